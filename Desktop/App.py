@@ -1,22 +1,40 @@
 import datetime
-import segno
-from segno import helpers
-from barcode import isxn, ean, get_barcode
-from barcode.writer import ImageWriter
+import os
+import sys
 from PyQt5 import QtGui, QtCore, QtWidgets
-from PyQt5.QtWidgets import QMainWindow, QMessageBox, QDialog
+from PyQt5.QtWidgets import QMainWindow, QMessageBox, QDialog, QFileDialog
 from QrCodeWindow import Ui_MainWindow
 from OutputWindow import Ui_Dialog
+import icon_rc
+
+# Make the shared generation engine (../qrengine) importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import qrengine  # noqa: E402
+from qrengine.contacts import minimize  # noqa: E402
+from Worker import GenerateJob  # noqa: E402
+from Payload import blank_to_none, parse_birthday  # noqa: E402
+
+LINK_DB = os.environ.get("QRCODE_LINK_DB", "links.sqlite3")  # SQLite store of the short links
+SHORT_LINK_BASE = os.environ.get("QRCODE_SHORT_LINK_BASE", "http://127.0.0.1:8000/R/")  # Redirect route of the codes
 
 
 class App(QMainWindow):
     def __init__(self):
         super().__init__()
 
+        icon_rc.register()  # Icons and backgrounds of both windows, registered once a window is built
         self.ui = Ui_MainWindow()
         self.ui.setupUi(self)
 
-        self.output = Output()
+        self.timings = qrengine.TimingLog()  # Per-stage timings of the latest generate and save operations
+        self.output = Output(self.timings)
+
+        self.pool = QtCore.QThreadPool.globalInstance()
+        self.job = None
+        self.jobs = {}  # Every job that is queued or running, referenced until it reports back
+        self.job_count = 0
+
+        QtWidgets.QShortcut(QtGui.QKeySequence("Ctrl+Shift+D"), self, activated=self.dump_timings)
 
         self.prev_button = self.ui.text_button
         self.ui.create_button.clicked.connect(self.create_qr)
@@ -29,6 +47,37 @@ class App(QMainWindow):
         self.ui.micro_button.clicked.connect(self.micro)
         self.ui.barcode_button.clicked.connect(self.barcode)
 
+        # The error level can be pinned instead of boosted, and fast mode skips the mask evaluation
+        self.error_box = QtWidgets.QComboBox()
+        self.error_box.addItems(["Auto", *qrengine.core.ERRORS])
+        self.error_box.setToolTip("Error correction level. Auto uses the highest level that fits the smallest version.")
+        self.statusBar().addPermanentWidget(QtWidgets.QLabel("Error level:"))
+        self.statusBar().addPermanentWidget(self.error_box)
+        self.error_box.currentIndexChanged.connect(self.capacity_hint)
+        self.fast_box = QtWidgets.QCheckBox("Fast mode")
+        self.fast_box.setToolTip("Use mask 0 instead of evaluating all eight masks; every mask gives a valid code.")
+        self.statusBar().addPermanentWidget(self.fast_box)
+
+        # Non-Latin text is encoded in the smallest ECI charset unless UTF-8 is forced
+        self.utf8_box = QtWidgets.QCheckBox("Force UTF-8")
+        self.utf8_box.setToolTip("Encode non-Latin text as UTF-8 instead of the smallest ECI character set,\n"
+                                 "for scanners that ignore ECI headers.")
+        self.statusBar().addPermanentWidget(self.utf8_box)
+        self.utf8_box.toggled.connect(self.capacity_hint)
+
+        # Links can be stored in the link store and encoded as a short redirect URL instead
+        self.links = None  # LinkStore, opened when a short link is first needed
+        self.short_box = QtWidgets.QCheckBox("Short link", self.ui.link_page)
+        self.short_box.setToolTip(f"Store the link in {LINK_DB} and encode a short redirect URL\n"
+                                  f"({SHORT_LINK_BASE}...) instead, so long tracking links still give a small code.")
+        self.ui.gridLayout_4.addWidget(self.short_box, 3, 0, 1, 4)
+        self.short_box.toggled.connect(self.capacity_hint)
+
+        # Show the QR version the input will need in the status bar while typing
+        for widget in self.ui.input.findChildren((QtWidgets.QLineEdit, QtWidgets.QTextEdit)):
+            widget.textChanged.connect(self.capacity_hint)
+        self.ui.input.currentChanged.connect(self.capacity_hint)
+
     def create_qr(self):
         """
         Method that generates QR Code.
@@ -51,6 +100,63 @@ class App(QMainWindow):
         elif button == self.ui.barcode_button:
             self.barcode_2d()
 
+    def current_input(self) -> tuple[str, dict]:
+        """
+        Method that returns the code type and payload of the page that is open.
+        Raises ValueError if the input of the page cannot be parsed yet.
+        """
+        button = self.prev_button
+        if button == self.ui.text_button:
+            return "Text", {"Content": self.text_data()}
+        if button == self.ui.link_button:
+            link = self.link_data()
+            return "Link", {"Content": self.short_link(link, store=False) if self.short_box.isChecked() else link}
+        if button == self.ui.vcard_button:
+            return "VCard", {**self.vcard_data(), "Birthday": self.get_birthday()}
+        if button == self.ui.wifi_button:
+            return "Wifi", self.wifi_data()
+        if button == self.ui.email_button:
+            return "Email", self.email_data()
+        if button == self.ui.geo_button:
+            return "Geo", self.geo_data()
+        if button == self.ui.micro_button:
+            return "Micro", {"Text": self.micro_data()}
+        return "Barcode", self.barcode_data()
+
+    def capacity_hint(self):
+        """
+        Method that shows in the status bar which QR version the current input will need, or that it won't fit.
+        Only the content is measured, nothing is encoded, so it runs on every keystroke.
+        On the vcard_page the bytes the contact format saves are shown too, on the link_page the short link if it is used.
+        """
+        # A slot must not raise, PyQt5 aborts the application on an unhandled exception
+        try:
+            kind, payload = self.current_input()
+            estimate = qrengine.estimate(kind, payload, self.encode_options())
+            if estimate is None:
+                message = ""
+            elif kind == "VCard":
+                message = f"{estimate.message()} - {minimize(payload)[1].message()}"
+            elif kind == "Link" and self.short_box.isChecked():
+                message = f"{estimate.message()} - {payload['Content']}"
+            else:
+                message = estimate.message()
+        except Exception:  # Input that cannot be parsed yet, e.g. a birthday that is half typed
+            message = ""
+        if message:
+            self.statusBar().showMessage(message)
+        else:
+            self.statusBar().clearMessage()
+
+    def encode_options(self) -> qrengine.EncodeOptions | None:
+        """
+        Method that returns the encoding options chosen in the status bar, None for the defaults.
+        """
+        error = self.error_box.currentText()
+        opts = qrengine.EncodeOptions(error=None if error == "Auto" else error, fast=self.fast_box.isChecked(),
+                                      utf8=self.utf8_box.isChecked())
+        return None if opts == qrengine.EncodeOptions() else opts
+
     def text(self):
         """
         Method that opens the text_page when the text_button is clicked.
@@ -68,13 +174,12 @@ class App(QMainWindow):
     def text_qr(self):
         """
         Method that generates a QR Code or throws error box.
+        Mixed text is split into numeric, alphanumeric and byte segments when that gives a smaller version.
         """
         try:
             text = self.text_data()
-            qr = segno.make_qr(text)
-            qr.save("output.png", scale=15)
-            self.show_output()
-        except(segno.DataOverflowError, ValueError):
+            self.start_job("Text", {"Content": text})
+        except ValueError:
             self.error_msg()
 
     def link(self):
@@ -94,15 +199,29 @@ class App(QMainWindow):
     def link_qr(self):
         """
         Method that generates a QR Code or throws error box.
+        Mixed links such as https://EXAMPLE.COM/ID/1234567890 are split into segments the same way.
+        With Short link checked, the link is stored and its short redirect URL is encoded instead.
         """
         try:
             link = self.link_data()
-            qr = segno.make_qr(link)
-            qr.save("output.png", scale=15)
-            self.show_output()
-        except(segno.DataOverflowError, ValueError):
+            if self.short_box.isChecked():
+                link = self.short_link(link)
+            self.start_job("Link", {"Content": link})
+        except ValueError:
             self.error_msg()
 
+    def short_link(self, link: str, store: bool = True) -> str:
+        """
+        Method that returns the short redirect URL of a link from the link store, opened on first use.
+        Unless store is True, nothing is written and a placeholder code of the same length is previewed.
+        Raises ValueError for anything but an http or https link.
+        """
+        if self.links is None:
+            from qrengine.shortlinks import LinkStore  # sqlite3 is only loaded once a short link is used
+            self.links = LinkStore(LINK_DB, SHORT_LINK_BASE)
+        code = self.links.shorten(link) if store else self.links.peek(link)
+        return self.links.short_url(code)
+
     def vcard(self):
         """
         Method that opens the vcard_page when the vcard_button is clicked.
@@ -117,64 +236,38 @@ class App(QMainWindow):
         zipcode, country, org, title, cellphone, homephone and workphone variables.
         """
         vcard = {
-            "name": self.ui.name_content.text(),
-            "displayname": self.ui.display_name_content.text(),
-            "email": self.ui.email_content.text(),
-            "phone": self.ui.phone_content.text(),
-            "url": self.ui.url_content.text(),
-            "city": self.ui.city_content.text(),
-            "zipcode": self.ui.zipcode_content.text(),
-            "country": self.ui.country_content.text(),
-            "org": self.ui.org_content.text(),
-            "title": self.ui.title_content.text(),
-            "cellphone": self.ui.cellphone_content.text(),
-            "homephone": self.ui.homephone_content.text(),
-            "workphone": self.ui.workphone_content.text()
+            "Name": self.ui.name_content.text(),
+            "Displayname": self.ui.display_name_content.text(),
+            "Email": self.ui.email_content.text(),
+            "Phone": self.ui.phone_content.text(),
+            "URL": self.ui.url_content.text(),
+            "City": self.ui.city_content.text(),
+            "Zipcode": self.ui.zipcode_content.text(),
+            "Country": self.ui.country_content.text(),
+            "Org": self.ui.org_content.text(),
+            "Title": self.ui.title_content.text(),
+            "Cellphone": self.ui.cellphone_content.text(),
+            "Homephone": self.ui.homephone_content.text(),
+            "Workphone": self.ui.workphone_content.text()
                 }
-        for i in vcard.keys():
-            if vcard.get(i).replace(" ","") == "":
-                vcard.update({i: None})
-        return vcard
+        return blank_to_none(vcard)
     
     def get_birthday(self) -> datetime.date | None:
         """
         Method that returns birthday value required for vcard.
         """
-        birthday = self.ui.birthday_content.text()
-        if birthday.replace(" ","") == "":
-            birthday = None
-        else:
-            for i in [".", ":", "-","/"]:
-                if i in birthday:
-                    birthday = birthday.split(i)
-                    break
-            birthday = datetime.date(year= int(birthday[2]), month= int(birthday[1]), day= int(birthday[0]))
-        return birthday
+        return parse_birthday(self.ui.birthday_content.text())
 
     def vcard_qr(self):
         """
         Method that generates a QR Code which encodes a vCard (version 3.0.) or throws error box.
+        Blank fields are left out, and the shorter MeCard is used when it can hold every field and phone type.
         """
         try:
             vcard = self.vcard_data()
-            qr = helpers.make_vcard(name= vcard["name"],
-                                displayname= vcard["displayname"],
-                                email= vcard["email"],
-                                phone= vcard["phone"],
-                                birthday= self.get_birthday(),
-                                url= vcard["url"],
-                                city= vcard["city"],
-                                zipcode= vcard["zipcode"],
-                                country= vcard["country"],
-                                org= vcard["org"],
-                                title= vcard["title"],
-                                cellphone= vcard["cellphone"],
-                                homephone= vcard["homephone"],
-                                workphone= vcard["workphone"]
-                                )
-            qr.save("output.png", scale=15)
-            self.show_output()
-        except(segno.DataOverflowError, ValueError):
+            vcard["Birthday"] = self.get_birthday()
+            self.start_job("VCard", vcard)
+        except ValueError:
             self.error_msg()
 
     def wifi(self):
@@ -190,12 +283,12 @@ class App(QMainWindow):
         wifi_page contains: ssid, password an security variables.
         """
         wifi = {
-            "ssid": self.ui.ssid_content.text(),
-            "password": self.ui.password_content.text(),
-            "security": self.ui.security_content.currentText()
+            "SSID": self.ui.ssid_content.text(),
+            "Password": self.ui.password_content.text(),
+            "Security": self.ui.security_content.currentText()
                 }
-        if wifi.get("security") == "None":
-                wifi.update({"security": None})
+        if wifi.get("Security") == "None":
+                wifi.update({"Security": None})
         return wifi
 
     def wifi_qr(self):
@@ -204,13 +297,8 @@ class App(QMainWindow):
         """
         try:
             wifi = self.wifi_data()
-            qr = helpers.make_wifi(ssid= wifi["ssid"],
-                                password= wifi["password"],
-                                security= wifi["security"]
-                                )
-            qr.save("output.png", scale=15)
-            self.show_output()
-        except(segno.DataOverflowError, ValueError):
+            self.start_job("Wifi", wifi)
+        except ValueError:
             self.error_msg()
 
     def email(self):
@@ -226,14 +314,11 @@ class App(QMainWindow):
         email_page contains: to, subject and body variables.
         """
         email = {
-            "to": self.ui.to_content.text(),
-            "subject": self.ui.subject_content.text(),
-            "body":self.ui.body_content.toPlainText()
+            "To": self.ui.to_content.text(),
+            "Subject": self.ui.subject_content.text(),
+            "Body":self.ui.body_content.toPlainText()
                 }
-        for i in email.keys():
-            if email.get(i) == "":
-                email.update({i:None})
-        return email
+        return blank_to_none(email)
 
     def email_qr(self):
         """
@@ -241,12 +326,8 @@ class App(QMainWindow):
         """
         try:
             email = self.email_data()
-            qr = helpers.make_email(to= email["to"],
-                                subject= email["subject"],
-                                body= email["body"])
-            qr.save("output.png", scale=15)
-            self.show_output()
-        except(segno.DataOverflowError, ValueError):
+            self.start_job("Email", email)
+        except ValueError:
             self.error_msg()
 
     def geo(self):
@@ -265,8 +346,8 @@ class App(QMainWindow):
         -180 < longitude value < +180
         """
         geo = {
-            "latitude": float(self.ui.latitude_content.text()),
-            "longitude": float(self.ui.longitude_content.text())
+            "Latitude": float(self.ui.latitude_content.text()),
+            "Longitude": float(self.ui.longitude_content.text())
                 }
         return geo
         
@@ -276,11 +357,8 @@ class App(QMainWindow):
         """
         try:
             geo = self.geo_data()
-            qr = helpers.make_geo(lat= geo["latitude"],
-                                lng= geo["longitude"])
-            qr.save("output.png", scale=15)
-            self.show_output()
-        except(segno.DataOverflowError, ValueError):
+            self.start_job("Geo", geo)
+        except ValueError:
             self.error_msg()
 
     def micro(self):
@@ -303,10 +381,8 @@ class App(QMainWindow):
         """
         try:
             micro = self.micro_data()
-            qr = segno.make_micro(micro)
-            qr.save("output.png", scale=10)
-            self.show_output()
-        except(segno.DataOverflowError, ValueError):
+            self.start_job("Micro", {"Text": micro}, scale=10)
+        except ValueError:
             self.error_msg()
 
     def barcode(self):
@@ -322,8 +398,8 @@ class App(QMainWindow):
         barcode_page contains: type of barcode and barcode number.
         """
         barcode = {
-            "type" : self.ui.type_content.currentText(),
-            "number": self.ui.number_content.text()
+            "Type" : self.ui.type_content.currentText(),
+            "Number": self.ui.number_content.text()
                 }
         return barcode
     
@@ -333,15 +409,77 @@ class App(QMainWindow):
         """
         try:
             brcd = self.barcode_data()
-            bc = get_barcode(name= brcd["type"],
-                            code= brcd["number"],
-                            writer= ImageWriter())
-            bc.save("output")
-            self.show_output()
-        except(ValueError, isxn.WrongCountryCodeError, isxn.BarcodeError,
-               ean.NumberOfDigitsError, ean.WrongCountryCodeError):
+            self.start_job("Barcode", brcd)
+        except ValueError:
+            self.error_msg()
+
+    def start_job(self, kind: str, payload: dict, scale: int = 15):
+        """
+        Method that generates the code on the thread pool and shows a busy cursor until it is done.
+        A job that is still queued is taken back; the result of a job that is already running is ignored.
+        A payload that cannot fit into a QR code is rejected with a message box before any job is started.
+        """
+        encode_opts = self.encode_options()
+        estimate = qrengine.estimate(kind, payload, encode_opts)
+        if estimate is not None and not estimate.fits:
+            QMessageBox.warning(self, "Data error", estimate.message(), QMessageBox.Ok)
+            return
+        if self.job is None:
+            QtWidgets.QApplication.setOverrideCursor(QtCore.Qt.BusyCursor)
+        elif self.pool.tryTake(self.job):
+            del self.jobs[self.job.job_id]
+        self.job_count += 1
+        self.job = GenerateJob(self.job_count, kind, payload, scale, encode_opts)
+        self.job.signals.finished.connect(self.job_finished)
+        self.job.signals.failed.connect(self.job_failed)
+        self.jobs[self.job_count] = self.job
+        self.pool.start(self.job)
+
+    def end_job(self, job_id: int) -> GenerateJob | None:
+        """
+        Method that forgets a job that reported back and returns it if it is the current job.
+        If it is, the busy state is cleared; the timing of a superseded job is recorded right away.
+        """
+        job = self.jobs.pop(job_id, None)
+        if job is None:
+            return None
+        if job is not self.job:
+            job.timing.info["superseded"] = True
+            self.timings.record(job.timing)
+            return None
+        self.job = None
+        QtWidgets.QApplication.restoreOverrideCursor()
+        return job
+
+    def job_finished(self, job_id: int, code, image: QtGui.QImage):
+        """
+        Method that hands the generated code and its image to the Output Window and shows it, unless the job was superseded.
+        """
+        job = self.end_job(job_id)
+        if job is not None:
+            with job.timing.stage("display"):
+                self.output.set_output(code, image, job.scale)
+                self.show_output()
+            self.timings.record(job.timing)
+
+    def job_failed(self, job_id: int, error: Exception):
+        """
+        Method that shows the error message box for a failed job, unless the job was superseded.
+        """
+        job = self.end_job(job_id)
+        if job is not None:
+            self.timings.record(job.timing)
             self.error_msg()
 
+    def dump_timings(self):
+        """
+        Method that saves the per-stage timings of the latest operations as JSON (Ctrl+Shift+D).
+        """
+        path, _ = QFileDialog.getSaveFileName(self, "Save timings", "timings.json", "JSON (*.json)")
+        if path:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(self.timings.to_json())
+
     def show_output(self):
         """
         Method that shows Output Window and the generated output and calls the clear_all method.
@@ -373,17 +511,46 @@ format and the data is not too large or too small. Then try again.
 
 
 class Output(QDialog):
-    def __init__(self):
+    def __init__(self, timings: qrengine.TimingLog | None = None):
         super().__init__()
 
         self.ui = Ui_Dialog()
         self.ui.setupUi(self)
 
+        self.code = None
+        self.image = None
+        self.scale = 15
+        self.timings = timings if timings is not None else qrengine.TimingLog()
+        self.save_button = QtWidgets.QPushButton("Save", self)
+        self.save_button.clicked.connect(self.save)
+        self.ui.gridLayout.addWidget(self.ui.file_name, 2, 1, 1, 1)
+        self.ui.gridLayout.addWidget(self.save_button, 2, 2, 1, 1)
+
+    def set_output(self, code, image: QtGui.QImage, scale: int):
+        """
+        Method that stores the generated code, its display image and the module size used when saving.
+        """
+        self.code = code
+        self.image = image
+        self.scale = scale
+
     def show_output(self):
         """
         Method that displays the generated output.
         """
-        image_path=("output.png")
-        image_profile= QtGui.QImage(image_path)
-        image_profile= image_profile.scaled(450, 420, aspectRatioMode=QtCore.Qt.KeepAspectRatio, transformMode=QtCore.Qt.SmoothTransformation)
-        self.ui.output.setPixmap(QtGui.QPixmap.fromImage(image_profile))
+        self.ui.output.setPixmap(QtGui.QPixmap.fromImage(self.image))
+        self.ui.file_name.setText("Not saved")
+
+    def save(self):
+        """
+        Method that asks for a file name and writes the generated output there as PNG.
+        """
+        path, _ = QFileDialog.getSaveFileName(self, "Save", "output.png", "PNG image (*.png)")
+        if not path:
+            return
+        timing = qrengine.Timing("save")
+        with timing.stage("write") as stage, open(path, "wb") as f:
+            qrengine.write(self.code, f, qrengine.RenderOptions(scale=self.scale))
+            stage.size = f.tell()
+        self.timings.record(timing)
+        self.ui.file_name.setText(os.path.basename(path))
@@ -0,0 +1,75 @@
+# Headless command line of the desktop application.
+# Generates a code from arguments without importing PyQt5, for example:
+#   python Main.py text Content="Hello world" -o hello.png
+#   python Main.py wifi SSID=Home Password=secret Security=WPA -o wifi.svg
+#   python Main.py vcard Name="Doe;John" Displayname="John Doe" Birthday=02.01.1990
+#   python Main.py link Content=https://example.com --timings timings.json
+#   python Main.py text Content=ABC123 --version 2 --error Q --fast
+
+import argparse
+import os
+import sys
+
+# Make the shared generation engine (../qrengine) importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import qrengine  # noqa: E402
+from qrengine.cli import add_encode_arguments, encode_options  # noqa: E402
+from qrengine.payloads import FIELDS  # noqa: E402
+from Payload import normalize  # noqa: E402
+
+SCALES = {"Micro": 10}  # Module size of the saved image per type, 15 for all others (as in the GUI)
+
+
+def parse_fields(kind: str, pairs: list) -> dict:
+    """
+    Function that turns KEY=VALUE arguments into a payload; keys are matched case-insensitively.
+    """
+    names = {name.lower(): name for name in FIELDS[kind]}
+    payload = {}
+    for pair in pairs:
+        key, separator, value = pair.partition("=")
+        if not separator or key.lower() not in names:
+            raise ValueError(f"Expected one of {', '.join(FIELDS[kind])} as KEY=VALUE, got {pair!r}")
+        payload[names[key.lower()]] = value
+    return payload
+
+
+def main(argv: list) -> int:
+    """
+    Function that generates one code from the command-line arguments and writes it to a file.
+    """
+    kinds = {kind.lower(): kind for kind in qrengine.KINDS}
+    parser = argparse.ArgumentParser(prog="python Main.py",
+                                     description="Generate a code without opening the window. "
+                                                 "Run without arguments to start the application.")
+    parser.add_argument("type", choices=list(kinds), type=str.lower, help="Code type.")
+    parser.add_argument("fields", nargs="*", metavar="KEY=VALUE",
+                        help="Fields of the code type, e.g. Content=... or SSID=... Password=...")
+    parser.add_argument("-o", "--output", default="output.png", help="Output file (default: output.png).")
+    parser.add_argument("--format", choices=["png", "svg"], help="Defaults to the output file extension.")
+    parser.add_argument("--scale", type=int, help="Module size in pixels.")
+    parser.add_argument("--timings", metavar="FILE", help="Write the per-stage timings as JSON.")
+    add_encode_arguments(parser)
+    args = parser.parse_args(argv)
+
+    kind = kinds[args.type]
+    output = args.format or ("svg" if args.output.lower().endswith(".svg") else "png")
+    opts = qrengine.RenderOptions(output=output, scale=args.scale or SCALES.get(kind, 15))
+    timing = qrengine.Timing("generate", kind)
+    try:
+        with timing.stage("encode"):
+            code = qrengine.make_code(kind, normalize(kind, parse_fields(kind, args.fields)), encode_options(args))
+        with timing.stage("write") as stage, open(args.output, "wb") as f:
+            qrengine.write(code, f, opts)
+            stage.size = f.tell()
+    except Exception as e:
+        timing.error = type(e).__name__
+        print(f"Data error: {type(e).__name__}: {e}", file=sys.stderr)
+        return 1
+    finally:
+        if args.timings:
+            log = qrengine.TimingLog()
+            log.record(timing)
+            with open(args.timings, "w", encoding="utf-8") as f:
+                f.write(log.to_json())
+    return 0
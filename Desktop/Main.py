@@ -4,6 +4,13 @@
 
 # Version: segno (1.6.0), PyQt5 (5.15.10), PyQt5Designer (5.14.1), pyhon-barcode (0.15.1), python (3.11.2)
 
+import sys
+
+if len(sys.argv) > 1:
+    # Headless mode: generate from the command-line arguments without importing PyQt5
+    from Cli import main
+    sys.exit(main(sys.argv[1:]))
+
 from PyQt5.QtWidgets import QApplication
 from App import App
 
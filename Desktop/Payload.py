@@ -0,0 +1,48 @@
+# Input normalization of the desktop application.
+# Shared by the GUI (App.py) and the headless command line (Cli.py), so neither imports PyQt5 here.
+
+import datetime
+
+
+def blank_to_none(data: dict) -> dict:
+    """
+    Function that replaces empty or whitespace-only values with None.
+    """
+    for i in data.keys():
+        if isinstance(data.get(i), str) and data.get(i).replace(" ","") == "":
+            data.update({i: None})
+    return data
+
+
+def parse_birthday(birthday: str | None) -> datetime.date | None:
+    """
+    Function that parses a day.month.year birthday; ".", ":", "-" and "/" are accepted as separators.
+    Raises ValueError for anything else, e.g. a birthday that is still being typed ("02.01").
+    """
+    if birthday is None or birthday.replace(" ","") == "":
+        return None
+    parts = [birthday]
+    for i in [".", ":", "-","/"]:
+        if i in birthday:
+            parts = birthday.split(i)
+            break
+    if len(parts) != 3:
+        raise ValueError(f"Birthday {birthday!r} is not day.month.year")
+    return datetime.date(year= int(parts[2]), month= int(parts[1]), day= int(parts[0]))
+
+
+def normalize(kind: str, payload: dict) -> dict:
+    """
+    Function that applies the rules of the desktop input pages to a payload of the given code type.
+    """
+    if kind == "VCard":
+        payload = blank_to_none(payload)
+        payload["Birthday"] = parse_birthday(payload.get("Birthday"))
+    elif kind == "Email":
+        payload = blank_to_none(payload)
+    elif kind == "Wifi":
+        if payload.get("Security") in ("None", ""):
+            payload.update({"Security": None})
+    elif kind == "Geo":
+        payload = {key: float(value) for key, value in payload.items()}
+    return payload
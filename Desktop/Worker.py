@@ -0,0 +1,109 @@
+# Background generation for the desktop application.
+# Codes are generated on a QThreadPool so that the GUI thread never blocks on segno or python-barcode,
+# and are rendered directly into a QImage of the display size without writing or reading a file.
+
+import time
+
+from PyQt5 import QtCore, QtGui
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+import qrengine
+from qrengine.pngstream import packed_lines
+
+OUTPUT_SIZE = (450, 420)  # Size of the image area of the Output window
+
+
+class WorkerSignals(QObject):
+    """
+    Signals of a GenerateJob. They are delivered to the GUI thread through queued connections.
+    """
+    finished = pyqtSignal(int, object, object)
+    failed = pyqtSignal(int, object)
+
+
+class GenerateJob(QRunnable):
+    """
+    QRunnable that encodes one code and renders it into a QImage of the Output window size.
+    """
+
+    def __init__(self, job_id: int, kind: str, payload: dict, scale: int,
+                 encode_opts: qrengine.EncodeOptions | None = None):
+        """
+        Args:
+            job_id (int): Identifier used to recognize results of superseded jobs.
+            kind (str): Code type, one of qrengine.KINDS.
+            payload (dict): Content of the code.
+            scale (int): Module size in pixels used when the code is saved.
+            encode_opts (qrengine.EncodeOptions | None): Encoding options, None to let segno choose.
+        """
+        super().__init__()
+        self.setAutoDelete(False)  # Kept by App so that a queued job can still be taken back
+        self.job_id = job_id
+        self.kind = kind
+        self.payload = payload
+        self.scale = scale
+        self.encode_opts = encode_opts
+        self.signals = WorkerSignals()
+        self.timing = qrengine.Timing("generate", kind)
+        self.queued = time.perf_counter()
+
+    def run(self):
+        """
+        Method that generates the code and emits finished with the code and its image or failed with the exception.
+        """
+        self.timing.add("queue", time.perf_counter() - self.queued)
+        try:
+            with self.timing.stage("encode"):
+                code = qrengine.make_code(self.kind, self.payload, self.encode_opts)
+            with self.timing.stage("rasterize") as stage:
+                if self.kind == "Barcode":
+                    image = barcode_image(code, *OUTPUT_SIZE)
+                else:
+                    image = mono_image(code, *OUTPUT_SIZE)
+                stage.size = image.sizeInBytes()
+        except Exception as e:
+            self.timing.error = type(e).__name__
+            self.signals.failed.emit(self.job_id, e)
+        else:
+            self.signals.finished.emit(self.job_id, code, image)
+
+
+def mono_image(code, width: int, height: int) -> QtGui.QImage:
+    """
+    Renders a QR code straight from its module matrix into a 1-bit QImage.
+    The module size is the largest whole number of pixels that fits into width x height,
+    so the image is crisp and needs no rescaling.
+
+    Args:
+        code (segno.QRCode): The encoded symbol.
+        width (int): Available width in pixels.
+        height (int): Available height in pixels.
+
+    Returns:
+        QtGui.QImage: Format_Mono image, dark modules black.
+    """
+    modules = code.symbol_size(scale=1)[0]
+    scale = max(1, min(width, height) // modules)
+    size = modules * scale
+    bytes_per_line = (size + 31) // 32 * 4  # QImage scanlines are 32-bit aligned
+    data = b"".join(line.ljust(bytes_per_line, b"\xff") * scale for line in packed_lines(code, scale))
+    image = QtGui.QImage(data, size, size, bytes_per_line, QtGui.QImage.Format_Mono).copy()
+    image.setColorTable([QtGui.qRgb(0, 0, 0), QtGui.qRgb(255, 255, 255)])
+    return image
+
+
+def barcode_image(code, width: int, height: int) -> QtGui.QImage:
+    """
+    Renders a barcode in memory and fits it into width x height.
+
+    Args:
+        code (barcode.barcode.Barcode): The encoded barcode.
+        width (int): Available width in pixels.
+        height (int): Available height in pixels.
+
+    Returns:
+        QtGui.QImage: The barcode image.
+    """
+    image = QtGui.QImage.fromData(qrengine.render(code))
+    return image.scaled(width, height, aspectRatioMode=QtCore.Qt.KeepAspectRatio,
+                        transformMode=QtCore.Qt.SmoothTransformation)
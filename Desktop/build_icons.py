@@ -0,0 +1,69 @@
+"""
+Rebuilds icons.rcc from icon.qrc and the images in icons/ and background/.
+
+    python build_icons.py
+
+Qt's resource compiler is used if it is on the PATH:
+
+    rcc -binary icon.qrc -o icons.rcc
+
+PyQt5 wheels only ship pyrcc5, which writes a Python module instead. Without
+rcc, the data, name and tree tables of pyrcc5's output are written out in the
+binary format of `rcc -binary` (version 2), which is what Qt memory-maps.
+"""
+import ast
+import os
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+QRC_FILE = os.path.join(DIRECTORY, "icon.qrc")
+RCC_FILE = os.path.join(DIRECTORY, "icons.rcc")
+
+
+def pyrcc_tables(qrc_file: str) -> dict:
+    """
+    Function that runs pyrcc5 on a .qrc file and returns the byte tables of the generated module.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        module = os.path.join(tmp, "resources.py")
+        subprocess.run([sys.executable, "-m", "PyQt5.pyrcc_main", qrc_file, "-o", module], check=True)
+        with open(module, encoding="utf-8") as f:
+            tree = ast.parse(f.read())
+    return {node.targets[0].id: node.value.value for node in tree.body
+            if isinstance(node, ast.Assign) and isinstance(node.value, ast.Constant)
+            and isinstance(node.value.value, bytes)}
+
+
+def binary_rcc(tables: dict) -> bytes:
+    """
+    Function that returns the binary resource file of pyrcc5's tables: header, data, names, tree.
+    """
+    data, names, tree = tables["qt_resource_data"], tables["qt_resource_name"], tables["qt_resource_struct_v2"]
+    header_size = 20  # Magic, format version and the offsets of tree, data and names
+    data_offset = header_size
+    names_offset = data_offset + len(data)
+    tree_offset = names_offset + len(names)
+    header = b"qres" + struct.pack(">IIII", 2, tree_offset, data_offset, names_offset)
+    return header + data + names + tree
+
+
+def main() -> int:
+    """
+    Function that rebuilds icons.rcc.
+    """
+    rcc = shutil.which("rcc")
+    if rcc is not None:
+        subprocess.run([rcc, "-binary", QRC_FILE, "-o", RCC_FILE], check=True, cwd=DIRECTORY)
+    else:
+        with open(RCC_FILE, "wb") as f:
+            f.write(binary_rcc(pyrcc_tables(QRC_FILE)))
+    print(f"Wrote {RCC_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,11619 +1,29 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
+"""
+Registers the icons and backgrounds of the windows with Qt.
+
+pyuic5 writes `import icon_rc` into QrCodeWindow.py and OutputWindow.py for the
+icon.qrc resource of the .ui files. Instead of the module of byte literals that
+pyrcc5 would generate, this module provides register(), which registers the
+binary icons.rcc, which Qt memory-maps. App calls it just before it builds its
+windows, so importing them costs nothing and regenerated window files keep
+working unchanged.
+Rebuild icons.rcc with build_icons.py (or `rcc -binary icon.qrc -o icons.rcc`),
+not with pyrcc5, which would overwrite this file.
+"""
+import os
 
 from PyQt5 import QtCore
 
-qt_resource_data = b"\
-\x00\x00\x04\x23\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x00\x56\x01\x1a\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x53\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x03\
-\xff\xd9\
-\x00\x00\xdc\xb0\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x78\x00\
-\x78\x00\x00\xff\xe1\x00\x22\x45\x78\x69\x66\x00\x00\x4d\x4d\x00\
-\x2a\x00\x00\x00\x08\x00\x01\x01\x12\x00\x03\x00\x00\x00\x01\x00\
-\x01\x00\x00\x00\x00\x00\x00\xff\xe2\x02\x28\x49\x43\x43\x5f\x50\
-\x52\x4f\x46\x49\x4c\x45\x00\x01\x01\x00\x00\x02\x18\x00\x00\x00\
-\x00\x02\x10\x00\x00\x6d\x6e\x74\x72\x52\x47\x42\x20\x58\x59\x5a\
-\x20\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x61\x63\x73\
-\x70\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x00\x00\xf6\
-\xd6\x00\x01\x00\x00\x00\x00\xd3\x2d\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x09\x64\x65\x73\
-\x63\x00\x00\x00\xf0\x00\x00\x00\x74\x72\x58\x59\x5a\x00\x00\x01\
-\x64\x00\x00\x00\x14\x67\x58\x59\x5a\x00\x00\x01\x78\x00\x00\x00\
-\x14\x62\x58\x59\x5a\x00\x00\x01\x8c\x00\x00\x00\x14\x72\x54\x52\
-\x43\x00\x00\x01\xa0\x00\x00\x00\x28\x67\x54\x52\x43\x00\x00\x01\
-\xa0\x00\x00\x00\x28\x62\x54\x52\x43\x00\x00\x01\xa0\x00\x00\x00\
-\x28\x77\x74\x70\x74\x00\x00\x01\xc8\x00\x00\x00\x14\x63\x70\x72\
-\x74\x00\x00\x01\xdc\x00\x00\x00\x3c\x6d\x6c\x75\x63\x00\x00\x00\
-\x00\x00\x00\x00\x01\x00\x00\x00\x0c\x65\x6e\x55\x53\x00\x00\x00\
-\x58\x00\x00\x00\x1c\x00\x73\x00\x52\x00\x47\x00\x42\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x58\x59\x5a\
-\x20\x00\x00\x00\x00\x00\x00\x6f\xa2\x00\x00\x38\xf5\x00\x00\x03\
-\x90\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x62\x99\x00\x00\xb7\
-\x85\x00\x00\x18\xda\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\x24\
-\xa0\x00\x00\x0f\x84\x00\x00\xb6\xcf\x70\x61\x72\x61\x00\x00\x00\
-\x00\x00\x04\x00\x00\x00\x02\x66\x66\x00\x00\xf2\xa7\x00\x00\x0d\
-\x59\x00\x00\x13\xd0\x00\x00\x0a\x5b\x00\x00\x00\x00\x00\x00\x00\
-\x00\x58\x59\x5a\x20\x00\x00\x00\x00\x00\x00\xf6\xd6\x00\x01\x00\
-\x00\x00\x00\xd3\x2d\x6d\x6c\x75\x63\x00\x00\x00\x00\x00\x00\x00\
-\x01\x00\x00\x00\x0c\x65\x6e\x55\x53\x00\x00\x00\x20\x00\x00\x00\
-\x1c\x00\x47\x00\x6f\x00\x6f\x00\x67\x00\x6c\x00\x65\x00\x20\x00\
-\x49\x00\x6e\x00\x63\x00\x2e\x00\x20\x00\x32\x00\x30\x00\x31\x00\
-\x36\xff\xdb\x00\x43\x00\x02\x01\x01\x02\x01\x01\x02\x02\x02\x02\
-\x02\x02\x02\x02\x03\x05\x03\x03\x03\x03\x03\x06\x04\x04\x03\x05\
-\x07\x06\x07\x07\x07\x06\x07\x07\x08\x09\x0b\x09\x08\x08\x0a\x08\
-\x07\x07\x0a\x0d\x0a\x0a\x0b\x0c\x0c\x0c\x0c\x07\x09\x0e\x0f\x0d\
-\x0c\x0e\x0b\x0c\x0c\x0c\xff\xdb\x00\x43\x01\x02\x02\x02\x03\x03\
-\x03\x06\x03\x03\x06\x0c\x08\x07\x08\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\
-\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\x0c\xff\xc0\x00\x11\x08\
-\x03\x17\x03\xb8\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\xff\xc4\
-\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\
-\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\
-\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\x04\x04\
-\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\x41\x06\
-\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\xb1\xc1\
-\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\x19\x1a\
-\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\x44\x45\
-\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\
-\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\x84\x85\
-\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\
-\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\
-\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\
-\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\xf3\xf4\
-\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\x01\x01\
-\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\
-\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\x01\x02\
-\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\x02\x03\
-\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\x32\x81\
-\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\x72\xd1\
-\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\x29\x2a\
-\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\x53\x54\
-\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\x73\x74\
-\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\x8a\x92\
-\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\
-\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\
-\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\xe4\xe5\
-\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xda\
-\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\xfc\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x01\xb2\x6e\xc7\xcb\x44\x5b\xb6\x0d\xdd\x69\
-\xd4\x50\x01\x45\x14\x50\x03\x4e\x77\x53\x87\x4a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x29\x8f\xf7\xa8\x01\xf4\x54\x6b\
-\xf3\xbe\x3e\x6f\x96\xa4\x53\x91\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x34\xc7\x96\xcd\x3a\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\x8a\x00\x29\x8f\xf7\xa9\xf4\x50\x02\x27\xdd\xe6\x96\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa4\x3f\x2e\x4d\x2d\x14\x00\xd8\xdb\
-\x72\x53\xa8\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x46\xcf\x6a\x5a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa6\x91\xcf\x4a\x75\x15\x98\x00\xe9\x45\x14\x56\x80\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x13\x8a\x28\xc6\x68\x00\x07\x34\x51\x8c\x51\x46\xa0\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x48\x1f\x26\x80\x16\x8a\x42\xd8\x34\x9e\x67\x14\xaf\x70\x1d\
-\x45\x37\x7d\x1e\x67\x3d\xe9\x85\xc7\x51\x4d\xdf\x4e\x07\x34\xae\
-\x98\x05\x14\x51\x4c\x02\x8a\x28\xa0\x02\x9b\xe6\xa9\xcf\x5e\x38\
-\x3c\x53\xaa\x03\x67\x99\x4b\xee\x70\x73\x9c\x06\xe0\xd4\xc8\x09\
-\xb7\x67\xb1\xa5\xa8\xd4\x49\xb0\xe7\x6e\x7b\x73\x4f\x5c\x85\x19\
-\xeb\x8e\x68\x8d\xc0\x5a\x28\xa2\xa8\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\xa1\x0f\x86\x3f\x5a\x9a\xa3\xe3\x2d\xf5\
-\xa9\x93\xd5\x13\x22\x19\xaf\xe3\x89\xd5\x5b\x70\xdc\x42\x83\x8e\
-\x09\x39\x03\x9e\x9d\x46\x3e\xa4\x0e\xe2\xaa\x69\x5e\x29\xb0\xd6\
-\xac\x16\xea\xc6\xe6\x2b\xdb\x77\x62\x8b\x24\x0c\x24\x52\xe0\xed\
-\x2b\x91\xc0\x60\xdc\x10\x71\x83\xc7\x63\x5f\x32\xfe\xd2\xbf\xb5\
-\x5e\x93\x0c\xdf\x11\xf4\x1d\x4b\xed\x1a\x4e\x87\xe1\x54\x73\xaa\
-\x6a\x30\xdd\x6d\x9a\xf6\x18\xed\x61\x9a\x44\x8c\x27\xcc\x88\xcd\
-\x3a\xda\x9e\x4b\x3b\x19\x82\x18\xd8\x06\x3e\x07\xe2\xbf\x1d\x7c\
-\x5a\xf0\xbf\x88\x6c\x7c\x0f\xf0\xef\x54\xf0\xdf\x87\x6d\x7c\x4c\
-\x5a\x59\x2d\xed\xb4\x98\xed\x93\xc3\x16\xaf\x1c\x89\x67\x65\x61\
-\x17\x11\x9b\x86\x93\x79\xb8\x99\xc3\x2a\x0d\xc2\x35\xc8\x51\x5e\
-\x46\x23\x38\xa7\x4a\xaa\xa6\x76\x53\xc1\x4a\x6b\x98\xfd\x21\x17\
-\xc8\xc1\x88\xdc\xd8\x20\x1e\x3b\x9e\x9f\x9e\x47\xe7\x4d\x4d\x52\
-\x29\x08\xdb\xb9\xb7\x63\x18\x19\x0d\x9d\xd8\xc1\xe9\xfc\x24\xfb\
-\x77\xc5\x7c\x3b\xf0\xdb\xf6\xf9\x1f\x0f\xc4\x3a\x04\x7a\x1d\xff\
-\x00\x89\x20\xd2\x74\xbb\xad\x3b\x4a\x9e\xd2\xf5\x2d\xf4\xfd\x41\
-\xad\x52\x00\x16\x46\x99\x9e\x41\x3c\xc0\x3b\xed\x89\xa5\x58\x12\
-\x5b\x64\x93\xf7\x92\x64\x7a\xb7\x85\x7f\x69\x1b\x8f\x07\x7c\x31\
-\xd5\xa2\xd7\x35\x1b\x0f\x13\x78\xca\xd4\xc7\x0d\xc5\xa5\xb3\x18\
-\x6d\xe7\xbe\xbc\x2c\x60\xb3\x56\x6c\xaa\xf9\x68\x58\x30\x0e\xd2\
-\x08\xa1\xf3\x9c\x2a\xb0\x63\xd1\x2c\xc6\x9d\xb9\xa2\xee\x8c\x95\
-\x07\x7e\x53\xe9\x03\x76\x81\x0b\x67\x80\xbb\x8e\x46\x38\xf5\xab\
-\x0b\xd2\xbc\xef\xc3\xbf\x18\xec\x6f\xf5\x6b\xcb\x5d\x4f\xc9\xd3\
-\x63\x82\x79\x22\xb7\x9a\xe2\xe1\x55\x6f\x56\x38\xc4\x97\x2e\xb9\
-\x38\xdb\x13\x65\x5b\xfb\xa5\x79\xc0\xc1\x3d\x9e\x97\xe2\x6b\x3d\
-\x5a\xce\x09\xad\xe7\x4b\xa8\xe7\x54\x64\x96\x1f\x9d\x24\x56\x1f\
-\x2b\x82\xb9\x1b\x5b\xa8\x6e\x84\x72\x32\x39\xad\xf0\xf5\xa1\x53\
-\xde\x8b\x22\x54\xe5\x1d\xd1\xa3\x45\x57\x5d\x49\x1d\xb6\xaa\xc8\
-\x5b\xfb\xb8\xc3\x0e\xbc\xe0\xf6\xc8\x23\x3d\x0f\x6a\x99\x65\x0c\
-\x33\xeb\x5d\x1c\xcb\x62\x47\x51\x4d\xdf\x4e\x07\x35\x40\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x05\xb1\x40\x6c\xd3\x64\
-\x4d\xe4\x52\xaa\xed\xa0\x05\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa8\
-\xc8\xfb\xdf\x5a\x92\xa3\x66\xe5\xbd\xaa\x64\x4b\x3f\x39\xff\x00\
-\x6d\xad\x17\x46\xd1\x7f\x69\xff\x00\x18\x5a\xf8\x92\xe2\xd6\xeb\
-\x4b\xf1\x1e\x9b\x18\xb2\xd1\x4c\xd1\xc7\xf6\xf9\xa3\xbb\xd3\xae\
-\x1e\xe9\xdc\x90\xe1\x21\x08\xc1\x95\x59\x76\x82\xcf\x84\xc9\x90\
-\xb7\xf6\x50\xd5\xb4\x9d\x47\x51\xf8\x7b\xaf\xea\x17\x96\x17\x1e\
-\x2c\xd6\x16\xf2\x7b\xeb\xab\x9b\x59\x6d\xee\x8a\x47\x73\x6e\x00\
-\x01\xce\x62\x11\xab\x64\xab\x1d\xae\x48\xee\x48\x1e\xb3\xff\x00\
-\x05\x1b\xfd\x9a\x35\x0f\x8b\x56\xb7\xfa\x8e\x8d\x63\xe7\xeb\x0b\
-\x6b\x1d\xf6\x9f\x21\xff\x00\x9f\x9b\x5f\x36\x39\x23\x55\xce\x43\
-\xcd\x63\x73\x75\x18\xfe\x17\x30\x44\x08\x38\x18\xf8\xba\xcf\xe2\
-\x9f\x85\xec\xfc\x57\xe1\x99\xb4\x2d\x6a\xc7\x5e\xbf\xd0\xf5\x1b\
-\xd9\x24\x9f\x4f\x32\x5d\x49\x26\x93\xa8\xce\x42\x4f\x1c\x6a\x5c\
-\xb0\x86\xf8\x40\x4a\x12\xcc\x23\xdc\x48\x00\x0c\xfe\x6f\x9f\xf3\
-\xc2\xb5\xd2\x3e\x8b\x2f\x71\x71\xe5\x67\xd3\x1f\x0d\x3c\x33\xa6\
-\xf8\x43\x46\xf0\xf4\x9a\x7c\x72\x69\xf7\x0d\xae\xea\x17\xa9\x6d\
-\x0d\x9a\xdc\x29\x83\xed\xbe\x6e\xe6\xf9\x71\x83\x15\xa4\x00\x6c\
-\xf9\xb7\xa8\x54\x2a\xfc\x0d\x2f\x03\x5f\x5b\xf8\x3e\xeb\x59\x9b\
-\xc4\x10\xd8\x6b\x37\x96\xa6\x7b\x88\x5a\xfa\x58\xe3\xd9\x77\x7f\
-\x73\x25\xc4\xd7\x0c\xe7\x1e\x58\x8a\x25\x89\x37\xa6\x19\x52\x1c\
-\xa6\x03\x26\x30\x7e\x03\x6a\x56\xfa\xa6\x81\xe1\x91\x79\xaa\x69\
-\xad\xa8\xd9\xdf\xde\x58\x5e\xc3\x6d\x20\x89\x6d\x25\x68\x24\xba\
-\x61\xb3\x77\xcb\x96\x9e\x47\x50\x4e\xd0\x1f\x01\xb7\x1c\xaf\x47\
-\xe2\x7d\x02\xcb\xc3\x7a\x65\xf4\xd7\x72\xdb\xd9\xdb\xff\x00\x6e\
-\xbc\xb7\xcc\x1c\xdb\xa4\x56\xf6\xc8\x25\xb9\x79\x4b\x00\xbf\x2c\
-\x30\xb7\xca\xf8\x62\x8e\x42\x94\xea\x78\xf0\xd5\x2b\xb6\xa4\x9e\
-\x9d\x4e\x8c\x47\xd5\xe3\x75\x3d\xcb\x3f\x0f\x3c\x05\x6b\xff\x00\
-\x0a\x66\xce\xd6\xd2\x4b\xfd\x53\x59\xd4\x20\x6b\x5b\xb8\x7c\x40\
-\xbf\x64\xb8\xbc\xfb\x6c\xd3\xcf\x21\x10\xb9\x25\x27\xba\x59\x24\
-\x2b\x16\x57\x6c\x65\x55\xca\x85\x7c\xf4\xde\x0e\xf8\xe9\xe2\x2f\
-\x84\xbe\x10\xd1\x74\xf5\xd3\xa3\xb8\x78\xe5\x36\xbf\xd9\x10\x2f\
-\x9a\x43\xcf\xcd\xad\xb4\x33\x29\xda\xc2\x3c\x33\x4b\x31\x38\x40\
-\xb8\x55\x20\x8a\xe7\xdf\xc6\x1a\x87\xc4\x8d\x7f\xc2\xbe\x32\xb7\
-\xb1\x9a\xf0\xf8\x7a\x18\x53\x4b\x5b\xaf\x2e\xcd\x23\xb8\xbd\x58\
-\xc5\xdd\xd4\xf1\x93\x84\x30\x5b\x95\x85\x77\x73\x19\x32\xaa\x82\
-\x0e\xea\x8f\xc2\x91\xc7\xac\x5d\x45\xac\x78\x6e\x18\x2c\xef\x35\
-\x27\x1e\x1e\xf0\xd6\xc4\x99\xac\xb4\xcb\x29\x24\x04\xce\x71\xb6\
-\x33\x22\xdb\xac\xd2\x9d\xc1\xb7\x34\xa9\x1e\x78\x38\xfa\x1c\x3a\
-\x84\x2a\x7b\x4a\x77\x5d\xee\x79\xae\xac\xa7\x0e\x59\x23\xea\xbf\
-\x87\xda\xde\xa1\xe2\x68\x2e\xae\xf5\x0d\x3a\x2d\x3e\x19\xee\x4f\
-\xd8\x62\x25\x8c\xcd\x6c\xa7\xf7\x72\x4b\xb8\x0d\xa5\xdb\x71\x11\
-\xf3\xb4\x30\x19\x38\x38\xe9\xd2\xe7\x08\xa3\xe6\x77\xc7\x41\xfc\
-\x47\x19\xe2\xbe\x67\x8a\xeb\xc5\x56\x7f\x10\xfc\x2a\xab\x3c\x3a\
-\xef\x86\x74\xc4\xbc\xcd\xed\xc8\x66\xbc\x5b\x89\xee\x66\x8e\x1d\
-\x85\x31\x92\x90\x11\x13\x0d\x84\x48\x18\xa8\x08\x53\x35\xdf\x7c\
-\x04\xf8\xff\x00\x27\xc5\x04\xbb\xb7\x9b\x4a\xbe\xb3\xb9\xd3\xe5\
-\x96\x36\x7d\x9b\xad\xae\x36\xdd\xdc\x41\x19\x8a\x46\x23\x73\x15\
-\x80\x16\x1c\x6d\x12\x21\x38\x04\xe3\xdf\xa5\x9a\x53\x6f\x90\xe1\
-\xfa\xbb\x4a\xe7\xb0\x67\x8c\xf6\xf5\xa9\x17\xa5\x55\x8e\x74\x91\
-\x17\x6b\x02\xbc\x05\xdb\xd0\xf1\x9e\x2a\xca\x1f\x90\x7d\x2b\xd5\
-\x8b\xba\xb9\xcd\xad\xf5\x16\x8a\x28\xa6\x30\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa8\
-\xb6\xed\x2d\x8e\xe6\xa5\xa8\xdb\x86\xa5\x7b\x13\x23\x98\xf1\xbf\
-\x87\x6d\x7c\x63\xa4\x5c\x59\xdd\x4d\x34\x31\xcc\x4a\xfd\xa6\x17\
-\xc4\xb6\xac\x32\x15\xe1\x71\xf7\x64\x46\x5d\xc0\xe0\x95\x60\x7e\
-\x5c\x13\x5f\x94\xbf\xb4\xcf\xec\x6f\xa2\xfe\xcf\x1f\xb6\xbd\xa6\
-\xb5\x26\xa9\xe1\xef\x2f\x5c\xd4\x67\xd0\xa6\x8a\x3b\x94\xb3\x92\
-\x2b\x8d\x6a\x34\x36\xb2\x6d\x20\x35\xbc\xb3\x5c\xdb\xcd\x1f\xee\
-\x24\x0a\x5e\x6f\x35\x3c\xb6\x66\x55\xfd\x0f\xfd\xad\x7e\x21\xdf\
-\x7c\x2f\xd1\xaf\x2f\x6e\x2d\x74\xdd\x5f\xc2\xf3\x69\xf7\x12\x6a\
-\x96\xda\x86\x91\x77\x2d\xa8\x8a\x25\x77\x90\xcf\x79\x02\xc8\xb0\
-\x44\x23\xeb\xbe\x09\x30\x17\x20\x12\x18\x8f\xce\x8f\x8b\xde\x2d\
-\x9f\xf6\xb1\xb0\xd4\xaf\x35\x21\x7b\x71\xf0\xce\x04\xbe\xd2\x6d\
-\xed\x6f\x60\xf9\x2e\xa1\x13\x1f\x29\x1e\xfe\xd3\x74\x97\xb6\x58\
-\x92\x46\x80\xab\x80\xac\x51\x88\x69\x4b\x44\xbe\x06\x77\xf5\x5e\
-\x5b\x56\xdc\xec\xc2\xfb\x57\x2b\xc3\xa1\xf2\xe7\x84\x7c\x77\xe2\
-\x7d\x64\x6b\x5e\x07\xd6\xae\xb1\xe3\x6b\xc4\xd4\x74\x2b\x99\xad\
-\x1f\xca\xfe\xd0\xd5\xf4\xbb\x59\xae\x2c\x2e\xa5\x87\x2c\xa4\x5d\
-\x59\xcf\x86\x75\x6c\x97\xb7\x3b\x88\x28\xfb\x7d\xc7\xc2\x3f\xb5\
-\xfb\x7c\x4d\xf8\x7d\xe2\x19\x0d\xe5\xd7\x89\x34\x3d\x73\x5b\xd3\
-\x35\xeb\x85\x9e\x56\x36\x96\xd6\xba\xbe\x9b\x6a\x8f\x14\xbb\xb7\
-\x6e\x6f\x39\xee\x86\xf6\x62\x1c\x10\xbf\x2e\x2b\xc8\x25\xfd\x98\
-\x7e\x1f\xf8\x7a\x4d\x42\xe2\x57\xd5\x62\xd3\x6e\x3c\x49\x65\xe2\
-\x0b\x2d\x65\xac\xde\xd6\xf2\xc4\xdb\xe9\x33\xea\x12\x47\x3c\x51\
-\x64\x2a\xa3\x9c\x70\x91\x6e\x11\x8c\x6d\x2a\x19\xb5\xac\x7f\x67\
-\x6b\xcf\x84\xbe\x0e\xd1\xbe\xcb\x1c\xda\xa5\x96\xa9\xa4\x88\x8d\
-\xcc\x77\x2a\x6d\xf7\x59\x5d\x1d\x4f\x49\x32\x32\xee\x32\x2a\x09\
-\x5e\x36\x60\x15\x4a\x46\x08\xc8\xe9\xf2\x71\xc5\xd2\xa1\x0f\x76\
-\x26\xd5\x29\xce\xac\xef\x73\xec\x8b\x3f\xda\x73\x4c\xba\xf0\xa6\
-\xa9\xa1\x9b\xe4\xf0\xee\x97\x26\x83\x0d\xe5\xc6\xb4\xb2\x1b\x9b\
-\x66\x37\x30\x5c\xea\x57\xc6\x32\x54\xfc\x91\x59\x2a\x92\xeb\xbd\
-\x8c\x97\x31\xa0\x01\xb2\x17\xa0\xf8\x37\xf1\xc2\xc7\xc3\x9a\xbd\
-\xd5\xd5\x9d\xd5\xac\xfe\x1e\xb2\xd3\xed\xf5\x49\xde\x77\xf9\xac\
-\x5e\xf6\x38\xfc\x98\x76\x03\xfb\xb8\xd2\x2f\x24\x85\x75\x1b\xfe\
-\xd0\xaa\x59\xb2\x16\xbe\x35\xf8\x70\x3c\x45\xa3\x5c\x5c\x15\x86\
-\x36\xb5\x8a\x1b\x89\x75\xfd\x43\x54\xd3\xd5\x2d\xa4\x8a\x74\x8a\
-\xe6\xea\x1b\x29\x1e\x4d\xb3\x6e\xb8\x11\xa2\xc7\x8f\x2a\x18\x63\
-\x0a\xea\xe4\xaa\x9d\x2f\x07\x7c\x4d\xff\x00\x84\xa1\x26\xd5\x97\
-\x53\x8b\xc5\x9f\x60\xd5\xcc\x30\x59\xde\x3c\x56\x16\xda\xb7\x88\
-\x44\xe9\x2b\x6b\x57\x17\x1f\x70\x5a\xd9\x6c\x8a\x28\xb7\xa6\xc7\
-\xf2\x76\x80\x5d\x50\x3d\xd3\xc5\x7b\x7f\x84\xea\x8d\xa9\xe9\x23\
-\xee\x2d\x0b\xe2\x84\x9a\xee\xad\xa7\xd9\xbc\x90\xdf\x49\xa8\xf8\
-\x8a\x3d\x4b\xec\xb7\x2c\xd0\xc9\xa5\xe9\xb6\x1b\x51\x98\xed\x3b\
-\x9d\x9a\xe5\x58\x46\xa4\x0f\x33\xce\x6d\xc5\x91\x38\x3c\x03\xf1\
-\x03\xc4\x9e\x1f\x1a\xb6\xa5\x6b\x35\xb6\xa1\x6b\x6c\xf6\x7a\x44\
-\xb3\x49\x38\x16\x96\x0c\xb7\x97\x33\xdc\x49\x3e\x1b\x04\x25\xac\
-\xe8\x70\xbf\x37\xee\xd1\x1b\x92\xa5\xbe\x43\xfd\x93\xff\x00\x69\
-\x4d\x37\xc6\x9a\x7f\x8d\xb4\xff\x00\x0c\xbe\xa5\xe2\xf9\x34\xed\
-\x48\x5b\xda\xc9\x67\x61\x3a\x46\x61\x86\xdd\xb6\xec\x95\x81\x8d\
-\x12\x6b\xb1\x22\xc6\x33\x24\xbb\x9d\xee\x1c\xa0\x90\xa2\xfb\x37\
-\x8e\x3e\x2b\x59\xbc\xff\x00\x0f\xfe\x15\xac\x13\x5d\x6b\x3e\x20\
-\x92\x4f\x13\x78\xe7\x4f\xf0\xec\x47\xfd\x2a\xda\xca\x08\xe7\x78\
-\x15\x90\xa8\x11\x5c\xdc\x3c\x31\x2b\x3e\xe1\x22\x43\x32\x0c\xbe\
-\x14\x61\x39\x4d\x54\x4a\x2f\x53\xba\x31\x84\xa1\xa1\xf6\xa7\xc1\
-\x0f\xda\x96\xd7\xc5\xbe\x02\xf0\x7e\xa9\xab\x4f\xa5\xc3\x1f\x8a\
-\xb4\x9b\x8d\x5e\x3b\x8b\x29\x87\xd9\x22\x85\x6e\xe0\x8e\x01\xb9\
-\xb0\x37\x15\xb9\x89\x5b\x19\x08\xea\xe1\x98\x6d\xe7\xd1\xbe\x0e\
-\xfc\x6a\xd3\x7e\x32\xfc\x3d\xb3\xf1\x0e\x9f\x63\xad\xe9\xf6\xb7\
-\x6f\x71\x10\xb6\xd4\xac\x5a\xd6\xee\x17\x82\x79\x2d\xe4\x59\x21\
-\x39\x64\x60\xf1\x30\xda\x7e\x61\xc0\x20\x12\x05\x78\x3f\xc3\x6f\
-\x0b\xdb\xf8\x9b\xc3\x50\xeb\x96\xda\x6a\xf8\x6e\x3d\x46\x0d\x33\
-\x46\xb6\xf0\xfc\xbe\x4d\xb3\x68\x8a\x66\x49\x66\x85\x92\x02\x42\
-\xcc\x32\x10\x22\x95\x51\xe4\x16\x1b\x43\xee\xae\xdb\xc0\x3f\x13\
-\xec\xfc\x1f\xe3\xbd\x1f\xc2\xf6\xf0\xef\x87\xc4\xda\x96\xbf\x22\
-\xdc\xba\x34\x72\xc3\x79\x1d\xdb\x4c\xf1\xb4\x64\x8c\x46\xe2\xe3\
-\x21\xb2\x3e\x60\xa0\x80\x5c\x6d\xfb\x4c\xa3\x1a\xea\x47\x96\x7b\
-\x9e\x06\x22\x8f\x2c\x9b\x47\xba\x2b\x6e\x50\x79\xe7\x9e\x46\x28\
-\xa8\xe2\xb8\x56\x89\x58\x6e\xc1\x00\x8e\x31\xfa\x1a\x90\x1c\x8a\
-\xf7\x3c\x8e\x60\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa8\x65\xfb\xf5\x35\x46\xc4\xe6\
-\xa6\x5a\xab\x13\x28\xdd\x1f\x08\xff\x00\xc1\x53\xbe\x23\x6a\x5f\
-\x0b\xfc\x25\xe2\xcb\xad\x32\x1f\x88\x9e\x1b\xf1\x44\xed\x61\x6b\
-\xe1\xff\x00\x13\xda\x5e\xcd\x3e\x95\x73\x25\xc5\xc4\x11\x79\x4e\
-\x36\xcb\x6d\x6d\xe5\xb4\xc1\x7c\xb9\x61\xfd\xee\x55\x91\x8b\x19\
-\x2b\xe4\x3f\x03\xd8\xdb\x78\x17\x59\xb7\xd2\x7c\x3b\xab\x47\xa8\
-\xc3\x6d\x19\x92\xd9\x3c\x1a\x61\xd2\xaf\xac\xed\xe3\xb7\xf2\x5d\
-\xda\x21\x74\x23\x94\x02\xa8\x19\x5a\x12\xa5\x8e\x76\xef\x26\xbe\
-\xd5\xff\x00\x82\xb8\xfc\x37\xd4\xfc\x63\xf0\xd1\x6e\xbc\x3f\x71\
-\xe2\x5b\xdf\x12\x41\x2c\x33\x69\x96\x0b\xa4\x5c\x5f\x69\xa9\x2c\
-\x33\x24\xb0\x49\xf2\xcb\x05\xbc\x32\x0b\x98\xe3\x63\x24\xed\x23\
-\x18\xd2\x40\x14\xaf\x03\xe3\xcb\x6f\x8a\xf7\x12\x5b\xc3\xe2\xad\
-\x63\xc4\xdf\x03\xbc\x27\xf6\x1d\x61\xb4\x8b\x99\xa2\xd3\xa7\x7d\
-\x52\x1b\x82\x5d\x1c\x5b\x93\x2b\xfd\xb2\x41\xb8\x88\xcc\x02\x55\
-\x97\xcb\xf2\xf0\xc6\x32\x07\xc3\xe7\x98\x79\xd4\xc5\x2d\x74\x3d\
-\x4c\x1d\x75\x4e\x36\x24\xba\xd2\x3c\x3b\xae\x78\xd2\xe2\xe2\xcf\
-\x5c\xf1\x74\x9e\x31\xb5\xd5\x2d\x6e\x6e\xae\x7e\xc5\x71\x1d\x9c\
-\x53\xba\xc7\x60\xce\xf0\xbd\xb3\xdb\x86\xf2\x27\x78\xe4\x8e\x32\
-\x88\x3c\xb3\xcc\x0e\x1d\x86\x77\xfc\x21\x3a\xb7\xc2\x56\xd5\x75\
-\x3f\x0c\xf9\x37\xb2\x59\xd9\xdd\xdd\xb5\xac\x0b\x14\x70\xc6\x60\
-\xd5\xa0\xb7\x9d\x2d\x60\x76\x7f\x2a\x39\x2d\xed\x5b\xee\xb9\x41\
-\x22\x33\x85\x47\x66\x0d\xb3\xf1\x5f\x5b\xd5\x2e\xb5\x58\x6d\x57\
-\xc4\x5e\x29\xd0\x3c\x25\xe1\xa9\xa0\xd0\xac\xbf\xb2\xe5\x6b\x8f\
-\x11\x78\xe7\x58\x85\x8a\xb2\x47\x31\xcb\xad\xba\xa8\x3e\x60\x2c\
-\x0c\x8c\xaf\xe6\x79\x70\x46\x19\xba\x6d\x73\xc3\x77\x93\xf8\x01\
-\x75\xed\x3f\x47\xb0\xb5\xd6\xef\x7c\x39\xa8\xdb\x78\x80\xdf\x49\
-\x25\xc6\x9b\x71\x1c\x51\x1b\x87\xb5\x9d\x22\x6d\xae\xde\x65\xdb\
-\xaa\x34\x4e\x8c\x8a\x37\x21\x90\x33\x23\x79\x75\xe8\xf2\xfb\xaf\
-\x63\x6a\x55\x53\x9b\x3c\x87\xc7\xdf\x05\x23\xf8\xb5\x7b\x37\x86\
-\x74\x99\xad\xbf\xb2\xf4\xff\x00\x15\x5c\xe9\xd7\x9a\x7d\xc5\xe3\
-\xbc\x57\x96\xd3\x2c\xcf\x14\x92\x45\x23\x09\x27\xff\x00\x97\x56\
-\xf2\x83\x22\xcd\x15\xc2\xa6\x64\x40\xa4\x7c\xef\xe3\x9d\x07\x58\
-\x4f\xda\x16\xfb\xc3\x3e\x39\xd5\xad\xed\xf4\xd8\x3c\x8f\xec\x45\
-\xbe\xd3\xa6\xbd\xd3\x72\x8e\xaa\x20\x86\x24\x11\xc0\x55\x51\xd5\
-\x1b\xcd\xd8\xd8\xdc\xd8\xc0\xf3\x87\xdd\x1e\x22\xd1\xb4\xfd\x73\
-\x56\xd7\x7c\x33\xa5\xe9\xda\x85\xa7\x89\xec\x62\xfe\xdd\x7b\xbb\
-\x7b\x05\x29\xae\x2d\xaa\x42\xab\xf6\x10\xac\x4d\xc3\x27\xd8\xe2\
-\x59\x10\x8f\x9d\x24\x8f\x2c\x23\xc0\x1e\x3f\xf0\x7f\xe0\xe4\x3f\
-\x1c\xfe\x33\x5e\x47\xe0\xa9\x24\xb1\x93\x4d\xd3\x8c\x3a\x76\x89\
-\x7d\x14\xb0\x5b\x5e\x5c\xce\xc9\x99\x63\xba\x62\xc7\xce\x81\x63\
-\x2b\x26\x41\x36\xe4\xe5\xa2\x21\x1d\x06\x94\x69\xce\x36\x85\x15\
-\xa9\xe6\xe3\xb1\x12\x53\x46\xbe\x97\xad\xaa\xf8\x1e\x3d\x1f\xc3\
-\x7a\xae\x95\xa0\xcf\xa7\xdb\x18\xf5\x0d\x62\xf2\x35\xb1\xb7\x3c\
-\xc7\x97\x82\xce\x67\x0f\x2c\x49\x1e\xf1\xf7\x82\x17\x40\x59\xf8\
-\x93\xcc\xec\x7f\x67\x7f\x82\xba\x4f\x8c\xb4\x2f\x10\xf8\x93\xc1\
-\x7f\x11\xb5\x58\x74\xbd\x49\xae\x34\xff\x00\x1b\x78\xea\xe1\x64\
-\xb5\xd4\xa1\xb2\xb7\xdf\x26\x6d\x2f\x6e\x18\xf9\x2a\xab\x21\x90\
-\xdc\xed\x68\x8f\xcc\x91\x05\x90\x10\x3a\x2d\x0b\xf6\x6a\xf8\xfd\
-\xf0\xaa\x3b\x18\x6d\x7c\x21\x65\xad\x6b\x8b\x61\x76\xd2\x5f\xea\
-\xde\x1e\xb5\xbe\xb8\xf3\xc0\x38\x89\xae\xcd\xfc\x76\xd1\xef\x41\
-\x1f\xce\x57\x6c\x80\x00\xfe\x52\xa8\x48\xfe\x80\xf8\x1d\xfb\x0b\
-\x7c\x45\xd7\xbc\x27\xe6\x7c\x4a\xbc\xd2\xf5\x3b\xc9\x24\x17\x90\
-\x58\x4d\xe4\x0b\x0d\x32\x61\xca\x38\xb7\x82\x15\x82\xe2\x45\x67\
-\x91\xc1\x99\x5d\x51\xb6\xe0\x31\x0a\xea\x7f\x64\x66\x12\xad\xcf\
-\x63\xd5\xc3\xe6\x10\x54\x79\x5e\xe7\x9a\x7c\x36\xf1\x66\x8f\xfb\
-\x2d\xf8\x0b\x43\xfb\x2e\xa1\xa9\xda\xf8\x7e\xce\xf3\x52\xf1\x47\
-\xf6\x56\x9d\x6c\xd2\xdc\x6a\xf1\x5e\x07\x4b\x28\x2e\x64\xb9\xdf\
-\x34\xd7\x37\x01\x84\xcc\xa4\xb3\x97\x3f\x39\x48\xda\x35\x3f\x53\
-\xfe\xca\x7a\x76\xbd\xe3\x6f\x0e\xe8\xfe\x23\xd6\x2d\xf5\x0d\x26\
-\xde\xe6\xc6\x7b\xc6\xb5\xb9\x81\x7c\xf9\x2f\x2f\x26\xf3\x67\x8e\
-\x41\xf3\x61\x22\x55\x48\xd4\xab\x91\x26\xe9\x1b\x3f\x70\xd5\x5f\
-\x87\x9f\xb0\x6a\xd8\xfc\x45\xb1\xf1\x1f\x8a\xfc\x51\x79\xe2\x45\
-\xd0\xee\xa5\xb9\xd1\xb4\xb5\x80\x5b\xda\xda\xbc\x81\xc1\x96\xe1\
-\xb2\xd2\x5d\x4d\x87\x24\x19\x0e\xc4\x6f\x99\x51\x58\x06\x1e\xf9\
-\x67\xa2\x9b\x5b\x5f\x2d\x9a\x39\x5c\xae\xd2\xec\x9d\x79\xcf\x4f\
-\xee\xfa\x0e\xde\xf5\xf5\x19\x3e\x5b\x5a\x8d\xe7\x5b\x73\xcc\xad\
-\x5f\x9d\xb2\xdc\x45\x42\x28\xf9\xba\x75\x3d\x6a\x51\xd2\xa3\x30\
-\x54\x8a\x30\xb5\xf4\x0b\x7b\x9c\xb1\xbe\xcc\x28\xa2\x8a\xa2\x82\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\xb1\xbc\x59\xaf\xcd\xe1\xcd\x07\x50\xbe\xb7\xb0\xbb\xd4\xae\x2d\
-\x61\x79\x52\xd2\xdb\x69\x9e\xef\x68\xcf\x97\x18\x62\xa0\xbb\x1e\
-\x06\x48\x19\xea\x40\xe6\xb6\x6b\x3e\xf6\xcb\xcf\x2e\xc7\x86\x55\
-\x65\x04\xb1\xc8\x07\x92\x01\xea\xb9\xc2\xf4\xe9\xb6\xa6\x5a\x6a\
-\x26\x7c\xc3\xfb\x6d\xfc\x49\xd1\x6c\xfe\x18\xd9\xf8\xcb\x5c\xbe\
-\x93\x50\xf8\x17\xad\x5a\x4d\xa7\xf8\xc1\xec\x5e\x68\x26\xd2\xc4\
-\x85\x3e\xcf\x7c\xd2\xdb\x6c\x9f\xc9\x59\x63\xfb\x35\xcc\x7b\xc8\
-\x09\x22\x16\x0a\x22\x93\x3f\x9b\x7e\x1c\xfd\x9c\xed\x74\xff\x00\
-\x8d\x3a\x6f\x8f\x3c\x1c\xf7\x1a\x4c\x3f\x12\x35\xbf\x10\x78\x9b\
-\x44\xd2\x63\x44\x10\xe8\xba\x4c\x37\x6d\x6f\xa4\xdf\x5b\x40\x10\
-\x08\x44\xeb\x73\x73\x2a\x85\xd8\x8d\xe6\x43\xb9\x76\x33\x2b\xfe\
-\xa8\xfc\x6e\xf8\x48\x9a\xf4\x5e\x23\xf0\xec\x3a\x9e\x9b\x61\xe1\
-\x7f\x1d\x69\x53\xd8\x5f\xe9\xb7\x16\x31\x35\x8b\xdc\x4e\x42\xcd\
-\x73\x8c\x65\xe5\x78\xf2\x0c\x2c\xc2\x37\x3c\xb2\x31\xdc\x5b\xf3\
-\xcb\xe0\xe7\xc1\x06\xf0\xa7\xc7\x09\x35\x0f\x0c\xe8\x30\xde\x78\
-\x7f\xc3\x76\x6b\xa7\xe9\xb1\x5d\xad\xdc\x8d\xe2\x27\xb5\x16\xb0\
-\x5a\xac\x68\xaf\x85\x66\xb8\x9a\x24\x47\x0d\x18\x82\x38\xe6\x75\
-\x89\x9b\xe6\x1f\x3b\x98\x56\x55\x66\xa9\x53\xf8\x99\x97\xd6\x1c\
-\x65\x62\x9f\x83\x7e\x21\x6a\xf6\x9a\xad\xe5\xe6\xaf\x6b\x63\xa2\
-\xf9\x9a\x26\xbf\x6f\xa5\xe8\xca\xe2\x69\x74\x4b\x5b\x15\x55\x5c\
-\xed\x3b\x1e\xf6\x49\x1e\x66\x9e\x48\x53\x61\x55\x09\xb9\xc2\xee\
-\x7f\x41\xf0\xcf\x86\xf4\x3f\xda\x93\xf6\x4b\xd7\x34\x9b\x28\xee\
-\x21\x8f\x5e\xf0\xf5\x85\xee\x88\x97\xf0\x96\x99\xfe\xcf\x6b\x6a\
-\x16\x56\x12\x49\x95\x96\x3b\xc5\x68\x1d\x09\x57\xc9\x56\x2e\xc8\
-\x43\x1d\x9f\x01\x7f\xc1\x3b\xbe\x29\x78\x3b\xc6\x5f\x0e\x61\xf1\
-\xbf\x87\xbc\x21\xf1\x2a\xfa\xd3\x57\xd4\x25\xd6\xf5\xcb\x1b\xb9\
-\x2c\x60\xbe\x87\x52\x1a\xab\x4b\xbc\x79\x2c\xcb\x95\x6b\x64\x94\
-\x26\xd4\x68\xfc\xb0\x13\x77\xcf\x5e\xad\x6d\xfb\x06\x78\x9b\xc0\
-\x7a\xd7\x81\xfc\x61\x67\xaa\x4d\x67\xaa\x78\x7e\xe6\xf3\x44\xb9\
-\xd1\x74\x94\x53\x6a\x91\x6a\x97\x4a\xf3\xce\xb3\x4c\xaf\x34\xab\
-\x1b\xf9\x6c\x11\xc8\x4d\xaa\x48\x0a\xff\x00\x31\xf3\x6a\x64\xb8\
-\xa5\xa2\x77\x3d\x0a\x38\xa5\xcd\x73\x99\xfd\x9f\x7c\x4b\xff\x00\
-\x09\x96\x9f\x67\xa9\x45\x79\xf6\xe9\xaf\x2d\xd7\x5e\xb1\x6d\x44\
-\x89\xae\xec\x9e\xe8\x22\xc9\x6b\x7c\xa0\xef\x50\xb2\x44\x15\x19\
-\x02\xb8\x48\x99\x5c\x9d\xa5\x8f\x84\xfc\x12\xfd\x95\xf4\x4f\xda\
-\x63\xf6\xa1\xf1\xaf\x8d\x35\x7d\x36\xd2\xce\x4d\x70\xd9\x4d\xa6\
-\x47\x1d\xf3\x47\x61\x77\x7f\x00\x92\x5b\xc1\x0d\xcc\x53\x2b\x79\
-\x84\x22\xb9\x32\x2b\x21\x60\xfb\xd5\x5d\x84\x83\xea\x8b\x3f\xd9\
-\x16\xef\xc7\x1f\x13\xae\x26\x9a\xf3\xc5\x49\xa7\xdb\xdf\xeb\x30\
-\x22\x45\x71\x1c\x10\xe9\x7f\x67\xb9\xb5\x9a\xc8\xc2\xd1\xc7\x13\
-\x85\x98\xc6\x56\x40\xed\x23\x38\x5d\x9b\xc4\x60\xa9\xfa\x7b\xe0\
-\xa7\xc1\x3d\x0f\xe1\x0f\xc3\x5b\x7d\x07\x41\xd3\xd7\x4b\xd2\x4c\
-\xf2\xdf\x25\x9f\x96\xb1\xfd\x9a\x59\xe4\x6b\x89\x4e\x17\x20\xbb\
-\x4d\x24\x8e\xc4\x96\xcb\x48\xd9\x24\x60\x57\xa1\x97\xe5\x35\x63\
-\x3e\x7a\xa7\x3e\x26\x5e\xd2\x44\x7f\x0c\x3e\x19\x26\x85\x7f\xaa\
-\x6b\x30\xdd\xf8\x88\x7f\x6f\x34\x52\xff\x00\x66\xea\x33\xa3\x47\
-\xa6\x32\x97\x66\x11\x2a\x83\xb0\xb6\xf0\xad\xf3\x30\x65\x8a\x35\
-\xc7\x05\x9b\xbc\xb3\x81\xa3\xb5\x8c\x3b\x2b\xc8\x10\x02\xc1\x4a\
-\xe4\xe3\xaf\x24\x9f\xcc\x9f\xa9\xa7\x08\x19\x42\xe3\x19\x51\x80\
-\x3b\x54\xaa\x36\xa8\x1e\xd5\xf4\x9d\x48\x4a\xc8\x02\xe2\x96\x8a\
-\x2a\x86\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x4d\x67\xda\x28\x01\xd9\xaa\xe7\x52\x8f\xcd\x29\
-\xb6\x46\x61\x93\x80\xbd\x86\x01\xfd\x4f\x4e\xa7\x9c\x03\x5c\x76\
-\x89\xfb\x41\xf8\x67\xc4\x1f\x12\xfc\x55\xe0\xfb\x6b\xff\x00\xf8\
-\xa8\xbc\x1c\x6d\x0e\xa5\x67\x24\x66\x36\x8d\x2e\xd3\x7d\xbb\xab\
-\x36\x15\x95\xf0\xe8\x08\x38\x0f\x1b\x29\xc1\xc6\x79\xaf\xd9\xc7\
-\xe2\x7e\xb1\xf1\x8b\x4a\xf1\x5e\xb3\xa9\x59\x69\xb0\xe9\x71\xf8\
-\x9e\xfe\xcb\x42\x36\x8d\xe6\x35\xe5\x8d\xb3\xac\x09\x34\x8c\x0e\
-\x37\xc9\x2a\x4c\xcb\xfd\xd5\xda\x3a\xe7\x13\xcc\x9b\xb2\x03\xd7\
-\x81\xdc\x3f\xfa\xd5\x93\xaf\xeb\x11\xe9\x76\x37\x53\x18\x99\x9a\
-\x18\xde\x50\xa1\x4b\x19\x02\x8c\xb6\x00\xc9\x27\xdb\x1c\xf6\xcd\
-\x5e\x5d\x46\x33\xb7\x9c\xee\xe8\x71\xc3\x71\x9e\x3d\x7a\x76\xcd\
-\x72\xbe\x39\xf8\x93\x67\xe0\xcd\x47\x4d\x8a\xea\xc7\x5c\xb9\x8f\
-\x56\xb8\x78\x84\xd6\x3a\x74\x97\x50\xdb\x05\x8b\xcc\xf3\x27\xf2\
-\xf2\x63\x4c\x0c\x06\x6c\x0d\xde\xdc\xd4\xd4\x4d\xe8\x09\xab\x9f\
-\x2a\xfe\xde\xfe\x30\x87\xc6\xbf\xb3\xe7\x87\xfc\x5d\xe1\xad\x4a\
-\xea\xca\x6d\x26\xfb\xfb\x5a\xd9\x61\x96\xe2\xd6\xe9\x5d\xa1\x67\
-\xc9\x42\xc8\x55\xfe\x62\x3c\xb9\xd7\x6e\x07\x40\x76\x83\x9f\xfb\
-\x31\xfc\x2a\xf0\x06\xb5\x6b\xf0\xa2\xea\xea\xef\x50\xd2\x75\x9f\
-\x86\x5e\x1e\x5f\x15\xc5\x69\xe6\x28\xb5\xdb\x73\x0d\xc5\xa8\x6b\
-\x82\xc9\xf2\x90\x23\x91\x95\x80\x05\x4c\x79\xe3\x0c\x24\xea\x3f\
-\xe0\xa4\x1f\x0b\x5b\xe2\xcf\xec\xd9\xae\x78\x8b\xc0\xf7\xd0\xb6\
-\xa9\x6f\x02\xdf\x41\x35\xa3\x09\x56\xed\xe3\x56\x2b\x14\xa1\x49\
-\xde\x4e\xe6\x00\xf1\xb1\x8a\x1e\x0a\x96\x3f\x3d\xfc\x1f\xf8\x55\
-\x37\xc5\x4f\x85\x92\xeb\xd7\x57\x11\xad\xae\xbd\x65\xa7\x58\xcf\
-\xa7\xeb\x9a\xdd\xcd\x9e\x99\x7b\xa4\xdb\xee\x69\x2d\xae\xde\x1c\
-\x31\x82\x38\xe5\xb8\x6f\x2d\x86\xc9\x4e\x03\x1f\x2f\x02\xbe\x45\
-\x54\xf6\x39\x8a\xbe\xa9\x9c\xb2\xd2\xa3\xd0\xfd\x1c\xf8\x69\xe3\
-\xfd\x1f\xe2\xa7\x84\xec\x75\xef\x0e\xea\xfa\x5e\xbd\xa3\x6a\xb1\
-\x24\xb6\xf7\xb6\x32\xac\xd0\xdc\x21\x4d\xdb\x83\x2b\x30\xe4\x15\
-\xe0\x9c\xe0\x7a\xd7\x48\xb0\x66\x35\xf2\xf6\xed\x60\x0e\xe0\x7a\
-\xf6\xfe\x5f\xd2\xbc\xef\xf6\x72\xf1\xe7\x84\xfc\x7b\xf0\x97\x47\
-\xd4\xfc\x13\x6e\xb6\xbe\x1b\xb8\x89\xa4\xd3\xcc\x3a\x67\xd8\xa0\
-\x9e\x35\xf9\x7c\xe8\xe2\xd9\x1e\x23\x71\x86\x46\x2a\x03\xab\x06\
-\x50\x41\x15\xe9\x31\xbe\x23\x5c\xe7\x38\xe6\xbe\xba\x2e\xfe\xf1\
-\xd2\x99\x5e\x5d\x3d\xa4\x0c\xaa\xc2\x35\x60\xfb\x76\xff\x00\x09\
-\x38\xc1\xc7\x7e\x72\x79\xee\x6a\xd2\xae\x05\x20\x7e\x33\x83\x4c\
-\x92\xed\x63\x24\x61\x8f\x20\x71\xea\x4e\x2b\x41\x92\xd1\x4c\x8a\
-\x75\x98\x02\xbd\x08\xc8\xa7\xd1\x70\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\xcd\xd7\
-\xf5\xf8\xf4\x4d\x26\xf2\xe9\xa1\xba\xb8\x16\x70\xbc\xed\x14\x11\
-\xef\x99\xc2\x86\x24\x2a\xf5\x62\x76\x90\x00\xea\x48\xc5\x69\x55\
-\x2b\xcd\x2d\xa7\x2f\xb5\xb6\xef\x3d\xc9\xe0\xe5\x4e\xef\x5c\xae\
-\xde\x39\x1d\x4d\x00\x7e\x7c\x7e\xdb\xff\x00\xb4\x6c\x9e\x04\xd3\
-\xed\x3e\x3b\xfc\x27\x30\xf8\x96\xd7\xc5\x5a\x55\xc6\x9b\x20\xb7\
-\xdd\x1d\xc2\xdd\xda\xc5\x72\xdf\x66\x2b\xb7\x09\x75\xe5\x34\x99\
-\x8e\x64\xdc\x92\x58\xac\x4c\xa5\x9f\x68\xfa\xf3\xf6\x5e\xf0\xf6\
-\x9f\xe0\xbf\x84\x56\x5a\x35\x9d\xc1\xba\x5d\x16\x46\x82\x69\x64\
-\x74\x93\x6c\xce\x44\xd2\x01\xb4\x0f\x2f\xe6\x97\x70\x43\x82\x03\
-\x0e\x2b\xc9\xff\x00\x6c\x8f\xf8\x26\xce\x83\xf1\xcf\x5f\xba\xf1\
-\x66\x87\x6e\xba\x37\x8a\xaf\x84\x6f\xab\x47\xa6\x5e\xcd\xa4\xb7\
-\x88\x0c\x07\x7c\x12\x3c\xd1\x64\x7d\xae\x07\x08\xd1\x4e\xf1\x48\
-\x7e\x52\xae\x19\x76\x08\xfd\x07\xe0\x3f\x8f\x6d\x3c\x67\xf0\xa6\
-\xe6\xc7\x47\xbc\x9a\x3f\x10\x58\x24\xba\x75\xeb\xea\xb6\x31\xdb\
-\xde\x25\xec\x68\x23\x91\xee\x22\x88\x08\xcb\xa9\x44\x77\x09\x95\
-\x70\xc8\xca\x42\xba\x83\xc9\x77\x09\xb6\xfa\x93\x18\xbb\xb3\x1b\
-\xe2\x9f\xed\x0b\xe2\x7d\x7e\xdb\x4d\x8f\xe1\x06\x85\xa4\xf8\xa9\
-\xb5\x4d\x5a\x1b\x49\xb5\x9b\xdb\x80\x9a\x35\xac\x0b\x3a\x8b\xc9\
-\x59\x94\x87\xb8\xf2\xe0\x57\x28\xc9\x85\x67\x91\x15\x59\xdb\x70\
-\x5f\x6f\xb1\x59\x92\xd1\x56\xe6\x55\x9a\x68\xf0\x09\x89\x4c\x7e\
-\x69\x00\x31\xf9\x49\x6c\x12\x77\x71\x9e\x9d\x4d\x7c\xb5\xfb\x3c\
-\xfc\x67\xd6\x7e\x1f\x7e\xd2\x1f\x10\x3c\x23\xe3\x2b\x56\xd0\x74\
-\x9f\x07\x78\x6e\xca\xf2\x0d\x46\x58\x85\x95\xbe\xa7\x6f\x04\x4d\
-\xf6\xdb\xe8\x20\x0b\x84\x87\xed\x2d\x28\xf9\x5b\x68\x45\x8f\x08\
-\x39\x61\xe9\x5f\xb1\xef\xed\x57\x1f\xed\x6f\xe0\xdd\x6b\xc4\x1a\
-\x6f\x85\xf5\xdd\x07\xc2\x76\xba\xac\xda\x6e\x89\x7b\xa9\x62\xdd\
-\xb5\xf8\xe1\x62\x92\x4f\x1c\x07\xe7\x81\x04\xa1\x91\x44\x9b\x49\
-\xda\x41\x03\x15\xb4\x5f\x33\xb1\x11\x7e\xf1\xe6\xff\x00\xf0\x51\
-\xff\x00\x87\xda\xa6\x93\xf0\xef\xfe\x12\x4f\x0b\xea\x1a\x6d\x8c\
-\xf7\x3a\xce\x9f\x63\xae\xdb\x5e\xc0\xed\x67\xab\x59\xdc\xcd\x1d\
-\xa3\x24\xac\x08\x10\xaa\x99\x91\xda\x53\xfc\x2a\xa1\xc9\x40\x2b\
-\xe6\xff\x00\xd9\xb3\xc2\xb3\x27\xfc\x13\xdb\xc2\x7e\x15\xbc\xbe\
-\xd4\x35\x1b\xc9\xb5\xa8\x3c\x28\xb2\xde\x44\x0b\x35\xcc\xba\x9c\
-\x96\x61\x6e\x22\x91\x48\x75\x0a\x58\xbe\xf4\x65\x6c\x0c\xec\x38\
-\x35\xf5\x67\xfc\x14\x7b\xc1\x7a\xd6\xb1\xf0\x66\xeb\x54\xf0\xdd\
-\xef\xfc\x4c\xe6\x5f\xec\x79\x6c\x75\x0b\x8b\x8f\xec\x1b\xe8\xae\
-\xd9\x20\x26\xfe\x08\xfe\x6d\x88\x1c\x10\xf0\x98\xe7\x56\x31\xe2\
-\x55\x01\xab\xc4\x7c\x07\xf1\x16\xeb\xe0\x4f\xec\xe5\x07\x8f\x75\
-\xad\x45\xb5\x7b\x1f\x07\x5c\x5b\x6a\x7a\x86\x9d\x74\xa9\xb2\xdb\
-\xc9\x81\xa2\xbd\xf2\x98\x00\x5a\x65\x6d\xf7\x11\x0c\xe5\x99\x19\
-\x55\xff\x00\x78\x36\xf8\x95\x23\x4e\x18\xd8\xb9\x13\x2f\x8e\xe7\
-\xdd\xda\x6e\x9f\xfd\x9b\x6d\x1d\xa8\x93\x72\x46\xab\x11\x31\x23\
-\x2a\x9e\x07\x18\xdc\xc5\x48\x24\x63\x27\x81\xc0\x18\x19\xad\x13\
-\xa9\xa8\x8b\x2a\xae\xca\xa3\x25\x95\x0e\x3a\xe3\xa7\x5e\xb9\xf5\
-\xe9\xf4\xcf\x80\x7c\x0f\xf8\xcf\xe2\xef\xda\x47\x47\xd4\xbc\x5f\
-\x75\xe0\x8b\xbf\x04\xf8\x3d\xad\xc5\xc7\x86\x22\xd6\xd9\xe3\xd7\
-\x35\x32\x8a\xfb\xee\x6e\xac\xc0\x09\x6d\x0b\xa3\x2a\x24\x45\xcc\
-\xa7\xef\x37\x96\xc1\x55\x6c\x7e\xc6\xdf\x1a\x35\x0f\x15\xdd\x78\
-\xd3\xc1\x7e\x24\xbe\xb6\xbc\xf1\x37\xc3\xfd\x6d\xac\xd2\xe4\xca\
-\x1a\xe3\x52\xd3\xe6\x8e\x39\xad\x27\x7c\xa8\xc4\x82\x26\x68\xa4\
-\xc0\xe4\xdb\x6e\xe4\x38\x27\xd6\x94\xb5\x71\x5b\xf4\x35\xe9\x73\
-\xd4\x34\xff\x00\x8e\xde\x1b\xbf\xf1\xed\xaf\x86\x62\xd4\xe1\x9b\
-\x5a\xd4\x34\xf9\xb5\x3b\x4b\x74\xe4\x5d\x41\x14\xa2\x19\x4a\x3f\
-\xdc\x66\x49\x19\x55\x90\x36\xe5\x2c\x32\x07\x38\xd0\xf8\x81\xe2\
-\x49\xbc\x35\xe1\x1d\x57\x50\xb2\xd3\xee\x35\x8b\xed\x3e\xda\x5b\
-\xab\x7b\x2b\x76\x54\x92\xea\x45\x8c\xb2\xc4\xac\xc5\x51\x59\xf1\
-\x85\x2e\xca\xa4\x90\x0b\x0e\xb5\xf2\xe7\xc6\x59\x6c\x3e\x17\xfe\
-\xd9\x5e\x1f\xba\xb9\xff\x00\x41\xb5\xd1\xb4\xe9\xf5\x1b\x3b\xb5\
-\x89\x24\x5b\x45\x96\x74\xb6\x9a\xd4\xc5\xbb\xcc\x31\x4a\x2e\x0b\
-\xb4\x88\x44\x71\x98\xc1\x23\x20\x0a\xf6\x3f\xdb\x27\xc7\xf6\x5e\
-\x01\xfd\x98\xfc\x71\xaa\x6a\x46\x66\x85\x74\xbb\x8b\x31\x0c\x5c\
-\xcd\x75\x34\xb1\x98\x62\x82\x3d\xbd\x65\x96\x49\x55\x14\x0c\xfc\
-\xcc\xbf\x75\xb0\x2a\x68\x62\x53\x5e\xf7\x42\x77\x47\x63\xf0\x17\
-\xe3\x1e\x97\xf1\xe3\xe0\xb7\x85\xfc\x69\xa3\xdb\xdf\x5a\xe9\x9e\
-\x27\xd2\xed\xf5\x2b\x68\x2e\xe2\xf2\xee\x22\x49\x63\x0e\x23\x75\
-\xc9\xc3\xaf\x42\x32\x70\x45\x76\xaa\x72\xb5\xe0\x5f\xf0\x4d\x88\
-\x66\xb2\xfd\x85\xfe\x16\xd8\x4b\x67\x71\x63\x2e\x93\xe1\xeb\x7d\
-\x35\xe0\x92\x42\xf2\x46\x60\x0f\x01\x24\x9e\x4b\x13\x19\x24\x9e\
-\xb9\xcf\x5a\xf7\xc4\xe1\x07\xd2\xba\xa3\x25\x25\x74\x54\x15\x96\
-\xa2\xd1\x45\x15\x45\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x11\x49\x6d\xe6\x11\x9c\x37\
-\xcf\xbb\x9e\x71\xf4\xaf\x24\xf8\x8d\xfb\x3d\x5e\x49\xe3\xf8\x7c\
-\x61\xe1\x5b\xab\x7b\x1d\x6b\xcf\x67\xd5\xac\x0a\x88\xb4\xff\x00\
-\x11\x23\xc7\x14\x21\xee\x30\x8c\xff\x00\x68\x82\x38\x93\xca\x99\
-\x4e\xe2\x10\x44\xd9\x8c\x80\x9e\xc1\x55\x66\xbe\x58\x9f\x0c\x71\
-\xc9\xe4\xf0\x00\x04\x0f\xea\x39\xac\xea\x45\x4a\xd7\x0b\xd8\xf8\
-\xf3\xf6\xf0\xf0\xee\x83\xf1\x87\xc3\xb7\x9a\x1f\x8b\xf4\xed\x6f\
-\x40\xf1\x46\x8f\xa6\x4f\xa9\x68\x3a\xde\x9d\x0f\xda\x96\xf2\x0f\
-\xdd\xfd\xb6\xd5\x19\x57\xf7\x9d\x17\xcf\xb6\x60\xac\xf1\xae\xf8\
-\xd4\xec\x3e\x5f\xa0\xfe\xc5\xff\x00\x13\x7c\x3c\xda\x4e\xa3\xe1\
-\x2b\x53\x25\x8e\xb7\xa5\x45\xfd\xbb\x35\xb4\x8c\xa0\x49\x6f\x7d\
-\x34\xd3\x99\xed\xb3\xcb\x5b\x1b\x8f\xb4\x6d\x24\x7c\xa0\x2e\x70\
-\x08\xaf\x68\xf1\xa7\xc3\x8d\x37\xe2\x5e\x81\x26\x9f\xac\x5a\xc7\
-\x77\x65\x34\xb1\xdc\x05\x67\x65\x78\xa4\x46\x57\x8d\xd5\xa3\x20\
-\xab\xa3\x0c\xab\x29\xc8\x2a\xa7\x39\x19\xaf\x82\xfe\x26\xf8\x77\
-\xc4\x1f\xb0\xb7\xc7\x0b\xbf\x14\x47\x7d\xa1\xc3\xa4\xff\x00\x68\
-\xcc\x2d\x64\xb8\xbb\xf2\xd2\xd2\x2b\xb9\x62\x26\x67\x05\x77\xa5\
-\x93\xce\xc2\x3b\xb8\x61\x12\x2c\x0c\xd0\x5d\xa8\x4d\xce\x95\xe7\
-\xd4\x94\xa8\xd4\x52\xbe\x8c\xcb\x96\xd2\xb9\xf7\x77\xc4\x9b\x85\
-\x87\xc1\x3a\xc4\xb2\x34\x80\x43\x63\x24\x9f\x20\xdd\x26\x30\x7a\
-\x0c\x1e\x7a\x11\x90\x48\x24\x7a\x57\xc8\x3e\x13\xf8\x5f\xe1\x9f\
-\x8a\xd6\x5e\x13\xf8\x4b\xe2\x28\x6e\x35\xed\x2f\xc6\xda\x1d\xe6\
-\xaf\xaa\x32\x07\x8d\x35\x8b\x54\x86\xc0\x48\x93\xcc\x85\x37\x79\
-\x9f\x68\x8f\x78\x23\x73\x20\xf2\xc1\x8d\x41\x5a\xfa\x03\xc1\xdf\
-\xb4\xee\x91\xe2\x0b\x7d\x42\xc7\x58\xb2\xba\xf0\xdf\x8c\x74\x2d\
-\x28\x6a\xda\x87\x86\xee\x26\x8e\x6b\xdf\xb3\xf0\x4c\xb6\xec\xac\
-\x52\xea\x09\x0c\x6c\xab\x32\x1c\x64\x15\x7d\x8e\x19\x57\xc7\x7e\
-\x0b\xf8\xd6\xeb\xe1\x5f\x81\x7c\x1b\xa8\xeb\x56\xb6\xd6\x7a\x86\
-\xad\xac\x25\xb5\x94\x17\x72\x23\x4b\xa4\xe9\xf7\x57\x33\xdc\x98\
-\x33\x90\xa8\xd0\xdb\xe0\xbe\x49\x50\x63\x23\x24\x2a\x93\x55\x68\
-\xc2\x75\x23\x51\x19\xd4\x92\xb9\xf4\x97\x8e\x3c\x45\xa5\xfc\x31\
-\xf0\x66\xa1\xac\xde\x5c\x47\xa7\x69\xba\x65\xaf\xda\x27\xb9\x64\
-\x32\x2c\x49\x12\xe4\x36\xd5\x19\x60\x14\xe0\x2a\x8f\x40\x32\xd8\
-\x15\xf1\x77\xec\xaf\xf1\xb7\xc3\x5a\x17\xc7\x9f\x19\x78\xd2\xd7\
-\x5d\x3f\xf0\x8f\xf8\x8b\x5e\xd1\xb4\x44\x58\x98\x49\x1c\xd2\xde\
-\x69\xf0\xa2\x6f\x7e\x03\x11\x34\x51\x28\x6c\x31\xfd\xe7\x97\xc9\
-\x23\x32\xfc\x7e\xd5\x3c\x4d\xfb\x6d\xea\x9a\x03\x5b\x6b\x17\x1a\
-\x37\x80\x6f\x3f\xd2\xc5\xb6\x8f\x30\xfb\x65\xec\x45\xce\xdc\xdc\
-\x10\x7c\xb2\xf0\x6d\x73\xe4\xa8\x91\x16\x47\xd8\xca\xc7\x70\x5f\
-\x13\xfe\xcf\x1f\x0c\xfe\x09\x7c\x36\xd4\x6f\x3c\x4b\xa4\xe9\x3e\
-\x1f\xf0\xbd\x9c\x3f\xda\x17\xd6\xb1\xb2\x7d\x82\xc1\xc1\xf9\xe7\
-\x77\x6c\xf9\xbb\xfc\xc6\x53\x23\xe4\x7c\xe5\x63\xda\xe7\x07\xc1\
-\xc7\x66\xd2\x75\xef\x4d\x7c\x24\x7b\x47\x7e\x55\xb1\xd7\xdf\xf8\
-\x57\x47\xfd\xb2\xfe\x3d\xc5\x75\x25\xad\xe6\x9a\xfa\x16\x99\x2d\
-\x95\xdd\xe2\xec\x06\xc6\xda\xf4\xa3\xc7\x02\x75\x46\x95\xe2\xb5\
-\x59\x24\x2a\xa4\x24\x73\x22\xb1\x23\x06\xbb\xcf\x8c\x5f\x14\xb4\
-\x3d\x7b\xf6\xac\xf8\x73\xf0\xd7\x54\xb1\xd4\xb5\x49\xae\x99\xb5\
-\xa2\x0b\xf9\x36\x56\x86\x18\xa5\x92\xd6\x4b\xa8\xe4\x21\xee\x49\
-\x9e\xde\x46\x8d\x17\xe6\x8d\xad\x84\x92\x10\xa1\x59\xb9\x9d\x72\
-\xed\xbf\x66\x1f\x83\xfa\x8d\xaf\x87\xaf\x7c\x33\xe0\xdd\x12\xe2\
-\x14\xba\xbd\xf1\x4e\xa1\x3f\x99\x2d\x84\xd7\x12\x6c\x5f\x2a\xc5\
-\x83\x3d\xc5\xc3\x7c\x9e\x44\x2c\x4a\xbb\x6c\x8c\x6f\xfb\xb5\xd5\
-\xfe\xc8\x7f\xb3\xe3\x78\x7f\xc4\xba\xbf\x8e\x35\x8b\x0b\xcb\x5d\
-\x4f\x51\x02\x3d\x26\x5d\x5c\x2c\x9a\xe2\x59\xb7\x96\xd2\xdc\x5e\
-\xca\xb8\x55\x9a\xe2\x48\xc0\x30\xc4\x15\x23\x86\x0b\x74\x00\x6d\
-\x20\x7a\x79\x6f\xef\x23\xcc\xfa\x9d\x51\xb5\x8f\x63\xf8\x2d\xf0\
-\xd0\xfc\x1f\xf8\x55\xa1\xf8\x6d\x6e\xd6\xf8\xe9\x36\xab\x13\x5d\
-\x18\x7c\x93\x3c\x99\x2c\xef\xb3\x27\x60\x66\x2c\x76\xe4\xe3\x38\
-\xc9\xeb\x5d\x82\xfd\xd1\x8a\x86\x38\xd6\x28\x11\x11\x56\x35\x55\
-\x0a\x14\x0c\x05\x03\xb0\x15\x2a\xf0\xa3\xe9\x5e\xcc\x15\xb4\x28\
-\x5a\x28\xa2\xb4\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x02\xac\x9a\xcd\xbc\x4e\xea\x64\
-\x1b\xa3\x6d\x8c\xa3\xa8\x38\xce\x31\xf4\xe7\xe9\xcf\x4e\x6b\xcc\
-\xbf\x6b\x1f\x8e\xfa\x97\xec\xeb\xf0\x5f\x5a\xf1\x7e\x8f\xe1\x2d\
-\x5b\xc7\x17\x7a\x4c\x91\x6f\xd2\xec\x27\x8e\xde\x4d\x8c\xe9\xe6\
-\x4a\x64\x76\x01\x63\x8a\x2c\xc8\xd8\xc9\x20\x1e\x3a\xe3\xbd\xf1\
-\x4f\x86\x6e\x3c\x45\xa4\xdf\xda\xc7\xa8\x4d\x62\xf7\x70\x49\x14\
-\x73\xc3\xcb\xdb\x33\x29\x50\xea\xad\x94\x24\x70\x40\x65\x23\x39\
-\x35\xe1\xff\x00\x08\xbe\x2a\xe9\x7f\x05\x7e\x0f\x5c\x78\x67\xc7\
-\x5e\x30\xb1\xd5\xbc\x4d\xf0\xe7\x4f\x16\x3e\x21\xd4\xef\x0b\x83\
-\x7f\x2a\xda\x8b\xa6\x9b\x32\x92\x65\x67\x46\x12\x15\xcb\x30\xf3\
-\x3d\x70\xcf\x32\x92\x8e\xac\x0f\x6a\xf0\x0f\xc4\x0b\x1f\x1f\x78\
-\x1f\x4a\xd6\xb4\xdf\xb4\x4d\x69\xaa\x5b\x47\x3c\x1b\xc2\xef\x60\
-\xc8\x18\x64\x83\xb4\x9e\x7a\x82\x41\x3d\x09\x1c\xd7\x09\xfb\x4c\
-\xfc\x0a\xb5\xf8\xf5\xe1\x7b\x5f\xb3\xc9\x6e\x9a\xe7\x87\xb5\x08\
-\xf5\x5d\x26\xe2\xe5\x37\xdb\xf9\x81\x4a\xbc\x17\x03\xf8\xec\xe6\
-\x88\xbc\x53\x20\xc0\x64\x66\x03\xf7\x80\x11\xc3\x78\x3f\xe3\xaa\
-\xfc\x0e\xff\x00\x82\x70\x47\xe2\xbd\x6d\x1b\x41\xbe\xf0\x1f\x82\
-\xda\x5d\x4a\xd2\xf6\x30\xed\xa6\x5d\x59\xdb\x15\x92\x19\x12\x3c\
-\x8f\x96\x48\xf0\x00\xe0\xa8\xc8\xf9\x79\xaf\x45\xd7\x7e\x1c\x5a\
-\xfc\x68\xf0\x2f\x87\x6f\xaf\x24\xba\xb5\xd5\x34\xff\x00\x2f\x53\
-\xd3\x2f\xed\x9d\xe1\x9b\x4c\xba\x7b\x62\x0c\xc8\x3a\x30\xc4\xaf\
-\x98\xe4\x52\xa7\x3b\x48\x20\x0c\x61\x5b\x96\x74\xee\x38\xea\xec\
-\x7c\x11\xf1\x87\x54\xf1\xc7\xed\x0d\xff\x00\x14\x7d\xc6\x93\xae\
-\x78\x3f\x54\xb7\xd6\xda\x1d\x3f\x57\x79\xc5\x95\xe6\x99\x14\x51\
-\xce\xba\x85\xab\x17\x3b\x67\x87\xec\xfe\x4a\xca\x21\x25\x6e\x60\
-\x31\x30\xdb\x22\x9d\x9d\xf7\x85\xfe\x37\xe8\x1f\x1b\xb4\x19\xa2\
-\x5d\x3f\x4b\xd7\x35\x8d\x75\xce\x87\x71\xa5\xde\xab\xcb\x6a\x16\
-\x35\x8c\x5d\x82\xf2\x02\xfe\x53\x41\x73\x1c\x62\x4d\xc0\x90\x04\
-\x7f\xbc\x0b\x47\xed\xd1\x6b\xff\x00\x0b\x97\xe2\xef\x84\x7e\x1b\
-\xde\x5b\xea\x36\x7a\xc5\x9d\xdc\x7a\xf6\xb3\x34\x10\x4d\x67\x1e\
-\xa3\x0a\xc0\xf6\xf0\x9b\x57\x0d\xfb\xc8\x9e\x49\x64\x13\xc7\x9c\
-\x08\xe1\x58\xdf\x62\xbc\x6e\xfe\x37\xa6\x7c\x5a\xf0\x4f\xec\x3f\
-\xa2\x78\x47\xc6\xd1\x22\xad\xa7\x8d\x97\x55\xf1\x54\x3a\x44\x76\
-\xcb\x35\xdc\x7a\x58\x87\x6d\x95\x95\xb4\x61\x37\xac\x93\xce\xf6\
-\x76\xe8\x55\x58\xab\x39\x3b\x76\xab\x3a\xfc\x7e\x23\x11\x53\x9b\
-\xd9\xc5\xd9\x9c\x98\x88\xf2\xce\xc8\xfa\x2b\xc1\xdf\x17\x2e\x35\
-\x3f\xda\x28\xfc\x3a\xd2\x6c\xae\x6f\xb5\x46\xb9\x36\xba\xe6\xb0\
-\x8e\xa9\x1e\x8e\x21\xb6\xdf\x23\xa5\xb6\x37\x79\x31\x99\x6d\xf7\
-\x49\x33\x47\x1b\x49\x38\x8d\x56\x57\x57\x0b\xf4\x86\xad\xfb\x27\
-\xf8\x33\xc4\x92\xd9\x5c\x6a\xde\x1d\xd2\x75\x9b\xdb\x5b\xd1\xa8\
-\x2d\xc6\xa5\x0a\xdd\x4b\x1c\xfd\x4c\x80\xba\x9e\x43\x7c\xc8\xa3\
-\x6a\xa1\x23\x68\x50\xa0\x57\xcf\x7f\xf0\x4d\xcf\x87\xdf\x11\xbc\
-\x3b\xa6\x6a\x3e\x28\xd6\x3c\x17\xa2\xf8\x63\xfe\x13\xed\x56\xe7\
-\xc4\x1e\x27\xbe\xd4\x99\xa3\xf1\x0e\xad\x75\x34\x63\xcb\x44\x82\
-\x01\xe5\xda\xda\xc1\xfb\xab\x78\x92\x49\x1e\x42\x90\x19\x1d\x23\
-\x77\x22\xbe\xd0\x84\x04\x45\x51\x8f\x94\x63\x81\x81\x5f\x4b\x84\
-\xc0\xd2\x85\x25\x16\xae\xde\xad\x9a\x46\x9c\x6d\x73\xca\x74\x0f\
-\xd9\x1b\xc3\x1a\x37\xc4\x53\xe2\x8b\x95\xbc\xd5\xb5\x5b\x7d\xff\
-\x00\xd9\xdf\x6e\xba\x92\x5b\x6d\x15\x9f\x97\x6b\x58\x33\xe5\xc4\
-\xc7\x00\x79\x80\x79\xd8\xce\x64\x39\xc0\xf4\xe8\x6c\xa4\x54\xda\
-\xce\xac\x01\x3b\x4e\x31\xd4\x0c\x92\x00\xc1\x25\xb2\x7b\x75\xe9\
-\x4f\x6b\x85\xde\xdf\xef\x05\xcf\x6c\x9c\x0f\xe6\x71\x4c\x3a\xa4\
-\x69\xd5\x64\xc6\x33\x9d\xbd\x46\x32\x48\xef\xc7\xf5\x18\xcd\x76\
-\x42\x9c\x29\xab\x2d\x0d\x23\xa0\xe6\xd4\x21\x86\x17\x62\xf9\x58\
-\xb2\x19\x81\xdd\x8c\x0e\x73\x8e\x98\xc1\xeb\x8a\xb4\x1f\xa0\xc1\
-\xff\x00\x0a\xe3\x3e\x25\xe9\xd6\xbe\x2e\xf0\xae\xa9\xa7\xcc\xb7\
-\x1e\x4d\xc4\x26\xd6\x57\x8d\x8a\xb2\x24\x99\x0c\x55\xd4\x16\x56\
-\x50\x5b\x80\x46\xdc\x64\xed\x52\x18\xf0\x5f\xf0\x4f\x3f\x1e\xc9\
-\xe3\xef\xd8\x8f\xe1\xad\xe4\xd7\x57\x9a\x85\xe5\xa6\x87\x0e\x95\
-\x7f\x3d\xc3\x33\xdc\x4b\x75\x65\x9b\x3b\x8d\xec\xc4\x96\x7f\x3e\
-\x09\x01\x62\x4e\x4f\x39\xe6\xb5\x8e\xf6\x0e\x64\x7b\x90\x39\x14\
-\x52\x21\xf9\x7d\xfb\xd2\xd5\x94\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x04\x57\x82\xfc\
-\x73\xfd\x89\x34\xdf\x8a\x1e\x2c\xd4\x7c\x49\xa6\xea\x97\x5a\x5e\
-\xad\xa8\x5c\xd9\xdf\x5e\xda\x4f\x1a\xde\x69\x7a\x95\xcd\x98\x02\
-\xda\x59\x20\x71\xba\x39\x50\x2a\x81\x34\x0f\x1b\xfc\xaa\x1b\x7a\
-\xae\xda\xf7\xaa\x69\x56\x1f\x77\x1c\xf5\xcd\x4c\xa3\xcc\xac\xc0\
-\xf8\xf7\xf6\xb4\xfd\x9a\x2f\xff\x00\x6b\x2f\x0b\xdd\x78\x07\x59\
-\xf1\x3c\xde\x1b\x4f\x12\x41\x65\x17\x8a\xb4\x8b\x57\x13\x7f\x68\
-\x5b\xc3\x30\x94\x4b\x67\x2b\x6d\x92\x0d\xe6\x3f\x2d\xe7\x29\x26\
-\xe8\xa3\x64\x68\xb2\xaa\xe3\xb8\xf8\x69\xfb\x60\x69\x7a\x07\x80\
-\xbc\x07\xa1\xeb\x4b\x79\x2f\x8d\xb5\x7d\x59\x3c\x1f\x71\xa5\xc0\
-\xa1\xae\xa1\xbc\x80\xdc\x24\x93\x4a\x8c\xc0\xa4\x21\x6d\x24\x93\
-\xcc\x3c\x15\x92\x22\x33\xe6\x2e\x7b\x3f\xda\xab\xe0\x4d\xf7\xc6\
-\x8f\x86\x3a\x95\xbe\x87\x2e\x9f\x63\xe2\xc8\x2d\xe5\x6d\x1e\xf2\
-\xe9\x19\xa0\x59\x7e\x56\xf2\xa5\xd8\x43\x88\xdc\xa8\x0c\xd1\x91\
-\x22\x10\x92\x23\x2b\xa2\x11\xf3\xe6\xa0\xab\x63\x6d\x0e\x87\x71\
-\x27\xfc\x25\x1e\x2e\xb3\x97\xed\xbe\x1d\xbf\x45\x58\x75\x4b\xeb\
-\x8d\x1e\x68\xdf\xfb\x3a\xea\x62\xaa\x67\x9e\x29\x0f\x97\xe6\x6d\
-\x58\xe7\x8a\xe1\x58\xa0\x3b\x99\xbc\xda\x92\x96\x1a\x37\x7a\xa6\
-\x35\x64\xae\xcf\x1d\xfd\xb9\x7e\x3f\x68\xf7\x3f\xb4\xf6\xa5\xe2\
-\xab\x1b\xed\x4e\xea\x1f\x0f\xf8\x5f\xc4\x5e\x1e\x9e\xd2\x68\xfc\
-\x88\xf4\xab\xeb\x6f\x29\xb8\x8d\xc6\xe7\x79\x1a\x46\x2b\x34\x44\
-\x90\x13\x0c\x8c\xbb\x1a\xb3\xfe\x02\x7e\xcc\xbf\x11\xbe\x3b\xfc\
-\x70\xd2\xfc\x51\xa4\xda\xf8\x66\xc3\xc3\x3e\x02\xb0\xb6\xd1\x6c\
-\x2e\xf5\xdb\x39\x6e\xad\xfe\xd9\x0c\x70\xca\x97\x56\xb6\xc8\xd8\
-\x9d\x21\x20\xc4\x87\xcd\x88\x47\x20\xca\x86\x75\x6d\xda\x5f\x1f\
-\xac\x97\xc7\x7f\xb6\x7f\x8e\xbc\x2b\x7d\xa3\xca\x9e\x17\xf1\xa7\
-\x83\x2c\xb5\xeb\xdf\xed\x18\x47\xdb\x92\x79\xa4\x92\xd2\x52\x90\
-\x92\x5d\x64\x16\xa6\x18\x64\x40\x41\x21\x60\xdd\xb8\x05\xcf\xa3\
-\xff\x00\xc1\x1f\xbe\x39\xf8\xbf\xe2\x8e\x95\xae\x78\x67\x55\xb3\
-\xd2\xf4\x5d\x37\xe1\xbe\x9d\x69\xa4\x6a\x16\xae\xb2\x2e\xac\x75\
-\x99\xa4\x96\x69\x25\x31\xba\xe1\x6d\x8d\xa9\xb6\x11\x48\x0b\x2c\
-\xef\xe6\x3f\x23\x02\xbc\x7c\x2e\x11\x57\xc4\xb9\xc8\xc6\x51\x52\
-\xf7\x99\xf5\x2f\xc2\x2f\x86\x5e\x3b\xf0\xc6\xa1\x7d\x77\xe3\x0f\
-\x1e\x5a\xf8\xa5\x6e\xad\x52\xde\xde\xc6\xc3\x43\x4d\x26\xd2\xcd\
-\x86\x77\xc8\xa4\x49\x2c\xc5\x9f\x20\x73\x2e\xd4\x03\x85\xcf\x35\
-\xe8\xd1\xb7\x92\x9d\x37\x6d\x5e\x76\xae\x3a\x7b\x57\x0d\xf1\x93\
-\xf6\x92\xf0\x7f\xc0\x1d\x0a\xce\xff\x00\xc5\x3a\xbc\x3a\x7c\x7a\
-\x9d\xdc\x7a\x76\x9d\x1e\x0b\xcb\xaa\xdd\x48\x55\x62\xb7\xb6\x5e\
-\xb3\x4a\xec\xea\xaa\xab\x92\x49\xf4\x04\x8c\x3f\x88\x3f\xb5\xe7\
-\x85\xfc\x03\xe1\xc9\xaf\x2e\x23\xd7\x24\xd4\x56\xe1\x6c\x6c\xf4\
-\x75\xd2\xe7\xfe\xd1\xd4\xee\x9c\x12\x90\xdb\xa6\xdc\xc8\x4e\xd6\
-\x6d\xcb\x94\x54\x46\x76\x65\x45\x2d\x5f\x4f\x29\x2a\x71\xf2\x45\
-\xa9\x28\xad\x4d\x73\xf1\x8a\x46\xfd\xa0\xef\x3c\x0a\xda\x3d\xf4\
-\x51\xaf\x87\x53\x5f\x8b\x56\x24\x2c\x12\x96\xb9\x78\x64\x81\x41\
-\x39\xf3\x11\x56\x17\xc9\x01\x40\x95\x79\xce\x40\xf9\x2f\xfe\x0a\
-\x05\xfb\x53\x6a\xff\x00\x0c\xff\x00\x6b\xbf\x03\x43\xa6\xea\xed\
-\x63\x1f\x84\x6d\x2e\xb5\xd9\x6d\x6d\x6f\xa5\x8e\x3b\xf4\x65\x8e\
-\x2f\xb3\xdc\x42\x19\x56\x5f\x36\x57\x86\x04\x04\x16\x47\xb9\x49\
-\x31\xc1\xc7\x79\xe0\x2d\x1f\xc4\x50\x7c\x40\xf1\x47\x89\xe2\x86\
-\x28\xfc\x4d\xe2\x6d\x54\x38\x98\x07\x6b\x1b\x1b\x78\xa0\x8f\x6d\
-\x9c\x41\x8b\x9b\x85\x95\x23\x53\x31\x85\x90\x09\x99\xe5\x41\xce\
-\x4f\x96\x7c\x23\xfd\x99\x2c\x3c\x55\xe2\xcf\x1b\xeb\x1e\x3a\xd5\
-\xec\x3c\x61\xe2\x1f\x15\x5d\x49\x63\xae\x4e\xd7\x28\xac\xca\x86\
-\x2f\x22\x16\x31\xc8\x05\xb2\x94\x89\xca\xc2\x8f\xb5\x43\x8f\xde\
-\x34\x84\xcc\x3c\x0c\x76\x69\x7e\x58\xc3\xb9\xc9\x53\x10\xdb\xb2\
-\x3d\x8f\xf6\x88\xf1\xfe\xab\xf1\x93\xe2\x6d\xc7\xc3\xcd\x0f\x56\
-\xbf\xd0\xf4\x0b\x3b\x7b\x48\x75\x9d\x4b\x49\x25\x6e\xa7\x9e\x77\
-\x12\x35\xb2\xca\x01\x30\xc7\x0d\x9a\x4d\x2c\x86\x22\x09\x13\xc4\
-\xab\x22\x65\x85\x75\xdf\xb2\x87\x8e\x3c\x3f\xf0\xef\xf6\x53\xf0\
-\xae\xad\xaa\x7f\x66\xf8\x27\x4c\xd6\x19\xef\x2c\xad\xef\xaf\xd2\
-\xdd\x71\x7b\x71\x35\xc4\x2a\xb2\x4a\x54\x17\x95\x24\x12\x6c\x19\
-\xf9\xcb\x2e\x72\x0d\x78\x57\xc5\x5f\x19\x78\x17\xc1\x3e\x15\xbe\
-\xf0\x9f\x87\x7c\x65\x16\x93\xab\xeb\x11\x5e\x13\xa6\x69\xda\x7c\
-\xba\xb5\xe6\xa2\x26\x89\x94\x49\x22\xda\xc5\x35\xe0\x2c\xe6\x32\
-\xd2\xa6\x1d\x71\x23\xe4\x12\x1d\x24\xf0\x6f\xec\x61\xe1\x9f\xda\
-\x5f\xe3\x7e\x9a\xbe\x21\xbd\x97\xe2\x97\x86\x7c\x02\x62\x93\x55\
-\xbb\xd5\x15\x5b\x4d\x9f\x53\x46\x41\x6d\xa4\x5a\xdb\x6c\xf2\xe1\
-\xb6\xb2\x45\x33\xca\x8a\xcf\x24\xb2\xbc\x11\x5c\x49\x21\x89\xd2\
-\xbb\xf2\xda\xd3\xa9\x79\x4d\x15\x4e\x5c\xcc\xfb\x97\x41\xf1\x0d\
-\x8f\x88\xf4\x5b\x5d\x47\x4d\xbc\xb6\xd4\x34\xfb\xf8\x52\xe2\xda\
-\xea\xda\x41\x2c\x37\x11\x3a\x86\x47\x46\x53\x86\x56\x52\x08\x20\
-\x90\x41\x06\xaf\x03\xb8\x55\x6d\x3a\xd1\x2c\xec\xa2\x8e\x18\xe3\
-\x8e\x35\x40\x15\x02\xed\x08\x31\xc0\x03\x03\x18\xf4\xc0\xab\x23\
-\x81\x5e\xa9\xd6\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x50\x3e\xa0\x91\xce\xd1\
-\xb2\xcd\xb9\x70\x78\x8c\xb0\x20\xf7\xe3\xf1\x1c\xf3\xc7\xd3\x20\
-\x0f\xf2\xbe\x7f\xba\xbd\x72\x0e\x39\xaf\x9d\xbf\x6a\x8f\x80\xfa\
-\xb2\xde\x6a\x7e\x2e\xf0\x5c\x6b\x3e\xb0\xd8\xbe\xbe\xd1\x5c\x05\
-\x8b\x58\x92\x14\x54\x8e\xe1\x39\x1b\x2e\x23\x45\xd8\x58\x03\xe7\
-\xc4\x44\x6e\x1b\x64\x4c\x9e\xc7\x7b\xf1\xab\xc3\x7a\x6f\xc4\xcb\
-\x3f\x06\xdc\x6a\x2b\x07\x89\xb5\x1d\x32\x6d\x62\xd2\xc1\x90\xf9\
-\x97\x36\xb0\xc9\x1c\x73\x48\x98\x18\x60\x8f\x2c\x6a\xc0\x12\x47\
-\x98\xb9\xe1\x81\x3b\x2e\xa6\x77\x61\x96\xc3\x3f\x28\xa8\x08\x39\
-\xe7\x93\xcf\x4f\xa8\xac\x71\x14\x55\x58\x38\xb2\x65\xb1\xf0\x57\
-\xc1\xff\x00\x14\x5e\x7c\x63\x91\xbc\x47\xe2\x6f\x0d\xdc\x69\x3e\
-\x3e\x96\xcd\xad\x24\x67\xb5\x96\xd5\xa5\xd2\xe4\xbb\x6f\xdd\x20\
-\x38\x65\x41\x25\xb8\x43\xe6\x2e\x77\x44\x24\x0c\xe2\x74\x51\xd3\
-\xfe\xcb\xfa\x57\x81\xec\x7f\x6c\xad\x76\x6d\x52\xca\x36\xf1\x47\
-\x8b\xac\xed\x57\xc2\xb7\x8b\x67\xe6\x23\xc3\xa5\xda\x8b\x7b\xc1\
-\x1c\x88\x19\x61\x90\x2c\xa8\x0b\x9d\x99\x49\x51\x63\x2c\x55\x8d\
-\x6e\xff\x00\xc1\x46\x7c\x63\xe2\x2f\x81\xba\x9f\x82\xfc\x55\xe1\
-\xbd\x23\x50\xf1\x1a\xdf\x5c\x5d\xe9\x1a\xb6\x83\x6f\x6e\xd3\xac\
-\xf6\xeb\x69\x3d\xf1\xbb\xf3\x08\x29\x09\x84\xdb\x12\x73\x9f\x3b\
-\xce\x23\x1b\xc2\xe3\x93\xfd\x99\xfc\x69\x6b\xe1\xff\x00\xdb\x23\
-\x4e\xd6\x6f\xaf\xad\x64\xd2\x7e\x20\xe8\x0d\xe1\xed\x33\x51\xb8\
-\x11\xcb\x2c\x57\x29\xb3\x51\x82\xd4\x48\x72\xcb\xf6\x8b\x69\x2e\
-\xe4\x01\x98\x23\x1b\x65\x38\x66\x18\xaf\x1e\x8e\x1e\x54\x71\x2b\
-\x97\x66\x14\xec\xe3\x63\xdd\x3f\x6f\x2f\x16\xc7\xe1\x5f\xd9\x87\
-\xc5\x1b\x2c\x2d\xf5\xcd\x5b\x5e\x82\x1d\x0f\x49\xd3\xe6\x8c\x6c\
-\xd4\x2f\xae\xe6\x16\xb6\xc3\xee\x92\xc0\x4b\x2a\xb9\xdb\xf7\x55\
-\x0b\x8c\x6d\xdd\x5e\x63\xa0\xff\x00\xc2\x41\xf1\x73\xf6\xaf\xbb\
-\xd2\xf4\x15\xb0\xfe\xc3\xf0\x7d\x9b\xe9\xde\x20\xf1\x6d\xd5\xba\
-\xc9\x71\x75\x74\x48\x93\xec\x16\xcc\x3d\x03\x79\xb3\xb8\x38\x47\
-\x71\x10\xc3\x19\x2b\xd2\x3e\x3a\xf8\xbb\x4a\xf1\xb7\xc6\x3d\x07\
-\xc2\x32\x41\x0c\xba\x86\x8b\x68\x9e\x2b\x7f\xb4\xc0\xa9\x1d\xbc\
-\xb2\x19\xec\xed\x71\x23\xa8\x68\xe5\x62\x2e\x48\x25\x79\x48\x1c\
-\x75\xc5\x1f\xb1\x47\xc3\x3b\x8f\x09\xf8\x4f\xc6\x3a\xb4\xd2\xc9\
-\xbb\xc5\xde\x30\xd6\x75\xa8\x86\x15\x7c\x8b\x69\x2e\xe4\x8e\x35\
-\x5c\x1c\x6d\x29\x0e\xf1\x8c\x0c\xcb\x93\xb8\xf3\x5e\x94\x94\x6a\
-\xd4\x70\x7b\x23\x9e\x51\x72\x95\x87\x7f\xc3\x01\xf8\x2d\xf5\x0d\
-\x53\x53\xfb\x4f\x8c\x23\xf1\x1e\xac\x41\x9b\x59\x8f\xc4\xf7\xcb\
-\x79\x12\x87\xdc\x20\x8c\xef\xd8\x91\x01\x85\x28\xaa\x15\x80\xe5\
-\x4f\x5a\xed\xbc\x6b\xfb\x2b\x78\x03\xe2\x35\xdc\x97\x1a\xf7\x83\
-\xfc\x37\xac\x4f\x2b\xa4\xb2\xcb\x73\x61\x1b\x49\x70\xc9\x82\xa6\
-\x46\xda\x4b\x10\x55\x48\x3d\xab\xd0\x61\xb6\x64\x40\x3e\x4e\x9c\
-\xe0\x60\x7e\x02\xa5\x11\xe0\x56\x8b\x0f\x05\xa2\x8a\x37\xf6\x71\
-\x4b\x63\xc0\xbc\x3f\xfb\x14\x5a\xde\xf8\xc7\xc4\xfa\x87\x89\x24\
-\xd2\xee\x74\x5b\xfb\xa5\x6d\x23\xc3\x7a\x45\xb0\xd2\xf4\xdb\x78\
-\xe2\x62\xc9\x35\xd7\x94\xa1\xee\xae\xa4\x62\x77\xb3\x9f\x29\x63\
-\xda\x8b\x19\x21\xe4\x97\xd9\x74\x7f\x07\xc3\xe1\xbd\x02\xdf\x4d\
-\xd2\xe1\xb5\xd3\xac\xec\xe1\xf2\x20\xb7\xb6\x88\x45\x0c\x28\x31\
-\x80\xa8\x06\x17\x03\x38\xea\x06\x41\x21\x88\xad\x8d\x94\xe1\xc0\
-\xad\x21\x16\x87\x14\x96\xc3\x2d\xe0\x5b\x6b\x78\xe3\x50\x15\x63\
-\x50\xa0\x00\x00\x00\x71\xd0\x71\xf9\x53\xe8\xa2\xb4\x28\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x2b\xca\xff\x00\x69\x5b\x0f\x1d\x4d\xe1\x48\xb5\x2f\x87\
-\x37\x9a\x7b\x78\x9b\x45\xb8\x37\xb1\xe9\x5a\x80\x5f\xb0\xf8\x81\
-\x57\x21\xec\x64\x97\x6b\x3d\xb3\x3c\x7b\xb6\x4f\x19\x1e\x5c\x81\
-\x1a\x45\x74\xdd\x1b\x7a\xa5\x78\xa7\xed\x2b\xf1\x6b\xc7\x5f\x06\
-\xb5\x0b\x3d\x53\x45\xf0\x9e\x93\xe2\xcf\x07\x10\x63\xd5\x9f\xfb\
-\x46\x6b\x5d\x43\x43\x2c\xcf\xfe\x9b\x81\x14\xa2\x5b\x75\xe1\x5d\
-\x54\x79\x88\x09\x75\x0e\xa1\x95\x66\x40\x7c\xfb\xfb\x53\xfe\xd7\
-\xbe\x05\xf8\xa1\xfb\x37\x6a\x1e\x38\x4b\x5f\x16\x78\x47\xe2\x17\
-\x80\xec\xee\x75\x3d\x1e\x1b\xb8\x6e\x34\xfd\x42\xda\xec\x29\x86\
-\x7b\x18\xee\xa0\x49\x22\x33\xca\xd1\xb5\xbf\x94\x4c\xa0\xca\x88\
-\xaf\x13\x05\x64\x1d\x9f\xc2\xef\xf8\x28\x2d\x9f\x87\xc6\x93\xa6\
-\xfc\x49\xb8\xb3\xb4\x1a\xb3\xda\xe9\x96\xb7\xb6\x56\xc6\xe9\x4e\
-\xa7\x24\x30\x32\xdb\x4e\x6d\xcc\xa8\x92\x4c\x65\x6f\x2f\xe5\x54\
-\x76\x8a\x50\xb8\x2a\x14\xe9\xfc\x26\xf0\xef\x88\x3c\x19\x67\xe2\
-\xdd\x7b\xe2\x36\xa1\xa1\xd8\xda\x78\xca\xf2\x3d\x4a\xc3\x43\xd1\
-\xa2\x0f\x6f\xa3\x3b\x40\x89\x32\xc5\x3e\xc4\x6b\xa7\x79\x49\x66\
-\x90\xa2\x96\x24\x0d\xa4\x73\x5f\x2c\x7c\x4f\x4f\x0f\xf8\xf7\xe3\
-\x9f\xfc\x24\x76\x7e\x25\x9b\x41\xd6\xb4\xfb\x87\xb5\xb7\x7b\x7d\
-\x65\xad\x6d\xe3\x06\x56\x3f\x66\x95\xa1\x28\xae\x37\xa9\xdf\x1b\
-\x86\x20\xe5\x70\xa0\x57\xc9\xe3\xf3\x8a\xb8\x7a\x97\x8a\xba\x31\
-\xa9\x59\x43\x73\xf4\x0a\xd7\xc6\x9e\x18\xf8\xeb\xe0\x3b\xb6\xf0\
-\xde\xb5\xa1\xeb\x96\x29\xfe\x8b\x34\x90\x48\x26\x86\x29\x54\x07\
-\xf2\x65\x45\x23\x04\x2b\x1c\x8e\x0a\x95\x39\x1d\x54\x7c\x23\xff\
-\x00\x04\xf0\xfd\xa2\x7f\xe1\x00\xf0\xcf\x83\x7c\x2b\x75\xa8\x68\
-\x96\x7a\x8c\x77\x33\x78\x7a\x6b\x76\x94\xcf\x68\xa9\xfd\xb7\x75\
-\x0c\x70\xc4\xc3\xee\xb9\x8f\xca\xf2\x01\x32\x03\xb2\x38\xb8\x66\
-\x4c\x58\xf0\x1f\xc4\x6f\x16\x7c\x2b\xd5\xa0\xf1\x37\xf6\xb5\xe4\
-\x96\x3a\x9e\x21\xb9\xd4\xe4\x81\x6f\xa5\xbb\x48\x52\x46\x31\xca\
-\xd1\xec\x96\x78\x49\x27\x64\x91\xb7\x9b\x1b\xf2\xbb\xbe\x61\x5a\
-\x7e\x28\xf8\x95\xa7\x78\xbb\xf6\x7a\xff\x00\x85\x99\x65\xe0\x9d\
-\x3d\x75\x2f\x0c\xcf\x26\xa1\x61\x6a\xd1\xdb\xea\xb0\x5c\xc6\x37\
-\xcb\x73\x25\xbb\x5b\x85\x4b\x8f\x34\x79\xf2\x42\x0a\xa7\xfa\x43\
-\x60\xa2\x38\x93\x1d\x18\x5c\xc9\x62\xe5\x16\xb4\x7d\x85\x1a\x8f\
-\x74\x7a\x87\xc5\x09\x6e\xbe\x17\x7e\xd0\x1f\x11\x35\x29\x21\xfb\
-\x75\xf6\xa1\x64\xbe\x2a\xd1\x6e\x23\x70\xc6\xea\xde\xd2\xd2\x0b\
-\x4b\x7d\x3e\x1c\xe5\x56\x44\xba\x9e\x67\x2a\xdc\x49\xf6\xe5\x2a\
-\x72\xc4\x2f\xd4\x1f\x05\x7c\x25\x7f\xe1\x4f\x84\x7e\x1b\xd3\xb5\
-\x69\x2d\x26\xd5\xac\xf4\xbb\x6b\x7b\xe9\xad\xd0\x08\xa4\x99\x62\
-\x5f\x35\x90\x74\x0a\x64\x2e\x46\x3b\x11\x5e\x0d\xfb\x4f\x6b\x16\
-\xbe\x2e\xf8\xd3\xf0\x53\x4b\xb5\xba\xfb\x1b\x78\x93\xc4\x97\x2d\
-\x06\xab\xb4\x3b\xdb\xdb\x41\xa7\x3d\xdc\x81\x72\x36\xaa\xcc\xd1\
-\x24\x24\x38\x60\x0c\x9b\xb1\xe6\x6d\xc7\xd4\x96\xca\x56\xdd\x73\
-\xd7\x03\xb6\x3f\x4a\xf7\x30\xb4\xd2\xbc\xae\x55\x3d\x5d\xc9\x07\
-\x4a\x28\xa2\xba\x8d\x42\x8a\x28\x27\x9a\x00\x28\xa6\xb3\xed\xec\
-\x4f\xd2\x9c\x0e\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x15\xc6\xfc\x5f\xf1\xc4\
-\x7f\x0b\xbe\x1d\x78\x97\xc5\x12\x59\xdc\xde\xc3\xa0\x69\xd7\x1a\
-\x83\x43\x0a\x81\x34\xcd\x12\x17\xda\x9b\x88\x1b\x8e\xd0\x06\x4e\
-\xd3\xc6\x48\x03\x9e\xca\xa8\x6a\x3a\x2a\x6a\x10\xcd\x1c\xa9\x13\
-\xc5\x32\xbc\x6c\x18\x6e\x0c\x8c\x3e\x65\x60\x72\x18\x1e\x78\x3d\
-\xaa\x64\x07\xcb\x1e\x2d\xf8\x05\xa2\xdc\x5e\xfc\x30\xf0\xc4\x3a\
-\x97\x88\x34\xdd\x27\x57\xd3\xb5\x98\xf4\xd5\x87\x57\x95\x9a\xd2\
-\xf6\x41\x15\xdd\xac\x4b\x34\x25\x5c\xc5\x6f\x1f\xda\x7c\xb0\x1c\
-\x29\x58\x80\x72\xc6\xbc\x47\xc7\x5f\x0c\xfc\x45\xf0\xf6\xdf\xe0\
-\x9e\x9f\x99\x34\xdb\xed\x17\x53\xd3\xf4\x4d\x46\x2b\xc9\x22\x9b\
-\x6a\x4f\xf6\x8b\x19\x99\xa4\x46\x8c\x4d\x09\x92\x58\xe4\x8d\xf0\
-\x58\x82\xbe\x66\x5f\x72\xd7\xd7\x91\xf8\xeb\x43\xb6\xf1\xe7\x88\
-\xbc\x11\x34\x97\x17\x07\xc2\xeb\xa7\xea\x1b\x2d\xec\xd9\x05\x84\
-\x17\x13\xb4\x76\xf0\x6e\x0b\x82\x15\x91\x9b\x08\x7e\x58\x98\x6e\
-\x3b\x4f\x3d\xb7\x8a\x3e\x0f\xe8\xde\x30\xd5\xf4\xfd\x4a\xf7\x4f\
-\xb4\xb8\xd4\xb4\x79\xbe\xd5\xa7\xdd\xb2\xe2\x6b\x39\x36\xb2\xe5\
-\x1b\x1e\x8d\xd1\xb7\x2f\x6d\x98\x00\x0e\x2c\x4e\x0e\x15\x23\x68\
-\xa3\x19\x53\xe6\x95\xd9\xe1\x3a\xff\x00\xc1\xdf\x87\xff\x00\xf0\
-\xb6\x97\x43\xd1\xd7\x52\xf0\x67\x8d\x21\xb3\x8a\x6b\x69\x57\x49\
-\x30\xe9\x97\x88\xc1\x46\x63\x8d\xe3\x4b\x4b\x89\x63\x40\x51\xfc\
-\xb0\x26\x8d\x7f\xbb\x82\xd5\xf3\x35\xbf\xc3\x9d\x7f\xe2\xce\xb5\
-\x26\xaf\xa3\xe9\xda\xd7\xc3\x7f\x1c\x69\x1a\xf4\x3a\x87\xf6\x5d\
-\xae\xa9\x1d\xb6\x99\xe3\x1f\x2e\xe5\x6d\xae\x45\xd5\xac\xa5\xcb\
-\x46\xd0\x86\x40\xee\xa9\x26\xe4\xdd\x1c\x92\x2e\xd7\x1f\x7a\xfc\
-\x6f\xf0\x2c\x7e\x2f\xf8\x69\xaa\xe9\x52\x69\x7f\xda\xab\x22\x0d\
-\xb6\x70\x84\x8e\x47\x74\xd8\x50\xa3\x65\x19\x76\xed\x0c\xa4\x3a\
-\xba\xb0\x1b\x5c\x10\x08\xf8\xd3\xe0\xd7\xc4\xd9\x20\xf8\x45\xe2\
-\x4b\xb9\x75\x8d\x6b\x5c\xd5\x3c\x33\xe2\x9d\x67\x4c\x96\x40\xeb\
-\x36\xa5\x14\x86\xe9\xa2\x85\x26\x4d\x81\xbc\xe0\xb2\x2a\x31\xf2\
-\xd5\xf0\x37\x1c\x96\x19\xf2\xb3\x0a\x8b\x0d\x15\x28\x44\xd2\xd7\
-\x56\x89\xd8\xf8\x4b\xc5\x9a\xee\xb9\xfb\x42\xeb\xba\xf6\xa1\x79\
-\x6f\x6d\xf1\x6e\xf6\xca\xe3\x44\xf0\x6f\x85\x63\xb8\xfb\x4c\x7a\
-\x66\x9e\x2f\xa3\x37\x1a\x8c\xea\x03\x2c\x2b\x72\xf1\x24\x81\xa5\
-\x20\x85\x8d\x63\x52\xd2\x31\x4a\xfb\x72\x3b\x95\x89\x84\x7b\xd5\
-\x8a\xe1\x33\x91\xf7\xb1\xc0\x3d\xf2\x7a\xd7\xc0\x3e\x19\xd1\x64\
-\xfd\x85\x7c\x59\xf1\x23\xc4\xda\x3d\x9d\x9e\xb9\xf1\x03\xe2\xa5\
-\xe6\x8f\xa0\xe8\xda\x74\xd2\x82\xda\xfe\xb6\xe9\x72\xb1\xe5\x97\
-\xe7\x16\x50\xa1\xcb\x63\x02\x2b\x7b\x79\x18\x65\x86\x47\xd9\xff\
-\x00\x06\x3c\x07\xe2\x8f\x06\x7c\x38\xb3\xb0\xf1\x67\x8c\x2e\x3c\
-\x6b\xe2\x25\x0f\x25\xe6\xad\x35\x8d\xbd\x92\xcd\x23\xb6\xed\xb1\
-\xc3\x0a\x2a\x24\x49\xf7\x50\x30\x77\xda\x06\xe7\x63\x92\x7d\x8c\
-\x0e\xb4\x94\xaf\xb9\x14\xf4\xd1\x9d\xc8\x3b\x86\x68\xa4\x40\x42\
-\x2e\x79\x38\xe4\xfa\xd2\xd7\x61\xa8\x50\x73\x9a\x28\xa9\x90\x0d\
-\x11\x85\x6c\xe3\xad\x3a\x8a\x28\x88\x05\x14\x51\x54\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x43\x0c\
-\x8a\x28\x07\x35\x32\x03\xc5\xfe\x30\xf8\x03\x4e\xf0\xe7\xc4\xcb\
-\x3f\x18\xcd\x6d\x71\x71\xfd\xad\x25\x8e\x83\x72\xc8\x82\x41\xa7\
-\xca\x2e\x65\x6b\x2b\xc8\xd0\x0c\x6f\x8e\x6b\xa7\x56\x2c\xbc\xa4\
-\xcd\x96\x20\x6d\x6f\x60\xb3\x5f\x2e\xd2\x25\xcb\x36\xd4\x03\x2c\
-\x49\x63\xc7\x72\x7a\x9a\x86\xfe\xd5\xe7\x6c\x2b\x2a\xab\x30\xdd\
-\xeb\x8c\xfc\xdf\x5c\xae\x17\xb6\x32\x4f\x61\x56\x11\x89\x5e\xed\
-\xc1\xe7\xd7\x15\x31\x60\x63\xf8\x86\xea\xd6\x21\xe5\x5d\x5e\x5b\
-\xda\x9b\x86\x68\xa2\x12\x48\x15\xa4\x7c\x7c\xb8\xcf\xf1\x03\x92\
-\x14\x64\x9e\x0d\x7c\x85\xfb\x47\x7c\x3a\xd5\x3e\x03\x47\x1e\x91\
-\xa5\x69\x37\x1e\x22\xd1\xbc\x5b\x05\xc6\x35\x99\xf6\xb5\xc5\xae\
-\xa3\x6f\x03\x5c\x79\x9a\x8a\xec\x55\x91\x66\x8e\xd8\x42\x6e\x32\
-\x18\x48\xc3\x70\x76\x6d\xeb\xf5\x2f\xc6\x4f\x01\xe8\xbe\x3f\xf0\
-\x1e\xa5\x65\xaf\x78\x6e\xd7\xc5\x9a\x67\x96\x6e\x8e\x97\x71\x6f\
-\x1c\xe9\x73\x2c\x7c\xa0\x54\x93\xe5\xf3\x32\x06\x09\xe3\x3c\xf0\
-\x79\xaf\x8d\x2e\xbf\x68\xed\x62\x3d\x57\x4f\xf0\x9d\x8e\x99\xe2\
-\xad\x2f\x5a\xf1\x3d\xeb\xb4\x3e\x09\xf1\xd3\x1b\x7d\x4a\x45\x5b\
-\x79\x2e\x9d\xb4\xbb\xb5\x69\x0c\x91\x27\x96\xc8\xd0\xb3\x4c\xa0\
-\x32\xe1\xa2\x52\x2b\x87\x31\x70\x9d\x16\x9a\x33\xe6\x71\x67\x77\
-\xf0\xfa\xde\x0f\x19\xff\x00\xc1\x46\xff\x00\xe1\x22\xd6\x34\x5b\
-\xf6\xd3\x7c\x3b\xe0\xa8\x2d\xbc\x39\xab\xcf\x64\xeb\x69\xfd\xa1\
-\x79\x35\xc4\x97\xaa\xae\xc7\x06\xe1\x6d\x61\xb6\x4c\x64\x9f\x2d\
-\xa4\x40\x49\x12\x0a\xfa\xc3\x4c\xf1\x6e\x9b\xa9\x4f\x71\x6b\x6b\
-\x7b\x69\x34\xda\x73\x88\x2e\x62\x8a\x64\x91\xad\x9f\x19\xda\xe1\
-\x49\x28\x42\xe0\xe1\xb1\xc1\x15\xf2\xff\x00\xc5\xdd\x13\x54\xbb\
-\xf8\x09\xe1\x5d\x3e\xc7\xc4\x57\x1e\x11\xd6\x23\xbd\xd3\x2e\x2c\
-\x75\x0b\x6b\x65\xb9\x09\x3c\x06\x37\x58\xc2\x48\x48\xda\x4a\x98\
-\xe4\x1c\x8f\x2f\x20\x0e\x43\x2f\xb0\x7e\xce\xda\x5e\x8f\xa5\xf8\
-\x46\x4d\x3e\xd7\xc5\x27\xc6\xba\xd6\x91\x33\xe9\xba\xde\xb7\x37\
-\x91\xf6\xb9\x2e\xe1\xda\x5e\x3b\x83\x6e\x89\x18\x78\xf7\x81\xb3\
-\x03\x68\x1c\x72\x18\xd4\xe5\xb8\xb8\x54\x8f\xb2\x5b\xa1\x42\x49\
-\xb3\xd5\x51\xb7\x20\x3c\xf2\x3b\x8c\x52\xd3\x55\xf0\xa3\xbf\xbf\
-\xad\x38\x1c\xd7\xa8\x6a\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\xd2\xfb\x0f\x73\xf4\xa7\x66\xb0\xfc\x53\xe2\xfb\x6f\
-\x0b\xe9\x37\x17\x93\xb3\x2c\x30\x63\x77\x19\x62\x59\xb6\xa8\x1f\
-\x56\xe3\xf9\xe0\x73\x53\x29\x28\xab\xb1\x32\x7d\x73\xc4\xd6\xba\
-\x0e\x9f\x71\x75\x75\x34\x76\xb0\xdb\xab\x3c\x92\x4e\xe2\x34\x55\
-\x51\xb8\xb6\xe6\x20\x60\x2e\x49\x39\xe0\x03\x9e\x78\xaf\x18\xbf\
-\xff\x00\x82\x87\x7c\x31\xd3\xec\x2d\xef\x25\xd7\xae\x23\xb1\x9a\
-\x55\x31\x5d\x7f\x63\xdf\x18\x6e\x14\xae\x33\x1b\x88\x48\x70\x4f\
-\x20\xae\x41\x1c\xf4\xe6\xbc\x7e\xff\x00\xc7\x9e\x2a\xfd\xae\x2d\
-\x24\xd6\x2e\x26\xb7\xb5\xf8\x7f\x71\xe2\x7b\x3b\xed\x0a\xca\xdc\
-\xb2\xcb\xa9\xe9\x56\x92\xfe\xf8\x4b\x2a\x36\x1e\x4b\xbb\xa8\xb6\
-\xf9\x40\x14\x48\x17\xe6\xde\xce\xc4\x74\xf7\x9f\xb4\x86\x85\xe2\
-\xdf\x88\xd7\x5e\x1b\xbd\x4b\xed\x3e\xe3\x48\xbd\x36\x51\x0d\x4f\
-\x49\xb8\xb5\x86\xf2\x77\xe0\xfd\x92\x59\x40\x49\x37\xb1\x2a\xae\
-\x84\x97\x20\xaa\x06\x22\xbc\xca\x99\x82\xb3\x70\x57\x30\xf6\x9a\
-\xe8\x74\x1e\x24\xff\x00\x82\x8c\xf8\x07\x41\xb9\xb3\xb3\xd3\xee\
-\xa4\xf1\x56\xad\x3d\xbb\xde\x0b\x2d\x27\xcb\x79\x5e\xda\x37\x45\
-\x9e\x5f\xdf\x3c\x49\xfb\x95\x91\x24\x64\xdd\xe6\x6c\x24\x84\x6d\
-\x8e\x17\xc9\xbe\x2a\x7c\x71\xf0\xbf\xed\x45\xf1\xbf\xc0\xda\x7e\
-\xb1\xe1\x1f\x10\x78\x7b\x4e\x8f\x4a\xd5\xef\x2c\xaf\x3c\x51\xa4\
-\x7d\x9d\x63\xba\x2d\x64\x91\xb4\x13\x7c\xea\x25\xfd\xee\x76\x2c\
-\x85\x9d\x02\x05\x42\xad\x91\xde\xc3\xe0\x6d\x1b\x4a\xf1\x66\x9f\
-\x2a\x58\xe9\xb7\x11\xd9\x2c\x97\x16\xd6\x57\x0b\x1b\xcf\x69\x26\
-\xec\x0f\xb2\x39\x06\x58\x97\xe6\x2a\x42\x36\xc5\x2e\x03\x06\x0d\
-\xb0\xf9\x1f\xed\x15\xf0\x6f\x46\xf8\x3d\xfb\x4e\xfc\x33\xf8\x91\
-\xa0\x5a\x69\x16\x5e\x0a\xbe\xbb\xbb\x7d\x72\x3b\x4d\x3d\x56\x1b\
-\x43\x2d\xbc\xd1\xc7\x7a\xd1\x46\xcb\x03\x11\x70\xd0\x96\x63\x1f\
-\x99\x11\x26\x4d\xe7\x32\x13\x85\x5c\x67\xb4\xa0\xdd\xb5\x2a\x2f\
-\x99\xd9\x9d\xae\x9d\xe3\x7d\x7b\x5c\xb1\xf0\xec\x5e\x24\x86\xce\
-\xc3\xc4\x3a\x5f\x88\x75\x6b\x2d\x47\x2c\xd3\x2d\xa2\xc3\xbf\xca\
-\xb9\x13\x0c\x79\xaa\xb6\x8f\x14\xce\x78\x43\x97\x43\x82\xa0\x1c\
-\xbf\x85\x7f\x03\xbe\x20\xfc\x7c\xd7\x2e\xbc\x39\xa8\xdb\xc5\xe0\
-\x5f\x80\xf1\xea\x3f\xda\x91\xe9\xb6\xb3\xac\x37\x9e\x27\x86\x47\
-\x96\x75\xb7\x0f\x11\x59\x61\x8d\x66\x3e\x6c\xec\x76\xbd\xc2\x34\
-\x51\x67\x67\x98\xd2\x71\x1e\x2a\xf1\x43\x78\xbb\xe2\x1f\x8a\xfc\
-\x29\x73\x78\xda\x76\xa5\x67\xad\x68\x10\xc6\xc9\x26\x22\x36\xb7\
-\x76\xb3\xc2\x66\x21\x41\xdc\x3c\xf4\x92\x13\xf7\x54\x85\x5c\xee\
-\xeb\x5e\x87\xe2\x3f\x89\xfe\x24\xfd\xaf\x7f\x68\x8d\x4b\xe1\xff\
-\x00\xc3\x9d\x6b\x52\xd3\x3e\x1c\x7c\x33\xb8\x81\x3c\x77\xaa\x78\
-\x7f\x52\x8e\xd7\x51\xd4\x75\x17\x28\x62\xd1\xa0\xb9\x52\x16\x05\
-\x82\x11\xe7\x5d\x30\xdb\x29\xf3\x23\x85\x1d\x58\x39\xaf\x2b\x25\
-\xa3\x3f\xac\xb6\xf4\x27\x92\xd3\xb2\x3e\xd7\xb2\x6d\xd6\x50\x9f\
-\x97\x94\x53\xc3\x6e\x1d\x3d\x47\x07\xeb\x56\x47\x4a\xaf\x69\x17\
-\x95\x6e\x91\xfc\xc7\xcb\x50\xb9\x66\x2c\x4e\x38\xe4\x9e\x4f\xd4\
-\xf3\x56\x07\x02\xbe\xb6\x9c\x6d\x74\xce\x80\xa2\x8a\x2b\x40\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa6\x97\xc5\x00\x35\xa6\x55\x2d\xbb\xe5\xc7\
-\x1c\xf7\xaf\x10\xfd\xb6\xfe\x20\x69\x9f\x0e\xfe\x08\x6b\xd7\xba\
-\x96\xad\x6f\x67\x79\x67\x6d\x35\xee\x9b\x6a\x65\x0b\x3e\xa5\x75\
-\x18\x02\xde\x14\x4f\xbc\xfb\xe6\x68\xa3\xda\xa0\xe4\xb2\xf4\x2c\
-\x05\x7a\x0f\xc6\x2f\x8a\xda\x7f\xc1\xbf\x86\xda\xf7\x8a\xb5\x4f\
-\x39\x74\xef\x0d\xd9\xcd\x7d\x70\x23\x50\xd2\xc8\x11\x19\x82\x20\
-\x24\x06\x77\x62\xa1\x46\x40\xe4\x64\x8a\xf8\x77\xc5\x21\x7e\x09\
-\x8d\x36\xeb\x54\xb0\xb3\xf1\x0f\xc6\x4f\x11\x4c\xb6\x6d\x36\xa5\
-\x39\xd4\x2e\x6e\x75\x99\xa0\x32\x94\xb7\x96\x62\xd2\xdb\x5a\x58\
-\x2c\x92\x11\x15\xb0\x8c\x3a\x2e\xd5\x5f\x31\x86\xfe\x3c\x65\x5a\
-\x70\x85\xaa\x75\xd8\xc6\xad\x44\x91\xad\xe2\x1f\x19\x6a\xfe\x10\
-\xf0\x26\x95\xf0\xff\x00\xc2\x16\x7a\x79\xd5\xb4\xab\x01\xa6\xeb\
-\x7a\xcb\x5b\x49\x1d\x84\x1a\x9b\x41\x1c\x92\x24\x36\xc9\x89\x2e\
-\xcb\xbc\xc4\xfe\xed\x96\x28\xc0\xda\x25\x0d\x88\x8d\x3b\x4f\xd9\
-\xdb\xc4\x1f\x10\x6c\x6e\xa1\x9b\xc5\x5a\x85\xec\x46\x11\x14\xdf\
-\xda\x9a\x6d\x9c\x96\x4a\x1c\x91\x26\x61\x84\xa4\xb1\x89\x13\x67\
-\xee\xc4\xc4\xae\x03\x21\x24\x88\xcb\xbf\x66\x6f\xd9\xc7\xe2\x67\
-\xc5\x0f\x0e\xc9\xe2\x49\xbc\x59\x09\xb7\x6b\xc9\xed\x56\xe7\xc4\
-\x3a\x7d\xc5\xd5\xe6\xa8\x96\x92\x3c\x52\x4a\xb0\xc7\x2c\x50\xd9\
-\x41\x24\xeb\x24\xb1\xc2\x88\x5f\x12\x02\xec\x18\xed\x4a\xbf\x14\
-\xff\x00\x68\xcf\x14\xfe\xcf\x3f\x15\x20\xf8\x73\x6b\xa5\xe8\xf1\
-\xb6\x8a\xb0\xea\x7e\x22\xd6\xf4\xdb\xb1\x74\x8b\x66\xff\x00\x28\
-\xb4\xf2\xe7\x89\x3e\xcf\x34\xe7\x92\x4b\xc8\xf1\xc2\xdb\xd0\xbb\
-\x48\x82\xbc\x5f\x67\x52\x9b\xe7\xa9\xa4\x4e\x38\xdd\x3b\xcb\x63\
-\x97\xd5\x74\x3f\x17\xfe\xcf\xda\xbe\x9e\xda\xd5\xc4\x37\x11\xe8\
-\x57\xa2\x4f\x0f\x8b\xb5\x33\x27\x90\xd0\xf9\x77\x76\x4b\x71\x23\
-\x46\xdb\xa4\x8b\x06\xde\x37\xf9\xd6\x44\x60\xad\x30\xc2\x27\x71\
-\xe2\xff\x00\x8a\x5a\x47\x8e\xf4\xed\x37\x44\x5d\x4a\xd2\x3d\x1f\
-\xc6\xd6\x6f\xf6\x7b\xc7\x8b\x7d\xbc\xc6\x64\x64\xb8\xf9\x78\xf3\
-\x02\x43\x3a\xb8\x0b\xb7\xf8\x95\xb6\xb0\xc5\x27\xc6\x9f\xda\x03\
-\xc5\x1f\x11\x7c\x0d\x2f\x83\xf4\x1f\x86\xb6\xfe\x24\xf1\x15\xf4\
-\x32\x47\xad\xe9\x9a\xad\x9c\xc9\xa6\x59\x02\x41\xff\x00\x4b\x6c\
-\x00\xb1\xb2\xb0\x66\x8d\xb7\x33\x8c\x6d\x52\x98\x6a\xf9\x6b\xe3\
-\x4d\xbc\x9f\x0f\xa6\x83\xc2\xde\x09\xf0\x7e\x83\x7b\xac\x59\x4d\
-\xe6\xdc\xdd\x78\x77\x57\x0b\xe1\xed\x3b\x50\x8e\x54\x09\x88\x2f\
-\x37\xe2\x78\xc7\xde\x5b\x51\xb3\xcb\x99\xe0\x94\x86\x28\xa2\x2b\
-\xda\x4b\xdb\x27\x68\x85\x4a\x9c\xba\xa3\xd2\x3e\x1a\x0b\xcf\x8b\
-\xbf\x1b\xbc\x55\x78\x90\x8b\x5b\xdd\x17\xc0\x96\xc2\x45\x69\x00\
-\x69\xaf\xed\x35\x5b\x88\x5d\x5d\xbf\xb8\x5a\x09\x0a\xf1\xf7\x66\
-\x85\xb0\x37\x90\x3e\x8c\xfd\x94\x3c\x40\xba\x07\xed\x29\xe3\x7b\
-\xf8\x6c\x6d\x74\xfb\x7f\x88\x96\x3a\x26\xb0\xb6\xe9\x66\xb6\xb2\
-\x0b\xa8\xbe\xd5\x6f\x78\xf2\x6d\xc1\x69\x3c\xd4\xb6\xdd\x9d\xdb\
-\x77\xae\x43\x12\x48\xf8\xaf\xe0\x06\x93\x37\xed\x69\xfb\x7b\x7c\
-\x3d\xf8\x93\x65\x0d\xff\x00\x85\x34\x9f\x0c\xe8\x57\x52\x6a\x32\
-\x34\xed\xba\xf6\xf6\xda\xfe\x48\x21\xfd\xf4\x72\x32\xc9\x1b\x2b\
-\xcb\xcc\x8e\xc2\x58\x92\x6d\x87\x31\xe1\x7e\xb2\xd6\xed\x07\xc3\
-\x9f\x1d\x78\x0e\xf1\x6d\x8b\xc7\x67\xe2\xa9\xf4\x83\x29\x55\x56\
-\x61\x7f\x1a\xcb\x1a\xbb\xee\x00\x29\xb8\x86\x21\xc0\xfb\xcd\xc0\
-\xe1\xb1\x1e\xd1\x42\xaa\xad\x49\xe8\xf4\x3a\x29\xc9\xb8\xf3\x1f\
-\x76\xe9\xd1\xad\xb5\xac\x68\x02\x2a\xaa\x85\x01\x13\x62\x8c\x7a\
-\x2f\x61\xed\xda\xac\x83\x9a\xcc\x83\x54\x86\x1b\x65\x66\xdc\xaa\
-\xab\x92\x58\xf6\x03\xaf\x3c\x9e\x9e\x99\x35\xa1\x1c\xc2\x44\x0d\
-\x86\x19\x1d\x08\xc5\x7d\x45\x39\x5d\x5d\x9d\x11\x95\xd0\xfa\x29\
-\xbb\xe9\xc0\xe6\xb4\x28\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x2a\xac\xd7\xc9\x1c\x8c\
-\xa4\x49\xbb\x04\x8c\x29\x39\xff\x00\x0f\x6c\xe3\x3d\xb3\x56\xab\
-\xce\x3f\x68\xaf\x89\x3a\xa7\xc2\x2f\x85\x9a\xff\x00\x88\x34\xad\
-\x21\xfc\x43\xa9\x69\xf0\x83\x63\xa6\x2d\xe0\xb4\x5b\xd9\x1a\x44\
-\x8c\x29\x94\x83\xe5\x2e\xe9\x17\x73\x90\xc4\x2a\x92\xaa\x49\xc5\
-\x4c\xa4\xd6\xc4\xc8\xf1\xbf\xf8\x29\x1f\xc7\xef\x0c\xf8\x2f\xc3\
-\xbe\x16\xf0\x4e\xad\x35\xd5\xd4\xde\x30\xd6\x6d\x2e\x27\xd3\xf4\
-\xfb\x59\x2e\xae\xae\xb4\xeb\x4b\x98\xa7\x9f\x62\xa0\x3f\x34\x92\
-\x2c\x16\xea\x83\x2f\x2b\x4e\x15\x15\xb9\xc7\xce\x9f\x0f\x34\xed\
-\x5b\x4f\xfd\xaf\xfe\x23\xf8\x9b\xc5\x70\x5b\xd9\x6b\x1a\x27\x87\
-\xad\x75\x4b\x9b\x7f\x35\x65\x8f\x4b\x9a\x5b\x69\xee\x44\x61\x98\
-\x8d\xac\x96\xf0\xdb\x02\x03\x6c\xf3\x5e\x56\x20\xab\x2b\x8f\xa6\
-\x3f\x62\xdf\x82\x77\x12\x49\xe2\x2f\x14\x78\xe3\xfb\x27\xc5\x1f\
-\x11\xa3\xd7\x66\xb3\x9b\xc4\x1f\x25\xd2\x44\x21\x24\x2c\x16\xb1\
-\x80\x05\xad\xb4\x2f\x24\xd1\xa4\x4b\xb5\x99\x57\xcc\x90\x99\x64\
-\x70\x3c\xe7\x5d\xd0\xed\xfc\x33\xfb\x65\x7c\x4b\xd1\x75\x0d\x25\
-\xb5\x2d\x63\xe2\x8e\xa3\xa6\x35\x84\x48\xe8\x22\xbb\xd2\x53\x4c\
-\xb7\xb6\xbd\xb8\x94\x9f\x94\x47\x6d\xe5\xb0\x7e\x01\x7f\x3e\x04\
-\x0a\x4c\x8a\x2b\xc9\xc7\x51\x94\xed\x7e\xe7\x3c\xa3\x7b\x33\xe8\
-\x3f\xd9\xae\xd2\xcf\xc0\x5f\xb3\x27\x82\x5a\x66\xfb\x3c\x70\xf8\
-\x6e\xd6\xe6\xe1\xee\xa7\xdc\xcb\xba\xdd\x25\x9a\x59\x9c\x90\x0b\
-\x17\xde\x59\xdb\x0a\x4e\x72\x46\x46\x7e\x2a\xf8\x01\xa1\xf8\x7f\
-\xf6\xdb\xf8\xb9\x1d\xae\x8e\x93\xdf\xe9\x37\x1a\x84\xde\x22\xf1\
-\x95\xe4\x10\xca\x88\xef\x3b\x09\xa2\xb4\x9f\x70\xca\x4d\x3f\xee\
-\x73\x19\x6f\x36\x28\x21\x40\x3c\xb5\x54\x09\xf7\x27\xed\x2f\xe0\
-\x8b\xff\x00\x1d\x7e\xcd\xbe\x3b\xd0\x74\x78\x87\xdb\xf5\x5f\x0c\
-\xea\x1a\x7d\x84\x04\x04\x41\x34\x96\xb2\xc6\x9e\xd8\xcb\x81\xe8\
-\x46\x06\xd1\x8c\xd4\x7f\xb2\x87\xec\xdf\xa5\x7e\xcd\x3f\xb3\xf7\
-\x83\x3c\x1b\xa4\x69\xf6\xfa\x5c\x1e\x1c\xd2\x2d\x2c\xde\x14\x7f\
-\x37\x32\xa2\x03\x2b\x3b\xf5\x95\xde\x56\x91\xda\x47\x66\x25\x98\
-\xb7\x52\x6b\x6c\x46\x17\xda\xa8\xf6\x5f\x89\x52\xa2\xa5\x64\x87\
-\xfe\xd0\x5e\x33\xd3\xfe\x04\x7c\x0f\xf1\x27\x8b\x2e\x56\x5b\x88\
-\x7c\x37\xa6\x4b\x78\xb0\x21\x02\x4b\xa6\x45\x2e\x88\x9c\xa0\xdc\
-\xef\xb1\x72\x1b\x27\xb1\x04\xe4\xfc\x1d\xaa\x7e\xcd\x9e\x26\xf8\
-\x89\xe2\x58\xed\x6c\xe3\xf0\xb7\x87\x4d\xd0\xb5\xbd\x8a\xeb\x55\
-\x56\x25\x92\xe5\xa4\x73\x1d\xa5\xba\xec\x59\x25\x67\x89\x89\x52\
-\xca\x88\x92\x34\x8d\x1c\x85\xeb\xeb\x6f\xf8\x28\xf6\x5b\xf6\x76\
-\xd3\xf4\xc8\xe1\x8e\x4b\x7b\xff\x00\x14\x68\xb6\x17\x11\x32\x17\
-\x0d\x13\x5e\x44\x4a\x80\x32\x46\x40\x1c\x8c\xe0\x1e\x7b\xd5\x1f\
-\x03\x7e\xca\xde\x1b\xf8\xed\xf0\xc6\xd7\x59\xf1\x96\x88\xb3\x6b\
-\x3a\xbe\x9b\x6e\x2c\xcb\x09\x23\x9b\x42\xb6\x46\xf3\x2d\xfe\xce\
-\xc4\xfe\xea\x60\xe1\x65\x69\x63\xf2\xdd\xdc\xfc\xc4\xaa\x20\x1c\
-\x78\x9c\x0d\x3c\x55\x65\x4a\x5a\x45\x20\xa9\x04\xbd\xdb\x1f\x0d\
-\xd8\x7c\x38\xf1\x57\xc3\x6f\x12\xf8\xbf\x43\xd3\xf5\x04\xf1\x45\
-\xb8\x83\x50\xd3\x23\x83\xec\xa2\xce\xf2\xe6\x79\x21\x28\x8d\x0c\
-\x90\xb6\xc8\x81\xc1\x52\xcf\x19\xd8\xca\x1f\xe4\x38\x27\xd6\x3e\
-\x27\x6b\xcb\xe2\x3b\xad\x4b\xe1\xfd\xa6\xad\x62\xf0\x5a\xf8\x06\
-\x4d\x42\xe2\x79\xae\xe3\x6b\xbd\x3b\x55\xb3\x7b\x13\xa6\xcd\x3e\
-\x30\x21\x90\x4a\x04\x85\xd8\x2e\xe2\x49\xc0\x51\xf3\x71\xbf\x15\
-\xff\x00\xb7\x3f\x66\x7f\x8d\xbf\x16\xae\xb5\xcf\x10\x2e\xad\xa5\
-\xf8\x4f\x48\x1a\x86\x9f\xa8\xde\xca\x1e\xec\x19\x62\x45\x81\x6f\
-\x41\x50\x97\x04\x00\xf0\x89\x50\x07\x61\x1f\xcd\xb9\xb9\x3b\xbf\
-\x03\xa0\x3e\x3b\xf8\xfb\xe2\xbd\x43\x52\x86\xc6\x4d\x63\x55\xf0\
-\xf6\x85\x63\x78\x9e\x48\xf9\x09\x17\x6f\x20\xdd\x8c\xbe\x26\xdc\
-\xe5\x4e\xf6\xda\xa9\xf7\x40\xf3\x0f\x8d\x1a\x7e\xc5\xfb\x35\xdf\
-\x43\x4a\x6e\xf0\xb2\x3e\xaf\xfd\x98\x3f\x6c\x89\x3f\x6a\x8f\x1a\
-\xdd\x59\xe8\x1a\x0c\xf3\xe8\x3e\x17\xb6\x8a\x0f\x11\x78\x85\xee\
-\x7c\xab\x58\xf5\x89\x2d\x61\x99\xb4\xfb\x45\x0a\xc2\xe9\xa1\x59\
-\x88\x95\xb7\x22\xc6\xc4\x28\x2c\x43\x01\xf4\x0c\x57\xf1\xac\x2a\
-\x7e\x6d\xa4\x67\xae\x78\x18\xe7\x3f\xaf\xb8\xf5\xaf\x9a\x7f\xe0\
-\x9e\xd0\x78\x7f\xe1\xa7\xec\x41\xf0\xf6\xdf\xc3\xfa\x5c\x3a\x75\
-\x8c\xfa\x3f\xda\xed\xed\x21\x85\x55\xa6\x4c\xbc\x86\x77\x3b\x50\
-\xbb\xb8\x2a\xe6\x4d\xd9\x72\xdb\xf2\xd5\xd6\xfc\x5f\xfd\xa6\xbc\
-\x3f\xfb\x3e\xfc\x2c\x8f\xc7\x1f\x13\xaf\x17\x43\x86\xcf\xcf\xb8\
-\x86\xce\xde\x59\x25\x9e\x7d\x90\x3b\xba\x2c\x6a\x54\x4a\xdb\x01\
-\x6f\x9d\x76\x2a\x7c\xcc\xc2\xbe\xb2\x9d\x5e\x6b\x25\xd8\x98\xc9\
-\x58\xf4\xbf\x1c\x7c\x66\xf0\xaf\xc3\x25\x8d\xbc\x45\xe2\x2d\x17\
-\x42\x59\x86\x62\xfb\x7d\xec\x76\xe6\x51\xbd\x63\x3b\x43\x30\x27\
-\x0e\xe8\xa7\x8e\x0b\xa8\xef\x56\xfc\x0b\xf1\x57\xc3\x7f\x13\x74\
-\x8f\xed\x0f\x0e\x6b\x9a\x57\x88\x34\xf1\x23\x43\xf6\xad\x36\xee\
-\x3b\xb8\x4c\x8a\x70\xcb\xba\x32\xc3\x20\x8e\x41\xaf\x92\x3f\x62\
-\xbf\xd9\xa7\xc7\x7f\x11\x7c\x6c\xdf\x1b\x3e\x2e\x4c\xfa\x56\xb9\
-\xe2\xa1\x26\xad\x17\x86\x90\xb7\x9d\xa7\x5b\x48\xac\x96\xb6\x37\
-\x6c\x78\xf2\x20\xb6\x31\xaf\xd9\x15\x7c\xa6\xb9\x69\xee\x5f\x7c\
-\x86\x2f\x2b\xec\x4d\x3b\xc3\x50\x69\x10\x2c\x76\x70\xda\xdb\x47\
-\xbd\xa5\x2a\x91\x6d\x42\xcc\x72\xcc\x51\x48\x1b\x89\x24\x96\xeb\
-\x93\x5d\x7a\x58\xd2\x26\x92\x36\xf4\x0d\xcf\xcc\x33\xc8\xc1\xa5\
-\xa4\x41\xb5\x14\x74\xc0\xc6\x07\x6a\x5a\x0a\x0a\x28\xa2\x80\x0a\
-\x28\xa6\xf9\x9d\x7d\xa8\x01\xd4\x50\x0e\x45\x14\x00\xdf\x35\x79\
-\xf6\xa7\x03\x91\x4d\x0a\xc3\x3f\x37\x7f\x4a\x70\xe9\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x79\
-\x37\xed\x90\x61\x4f\xd9\x97\xe2\x20\x92\xcf\x52\xd4\x24\x6d\x12\
-\xed\xa1\xb6\xd3\xec\x64\xbc\xba\x9a\x6f\x20\xf9\x42\x28\x90\x66\
-\x59\x7c\xc4\x42\xaa\x39\xce\x09\xc0\xe6\xbd\x66\xb3\xe7\xd2\x5e\
-\x69\x24\x93\x70\xde\x59\xb6\xe0\xed\xc2\x91\x8c\x12\x06\x7a\xf3\
-\xc6\x08\xf5\xed\x40\xa5\xb1\xe6\x7f\xb1\xd6\x85\xe2\x8b\x0f\x81\
-\x3a\x6d\xe7\x8c\xed\xd2\xcf\xc4\x9a\xd5\xc5\xd6\xb3\x7d\x6a\x91\
-\xac\x66\xc9\xee\xa7\x92\xe1\x62\x21\x78\xdc\x8b\x22\xa3\x75\xc3\
-\x29\x01\x98\x7c\xc7\xd2\x24\xf0\xf2\xbd\xf7\xda\xa2\xf2\xc4\x8d\
-\xd5\xb9\x04\x8c\x8e\xa4\x63\x23\x1d\x8f\x5e\x06\x40\x18\xab\xab\
-\x6a\xca\x15\x77\x13\xb7\x9d\xc4\xf2\xdf\xd2\xa2\x97\x56\x8e\xd5\
-\x8a\xc8\xdb\x36\xe7\x24\xe0\x28\x00\x64\x9c\xfa\x70\x7a\xfa\x13\
-\xd0\x13\x53\x2b\x75\x26\x31\xd2\xcc\x6a\xe9\xed\x04\x58\xf9\x0e\
-\x0e\x40\x51\xb7\xb8\x3c\xfe\x5d\x80\xfa\x53\x64\xd4\xe0\xd2\xd1\
-\x21\x7f\x33\x70\x5d\xab\x94\x23\xcc\x20\x1e\x01\xe8\xcc\x70\x7e\
-\x51\xcf\xb6\x2a\xe0\x6d\xe8\x1b\xd4\x67\x9a\xe7\x3c\x77\x1d\xe6\
-\x9b\xe1\xad\x52\xe7\x4f\x92\x18\xf5\x06\x81\xcc\x12\x3c\x41\xb1\
-\x20\x05\xa3\x2d\xd3\x2a\xa7\x3c\x1c\xe7\x8e\xbc\x8a\x25\x25\x6b\
-\xb1\xd9\x6e\x8e\x5b\xf6\x95\xf8\x41\x75\xf1\xc7\xe1\x65\xe6\x8b\
-\x63\x75\x65\x6f\x34\xd7\x16\xb7\x91\xb5\xc2\x33\xda\xde\x1b\x7b\
-\x95\x9c\x5b\x5c\x04\x3b\xcd\xbc\xa5\x02\x36\xd6\x05\x43\x16\x19\
-\xc6\xda\xe6\x3f\x6a\x0f\x8a\xfa\xaf\xc1\x0f\x85\x36\x77\x5a\x6d\
-\x8b\x41\x15\xbc\xf1\x59\xdc\xde\xa4\x5e\x75\xb6\x89\xf2\x9d\x92\
-\x4e\x37\x03\xe4\x17\x08\x8c\xea\x09\x41\x20\x76\x55\x88\x34\x8b\
-\xd9\xfe\xce\xba\x86\xad\xab\x7c\x15\xf0\xad\xe6\xbd\xab\x5c\x6b\
-\x5a\xb5\xee\x99\x6f\x77\x75\x77\x35\xbc\x76\xd2\x4e\xd2\x46\xad\
-\x87\x48\xc0\x8f\x70\x2c\x47\xc8\xaa\xb9\x07\x00\x0c\x0a\xd0\xf1\
-\xdd\xae\xfd\x0a\xea\x35\x78\xe4\x65\x8d\xa1\x65\x99\x37\xc2\xc1\
-\xb0\x1f\x7a\xf4\x0a\x57\x2b\xf3\x7d\x47\x7c\xe7\x38\xa9\xc2\xe8\
-\xce\x4d\x59\xb6\x7e\x31\x7e\xd4\xff\x00\x1f\xf5\x7f\x8c\x5e\x2e\
-\xf8\x9d\xa6\x7c\x40\x8e\xd7\x40\xf1\x63\x78\x5f\x4a\xd2\x35\x4b\
-\x7d\x36\x56\x92\xd6\xe6\xde\x5b\x99\x65\x4b\xdb\x59\x36\x87\x64\
-\x96\x27\x8d\x7c\xb6\x1f\xbb\x68\xd9\x94\x32\xe5\xab\xe9\x3f\x82\
-\xfa\x8d\x86\x93\xf1\xcb\xe2\x07\xda\x24\x85\xa5\xb7\xd3\xb4\xb2\
-\xd0\xc8\x9f\xb9\x30\x1b\x79\x92\x3c\x2f\xca\x1b\x7c\x81\x97\x08\
-\x41\x63\x85\xc8\x18\x07\xe5\x1f\xda\x17\xe1\xa6\x9b\xe1\x8f\xda\
-\x93\xe3\x36\xa9\xe1\x9f\xb6\x5e\x78\x7f\x42\xf1\x07\x87\xfc\x3d\
-\xa7\xad\xc2\x96\x92\xd3\x12\xc4\x2e\x2c\xac\xee\x03\x7c\xd6\xf0\
-\xcc\xf2\x61\x18\x98\xe2\x78\xc8\x0e\xcc\xab\x12\x7b\xa5\xb4\xba\
-\xaf\x86\x7f\x69\xdf\x18\xdc\x58\xdb\xdb\xb5\xac\x9a\x18\xf9\x14\
-\x21\x00\xa6\xa1\x3c\x58\x00\x04\x29\x9f\x32\x45\x5e\x3e\x43\x96\
-\x03\xe6\x65\x3f\x11\x8c\xe6\x8d\x57\x2b\xe8\x4d\x29\x5a\x0d\x97\
-\xf4\xbd\x57\xc6\x97\xd6\x56\x3e\x1e\x93\xe2\x47\x8b\x74\xef\x09\
-\xea\x1e\x22\xb8\xb5\xd2\x7c\x3d\x67\x3c\x16\x77\x97\x16\x4d\x6f\
-\x1d\xd5\x85\xa9\xbe\x89\x16\x61\x66\xa9\x29\x49\x12\x26\xdd\xb2\
-\x2d\xa5\xf2\x0c\x75\xdc\xfe\xc7\xff\x00\xb3\xcf\x87\xbe\x1c\xe9\
-\x7e\x13\xf1\xe7\xc4\xfd\x53\xc4\x7e\x3e\xd7\x1f\x53\xbc\xd2\x3e\
-\x12\xf8\x55\xa5\x10\xb3\x69\xe8\xc1\x8b\x45\x65\xfb\xb1\x33\x4a\
-\xf0\x9b\xb3\x2d\xc1\x64\x8a\x13\x04\x84\xc7\x8d\xab\xc2\x78\x8b\
-\xf6\x76\x5f\x1d\xfe\xd9\xbe\x3d\xd7\xbc\x4d\xe2\xc1\xa5\xf8\x6f\
-\xc1\x5a\x36\x93\x79\xa7\x5b\xc3\x0f\xfa\x3e\x8b\x63\x2d\x93\x25\
-\xfc\xf2\x48\xb2\xac\xbf\x6a\x7b\x3b\x69\x62\x49\x43\x66\xdd\x0b\
-\x32\xa8\x60\xed\x5e\xff\x00\xff\x00\x04\xb0\xf8\xa9\x17\xed\x23\
-\x79\xe2\x8f\x88\xda\x87\x84\x6f\xac\x75\xcb\xc6\x8e\xc2\x1d\x62\
-\xeb\xca\x6b\x3b\x2d\x3c\x3a\xc9\x6b\xa3\xd9\xa6\x43\xc4\x96\xf0\
-\xb5\xbc\xb3\x2c\x31\xac\x72\xce\xec\xcc\xfb\x80\x8d\x3d\xdc\xaa\
-\x32\x4b\x9e\x4e\xf7\x39\xe9\xde\xf6\x67\xdc\x16\x56\x84\x43\xf3\
-\x79\x65\x5b\xef\x61\x4a\x93\x9e\x49\xe4\x93\xd7\xb1\xab\x51\x86\
-\x58\xd4\x37\x2d\x8e\x4f\xa9\xa8\xed\xa4\xc4\x6b\xb9\x59\x5b\x19\
-\x23\xfb\xbe\xd5\x30\x39\xaf\x7d\x1d\xf1\x56\x41\x45\x14\x53\x18\
-\x51\x45\x14\x00\x53\x76\x70\x69\xd4\xd2\xf8\xa0\x07\x01\x81\x45\
-\x30\xcc\x07\xad\x3c\x1c\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x2b\xc4\xff\x00\x6d\x2f\x15\x78\xd3\xe1\xa7\xc2\xbf\xf8\x4b\x7c\
-\x0b\xa7\x5f\x78\x8f\x54\xf0\x7d\xea\xea\xf7\x7e\x1d\xb5\x65\x12\
-\x78\x96\xcd\x51\xd2\x7b\x35\x24\x1c\x4b\xe5\xb3\x4b\x11\xe8\x64\
-\xb7\x8d\x33\x86\x20\xfb\x2c\xda\x84\x70\x49\xb1\x8f\xcf\x82\x42\
-\x8f\xbc\xd8\x19\xe0\x75\x35\x4a\xf2\x19\x1a\x5b\x8f\x99\x71\xd5\
-\x36\xae\xd6\x24\x05\x6c\x6e\xfc\x3a\xe3\x91\x81\xc1\x5c\x98\x9c\
-\x5b\xd8\x52\x32\x7e\x19\xfc\x5a\xf0\xff\x00\xc5\xcf\x87\x3a\x37\
-\x8a\xbc\x39\xa9\xc3\xad\x68\x3a\xed\x9a\x5f\x58\xde\xdb\x02\xc9\
-\x73\x13\x28\x60\xc0\x0e\x73\xce\x0a\xe3\x70\x6c\x82\x01\x18\xad\
-\xb9\x42\x5d\xd9\xe5\x95\x5d\x24\x19\xc3\x2e\xf0\x41\xcf\xe1\xd0\
-\xd7\xca\x4f\x0e\xbd\xfb\x0e\x7c\x73\xd5\x34\xdf\x0f\xe9\xba\x4d\
-\xf7\xc3\x3f\x1b\xdc\x4b\xab\xd9\xe8\xdf\x6a\x1a\x6c\x9a\x35\xf6\
-\x5a\x6b\xe3\x68\xcc\x0c\x4c\x92\x30\x69\xda\x03\xe5\x9d\xd2\x4b\
-\x22\x3e\x15\xc0\xfa\x37\xe1\xbf\xc5\x7d\x2f\xe2\x97\x84\xa1\xd5\
-\x2c\x63\xd4\x6d\xb2\x02\x5c\x59\xde\x42\x61\xbc\xb1\x9b\x68\x66\
-\x82\x68\xce\x4a\xca\xaa\x41\x20\x6e\x04\x10\xca\x58\x32\x96\xcb\
-\x47\xee\xdf\x52\x23\x25\x7b\x1e\x49\xfb\x1f\x78\x97\x54\xb1\xf1\
-\x8f\xc5\x6f\x05\xea\xd7\x53\x3d\xc7\x85\x3c\x5a\x46\x97\x04\xe0\
-\x82\x9a\x6d\xd5\xbc\x73\x5b\x6c\xc8\x1f\xbb\x04\xdc\x05\xc6\x47\
-\xee\x98\x0c\xe2\xb9\x5f\x8c\xfe\x2a\xf8\xed\xe1\x7f\x8a\xff\x00\
-\xf1\x4e\xe9\x5e\x0a\xf1\x96\x8a\xd7\x0f\x77\xfd\x9e\x6d\xae\xf4\
-\x9b\x98\xac\x59\xb6\x45\x1f\xda\xe4\x9a\x44\x6b\xa7\x52\xff\x00\
-\x2a\xdb\x6c\x67\x5f\x9a\x48\x41\x06\xaf\x78\xb1\x6e\x7c\x09\xfb\
-\x77\xeb\xba\xed\xaa\xdd\xcd\x0e\xa9\xe0\xdd\x3d\xae\xec\x60\x9c\
-\x49\xfd\xa5\x1c\x17\xb7\xea\xc1\x23\x3d\x5e\x3f\x3e\x27\x42\x8d\
-\x96\x76\x68\xf8\xf3\x17\x3e\xd5\x1f\x8b\xec\xfc\x4d\xf0\xee\x4f\
-\x10\x68\xb2\x26\xab\x69\x75\x09\xbb\xb4\x6b\x53\x9f\xb5\xa9\x42\
-\xaa\x37\x03\xb4\xb1\x24\x0c\x91\x9c\x0d\xa4\x64\x66\xa6\x35\xa3\
-\xcb\x6b\xec\x44\x92\xd5\x33\xf1\xc3\xe1\xaf\x89\xfe\xdf\xf0\x83\
-\xe1\xaf\x8a\x2f\xac\x75\x4b\x5b\x1d\x53\xe2\xb5\xa4\x5b\x75\x3b\
-\x36\x82\xe3\x51\x6b\x7d\x4e\xe7\xcc\x0d\x13\xb1\x21\x9a\xe6\x71\
-\x23\x07\xe8\xe1\xf8\x62\x2b\xbd\x8b\xc4\x0b\xa8\xfe\xd4\x36\xf3\
-\x6a\x12\x43\x14\x9a\xc7\x86\x5a\x39\x4a\x27\xd9\xe0\x9d\xbf\xb4\
-\x46\x24\x66\x62\x02\x84\x67\xee\x72\x0a\xb1\x60\x06\x18\xfa\xaf\
-\x8a\xbc\x4d\xe1\x4f\x1a\xfe\xcc\xde\x0c\xd4\x2d\x6c\xa1\xd3\xf4\
-\xe9\xfc\x73\x2a\xe9\x6b\x14\x82\x40\x97\x2b\xaa\xde\xe2\x53\x13\
-\x7c\xcd\x23\x4a\x92\xb8\x55\x24\xee\x9b\x1d\x10\x91\xf3\x27\xc7\
-\x6f\x06\xdf\x6b\x7a\x8f\xc4\x29\x2c\xed\x64\xb9\xbc\xd2\xfe\x1c\
-\x6a\x16\xd6\x1f\x2b\x34\x68\xaf\x3c\xdb\xde\x46\x0d\x91\xb4\x44\
-\xca\xe4\xb6\xd0\x02\x74\x1c\xd7\xc1\xe2\x6a\x37\x5f\x92\x5d\xcc\
-\xa5\xee\xd2\x69\x1f\x5b\x7c\x66\xf0\xdd\x97\xc5\xcf\x0e\x7c\x54\
-\x9a\xe7\x52\xb7\x8e\xc7\x5e\xf0\x1a\xe8\x5a\x9c\x73\x03\x32\xdc\
-\xfd\x81\xee\xe4\x8a\x6c\xc6\x5b\x16\xe5\x2e\xe4\x0c\xb1\xec\x93\
-\x74\x6a\x72\x08\x6d\xdf\x4a\x7e\xc7\x1a\x4d\xaf\xec\xf3\xfb\x15\
-\x78\x46\xe3\xc4\x77\xd6\xba\x3a\xd9\xe8\x6d\xaf\x6b\x57\x57\x97\
-\x49\x0c\x36\xd2\x5c\xa3\xea\x17\x8e\xf3\x4b\xc2\xa2\xc9\x24\x9b\
-\x98\xb6\xd1\x8c\xee\xe0\x81\xe2\x9f\x0b\x3f\x66\x38\x7c\x65\xe1\
-\x1f\xec\xeb\x5d\x4a\xc6\xca\xc5\xb4\xbd\x3f\x4b\x69\xc6\x9e\x67\
-\x37\x36\xa1\x84\x73\xda\x94\x0c\xbb\x1a\x68\x62\x28\xb9\xc3\x02\
-\x77\x7c\xcc\xd8\xae\x8f\xf6\xb2\xf8\xab\xe1\x7f\x8e\x5f\x1a\x3c\
-\x2b\xfb\x3b\xc7\xa8\x2e\xa1\x36\xb5\x0c\x5a\x9f\x8b\x74\xdb\x54\
-\x2b\x1d\xb6\x99\x06\x27\x8e\x19\xa4\xc6\xd4\x33\xb4\x4a\xa2\x2f\
-\xbe\xd1\x49\x90\x11\x0b\x48\x7e\x8f\x25\xac\xd5\x1d\x57\x5b\x15\
-\x4e\x2a\xca\x4c\xfa\x4b\xe0\xa7\xc7\x8b\x7f\x8d\xbe\x0a\xb6\xd7\
-\xec\x7c\x3b\xe2\x6d\x27\x47\xd4\x14\x4b\xa6\x4d\xaa\x59\xc7\x68\
-\xda\x9c\x04\x65\x27\x48\xbc\xc3\x24\x28\xcb\x86\x0b\x70\xb1\x3e\
-\x08\x05\x41\xc8\x1d\xf4\x4e\x25\x89\x59\x73\x86\x00\x8c\x82\x0f\
-\xe4\x6b\x23\xc3\x3a\x02\xe8\xba\x2d\xb5\xbc\x71\xc3\x6e\xb1\xc6\
-\xab\xe5\xc2\x30\xa8\x00\x00\x01\xd7\x38\xf7\xcf\xe1\x5a\xf1\x82\
-\x23\x5c\xf2\x71\xc9\x1d\xeb\xe8\x63\xae\xa7\x54\x5b\x6b\x51\xd4\
-\x51\x45\x50\x05\x14\x51\x40\x05\x46\x7a\xd4\x94\xd2\x99\x35\x32\
-\x00\x0a\x31\x4e\xa8\xcc\x6d\xea\x2a\x41\xc0\xa2\x20\x14\x51\x45\
-\x50\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x66\x8d\xc3\x3d\x68\
-\x00\xa2\x80\x73\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x50\xbc\xb1\x9a\x45\x93\
-\x6c\x98\x0c\x49\x60\x59\xf1\xdf\x18\x00\xe4\x63\x8c\x80\x40\x3e\
-\xd5\xe1\xdf\xb3\x87\xed\x61\xff\x00\x09\x9f\xc4\x7f\x15\x7c\x39\
-\xf1\x94\x27\x4b\xf1\xf7\x83\xae\x7c\xbb\x89\x22\xb6\x78\xf4\xfd\
-\x6a\xd1\xc9\x36\xd7\x96\xcf\x96\x40\x1d\x41\x47\x8d\x98\x3a\x49\
-\x1c\x8b\x86\x09\xbc\xfb\xf6\xdf\x98\xfa\x62\xbc\x2f\xf6\xad\xfd\
-\x9a\x5f\xe2\x0e\x97\x7d\xe2\x0f\x0e\xfd\x8e\xd7\xc5\x96\x70\x13\
-\x0f\x9d\x1b\x49\x6d\xac\x46\x31\xbe\xd2\xee\x30\x40\x96\x27\x41\
-\xb0\x0f\xbc\x84\x2b\x2b\x06\x00\x8e\x7c\x44\xd4\x17\x3b\xe8\x4c\
-\xb6\x36\xff\x00\x69\xff\x00\x82\xd6\x3f\xb4\x27\xc2\x6d\x4b\x42\
-\xba\x98\x28\x99\xa2\xbc\xb3\xb9\x0a\x19\x6d\x6e\x22\x71\x24\x13\
-\xc7\xcf\x2f\x1b\x80\xc3\x07\x0c\x54\x86\xf9\x48\x15\xf2\x0f\xec\
-\xdf\xfb\x56\xdf\x78\x0b\x50\xbe\xfe\xd0\x7d\x45\x75\x6d\x05\x66\
-\xb4\xd5\xf4\xd9\xc3\x5c\x5c\x23\x59\x31\xfb\x44\x2a\x0f\xef\x1f\
-\x29\xfb\xe8\x5b\x1b\x8e\x15\x01\x22\x44\x51\xf4\x87\xc1\x5f\x8c\
-\x93\xde\xf8\x5d\x59\x61\xd5\xa4\xbe\x58\xe1\xf3\x2c\xef\xa4\xdc\
-\xd6\xc4\xe0\xcf\x1f\x9c\xdf\x33\x4a\x8d\xb8\x32\x6e\x44\x05\x41\
-\x18\x46\x06\xbe\x54\xfd\xb7\xfe\x17\xc9\xf0\x97\xf6\x95\xd7\x3c\
-\x4d\x67\xa8\x2c\x70\xf8\xb2\xca\xdf\x53\xb3\xf2\x46\x1a\xde\xe2\
-\xdd\x5e\x27\x0a\x70\x46\x49\x91\x0a\x95\x05\x81\x8f\x93\xd0\x8f\
-\x94\xcd\x31\x7c\x91\x58\xda\x2f\x44\xf5\x47\x9f\x56\xa5\xad\x28\
-\x9e\xf9\xfb\x44\xeb\xba\x7d\xf7\xed\x0f\xe0\x0d\x4a\xc6\xf2\xdd\
-\x64\xd7\xbc\x37\xab\xc5\xf6\xa8\xd0\xc9\x1c\x96\xd1\x9b\x2b\x94\
-\x7d\xfd\x06\xd8\xe4\x0c\xac\x30\x72\x43\x10\xe0\x00\xb6\xbf\x65\
-\x5f\x1a\xdd\xf8\x42\xdf\xe2\x96\x9b\x24\x71\xdb\xe9\x7a\x4d\xc4\
-\x7e\x25\xb0\xb5\x59\x0b\x3d\x9a\x5e\x5b\xbc\x93\xc2\x13\x19\x0a\
-\x2e\xe1\xb8\x94\x1c\x00\x4c\xcd\xb7\x2a\x01\x3e\x11\xe1\x7d\x6a\
-\x6d\x4f\xc5\x7e\x0b\xd5\xaf\xb5\x6b\x8b\x7d\x1e\xe3\x4d\xd7\x67\
-\xd3\xed\xf5\x6d\x41\x59\x2c\x6e\xee\x5a\xc5\xe4\x81\x03\x00\x22\
-\x82\xdf\xec\xf2\xcb\x12\xbb\x4a\x76\x5c\x90\x1d\x11\x55\x06\xcf\
-\x8e\xae\xb5\x6f\x08\x69\x3e\x2b\xbd\xd2\xff\x00\xb1\x6f\x75\x6f\
-\x12\xe9\x56\xfa\x26\x9d\xa3\xdd\x86\x8e\x5d\x5a\xe1\x2f\x95\x80\
-\xdc\x32\x5e\x18\x61\x96\x67\x6d\xab\xb8\x8c\x9d\xc0\x66\xba\xe3\
-\x88\x52\x97\xb6\xa6\xee\xa4\x91\xa4\x1b\xab\xef\x23\xe5\x3f\x10\
-\x9d\x73\xfe\x19\xff\x00\x48\xd2\x6e\x23\xd1\x74\xbf\x06\xf8\x3f\
-\xc7\xc9\xe2\x08\xef\x6e\x6f\x94\x0b\x8b\x2b\x9d\x56\x5b\x96\x85\
-\x59\x41\x69\x2f\x8a\xbb\xc7\xe5\x44\x59\xd9\x30\xa8\x0b\xb3\xed\
-\xec\x34\x8f\x81\x5f\x19\x3e\x20\xdd\x5d\xdc\x78\x47\xe1\x43\x49\
-\xa7\xf8\xa3\xc1\x97\x1e\x19\x9e\xef\xc6\xf7\x51\xe8\x71\x46\x25\
-\xb9\x69\xa3\xba\x82\xc5\x44\x97\x8e\x98\x79\x3f\x77\x2c\x2b\xf3\
-\x10\x58\x95\x3c\x7d\x95\xfb\x3a\xfe\xc2\x9a\x5f\x82\x75\x89\x3c\
-\x59\xad\xdc\xa7\x89\x7c\x5d\x39\x07\x4d\xbd\xba\xb1\x8b\x6e\x88\
-\xbf\x3b\xff\x00\xa1\x26\x31\x19\xdc\xe4\x89\x79\x97\x9f\xbe\x57\
-\x08\x3d\xe7\x44\xd1\x6d\x6e\x9f\x77\x97\x2a\x19\x4f\x2c\xe0\x09\
-\x0b\x14\x09\xbb\x70\xed\xe5\x80\x9b\x47\xcb\xc6\x71\x59\x50\xc2\
-\xc2\x55\x3d\xa4\xcf\x42\x38\x5b\xad\x4f\x80\xbe\x0a\x6b\x3f\xb5\
-\x64\x5f\x0f\xac\xfc\x35\x75\xe0\x8f\x0a\xf8\x5f\x54\xb8\x11\x69\
-\x9a\xc7\x89\xe0\xd6\xd5\xee\xad\x60\x48\x13\x37\x36\x96\x2e\x56\
-\x31\x34\xe4\x5c\x38\x12\xb0\x10\xbc\xd9\x2b\x20\x2d\x18\xf4\x2f\
-\xd9\x8b\xe1\xcd\xd7\xc2\x1f\xdb\x80\xeb\x5e\x22\xf0\xce\xad\xe0\
-\x7f\x0f\xff\x00\xc2\x38\xd6\x5a\x3d\xe6\xbb\xa8\x41\x75\x26\xb5\
-\xae\xdf\xdf\x01\x74\x64\xbc\x59\x24\x37\x17\x52\x47\x67\x00\x55\
-\x7f\xde\x6d\x76\x55\x05\x02\x2a\x7d\xa5\xa3\xf8\x6a\xce\xd6\x19\
-\x1a\x08\x63\x56\x72\x5b\x71\xe7\xcb\x25\x48\x04\x71\xd0\xe7\x8f\
-\x41\x56\x35\x4f\x0d\x5a\x6a\x90\xdc\x59\xdc\x41\x04\xd6\x97\x79\
-\x8e\x58\x2e\x23\x57\x8a\x65\x3b\x41\xdc\x98\xc3\x76\xeb\xd7\x9c\
-\x93\xc0\xaf\x57\x0d\xcb\x18\xf2\xf9\x8d\xd1\x8a\xd0\xd8\x4d\x42\
-\x3b\x6b\x75\x56\xde\x36\x8d\xa3\x23\x1b\x88\x19\x3c\xe7\x1f\xaf\
-\x5e\x2a\xea\x9c\xa8\xc7\xa5\x78\xed\xaf\x80\x75\x9f\x80\xb6\x4d\
-\x2f\x86\x6e\xae\x35\x5f\x0f\x5a\x4b\x2d\xd5\xce\x85\x7d\x3c\xb2\
-\xdc\x59\x5b\x88\xc3\x14\xd3\xe5\xce\xe7\x55\x60\x0a\xdb\xca\x4a\
-\x66\x46\x55\x92\x25\x0a\x87\xd1\xfc\x17\xe3\xfd\x37\xc6\xde\x14\
-\xb5\xd5\xac\x26\x92\x4b\x3b\x88\xf7\x6e\x96\x33\x1c\x91\xe3\x86\
-\x0e\xac\x01\x56\x04\x10\x41\x00\x8c\x1e\x38\xaf\x52\x32\x44\x1b\
-\x94\x54\x70\xdd\x2c\xf0\xac\x8b\x9d\xae\x01\x1c\x83\xd7\xe9\xc5\
-\x48\x0e\x6b\x40\xb8\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\
-\x00\x51\x45\x14\x00\x51\x4d\x2f\x83\x8a\x75\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x35\x87\xcc\xb4\xdc\x37\x9d\xd2\xa4\xa2\x80\x1a\x99\xc7\x34\xea\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\xab\xcd\x6f\xe6\xb7\xcd\xd3\x76\x7a\
-\xf4\xab\x15\x1b\x37\x3f\x8d\x67\x38\xa7\x6b\x86\xfa\x1f\x3d\xfc\
-\x65\xf8\x59\x67\xe0\x7f\x14\x5c\x6b\x96\x4a\xb1\xb6\xb9\x74\x93\
-\x49\x04\x4e\xc0\x49\x7c\xb1\xca\x0c\xa0\x02\x7e\x66\x44\x8b\xe5\
-\x18\x1b\xa2\xdc\x36\xb3\x13\x5e\x1f\xfb\x55\x6a\xfa\x7f\x8e\x74\
-\x4f\x09\xdb\xdf\xd8\x4b\x6e\xda\x4a\xdd\xcb\x3c\xd1\x47\x8f\x2a\
-\x31\xe4\xe5\x9f\xfe\x79\xee\x9d\x88\x0a\xb9\x66\x01\xb0\x3e\x53\
-\x8f\x7f\xfd\xbe\xf5\xc8\x7c\x37\xf0\x1e\x6d\x62\x4f\x26\x4b\x8d\
-\x1f\x57\xd2\xe5\xb6\xfb\x44\xc6\x08\xed\xdd\xef\x63\x81\x9d\x98\
-\x01\x85\xf2\xe5\x93\x93\xc6\x46\x33\x5f\x26\x7c\x03\x5f\x13\x7e\
-\xd5\x3e\x2b\xb7\xf1\x96\xb1\xa6\xc1\xa0\xfc\x2d\xbc\xd3\xae\x06\
-\x93\xa7\x99\x03\xeb\x9e\x21\xfb\x46\xc5\x4b\xb9\x24\x8c\x1f\xb1\
-\xc0\x12\x15\x60\xbe\x63\x34\xd9\x53\x91\x1f\xc8\x7e\x67\x32\xcb\
-\x7d\xa5\x47\x05\xf0\xbd\xcf\x3e\x54\x1c\xa7\xc9\x13\xc8\xb4\x4f\
-\xd9\x7b\xc5\x9f\xb6\x6e\x93\x67\x71\x0c\x71\xf8\x47\xc2\x92\x24\
-\xda\x7d\xe4\xd7\x1a\x8c\x87\x52\xd6\x2d\x16\xe5\x44\xd6\x91\x5a\
-\x42\xe6\x0b\x46\xda\x8e\x3e\xd1\x71\xbe\x55\xde\x40\x8d\x08\x26\
-\xbe\xdf\xf0\x87\xc3\x4f\x0a\xe9\x1a\xad\xae\xad\xf6\x5b\x7b\xbd\
-\x6e\x08\xa3\xb3\x7d\x4e\xf9\x04\xb7\xa2\xdd\x58\x48\x50\xbb\x10\
-\xc5\x5b\x70\x73\xe5\xec\x56\x1b\x53\xcb\xf9\x54\xab\xae\xec\xf4\
-\x7d\x06\xd6\xcd\x74\xfb\x5b\x3b\x7b\x7b\x41\xb4\x5a\xda\xc0\xa3\
-\xec\xa8\x8d\xc2\xc6\xa5\x4f\x03\x8c\x28\xc6\xd0\x30\x71\x8a\xa7\
-\xa9\x49\x35\x90\x9a\xe2\x46\x69\xde\xe8\x79\x84\xab\xee\xde\xec\
-\xea\xc9\xbb\x8e\x76\xf2\xd9\xe3\x3c\x8c\x00\x2a\x68\xd3\x50\x82\
-\x84\x7a\x1e\xd6\x1f\x07\x1a\x31\xd7\x73\xb8\xd2\x7c\x6a\x63\xbf\
-\x87\xce\xb8\x92\x25\xb2\x64\x58\xd0\xcb\x97\xe5\x46\x43\x0f\xc4\
-\x0f\xc6\xb5\xa1\xf1\xd4\x37\x11\x3c\xd0\xb3\x0c\x4d\x98\xb7\xbf\
-\x02\x3c\x36\x49\xc7\x3c\x63\x1e\xb9\x23\xb7\x35\xe4\x4c\x9a\x82\
-\x4b\x0c\x3e\x4c\x36\xd7\x0e\x0b\x30\x51\x9d\xa3\x72\x11\xc8\x27\
-\xb2\x8f\xc8\xd7\x6f\xe1\x3f\x0f\x5e\x5c\x4c\x21\x8f\xcc\x6f\x2d\
-\x77\x06\xf2\x73\xf3\x8d\xbb\x5f\xf0\x0b\xb7\x1d\x09\xc9\xad\x1c\
-\x59\xdd\x09\x26\xad\x63\xd0\x7c\x31\xe2\x19\x23\x81\x9f\xce\x71\
-\xb5\xb6\x28\x23\x2a\xc3\x20\x63\x3e\xd9\xfd\x2b\x76\x1d\x7b\x7c\
-\x67\x74\x90\xbe\xd3\x8d\xe5\x4f\x1d\x71\x9f\xaf\xcb\xd2\xb2\xfc\
-\x33\xe0\xfb\x7b\x0d\x20\x87\x8e\x46\x51\x97\x40\x1b\xbf\x39\xfc\
-\x8e\x3f\x2a\xd8\x8e\xca\x11\x24\x10\x86\x51\x12\xfd\xcd\xcc\xa7\
-\xcb\x3d\xf8\x27\x27\x3f\xa5\x69\x46\xe9\xea\x63\x2e\x5e\xc2\x49\
-\xab\x29\xb9\x58\x5b\x6a\xc8\xaf\xe6\x12\xa4\x80\x4f\x50\x08\xc9\
-\xe3\x20\x64\x03\x86\xe4\xf1\xd2\xb0\x7c\x61\xf0\xfe\xeb\x5f\xd7\
-\x6d\xf5\xed\x0a\xfa\x4d\x3f\x5e\xb5\x83\xec\x69\x3c\xa5\xe7\xb5\
-\xb8\x8f\x76\xe3\x1c\xf0\x79\x88\xb2\x74\xc0\x7c\x87\x52\xdc\x36\
-\xdd\xe9\x27\x56\x3c\x3f\x6f\x34\x9e\x6c\x6a\xbd\x3b\x74\xfc\x2a\
-\x48\x2c\xbc\xa9\x73\x03\x2a\x49\xb9\x77\xbe\x37\x70\x06\x08\xc5\
-\x7a\x34\x6a\xbd\x8e\x39\x72\xb2\x8f\x86\x7e\x23\xd9\xeb\x57\xb3\
-\x69\x73\xb2\xda\xeb\xda\x7c\x49\x2d\xee\x9e\xf2\x0f\x36\x15\x6c\
-\xe1\xc1\xe0\x3c\x6c\x41\xc3\x81\x83\xd0\xed\x20\xa8\xe9\x16\xe3\
-\x70\xe1\x24\xed\xc1\x18\xae\x2f\xe2\x4f\xc3\x29\xbc\x63\xa4\xca\
-\xda\x7d\xf3\x68\x3a\xc4\x31\xe3\x4e\xd5\x6c\xe1\x43\x71\x62\xdb\
-\x83\x30\x21\xc3\x24\x91\x48\x42\xef\x8d\x97\x04\x75\xc9\x0a\x57\
-\x3f\xc0\x5f\x11\xb5\x4b\x6b\x78\x74\xaf\x1d\x43\xa7\xe9\x3e\x22\
-\x67\xfb\x24\x72\xd9\xb9\xfe\xcf\xd5\xa4\xdb\xb8\x3d\xa8\x66\x32\
-\x23\x10\x09\xf2\x5f\xe7\x18\x3b\x4c\x8a\xa5\xeb\xbe\x15\x13\xd0\
-\xc7\x96\xc7\xa3\xa3\x87\x40\xc3\xa3\x0c\x8a\x5a\xab\x6d\xab\x43\
-\x77\xfe\xad\xbc\xce\x40\xca\x10\xe0\x64\x67\x3c\x67\x8e\x08\xe7\
-\xbd\x59\x47\x0e\x81\x97\x90\xc3\x20\xd6\x80\x2d\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x0d\x64\xdc\xd9\xa7\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x19\xc5\x19\xcd\x35\xc6\x68\x41\x8a\
-\x00\x75\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x72\x7f\x14\xfe\x2e\x78\x7f\xe0\xdf\x86\
-\x2e\xb5\xcf\x13\x6a\xb6\xba\x2e\x93\x6b\x24\x50\x3d\xe5\xd3\xf9\
-\x71\x23\xca\xe2\x34\x19\x3d\x72\xc4\x0e\x33\xd7\xd8\xe3\xac\x27\
-\x02\xbe\x3f\xff\x00\x82\x8d\xeb\xfe\x0b\xf1\xce\x9f\x67\xe1\xef\
-\x10\xdc\x09\xb4\xbf\x0e\x6b\x10\xdf\x78\x89\xe1\xbe\xd8\xba\x52\
-\x4f\x1b\xda\xdb\x45\x3c\x69\xb9\xb7\xdd\x49\x72\xab\x17\xca\x76\
-\x86\x96\x5c\x82\x98\xa9\x9d\x45\x08\xb9\x30\xf6\x6e\x6d\x45\x18\
-\xfe\x35\x83\xfe\x1a\xee\x4d\x1f\xc5\xde\x22\xfb\x2d\xe7\x82\x59\
-\x65\x9b\x40\xf0\xf1\x2d\x35\xa6\xa6\x1e\x66\x11\x6a\x97\x47\x8f\
-\x38\x98\x11\x5e\x18\x00\x31\x45\xe6\x99\x1b\x7c\x81\x0a\x75\xfa\
-\x76\xa0\xb0\x85\xb3\x58\xda\x19\x55\x3c\x91\x26\xc4\xf2\xf0\xa5\
-\x86\x08\x50\x13\x80\x70\x1c\x2e\x4a\xae\xdf\x94\x00\x6b\x76\xef\
-\xc3\x93\x69\xda\x44\x56\xbf\x67\x86\x35\x44\xfb\x3a\x5b\xc5\x09\
-\x68\xd5\x12\x36\x8d\x63\x00\x7f\x0a\x05\x00\x63\x01\x71\xc9\x23\
-\x9a\xcd\x4d\x06\x1b\xc1\xe6\x13\x04\xd1\x64\xf9\x86\x22\x24\x25\
-\x80\xdd\x8d\xc1\xb6\xf0\x8c\x58\x92\x40\xc1\x07\xbd\x7c\xdd\x6c\
-\x6f\xb5\x93\x68\xf5\xa8\xe1\x63\x4b\xde\x96\xe4\x2b\xa5\x46\xda\
-\x90\x86\x18\x84\xcd\x7c\xe9\xe6\x1d\xa5\x46\x31\xd0\x92\x49\x3c\
-\x8f\x5c\xfa\x96\xa7\x47\x74\xba\xa1\xdb\xe4\xf9\x33\x20\xf2\xcb\
-\xb9\x28\xbd\x3e\x65\x6c\x80\x0e\x03\x36\x08\xeb\x81\xd2\xb4\xe0\
-\xb1\x91\xe3\x48\xd2\x68\x56\x46\xff\x00\x56\x76\xb2\xf1\xbd\x88\
-\x27\x23\x20\x05\x19\x24\xf6\x20\xf4\xe6\xa6\xb8\xf0\x65\xc2\xa0\
-\x68\x66\x85\x60\x91\xbc\xbd\xe5\xb8\x2c\x57\xa9\xeb\x81\xea\xc4\
-\x00\x3a\x70\x78\xac\x61\x74\x8a\x92\x52\x77\x63\x21\xf0\x25\xbd\
-\xbd\xc2\x2a\x9b\x89\x77\x32\x3a\xf9\x2b\x9d\xc8\x10\x86\xe7\xd0\
-\xfc\xd8\xc7\xa8\xae\xe7\xc2\xd6\x51\x5a\x88\x51\x23\x0a\xab\x1a\
-\x3e\x55\x5c\xb9\xe7\x8f\x4e\x37\x67\xf0\xfc\xab\x96\xd0\x34\xcb\
-\xc8\x25\x51\xe7\xc6\x52\x41\x96\x93\xf8\x51\x14\x81\x80\x72\x3d\
-\xc1\xe9\xcf\x4a\xec\x6c\xb4\xcb\xab\x3b\xb8\xe7\x2b\x6a\xce\xd1\
-\x90\x12\x32\x5b\x76\x1d\x8e\x07\x38\x24\x60\x8f\xc2\xb5\xbb\x7a\
-\x13\x74\xb6\x3a\xbb\x28\x56\x10\xb1\x23\x61\x55\x18\x2e\x78\xe4\
-\x9c\xd1\x6b\x13\x49\x2a\x2e\xd1\xb6\x3c\x8f\x98\x29\x6c\x7d\x7b\
-\x51\xa5\x3c\x37\x91\x42\xcc\xab\xe7\xec\x18\x5c\x32\x9c\x1e\x01\
-\xda\x40\x3e\xfd\x3a\x54\xf0\xcf\x0c\x43\xef\x2f\xca\x32\xc4\xaf\
-\xdd\xfa\x9e\x80\xf7\xc1\xe7\x83\xc5\x77\x42\x82\x76\x38\x67\x53\
-\x52\xed\xb4\x09\x12\x2e\x01\xce\x39\xc9\xcd\x4c\x60\x38\xf9\x48\
-\x51\xe8\x05\x43\x13\xf0\x38\x21\x9b\x90\xa7\x82\x78\xcf\x4a\x95\
-\x2e\xd5\xe3\x0c\x1b\x2b\xd9\x87\x43\x5d\xf0\xa6\xad\xa1\xce\xa4\
-\xee\x24\xb6\xa0\xa6\x3d\xf3\xd6\xb1\x7c\x5b\xe0\x4b\x2f\x19\x68\
-\xf7\x16\x57\xd6\xf6\xf7\x56\xb7\x04\x33\x45\x32\x86\x52\xcb\xca\
-\x38\xc8\x21\x5d\x5b\x90\xf8\x24\x60\x11\xc8\x52\xbb\x53\x5d\xaa\
-\x2a\xee\xf9\x59\xb8\x00\xe0\x67\xf3\xe2\xa3\x6d\x42\x32\x59\x17\
-\x71\x91\x40\x3b\x47\x56\x07\xa1\xfa\x1c\x10\x33\x8c\x90\x68\x9d\
-\x37\xba\x28\xf2\xf6\x97\x5b\xf8\x0d\xa6\x43\xf6\xdb\xdd\x43\xc5\
-\x5e\x17\xb3\x0c\x93\x5f\x5d\x16\xb8\xd5\xb4\xd5\x01\x55\x24\x3b\
-\x40\xfb\x4c\x6b\x97\xdc\x54\x09\x40\x23\x26\x66\xdd\x5e\x99\xa6\
-\xf8\x8a\xcf\x51\xb0\x86\x6b\x79\xe3\xb8\x86\x48\xd2\x44\x78\x5c\
-\x48\x8c\xac\x01\x52\x19\x72\x08\x60\x41\x1f\xde\x04\x63\x35\x1c\
-\x91\x79\x92\x09\x15\x96\x4f\x30\xaa\x82\xa3\x27\x19\x24\x36\x7d\
-\xb3\xf2\xe3\x03\x27\xbd\x79\xc9\xd3\x17\xf6\x7a\x8f\x52\xd4\x22\
-\x7b\x89\x7c\x16\xae\x66\xfb\x0d\xb5\xbb\x4a\xfa\x1c\x4d\xe5\x09\
-\x0c\x0a\x8a\x59\xa0\x2e\x1d\xdd\x40\x2d\x1e\x72\xa0\x2f\x03\x4a\
-\x57\xdd\x90\xe4\x96\xe7\xad\x03\x91\x45\x66\x69\xde\x27\xb5\xbd\
-\xd3\x61\xb8\x8e\x41\x34\x32\x46\x1d\x64\x8f\x0c\x8e\xb8\xc9\x61\
-\x82\x46\xdc\x73\xc1\x39\xed\x9a\xd1\x8d\xfc\xc4\x56\xe7\xe6\x19\
-\xe4\x60\xd6\xd7\xb8\xfc\xc7\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\xd6\x05\x85\x7e\x6f\xfe\xd7\x9e\x26\x93\xf6\x30\xfd\
-\xac\x3e\x21\x5c\x6b\x1e\x1b\x5d\x47\x45\xfd\xa1\x75\x7d\x15\x74\
-\xad\x43\xed\xdf\x61\xb0\xb3\xb8\x86\xcd\x6c\xee\x12\xee\x63\x1c\
-\x9e\x5b\xb1\x8e\x12\x84\x06\x32\x07\xc2\xac\x7e\x54\x8c\x7f\x48\
-\xab\x96\xf8\x8b\xf0\xb7\x46\xf8\xb3\xe1\xbb\xbd\x0f\xc4\xba\x5e\
-\x97\xaf\x68\x77\xd2\xa3\x5c\x58\x5f\xdb\x2c\xf6\xf2\x84\x75\x91\
-\x49\x52\x39\x21\x95\x48\xcf\x46\x01\x87\x40\xb5\x8d\x7a\x7c\xf1\
-\xe5\x65\x46\x5c\xae\xe7\xc0\x9a\x4e\xb5\xf1\xb3\x5b\xf0\x46\x87\
-\xaa\x78\xc3\x56\xd2\xe7\xb2\xd5\xae\xda\x4d\x4f\x4c\xf0\x9c\xb1\
-\x69\xd7\x16\x36\xab\xb8\x24\x2d\x7b\x31\x7f\xb4\xc6\xc1\x91\xd9\
-\xe3\x7b\x59\x5c\x30\x54\x31\xb8\x61\x5d\x16\x91\xf1\x3f\x56\xd2\
-\x7c\x3b\x66\xcd\xe2\xef\x12\xf8\x4f\x52\xb8\xbe\x08\xf2\x78\xcf\
-\x41\x17\x90\x47\x17\xcc\xcd\x66\x25\x09\xb0\xec\x60\xec\x26\x67\
-\x65\x0c\x30\x5d\xb8\x5a\xf4\x2f\xdb\x0f\xf6\x4c\xf0\x47\x81\x7c\
-\x2f\xe1\xdf\x14\x78\x77\x46\x9b\xc2\xb7\x9e\x19\xd6\xf4\xe8\x8c\
-\x9e\x17\x99\xf4\x7f\x2e\xca\x4b\x88\x60\x98\xbc\x70\x01\x0c\x91\
-\x85\x94\xbb\xc6\xf1\x3a\x90\x80\x0d\xb8\xcd\x79\xde\xbb\x7d\xac\
-\xf8\x0e\x3b\x3b\x3b\x5f\x88\xdf\x11\xff\x00\xd0\x35\x9d\x22\xce\
-\xe0\x6a\xed\xa4\xdd\x40\xf0\x5e\x6a\x10\x59\x80\xc1\xec\x04\xac\
-\x53\x78\x64\x50\xc2\x37\x6e\x3b\xe6\xbe\x7e\xa6\x1a\x14\x6a\x28\
-\x37\xab\x3a\x25\x8d\xd7\xde\x66\x36\xb1\xf1\x47\xe2\x8d\x8f\x8b\
-\xb5\x41\x65\xe2\x6f\x0e\xe9\xfa\x7e\xc6\x86\xde\x0d\x6f\xc3\xde\
-\x5d\xa5\xc9\x8d\x5c\x09\x22\xbe\xb7\xb8\xda\x59\x1b\xac\x52\x18\
-\xd9\x4e\x72\x14\xee\x6a\xe4\x7c\x4b\xfb\x4a\x7c\x4d\xbb\xf1\xa4\
-\x9a\x1e\xa1\xe2\x2d\x3f\x52\xd2\xe6\xd2\x1f\xfb\x5e\x6d\x27\x41\
-\x5b\x6d\x73\x4e\x7d\xa4\x79\xf1\x5b\xbd\xc3\xb9\xb7\x69\x90\xe1\
-\xe3\x57\xda\x1d\x40\x6d\x99\x23\xa2\xfd\xba\x7e\x04\x5c\x78\x07\
-\x41\xf0\xcc\x90\xaf\x87\xb5\x6f\x13\x78\xf3\x5e\x87\xc3\xf0\x5c\
-\x69\xff\x00\x6c\xf0\xdc\xcc\x24\x59\x27\xbe\x9e\x7f\xb1\xcb\xb2\
-\x7d\xa2\xdc\xcc\xc1\xe2\xea\xc4\x80\x1b\x04\x7c\xed\xf1\x2f\xe1\
-\xf6\xb9\xe1\x0f\x14\x4d\x6f\xe2\x0b\x5f\xf8\x42\xec\xf4\x99\x60\
-\x8a\xdf\x56\xf0\xf5\x95\xc4\xb6\xce\x6e\x12\x66\x58\xad\x1a\x08\
-\x9a\x38\xae\x9d\x55\x57\x2f\x15\xb4\x8a\x1c\xe1\xdc\x29\xc7\xa9\
-\xf5\x48\xa5\x67\xb9\x8b\xc6\x6b\xb9\xef\x9f\x0b\xbf\x6b\xe2\xbe\
-\x16\xd2\x7c\x51\xab\x7c\x5d\xbe\x97\xc2\xac\xf1\x89\xb5\x2f\xec\
-\x8b\x35\x0a\x54\x86\x31\x5e\x2c\x71\x9d\x92\xec\x1e\x51\x8c\x10\
-\xd2\x15\x0d\x1b\x23\x92\x0f\x33\xe2\xcf\xda\x4b\x58\xb3\xf8\x3d\
-\x79\xaf\x5e\xfc\x54\xf1\x35\xc6\xbd\xe1\xdb\x8b\x31\xaf\x5b\x5b\
-\x6a\x76\xf2\x5a\xac\x0c\x54\x4b\x32\x44\x91\x08\x99\x1a\x03\x25\
-\xc2\x48\xab\xb1\x94\x30\x3b\x59\x4a\x0f\xcf\xdf\x8f\x7e\x15\xd6\
-\x97\x41\xf1\x2f\xfc\x23\xb7\x5e\x30\xd6\x66\xd1\xdb\x53\xb3\xd6\
-\x2e\x35\x3d\x14\xcd\x7b\x63\x1c\x71\x46\xc2\xd2\x7f\x2e\x24\x75\
-\x47\xcb\x89\x96\x57\x64\xf2\x98\x1c\x6d\x24\x37\xdb\xdf\x07\xbf\
-\xe0\x9e\x1f\x0c\x7c\x6f\xf0\x23\xc0\x32\xeb\x5a\x54\xd6\x72\x5c\
-\x68\x36\x32\x6a\xf0\xc1\x74\x6d\x67\xd7\xd1\x21\xf3\x56\x2b\xa7\
-\x07\xcc\x58\xbc\xd9\xe5\x3b\x21\x61\xe6\x2e\xc5\x72\x42\xa8\x5c\
-\x71\x14\xd5\x04\x9b\xea\x5e\x1d\xca\xab\xb2\x3d\x1f\xc4\xbf\x1f\
-\xfc\x7b\xf0\x8b\xe2\x9d\xe6\x9b\x37\x8d\xfc\x41\xad\xe9\xb1\x78\
-\x0f\x53\xf1\x2d\xbc\x62\xca\xca\x66\x96\x5b\x5b\x88\xf7\x2a\x22\
-\x42\x9e\x72\xbd\xbc\xd1\x01\xb7\x1f\x22\x16\x2e\x3a\xd7\x53\xe0\
-\x7f\xdb\x13\xe2\xa7\x84\xbc\x39\xf0\xf2\x2d\x4b\x59\xb2\xf1\x96\
-\xb5\xe3\x28\x86\xa1\x71\x23\xd8\xff\x00\x66\xdb\xd9\xd9\x08\x11\
-\xa7\xbb\x2d\x19\x98\x24\x70\xb3\x2c\x20\x7c\xec\xec\xd8\x38\x63\
-\x50\x7c\x43\xff\x00\x82\x75\x7c\x33\xf1\x17\x85\xa1\xb5\xbf\xb3\
-\xd6\x2f\xac\x6e\xac\x56\xd5\xad\x9f\x5f\xbe\x92\xdb\xc8\x0d\x1c\
-\xbe\x41\x8c\xdc\x29\xf2\xfc\xc8\xe2\xdf\x16\x54\x49\xe4\xa2\x92\
-\x14\x10\xcb\x75\xff\x00\x04\xc0\xf8\x6b\x78\x96\xfa\xce\x9b\xa4\
-\xdf\x59\xbd\xad\x89\xd3\x6d\xe1\xb0\xf1\x05\xe5\xb5\xbd\xe4\x01\
-\x36\x88\x24\x09\x2a\xa8\x41\x92\x88\x1b\x01\x09\x66\x24\x0d\xb8\
-\xe1\x8e\x60\xaf\x64\x77\x47\x04\xed\x76\x7a\x56\xa9\xff\x00\x05\
-\x1c\xd4\x6d\x75\x1b\x3d\x17\x43\xd0\x65\xf1\xb6\xbd\x1d\xb2\xc3\
-\xa8\x58\x78\x55\x26\xbb\xfb\x1d\xce\xf6\x6c\x99\x9d\x16\xda\x28\
-\xd5\x06\x08\x96\x75\x7c\xfc\xa0\x31\x06\xa4\xf1\x67\xfc\x14\x3f\
-\xc4\x9e\x0e\xd4\x74\xd8\xb5\xef\x03\xd8\xe8\x16\xf7\xc1\x36\x7d\
-\xbb\xc5\x16\x16\xf7\xee\xec\xac\x76\x2c\x1e\x69\x12\x60\xae\xdc\
-\xab\x1d\xc7\x18\xcf\x24\x7c\x23\xfb\x16\xfc\x2f\xd7\xb4\x8d\x23\
-\xc6\x9f\xdb\x5e\x24\xbd\xd0\xf4\x9b\x4f\x13\x5f\x5f\xc1\xa2\xea\
-\xfa\xad\xcd\xed\xbe\x9b\xa5\x0b\x28\x92\x19\x0c\x76\x77\x71\x45\
-\x1a\x98\xca\x93\x23\xa0\x59\x09\xfd\xd9\xcf\x35\xf4\x37\xc2\xfd\
-\x0f\xe1\xdf\xc2\x7d\x2a\xf3\x50\x5f\x1c\x69\xb1\xea\xd3\x4a\x6e\
-\x65\xb9\xd5\xac\x62\xb7\xb7\x54\x61\x01\x47\x51\x77\xba\x62\xa9\
-\x1a\x44\xca\xff\x00\x68\x60\xe7\x83\x9c\x28\x5f\x46\x32\x9a\xd4\
-\xe2\xe5\x8d\xda\x3d\x57\x4a\xff\x00\x82\xc8\xf8\x5a\xe7\x43\x8a\
-\xe4\xf8\x2f\xe2\x14\x8f\x34\x9f\x66\x84\x5a\xe8\xd2\xdc\x9b\x8b\
-\x86\x91\xa3\x8e\x25\x58\xc3\xb7\xcc\xca\x72\xe8\xac\x00\xe6\xb3\
-\x34\x8f\xf8\x2a\x07\x8a\xbc\x63\xa1\x49\x7d\x27\xc2\x4f\x14\x78\
-\x3a\xd6\xca\x09\xae\xaf\xf5\x1d\x5e\xd2\xf6\xe2\xce\x3f\x29\x51\
-\xcc\x71\x45\x6d\x01\xbb\x69\x0a\xc8\x49\x69\x23\x55\x50\xca\xe8\
-\x5d\x89\x41\x8d\xa0\xf8\xf7\x5a\xd5\xb5\x4d\x4a\xc6\x3f\x16\x78\
-\x8b\xe2\x64\x9a\x7d\x97\xda\xee\xac\xfc\x2f\xa6\x4b\x6f\x75\x78\
-\x8c\xcb\x1b\xc5\x23\x04\x8e\x28\x97\x94\x19\x49\xc4\x80\x77\x0a\
-\x0c\x6b\xb7\xe2\x5f\x83\xbe\x3e\xf8\x81\x32\xc3\xa0\xfc\x3d\xf1\
-\x33\xdd\x0b\xf6\x13\xea\x5e\x2c\xf1\x89\xd2\xec\x60\x5f\xdd\x48\
-\xcc\xb0\x44\xd7\x25\xc4\x84\xa9\x00\xc2\x08\x6d\xe4\x14\x3c\x9b\
-\x95\x4a\xfc\xbe\xe2\x25\x46\x97\x53\x42\xc7\xfe\x0a\x69\x35\xb4\
-\x52\x0d\x5a\xeb\xe1\xed\x8e\xa9\x6e\x8e\x26\xd2\xb5\x1d\x42\xfb\
-\x44\x9a\xd4\xb9\x1e\x46\xf9\x2f\x20\x1b\x77\x48\x31\x99\x15\x01\
-\x1c\xf4\x22\xba\xcf\x13\xfe\xdc\x5a\xb6\x93\xa0\x5d\x47\x27\x85\
-\xe1\xd2\x75\xfd\x40\x7f\xc5\x32\xf0\x49\xfd\xbb\x63\xac\xca\x57\
-\x22\x27\x7b\x7f\x2f\xec\xe4\xa2\xaf\xef\x24\xdb\x10\x5c\xfc\xcd\
-\xc6\x79\x1d\x33\xf6\x0d\xf8\xab\xe2\x34\x8a\xd4\x6a\xdf\x0f\x7e\
-\x1b\xe9\xed\x0a\xbb\x45\xa4\xd9\xdc\x6b\x8f\x05\xce\xed\xf2\xc8\
-\x91\x5c\x79\x36\xa3\x7b\x16\x01\x8c\x0c\xeb\xc3\x06\x2c\x4b\x1f\
-\x5a\xf8\x6d\xff\x00\x04\xfb\xd1\x7c\x3d\xe1\x39\x74\xcf\x16\xf8\
-\x8b\x5e\xf8\x95\x15\xe4\x10\x47\x3c\x5e\x21\x16\xff\x00\x62\xcc\
-\x6c\xcf\xf2\x5a\xc1\x14\x71\x2a\x96\x6c\xed\xc1\x23\xd7\x39\x27\
-\xcd\xa7\x4f\x1c\xaa\xde\xfa\x1d\x72\x78\x65\x0d\x16\xa6\xcf\xec\
-\xf3\xe2\xab\x5d\x47\xc7\x5e\x3d\xd1\xf4\x5d\x42\xfb\x58\xd0\xac\
-\x6f\xad\xee\x20\xd4\x3c\xd1\x71\x61\x0d\xd4\xa8\xe2\x7b\x0b\x57\
-\x5e\x31\x6e\x62\x47\x65\xc9\xd8\x6e\x02\x12\x08\x20\x7b\x3d\xb2\
-\xec\xb6\x8d\x7d\x14\x0e\x33\xe9\xef\xcd\x60\x78\x4b\xe1\xb6\x9b\
-\xe0\x4f\x0d\xdb\xe8\xfa\x2e\x9f\xa6\xe9\x3a\x3d\xa4\x46\x18\x2c\
-\x2d\x2d\xd6\x1b\x78\x97\x39\xc0\x44\x0a\xa3\x3f\x31\x20\x01\x92\
-\x79\x27\x15\xd1\x22\xec\x45\x5c\xee\xc0\xc6\x4f\x7a\xfa\x28\xf3\
-\x5a\xd2\x3c\xef\x41\x68\xa2\x8a\xa0\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\xae\xda\
-\x8a\xa5\xc7\x97\xb2\x5d\xd9\xc6\x76\x71\xeb\xf9\x7b\xf4\xed\x9c\
-\xf1\x53\xef\xaf\x1e\xf8\xfb\xf1\x4e\xfb\xc3\x9e\x28\xd1\xfc\x33\
-\xa1\xde\x47\x63\xae\x78\x81\x2e\x6e\x21\xb8\x7d\x3c\xdf\x0b\x58\
-\xa0\x31\x17\x6d\x85\x95\x56\x46\x69\x91\x22\x79\x0f\x96\x18\x92\
-\x43\x8c\x20\xce\xa5\x58\x53\x8f\x34\xdd\x90\x9c\x92\xdc\xf5\xc8\
-\xef\x92\x4f\xef\x2f\x6e\x46\x39\xf4\xfa\xfb\x76\xef\x8a\x50\x77\
-\x2e\x47\x46\xe4\x57\x97\x68\xdf\x16\x25\xf0\xc5\xbb\x3f\x8b\x24\
-\xb6\xb3\xd3\x76\x07\x8f\x5a\x89\x8c\x76\x7e\x5b\x42\xa7\x74\xfb\
-\x8e\xdb\x63\xb8\xe1\x5b\x73\x2b\x70\x37\x6e\xe2\xbd\x22\x1d\x62\
-\x3b\xb4\x0d\x18\x69\x15\x94\x1c\xa6\x08\x3d\x3a\x73\x9e\x87\x3f\
-\x4f\xca\xa7\xda\x46\xa4\x39\xa0\xee\x2e\x65\x73\xce\x7f\x6a\xcd\
-\x02\xeb\xc4\x9f\x00\x7c\x5d\x6b\x65\xa4\xc7\xae\x4f\x25\x99\x71\
-\x65\x70\xac\x91\xdd\x18\xd9\x64\xc6\x57\x07\x80\xa4\x2e\x31\x92\
-\x07\x51\xcd\x7c\xb7\xe1\xaf\x13\xda\xf8\xbb\xc4\x97\x7a\xa6\x82\
-\xd3\xdd\x69\x5a\xbc\x76\x7a\xbd\x95\xdf\x91\x91\x76\xad\x77\x69\
-\x33\x6c\x66\x0c\x16\x4f\x29\x19\x80\xfe\x07\x52\x40\x0d\xb9\x57\
-\xea\xaf\x16\xf8\x92\xf2\xd3\xe3\xa7\x87\x74\x9f\xed\x4d\x2e\x1d\
-\x27\x58\xb0\xbd\xf3\x2d\x1a\x22\x6f\x6e\x2e\x63\x68\xcc\x6e\x8f\
-\x9d\xaa\xa8\x86\x5c\x82\x32\x49\x41\x8e\x4e\x3e\x77\xd5\x7e\x1d\
-\x5b\x78\x07\xf6\x85\x5d\x12\x39\x1e\xde\xce\x6d\x6a\x7b\xcb\x50\
-\x2e\x1a\x3f\x25\x35\x20\xcf\xb1\x42\xe0\xb2\x0b\xc6\x95\x90\x0e\
-\x15\x94\x80\xa3\x6a\x85\xf3\x73\x2a\x71\xe7\x85\x57\xd0\xe7\xac\
-\x9f\x32\x65\xaf\xda\x9e\xd6\xeb\x59\xfd\xa8\xfc\x16\xb1\xc6\xd0\
-\xda\xf8\x57\x44\xd4\xf5\x57\xbb\x2d\xfb\xa8\xee\x2e\x8a\xd8\xc3\
-\x19\x19\xde\xbb\x23\x5b\x86\x19\xe0\xe5\x87\x41\x5c\x17\xc1\x9f\
-\x11\xe9\xa3\xe2\xc6\xb7\xf6\x89\x16\xde\x59\xbc\x46\x89\x34\x90\
-\xc0\x14\x40\x90\xdb\x40\x3e\x62\x08\x04\x1d\x92\x28\x72\xa4\x86\
-\x1b\x55\x78\x60\x7a\xfb\x7d\x7e\xdf\xe2\xcf\xc4\x5f\x11\xf8\x92\
-\xde\xf6\xd6\xef\x4f\xb9\xbf\x87\xc3\xb6\xfe\x5a\xf9\x29\x11\xb2\
-\x0f\x0c\xdf\x78\x0d\xc0\xdc\x4b\x39\xc1\x01\x70\x17\x69\x6e\x95\
-\xe1\x7e\x17\xf8\x87\x79\xac\xdb\xdb\xeb\x97\xb3\x3c\x11\xdc\x4d\
-\x2c\xa2\xe0\x46\x23\x2b\x6e\xfa\x85\xc7\x92\x83\x20\x72\x9e\x60\
-\x2a\x48\x27\x77\x5e\x48\x07\x87\x1d\x8c\x9a\x91\xcd\x5a\x56\x92\
-\xb1\xeb\x5a\xe7\xec\x55\xf0\x87\xc2\x5f\x00\x75\x09\xb4\xdf\x01\
-\xf8\x36\xf2\xe2\xe3\x4e\xd4\xf5\x3b\x9b\xbb\xad\x26\x1b\xff\x00\
-\x36\x76\xf3\xa4\x73\x34\x8d\xf7\xc1\x2c\x10\x8d\xdb\x98\xa0\xc3\
-\x29\x19\x3c\xdf\x80\xf4\x76\xf0\x7f\xc2\x9f\x0a\xd8\xdc\x7f\x68\
-\x6d\xb7\xd2\xac\x2d\xd2\x13\x32\xb4\x8e\xde\x44\x71\xe1\xbe\x5e\
-\x5d\x5c\x10\xd8\xc0\xc8\x27\xa6\x2a\xbf\xc7\xbf\x12\x5e\x59\x7e\
-\xc5\x5e\x22\x86\xde\x25\xb7\x37\x3e\x23\x93\x43\x8d\x62\xbd\xf3\
-\x9a\xda\x49\xfc\x40\xb1\x70\xf1\xe5\x72\x04\x92\x38\x43\xcf\x3b\
-\x48\x00\x57\xac\x78\x9b\xc3\xb6\xfa\xc7\x8a\xae\x6e\xa0\x48\x59\
-\x24\x9e\x59\x22\x76\x93\xe6\x60\xdb\x41\xc8\xc6\x06\xed\xa4\x1e\
-\xea\x30\xd8\x19\xa9\xcc\xeb\x4b\xd9\xc2\xe7\xd1\xe4\xf0\x52\x6d\
-\xae\xc4\x9e\x1d\xd4\x86\xb9\xe0\xab\x1f\xde\x6e\xf3\x08\x2d\x2b\
-\xba\xaa\xce\x52\x52\xfc\xe7\x91\xd7\xdf\x3e\xb5\xd4\x5c\xdc\xc9\
-\x65\x6d\x6f\x6f\x14\x9b\x9e\xe9\x22\x82\xe7\x70\x59\x3c\xbf\x35\
-\x76\x21\x51\xc2\xb0\x18\x04\x81\x9c\x83\xb7\x38\x19\x38\xbe\x17\
-\xd0\xe3\xd0\x7c\x3f\x6f\x0c\x2b\x18\x56\x85\x9c\x32\x75\x1c\xf0\
-\xa4\x30\x38\xcf\x6e\x3f\x2a\xd6\xbe\xb3\x1a\x26\x9b\x06\xa3\x73\
-\x75\x0e\x9b\x0d\xbb\x79\xf3\x48\x58\x2a\x05\x57\xda\xac\x65\x3f\
-\x2a\x80\x73\xb8\xfb\x12\x42\xf1\x5f\x33\x2a\xf2\x52\x3e\x92\x14\
-\xe2\xf7\x28\xff\x00\xc1\x3b\xbf\x66\x9d\x37\xc0\x7f\xb1\xfe\x8f\
-\xe1\xbf\x15\x69\x7a\x5e\xb5\xe2\x23\x15\xee\x95\xe2\x19\xa4\xb6\
-\x8e\x55\xbe\x64\xb9\x78\x5a\xde\x46\x65\x05\xe1\x28\x88\x16\x37\
-\x1b\x19\x40\xe0\x8c\x01\xf4\x52\x69\xf1\xc3\x6e\x15\x5a\x38\x21\
-\x8f\x11\xa9\x44\xda\xab\xb4\x15\x50\x01\x25\x41\x52\x01\xcb\x6e\
-\xe8\x41\x5c\x8a\xf8\x93\xf6\x59\xff\x00\x82\x92\x7c\x28\xf8\x43\
-\xaa\x7c\x51\xb1\xd6\xfe\x22\x1d\x4b\x43\x4f\x10\xdd\x78\x83\x4e\
-\xd6\x44\x17\x37\xb6\xb7\xb0\xdc\x41\x0d\xe5\xca\x5b\xcb\x0c\x2d\
-\x0b\x25\xab\x48\xea\xc1\x5d\xca\x28\x04\x85\x1c\xd7\x99\x7e\xde\
-\x3f\xf0\x5a\xad\x5b\x58\xf8\x3d\xe2\x8b\x1f\x80\x1a\x2d\xf5\xe7\
-\xda\x21\xd4\x2d\x07\x8f\x6f\x5a\x28\x34\xeb\x38\xe1\x1e\x53\x5c\
-\xd8\x42\xde\x63\xdc\x90\xc7\x74\x5b\xd5\x20\x73\x9f\x9f\x20\x29\
-\xfb\x88\x62\xa8\xc2\x82\xad\x52\x4b\x45\xdc\xf9\x39\xe1\xea\x4a\
-\xab\x84\x53\xdc\xfb\x83\xc6\x1f\xb6\xb7\xc2\x3f\x03\xfc\x43\xd5\
-\x7c\x2d\xac\x78\xdb\x48\xb3\xd7\x34\x1b\x73\x73\xa9\xdb\x4c\xae\
-\xdf\x63\x51\x18\x90\x23\xb1\x52\x04\x86\x27\xde\x22\xdc\x5f\x63\
-\x33\x63\x1c\xd7\x47\xe0\x9f\xda\x23\xc1\x3f\x12\x6e\xad\x6d\xf4\
-\x1f\x14\x69\xb7\x97\xd7\x48\xd2\x47\x6e\xb2\x2a\xdd\x4a\x15\xb0\
-\x48\x85\xc7\x98\xca\x0e\x41\x65\x1c\x6d\xf6\x38\xfc\xfc\xf8\x15\
-\xf0\xe2\x4f\x89\x1f\x17\x7c\x27\xa5\x78\x67\xc4\x12\x78\x1f\xfe\
-\x12\xad\x12\x3d\x73\xc4\xbe\x2c\xb0\x8a\xdd\xf5\xed\x7a\xd6\xc6\
-\xda\x18\xa3\xb7\x12\x34\x7b\x20\x9e\x67\x98\xcd\x2c\xeb\x19\xca\
-\x29\x45\x51\xbf\x7d\x7a\x82\x7e\xc9\xbe\x07\xf8\x4f\xa1\xda\xe8\
-\x7f\x0a\xbe\x23\x4f\xaf\x78\xe6\xde\xe8\xeb\x37\xc9\x7f\xaf\x2e\
-\xbd\xac\xea\x28\x4a\xc2\xf7\xfb\x58\x92\xb2\x23\x5c\xc5\x26\xf4\
-\x45\x57\x4f\xdd\xb0\x65\x61\x58\xd1\xc7\x4e\xba\xf6\xd4\xd7\xba\
-\x69\x53\x0b\x1a\x72\xe4\x9b\xb3\x3e\xec\xb7\x99\x44\x3b\x54\x79\
-\x7f\x2a\xa8\x05\x81\x0a\x08\xe3\x9c\xf3\xe9\x57\xa1\x20\xc2\xbb\
-\x77\x63\x68\xc6\x46\x0f\xe5\x5f\x9c\xfe\x01\xff\x00\x82\xa5\xfc\
-\x48\xf8\x70\x6c\x7c\x45\xf1\x7f\xc3\xfe\x11\x8f\xe1\xce\xb3\x6e\
-\xd7\xcf\x79\xa1\x8b\xd8\x35\x7f\x0e\xc0\xb1\xfc\xb3\xdc\x43\x37\
-\xfc\x7d\xa3\xba\x98\xdc\x40\x10\xa0\xda\xc0\x48\x0d\x7d\x75\xa7\
-\xfe\xda\xdf\x0f\x8e\x81\xe1\xeb\xeb\x8d\x52\xeb\x4d\xb5\xf1\x15\
-\xc5\xa5\x95\xa4\x97\x76\x32\xc7\x1a\x4b\x73\x10\x92\x14\x91\xc2\
-\xec\x8f\x20\x81\xf3\x10\x03\x10\x3b\x8c\xf4\x61\x73\x6c\x2d\x6b\
-\xa8\xcd\x5d\x6e\x4d\x4c\x0d\x7a\x7e\xf4\xa2\xec\xcf\x60\xa2\xab\
-\xc1\xa9\xc7\x3c\x51\xb2\x7c\xcb\x22\xab\x29\x52\x18\x30\x6e\x84\
-\x10\x79\x1f\x4a\xb0\xad\xb9\x41\xf5\xe6\xbd\x38\xc9\x35\x74\x72\
-\x85\x14\x51\x4c\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x06\xed\xc0\x6a\xf9\x0f\xf6\x81\
-\xf1\xbd\xc6\x9d\xfb\x47\x6a\xd6\x9a\x5d\xa2\x6a\x9e\x2e\xd5\xa7\
-\xd3\xfc\x35\xa1\x69\xd7\x69\x24\x56\x97\x08\x62\x7b\xcb\x99\x6e\
-\x25\x88\x3b\x2d\xbc\x68\x19\xcb\xb2\x80\x1a\x04\x41\x9d\xcb\x9f\
-\xaf\x98\x64\x57\x9c\xdc\x7e\xcf\xd0\x4d\xfb\x49\x47\xf1\x1c\x5d\
-\x47\xf6\xc1\xe1\xb9\xbc\x37\x25\xb9\x8b\xfd\x6c\x52\x5d\x45\x70\
-\x1c\xb8\x23\xee\xf9\x64\x01\x8e\x8d\xd4\x63\x9e\x5c\x66\x1a\x35\
-\xe9\xf2\x48\x99\x46\xe7\x1b\xa6\xfe\xcd\x1a\xc7\xc3\xaf\x0f\x37\
-\xfc\x22\xba\xc4\x77\xb7\x13\xb5\xc4\xd7\xda\x4e\xa8\x64\x3a\x6e\
-\xb1\x24\xac\x58\xe7\x71\x79\x2d\xce\xd3\xb3\x28\x5e\x30\xa0\x2f\
-\x95\xb0\x04\x1e\x2f\xf1\x0b\xc4\xba\x5f\x84\x3c\x43\x69\x36\x97\
-\xa0\xea\x5e\x15\xf1\xb7\x85\x6f\xb4\x8b\xfd\x57\x49\xb0\xbe\xb8\
-\x86\xd8\xd8\x9b\xd8\x91\xfc\x98\xc6\xd8\x2e\xa2\x29\xe6\xa6\x62\
-\x85\x58\x05\x50\xe2\x32\x76\x8f\xb5\xfe\xc6\xcc\x17\x76\xd6\x2a\
-\x41\xcb\x72\x7a\x73\xe9\x5c\xa7\x8f\xbe\x10\x69\x9f\x12\xec\xae\
-\x2d\x75\xab\x58\x2e\xad\xe4\x46\x85\x0e\x4e\xe1\x1b\xa6\xc9\x14\
-\x80\x00\x65\x21\x9f\xe5\x6d\xc0\x70\x79\xe0\x2f\x3f\xd4\x7d\x9a\
-\x8c\x29\x07\xb3\xb9\xc0\x7c\x7a\xf0\xfc\xe7\xc5\xfe\x11\xd5\x6c\
-\x6e\xe6\x86\xea\xde\x49\xa0\x51\x08\x75\x6b\x86\xd8\x2e\x52\x36\
-\x91\x5b\x72\xc6\xfe\x46\xd3\x92\x57\x0c\x47\xb5\x79\xf7\xc7\xd9\
-\xd6\xc3\xe2\xf4\x9a\xd2\x9b\x86\xba\xba\xb0\xb0\x7b\x18\x8b\x2f\
-\x96\x0c\x2f\x2b\x79\x91\x9f\xbe\x01\x32\xf9\x6e\x11\x49\x1b\x47\
-\x00\x90\x4f\xac\x7c\x53\xf0\xfb\x78\x73\xe1\x4a\xdb\xcd\xaa\x5e\
-\xaa\xe8\x6d\x6d\x27\xdb\x8f\xef\x26\x78\xd1\xd4\x65\xd7\x18\x62\
-\xeb\xbd\x1b\xa6\xee\x5b\x20\x9c\x57\xcd\x3f\xb5\xef\xc5\x98\xc7\
-\x82\xf4\xd8\x6d\x7c\xb1\x35\xc0\x51\xe6\x39\x1b\x43\x3c\x4e\x1e\
-\x39\x09\x39\x20\x48\x77\x00\xa4\x1c\x92\x30\x49\x5c\x78\x39\xbe\
-\x2a\x71\xbd\x3f\x43\x86\xab\x71\x7a\x99\xfa\x0f\xc6\x0b\x7f\x1b\
-\xfc\x36\xd2\x75\xb8\xe0\xbe\xb7\xb7\xf1\x25\xbc\x3a\xc3\xa4\xe8\
-\x8a\xe5\x26\x93\xce\x05\x82\x65\x43\x61\xd0\x8c\x13\xd4\x7a\x8c\
-\xfc\xed\xe0\x2f\x8c\xb1\xe9\x97\xfb\xaf\x2f\xa6\x9e\x0d\x27\x5d\
-\xbd\xd2\xe5\x81\xe2\x2c\x2d\xd5\x75\x2b\x80\x4b\xe4\x01\xc9\x73\
-\x82\x30\x0e\x48\x52\xaf\xf3\x8e\xa3\xf6\x59\xf1\x74\x1e\x2b\xfd\
-\x99\xbc\x09\x0a\x4d\x25\xbf\x9d\xa1\xd8\xc7\x1e\xe2\x5e\x17\xc5\
-\x9c\x71\x9c\x31\x18\x1f\x74\x90\xbe\x87\xdd\x83\x78\x75\xc8\x93\
-\x4e\xf8\x8f\xe3\x4b\x59\x1e\xf1\xa5\x6f\x14\x5e\x6a\x51\x5f\x89\
-\xf6\x09\x92\x68\xa1\x9b\x30\xab\x63\x77\x2c\xfb\xb0\x49\xe0\xaa\
-\x15\x20\xd7\x3e\x32\xb7\xee\xb9\xe5\xe4\x73\xd4\x77\x8d\xcf\x7a\
-\xf1\x37\x8a\x63\xf1\x87\xc4\x6d\x7b\x4f\xf1\x0c\xb6\xba\x2d\xbe\
-\x97\xf1\xb3\x41\x6b\x38\x89\x23\xcc\x8a\xe6\xca\x09\x72\xc1\x02\
-\x86\x2f\x36\x65\xc9\x25\x57\x24\xb0\x4c\x62\xbe\x9e\xf0\xee\x8e\
-\x6f\x92\x19\x36\xff\x00\xa3\xb3\xb4\x66\x08\xd4\x0f\x23\x6e\x40\
-\x72\x4e\x33\x9d\xbc\xe4\x0d\xc3\x00\x71\xcd\x7c\x93\xe1\x1b\x5b\
-\x8f\x1e\x7e\xd5\x9e\x03\xd3\x6d\x60\xb3\x5d\x2d\xf4\xd9\x3c\x73\
-\xaa\x4d\xf6\x80\xf7\x72\xdf\x69\xf6\xcd\xa6\xdb\x2a\x84\x61\xfb\
-\x92\x2e\xe1\x25\x1f\x20\xb5\xb1\x2b\xf3\x33\xe3\xec\x2f\x04\xe9\
-\xeb\xa2\xc1\xa5\xc3\xf6\xc6\xb5\x8f\xcd\x62\xb9\x11\xac\x81\x59\
-\x59\xb8\x18\x50\xa3\x0c\xb9\x0a\xa4\x73\x85\x03\xa0\xc7\x3a\xc5\
-\xde\x94\x12\xec\x7d\xa7\x0f\x53\x5e\xc3\xda\x33\xb2\x92\x1f\xec\
-\x3d\x0d\xee\x23\xde\xd2\x6c\x12\x2c\xcd\x9d\xb8\x03\x6b\xab\x7c\
-\xbc\x11\xd4\x0c\x6e\x3e\x9d\x6b\xe3\x3f\xdb\xb7\xe3\x34\x1a\xcf\
-\x8d\xbc\x27\xf0\x72\xfb\x50\xd4\x2c\x63\xf1\x31\xb9\xd4\xe6\xcc\
-\x51\x35\xbe\xad\xa7\x59\x46\xc2\x6b\x79\x1c\x8c\x49\x1c\xcf\x2c\
-\x29\xb5\x41\x62\x91\x32\xb8\x31\xb9\xdc\xdf\xf8\x29\x47\xfc\x14\
-\x90\x7c\x33\xf8\x95\xa0\xfc\x1d\xf8\x7b\xab\x5b\x8f\x88\x9a\xc5\
-\xd3\x47\xaa\xea\x33\x59\x0b\x88\xfc\x29\x68\xb6\xcf\x71\x93\x11\
-\x00\x4d\x73\x2a\x28\x10\x41\x23\x1e\x4e\xf6\x49\x41\x55\xaf\x99\
-\xff\x00\x66\xed\x0a\xcb\xf6\x96\xf0\x17\xc3\xef\x1e\x78\xbd\x60\
-\xf1\x37\xc4\x6d\x7f\x49\x82\xfe\xeb\xc5\x1a\x8d\xbe\x2e\x5a\x46\
-\x20\x6d\x88\x21\xf2\xa3\x54\x45\xf2\x40\x40\xa4\xf9\x65\xdb\x6b\
-\x12\x4f\xc9\xe6\x35\x15\x0c\x1b\xaf\x51\xef\xb7\xa9\xf5\x39\x47\
-\x2e\x27\x11\xec\xd2\xd8\xf6\xad\x47\xe1\xcd\xf7\x8a\x3e\x1e\x47\
-\xa3\xe9\xf2\xc4\xb0\xa9\x82\x03\x66\xea\xdf\x65\xf2\xe4\xce\xfb\
-\x72\x90\x94\x74\x87\x68\x8f\x26\x06\x05\x83\x6c\xf9\x00\xe6\xe7\
-\xc2\xdf\xd9\xaf\xc2\xff\x00\x0d\xb4\xeb\x3b\x3b\x57\xbe\x9a\xc2\
-\xce\x21\x02\xed\x75\x27\xec\xbb\xdd\xc4\x41\xff\x00\x8e\x35\x66\
-\x73\x10\x50\x11\x72\x3e\x5f\x4a\xde\x27\xf8\xbf\x67\xf0\xc2\xe7\
-\xc2\xda\x4d\xf1\x86\xde\xd7\xc4\x97\x72\x5a\x25\xf5\xc5\xdc\x71\
-\xdb\x5b\x48\x12\x22\xb0\x90\xaa\x54\xcd\x22\x64\x47\x90\x8a\xdb\
-\x40\x2e\x7e\xe8\xe8\xe5\xfd\xa6\xfc\x1b\x0f\x82\x6f\x8d\xff\x00\
-\x8d\x3c\x3f\x0d\xf7\x87\x63\x92\x6d\x5e\x3d\x36\xe3\xce\x8a\xc9\
-\x57\x7e\x43\xef\x01\xc1\xee\x77\x05\xc6\x0f\xa1\xc7\xe6\x75\x31\
-\x58\xfa\xe9\xa5\x29\x59\xec\x7e\x87\x1c\x2e\x0a\x9b\xd2\x2a\xfd\
-\x43\x4c\xf8\x0d\xe1\xff\x00\x0a\x69\x5a\x5d\xbc\x5a\x7d\xc6\x97\
-\x6b\xa0\xc5\x7d\xa7\x59\x43\x65\x3c\x90\x1f\xec\xdb\xc7\x8d\xae\
-\xad\x25\xe7\xe6\x8d\x80\x5d\xa0\x30\x2a\x40\xc1\x01\x00\x3c\x7f\
-\xc0\x7f\xf8\x27\xc7\x80\x7e\x0d\xfe\xd1\xfa\x57\xc4\x9f\x06\xea\
-\xde\x36\xb5\x9a\xc6\xdd\xa2\xb4\xd0\xe6\xd6\x90\xc0\x96\xe7\x28\
-\x96\xbe\x70\x45\xb9\x58\x32\x59\x4c\x61\xc8\x65\x5d\xa7\x71\x91\
-\xb1\x63\xe2\x67\xed\xf1\xf0\xbb\xc1\x5a\x1c\x92\x5e\x78\xab\x4d\
-\xba\xd2\xae\x1b\x16\x6f\x67\x38\xb9\x32\xca\xe8\xfe\x5a\x47\xb0\
-\xb1\x6d\xcc\x98\x03\xb1\xc0\x38\xc8\xcf\x90\x45\xff\x00\x05\x77\
-\xf8\x6d\x69\x35\xbc\x96\x33\x6b\xf2\x5c\x5c\x5c\x01\xe4\xb5\x91\
-\xb5\x37\x68\xea\x70\x9b\x24\x03\x73\x2e\x32\x70\x70\x41\x5c\x92\
-\x19\x56\xbd\xec\xaf\x19\xc4\x98\x7a\x3e\xce\x8d\xdc\x59\xe4\x66\
-\x38\x3c\x86\xac\xbd\xa5\x5d\x24\x8f\xad\x3e\x33\xe9\x30\x6a\xba\
-\x87\xfa\x3d\xbc\x76\x72\x49\x6f\x04\x31\x2c\x30\x88\x52\xc4\x2e\
-\xd4\x42\x85\x54\x7c\x8b\xe5\x88\xc2\xe4\xe0\x01\x80\xa1\x89\xaf\
-\x32\xf0\x07\xed\x51\xe0\x5f\xf8\x27\xdd\xb5\xa7\x86\xbc\x7f\xa3\
-\xf8\xce\xe3\xc1\x9e\x25\xbd\xbb\x89\x35\xdb\x27\x6b\xcb\x3f\x0d\
-\xdb\xc8\xd1\xc6\xb6\x92\x46\x99\x8f\xec\xb9\x91\x95\x14\x46\xa2\
-\x34\xdc\x40\xde\x02\x8e\x6f\xc2\xdf\xf0\x53\x9f\x87\x7f\x12\x2c\
-\x2c\x6e\xa1\xd5\x2f\x23\x5b\x9b\xb8\x92\x34\xfb\x1b\x19\x8b\x05\
-\x0c\xd3\xa9\x53\x24\x7c\x26\xd1\x22\x33\x83\x1a\x86\x72\x30\x41\
-\x3e\x81\x73\xa6\xf8\x17\xf6\xb0\xf8\x43\xa9\x5a\x5a\xea\x70\xea\
-\x9a\x5f\x88\x2c\x5a\xda\xe5\x62\xb8\x0c\xc5\x1d\x03\x3a\xa2\xae\
-\x0a\xc8\x48\x25\x0b\x00\x0e\xdd\xe1\x88\x6c\xd3\xca\xb1\x98\xfc\
-\xbb\x1c\xaa\x62\x22\xec\xde\xbd\x8c\xf3\x2c\x2e\x07\x19\x84\xf6\
-\x54\x24\xaf\x6d\x0f\xd1\x4f\xd9\xeb\xc4\x51\xf8\xbb\xe0\xd7\x86\
-\xb5\x2b\x79\xae\x2e\x6d\xef\x2c\x23\x36\xd3\xdc\x33\x34\x97\x11\
-\x67\xf7\x72\x31\x60\x19\x89\x4d\xac\x49\x00\x9d\xd9\xc7\x35\xe8\
-\x50\x7f\xa8\x4f\xf7\x47\x5a\xf9\x8f\xfe\x09\xa5\xfb\x47\x5e\xfc\
-\x7b\xf8\x19\x7d\x65\xe2\x07\x59\xbc\x59\xf0\xdf\x59\xba\xf0\x6e\
-\xb5\x7b\x05\xbf\x93\x6b\xa9\x4f\x6a\xb0\x94\xba\x85\x47\xca\x8b\
-\x2c\x0f\x04\xa5\x07\x09\xbc\x8f\xbb\xb5\x9b\xe9\xc8\x0e\x61\x5f\
-\xa0\xaf\xe8\xdc\x26\x22\x35\xe9\xc6\xac\x76\x68\xfc\x56\xa5\x17\
-\x46\x6e\x93\xe8\xc7\x51\x45\x15\xd4\x40\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x54\x72\x2f\x98\xad\x52\x53\x33\x8d\xdf\x5a\x99\x6e\x1d\
-\x4f\x99\x3f\x6c\x7f\x8b\xf6\xf7\x3f\x08\xfc\x7d\x7d\xa2\xde\x5e\
-\x47\xab\x7c\x37\x49\x13\x59\xb0\x8d\x43\x49\x25\xb9\x48\xe6\x72\
-\x54\x9c\x67\xc8\x0b\x2c\x79\x23\x77\x4e\x32\x71\xf2\x1f\xc4\x9d\
-\x72\x3f\x18\xda\xea\x3a\xa4\x8c\x17\x4f\x1a\x84\x5f\x66\x95\xa3\
-\x2d\x15\xe5\x94\x9a\x6d\xac\xc9\x27\xf7\xf6\xe3\x7a\xa9\xc1\x56\
-\x64\xc6\x08\x40\xb5\xf5\x77\xc6\x1b\x36\x83\xf6\xd0\xd5\xb4\x4b\
-\x56\x3f\x67\xf1\xa7\x81\x1a\xf2\xee\x14\xb7\x52\x3c\xeb\x5b\xcf\
-\xb3\x2b\x1c\xf5\x2f\x1d\xd3\x29\xdc\x08\x22\x30\x38\x02\xbe\x0b\
-\xf0\x8d\xd2\xe9\x3f\x0e\x9b\x49\xd4\x96\xf2\xdf\x50\xd2\x2f\xee\
-\xb4\x88\x2d\x83\xbc\xc2\x6b\x5d\x36\x5b\x85\x8a\x36\x75\x0d\xe5\
-\xbc\x30\x28\xc2\xf2\xfb\x01\x8c\x6e\x55\x0b\x5f\x0f\xc4\x12\xb4\
-\x9b\x3c\xbc\x73\x77\xd0\xe8\xbf\x63\x6f\x0b\x5f\x59\xf8\x11\x7c\
-\x27\xad\x43\xf6\x3d\x4b\xc2\x77\x6f\xe1\xcb\x39\xa1\xcb\xfd\xbe\
-\xd5\x55\x1e\xd2\x68\xf2\x01\xc0\x8d\x96\x23\xb1\xb6\x23\xab\x29\
-\xda\xa5\x19\xbc\xc7\xf6\xa8\x9a\x1f\x07\xfe\xd3\xde\x29\x92\x73\
-\x35\xc6\x8f\xa7\xf8\x32\xda\xfa\xfd\xcc\x66\x34\x8a\x7b\x69\xae\
-\x77\xee\x0c\x00\x46\x68\x02\x2f\x04\x70\xaa\x0e\x0e\x19\xbd\x53\
-\xe0\x0f\x87\x24\xb2\xf8\xd7\xa9\x6b\x8b\x71\x71\xfd\x9f\xad\x68\
-\x51\x5b\x25\xac\x52\xf9\xd0\x7d\xae\xde\xe3\xfe\x3e\x24\x46\x66\
-\x58\xdd\x2d\x66\x8e\x26\x09\x80\xe1\x79\x19\x2a\xc2\xa7\x8e\xfe\
-\x12\x5b\xf8\xa7\xf6\xc9\xb0\x93\x50\x66\x8f\x4d\xd4\xb4\x4d\x68\
-\x6b\xd0\x07\xf3\xa7\xbb\xd3\xa3\x9f\x4e\xf9\x22\x52\x0b\x2b\x49\
-\x28\x82\x39\x59\x71\xfb\xb1\x20\x51\x1b\x65\x9a\xa8\xd1\xfa\xc5\
-\x24\xa5\xb5\x8e\x7a\x31\x94\xed\x0e\xe7\xa9\xfe\xc7\xbe\x13\xbb\
-\xd6\x74\x38\xfc\x7d\x7d\xa0\xc9\x67\xae\x78\xb2\xd6\xd1\x22\xb4\
-\xbc\x9b\xcd\xba\x4b\x2f\x9a\x58\xbc\xc3\xb1\x42\x49\x2b\x4a\xf2\
-\xb2\x2e\x54\xe5\x55\x8e\x14\x28\xd4\xff\x00\x82\x96\x7e\xd1\xb7\
-\xdf\x04\xff\x00\x66\xa8\xf4\xbf\x0b\xde\x34\x7e\x3e\xf8\x91\x7f\
-\x17\x85\x3c\x31\x24\x8a\x11\x6d\x24\xb8\xff\x00\x5f\x70\x41\x04\
-\xaa\xc3\x07\x99\x36\xf2\x40\x0c\x54\x29\x6c\x12\x3d\x32\xcf\xc4\
-\x52\x41\x1c\x8d\x74\x85\x61\xb8\xb9\x54\x49\x13\x73\x32\xab\xb6\
-\xf2\x14\xe3\x92\xc5\x81\x1d\x30\x0e\x2b\xe2\xef\xda\x07\xe3\x8e\
-\x93\xfb\x4d\x7e\xd0\x03\xc3\xb0\x5e\x8b\x5d\x07\xc3\x13\x4f\x61\
-\x05\xec\xa4\x46\x13\x56\x05\xd6\x50\x91\xb6\x13\x6c\x68\x93\x7c\
-\xfb\x5b\xcc\x33\x72\xc3\x8a\xf1\x71\xcd\xaa\x8e\xfa\xa8\x9f\xa0\
-\x47\x97\x0b\x83\xe5\x47\x80\x78\xfe\xc3\xc3\xbf\x04\x35\xdf\x00\
-\xf8\xc2\x1d\x42\xe3\xc5\x1a\x8f\x83\xf7\x5c\x5f\x25\xfb\xbc\x97\
-\x5a\xb5\xb9\x0d\x15\xdd\xeb\xc9\xb4\xc9\x28\x80\x4f\x24\x8c\xaf\
-\x90\xd1\xe5\x76\xec\x09\xb7\xd1\x3f\x64\xbb\x38\xf4\x1f\x87\xf6\
-\x7e\x17\x95\x16\xd6\xe3\xe1\xc9\x9f\x46\x9e\x3b\x8b\x95\x63\x14\
-\x5e\x6b\x49\x05\xc4\x78\x6c\xaa\x4f\x04\xca\xaa\x4a\x90\xcc\x8f\
-\x8e\x84\xd4\x7a\xaf\x87\xed\xfc\x78\x75\x8f\x2e\xc5\xe6\xba\xf0\
-\xad\xb0\xd2\x9a\xd2\x37\x8e\x3f\xb4\xd9\x39\x68\xe6\x97\x63\xe0\
-\xa9\x55\x62\xe0\x05\x0e\xe1\xf0\x0e\xfc\x9a\xf1\xff\x00\x0e\x7c\
-\x4d\xb8\xf0\x67\xc5\xfd\x07\xed\xd7\x96\x9a\x76\xad\xa1\xc2\x3c\
-\x19\xad\xc5\x1d\xa4\x96\xf0\x95\x85\x56\x2b\x7b\x95\x2c\xac\xcb\
-\x11\x2b\x0b\x23\x48\x0a\xaa\xcb\x31\xdc\x09\x20\x7c\xee\x73\xfe\
-\xd9\x83\x6a\x3d\x3a\x1d\x5c\x23\x99\x2a\x58\xd4\xe7\xf6\xb4\x3e\
-\xd6\x82\xde\x4d\x76\xf5\xed\xf5\x05\x6b\x8b\xa8\x42\x43\x74\xb3\
-\x47\x1a\xda\xca\xc4\x33\x63\x6e\xd6\x28\xbf\x28\xc8\xc9\x50\x46\
-\xf0\xbb\x8e\x05\xef\x14\x4d\x6b\xe2\xaf\x0a\xdd\x58\xdf\x68\xb6\
-\x7a\xc5\x8a\xc2\x86\x5b\x59\xed\x14\xc4\x8c\x01\xf9\x97\x08\xc1\
-\x36\xbe\x08\x00\xfc\x87\xe6\x07\x76\x18\x79\xef\x86\xef\xd5\x2e\
-\x65\xfe\xd0\x5b\xb8\x2e\xa6\xde\x8b\x87\x72\xa0\x2c\x62\x30\x4a\
-\x80\x72\x30\x41\xeb\xeb\x5b\xde\x24\x96\xeb\x52\xf1\x16\xdb\x32\
-\x37\x5d\x3a\xc7\x00\x07\x25\x18\xed\x67\x61\x82\xdb\x54\xfc\xb9\
-\x05\x94\xaf\x23\x6f\x18\xaf\xce\xe9\xca\x50\x8f\x21\xfb\x1d\x6e\
-\x49\xca\xfb\x10\x7c\x4e\xfd\x9d\x7e\x15\xfc\x59\xb2\x96\x6d\x7f\
-\xc1\xfe\x1d\x9e\xe9\xa2\x10\xb4\xc2\xce\x38\xe6\x40\xa8\xe0\x88\
-\x5e\x20\xae\xaa\xc1\xc1\x24\x6e\xc1\xdd\xc7\x20\xad\x2d\x63\xf6\
-\x0a\xf8\x21\xe3\x0d\x22\xf2\x6b\x3f\x0f\xda\x69\x37\xda\xa4\x31\
-\xcf\x34\x8a\xa8\x5e\x78\xe3\x04\x3f\x94\x18\x30\xc3\x28\x61\x22\
-\xa0\xdb\x28\xe0\x83\x8c\x47\xd3\x5a\x59\x43\xe2\x7d\x76\xc2\xda\
-\xc6\x4d\x3e\x26\xba\xba\xfb\x3c\x6e\x66\xdd\x6e\x0e\xc3\xf3\x4d\
-\x33\xe5\xb6\xa8\x52\x70\xac\xb8\x03\x9c\xe0\xd5\x7f\xd9\xeb\xe2\
-\x15\x9f\xc4\xef\x88\x1e\x22\xf0\xce\xb1\xa3\xea\x5a\x5e\xad\x71\
-\x61\x61\x7d\xa5\x58\x6a\xe1\x6c\x75\xad\x64\xcc\x92\x4c\xd2\xdb\
-\xd9\x48\xff\x00\xe9\x56\x8b\x1c\x76\xee\x1a\x09\x0c\x83\xcd\xd8\
-\xe8\x4c\x7b\x53\xe9\x32\x5c\xab\x34\xc6\xc7\x9f\x09\x37\x68\xff\
-\x00\x56\x3e\x73\x36\xc7\x65\xd8\x69\x28\xe2\x63\xb9\xe1\x33\xff\
-\x00\xc1\x24\x34\xfb\x2b\xc6\x9f\xc1\xba\xcb\xbd\xbb\x20\x53\x1d\
-\xfa\xcb\x6b\x79\x0c\x8d\xe5\x88\xd5\x2e\xa1\x2b\x22\xa7\xfc\xb3\
-\x39\x0c\xdc\x96\x0c\x49\x29\x47\xec\xb5\xfb\x18\xd8\xf8\x63\xf6\
-\xd0\xf0\xdf\x87\xe1\xb1\xf1\xa6\x9f\xaa\x24\x37\xfa\xcd\xbd\xca\
-\xdf\x45\x6b\x61\xe2\x29\x62\x43\x1f\xd9\x44\x84\xf9\x4f\xba\x59\
-\x57\xcc\x29\x16\xe0\xa3\x72\xc7\x8e\x47\xd4\x11\xe9\xfa\x9f\x85\
-\xad\x7e\xc7\x6b\x17\x88\x74\x28\x6f\xa7\x7f\x25\x3c\x4d\x63\x2e\
-\x9b\x3c\x92\xac\xb2\x28\xdc\x6e\x54\x44\x5f\x21\x41\xc1\xdc\x70\
-\x87\xe6\x8d\xe3\x2d\x07\xec\xb3\xf0\x27\xc6\x9f\xf0\x51\x08\xfc\
-\x3b\xe2\xbd\x7b\x45\xbe\xf0\x1f\x82\x74\x3f\x13\xe9\xde\x22\xb0\
-\xd5\xb5\x07\x8d\xb5\x0f\x15\x2d\xad\xc1\xb8\x55\x81\x21\x2a\xf0\
-\xdb\x99\x04\x67\xcc\x99\x9f\x78\xdf\x1e\x14\xe5\xcf\xd9\x65\x39\
-\x66\x6b\xf5\xb5\x4b\x15\x0b\xc7\xab\x67\xcb\xe6\x78\xec\xbd\x50\
-\x75\x30\x92\xb3\x3e\xbf\xff\x00\x82\x7f\xfe\xc8\x9a\x8f\xec\x9b\
-\xf0\x4a\xef\x4c\xf1\x06\xb1\x6f\xaf\x78\xdb\xc4\xda\x9d\xc7\x88\
-\xbc\x45\x7b\x6a\x9e\x4d\xb4\x97\xf3\x85\x3e\x5c\x5f\x20\x93\x64\
-\x69\x1a\x22\xbb\x8d\xec\x14\x96\x19\x3b\x57\xe9\x0b\x76\xfd\xda\
-\x8e\x7e\xe8\x35\xe0\x1f\xb5\x57\xed\xa9\xe1\x5f\xd9\x4f\x4e\xd0\
-\xe6\xd6\x06\xa2\xf6\xfa\xa6\xab\x69\x63\x7b\x7c\xb6\x37\x5f\x64\
-\xd1\x2d\x25\x94\xc6\xd7\x77\x17\x09\x09\x48\xd5\x1b\x85\x0e\x40\
-\x69\x25\x44\x1d\x72\x3d\x7f\xe1\x97\x8e\x57\xe2\x47\xc3\xed\x1f\
-\xc4\x31\xd9\x5c\x5a\x41\xad\x59\xc3\x7d\x04\x37\x08\x63\x99\x23\
-\x95\x15\xd4\x3a\x9e\x55\x80\x61\x90\x79\x07\x8a\xfd\x72\x8d\x38\
-\xd3\x8f\x2a\x47\xe7\x52\x97\x34\xf9\xba\xb3\xa4\x07\x22\x8a\x67\
-\x9c\x07\xad\x28\x93\x35\xb5\xd0\x87\x52\x6e\xfa\xd4\x12\x6a\x31\
-\xc7\xbb\x3b\xbe\x42\x41\xf6\x20\x67\xaf\x4e\x9c\xd7\x3b\xe3\xef\
-\x8d\x7e\x15\xf8\x59\x0c\x32\xf8\x8f\x5d\xd3\x34\x48\x2e\x33\xe4\
-\xcb\x79\x3a\xc2\xb2\xe0\x64\xe0\x93\xdb\x8e\x7a\x64\x81\x9c\xf1\
-\x40\xb9\x91\xd5\x51\x5c\xdf\x84\x7e\x2d\xf8\x73\xc7\xda\x72\xdd\
-\xe8\x9a\xc5\x86\xad\x03\x22\x38\x6b\x49\xd6\x66\xc3\xa7\x98\x9f\
-\x2a\x9d\xdf\x34\x79\x75\x18\xc9\x5e\x46\x6b\x79\xaf\xa3\x55\x2d\
-\xbb\xe5\x53\x82\x41\x07\x14\x94\x93\xd8\x69\xdf\x62\x6a\x2a\x13\
-\x78\xa3\x1f\x2b\x93\xb8\x29\x00\x7d\xdc\xe3\xaf\xd3\x22\xa4\x8d\
-\xfc\xc8\xd5\xb9\x1b\x86\x79\xa6\x03\xa8\xa2\x8a\x00\x28\xa2\x8a\
-\x00\x28\xa2\xab\x3e\xa6\x89\x2b\x2e\xc9\x3e\x5c\xee\x38\xc0\x1e\
-\xe7\xd8\xe0\x8c\xf4\xe3\xe9\x90\x0b\x34\x55\x55\xd6\x21\x64\x56\
-\xcb\x7c\xd8\xe0\x2e\xe2\x01\xcf\x3c\x76\xe0\xf3\xd0\xd2\x8d\x52\
-\x33\x8f\x96\x4e\x79\xe9\xc0\x00\xe0\xe4\xf4\xe3\xd3\xad\x4f\x34\
-\x7b\x81\x39\x7c\x1c\x52\xee\xfa\xd5\x49\xb5\x38\x55\x97\x93\x93\
-\xd0\x11\xb4\x93\x81\xc7\x38\xe7\x9e\x9f\x5f\x4a\xc5\xf1\x97\xc6\
-\x1f\x0d\xfc\x3c\xd2\x6e\x35\x0d\x77\x5a\xd3\x34\x6b\x1b\x54\x2f\
-\x24\xd7\xf7\x51\xda\xaa\x00\x09\x39\xf3\x19\x71\xc6\x0f\x38\xfb\
-\xc2\x89\x54\x8a\x57\x6c\x9f\x69\x1e\xe7\x49\xbe\x97\x77\xb1\xaf\
-\x08\xf0\x87\xfc\x14\x8b\xe0\xff\x00\xc4\x4b\x3d\x5e\xeb\xc3\xde\
-\x26\xb8\xd7\x2d\x74\x49\x12\x3b\xa9\xec\xb4\xbb\xa9\x22\xdc\xc3\
-\x3f\xbb\x6f\x2c\x09\x40\x5c\x31\x31\xee\x18\x23\x9c\xf1\x5a\x1a\
-\x57\xed\xf1\xf0\xc3\x54\xbb\x78\x5f\xc4\x0d\xa6\xcd\x08\x1b\x93\
-\x52\xb4\x9a\xcb\xe6\xc6\x4a\x03\x2a\xa8\x2e\xb9\x01\x94\x12\x41\
-\x60\x31\x93\x8a\xe7\x78\xca\x0b\x79\x22\x7d\xb4\x2d\x7b\x9e\xc6\
-\xf7\x69\x18\x39\xf5\xc6\x32\x3a\xfd\x7a\x54\x8a\xdb\xd4\x1f\x51\
-\x9a\xf9\xd2\xfb\xfe\x0a\x3f\xf0\xce\x0f\x8b\x32\xf8\x6e\xdf\xc4\
-\x96\x37\x9e\x4c\x2c\x6f\x2f\xa0\xba\x59\x13\x4d\x93\x0a\xe8\x25\
-\x87\xef\xec\xd8\xc0\x99\x14\x30\x5e\x37\xed\xc8\x27\xde\x2c\x3c\
-\x57\x61\x77\xa5\x45\x75\x6f\x32\xdc\x5a\xb0\xf9\x65\x8c\x87\x42\
-\xa0\x02\x5b\x70\xf9\x48\x03\x9c\x83\xce\x0e\x33\x5b\x42\xb5\x39\
-\xeb\x16\x54\x6a\x46\x5f\x0b\x35\x09\xc5\x37\xcd\x19\xf5\xfa\x54\
-\x60\xf9\xe9\xce\xe1\x9e\xc7\xb5\x3a\x08\x3c\x95\x23\xae\x6b\x42\
-\x89\x01\xcd\x14\x01\x81\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x15\x19\xfb\xc7\xeb\x52\x53\x18\x60\xd6\x75\x3a\x09\x9f\x3b\xfc\
-\x5d\xd3\x23\xb1\xfd\xb6\x34\x2d\x5b\x6c\xcb\x2c\xfe\x10\xb9\xd3\
-\xe4\x9c\x37\xca\x9f\xf1\x31\xb4\x68\xd7\x1d\x79\xde\xf9\x20\x74\
-\xc5\x7c\x49\xf1\xdb\xc7\x1a\x7d\x97\xc7\xbf\x11\x7c\x3c\xb2\x8f\
-\xc9\xd5\xa7\xf8\x9f\x71\x2c\xb6\xc9\xe5\x9b\x88\x6c\x64\xd2\x96\
-\xea\x59\x30\x18\x14\x1b\xa6\x6d\x92\x90\x72\xf2\x15\xe4\x90\x0f\
-\xda\x3f\xb5\xdd\xa0\xd0\xbe\x37\x78\x23\xc4\x90\xdc\x5c\x2d\xc5\
-\xc6\x9d\xa9\xe8\x91\xa8\x52\xd1\x34\x9b\xed\xaf\x39\xc7\x57\xd9\
-\x69\x28\x03\xae\x03\x81\xc8\xc5\x7c\x45\x26\xab\x63\xe3\x4f\xda\
-\xab\xe2\x27\x8d\x62\x82\x1f\xb5\x5e\xeb\x36\x5a\x44\x32\x5b\xc6\
-\x25\xb8\x99\xb4\xdd\x3d\x6d\xe5\x8f\xce\xe8\xd0\x8b\xa9\xdd\x15\
-\x73\xf3\x49\x04\x9c\x93\x8c\x7c\x7f\x10\x5a\x30\x9b\x91\xe7\x62\
-\x95\xd9\x93\xf0\x84\xa6\x91\xfb\x4f\x68\xfa\x7a\xb5\xe4\x6b\xe2\
-\x3f\x0d\x5f\x46\xe8\xe8\x3e\xcb\x24\x96\xb7\x91\xcf\x0e\xd4\x52\
-\x08\x6f\xdf\x5c\x82\xd9\x1b\x89\x20\x1d\xc0\x30\xf5\xcf\x87\x6f\
-\xa5\xdf\xfc\x46\xf1\x9c\xd7\x52\xd9\x5e\x6b\xd6\x3a\xed\xb7\x84\
-\xe3\x46\x4d\xd7\x1a\x64\x10\xda\x47\x7e\x91\x80\x76\x79\x8b\x3c\
-\xd7\x5e\x61\x08\x4a\xb2\x24\x49\xb9\xb6\xd7\x0f\xf0\x83\xc1\xb7\
-\x07\xf6\x9c\xd0\x64\xd4\xb7\xa0\x10\x79\x36\xa0\x33\x48\xb3\x9b\
-\xa8\x6e\x98\x46\xcc\xb2\x28\x04\xa4\x12\x9c\x14\x2a\xdf\x20\x0d\
-\xbb\x71\x1d\xff\x00\xec\x5d\xa5\x41\xe3\x3f\x0a\x78\xcb\xc5\x4f\
-\x0b\x7d\xb3\x52\xf8\x87\xe2\x59\xa6\xfb\x43\x08\x8d\xe2\x41\x7a\
-\xb6\x71\x06\x41\xd1\x7c\xab\x60\x8a\x40\x20\xaa\xe0\x6e\x5c\x01\
-\xc3\x83\xa9\x25\x83\x73\x4f\xa1\xe9\x64\xf4\x63\x2a\xd1\x4c\xe9\
-\xfe\x21\xf8\xcd\x7e\x1c\xfc\x3c\xd6\xbc\x45\x32\x5a\xd8\xae\x87\
-\x69\x25\xf4\x6f\x73\xb9\x63\xb7\x30\xc6\xf3\x02\xc1\xb0\xdb\x41\
-\x18\x72\x14\x95\x55\xce\x0e\x0e\x3f\x30\x3c\x59\xe2\xdd\x07\xc3\
-\xde\x30\xf0\x56\xb5\x6b\xa9\xe9\x50\xf8\x5e\xcf\xc4\x53\x35\xd4\
-\xb6\xc4\x89\x2d\xe4\xbd\x8b\x6a\x2a\xb8\x2c\x24\x24\x30\x79\x24\
-\x04\x95\x0f\xf2\x90\x32\xa3\xef\x9f\xf8\x2a\xcd\xdb\x78\x6b\xf6\
-\x2a\xf1\x95\xbc\x37\xd7\x1f\x6a\xd5\x96\xce\xc2\xcd\x52\x24\x32\
-\x7d\xa2\xe2\xe1\x61\x88\x79\x4f\x9d\xc4\x19\x18\xfd\xd2\x46\xe0\
-\x41\x56\x01\x97\xf3\xf7\xc7\x5f\x0e\x2d\x63\xb6\x6d\x36\xd7\x4b\
-\x9a\x6b\x14\x0e\xd3\xe9\x64\xc9\x24\x6b\x6a\xe9\xfb\x90\x02\x9d\
-\xf8\x0b\x80\xb2\x85\x04\x02\x33\x9c\x57\x93\x4a\x77\x8d\xe7\xd7\
-\x43\xd6\xcf\xeb\x72\xc9\x53\x8f\x43\xd7\x3c\x2b\xe3\x39\x2e\xf4\
-\xeb\xe8\xb4\x1b\xcb\x15\xd7\x9b\x53\x97\x50\x6b\x7b\x19\x43\x34\
-\x50\xc7\x86\x56\x57\x2a\x48\x64\x08\xec\x51\xb8\x0c\xd9\xe0\x9c\
-\x0e\x77\xf6\x91\xf8\x13\x0e\xbf\xe0\x50\xcf\x0c\x36\xda\x84\xb7\
-\x45\xda\xee\x38\x84\xb3\x2c\xed\x1a\x16\xb7\x69\x54\x33\x79\x2d\
-\xb0\x3f\x1b\xcc\x4c\x8b\x22\x82\xdb\xf7\x79\x37\xc0\x5f\x89\xad\
-\xf0\xe7\xc7\xba\x5f\x87\xfc\x43\x3d\xd5\xaf\x88\x16\x3b\x8b\x7d\
-\x36\xea\xeb\xcb\x99\xb5\x08\xe4\xb8\x57\x88\x2b\xc6\x7f\x79\x33\
-\xc7\xe5\x86\x57\x01\xfe\x52\x70\x54\x96\xaf\x7f\x9b\xc3\x76\x7a\
-\x86\xb5\xa7\xcb\xfd\x87\x65\x6d\xa5\xb8\x69\x19\x95\xdd\x23\xd8\
-\xe9\x2c\xbe\x73\x3c\x67\x6c\x9b\xae\x18\xb9\xda\x03\x06\x6c\x6f\
-\x2b\x82\x7c\xdc\x45\x07\x46\x57\x5b\x33\xc9\xc2\x56\x71\xb4\xa2\
-\xf5\x24\xb9\xf8\x9b\xa6\xf8\x4f\xc2\x7a\x2e\xa9\xe2\x29\xa4\xb6\
-\x97\x56\xb3\x76\x8a\xe6\x6b\xa1\x25\xa4\xd8\x05\x46\xdb\xc4\xc4\
-\x0c\xcc\xc0\x63\x25\x0b\x75\xda\x33\x8a\xea\xae\xbf\x68\x5f\x0d\
-\xf8\x46\xf6\x4d\x47\x57\xd6\x34\xd5\xd2\x2d\xa2\xd9\x2c\xb7\x17\
-\xe8\xb1\xc3\xb5\x63\x21\xc0\x73\x9c\x00\x47\x05\x77\x1c\x8c\x29\
-\xc8\xcf\x2b\xe2\x1d\x13\x45\xbf\xf0\xbe\xad\xa1\x43\x6b\x79\x6b\
-\x67\x73\x63\x22\xb8\x8e\x72\xcd\xac\xc6\x72\x8c\x64\x85\xf0\xb2\
-\x92\x08\x38\x50\x5b\x6f\xcc\x01\x26\xb9\x8b\x7d\x0a\x6f\x84\x4f\
-\xf6\x2d\x32\xc7\x4d\xbd\xf0\xbe\x9f\x73\x61\x78\x20\xb7\xd1\x6d\
-\xe4\x98\xcc\x8f\x28\x49\x82\x6c\x77\x42\xa0\x93\xb8\xe0\x8d\xc5\
-\x47\x96\x37\x6e\xf2\x7f\xb1\xf0\xf5\xaa\xa9\xcb\x4f\x23\xed\x28\
-\xf1\xa5\x6a\x34\xbd\x94\xd5\xfc\xcf\x67\x5f\x8d\x5a\xe5\xbf\xc3\
-\xff\x00\x09\xf8\xb3\x45\x9a\xc7\x41\xf0\xbf\x8a\x2f\x2d\x22\xb2\
-\xd7\x35\x3b\x75\x87\xfb\x62\x09\x24\x8d\x5e\x3d\x3e\x26\x2a\xbe\
-\x64\x91\x48\xc4\xcd\x24\x64\x46\xb1\x3b\xa4\x72\x0d\x81\x7f\x53\
-\xb5\xff\x00\x83\xfe\x03\xf8\xe3\xe0\x35\xf0\xde\xa5\x63\xe1\xff\
-\x00\x10\x78\x6a\xc5\x7e\xcf\x6d\x69\x14\x51\xac\x7a\x74\xb1\x0f\
-\x2d\x7c\x8f\x2c\x83\x6f\x24\x44\x60\x14\x2a\xe8\xe4\x10\x57\x6a\
-\x85\xfc\xb9\xf8\x55\xff\x00\x13\xaf\x82\xfa\x97\x82\x7c\x3d\xa5\
-\xdb\xc2\xde\x0e\xba\xb9\xd2\xf4\xdd\x3b\x55\x63\x0c\x16\xf1\xce\
-\xab\x7d\x6a\x8e\xd0\xae\xe8\xe0\xdd\x78\xc3\x8e\x51\x40\xda\x14\
-\x72\x74\xad\x2c\x7e\x20\x3f\x81\xf5\xa9\xbc\x71\x75\xf0\xf7\xc3\
-\x3a\xab\xca\xc6\xf6\x71\x2d\xc5\xdd\xa0\xb4\x0b\xf3\xb5\xde\x3e\
-\xcc\xac\x41\x48\x8a\x90\xea\x80\x96\xdd\xb4\x15\xcf\xd2\x64\x19\
-\xe6\x1f\x2d\x73\xc3\xd3\x8e\xb7\x3a\x33\x1c\xb6\xa6\x63\x46\x18\
-\xbe\x6d\x2c\x7d\xed\xe3\xef\x83\x17\x1f\x0d\xbf\x67\x5d\x73\x49\
-\xd1\x74\xfd\x53\xe3\x0f\x87\xff\x00\x78\xef\xe1\x6d\x76\xfa\x3b\
-\xeb\xab\xdd\x3d\x87\x36\x56\x77\x33\xb4\x6d\xbb\x72\x61\x3e\xd3\
-\x2c\x84\x95\x5f\x9c\x00\xa0\x7c\x87\xfb\x00\xfc\x7b\xb8\x86\xc3\
-\xc3\x3e\x05\xd2\xee\x27\xf1\x47\x82\x74\x8d\x16\xea\x7f\x86\xfe\
-\x0a\xbd\xb7\x87\x4b\xf1\x16\xa7\xf6\x49\x12\x2d\xf7\xc0\x4a\x63\
-\x30\xc6\x6e\x5d\x15\xa5\x01\x24\x4b\x61\x39\xde\xed\x5e\xd1\xfb\
-\x1c\x6a\x3a\x6f\xec\xe5\xff\x00\x04\xf6\xf1\xc7\xc4\x2b\x39\x6f\
-\x7f\xb3\xe1\xb0\xd4\xfc\x4d\xe7\x4d\xa7\x4d\xa6\xda\x4e\x96\xd6\
-\x65\x84\xb0\x5b\x4a\xcd\xb2\x16\x28\x00\x04\x1f\x30\xe5\xc0\x00\
-\xe6\xa4\xfd\x9a\x7e\x1d\xe8\xbf\x08\x3c\x5f\x6b\xfd\xa5\x79\x0e\
-\x99\x6b\xf0\x9f\xe0\x86\x87\x63\xaa\xdc\xc4\xfb\x66\x89\x6e\x25\
-\xba\xb8\xbb\x95\xc8\x42\xc0\x28\xb0\x59\x41\x50\x1b\x74\xa7\x6e\
-\x39\x35\xfa\xa6\x0e\xb4\x6b\xd2\x55\xf9\x6c\xd9\xf0\x58\x8a\x72\
-\xa7\x27\x4d\x3d\x11\x27\xed\x7d\xf1\x87\x4b\xd6\xff\x00\x63\xef\
-\x1e\x7c\x57\xf0\x67\x8d\x34\x1f\x17\x78\xd3\x45\xd0\x27\xd1\xb4\
-\x37\xd2\x75\x31\x75\xa3\xe9\x5a\x85\xd3\x1b\x50\x52\x25\x93\x6f\
-\x9b\xe6\x32\xa7\x9b\x39\x24\xed\x24\x00\x84\xc6\x7e\x8a\xfd\x93\
-\x7e\x31\xe8\xff\x00\x18\xff\x00\x67\x5f\x08\xeb\xda\x62\x5f\xda\
-\xc1\x3d\x82\xdb\x49\x6d\x7e\x23\xfb\x5d\x84\xf6\xec\xd6\xd3\xc1\
-\x3f\x94\x4a\x09\x22\x9e\x19\x63\x7d\xbf\x28\x74\x20\x76\x15\xf9\
-\x95\xe3\x7f\x85\x77\xda\xcf\xc3\x2d\x1d\x2d\x9a\xfb\xc6\x5e\x13\
-\xd5\x21\xff\x00\x89\xee\x8f\x70\xe8\x3c\x53\xa1\xc5\x7f\x72\xde\
-\x4e\xa5\xa7\x5f\xdb\xac\x2d\x3d\x9c\x9b\xbc\xf5\x8e\xe2\x20\x63\
-\x46\x2a\x1d\x59\x1a\x21\xee\x9f\xb1\x97\x89\xbc\x51\xf0\x7f\xf6\
-\xff\x00\x4f\x0d\xdd\x6b\x97\x7a\xb7\x86\x3e\x23\x78\x62\x4b\xad\
-\x40\x3d\x8c\x6b\x15\xee\xbf\x67\xe4\xac\xfa\x89\x31\xe1\x23\x96\
-\xe2\x06\x55\x98\x46\xbb\x24\x78\x91\xf6\xab\x6e\x2d\xe1\xd5\xe2\
-\x4a\x51\xc5\x7d\x5a\x7a\x33\xd3\xa3\x92\xd4\x96\x1b\xeb\x2b\x63\
-\xf4\x36\x3f\xde\x22\xb7\xf7\x86\x79\x04\x1f\xc8\xd4\x7f\xda\x11\
-\xa3\x48\xb9\x2c\xd1\x9c\x10\xa3\x71\x1c\x64\x74\xe9\x9e\xd9\xeb\
-\xdb\xb5\x02\xed\x61\xc2\xe1\xf8\xe0\x1c\xe7\x27\x81\xf5\xe4\xf1\
-\xcf\xa1\xaf\x8e\x3e\x31\xff\x00\xc1\x46\xf5\xbf\x87\x9e\x21\xf1\
-\x86\xbd\x63\xe1\x7b\x1d\x5b\xe1\xe7\x84\xe3\xbb\x1e\x71\xbe\x7b\
-\x7d\x57\x58\xfb\x3d\xbb\xdc\x4b\x73\x6c\x0c\x66\x05\x80\x38\xfb\
-\x38\x49\x19\x5e\x5d\xaf\x32\x36\xd5\x05\xbd\xaa\xd8\x8a\x74\xbd\
-\xea\x8e\xc8\xf2\x7d\xa2\x84\x7d\xe3\xe9\xbf\x8a\xde\x39\x1e\x00\
-\xf0\x17\x89\x3c\x41\x1d\xad\xc6\xa4\xda\x1e\x99\x71\xa8\xfd\x92\
-\xdd\x87\x9d\x7e\x20\x8e\x49\x44\x51\x31\xe3\x24\x82\xb8\x3c\x83\
-\x8c\xfc\xa4\x1a\xfc\xd0\xfd\x90\x6d\x7f\x69\x1f\x84\xff\x00\xb4\
-\x3c\xda\xc7\xc6\xab\x8d\x23\xe2\xb7\xc1\x5d\x6a\xda\x59\x60\xd6\
-\x6c\xbc\xbf\x11\x5d\x5a\xcd\xf6\x88\x0d\xbc\xaf\x1c\x68\xd3\x2c\
-\x91\x2b\xf9\x72\x18\xcf\x93\xb6\x37\x31\xa9\x38\x91\xed\xfc\x70\
-\xfd\xb5\x6f\xbe\x2c\xb6\xa1\x6e\xba\xd5\xbe\xad\xa1\xf8\x92\x46\
-\x67\x4f\x34\x79\x30\xc1\xb4\xc6\xb6\x6c\x12\x56\x8d\xe3\x0b\x23\
-\x67\xab\x39\x91\xcb\x12\x36\xa8\xe6\xfc\x21\xa7\xde\x5b\xe9\x36\
-\x70\xe8\x7a\xba\xc3\x6f\x67\x82\x96\xb0\x84\x48\x61\x3b\x88\xca\
-\xc3\x1a\x85\x8c\x0d\x85\x00\xda\x17\xbe\x40\xc1\xaf\x87\xcd\x38\
-\xf2\x96\x16\x4e\x34\x20\xdf\x99\xe5\xd6\xcc\x92\xd2\x28\xda\xff\
-\x00\x86\xbc\x4f\x80\x7f\x1f\xb5\x8b\xdf\x85\xba\x5e\xb9\xae\x69\
-\x2b\xa9\xc0\xb0\x68\xf3\xe9\xed\x66\x05\x8b\xcc\x82\xe6\x18\xfc\
-\xc5\x4f\xb8\xf2\x4b\x3c\x51\x36\xdc\x07\x69\x17\x7c\x78\xc7\xdf\
-\x7e\x10\xfd\xa7\x66\xf8\x91\x36\x97\x17\x87\x7c\x23\xe2\x06\x86\
-\xf3\x4b\x1a\x9c\xd7\x3a\xb4\x52\x58\xda\xda\x96\x69\x23\xfb\x30\
-\x91\x55\xcc\x97\x02\x48\xd8\xba\xa8\x60\xa9\x87\x2d\xb5\x81\x3f\
-\x9e\x57\x5f\x0e\x21\xd2\xe2\xfb\x43\x28\xbb\x91\x62\x30\xc6\x62\
-\x61\x27\x9a\xc5\xff\x00\x78\x03\x1d\xc1\x94\x2a\x82\x18\x9f\xbd\
-\xb4\xe3\x6e\x54\xe6\xfc\x5e\xfd\x8b\x7e\x35\xfe\xd2\x3a\x5f\x83\
-\xfe\x33\x7c\x0e\xf1\x86\xb3\x0d\xfe\x96\xcf\xa6\x78\x9b\xc1\x57\
-\x9e\x25\xd4\x34\x98\xae\x65\xb6\x90\x21\x36\x4f\xe6\x15\x89\x5d\
-\x22\x8d\x82\x65\x63\x04\x89\x11\x9b\xcc\x65\x0f\x83\x78\x8a\x79\
-\x8d\x49\xaa\x9a\x13\x81\xc5\xca\xa4\x9a\x3e\xf6\xf0\xe7\xed\xd7\
-\x07\x83\x7c\x55\x69\xa0\x7c\x4b\xd2\xe3\xf0\xbe\xb5\x70\x23\x0f\
-\x77\x6d\x70\x2e\x34\xc4\xdf\x3c\x90\xa4\xa6\x56\xda\xeb\x6f\x24\
-\x89\x1c\x49\x3b\xc6\xa8\x5c\x85\x62\x85\x80\x3f\x46\x2e\xa0\x85\
-\x57\x22\x45\xce\x06\x59\x0a\x8c\x9c\x7a\xfd\x6b\xe1\x7d\x56\xcf\
-\xc5\x3f\x14\xfe\x11\x7c\x39\xb8\xf8\xb9\xe1\x7d\x27\x47\xf8\xb3\
-\xa8\x41\x75\xe1\xcf\x16\xe8\x72\xfd\x9a\x6b\x6d\x73\x49\xf3\x61\
-\x1a\x85\xc1\x2a\x31\x2d\xbb\xdb\xaa\xbb\x2a\xfc\xa0\x4a\xe0\x00\
-\xca\x0a\xfa\x9f\xfc\x13\x57\xf6\x98\xb1\xf8\xf5\xfb\x31\x69\xfa\
-\xa2\xdf\x69\xcd\x0e\x95\xac\x5f\x78\x66\xda\x48\x81\x43\x73\x1d\
-\x95\xcb\xc3\x10\x78\xd9\x99\xfc\xd6\x89\x10\xfc\xd8\x63\x90\x71\
-\x86\x52\xdf\x73\x19\x5a\xab\x83\x3d\x58\xcd\xde\xcc\xfa\x76\x8a\
-\xcf\xb5\xd7\x2d\xbc\x84\x55\x6d\xaa\xaa\xbf\xc6\x1b\x00\xf4\x3d\
-\x7a\x74\xe7\xa1\xc8\x3d\x2a\xd1\xbf\x8c\x20\x63\xb9\x73\xfd\xe1\
-\xb7\xf0\xe6\xb6\xe6\x46\xbd\x2e\x4d\x45\x46\xb3\xee\x5e\x86\x8f\
-\xb4\x0f\x46\xa3\x99\x0a\xeb\x70\x96\xe9\x62\x52\xd8\x62\x17\x93\
-\x8e\xde\xbc\x75\xaf\xcb\x7f\x11\x7f\xc1\x61\xfc\x65\xfb\x45\xfc\
-\x55\xf1\x95\xbf\xc3\x4b\x7d\x3b\xc0\x7e\x07\xf8\x77\xe2\x09\xf4\
-\x5d\x4f\x51\xd7\x61\x89\xb5\x4d\x5e\xf2\x19\x49\x61\x04\x64\xf9\
-\x6b\x03\xa4\x6c\x5b\x78\xf3\x3e\x41\xb5\xcb\x16\x41\xfa\x80\xd6\
-\xbe\x64\x8c\xd8\x56\x05\xb7\x1c\xf0\x49\x05\x4a\xf3\xdb\x18\x3c\
-\x77\xaf\xcf\x3f\xdb\xc3\xf6\x56\xf0\x47\xec\xdb\xfb\x4f\xe8\x7f\
-\x17\xc7\x86\x5b\x50\xf0\x97\xc4\x4d\x52\x1d\x0b\xc6\x9a\x44\x71\
-\xaa\xe9\x49\xaa\xc9\x24\x67\x4d\xd6\xa6\x8b\xee\x65\xae\x23\x5b\
-\x79\xce\xc3\xe6\xfd\xa2\x00\xe4\x05\x3b\xb9\x31\xf1\xab\x2a\x0f\
-\xd8\xbb\x33\x3a\x90\x73\x5c\xb1\x67\xcc\xbe\x1a\xf8\xbf\x7d\xe3\
-\x29\x35\x28\xef\x3e\x2c\x78\x93\xe2\x34\x7a\xa2\x31\xbc\x4b\xaf\
-\x16\xfd\xa0\xb0\xc4\x8c\xea\x91\x44\x63\x82\x2d\x99\x6c\x01\x1f\
-\x00\x01\x9e\xd5\xe9\x1e\x1b\xd5\x2f\x75\x2d\x33\xfb\x1e\xeb\x5a\
-\xf1\x75\xd5\x8b\x37\x91\xe5\x58\xeb\xd7\xb6\xf2\x43\x14\x40\x2a\
-\xe6\x48\x5d\x5d\x8f\xc9\x07\xc8\x5b\x69\x2a\x57\xae\x45\x7a\x3f\
-\xed\x33\xf0\x4f\xe1\xbf\x8f\x3e\x1c\xea\xb6\xfa\x8f\x86\xf4\x9d\
-\x3e\x18\xe1\x85\x8c\x96\x5a\x7c\x56\xf7\xf0\x31\xce\xd3\x09\x8c\
-\x09\x04\xd1\x49\x23\x32\x60\x9c\x17\x3f\x2c\x83\xa7\xcf\xdf\xf0\
-\x4f\xff\x00\xd8\xcf\x47\xf8\x81\xfb\x6e\x37\x82\x7c\x67\x73\xad\
-\x5e\x78\x6a\xc3\xc2\x17\x7a\x85\x8e\x97\x6b\xa8\xdd\x5b\xda\xc5\
-\xa8\x43\xa9\x5a\xab\xca\xac\x92\x87\x9e\x22\x1d\xdf\xc9\x9b\xcc\
-\x44\x69\x08\x20\x82\x09\xfc\xf2\x86\x57\x5e\xbd\x4b\xfb\x57\x7b\
-\x9c\x95\xb2\x9a\xcb\xde\xe6\x37\xbc\x75\xe2\xdf\x11\x78\x6f\xc6\
-\x92\x68\xba\x0e\x87\xe2\xff\x00\x89\xde\x22\xd5\x9d\xef\x35\x2d\
-\x3b\x49\xf1\x7e\xa2\xef\x06\xd5\x28\x04\x90\xa3\xcc\xca\xa4\xb3\
-\x80\x55\x42\xfc\xdc\xb2\xe2\xb4\x7c\x4d\xfb\x3b\xfc\x58\xf1\xe7\
-\x84\xf4\xab\x8b\xaf\x82\xda\xaf\x85\x7c\x55\x16\xa7\x65\x72\x86\
-\xfe\x3b\x7f\x12\xc8\x96\x51\xc9\xb6\x5d\xa5\xcb\x24\x2f\xe5\x90\
-\xca\x44\xbe\x61\x20\x13\xe5\xb6\x4d\x7e\xa5\xf8\x17\xe1\x86\x89\
-\xf0\xe7\xc3\x36\x7a\x5f\x87\x74\x9d\x1f\x41\xd2\xad\x63\x54\x82\
-\xcf\x4e\xb4\x8a\xde\xde\x24\x03\x20\x24\x71\xa2\xc6\xa3\x3c\x70\
-\xbd\x31\x5a\xdf\xd8\xdb\x00\x55\x61\x1a\x73\x90\x84\xa7\x55\xc7\
-\x63\x8f\x4e\xbf\x9d\x7d\x65\x2c\x91\x46\x29\x55\x93\x65\x47\x06\
-\xad\x69\x3b\x9f\x8c\xbf\x11\x7e\x2c\xfc\x43\xf8\x39\xe1\xe3\x2e\
-\xa7\x17\x8a\x34\xbb\xe6\x68\xed\xad\x6d\x64\xf0\xcc\x69\x36\xa1\
-\x3c\xcd\xb7\x62\x89\xa6\x3e\x62\xee\xe8\xbe\x72\x04\x66\x5d\xc0\
-\x29\x52\xde\x67\x71\xfb\x42\xf8\xd3\x43\xd1\xad\xfc\x5d\x78\xde\
-\x34\xf0\xbe\x8f\xbe\x29\x4a\xcd\x70\x9e\x28\xb7\x8a\x19\x6e\x0e\
-\x56\xe2\x34\x0b\x3d\xb4\x60\x95\x79\x1e\x06\x91\x55\x8b\xa6\xd0\
-\x03\x06\xfd\x55\xff\x00\x82\xb1\x5b\xe8\x4b\xfb\x06\xfc\x42\xba\
-\xf1\x35\xc6\xa5\x63\x6b\x69\x14\x12\xd8\x5c\x69\xf6\xcf\x35\xca\
-\xdf\x8b\x94\x5b\x15\x48\xd4\x82\xdb\xee\x9a\x24\xe3\x19\x12\x11\
-\x9e\x8f\x5f\x06\xfc\x0c\xf8\xb7\xa3\x7c\x46\x69\x34\x9d\x26\xea\
-\xf6\xc6\xfb\x41\x36\xf6\xf7\xb1\x3b\x2c\x03\x4c\x98\xc0\xb3\xba\
-\x39\x74\x0b\x14\x88\xd2\x00\x77\x22\x0f\x95\xa3\x65\x65\x0b\x5e\
-\x0e\x71\x82\x8e\x09\xaa\xb1\xbb\x5d\x4e\x1a\xf8\x77\x0d\x21\x73\
-\xcb\x2c\xec\xf5\xeb\xfb\xfb\x5d\x52\xd7\xc4\xda\x8d\x86\x9f\xa9\
-\x86\x1a\x7f\x89\x7c\x31\xa9\x8d\x67\x44\x17\x73\xe0\xc5\x34\x91\
-\x5c\x06\x96\x39\x37\x3c\x8a\x82\x39\x16\x29\x01\x31\xab\x07\xda\
-\xd5\xef\x1f\xb3\x97\xed\x61\xe2\x0f\x87\x9e\x3b\xb1\xd1\xef\x3c\
-\x47\xa7\x69\x3a\x96\xa8\x2e\xee\x2c\xb5\x7b\x08\xe6\xfe\xc5\xbe\
-\xfb\x3e\x1e\xe1\xae\xac\x65\x73\x35\xbc\x71\x46\x47\x9a\x65\x28\
-\x42\xbe\xe8\xe4\x0d\xf7\xba\x4f\x83\xff\x00\x0b\xfe\x1a\xf8\x7b\
-\x59\xba\xb7\xf1\xc7\x83\x3c\x2b\xab\x78\x6e\xf2\x79\x6e\x35\x3d\
-\x56\xc6\xd1\xed\xe6\xd1\x66\x95\x94\x4b\x75\x34\xd1\x32\xc9\x2d\
-\x8c\xce\x8a\x64\x07\xcc\xfb\x34\x8f\xcb\x08\x25\x02\x3f\xd1\xfb\
-\x2f\x0a\x68\x96\x77\xd2\x6a\xd0\x58\xe9\xb1\x5f\x4e\xa8\xdf\x6c\
-\x86\x08\x52\x69\x00\x56\x0a\xde\x67\x42\xb8\x21\x54\x1c\x80\x71\
-\xd7\xad\x7a\x59\x4e\x0e\x96\x22\x2b\x11\x4e\x7a\x76\x3a\x30\xd4\
-\x5b\x8a\xb3\x2b\x7c\x04\xf8\xac\x7e\x31\xfc\x19\xf0\xcf\x8a\x64\
-\xd2\x6f\xb4\x49\x35\xed\x36\x1b\xe7\xd3\xee\xa3\x64\x9a\xd0\xba\
-\x82\x50\x86\x0a\xdc\x12\x40\xdc\xaa\xd8\x1c\xaa\x9c\x81\xdb\xa9\
-\xdc\xa0\xfb\x55\x18\x2d\x8a\x27\x0a\xdc\x85\x1c\x93\xc0\x07\x24\
-\x0c\xf3\x57\x63\xcf\x96\xb9\xeb\x8e\x6b\xeb\x61\x15\x1d\x11\xea\
-\x59\xa5\x66\x3a\x8a\x28\xab\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa6\xb9\xc9\xa7\x53\x08\xc9\x35\x15\x36\x03\xc6\xff\x00\x6c\x5f\
-\x02\x5f\x78\xc3\xe1\x92\x6a\x5a\x3d\x9a\xea\x1a\xef\x84\xb5\x5b\
-\x5f\x10\x69\x91\x34\xfe\x57\x99\x25\xbb\xed\x95\x55\xc7\x31\xb1\
-\x85\xe6\x4d\xd8\x24\x6f\x3e\xb5\xf9\xd5\xf0\xcb\x4b\xfb\x27\x87\
-\x35\x23\x79\x25\xbc\x97\x8d\xab\xeb\x31\xc9\x25\xb2\x19\x21\x69\
-\xd3\x57\xbb\x50\x51\xd4\x2a\xaf\xde\x52\xdf\xdd\x23\x69\xda\xc3\
-\x27\xf5\x83\xc5\xf6\xb2\x5f\x68\x37\xd0\x43\x99\x24\x9a\x26\x8d\
-\x53\x7e\xdd\xcc\xeb\xb5\x41\x38\xe0\x73\x5f\x96\xb6\x3f\x12\x34\
-\x1f\x14\xe8\x6f\x36\x8b\x1b\x45\x6a\xd7\x97\x52\xb4\x77\x00\x59\
-\xcd\x76\xc6\xe2\x45\x24\x8d\xc3\x2a\x65\x56\xd8\x70\xa5\xf8\x3b\
-\xf9\xc5\x7c\x57\x17\x5f\xd9\xdd\x6c\x71\xe2\x22\xae\x8f\x48\xfd\
-\x9f\xaf\xe0\xd4\xbc\x73\xa8\x5e\x4b\x1a\xde\x4f\xe2\x4f\x18\x5d\
-\x68\xc9\x30\x02\x2f\xec\xab\x4d\x27\x4c\x6f\x24\x34\x64\x7e\xf2\
-\x49\xa5\xb9\x95\x98\x92\xb9\xfb\x4e\x06\xe4\x0a\x2b\xb2\xfd\x8d\
-\x74\x18\x74\x6f\x84\xda\x85\x95\x8b\x32\xc7\xa4\x78\xbb\xc4\x96\
-\x17\x1b\x57\x18\x95\x35\x9b\xb6\x38\x66\xcb\x05\x6f\x3b\x8d\xdf\
-\x78\x29\x2b\xf2\xe1\x8f\x91\x7e\xcf\xda\xa5\xf5\x87\xed\x35\xe2\
-\xad\x16\x3f\x3a\x3d\x27\xfb\x3e\xcf\x5d\x8f\x51\xb8\xb9\x5f\x3c\
-\xdd\x5d\x40\x96\xd3\xc5\xb0\xa1\xcb\x08\xf4\xf4\x70\xea\xca\x00\
-\x7c\x0c\xf4\x0b\xa6\xfe\xd7\x50\x7e\xca\x3f\x12\xfe\x31\xf8\x6e\
-\x3d\x3e\xf7\xc4\x1a\xf6\xbf\xe2\xed\x3b\x55\xf0\x7e\x8a\x64\x61\
-\x0e\xac\x75\x1b\x11\x04\xae\xb7\x03\x71\x8a\x38\xee\x2c\x6e\x7c\
-\xc2\xe0\xba\x20\xc8\x52\x5b\x15\x14\x39\x67\x85\x54\xe2\xba\x1e\
-\x8e\x55\x52\x34\xab\x46\x4c\xe3\x7f\xe0\xb2\x3e\x39\xd4\xfe\x1c\
-\x7c\x12\xf0\xba\xdb\x7d\xb2\x1b\x79\xbc\x63\xa4\x59\x5c\x5d\xdb\
-\x00\xab\x66\xb1\xcc\xd7\x0a\xd8\x6c\xb0\x25\xe2\x40\x87\x23\x12\
-\x39\x60\x41\x6d\xc7\xe6\x3d\x33\x49\x8f\x46\xbc\xb5\xd4\x2d\xaf\
-\x35\x58\x22\xd2\xf4\x92\x1e\x58\x94\x48\xd3\x6d\x62\x7c\xb1\x9e\
-\x36\x80\xa1\x33\xb4\x60\xab\x0d\xdc\x64\xfd\xdd\xfb\x7c\x7e\xc7\
-\x7f\x16\x3f\x69\x0f\xd9\x7f\x53\xb1\xf0\xcb\x78\x55\x7e\xdb\x63\
-\x63\xae\x43\x6e\xb0\xdc\x5c\x6a\x12\xdd\x5a\xc8\x93\xb4\x50\xab\
-\x34\x70\xec\x67\x1b\x50\xcc\xca\x42\x9e\x70\xdb\x76\x7c\x0b\xe0\
-\xaf\x18\xf8\x7e\xde\xe2\x66\xb6\xba\xbc\xba\xd2\x75\xed\x36\xd4\
-\xfd\xb0\x03\xe5\xc7\x1a\xc8\xdb\x16\xe9\x46\x0c\x61\x77\xba\x6e\
-\x01\x4a\x18\x99\x49\xe0\x03\xe3\x62\x32\xfa\x98\x7a\x4a\x52\x5d\
-\x4d\xf3\x8a\xd1\xab\x88\xba\xd8\xe6\xfc\x67\xf0\xbb\xc2\xff\x00\
-\x11\x5a\xd6\xfb\x54\xd1\x16\x59\x2c\xf4\xc7\xb8\x69\xdf\xcd\xf2\
-\xb7\xc6\xcd\x96\x69\x63\x74\x65\xfd\xdb\xa6\x73\x8c\xb2\xa9\x25\
-\x98\x90\x29\xf8\xc7\xe2\x65\xf7\xec\xf9\xa2\xd9\xde\x49\xe2\xcf\
-\x16\x6b\x5e\x4e\x89\x79\x26\x9b\x69\x7f\x65\x1e\xa2\x89\x77\x20\
-\x7d\xca\xf2\xb2\x2d\xc8\x8c\xaa\xee\x11\xb4\x8a\x5d\x23\x64\x0a\
-\xc2\x32\x07\xa3\x78\xca\xf3\x47\xf0\x77\x82\x3c\x49\x7d\x62\xed\
-\x63\x1e\xb8\x61\x59\xed\xef\x65\x49\xd6\x76\x05\x49\x8d\x14\x95\
-\x0c\xc9\xb8\x3e\x57\xa2\xed\x0c\xa0\xd7\x17\xf1\x82\x1d\x6b\x55\
-\xf1\x1e\x96\xbe\x0b\xd1\xed\x66\xf0\x6e\xa5\x22\xe9\xda\xc3\x5b\
-\xa7\xdb\x12\x6b\x87\x95\xa4\x89\xd1\x1d\xbe\x5f\x2e\x50\x00\x27\
-\x6b\xa4\xd1\x1d\xe5\x00\x15\xcf\x87\xaa\xaa\xc9\x43\x73\xc9\x6b\
-\x97\xe1\x26\xf0\x1e\xb7\xf1\x0f\xc7\xd2\x5c\x58\x6a\x12\x7c\x3f\
-\xf1\x25\x9d\x9a\xda\x69\x53\x5c\xc9\x77\x75\xa6\x48\x45\xcd\xba\
-\xcd\x1b\x21\xd8\xd3\xf9\x4a\x03\x19\x18\x33\x0c\xa4\x87\x38\x56\
-\x03\xa4\xf8\x8d\xf0\x4b\xc5\x96\xff\x00\x11\xfc\x37\xe2\x4d\x53\
-\xc1\xfe\x22\x4b\x9d\x22\xe0\xdb\x25\x97\x87\xee\xac\xb5\x8b\x56\
-\x81\x03\x3c\x47\xcd\x76\x8c\xdb\xf9\x92\x39\x47\xf2\xd2\x52\xf1\
-\x20\x52\x40\x01\x6b\x9c\xf8\x3f\xe2\x4d\x07\x5c\xf8\x83\xe2\xed\
-\x52\x7b\xe6\x6b\xaf\x16\x5e\x9b\x6b\x73\x0c\x3b\x19\xe2\xb6\xc5\
-\xa3\x15\x7c\x63\xca\xf3\xa2\x92\x61\x2a\x7c\xc0\xf1\x21\x52\xa0\
-\x1f\xb2\xfe\x00\xfc\x67\xd3\x35\xa8\x1b\x4b\xd4\xf5\x0b\x5d\x5b\
-\x5e\x6b\x71\xb2\x13\x7a\x86\xe1\x40\x62\x41\x44\x66\xdf\x2a\xfc\
-\xce\x78\xc8\x55\xda\xc4\x05\x20\xd7\xbd\x3c\x1d\x3a\x6b\x9b\x94\
-\xe8\xa7\x1e\x7f\x89\x9e\x75\xf0\x53\x51\x9f\xe1\x0e\x89\xab\x36\
-\xbb\xe1\x9f\x12\x69\x57\xde\x26\xd4\xad\xf5\x4b\x9f\xb3\x42\xf7\
-\xd2\x68\xd0\xac\x31\xc0\x82\xe1\x84\x8d\x35\xbc\xb2\x3d\xb4\xb2\
-\x39\x91\x4c\x5b\x1c\x32\xca\x1b\x79\x1e\x27\xaa\xfc\x63\xf0\x3e\
-\x91\xf1\x86\xdf\xc1\x3e\x05\x5f\x07\xf8\x5f\xc4\x5a\x96\xbb\x31\
-\xb3\xf1\x9e\xae\x83\x51\xf0\xe5\x95\xdb\xa9\x9e\x67\x95\x6e\x25\
-\x78\xfc\xe8\x81\xc2\x86\x89\x42\x6e\x44\x52\x40\xf3\x0f\xe8\x7f\
-\x8a\xec\x34\x5b\x7b\xfd\xda\x5d\x9f\xd9\xc2\x28\x96\x47\x8d\xd5\
-\x5e\x44\xf2\xc8\x10\xe7\x05\x46\x4a\x96\x27\xa0\x25\x70\x14\x64\
-\x1f\x99\x7f\x6d\xff\x00\x87\xda\x57\xfc\x2a\x89\x35\xab\x3d\x3f\
-\x4b\xd1\xef\xfc\x3b\xaa\xbf\x88\x35\x2b\xb8\x63\x58\xd7\x58\x8a\
-\x62\xb1\xea\x28\xea\xab\x99\xcb\xc0\x8c\x51\xfe\x66\x8d\xf0\x54\
-\xa8\x66\x71\xe7\xe0\x70\xb8\x6f\xad\x7b\x79\xa3\xe9\x1e\x69\x5a\
-\x9e\x15\x50\x8e\xc7\xda\x1f\xb5\xad\xed\xc6\x99\xff\x00\x04\xb1\
-\xd4\xb4\x15\xd7\x17\xc7\x7a\xe6\xb9\x61\xa4\x78\x73\xfb\x56\xfa\
-\xcd\x21\xfe\xde\x7d\x46\xf6\xda\xcd\xa6\x45\x8d\x76\x6d\x75\xb8\
-\x25\x12\x25\x21\x55\x80\x0b\x8c\x1a\xf4\x4f\xd9\x87\xc3\x96\x7a\
-\xc7\xc7\x8f\xda\x1f\xc4\x72\x43\x6b\x24\x3a\x97\x89\x34\xff\x00\
-\x0c\x24\x0c\xbe\x6e\xdb\x5b\x0d\x22\xd8\x6c\x64\xc6\x18\x34\x97\
-\x53\xb0\x4e\xeb\x20\xc0\x3c\x0a\xfc\xe7\xf0\x37\xc2\x4f\x13\x78\
-\x57\xe1\xae\x88\xfe\x01\xd4\x24\x9e\xfb\x42\xd6\x34\xcd\x69\xbc\
-\x33\x67\xaa\xfd\x83\xc3\x3a\xfc\x16\x97\x2b\x2b\x2f\xd9\x88\x6b\
-\x6b\x79\x73\x0a\x14\x08\x51\x52\x45\x2e\x09\x27\x79\xf4\xef\xd8\
-\xa7\x54\xf8\x85\x75\x75\xe1\x1d\x5b\xe2\x13\x4d\x67\x2f\x88\x3e\
-\x28\x6a\x97\x5a\xc7\x86\x6d\x2f\xb3\xa6\xa2\xea\xa6\xe9\x23\x73\
-\x2c\x44\x3d\xf7\x96\x7c\xb2\x81\xf0\x02\xcf\x83\x18\x21\x4a\xfe\
-\x85\x1c\xc2\x85\xd2\x86\x9e\x47\xcd\xb8\x4e\x4d\xc9\xf5\x35\xac\
-\x7e\x05\xfc\x40\xf8\x91\xf1\xc3\xc4\x3a\xc6\x8d\xe1\xbb\xcb\x6f\
-\x0d\x78\x53\xc5\x1a\x87\x85\xf4\x3f\x14\xf8\x7a\xfd\x1b\x5e\xd3\
-\x2d\x52\x68\xe1\x6b\x67\xb0\xb8\x85\x2d\xee\xb4\xde\x3c\xb6\x2a\
-\xec\xe3\xc8\x8a\x60\x0c\x8b\x93\xef\x1f\x09\x7f\x65\x7d\x60\xfe\
-\xdc\x49\xf1\x02\xf5\xaf\xa1\xd0\xfc\x1f\xa2\xdd\xe9\xf1\xc2\xd0\
-\xcd\x0c\x57\x5a\x85\xdc\xa8\xee\xf1\xa3\x00\x64\x54\x81\x14\x33\
-\x77\x77\x0a\x9b\xc8\x6c\x7d\x6f\xa3\xe8\x70\xd8\x69\x76\x96\xf6\
-\xb6\xf6\x96\xf6\x10\xc4\x16\x1b\x78\xa3\x55\x8e\x24\xc0\x01\x02\
-\x8c\xae\x3f\xdd\x20\x0c\x0e\xa2\xa5\x8f\x4d\x92\xd9\xf2\x24\xce\
-\xec\x1c\x9e\x71\xc8\x3f\xd5\xb8\x18\x18\xda\x06\x31\x9a\xf3\x71\
-\x19\x1e\x1a\xbd\x6f\xac\x4f\x73\xd3\xa3\x9b\x56\xa7\x45\xe1\xe3\
-\xb1\xf3\xef\xfc\x14\x8b\xe3\x1d\xff\x00\xc3\x8f\xd9\xf2\x3d\x2b\
-\x45\xd5\x1b\xc3\xfe\x22\xf8\x85\xac\x5a\x78\x33\x4b\xd4\x58\x2a\
-\x7d\x82\x7b\xb6\xc3\xce\x37\x1f\xbc\x96\xe9\x72\x54\x0c\x96\x60\
-\x98\xce\xe5\xcf\xe6\x1f\xed\x69\xe1\x6d\x77\xe1\xae\xa9\xa2\xea\
-\xde\x0f\x6f\xf8\x99\xf8\xa7\x43\xbc\xf0\x7e\x9d\x15\xc1\x69\xad\
-\xe7\x32\x5a\xb9\xd3\x7c\xc0\xcc\x63\xdc\x8f\xe7\x45\x0e\x46\x5e\
-\x57\x64\xc9\x04\xaa\xfd\x85\xff\x00\x05\x9d\x9a\xd7\xe2\xc5\xbe\
-\x89\xe1\x9d\x27\x5a\xb9\xd1\xf5\x9f\x87\xd7\x71\x78\x82\xca\x48\
-\x7c\xb3\x6b\x06\xa8\xca\xcd\x6a\x66\x8d\xc1\x13\xaa\x46\x92\xb9\
-\x8c\x2a\x90\x65\x43\xe6\x01\xb9\x4f\xc5\x3f\x16\x3f\x6a\x9f\x0e\
-\xfc\x7e\xf8\x41\x6f\xf0\xbf\x58\xf0\xbe\xb5\x17\xc4\x8d\x6a\x68\
-\xac\xfc\x38\xf6\xca\xef\x69\x1e\xab\x04\x91\x94\x71\x74\x72\x52\
-\x10\xdf\xbd\x62\xe6\x37\x45\x57\x60\xaa\xce\xbb\xbe\x77\x3b\xc4\
-\xba\x98\xd8\xe1\x28\x3d\xb7\x3c\xac\x56\x57\x89\x9d\x2f\x6b\xd0\
-\xe1\x7e\x02\xfc\x35\xf8\x75\xe3\x4f\x01\xd8\xdd\xdb\xdb\xea\x5e\
-\x1f\xd6\xb4\x0b\x55\xb6\xd6\x92\xd6\xe6\xe2\xc3\x50\xb6\x9e\x46\
-\x11\x81\x32\xc6\xc8\x24\x0d\x2a\x3a\x2c\xa4\x32\x33\xf1\x80\x72\
-\x07\x49\xa2\xfc\x0b\xf8\x93\xf0\xd2\xce\xea\xf3\xe1\xe7\x88\x17\
-\xe2\x06\x92\xdc\x5a\xe9\x9a\xad\xf0\x82\xe1\x98\xa9\x62\xa9\x72\
-\xaa\x21\xe5\x48\x40\x25\x40\xdf\x2e\x4b\x64\xd7\xb0\x7c\x7b\xff\
-\x00\x82\x51\xfc\x58\xf8\x39\xa5\x5f\xeb\xb6\xfa\x86\x83\xaa\xe9\
-\xfe\x15\xd4\xb5\xcf\x1a\x5c\xdf\x68\xe8\xd6\x97\x1a\xdd\x8d\xca\
-\x45\x25\xde\x94\x2d\xdf\x78\x8a\x12\xf9\xdc\x86\x49\x03\x38\x32\
-\xa8\x47\x66\xaf\x3b\xf8\x79\x6b\x06\x8e\xf7\x0b\x66\xb3\xcb\x24\
-\xe1\x2e\x2d\x18\xc8\xcc\x2e\x6d\x58\xee\xdf\x1b\xfc\xce\x63\x31\
-\xed\x1c\x12\x17\x18\x50\xd5\xf3\x19\xb6\x5f\x57\x09\x37\x29\xab\
-\xa7\xd0\xf9\xb9\xd1\x71\x6e\xe5\xcf\x81\xff\x00\xb6\x65\xf7\xc4\
-\xbf\x14\xdf\x78\x67\x58\xd1\xf5\x8d\x07\x5f\x88\x3c\x5f\x67\xba\
-\xb7\x48\x64\x05\x87\xee\xe4\x4f\x98\x24\xb0\xb3\x44\xe3\xcd\x42\
-\x40\xf2\xd8\xb0\x50\x57\x3f\x5c\x7c\x22\xfd\xa2\xbc\x55\xf0\x87\
-\xc4\xcd\x69\x6b\x71\x67\x7d\xa1\xde\x30\x41\x00\xb7\x0a\xb2\x0e\
-\x00\x2a\xff\x00\x23\xb1\x54\xf9\x76\x86\x60\xa1\x57\x20\x0c\xe3\
-\xc1\xf5\xcf\x08\xf8\x67\xe3\x46\x82\xd6\x3e\x33\xd1\x6c\x35\xa6\
-\xd4\x9f\xcc\x7b\x9b\xb8\xf7\x33\x46\xcc\x0e\xd4\x70\x40\x8b\xe5\
-\xf9\xcf\x94\xcb\xb8\xe3\x03\x04\xd7\x9e\xbf\x82\x7c\x75\xf0\xb7\
-\x5d\xf3\xbc\x3b\xa9\x5c\x78\xa7\x45\xd4\xae\x1e\x59\xac\x75\x39\
-\x8c\xb2\x70\x55\xcc\xea\x58\x97\xf3\x24\x55\x68\xcc\x88\x18\x8e\
-\xaf\x0b\x1d\xee\xbf\x2e\xa6\xe8\xcf\xda\x61\x9f\xb3\x97\x6e\x87\
-\x3c\x6f\x07\xcd\x16\x7d\x55\xfb\x42\x7c\x5d\xf1\x07\xc4\x49\x26\
-\xd5\x34\xc6\x8f\x41\xf1\x81\xb6\x36\x76\x7a\xa4\x0f\x1a\xea\x10\
-\x5b\xcb\x22\xc8\xe9\x6f\x23\x6f\x03\x24\x1c\xbc\x58\xfe\xf2\xa9\
-\x6c\x32\xfc\x71\xfb\x47\xfc\x1c\xb1\xf0\xa7\xc3\x9f\x0f\xe8\x7e\
-\x09\xb4\xbe\xd0\x35\x8d\x3e\x26\xb3\xd0\x5e\xdc\xe1\xc4\xf3\x4a\
-\x42\xa5\xc2\x5c\x9f\xde\xab\x99\xe4\x71\x29\x51\x2a\x7c\xe2\x23\
-\xb8\x9c\xfb\x5f\xc0\xef\x8e\x9a\x0f\xc4\x96\x9a\x49\x61\xbe\xd3\
-\xf5\x1d\x35\xe4\x4b\xed\x1e\x74\x6f\x3e\x19\x21\x56\x69\x19\xa3\
-\x1f\xeb\x11\x4c\x89\xfb\xe4\xdc\x8c\x41\xe7\x3c\x57\x59\x7b\x63\
-\xa6\x7c\x7c\xf0\xe5\xdd\xad\x8e\xd9\xe5\xd3\x00\xb5\x96\x45\x68\
-\xfc\xeb\x5b\xa0\xd8\x28\xa4\x9c\x23\xac\x9b\x8f\x04\xec\x63\xbb\
-\xe5\x07\x8e\x8a\x39\xf6\x61\x0a\xbc\xd5\x24\xf4\x0f\x6f\x51\xb7\
-\x2e\x63\xe7\x3d\x0b\xe3\xa7\xc7\x5f\xd9\xb7\x48\xf0\xee\x95\xe0\
-\xfd\x7b\x53\x86\xf3\xcc\x2b\x69\x7f\x69\x7f\x77\xa9\x2d\xcd\xc4\
-\x70\x6f\x22\xf2\xce\xf1\xc4\x52\x09\xa2\x0c\x8b\x2a\x95\x64\xf2\
-\xb6\xac\x6c\xdd\x3e\xc2\xfd\x9d\x3f\xe0\xb5\x72\xda\xf8\x16\xce\
-\xe7\xe2\x06\x8b\x26\xa5\xe5\xd9\x09\x75\x0b\xff\x00\x0c\xc0\x44\
-\xb6\x52\x28\x01\xe3\x7b\x39\x5f\x7b\xfc\xfb\x94\x18\xd9\xdf\x72\
-\x95\x23\x77\x15\xf3\x67\x8d\xbc\x79\xa8\x7c\x2d\x4d\x3b\x50\x7d\
-\x28\x5f\x6b\xba\x3c\xa9\xa8\x69\xb7\x90\x69\xd2\xcd\x65\xaa\x5c\
-\xdb\x0e\x37\x32\x92\x20\x25\x0c\xc8\xbe\x61\x52\xae\x7e\x52\x54\
-\xd7\x05\xf0\xe3\xc7\xf6\x37\x5f\xb4\x9f\x8a\x34\xbd\x16\xd6\xeb\
-\xfe\x11\xc9\xa2\xb4\xd7\xb4\xf9\xa4\x83\xe6\x82\x2b\xd0\xf2\x6d\
-\x64\xe1\x89\x5e\x5d\x72\x50\x16\x94\xa6\x79\x25\xfe\x96\x3c\x45\
-\x8f\xa7\x85\xfa\xdd\x17\x74\xb7\xf4\x3f\x42\xe1\x65\x4f\x1a\xbd\
-\x85\x5d\xcf\xd9\xcf\x81\x1f\xb6\x9f\xc3\x2f\xda\x4b\x46\xb3\xba\
-\xf0\x6f\x8c\x34\x5d\x59\xef\x60\x69\xe3\xb3\x8e\x70\xb7\xaa\xaa\
-\x70\xdb\xad\xdb\x12\xa9\x07\x8e\x54\x57\xa6\x5b\xea\x11\xdd\x26\
-\x57\x73\x0c\x90\x08\xc3\x06\xc7\x5c\x10\x71\xd7\x8c\x67\x39\xaf\
-\xc4\x3f\x89\x5e\x15\xd0\xf5\x2b\xed\x27\x5a\xfe\xc6\xd3\xe5\xd5\
-\x2c\xa6\x37\x56\x17\xe8\x91\x8b\x8b\x29\x46\x10\x4b\x1d\xde\xc0\
-\x72\x49\xc0\x0a\xe3\x38\xc9\x22\xbb\x2f\x81\xff\x00\xb7\x0f\xc6\
-\x0f\xd9\xd7\x54\xb2\x58\x3c\x65\x75\xe3\x0f\x0f\x79\xae\xf7\x3a\
-\x27\x88\x27\xfb\x55\xc8\x0a\x86\x4d\xb6\xd7\xdf\xeb\x57\xe6\x3f\
-\x76\x45\x99\x70\x40\x04\x1a\xf4\xb2\x9f\x10\xe9\xe2\x6d\xed\xe1\
-\x6b\xe8\x7d\x16\x63\xc1\xd3\xa3\x26\xe9\x48\xfd\x90\x12\x6d\x0c\
-\xbf\x37\xe5\x5c\xd7\xc4\xcf\x86\x7a\x4f\xc5\xaf\x03\x6b\x1e\x1f\
-\xd7\xac\x61\xd5\xb4\x2d\x7a\xd2\x4b\x5b\xcb\x39\xbe\xec\xd1\x91\
-\x82\x32\x39\x5f\x50\x46\x0a\xb1\xdc\x39\xc1\x1f\x9f\x5f\xb3\x5f\
-\xfc\x1c\x13\x63\xe2\xcb\x2b\x89\xbe\x27\x7c\x2b\xf1\xaf\x82\xd6\
-\x0d\xcd\x1c\xf6\x70\xff\x00\x68\x2b\x2a\xb6\xd9\x0f\x96\xad\xe6\
-\x1d\xa7\x07\x6a\xa1\x66\x52\x19\x55\x87\x35\xf4\x24\xdf\xf0\x5a\
-\x4f\xd9\xb7\x4f\x86\xdd\x6e\xfe\x24\x43\x67\x35\xc1\x01\x21\xb9\
-\xd2\x2f\xa1\x91\x86\x42\x96\xda\xd0\x82\x17\x27\x1b\x8e\x07\x07\
-\x9c\x57\xdb\xd1\xcd\xb0\x95\x5d\x94\x91\xf2\xb5\x70\x38\x8a\x6e\
-\xed\x68\x7c\xf3\xae\x78\xf7\x50\xf0\x16\xab\xe2\x4f\x01\xf8\x92\
-\x1b\xed\x63\x52\xf0\x7d\xf2\x5b\x5e\x5f\xc9\x01\x87\xfb\x4e\xd6\
-\xe5\x5e\x5d\x3e\xe1\xe4\x00\xb1\x66\xb7\x46\x8e\x42\x83\x3e\x6d\
-\xb4\x8e\x0f\x25\x46\x47\xec\xa5\xa8\x7f\xc2\x05\xfb\x71\xf8\x6b\
-\xc5\x37\xd7\x1e\x5e\x83\xad\x4f\x7b\xe1\x78\x43\x06\x2a\xbf\x6d\
-\x82\x39\xed\x77\xb0\x04\xe2\x49\x6c\xbe\xcf\x86\x07\x0e\x60\x0b\
-\xf7\x97\x3e\xdf\xff\x00\x05\x12\xf0\xa5\x9d\xed\xe7\x83\xfe\x21\
-\x68\x11\xfd\xb7\x4f\xd5\xc2\x78\x7b\x5a\xba\xb7\x90\x49\x6b\xfd\
-\x99\x2c\x8f\x3c\x33\xc9\xce\x23\x58\xae\x95\x31\x26\x0a\xe6\xed\
-\xc3\x60\xec\x35\xf1\x7f\xc6\xad\x2b\x5d\xf0\x3a\xb4\x7a\x5c\x93\
-\x47\xe3\x0d\x4b\x4f\x31\xd8\xb4\xb2\x35\xab\x5b\x5f\x43\x2f\xda\
-\xa2\x56\x66\x60\x73\x1c\x8b\x9f\x9c\x85\x8c\x46\x49\xc2\xec\x35\
-\xc1\x88\xa6\xb0\xf5\xfd\xad\x3f\x85\x9a\x47\x9a\x71\x71\x96\xe7\
-\xed\x44\x1b\x8c\x09\xb9\xb7\x36\x06\xe3\xb7\x6e\x4f\xd3\xb7\xd2\
-\x95\x8f\x15\xe6\x9f\xb2\x8f\xed\x19\xa5\xfe\xd3\x1f\xb3\xff\x00\
-\x85\x7c\x65\x61\x6f\x2e\x9e\xba\xe5\x92\x3c\xf6\x53\x61\x64\xb0\
-\xb8\x19\x49\x60\x61\x9e\xa9\x22\xba\xe7\xbe\xc3\xdf\x8a\xf4\x3b\
-\x9b\x85\xb7\x82\x49\x5b\x70\x0a\xbb\x86\x46\x3f\x4a\xfa\x0a\x75\
-\x95\x58\x26\x8e\x19\x43\x95\x1f\x34\x7f\xc1\x4a\x3c\x37\x65\xf1\
-\x17\xc3\x3e\x09\xf0\x8d\xd2\xaf\xf6\x7e\xb5\xe2\xcb\x4d\x53\x5b\
-\x0b\xf2\x33\xe9\xfa\x6f\xfa\x64\x84\xb6\x3b\x4d\x0d\xa2\xe3\x23\
-\x9a\xf9\x8f\xf6\x86\xf8\x47\xe1\x4d\x77\xc1\x17\xde\x20\x9a\xf3\
-\x54\xf0\xbf\x89\x21\xd3\x2e\x2e\x13\x58\xd0\xc4\x69\x74\xa8\x46\
-\xe4\x88\x47\x82\x2e\x63\x40\x0b\xb4\x53\x6f\x0c\xd2\x02\xa1\x1b\
-\x2c\x3d\x83\xf6\xc4\xb5\xd4\xbc\x57\xf1\xee\x6b\xa9\xb5\xeb\xc9\
-\x3c\x3f\xa7\xe8\xab\x68\xfa\x72\x42\x44\x56\xd3\x4b\x2b\x31\x93\
-\xcc\xe8\xd2\x32\x44\x41\x45\xc9\xda\xa8\x4e\x0b\x00\x7e\x71\xfd\
-\xa6\xf5\x37\xd5\xfc\x31\x0e\x8e\xa6\xd6\xe6\xe1\xef\x6c\x20\x9b\
-\x4d\x9c\x34\x2c\xe2\x43\x21\xb3\x46\x72\x50\x8d\xb3\xa2\x28\x65\
-\xfe\x16\x55\x39\x39\x15\xf3\x79\xed\x44\xf1\x0a\x84\xf6\x3b\x30\
-\xd4\x61\x2a\x4e\x52\x47\x03\xfb\x1f\xfe\xd1\x52\x78\xff\x00\x45\
-\xd4\xb4\x3b\xbb\xa8\xe1\xf1\x1f\x85\xb5\x47\xd0\xef\x35\x1b\x00\
-\x52\xde\xed\xe0\x8d\x8c\x72\x05\x6c\x16\x8e\x58\xf6\xca\x13\x82\
-\xaa\x08\x39\xda\x5a\xbe\x8d\xf0\xc7\xed\x05\xe3\x5f\xd9\x7f\xc2\
-\x77\x17\xde\x18\x4d\x33\xc4\x1a\x1a\x48\x6e\xd3\x46\xbb\x9a\x54\
-\x52\x0b\x06\x90\x24\xd9\x3f\x67\x06\x30\x8a\xa3\xe7\x87\x70\xc7\
-\x96\x1b\x91\xf2\xe7\xec\x55\xfb\x1a\xeb\xdf\xb4\x3f\xc4\x99\xb5\
-\xbf\x86\x3e\x21\xd2\x63\x9f\xc3\x96\x77\x1a\x27\x8a\x6e\x2f\xa2\
-\x32\x69\x72\xdf\x45\x70\x92\x59\xda\xdc\x44\xa4\x1b\x95\x92\xdf\
-\x2b\x2b\x42\xcb\x2d\xa3\xec\x65\x72\xde\x64\x47\xda\xbe\x29\x78\
-\x84\x78\x6b\xc5\x3f\xf0\x85\xf8\xc2\xdf\x52\xf0\xdf\x8d\x64\xcd\
-\xd8\xb4\xbb\x02\xe6\x6b\x85\x04\x66\x5b\x39\x23\x0b\x15\xe5\xbe\
-\x58\xaa\xc8\xaa\x0c\x45\x18\xc9\x12\x37\xcb\x5f\x3b\x5b\x2f\xc7\
-\xe0\x67\xf5\xbc\x2b\xf7\x3a\xa3\xe6\xf1\x14\xe7\x4a\xa3\x94\x76\
-\x3f\x43\x3e\x02\x7e\xd2\xfe\x1f\xfd\xa0\x3c\x01\x6f\xad\x69\x4d\
-\x75\x67\x30\x54\x17\xba\x6d\xef\x96\x97\x9a\x63\xb6\x30\x93\x2a\
-\xbb\x2a\x92\x0e\xe5\xc3\x1d\xcb\xca\x93\x5e\x92\xb2\x61\x7e\x9c\
-\x13\x5f\x8e\xde\x2a\xf8\x89\x67\xf0\x9b\xc2\x96\x3e\x22\xd5\xaf\
-\xb5\x2f\x0e\x6a\xde\x1d\x71\x3c\x3a\xb6\x85\x81\xab\x68\xd1\x4b\
-\x32\xdb\x89\x3c\xbf\xbc\xf1\x3e\xe5\x12\x2b\x2c\x8a\x51\x49\x2a\
-\x46\xd1\x5f\x7c\xfe\xc8\xff\x00\xb6\xae\x93\xf1\x37\xc3\x1e\x1f\
-\xf0\xef\x88\xb5\x44\x6f\x1a\x4d\xa7\x98\xc5\xe1\x83\xc8\xb4\xf1\
-\x03\xc4\xab\xbe\x6b\x66\x1f\x29\x63\x9d\xfe\x50\xc4\x80\x64\x84\
-\x2a\xa4\x8f\xab\xc9\xf3\xca\x58\xb5\xef\x7b\xb2\xf3\x3a\xb0\xb8\
-\xc8\xd5\x56\x7b\x9f\x49\xa9\xdc\xb9\xa2\xa0\x8e\xfd\x1d\x23\x6c\
-\x32\x89\x00\x23\x24\x1e\xd9\xec\x6a\x75\x6d\xca\x0f\xaf\x35\xf4\
-\x7d\x6c\x77\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x34\x0e\x5a\x9d\
-\x55\x6e\x75\x78\x2d\xb7\x2b\xbe\x19\x73\x90\x3b\x63\x19\xff\x00\
-\xd0\x87\x1d\x79\x1d\xce\x29\x4a\xdd\x40\xe2\xbe\x3d\x78\xe2\x6f\
-\x86\xff\x00\x09\xfc\x51\xe2\x2b\x7d\x3c\xea\x37\x1a\x0e\x99\x77\
-\x7d\x15\xa9\x3b\x56\xe4\xc5\x03\x48\x15\x8f\x1b\x51\x9d\x15\x4b\
-\x7b\x71\x9c\xd7\xe3\x6f\xec\x7b\xaa\x49\xab\x7c\x12\xf0\x8e\xa2\
-\xd0\xdc\x5c\x6b\xd3\x0b\x99\x35\xe9\x82\xac\xb2\x49\x70\x2e\xe6\
-\xfb\x42\xa6\x3e\xe8\xde\x59\x80\xdc\x40\xc3\x0c\xae\x06\x7f\x5a\
-\x3f\x6e\x3d\x19\xbc\x5f\xfb\x25\xfc\x48\xd2\xed\x66\xd3\xbe\xd5\
-\x36\x8f\x73\x0a\x7d\xae\x61\x0d\xbc\x72\x32\x0d\xa1\xd8\xb0\x0a\
-\x7e\x60\x41\x62\x17\x2c\x09\xc0\x60\x4f\xe7\x37\xc5\xff\x00\x88\
-\x7f\x0f\xee\x35\x06\xd5\xbc\x03\x75\xa7\xf8\x8b\xe1\xff\x00\x8e\
-\x35\x34\xba\x53\x6d\x65\xe5\xcd\xa1\xdf\xdc\x34\x72\x94\x21\x70\
-\x6d\x94\x9d\xca\x22\x78\xc1\x79\x59\x94\xbe\x48\x27\xe6\x38\x9b\
-\x0e\xaa\x61\x6c\xbb\x9c\x78\x8a\x6e\x4e\xe8\xb1\xfb\x36\x5e\x7f\
-\x61\x7c\x6d\xf1\x95\xd0\x92\xce\xdc\x6a\x9a\x26\x97\x6d\x1c\xf9\
-\x92\xdd\x6e\x23\x49\x2e\x02\x40\x8b\x26\xe2\xa0\xcb\xe6\x61\x98\
-\xa9\x66\x56\x5e\x40\x04\xf7\x1e\x10\xf8\x73\xa1\xf8\xcf\xfe\x0a\
-\x21\xf0\x4f\x5a\x7b\x28\xa6\xd6\x2d\xa1\xd7\xdb\x50\xb1\x9a\x19\
-\x18\xc1\x0a\x43\x1b\x47\x3c\x88\x3a\x04\xb9\x99\xb0\xce\x02\xe2\
-\x42\xa4\x83\x5e\x4b\xa3\xfc\x7f\xd6\x6d\x74\x58\xef\x74\xdb\x58\
-\x21\xf8\x8b\xe2\x58\xee\xfc\x37\x6c\x8f\x63\x25\xbd\x9d\xec\xc6\
-\xfe\x14\xd3\xe7\x92\x4c\xe4\x08\xd6\xf0\xcd\x71\x13\x6e\x66\x4d\
-\xc1\x0a\xed\x2a\x7e\xda\xff\x00\x82\x7f\x78\x07\xc3\xdf\x04\xfc\
-\x2d\xa9\xe8\xb6\x70\xdd\x6a\x1a\xa5\xcd\xd1\xbb\xf1\x0f\x88\xef\
-\x9a\x39\xaf\x75\xeb\xf7\x01\x9e\x49\xcc\x64\x88\xc2\x8c\x6d\x41\
-\x88\x80\x0a\xa8\x00\x00\x0e\x4c\xaf\x09\x27\x18\xbe\x89\x15\x4e\
-\xd1\xd6\xe7\xd0\x96\xb6\x1a\x75\x84\x92\x34\x90\xdc\x4f\x3a\x75\
-\x59\x98\xc8\xea\x8e\x17\x72\xb6\xd3\x8c\x7c\x83\xe5\x23\xaa\xe7\
-\xa9\x35\xf1\x9f\xed\x97\xff\x00\x04\xb9\xb2\xf1\x26\xb1\xa8\xf8\
-\x93\xe1\xbd\x96\x8f\xa7\xdd\xeb\xda\xa4\x77\xba\xde\x87\x32\xb5\
-\xb5\xbe\xa9\x70\x48\x32\xcd\x14\x91\x8d\xb0\x4a\xe4\x36\xf5\x74\
-\x68\xdc\xfc\xc7\x05\x8e\x3e\xc4\xd4\xaf\x85\xa5\xc4\xd1\xcb\x23\
-\x3e\xd2\x5c\xec\x5f\x96\x45\xdd\x8d\xbb\x47\x5c\x02\xf8\xc9\xf4\
-\xe6\xac\x14\x1a\x90\x59\x3c\xe0\x1b\x7b\x45\x1b\x8c\x28\x62\x30\
-\xa0\x1e\xb8\x03\x39\x20\x83\x80\x7a\x93\x5e\xdd\x7a\x74\xea\xaf\
-\x67\x24\x6a\xe5\xcc\xee\xcf\xc5\xfb\xef\xd9\x1f\xe2\x76\x81\xa1\
-\x6a\x1a\x7f\x88\x3e\x1c\xf8\xbb\x49\xd1\xd9\xa3\xd4\x2c\x52\xd6\
-\x44\xd6\x0d\xd0\x82\x7f\xf5\x64\xda\xac\x82\x02\x36\xab\xc4\xcd\
-\x22\x81\xbb\x61\x47\x5c\x56\x7f\xec\xe1\xff\x00\x04\xeb\xf8\x8d\
-\xe2\x39\x64\xf0\xdc\xd7\x57\xfe\x19\xf0\x5c\xd7\x8d\x7f\x7d\xaa\
-\xea\x3a\x78\xb4\xd4\xb5\x17\xf2\xc4\x31\xc7\x05\xa2\xb7\x97\x16\
-\xd8\x94\x0f\xb4\x4c\x8a\xf2\x7f\x12\xc9\xd6\xbf\x6d\x35\xcb\x2d\
-\x2f\x42\xd1\xe4\x96\xea\x18\x23\x4b\x56\x4d\xe7\xe5\x52\xa0\x90\
-\xaa\xaa\x79\x50\x4b\x85\x5f\x73\x9e\x17\x8a\xe3\xb5\x18\x74\x1b\
-\x7d\x27\x13\x5f\x41\x1f\x98\x9f\x6d\x59\x20\x5d\xc8\xe8\x64\x11\
-\xa0\xe4\x30\xdd\xb8\x85\xc1\xe7\x3d\xc5\x79\xd4\x72\x7a\x34\xe5\
-\xcd\x12\x25\x15\xd4\xf8\x7b\xe2\x17\xfc\x10\xbb\xe0\xce\xbd\xe1\
-\x1d\x0b\x54\xb3\x8f\xc5\xda\x0e\xb3\xa2\xc6\x43\xea\x36\x97\x11\
-\xcf\x36\xa3\x19\x5d\xa5\xee\x92\x68\xdd\x19\xb9\xc1\x7f\x2c\x3e\
-\xd9\x15\x4f\xca\x38\xf9\xc7\xe0\xa7\xec\x2b\x37\xec\xeb\xfb\x7f\
-\x4b\xa1\xea\x5e\x28\xd5\x6d\xfc\x07\xff\x00\x08\xc3\x6a\xda\x1c\
-\xb2\xdc\xc0\xb7\xde\x21\x87\x68\x17\x36\xfb\xc7\xc8\x56\xd2\x5d\
-\xad\x24\x88\x15\xc4\x62\x20\x0b\x06\x32\x57\xe8\xe7\xc5\xdf\x8d\
-\x96\xf7\xde\x13\xb8\x8f\x47\x46\xba\x9a\x78\x25\x9c\xc9\x22\x34\
-\x8f\x18\x6b\x54\x92\x19\x12\x2d\xc0\xb9\xe3\x68\x46\x6c\xa6\xd0\
-\x5b\x20\xab\x37\x07\xf1\xc7\xc3\x96\x3e\x26\xf8\xab\xf0\xcf\xec\
-\xf6\x16\xd7\x16\x1a\x56\x9f\xaf\xcd\x3d\xd3\x05\x9d\xe1\x2a\x6c\
-\xe3\x8a\x5d\x80\x0f\x34\xf9\xc5\x7f\x78\x9e\x59\x00\xb2\xe5\x71\
-\x96\xf4\xb1\x5c\x8b\x0f\x2b\xae\x84\xd3\xa9\xef\xa4\x52\x83\xc2\
-\x07\x48\xb6\xf3\x1c\xc5\xe7\xda\xcb\xf6\xc4\x9a\x07\x5f\xdd\x46\
-\xaa\x40\xc6\xf0\x7e\xf6\x50\xed\x04\x63\x27\x1d\x85\x79\x17\xed\
-\x9f\xe1\xb8\x75\x9f\x80\x3e\x36\x60\xcd\x63\x6b\x6f\xa2\x5f\x4b\
-\x77\x3a\x47\xbb\x72\x49\x66\xdd\x98\x85\x90\x96\x04\x28\x20\x03\
-\xf7\x9f\x27\x9a\xfa\x67\x59\xd3\x6d\xb4\xcd\x2e\x38\x61\x2f\x22\
-\xcc\x8a\x09\x90\x83\xe5\xc7\xe4\x82\x9c\x63\x1d\x93\xe6\xcf\x38\
-\x63\x8f\x5f\x1e\xfd\xa6\x7c\x39\xfd\xbf\xfb\x3e\x78\xf2\x19\x2d\
-\x65\xb8\xff\x00\x8a\x7a\xed\x8c\x79\xf3\x26\x56\x16\x72\xb1\x4d\
-\x83\x93\xbd\x71\x18\x24\x00\x08\xce\x7b\xd7\xe7\x94\x71\x16\xa9\
-\xa1\xed\xce\xee\x07\x0b\xf0\x6b\xc2\xf1\xd8\xfc\x32\xd2\xe1\xf2\
-\xed\xee\xac\xfe\xc2\x0c\xb1\x5d\x15\x64\x78\x88\xc0\x25\xf1\xb8\
-\x15\x56\x41\xf2\x2f\x03\x04\x03\x9c\x56\xdd\xf6\x9b\x7b\xaf\xda\
-\x3c\xfa\x7c\x73\x6d\xd2\xb5\x2d\x2f\x53\xb7\x99\x82\x9b\xab\x47\
-\x83\x53\xb7\x7f\x34\x1d\xc0\x79\x8a\x44\xb8\x7c\x64\xfd\xd6\x12\
-\x2f\xc8\xba\x5f\x0e\xb4\xe6\xf1\x47\x85\xf4\x79\xad\x56\xc6\x1b\
-\x58\xe2\x8a\x5b\x79\x64\xe4\x48\x5e\xdd\x64\x57\x05\x72\x3c\xb1\
-\x98\xd3\x8c\x8c\x60\x9c\x56\xc7\x8c\xf4\x36\xd5\x7e\x07\xf8\xe1\
-\x2d\x52\xfa\xe2\xe9\xb4\x89\xd6\xcd\x2d\xdb\x6b\x6e\x8d\x0c\xc2\
-\x3c\xa8\xe7\x79\x82\x38\x99\xbd\x18\x60\x82\x49\x3e\x95\x3a\xcd\
-\xe2\x23\x24\xf4\x30\x5f\x05\xcf\xd1\x98\x59\x5e\x15\xc6\x18\x63\
-\xa8\xe8\x7e\x95\x1d\xc4\xff\x00\xc1\x83\xb4\x63\x27\xeb\x91\xfc\
-\xc6\x3f\x11\x5c\x4f\xec\xed\xfb\x40\xe8\x5f\xb4\x57\xc0\x6f\x0a\
-\xf8\xff\x00\x45\x99\xbf\xb2\x7c\x55\xa5\x5b\xea\x71\x99\x06\xd6\
-\xb7\xf3\x17\xe6\x8a\x4e\xca\xf1\xb8\x64\x70\x7e\xeb\x29\x15\x8b\
-\xf1\x2f\xf6\x8b\xf0\xed\xb7\xc3\x2d\x67\x5a\xd2\x75\xed\x2f\x50\
-\xfb\x06\x95\x7d\xa9\xc5\x1d\xb5\xdc\x6f\x34\xdf\x65\x8d\xc3\xaa\
-\xa6\xec\xfc\x92\x6c\x56\xc8\x1b\x5d\xd5\x4e\x09\xc5\x7e\x85\x17\
-\x74\x8e\x3b\xa5\x2d\x4f\xcb\x1f\xdb\xab\xc5\x71\x7c\x4c\xfd\xa4\
-\x3e\x21\x78\xad\x6e\x64\x5d\x3f\x52\xd6\xa7\xd2\xec\xa2\x39\x96\
-\x06\x87\x46\xd9\x67\x8c\x03\x86\x79\x2e\x16\xf9\xfa\xaf\xca\x23\
-\x5c\x90\x09\x14\x7f\xe0\x96\x1e\x04\xb6\xf8\x9d\xfb\x63\xe8\x92\
-\x6a\x91\xad\xef\xfc\x23\xb0\xdc\x6b\x81\x25\x66\xbc\x58\x2e\x5c\
-\x14\x86\x57\x79\x3e\x5c\x88\xd4\xa8\x6f\x93\x3e\x63\x05\xd9\x95\
-\x35\x47\xe2\x17\x84\x5b\xc0\xfe\x0a\xf0\xf7\x85\xf5\x00\xcf\x71\
-\xa1\x78\x56\xc7\x4f\x9a\x67\x90\xc3\x74\xb7\xb3\xdb\x25\xd5\xd4\
-\xae\xc5\x4e\x24\x69\xee\xe5\x67\x05\x4e\x32\x0b\x0c\x95\x27\xe6\
-\x9f\x87\x2f\xe3\x0f\x84\xdf\xb4\x05\xf5\xcf\x86\x7c\x4b\xe2\x0d\
-\x26\xf6\x3d\x0e\x0d\x36\xf6\xef\x4d\xd7\x1a\x3b\xb8\xfc\xcb\x89\
-\xfe\x79\x3f\x86\x48\xb0\xbb\x98\x95\x53\xbe\x40\xca\x14\x92\x6b\
-\xf1\xb9\x63\x23\x2c\xd6\xa5\x6a\x8f\xe1\x67\xe8\x14\xe8\xc9\x60\
-\x54\x22\xb5\x67\xf4\x27\xf1\x37\xe2\xd7\x84\xbe\x1a\xe8\x31\xdc\
-\xf8\xab\x5b\xd3\xf4\x6b\x49\xbc\xb8\x3c\xcd\x45\xc4\x22\xe9\xb7\
-\x0d\xaa\x14\xa8\xdc\x72\xcd\xb9\x55\x7d\x72\x17\x15\xf8\x35\xfb\
-\x0f\x7c\x69\xd2\x3e\x26\x6a\x9a\x9e\x93\x1c\x11\x47\x77\xa5\xdd\
-\x5c\xc5\x63\x67\x05\xc3\x14\x86\x08\xe7\x7f\x21\xa1\xdc\xa7\x2a\
-\x90\x04\x85\x82\xa1\x66\xc2\xee\xf9\x59\x6a\xc7\x8e\x75\x7d\x5b\
-\xc5\x36\xcb\xf6\x89\x75\x03\xaf\x69\xec\x6e\x6f\xf5\x1b\x9d\x5a\
-\x7d\x42\xfa\xda\x30\xbb\x42\xbf\x98\xcc\x64\x46\x8c\x72\x10\xa0\
-\x2b\x85\xc1\x50\x00\xf0\x3f\x8a\x7a\x16\xa1\xf0\x63\xe2\xbd\xbf\
-\x8e\xb4\xcb\xe4\xd1\x95\x6f\x0f\xda\x9d\xa1\x3f\x67\xd3\x65\x91\
-\x56\x36\x79\x10\x95\x77\xb5\x92\x30\x43\xa8\xf9\x81\x6d\xf9\x25\
-\x80\x5f\xa3\xcd\x33\x6a\x19\x8d\x2f\x61\x4e\x3a\xf7\x3e\x3f\x1f\
-\xc3\xd5\x25\x4f\x9a\x5a\x33\xf4\x43\xfb\x16\x3d\x6a\x20\xb7\x89\
-\x1d\xd0\xb5\x78\xe5\x06\x36\xdd\x14\x93\x8c\x1e\xac\xca\x1f\x21\
-\xb0\x5f\x3b\x40\x53\xc9\x3c\x1b\x1a\x4e\xb3\xff\x00\x08\x77\x87\
-\xac\xda\x48\xdb\x75\xc2\xf9\x90\x45\x34\xfe\x48\x95\x55\xc7\x3b\
-\x98\x6e\xf3\x19\x80\x66\x23\x18\x03\x1f\x36\x0e\xef\x24\xfd\x96\
-\xff\x00\x6c\x0f\x0e\xfe\xd8\x1a\x4c\x36\xd0\xb2\x68\x7e\x34\x59\
-\x37\x2e\x93\x77\x2a\xab\x72\x59\x24\x28\x4e\x33\x1f\x98\x5b\x0e\
-\x17\x0a\x17\x0c\xa0\xf3\x5e\xdd\x67\xa4\x5c\x13\x6f\xa7\x8b\x87\
-\xbe\xb5\x31\xaa\x4a\x44\x05\x51\xa4\xcf\xce\x36\x85\x76\x0c\x37\
-\x31\xc8\xc1\xe3\x24\x0a\xfc\xf7\x1d\x83\xa9\x46\x5e\xce\x4b\x5e\
-\xe7\xc3\x54\xc2\xca\x9c\x9c\x64\x67\xeb\xff\x00\x0f\xf4\x3f\x1c\
-\x40\xd1\xa8\x5b\x5d\x4a\xdd\x23\x92\xce\xee\xd1\x4d\x9d\xe3\x21\
-\xc9\x2b\x04\x84\x82\xae\x87\x69\x52\x72\x84\x92\x76\x9c\xd5\x6f\
-\x87\x7f\x01\x9b\xe0\xbf\xc4\x6f\x13\x78\xb0\xea\xba\xa5\xeb\x78\
-\x8e\xd2\x0d\x3c\xc0\xf1\xae\xc9\xc4\x32\x96\x69\x6e\x7c\xbd\x85\
-\x9c\xc5\xb1\x1d\xc6\x37\x6d\x50\x58\xb6\x6a\xc5\x8d\xbb\x78\x37\
-\x5d\x68\xef\xe3\x6b\x97\x57\x4b\x58\x59\x65\xf9\x56\x46\xc3\x1d\
-\xc7\x9d\xdd\x17\xfb\xb8\xcf\x03\x90\x0a\x78\xe7\xc4\xef\x3d\xb5\
-\xd4\x96\xf6\x66\xdf\x68\x47\x47\x9e\x4f\xdf\x70\xe0\x02\x24\x25\
-\x98\x04\x60\x18\x10\x02\xb0\x38\x01\xb2\xa4\xf8\xd2\xa9\x5e\x29\
-\xd2\x82\xbd\xf7\x39\x7e\x1b\xb4\x27\xc5\xdf\x17\x2d\x95\xcd\xd5\
-\xf4\x7f\x66\xb9\x36\xf3\x16\x7b\x57\x45\xf2\x63\x2c\xcc\xbb\xc6\
-\xe1\xf2\xf0\x0a\x90\xcc\x70\x00\x3c\x64\xe3\xe5\xad\x23\x55\xf3\
-\xfc\x77\xa3\xdb\xc9\x79\x6b\x79\xac\x47\xe1\x98\xec\xf5\x37\x49\
-\x36\xcd\x7d\x7d\x65\x3c\xb6\xec\xca\x4f\xee\xd2\x35\x88\xab\x26\
-\x37\x61\xdc\xfc\xc7\x71\xdd\xeb\xff\x00\xf0\x94\xdf\x78\x99\x66\
-\xb5\xbe\x9a\x36\x88\xa1\xb6\x2b\x21\x0d\xf6\xad\xc5\x9c\x00\xef\
-\x80\xa5\x82\x34\x78\x72\x59\x40\x52\x79\x24\xd7\x93\xfe\xd0\xba\
-\x35\x8f\xc1\x8d\x03\xc1\x7a\xee\x8f\x1d\xec\xbe\x20\xb8\xbf\x4b\
-\xcb\xc6\x43\xe6\x48\x56\x5b\x69\x92\x6d\x81\x95\x57\x7c\x8b\x6f\
-\x01\x0a\x32\xb0\xb2\x7f\x13\xbe\x2b\xeb\xf8\x7b\x0c\xaa\xe1\xe7\
-\x42\x49\xea\x8f\xa0\xe1\xdc\x54\xe8\x62\xa1\x3b\xd9\x5c\xf5\x2d\
-\x7b\x45\x5d\x66\xce\xea\xce\x49\xa6\xbd\xb3\xbc\x8d\xa0\x6c\x29\
-\x32\x01\x24\x5b\xb3\xb3\x3d\x03\x26\x41\xc0\xe5\x87\xcd\xde\xbc\
-\x0f\xf6\x70\xf8\xb2\xb7\xda\x46\xab\xe0\xfd\x48\x5c\x5a\xea\x9f\
-\x0e\x60\xb4\xb1\x9d\xd9\x94\x89\x59\x73\x1a\xc9\x11\xc9\x3b\x46\
-\xc2\xe7\x3d\x98\x0c\x9a\xf7\xef\xb4\xa6\xb3\xa5\x1b\x8b\x78\x56\
-\x18\xa6\x52\xd1\x2a\x48\x0f\x94\x55\x95\x7f\x76\xdc\xac\x99\x2a\
-\x41\x03\x90\x73\xcf\x7a\xf9\xff\x00\xe2\x9c\x7a\x77\xc2\x6f\x8e\
-\xd6\x77\xf6\xb1\x5e\x47\x79\xe3\x38\x1a\x19\xf6\x7c\xd1\x4b\xf6\
-\x50\x78\xc6\x0b\x6e\x3b\xc6\x78\x23\x68\xe4\xe6\xbe\x6f\x2d\x8c\
-\x39\xea\x61\x65\x1d\x6f\xa1\xfb\xbe\x3a\xa4\xdc\x21\x89\x83\xd3\
-\xa9\xeb\x9a\x35\xda\x69\xe9\x2c\x9e\x42\xac\xd2\x4a\x5b\x02\x40\
-\x5a\x7c\x61\xb2\x4e\x03\x6e\xfb\xaa\x48\x20\x90\x0e\x08\xe9\x56\
-\xbc\x6b\xa4\x43\xe2\x5d\x23\x50\xd1\x6f\x26\x69\xb4\x8d\x6a\xdf\
-\xcb\xbb\xb2\x9b\xcc\x58\x98\x05\x1b\x47\x24\x2e\x41\x24\xa9\x51\
-\x91\x81\x9c\xd7\x1b\xe1\x1f\x13\xdd\x6a\xf6\x57\x52\xac\x0b\xa8\
-\x5b\xb3\x45\x1b\xb5\xb0\x24\xcb\x21\x5d\xe7\x72\xa8\x66\x66\x0a\
-\x47\xdd\xe5\xce\x70\x0d\x6c\x4f\xe2\xb9\x22\xb8\x56\x9b\x7c\x52\
-\x5a\xbf\x98\xf3\x28\x6d\x91\x83\x0a\x92\xa1\x5b\x2b\xc9\x38\xeb\
-\x91\xdc\x0a\xca\xb5\x3a\xf4\x65\xca\xa4\xee\x5d\x39\x52\xad\x1b\
-\xce\x2b\x53\xe8\x7f\xd8\x2f\xe2\x36\xbb\xf1\x03\xe1\x07\xc5\x8f\
-\xd9\xd2\xff\x00\x5d\xb1\xba\xf1\x2d\xee\x85\x79\x75\xe1\xa9\x35\
-\x01\x15\xdc\xf7\x16\xae\x9e\x50\x99\xa3\x95\xd2\x29\x64\x47\x12\
-\x42\xce\x4a\x20\x74\x46\x27\x2e\xd9\xf4\xff\x00\xda\x9a\xc2\xea\
-\xc3\x41\x86\xd7\xec\x36\xba\xbe\xb5\x66\x22\x6b\x57\xb3\xb6\x68\
-\xe1\xbe\xb9\x8e\x12\x2e\x26\xdb\x21\xdc\x55\xd8\x48\x72\xf2\x2b\
-\xc6\x58\xe0\x92\x48\xaf\xcf\xff\x00\x15\x5a\x47\x27\xed\x33\xf0\
-\x57\x50\xbb\xb7\x5d\x42\x63\xa8\x5f\x5b\xbc\x2c\x4c\x98\x0d\x00\
-\x62\xc5\x86\x19\x84\x7b\xa1\x5c\x21\x19\x5e\xe0\x8c\x57\xd4\x5f\
-\xf0\x86\xf8\x9b\xc3\x42\xdb\x49\xf0\x9f\x8e\x26\x12\xc8\xb2\x5b\
-\x69\xda\x27\x89\x2f\x3f\xb6\x74\x9b\xd8\x37\x13\xe4\x66\x6c\x5d\
-\xa2\xa0\x70\x55\xe3\x9c\x80\x14\x7c\xac\x3a\xfe\x91\x81\xcc\xaf\
-\x80\x84\x24\xf5\x5d\x4f\x87\xc7\x60\x79\x31\x2d\xc7\x63\xd6\x7f\
-\xe0\x8b\xdf\x18\xf5\x2d\x2b\xe2\x5f\x8a\x7e\x1c\xde\x9b\x7b\xad\
-\x26\xe6\xce\x6f\x13\xd9\x3c\x18\x55\xb7\xb8\x59\xe3\x8a\xee\x14\
-\x87\x92\x51\xe6\x78\xae\x57\x69\x0a\xa6\xf1\x94\x1c\x6d\xdd\xfa\
-\x13\xe2\xcd\x55\x62\xd3\xee\x15\xa6\x6b\x68\x21\x5d\xaf\x23\xfc\
-\xa1\x39\xc0\x2c\x5b\x18\x04\xe7\x93\xd8\x64\xfc\xbf\x31\xfc\x9f\
-\xfd\x8f\x7c\x51\xe2\x3f\xd8\xcb\xf6\xa8\xf1\x3f\x8e\x3e\x24\x68\
-\xda\x87\xfc\x22\xf6\x9a\x75\xde\x81\xe1\xc3\xe1\xfd\x31\xb5\x1b\
-\xad\x4a\x49\x2e\xac\xa4\x96\x6b\x93\x6e\xcc\xca\xf2\x14\x89\x55\
-\x0a\x30\x04\xed\x72\xa4\x90\xfe\x89\xfb\x48\xff\x00\xc1\x55\x2c\
-\x7f\x69\x5d\x07\x57\xf0\x5f\xc3\xbf\x0c\xfc\x49\xd3\x5b\x4d\xbd\
-\x78\xbc\x49\x74\x34\x18\x5b\xcf\x8a\x39\x70\xb6\x91\x4c\xae\x6d\
-\x4a\xdc\x94\x58\xe6\x77\x76\x11\x40\x1d\x4a\x99\x0a\xb4\x7f\x65\
-\x95\xe6\x34\x55\x1d\x64\x8f\x9e\xc5\x61\x66\xe7\x6b\x1d\x26\x83\
-\xf1\x46\x1f\x89\x93\x6a\x5e\x2f\x86\x29\xa1\x8f\xc4\x9a\x9c\xfa\
-\x95\x93\xdd\x33\x3d\xdd\xc5\xb2\xcb\xe4\xd8\xa3\x6f\x23\x02\x4d\
-\xac\xe9\x12\x3a\x88\xd2\x40\x47\x0c\xe5\xbc\x97\xc1\xfe\x18\xba\
-\xfd\xa2\xbe\x30\xeb\x5e\x05\xd1\xfe\xcf\x0f\x88\xb5\x0d\x4e\x4b\
-\x56\xbf\xbc\xb8\x4b\xef\xf8\x47\x1e\x3c\x5c\xfd\xb6\x30\xc4\x19\
-\x22\x12\x5b\x5b\x34\x3b\xc2\xa3\x4b\x7b\xb7\x21\x77\x79\x93\x7c\
-\x48\xf0\x45\xf7\xc6\x6f\x80\x5a\x6f\x86\x63\xba\xb3\xf0\xcd\xae\
-\xbc\xf6\xf6\xb2\x5b\x5b\xb8\x99\xac\x22\x8d\x14\x4c\xcb\xe4\x93\
-\x16\xd5\x8d\x23\x85\x14\x92\x9b\x00\x0c\x64\xc0\xaf\xa0\x7f\xe0\
-\x94\xbf\x05\xf4\xd1\x15\xf7\xc4\x0f\x3a\xc5\xb4\x56\x56\xf0\xff\
-\x00\x86\xa3\x95\x96\x7b\x88\x2c\xed\x8f\x93\xe6\x4b\x36\x15\xa6\
-\x92\x6c\x19\x64\x63\x91\x89\xa2\x50\x14\x44\x18\xf9\xf4\x29\xbc\
-\x66\x29\xd5\x91\xd1\x39\x7b\x3a\x5c\x87\xd5\x7f\xb3\x1f\xec\xcb\
-\xa1\xfe\xca\xbf\x03\xbc\x3b\xe0\x9f\x0c\x88\xfe\xc9\xa1\xc1\x86\
-\xb9\x91\x3e\x7b\xeb\x87\x62\xf3\xdd\x48\x01\xe6\x49\x64\x79\x5d\
-\xb9\xe4\xc9\xd7\x81\x55\xff\x00\x69\x8f\xd9\x63\xc2\xff\x00\xb5\
-\x57\xc3\x8d\x43\xc2\xbe\x2e\xb2\x6b\xad\x32\xfb\x63\xf9\x96\xf2\
-\x98\x6e\xed\xa6\x8c\xab\xc3\x34\x53\x2e\x19\x1a\x29\x11\x1d\x7b\
-\x6e\x45\x27\x23\x2a\x7d\x21\xb5\x34\x8a\x3c\xb8\x93\x0a\x3e\x66\
-\x23\x01\x47\x72\x49\xc7\x1d\x4e\x7b\xe3\x8c\xf4\xa9\x0d\xea\xa3\
-\x38\xe7\xf7\x6b\xbd\xb2\x3a\x0e\x7f\xc0\xfe\x55\xf5\x92\xa3\x0e\
-\x55\x09\x6c\x79\x4e\x29\xab\x48\xfc\xb7\xfd\xb0\x7f\x64\xc6\xf8\
-\x6b\xa2\xe8\xeb\xaf\xdf\xdd\x68\x7e\x25\xd1\x47\xd8\xf4\x4f\x16\
-\xe8\xc2\x2b\x46\xbf\x90\xff\x00\xaa\x11\xa4\xa2\x45\x0d\x28\xc4\
-\x52\xd9\x31\xd8\x49\xde\xbe\x60\xf2\xfc\xaf\x97\x7c\x7e\x97\xdf\
-\x11\xfe\x13\xde\xcb\x37\x99\xa5\xda\xe9\xb7\x92\xd9\xf8\xb7\x3e\
-\x7c\x6d\xe1\x5d\x62\x29\x55\x62\xd7\x6d\xdb\x76\xe8\xe2\x0e\xd1\
-\x4c\xf1\x9d\xa9\x24\x52\xa1\x2c\x0a\x48\xed\xfb\x8d\xf1\x33\xe1\
-\x1e\x87\xf1\x8f\xc1\xda\xbf\x87\x7c\x51\xa5\xe9\xfa\xe6\x85\xac\
-\xc2\xd6\xd7\x56\x37\xb1\x89\x62\x99\x1b\x92\x48\x23\xef\x02\x17\
-\x69\x1c\xae\xc0\xc0\x83\x5f\x8e\x1f\xb5\x7f\xc3\xdd\x7b\xfe\x09\
-\xe7\xfb\x67\xdd\x68\x57\xd7\x57\xda\xa7\xc3\x6f\x10\x69\xd0\xdd\
-\x5b\xcd\x77\x1b\x5f\x49\x2e\x97\x19\x92\x05\xb7\x9a\x46\x39\x96\
-\x5b\x32\x11\x4b\xca\x0e\xfb\x49\xb6\x92\xed\x02\x1a\xf8\xfc\xcb\
-\x29\xf6\x32\x78\x8a\x1a\x58\xf1\xb1\x78\x5e\x4f\x7a\x99\xf7\xdf\
-\xfc\x12\xa7\xf6\x99\xf1\x07\xc6\x2f\x82\x97\x1e\x1b\xf1\xe6\xa8\
-\xda\xb7\x8f\xbc\x18\x16\xdb\x51\xbd\xf3\xe2\x95\xf5\xa8\x08\xc5\
-\xbd\xe6\xf8\xd1\x06\xd9\x02\x9e\x4e\xd6\xc8\x62\xc0\x0e\x6b\xec\
-\x08\x3f\xd4\xa7\x7f\x94\x72\x73\xcf\xe7\x5f\x89\x3f\xb0\x87\xc7\
-\xbf\xf8\x65\x9f\xda\x4b\x54\xd3\xb5\x55\x6d\x16\x1f\x09\xdc\x25\
-\xbd\xaf\x9d\x7e\x24\x8a\xef\xc3\x17\x72\x83\x14\x80\xe1\x43\xad\
-\xb3\x6d\x1e\x63\x1c\x04\x84\x06\x65\xe8\xff\x00\xb5\x5a\x76\xb3\
-\x1d\xdc\x10\xe1\x64\x56\x91\x78\x56\xea\x71\xc1\xeb\x83\xc1\xe3\
-\x90\x0f\xb5\x7b\xd9\x3e\x37\xdb\xd0\x4e\x5b\x9d\xf8\x3a\x9c\xf4\
-\xf5\xdc\xbd\x45\x57\x6d\x4a\x34\x66\x1c\xf1\xd3\x24\x0d\xde\xb8\
-\x04\xe7\x8e\xb4\x36\xa9\x0a\x29\x6c\xb6\xde\x70\x40\xe0\xe0\xe0\
-\xfd\x30\x4e\x39\xc7\x35\xeb\x73\x23\xac\xb1\x45\x31\x67\x0c\x8a\
-\xd8\x23\x70\xce\x3d\x29\xe0\xe4\x55\x5c\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\xbe\x77\xfd\xb6\x3c\
-\x05\xad\x2d\xdf\x87\x3e\x22\x78\x66\x4d\x59\xb5\x8f\x87\xed\x78\
-\x65\x8b\x4e\x84\xdc\xdc\xad\x8d\xd0\x45\xb8\x96\x38\x09\xc5\xd3\
-\x44\x61\x8e\x63\x6a\x08\x69\x92\x26\x44\x1e\x6f\x94\x47\xd1\x15\
-\xc5\x7c\x5e\xf1\x98\xf0\x0f\x84\xf5\x2d\x51\x34\x7d\x7b\x5e\x92\
-\x36\x8e\x0f\xec\xed\x1e\xcc\xdc\x5e\x5c\x34\x8c\x91\x86\x8d\x09\
-\x50\xd8\xde\x32\x77\x28\x55\x57\x66\x6c\x21\xdb\x15\x20\xe4\xac\
-\x84\xef\xd0\xfc\xf7\xfd\xae\xbe\x2e\xde\x7c\x43\xf8\x51\x7d\x37\
-\x8c\xff\x00\xb6\x3c\x37\x1e\xb3\x1d\x9d\xcd\xcc\xfa\x54\x92\xeb\
-\xde\x1d\xd4\x8c\x33\xc5\x71\x69\x77\x61\x14\x88\xe9\xf6\x80\x61\
-\x86\x43\x6f\x2c\x51\x99\xd6\x4f\x28\x33\x48\x04\x8d\xce\x6b\x1f\
-\x0f\x7c\x49\xf1\x56\xe2\xf2\xdf\xc4\x9e\x13\xb3\x9f\x54\x87\x4c\
-\x30\x37\x8b\x34\xa6\x8a\xd6\x2d\x65\xa4\x62\x1e\x25\x81\x59\x67\
-\x8f\x6e\x12\x5d\x9b\x9b\x63\xae\xe8\xe4\x0e\xaa\xc3\xea\x6f\x03\
-\x7e\xcc\x3e\x36\x97\x5e\xba\xf1\xd3\xc9\x6b\xe1\xb8\xfc\x4c\x8f\
-\x76\x3c\x19\x67\x6a\xb1\x43\x64\x65\xc3\xe6\xe2\xe7\x74\x8d\xf6\
-\xa0\x59\xcb\x18\x36\xc5\xbc\xf0\xa4\x65\x9f\x5a\x49\xac\xec\x2c\
-\x6f\x2c\xee\x2d\xe5\xb4\x68\x4e\xeb\xa8\x04\x40\xcb\x0b\xa1\x3b\
-\x5c\x8c\x6f\x2b\xf3\x33\x82\x99\xdd\xb8\x0e\x2b\xe4\xb1\xf8\x6a\
-\xb2\x76\x9b\xd0\xe6\x9f\x35\x99\xf9\x93\xe2\xff\x00\x1a\x78\xcb\
-\xc0\x3e\x28\xd2\x7c\x6d\xe2\xdd\x36\x7f\x0e\xea\xbe\x1f\xd7\xb4\
-\xed\x5b\x57\xdb\x67\x2c\xa9\x69\x77\x6d\x71\x04\x17\xb7\x51\x31\
-\xd8\xa6\x3b\x9b\x3b\x9b\x5b\x98\x97\x80\x65\x82\x75\x55\x59\x18\
-\x83\xf5\x67\xc0\xef\x8d\x9a\x7f\xc3\x7f\x88\x5e\x75\xf6\xa7\x1d\
-\xfc\xba\xa5\x9d\x84\x77\x77\x37\x60\x43\x6b\xa9\x5b\xae\xd3\x6f\
-\x7b\x68\x54\x2a\x5c\x40\x51\xe3\x60\x22\x0c\x54\xc8\xaa\xca\x06\
-\x0d\x77\xfe\x2f\xf0\x48\x8f\x59\xf3\x16\xd6\xe2\x6b\x25\x59\x1c\
-\xc0\xe8\x15\x78\x55\x56\xcc\x72\x31\x56\x38\xc8\x3b\x92\x40\xc0\
-\xf6\x04\x83\xc3\x7c\x49\xf8\x13\x64\x3c\x19\x25\xbf\x84\xd2\xcf\
-\xc1\xba\xd4\x2c\x8a\x92\xd9\xda\xcc\x9a\x55\xd4\xab\x20\x65\x5b\
-\x9b\x5e\x53\x63\x6d\x31\x99\x20\x44\x9e\x2f\x31\xa4\x46\xc1\x64\
-\x6d\xf2\xdc\xc2\x14\x97\xb2\x92\x39\x69\xcb\xa3\x3e\xcb\xb6\xbc\
-\x17\xf7\xd6\xf3\xab\x4c\xd6\xc8\x9e\x7e\x51\x48\x0b\x1b\x01\x8f\
-\x9b\xa1\xce\xe1\x8f\x5c\x8a\xca\xbc\xf1\xde\xa3\x61\xaa\xc3\x1d\
-\xb5\x8d\xe5\xaa\xdb\x8f\x28\xcc\xec\x0f\x9d\x87\x5c\x36\xdc\x6e\
-\xc3\x1f\x94\x9c\x76\xaf\x0a\xf8\x0b\xe3\xbb\xaf\x12\x7c\x2c\xb9\
-\xb0\xbe\x6b\x8b\x4d\x6b\xc2\x6e\xd6\xfe\x22\xd3\x26\x72\xb3\x5b\
-\xbc\x44\x1d\xc5\x14\x28\xf2\x42\xc4\x1e\x37\x8d\x7c\xb9\x23\x60\
-\x53\x23\x20\x75\x3e\x21\xd4\xb5\x7d\x1b\xc4\x96\xf3\x49\x7f\xa9\
-\xc0\xb6\xf7\xb1\xac\xd1\xc9\x11\x58\x64\x28\x2e\x40\x2e\x98\x60\
-\xbb\xa5\x08\x5c\xaf\xcc\x4b\x03\xd0\xe6\xbd\x87\x4d\x4e\x5c\xf1\
-\x67\x64\x64\xb4\x2f\x78\xf5\xfc\x41\x71\xa7\x2d\xbd\xd4\xd1\x34\
-\xb7\x48\x59\xcd\xd7\xef\x3c\xa7\x8c\xc5\x37\x05\x78\xca\xf9\x2c\
-\x72\xa1\x8e\x5c\x7b\xe3\x80\xf1\x17\x8c\xa6\xf0\xf7\x89\x75\x18\
-\x57\xce\x3e\x4c\x9a\xc9\x96\xd9\xa4\x2d\xe6\xbc\x57\x96\xb2\x2c\
-\x61\x14\x1f\x9a\x36\xce\x0f\x05\x8e\x70\x2b\xd0\x7c\x1f\xf1\x4a\
-\xeb\x50\x97\x4b\x8e\xfa\x3d\x35\x64\xba\x50\xb2\xcd\x04\xc5\x4f\
-\x96\xc1\x11\xd0\xa0\xdc\xca\x54\xca\x99\xcb\xed\x62\xf8\xfb\xb8\
-\x35\xd7\xd8\x69\x9e\x1d\xf8\x81\x6f\x34\x37\xda\x7e\x9f\x6b\xa9\
-\x5a\xdc\x3c\x3a\x95\xb2\x27\x94\xd6\xec\x37\x16\xc2\x81\xbf\x0c\
-\x11\x00\x70\x1b\x28\x00\x3b\x87\xca\x37\x8c\x52\x56\xb0\x4f\x57\
-\x74\x79\xc7\x84\x7c\x0d\x9d\x4e\xe5\xb5\x2b\x06\x61\x71\x2d\xa4\
-\x53\xc8\xf1\xfc\xb2\x8f\x22\xea\x02\x99\x04\x13\x88\x9a\x25\x24\
-\x05\x21\x1d\x17\xe6\x24\x11\xe7\x7f\x14\x3f\x6a\xbf\x0a\xfc\x1d\
-\xfd\xa7\xfc\x29\x6f\xab\x6a\x91\x2d\xbc\xda\x1e\xab\xa7\xea\x70\
-\x5a\x91\x72\x6c\x24\x9e\x5d\x35\xed\x56\xe5\xe2\x04\xc2\xdf\xb8\
-\xb9\x91\x55\xb6\x15\x58\xdc\xe7\x03\x15\xf5\x47\x89\x75\x9d\x13\
-\xc3\x1a\x75\xd4\x9a\xb5\xc5\x86\x9c\xb6\xaa\x2e\x9d\xae\xae\xd2\
-\x14\x04\x06\x0e\x5b\x2d\xf2\xae\x37\x02\x49\xda\xa0\xbe\x58\x15\
-\x1b\x7f\x20\x7f\x69\x8f\xda\xab\xc3\x3f\x0a\xff\x00\x68\x1d\x6b\
-\x53\xd3\x7c\x1b\xe2\x3b\xcb\x8f\x11\x6b\x37\xfa\xbe\x91\xe2\xa8\
-\x43\x45\x63\xe2\x8b\x1b\x89\x16\x01\xe4\xdb\xaa\x31\x49\x31\x18\
-\x87\x2c\x8a\x6e\x92\x28\x66\x69\x15\x02\x8a\xf2\xf3\x29\x4a\x38\
-\x79\xb4\xaf\xa6\xc7\x4e\x06\x9d\x39\xd5\x4a\x4d\x23\xf4\x63\x5e\
-\xf8\xf3\xf0\xf7\x5c\x12\x32\xf8\xb3\xc3\x71\xcf\x1c\x27\xcf\x86\
-\x4d\x46\x01\x2c\x0b\xb3\xe5\x2e\x32\x3e\xea\x12\x49\x03\x80\x41\
-\x20\x03\x5e\x33\xf1\x63\xf6\xca\xf8\x4b\xe1\xdd\x07\x56\x5b\xef\
-\x1b\x68\x77\xcb\xbf\xf7\x30\x5b\x37\xdb\x2e\xa5\xf2\xe2\x79\xa6\
-\x88\x43\x10\x66\x7c\x46\x0e\xec\x29\xda\x18\x65\xba\x91\xf3\x2f\
-\xc3\xcf\xdb\x0b\xe1\xcf\xc4\x29\xe7\x87\x54\xb6\x5f\x0d\xea\x91\
-\xce\x91\x13\xa9\x41\x6b\x6e\x65\x97\x05\xbc\xbf\xb6\x37\xee\x43\
-\x36\x0e\x52\x57\x52\xa3\x04\x82\x08\x51\xea\x9e\x1a\x8a\xd3\xc5\
-\xfe\x1d\x9b\x56\xf0\xb4\x36\xb7\xda\x4d\xb8\x6b\x7b\x9b\x9d\x31\
-\x62\xb9\x86\xd3\x68\xda\x52\x41\x09\x6d\xa4\xb3\x3e\x43\x04\x63\
-\xcf\x7c\x93\xf8\xeb\xcd\x2b\x51\x9f\x3c\xe8\xca\xc9\xf6\x3f\x43\
-\xa5\xc3\x38\x6c\x42\xb4\x2b\x2f\xbc\xf9\xf7\xf6\x49\xfd\xb6\xf5\
-\x5b\xbd\x2e\x3f\x0e\xdb\xe8\x72\xb6\x9f\x62\xf2\xb7\x85\xf4\x8d\
-\x52\x36\xd2\x2f\xef\xac\x21\x66\x11\xcd\x0c\x8d\xe6\x47\x74\x61\
-\xb5\x11\xbb\xa3\x98\xe4\x45\x0a\xdb\xe6\x88\xa8\xaf\xad\x3c\x17\
-\xf1\xab\xc5\x97\x1e\x16\x91\x64\xf0\xfe\x8f\xa4\xac\x77\x6c\x75\
-\x1d\x43\x57\xd5\x24\xf2\x6d\xe1\x2b\xf3\x33\x47\x0c\x2d\x3a\x6f\
-\x8c\x05\x58\x8b\x2b\x16\x0a\x4e\x32\x71\xe3\xda\xbf\xec\x6b\xf0\
-\xf7\xc4\x76\x9a\x65\xa5\xa7\x87\xc6\x8a\xb6\x97\x1f\xda\x30\x7f\
-\x62\xdd\x3d\xac\xd0\x4a\x9b\x91\xe5\x8d\xad\xf1\xb5\x94\xb1\xe7\
-\xa3\x00\x57\xa8\xab\x5f\xd9\xfa\xf7\xc0\xff\x00\x08\xb4\x7a\x4e\
-\xb9\xff\x00\x09\x66\x83\x67\x32\xad\xc6\x9b\xaa\xea\x09\x26\xa9\
-\x6a\xbe\x5a\x99\x9a\xde\xef\x85\x95\xa3\x84\x1f\xdc\xcc\xc2\x43\
-\xfc\x32\x0f\xbb\x5a\x56\xe2\xa5\x2b\x4f\x0c\xad\x25\xd1\x9d\x74\
-\xf8\x36\x95\x3f\x76\xb3\xbc\x4e\x77\xf6\x37\xf8\x89\xf1\xdb\xf6\
-\x0b\xf1\x8d\xe6\x95\xaf\x78\xda\xc2\x3f\x06\x5e\xea\x32\xdd\x6a\
-\x72\xcb\xa2\xdd\x78\x83\xc8\xb7\x8e\x07\x68\xda\xde\x14\x31\xcd\
-\x04\xc6\x21\x04\x52\x0d\x92\x80\xb1\xab\x33\x48\xc8\x43\x7d\x2b\
-\xf0\x9b\xf6\x44\xf1\x67\xc5\x1d\x3f\xc5\xda\xf7\x8c\xbe\x27\x59\
-\xf8\xe4\xfc\x40\xbc\xd5\xaf\x2c\x17\x4f\xd2\xd2\xce\xce\xde\xca\
-\xff\x00\x4d\x9b\x4e\xfb\x3a\x6c\x3b\xf1\x24\x02\xd2\x49\x93\x79\
-\x2b\x25\xa4\x64\x4b\xbf\x71\x3c\x7f\x84\x3e\x33\x78\x3f\xc4\xd6\
-\xda\x5d\xb5\x8d\xf5\xbd\xad\xe5\xd4\x71\x4b\x15\xa4\xf2\xa4\x57\
-\x04\x34\x66\x58\xd8\x02\xdf\xbc\xdd\xe6\x67\xcd\x8b\x21\x97\x80\
-\xce\x06\x6b\xcb\x67\xf1\xc6\xa1\xe1\x1f\x1d\x6a\x1a\xe7\xc3\xdb\
-\xef\x14\x78\x5e\xe5\x51\x1b\x5b\xbb\xd3\xa7\x91\xa2\xd2\xe4\x79\
-\x88\x6f\xed\x1d\x11\x8e\x27\xb4\x64\x57\xdf\x75\x68\x1d\x80\x94\
-\xc9\x90\xdb\x65\x1e\xb6\x57\xc7\x98\xaa\x95\x55\x1c\x5c\x2c\x8f\
-\x37\x36\xe0\x9a\x14\xe9\xfb\x5c\x2c\xf5\x39\x5f\x8a\x7f\xf0\xb0\
-\xb4\xbf\x1d\xc3\xe1\x1f\x1e\x78\x5f\x5a\x4f\x17\xc3\xa4\x21\xbb\
-\x97\xc3\xfa\x7c\xd7\xba\x76\xb1\x05\x9a\xb4\x06\xee\xdb\xcb\x47\
-\x78\xcb\x47\x0a\xb3\x44\xcb\xbd\x4c\x99\x20\xa1\x56\x5f\x39\xba\
-\xd5\x74\xff\x00\x0c\xf8\xda\xe3\x4f\xb3\xf0\xdf\x8d\x66\xf1\x55\
-\xe8\x8a\x6b\x88\xec\x3c\x31\x77\x35\xcc\x67\x66\xd8\x1a\x45\x11\
-\xf9\x88\x88\x8b\x8c\x30\x04\x60\xf2\x3a\x57\xd5\xbe\x0f\xff\x00\
-\x82\x98\xea\x1e\x14\xf8\x8d\x6b\x6b\xe2\x6f\x08\xe9\xf6\x7a\xb7\
-\x89\x24\x03\x49\xba\xb0\xbd\x9e\x6b\x6b\xe9\xd5\x23\x90\xef\xf2\
-\x43\x89\xa2\x4f\x30\x6d\x7b\x72\x25\x91\x30\xbe\x42\xca\x1d\x07\
-\xd0\x67\xf6\xe7\xf8\x75\xf1\x32\xfa\x3f\x0f\xc3\xe0\xbf\x88\xd7\
-\x3a\xbc\xc9\x3d\xd5\x82\x4d\x68\x96\x76\xda\xbc\xb1\x12\xac\xb6\
-\xf3\xcd\x34\x6b\x33\x02\x8c\x76\x8c\x10\xad\x93\xb4\x1a\xf5\x7f\
-\xb0\xb0\x58\xaa\xbe\xda\x9c\xf7\xd4\xf2\x56\x6b\x8d\xc3\x41\x52\
-\x94\x6f\x63\xf3\xab\xfe\x19\x57\xe2\x87\xc5\x4d\x27\x4b\xf1\x06\
-\x95\xe1\xdb\xcf\x04\xc7\x77\x71\x18\x7b\xef\x10\xbd\xb5\xac\x56\
-\x96\x85\x8b\x96\x6b\x63\x20\x94\x06\x56\x72\xa3\x6b\x6f\x2c\x06\
-\x10\x74\xd0\xf0\xb7\xfc\x11\xbb\x5f\xbc\xf1\x47\x88\x34\xff\x00\
-\x1c\x78\xd3\xfb\x23\x46\xd0\xe2\x92\xfb\x47\x3e\x1d\x89\xa3\xf3\
-\xfe\xd4\xd8\x74\x9c\xdd\x0f\xdd\xc2\x1f\x63\xec\x1e\x60\xc3\xb4\
-\x21\xc3\xa6\x0f\xe9\x0d\x8d\xc6\x8b\xf1\xef\x4d\xba\x6f\x0f\xb4\
-\x9a\x5c\x9a\x5c\xeb\xa7\xea\x1a\x75\xeb\xc2\x2e\x6c\xa4\xf2\x85\
-\xc1\x47\x2a\xd2\xa0\x77\x32\xa9\x38\x32\x01\x19\x0d\x90\x2a\xbd\
-\x9f\x82\x6e\x26\x8e\xd6\x5b\xeb\xcb\x38\xe0\x2e\x8d\x33\x23\x89\
-\x99\x36\x00\xcb\x01\xc8\x2a\xcd\xe6\x29\x23\x8c\x02\xd9\x2a\xdc\
-\x28\xf5\x70\xb9\x72\xc3\xcb\x92\x94\x7e\x67\xcf\x63\xb3\x4c\x55\
-\x69\x6a\x7e\x70\x78\x6b\xfe\x08\x73\xe1\x5d\x0f\x47\x87\x4d\xba\
-\xf1\x04\x91\x5c\x0d\xd3\x47\x75\x67\x00\xb4\xba\xd3\xa4\x4c\x08\
-\x56\x29\x09\xde\xec\xd9\xc6\xd2\x54\x48\x5c\x46\x31\x20\x69\x0f\
-\xaf\x6a\x9e\x02\xd4\xc7\x88\x22\xb1\xf0\xaf\x8c\xa3\x92\xcf\x45\
-\xb6\xb4\xd3\x35\x0b\x1b\xaf\x0d\xdd\x6a\x11\xfd\xba\x5f\x95\x24\
-\x17\x16\x93\x2f\x91\x09\x8d\x81\x90\x04\x91\xe2\xcf\xcc\xc8\x82\
-\x9d\xe3\xef\x1f\xeb\x76\x56\xbe\x36\xbe\xf1\x16\x83\x36\x97\xa9\
-\xea\x1a\x79\xbf\xbd\xd2\xfc\x51\xad\xc8\x9a\x7d\xa4\x0c\x63\x09\
-\x02\x41\x6e\xac\xe9\x1c\x45\x01\x96\xe2\x5c\x33\xc5\x22\x82\xf1\
-\x79\xc1\x12\x8f\x87\xbe\x2a\xea\xfe\x24\xf8\x44\xde\x2e\xd4\x2c\
-\x7c\x75\xad\x78\x59\xe2\x74\xb1\xd3\xfc\x33\xa7\xa7\x84\xf4\x8b\
-\xcb\x85\x61\x08\x8e\x2f\x3d\xd6\xfa\xed\x99\xdb\x11\xc7\x13\x22\
-\xc8\x63\x95\x42\x9c\x79\x63\x7c\x56\x12\x33\x5f\xbc\x8d\xfc\xcf\
-\x9f\xab\xef\x3f\x78\xf3\xef\x0e\xf8\xeb\xe2\xae\xac\xd7\x9a\x0e\
-\xad\xf0\xc6\xee\xd6\xe3\x4c\x90\x3b\xdd\xdc\x3c\x9a\x76\x97\x35\
-\xc2\xb0\x0a\xd1\xb3\x47\x9f\x2c\x16\x72\xc8\xca\xb2\x2c\x43\x71\
-\x4d\xbb\xb3\xca\xf8\xf3\xe3\x6e\xbd\xab\xa6\x9a\xda\x06\x91\xe1\
-\x7b\xab\x5b\xed\x36\x2b\x99\x84\xb7\x77\x50\xdc\x59\xa1\x2c\x93\
-\xa3\x89\x22\x0a\x44\x67\x78\xdd\xbb\x6b\x60\xe0\x83\xf7\x3e\xa1\
-\xf0\x97\xc5\x88\xf4\x9f\x00\x69\x50\xf8\xdb\xc1\xf7\xde\x01\x9a\
-\xd6\x34\x4b\x38\x75\x5d\x5b\xfb\x66\xee\x72\x5b\x78\x8c\x94\xc4\
-\xf3\x5c\xed\x2a\xd2\x47\x99\x1d\xb7\x46\x3e\x6e\x63\x3e\x41\xf1\
-\x07\xc5\x30\x78\x8f\xc5\x6d\xa3\xe9\x1a\x4d\xfd\xc5\xf5\x8a\x2d\
-\xfc\xe2\xdc\x06\x94\xfd\xaa\x5f\x91\x52\x3d\xbf\x2e\xd6\x80\xc8\
-\xdb\x80\x5c\xcb\x80\xb8\x04\xb7\xc8\x63\x28\x4e\x31\x9c\xb0\xf4\
-\xf5\x5e\x47\x66\x47\x80\xc3\x56\xc5\x72\x62\xfe\x13\xc9\xbc\x2f\
-\xe2\x6f\x89\x3e\x20\xd3\xef\xb4\xdd\x42\x1f\x07\xb4\xd7\x56\xff\
-\x00\x67\x94\xc5\x65\x3c\x31\x98\x65\x2e\x36\x14\xf3\x15\xc3\x79\
-\x6a\x15\x88\x3d\x70\x8a\x15\x83\x39\xf3\x8f\x8f\x1f\x02\x3c\x75\
-\xe3\xcb\xdb\x3d\x66\x3f\x10\x58\xea\x97\xb6\x7b\x64\x30\xba\x3d\
-\xb4\x25\x4c\x69\x1c\xcd\x6e\xca\x77\x44\xc7\xcb\x0b\xb4\x82\x85\
-\xbc\xc7\xda\x3c\xc6\x53\xe9\xbf\x0a\xbe\x1f\xfc\x4a\xba\xd5\x35\
-\xa8\xb5\x6b\x1f\x26\xd5\x6e\x94\x5a\x34\xb6\xeb\x6f\x67\x6f\x0f\
-\x9f\x24\x3f\x66\xf3\x9d\x8f\x05\xc2\x8d\xb9\x69\x38\xc1\x56\x5c\
-\x57\x77\xe3\x1f\x80\x1e\x3e\xd1\x2d\x35\x2b\x6b\x7b\x1b\xad\x56\
-\x65\x2f\x0c\xef\xa5\xcd\xfd\xa5\x70\x1c\x6c\x59\x20\x75\x85\x59\
-\x51\x97\x72\xa9\x5d\xc5\x88\x19\x50\xdc\xe3\xcc\xa7\x88\xcd\xa9\
-\xce\xf8\x64\xb6\xd7\x43\xf4\x6a\x79\x4e\x4d\x4a\x0e\xda\x34\xff\
-\x00\x03\x80\xf8\x77\xe1\x0b\xaf\x05\x78\x52\xcb\x4f\x8f\x5d\xbc\
-\xfe\xc9\xfb\x32\xe6\xea\x69\x55\xa4\x91\x99\x0f\x9a\xe8\xe7\x63\
-\x26\x5a\x44\x7c\x01\xb4\xee\xe1\x46\x54\x1e\x67\xf6\xdb\x8a\xd6\
-\xf7\xe1\xd7\x85\xee\x2d\xe4\x96\x3b\xeb\x1d\x56\xd2\x59\x72\x88\
-\xb1\x98\xa4\xd9\x68\xe5\x80\x60\xd9\x26\x56\xc6\xce\x33\x1f\x23\
-\x83\x8f\x4f\x9b\xe1\x37\x8f\xae\x35\x99\x34\x99\xfe\x1e\xf8\x83\
-\x5a\xb7\x92\xf2\xe7\x4e\x12\xcb\x60\x23\x85\x5e\xdb\x2a\xca\xb2\
-\x33\x2a\x7c\xec\xc3\x61\x62\xaa\x51\x4e\x0e\x76\xe3\xcb\xfe\x24\
-\x7e\xc6\xbf\x1b\xbe\x22\x4f\x17\x83\xdb\xc2\x30\xe8\x72\x35\xec\
-\x97\x93\x5d\xea\x17\x71\xc4\x89\x65\x16\x1d\x23\x5b\xa5\x67\x55\
-\xba\x9a\x65\x61\xe5\xfd\xe4\x28\xb2\x36\xd2\x46\xc3\x2d\xc8\xf1\
-\x8f\x16\xab\x4d\x59\xbd\x59\xd9\x8f\xce\xb0\x54\xb0\xfe\xca\x0e\
-\xfa\x19\x7e\x02\xf8\x93\x08\xd6\x16\x1f\xb1\xdc\xc9\x0f\x93\x32\
-\x21\x79\x1a\x71\x79\x34\x5b\x55\xd9\x40\xc2\x8c\xb4\x52\xe0\x27\
-\x46\xe4\x10\x0e\xda\xea\x23\xf1\x6c\x3e\x24\x8e\x46\x86\x2f\xb4\
-\x5d\x5a\x46\xd0\xa4\x0e\x99\x8c\xba\xec\xe0\x15\xc2\xc6\x42\xb2\
-\x8c\xb7\x71\xf3\x6d\xac\x1f\x01\x7e\xcc\x5e\x30\xf0\xc5\xf2\xc7\
-\xab\xda\xea\x5a\x2e\xb9\x36\xa4\xb6\x4b\xe1\x88\xad\xae\xe5\xb9\
-\x89\xe5\xc2\xa4\xf6\xf3\x2c\x3f\x67\xd8\xec\xde\x63\x32\x4a\x51\
-\x42\x33\x39\x45\x60\x4f\xb0\x6b\x5f\xb2\x2f\xc5\x2f\x88\xe1\xad\
-\xfc\x23\xe1\xd4\xd1\xe4\xd4\x1a\x58\xf5\x4d\x47\xc4\x76\xb2\xc7\
-\x0e\x99\x26\x01\x45\x88\xa9\x69\x2e\x82\x98\x95\x82\xc6\x81\x41\
-\x70\xa4\xed\x50\xc7\xd0\xc6\x64\x38\x97\x5b\x6d\x0e\x0c\x2e\x7f\
-\x84\x85\x3d\x5e\xa5\x1f\x84\xda\x2c\x3e\x37\xfd\xaf\xbc\x0b\x35\
-\xf7\xee\x74\xef\x0c\xdb\xcb\xab\x6a\x05\xf0\xc1\x8f\x9c\x59\x03\
-\x28\xc6\x40\x6b\x64\x58\xc2\xe0\xc8\xf2\x2a\x0d\xc6\xbe\xfa\xf0\
-\xaa\xc5\x6b\x67\x0f\xdb\x34\xf8\x65\x5b\x72\xed\x13\xcf\xa6\x33\
-\x49\x6a\x64\x12\x26\x09\xd9\x95\xdf\xe5\x8d\xbc\x8c\xf2\x78\x0a\
-\xc5\x7c\x1e\xcb\xfe\x09\x35\x7d\xe2\x0f\x82\x9a\xde\x91\x7b\xe2\
-\x8d\x5b\xc3\xf3\xeb\x97\x06\xef\x52\x8e\xda\xe0\xea\x49\x78\x12\
-\x08\xa0\x89\x66\x17\x4b\xe6\xdc\x4a\xa6\x2f\x35\x65\x88\xc2\x54\
-\xc8\xca\x0e\xcc\xee\xea\xb4\x9f\xf8\x25\xf4\x7a\x2c\xda\x95\xf3\
-\x7c\x46\xf8\xc1\x67\x7d\x34\xe6\x3b\x1b\x95\xf1\x95\xd2\xfd\x9a\
-\x06\x96\x2c\x44\x13\x2e\x0a\x93\x11\x25\x58\x1c\x12\x32\x32\xb9\
-\xaf\x4e\x96\x43\x53\xd9\x28\x39\x1e\x36\x23\x3f\x84\xaa\x73\x45\
-\x1e\x9b\x2e\xa7\xe1\x39\xf5\xe9\x6d\xe5\xd2\xf4\xb3\x7e\xd7\x00\
-\x47\x1b\xc1\x71\x0c\x90\x90\x83\x82\xaa\x57\x25\x92\x56\xc9\x39\
-\xc8\x62\x0e\xfc\x85\x3e\x61\xf1\x07\xc5\xfa\x4e\x95\x68\x91\xb3\
-\x40\xb7\xcc\x52\xdd\x2d\xe4\xb7\x05\xa1\x46\x56\x2a\x84\x3b\xab\
-\x0d\xe5\x65\x6c\xe5\x03\x11\xdc\xf1\x5d\x4e\x85\xfb\x19\xf8\x6f\
-\xc3\xde\x1d\xbc\xd0\xb5\x4b\x8d\x5a\x6b\x1b\x5b\xb9\xb5\x2b\x4b\
-\xbb\x2d\x4a\xea\xd1\xa0\x59\xa6\x69\x76\xcd\x72\x92\x6f\xb8\x20\
-\x8c\xa4\xac\x77\x81\xb5\x73\x85\xe7\x79\x7f\x62\x2f\x01\xd9\xde\
-\xdd\xb2\xe8\x1a\x5e\xa4\xb7\x88\x20\x95\xb5\x29\xa4\xd4\x26\x68\
-\x54\xe5\x20\x8a\x49\xbc\xc6\x86\x34\x69\x5d\xd7\x6b\x6d\x5d\xc4\
-\xaa\xa9\x35\xd9\x83\xe1\xf9\x53\x7e\xfc\xf4\x39\xeb\xe7\xce\x5f\
-\x0c\x4f\x99\x3e\x31\x7e\xd2\xf7\x9e\x23\xd4\x57\xc3\xfe\x11\xba\
-\x9a\xff\x00\xe2\x2f\x88\x12\x7b\x0d\x0b\xed\x3e\x4b\x47\xa7\x2c\
-\x40\x4b\x79\x7f\xe4\xee\x1f\x35\xbc\x0b\x72\x7f\x78\x08\x32\x05\
-\x4f\x2e\x46\x21\x8f\xd4\x5e\x11\xfd\xa0\xf5\x46\xfd\x9a\x13\xc2\
-\xff\x00\x0f\xfc\x0f\xf1\x0b\xc1\x7a\x2e\x93\xa1\xc3\x6f\xa0\x78\
-\x82\xfe\x2b\x18\x2e\x6d\x7c\x89\x23\x31\xbb\x59\x3c\xff\x00\x69\
-\x3f\x68\x0c\xac\xe7\xcb\x32\x2a\xcb\x9d\xa2\x4c\x06\xd5\xf0\x5f\
-\xec\xcf\xe0\xbf\x87\xba\xa5\x8d\xf6\x8b\xa0\xe8\xfa\x3e\xb9\xe1\
-\xfd\x39\xf4\x3f\xb4\xd9\xda\x47\x64\x3e\xc4\x5e\x32\xe9\xe5\xa1\
-\xd8\x10\x30\xe6\x51\xb9\xcf\x00\x61\x46\x0f\x45\xe1\x2f\x0f\xda\
-\x69\xfa\xd5\xfc\x48\xa6\xd6\xcd\x64\x92\xe9\x95\xe0\xdd\xe6\xb6\
-\x76\xf2\x09\x04\x66\x40\x54\x8e\xc0\x1c\x67\x20\xaf\xd3\xe1\x94\
-\x30\xfa\x53\x47\x87\x57\x11\x56\xab\xbc\xd9\xc4\x78\x3f\xfe\x0a\
-\x0f\xe2\x0f\x1b\x69\x73\xe8\xf7\x1a\xa5\xae\x9f\xab\x79\x27\x4d\
-\x6b\xf8\xec\x16\xd3\x53\xf0\xb5\xec\xcd\x2c\x50\xcf\x75\x6b\x70\
-\x4f\x9d\x13\xc8\x55\x23\x99\x48\x8e\x49\x42\xa3\xc7\x14\x8d\x81\
-\xb1\xf0\xdf\xf6\xf9\xd4\xbe\x2e\xf8\x6b\x4f\x87\x45\x8c\xff\x00\
-\xc2\x73\x68\x2f\xf4\xc3\x08\x86\x48\xad\x2f\x35\x2b\x24\x62\xe2\
-\x30\xc5\xb6\x43\x29\x52\xc9\xe6\x3e\x70\x58\x12\x48\xe7\xb2\x6f\
-\x87\x5a\x65\xc2\x46\x2e\xa1\x86\xe7\xed\xd0\x9d\x36\xe4\xcc\x80\
-\xc9\x34\x05\x19\x45\xbb\x3e\x37\x18\xc0\x90\xa1\x56\xde\x36\xb3\
-\x05\xc0\xeb\x63\xc3\x1f\xb2\x87\x82\x7c\x2b\xad\x78\x2f\x50\xd2\
-\x74\xdb\x4d\x0d\xbc\x27\x24\xb1\xda\x26\x94\xbf\xd9\xf6\xe1\x25\
-\x69\x01\x87\xc8\x8c\xa2\x98\xd9\x9d\x9b\xe6\x57\xf9\xc3\x3e\x03\
-\x12\xc7\xaa\x53\xa9\x29\x73\x19\x7b\xdd\xcf\x72\xd0\x7f\x68\x2d\
-\x13\x52\xd2\xef\x6e\x26\x87\x52\xb3\x6d\x3c\xda\xe6\x19\x60\x06\
-\x49\x23\xb8\x11\x79\x52\xc6\x10\xb6\xf8\xcb\x4a\x23\x2c\xb9\xda\
-\xe8\xe0\xe3\x19\x3f\x22\x7f\xc1\x58\xfc\x1d\xa3\x7c\x78\x8f\xc3\
-\x57\xda\x1c\xfa\x16\xa5\xab\x78\x06\xfa\x29\xef\xa0\x0e\xc7\x54\
-\xb0\x82\xf2\xf2\xd1\x12\x48\x21\x61\xb1\xe2\x91\xe1\x71\x23\x30\
-\x27\x01\xf6\xe4\xa3\x29\xf5\x5b\xcd\x0e\xc9\x74\x6b\xcd\x3e\xee\
-\xeb\x52\x55\xf2\x65\x16\xbe\x59\x6b\x7f\xec\xa7\x9d\x04\x6e\x60\
-\x63\xf3\x2f\xc8\x5c\x0c\x93\xcb\x76\x50\x14\x71\xff\x00\xb5\x37\
-\xc2\x68\xbf\x68\x2d\x02\xd6\x0b\xa1\x0d\xed\xd4\x6e\xec\x8d\xaa\
-\xdb\x8b\xbb\x3f\x38\x07\x68\x58\xc4\x0a\xee\x55\x66\x60\xcb\x90\
-\x1d\x51\x39\x1b\x54\xab\xa9\x55\x54\x83\xa4\xd6\xe5\xd4\xa8\xa5\
-\x1e\x53\xe1\xcf\x89\x5a\x2b\x7c\x11\x8b\x5a\xd1\x75\x2b\x3b\x79\
-\xac\xbc\x10\xf6\x13\xe9\x91\xde\x48\x24\x56\xd0\x35\x1b\x88\xbc\
-\xc8\x64\x32\x2e\xf9\x21\x42\x6e\x90\x19\xb6\xa8\x16\xe8\x1f\x72\
-\x11\x8f\xd2\x8f\xf8\x27\x7f\xc4\x66\xf1\x07\xc1\x16\xd1\x6f\x9a\
-\x38\xe6\xf0\x85\xd8\xd2\xed\xd1\xae\x0c\xd2\x35\x9f\xd9\xd2\x4b\
-\x39\x25\x76\x24\x89\x3e\xce\xeb\x13\x6f\x6c\x93\x0b\x1e\x4d\x7c\
-\xbd\xfb\x48\xfe\xcc\x57\x9f\xb4\x1d\xcf\x88\xb4\xbd\x47\x54\xfe\
-\xc5\xb1\xba\xf0\x28\xf0\x8c\x49\x61\x16\x66\xb3\x61\x74\xf7\x0b\
-\x70\x8e\x43\x19\x22\xc1\x58\x1a\x22\x58\x95\x2d\xd3\x00\x9e\x9b\
-\xe0\x0f\xc1\x3f\x12\x68\x3a\x7f\x89\x2f\x3c\x4d\x71\x24\x7a\xbe\
-\xb9\x67\x63\x69\x28\xd2\x35\xa9\xec\xc1\x36\xd6\xcd\x14\x4f\x1c\
-\x96\xee\xad\x18\x01\xcb\xe5\xf2\x77\x30\x6d\xa8\xcc\xd8\xf2\xf0\
-\xb1\x8e\x06\x52\x69\xdd\x33\x96\x8f\xee\x9b\x3e\xac\xd6\xff\x00\
-\x69\x8d\xbf\xb5\x3e\x8f\xf0\xc3\x4a\xd1\xee\xb5\x09\x64\xd2\xee\
-\x75\x7d\x67\x51\xf3\x84\x76\xfa\x54\x49\xb0\x44\x02\x9c\xb4\xed\
-\x24\x92\x20\x65\x4e\x23\x57\x42\x48\xc8\xce\xd2\xfc\x45\xbf\xbe\
-\xf8\xe0\xbe\x1d\xd3\x6d\x6d\xe5\xd1\xf4\xfd\x36\x6b\x9d\x56\xf6\
-\x55\x62\xd6\xf3\x6e\x88\x5b\xc0\x87\xee\x9d\xdb\xa6\x66\xcf\x23\
-\xcb\x1e\xf5\xf3\x5f\x82\x7c\x6f\xff\x00\x0c\xdd\xe1\x7f\x15\xda\
-\xe8\x71\x5a\xc7\xae\x6a\x52\x19\x52\x6b\xe3\x2d\xd0\x8e\x63\x20\
-\x8b\xce\xba\x6f\x31\x99\xa1\x81\x42\xe7\xe6\x00\x28\x1b\x4a\x8d\
-\xc5\xb4\x3e\x0d\xfe\xd5\x9e\x1b\xf8\x6f\xac\x5a\x78\x6e\x2d\x6b\
-\x4b\xd7\x6e\x35\x6d\x5f\xec\x0f\xa8\x88\x26\xb7\x86\xee\xe6\x40\
-\xc6\x38\x23\x98\xee\x8c\xb0\x27\xcb\x05\xd8\x06\x2c\xb9\x23\x7a\
-\x6e\xec\xfe\xd4\x55\x25\x15\x13\xa6\x35\xd3\x3e\xc6\x8a\x50\xd1\
-\x2e\x7a\x95\x07\x1d\x7f\x5e\x95\x61\x4e\x54\x56\x56\x8d\x3b\x7d\
-\x90\x2b\x48\xd2\xf9\x8d\x94\x2b\x11\xda\xab\xdb\xa0\xe3\x8e\xc7\
-\xa5\x69\xc6\x72\x8b\xdf\x8e\xb5\xed\x43\xc8\xeb\x4e\xe8\x75\x14\
-\x51\x5a\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x55\
-\x1b\x9d\x20\xcd\x23\x30\x60\xbf\x38\x70\x00\xdb\xb8\x8e\x9b\x88\
-\x19\x3f\x40\x46\x40\xc1\xe0\x9c\xde\xa2\x93\xbf\x40\x21\x16\x6b\
-\xe4\x88\xcf\x2b\xb4\x2f\x5c\x74\xe9\xd3\x8a\xe1\xfc\x79\xf0\x13\
-\x47\xf1\xfe\xbd\x6d\xa9\x5e\x43\x22\x5c\x5a\xc6\xf1\x03\x14\xcc\
-\xa2\x40\x4e\x40\x7c\x60\xb0\x53\x92\x06\x47\x5c\x74\x15\xdf\x53\
-\x70\xd9\xfe\x1c\x56\x35\x29\xc6\x7f\x12\x13\x57\x3c\x47\x54\xfd\
-\x9a\xa0\xd3\x06\xeb\x1b\xc9\xe1\x4b\x65\xf2\xe3\xb6\x6f\x9a\x0d\
-\xbb\x40\x0b\x96\xcb\x63\x8f\x5e\x95\xc3\xf8\x8b\xe0\xdd\xfe\xa1\
-\xaf\x18\x64\xfb\x6e\x96\xd3\x3a\xcb\x2c\xb6\xac\x4a\xc8\xe0\xfd\
-\xfe\x72\x0e\x17\x01\x73\xb7\x03\x83\x9e\xb5\xf5\x14\xb6\xbe\x78\
-\x65\x60\xbb\x4f\x23\xeb\x51\x4b\xa6\xf9\xa5\xb3\xb7\x6b\x75\x5e\
-\x8a\x7e\xa3\xbd\x79\x75\xb2\x78\xcf\x55\xa1\x84\xb0\xe9\x9f\x31\
-\x78\xcb\xe0\xbd\xb7\x89\xb4\x3b\xdd\x37\xc4\x5a\x3e\x97\xe2\x68\
-\xee\xa0\xb6\x13\xae\xa3\x6e\x93\xf9\xa8\x92\x3b\x24\x6a\x72\x00\
-\x54\x32\x3e\xd5\xe8\xa7\x24\x00\xcc\x58\x79\xe4\x3f\xb1\x76\x9b\
-\x67\xa7\xb5\xd7\x87\x2d\xaf\xbc\x0f\xaf\x48\xd1\xde\x7f\x6c\x69\
-\xd7\x97\x17\x0c\xb2\xab\x09\x51\x4c\x37\x0f\x24\x72\xc6\x8c\x02\
-\xac\x6c\x00\x45\xfb\xa5\x5b\x93\xf6\xc4\x9e\x1b\x8a\x59\xd1\x8a\
-\x47\xb6\x30\x36\xae\x06\xd1\xce\x7a\x63\x8f\xae\x6a\x53\xa2\x46\
-\xf6\xea\xac\xa8\xdb\x78\xc1\x19\xa8\xa7\x96\xd7\xa6\xfd\xd9\x11\
-\xf5\x76\x7c\x17\xe1\x0f\xd9\xbb\xc6\x5a\x05\xea\xdc\x5f\x7c\x4a\
-\xf1\xcf\xf6\x95\x8f\xfc\x83\xee\x20\xb3\xb3\x8a\xd2\xdb\x2b\x1a\
-\x97\xfb\x23\x5b\x4b\x19\x62\xb1\x26\x4e\x72\x48\xce\x45\x33\xc6\
-\x1f\x00\xfe\x32\x78\xcf\x5f\x9d\x6d\x7e\x2a\x78\xca\x1b\x39\xa3\
-\xcc\x2b\xa6\x5b\xe9\xda\x54\xeb\xb0\xb0\x45\xf3\x84\x06\x69\x11\
-\x41\xce\x08\xc9\xe9\xcf\x53\xf7\x8b\x68\x16\xe0\xed\xf2\x63\x6e\
-\xa0\x92\xbc\xff\x00\x3a\xad\x67\xe1\xe8\x6d\x98\x95\x5d\xb8\x05\
-\x47\x03\x82\x4f\x38\x24\x12\x33\xec\x6a\xaa\x65\xb5\xea\x69\x39\
-\xfd\xc6\x9e\xc5\xdb\x73\xe1\x9f\x03\xff\x00\xc1\x3c\x5b\x42\xf1\
-\x2e\xb1\xad\x6b\xba\x3d\xbf\x8b\xf5\xdd\x4a\x58\x0a\xeb\x7e\x25\
-\x93\xfb\x6f\x52\x41\x0c\x4a\x23\x58\xa5\x99\x03\x40\xb1\xb0\xdd\
-\x1a\xc6\x02\x23\xfc\xc4\x3f\x2a\x7d\x6a\xc3\xe0\x3e\xa9\xe1\xdd\
-\x2b\x1a\x91\xd4\xae\xa6\xb7\x7c\xdb\xb2\xdc\x06\x54\x38\xc4\x8c\
-\x85\xb7\x30\xcf\x4c\xe7\xe6\x1d\x3c\xb1\xc5\x7d\x2b\xfd\x92\xb1\
-\x9f\x96\x35\xda\xb8\xdb\xc9\xcf\x5e\x79\xee\x31\x8e\x2a\x39\x34\
-\x35\x89\x64\x91\x23\x56\xdc\xa5\x4a\x11\xf2\xfd\x7d\xab\x3f\xec\
-\x15\x25\x69\x4d\x8b\xea\xe9\x6a\x7c\xa7\xa0\xe8\x1a\xc5\xe3\xdd\
-\x5a\xdf\x59\xde\x6a\x10\x93\x14\xcf\x6d\x75\x14\x52\xda\x95\xc2\
-\x81\x12\xab\x02\x38\xf9\x89\x62\x0e\x78\x00\x27\x2d\x57\xae\x7f\
-\x65\x9f\x07\xf8\xaa\xd2\xde\x0d\x63\xc1\xba\x3e\xa5\x71\x62\xcb\
-\x3d\x99\xb4\xb5\x4d\x3e\xea\xc2\x68\xe5\x67\xf3\x22\x9a\x15\x43\
-\x13\x6e\x67\x6d\xc8\x46\xdc\xe7\x69\x62\x4d\x7d\x0d\x65\xe1\xbb\
-\x78\x26\x65\xf2\x55\x73\xc8\xe4\xf0\x7d\xea\xd2\x78\x78\x42\xad\
-\xb5\x7e\xf6\xe1\x8c\xe1\x46\xee\x09\xe9\xcf\x00\x75\xef\x5a\x52\
-\xc8\xd5\x35\x6b\xab\x7e\x66\x90\x8c\xe1\xef\x29\xbd\x0f\x8b\xff\
-\x00\x68\x5f\xd8\x9e\xc7\xc7\x5e\x08\xd6\x35\x09\x6d\x7c\x47\xaa\
-\x30\xf3\x2f\x63\x4b\x1b\x64\xfe\xdc\xf0\xf4\xeb\x91\xe7\x58\x3c\
-\x60\x2d\xcb\x46\x09\x61\x6e\x50\x4b\x2a\x9d\xa1\x98\x61\x2b\xe3\
-\x9d\x39\x3c\x71\xa6\x4f\x67\xad\x49\x75\x63\x63\xe2\x8d\x52\x24\
-\x30\xeb\x29\x64\xb7\x1e\x16\xf8\x82\x91\xba\x9b\x6b\x94\xb8\x1f\
-\xf1\xef\x70\x01\x58\xf0\xe1\x65\x81\xd9\xe3\x29\x2a\xac\x6b\x1f\
-\xed\x2a\x68\xaf\x24\x6c\xbe\x69\x5f\x31\x70\xec\xb9\x52\x7e\x98\
-\xe9\xdf\xa1\x18\xc9\x3c\x93\xb8\x78\x8f\xc6\x7f\xd8\x57\xc2\xbe\
-\x3a\xb3\xf1\x03\xc7\xa2\x69\xf7\x56\x3e\x20\xb6\x73\xab\xf8\x79\
-\xc7\x93\xa6\xeb\x17\x5f\x37\x97\x72\x42\xaf\xee\x6e\x41\x3f\xeb\
-\xe3\x5c\x91\x9d\xca\xe4\x21\x4f\x0f\x37\xe0\xfc\x3d\x7a\x6e\x78\
-\x78\xa8\xcc\xfa\x9c\xab\x89\xb1\x54\x26\x95\x67\xcd\x13\xf2\xca\
-\xf7\x44\xf0\x9f\x8d\xf5\x9b\xaf\x0e\xf8\x36\x09\x05\xe4\x37\x5f\
-\xdb\xb1\xf8\x27\x57\xb9\xfe\xc6\xd4\xb4\xab\xa3\x19\x26\xef\x49\
-\x9a\x64\x68\xd4\x17\x40\xcf\x12\x46\xf1\xe1\x99\x94\x22\x31\x57\
-\xb9\x6f\xa1\xf8\xc3\xe3\x35\xc7\xf6\x4e\x87\xa7\xf8\x7f\xc7\x9e\
-\x2c\xd1\x6d\x65\x7b\xcd\x02\xea\xf9\xbc\x27\xe2\xed\x28\x82\x4c\
-\x77\x11\x9d\xe6\x37\x8a\x31\x30\x56\x54\x61\x19\x04\x18\x8c\x84\
-\x31\x1f\x62\x78\x57\xfe\x09\x6f\xa8\xe9\xff\x00\x0f\x35\x2d\x17\
-\xc5\x16\x70\xf8\xc2\x6d\x37\x50\xdd\xa3\xcb\x73\x2c\x4d\x75\x22\
-\x32\x29\x8a\x78\xa4\x73\x98\x27\x89\x4b\xc6\xc4\x10\x1f\xcb\x2f\
-\xce\xed\x83\x7b\xc1\x3f\xf0\x4d\xfd\x53\xc7\xda\x06\x9b\x71\xe2\
-\x8f\x12\x6a\xfa\x4d\xfe\x97\xaa\xfd\xbe\x28\xaf\x6c\xac\x75\x0b\
-\x8b\x71\x14\x9b\x7e\xd3\x6f\x3e\x1a\x5b\x57\x9e\x30\x46\xdf\x35\
-\xca\x79\x8c\x46\xcc\xed\x1f\x3f\x95\xf0\xb6\x2a\x2f\x96\xac\x7e\
-\x67\xaf\x98\x67\xd8\x79\x7e\xf2\x83\xd5\xf4\x3f\x38\x3e\x04\xc5\
-\x79\x1d\xce\xa7\x35\xd5\xc6\xb9\xe1\xfd\x43\x58\xbb\x78\x2e\xbc\
-\x1b\xe2\xbd\x24\x5d\x4b\x3b\x41\x2c\x70\xb2\xc5\x0c\x23\xfd\x37\
-\x6c\xb1\xc9\x13\x4b\x10\x86\x78\xca\x65\x9d\x80\x2b\x5f\x62\xf8\
-\x53\xe1\x4f\xc6\x8f\x09\x78\x4a\xce\x2d\x27\xc2\xbe\x34\xb4\xf0\
-\xcc\x2d\xf6\xbb\x1d\x24\x5d\xda\xeb\xfa\x7d\xb1\x12\x06\x55\x44\
-\x9c\xc1\xaa\x45\x19\x91\xe4\x62\x21\x68\xc8\x42\x15\x36\x80\x01\
-\xfb\xe3\xe1\xd7\xec\xdf\xe1\x9f\x85\xda\xee\xb1\xab\x69\x36\x33\
-\x47\xab\xeb\xeb\x12\x5e\xdd\xdd\xde\xcf\x7b\x34\xd1\xc7\x9f\x2a\
-\x3d\xd2\xbb\x32\xc6\x85\x98\xec\x42\xa0\x9e\x4d\x75\xf7\x3e\x1f\
-\xfb\x40\x7c\x18\xe3\xf3\x77\x07\x64\xdc\x1b\x04\x2e\x48\x39\xfb\
-\xd9\x55\x20\x90\x70\x17\x18\xe7\x35\xf5\xd8\x6e\x19\x85\x19\xf3\
-\xc2\x5a\x9f\x2f\x5b\x35\x95\x45\x66\x8f\x02\xfd\x92\xbe\x1b\xdb\
-\x68\x7f\xb3\x6e\x82\xd1\x7c\x35\x1f\x0b\xee\x2e\x2d\x24\x7b\xef\
-\x0e\x09\x03\x3c\x1f\xbc\x77\x5f\x36\x40\x70\xcf\x26\xe1\x39\x32\
-\x31\x99\x5e\x52\x0b\x64\x62\xba\x77\xf8\x7f\x73\x6f\x7f\x24\xa1\
-\xa5\x93\x7a\x15\x0c\x42\xb7\x97\x96\xe4\x91\xb7\x18\x2b\x8c\x77\
-\x1e\xbd\xeb\xd5\x4e\x88\x63\x75\x68\xc4\x6a\xd1\xf0\xad\xb7\x18\
-\xe8\x7a\x0c\x2f\x65\x5f\xbb\x90\x07\x5e\xd4\x49\xa7\x0b\x61\xba\
-\x38\x57\xe6\xf9\x00\x27\x83\xf5\xfa\x76\xaf\xa1\xfa\xba\xb5\x8f\
-\x2d\xa4\xdd\xcf\x98\xfe\x30\x7e\xc4\x1e\x04\xf8\xb1\xad\x9f\x15\
-\x5f\x78\x47\x46\xbc\xf1\x77\x95\xe6\x79\xd7\x6b\x22\xda\x5f\xdd\
-\x47\xc4\x1f\x69\x84\x3e\xcb\x85\x46\x48\xd7\x25\x24\x21\x01\xe5\
-\x1b\x0c\x3c\xcf\xe0\xdf\xec\x75\xf1\x3f\x5f\xd2\x2f\x24\xd7\x35\
-\xcb\xcf\x07\xf8\xaa\x59\x46\x3c\x45\x3b\xda\xeb\x53\xab\x4a\xe6\
-\x4b\x81\x69\x0a\x91\x6f\x0c\x60\x96\x58\x84\x88\xc0\x2b\x02\xc3\
-\x75\x7d\xc9\x36\x87\xb6\x45\x50\x32\xef\x95\x8d\xff\x00\xe7\x98\
-\x00\x63\xb1\xea\x73\xc8\xc7\xe3\x4f\xd2\xf4\x66\x05\x99\x9b\x6a\
-\xef\xdc\xa0\x6d\x0c\x3d\xb2\x14\x71\xec\x45\x27\x86\xba\xb2\x33\
-\x95\x18\xee\x78\x67\xec\xf9\xfb\x19\x78\x5f\xe0\x24\x4d\xaa\x32\
-\xea\x5e\x24\xf1\x45\xd4\x69\x04\xfa\xf6\xb5\x78\x2e\xb5\x09\x63\
-\xdd\xbc\xc2\x85\x02\xc7\x04\x3e\x68\xdc\x62\x81\x55\x1d\x82\xbb\
-\x6e\x23\x15\xa1\xf1\x1b\xf6\x73\xf0\x5f\x8d\x8c\x8d\xa9\x78\x67\
-\x45\x92\x4b\x96\x1e\x7d\xcb\xd8\x22\x33\xe0\x96\x8d\x58\xa0\xc8\
-\xc3\x31\xc1\xe4\x9e\xe6\xbd\xad\xb4\xcc\xa4\x6a\xde\x5e\xe5\x2a\
-\x4e\x17\x83\x83\x9a\x86\xeb\x44\x69\x8b\x70\xbf\x36\x03\x1d\xbf\
-\x7c\x0e\x83\x1e\xde\xb5\x8c\xf0\xb6\xf7\x52\x43\x54\xe2\xb5\x47\
-\x81\x78\x3b\xf6\x3b\xf0\x3f\x84\xf5\x3b\x89\xac\x3c\x3b\xa5\xc7\
-\x7d\x1d\xc0\x9d\xae\xae\x23\x7b\x89\x8b\xe3\xe6\x2a\x64\x76\xd8\
-\x7f\x84\x60\x90\xaa\x06\x32\x6b\x63\xc4\xbf\x0a\x6d\xe4\xb7\xff\
-\x00\x47\xd2\xec\x20\xf9\xd9\x0a\xc7\x16\x0b\x00\x43\x64\x30\x39\
-\x05\x9b\x70\xdc\x30\x54\x36\x47\xf7\x6b\xd8\xe2\xd0\x18\x5c\xef\
-\x60\xa5\x79\xe3\x67\xe5\x4f\x8f\xc3\xf1\x1f\x9d\x91\x77\x21\x24\
-\x05\xf9\x6b\x35\x95\xd3\xb6\xa9\x17\xbb\xbb\x6c\xf0\xbd\x43\xe1\
-\xcc\x96\x3a\x6c\x6a\xcd\x75\x23\x47\x10\x46\xf9\xca\xca\xd1\x38\
-\x60\x63\x43\xbb\xe5\x5e\x43\x10\xdb\x80\xc0\x00\x01\x56\x74\x1f\
-\x01\x30\x9e\xda\x49\x6d\xbe\xd9\x75\xe6\x00\x0b\x46\x03\x85\xc3\
-\x2c\x85\x4f\x3b\x4b\x29\x0a\x71\xc0\x51\xb4\x00\x06\x6b\xda\x4f\
-\x86\xe1\x96\x41\x27\x93\x1e\xf2\xb8\xc9\xe7\xa8\xc3\x7e\x80\x7e\
-\x34\xb6\xbe\x1d\x16\xb3\x6e\x50\x07\x24\xe4\x0e\x57\xe9\xf5\xa5\
-\xfd\x9e\x96\xc8\xc9\xd3\x5b\xa3\xce\xcf\xc3\x9b\xaf\xb2\xcb\x2c\
-\x30\x47\xe6\x1d\xf8\x1c\xc7\x14\xe1\x80\xdc\x19\x41\xc1\x56\xe7\
-\x23\x1c\xe7\x9c\x8f\x96\xb1\x35\x4f\x83\xf3\x5d\x6a\xd0\xcd\x23\
-\x3b\x2f\x9a\x76\xf1\xb4\x63\x6a\xe0\x01\x9c\x29\xf9\x7f\x87\x68\
-\xfa\xd7\xb8\x25\xb7\xee\x80\x65\x5e\x9d\x01\xe0\x54\x33\xe8\xf1\
-\xce\x17\x72\xa7\xca\xdb\x87\x1d\x38\xa5\xfd\x9e\xf7\x61\x1a\x6b\
-\xa9\xe4\xba\x4f\xc3\xef\x36\x4b\x65\x92\x3b\xa8\x7e\xce\xdb\xe0\
-\x90\x49\x97\x47\x03\x0c\xac\x4f\x50\x7d\x06\x00\xab\xab\xe0\xf9\
-\x64\x5b\x57\xf2\x4a\xb5\xaa\xee\x8d\x88\x5f\x90\xa4\x8c\xd8\x04\
-\x86\x65\xe4\xf6\x3c\xfb\x57\xa5\x59\xe8\x69\x6c\x8a\xac\x15\xf6\
-\x8f\x5e\xa7\xb9\xa4\x5d\x25\x61\x79\x36\xac\x7b\x5d\xf2\x72\x3b\
-\x1e\xbf\x8e\x6b\x65\x82\x56\x1f\xb3\x47\x83\x6b\x1e\x01\x5d\x29\
-\x66\xb2\x92\x46\xff\x00\x4a\x2b\x34\x93\x46\xb8\x58\xc8\x56\xdc\
-\x08\x24\xee\xcb\x1a\xa1\xa3\x69\x12\x20\xb8\x63\x0a\xf9\x37\x0f\
-\xe6\x00\x83\x3b\x54\xc4\xca\x41\xff\x00\xbe\x57\x03\xa5\x7d\x01\
-\x3f\x84\xed\x6e\xed\x4c\x73\x46\xaf\xb8\x00\xc7\x1d\x71\x54\x63\
-\xf0\x65\xb2\xcd\x2f\xee\x23\x45\x93\xe4\x21\x06\xdc\x28\x23\x18\
-\xf7\xc6\x7f\x3a\x95\x85\x7d\x85\xec\xcf\x19\x3e\x0c\x8f\x58\xd2\
-\xe4\x87\x77\xd9\x9b\x69\x9a\x46\x8e\x3d\xab\x0c\xec\xa5\x4b\x95\
-\xe4\xbe\xd4\xdb\xf2\xe4\x6d\x07\x83\xc6\x2a\x84\xde\x1f\x9f\x4a\
-\xb8\x93\x65\xbf\x92\xb6\xf0\xf1\x91\xbb\x38\x3b\x36\x9f\xf6\x82\
-\x80\x9f\x41\xbb\xa9\xc5\x7b\xad\xa7\x87\x63\xb7\x5d\xa1\x76\xb4\
-\x64\x84\x3b\x77\x63\x3c\x31\xf7\x2c\x30\x3d\xa9\xb2\xf8\x16\xde\
-\xec\x2c\x6c\x4e\xd1\x82\x48\x50\x32\x3e\xbe\xb9\xad\x16\x17\xb8\
-\x7b\x33\xc8\xa1\xd1\x4c\xda\xc3\xb3\x46\xb1\xf9\xcc\xbb\xa3\x2d\
-\xf2\xc1\xb7\x6f\xdc\x66\xc7\x3f\x2f\x4e\xb5\xbe\x9e\x18\x92\xf5\
-\xed\xe1\x8d\xa4\x69\x26\x95\x52\x4c\x28\xda\xbf\x26\x14\xf3\xc9\
-\x2b\x96\x62\x78\xe4\xd7\x79\x7b\xe1\x68\xe3\x9d\x84\x2d\x3b\x36\
-\xd0\x49\x72\x0e\x7d\xf3\x8d\xdf\x81\x38\xf6\xad\x0d\x1f\x43\x8e\
-\xcd\x22\x66\x8d\x7c\xc5\x1f\x33\x01\xb7\x73\x11\xb4\x9c\x00\x00\
-\xe0\x76\xad\xa3\x47\xa0\xbd\x91\xe6\x27\xc0\xb7\x52\x79\xcc\xf0\
-\xff\x00\xa4\x5e\x60\xc8\xad\xc0\x50\x3a\x15\x07\x38\xfa\x55\x3b\
-\xbf\x06\xa5\xc6\xab\x6f\x04\x96\xf7\x1e\x69\x2c\x0c\xbb\xf2\x24\
-\xda\xa3\x20\x0e\x00\xe1\x9f\xd3\xb5\x7b\x55\xc6\x99\x1d\xcb\x86\
-\x64\x8f\x77\x5d\xd8\xe6\xa9\x49\xe1\xb8\x9e\xef\xcc\x65\x56\xf5\
-\x1d\x37\x72\x7f\x2c\x0c\x7d\x6b\x39\x61\x15\xee\x8b\x50\x47\x88\
-\x78\xf7\xe1\xfd\xc5\xbd\xbe\x9f\x6a\xb6\xb9\x45\x44\x73\x2c\x09\
-\x9f\x32\x45\x64\x08\xcc\x78\x2d\xb7\x7e\x31\xf2\xf0\xa4\x92\x4f\
-\x06\x3f\x0f\xfc\x3e\x5b\x8f\x13\xb6\xe3\x21\xfe\xc5\x92\x42\x23\
-\x9a\x5f\x9a\x41\x22\x84\x24\xed\x65\x0d\x90\xab\x8c\xfb\xd7\xba\
-\x26\x92\xca\x19\xb0\x0b\x02\x01\x24\x67\x7a\xe3\xe6\x18\xed\xdf\
-\xf4\xa8\xe3\xf0\xc4\x61\x62\x6f\x25\x76\xa9\xcf\x97\xc6\x3d\xb2\
-\x71\x93\x8f\x7a\xe7\xa9\x97\xa9\x4b\x53\x37\x45\x36\x79\x2e\xaf\
-\xfb\x35\xe9\x3f\x6d\x8e\xf2\xd3\x4d\xb7\x86\xfe\xf1\x63\x8a\x4d\
-\xcc\x48\x3b\x59\x9c\x29\xc8\x65\x2a\xa6\x49\x1b\x25\x49\x2c\xfc\
-\x92\x00\xac\xdf\x14\x7e\xc9\x56\x7e\x2d\xd3\x20\xb5\x96\xda\xde\
-\x7d\x2e\xde\x36\x12\xda\x5c\x45\xb5\x2e\x77\x28\xe5\x42\xfd\xc7\
-\x0c\xaa\xeb\x20\x25\x95\x94\x63\x38\x04\x7b\xc4\x9a\x5b\x48\xaa\
-\xcc\xc1\xa4\x45\x38\x63\xeb\xeb\x56\x3e\xcb\x82\xa3\xf8\x41\x24\
-\xf3\xcd\x38\x65\x94\xe3\x2b\xa0\x58\x74\x8e\x1f\x4d\xd2\x7c\x41\
-\xe0\x8d\x13\x4b\x8d\x6f\xbf\xb7\xe3\xb0\xb7\x43\x74\xd7\xd1\xed\
-\xbc\x98\x2a\x00\xd2\xee\x53\xb4\xc8\x70\x49\x1e\xa4\xe2\xba\xdf\
-\x0c\xf8\x92\xdf\xc5\x1a\x2d\xad\xed\xaf\x9c\x61\xba\x40\xeb\xe6\
-\xa6\xc7\x00\x8c\xfc\xc3\xb1\xf6\xab\x32\x5a\x3c\xa3\xe6\x65\x61\
-\xd4\x83\xfc\x5e\x9f\x4c\x7e\xb4\xeb\x7b\x76\x81\x02\xee\xce\x3f\
-\x36\x3e\xa6\xbd\x18\xc6\xc6\xcb\x42\x55\x6d\xea\x0f\xa8\xcd\x2d\
-\x03\x81\x45\x50\xc2\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x04\xe7\xda\x90\xc5\xb9\x70\x7d\x73\xc5\x3a\x8a\x00\x40\x08\xf4\
-\xa4\x08\x41\xeb\x4e\xa2\x80\x21\xfb\x28\xde\x5b\x3c\xe7\x3d\x2a\
-\x43\x1e\xee\xb8\xa7\x51\x40\x08\x10\x2d\x42\xf6\xcc\xee\xdd\x30\
-\x48\xc6\x4e\x70\x3e\x95\x3d\x14\x01\x4e\x4d\x35\x99\xf7\x7e\xed\
-\xb7\x70\xdb\x86\x77\x0e\x7a\xf1\xdb\xa0\xf4\x04\xd2\x9d\x33\x18\
-\xc1\x56\xda\xc4\x8d\xe3\x70\x19\xe4\xf0\x31\x9c\x9f\x5a\xb7\x45\
-\x00\x31\x63\xe1\x73\x8c\xe3\x9c\x53\xe8\xa2\x80\x13\x9f\x6a\x42\
-\xb9\x18\xa7\x51\x40\x0d\x54\xc6\x33\x8c\xaf\x4a\x36\x64\x63\xb5\
-\x3a\x8a\x00\x4d\x9d\x3d\xa8\xc1\xf5\xa5\xa2\x80\x13\x07\xd6\x90\
-\xa6\x4f\xf3\xa7\x51\x40\x00\xe2\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x9a\x17\x24\xe7\x14\xea\x28\x01\xbe\x50\x27\x90\
-\x38\xa6\x88\x70\x31\xfc\x39\xdd\x52\x51\x40\x0d\x08\x77\x64\xed\
-\xef\xf9\x76\xa0\xc7\x94\xc7\xe3\x4e\xa2\x80\x0a\x31\x8a\x28\xa0\
-\x03\xbd\x35\xa2\x0c\x3f\x1c\xf5\xa7\x51\x40\x00\xe2\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x0f\xff\xd9\
-\x00\x00\x47\x45\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x01\xe3\x01\x12\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x53\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x6b\x30\x5e\xb4\x00\xea\
-\x2b\xe2\xdf\xda\x63\xfe\x0a\x75\xf0\xd7\xe0\x4d\xc5\xde\x89\xa0\
-\x13\xf1\x07\xc5\x71\xee\x56\xb6\xd3\x66\x55\xb2\xb7\x7f\xee\xcd\
-\x71\xf3\x0d\xdf\xec\xc6\xad\xfe\xd6\xda\xfc\xda\xf8\xb7\xff\x00\
-\x05\x1f\xf8\xe7\xf1\x62\xea\xe5\x3f\xe1\x2f\x9b\xc2\x9a\x5c\x9f\
-\x2a\xe9\xfe\x1b\xff\x00\x43\x55\x5f\xfa\xed\xfe\xb9\xbf\xe0\x52\
-\x50\x07\xee\x47\x8d\xbe\x2a\x78\x3b\xe1\xa5\x98\xba\xf1\x6f\x8a\
-\x74\x7f\x0d\xc0\x46\xe5\x7d\x52\xfa\x3b\x7d\xc3\xdb\x73\x7c\xd5\
-\xe6\x37\xdf\xb7\x5f\xc0\x2d\x35\x48\x93\xe2\xb7\x87\x1f\xfe\xb8\
-\x5d\x34\xdf\xfa\x0a\xb5\x7f\x3e\x3a\x96\xad\x79\xac\x5f\x4d\x79\
-\xa8\xdd\x4f\x7d\x79\x33\x6e\x92\x7b\x99\x1a\x49\x1b\xfd\xe6\x6f\
-\x9a\xaa\xef\x6f\xef\x50\x07\xef\xb6\xa3\xff\x00\x05\x28\xfd\x9c\
-\x74\xe5\x3b\xbe\x24\x41\x3b\x2f\xf0\x5b\xe9\xb7\x92\x1f\xfd\x13\
-\x5c\xd5\xf7\xfc\x15\x73\xf6\x79\xb5\x5f\xdd\x78\x8b\x55\xbe\xff\
-\x00\xae\x1a\x2d\xc7\xfe\xcc\xab\x5f\x85\xdb\xbe\x94\x94\x01\xfb\
-\xe1\xe1\x1f\xf8\x29\x57\xec\xf3\xe3\x2d\x91\xaf\x8f\x53\x45\x9d\
-\xbf\xe5\x86\xb1\x63\x71\x6b\x8f\xfb\x69\xb7\xcb\xff\x00\xc7\xab\
-\xdd\xfc\x1d\xf1\x5f\xc1\x9f\x11\x20\x12\xf8\x5b\xc5\x7a\x2f\x88\
-\xd3\x19\xff\x00\x89\x56\xa1\x0d\xc6\x3f\xef\x96\x35\xfc\xcc\x54\
-\xf6\x77\xf7\x1a\x6d\xd4\x77\x16\xb7\x0f\x6d\x71\x1b\x6e\x8e\x58\
-\x19\xa3\x65\xff\x00\x75\x96\x80\x3f\xa8\xfa\x2b\xf0\x33\xe0\xc7\
-\xfc\x14\x83\xe3\x77\xc1\xd6\xb7\xb7\xff\x00\x84\xa1\xbc\x5d\xa2\
-\xc5\xb7\x3a\x6f\x88\xc7\xda\xbe\x5f\xee\xac\xdf\xeb\x97\xfe\xfa\
-\xdb\xfe\xcd\x7e\x8e\xfe\xcc\xff\x00\xf0\x53\xcf\x86\xff\x00\x1d\
-\xb5\x3b\x1f\x0f\x6b\xd1\x4d\xe0\x4f\x14\xdd\x90\x91\xc1\xa8\x4c\
-\xb2\x59\x5c\x49\xfd\xd8\xee\x3e\x5f\x98\xff\x00\x76\x45\x5f\xee\
-\xae\xea\x00\xfb\x5a\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x0c\xad\x6b\x5c\xd3\xfc\x35\xa3\xdf\x6a\xda\xa5\
-\xdc\x36\x1a\x6d\x8c\x2f\x71\x75\x75\x3b\x6d\x8e\x18\xd5\x77\x33\
-\x33\x7a\x01\x5f\x8b\xff\x00\xb6\xa7\xfc\x14\x97\xc4\x7f\x1d\x24\
-\xbf\xf0\x97\x81\x66\xb9\xf0\xdf\x80\x72\xd0\xc9\x3a\xb7\x97\x7b\
-\xab\x2f\xf7\xa4\x6f\xf9\x67\x0b\x7f\xcf\x35\xfb\xdf\xc5\xfd\xd5\
-\xee\x7f\xe0\xa8\x5f\xb6\xd7\xfc\x26\xda\xbd\xe7\xc1\xff\x00\x03\
-\x6a\x3b\xbc\x37\x63\x36\x35\xeb\xfb\x66\xf9\x6f\xae\x15\xbf\xe3\
-\xdd\x5b\xfe\x79\xc6\xdf\x7b\xfb\xd2\x2f\xfb\x3f\x37\xe7\x2d\x00\
-\x14\x57\x47\xe0\x1f\x87\xfe\x22\xf8\x97\xe2\xad\x3f\xc3\xbe\x16\
-\xd1\xee\xb5\xdd\x6e\xf2\x4f\x2e\x0b\x2b\x45\xdc\xcd\xff\x00\xc4\
-\xaa\xfd\xe6\x66\xf9\x57\xf8\xab\xf5\x9f\xf6\x58\xff\x00\x82\x50\
-\xf8\x4b\xc0\x16\xb6\x7e\x20\xf8\xac\xb0\x78\xc7\xc4\x87\x6c\x8b\
-\xa3\x2b\x37\xf6\x65\xab\x7f\x75\xbf\x8a\xe1\xbf\xde\xfd\xdf\xfb\
-\x2d\xf7\xa8\x03\xf3\x0b\xe1\x0f\xec\xd9\xf1\x33\xe3\xb5\xc7\x95\
-\xe0\x7f\x07\xea\x5a\xe4\x3b\xb6\xb5\xea\x47\xe5\xda\xc6\xdf\xed\
-\x5c\x49\xb6\x35\xff\x00\xbe\xab\xec\xbf\x87\x7f\xf0\x46\x3f\x1b\
-\xea\xd1\x45\x71\xe3\x6f\x1c\x68\xfe\x1d\x56\xf9\x9a\xdb\x4b\xb7\
-\x93\x50\x9d\x7f\xd9\x66\x6f\x2d\x77\x7f\xbb\xba\xbf\x5b\x74\x9d\
-\x2a\xcb\x45\xd3\xed\xec\xb4\xeb\x38\x2c\x2d\x2d\xd3\xcb\x86\xda\
-\xda\x35\x8e\x38\xd7\xfb\xaa\xab\xc2\xd6\x8d\x00\x7e\x7c\x68\x7f\
-\xf0\x46\x3f\x85\x56\x71\xaf\xf6\xb7\x8b\xfc\x5b\xa9\xc9\xfc\x5f\
-\x67\x92\xd6\xd9\x1b\xfe\x03\xe4\xb7\xfe\x85\x5b\x17\x5f\xf0\x47\
-\x1f\x82\x13\x43\xb6\x3d\x63\xc6\x76\xcd\xfd\xe5\xd4\xad\xdb\xff\
-\x00\x42\xb7\xaf\xbb\xe8\xa0\x0f\xcc\xdf\x16\x7f\xc1\x14\x7c\x39\
-\x71\x1c\x87\xc3\x3f\x12\xb5\x4b\x17\xfe\x15\xd5\xb4\xe8\xee\x81\
-\xff\x00\x81\x46\xd1\xff\x00\xe8\x35\xf3\x87\xc5\x0f\xf8\x24\xbf\
-\xc7\x0f\x03\xac\xd7\x1a\x14\x3a\x47\x8d\xec\x97\xe6\xff\x00\x89\
-\x4d\xd7\x97\x73\xb7\xfe\xb8\xcd\xb7\xfe\xf9\x56\x6a\xfd\xc1\xa2\
-\x80\x3f\x98\x6f\x18\x78\x13\xc4\x9f\x0f\x75\x69\x34\xaf\x13\xe8\
-\x3a\x8f\x87\xf5\x34\xfb\xd6\x9a\x95\xac\x96\xf2\x7f\xdf\x2c\xb5\
-\x85\x5f\xd3\x4f\x8f\xbe\x1a\xf8\x5b\xe2\x8e\x86\xfa\x2f\x8b\xbc\
-\x3d\xa7\xf8\x93\x4b\x90\xff\x00\xc7\xbe\xa5\x6e\xb3\x2a\xff\x00\
-\xb4\xbb\xbe\xeb\x7f\xb4\xbc\xd7\xe4\xcf\xed\xb9\xff\x00\x04\xca\
-\xd4\xfe\x14\x0b\xef\x1a\x7c\x2c\xb6\xbb\xd6\xfc\x1e\x8a\xd3\x5d\
-\xe8\xcc\x5a\x6b\xdd\x39\x7f\x89\x97\xf8\xa6\x85\x7f\xef\xa5\xfe\
-\x2d\xcb\xf3\x50\x05\x7f\xd8\xbb\xfe\x0a\x79\xad\xfc\x21\x92\xd3\
-\xc2\x5f\x13\xe5\xba\xf1\x27\x83\xbe\x58\x6d\xf5\x5f\xf5\x97\xfa\
-\x6a\xff\x00\xed\x68\x57\xfb\xbf\x79\x7f\x87\x77\xdd\xaf\xd7\x6f\
-\x07\x78\xdb\x42\xf8\x89\xe1\xbb\x2d\x7f\xc3\x9a\xad\xae\xb5\xa3\
-\xde\x27\x99\x6f\x7b\x62\xfe\x64\x72\x2f\x5f\xcf\x8f\xbb\xd4\x57\
-\xf3\x1d\x5e\xef\xfb\x2e\x7e\xd8\x5e\x3c\xfd\x96\x7c\x4d\xf6\xbf\
-\x0f\x5d\x7f\x68\x78\x7e\xea\x45\x6d\x43\xc3\xd7\x92\x37\xd9\x6e\
-\xbf\xda\x5f\xf9\xe7\x27\xfd\x34\x5f\xf8\x16\xe5\xf9\x68\x03\xfa\
-\x1f\xa2\xbc\x67\xf6\x71\xfd\xa7\x3c\x15\xfb\x50\x78\x36\x3d\x73\
-\xc2\x5a\x8e\xdb\xb8\x42\x8d\x43\x47\xb8\x65\x5b\xbb\x19\x08\xfb\
-\xb2\x27\x75\xfe\xec\x8b\xf2\xb7\xe6\x2b\xd9\xa8\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xaf\x82\xff\x00\xe0\xa5\xdf\xb6\xc1\xf8\x1f\xe1\x77\xf8\x75\
-\xe0\xeb\xe0\x9e\x3b\xd6\x6d\xf3\x75\x77\x0b\xfc\xda\x55\xa3\x7f\
-\x17\xfb\x32\xc9\xfc\x3f\xdd\x5d\xcd\xfd\xda\xf7\x1f\xdb\x37\xf6\
-\xa8\xd1\xff\x00\x65\x5f\x85\x53\x6b\x53\x95\xbb\xf1\x36\xa0\x5a\
-\xd7\x43\xd3\x37\x63\xed\x17\x18\xfb\xed\xff\x00\x4c\xe3\xdc\xac\
-\xdf\xf0\x15\xfe\x2a\xfc\x07\xf1\xa7\x8b\xb5\x8f\x88\x1e\x28\xd4\
-\xfc\x47\xaf\x5f\xc9\xa9\x6b\x3a\x9d\xc3\x5c\xdd\x5d\xcc\xdb\x9a\
-\x49\x1b\xfc\xfd\xdf\xe1\xa0\x0c\x56\x7d\xed\xb9\xab\xac\xf8\x5d\
-\xf0\xb7\xc4\x9f\x18\xfc\x71\xa5\xf8\x4b\xc2\x7a\x6c\x9a\xae\xb7\
-\xa8\xc9\xe5\xc3\x0a\xfd\xd5\xfe\xf4\x8c\xdf\xc3\x1a\xaf\xcc\xcd\
-\xfc\x35\xcd\xd8\x69\xf7\x1a\xb5\xf5\xbd\x9d\x9c\x2f\x73\x75\x71\
-\x22\xc3\x0c\x10\xae\xe6\x91\x99\xb6\xaa\xaa\xff\x00\x13\x57\xee\
-\xc7\xec\x07\xfb\x1a\xd9\xfe\xcb\xff\x00\x0f\x17\x51\xd6\xad\xe2\
-\x9f\xe2\x16\xb9\x0a\xbe\xa9\x70\x06\xef\xb1\xc7\xf7\x96\xd2\x36\
-\xfe\xea\xff\x00\x17\xf7\x9b\xfd\x95\x5a\x00\xe9\x7f\x64\x1f\xd8\
-\xe7\xc2\xdf\xb2\x7f\x82\xd2\x0b\x58\xe3\xd5\x7c\x63\x7d\x1a\xff\
-\x00\x6b\x6b\xfe\x4f\xcf\x23\x7f\xcf\x18\x7f\xe7\x9c\x2a\xdf\xc3\
-\xfc\x5f\x79\xbf\xd9\xfa\x42\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x03\xf3\xa3\xf6\xe2\xff\x00\
-\x82\x64\xe9\xff\x00\x11\xa3\xd4\x3c\x73\xf0\x9e\xce\x0d\x37\xc5\
-\x87\x75\xc5\xf7\x87\xa3\xdb\x1d\xb6\xa4\xdf\xc4\xd0\xff\x00\x0c\
-\x53\x7b\x7d\xd6\xff\x00\x65\xbe\x66\xfc\x8d\xd6\x34\x6b\xef\x0e\
-\xea\x97\x5a\x76\xa9\x67\x3e\x9d\xa8\x5a\xc8\xd0\xdc\x5a\x5c\xc6\
-\xd1\xc9\x0c\x8b\xf7\x95\x95\xbe\x65\x6a\xfe\xa2\x6b\xe3\xcf\xdb\
-\x8b\xf6\x07\xd0\xbf\x69\xed\x1a\xe3\xc4\x1a\x04\x30\xe8\x7f\x12\
-\x6d\x62\x3e\x4e\xa0\x57\x6c\x5a\x92\xaa\xfc\xb0\xdc\x7f\xe8\x2b\
-\x27\xde\x5f\xf6\x97\x8a\x00\xfc\x5d\xf8\x53\xf1\x67\xc5\x1f\x05\
-\x7c\x69\x63\xe2\x9f\x07\xea\xf3\xe9\x1a\xc5\x9b\x7c\xb2\x47\xf3\
-\x2c\x8b\xfc\x51\xc8\xbf\x76\x48\xdb\xf8\x95\xab\xf7\x63\xf6\x2f\
-\xfd\xac\xb4\x3f\xda\xb3\xe1\x8a\x6a\x51\x88\x74\xef\x15\xe9\xa5\
-\x61\xd6\x74\x95\x72\x7c\x99\x1b\xee\xc9\x1e\xef\x9b\xc9\x93\x9d\
-\xbe\x9f\x32\xff\x00\x0d\x7e\x05\xf8\xa3\xc2\xfa\xaf\x82\xfc\x45\
-\xa8\xe8\x5a\xdd\x84\xda\x5e\xaf\xa7\xdc\x35\xad\xd5\xa5\xc2\xed\
-\x92\x19\x15\xb6\xb2\xb5\x7a\x0f\xec\xcf\xfb\x41\x6b\x9f\xb3\x5f\
-\xc5\x8d\x1f\xc6\x5a\x23\x49\x2c\x30\xb7\x93\xa8\x69\xea\xdb\x56\
-\xfa\xd5\xbf\xd6\x42\xdf\xfa\x12\xff\x00\x75\x95\x5a\x80\x3f\xa4\
-\x0a\x2b\x95\xf0\x0f\x8e\x34\x9f\x89\x5e\x0c\xd1\xbc\x53\xa0\x5d\
-\x8b\xed\x1b\x56\xb5\x8e\xf2\xd6\x7f\xef\x46\xcb\x9f\x9b\xd1\xbf\
-\x85\x97\xf8\x48\x35\xd5\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x15\xe0\x9f\xb6\xd7\xc6\x16\xf8\x1f\xfb\x32\
-\xf8\xdb\xc4\xb6\xf3\x18\xf5\x46\xb3\xfe\xcf\xd3\xd9\x7e\xf7\xda\
-\xae\x3f\x73\x1b\x2f\xfb\xbb\x9a\x4f\xf8\x05\x00\x7e\x41\xff\x00\
-\xc1\x43\xbf\x68\x0f\xf8\x5f\xbf\xb4\x6e\xb9\x2d\x85\xd7\x9f\xe1\
-\xcf\x0f\xee\xd1\x74\xbd\xad\xf2\xc8\xb1\xb7\xef\x26\x5f\xfa\xe9\
-\x26\xe6\xdd\xfd\xd5\x5a\xf9\x82\x95\xab\x5b\xc2\x3e\x17\xd4\xbc\
-\x6d\xe2\xad\x1f\xc3\xba\x45\xbb\x5c\xea\x9a\xb5\xe4\x36\x36\xb0\
-\x7f\x7a\x49\x19\x55\x7f\xf1\xe6\xa0\x0f\xd0\x2f\xf8\x24\x9f\xec\
-\xb6\x9e\x32\xf1\x6d\xcf\xc5\xff\x00\x10\xda\xef\xd2\xb4\x19\xfe\
-\xcd\xa1\xc7\x22\xf1\x35\xf6\xdf\x9a\x6f\xf7\x61\x56\xf9\x7f\xda\
-\x7f\xfa\x67\x5f\xaf\xb5\xc0\x7c\x13\xf8\x4f\xa5\xfc\x0f\xf8\x59\
-\xe1\x9f\x03\xe9\x0a\xbf\x63\xd1\xec\xd6\xdc\xca\xab\xb7\xce\x93\
-\xef\x49\x2b\x7f\xb4\xd2\x16\x6f\xf8\x15\x77\xf4\x00\x51\x45\x14\
-\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\
-\x00\x51\x45\x14\x01\xf9\x93\xff\x00\x05\x77\xfd\x97\x61\xd4\x7c\
-\x3f\x6d\xf1\x9b\x41\xb3\xdb\xa8\x58\xb4\x76\x3a\xfa\xc4\xbf\xeb\
-\x6d\xdb\xe5\x86\xe1\xbf\xda\x56\xdb\x1b\x37\xf7\x59\x7f\xbb\x5f\
-\x93\xf5\xfd\x3a\xf8\xd7\xc1\xda\x5f\xc4\x0f\x08\xeb\x1e\x1a\xd6\
-\xad\xc5\xd6\x93\xab\x5a\x49\x65\x75\x0b\x7f\x1c\x72\x2e\xd6\xfc\
-\x6b\xf9\xc1\xf8\xd9\xf0\xab\x53\xf8\x25\xf1\x5b\xc4\xde\x07\xd5\
-\xd5\xbe\xd9\xa2\xde\x49\x6f\xe6\xed\xdb\xe7\x47\xf7\xa3\x91\x7f\
-\xd9\x68\xd9\x5b\xfe\x05\x40\x1f\xa4\xbf\xf0\x47\x6f\xda\x01\xb5\
-\x2d\x1f\x5f\xf8\x43\xaa\xdc\x79\x93\x58\x96\xd5\xf4\x55\x95\xba\
-\x42\xcd\xb6\xe2\x15\xff\x00\x75\x99\x64\xdb\xff\x00\x4d\x24\xaf\
-\xd3\xaa\xfe\x69\x3e\x08\x7c\x58\xd5\xbe\x06\xfc\x54\xf0\xe7\x8d\
-\xf4\x46\x6f\xb6\x68\xf7\x8b\x33\x46\x1b\x6a\xdc\x47\xf7\x64\x85\
-\xbf\xd9\x92\x36\x65\xff\x00\x81\x57\xf4\x6f\xe0\x3f\x1a\x69\x7f\
-\x11\x3c\x1f\xa2\xf8\x9b\x45\x9f\xed\x3a\x56\xad\x67\x1d\xed\xac\
-\x98\xeb\x1c\x8a\x19\x73\xef\x40\x1d\x25\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x7e\x62\x7f\xc1\x69\xfe\x26\xfd\x97\xc3\
-\xbf\x0f\xbc\x01\x04\xc4\x35\xd5\xc4\xda\xd5\xd4\x49\xfd\xd8\xd7\
-\xc9\x87\xff\x00\x1e\x92\x6f\xfb\xe6\xbf\x4e\xeb\xf0\xcf\xfe\x0a\
-\xc9\xe3\x2f\xf8\x4a\x7f\x6b\xad\x4e\xc1\x25\x32\x47\xe1\xfd\x2a\
-\xcf\x4d\xf9\x5b\xe5\x56\x65\x6b\x86\xff\x00\xd2\x8a\x00\xf8\xd6\
-\xbe\xdd\xff\x00\x82\x4a\x7c\x25\x1e\x3c\xfd\xa5\x8f\x89\xae\x22\
-\xf3\x2c\x3c\x23\x61\x25\xf2\xef\x19\x5f\xb5\x4d\xfb\x98\x7f\x46\
-\x95\xbf\xed\x9d\x7c\x45\x5f\xb2\x5f\xf0\x46\xbf\x00\xae\x83\xf0\
-\x0b\xc4\xde\x2a\x96\x3d\xb7\x5a\xf6\xb4\xd0\xab\x7f\x7a\x1b\x78\
-\xd5\x57\xff\x00\x22\x49\x35\x00\x7e\x82\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x57\xe5\x5f\xfc\x16\x47\xe0\x38\x8a\x7f\
-\x0b\xfc\x5a\xd3\xe0\xcf\x9d\xff\x00\x12\x3d\x59\xd5\x7f\x8b\xe6\
-\x7b\x79\x1b\xfe\x03\xe6\x26\xef\xf6\x63\xaf\xd5\x4a\xf2\x8f\xda\
-\x83\xe0\xfc\x5f\x1d\x3e\x02\xf8\xd3\xc1\x6c\x8a\xf7\x5a\x8d\x83\
-\x1b\x36\x65\xfb\xb7\x51\xfe\xf2\x16\xff\x00\xbf\x8a\xb4\x01\xfc\
-\xe0\x57\xec\x47\xfc\x11\xdf\xe3\x53\x78\xb3\xe1\x07\x88\x3e\x1d\
-\xdf\xdc\x79\xb7\x5e\x15\xba\x5b\x8b\x15\x66\xff\x00\x97\x3b\x86\
-\x66\xda\xbf\xee\xcc\xb2\x7f\xdf\xc5\xaf\xc7\xcb\x8b\x79\x2d\x6e\
-\x24\x86\x58\xda\x29\x23\x6d\xac\xac\xbb\x59\x5b\xfb\xb5\xf5\x3f\
-\xfc\x13\x37\xe2\xc7\xfc\x2a\xcf\xda\xcb\xc3\x31\xcf\x37\x93\xa6\
-\xf8\x91\x64\xd0\x6e\xbe\x6d\xab\xfb\xed\xad\x0f\xfe\x46\x58\xff\
-\x00\xef\xaa\x00\xfd\xea\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\
-\x28\x01\x1b\xee\x9a\xfe\x71\x7f\x6b\x4f\x14\x37\x8c\x3f\x69\xaf\
-\x8a\x1a\xb1\x93\xcc\x59\xbc\x45\x7d\x1c\x6d\xbb\xfe\x59\xc7\x33\
-\x47\x1f\xfe\x3a\xab\x5f\xd1\xd3\x57\xf3\x27\xf1\x5a\xc6\x4d\x2f\
-\xe2\x77\x8b\xac\x65\x91\xa4\x92\xd7\x58\xbc\x85\xa4\x6f\xe2\x65\
-\x9a\x45\xdd\x40\x1c\xba\xfd\xea\xfe\x82\x3f\xe0\x9e\xfe\x18\x1e\
-\x12\xfd\x8e\xfe\x19\x5a\x84\x08\xd7\x5a\x73\x6a\x0d\xb7\xf8\x8d\
-\xc4\xd2\x4d\xbb\xf2\x91\x6b\xf9\xf7\x5a\xfe\x96\x7e\x06\x69\x0b\
-\xe1\xdf\x82\x7f\x0f\xf4\xb5\x5d\xab\x67\xe1\xfd\x3e\xdf\x6f\xfb\
-\xb6\xf1\xad\x00\x77\x94\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x8d\x4b\x45\x00\x7f\x3f\xbf\xf0\x50\xff\x00\x84\x2b\xf0\
-\x7f\xf6\xac\xf1\x85\xa5\xbc\x3f\x67\xd2\xf5\x89\x17\x5c\xb1\x5d\
-\xbf\x2f\x97\x3f\xcd\x22\xaf\xfb\xb3\x79\xcb\xff\x00\x01\xaf\x9d\
-\x34\xdd\x4a\xeb\x49\xd4\xad\x6f\xac\xa6\x7b\x6b\xcb\x59\x16\x68\
-\x67\x8d\xb6\xb4\x72\x2b\x6e\x56\x5f\xf8\x15\x7e\xb0\x7f\xc1\x67\
-\xbe\x13\x7f\x6a\x78\x2f\xc1\x5f\x11\x6d\x60\xdd\x2e\x95\x75\x26\
-\x8f\x78\xe8\x7f\xe5\x8c\xcb\xe6\x42\xcd\xfe\xca\xc9\x1b\xaf\xfd\
-\xb5\xaf\xc9\x6a\x00\xfe\x94\x7f\x67\xff\x00\x8a\x36\xff\x00\x1a\
-\xfe\x0b\xf8\x2f\xc7\x16\xfb\x40\xd6\x74\xd8\xee\x26\x45\xe9\x1d\
-\xc6\x36\xcc\x9f\xf0\x19\x16\x45\xfc\x2b\xd1\x6b\xf3\xc3\xfe\x08\
-\xd9\xf1\x48\xf8\x87\xe0\xdf\x89\xfc\x0d\x71\x30\x69\xfc\x3b\xa8\
-\xad\xd5\xba\xee\xe5\x6d\xee\x57\x76\xdf\xf8\x0c\x91\xc9\xff\x00\
-\x7d\xd7\xe8\x7d\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x61\xf8\xbe\
-\xea\xfe\xcb\xc2\xba\xc5\xc6\x93\x12\xcf\xaa\x43\x67\x34\x96\x71\
-\x32\xee\x12\x4c\xb1\xb3\x46\xb8\xff\x00\x78\x2d\x7f\x32\x5a\xd5\
-\xf5\xe6\xad\xab\xdf\x5f\x5f\xc8\xd2\xdf\x5c\x4d\x24\xd7\x0d\x2a\
-\xed\x66\x91\x9b\x73\x6e\xff\x00\x81\x6e\xaf\xe9\x53\xe3\x15\xfe\
-\xa9\xa5\xfc\x27\xf1\xa5\xee\x87\x31\xb6\xd6\xad\xf4\x5b\xd9\xac\
-\x66\x55\xdd\xe5\xdc\x2d\xbc\x8d\x1b\x7f\xdf\x5b\x6b\xf9\xa3\xb8\
-\x96\x4b\x89\x9a\x49\x64\x69\x24\x91\xb7\x33\x33\x6e\x66\x66\xa0\
-\x08\xd7\xe7\x6d\xab\x5f\xd3\xf7\x86\x60\x5b\x5f\x0e\xe9\x90\x81\
-\xb4\x47\x6b\x0a\xfe\x48\xb5\xfc\xc1\xc2\xfb\x64\x56\xff\x00\x6a\
-\xbf\xa8\x4d\x15\xb7\x69\x16\x4d\xeb\x0c\x67\xff\x00\x1d\x14\x01\
-\x7e\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x0f\x19\xfd\xae\xfe\x16\xff\x00\xc2\xe7\xfd\x9c\x7c\x79\xe1\x48\
-\xe1\xf3\xef\x2e\xb4\xd9\x26\xb3\x5c\x7f\xcb\xd4\x3f\xbe\x83\xff\
-\x00\x22\x46\xab\xff\x00\x02\xaf\xe7\x41\xbe\xf5\x7f\x52\x8d\x5f\
-\xce\x6f\xed\x81\xf0\xbf\xfe\x14\xef\xed\x2d\xf1\x03\xc2\xe9\x0f\
-\x91\x67\x6f\xaa\x49\x71\x66\xbb\x7f\xe5\xde\x6f\xdf\x43\xff\x00\
-\x8e\xc8\xab\xff\x00\x01\xa0\x0f\x4a\xff\x00\x82\x64\xfc\x55\x6f\
-\x86\x7f\xb5\xb7\x85\x61\x96\xe1\xa0\xd3\x7c\x48\xb2\x68\x77\x4b\
-\xbb\xe5\x66\x99\x77\x43\xff\x00\x91\x96\x3f\xfb\xea\xbf\x7a\x6b\
-\xf9\x78\xf0\xfe\xb7\x79\xe1\x9d\x73\x4f\xd5\xac\x24\xf2\x2f\xb4\
-\xfb\x88\xee\xad\xe5\xfe\xec\x91\xb2\xb2\xb7\xfd\xf4\xb5\xfd\x2f\
-\xfc\x39\xf1\x95\xaf\xc4\x2f\x01\xf8\x77\xc4\xf6\x4c\x8f\x69\xad\
-\x69\xf0\x6a\x11\x98\xdb\x72\xed\x92\x35\x6f\xfd\x9a\x80\x3a\x8a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x2a\x5e\x5a\x43\x7b\x6b\x35\xbc\xb1\
-\x89\x21\x99\x5a\x29\x14\xff\x00\x12\xb7\x0d\x5f\xcc\x9f\x8f\xb4\
-\x15\xf0\xaf\x8e\xbc\x45\xa2\xa3\x6e\x5d\x37\x52\xb8\xb3\x5f\xfb\
-\x67\x33\x2f\xfe\xcb\x5f\xd3\x4e\xa1\x2c\x90\xd8\xdc\x49\x02\xab\
-\x4c\x91\xb3\x46\xa7\xf8\x9b\x6f\xcb\x5f\xcc\x36\xbd\xab\xdd\x6b\
-\xda\xe6\xa1\xa9\x5e\xb6\xeb\xcb\xcb\x89\x2e\x26\x6f\xef\x48\xcc\
-\xcc\xdf\xf8\xf3\x50\x05\x15\xaf\xe9\xc7\xe1\xe6\xa4\xba\xb7\x80\
-\xfc\x35\x7a\x0e\xe5\xba\xd3\x6d\x66\x53\xfe\xf4\x2a\xd5\xfc\xc7\
-\x2d\x7f\x47\xff\x00\xb2\xce\xb8\x9e\x26\xfd\x9b\x3e\x16\x6a\x43\
-\x96\x9b\xc3\x3a\x7e\xef\xf7\x96\xde\x35\x6f\xfc\x79\x68\x03\xd5\
-\xa8\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x2b\xf2\x03\xfe\x0b\x37\xf0\xc7\xfb\x1b\xe2\x8f\x82\xfc\x71\x6f\
-\x16\xd8\xb5\xcd\x36\x4d\x3e\xe1\x97\xfe\x7b\x5a\xb6\xe5\x66\xff\
-\x00\x7a\x39\x97\xfe\xfd\xd7\xeb\xfd\x7c\x65\xff\x00\x05\x5c\xf8\
-\x6d\xff\x00\x09\xd7\xec\x9f\xa9\x6a\x91\x43\xe6\x5e\x78\x5f\x50\
-\xb7\xd5\x97\x6f\xde\xf2\xf7\x79\x32\x7f\xe3\xb3\x6e\xff\x00\x80\
-\xd0\x07\xe1\xb5\x7e\xdd\x7f\xc1\x25\xfe\x26\xff\x00\xc2\x6d\xfb\
-\x2d\xc3\xa1\xcd\x72\x67\xbd\xf0\xbe\xa5\x35\x81\x57\xfb\xcb\x0c\
-\x98\x9a\x1f\xc3\xf7\x92\x2f\xfc\x06\xbf\x11\x6b\xf4\x1b\xfe\x08\
-\xd7\xf1\x2b\xfe\x11\xff\x00\x8e\x5e\x26\xf0\x64\xf3\x15\xb7\xf1\
-\x16\x93\xf6\x88\x50\xb7\xde\xb8\xb6\x6d\xcb\xff\x00\x90\xe4\x9b\
-\xfe\xf9\xa0\x0f\xd9\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x1a\xd8\x65\
-\xe7\xa5\x7f\x35\x9f\xb4\x07\x80\x5b\xe1\x7f\xc6\xef\x1d\x78\x57\
-\x6e\xd8\xf4\x9d\x6a\xea\xd6\x1f\xf6\xa1\x59\x1b\xcb\x6f\xfb\xe7\
-\x6d\x7f\x4a\xb5\xf8\x41\xff\x00\x05\x4c\xf0\xd2\xf8\x7f\xf6\xc8\
-\xf1\x55\xc2\x26\xc8\xf5\x6b\x4b\x1b\xfd\xbf\xed\x35\xba\xc6\xdf\
-\xf8\xf4\x6d\x40\x1f\x24\xaf\xde\xaf\xdf\x5f\xf8\x26\xaf\x89\xbf\
-\xe1\x26\xfd\x8c\xfe\x1e\x3b\x36\xe9\xac\xe1\xba\xb0\x73\xff\x00\
-\x5c\xae\xa5\x55\xff\x00\xc7\x76\xd7\xe0\x4d\x7e\xd1\xff\x00\xc1\
-\x1d\x3c\x49\xfd\xad\xfb\x31\x6b\x1a\x6b\x37\xcf\xa5\xf8\x92\xe2\
-\x35\x5f\xee\xc7\x24\x30\xc8\xbf\xf8\xf3\x35\x00\x7d\xe7\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x5c\x9f\
-\xc5\x0f\x03\xdb\xfc\x4a\xf8\x75\xe2\x7f\x0a\x5d\x81\xf6\x7d\x6b\
-\x4d\xb8\xb0\x6d\xdd\xbc\xc8\xd9\x77\x7f\xe3\xd5\xd6\x52\x35\x00\
-\x7f\x2e\xba\xb6\x9b\x71\xa3\xea\x97\x9a\x7d\xdc\x6d\x05\xd5\xac\
-\xcd\x6f\x34\x4d\xfc\x32\x2b\x6d\x65\xff\x00\xbe\x96\xbd\x47\xf6\
-\x4a\xf8\x89\x0f\xc2\x7f\xda\x43\xe1\xef\x89\xee\x58\xc5\x63\x63\
-\xaa\xc2\xb7\x4c\xb2\x63\x6c\x32\x7e\xe6\x46\xff\x00\xbe\x64\x6a\
-\xec\x7f\xe0\xa1\x5f\x0d\xff\x00\xe1\x59\x7e\xd7\x5f\x10\x2c\x62\
-\x87\xcb\xb3\xd4\xaf\x3f\xb6\x2d\xf6\xfd\xd6\x5b\x95\xf3\x9b\xff\
-\x00\x22\x34\x8b\xff\x00\x01\xaf\x9c\xd7\xef\x50\x07\xf5\x28\xbf\
-\x74\x52\xd7\x8b\x7e\xc7\xff\x00\x14\xbf\xe1\x71\x7e\xcd\x9e\x00\
-\xf1\x53\xca\xb3\xde\x5c\xe9\x91\x5b\xde\x36\xef\xf9\x78\x87\xf7\
-\x33\x7f\xe3\xd1\xb3\x7f\xc0\xab\xda\x68\x00\xa2\xb9\xff\x00\x19\
-\x78\xb3\x4b\xf0\x1f\x84\xf5\x8f\x11\xeb\x57\x5f\x62\xd1\xf4\xab\
-\x49\x6f\xaf\x2e\x76\x33\x79\x70\xc6\xbb\x99\xb6\xaf\x27\x0a\x3b\
-\x57\xe5\x4f\xed\x17\xff\x00\x05\x80\xf1\x27\x88\x26\xba\xd2\x7e\
-\x11\xe9\x6b\xe1\xab\x0f\xf5\x6b\xaf\x6a\xb1\xac\xd7\xb2\x7f\xb5\
-\x1c\x3f\x34\x71\xff\x00\xc0\xbc\xc6\xff\x00\x76\x80\x3f\x5d\xa8\
-\xaf\xc2\x7f\xd9\x6f\xf6\xfa\xf8\xbd\xe0\xbf\x8c\xda\x4a\xea\xde\
-\x2c\xbc\xf1\x46\x8b\xaf\xea\x96\xf6\xfa\xa5\x8e\xbb\x33\x5c\x2e\
-\xd9\x24\x58\xda\x48\x59\xbe\x68\x59\x55\xbe\x5d\xbf\x2f\xcb\xf3\
-\x2b\x57\xee\xba\xd0\x02\xd1\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x57\xe2\xa7\xfc\x16\x32\xdd\x63\xfd\xaa\x34\x99\x07\xde\
-\x93\xc2\xf6\x6c\xdf\xf8\x11\x70\xb5\xfb\x57\x5f\x90\x1f\xf0\x5a\
-\x5f\x0e\x0b\x5f\x8b\xde\x00\xf1\x00\x4d\xbf\x6f\xd0\xe6\xb2\xdd\
-\xfd\xe6\xb7\xb8\x66\xff\x00\xdb\x8a\x00\xfc\xe8\xaf\xd5\x1f\xf8\
-\x22\x5f\x89\x55\xf4\xff\x00\x8a\xba\x0b\xb7\xcd\x1c\xda\x7d\xf4\
-\x6b\xfe\xf2\xcd\x1b\x7f\xe8\x2b\x5f\x95\xd5\xf7\xb7\xfc\x11\xc3\
-\xc5\x9f\xd9\x1f\xb4\x76\xbf\xa3\x3b\x7e\xef\x58\xf0\xf4\xdb\x57\
-\xfb\xd2\x45\x34\x72\x2f\xfe\x3b\xe6\x50\x07\xed\x05\x14\x51\x40\
-\x05\x14\x51\x40\x05\x14\x57\x29\xf1\x33\xc6\xf6\x9f\x0c\xfe\x1f\
-\xf8\x97\xc5\xda\x82\xb4\x96\x3a\x1e\x9b\x71\xa9\x4d\x1c\x67\xe6\
-\x75\x86\x36\x93\x6a\xff\x00\xb4\xdb\x71\x40\x1d\x5d\x15\xf8\x21\
-\xf1\x43\xfe\x0a\x4d\xf1\xdb\xe2\x4e\xbb\x75\x73\x6d\xe3\x19\xbc\
-\x21\xa5\xb3\x31\x83\x4c\xd0\x55\x60\x58\x57\xf8\x57\xcc\xdb\xe6\
-\x33\x7f\xb4\xcd\xff\x00\x7c\xd7\xe9\x3f\xfc\x12\xf7\xe3\x76\xad\
-\xf1\xab\xf6\x75\x9b\xfe\x12\x6d\x5e\xeb\x5b\xf1\x16\x8b\xab\x5c\
-\x59\xdc\x5e\x5f\x4c\xd2\xcf\x34\x6d\xb6\x68\xd9\x99\xbe\xf7\xfa\
-\xc6\x5f\xfb\x67\x40\x1f\x64\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x01\xf9\x39\xff\x00\x05\
-\xa7\xf8\x6d\xf6\x5f\x13\x7c\x3d\xf1\xe4\x30\x8c\x5e\x5a\xdc\x68\
-\xd7\x52\x2a\xff\x00\x14\x2d\xe7\x43\xff\x00\x8e\xc9\x37\xfd\xf3\
-\x5f\x99\x95\xfb\xb3\xff\x00\x05\x47\xf8\x72\x7c\x7d\xfb\x22\xf8\
-\x8a\xea\x28\xfc\xcb\xcf\x0d\xdd\x5b\xeb\x50\xfc\xbf\x36\x23\x6f\
-\x2e\x4f\xfc\x87\x34\x8d\xff\x00\x01\xaf\xc2\x6a\x00\xfd\x79\xff\
-\x00\x82\x31\xfc\x4e\x3a\xc7\xc2\xdf\x1a\x78\x1e\x79\x37\x49\xa1\
-\xea\x51\xea\x16\xe1\xbb\x43\x72\xbb\x59\x47\xfd\xb4\x85\x9b\xfe\
-\xda\x57\xe8\xed\x7e\x1b\x7f\xc1\x28\xfe\x2a\x4d\xe0\x1f\xda\xaf\
-\x4f\xd0\x59\xbf\xe2\x5f\xe2\xcb\x39\xb4\xb9\x97\xfb\xb2\x2a\xb4\
-\xd0\xb7\xfd\xf5\x1b\x2f\xfd\xb4\xaf\xdc\x9a\x00\xe6\x7c\x7d\xe0\
-\x8d\x2b\xe2\x47\x83\x75\xbf\x0b\x6b\x90\xb5\xce\x8f\xab\xda\x49\
-\x63\x75\x1a\x36\xd6\x68\xe4\x5d\xad\xb5\xbf\x84\xf3\x5f\xcd\xb7\
-\xc4\xef\x05\xdc\x7c\x37\xf8\x8d\xe2\x8f\x09\xdd\x33\x4b\x71\xa1\
-\xea\x97\x5a\x6c\x92\xed\xfb\xcd\x0c\x8d\x1e\xef\xf8\x16\xda\xfe\
-\x9b\xeb\xf0\x9b\xfe\x0a\x8b\xf0\x6e\xe3\xe1\x8f\xed\x4d\xad\x6a\
-\xc1\x59\xb4\xaf\x17\x46\xba\xd5\xac\xbf\xdd\x91\xbf\x77\x34\x7f\
-\xef\x2c\x8b\xbb\xfd\xd9\x16\x80\x3e\x49\xb3\xba\x9a\xc2\xea\x1b\
-\x8b\x79\x1a\x29\xa1\x91\x64\x8e\x55\xfe\x16\x5f\xba\xd5\xfd\x1e\
-\x7e\xcc\xbf\x17\x17\xe3\xbf\xc0\x9f\x06\xf8\xe7\x62\x43\x3e\xad\
-\x64\x1a\xea\x18\xdb\x72\xc7\x70\x8c\xd1\xcc\xbf\xf7\xf1\x1a\xbf\
-\x9b\xca\xfd\x90\xff\x00\x82\x37\x7c\x44\xff\x00\x84\x87\xe0\x3f\
-\x89\x3c\x27\x2b\x6f\x9f\xc3\xba\xc7\x9d\x1a\xee\xfb\xb6\xf7\x31\
-\xee\x5f\xfc\x89\x1c\xdf\xf7\xd5\x00\x7e\x83\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x57\xe7\x7f\xfc\x16\x4b\xe1\xa6\xa9\
-\xe2\x8f\x83\xbe\x12\xf1\x65\x85\x84\xd7\x90\x78\x6f\x50\x99\x6f\
-\xa4\x8d\x77\x7d\x9e\x1b\x85\x55\xf3\x1b\xfd\x9f\x32\x38\xd7\xfe\
-\x04\xb5\xfa\x21\x5e\x3f\xfb\x5c\x78\x77\xfe\x12\xaf\xd9\x87\xe2\
-\xae\x9a\x14\x34\x92\x78\x6e\xfa\x48\xd7\xfd\xa8\xe1\x69\x17\xff\
-\x00\x1e\x51\x40\x1f\xce\x4d\x7d\x0f\xff\x00\x04\xfb\xf1\xaf\xfc\
-\x20\xdf\xb6\x17\xc3\x3b\xe7\x93\xcb\x86\xeb\x52\xfe\xcb\x93\xfd\
-\xaf\xb5\x46\xd0\xaf\xfe\x3d\x22\xd7\xcf\x2d\xf7\xab\x53\xc2\xba\
-\xf5\xc7\x85\x3c\x4d\xa4\xeb\x56\x9f\x2d\xd6\x9b\x79\x0d\xe4\x2d\
-\xfe\xd4\x72\x2c\x8b\xff\x00\xa0\xd0\x07\xf5\x00\xbf\x74\x52\xd6\
-\x4f\x87\x35\xdb\x5f\x12\x68\x3a\x6e\xaf\x64\xdb\xec\xf5\x0b\x68\
-\xee\xe1\x6f\x54\x91\x43\x2f\xfe\x85\x5a\xd4\x00\x51\x45\x14\x00\
-\x57\x9b\xfe\xd1\x9e\x1c\x1e\x2c\xf8\x05\xf1\x23\x45\x55\x2e\xf7\
-\xfe\x1d\xd4\x20\x55\x5f\xef\x35\xbc\x9b\x7f\xf1\xec\x57\xa4\x55\
-\x4b\xeb\x58\xaf\xad\x27\xb6\x9c\x6e\x8e\x64\x68\x99\x7f\xd9\x6e\
-\x28\x03\xf9\x75\x6a\xfd\x15\xff\x00\x82\x30\xfc\x44\xfe\xc7\xf8\
-\xb3\xe3\x4f\x05\xcf\x2e\xd8\x75\xad\x2e\x3b\xf8\x55\xff\x00\x8a\
-\x6b\x69\x36\xfc\xbf\xf6\xce\x66\xff\x00\xbe\x6b\xf3\xfb\xc5\x5a\
-\x34\x9e\x1c\xf1\x36\xad\xa4\xcb\xfe\xb2\xc6\xf2\x6b\x56\xff\x00\
-\x7a\x39\x19\x7f\xf6\x5a\xf6\x8f\xd8\x3f\xc7\x9f\xf0\xae\x7f\x6b\
-\x6f\x86\x7a\xa3\x4d\xe5\xdb\xcd\xab\x2e\x9b\x37\xf7\x7c\xbb\xa5\
-\x6b\x7f\x9b\xfe\xfe\x2b\x7f\xc0\x68\x03\xfa\x19\xa2\x91\x69\x68\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x03\x9b\xf8\x85\xe1\x1b\x5f\x1e\xf8\x17\xc4\x5e\x19\xbd\xdb\xf6\
-\x3d\x6b\x4f\xb8\xd3\xa6\xdc\x3f\x86\x68\xda\x3f\xfd\x9a\xbf\x99\
-\xcd\x73\x49\xba\xf0\xf6\xb5\x7d\xa5\xde\xc7\xe5\x5e\x58\xdc\x49\
-\x6b\x34\x7f\xdd\x92\x36\xda\xcb\xff\x00\x7d\x2d\x7f\x50\xcd\x5f\
-\xcf\xcf\xfc\x14\x3b\xe1\xd9\xf8\x73\xfb\x5e\x7c\x41\xb3\x48\x42\
-\x5a\x6a\x57\x8b\xac\x5b\xed\xfb\xac\xb7\x2a\xb2\x37\xfe\x44\x69\
-\x17\xfe\x03\x40\x1e\x77\xfb\x34\xf8\xc5\x3e\x1f\xfe\xd0\x5f\x0e\
-\xbc\x43\x23\x6d\x83\x4f\xf1\x05\x8c\xd3\x37\xfd\x33\xf3\x95\x64\
-\xff\x00\xc7\x59\xab\xfa\x4a\x5a\xfe\x5a\xe3\x7d\xac\xac\xbf\x7a\
-\xbf\xa4\xcf\xd9\xdf\xc7\xc3\xe2\x97\xc0\xbf\x01\xf8\xb0\xc9\xe6\
-\xcb\xaa\xe8\xd6\xb7\x13\x39\xff\x00\x9e\xde\x5a\xac\x83\xfe\xfe\
-\x2b\x50\x07\xa4\xd7\xe7\xa7\xfc\x16\x53\xe1\xa7\xfc\x24\x3f\x03\
-\xfc\x31\xe3\x28\x23\x56\xb8\xf0\xee\xad\xf6\x79\x9b\x6f\xdd\xb7\
-\xba\x5d\xad\xff\x00\x91\x23\x87\xfe\xfa\xaf\xd0\xba\xf2\x1f\xda\
-\xbf\xe1\xb8\xf8\xb9\xfb\x39\x7c\x42\xf0\xaa\x26\xfb\xab\xcd\x26\
-\x69\x2d\x57\x6e\xef\xf4\x88\xd7\xce\x87\xff\x00\x22\x46\xb4\x01\
-\xfc\xe3\xd7\xe8\xf7\xfc\x11\x6f\xc6\x96\x5a\x5f\xc4\xff\x00\x1f\
-\xf8\x62\x66\x54\xbc\xd5\xb4\xbb\x7b\xcb\x7d\xdf\xc5\xf6\x79\x19\
-\x59\x57\xfe\x03\x70\xad\xff\x00\x01\x6a\xfc\xe2\x6a\xf6\x0f\xd9\
-\x0f\xe2\x37\xfc\x2a\x9f\xda\x53\xe1\xe7\x89\x24\xb8\x7b\x5b\x4b\
-\x7d\x62\x18\x6f\x25\x56\xdb\xfe\x8f\x33\x79\x33\x6e\xff\x00\x67\
-\x6c\x8d\x40\x1f\xd1\xad\x14\x8b\xf7\x45\x2d\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x15\x8b\xe2\xed\x15\x7c\x43\xe1\x6d\x63\x4b\x65\
-\xdc\xb7\xd6\x73\x5a\xb2\xfa\xef\x8d\x97\xff\x00\x66\xad\xaa\x28\
-\x03\xf9\x6e\xba\xb7\x92\xd6\xe2\x48\x65\x5d\xb2\x46\xcd\x1b\x2f\
-\xf7\x59\x6a\x35\xfb\xd5\xf4\xff\x00\xfc\x14\x73\xe0\xcd\x87\xc1\
-\x7f\xda\x87\x5e\xb4\xd2\x61\x16\xfa\x3e\xb9\x0a\x6b\x96\xb0\x29\
-\xff\x00\x53\xe6\xb3\x79\x8a\xbe\xde\x74\x72\x6d\xff\x00\x65\x96\
-\xbe\x5f\xa0\x0f\xe8\x17\xfe\x09\xeb\xe3\xff\x00\xf8\x58\x5f\xb2\
-\x17\xc3\xcb\xb7\x94\xc9\x75\xa7\xd9\x36\x8f\x36\xef\xbc\xa6\xda\
-\x46\x85\x73\xff\x00\x6c\xd6\x36\xff\x00\x81\x57\xd2\x35\xf9\xad\
-\xff\x00\x04\x5b\xf8\x85\xf6\xef\x87\xbe\x3f\xf0\x54\xb2\xfe\xf7\
-\x4b\xd4\xa1\xd5\x21\x8d\xbf\xe7\x9c\xf1\xf9\x6d\xb7\xfe\x05\x6e\
-\xbf\xf7\xd5\x7e\x94\xd0\x01\x45\x14\x50\x01\x48\xdf\x74\xd2\xd1\
-\x40\x1f\xce\x47\xed\x7d\xe1\xc5\xf0\xaf\xed\x49\xf1\x53\x4d\x0b\
-\xb2\x35\xf1\x25\xf4\x91\xaf\xfb\x32\x4c\xd2\x2f\xfe\x3b\x25\x79\
-\x7e\x83\xab\x5c\x78\x7b\x5a\xd3\xf5\x4b\x56\xdb\x75\x63\x71\x1d\
-\xd4\x2d\xfd\xd6\x8d\x95\x97\xff\x00\x41\xaf\xa8\x3f\xe0\xa8\x5e\
-\x1c\xfe\xc1\xfd\xb4\x3c\x6d\x22\xae\xd8\xf5\x28\xec\x6f\x97\xfe\
-\x05\x6b\x1a\xb7\xfe\x3d\x1b\x57\xca\x2b\xf7\xa8\x03\xfa\x7e\xf0\
-\xde\xb9\x07\x89\x3c\x3b\xa5\xeb\x16\xff\x00\xf1\xed\xa8\xda\xc3\
-\x77\x17\xfb\xb2\x2a\xb2\xff\x00\xe8\x55\xaf\x5e\x0f\xfb\x0e\xf8\
-\xad\xbc\x71\xfb\x25\xfc\x2d\xd4\x9e\x4f\x35\xd3\x45\x86\xc9\x9b\
-\x3f\xc5\x6f\xba\xdd\xbf\xf4\x5d\x7b\xc5\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x15\xf9\x1d\xff\x00\
-\x05\xa8\xf0\x0f\xd8\x7e\x20\x7c\x3d\xf1\xa4\x51\x65\x75\x2d\x36\
-\xe3\x4b\x99\x97\xfb\xd6\xf2\x79\x8b\xbb\xfe\x03\x70\xdf\xf7\xcd\
-\x7e\xb8\xd7\xc3\x3f\xf0\x57\xaf\x04\x27\x88\xff\x00\x65\xa8\xb5\
-\xd5\x8f\x17\x1e\x1d\xd6\xed\xae\x9a\x4f\xee\xc7\x32\xb5\xbb\x7f\
-\xe3\xd2\x47\xff\x00\x7c\xd0\x07\xe2\x7d\x7e\xdd\xff\x00\xc1\x24\
-\xbc\x78\x3c\x5b\xfb\x28\xc3\xa3\x49\x29\x7b\x8f\x0d\xea\xd7\x5a\
-\x7e\xd6\xfb\xcb\x1b\xed\xb8\x5f\xfd\x1c\xcb\xff\x00\x01\xaf\xc4\
-\x4a\xfd\x2f\xff\x00\x82\x2a\x78\xe3\xec\xfe\x31\xf8\x8f\xe0\xe9\
-\x64\xf9\x6f\x2c\x6d\x75\x68\x63\xff\x00\x6a\x19\x1a\x39\x3f\xf4\
-\x74\x7f\xf7\xcd\x00\x7e\xb3\xd2\x37\xdd\x34\xb4\x50\x07\xf3\x81\
-\xfb\x55\x7c\x37\xff\x00\x85\x47\xfb\x46\x7c\x42\xf0\xaa\xc7\xe5\
-\x5b\xd8\xeb\x13\x35\xaa\xed\xdb\xfe\x8f\x23\x79\x90\xff\x00\xe4\
-\x39\x16\xbc\xa5\x7e\xf7\xcb\x5f\x7f\xff\x00\xc1\x63\xfe\x1a\xff\
-\x00\xc2\x39\xf1\xeb\xc3\xbe\x2e\x8a\x3d\xb6\xfe\x24\xd1\xd6\x39\
-\x1f\x6f\xde\xb8\xb6\x6f\x2d\xbf\xf2\x1c\x90\xd7\xe7\xfd\x00\x7f\
-\x49\x1f\xb3\x5f\x8f\x0f\xc4\xdf\x80\x3f\x0f\x7c\x51\x34\x9e\x6d\
-\xce\xa5\xa1\xd9\xcd\x70\xfe\xb3\x79\x6a\xb2\x7f\xe4\x45\x6a\xf4\
-\xea\xf8\x3f\xfe\x09\x01\xf1\x31\xbc\x5b\xfb\x37\xea\x1e\x17\xb9\
-\x90\xbd\xc7\x85\x75\x69\x21\x8d\x0b\x6e\xdb\x6f\x71\xfb\xe8\xff\
-\x00\xf2\x27\x9d\x5f\x78\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x07\xe3\xaf\xfc\x16\x8b\x41\x9a\xd7\xe3\x9f\x82\x75\
-\xa6\x56\xfb\x2d\xe7\x87\x7e\xca\xad\xb7\xe5\xf3\x21\xba\x99\x9b\
-\xff\x00\x1d\x99\x6b\xf3\xce\xbf\x6c\x3f\xe0\xaf\x9e\x1b\x6d\x57\
-\xf6\x55\xb7\xd4\x63\x86\x27\x6d\x27\xc4\x16\x77\x0d\x2b\x2f\xcd\
-\x1c\x6e\xb2\x43\xf2\xb7\xf0\xfc\xd2\x47\x5f\x89\xf4\x01\xf6\x9f\
-\xfc\x12\x5b\xe2\x17\xfc\x22\x1f\xb5\x75\xbe\x8b\x2c\xbb\x6d\xfc\
-\x4d\xa5\xdd\x69\xbb\x5b\xee\xf9\x91\xaa\xdc\x47\xff\x00\xa2\x59\
-\x7f\xe0\x55\xfb\x87\x5f\xcd\x17\xc0\x9f\x1f\x4b\xf0\xbb\xe3\x27\
-\x82\x7c\x5d\x1c\x9e\x5a\xe8\xfa\xc5\xad\xe4\x9f\xed\x46\xb2\x2f\
-\x98\xbf\xf0\x25\xdc\xb5\xfd\x2b\xc3\x34\x73\xc4\x92\x44\xc1\xa3\
-\x65\xca\xb2\xf7\x14\x01\x35\x14\x51\x40\x05\x14\x51\x40\x1f\x8c\
-\xdf\xf0\x59\x6f\x0e\x7f\x67\x7e\xd1\x5e\x19\xd5\x91\x71\x1e\xa5\
-\xe1\xb8\xd5\x9b\xfe\x9a\x43\x71\x32\xff\x00\xe8\x2c\xb5\xf0\x15\
-\x7e\xa6\xff\x00\xc1\x6c\xfc\x33\xfb\x9f\x85\x7e\x20\x8d\x7e\xeb\
-\x6a\x16\x32\x37\xfd\xf9\x91\x7f\xf6\xa5\x7e\x59\x50\x07\xed\xa7\
-\xfc\x12\x23\xc5\x83\xc4\x1f\xb2\x83\x69\x6d\x20\xf3\x34\x2d\x72\
-\xf2\xcc\x2f\xf7\x56\x4f\x2e\xe1\x7f\xf1\xe9\x9a\xbe\xe2\xaf\xcb\
-\x3f\xf8\x22\x7f\x8c\xbf\xe4\xa8\x78\x56\x46\xff\x00\x9f\x1d\x52\
-\x15\xff\x00\xbf\x91\xc9\xff\x00\xb4\xeb\xf5\x32\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\xf1\x3f\
-\xdb\x37\xc2\x3f\xf0\x9d\x7e\xca\xdf\x14\xb4\x70\x9e\x6c\x8d\xa0\
-\xdc\x5d\x46\x9f\xde\x92\x05\xf3\x97\xff\x00\x1e\x8d\x6b\xdb\x2b\
-\x3b\x5a\xd3\x60\xd7\x34\x9b\xed\x2e\xe4\x6e\x86\xf2\xde\x48\x24\
-\x5f\x55\x65\xda\xdf\xfa\x15\x00\x7f\x2f\x6d\xf7\xab\xeb\x7f\xf8\
-\x25\x8f\x8b\x07\x86\x7f\x6c\x8f\x0b\xdb\xb3\xf9\x70\xeb\x56\x77\
-\xda\x74\x9f\xf0\x28\x5a\x45\x5f\xfb\xea\x15\xaf\x95\xb5\xed\x26\
-\x6d\x07\x5c\xd4\x34\xdb\x8f\xf5\xd6\x77\x12\x5b\xc9\xfe\xf4\x6c\
-\xcb\xff\x00\xb2\xd7\xa7\x7e\xc8\xbe\x26\xff\x00\x84\x4b\xf6\xa0\
-\xf8\x5b\xaa\x33\x6d\x8e\x3f\x11\x58\xc7\x23\x7f\xd3\x39\x26\x58\
-\xdb\xff\x00\x1d\x66\xa0\x0f\xe8\xe6\x8a\x45\xfb\xa2\x96\x80\x3e\
-\x09\xff\x00\x82\xc4\x7c\x3d\xff\x00\x84\x9b\xf6\x71\xd2\x7c\x4d\
-\x14\x7b\xee\x3c\x37\xad\x46\xd2\x36\xdf\xbb\x6f\x70\xad\x0b\x7f\
-\xe4\x4f\x26\xbf\x17\xeb\xfa\x3a\xfd\xac\x3c\x00\x3e\x27\xfe\xcd\
-\xff\x00\x12\x3c\x36\xb1\xf9\xb7\x17\x7a\x25\xc3\x5b\xa7\xf7\xa7\
-\x8d\x7c\xd8\x7f\xf2\x24\x6b\x5f\xce\x33\x7d\xea\x00\xfd\x04\xff\
-\x00\x82\x35\x7c\x42\xff\x00\x84\x7f\xe3\xa7\x8a\xbc\x29\x34\x9b\
-\x6d\xf5\xed\x17\xcf\x8d\x77\x7d\xe9\xad\xa4\xdc\xbf\xf9\x0e\x49\
-\xbf\xef\x9a\xfd\x91\xaf\xe7\x9b\xf6\x0b\xf1\x6c\x9e\x0b\xfd\xaf\
-\x3e\x16\xdf\x47\x27\x96\x6e\x35\x88\xf4\xf9\x3f\xda\x5b\xa5\x6b\
-\x76\xff\x00\xd1\x95\xfd\x0c\x2f\xdd\x14\x00\xb4\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x70\x3f\x1a\x3c\x07\xa7\xfc\x50\xf8\
-\x5f\xe2\x6f\x0c\xea\xba\x6c\x3a\xbd\x9e\xa1\x61\x2c\x7f\x64\x9f\
-\xee\xb4\x98\xdd\x1b\x73\xf7\x59\x59\x55\x95\xbf\x85\x96\xbf\x9a\
-\xa9\x15\xa2\x91\x95\x95\x95\x97\xe5\x65\x6a\xfe\xa4\x9a\xbf\x9e\
-\xef\xdb\xe3\xe1\xbe\x87\xf0\xa3\xf6\xab\xf1\xbf\x87\xbc\x39\x65\
-\x26\x9d\xa3\xa4\x96\xf7\x30\xdb\xbb\x6e\x55\x32\xdb\xc7\x33\xf9\
-\x7f\xec\xee\x91\xb6\xd0\x07\xcf\x8b\xf7\xab\xfa\x22\xfd\x8b\x7e\
-\x23\x7f\xc2\xd5\xfd\x97\xfe\x1c\x78\x81\xe6\x13\x5d\x36\x93\x1d\
-\x9d\xd3\x7a\xcd\x6f\xfe\x8f\x26\x7f\xe0\x51\x96\xff\x00\x81\x57\
-\xf3\xb9\x5f\xb0\x5f\xf0\x46\x5f\x88\xff\x00\xdb\x9f\x07\x7c\x61\
-\xe0\xc9\xe6\x57\xb8\xd0\x75\x65\xbc\x89\x7f\x89\x61\xb9\x8f\xff\
-\x00\x8e\x43\x27\xfd\xf5\x40\x1f\xa2\x94\x51\x45\x00\x14\x51\x45\
-\x00\x7c\x1f\xff\x00\x05\x8a\xf0\xcf\xf6\xcf\xec\xc7\xa4\xea\xc8\
-\xbf\xbc\xd1\xfc\x45\x6f\x23\x3f\xf7\x63\x92\x19\xa3\x6f\xfc\x79\
-\xa3\xaf\xc5\x9a\xfe\x81\x7f\xe0\xa2\x5e\x15\xff\x00\x84\xc3\xf6\
-\x35\xf8\x95\x6a\xb1\xee\x92\xd6\xc6\x3d\x49\x7d\xbe\xcf\x34\x73\
-\x37\xfe\x3a\x8d\x5f\xcf\xdb\x7d\xea\x00\xfb\x5b\xfe\x09\x17\xe3\
-\x0f\xf8\x47\x7f\x6b\x48\x74\xb2\xfb\x53\x5f\xd1\x6f\x2c\x76\x9f\
-\xe2\x68\xf6\xdc\x2f\xfe\x89\x6a\xfd\xbf\xaf\xe7\x1b\xf6\x47\xf1\
-\xcf\xfc\x2b\x7f\xda\x5f\xe1\xaf\x88\x24\x6f\x2a\x1b\x5d\x72\xd6\
-\x3b\x86\xfe\xec\x32\x37\x93\x27\xfe\x3b\x23\x57\xf4\x70\xbf\x74\
-\x50\x02\xd1\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x52\x37\xdd\x34\xb4\x50\x07\xf3\x99\xfb\x63\x78\x57\xfe\
-\x10\xdf\xda\x93\xe2\x96\x96\xab\xb2\x38\xfc\x41\x79\x34\x6b\xfd\
-\xd8\xe6\x93\xce\x5f\xfc\x76\x45\xaf\x29\xd1\xf5\x4b\x8d\x13\x56\
-\xb3\xd4\x2d\x5b\x6d\xc5\x9c\xd1\xdc\x46\xdf\xdd\x65\x6d\xcb\xff\
-\x00\xa0\xd7\xd6\x7f\xf0\x55\x8f\x0c\x8f\x0e\xfe\xd8\xfe\x22\xba\
-\xf2\xfc\xa5\xd6\x34\xfb\x1d\x41\x76\xff\x00\x17\xee\x56\x16\x6f\
-\xfb\xea\x16\xaf\x90\x17\xef\x50\x07\xf4\xf5\xe1\x1f\x11\x41\xe3\
-\x0f\x09\xe8\xda\xf5\xa8\x1f\x65\xd5\x2c\x60\xbe\x87\xfd\xd9\x23\
-\x59\x17\xff\x00\x42\xad\xba\xf9\xcf\xfe\x09\xf7\xe3\x03\xe3\x2f\
-\xd8\xf3\xe1\x95\xe4\x92\x79\xb2\xda\xe9\xc7\x4c\x7f\xf6\x7e\xcd\
-\x24\x90\xaf\xfe\x3b\x1a\xd7\xd1\x94\x01\x14\x88\xb2\xa1\x56\x50\
-\xca\x7e\xf2\xb5\x7f\x35\x3f\x1d\xbc\x0c\xdf\x0d\x7e\x33\x78\xe3\
-\xc2\xbe\x5f\x95\x1e\x8f\xad\x5e\x59\xc7\xff\x00\x5c\xd6\x66\xf2\
-\xdb\xfe\xf9\xdb\x5f\xd2\xdd\x7e\x14\xff\x00\xc1\x55\x3c\x0e\x7c\
-\x23\xfb\x5f\x6b\xd7\x89\x1f\x95\x0f\x88\x2c\x6c\xf5\x68\xff\x00\
-\xde\xf2\xfc\x99\x3f\xf1\xe8\x5a\x80\x3e\x5e\xf0\x0f\x8a\x24\xf0\
-\x47\x8e\x3c\x3b\xe2\x28\x95\x9a\x6d\x1f\x50\xb7\xd4\x15\x57\xf8\
-\x9a\x19\x16\x4f\xfd\x96\xbf\xa6\x0f\x0e\xeb\x96\x3e\x2c\xd0\x74\
-\xdd\x73\x4c\x9d\x6e\xb4\xdd\x42\xde\x3b\xcb\x59\xd7\xee\xc9\x1c\
-\x8b\xb9\x5b\xfe\xf9\x6a\xfe\x60\x57\xef\x57\xef\x9f\xfc\x13\x5f\
-\xc5\x67\xc5\x5f\xb1\x9f\xc3\xe6\x76\xdd\x71\xa7\x47\x71\xa6\xc9\
-\x9e\xde\x4d\xc4\x8a\xbf\xf9\x0f\x65\x00\x7d\x45\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x5f\x92\x1f\xf0\x59\x0f\x81\x77\
-\x5a\x4f\x8d\x3c\x37\xf1\x5a\xc9\x5a\x5d\x37\x56\x85\x74\x5d\x43\
-\x8f\xf5\x37\x11\xab\x34\x2d\xff\x00\x6d\x23\xdc\xbf\xf6\xc7\xfd\
-\xaa\xfd\x6f\xaf\x9e\xff\x00\x6f\x2f\x86\xf1\x7c\x50\xfd\x93\xfe\
-\x22\xe9\xcd\x12\xcb\x71\x67\xa6\xbe\xad\x6a\xdf\xc4\xb2\xdb\x7e\
-\xfb\xe5\xff\x00\x79\x63\x65\xff\x00\x81\x50\x07\xf3\xdb\x5f\x6e\
-\x7f\xc1\x23\xfe\x24\x7f\xc2\x1f\xfb\x51\x7f\xc2\x3f\x34\xbb\x2d\
-\x7c\x51\xa5\xdc\x58\xaa\xb7\xdd\x69\xa3\xff\x00\x48\x8f\xff\x00\
-\x1d\x8e\x45\xff\x00\x81\x57\xc4\x8d\x5d\xb7\xc1\x1f\x88\x33\x7c\
-\x28\xf8\xbd\xe0\xdf\x18\x44\xcc\xbf\xd8\xba\xb5\xbd\xe4\x9b\x7f\
-\x8a\x35\x91\x7c\xc5\xff\x00\x81\x2e\xe5\xa0\x0f\xe9\x7e\x8a\xab\
-\x6b\x79\x0d\xed\xbc\x53\xc3\x22\xcb\x0c\x8a\xb2\x46\xeb\xd1\x95\
-\xbe\xe9\xab\x54\x00\x51\x45\x14\x01\xcb\x7c\x4e\xf0\xaa\xf8\xe7\
-\xe1\xc7\x8a\xbc\x3a\xea\x1d\x75\x7d\x2e\xeb\x4f\xc3\x7f\xd3\x68\
-\x5a\x3f\xfd\x9a\xbf\x99\x7b\x88\x24\xb5\x9a\x48\x65\x56\x8a\x48\
-\xdb\x6b\x2b\x7f\x0b\x2d\x7f\x52\x0d\xf7\x4d\x7f\x38\x7f\xb5\x97\
-\x82\x3f\xe1\x5c\xfe\xd2\x9f\x12\xbc\x3e\xab\xe5\x43\x6b\xaf\x5d\
-\x35\xba\xff\x00\xd3\x19\x24\xf3\x23\xff\x00\xc8\x72\x2d\x00\x79\
-\x4c\x32\xb4\x13\x2c\x88\xcc\xb2\x2b\x6e\x56\x5f\xe1\x6a\xfe\x96\
-\xbe\x0b\xf8\xe1\x7e\x25\x7c\x24\xf0\x77\x8a\xd5\xfc\xd3\xad\x69\
-\x16\xb7\xcd\xfe\xf4\x90\xab\x30\xff\x00\xbe\xb7\x57\xf3\x45\x5f\
-\xba\x7f\xf0\x4a\xff\x00\x1e\xff\x00\xc2\x67\xfb\x20\xe8\x16\x4f\
-\x27\x9b\x71\xe1\xeb\xeb\xad\x22\x4c\xfd\xed\xab\x27\x9d\x1f\xfe\
-\x43\x99\x7f\x2a\x00\xfb\x0e\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x0f\xc8\x1f\xf8\x2d\x37\
-\x87\x16\xd7\xe3\x07\xc3\xfd\x71\x55\x57\xed\xda\x1c\x96\x7b\xbf\
-\xbc\xd0\xdc\x33\x7f\xed\xc5\x7e\x73\xd7\xeb\x2f\xfc\x16\xbf\x41\
-\xfb\x47\x81\xfe\x18\xeb\x3b\x7f\xe3\xd7\x52\xbc\xb3\x66\xff\x00\
-\xae\x90\xc7\x27\xfe\xd1\x6a\xfc\x9a\xa0\x0f\xda\xcf\xf8\x23\xd7\
-\x88\xff\x00\xb6\x3f\x65\x9b\xfb\x06\x6d\xcd\xa5\x78\x8a\xea\x05\
-\x5f\xee\xac\x91\xc3\x37\xfe\x85\x23\x57\xdd\x55\xf9\xa7\xff\x00\
-\x04\x51\xd6\x7c\xff\x00\x00\xfc\x4e\xd2\xb7\x7f\xc7\xae\xa9\x67\
-\x73\xb7\xfe\xba\x43\x22\xff\x00\xed\x1a\xfd\x2c\xa0\x02\xbf\x2b\
-\x7f\xe0\xb5\xde\x09\xd9\x7d\xf0\xc7\xc5\xf1\x2f\xfa\xc8\xef\x34\
-\x9b\x86\xff\x00\x75\xa3\x9a\x3f\xfd\x0a\x6a\xfd\x52\xaf\x8a\xff\
-\x00\xe0\xad\x3e\x07\x1e\x2a\xfd\x92\x6f\xb5\x44\x8b\xcc\x97\xc3\
-\xba\xb5\x9e\xa5\x95\xfb\xca\xac\xcd\x6e\xdf\xfa\x39\x7f\xef\x9a\
-\x00\xfc\x3d\xaf\xd5\xef\xf8\x22\xc7\xc4\x4b\x8b\xef\x0c\x7c\x44\
-\xf0\x4d\xc4\x9b\xad\xf4\xfb\xab\x7d\x5a\xd1\x58\xfd\xdf\x39\x5a\
-\x39\xbf\xf4\x4c\x7f\xf7\xd5\x7e\x50\xd7\xdd\xff\x00\xf0\x47\x5f\
-\x15\x7f\x63\x7e\xd3\x9a\xb6\x92\xed\xfb\xbd\x63\xc3\xb7\x11\xaa\
-\xff\x00\x7a\x48\xe4\x86\x45\xff\x00\xc7\x56\x4a\x00\xfd\xa7\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xae\x7f\xc7\x1a\x3b\
-\x78\x83\xc1\x7a\xf6\x96\xa9\xe6\x35\xf5\x85\xc5\xae\xdf\xef\x79\
-\x91\xb2\xff\x00\xec\xd5\xd0\x52\x35\x00\x7f\x2d\xf7\x56\xf2\x5a\
-\xdc\x49\x0c\xf1\xc9\x14\xd1\xb7\x97\x24\x52\xae\xd6\x56\x5f\xe1\
-\x6a\x8d\x6b\xea\xff\x00\xf8\x29\xaf\xc3\xad\x63\xc0\xff\x00\xb5\
-\xaf\x8b\x75\x5b\xdd\x2f\xec\x3a\x5f\x88\x64\x8e\xff\x00\x4d\xb8\
-\x8e\x3d\xb1\xdc\xaf\x93\x1a\xc8\xcb\xfe\xd7\x98\xad\xbb\xf8\xb7\
-\x7c\xdf\xc5\x5f\x27\xd0\x07\xf4\x25\xfb\x09\xfc\x4e\xff\x00\x85\
-\xad\xfb\x27\xfc\x3b\xd6\x25\x9b\xcc\xbd\xb7\xd3\xd7\x4b\xba\xfe\
-\xf7\x9d\x6c\xde\x4f\xcd\xfe\xd3\x2c\x6a\xdf\xf0\x2a\xfa\x12\xbf\
-\x32\xff\x00\xe0\x8b\x7f\x13\x0d\xf7\x83\xfc\x7d\xe0\x1b\x89\xbf\
-\x79\xa7\x5e\x43\xac\x5a\xc6\xdf\xf3\xce\x65\xf2\xe6\xdb\xfe\xeb\
-\x47\x1f\xfd\xfc\xaf\xd3\x4a\x00\x28\xa2\x8a\x00\x2b\xf1\x1f\xfe\
-\x0a\xf1\xe0\x7f\xf8\x46\xbf\x6a\x85\xd6\x92\x3d\xb0\xf8\x8b\x45\
-\xb5\xbc\x66\x5f\xe2\x92\x3d\xd6\xed\xff\x00\x8e\xc7\x1f\xfd\xf5\
-\x5f\xb7\x15\xf9\x9d\xff\x00\x05\xa9\xf0\x1f\xda\xbc\x13\xf0\xe7\
-\xc6\x31\x46\xdb\xac\x75\x0b\x8d\x2a\x69\x57\xfb\xb3\x46\xb2\x47\
-\xbb\xfe\x05\x0b\x7f\xdf\x54\x01\xf9\x35\x5f\xa8\xbf\xf0\x45\x2f\
-\x1e\x01\x71\xf1\x2b\xc1\x92\xb7\xde\x5b\x5d\x62\xdd\x7f\xdd\xdd\
-\x0c\xcd\xff\x00\x8f\x43\x5f\x97\x55\xf5\x9f\xfc\x12\xf3\xc7\xc7\
-\xc0\xbf\xb6\x07\x85\xed\xde\x4f\x2a\xd7\x5e\xb7\xba\xd1\xe6\xf9\
-\xbf\xe7\xa4\x7e\x64\x7f\xf9\x12\x18\xe8\x03\xf7\x8e\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x0f\x84\x7f\xe0\xb0\xfa\x22\xea\x3f\xb2\xce\x9d\x79\xb7\xf7\x9a\
-\x7f\x89\x2d\x66\xdd\xfe\xcb\x43\x71\x1f\xfe\xcc\xb5\xf8\xaf\x5f\
-\xbb\xdf\xf0\x54\xbd\x2c\xea\x3f\xb1\x6f\x8c\xa5\xda\x19\xec\xee\
-\xb4\xfb\x85\xc7\xfd\x7e\x44\xa7\xf4\x6a\xfc\x21\xa0\x0f\xd2\xdf\
-\xf8\x22\x86\xa9\xe4\xf8\xdb\xe2\x7e\x97\xbb\xfe\x3e\x34\xdb\x1b\
-\xad\xbf\xf5\xce\x69\x17\xff\x00\x6a\x57\xeb\x4d\x7e\x30\x7f\xc1\
-\x1b\x75\x9f\xb0\x7e\xd3\x1e\x20\xb1\x6f\xbb\x7d\xe1\x9b\x8f\xfb\
-\xea\x3b\x8b\x76\xff\x00\xe2\xab\xf6\x7e\x80\x0a\xf2\xaf\xda\x87\
-\xc0\xc9\xf1\x13\xf6\x74\xf8\x91\xe1\xd0\x9e\x64\x97\xda\x15\xe2\
-\xc2\xbf\xf4\xd9\x63\x69\x23\xff\x00\xc8\x8a\xb5\xea\xb5\x04\xd0\
-\xa4\xf1\x34\x6e\xaa\xf1\xb0\xc3\x2b\x77\x14\x01\xfc\xb8\xb7\xde\
-\xaf\x61\xfd\x90\x7e\x23\x5e\x7c\x2b\xfd\xa5\xbe\x1e\x78\x86\xcf\
-\x73\x79\x7a\xb4\x36\xb7\x11\xee\xdb\xbe\xde\x76\xf2\x66\x5f\xfb\
-\xe6\x46\xae\x13\xe2\x97\x85\xdb\xc0\xdf\x12\xbc\x59\xe1\xd6\x56\
-\x56\xd2\x75\x6b\xad\x3f\x6b\x7f\xd3\x39\x9a\x3f\xfd\x96\xa8\xf8\
-\x2f\x51\xfe\xc6\xf1\x76\x8b\xa8\x37\xcb\xf6\x5b\xeb\x79\xbf\xef\
-\x99\x15\xbf\xf6\x5a\x00\xfe\x9f\x16\x96\xa3\x8d\x95\xd4\x32\x9d\
-\xca\xdc\x8a\x92\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x3f\x34\x3f\xe0\xb3\x5f\x0a\xf5\x9d\x73\xc2\x3e\x07\xf1\xde\
-\x9f\x1b\x4f\xa3\xe8\x32\xdc\x59\x6a\x5b\x1b\xfe\x3d\xfe\xd0\xd1\
-\xf9\x72\x6d\xfe\xee\xe8\xd9\x59\xbd\x59\x2b\xf2\x62\xbf\xa6\x1f\
-\x8b\xff\x00\x0e\xec\x7e\x2d\x7c\x30\xf1\x47\x83\xb5\x00\x0d\xae\
-\xb7\xa7\x4d\x64\xc5\xbf\xe5\x9b\x32\xfc\xaf\xf5\x56\xda\xdf\xf0\
-\x1a\xfe\x69\xf5\x2b\x09\xb4\xbd\x42\xe2\xce\xea\x3f\x2a\xe2\xde\
-\x46\x86\x45\x6f\xe1\x65\x6d\xad\x40\x1f\x54\xff\x00\xc1\x2f\xfe\
-\x25\xff\x00\xc2\xbb\xfd\xae\xbc\x33\x6f\x2c\xde\x55\x8f\x89\x21\
-\x9b\x43\x9b\xe6\xfe\x29\x17\x74\x3f\xf9\x1a\x38\xd7\xfe\x05\x5f\
-\xbc\x95\xfc\xc0\x78\x47\xc4\xd7\x9e\x0a\xf1\x56\x8f\xe2\x0d\x3d\
-\xbc\xad\x43\x49\xbc\x86\xfa\xdd\xbf\xbb\x24\x72\x2c\x8b\xff\x00\
-\x8f\x2d\x7f\x4c\x5e\x0a\xf1\x45\xa7\x8d\xfc\x1f\xa2\x78\x8b\x4f\
-\x6d\xd6\x1a\xbd\x8c\x3a\x85\xbb\x7f\xd3\x39\x63\x59\x17\xf4\x6a\
-\x00\xdd\xa2\x8a\x28\x00\xaf\x97\xbf\xe0\xa4\x7e\x01\x3e\x3e\xfd\
-\x8f\xbc\x74\x89\x1f\x99\x75\xa4\x47\x0e\xb5\x0f\xcb\xf7\x7c\x89\
-\x15\xa4\xff\x00\xc8\x7e\x65\x7d\x43\x58\x9e\x2f\xf0\xed\xb7\x8c\
-\xbc\x2b\xac\xe8\x37\x9f\x35\x96\xa9\x67\x3d\x8c\xcb\xff\x00\x4c\
-\xe4\x8d\xa3\x6f\xfd\x0a\x80\x3f\x98\x4a\xe9\xfe\x18\xf8\xc2\x6f\
-\x87\x7f\x11\xfc\x2f\xe2\x9b\x72\xcb\x2e\x8b\xaa\x5a\xea\x0b\xb7\
-\xfe\x98\xc8\xb2\x7f\xec\xb5\x9b\xe2\x8f\x0f\x5d\x78\x4b\xc4\xda\
-\xb6\x87\x7e\xbb\x6f\xb4\xdb\xc9\xac\x6e\x17\xfb\xb2\x47\x23\x46\
-\xdf\xf8\xf2\xd6\x5a\xfd\xea\x00\xfe\xa2\x2c\x2f\xa1\xd4\xac\x6d\
-\xee\xed\xdd\x65\xb7\xb8\x8d\x66\x8d\xc7\xf1\x2b\x0d\xca\x6a\xed\
-\x78\x17\xec\x35\xf1\x0b\xfe\x16\x67\xec\xa5\xf0\xdb\x5a\x67\x12\
-\x5c\x47\xa5\x47\xa7\xce\xdf\xc5\xe6\x5b\x33\x5b\xb6\xef\xfb\xf7\
-\xbb\xfe\x05\x5e\xfb\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x1f\x37\xff\x00\xc1\x45\x2d\x7e\xdb\xfb\
-\x17\xfc\x50\x8f\xfb\xb6\x30\xc9\xff\x00\x7c\xdd\x42\xdf\xfb\x2d\
-\x7f\x3f\x4d\xf7\x9a\xbf\xa1\x4f\xdb\xe1\x43\x7e\xc7\xff\x00\x15\
-\x33\xd3\xfb\x1d\xbf\xf4\x64\x75\xfc\xf5\xb7\xde\x6a\x00\xfb\x0b\
-\xfe\x09\x43\xa8\xb5\x97\xed\x91\xe1\xf8\x43\x7f\xc7\xe6\x9b\xa8\
-\x42\xdf\xf8\x0e\xd2\x7f\xed\x3a\xfd\xd3\xaf\xc0\xdf\xf8\x26\x3d\
-\xd3\x5b\xfe\xdb\x5f\x0e\xd5\x5b\x6f\x99\xf6\xe8\xff\x00\xf2\x46\
-\xe2\xbf\x7c\x56\x80\x16\x91\xbe\xe9\xa5\xa2\x80\x3f\x9f\xef\xf8\
-\x28\xc7\x83\xdb\xc1\x9f\xb6\x37\xc4\x58\x12\x3d\x90\x5f\x5d\x47\
-\xaa\x46\xdf\xde\xfb\x44\x31\xc8\xcd\xff\x00\x7f\x1a\x4a\xf9\xad\
-\x7e\xf5\x7e\x8b\x7f\xc1\x68\xbc\x08\x34\xcf\x8b\xde\x06\xf1\x64\
-\x51\xed\x4d\x63\x47\x92\xc6\x46\xfe\xf4\x96\xd3\x6e\xff\x00\xd0\
-\x6e\x17\xfe\xf9\xaf\xce\x8a\x00\xfe\x94\x3f\x67\xdf\x1c\x43\xf1\
-\x2b\xe0\x77\x80\xfc\x51\x0c\x9b\xc6\xa9\xa3\x5a\xdc\x49\x8f\xe1\
-\x93\xcb\x5f\x31\x7f\xe0\x2c\x19\x7f\x0a\xf4\x6a\xf8\x27\xfe\x08\
-\xf9\xf1\x36\x4f\x16\xfe\xce\xfa\xb7\x85\x6e\x1d\x9a\x5f\x0a\xea\
-\xcd\x1c\x3b\x9b\xee\xdb\xdc\x2f\x9c\xab\xff\x00\x7f\x3c\xea\xfb\
-\xda\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x11\xbe\
-\xe9\xaf\xe7\x27\xf6\xc0\xf0\x6b\x78\x03\xf6\xa0\xf8\xa1\xa2\xb2\
-\xec\x58\x75\xeb\xa9\xa1\x5f\xfa\x63\x34\x9e\x74\x7f\xf8\xec\x8b\
-\x5f\xd1\xbd\x7e\x2a\x7f\xc1\x60\xbc\x03\xff\x00\x08\xdf\xed\x39\
-\x63\xaf\xc7\x1e\xdb\x7f\x12\x68\xb6\xf3\x34\x9b\x7e\xf4\xd0\xb3\
-\x42\xcb\xff\x00\x7c\xac\x3f\xf7\xd5\x00\x7c\x29\x5f\xba\xff\x00\
-\xf0\x4b\x6f\x89\xc3\xe2\x17\xec\x97\xa0\xd8\xcd\x32\xc9\x7d\xe1\
-\x9b\x99\xb4\x69\xbf\xbd\xb5\x5b\xcc\x87\xff\x00\x21\xc8\xab\xff\
-\x00\x01\xaf\xc2\x8a\xfd\x1e\xff\x00\x82\x31\x7c\x50\x3a\x5f\xc4\
-\x4f\x1c\x78\x0e\x79\x76\xc3\xac\x69\xf1\xea\x96\xaa\xdf\xf3\xda\
-\xdd\xb6\xc8\xab\xfe\xd3\x47\x36\xef\xfb\x67\x40\x1f\xaf\x14\x51\
-\x45\x00\x14\x51\x45\x00\x7e\x08\xff\x00\xc1\x4c\xbe\x19\xff\x00\
-\xc2\xb7\xfd\xaf\x3c\x5c\xd1\x47\xe5\x58\xf8\x81\x63\xd7\xad\xfe\
-\x5f\xbd\xe7\x2f\xef\xbf\xf2\x34\x73\x57\xca\xf5\xfa\xd5\xff\x00\
-\x05\x9e\xf8\x4f\xfd\xa5\xe0\x9f\x05\x7c\x44\xb5\x83\x74\x9a\x5d\
-\xd4\x9a\x3d\xf3\x2f\xfc\xf1\x99\x7c\xc8\x59\xbf\xd9\x59\x23\x65\
-\xff\x00\xb6\xb5\xf9\x2b\x40\x1f\xae\x7f\xf0\x46\x1f\x89\x8b\xab\
-\xfc\x35\xf1\x9f\x80\xee\x26\xdd\x3e\x8f\xa8\x47\xaa\x5b\xab\x77\
-\x86\xe1\x76\xb6\xdf\xf7\x64\x87\xff\x00\x22\x57\xe9\x1d\x7e\x0c\
-\x7f\xc1\x32\x7e\x2e\x2f\xc2\xbf\xda\xc3\xc3\x70\xdc\xcf\xe4\xe9\
-\x7e\x26\x8e\x4d\x06\xe3\x73\x7c\xbb\xa6\xda\xd0\xff\x00\xe4\x65\
-\x8d\x7f\xe0\x55\xfb\xcf\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x1f\x39\x7f\xc1\x43\x2f\x85\x8f\xec\
-\x6b\xf1\x4a\x43\xdf\x4f\x8e\x2f\xfb\xea\xe2\x15\xff\x00\xd9\xab\
-\xf9\xf7\x6f\xbc\xd5\xfb\x9f\xff\x00\x05\x5c\xf1\x10\xd0\xff\x00\
-\x63\x9d\x7e\xd7\x76\xd9\x35\x6d\x4a\xc2\xc5\x4f\xfd\xb6\xf3\x8f\
-\xfe\x3b\x0b\x57\xe1\x7d\x00\x7d\x41\xff\x00\x04\xcc\xb7\x37\x1f\
-\xb6\xc7\xc3\x7c\x7f\xcb\x39\x2f\xa4\xff\x00\xc9\x1b\x8a\xfd\xf5\
-\x5f\xba\x2b\xf0\xc3\xfe\x09\x3f\xa5\x9b\xff\x00\xdb\x17\x43\xb9\
-\x0b\x91\xa7\xe9\x7a\x85\xcb\x7f\xb3\xfb\x9f\x2f\xff\x00\x6a\x57\
-\xee\x85\x00\x14\x51\x45\x00\x7e\x77\x7f\xc1\x68\x7c\x37\xf6\xef\
-\x81\xde\x09\xd7\x16\x3d\xed\xa7\xf8\x81\xad\x77\x7f\x75\x66\xb7\
-\x93\xff\x00\x66\x85\x6b\xf1\xea\xbf\x73\x3f\xe0\xac\x5a\x1f\xf6\
-\xaf\xec\x77\xad\x5d\xed\xdd\xfd\x99\xaa\x69\xf7\x7f\x4f\xdf\x79\
-\x3f\xfb\x5a\xbf\x0c\xe8\x03\xf4\xbb\xfe\x08\x9f\xe2\x36\xb7\xf1\
-\xb7\xc4\xdd\x07\x77\x17\x5a\x6d\x9d\xf2\xaf\xfd\x71\x9a\x48\xdb\
-\xff\x00\x47\x2d\x7e\xb4\x57\xe2\x37\xfc\x12\x17\xc4\x4d\xa3\x7e\
-\xd6\x9f\x61\xf3\x36\xae\xad\xa0\xde\x5a\xed\xfe\xf3\x2b\x47\x37\
-\xfe\xd1\x6a\xfd\xb9\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\xbe\x22\xff\x00\x82\xb2\x7c\x35\xd4\xfc\x75\xfb\x30\
-\xad\xfe\x93\xa6\x9b\xf9\xbc\x3d\xab\x45\xaa\xdd\x34\x71\xee\x96\
-\x2b\x5f\x26\x68\xe5\x90\x7f\x16\x14\xb4\x6c\xdf\xec\xaf\xfb\x35\
-\xf6\xed\x72\x9f\x14\x3c\x22\xde\x3e\xf8\x6d\xe2\xaf\x0c\xa4\xc2\
-\x06\xd6\x74\x9b\xad\x35\x67\x27\xee\x19\xa1\x68\xf7\x7f\xe3\xd4\
-\x01\xfc\xca\x57\xb2\xfe\xc7\xff\x00\x14\xbf\xe1\x4e\x7e\xd2\x9f\
-\x0f\xfc\x50\xf3\x79\x16\x76\xfa\xa4\x76\xf7\x8d\xbb\xfe\x5d\xe6\
-\xfd\xcc\xdf\xf8\xec\x8c\xdf\xf0\x1a\xf3\x3f\x19\x78\x47\x55\xf0\
-\x17\x8a\xb5\x5f\x0e\x6b\x76\x8f\x65\xab\x69\x57\x52\x5a\x5c\xdb\
-\xc9\xff\x00\x2c\xe4\x8d\xb6\xb5\x63\xaf\xde\xa0\x0f\xea\x51\x69\
-\x6b\xc5\xff\x00\x64\x2f\x8a\xbf\xf0\xb9\xbf\x67\x0f\x01\x78\xa9\
-\xe6\x13\x5e\x5c\x69\xb1\xdb\xde\xb6\xef\xf9\x7a\x87\xf7\x33\x7f\
-\xe3\xd1\xb3\x7f\xc0\xab\xda\x28\x00\xa2\x8a\x28\x03\xca\x7f\x69\
-\xdf\x84\x51\xfc\x73\xf8\x0b\xe3\x4f\x05\x32\xa3\xdc\x6a\x5a\x7b\
-\x7d\x8d\x9b\xf8\x6e\x93\xf7\x90\xb7\xfd\xfc\x55\xaf\xe7\x12\xf2\
-\xd6\x6b\x1b\xa9\xad\xee\x23\x68\x2e\x21\x66\x8e\x48\xd9\x76\xb2\
-\xb2\xfd\xe5\xaf\xea\x46\xbf\x07\xff\x00\xe0\xa6\xbf\x01\xdf\xe0\
-\xbf\xed\x2f\xaa\xea\x16\x96\xfe\x4e\x81\xe2\xed\xda\xd5\x9b\xaa\
-\xfc\xab\x33\x37\xfa\x44\x7f\xf0\x19\x37\x37\xfb\xb2\x2d\x00\x7c\
-\xa5\xa5\xea\x57\x5a\x4e\xa5\x6b\x7d\x65\x33\x5b\x5e\x5a\xc8\xb3\
-\x43\x3c\x7f\x7a\x39\x15\xb7\x2b\x2f\xfc\x0a\xbf\xa4\x3f\xd9\xdf\
-\xe2\xdd\xa7\xc7\x6f\x82\xbe\x10\xf1\xc5\xab\x20\x3a\xb5\x8c\x72\
-\x5c\x46\x9f\xf2\xc6\xe1\x7e\x59\xa3\xff\x00\x80\xc8\xac\xbf\x85\
-\x7f\x36\x75\xfa\x7f\xff\x00\x04\x73\xf8\xfe\xb6\xf7\xbe\x20\xf8\
-\x43\xab\x5d\x79\x7f\x6a\xce\xb1\xa2\xab\x9f\xf9\x68\xab\xb6\xe2\
-\x15\xff\x00\x80\xaa\xc9\xb7\xfd\x99\x28\x03\xf5\x5e\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x29\x1a\x80\x3f\x32\x3f\
-\xe0\xb5\x5e\x3e\x8e\xdf\xc2\x3f\x0e\xbc\x17\x1c\x9b\xa4\xba\xbc\
-\xb8\xd6\x26\x8f\x3f\x75\x61\x8f\xc9\x8f\xff\x00\x1e\x9a\x4f\xfb\
-\xe6\xbf\x28\x6b\xe9\xff\x00\xf8\x28\xd7\xc6\xd8\xfe\x37\x7e\xd4\
-\x3e\x23\xb8\xb0\x9f\xed\x1a\x26\x82\xab\xa0\xe9\xec\xad\xb9\x59\
-\x62\x66\xf3\x19\x7f\xde\x99\xa4\xff\x00\x80\xed\xaf\x98\x28\x03\
-\xf4\x5f\xfe\x08\xb7\xe0\xff\x00\xed\x0f\x8b\x5e\x3e\xf1\x33\x47\
-\xba\x3d\x37\x46\x8e\xc5\x5b\x6f\xdd\x6b\x89\xb7\x7f\xe8\x36\xed\
-\x5f\xaf\xf5\xf0\x6f\xfc\x11\xfb\xe1\xbb\x78\x57\xf6\x71\xd4\xbc\
-\x51\x3a\x14\x9b\xc5\x1a\xbc\x93\x46\xd8\xfb\xd6\xf0\x2f\x92\xbf\
-\xf9\x13\xce\xaf\xbc\xa8\x00\xa2\x8a\x28\x03\xe7\xcf\xdb\xeb\x41\
-\x1e\x22\xfd\x8f\x7e\x2a\x5a\x6d\xdd\xe5\xe8\xed\x79\xff\x00\x7e\
-\x24\x8e\x6f\xfd\xa7\x5f\xcf\x6b\x7d\xea\xfe\x96\x3e\x3b\x69\x2b\
-\xe2\x2f\x82\x3f\x10\x34\xb2\xbb\xbe\xd9\xe1\xfd\x42\xdf\x6f\xfb\
-\xd6\xf2\x2d\x7f\x34\xed\x40\x1f\x5e\x7f\xc1\x2a\xf4\x56\xd5\x3f\
-\x6c\xaf\x0b\xdc\x2c\xad\x18\xd3\x6c\x75\x0b\xa6\x55\xff\x00\x96\
-\x9f\xe8\xed\x1e\xdf\xfc\x89\x5f\xbb\x35\xf8\x15\xff\x00\x04\xd2\
-\xf1\x92\xf8\x37\xf6\xc8\xf0\x1b\x4b\xff\x00\x1e\xfa\xa3\x5c\x69\
-\x72\x7f\xdb\x68\x59\x63\xff\x00\xc8\x9e\x5d\x7e\xfa\x2f\xdd\x14\
-\x00\xb4\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x7e\x2e\xff\x00\xc1\x61\xbe\x1b\xda\xf8\x57\xf6\x89\xd1\xfc\
-\x4d\x69\x1a\xc4\xbe\x26\xd1\xd6\x6b\xad\xab\xf7\xae\x2d\xdb\xc9\
-\x66\xff\x00\xbf\x7e\x4f\xfd\xf3\x5f\x05\xd7\xec\x47\xfc\x16\x0b\
-\xe0\x87\xfc\x25\xff\x00\x08\x74\x5f\x88\xd6\xf7\x91\x41\x37\x84\
-\x25\x78\x2e\x2d\xa4\xe3\xed\x10\xdd\x4b\x0c\x6b\xb5\xbf\xbc\xb2\
-\x2a\xfc\xbf\xdd\x66\xfe\xed\x7e\x3b\xd0\x07\xeb\x3f\xfc\x11\x87\
-\xe2\xbf\xf6\x8f\x83\xfc\x6d\xf0\xea\xe2\x7d\xd2\xe9\xb7\x51\xeb\
-\x56\x28\xdf\xf3\xc6\x65\xf2\xe6\x55\xff\x00\x65\x64\x8e\x36\xff\
-\x00\xb6\xb5\xfa\x5f\x5f\xcf\xdf\xfc\x13\xcf\xe2\xe7\xfc\x29\xef\
-\xda\xb3\xc1\x97\xd3\x4d\xe4\x69\x7a\xc4\xcd\xa1\xdf\x6e\x3f\x2f\
-\x97\x71\xf2\xab\x37\xfb\x2b\x27\x92\xdf\xf0\x1a\xfe\x81\x28\x00\
-\xa2\x8a\x28\x00\xaf\x95\x3f\xe0\xa2\xbf\xb3\x91\xfd\xa1\xbf\x67\
-\xfd\x41\x34\xbb\x51\x73\xe2\xcf\x0d\x96\xd5\xb4\xa5\x45\xf9\xe6\
-\xda\xbf\xbe\xb7\x5f\xfa\xe9\x1f\xfe\x3c\xb1\xd7\xd5\x74\x50\x07\
-\xf2\xd4\xdf\x25\x74\xdf\x0c\xfe\x20\x6b\x1f\x0a\xbc\x75\xa1\xf8\
-\xc3\x40\x9f\xec\xda\xc6\x8f\x77\x1d\xe5\xbc\x9f\xc3\xb9\x7f\x85\
-\xbf\xbc\xac\xbb\x95\x97\xfb\xac\xd5\xf5\x97\xfc\x14\xeb\xf6\x4d\
-\x93\xe0\x77\xc5\x36\xf1\xb7\x87\xed\x1a\x3f\x03\xf8\xaa\xe1\xa6\
-\x55\x45\xf9\x6c\x6f\x9b\xe6\x92\x1f\xf6\x55\xbe\x69\x17\xfe\x04\
-\xbf\xc3\x5f\x13\x50\x07\xf4\x8d\xfb\x3d\xfc\x6d\xd0\xbf\x68\x6f\
-\x85\x5a\x2f\x8d\xbc\x3f\x20\x16\xd7\xc9\xb6\xe2\xd5\x9f\x74\x96\
-\x97\x0b\xfe\xb2\x16\xff\x00\x69\x5b\xfe\xfa\x5d\xad\xfc\x55\xea\
-\x15\xfc\xfb\x7e\xc6\x5f\xb6\x2e\xbf\xfb\x26\xf8\xf1\xae\xa2\x59\
-\x35\x5f\x07\x6a\x4c\xab\xac\x68\x82\x4d\xbe\x62\xa8\xf9\x66\x87\
-\xf8\x56\x65\xff\x00\xc7\x97\xe5\x6f\xef\x2f\xee\x67\xc2\x4f\x8c\
-\x3e\x15\xf8\xe1\xe0\xdb\x5f\x13\x78\x3b\x59\x87\x58\xd2\x6e\x17\
-\xef\xc4\xdb\x64\x89\xff\x00\x8a\x39\x23\x3f\x34\x6e\xbf\xdd\x6a\
-\x00\xef\x68\xa2\x8a\x00\x28\xa2\xb2\xf5\x8d\x62\xc7\x40\xd3\x6e\
-\x75\x1d\x4a\xf2\xdf\x4e\xd3\xed\x63\x69\x27\xbb\xba\x95\x63\x8e\
-\x15\x5f\xe2\x66\x6e\x14\x50\x06\xa5\x7c\x57\xff\x00\x05\x12\xfd\
-\xb4\x2c\x3f\x67\xcf\x87\xd7\xbe\x0f\xf0\xee\xa0\xaf\xf1\x1b\x5c\
-\xb7\x68\xa0\x8e\x06\xcb\x69\x76\xed\xf2\xb5\xc4\x9f\xdd\x6d\xa7\
-\xf7\x63\xfb\xdf\x37\xdd\x5a\xf2\x1f\xda\xdb\xfe\x0a\xc9\xa6\xe8\
-\xab\x7b\xe1\x7f\x82\xef\x16\xa7\xa8\xe1\xa3\x9b\xc5\x77\x31\xee\
-\xb7\x80\xe3\xfe\x5d\xa3\x6f\xf5\x8d\xff\x00\x4d\x1b\xe5\xfe\xea\
-\xc9\x5f\x95\xde\x24\xf1\x1e\xa9\xe2\xfd\x72\xfb\x5a\xd6\xf5\x0b\
-\x9d\x57\x56\xbe\x91\xa6\xba\xbe\xbb\x91\xa4\x92\x69\x1b\xf8\x99\
-\x9b\xef\x50\x06\x6b\x36\xe6\xdc\xdf\x7a\xae\x68\xba\x4d\xd6\xbf\
-\xac\x58\xe9\xb6\x10\xb5\xcd\xf5\xe4\xd1\xdb\xdb\xc0\xbf\x7a\x49\
-\x24\x6d\xaa\xbf\xf7\xd3\x55\x2a\xfb\x73\xfe\x09\x4f\xfb\x3d\xcb\
-\xf1\x57\xe3\xec\x7e\x32\xd4\x6d\x73\xe1\xdf\x05\x85\xbc\xde\xcb\
-\xf2\xcb\x7c\xdf\xf1\xef\x1f\xfc\x07\xe6\x93\xfe\xd9\xaf\xf7\xa8\
-\x03\xf5\xff\x00\xe0\x9f\xc3\x7b\x6f\x84\x3f\x09\x3c\x23\xe0\xab\
-\x50\xbe\x5e\x89\xa6\xc3\x66\xce\xbf\xf2\xd2\x45\x5f\xde\x49\xff\
-\x00\x02\x93\x73\x7f\xc0\xab\xbb\xa2\x8a\x00\x28\xa2\x8a\x00\xcd\
-\xd7\x2c\xc6\xa9\xa3\xdf\xda\x15\xdc\x26\xb7\x92\x3d\xbf\xef\x2b\
-\x2d\x7f\x30\x17\x50\xb5\xad\xc4\x90\x9f\xbd\x1b\x32\xff\x00\xdf\
-\x35\xfd\x48\x35\x7f\x30\xfe\x3a\xb2\xfe\xce\xf1\xa6\xbd\x67\xff\
-\x00\x3e\xfa\x85\xc4\x3f\xf7\xcc\x8c\xb4\x01\xd3\x7e\xce\xbe\x21\
-\x6f\x0a\xfc\x7c\xf8\x73\xac\x6e\xda\xb6\x3e\x22\xd3\xe6\x66\xff\
-\x00\x65\x6e\x23\xdd\xff\x00\x8e\xd7\xf4\xa4\xb5\xfc\xbe\xf8\x6e\
-\x6f\xb2\xf8\x8b\x4b\x9b\xfe\x79\xdd\x42\xdf\xf9\x11\x6b\xfa\x81\
-\x56\xdc\xb9\xa0\x07\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\
-\x00\x51\x45\x14\x01\xc1\xfc\x68\xf8\x4f\xa2\xfc\x70\xf8\x63\xaf\
-\xf8\x1f\xc4\x22\x51\xa5\x6b\x11\x08\xa4\x92\xdd\xb1\x24\x6c\xac\
-\xaf\x1c\x8b\xee\xac\xaa\xdf\xf0\x1a\xfe\x6d\xbc\x45\xa3\x4d\xe1\
-\xdd\x7b\x52\xd2\x6e\x95\x96\xe2\xc6\xea\x4b\x59\x15\x97\x6b\x2b\
-\x46\xcc\xad\xf2\xff\x00\x0f\xdd\xaf\xea\x16\xbf\x08\x7f\xe0\xa8\
-\x3f\x07\x64\xf8\x59\xfb\x54\x6b\x9a\x85\xbd\xb7\x95\xa4\xf8\xb2\
-\x35\xd7\x2d\xd9\x57\xe5\xf3\x24\xf9\x6e\x17\xfd\xef\x39\x59\xbf\
-\xed\xa2\xd0\x07\xc9\x96\xf3\xc9\x6b\x71\x1c\xd0\x48\xd1\x4d\x1b\
-\x2b\x47\x2a\xb6\xd6\x56\xfe\x16\xaf\xe8\xf3\xf6\x61\xf8\xb5\x1f\
-\xc7\x1f\x80\x9e\x09\xf1\xa8\x90\x3d\xc6\xa5\xa7\xc7\xf6\xcd\xbf\
-\xc3\x74\x9f\xbb\x99\x7f\xef\xe2\xb5\x7f\x37\xd5\xfa\xc1\xff\x00\
-\x04\x65\xf8\xcd\xf6\xef\x0d\x78\xcb\xe1\x8d\xed\xc6\xe9\xb4\xf9\
-\x97\x5c\xd3\xd5\xbf\xe7\x8c\x9b\x63\xb8\x55\xff\x00\x65\x64\x58\
-\xdb\xfe\xda\x35\x00\x7e\x9b\x51\x45\x14\x00\x51\x45\x14\x01\xc2\
-\xfc\x5e\xf8\x57\xe1\xdf\x8d\xff\x00\x0f\x35\x7f\x07\x78\x9a\xd0\
-\x5d\xe9\x3a\x94\x45\x1b\x81\xe6\x42\xff\x00\xf2\xce\x68\xdb\xf8\
-\x5d\x5b\x0c\xad\xed\x5f\xcf\xdf\xed\x29\xfb\x39\xf8\xa3\xf6\x66\
-\xf8\x95\x7d\xe1\x5f\x11\xc2\xcd\x1a\xee\x9b\x4f\xd4\x23\x5d\xb0\
-\xdf\x5b\xee\xf9\x66\x8f\xff\x00\x66\x5f\xe1\x6f\x96\xbf\xa3\xea\
-\xf1\xdf\xda\x3b\xf6\x71\xf0\x7f\xed\x41\xf0\xf6\x5f\x0c\xf8\xaa\
-\x0f\x29\xa3\xdd\x2d\x86\xa9\x1a\xaf\xda\x6c\x27\xdb\xfe\xb2\x36\
-\xff\x00\xd0\x97\xee\xb2\xff\x00\xc0\x59\x40\x3f\x9c\xba\xee\xfe\
-\x13\x7c\x6e\xf1\xb7\xc0\xbf\x12\x2e\xb9\xe0\x8f\x10\x5e\x68\x57\
-\xe0\xaa\xc9\xe4\xb6\xf8\xae\x17\xfb\xb3\x46\xdf\x2c\x8b\xfe\xcb\
-\x2d\x76\x5f\xb4\xc7\xec\x9b\xe3\xcf\xd9\x6f\xc5\x4f\xa7\xf8\xa2\
-\xc3\xcf\xd1\xee\x24\x65\xd3\xf5\xfb\x45\x66\xb5\xbc\x5f\xf6\x5b\
-\xf8\x64\xfe\xf4\x6d\xf3\x7f\xbc\xbf\x35\x78\x95\x00\x7e\xa1\x7c\
-\x1f\xff\x00\x82\xcf\x4b\x6f\x6e\x96\xbf\x12\xfc\x0f\xf6\x99\x06\
-\xd5\x6d\x4f\xc3\x33\x6d\x2d\xff\x00\x6e\xf3\x37\xfe\x83\x27\xfc\
-\x06\xbe\x84\xb0\xff\x00\x82\xb4\x7c\x00\xbc\xb3\xf3\xa5\xd5\x35\
-\xdb\x29\xbf\xe7\x8c\xfa\x3c\x85\xbf\xf1\xc6\x65\xff\x00\xc7\xab\
-\xf0\xe6\x8a\x00\xfd\x79\xf8\xa5\xff\x00\x05\x98\xf0\x56\x93\xa7\
-\x4d\x07\x80\xbc\x27\xab\x78\x83\x53\x2b\xb5\x2e\x75\x8d\xb6\x36\
-\x8a\xde\xbb\x55\x9a\x46\xff\x00\x77\xe5\xff\x00\x7a\xbf\x3a\x7e\
-\x3d\xfe\xd6\xdf\x13\x7f\x69\x1b\xe6\x97\xc6\x5e\x22\x96\x5d\x2d\
-\x64\xf3\x21\xd1\x2c\xbf\x71\x61\x0f\xfb\xb0\xaf\xde\x6f\xf6\xa4\
-\xdc\xdf\xed\x57\x8e\x51\x40\x05\x14\x57\xd2\x1f\xb3\x0f\xec\x25\
-\xf1\x27\xf6\x9c\xba\xb7\xbd\xd3\xec\x5b\xc3\xde\x0f\xdd\xfb\xef\
-\x12\x6a\x91\xb2\xc3\xb7\xf8\xbc\x95\xfb\xd3\x37\xfb\xbf\x2f\xf7\
-\x99\x68\x03\xc9\x7e\x10\x7c\x1f\xf1\x47\xc7\x4f\x1f\x69\x9e\x12\
-\xf0\x9e\x9e\xda\x86\xab\x7a\x7f\xdd\x8e\x08\xff\x00\x8a\x69\x5b\
-\xf8\x51\x7f\x89\xbf\xf6\x6a\xfe\x81\xbf\x66\x9f\x80\x3a\x0f\xec\
-\xd5\xf0\x9f\x49\xf0\x6e\x86\x04\xed\x08\xf3\xaf\xb5\x07\x4d\xb2\
-\x5e\xdd\x37\xfa\xc9\x9b\xf4\x55\x5f\xe1\x55\x55\xac\xdf\xd9\xab\
-\xf6\x5b\xf0\x37\xec\xc1\xe1\x1f\xec\x6f\x09\xd8\x34\xb7\xd7\x01\
-\x4e\xa1\xac\xde\x6d\x6b\xab\xe9\x17\xfb\xcd\xfc\x2a\xbf\xc3\x1a\
-\xfc\xab\xfe\xf6\xe6\x3e\xd9\x40\x05\x14\x51\x40\x05\x14\x51\x40\
-\x08\xd5\xfc\xd2\xfc\x78\xb5\xfe\xcf\xf8\xe1\xf1\x0a\xd7\x6e\xdf\
-\x27\xc4\x5a\x84\x7f\xf7\xcd\xd4\x95\xfd\x2d\xd7\xf3\x89\xfb\x5c\
-\x58\x7f\x67\x7e\xd4\x5f\x16\xad\xff\x00\x85\x7c\x55\xa9\x6d\xff\
-\x00\x81\x5c\x48\xd4\x01\xe5\x36\xad\xe5\x5c\x46\xdf\xdd\x65\x6a\
-\xfe\xa1\x74\xe9\x3c\xeb\x1b\x69\x7f\xe7\xa4\x6a\xdf\xf8\xed\x7f\
-\x2e\xcb\x5f\xd3\x7f\xc3\xad\x59\x3c\x41\xf0\xff\x00\xc3\x3a\xa2\
-\x7f\xab\xbd\xd3\x2d\x6e\x57\xe8\xf0\xab\x7f\xec\xd4\x01\xd3\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x57\
-\xc1\x5f\xf0\x57\xaf\x83\xe9\xe3\x6f\xd9\xf6\xc3\xc6\x76\xb0\x6f\
-\xd4\xbc\x21\x7c\xb2\x49\x22\xaf\xcd\xf6\x3b\x82\xb1\xc9\xff\x00\
-\x91\x3c\x96\xff\x00\x80\xb5\x7d\xeb\x5c\x9f\xc4\xcf\x03\x69\xff\
-\x00\x13\xbc\x03\xe2\x2f\x09\x6a\xa3\x76\x9d\xad\xd8\xcd\xa7\xcd\
-\x8f\xe1\x59\x15\x97\x72\xff\x00\xb4\xbf\x7b\xf0\xa0\x0f\xe6\x56\
-\xbd\xc7\xf6\x29\xf8\xcd\xff\x00\x0a\x2b\xf6\x96\xf0\x5f\x89\xa7\
-\x9b\xc8\xd2\xda\xf1\x74\xfd\x4b\xfb\xbf\x65\xb8\xfd\xdc\x8c\xdf\
-\xee\xee\x59\x3f\xed\x9d\x79\x77\x8f\xbc\x15\xa8\xfc\x37\xf1\xc6\
-\xbd\xe1\x5d\x66\x3f\x23\x54\xd1\xef\xa6\xb1\xb8\x5f\xfa\x69\x1b\
-\x6d\xdd\xfe\xef\xf1\x57\x3f\x40\x1f\xd4\xa2\xb6\xea\x75\x7c\xdd\
-\xfb\x01\x7c\x6b\xff\x00\x85\xe7\xfb\x30\x78\x4f\x54\xba\x9c\x4d\
-\xad\x69\x71\xff\x00\x62\xea\x7b\x8f\xcd\xe7\xc0\xaa\xa1\x9b\xfd\
-\xa6\x8f\xcb\x93\xfe\x05\x5f\x48\xd0\x01\x45\x14\x50\x01\x45\x14\
-\x50\x06\x17\x8b\xbc\x1f\xa2\x78\xf3\x41\xbb\xd1\x3c\x45\xa4\xda\
-\x6b\x7a\x45\xda\xec\x9e\xc6\xfa\x15\x96\x29\x17\xdd\x5a\xbf\x38\
-\x3f\x68\x3f\xf8\x23\xad\x8e\xad\x77\x75\xab\x7c\x21\xd7\x57\x48\
-\x2d\xb9\x87\x87\xf5\xc7\x69\x2d\xd7\xfd\x98\x67\x5d\xcc\xbf\xee\
-\xc8\xad\xfe\xf5\x7e\x9e\x51\x40\x1f\xce\xa7\xc4\xcf\xd8\xc7\xe3\
-\x47\xc2\x59\xa6\x5f\x10\xfc\x3b\xd6\xbe\xcb\x1b\x7f\xc7\xee\x9f\
-\x6f\xf6\xeb\x6d\xbf\xde\xf3\x21\xdc\xab\xff\x00\x02\xaf\x19\xba\
-\xb5\x9a\xca\x66\x86\xe2\x19\x20\x99\x7e\xf2\xc8\xbb\x59\x6b\xfa\
-\x90\xdb\x59\xd7\xfa\x1e\x9d\xa9\x7c\xd7\x7a\x7d\xad\xd3\x7f\xd3\
-\x78\x56\x4f\xe7\x40\x1f\xcc\x66\x8f\xe1\xed\x53\xc4\x77\x4b\x6f\
-\xa5\xe9\xb7\x7a\x9d\xc3\x7c\xab\x1d\xa5\xbb\x4c\xcd\xff\x00\x01\
-\x5a\xfa\x37\xe1\x1f\xfc\x13\x8b\xe3\xa7\xc5\x8b\x8b\x66\x1e\x11\
-\x9b\xc2\xda\x5c\x87\x0d\xa8\x78\x98\xfd\x8d\x55\x7f\xeb\x9b\x7e\
-\xf9\xbf\xe0\x31\xd7\xef\x5d\x8e\x9f\x6b\x63\x1e\xdb\x5b\x68\xad\
-\x53\xfb\xb0\xc6\xab\xff\x00\xa0\xd5\xda\x00\xf8\x73\xf6\x73\xff\
-\x00\x82\x56\x7c\x33\xf8\x4a\xf6\xda\xa7\x8c\x73\xf1\x0f\xc4\x71\
-\x85\x90\x7f\x68\x43\xe5\xe9\xd0\xbf\xfb\x36\xff\x00\xf2\xd3\xfe\
-\xda\x33\x7f\xba\xb5\xf6\xc5\xad\xac\x36\x36\xf1\xc3\x0c\x69\x0c\
-\x31\xa8\x44\x8e\x35\xda\xaa\xbe\x80\x55\xba\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x01\xad\xf7\x4d\x7f\x3b\xdf\xb7\
-\x25\xbf\xd9\xff\x00\x6b\x8f\x8b\x0b\xfd\xef\x10\x5c\x37\xfd\xf5\
-\xf3\x7f\xec\xd5\xfd\x10\x49\xfe\xad\xbe\x95\xfc\xf5\xfe\xde\xdf\
-\xf2\x78\x5f\x15\x3f\xec\x35\x27\xfe\x8b\x8e\x80\x3c\x05\x6b\xfa\
-\x51\xfd\x9f\x6c\xff\x00\xb3\xfe\x01\xfc\x36\xb5\x66\xf3\x1a\x1f\
-\x0c\xe9\xb1\xee\xfe\xf6\xdb\x58\xeb\xf9\xae\x5a\xfe\x92\x7f\x66\
-\x87\x96\x4f\xd9\xd7\xe1\x6b\x4c\xdb\xa5\x6f\x0b\x69\x65\x9b\xdf\
-\xec\xb1\xd0\x07\xa6\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\
-\x00\x51\x45\x14\x00\x51\x45\x14\x01\xf8\xd7\xff\x00\x05\x82\xf8\
-\x2b\xff\x00\x08\x7f\xc6\x9d\x1f\xe2\x15\x95\xbe\xdd\x3f\xc5\x96\
-\xbe\x5d\xd3\x2a\xfd\xdb\xcb\x75\x55\x6d\xdf\xef\x43\xe5\xff\x00\
-\xdf\x2d\x5f\x9f\xb5\xfd\x00\xff\x00\xc1\x40\xfe\x09\xaf\xc7\x3f\
-\xd9\x8f\xc5\x1a\x64\x10\xac\x9a\xde\x8f\x1f\xf6\xd6\x97\xf2\xfc\
-\xde\x74\x0a\xcc\xca\xbf\xef\x47\xe6\x2f\xfc\x08\x57\xf3\xfe\xd4\
-\x01\xfa\x0d\xff\x00\x04\x7b\xf8\xe1\xff\x00\x08\x87\xc6\x2d\x67\
-\xe1\xd5\xf4\xdb\x74\xff\x00\x15\x5b\xfd\xa2\xcd\x58\xfc\xab\x7b\
-\x02\xb3\x6d\x5f\xf7\xa1\xf3\x3f\xef\xda\xd7\xec\x7d\x7f\x31\x1e\
-\x03\xf1\x96\xa5\xf0\xef\xc6\x9a\x1f\x89\xf4\x79\x7c\x9d\x4f\x48\
-\xbc\x86\xfa\xd5\xbf\xe9\xa4\x6d\xb9\x7f\xe0\x3f\x2d\x7f\x48\xbf\
-\x0b\x7e\x20\xe9\xbf\x16\x3e\x1d\xf8\x7b\xc6\x3a\x3b\x96\xd3\x75\
-\x9b\x18\x6f\x61\x19\xfb\x9b\x97\xe6\x46\xff\x00\x69\x5b\x72\xb7\
-\xfb\xb4\x01\xd9\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\
-\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\
-\x51\x45\x14\x00\x51\x45\x14\x00\xd6\xfb\xa6\xbf\x9e\x4f\xdb\xba\
-\xe3\xcf\xfd\xaf\xbe\x2b\x32\xff\x00\xd0\x72\x65\xff\x00\xbe\x55\
-\x56\xbf\xa1\xda\xfe\x73\x3f\x6c\x6b\xf5\xd5\x3f\x6a\xaf\x8b\x53\
-\x2b\x6e\x5f\xf8\x4a\x35\x08\xd7\xfe\x03\x33\x2f\xfe\xcb\x40\x1e\
-\x3a\xb5\xfd\x2a\x7e\xcf\xb0\x8b\x5f\x80\xff\x00\x0d\xe1\xff\x00\
-\x9e\x7e\x1b\xd3\x57\xff\x00\x25\x63\xaf\xe6\xad\x6b\xfa\x5f\xf8\
-\x2e\xe9\x27\xc1\xef\x02\xb2\x7f\xab\x3a\x0d\x8e\xdf\xf7\x7e\xcf\
-\x1d\x00\x76\xd4\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x43\x24\x2b\x34\x6d\x1c\x80\x3a\x32\
-\xed\x2a\xdf\x74\xd7\xe0\xe7\xfc\x14\x6b\xf6\x67\xd2\xbf\x66\xff\
-\x00\x8e\x11\xc5\xe1\xb8\x7e\xcb\xe1\x4d\x7a\xd4\x6a\x36\x36\xd9\
-\x27\xec\xad\xbd\x96\x68\x55\x9b\xef\x2a\xb6\xd6\x5f\xf6\x64\x55\
-\xfe\x1a\xfd\xe9\xaf\x83\xff\x00\xe0\xad\x5f\x01\x64\xf8\x95\xf0\
-\x26\xdf\xc6\xfa\x6c\x26\x5d\x63\xc1\x73\x35\xc4\xca\x9f\x79\xac\
-\x65\xda\xb3\x7f\xdf\x2c\xb1\xc9\xfe\xea\xb5\x00\x7e\x2c\xd7\xeb\
-\x5f\xfc\x11\xc7\xe3\xc1\xd7\x3c\x1b\xe2\x2f\x85\x3a\x95\xce\xeb\
-\xad\x15\xce\xab\xa4\xab\x1e\xb6\xb2\x36\xd9\x91\x7f\xdd\x91\x95\
-\xbf\xed\xb5\x7e\x4a\x57\xab\x7e\xcc\x3f\x1b\xae\xbf\x67\xdf\x8e\
-\x5e\x15\xf1\xc5\xb6\xf3\x6b\x63\x73\xb6\xfa\x04\xff\x00\x96\xd6\
-\x72\x7c\xb3\x47\xff\x00\x7c\xb3\x6d\xff\x00\x69\x56\x80\x3f\xa4\
-\x0a\x2b\x2f\x48\xd5\xac\xf5\xfd\x26\xcb\x54\xb0\xba\x4b\xcb\x0b\
-\xc8\x63\xb8\xb6\xb8\x8c\xee\x59\x63\x65\xdc\xac\xbf\xef\x29\xad\
-\x4a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\
-\x8a\x00\x46\xaf\xe6\x77\xe3\x46\xac\xbe\x20\xf8\xc1\xe3\x8d\x51\
-\x5b\x72\xdf\x6b\x97\xd7\x4a\xdf\xef\x5c\x48\xd5\xfd\x22\xf8\xdb\
-\xc4\x09\xe1\x5f\x06\xeb\xda\xd3\xb6\xd8\xf4\xdd\x3e\xe2\xf1\x8f\
-\xb4\x71\xb3\x7f\xec\xb5\xfc\xc6\x5d\x4f\x25\xd5\xc4\x93\x4a\xdb\
-\xa4\x91\xb7\x33\x7f\xb4\xd4\x01\x1a\xfd\xea\xfe\x9a\x3e\x16\x68\
-\xd2\x78\x7f\xe1\x97\x84\x74\xa9\x97\xcb\x96\xc7\x48\xb4\xb5\x75\
-\xf4\x64\x85\x17\xff\x00\x65\xaf\xe7\x07\xe1\x3e\x90\xbe\x20\xf8\
-\xa5\xe0\xfd\x2d\xd7\x72\xdf\x6b\x16\x76\xac\xbf\xde\xf3\x2e\x23\
-\x5f\xfd\x9a\xbf\xa6\xa5\xfb\xa2\x80\x16\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\xb3\x75\
-\x5d\x2e\xcf\x5f\xd3\x6f\x34\xdb\xfb\x64\xbb\xb1\xbc\x86\x4b\x7b\
-\x8b\x79\x46\x52\x58\xd9\x76\xb2\xb7\xb3\x29\xad\x2a\x28\x03\xf9\
-\xca\xfd\xac\xbe\x03\xdc\x7e\xce\x1f\x1d\x3c\x47\xe0\xc9\x7c\xc6\
-\xd3\x61\x93\xed\x5a\x5d\xcc\x9f\xf2\xda\xc6\x4f\x9a\x16\xff\x00\
-\x79\x7f\xd5\xb7\xfb\x51\xb5\x78\xf5\x7e\xdc\xff\x00\xc1\x51\x3f\
-\x65\xf5\xf8\xd1\xf0\x66\x6f\x1a\x68\xd6\xc6\x4f\x17\x78\x3e\x39\
-\x2e\x97\x6a\xe5\xae\xac\x7e\xf4\xd0\xff\x00\xb5\xb7\xfd\x62\xff\
-\x00\xba\xcb\xfc\x55\xf8\x8d\x40\x1f\xb2\x1f\xf0\x49\x1f\xda\x49\
-\x7c\x7f\xf0\xbe\xe7\xe1\x7e\xb1\x73\xbf\x5e\xf0\x9a\xf9\x96\x1e\
-\x63\x7c\xd3\xe9\xec\xdf\x77\xfe\xd8\xc8\xdb\x7f\xdd\x68\xeb\xf4\
-\x1a\xbf\x9a\xdf\x80\xbf\x19\xb5\x7f\x80\x3f\x15\xfc\x3b\xe3\x8d\
-\x15\xb7\xdd\x69\x77\x01\xe6\xb6\xdf\xb5\x2e\xad\xdb\xe5\x9a\x16\
-\xff\x00\x65\x97\x72\xff\x00\xdf\x2d\xfc\x35\xfd\x12\x7c\x33\xf1\
-\xfe\x8d\xf1\x5b\xc0\xda\x2f\x8b\xbc\x3d\x72\x2e\xb4\x6d\x62\xd9\
-\x6e\xad\xe4\xc6\x18\xab\x75\x56\x1f\xc2\xca\xc1\x95\x97\xfb\xca\
-\xd4\x01\xd7\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x01\xe0\x1f\xb7\x87\x8c\x47\x81\xbf\x64\x5f\x8a\x3a\x90\
-\x93\xca\x92\x6d\x1e\x4d\x39\x1b\xfd\xab\x96\x5b\x7f\xfd\xa9\x5f\
-\xcf\x4b\x7d\xea\xfd\x95\xff\x00\x82\xc8\xf8\xf9\x74\x1f\xd9\xff\
-\x00\xc3\xbe\x17\x8a\x4d\xb7\x1e\x20\xd6\x96\x46\x5f\xef\x43\x6f\
-\x1b\x33\x7f\xe4\x49\x21\xaf\xc6\x9a\x00\xf6\xbf\xd8\xaf\xc2\xad\
-\xe3\x2f\xda\xbb\xe1\x5e\x9a\xab\xbb\xfe\x2a\x0b\x5b\xc6\xff\x00\
-\x76\xdd\xbc\xe6\xff\x00\xc7\x63\x6a\xfe\x8a\x97\xee\x8a\xfc\x4a\
-\xff\x00\x82\x43\xf8\x1d\xbc\x49\xfb\x55\x36\xb4\xd1\xfe\xe7\xc3\
-\xba\x2d\xd5\xe7\x99\xfd\xd9\x24\xdb\x6e\xab\xff\x00\x7c\xc9\x27\
-\xfd\xf3\x5f\xb6\xd4\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x01\x04\xd1\
-\x2d\xc4\x6d\x1c\x8a\xae\x8c\x30\xca\xcb\xb9\x4d\x7e\x0b\x7f\xc1\
-\x43\x7f\x65\x9f\xf8\x66\xaf\x8d\x13\x49\xa4\x5b\x98\xbc\x15\xe2\
-\x3f\x32\xf7\x47\xd8\xbf\x2d\xbb\x6e\xfd\xf5\xaf\xfd\xb3\x66\xf9\
-\x7f\xd9\x65\xaf\xdf\x0a\xf0\x8f\xda\xf7\xf6\x6c\xd3\x7f\x69\xcf\
-\x83\x3a\xb7\x85\x66\xd9\x0e\xb5\x17\xfa\x6e\x8f\x7a\xc3\x3f\x67\
-\xbc\x55\x6d\x9b\xbf\xe9\x9b\xf3\x1b\x7f\xb2\xdf\xec\x8a\x00\xfe\
-\x78\x2b\xf4\x27\xfe\x09\x53\xfb\x5f\x27\xc3\x7f\x18\x0f\x85\x1e\
-\x2a\xd4\x04\x5e\x1b\xd7\xae\x37\x68\xf7\x13\x37\xcb\x69\x7c\xdf\
-\xf2\xcf\xfd\x98\xe6\xf9\x7f\xed\xa6\xdf\xef\x35\x7c\x2d\xe3\x4f\
-\x04\x6b\x3f\x0d\xfc\x4d\xa8\x78\x7b\xc4\x9a\x5d\xce\x91\xad\x69\
-\xf2\x79\x37\x16\x97\x91\xec\x92\x36\xff\x00\xe2\x7f\x89\x5b\xee\
-\xb2\xd6\x14\x72\xb4\x52\x2c\x88\xcc\x8c\xad\xb9\x59\x7f\x86\x80\
-\x3f\xa9\x3a\x2b\xe2\x4f\xf8\x26\xff\x00\xed\xa2\x9f\xb4\x37\x82\
-\x13\xc2\x1e\x29\xbf\x51\xf1\x13\x41\x85\x56\x56\x95\xbe\x6d\x52\
-\xd5\x7e\x55\xb8\x5f\xef\x48\xbf\x2a\xc9\xff\x00\x01\x6f\xe2\xf9\
-\x7e\xdb\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x2b\x13\xc5\
-\x1e\x24\xb1\xf0\x7f\x86\x35\x6d\x7b\x57\x99\x6d\xb4\xcd\x2e\xd6\
-\x6b\xcb\xa9\x9b\xf8\x21\x8d\x59\x99\xbf\xef\x95\xa0\x0f\xc7\x1f\
-\xf8\x2b\xff\x00\xc5\x05\xf1\x87\xed\x1d\xa7\xf8\x56\xde\x61\x25\
-\xaf\x84\xf4\xb8\xe1\x91\x15\xb7\x6d\xba\xb8\xfd\xf4\x9f\xf9\x0f\
-\xec\xff\x00\xf7\xcd\x7c\x25\x5d\x6f\xc5\x8f\x88\x37\xdf\x15\xfe\
-\x26\x78\xa3\xc6\x5a\x96\xef\xb5\xeb\x9a\x84\xd7\xcc\xbf\xf3\xcf\
-\xcc\x6d\xcb\x1f\xfb\xaa\xbb\x57\xfe\x03\x5c\x9a\xfd\xea\x00\xfd\
-\x72\xff\x00\x82\x30\xfc\x37\x1a\x67\xc3\x1f\x1c\xf8\xd6\x68\xb6\
-\x4b\xac\x6a\x51\xe9\xd6\xec\xdf\xf3\xce\xde\x3d\xcc\xcb\xff\x00\
-\x02\x9b\xff\x00\x1d\xaf\xd2\x3a\xf0\x0f\xd8\x67\xe1\xc7\xfc\x2a\
-\xdf\xd9\x4f\xe1\xbe\x91\x24\x5e\x5d\xd4\xda\x62\xea\x57\x2a\x47\
-\xcd\xe7\x5d\x37\xda\x1b\x77\xfb\xbe\x60\x5f\xf8\x0d\x7b\xfd\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x7c\x15\xff\x00\
-\x05\x52\xfd\x97\x9f\xe2\xe7\xc2\xdb\x6f\x1d\x78\x6b\x4a\x17\x9e\
-\x2e\xf0\xbe\xf7\xba\xf2\x57\xf7\xd7\x5a\x6e\xd6\x69\x17\xfd\xa6\
-\x8d\xb6\xc8\xab\xfd\xdf\x33\x6d\x7e\x2f\x57\xf5\x28\xcb\xb9\x70\
-\x6b\xf1\x6f\xfe\x0a\x55\xfb\x0f\xb7\xc1\x1f\x11\xcd\xf1\x13\xc1\
-\x76\xad\xff\x00\x08\x1e\xb1\x71\xfe\x99\x67\x02\xfc\xba\x4d\xd4\
-\x8d\xf7\x7f\xd9\x86\x46\xfb\xbf\xdd\x6f\x97\xfb\xb4\x01\xf1\x9f\
-\xc3\xbf\x1f\xeb\x9f\x0b\x7c\x6d\xa4\xf8\xab\xc3\x97\xd2\xe9\xfa\
-\xd6\x97\x3a\xdc\x5a\xdc\x47\xfc\x2d\xfd\xd6\xfe\xf2\xb2\xfc\xac\
-\xbf\xc4\xac\xcb\x5f\xbd\x9f\xb1\xef\xed\x6b\xe1\xdf\xda\xb7\xe1\
-\xfc\x5a\xa5\xa3\xc7\xa6\xf8\xaa\xc1\x56\x3d\x67\x44\xf3\x3e\x6b\
-\x79\x3f\xe7\xa4\x7f\xde\x85\xbf\x85\xbf\xe0\x2d\xf3\x2d\x7f\x3d\
-\xf5\xdb\xfc\x1d\xf8\xb9\xe2\x7f\x81\xfe\x3c\xd3\xbc\x5f\xe1\x2d\
-\x4f\xfb\x3b\x56\xb3\x6f\xf7\xa3\xb8\x8d\xbe\xf4\x32\xaf\xf1\x46\
-\xdf\xc4\xbf\xfb\x36\xda\x00\xfe\x97\xe8\xaf\x9d\xff\x00\x64\xaf\
-\xdb\x0b\xc2\xbf\xb5\x87\x82\x16\xf3\x4a\x92\x3d\x37\xc5\x76\x31\
-\xaf\xf6\xb6\x83\x24\x99\x92\xdd\xbf\xe7\xa4\x7f\xf3\xd2\x16\x6f\
-\xba\xdf\xf0\x16\xda\xd5\xf4\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x15\xf9\xff\
-\x00\xff\x00\x05\x73\xfd\xa1\x57\xc0\x3f\x07\x6d\x3e\x1b\xe9\x97\
-\x1b\x35\xbf\x17\x36\xeb\xc5\x56\xf9\xa2\xd3\xe3\x6f\x9b\xfe\xfe\
-\x48\xaa\xbf\xee\xac\x95\xf6\xc7\x8e\xfc\x69\xa4\xfc\x39\xf0\x8e\
-\xad\xe2\x4d\x7e\xf1\x6c\x34\x7d\x26\xd5\xee\xee\xae\x64\x3f\x76\
-\x35\x1c\xfd\x5b\xb0\x5f\xe2\x35\xfc\xf2\x7e\xd2\xbf\x1d\x35\x3f\
-\xda\x2b\xe3\x27\x88\x7c\x6d\xa9\x23\xc1\x1d\xe4\x9e\x5d\x8d\xa3\
-\x30\xff\x00\x45\xb5\x8f\xe5\x86\x1f\xf8\x0a\xfd\xef\xf6\x99\x9a\
-\x80\x3c\xb2\xbd\x17\xf6\x77\xf8\x5b\x37\xc6\x8f\x8d\x9e\x0b\xf0\
-\x5c\x31\xb3\x26\xb1\xa9\x43\x0d\xc6\xdf\xe1\xb7\xdd\xba\x66\xff\
-\x00\x80\xc6\xb2\x35\x79\xd5\x7e\x98\xff\x00\xc1\x1a\x7e\x08\xb6\
-\xa1\xe2\x4f\x15\xfc\x54\xbf\xb7\xcd\xbe\x9c\x9f\xd8\xba\x5b\xb2\
-\xf5\x9a\x4d\xad\x70\xcb\xfe\xec\x7e\x5a\xff\x00\xdb\x56\xa0\x0f\
-\xd5\xab\x4b\x28\x6c\x6d\x62\xb7\x86\x35\x8a\x18\x95\x63\x8e\x34\
-\xe8\xaa\xbf\x74\x55\xba\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\xb1\x3c\x55\xe1\x5d\x27\xc6\xfe\x1d\xd4\x74\
-\x0d\x76\xc2\x1d\x53\x47\xd4\x20\x6b\x6b\xab\x4b\x81\xba\x39\xa3\
-\x6f\xbc\xad\x5b\x74\x50\x07\xe2\x27\xed\xbd\xff\x00\x04\xe3\xd7\
-\xbf\x67\xc9\x2f\xbc\x61\xe0\xd5\xb8\xf1\x0f\xc3\xb2\xfe\x64\x9b\
-\xbe\x6b\xad\x27\xfd\x99\xbf\xbd\x1f\xfd\x36\xff\x00\xbe\xb6\xfd\
-\xe6\xf8\x92\xbf\xa8\xab\xab\x38\x75\x0b\x69\xad\xee\x21\x49\xad\
-\xe5\x52\x8f\x1c\x8b\xb9\x59\x5b\xef\x29\x15\xf9\x37\xfb\x76\x7f\
-\xc1\x31\xee\xbc\x2f\x36\xa5\xe3\xff\x00\x84\x1a\x7b\xdd\x68\x99\
-\x69\xf5\x0f\x0b\xdb\x26\xe9\xac\xff\x00\xbd\x25\xaa\xff\x00\x14\
-\x7f\xf4\xcf\xef\x2f\xf0\xee\x5f\xba\x01\xf9\xfd\xf0\xff\x00\xe2\
-\x1f\x88\xbe\x16\xf8\xb2\xc7\xc4\xbe\x15\xd5\xee\x34\x3d\x6a\xc6\
-\x41\x24\x17\x76\xed\xb5\x97\xfd\x96\xfe\x16\x56\xfe\x25\x6f\x95\
-\xab\xf6\x37\xf6\x34\xff\x00\x82\x96\x78\x5f\xe3\xc4\x76\x1e\x17\
-\xf1\xb4\x96\xde\x13\xf8\x80\xc1\x63\x8d\x98\xec\xb0\xd4\xdb\xfe\
-\x98\xb3\x7f\xab\x91\xbf\xe7\x9b\x7f\xc0\x59\xbe\xea\xfe\x27\x32\
-\x6c\x6d\xad\x42\xfc\x94\x01\xfd\x4a\xd1\x5f\x88\xff\x00\xb2\x9f\
-\xfc\x15\x0b\xc6\xff\x00\x05\x45\x9e\x85\xe3\x71\x3f\x8e\xfc\x22\
-\x85\x51\x1a\x79\xbf\xe2\x63\x69\x1f\xfd\x33\x99\xbf\xd6\x2a\xff\
-\x00\xcf\x39\x3f\xe0\x2c\xb5\xfa\xb9\xf0\x2f\xf6\xa2\xf8\x71\xfb\
-\x45\x69\x2b\x77\xe0\x9f\x10\xc3\x7f\x70\xa9\xba\x7d\x32\x7f\xdc\
-\xde\x5b\xf4\xff\x00\x59\x0b\x7c\xdf\xf0\x25\xdc\xbf\xed\x50\x07\
-\xae\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x52\x35\x53\
-\xbd\xbe\x82\xc2\xda\x6b\x8b\x99\x52\x08\x22\x46\x91\xe4\x95\xb6\
-\xaa\x2a\xfd\xe6\x2d\xd8\x57\xe5\x47\xed\xfd\xff\x00\x05\x2a\x8f\
-\xc5\x16\x7a\x8f\xc3\x6f\x84\x9a\x89\x3a\x4c\xa1\xa0\xd5\xbc\x51\
-\x6c\xdb\x7e\xd4\xbf\x75\xa1\xb5\x6f\xf9\xe7\xfd\xe9\x3f\x8b\xee\
-\xaf\xcb\xf3\x30\x07\x17\xff\x00\x05\x38\xfd\xb6\xa3\xf8\xbd\xae\
-\x49\xf0\xbf\xc1\x97\x8a\x7c\x19\xa3\xdc\x6e\xd4\xaf\xa0\x7c\xae\
-\xa7\x78\xbf\xc2\xad\xfc\x50\xc6\xdf\xf7\xd3\x7c\xdf\xc2\xb5\xf0\
-\x0d\x14\x50\x07\x4d\xf0\xe7\xe1\xfe\xb9\xf1\x57\xc7\x1a\x3f\x84\
-\x7c\x39\x6a\xd7\x9a\xe6\xad\x70\xb6\xb6\xb0\x2f\xf7\x9b\xf8\x9b\
-\xfb\xaa\xab\xb9\x99\xbf\x85\x55\xab\xfa\x1b\xfd\x9c\xfe\x09\xe9\
-\x5f\xb3\xbf\xc2\x3f\x0e\xf8\x17\x4b\x2b\x20\xd3\xa0\xdd\x75\x76\
-\x17\x6f\xda\xae\x9b\xe6\x9a\x63\xfe\xf3\x67\xfd\xd5\xda\xb5\xf2\
-\x67\xfc\x12\xcb\xf6\x44\xff\x00\x85\x5b\xe0\xa1\xf1\x53\xc4\xf6\
-\x42\x2f\x15\xf8\x82\xdf\x66\x9d\x6b\x3c\x7f\x35\x8d\x83\x7c\xdb\
-\xbf\xd9\x79\xbe\x56\xff\x00\x66\x3d\xbf\xde\x6a\xfd\x08\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x0f\x85\x7f\x6c\xaf\xf8\x26\x9f\x86\
-\x7e\x3c\xc9\x7f\xe2\xcf\x02\xfd\x97\xc2\x7e\x3a\x93\x74\xb2\xc5\
-\xb3\x6d\x86\xa8\xdf\xf4\xd1\x57\xfd\x5c\x8d\xff\x00\x3d\x17\xef\
-\x7f\x12\xb7\xde\xaf\xc7\xef\x88\xdf\x0b\xbc\x53\xf0\x83\xc5\xd7\
-\xbe\x1a\xf1\x7e\x8b\x75\xa1\xeb\x56\xa7\xf7\x96\x97\x2b\xf7\x97\
-\xf8\x59\x5b\xee\xc8\xad\xfc\x2c\xbb\x95\xab\xfa\x6b\xaf\x27\xf8\
-\xf3\xfb\x36\xf8\x13\xf6\x8e\xf0\x9c\x9a\x17\x8d\x74\x84\xbd\x55\
-\xdc\xd6\xb7\xd0\xe2\x3b\xbb\x17\x3c\x6e\x86\x4e\xab\xfe\xef\xdd\
-\x6f\xe2\x56\xa0\x0f\xe7\x06\xae\xe8\xba\xde\xa5\xe1\xcd\x52\xdf\
-\x52\xd2\xaf\xae\x74\xcd\x42\xdd\xbc\xc8\x6e\xed\x26\x68\x66\x8d\
-\xbf\xbc\xac\xbf\x32\xd7\xd5\x7f\xb4\xc7\xfc\x13\x7f\xe2\xa7\xc1\
-\x1d\x7a\x46\xd0\x34\x6b\xcf\x1e\xf8\x5a\x4d\xd2\x5b\xea\x9a\x2d\
-\x93\x4d\x32\x2a\xff\x00\x0d\xc4\x2b\xb9\xa3\x6f\xf6\xbe\x65\x6f\
-\xef\x7f\x0a\xfc\x95\x34\x52\x5b\xcc\xd1\xcb\x1b\x45\x24\x6d\xb5\
-\x95\x97\x6b\x2b\x50\x07\xdb\xbf\x04\x7f\xe0\xad\x1f\x16\x3e\x1c\
-\x47\x15\x8f\x8b\xa2\xb5\xf8\x87\xa4\xa8\xdb\xbb\x50\x7f\xb3\xdf\
-\xaa\xff\x00\xd7\xc4\x6b\xf3\x7f\xdb\x45\x66\xff\x00\x6a\xbe\xd8\
-\xf8\x6b\xff\x00\x05\x6e\xf8\x21\xe3\x28\xe2\x4d\x7e\x4d\x63\xc1\
-\x57\x8d\xf7\xc6\xa5\x66\xd3\xc1\xbb\xfd\x99\x21\xdd\xff\x00\x8f\
-\x2a\xd7\xe2\x3d\x14\x01\xfd\x1c\x78\x67\xf6\xb6\xf8\x33\xe3\x08\
-\xc3\x69\x3f\x14\xbc\x27\x3b\x30\xc8\x8a\x5d\x5a\x18\x64\xff\x00\
-\xbf\x72\x32\xb5\x76\xb6\xff\x00\x13\xbc\x21\x74\x9b\xa1\xf1\x56\
-\x89\x2a\xff\x00\x7a\x3d\x4a\x16\xff\x00\xd9\xab\xf9\x93\xdd\xf4\
-\xa3\x77\xd2\x80\x3f\xa5\x4d\x7b\xe3\xf7\xc3\x4f\x0a\xda\xb5\xc6\
-\xb3\xf1\x03\xc2\xfa\x6c\x4b\xf7\x9a\xe7\x58\xb7\x5f\xfd\x9a\xbe\
-\x6c\xf8\xbd\xff\x00\x05\x59\xf8\x2b\xf0\xe6\x39\x62\xf0\xf5\xed\
-\xef\x8f\xf5\x45\xce\xdb\x7d\x1a\x13\x1d\xb6\xef\xf6\xae\x24\xda\
-\xbb\x7f\xda\x55\x7a\xfc\x3e\xdd\xf4\xa4\xa0\x0f\xa5\xbf\x69\x8f\
-\xdb\xeb\xe2\x6f\xed\x30\xd3\x69\xd7\xf7\xa9\xe1\xbf\x08\x33\x71\
-\xe1\xfd\x2d\x98\x47\x27\xf7\x7e\xd1\x27\xde\x9b\xfe\x05\xf2\xff\
-\x00\xb3\x5f\x34\xd1\x45\x00\x15\xf6\x3f\xfc\x13\x77\xf6\x41\x6f\
-\xda\x2f\xe2\x7f\xfc\x24\x7e\x21\xb3\xf3\x7c\x07\xe1\x99\x96\x6b\
-\xc5\x95\x7e\x5b\xeb\xaf\xbd\x1d\xaf\xfb\x4b\xfc\x52\x7f\xb3\xb5\
-\x7f\x8a\xb1\x3f\x63\x4f\xd8\x17\xc5\xdf\xb4\xf6\xa7\x0e\xb3\xa8\
-\x47\x73\xe1\xaf\x87\xf0\xc9\xfe\x91\xad\x49\x1e\xd9\x2e\xbf\xbd\
-\x1d\xaa\xb7\xfa\xc6\xff\x00\xa6\x9f\x75\x7f\xda\x6f\x96\xbf\x6d\
-\x3e\x16\xfc\x2b\xf0\xc7\xc1\x9f\x05\xe9\xfe\x14\xf0\x86\x97\x1e\
-\x91\xa2\x58\xa8\x11\xc3\x18\xdc\xd2\x37\xf1\x49\x23\x7d\xe6\x76\
-\xfe\x26\x6a\x00\xec\x92\x35\x8e\x30\xaa\xbb\x54\x7f\x08\xa9\x28\
-\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\
-\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\
-\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\xf9\
-\xbf\xe3\xbf\xec\x13\xf0\x77\xf6\x82\xd6\xae\xf5\xbf\x10\x78\x76\
-\x6b\x1f\x11\xdc\xa7\x97\x26\xb1\xa3\xdc\x35\xb4\xcd\xfe\xd3\x2f\
-\xfa\xb9\x1b\xfd\xa6\x56\x35\xf4\x85\x14\x01\xf8\x81\xf1\xfb\xfe\
-\x09\x57\xf1\x63\xe1\x7e\xa5\x7f\x75\xe0\xeb\x2f\xf8\x58\x7e\x1b\
-\x5f\x9e\x19\xec\x36\xad\xfa\xaf\xf7\x64\xb7\x66\xdc\xcd\xff\x00\
-\x5c\xf7\x6e\xff\x00\x67\xee\xd7\xc7\xfe\x22\xf0\x96\xb9\xe1\x2b\
-\xe6\xb3\xd7\x34\x7d\x43\x45\xbc\x5f\xbd\x06\xa1\x6b\x25\xbc\x8b\
-\xff\x00\x01\x65\x5a\xfe\x9f\xeb\x2b\x5c\xf0\xfe\x9b\xe2\x3b\x16\
-\xb3\xd5\x74\xfb\x5d\x4a\xd5\xfe\xf4\x17\xb0\xac\xd1\x9f\xf8\x0b\
-\x50\x07\xf2\xfd\xb5\xa8\xaf\xe8\x8f\x5a\xfd\x8a\xfe\x05\xf8\x82\
-\xfa\x6b\x9b\xcf\x85\x5e\x17\xf3\xa6\x56\x56\x6b\x7d\x3d\x6d\xc7\
-\xcd\xfe\xcc\x7b\x57\x77\xfb\x5f\x7a\xbc\xc7\x45\xff\x00\x82\x58\
-\xfe\xcf\x3a\x3d\xd3\x4d\x3f\x85\xb5\x0d\x54\x6e\x2c\xb1\xde\xea\
-\xf7\x1b\x57\xfd\x9f\xdd\xb2\xfc\xbf\xef\x50\x07\xe1\x5e\xdf\xa5\
-\x5c\xd3\x74\x6b\xed\x66\xe3\xec\xf6\x16\x77\x37\xd7\x1f\xf3\xca\
-\xda\x16\x91\xbf\xef\x95\xaf\xe8\x8b\xc2\xdf\xb1\xef\xc1\x2f\x06\
-\xc8\xa7\x4b\xf8\x5b\xe1\x78\xe4\x5f\xbb\x2d\xc6\x9b\x1d\xc4\x83\
-\xfe\x05\x26\xe6\xaf\x53\xd1\x74\x0d\x33\xc3\xd6\xbf\x67\xd3\x34\
-\xdb\x4d\x36\x1f\xf9\xe7\x67\x02\xc2\xbf\xf7\xca\xd0\x07\xe0\x4f\
-\xc2\xaf\xf8\x27\xdf\xc7\x4f\x8b\x8d\x0c\xda\x7f\x81\xef\x34\x5d\
-\x36\x4f\xf9\x88\xf8\x8b\xfe\x25\xf0\xaa\xff\x00\x7b\x6c\x9f\xbc\
-\x65\xff\x00\x75\x5a\xbf\x44\x3f\x67\x2f\xf8\x24\xbf\x80\xfe\x1a\
-\xbd\xae\xb5\xf1\x0a\xe9\x7e\x20\x6b\xf1\x95\x91\x6c\x8c\x5e\x4e\
-\x99\x0b\x7f\xd7\x3f\xbd\x37\xfd\xb4\xf9\x7f\xe9\x9d\x7d\xf5\x45\
-\x00\x51\xb2\xb1\xb7\xb0\xb6\x86\xde\xda\x14\x86\x08\x91\x63\x48\
-\xa3\x5d\xaa\x8a\xbf\x75\x42\xf6\x1c\x55\xea\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x0f\xff\xd9\
-\x00\x00\x3c\x4a\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x01\x21\x01\x51\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x51\
-\xdf\xce\x30\x4f\x3c\xd3\x7c\xe5\xe8\x73\x9f\xee\xe3\x9f\xca\xb1\
-\x7c\x61\xe2\x18\xbc\x23\xe1\x9d\x5f\x5d\xb8\x56\x6b\x7d\x32\xd6\
-\x6b\xc9\x15\x71\x96\x58\xe3\x69\x08\x07\xdf\x18\xaf\xc3\xcf\x1e\
-\x7f\xc1\x54\x3e\x3b\xf8\x9b\xc4\xd7\x57\xda\x1f\x88\xa0\xf0\xa6\
-\x98\xcc\xdf\x66\xd3\x2c\x2c\xa1\x91\x21\x4c\x9d\xb9\x69\x15\x8b\
-\xb6\x3a\x93\x8c\x9e\x71\x40\x1f\xbc\x19\xa2\xbf\x9f\xc1\xff\x00\
-\x05\x2f\xfd\xa4\x00\x00\x7c\x45\x9b\xd8\x7f\x66\xda\x7f\xf1\xaa\
-\x3f\xe1\xe6\x3f\xb4\x87\xfd\x14\x69\x8f\xbf\xf6\x6d\xa7\xff\x00\
-\x1a\xa0\x0f\xe8\x0e\x8c\xd7\xf3\xf9\xff\x00\x0f\x31\xfd\xa4\x3f\
-\xe8\xa2\xcd\xff\x00\x82\xdb\x4f\xfe\x35\x47\xfc\x3c\xc3\xf6\x90\
-\x5e\x47\xc4\x59\x8f\x3d\xf4\xdb\x4f\xfe\x35\x40\x1f\xd0\x09\x99\
-\x46\x7d\x07\x7e\xd4\xe1\xcd\x7c\x05\xff\x00\x04\xd4\xfd\xb8\x3c\
-\x55\xfb\x4a\xcd\xe2\x2f\x08\xf8\xf1\x20\xbc\xd7\xf4\x8b\x38\xef\
-\xed\xf5\x6b\x78\x56\x1f\x3e\x1d\xeb\x13\x2c\xa8\x3e\x5d\xe1\xd9\
-\x18\x10\x30\xdb\x9b\xa6\x00\x3f\x7e\x8e\x82\x80\x16\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\xa2\xfb\x42\x65\x87\x3f\x29\xc1\x38\x38\xff\x00\x3f\xca\xa5\
-\xaf\x9b\xff\x00\x6e\xcf\xda\x4a\xff\x00\xf6\x5d\xf8\x17\x7d\xe2\
-\xbd\x1e\xca\x2b\xdd\x6e\xee\xee\x3d\x33\x4e\xfb\x50\x26\x08\xa6\
-\x90\x39\x32\x48\x3f\x88\x2a\xc6\x70\xbc\x64\xfa\xf3\x40\x1f\x47\
-\x2b\x06\x55\x23\xa1\x19\xa5\xaf\xc0\x2b\xef\xf8\x29\xb7\xed\x1f\
-\x71\x79\x34\x8b\xf1\x05\xe1\x56\x76\x61\x1c\x7a\x65\xa8\x54\xc9\
-\xe8\x01\x8c\x90\x07\xb9\xa8\x7f\xe1\xe6\x3f\xb4\x87\xfd\x14\x59\
-\xbf\xf0\x5b\x69\xff\x00\xc6\xa8\x03\xfa\x03\xa2\xbf\x9f\xcf\xf8\
-\x79\x8f\xed\x21\xff\x00\x45\x16\x6f\xfc\x16\xda\x7f\xf1\xaa\x55\
-\xff\x00\x82\x98\x7e\xd2\x0c\x33\xff\x00\x0b\x1e\x40\x3b\xe7\x4e\
-\xb4\xe3\xff\x00\x21\x50\x07\xf4\x00\x26\x56\x24\x0e\xdd\x78\xe3\
-\xf3\xa1\xa5\x09\x9c\xf6\xe4\xfb\x0f\x5a\xfc\x07\xb0\xff\x00\x82\
-\x9c\x7e\xd1\x56\x37\xd6\xf7\x12\xf8\xf9\xae\xfc\xb7\x0c\x61\x9f\
-\x4c\xb5\x28\xc0\x75\x56\xc4\x60\xe0\xfb\x11\x5f\xb0\xbf\xb1\xbf\
-\xc7\xdb\x8f\xda\x63\xe0\x2e\x81\xe3\x6b\xdd\x3e\x1d\x37\x54\x95\
-\xe5\xb5\xbd\x86\x0c\xf9\x5e\x74\x4d\xb1\xda\x30\x49\x21\x18\x72\
-\x01\x3c\x67\x1c\xf5\xa0\x0f\x73\xdf\xfe\xcb\x7e\x54\x54\x7e\x53\
-\xfa\x9f\xfb\xec\xff\x00\x85\x14\x01\xc3\x7c\x7c\x40\xdf\x04\x7e\
-\x20\x8c\x91\x9f\x0f\xdf\x03\xff\x00\x7e\x1e\xbf\x99\x96\x3f\x30\
-\xfa\x57\xf4\xd1\xf1\xeb\xfe\x48\x8f\xc4\x1f\xfb\x17\xef\xbf\xf4\
-\x43\xd7\xf3\x2c\xdd\x47\xd2\x80\x3f\x43\x7e\x04\xff\x00\xc1\x26\
-\x2e\xfe\x35\x7c\x1e\xf0\x9f\x8e\x63\xf8\x8d\x6f\xa4\xae\xb9\x62\
-\x97\xbf\x63\x6d\x29\xa5\x31\x12\xcd\xc1\x6f\x30\x67\x80\x7b\x57\
-\x75\xff\x00\x0e\x3f\xbe\xef\xf1\x5e\xdf\x3f\xf6\x06\x61\xff\x00\
-\xb5\x6b\xed\xef\xd8\x27\xe6\xfd\x8f\x3e\x14\x00\x7f\xe6\x07\x17\
-\xfe\x84\xf5\xf4\x15\x00\x7e\x4f\xff\x00\xc3\x8f\xef\xbf\xe8\xab\
-\x5b\xff\x00\xe0\x9d\xbf\xf8\xed\x1f\xf0\xe3\xfb\xec\x8f\xf8\xba\
-\xd6\xf8\xff\x00\xb0\x3b\x7f\xf1\xda\xfd\x60\xa2\x80\x3e\x62\xfd\
-\x8d\x7f\x61\x9f\x0f\x7e\xc8\x3a\x5e\xab\x35\x9e\xad\x2f\x88\xfc\
-\x4d\xab\x2c\x69\x77\xaa\x4d\x10\x85\x56\x34\xc9\x11\x44\x80\xb6\
-\xd5\xdc\x49\x24\x92\x4e\x07\x4a\xfa\x71\x46\xd5\x00\xe3\x20\x76\
-\x18\x14\xb4\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x01\x45\x14\x50\x01\x5e\x59\xfb\x45\x7e\xcf\x7a\
-\x07\xed\x29\xf0\xcf\x52\xf0\x67\x88\xda\x4b\x7b\x6b\x87\x4b\x8b\
-\x5b\xeb\x6f\xf5\xd6\x97\x29\x9f\x2a\x65\xcf\x07\x69\x66\x05\x4f\
-\xde\x0c\xc3\x23\x35\xea\x74\x50\x07\xe5\x1d\xc7\xfc\x10\xfe\xeb\
-\xcf\x93\xc9\xf8\xaf\x09\x8b\x71\xd9\xbf\x46\x21\xb6\xe7\x8c\xe2\
-\x5e\xb8\xa8\xff\x00\xe1\xc7\xf7\xdf\xf4\x55\xad\xff\x00\xf0\x4e\
-\xdf\xfc\x76\xbf\x58\x28\xa0\x0f\xc9\xff\x00\xf8\x71\xfd\xf7\xfd\
-\x15\x6b\x7f\xfc\x13\xb7\xff\x00\x1d\xa7\xaf\xfc\x11\x16\xfe\x30\
-\x09\xf8\xad\x6e\x70\x40\xc7\xf6\x43\x74\xc9\x04\x7f\xad\xee\x31\
-\xfa\xd7\xea\xed\x31\xba\x75\xee\x3f\x9d\x00\x7f\x2d\x7e\x20\xd2\
-\xce\x89\xaf\x6a\x1a\x79\x90\x4b\xf6\x3b\x99\x2d\xfc\xc0\x31\xbb\
-\x63\x95\xce\x32\x71\x9c\x7a\xd7\xee\x27\xfc\x12\x3f\x27\xf6\x39\
-\xd2\xfa\x7f\xc8\x63\x50\x1f\xf9\x10\x57\xe2\x57\xc4\x0f\xf9\x1e\
-\xbc\x45\xff\x00\x61\x2b\x9f\xfd\x1a\xd5\xfb\x6d\xff\x00\x04\x8f\
-\xff\x00\x93\x39\xd2\xff\x00\xec\x33\xa8\x7f\xe8\xc1\x40\x1f\x68\
-\x67\xeb\x45\x25\x14\x01\xc1\xfc\x7c\xff\x00\x92\x23\xf1\x08\xfa\
-\x78\x7e\xff\x00\xff\x00\x49\xdc\xd7\xf3\x2e\xdd\x7f\x0a\xfe\x9b\
-\x3e\x39\x5b\x4d\x7d\xf0\x67\xc7\xd6\xd6\xf1\x34\xd7\x12\xe8\x37\
-\xc9\x1c\x68\x32\xce\xc6\xdd\xc0\x00\x7a\x93\x5f\xcc\xc7\xd9\xdd\
-\xb9\x1c\xaf\x4d\xdd\xba\x7f\x9f\xce\x80\x3f\xa2\x0f\xd8\x1b\xfe\
-\x4c\xff\x00\xe1\x47\xfd\x80\xe2\xff\x00\xd0\xa4\xaf\xa0\x6b\xc1\
-\x3f\x61\x1b\x39\xf4\xff\x00\xd9\x13\xe1\x3c\x57\x30\xbc\x12\xff\
-\x00\x60\xc0\xfb\x1c\x60\xed\x62\xcc\xa7\xe8\x43\x03\xf8\xd7\xbd\
-\xaf\x2a\x0e\x31\x40\x0b\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x4c\x6e\x9f\x88\xfe\x74\
-\xfa\x86\x57\x0a\xc3\x9e\xe3\x8e\xbd\xe8\x03\xf9\x7d\xf1\xff\x00\
-\xfc\x8f\x5e\x22\xff\x00\xb0\x95\xcf\xfe\x8d\x6a\xfd\xb6\xff\x00\
-\x82\x47\xff\x00\xc9\x9c\xe9\x7f\xf6\x19\xd4\x3f\xf4\x60\xaf\xc5\
-\x1f\x89\x56\x33\xd8\xfc\x44\xf1\x45\xb5\xc4\x4d\x04\xf0\xea\xb7\
-\x51\xc9\x1c\x83\x05\x18\x4c\xd9\x53\xee\x2b\xf6\xc7\xfe\x09\x2f\
-\x0c\x96\xbf\xb1\xce\x8c\x65\x8d\xa3\x59\x75\x6b\xf9\x23\x2c\x31\
-\xb9\x4c\xb8\x0c\x3d\xb2\x08\xfa\x8a\x00\xfb\x32\x8a\x4c\x9f\xee\
-\x1f\xd2\x8a\x00\x49\x22\x2c\x08\xc0\x2a\x7a\x83\xdf\x91\xfe\x71\
-\xde\xbe\x60\xd6\x7f\xe0\x9b\x5f\x01\xb5\xef\x88\xad\xe2\xfb\xcf\
-\x05\xab\xdd\x4b\x2b\x5c\x5c\x69\xb1\x5d\x49\x1e\x9f\x34\xa4\xe4\
-\xb1\x80\x1c\x01\x9e\x76\x02\x14\x9e\xa0\xf3\x9f\xa9\x28\xa0\x0a\
-\xd6\xb6\x6b\x67\x04\x50\xc2\x8b\x1c\x31\xa8\x45\x8d\x46\x15\x54\
-\x00\x00\x03\xb0\x00\x55\x9a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x4a\
-\x5a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x92\x80\x16\x8a\
-\x28\xa0\x02\x8a\x4a\x5a\x00\x28\xa2\x92\x80\x16\x8a\x28\xa0\x02\
-\x8a\x4a\x5a\x00\x28\xa2\x92\x80\x16\x8a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x29\x28\x01\x68\xa2\x8a\
-\x00\x2a\x16\x4e\xa7\xa1\x3d\xd4\xf3\xfe\x78\x15\x2d\x2d\x00\x7c\
-\xd1\xf1\x63\xfe\x09\xef\xf0\x57\xe3\x47\x8f\x8f\x8c\x3c\x45\xe1\
-\x66\x1a\xc4\xd2\xf9\xb7\x8d\xa7\xde\x49\x6b\x1d\xe9\xc6\x07\x9a\
-\x8b\xc1\x3e\xa5\x76\x96\x39\xce\x6b\xdf\x3c\x27\xe1\x0d\x27\xc0\
-\xbe\x1d\xd3\xb4\x2d\x03\x4e\xb7\xd2\x74\x7d\x3e\x15\x82\xda\xce\
-\xdd\x76\xc7\x14\x6b\xd1\x47\xe6\x4e\x7d\x6b\x6a\x96\x80\x22\xf2\
-\xff\x00\xd8\x5f\xfb\xe8\xd1\x52\xd1\x40\x05\x14\x51\x40\x0d\x66\
-\x0a\x33\x5e\x7f\xf1\x13\xf6\x82\xf8\x6f\xf0\x92\xfa\xd6\xcb\xc6\
-\x7e\x37\xd1\x3c\x31\x79\x72\x37\x45\x6d\xa9\x5e\xa4\x52\x32\xe7\
-\x1b\xb6\x93\x90\xb9\xfe\x2e\x9e\xf5\xdf\x49\x96\x18\x18\xcf\x6f\
-\xaf\x6a\xfe\x71\x3f\x6c\x2f\x13\xea\x1e\x24\xfd\xa9\x7e\x29\x5e\
-\x6a\x37\x52\xdd\x5c\x2f\x88\xaf\x60\x57\x91\xb9\x58\xa2\x95\xe3\
-\x8e\x31\xe8\x15\x15\x54\x7d\x28\x03\xfa\x31\xd2\xf5\xab\x1d\x72\
-\xc6\x0b\xdd\x3e\xea\x2b\xeb\x49\xd0\x49\x0d\xc5\xbc\x8a\xf1\xc8\
-\xa7\x38\x2a\xc0\xe0\x8e\x0f\xe5\x57\x73\x91\x9e\xd5\xf0\x47\xfc\
-\x11\xc7\xc4\xda\x97\x88\x7f\x66\x1d\x72\xca\xf2\xea\x4b\x9b\x4d\
-\x2f\xc4\x53\x5a\x59\xc3\x29\xc8\x86\x36\xb7\x82\x42\x8a\x7f\xbb\
-\xbe\x47\x6c\x76\xdd\x8a\xfb\xdf\xf8\x70\x4e\x4e\x28\x03\x8c\xf8\
-\x8d\xf1\x93\xc1\x5f\x08\x6c\x60\xbc\xf1\xaf\x89\xf4\xaf\x0b\xda\
-\xdc\x3f\x97\x04\x9a\xa5\xd2\x43\xe7\x30\x04\x95\x40\x4e\x58\xe0\
-\x67\x02\xb5\x7c\x1f\xe3\xcf\x0f\x7c\x41\xd0\xad\xb5\xaf\x0d\x6b\
-\x16\x5a\xf6\x91\x71\xfe\xaa\xfb\x4f\x9d\x66\x89\xc8\xea\x03\x29\
-\xeb\xd3\x8f\x7a\xfc\x49\xff\x00\x82\xb1\x78\x9b\x51\xd4\xbf\x6c\
-\x4f\x10\xe9\xb7\x97\x73\x4f\x65\xa6\x69\xf6\x30\x58\xc2\x5b\xe5\
-\xb7\x47\xb7\x49\x58\x28\xe8\x32\xee\xec\x4f\x53\x9c\x67\x15\xef\
-\x3f\xf0\x44\xdf\x12\x6a\x37\x9a\xb7\xc4\xed\x15\xee\x9d\xb4\xd8\
-\xe0\xb1\xbd\x5b\x53\xf7\x16\x62\xf2\xa9\x91\x47\x62\x54\x00\x7f\
-\xdd\x06\x80\x3f\x56\xd5\xb7\x28\x23\xbf\xa8\xc5\x73\xfe\x36\xf8\
-\x81\xe1\xcf\x86\xfa\x0c\xfa\xdf\x8a\x75\xab\x1d\x03\x48\x81\x95\
-\x25\xbe\xd4\x27\x58\xa2\x46\x6c\x6d\x52\xcc\x7a\x9c\xf4\xfe\x95\
-\xd0\x28\xda\xa0\x7a\x71\x5f\x91\xbf\xf0\x5a\xef\x12\x6a\x0b\xf1\
-\x07\xe1\xde\x86\xf7\x52\x36\x93\x1e\x99\x71\x7a\x96\xbb\x8e\xc1\
-\x3b\x4f\xb0\xbf\xfb\xdb\x50\x28\x27\x38\x05\xb1\xd6\x80\x3f\x50\
-\x7e\x1f\xfc\x60\xf0\x67\xc5\x6d\x2e\x6d\x4b\xc1\xbe\x25\xd3\x3c\
-\x4d\x63\x0c\xa2\x19\x67\xd3\x2e\x92\x65\x8d\xc8\x0c\x15\x88\x3c\
-\x1c\x1c\xfe\x7d\xeb\xb1\x07\x2a\x0d\x7e\x20\x7f\xc1\x21\xfc\x49\
-\x7f\x6b\xfb\x59\x26\x9b\x6d\x73\x24\x16\x3a\x8e\x8d\x78\x2e\xe0\
-\x56\x21\x26\xd8\x15\xd3\x70\xcf\x25\x58\x64\x13\xce\x18\x8c\xd7\
-\xed\xf2\xae\xd5\x03\xd0\x62\x80\x33\xf5\x8f\x11\x69\xbe\x1d\xd3\
-\x6e\xb5\x0d\x56\xf6\x1d\x3a\xc2\xd5\x0c\x97\x17\x57\x32\x04\x8e\
-\x15\x00\x9d\xce\xc4\xe1\x46\x07\x53\x8e\xa3\xbd\x71\xbf\x0f\x7f\
-\x68\x4f\x87\x1f\x16\x6f\xae\x6c\xfc\x19\xe3\x5d\x0f\xc4\xf7\x76\
-\xc3\x74\xd6\xfa\x65\xf4\x73\x4a\x8b\x92\x37\x6c\x07\x25\x72\x0f\
-\x20\x11\x5f\x1a\x7f\xc1\x67\xbc\x4d\xa9\x68\xbf\x01\xfc\x23\xa4\
-\xda\xdc\xb4\x3a\x7e\xa9\xaf\x62\xf2\x25\x00\x89\x84\x71\x33\xa2\
-\xb6\x7a\xa8\x63\xbb\x1d\xc8\x5f\x4a\xfc\xe1\xfd\x87\x7c\x4f\xa9\
-\x78\x7f\xf6\xaf\xf8\x63\x3e\x9d\x75\x25\xb4\xb3\x6b\x70\xda\xc9\
-\xb5\x88\x12\x45\x27\xc8\xe8\xd8\xea\x0a\x93\xd7\xa7\x5a\x00\xfe\
-\x8a\xd5\xb7\x28\x22\xa1\xb8\xbc\x4b\x65\x91\xa4\x21\x52\x35\xdc\
-\xcc\xc4\x00\x07\xa9\x27\xe8\x7e\x98\x35\x34\x63\x6a\xe3\xae\x38\
-\xaf\x98\xbf\xe0\xa4\x7e\x21\xd4\xbc\x2f\xfb\x1d\xfc\x40\xbc\xd2\
-\xee\xe5\xb1\xb9\x92\x28\x2d\x9a\x68\x18\xab\x88\xe4\x9d\x12\x40\
-\x0f\x6d\xca\x4a\x9f\x62\x68\x03\xd4\xfc\x31\xfb\x4b\x7c\x2d\xf1\
-\xa7\x8a\xa4\xf0\xd6\x83\xe3\xff\x00\x0f\x6a\xfa\xf2\x33\x29\xd3\
-\xed\x35\x08\xde\x52\xca\x70\x55\x40\x3f\x33\x0f\xee\xae\x4f\xb5\
-\x7a\x52\xb8\x6a\xfe\x5d\x7c\x3f\xe2\x6b\xdf\x0e\xf8\x87\x4d\xd5\
-\xb4\xc9\x9e\xcb\x50\xb2\x9e\x39\xed\xe6\x88\xed\x31\x3a\xb8\x60\
-\x54\x8e\x47\x20\x7e\x1c\x73\x5f\xd3\xdf\x87\xee\xa4\xbe\xd0\xf4\
-\xeb\x99\x8e\xe9\xa6\xb7\x8e\x47\x20\x63\x2c\x54\x13\xfa\x9a\x00\
-\xbe\x64\x1c\xf0\x4f\xd2\xbc\xd2\xf3\xf6\x98\xf8\x57\xa7\xf8\xd7\
-\xfe\x11\x0b\x8f\x88\x3e\x1c\x87\xc4\xc2\x41\x09\xd2\xdb\x52\x8b\
-\xce\x59\x0f\x48\xc8\xcf\x0e\x7f\xbb\xd7\xda\xb5\x3e\x37\x6a\xb7\
-\x7e\x1f\xf8\x43\xe3\x8d\x56\xc2\x56\x82\xfa\xc7\x43\xbe\xb9\xb7\
-\x95\x4e\x0a\x48\xb6\xf2\x32\xb0\xfc\x40\xaf\xe6\x7e\xe3\x50\x9a\
-\xf2\xea\x59\xa5\x91\xe5\x96\x73\xba\x47\x95\xcb\x33\xb1\xe5\x99\
-\x89\xe4\x92\x7e\x6c\xfa\xd0\x07\xf5\x2d\xbf\xfd\x93\x9c\x52\x99\
-\x02\xf5\xe9\xd2\xbc\x5f\xf6\x35\xf1\x16\xa3\xe2\xef\xd9\x6f\xe1\
-\x7e\xaf\xaa\xdc\xc9\x7b\xa8\x5c\x68\x76\xc6\x59\xe6\x6d\xce\xe4\
-\x2e\xd0\x58\xf7\x24\x01\x93\x5e\xcb\xb3\xa6\x79\xf4\xfc\xc1\xfe\
-\x74\x01\xe7\x9e\x3b\xfd\xa3\xbe\x19\x7c\x30\xd7\xe1\xd0\xfc\x5b\
-\xe3\xad\x03\xc3\xba\xbc\xca\xae\xb6\x5a\x8d\xfc\x71\x4a\x14\xf4\
-\x2c\x09\xf9\x41\xf5\x38\xcf\x6a\xef\xec\xf5\x08\x35\x0b\x58\xae\
-\x6d\xe4\x59\xad\xe5\x50\xf1\xcd\x1b\x06\x47\x52\x32\x19\x58\x70\
-\x41\x1c\xe4\x57\xf3\x3f\xf1\xb3\xc4\x97\xde\x26\xf8\xb9\xe3\x4d\
-\x4f\x55\xb9\x96\xf7\x50\xb9\xd6\x2e\xde\x59\xe5\x7d\xe5\x8f\x9a\
-\xea\x07\x3d\x95\x40\x00\x76\x03\x82\x3a\x57\xec\xd7\xfc\x12\x77\
-\x5c\xd4\x35\xff\x00\xd9\x0b\x48\x5b\xfb\xa9\x6e\xd6\xc3\x54\xbd\
-\xb1\xb5\x13\x31\x3e\x54\x0a\xea\xcb\x18\xf6\x05\xdb\x1e\x9c\x0e\
-\x94\x01\xf6\x76\xef\x6a\xe1\x7e\x23\xfc\x72\xf0\x17\xc2\x01\x6a\
-\x7c\x6b\xe2\xdd\x23\xc3\x1f\x6a\xcf\xd9\xd7\x52\xbb\x58\x9a\x5c\
-\x10\x09\x55\x3c\x90\x32\x32\x7a\x0f\x5a\xee\x1b\x81\x5f\x80\x7f\
-\xf0\x52\x8f\x14\xea\x3a\xd7\xed\x8f\xf1\x0a\x0b\xfb\xa9\x2e\x93\
-\x4f\xb8\x86\xce\xd9\x5f\xa4\x50\x8b\x78\xd8\x46\xa3\xb0\xdc\xcc\
-\x4e\x3a\xee\xc9\xa0\x0f\xde\x5f\x0c\xf8\xbf\x47\xf1\x9e\x8b\x69\
-\xac\x68\x3a\x9d\xae\xb3\xa4\xdd\xa0\x92\xde\xfa\xc2\x65\x9a\x19\
-\x94\x8c\x82\xae\xa4\x83\xff\x00\xd6\xad\x9e\xd5\xf9\x9b\xff\x00\
-\x04\x50\xf1\x0e\xa1\xa8\x78\x17\xe2\x66\x93\x2d\xcc\xb2\x69\xb6\
-\x37\xf6\x73\xdb\x5b\x3b\x92\xb0\xbc\xb1\xc8\x24\x2b\xe9\xbb\x62\
-\x67\x1d\xd7\xde\xbf\x4c\x57\xee\x8f\xa5\x00\x72\xde\x3e\xf8\xa7\
-\xe1\x3f\x85\xba\x49\xd5\x3c\x5f\xe2\x1d\x3f\xc3\x5a\x76\xed\x82\
-\xe7\x53\xb8\x58\x11\x9b\xae\xd5\x2c\x7e\x63\x8e\x70\x33\x4b\xe0\
-\x5f\x8a\x7e\x11\xf8\x9f\xa2\xa6\xad\xe1\x1f\x11\x69\xde\x23\xd3\
-\x59\x8c\x62\xe7\x4d\xb8\x49\x53\x78\x38\x2a\x48\x3c\x36\x73\xc1\
-\xc1\xe0\xd7\xe4\x67\xfc\x16\x67\xc4\xfa\x9c\x9f\xb4\x47\x86\x34\
-\x47\xba\x93\xfb\x2e\xc7\x40\x8e\xea\xde\xd9\x58\x85\x49\xa5\x9e\
-\x6d\xf2\x63\xa6\x48\x44\x1d\x3a\x2f\xbd\x37\xfe\x08\xcb\xe2\x4b\
-\xe8\x3f\x68\x6f\x13\x69\x10\xcf\x22\x69\xd7\xbe\x1e\x92\x59\xed\
-\xb7\x9d\x8f\x24\x73\x45\xb1\xcf\xb8\x0c\xe0\x1f\x42\x47\x7a\x00\
-\xfd\x9e\x56\xdc\x32\x3f\x5a\xc8\xf1\x3f\x8c\x34\x5f\x05\x68\xb7\
-\x9a\xce\xbf\xa9\xda\xe8\xda\x45\x9a\x19\x2e\x2f\xaf\xa6\x58\xa1\
-\x89\x47\x52\xce\xc4\x01\xf4\xeb\x5a\xd1\xae\xc5\x03\xb0\xaf\xcc\
-\xff\x00\xf8\x2d\x87\x88\x6f\xb4\xff\x00\x05\x7c\x36\xd1\xe2\xb8\
-\x78\xf4\xeb\xdd\x42\xee\xe2\xe6\x15\x27\x12\xb4\x71\xa0\x4d\xc0\
-\x11\x90\x37\x9e\x28\x03\xef\x6f\x87\xbf\x1d\x3c\x03\xf1\x6e\x3b\
-\xa6\xf0\x4f\x8b\x34\xaf\x15\x1b\x53\x89\xd7\x4a\xba\x49\x9a\x32\
-\x7a\x06\x00\xfc\xb9\xec\x4e\x07\x4e\x79\x15\xdd\xab\x6e\x50\x47\
-\x42\x33\x5f\xcf\xbf\xfc\x13\x8f\xc4\xfa\x8e\x8d\xfb\x66\x7c\x3a\
-\xfb\x0d\xcb\xc0\xda\x8d\xcc\xb6\x57\x38\xe4\x4b\x0b\xc1\x26\xf4\
-\x6c\xe7\x70\xe0\x1e\x7a\x10\x0f\x18\xaf\xe8\x21\x4e\xe5\x07\xda\
-\x80\x20\xbc\xbe\x82\xc2\xde\x6b\x8b\x99\x56\x08\x21\x52\xf2\x4b\
-\x23\x05\x44\x50\x32\x59\x89\xe0\x00\x39\x24\xf4\xaf\x3d\xf0\x4f\
-\xed\x21\xf0\xc7\xe2\x56\xbd\x36\x89\xe1\x4f\x1d\x68\x3e\x22\xd5\
-\xe2\x56\x76\xb1\xd3\xaf\xe3\x9a\x62\xab\x8d\xc5\x54\x1f\x98\x00\
-\x73\xf2\xe6\xbe\x7f\xff\x00\x82\xaf\x6b\xfa\x8f\x87\x7f\x63\xdd\
-\x77\xec\x17\x52\x5b\x2e\xa1\xa9\x59\xd9\x5c\xf9\x4c\x54\xc9\x03\
-\x39\x66\x42\x41\xce\x09\x40\x0f\xb1\x23\x9a\xfc\x59\xf8\x47\xe2\
-\xed\x4b\xc2\x7f\x15\x3c\x25\xac\xe8\xf7\x32\x58\x6a\x56\x7a\xb5\
-\xbc\xd6\xf3\x46\x71\xb1\xbc\xd5\x3c\x01\x8e\x0f\x42\x3a\x10\x4f\
-\x14\x01\xfd\x37\x83\x9a\x6b\x4a\x17\x77\x07\xe5\xeb\x81\x9a\x58\
-\xf0\xaa\x00\x18\x15\xe4\x3f\xb5\xbe\xb9\xa8\x78\x5f\xf6\x65\xf8\
-\xa5\xab\x69\x77\x32\x59\x5f\xda\x78\x72\xf6\x48\x2e\x2d\xdc\xa4\
-\x91\x37\x94\xdf\x32\xb7\x66\x19\xe0\xf6\x34\x01\xa7\x61\xfb\x4c\
-\x7c\x2c\xd5\x3c\x6d\xff\x00\x08\x7d\xa7\xc4\x0f\x0e\xcf\xe2\x7f\
-\x37\xc8\x1a\x52\xea\x51\x79\xcd\x28\xc9\x31\x81\xbb\x0c\xe3\x1f\
-\x74\x12\x6b\xd2\xd2\x4d\xdd\xab\xf9\x67\x8e\xfe\x58\x6e\x7c\xe5\
-\x91\x96\x64\x70\xe2\x51\x9d\xc1\x81\x1f\x30\x39\xe0\xf4\x39\xeb\
-\xef\x5f\xd2\xf7\xc0\x5d\x72\xfb\xc4\xdf\x03\x7e\x1e\x6b\x3a\x9c\
-\xed\x75\xa9\xea\x3e\x1d\xd3\xae\xee\xa7\x7c\x6e\x92\x59\x2d\xa3\
-\x77\x63\x80\x06\x4b\x12\x78\x03\xaf\x4a\x00\xef\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x6b\x7d\xe1\xfe\x7d\x6b\xf9\xac\
-\xfd\xa9\x3f\xe4\xe5\xbe\x2a\x7f\xd8\xcf\xa9\x7f\xe9\x44\x95\xfd\
-\x29\xb7\xde\x1f\xe7\xd6\xbf\x9a\xcf\xda\x93\xfe\x4e\x5b\xe2\xa7\
-\xfd\x8c\xfa\x97\xfe\x94\x49\x40\x1f\xa9\x1f\xf0\x45\x3f\xf9\x37\
-\x0f\x19\x7f\xd8\xd9\x27\xfe\x92\x5a\xd7\xe8\x67\xad\x7e\x79\xff\
-\x00\xc1\x14\xff\x00\xe4\xdc\x3c\x65\xff\x00\x63\x64\x9f\xfa\x49\
-\x6b\x5f\xa1\x9e\xb4\x01\xf8\x2d\xff\x00\x05\x58\xff\x00\x93\xda\
-\xf1\x9f\xfd\x7a\xe9\xbf\xfa\x47\x15\x7b\xdf\xfc\x11\x07\xfe\x47\
-\x5f\x8a\x9f\xf6\x0e\xb0\xff\x00\xd1\xb3\x57\x82\x7f\xc1\x56\x3f\
-\xe4\xf6\xbc\x67\xff\x00\x5e\xba\x6f\xfe\x91\xc5\x5e\xf7\xff\x00\
-\x04\x41\xff\x00\x91\xd7\xe2\xa7\xfd\x83\xac\x3f\xf4\x6c\xd4\x01\
-\xfa\xdf\x5f\x8f\x1f\xf0\x5b\x2f\xf9\x2c\x5f\x0f\xbf\xec\x05\x37\
-\xfe\x94\xb5\x7e\xc3\xd7\xe3\xc7\xfc\x16\xcb\xfe\x4b\x17\xc3\xef\
-\xfb\x01\x4d\xff\x00\xa5\x2d\x40\x1e\x63\xff\x00\x04\x8b\xff\x00\
-\x93\xc6\xd2\xbf\xec\x0f\xa8\x7f\xe8\xb1\x5f\xba\xb5\xf8\x55\xff\
-\x00\x04\x8b\xff\x00\x93\xc6\xd2\xbf\xec\x0f\xa8\x7f\xe8\xb1\x5f\
-\xba\xb4\x01\xf9\xb9\xff\x00\x05\xb6\xff\x00\x92\x43\xf0\xf3\xfe\
-\xc3\xd2\xff\x00\xe9\x39\xaf\xce\x0f\xd8\xcf\xfe\x4e\xa3\xe1\x5f\
-\xfd\x8c\x56\x7f\xfa\x1d\x7e\x8f\xff\x00\xc1\x6d\xbf\xe4\x90\xfc\
-\x3c\xff\x00\xb0\xf4\xbf\xfa\x4e\x6b\xf3\x83\xf6\x33\xff\x00\x93\
-\xa8\xf8\x57\xff\x00\x63\x15\x9f\xfe\x87\x40\x1f\xd2\x0a\xf7\xfa\
-\xd7\xca\x1f\xf0\x54\x3f\xf9\x32\xbf\x1e\x7d\x6c\xff\x00\xf4\xaa\
-\x3a\xfa\xbd\x7b\xfd\x6b\xe5\x0f\xf8\x2a\x1f\xfc\x99\x5f\x8f\x3e\
-\xb6\x7f\xfa\x55\x1d\x00\x7e\x06\x41\xfe\xba\x3f\xaf\xf5\xaf\xea\
-\x33\xc2\x9f\xf2\x2c\xe9\x1f\xf5\xe7\x0f\xfe\x80\x2b\xf9\x73\x83\
-\xfd\x74\x7f\x5f\xeb\x5f\xd4\x67\x85\x7f\xe4\x58\xd2\x7f\xeb\xce\
-\x1f\xfd\x00\x50\x07\x25\xfb\x43\x7f\xc9\x09\xf8\x8f\xff\x00\x62\
-\xe5\xff\x00\xfe\x93\x49\x5f\xcd\x02\xfd\xf5\xfc\x3f\x95\x7f\x4b\
-\xff\x00\xb4\x37\xfc\x90\x9f\x88\xff\x00\xf6\x2e\x5f\xff\x00\xe9\
-\x34\x95\xfc\xd0\x2f\xdf\x5f\xc3\xf9\x50\x07\xf4\x51\xfb\x08\xff\
-\x00\xc9\x9f\x7c\x26\xff\x00\xb0\x0c\x1f\xd6\xbd\xe5\xbb\x57\x83\
-\x7e\xc2\x3f\xf2\x67\xdf\x09\xbf\xec\x03\x07\xf5\xaf\x79\x6e\xd4\
-\x01\xfc\xc1\xfc\x52\xff\x00\x92\x91\xe2\xaf\xfb\x0a\xde\x7f\xe8\
-\xf7\xaf\xda\x1f\xf8\x24\x27\xfc\x9a\x1c\x1f\xf6\x1e\xbf\xff\x00\
-\xda\x75\xf8\xbd\xf1\x4b\xfe\x4a\x47\x8a\xbf\xec\x2b\x79\xff\x00\
-\xa3\xde\xbf\x68\x7f\xe0\x90\x9f\xf2\x68\x70\x7f\xd8\x7a\xff\x00\
-\xff\x00\x69\xd0\x07\xdb\x52\x7d\xd3\x5f\xcf\x5f\xfc\x14\x5b\xfe\
-\x4f\x4b\xe2\x9f\xfd\x84\x62\xff\x00\xd2\x58\x6b\xfa\x14\x93\xee\
-\x9a\xfe\x7a\xff\x00\xe0\xa2\xdf\xf2\x7a\x5f\x14\xff\x00\xec\x23\
-\x17\xfe\x92\xc3\x40\x1f\x69\x7f\xc1\x10\x7f\xe4\x5f\xf8\xb3\xff\
-\x00\x5f\x5a\x6f\xfe\x83\x35\x7e\xa1\xaf\xdd\x1f\x4a\xfc\xbc\xff\
-\x00\x82\x20\xff\x00\xc8\xbf\xf1\x67\xfe\xbe\xb4\xdf\xfd\x06\x6a\
-\xfd\x43\x5f\xba\x3e\x94\x01\xf8\x9f\xff\x00\x05\x96\xff\x00\x93\
-\xa8\xd1\xbf\xec\x59\xb5\xff\x00\xd1\xf7\x14\x9f\xf0\x46\x9f\xf9\
-\x3a\x2d\x5f\xfe\xc5\xbb\x9f\xfd\x1b\x0d\x2f\xfc\x16\x5b\xfe\x4e\
-\xa3\x46\xff\x00\xb1\x66\xd7\xff\x00\x47\xdc\x52\x7f\xc1\x1a\x7f\
-\xe4\xe8\xb5\x7f\xfb\x16\xee\x7f\xf4\x6c\x34\x01\xfb\x65\x5f\x97\
-\x9f\xf0\x5b\xef\xf9\x02\xfc\x29\xff\x00\xaf\x8d\x43\xff\x00\x40\
-\x8a\xbf\x50\xeb\xf2\xf3\xfe\x0b\x7d\xff\x00\x20\x5f\x85\x3f\xf5\
-\xf1\xa8\x7f\xe8\x11\x50\x07\xc4\xbf\xf0\x4f\x5f\xf9\x3c\xef\x85\
-\x1f\xf6\x14\x6f\xfd\x13\x25\x7f\x43\x89\xf7\x17\xe9\x5f\xcf\x17\
-\xfc\x13\xd7\xfe\x4f\x3b\xe1\x47\xfd\x85\x1b\xff\x00\x44\xc9\x5f\
-\xd0\xea\x7d\xd5\xfa\x50\x07\xc5\x1f\xf0\x57\xcf\xf9\x33\xbb\xbf\
-\xfb\x0e\x58\xff\x00\x37\xaf\xc4\xef\x01\xff\x00\xc8\xf1\xe1\xff\
-\x00\xfb\x08\xdb\x7f\xe8\xd5\xaf\xdb\x1f\xf8\x2b\xe7\xfc\x99\xdd\
-\xdf\xfd\x87\x2c\x7f\x9b\xd7\xe2\x77\x80\xff\x00\xe4\x78\xf0\xff\
-\x00\xfd\x84\x6d\xbf\xf4\x6a\xd0\x07\xf5\x10\xbf\x76\xbc\x53\xf6\
-\xd7\xff\x00\x93\x4a\xf8\xbd\xff\x00\x62\xcd\xf7\xfe\x8a\x35\xed\
-\x6b\xf7\x6b\xc5\x3f\x6d\x7f\xf9\x34\xaf\x8b\xdf\xf6\x2c\xdf\x7f\
-\xe8\xa3\x40\x1f\xce\x43\x7d\xe7\xfa\x9f\xe6\x2b\xfa\x5a\xfd\x99\
-\xff\x00\xe4\xdc\xbe\x15\xff\x00\xd8\xa9\xa5\x7f\xe9\x1c\x55\xfc\
-\xd2\xb7\xde\x7f\xa9\xfe\x62\xbf\xa5\xaf\xd9\x9f\xfe\x4d\xcb\xe1\
-\x5f\xfd\x8a\x9a\x57\xfe\x91\xc5\x40\x1e\x95\x45\x14\x50\x01\x45\
-\x14\x50\x01\x45\x14\x50\x03\x5b\xef\x0f\xf3\xeb\x5f\xcd\x67\xed\
-\x49\xff\x00\x27\x2d\xf1\x53\xfe\xc6\x7d\x4b\xff\x00\x4a\x24\xaf\
-\xe9\x4d\xbe\xf0\xff\x00\x3e\xb5\xfc\xd6\x7e\xd4\x9f\xf2\x72\xdf\
-\x15\x3f\xec\x67\xd4\xbf\xf4\xa2\x4a\x00\xfd\x48\xff\x00\x82\x29\
-\xff\x00\xc9\xb8\x78\xcb\xfe\xc6\xc9\x3f\xf4\x92\xd6\xbf\x43\x3d\
-\x6b\xf3\xcf\xfe\x08\xa7\xff\x00\x26\xe1\xe3\x2f\xfb\x1b\x24\xff\
-\x00\xd2\x4b\x5a\xfd\x0c\xf5\xa0\x0f\xc1\x6f\xf8\x2a\xc7\xfc\x9e\
-\xd7\x8c\xff\x00\xeb\xd7\x4d\xff\x00\xd2\x38\xab\xde\xff\x00\xe0\
-\x88\x3f\xf2\x3a\xfc\x54\xff\x00\xb0\x75\x87\xfe\x8d\x9a\xbc\x13\
-\xfe\x0a\xb1\xff\x00\x27\xb5\xe3\x3f\xfa\xf5\xd3\x7f\xf4\x8e\x2a\
-\xf7\xbf\xf8\x22\x0f\xfc\x8e\xbf\x15\x3f\xec\x1d\x61\xff\x00\xa3\
-\x66\xa0\x0f\xd6\xfa\xfc\x78\xff\x00\x82\xd9\x7f\xc9\x62\xf8\x7d\
-\xff\x00\x60\x29\xbf\xf4\xa5\xab\xf6\x1e\xbf\x1e\x3f\xe0\xb6\x5f\
-\xf2\x58\xbe\x1f\x7f\xd8\x0a\x6f\xfd\x29\x6a\x00\xf3\x1f\xf8\x24\
-\x5f\xfc\x9e\x36\x95\xff\x00\x60\x7d\x43\xff\x00\x45\x8a\xfd\xd5\
-\xaf\xc2\xaf\xf8\x24\x5f\xfc\x9e\x36\x95\xff\x00\x60\x7d\x43\xff\
-\x00\x45\x8a\xfd\xd5\xa0\x0f\xcd\xcf\xf8\x2d\xb7\xfc\x92\x1f\x87\
-\x9f\xf6\x1e\x97\xff\x00\x49\xcd\x7e\x70\x7e\xc6\x7f\xf2\x75\x1f\
-\x0a\xff\x00\xec\x62\xb3\xff\x00\xd0\xeb\xf4\x7f\xfe\x0b\x6d\xff\
-\x00\x24\x87\xe1\xe7\xfd\x87\xa5\xff\x00\xd2\x73\x5f\x9c\x1f\xb1\
-\x9f\xfc\x9d\x47\xc2\xbf\xfb\x18\xac\xff\x00\xf4\x3a\x00\xfe\x90\
-\x57\xbf\xd6\xbe\x50\xff\x00\x82\xa1\xff\x00\xc9\x95\xf8\xf3\xeb\
-\x67\xff\x00\xa5\x51\xd7\xd5\xeb\xdf\xeb\x5f\x28\x7f\xc1\x50\xff\
-\x00\xe4\xca\xfc\x79\xf5\xb3\xff\x00\xd2\xa8\xe8\x03\xf0\x32\x0f\
-\xf5\xd1\xfd\x7f\xad\x7f\x51\x9e\x15\xff\x00\x91\x63\x49\xff\x00\
-\xaf\x38\x7f\xf4\x01\x5f\xcb\x9c\x1f\xeb\xa3\xfa\xff\x00\x5a\xfe\
-\xa3\x3c\x2b\xff\x00\x22\xc6\x93\xff\x00\x5e\x70\xff\x00\xe8\x02\
-\x80\x39\x2f\xda\x1b\xfe\x48\x4f\xc4\x7f\xfb\x17\x2f\xff\x00\xf4\
-\x9a\x4a\xfe\x68\x17\xef\xaf\xe1\xfc\xab\xfa\x5f\xfd\xa1\xbf\xe4\
-\x84\xfc\x47\xff\x00\xb1\x72\xff\x00\xff\x00\x49\xa4\xaf\xe6\x81\
-\x7e\xfa\xfe\x1f\xca\x80\x3f\xa2\x8f\xd8\x47\xfe\x4c\xfb\xe1\x37\
-\xfd\x80\x60\xfe\xb5\xef\x2d\xda\xbc\x1b\xf6\x11\xff\x00\x93\x3e\
-\xf8\x4d\xff\x00\x60\x18\x3f\xad\x7b\xcb\x76\xa0\x0f\xe6\x0f\xe2\
-\x97\xfc\x94\x8f\x15\x7f\xd8\x56\xf3\xff\x00\x47\xbd\x7e\xd0\xff\
-\x00\xc1\x21\x3f\xe4\xd0\xe0\xff\x00\xb0\xf5\xff\x00\xfe\xd3\xaf\
-\xc5\xef\x8a\x5f\xf2\x52\x3c\x55\xff\x00\x61\x5b\xcf\xfd\x1e\xf5\
-\xfb\x43\xff\x00\x04\x84\xff\x00\x93\x43\x83\xfe\xc3\xd7\xff\x00\
-\xfb\x4e\x80\x3e\xda\x93\xee\x9a\xfe\x7a\xff\x00\xe0\xa2\xdf\xf2\
-\x7a\x5f\x14\xff\x00\xec\x23\x17\xfe\x92\xc3\x5f\xd0\xa4\x9f\x74\
-\xd7\xf3\xd7\xff\x00\x05\x16\xff\x00\x93\xd2\xf8\xa7\xff\x00\x61\
-\x18\xbf\xf4\x96\x1a\x00\xfb\x4b\xfe\x08\x83\xff\x00\x22\xff\x00\
-\xc5\x9f\xfa\xfa\xd3\x7f\xf4\x19\xab\xf5\x0d\x7e\xe8\xfa\x57\xe5\
-\xe7\xfc\x11\x07\xfe\x45\xff\x00\x8b\x3f\xf5\xf5\xa6\xff\x00\xe8\
-\x33\x57\xea\x1a\xfd\xd1\xf4\xa0\x0f\xc4\xff\x00\xf8\x2c\xb7\xfc\
-\x9d\x46\x8d\xff\x00\x62\xcd\xaf\xfe\x8f\xb8\xa4\xff\x00\x82\x34\
-\xff\x00\xc9\xd1\x6a\xff\x00\xf6\x2d\xdc\xff\x00\xe8\xd8\x69\x7f\
-\xe0\xb2\xdf\xf2\x75\x1a\x37\xfd\x8b\x36\xbf\xfa\x3e\xe2\x93\xfe\
-\x08\xd3\xff\x00\x27\x45\xab\xff\x00\xd8\xb7\x73\xff\x00\xa3\x61\
-\xa0\x0f\xdb\x2a\xfc\xbc\xff\x00\x82\xdf\x7f\xc8\x17\xe1\x4f\xfd\
-\x7c\x6a\x1f\xfa\x04\x55\xfa\x87\x5f\x97\x9f\xf0\x5b\xef\xf9\x02\
-\xfc\x29\xff\x00\xaf\x8d\x43\xff\x00\x40\x8a\x80\x3e\x24\xff\x00\
-\x82\x7a\xff\x00\xc9\xe7\x7c\x28\xff\x00\xb0\xa3\x7f\xe8\x99\x2b\
-\xfa\x1d\x4f\xba\xbf\x4a\xfe\x78\xbf\xe0\x9e\xbf\xf2\x79\xdf\x0a\
-\x3f\xec\x28\xdf\xfa\x26\x4a\xfe\x87\x53\xee\xaf\xd2\x80\x3e\x28\
-\xff\x00\x82\xbe\x7f\xc9\x9d\xdd\xff\x00\xd8\x72\xc7\xf9\xbd\x7e\
-\x27\x78\x0f\xfe\x47\x8f\x0f\xff\x00\xd8\x46\xdb\xff\x00\x46\xad\
-\x7e\xd8\xff\x00\xc1\x5f\x3f\xe4\xce\xee\xff\x00\xec\x39\x63\xfc\
-\xde\xbf\x13\xbc\x07\xff\x00\x23\xc7\x87\xff\x00\xec\x23\x6d\xff\
-\x00\xa3\x56\x80\x3f\xa8\x85\xfb\xb5\xe2\x9f\xb6\xbf\xfc\x9a\x57\
-\xc5\xef\xfb\x16\x6f\xbf\xf4\x51\xaf\x6b\x5f\xbb\x5e\x29\xfb\x6b\
-\xff\x00\xc9\xa5\x7c\x5e\xff\x00\xb1\x66\xfb\xff\x00\x45\x1a\x00\
-\xfe\x72\x1b\xef\x3f\xd4\xff\x00\x31\x5f\xd2\xd7\xec\xcf\xff\x00\
-\x26\xe5\xf0\xaf\xfe\xc5\x4d\x2b\xff\x00\x48\xe2\xaf\xe6\x95\xbe\
-\xf3\xfd\x4f\xf3\x15\xfd\x2d\x7e\xcc\xff\x00\xf2\x6e\x5f\x0a\xff\
-\x00\xec\x54\xd2\xbf\xf4\x8e\x2a\x00\xf4\xaa\x28\xa2\x80\x0a\x28\
-\xa2\x80\x0a\x28\xa2\x80\x1a\xdf\x78\x7f\x9f\x5a\xfe\x6b\x3f\x6a\
-\x4f\xf9\x39\x6f\x8a\x9f\xf6\x33\xea\x5f\xfa\x51\x25\x7f\x4a\x6d\
-\xf7\x87\xf9\xf5\xaf\xe6\xb3\xf6\xa4\xff\x00\x93\x96\xf8\xa9\xff\
-\x00\x63\x3e\xa5\xff\x00\xa5\x12\x50\x07\xea\x47\xfc\x11\x4f\xfe\
-\x4d\xc3\xc6\x5f\xf6\x36\x49\xff\x00\xa4\x96\xb5\xfa\x19\xeb\x5f\
-\x9e\x7f\xf0\x45\x3f\xf9\x37\x0f\x19\x7f\xd8\xd9\x27\xfe\x92\x5a\
-\xd7\xe8\x67\xad\x00\x7e\x0b\x7f\xc1\x56\x3f\xe4\xf6\xbc\x67\xff\
-\x00\x5e\xba\x6f\xfe\x91\xc5\x5e\xf7\xff\x00\x04\x41\xff\x00\x91\
-\xd7\xe2\xa7\xfd\x83\xac\x3f\xf4\x6c\xd5\xe0\x9f\xf0\x55\x8f\xf9\
-\x3d\xaf\x19\xff\x00\xd7\xae\x9b\xff\x00\xa4\x71\x57\xbd\xff\x00\
-\xc1\x10\x7f\xe4\x75\xf8\xa9\xff\x00\x60\xeb\x0f\xfd\x1b\x35\x00\
-\x7e\xb7\xd7\xe3\xc7\xfc\x16\xcb\xfe\x4b\x17\xc3\xef\xfb\x01\x4d\
-\xff\x00\xa5\x2d\x5f\xb0\xf5\xf8\xf1\xff\x00\x05\xb2\xff\x00\x92\
-\xc5\xf0\xfb\xfe\xc0\x53\x7f\xe9\x4b\x50\x07\x98\xff\x00\xc1\x22\
-\xff\x00\xe4\xf1\xb4\xaf\xfb\x03\xea\x1f\xfa\x2c\x57\xee\xad\x7e\
-\x15\x7f\xc1\x22\xff\x00\xe4\xf1\xb4\xaf\xfb\x03\xea\x1f\xfa\x2c\
-\x57\xee\xad\x00\x7e\x6e\x7f\xc1\x6d\xbf\xe4\x90\xfc\x3c\xff\x00\
-\xb0\xf4\xbf\xfa\x4e\x6b\xf3\x83\xf6\x33\xff\x00\x93\xa8\xf8\x57\
-\xff\x00\x63\x15\x9f\xfe\x87\x5f\xa3\xff\x00\xf0\x5b\x6f\xf9\x24\
-\x3f\x0f\x3f\xec\x3d\x2f\xfe\x93\x9a\xfc\xe0\xfd\x8c\xff\x00\xe4\
-\xea\x3e\x15\xff\x00\xd8\xc5\x67\xff\x00\xa1\xd0\x07\xf4\x82\xbd\
-\xfe\xb5\xf2\x87\xfc\x15\x0f\xfe\x4c\xaf\xc7\x9f\x5b\x3f\xfd\x2a\
-\x8e\xbe\xaf\x5e\xff\x00\x5a\xf9\x43\xfe\x0a\x87\xff\x00\x26\x57\
-\xe3\xcf\xad\x9f\xfe\x95\x47\x40\x1f\x81\x90\x7f\xae\x8f\xeb\xfd\
-\x6b\xfa\x8c\xf0\xaf\xfc\x8b\x1a\x4f\xfd\x79\xc3\xff\x00\xa0\x0a\
-\xfe\x5c\xe0\xff\x00\x5d\x1f\xd7\xfa\xd7\xf5\x19\xe1\x5f\xf9\x16\
-\x34\x9f\xfa\xf3\x87\xff\x00\x40\x14\x01\xc9\x7e\xd0\xdf\xf2\x42\
-\x7e\x23\xff\x00\xd8\xb9\x7f\xff\x00\xa4\xd2\x57\xf3\x40\xbf\x7d\
-\x7f\x0f\xe5\x5f\xd2\xff\x00\xed\x0d\xff\x00\x24\x27\xe2\x3f\xfd\
-\x8b\x97\xff\x00\xfa\x4d\x25\x7f\x34\x0b\xf7\xd7\xf0\xfe\x54\x01\
-\xfd\x14\x7e\xc2\x3f\xf2\x67\xdf\x09\xbf\xec\x03\x07\xf5\xaf\x79\
-\x6e\xd5\xe0\xdf\xb0\x8f\xfc\x99\xf7\xc2\x6f\xfb\x00\xc1\xfd\x6b\
-\xde\x5b\xb5\x00\x7f\x30\x7f\x14\xbf\xe4\xa4\x78\xab\xfe\xc2\xb7\
-\x9f\xfa\x3d\xeb\xf6\x87\xfe\x09\x09\xff\x00\x26\x87\x07\xfd\x87\
-\xaf\xff\x00\xf6\x9d\x7e\x2f\x7c\x52\xff\x00\x92\x91\xe2\xaf\xfb\
-\x0a\xde\x7f\xe8\xf7\xaf\xda\x1f\xf8\x24\x27\xfc\x9a\x1c\x1f\xf6\
-\x1e\xbf\xff\x00\xda\x74\x01\xf6\xd4\x9f\x74\xd7\xf3\xd7\xff\x00\
-\x05\x16\xff\x00\x93\xd2\xf8\xa7\xff\x00\x61\x18\xbf\xf4\x96\x1a\
-\xfe\x85\x24\xfb\xa6\xbf\x9e\xbf\xf8\x28\xb7\xfc\x9e\x97\xc5\x3f\
-\xfb\x08\xc5\xff\x00\xa4\xb0\xd0\x07\xda\x5f\xf0\x44\x1f\xf9\x17\
-\xfe\x2c\xff\x00\xd7\xd6\x9b\xff\x00\xa0\xcd\x5f\xa8\x6b\xf7\x47\
-\xd2\xbf\x2f\x3f\xe0\x88\x3f\xf2\x2f\xfc\x59\xff\x00\xaf\xad\x37\
-\xff\x00\x41\x9a\xbf\x50\xd7\xee\x8f\xa5\x00\x7e\x27\xff\x00\xc1\
-\x65\xbf\xe4\xea\x34\x6f\xfb\x16\x6d\x7f\xf4\x7d\xc5\x27\xfc\x11\
-\xa7\xfe\x4e\x8b\x57\xff\x00\xb1\x6e\xe7\xff\x00\x46\xc3\x4b\xff\
-\x00\x05\x96\xff\x00\x93\xa8\xd1\xbf\xec\x59\xb5\xff\x00\xd1\xf7\
-\x14\x9f\xf0\x46\x9f\xf9\x3a\x2d\x5f\xfe\xc5\xbb\x9f\xfd\x1b\x0d\
-\x00\x7e\xd9\x57\xe5\xe7\xfc\x16\xfb\xfe\x40\xbf\x0a\x7f\xeb\xe3\
-\x50\xff\x00\xd0\x22\xaf\xd4\x3a\xfc\xbc\xff\x00\x82\xdf\x7f\xc8\
-\x17\xe1\x4f\xfd\x7c\x6a\x1f\xfa\x04\x54\x01\xf1\x27\xfc\x13\xd7\
-\xfe\x4f\x3b\xe1\x47\xfd\x85\x1b\xff\x00\x44\xc9\x5f\xd0\xea\x7d\
-\xd5\xfa\x57\xf3\xc5\xff\x00\x04\xf5\xff\x00\x93\xce\xf8\x51\xff\
-\x00\x61\x46\xff\x00\xd1\x32\x57\xf4\x3a\x9f\x75\x7e\x94\x01\xf1\
-\x47\xfc\x15\xf3\xfe\x4c\xee\xef\xfe\xc3\x96\x3f\xcd\xeb\xf1\x3b\
-\xc0\x7f\xf2\x3c\x78\x7f\xfe\xc2\x36\xdf\xfa\x35\x6b\xf6\xc7\xfe\
-\x0a\xf9\xff\x00\x26\x77\x77\xff\x00\x61\xcb\x1f\xe6\xf5\xf8\x9d\
-\xe0\x3f\xf9\x1e\x3c\x3f\xff\x00\x61\x1b\x6f\xfd\x1a\xb4\x01\xfd\
-\x44\x2f\xdd\xaf\x14\xfd\xb5\xff\x00\xe4\xd2\xbe\x2f\x7f\xd8\xb3\
-\x7d\xff\x00\xa2\x8d\x7b\x5a\xfd\xda\xf1\x4f\xdb\x5f\xfe\x4d\x2b\
-\xe2\xf7\xfd\x8b\x37\xdf\xfa\x28\xd0\x07\xf3\x90\xdf\x79\xfe\xa7\
-\xf9\x8a\xfe\x96\xbf\x66\x7f\xf9\x37\x2f\x85\x7f\xf6\x2a\x69\x5f\
-\xfa\x47\x15\x7f\x34\xad\xf7\x9f\xea\x7f\x98\xaf\xe9\x6b\xf6\x67\
-\xff\x00\x93\x72\xf8\x57\xff\x00\x62\xa6\x95\xff\x00\xa4\x71\x50\
-\x07\xa5\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\xd6\xfb\
-\xc3\xfc\xfa\xd7\xf3\x59\xfb\x52\x7f\xc9\xcb\x7c\x54\xff\x00\xb1\
-\x9f\x52\xff\x00\xd2\x89\x2b\xfa\x53\x6f\xbc\x3f\xcf\xad\x7f\x35\
-\x9f\xb5\x27\xfc\x9c\xb7\xc5\x4f\xfb\x19\xf5\x2f\xfd\x28\x92\x80\
-\x3f\x52\x3f\xe0\x8a\x7f\xf2\x6e\x1e\x32\xff\x00\xb1\xb2\x4f\xfd\
-\x24\xb5\xaf\xd0\xcf\x5a\xfc\xf3\xff\x00\x82\x29\xff\x00\xc9\xb8\
-\x78\xcb\xfe\xc6\xc9\x3f\xf4\x92\xd6\xbf\x43\x3d\x68\x03\xf0\x5b\
-\xfe\x0a\xb1\xff\x00\x27\xb5\xe3\x3f\xfa\xf5\xd3\x7f\xf4\x8e\x2a\
-\xf7\xbf\xf8\x22\x0f\xfc\x8e\xbf\x15\x3f\xec\x1d\x61\xff\x00\xa3\
-\x66\xaf\x04\xff\x00\x82\xac\x7f\xc9\xed\x78\xcf\xfe\xbd\x74\xdf\
-\xfd\x23\x8a\xbd\xef\xfe\x08\x83\xff\x00\x23\xaf\xc5\x4f\xfb\x07\
-\x58\x7f\xe8\xd9\xa8\x03\xf5\xbe\xbf\x1e\x3f\xe0\xb6\x5f\xf2\x58\
-\xbe\x1f\x7f\xd8\x0a\x6f\xfd\x29\x6a\xfd\x87\xaf\xc7\x8f\xf8\x2d\
-\x97\xfc\x96\x2f\x87\xdf\xf6\x02\x9b\xff\x00\x4a\x5a\x80\x3c\xc7\
-\xfe\x09\x17\xff\x00\x27\x8d\xa5\x7f\xd8\x1f\x50\xff\x00\xd1\x62\
-\xbf\x75\x6b\xf0\xab\xfe\x09\x17\xff\x00\x27\x8d\xa5\x7f\xd8\x1f\
-\x50\xff\x00\xd1\x62\xbf\x75\x68\x03\xf3\x73\xfe\x0b\x6d\xff\x00\
-\x24\x87\xe1\xe7\xfd\x87\xa5\xff\x00\xd2\x73\x5f\x9c\x1f\xb1\x9f\
-\xfc\x9d\x47\xc2\xbf\xfb\x18\xac\xff\x00\xf4\x3a\xfd\x1f\xff\x00\
-\x82\xdb\x7f\xc9\x21\xf8\x79\xff\x00\x61\xe9\x7f\xf4\x9c\xd7\xe7\
-\x07\xec\x67\xff\x00\x27\x51\xf0\xaf\xfe\xc6\x2b\x3f\xfd\x0e\x80\
-\x3f\xa4\x15\xef\xf5\xaf\x94\x3f\xe0\xa8\x7f\xf2\x65\x7e\x3c\xfa\
-\xd9\xff\x00\xe9\x54\x75\xf5\x7a\xf7\xfa\xd7\xca\x1f\xf0\x54\x3f\
-\xf9\x32\xbf\x1e\x7d\x6c\xff\x00\xf4\xaa\x3a\x00\xfc\x0c\x83\xfd\
-\x74\x7f\x5f\xeb\x5f\xd4\x67\x85\x7f\xe4\x58\xd2\x7f\xeb\xce\x1f\
-\xfd\x00\x57\xf2\xe7\x07\xfa\xe8\xfe\xbf\xd6\xbf\xa8\xcf\x0a\xff\
-\x00\xc8\xb1\xa4\xff\x00\xd7\x9c\x3f\xfa\x00\xa0\x0e\x4b\xf6\x86\
-\xff\x00\x92\x13\xf1\x1f\xfe\xc5\xcb\xff\x00\xfd\x26\x92\xbf\x9a\
-\x05\xfb\xeb\xf8\x7f\x2a\xfe\x97\xff\x00\x68\x6f\xf9\x21\x3f\x11\
-\xff\x00\xec\x5c\xbf\xff\x00\xd2\x69\x2b\xf9\xa0\x5f\xbe\xbf\x87\
-\xf2\xa0\x0f\xe8\xa3\xf6\x11\xff\x00\x93\x3e\xf8\x4d\xff\x00\x60\
-\x18\x3f\xad\x7b\xcb\x76\xaf\x06\xfd\x84\x7f\xe4\xcf\xbe\x13\x7f\
-\xd8\x06\x0f\xeb\x5e\xf2\xdd\xa8\x03\xf9\x83\xf8\xa5\xff\x00\x25\
-\x23\xc5\x5f\xf6\x15\xbc\xff\x00\xd1\xef\x5f\xb4\x3f\xf0\x48\x4f\
-\xf9\x34\x38\x3f\xec\x3d\x7f\xff\x00\xb4\xeb\xf1\x7b\xe2\x97\xfc\
-\x94\x8f\x15\x7f\xd8\x56\xf3\xff\x00\x47\xbd\x7e\xd0\xff\x00\xc1\
-\x21\x3f\xe4\xd0\xe0\xff\x00\xb0\xf5\xff\x00\xfe\xd3\xa0\x0f\xb6\
-\xa4\xfb\xa6\xbf\x9e\xbf\xf8\x28\xb7\xfc\x9e\x97\xc5\x3f\xfb\x08\
-\xc5\xff\x00\xa4\xb0\xd7\xf4\x29\x27\xdd\x35\xfc\xf5\xff\x00\xc1\
-\x45\xbf\xe4\xf4\xbe\x29\xff\x00\xd8\x46\x2f\xfd\x25\x86\x80\x3e\
-\xd2\xff\x00\x82\x20\xff\x00\xc8\xbf\xf1\x67\xfe\xbe\xb4\xdf\xfd\
-\x06\x6a\xfd\x43\x5f\xba\x3e\x95\xf9\x79\xff\x00\x04\x41\xff\x00\
-\x91\x7f\xe2\xcf\xfd\x7d\x69\xbf\xfa\x0c\xd5\xfa\x86\xbf\x74\x7d\
-\x28\x03\xf1\x3f\xfe\x0b\x2d\xff\x00\x27\x51\xa3\x7f\xd8\xb3\x6b\
-\xff\x00\xa3\xee\x29\x3f\xe0\x8d\x3f\xf2\x74\x5a\xbf\xfd\x8b\x77\
-\x3f\xfa\x36\x1a\x5f\xf8\x2c\xb7\xfc\x9d\x46\x8d\xff\x00\x62\xcd\
-\xaf\xfe\x8f\xb8\xa4\xff\x00\x82\x34\xff\x00\xc9\xd1\x6a\xff\x00\
-\xf6\x2d\xdc\xff\x00\xe8\xd8\x68\x03\xf6\xca\xbf\x2f\x3f\xe0\xb7\
-\xdf\xf2\x05\xf8\x53\xff\x00\x5f\x1a\x87\xfe\x81\x15\x7e\xa1\xd7\
-\xe5\xe7\xfc\x16\xfb\xfe\x40\xbf\x0a\x7f\xeb\xe3\x50\xff\x00\xd0\
-\x22\xa0\x0f\x89\x3f\xe0\x9e\xbf\xf2\x79\xdf\x0a\x3f\xec\x28\xdf\
-\xfa\x26\x4a\xfe\x87\x53\xee\xaf\xd2\xbf\x9e\x2f\xf8\x27\xaf\xfc\
-\x9e\x77\xc2\x8f\xfb\x0a\x37\xfe\x89\x92\xbf\xa1\xd4\xfb\xab\xf4\
-\xa0\x0f\x8a\x3f\xe0\xaf\x9f\xf2\x67\x77\x7f\xf6\x1c\xb1\xfe\x6f\
-\x5f\x89\xde\x03\xff\x00\x91\xe3\xc3\xff\x00\xf6\x11\xb6\xff\x00\
-\xd1\xab\x5f\xb6\x3f\xf0\x57\xcf\xf9\x33\xbb\xbf\xfb\x0e\x58\xff\
-\x00\x37\xaf\xc4\xef\x01\xff\x00\xc8\xf1\xe1\xff\x00\xfb\x08\xdb\
-\x7f\xe8\xd5\xa0\x0f\xea\x21\x7e\xed\x78\xa7\xed\xaf\xff\x00\x26\
-\x95\xf1\x7b\xfe\xc5\x9b\xef\xfd\x14\x6b\xda\xd7\xee\xd7\x8a\x7e\
-\xda\xff\x00\xf2\x69\x5f\x17\xbf\xec\x59\xbe\xff\x00\xd1\x46\x80\
-\x3f\x9c\x86\xfb\xcf\xf5\x3f\xcc\x57\xf4\xb5\xfb\x33\xff\x00\xc9\
-\xb9\x7c\x2b\xff\x00\xb1\x53\x4a\xff\x00\xd2\x38\xab\xf9\xa5\x6f\
-\xbc\xff\x00\x53\xfc\xc5\x7f\x4b\x5f\xb3\x3f\xfc\x9b\x97\xc2\xbf\
-\xfb\x15\x34\xaf\xfd\x23\x8a\x80\x3d\x2a\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x06\xb7\xde\x1f\xe7\xd6\xbf\x9a\xcf\xda\x93\
-\xfe\x4e\x5b\xe2\xa7\xfd\x8c\xfa\x97\xfe\x94\x49\x5f\xd2\x9b\x7d\
-\xe1\xfe\x7d\x6b\xf9\xac\xfd\xa9\x3f\xe4\xe5\xbe\x2a\x7f\xd8\xcf\
-\xa9\x7f\xe9\x44\x94\x01\xfa\x91\xff\x00\x04\x53\xff\x00\x93\x70\
-\xf1\x97\xfd\x8d\x92\x7f\xe9\x25\xad\x7e\x86\x7a\xd7\xe7\x9f\xfc\
-\x11\x4f\xfe\x4d\xc3\xc6\x5f\xf6\x36\x49\xff\x00\xa4\x96\xb5\xfa\
-\x19\xeb\x40\x1f\x82\xdf\xf0\x55\x8f\xf9\x3d\xaf\x19\xff\x00\xd7\
-\xae\x9b\xff\x00\xa4\x71\x57\xbd\xff\x00\xc1\x10\x7f\xe4\x75\xf8\
-\xa9\xff\x00\x60\xeb\x0f\xfd\x1b\x35\x78\x27\xfc\x15\x63\xfe\x4f\
-\x6b\xc6\x7f\xf5\xeb\xa6\xff\x00\xe9\x1c\x55\xef\x7f\xf0\x44\x1f\
-\xf9\x1d\x7e\x2a\x7f\xd8\x3a\xc3\xff\x00\x46\xcd\x40\x1f\xad\xf5\
-\xf8\xf1\xff\x00\x05\xb2\xff\x00\x92\xc5\xf0\xfb\xfe\xc0\x53\x7f\
-\xe9\x4b\x57\xec\x3d\x7e\x3c\x7f\xc1\x6c\xbf\xe4\xb1\x7c\x3e\xff\
-\x00\xb0\x14\xdf\xfa\x52\xd4\x01\xe6\x3f\xf0\x48\xbf\xf9\x3c\x6d\
-\x2b\xfe\xc0\xfa\x87\xfe\x8b\x15\xfb\xab\x5f\x85\x5f\xf0\x48\xbf\
-\xf9\x3c\x6d\x2b\xfe\xc0\xfa\x87\xfe\x8b\x15\xfb\xab\x40\x1f\x9b\
-\x9f\xf0\x5b\x6f\xf9\x24\x3f\x0f\x3f\xec\x3d\x2f\xfe\x93\x9a\xfc\
-\xe0\xfd\x8c\xff\x00\xe4\xea\x3e\x15\xff\x00\xd8\xc5\x67\xff\x00\
-\xa1\xd7\xe8\xff\x00\xfc\x16\xdb\xfe\x49\x0f\xc3\xcf\xfb\x0f\x4b\
-\xff\x00\xa4\xe6\xbf\x38\x3f\x63\x3f\xf9\x3a\x8f\x85\x7f\xf6\x31\
-\x59\xff\x00\xe8\x74\x01\xfd\x20\xaf\x7f\xad\x7c\xa1\xff\x00\x05\
-\x43\xff\x00\x93\x2b\xf1\xe7\xd6\xcf\xff\x00\x4a\xa3\xaf\xab\xd7\
-\xbf\xd6\xbe\x50\xff\x00\x82\xa1\xff\x00\xc9\x95\xf8\xf3\xeb\x67\
-\xff\x00\xa5\x51\xd0\x07\xe0\x64\x1f\xeb\xa3\xfa\xff\x00\x5a\xfe\
-\xa3\x3c\x2b\xff\x00\x22\xc6\x93\xff\x00\x5e\x70\xff\x00\xe8\x02\
-\xbf\x97\x38\x3f\xd7\x47\xf5\xfe\xb5\xfd\x46\x78\x57\xfe\x45\x8d\
-\x27\xfe\xbc\xe1\xff\x00\xd0\x05\x00\x72\x5f\xb4\x37\xfc\x90\x9f\
-\x88\xff\x00\xf6\x2e\x5f\xff\x00\xe9\x34\x95\xfc\xd0\x2f\xdf\x5f\
-\xc3\xf9\x57\xf4\xbf\xfb\x43\x7f\xc9\x09\xf8\x8f\xff\x00\x62\xe5\
-\xff\x00\xfe\x93\x49\x5f\xcd\x02\xfd\xf5\xfc\x3f\x95\x00\x7f\x45\
-\x1f\xb0\x8f\xfc\x99\xf7\xc2\x6f\xfb\x00\xc1\xfd\x6b\xde\x5b\xb5\
-\x78\x37\xec\x23\xff\x00\x26\x7d\xf0\x9b\xfe\xc0\x30\x7f\x5a\xf7\
-\x96\xed\x40\x1f\xcc\x1f\xc5\x2f\xf9\x29\x1e\x2a\xff\x00\xb0\xad\
-\xe7\xfe\x8f\x7a\xfd\xa1\xff\x00\x82\x42\x7f\xc9\xa1\xc1\xff\x00\
-\x61\xeb\xff\x00\xfd\xa7\x5f\x8b\xdf\x14\xbf\xe4\xa4\x78\xab\xfe\
-\xc2\xb7\x9f\xfa\x3d\xeb\xf6\x87\xfe\x09\x09\xff\x00\x26\x87\x07\
-\xfd\x87\xaf\xff\x00\xf6\x9d\x00\x7d\xb5\x27\xdd\x35\xfc\xf5\xff\
-\x00\xc1\x45\xbf\xe4\xf4\xbe\x29\xff\x00\xd8\x46\x2f\xfd\x25\x86\
-\xbf\xa1\x49\x3e\xe9\xaf\xe7\xaf\xfe\x0a\x2d\xff\x00\x27\xa5\xf1\
-\x4f\xfe\xc2\x31\x7f\xe9\x2c\x34\x01\xf6\x97\xfc\x11\x07\xfe\x45\
-\xff\x00\x8b\x3f\xf5\xf5\xa6\xff\x00\xe8\x33\x57\xea\x1a\xfd\xd1\
-\xf4\xaf\xcb\xcf\xf8\x22\x0f\xfc\x8b\xff\x00\x16\x7f\xeb\xeb\x4d\
-\xff\x00\xd0\x66\xaf\xd4\x35\xfb\xa3\xe9\x40\x1f\x89\xff\x00\xf0\
-\x59\x6f\xf9\x3a\x8d\x1b\xfe\xc5\x9b\x5f\xfd\x1f\x71\x49\xff\x00\
-\x04\x69\xff\x00\x93\xa2\xd5\xff\x00\xec\x5b\xb9\xff\x00\xd1\xb0\
-\xd2\xff\x00\xc1\x65\xbf\xe4\xea\x34\x6f\xfb\x16\x6d\x7f\xf4\x7d\
-\xc5\x27\xfc\x11\xa7\xfe\x4e\x8b\x57\xff\x00\xb1\x6e\xe7\xff\x00\
-\x46\xc3\x40\x1f\xb6\x55\xf9\x79\xff\x00\x05\xbe\xff\x00\x90\x2f\
-\xc2\x9f\xfa\xf8\xd4\x3f\xf4\x08\xab\xf5\x0e\xbf\x2f\x3f\xe0\xb7\
-\xdf\xf2\x05\xf8\x53\xff\x00\x5f\x1a\x87\xfe\x81\x15\x00\x7c\x49\
-\xff\x00\x04\xf5\xff\x00\x93\xce\xf8\x51\xff\x00\x61\x46\xff\x00\
-\xd1\x32\x57\xf4\x3a\x9f\x75\x7e\x95\xfc\xf1\x7f\xc1\x3d\x7f\xe4\
-\xf3\xbe\x14\x7f\xd8\x51\xbf\xf4\x4c\x95\xfd\x0e\xa7\xdd\x5f\xa5\
-\x00\x7c\x51\xff\x00\x05\x7c\xff\x00\x93\x3b\xbb\xff\x00\xb0\xe5\
-\x8f\xf3\x7a\xfc\x4e\xf0\x1f\xfc\x8f\x1e\x1f\xff\x00\xb0\x8d\xb7\
-\xfe\x8d\x5a\xfd\xb1\xff\x00\x82\xbe\x7f\xc9\x9d\xdd\xff\x00\xd8\
-\x72\xc7\xf9\xbd\x7e\x27\x78\x0f\xfe\x47\x8f\x0f\xff\x00\xd8\x46\
-\xdb\xff\x00\x46\xad\x00\x7f\x51\x0b\xf7\x6b\xc5\x3f\x6d\x7f\xf9\
-\x34\xaf\x8b\xdf\xf6\x2c\xdf\x7f\xe8\xa3\x5e\xd6\xbf\x76\xbc\x53\
-\xf6\xd7\xff\x00\x93\x4a\xf8\xbd\xff\x00\x62\xcd\xf7\xfe\x8a\x34\
-\x01\xfc\xe4\x37\xde\x7f\xa9\xfe\x62\xbf\xa5\xaf\xd9\x9f\xfe\x4d\
-\xcb\xe1\x5f\xfd\x8a\x9a\x57\xfe\x91\xc5\x5f\xcd\x2b\x7d\xe7\xfa\
-\x9f\xe6\x2b\xfa\x5a\xfd\x99\xff\x00\xe4\xdc\xbe\x15\xff\x00\xd8\
-\xa9\xa5\x7f\xe9\x1c\x54\x01\xe9\x54\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x35\xbe\xf0\xff\x00\x3e\xb5\xfc\xd6\x7e\xd4\x9f\
-\xf2\x72\xdf\x15\x3f\xec\x67\xd4\xbf\xf4\xa2\x4a\xfe\x94\xdb\xef\
-\x0f\xf3\xeb\x5f\xcd\x67\xed\x49\xff\x00\x27\x2d\xf1\x53\xfe\xc6\
-\x7d\x4b\xff\x00\x4a\x24\xa0\x0f\xd4\x8f\xf8\x22\x9f\xfc\x9b\x87\
-\x8c\xbf\xec\x6c\x93\xff\x00\x49\x2d\x6b\xf4\x33\xd6\xbf\x3c\xff\
-\x00\xe0\x8a\x7f\xf2\x6e\x1e\x32\xff\x00\xb1\xb2\x4f\xfd\x24\xb5\
-\xaf\xd0\xcf\x5a\x00\xfc\x16\xff\x00\x82\xac\x7f\xc9\xed\x78\xcf\
-\xfe\xbd\x74\xdf\xfd\x23\x8a\xbd\xef\xfe\x08\x83\xff\x00\x23\xaf\
-\xc5\x4f\xfb\x07\x58\x7f\xe8\xd9\xab\xc1\x3f\xe0\xab\x1f\xf2\x7b\
-\x5e\x33\xff\x00\xaf\x5d\x37\xff\x00\x48\xe2\xaf\x7b\xff\x00\x82\
-\x20\xff\x00\xc8\xeb\xf1\x53\xfe\xc1\xd6\x1f\xfa\x36\x6a\x00\xfd\
-\x6f\xaf\xc7\x8f\xf8\x2d\x97\xfc\x96\x2f\x87\xdf\xf6\x02\x9b\xff\
-\x00\x4a\x5a\xbf\x61\xeb\xf1\xe3\xfe\x0b\x65\xff\x00\x25\x8b\xe1\
-\xf7\xfd\x80\xa6\xff\x00\xd2\x96\xa0\x0f\x31\xff\x00\x82\x45\xff\
-\x00\xc9\xe3\x69\x5f\xf6\x07\xd4\x3f\xf4\x58\xaf\xdd\x5a\xfc\x2a\
-\xff\x00\x82\x45\xff\x00\xc9\xe3\x69\x5f\xf6\x07\xd4\x3f\xf4\x58\
-\xaf\xdd\x5a\x00\xfc\xdc\xff\x00\x82\xdb\x7f\xc9\x21\xf8\x79\xff\
-\x00\x61\xe9\x7f\xf4\x9c\xd7\xe7\x07\xec\x67\xff\x00\x27\x51\xf0\
-\xaf\xfe\xc6\x2b\x3f\xfd\x0e\xbf\x47\xff\x00\xe0\xb6\xdf\xf2\x48\
-\x7e\x1e\x7f\xd8\x7a\x5f\xfd\x27\x35\xf9\xc1\xfb\x19\xff\x00\xc9\
-\xd4\x7c\x2b\xff\x00\xb1\x8a\xcf\xff\x00\x43\xa0\x0f\xe9\x05\x7b\
-\xfd\x6b\xe5\x0f\xf8\x2a\x1f\xfc\x99\x5f\x8f\x3e\xb6\x7f\xfa\x55\
-\x1d\x7d\x5e\xbd\xfe\xb5\xf2\x87\xfc\x15\x0b\xfe\x4c\xb3\xc7\x9c\
-\xf7\xb3\xff\x00\xd2\xa8\xe8\x03\xf0\x32\x0f\xf5\xd1\xfd\x7f\xad\
-\x7f\x51\x9e\x15\xff\x00\x91\x63\x49\xff\x00\xaf\x38\x7f\xf4\x01\
-\x5f\xcb\xa5\xb8\xcc\xf1\x01\xfd\xe0\x3f\x5a\xfe\xa2\xfc\x28\x73\
-\xe1\x7d\x23\xde\xce\x1f\xfd\x00\x50\x07\x25\xfb\x43\x7f\xc9\x09\
-\xf8\x8f\xff\x00\x62\xe5\xff\x00\xfe\x93\x49\x5f\xcd\x02\xfd\xf5\
-\xfc\x3f\x95\x7f\x4b\xff\x00\xb4\x37\xfc\x90\x9f\x88\xff\x00\xf6\
-\x2e\x5f\xff\x00\xe9\x34\x95\xfc\xd0\x2f\xdf\x5f\xc3\xf9\x50\x07\
-\xf4\x51\xfb\x08\xff\x00\xc9\x9f\x7c\x26\xff\x00\xb0\x0c\x1f\xd6\
-\xbd\xe5\xbb\x57\x83\x7e\xc2\x3f\xf2\x67\xdf\x09\xbf\xec\x03\x07\
-\xf5\xaf\x78\x6e\xdf\xe7\xb8\xa0\x0f\xe6\x13\xe2\x97\xfc\x94\x8f\
-\x15\x7f\xd8\x56\xf3\xff\x00\x47\xbd\x7e\xd0\xff\x00\xc1\x21\x3f\
-\xe4\xd0\xe0\xff\x00\xb0\xf5\xff\x00\xfe\xd3\xaf\xc5\xef\x8a\x5f\
-\xf2\x52\x3c\x57\xff\x00\x61\x5b\xcf\xfd\x1e\xf5\xfb\x43\xff\x00\
-\x04\x83\xff\x00\x93\x43\x83\xfe\xc3\xd7\xff\x00\xce\x3a\x00\xfb\
-\x6a\x4f\xba\x6b\xf9\xeb\xff\x00\x82\x8b\x7f\xc9\xe9\x7c\x53\xff\
-\x00\xb0\x8c\x5f\xfa\x4b\x0d\x7f\x42\x92\x7d\xd3\x5f\xcf\x5f\xfc\
-\x14\x5b\xfe\x4f\x4b\xe2\x9f\xfd\x84\x62\xff\x00\xd2\x58\x68\x03\
-\xed\x2f\xf8\x22\x0f\xfc\x8b\xff\x00\x16\x7f\xeb\xeb\x4d\xff\x00\
-\xd0\x66\xaf\xd4\x35\xfb\xa3\xe9\x5f\x97\x9f\xf0\x44\x1f\xf9\x17\
-\xfe\x2c\xff\x00\xd7\xd6\x9b\xff\x00\xa0\xcd\x5f\xa8\x6b\xf7\x7f\
-\x0a\x00\xfc\x4f\xff\x00\x82\xcb\x7f\xc9\xd4\x68\xdf\xf6\x2c\xda\
-\xff\x00\xe8\xfb\x8a\x4f\xf8\x23\x4f\xfc\x9d\x16\xaf\xff\x00\x62\
-\xdd\xcf\xfe\x8d\x86\x97\xfe\x0b\x2c\x73\xfb\x53\x68\xc7\xfe\xa5\
-\x9b\x5f\xfd\x1f\x71\x49\xff\x00\x04\x69\xf9\x7f\x6a\x2d\x63\x27\
-\x9f\xf8\x46\xee\x7f\xf4\x6c\x34\x01\xfb\x65\x5f\x97\x9f\xf0\x5b\
-\xef\xf9\x02\xfc\x29\xff\x00\xaf\x8d\x43\xff\x00\x40\x8a\xbf\x50\
-\xeb\xf2\xf3\xfe\x0b\x7d\xff\x00\x20\x5f\x85\x3f\xf5\xf1\xa8\x7f\
-\xe8\x11\x50\x07\xc4\x9f\xf0\x4f\x5f\xf9\x3c\xef\x85\x1f\xf6\x14\
-\x6f\xfd\x13\x25\x7f\x43\xa9\xf7\x57\xe9\x5f\xcf\x17\xfc\x13\xd7\
-\xfe\x4f\x3b\xe1\x47\xfd\x85\x1b\xff\x00\x44\xc9\x5f\xd0\xea\x7d\
-\xd5\xfa\x50\x07\xc5\x1f\xf0\x57\xcf\xf9\x33\xbb\xbf\xfb\x0e\x58\
-\xff\x00\x37\xaf\xc4\xef\x01\xff\x00\xc8\xf1\xe1\xff\x00\xfb\x08\
-\xdb\x7f\xe8\xd5\xaf\xdb\x1f\xf8\x2b\xe7\xfc\x99\xdd\xdf\xfd\x87\
-\x2c\x7f\x9b\xd7\xe2\x77\x80\xff\x00\xe4\x78\xf0\xff\x00\xfd\x84\
-\x6d\xbf\xf4\x6a\xd0\x07\xf5\x10\xbf\x76\xbc\x53\xf6\xd7\xff\x00\
-\x93\x4a\xf8\xbd\xff\x00\x62\xcd\xf7\xfe\x8a\x35\xed\x69\xf7\x6b\
-\xc5\x3f\x6d\x6f\xf9\x34\xaf\x8b\xdf\xf6\x2c\x5f\x7f\xe8\xa3\x40\
-\x1f\xce\x43\x7d\xe7\xfa\x9f\xe6\x2b\xfa\x5a\xfd\x99\xff\x00\xe4\
-\xdc\xbe\x15\xff\x00\xd8\xa9\xa5\x7f\xe9\x1c\x55\xfc\xd2\xb7\xde\
-\x73\xea\x7f\xcf\xf2\xaf\xe9\x6b\xf6\x67\x3f\xf1\x8e\x7f\x0a\xc7\
-\xfd\x4a\x9a\x57\xfe\x91\xc5\x40\x1e\x95\x45\x14\x50\x01\x45\x14\
-\x50\x01\x45\x14\x50\x03\x5b\xef\x0f\xf3\xeb\x5f\xcd\x67\xed\x49\
-\xff\x00\x27\x2d\xf1\x53\xfe\xc6\x7d\x4b\xff\x00\x4a\x24\xaf\xe9\
-\x4d\xbe\xf0\xff\x00\x3e\xb5\xfc\xd6\x7e\xd4\x9f\xf2\x72\xdf\x15\
-\x3f\xec\x67\xd4\xbf\xf4\xa2\x4a\x00\xfd\x48\xff\x00\x82\x29\xff\
-\x00\xc9\xb8\x78\xcb\xfe\xc6\xc9\x3f\xf4\x92\xd6\xbf\x43\x3d\x6b\
-\xf3\xcf\xfe\x08\xa7\xff\x00\x26\xe1\xe3\x2f\xfb\x1b\x24\xff\x00\
-\xd2\x4b\x5a\xfd\x0c\xa0\x0f\xc1\xaf\xf8\x2a\xcd\xb4\xab\xfb\x6b\
-\x78\xc1\xda\x36\x45\x7b\x3d\x35\x90\xb0\x20\x32\xfd\x92\x31\x90\
-\x4f\x04\x64\x11\xf8\x1f\x43\x5e\xf5\xff\x00\x04\x45\x82\x48\xfc\
-\x5d\xf1\x52\x62\x87\xcb\xfb\x06\x9e\x9b\xba\x7c\xc6\x49\x88\x1c\
-\xf7\xc0\xcd\x7d\xe5\xfb\x46\x7e\xc5\xbf\x0d\xbf\x6a\x09\xac\x2f\
-\x3c\x63\xa6\xcf\x1e\xb1\x60\xbe\x5d\xbe\xad\xa5\x5c\x1b\x6b\xa1\
-\x16\xed\xde\x51\x6d\xa5\x59\x33\x92\x37\x29\x2a\x59\xb6\xe3\x71\
-\x35\xd4\xfc\x07\xfd\x9c\x7c\x13\xfb\x37\x78\x48\xf8\x77\xc0\xfa\
-\x5f\xd8\x2c\x65\x71\x2d\xcc\xd2\xca\xd2\xcf\x75\x26\x08\x2f\x23\
-\xb1\x39\xeb\xc2\x80\x00\xed\x40\x1e\xa0\xad\xb9\x41\x1d\x0f\x3c\
-\x8c\x57\xe3\xcf\xfc\x16\xcb\xfe\x4b\x17\xc3\xef\xfb\x01\x4d\xff\
-\x00\xa5\x2d\x5f\xb0\xcb\xc2\x81\x5f\x8f\x3f\xf0\x5b\x2f\xf9\x2c\
-\x5f\x0f\xbf\xec\x05\x37\xfe\x94\xb5\x00\x79\x8f\xfc\x12\x2f\xfe\
-\x4f\x1b\x4a\xff\x00\xb0\x3e\xa1\xff\x00\xa2\xc5\x7e\xea\xd7\xe1\
-\x57\xfc\x12\x2f\xfe\x4f\x1b\x4a\xff\x00\xb0\x3e\xa1\xff\x00\xa2\
-\xc5\x7e\xea\xd0\x07\xe6\xe7\xfc\x16\xdb\xfe\x49\x0f\xc3\xcf\xfb\
-\x0f\x4b\xff\x00\xa4\xe6\xbf\x38\x3f\x63\x3f\xf9\x3a\x8f\x85\x7f\
-\xf6\x31\x59\xff\x00\xe8\x75\xfa\x3f\xff\x00\x05\xb6\xff\x00\x92\
-\x43\xf0\xf3\xfe\xc3\xd2\xff\x00\xe9\x39\xaf\xce\x0f\xd8\xcf\xfe\
-\x4e\xa3\xe1\x5f\xfd\x8c\x56\x7f\xfa\x1d\x00\x7f\x48\x2b\xdf\xeb\
-\x5f\x34\xff\x00\xc1\x45\x3c\x23\xab\xf8\xeb\xf6\x43\xf8\x81\xa5\
-\xe8\x56\x53\x6a\x3a\x8a\xc1\x0d\xd2\xda\xdb\xc6\x5e\x49\x12\x29\
-\xd1\xe4\xda\x00\xe4\x85\x56\x38\xef\x83\x8a\xfa\x59\x7b\xfd\x6a\
-\xb4\xf6\xad\x2b\x6e\x05\x55\xbb\x1c\x73\xff\x00\xeb\xc6\x70\x7b\
-\x64\xf0\x68\x03\xf9\x83\xf0\x4f\x83\x75\x6f\x1d\x78\xb3\x47\xd0\
-\xb4\x4b\x59\x35\x1d\x53\x52\xba\x8e\xde\xda\xde\xdd\x4b\x33\xbb\
-\x36\x07\x00\x70\x3b\x93\xd8\x02\x4f\x15\xfd\x3a\xe8\x36\x72\x69\
-\xba\x2e\x9f\x69\x2e\x0c\xb0\x5b\xc7\x13\x6d\x39\x19\x55\x00\xff\
-\x00\x2a\xc0\xd1\x3e\x12\x78\x3f\xc3\x7a\xf5\xc6\xbb\xa4\xf8\x5f\
-\x44\xd3\x75\xcb\x8f\xf5\x9a\x9d\xae\x9d\x0c\x57\x0f\xc6\xde\x5d\
-\x15\x58\xfc\xbc\x75\xe9\x5d\x7a\xae\xd5\x0b\xd7\x03\x14\x01\xe7\
-\x9f\xb4\x37\xfc\x90\x9f\x88\xdf\xf6\x2e\x5f\xff\x00\xe9\x34\x95\
-\xfc\xd0\x2f\xdf\x5f\xc3\xf9\x57\xf4\xbf\xfb\x43\x7f\xc9\x09\xf8\
-\x8f\xff\x00\x62\xe5\xff\x00\xfe\x93\x49\x5f\xcd\x02\xfd\xf5\xfc\
-\x3f\x95\x00\x7f\x45\x1f\xb0\x8f\xfc\x99\xf7\xc2\x6f\xfb\x00\xc1\
-\xfd\x6b\xdd\x64\x93\x03\xee\x92\x77\x63\x1e\xbc\x66\xbc\x2b\xf6\
-\x11\xff\x00\x93\x3e\xf8\x4d\xff\x00\x60\x18\x3f\xad\x7b\xb1\x8c\
-\xb6\x72\x7f\xfa\xe3\xe9\x40\x1f\xcd\x1f\xc7\xff\x00\x04\xeb\x5e\
-\x05\xf8\xd1\xe3\x3d\x17\x5c\xb0\x93\x4e\xd4\x21\xd5\x6e\x99\xa2\
-\x9c\x6d\xca\xb4\xcc\xc8\xe0\x9e\xaa\xc0\x82\x1b\xa1\xc8\xaf\xd9\
-\xef\xf8\x25\x67\x83\xb5\x8f\x05\xfe\xc8\xba\x2a\x6b\x16\x52\x59\
-\x49\xa9\x6a\x17\x7a\x8d\xbc\x72\x0c\x31\x82\x46\x50\x8c\x47\x6d\
-\xc1\x77\x0f\x62\x2b\xe9\x5f\x12\xfc\x2a\xf0\xa7\x8c\xf5\x2b\x5d\
-\x43\x5f\xf0\xd6\x8b\xac\xdf\xda\x92\xd6\xf7\x37\xfa\x7c\x73\xbc\
-\x47\xb6\xd2\xe0\xe3\x1f\xfd\x7e\x2b\xa8\x58\x3c\xbc\x05\x0a\xa0\
-\x0c\x00\x3a\x00\x3a\x71\x40\x0e\x63\x98\xf2\x3a\x57\xf3\xd9\xff\
-\x00\x05\x16\xff\x00\x93\xd2\xf8\xa7\xff\x00\x61\x18\xbf\xf4\x96\
-\x1a\xfe\x84\xd8\x6d\x8f\x15\xfc\xf6\x7f\xc1\x45\xbf\xe4\xf4\xbe\
-\x29\xff\x00\xd8\x46\x2f\xfd\x25\x86\x80\x3e\xd2\xff\x00\x82\x20\
-\xff\x00\xc8\xbf\xf1\x67\xfe\xbe\xb4\xdf\xfd\x06\x6a\xfd\x43\x03\
-\xe5\xfc\x2b\xf2\xf3\xfe\x08\x83\xff\x00\x22\xff\x00\xc5\x9f\xfa\
-\xfa\xd3\x7f\xf4\x19\xab\xf5\x0d\x7e\xe8\xfa\x50\x07\xe3\x6f\xfc\
-\x16\x73\xc0\xfa\xcc\x1f\x1d\x3c\x2d\xe2\x87\xb4\x6f\xec\x2b\xdd\
-\x12\x3b\x18\x6f\x3f\xe5\x9f\x9f\x0c\xb2\xb3\xc6\x5b\xa0\x6d\xb2\
-\x21\x00\x9e\x73\x47\xfc\x11\x8b\xc1\x3a\xd4\xff\x00\x1c\xbc\x53\
-\xe2\x55\xb2\x95\x74\x2b\x3d\x0d\xed\x25\xbc\x28\x7c\xbf\x3e\x49\
-\x63\x29\x18\x38\xfb\xd8\x47\x38\xec\x14\xe7\x9e\x2b\xf5\xe3\xc4\
-\x5e\x10\xd2\xfc\x5d\x63\x26\x9f\xae\x69\xb6\x5a\xd6\x9b\x2f\xfa\
-\xcb\x3d\x42\x05\x9e\x26\xeb\x83\xb1\x81\x5c\x8c\x91\x9c\x64\x83\
-\xed\x4b\xe1\xef\x07\xe9\x1e\x10\xd2\xe2\xd3\x74\x1d\x2e\xcb\x46\
-\xd3\xe2\x18\x4b\x4b\x18\x16\x08\xc6\x07\x00\x04\x00\x0e\xdc\xfb\
-\x50\x06\xca\xb0\x65\x04\x74\xaf\xcb\xdf\xf8\x2d\xf7\xfc\x81\x7e\
-\x14\xff\x00\xd7\xc6\xa1\xff\x00\xa0\x45\x5f\xa8\x6a\x36\x8c\x75\
-\xaf\xcb\xcf\xf8\x2d\xf7\xfc\x81\x7e\x14\xff\x00\xd7\xc6\xa1\xff\
-\x00\xa0\x45\x40\x1f\x12\x7f\xc1\x3d\x7f\xe4\xf3\xbe\x14\x7f\xd8\
-\x51\xbf\xf4\x4c\x95\xfd\x0e\xa7\xdd\x5f\xa5\x7f\x3c\x5f\xf0\x4f\
-\x5f\xf9\x3c\xef\x85\x1f\xf6\x14\x6f\xfd\x13\x25\x7f\x43\xa9\xf7\
-\x57\xe9\x40\x1f\x14\x7f\xc1\x5f\x3f\xe4\xce\xee\xff\x00\xec\x39\
-\x63\xfc\xde\xbf\x13\xbc\x07\xff\x00\x23\xc7\x87\xff\x00\xec\x23\
-\x6d\xff\x00\xa3\x56\xbf\x6c\x7f\xe0\xaf\x9f\xf2\x67\x77\x7f\xf6\
-\x1c\xb1\xfe\x6f\x5f\x89\xde\x03\xff\x00\x91\xe3\xc3\xff\x00\xf6\
-\x11\xb6\xff\x00\xd1\xab\x40\x1f\xd4\x3c\x7f\x77\xf1\xaf\x29\xfd\
-\xab\x7c\x35\xa9\xf8\xd3\xf6\x6c\xf8\x9f\xa1\x68\xb6\x8f\x7f\xab\
-\x5f\x78\x76\xfa\x0b\x6b\x58\xf1\xba\x59\x0c\x2d\x84\x5c\xf7\x3d\
-\xbe\xa2\xbd\x5d\x7e\xed\x46\x62\x62\xd9\x25\x48\xdd\x91\x9e\xc3\
-\x8f\xea\x33\x40\x1f\xcb\x95\xaf\x87\xf5\x2b\xed\x69\x74\x8b\x5b\
-\x0b\x8b\x9d\x56\x49\xc5\xb2\x58\xc3\x13\x34\xef\x29\x6d\xa2\x31\
-\x18\x1b\x8b\x92\x40\xda\x06\x73\xdb\x83\x5f\xd2\xdf\xc0\xff\x00\
-\x0e\xdf\xf8\x3f\xe0\xcf\x80\xb4\x1d\x52\x2f\x23\x53\xd2\xfc\x3f\
-\x61\x63\x75\x10\x20\xec\x9a\x2b\x78\xd1\xd7\x23\xae\x19\x4d\x58\
-\x87\xe1\x2f\x84\xad\xfc\x4c\xfe\x23\x8b\xc3\x3a\x34\x7e\x20\x7c\
-\xe7\x55\x5b\x08\x85\xd7\x27\x27\x32\x05\x0c\x7b\x0e\xc7\x03\x19\
-\xae\xb2\x18\xbc\x98\xd5\x7b\x28\xc0\xe9\xfd\x28\x02\x4a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x1a\xdf\x78\x7f\x9f\x5a\xfe\
-\x6b\x3f\x6a\x4f\xf9\x39\x6f\x8a\x9f\xf6\x33\xea\x5f\xfa\x51\x25\
-\x7f\x4a\x6d\xf7\x87\xf9\xf5\xaf\xe6\xb3\xf6\xa4\xff\x00\x93\x96\
-\xf8\xa9\xff\x00\x63\x3e\xa5\xff\x00\xa5\x12\x50\x07\xea\x47\xfc\
-\x11\x4f\xfe\x4d\xc3\xc6\x5f\xf6\x36\x49\xff\x00\xa4\x96\xb5\xfa\
-\x1b\x5f\x9e\x5f\xf0\x45\x3f\xf9\x37\x0f\x19\x7f\xd8\xd9\x27\xfe\
-\x92\x5a\xd7\xe8\x6d\x00\x14\x51\x45\x00\x15\xf8\xf1\xff\x00\x05\
-\xb2\xff\x00\x92\xc5\xf0\xfb\xfe\xc0\x53\x7f\xe9\x4b\x57\xec\x3d\
-\x7e\x3c\x7f\xc1\x6c\xbf\xe4\xb1\x7c\x3e\xff\x00\xb0\x14\xdf\xfa\
-\x52\xd4\x01\xe6\x3f\xf0\x48\xbf\xf9\x3c\x6d\x2b\xfe\xc0\xfa\x87\
-\xfe\x8b\x15\xfb\xab\x5f\x85\x7f\xf0\x48\xd1\xb7\xf6\xc6\xd2\x4f\
-\x50\x74\x7b\xf1\xc7\xfd\x73\x5e\xd5\xfb\xa7\xbb\xda\x80\x3f\x37\
-\x7f\xe0\xb6\xdf\xf2\x48\x7e\x1e\x7f\xd8\x7a\x5f\xfd\x27\x35\xf9\
-\xc1\xfb\x19\xff\x00\xc9\xd4\x7c\x2b\xff\x00\xb1\x8a\xcf\xff\x00\
-\x43\xaf\xd1\xef\xf8\x2d\xa3\x6e\xf8\x45\xf0\xf4\x77\xfe\xde\x97\
-\x39\xff\x00\xaf\x73\x5f\x9c\x5f\xb1\xa7\xfc\x9d\x47\xc2\xbf\xfb\
-\x18\xac\xff\x00\xf4\x3a\x00\xfe\x90\x17\xbf\xd6\x96\x91\x7b\xfd\
-\x69\x68\x00\xa2\x8a\x28\x03\xce\xff\x00\x68\x6f\xf9\x21\x3f\x11\
-\xff\x00\xec\x5c\xbf\xff\x00\xd2\x69\x2b\xf9\xa0\x5f\xbe\xbf\x87\
-\xf2\xaf\xe9\x7f\xf6\x86\xff\x00\x92\x13\xf1\x1f\xfe\xc5\xcb\xff\
-\x00\xfd\x26\x92\xbf\x9a\x05\xfb\xeb\xf8\x7f\x2a\x00\xfe\x8a\x3f\
-\x61\x1f\xf9\x33\xef\x84\xdf\xf6\x01\x83\xfa\xd7\xbd\x57\x82\xfe\
-\xc2\x3f\xf2\x67\xdf\x09\xbf\xec\x03\x07\xf5\xaf\x7a\xa0\x05\xa2\
-\x8a\x28\x01\x92\x7d\xd3\x5f\xcf\x5f\xfc\x14\x5b\xfe\x4f\x4b\xe2\
-\x9f\xfd\x84\x62\xff\x00\xd2\x58\x6b\xfa\x14\x93\xee\x9a\xfe\x7a\
-\xff\x00\xe0\xa2\xdf\xf2\x7a\x5f\x14\xff\x00\xec\x23\x17\xfe\x92\
-\xc3\x40\x1f\x69\x7f\xc1\x10\x7f\xe4\x5f\xf8\xb3\xff\x00\x5f\x5a\
-\x6f\xfe\x83\x35\x7e\xa2\x2f\xdd\x1f\x4a\xfc\xbb\xff\x00\x82\x20\
-\xff\x00\xc8\xbf\xf1\x67\xfe\xbe\xb4\xdf\xfd\x06\x6a\xfd\x44\x5f\
-\xba\x3e\x94\x00\xb4\x51\x45\x00\x15\xf9\x77\xff\x00\x05\xbe\xff\
-\x00\x90\x2f\xc2\x9f\xfa\xf8\xd4\x3f\xf4\x08\xab\xf5\x12\xbf\x2e\
-\xff\x00\xe0\xb7\xdf\xf2\x05\xf8\x53\xff\x00\x5f\x1a\x87\xfe\x81\
-\x15\x00\x7c\x49\xff\x00\x04\xf5\xff\x00\x93\xce\xf8\x51\xff\x00\
-\x61\x46\xff\x00\xd1\x32\x57\xf4\x3a\x9f\x75\x7e\x95\xfc\xf1\xff\
-\x00\xc1\x3d\x54\x8f\xdb\x3b\xe1\x49\x3f\xf4\x14\x6f\xfd\x13\x25\
-\x7f\x43\x8b\xc2\x8f\xa5\x00\x7c\x51\xff\x00\x05\x7c\xff\x00\x93\
-\x3b\xbb\xff\x00\xb0\xe5\x8f\xf3\x7a\xfc\x4e\xf0\x1f\xfc\x8f\x1e\
-\x1f\xff\x00\xb0\x8d\xb7\xfe\x8d\x5a\xfd\xb0\xff\x00\x82\xbc\x9d\
-\xff\x00\xb1\xfd\xd2\x00\x72\x75\xdb\x10\x38\xe3\xab\xd7\xe2\x7f\
-\x80\xff\x00\xe4\x78\xf0\xf7\xfd\x84\x6d\xbf\xf4\x6a\xd0\x07\xf5\
-\x10\xbf\x76\x9d\x4d\x5f\xbb\xf8\xd3\xa8\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x01\x8c\x7e\x61\xf5\xfe\
-\x86\xbf\x9a\xef\xda\x97\x8f\xda\x5b\xe2\xa7\xa7\xfc\x24\xfa\x97\
-\xfe\x94\x49\x5f\xd2\x8b\x29\x39\xe0\x1c\xfa\xd7\xe3\xb7\xed\x89\
-\xff\x00\x04\xca\xf8\xb5\xab\x7c\x76\xf1\x2f\x89\xbe\x1e\xe9\x11\
-\x78\xbb\x41\xf1\x15\xfc\xba\x96\x56\xf2\x08\x25\xb3\x79\x9c\xbc\
-\x91\xc8\xb2\xb2\xfc\xa1\x98\xed\x2b\xbb\x2a\x39\xc1\xe2\x80\x3e\
-\x80\xff\x00\x82\x2b\xa9\x87\xf6\x71\xf1\x96\xfe\x3f\xe2\xab\x94\
-\xfe\x56\x96\xbf\xe0\x6b\xf4\x32\xbe\x68\xfd\x82\x7f\x65\xfd\x43\
-\xf6\x59\xf8\x1a\x3c\x39\xad\xdd\xc3\x75\xe2\x0d\x4e\xfa\x4d\x53\
-\x52\x16\xae\x5a\x08\x64\x74\x8e\x31\x12\x1c\x0d\xdb\x63\x89\x32\
-\xd8\xe5\x8b\x63\x23\x93\xf4\xb2\xe7\x68\xc8\xc1\xc7\xae\x68\x01\
-\x68\xa2\x8a\x00\x2b\xf1\xe7\xfe\x0b\x60\xbb\xbe\x30\x7c\x3e\x23\
-\xaf\xf6\x14\xc3\x1d\xcf\xfa\x4b\x57\xec\x35\x7c\x1b\xff\x00\x05\
-\x32\xfd\x8a\x7c\x53\xfb\x4a\x47\xe1\xbf\x15\x78\x10\x45\x79\xe2\
-\x2d\x16\x29\x2c\xa6\xd2\x6e\x27\x58\x0d\xe5\xbb\x36\xf0\x62\x67\
-\xc2\x87\x57\x27\xa9\x00\x86\xce\x7e\x50\x08\x07\xe5\xbf\xec\x91\
-\xfb\x47\x2f\xec\xb3\xf1\x7a\xd7\xc7\x47\xc3\xff\x00\xf0\x93\x34\
-\x16\x73\xda\xff\x00\x67\xfd\xaf\xec\xc1\xbc\xc5\x0a\x1b\xcc\xd8\
-\xfd\x31\xe9\x5f\x73\x7f\xc3\xf1\xf1\xc7\xfc\x29\xc6\x6f\x73\xe2\
-\x50\x09\xff\x00\xc9\x4a\xf9\x32\x4f\xf8\x26\x77\xed\x2a\xce\x48\
-\xf8\x63\x31\x19\xed\xab\x69\xff\x00\xfc\x91\x49\xff\x00\x0e\xcf\
-\xfd\xa5\x7f\xe8\x98\xcf\xff\x00\x83\x7d\x3f\xff\x00\x92\x28\x03\
-\xa6\xfd\xb6\x3f\xe0\xa0\x71\xfe\xd8\x5e\x0f\xf0\xf6\x88\x7c\x0c\
-\xfe\x14\x7d\x22\xfd\xef\x84\xe3\x56\x17\x62\x52\xd1\xec\x0a\x57\
-\xc8\x8f\x1d\xf9\xcd\x79\x17\xec\x6c\xa7\xfe\x1a\xa3\xe1\x59\x03\
-\x83\xe2\x3b\x30\x07\xfd\xb4\xae\xdd\x7f\xe0\x99\xff\x00\xb4\xae\
-\xec\x9f\x86\x33\xe3\xfe\xc2\xfa\x7f\xff\x00\x24\x57\xd1\x3f\xb1\
-\x27\xfc\x13\x6b\xe2\xaf\x87\x7e\x37\x78\x73\xc5\xdf\x11\x34\x78\
-\x7c\x27\xa2\x78\x7a\xe8\x5f\x24\x52\x5f\x41\x71\x73\x77\x22\x64\
-\xac\x68\xb0\xbb\x80\xbb\x8e\x58\xb1\x04\x76\x06\x80\x3f\x5f\x57\
-\xa5\x3a\x9b\x18\x21\x06\x79\x34\xea\x00\x28\xa2\x8a\x00\xf3\xaf\
-\xda\x19\xbf\xe2\xc4\x7c\x47\xff\x00\xb1\x73\x50\xff\x00\xd2\x69\
-\x3f\xc6\xbf\x9a\x2d\x85\x59\x49\x3e\x9c\x7e\x15\xfd\x41\xf8\xe3\
-\xc2\x71\xf8\xe3\xc1\xfa\xef\x87\xae\x66\x6b\x7b\x7d\x5a\xc6\x7b\
-\x19\x25\x8f\x96\x45\x96\x36\x8c\x90\x3b\xe0\x36\x71\xea\x2b\xf1\
-\x3b\x55\xff\x00\x82\x4f\xfc\x79\xb5\xf8\x8a\xfa\x1d\x8e\x91\xa7\
-\xdd\xe8\x6b\x71\xe5\xc5\xe2\x5f\xed\x08\x96\xd3\xcb\xed\x23\x29\
-\x3e\x68\x20\x75\x51\x19\xc1\xe3\x27\xad\x00\x7e\xaa\x7e\xc2\x3f\
-\x2f\xec\x7f\xf0\x98\x63\x3f\xf1\x22\x80\x71\xf8\xd7\xbd\xd7\x11\
-\xf0\x5f\xe1\x8d\xbf\xc1\xdf\x85\x1e\x14\xf0\x55\xac\xe6\xea\x2d\
-\x0f\x4e\x86\xc4\x5c\x30\xc1\x90\xa2\xf2\xd8\xed\x96\xc9\xfc\x6b\
-\xb8\xa0\x02\x8a\x28\xa0\x06\x49\xf7\x4d\x7f\x3d\x9f\xf0\x51\x45\
-\xdd\xfb\x68\x7c\x53\x39\xff\x00\x98\x8c\x67\xff\x00\x25\xa1\x1f\
-\xce\xbf\xa1\x46\x1b\xab\xf2\x93\xf6\xfd\xff\x00\x82\x72\xfc\x4d\
-\xf8\x85\xf1\xc3\x56\xf1\xff\x00\xc3\x8d\x3a\x1f\x13\xd9\x78\x81\
-\xa3\x96\xea\xc1\xaf\x22\xb7\x9e\xd6\x75\x45\x46\x3f\xbe\x28\xad\
-\x19\x08\xa4\x7c\xd9\x04\x9e\x28\x03\x63\xfe\x08\x86\x76\xf8\x7b\
-\xe2\xc1\xeb\xfe\x95\xa6\xf7\x1f\xdd\x9f\x8a\xfd\x44\x5e\x14\x57\
-\xc7\x3f\xf0\x4e\x1f\xd9\x1f\xc4\x3f\xb2\xdf\xc3\x6d\x61\xfc\x5b\
-\x2d\xa8\xf1\x2f\x88\x66\x8a\x7b\x8b\x3b\x59\x04\x91\xda\x45\x12\
-\x10\x91\x97\x1c\x33\x12\xec\x58\xae\x46\x40\xc1\x61\xcd\x7d\x8c\
-\x28\x01\x68\xa2\x8a\x00\x2b\xf2\xf3\xfe\x0b\x78\xa5\xb4\x5f\x85\
-\x38\xe7\xfd\x23\x50\xfd\x12\x1e\x3f\x5f\xd2\xbf\x50\xeb\xe2\x1f\
-\xf8\x2a\x17\xec\xb7\xe2\xcf\xda\x3b\xe1\xce\x83\x79\xe0\x9b\x65\
-\xd5\x35\xff\x00\x0e\x5d\x4d\x33\x69\x5e\x62\xa3\xdd\x5b\xc8\x80\
-\x31\x4d\xc4\x02\xea\x55\x70\x09\x19\x19\xc6\x4e\x01\x00\xfc\x86\
-\xfd\x9a\xfe\x2c\xd9\x7c\x0b\xf8\xe5\xe1\x1f\x1d\x5f\xd9\x4f\xa9\
-\xda\xe8\x77\x66\x77\xb5\xb5\x70\x8f\x20\x31\xb2\xf0\x4f\xbb\x57\
-\xe8\xcc\xdf\xf0\x5b\xef\x0f\xc6\xa1\x60\xf8\x51\xa9\xcc\xbd\x3f\
-\x7b\xad\x46\x9f\xca\x13\x5f\x00\x43\xfb\x14\xfc\x79\xb8\x62\x13\
-\xe1\x17\x8c\x31\xd8\xbe\x93\x2a\x7f\x30\x2b\x56\xd3\xf6\x07\xfd\
-\xa1\x2f\x31\xe5\xfc\x27\xf1\x02\xe7\xfe\x7a\xc4\x91\xff\x00\xe8\
-\x4c\x28\x03\xdc\x3f\x6b\xff\x00\xf8\x29\xa5\x9f\xed\x4f\xf0\x7e\
-\xe3\xc0\x90\xfc\x3d\x9f\xc3\x3e\x65\xf4\x17\x82\xfd\xb5\x81\x73\
-\x8f\x2c\xb1\xc7\x96\x21\x4e\xb9\x1c\xe6\xbe\x31\xf0\x2c\x64\xf8\
-\xeb\xc3\xcc\x70\x01\xd4\x6d\xcf\x5f\xfa\x6a\xb5\xee\x50\xff\x00\
-\xc1\x38\x7f\x69\x0b\x8c\x6c\xf8\x5b\xa8\x2e\x7f\xe7\xa5\xed\xa2\
-\x7f\xe8\x53\x0a\xf6\x1f\xd9\xc7\xfe\x09\x6b\xf1\x87\x56\xf8\xa5\
-\xe1\xfb\x8f\x1e\xe8\x31\x78\x4f\xc2\x96\x17\x70\xdd\x5f\x4f\x71\
-\x7f\x6d\x34\xb3\x22\x1d\xc6\x28\x96\x17\x72\x19\x88\xdb\x96\xc6\
-\x32\x5b\x92\x31\x40\x1f\xb6\x2a\x72\xb9\xf7\xa7\x53\x53\x3b\x41\
-\x23\x04\xf3\x8a\x75\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x53\x3c\xc1\x9c\x77\xce\x3b\x7f\x9f\x7a\x41\x30\x6c\
-\x60\x37\xe2\x30\x7e\xbc\xd0\x04\x95\x13\x45\x9f\x7e\x73\xcf\x6f\
-\x7a\x90\x1c\x80\x7a\x52\xd0\x02\x0a\x5a\x28\xa0\x02\x8a\x28\xa0\
-\x02\x99\xe5\x8f\x98\xf4\x2d\xd7\x07\x14\xfa\x28\x01\xbb\x7d\x7f\
-\x99\xa5\xdb\xf5\xfc\xe9\x68\xa0\x06\xed\xff\x00\x39\x34\xdf\x2f\
-\x39\xcf\x39\xeb\xc9\xe6\xa4\xa2\x80\x11\x46\xd5\x03\x81\x81\x8e\
-\x05\x2d\x14\x50\x01\x45\x14\x50\x01\x51\x34\x67\x71\x23\x00\xfd\
-\x3f\x4a\x96\x8a\x00\x45\x1b\x54\x0e\xbc\x52\xd1\x45\x00\x14\x51\
-\x45\x00\x15\x1b\x47\xce\x40\x5c\xf5\xe9\x52\x51\x40\x11\xf9\x7c\
-\xf6\x03\xbf\xbd\x3c\x74\xa5\xa2\x80\x0a\x28\xa2\x80\x0a\xae\xd6\
-\xe7\x76\xe0\x7a\x12\x40\xcf\x1c\xfb\x0f\xeb\x9a\xb1\x45\x00\x47\
-\xe5\x9d\x81\x77\x64\x81\x8f\xf3\x9c\xd1\xe5\x9d\xa0\x12\x0f\xe1\
-\x52\x51\x40\x0c\x54\x2a\x31\x9c\x8e\xdc\x52\x6c\x38\xc7\x51\xde\
-\xa4\xa2\x80\x11\x46\x14\x0a\x5a\x28\xa0\x02\x8a\x29\x33\x40\x0b\
-\x45\x37\xcc\x5e\x7b\x7e\x14\xd3\x32\x8c\xe7\x38\x03\x26\x80\x24\
-\xa2\x99\xe6\x37\xfc\xf3\x6f\xd3\xfc\x68\xa0\x0c\x6f\x15\x6b\xf0\
-\x78\x4f\xc3\xda\xb6\xb5\x79\xb8\xda\x69\xf6\xb2\xdd\xcc\x10\xfc\
-\xdb\x11\x19\xdb\x1e\xe4\x2e\x07\x3d\xeb\xf1\x8f\x5b\xff\x00\x82\
-\xbd\xfc\x67\xba\xf8\x82\xda\xce\x9d\x1e\x87\x69\xe1\x85\x98\x94\
-\xf0\xdc\xd6\x22\x44\x78\xb3\x85\x12\x4e\x4f\x98\x5f\x6f\x56\x52\
-\xa3\x3f\xc3\xda\xbf\x5e\x3e\x3d\xaf\xfc\x59\x1f\x88\x39\xe7\xfe\
-\x29\xfb\xf1\xff\x00\x92\xef\x8f\xd6\xbf\x99\x96\x3f\xc8\x50\x07\
-\xf4\xdf\xf0\x67\xe2\x85\x9f\xc6\x4f\x85\xfe\x17\xf1\xae\x9f\x6d\
-\x35\xad\xa6\xb9\xa7\xc5\x7a\xb0\x4a\x41\x68\x8b\x0f\x9a\x32\x47\
-\x04\xab\x64\x67\xa1\xc6\x6b\xb6\xaf\x9f\xbf\x60\x9f\x9b\xf6\x3f\
-\xf8\x50\x47\x5f\xec\x38\xb9\x27\xa7\xcc\xdd\xbf\x0a\xfa\x05\x40\
-\x55\x00\x0c\x0a\x00\x5a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x8a\x69\x0c\x4b\x9e\xbc\
-\x81\xf9\xd4\xb5\x13\xa9\xeb\xdc\x74\x3f\x8d\x00\x7e\x37\x7c\x7e\
-\xff\x00\x82\xb3\xfc\x53\xff\x00\x85\xbd\xa9\xc1\xe0\x06\xd3\xb4\
-\x0f\x0a\x69\x37\xd2\xdb\x5b\xdb\xdd\x58\x47\x73\x2d\xe8\x46\x2a\
-\x5a\x66\x6c\x95\x0c\x41\x38\x8c\xa9\x00\xfd\xe6\xaf\xd2\x7f\xd9\
-\x1b\xe3\xfb\xfe\xd3\x1f\x03\x74\x2f\x1c\xcb\x60\xba\x4d\xed\xc1\
-\x96\xde\xf2\xd2\x23\x98\xd2\x78\x9f\x6c\x86\x32\x49\x3b\x0f\x60\
-\x79\x1f\xad\x7f\x3d\x1e\x3e\x6d\xbe\x3b\xf1\x16\x3a\x7f\x69\x5c\
-\xf1\xff\x00\x6d\x5a\xbf\x6c\xff\x00\xe0\x91\xe0\xb7\xec\x73\xa6\
-\x02\x72\x3f\xb6\x75\x00\x3f\xef\xe0\xcd\x00\x7d\x9f\xb5\xbf\xba\
-\xb4\x52\xf3\xe8\x3f\x3a\x28\x03\x84\xf8\xf5\xff\x00\x24\x47\xe2\
-\x0f\xfd\x8b\xf7\xdf\xfa\x21\xeb\xf9\x96\x6e\xa3\xe9\x5f\xd3\x47\
-\xc7\xcf\xf9\x22\x3f\x10\x7f\xec\x5f\xbf\xff\x00\xd2\x77\x35\xfc\
-\xcc\x37\x6f\xa5\x00\x7f\x44\x9f\xb0\x37\xfc\x99\xff\x00\xc2\x8f\
-\xfb\x01\xc5\xff\x00\xa1\x49\x5f\x40\xd7\xcf\x9f\xb0\x43\x6d\xfd\
-\x8f\xfe\x14\x65\x5b\x1f\xd8\x51\x73\xb4\xff\x00\x79\xeb\xe8\x2d\
-\xc3\xdf\xf2\x34\x00\xea\x29\xbb\x87\xbf\xe4\x69\x3c\xd5\xce\x33\
-\xcf\xd2\x80\x1f\x45\x44\x2e\x14\xb1\x50\x1b\x20\x85\x3f\x29\xeb\
-\x52\x50\x02\xd1\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x43\xf6\xa4\xdc\xcb\xdd\x4e\
-\x0f\x4f\x6f\xf1\xa0\x09\xa8\xa6\xf9\x83\xdf\xf2\x34\x6e\x1e\xff\
-\x00\x91\xa0\x07\x53\x1b\xa7\xe2\x3f\x9d\x2e\xe1\xef\xf9\x1a\x8e\
-\x49\x42\xe7\x21\xb8\xc1\x3c\x76\xcf\x5a\x00\xfe\x5f\x7e\x20\x7f\
-\xc8\xf5\xe2\x2f\xfb\x09\x5c\xff\x00\xe8\xd6\xaf\xdb\x6f\xf8\x24\
-\x7f\xfc\x99\xce\x97\xff\x00\x61\x9d\x43\xff\x00\x46\x0a\xfc\x4a\
-\xf8\x84\xa5\x7c\x79\xe2\x35\x60\x55\x86\xa7\x74\x08\x61\x82\x3f\
-\x7c\xd5\xfb\x6b\xff\x00\x04\x8f\xff\x00\x93\x39\xd2\xff\x00\xec\
-\x33\xa8\x7f\xe8\xc1\x40\x1f\x67\xd1\x45\x14\x01\xc2\xfc\x74\x86\
-\x5b\xbf\x83\x5e\x3c\xb6\x82\x27\x9a\x79\xb4\x1b\xf4\x8e\x34\x19\
-\x2e\xc6\xdd\xc0\x51\xef\x5f\xcc\xcb\x44\x72\xa0\x15\x3d\x3a\x1f\
-\x6a\xfe\xa7\x66\xb7\x13\x2b\x2b\x60\xa3\x0c\x15\x23\x20\xfa\x83\
-\xea\x08\xe2\xbe\x45\xf1\xc7\xfc\x12\xbf\xe0\x3f\x8e\x3c\x41\x7d\
-\xaa\xbe\x95\xaa\xe8\xef\x79\x21\x96\x5b\x4d\x2f\x51\x68\xad\x83\
-\x93\x92\xcb\x19\x07\x6e\x4e\x78\x07\x03\xb0\xa0\x0f\xc3\x9b\x1f\
-\x88\x5e\x26\xd3\x6c\xe1\xb4\xb5\xf1\x16\xab\x6b\x6b\x0a\x79\x71\
-\xc5\x05\xec\x88\xa8\xb9\x27\x01\x43\x60\x75\xa9\x3f\xe1\x66\x78\
-\xbf\xb7\x8a\xb5\xa0\x3f\xec\x23\x2f\xff\x00\x15\x5f\xb4\x5f\xf0\
-\xe7\xff\x00\x80\x5f\xdd\xf1\x37\xfe\x0d\x7f\xfb\x0a\x3f\xe1\xcf\
-\xff\x00\x00\xbf\xbb\xe2\x6f\xfc\x1a\xff\x00\xf6\x14\x01\xf8\xbb\
-\xff\x00\x0b\x37\xc6\x1f\xf4\x35\x6b\x5f\xf8\x31\x97\xff\x00\x8a\
-\xa7\x0f\x8a\x5e\x32\x18\xc7\x8b\x75\xc1\xf4\xd4\xe7\xff\x00\xe2\
-\xeb\xf6\x83\xfe\x1c\xff\x00\xf0\x0b\xfb\xbe\x26\xff\x00\xc1\xaf\
-\xff\x00\x61\x47\xfc\x39\xff\x00\xe0\x16\x7e\xef\x89\xbf\xf0\x6b\
-\xff\x00\xd8\x50\x07\x8f\x7f\xc1\x21\x7f\x68\x2f\x1c\xf8\xff\x00\
-\x54\xf1\x57\x80\x7c\x4f\xa9\xdf\xf8\x83\x46\xd2\xb4\xe8\xb5\x2b\
-\x1b\xdd\x4a\x46\x9e\x4b\x32\x64\x58\xcc\x22\x47\xc9\xd8\xca\xdb\
-\x95\x49\x18\xf2\xce\x38\x24\x8f\xd4\x05\xfb\xa3\xb5\x79\x27\xc0\
-\x3f\xd9\x93\xc0\xbf\xb3\x4f\x87\x6e\xf4\x6f\x02\x69\x42\xc2\x2b\
-\xb7\x59\x2e\xae\xae\x64\x33\x5c\xdc\xb0\x1f\x2b\x49\x21\xeb\xb7\
-\x2d\x85\x1c\x72\x7d\x6b\xd6\xd7\xee\x8c\xf5\xc5\x00\x2d\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x7c\x91\xff\x00\x05\x2e\xf8\xcf\xe2\xbf\x81\xbf\xb3\x5d\
-\xe6\xa7\xe0\xcb\xb9\x34\x9d\x57\x54\xd4\xe1\xd2\x9b\x52\x85\x4a\
-\xbd\xa4\x72\xac\x8e\xef\x1b\x02\x36\x39\xf2\xf6\x87\xea\xbb\x89\
-\x18\x62\xa4\x7d\x6f\x5c\x9f\xc4\x6f\x86\xbe\x1f\xf8\xb1\xe0\xfd\
-\x57\xc2\xde\x2a\xd3\x61\xd5\xb4\x2d\x4d\x44\x77\x36\xb2\x6e\x1b\
-\x80\x20\x82\x0a\x90\x43\x02\x01\x0c\x39\x04\x0f\x4a\x00\xfe\x6b\
-\xae\x3e\x2b\x78\xd2\xea\xe2\x59\xa7\xf1\x76\xbd\x2c\xd2\x31\x77\
-\x91\xf5\x39\x8b\x33\x13\x92\x49\x2d\xc9\x26\xa2\xff\x00\x85\x9b\
-\xe3\x0f\xfa\x1a\xb5\xbf\xfc\x18\xcb\xff\x00\xc5\x57\xed\x2c\xdf\
-\xf0\x48\x3f\x80\x32\xcc\xee\x22\xf1\x2a\x06\x62\x76\xae\xac\x48\
-\x19\xec\x32\xa4\xfe\x66\x99\xff\x00\x0e\x7f\xf8\x05\xfd\xdf\x13\
-\x7f\xe0\xd7\xff\x00\xb0\xa0\x0f\xc5\xdf\xf8\x59\xbe\x30\xff\x00\
-\xa1\xab\x5a\xff\x00\xc1\x8c\xbf\xfc\x55\x39\x7e\x27\x78\xb8\x2e\
-\x3f\xe1\x29\xd6\xbd\xbf\xe2\x61\x2f\x1c\xe7\xfb\xde\xb5\xfb\x41\
-\xff\x00\x0e\x7f\xf8\x05\xfd\xdf\x13\x7f\xe0\xd7\xff\x00\xb0\xa3\
-\xfe\x1c\xff\x00\xf0\x0b\xfb\xbe\x26\xff\x00\xc1\xaf\xff\x00\x61\
-\x40\x1f\x87\xd2\x89\x25\x26\x59\x18\xb3\xb6\x59\x99\x8f\xcc\x73\
-\xce\x79\xeb\x5f\xba\x7f\xf0\x49\x58\x24\xb6\xfd\x8e\xb4\x8d\xe8\
-\x40\x93\x57\xd4\x1d\x1b\xb3\xaf\x9b\x8c\x83\xdc\x64\x11\xf5\x06\
-\xa9\xda\x7f\xc1\x22\xfe\x01\xd9\xdc\xa4\xbf\x67\xf1\x14\xe8\xa7\
-\x26\x19\x35\x56\x0a\xfe\xc4\xaa\x83\x83\xdf\x9a\xfa\xef\xc1\x7e\
-\x09\xd1\xbe\x1e\xf8\x5f\x4d\xf0\xef\x87\x34\xe8\x34\x9d\x13\x4e\
-\x88\x41\x69\x67\x06\x76\x44\x83\xb0\xce\x49\x3c\x92\x49\x39\xcf\
-\xe7\x40\x1b\x5e\x62\xff\x00\x7a\x8a\x7e\xc1\x45\x00\x3a\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x06\x53\xa8\
-\xa2\x80\x16\x8a\x28\xa0\x0f\xff\xd9\
-\x00\x00\x13\xce\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x00\x87\x00\xc9\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x51\
-\x66\xda\xb9\xc6\x69\xab\x28\x66\x23\xa1\x1d\xb3\xfe\x7d\xff\x00\
-\x2a\x59\x06\x57\x3d\xc7\x35\xf0\x67\xfc\x14\xf7\xf6\xa8\xf8\x8f\
-\xfb\x32\xdd\x7c\x36\x5f\x00\x6a\xf0\x69\xa3\x5a\x4d\x4b\xed\xbf\
-\x68\xb3\x8a\xe3\x70\x87\xec\xdb\x31\xbc\x71\x8f\x35\xff\x00\x3a\
-\x04\x7d\xeb\x9a\x33\x5f\x86\x9e\x1d\xff\x00\x82\x99\x7e\xd3\xbe\
-\x2c\xd6\xac\xb4\x8d\x27\xc4\x56\x17\xba\x95\xe3\xf9\x56\xf6\xf1\
-\xe9\x16\x81\xa4\x7f\xee\x8c\xe0\x66\xbd\x87\xfe\x17\x97\xfc\x14\
-\x1c\xe7\x6f\x85\x35\x53\x81\x9f\xf9\x16\xed\xbf\x4f\x51\xf4\xa0\
-\x0f\xd6\xac\xd1\x9a\xfc\x94\xff\x00\x85\xe5\xff\x00\x05\x08\xc7\
-\x1e\x13\xd5\x89\xff\x00\x67\xc3\x56\xe4\x7e\x1c\x52\x7f\xc2\xf2\
-\xff\x00\x82\x85\x7f\xd0\xa3\xab\xff\x00\xe1\x33\x6f\xfe\x14\x0c\
-\xfd\x6c\xcd\x19\xaf\xc9\x3f\xf8\x5e\x5f\xf0\x50\xaf\xfa\x14\x75\
-\x7f\xfc\x26\x6d\xff\x00\xc2\x8f\xf8\x5e\x5f\xf0\x50\xaf\xfa\x14\
-\x75\x7f\xfc\x26\x6d\xff\x00\xc2\x80\x3f\x5b\x33\x46\x6b\xf2\x4f\
-\xfe\x17\x97\xfc\x14\x2b\xfe\x85\x1d\x5f\xff\x00\x09\x9b\x7f\xf0\
-\xa3\xfe\x17\x97\xfc\x14\x2b\xfe\x85\x1d\x5f\xff\x00\x09\x9b\x7f\
-\xf0\xa0\x0f\xd6\xcc\xd1\x9a\xfc\x93\xff\x00\x85\xe5\xff\x00\x05\
-\x0a\xff\x00\xa1\x47\x57\xff\x00\xc2\x66\xdf\xfc\x28\xff\x00\x85\
-\xe5\xff\x00\x05\x0a\xff\x00\xa1\x47\x57\xff\x00\xc2\x66\xdf\xfc\
-\x28\x03\xf5\xb3\x34\x66\xbf\x24\xff\x00\xe1\x79\x7f\xc1\x42\xbf\
-\xe8\x51\xd5\xff\x00\xf0\x99\xb7\xff\x00\x0a\x3f\xe1\x79\x7f\xc1\
-\x42\xbf\xe8\x51\xd5\xff\x00\xf0\x99\xb7\xff\x00\x0a\x00\xfd\x6c\
-\xcd\x19\xaf\xc9\x3f\xf8\x5e\x5f\xf0\x50\xaf\xfa\x14\x75\x7f\xfc\
-\x26\x6d\xff\x00\xc2\x8f\xf8\x5e\x5f\xf0\x50\xaf\xfa\x14\x75\x7f\
-\xfc\x26\x6d\xff\x00\xc2\x80\x3f\x5b\x33\x46\x6b\xf2\x4f\xfe\x17\
-\x97\xfc\x14\x2b\xfe\x85\x1d\x5f\xff\x00\x09\x9b\x7f\xf0\xa3\xfe\
-\x17\x97\xfc\x14\x2b\xfe\x85\x1d\x5f\xff\x00\x09\x9b\x7f\xf0\xa0\
-\x0f\xd6\xcc\xd1\x9a\xfc\x93\xff\x00\x85\xe5\xff\x00\x05\x0a\xff\
-\x00\xa1\x47\x57\xff\x00\xc2\x66\xdf\xfc\x28\xff\x00\x85\xe5\xff\
-\x00\x05\x0a\xff\x00\xa1\x47\x57\xff\x00\xc2\x66\xdf\xfc\x28\x03\
-\xf5\xb3\x34\x66\xbf\x25\x3f\xe1\x79\x7f\xc1\x42\xbf\xe8\x51\xd5\
-\xff\x00\xf0\x99\xb7\xff\x00\x0a\x4f\xf8\x5e\x9f\xf0\x50\x8e\x3f\
-\xe2\x92\xd5\xc7\x20\x73\xe1\x9b\x71\xd4\xe3\xd2\x81\x1f\xad\x99\
-\xa4\x66\xda\x32\x6b\xf1\x77\xe2\x57\xed\xc9\xfb\x64\x7c\x1d\x5b\
-\x43\xe3\x67\x1e\x19\x37\x85\x85\xb2\x6a\x3a\x25\xac\x6f\x36\xd3\
-\x86\x2a\xbd\x48\x07\x8c\x81\x8e\x6a\xe7\xec\xeb\xff\x00\x05\x1e\
-\xf8\xef\xf1\x23\xe3\xe7\xc3\xbf\x0b\x6b\xde\x26\xb1\xb9\xd1\x75\
-\xad\x7a\xd2\xc2\xf2\x18\xb4\xab\x74\x32\x44\xf2\x85\x75\x0c\x17\
-\x23\x83\xd4\x50\x07\xec\xaa\xc8\x19\xb1\xdf\x19\xf7\xa7\xd4\x71\
-\x8d\xbd\xfd\xfa\xfd\x2a\x4a\x06\x35\xfe\xeb\x7d\x2b\xf2\xbf\xfe\
-\x0b\x80\xc5\x6e\x7e\x0e\x10\x71\xfb\xbd\x6b\xeb\xff\x00\x2e\x5f\
-\x95\x7e\xa8\x3f\xdd\x6f\xa5\x7e\x57\x7f\xc1\x70\xbf\xe3\xe3\xe0\
-\xe7\xfd\x73\xd6\x7f\xf6\xca\x80\x3d\x2f\xe3\xf7\xfc\x12\xf7\xc1\
-\xff\x00\x1a\x3c\x1b\xa6\xf8\xab\xc0\x32\x5b\xf8\x23\xc6\x92\x69\
-\xf6\xf2\xc9\x00\x4c\x69\xb7\xf2\x18\x94\xe5\xd1\x46\x61\x6f\xf6\
-\xd3\x8e\x79\x53\x9c\x8f\x9f\xbe\x17\xfe\xda\x1f\x1b\xff\x00\x61\
-\x7f\x15\xc1\xe0\x1f\x8d\x3a\x16\xa3\xae\x78\x66\x16\x2b\x02\x5f\
-\x3e\xfb\xb8\xa1\x1f\x2e\xfb\x4b\xa3\x95\x9e\x21\xd9\x4b\x12\x3a\
-\x65\x70\x45\x7e\xb4\x78\x0e\x3d\xde\x07\xf0\xff\x00\xfd\x83\xad\
-\xbf\xf4\x52\xd6\x47\xc5\x6f\x83\x3e\x0e\xf8\xd5\xe1\x3b\x8f\x0e\
-\x78\xd3\x43\xb5\xd7\x74\xb9\x8e\x76\xdc\x29\x12\x44\xd8\xe1\xe3\
-\x90\x10\xe8\xc3\x27\x0c\xa4\x1e\x7d\x32\x28\x03\x37\xe0\xaf\xc7\
-\xdf\x02\xfc\x7e\xf0\xba\x6b\xbe\x09\xd7\xed\xf5\x98\x15\x55\x6e\
-\x2d\xf3\xb2\xe2\xd6\x4c\x72\x93\x42\x7e\x78\xdb\xea\x30\x7b\x12\
-\x39\xaf\x45\x8e\x45\x93\xa2\xe3\xea\x3f\xce\x3f\x1a\xfc\x8c\xf8\
-\xd5\xff\x00\x04\xf9\xf8\xb1\xfb\x27\x78\xa2\x4f\x88\x9f\x00\xf5\
-\xed\x53\x58\xd3\x2c\xf3\x2f\xd9\x6d\x98\x0d\x4e\xd6\x31\x96\x2a\
-\xd1\x01\xb6\xea\x30\x40\xc8\x55\xcf\x4f\x90\xf2\xc3\xda\xbf\x65\
-\x0f\xf8\x2a\xf7\x87\x3c\x70\xf6\xbe\x19\xf8\xbd\x1c\x1e\x0e\xf1\
-\x29\x22\x18\xf5\x95\xca\xe9\xf7\x4d\xd0\xf9\x80\xf3\x6e\xd9\xeb\
-\xbb\xe4\xe0\xf2\xbd\x28\x11\xfa\x1b\xb4\x7a\x0a\x36\x8f\x41\x50\
-\x5b\x5e\x45\x79\x04\x73\x40\xeb\x34\x52\x20\x92\x39\x23\x6d\xc8\
-\xea\x46\x41\x56\x1c\x10\x45\x4c\xad\xbb\xb1\xa0\x62\xed\x1e\x82\
-\x8d\xa3\xd0\x52\xd1\x40\x09\xb4\x7a\x0a\x36\x8f\x41\x4b\x45\x00\
-\x26\xd1\xe8\x28\xda\x3d\x05\x2d\x14\x00\x9b\x47\xa0\xa3\x68\xf4\
-\x14\xb4\x50\x02\x6d\x1e\x82\x8d\xa3\xd0\x52\xd3\x59\xb6\xe3\xbe\
-\x68\x01\x76\x8f\x41\x4d\x62\xa9\x8c\x8e\xa7\x02\x98\xd7\x00\x00\
-\x40\x27\x3f\x97\x42\x7f\xa7\x6a\xf0\x2f\xda\x7b\xf6\xd8\xf8\x71\
-\xfb\x31\xe9\x53\x45\xaf\x5f\xff\x00\x6a\x78\x99\xe3\xdf\x6d\xe1\
-\xdd\x35\xd5\xee\x9f\x23\xe5\x32\x75\x11\x2e\x71\xf3\x3f\x5c\x8c\
-\x06\xe9\x40\x1e\xe9\xaa\x6a\xf6\x5a\x2d\x8c\xd7\xd7\xf3\xc5\x67\
-\x63\x02\x99\x26\xb9\x9d\x82\x47\x12\x0e\xac\xcc\x78\x03\xde\xbf\
-\x3a\x3f\x6a\x8f\xf8\x2b\x25\x8e\x8f\x71\x37\x84\xbe\x08\x5a\x27\
-\x89\x35\x99\x9b\xec\xc7\xc4\x72\x44\x64\xb5\x8e\x42\x71\xb6\xda\
-\x30\x33\x3b\xe7\x18\x6f\xbb\xe8\x1e\xbc\x16\xeb\x58\xfd\xa3\xff\
-\x00\xe0\xa8\x5e\x26\x92\xd2\xc6\x1f\xf8\x46\xbe\x1c\xc3\x2e\xc9\
-\x12\x37\x78\xb4\xab\x5e\x79\xf3\x1c\xfc\xd7\x53\x00\x79\x1c\x81\
-\xce\x15\x2b\xf4\x1b\xf6\x59\xfd\x82\xfe\x1d\x7e\xcc\xb6\xb0\x5f\
-\x5a\x59\x8f\x11\xf8\xcc\xa6\x26\xf1\x36\xa5\x18\x69\x94\xf0\x0a\
-\xc0\x9d\x21\x5f\x42\xbf\x31\x1f\x79\x8f\x4a\x00\xf8\xcf\xe0\x37\
-\xfc\x13\x57\xe2\x1f\xed\x0b\xe2\x65\xf8\x8b\xfb\x43\xeb\xba\xad\
-\x8a\xdd\x37\x9c\x74\xbb\x89\xf7\xea\xd7\x4b\x9c\x85\x95\xce\x45\
-\xba\x60\x90\x11\x46\xe0\x38\x0b\x1d\x72\x9f\x16\xbc\x03\xe1\xdf\
-\x85\xff\x00\xf0\x54\xcf\x86\x3e\x18\xf0\xae\x8f\x6b\xa1\xe8\x96\
-\x1a\xa7\x87\x92\x0b\x3b\x44\xda\xa3\x85\xc9\x27\xab\x31\xc7\x2c\
-\xc4\x92\x79\x24\xd7\xec\x62\x42\xb0\xaf\xca\x4e\x31\x8c\x67\x8a\
-\xfc\x92\xfd\xa6\x3f\xe5\x2f\x7e\x02\xff\x00\xb0\xb7\x87\xbf\xf6\
-\x5a\x04\x7e\xb7\xaf\x6f\xa7\xf8\x53\xe9\x8b\xdb\xe9\xfe\x14\xfa\
-\x06\x35\xfe\xeb\x7d\x2b\xf2\xbb\xfe\x0b\x83\xff\x00\x1f\x1f\x07\
-\x3f\xeb\x9e\xb3\xfc\xec\xab\xf5\x45\xfe\xeb\x7d\x2b\xf2\xbb\xfe\
-\x0b\x83\xff\x00\x1f\x1f\x07\x3f\xeb\x9e\xb3\xfc\xec\xa8\x03\xf4\
-\xd7\xc0\x3f\xf2\x23\xf8\x7b\xfe\xc1\xd6\xdf\xfa\x29\x6b\x74\x8c\
-\xd6\x17\x80\x7f\xe4\x47\xf0\xf7\xfd\x83\xad\xbf\xf4\x52\xd6\xf5\
-\x00\x46\xd1\x6e\xfe\x22\x39\x04\xf2\x7f\xc6\xbe\x51\xfd\xac\x3f\
-\xe0\x9d\xff\x00\x0e\xbf\x68\xe8\xef\x35\xcb\x78\xd7\xc2\x1e\x39\
-\x93\x73\x8d\x6f\x4f\x85\x76\x5c\xc8\x46\x07\xda\x62\xe9\x27\x38\
-\xf9\x86\x1f\xa7\x27\x81\x5f\x59\x52\x32\xee\xc7\x6a\x00\xfc\x5f\
-\xf0\xef\xc5\x4f\xda\x1b\xfe\x09\x9b\xe2\xa8\x7c\x3b\xe2\xcd\x35\
-\xbc\x41\xf0\xf6\x49\x76\xc1\x6d\x24\x8d\x2e\x9f\x32\x8e\x49\xb4\
-\xb9\x23\x74\x0f\x80\x4f\x96\x78\x19\x3b\x90\x1f\x98\x7e\x98\xfe\
-\xcd\xdf\xb5\xf7\xc3\xaf\xda\x73\x45\x17\x1e\x13\xd5\x44\x7a\xbc\
-\x71\x87\xbb\xd0\x6f\x99\x63\xbd\xb5\xe8\x0e\x57\x3f\x3a\xe4\xf0\
-\xe8\x4a\x9f\x6e\x95\xea\x5e\x2d\xf0\x4e\x89\xe3\x9f\x0f\x5e\x68\
-\x7e\x21\xd2\xed\x35\xbd\x22\xf1\x3c\xb9\xec\xaf\x62\x12\x44\xea\
-\x7a\xfc\xad\xd3\xdb\x1c\x8a\xfc\xce\xfd\xa4\x7f\xe0\x97\x3e\x22\
-\xf8\x7d\xad\x0f\x1e\xfe\xcf\x5a\xb5\xf5\xad\xdd\x8c\x9f\x68\x8b\
-\x40\x17\xaf\x15\xdd\xa9\x1d\xec\xe7\x2c\x0b\x67\xfb\x8c\x79\x07\
-\x19\x3d\x08\x07\xea\x62\xc9\xb9\xb1\x8c\x53\xeb\xf2\xef\xf6\x65\
-\xff\x00\x82\xac\x6a\x1e\x15\xd6\x07\x81\xbf\x68\x1d\x2e\xeb\x4d\
-\xbf\xb5\x90\x5a\xc9\xe2\x24\xb5\x31\x4b\x03\x03\x8c\x5e\x5b\xe3\
-\x70\x3e\xae\x80\x9e\x46\x54\xe7\x23\xf4\xbf\xc3\xbe\x28\xd2\xbc\
-\x5d\xa3\x59\xea\xfa\x26\xa1\x6b\xaa\xe9\x77\x91\x89\x6d\xaf\x6c\
-\xe6\x12\xc3\x32\x9e\xea\xc3\x83\xf8\x7b\xfa\x1a\x00\xd5\xa2\x98\
-\xb2\x86\x93\x6e\x0f\x4c\xff\x00\x2f\xf1\xed\x4f\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x6b\x36\xde\xd9\xa6\x19\xb6\xae\x48\xe7\xdb\xa7\xe7\
-\x8a\x00\x7b\xb6\xd1\xd3\x35\xcf\xf8\xd3\xc7\x7a\x07\xc3\xff\x00\
-\x0d\xdd\x6b\xde\x25\xd6\x2c\xb4\x1d\x1e\xd1\x77\xcd\x7d\x7d\x32\
-\xc5\x12\xfa\x8c\xb7\x52\x7a\x00\x39\x3d\x31\x5f\x32\x7e\xd6\x5f\
-\xf0\x51\xdf\x87\xbf\xb3\xa0\xba\xd0\x6c\x0a\x78\xc3\xc7\x51\x82\
-\x3f\xb2\x2c\xe7\x5f\x26\xd1\xc0\xe3\xed\x52\x8c\x84\x39\xc7\xc8\
-\x32\xdf\x4e\x0d\x7c\x3b\xe1\x6f\x82\xff\x00\xb4\x2f\xfc\x14\xaf\
-\xc5\x76\xfe\x2a\xf1\xbe\xa7\x27\x87\x3c\x05\xe6\x6e\xb7\xba\xb8\
-\x8c\xc5\x67\x12\x1e\x0a\xd9\x5a\x92\x1a\x46\xc1\x3f\xbc\x27\x07\
-\x07\x2e\x7e\xe9\x04\x7a\x57\xed\x0d\xff\x00\x05\x3f\xf1\x5f\xc5\
-\x4f\x10\xaf\x80\xbf\x67\x9d\x22\xfd\xae\x2f\x25\xfb\x3a\xeb\x6b\
-\x68\x65\xbf\xba\xcf\xfc\xfa\xc3\x83\xe5\x8f\xfa\x68\xe3\x81\xce\
-\x17\xad\x6e\xfe\xcb\xff\x00\xf0\x4a\x39\xb5\x2d\x52\x3f\x1b\x7c\
-\x7c\xbf\x9b\x56\xd5\x2e\x1f\xed\x27\xc3\xb1\xdd\xb4\xa5\xdc\x9c\
-\xee\xbc\xb8\x07\x32\x31\xcf\x28\x87\x07\xa1\x62\x38\xaf\xb3\xbf\
-\x67\x3f\xd9\x2f\xe1\xef\xec\xc9\xa0\x8b\x2f\x08\x69\x43\xfb\x4a\
-\x55\x02\xef\x5c\xbd\x02\x4b\xdb\x9f\x50\xcf\x81\xb5\x4f\x64\x50\
-\x14\x63\xbd\x7b\x2c\x50\xf9\x7d\xf3\xd8\x76\xe2\x81\x94\x34\x3f\
-\x0c\xe9\x9e\x19\xd1\xec\xb4\x9d\x22\xc6\xdb\x4b\xd3\x2c\xe3\x11\
-\x5b\xd9\xd9\xc2\xb0\xc3\x0a\x81\x8c\x22\x28\x01\x47\xd3\x15\xa4\
-\xa9\xb7\x07\xae\x06\x29\xd4\x50\x02\x37\xdd\x35\xf9\x1b\xfb\x4c\
-\x7f\xca\x5f\x3c\x05\xff\x00\x61\x7f\x0f\x7f\xec\xb5\xfa\xe4\xdf\
-\x74\xd7\xe4\x6f\xed\x31\xff\x00\x29\x7c\xf0\x17\xfd\x85\xfc\x3d\
-\xff\x00\xb2\xd0\x07\xeb\x82\xf6\xfa\x7f\x85\x3e\x98\xbd\xbe\x9f\
-\xe1\x4f\xa0\x06\xbf\xdd\x6f\xa5\x7e\x57\x7f\xc1\x70\x7f\xe3\xe3\
-\xe0\xe7\xfd\x73\xd6\x7f\x9d\x95\x7e\xa8\xbf\xdd\x6f\xa5\x7e\x57\
-\x7f\xc1\x70\x7f\xe3\xe3\xe0\xe7\xfd\x73\xd6\x7f\x9d\x95\x00\x7e\
-\x9a\xf8\x07\xfe\x44\x7f\x0f\x7f\xd8\x3a\xdb\xff\x00\x45\x2d\x6f\
-\x56\x0f\x80\x7f\xe4\x47\xf0\xf7\xfd\x83\xad\xbf\xf4\x52\xd6\xf5\
-\x00\x14\x51\x45\x00\x23\x2e\xee\x3a\x54\x5e\x47\xfb\x58\xf4\xc0\
-\xe0\x7e\x06\xa6\xa2\x80\x3c\x03\xf6\x9a\xfd\x8b\x7e\x1b\xfe\xd3\
-\x9a\x4c\x8d\xe2\x3d\x37\xec\x5a\xfc\x69\xb6\xd7\xc4\x1a\x7a\x84\
-\xbb\x87\x8c\x00\xc7\xa4\xa9\x9e\x76\xbe\x47\xb8\xaf\xcd\xcd\x4f\
-\xc2\x7f\xb4\x77\xfc\x13\x07\xc4\xf3\x6a\x9a\x35\xcb\x78\x93\xe1\
-\xc4\xf3\xee\x96\x68\x95\xe5\xd2\xae\xb9\xe0\x4d\x10\x3b\xad\xa5\
-\x38\x03\x78\xc6\x4f\x0a\xee\x32\x2b\xf6\x81\x94\x38\xc1\xfd\x0e\
-\x0d\x56\xd4\x34\xbb\x6d\x5a\xce\x7b\x3b\xd8\x62\xbb\xb4\x9d\x1a\
-\x29\xa0\x9e\x35\x91\x24\x42\x30\xca\xca\x46\x0a\x91\xc1\x07\xa8\
-\x26\x80\x3e\x68\xfd\x94\xbf\x6f\xcf\x87\x9f\xb4\xc5\xbc\x1a\x6a\
-\xdc\xaf\x86\x3c\x70\xca\x3c\xdf\x0e\xea\x32\xa8\x79\x1b\x1c\x9b\
-\x79\x38\x13\x2f\xb7\x0e\x39\xc8\xaf\xa7\xd2\x40\xfd\x3d\x3b\x7f\
-\x2a\xfc\xe5\xfd\xaa\xbf\xe0\x93\xfa\x47\x88\x26\x9b\xc5\x7f\x05\
-\x6e\x63\xf0\xae\xbb\x13\x9b\x83\xe1\xf9\x64\x31\xd9\x4b\x27\x50\
-\x6d\xdc\x73\x6e\xd9\xc6\x07\xdd\x1d\xb6\x75\xaf\x30\xf8\x0f\xff\
-\x00\x05\x1d\xf8\x93\xfb\x36\xf8\xa0\x7c\x39\xfd\xa0\xf4\x2d\x56\
-\xf6\xde\xcb\x10\xbe\xa3\x79\x1e\xdd\x56\xd1\x06\x00\x77\xed\x73\
-\x1e\x33\x87\xce\xe6\x18\x21\x9f\xa5\x02\x3f\x5b\x29\xb2\x48\x23\
-\x52\xc4\x67\x1c\xd7\x23\xf0\xdf\xe2\xd7\x84\xbe\x2d\x78\x46\xdf\
-\xc4\xfe\x11\xd7\x2c\xf5\xdd\x0e\x65\xdc\x2e\xad\x65\x04\x21\x03\
-\x2c\xb2\x0e\xa8\xcb\xdd\x58\x02\x3d\x2b\xe3\x5f\xda\xcf\xfe\x0a\
-\xab\xe1\x1f\x85\x82\xf7\xc3\x3f\x0d\x12\xd7\xc6\xfe\x2d\x50\x62\
-\x7d\x41\x65\x0d\xa6\x59\xbe\x08\xfb\xc3\x99\xd8\x1f\xe1\x4f\x97\
-\xae\x58\x63\x04\x19\xf5\xef\xc5\xcf\x8d\xde\x0a\xf8\x1f\xe1\x59\
-\xfc\x41\xe3\x6d\x76\xdb\x43\xd3\xa1\xe1\x7c\xe3\xba\x59\x9f\x19\
-\x09\x14\x60\x16\x77\x3f\xdd\x51\x9e\xe7\x03\x9a\xfc\xc0\xf8\xc5\
-\xfb\x7a\x7c\x5f\xfd\xb0\xbc\x55\x27\xc3\xbf\x80\xfa\x26\xa9\xa2\
-\x69\x57\x59\x89\xe7\xb3\x60\x35\x0b\x98\x8e\x57\xcc\x96\x75\x3b\
-\x2d\xa3\xe4\x64\x86\xcf\x41\xbb\xa8\xaa\x9f\x09\x3f\x61\xdf\x8d\
-\x3f\xb6\xd7\x8a\x21\xf8\x87\xf1\xc3\x5e\xd4\xf4\x1f\x0f\xcd\x86\
-\x84\x5f\x28\x5b\xc9\xa1\x3f\x30\x4b\x6b\x62\x02\x5b\x42\x46\x71\
-\x95\x1d\x46\x11\x81\x2d\x5f\xa8\x7f\x05\xfe\x03\xf8\x1b\xe0\x2f\
-\x85\xa3\xd0\x3c\x0f\xa0\x5b\xe8\x96\x58\x56\x99\xd0\x6e\x9e\xe5\
-\xf1\x8d\xf3\x4a\x7e\x69\x1b\xfd\xe3\x81\xd0\x00\x38\xa0\x0f\x8f\
-\xbf\x64\xdf\xf8\x25\x47\x86\x3e\x1d\xb5\xaf\x89\x3e\x2b\x4f\x6f\
-\xe3\x4f\x13\x65\x66\x8f\x49\x8f\x2d\xa6\x5a\xb0\xe4\xef\x07\x1f\
-\x68\x6c\x9e\x4b\x00\x99\x27\xe5\x39\xcd\x7d\xfb\x6f\x67\x1d\xac\
-\x69\x1c\x0a\x21\x89\x14\x22\x44\x83\x08\xa0\x70\x00\x03\xa0\x03\
-\x80\x05\x4a\xb1\x85\x6d\xdd\xc8\xe7\xde\x9f\x40\x0d\x55\xdb\xef\
-\xf5\xa7\x51\x45\x00\x14\x51\x45\x00\x23\x7d\xd3\x5f\x91\xbf\xb4\
-\xc7\xfc\xa5\xf3\xc0\x5f\xf6\x17\xf0\xf7\xfe\xcb\x5f\xae\x4d\xf7\
-\x4d\x7e\x46\xfe\xd3\x1f\xf2\x97\xcf\x01\x7f\xd8\x5f\xc3\xdf\xfb\
-\x2d\x00\x7e\xb8\x2f\x6f\xa7\xf8\x53\xe9\x8b\xdb\xe9\xfe\x14\xfa\
-\x00\x6b\xfd\xd6\xfa\x57\xe5\x77\xfc\x17\x07\xfe\x3e\x3e\x0e\x7f\
-\xd7\x3d\x67\xf9\xd9\x57\xea\x8b\xfd\xd6\xfa\x57\xe5\x77\xfc\x17\
-\x07\xfe\x3e\x3e\x0e\x7f\xd7\x3d\x67\xf9\xd9\x50\x07\xe9\xaf\x80\
-\x7f\xe4\x47\xf0\xf7\xfd\x83\xad\xbf\xf4\x52\xd6\xf5\x60\xf8\x07\
-\xfe\x44\x7f\x0f\x7f\xd8\x3a\xdb\xff\x00\x45\x2d\x6f\x50\x01\x45\
-\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x03\x59\x77\x74\x38\xf7\
-\xaf\x30\xf8\xe9\xfb\x37\xf8\x07\xf6\x88\xf0\xc7\xf6\x2f\x8d\xb4\
-\x28\x75\x15\x5c\xfd\x9a\xfe\x3c\x45\x77\x64\xc7\xf8\xe1\x98\x7c\
-\xc8\x7d\xb9\x53\xdd\x48\xaf\x51\xa4\x23\x3f\xd2\x80\x3f\x1c\x7e\
-\x23\x7f\xc1\x2f\xfe\x38\xfc\x37\xf1\x65\xce\x81\xf0\xcb\xc4\x33\
-\xeb\x7e\x0c\xf1\x33\x7d\x96\xf2\xee\x3b\xe3\x63\xb6\x1c\xe4\x25\
-\xf4\x4a\xdb\x5d\x17\x6f\x55\x0c\x09\x3d\x06\x78\xfb\x23\xf6\x4e\
-\xff\x00\x82\x6b\xf8\x07\xf6\x7b\x7b\x2d\x7b\x5f\x58\xfc\x6b\xe3\
-\x94\x1e\x60\xd4\x2f\x23\xcd\xb5\x93\x0c\x60\x5b\xc4\x72\x32\x3b\
-\x3b\x92\xdc\x71\x8e\xdf\x61\x35\xb8\x67\x0c\x4f\x23\xa6\x46\x7f\
-\xcf\xe1\x4f\x55\xdb\xff\x00\xd7\xa0\x08\xd6\xdf\x66\x70\xd9\xf7\
-\xc7\xf9\x1f\xa5\x48\xaa\x47\x53\x9a\x75\x14\x00\x51\x45\x14\x00\
-\x51\x45\x14\x00\x51\x45\x14\x00\x8d\xf7\x4d\x7e\x46\xfe\xd3\x1f\
-\xf2\x97\xcf\x01\x7f\xd8\x5f\xc3\xdf\xfb\x2d\x7e\xb9\x37\xdd\x35\
-\xf9\x1b\xfb\x4c\x7f\xca\x5f\x3c\x05\xff\x00\x61\x7f\x0f\x7f\xec\
-\xb4\x01\xfa\xe0\xbd\xbe\x9f\xe1\x4f\xa6\x2f\x6f\xa7\xf8\x53\xe8\
-\x01\xaf\xf7\x5b\xe9\x5f\x95\xdf\xf0\x5c\x1f\xf8\xf8\xf8\x39\xff\
-\x00\x5c\xf5\x9f\xe7\x65\x5f\xaa\x2f\xf7\x5b\xe9\x5f\x95\xdf\xf0\
-\x5c\x1f\xf8\xf8\xf8\x39\xff\x00\x5c\xf5\x9f\xe7\x65\x40\x1f\xa6\
-\xbe\x01\xff\x00\x91\x1f\xc3\xdf\xf6\x0e\xb6\xff\x00\xd1\x4b\x5b\
-\xd5\x83\xe0\x1f\xf9\x11\xfc\x3d\xff\x00\x60\xeb\x6f\xfd\x14\xb5\
-\xbd\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x08\xdf\x74\xd7\xe4\x6f\xed\x31\xff\x00\
-\x29\x7c\xf0\x17\xfd\x85\xfc\x3d\xff\x00\xb2\xd7\xeb\x93\x7d\xd3\
-\x5f\x91\xbf\xb4\xc7\xfc\xa5\xf3\xc0\x5f\xf6\x17\xf0\xf7\xfe\xcb\
-\x40\x1f\xae\x0b\xdb\xe9\xfe\x14\xfa\x62\xf6\xfa\x7f\x85\x3e\x80\
-\x1a\xff\x00\x75\xbe\x95\xf9\x5d\xff\x00\x05\xc1\xff\x00\x8f\x8f\
-\x83\x9f\xf5\xcf\x59\xfe\x76\x55\xfa\xa2\xff\x00\x75\xbe\x95\xf9\
-\x5d\xff\x00\x05\xc1\xff\x00\x8f\x8f\x83\x9f\xf5\xcf\x59\xfe\x76\
-\x54\x01\xfa\x6b\xe0\x1f\xf9\x11\xfc\x3d\xff\x00\x60\xeb\x6f\xfd\
-\x14\xb5\xbd\x58\x3e\x01\xff\x00\x91\x1f\xc3\xdf\xf6\x0e\xb6\xff\
-\x00\xd1\x4b\x5b\xd4\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x8d\xf7\x4d\x7e\x46\xfe\
-\xd3\x1f\xf2\x97\xcf\x01\x7f\xd8\x5f\xc3\xdf\xfb\x2d\x7e\xb9\x37\
-\xdd\x35\xf9\x1b\xfb\x4c\x7f\xca\x5f\x3c\x05\xff\x00\x61\x7f\x0f\
-\x7f\xec\xb4\x01\xfa\xe0\xbd\xbe\x9f\xe1\x4f\xa6\x2f\x6f\xa7\xf8\
-\x53\xe8\x01\xaf\xf7\x5b\xe9\x5f\x95\xdf\xf0\x5c\x05\x2d\x71\xf0\
-\x73\x83\x8f\x2f\x59\xc9\xc7\x4e\x6c\xab\xf5\x42\x43\xf2\xe3\xd7\
-\x8a\xf8\x2f\xfe\x0a\x7f\xfb\x2a\xfc\x46\xfd\xa7\x2e\xbe\x1b\x37\
-\x80\x34\x78\x35\x21\xa2\xae\xa2\x6f\x3e\xd1\x7b\x1d\xb9\x4f\x38\
-\xdb\x79\x78\xde\x79\xcf\x94\xff\x00\x95\x00\x7d\xad\xe0\x19\x07\
-\xfc\x21\x3e\x1f\x52\x40\x23\x4f\xb7\xef\xd7\xf7\x49\xfe\x22\xba\
-\x0d\xc3\xd4\x57\xe4\x75\xa7\xc0\x3f\xf8\x28\x1d\x8d\xac\x36\xf6\
-\xfe\x29\xd5\x61\x86\x18\xd6\x38\xe3\x4f\x13\x5b\x85\x55\x51\x80\
-\x00\xcf\x03\x00\x7e\x55\x2f\xfc\x28\xdf\xf8\x28\x57\xfd\x0d\xda\
-\xbf\xfe\x14\xd6\xff\x00\xe3\x40\x1f\xad\x9b\x87\xa8\xa3\x70\xf5\
-\x15\xf9\x27\xff\x00\x0a\x37\xfe\x0a\x15\xff\x00\x43\x76\xaf\xff\
-\x00\x85\x35\xbf\xf8\xd1\xff\x00\x0a\x37\xfe\x0a\x15\xff\x00\x43\
-\x76\xaf\xff\x00\x85\x35\xbf\xf8\xd0\x07\xeb\x66\xe1\xea\x28\xdc\
-\x3d\x45\x7e\x49\xff\x00\xc2\x8d\xff\x00\x82\x85\x7f\xd0\xdd\xab\
-\xff\x00\xe1\x4d\x6f\xfe\x34\x7f\xc2\x8d\xff\x00\x82\x85\x7f\xd0\
-\xdd\xab\xff\x00\xe1\x4d\x6f\xfe\x34\x01\xfa\xd9\xb8\x7a\x8a\x37\
-\x0f\x51\x5f\x92\x7f\xf0\xa3\x7f\xe0\xa1\x5f\xf4\x37\x6a\xff\x00\
-\xf8\x53\x5b\xff\x00\x8d\x1f\xf0\xa3\x7f\xe0\xa1\x5f\xf4\x37\x6a\
-\xff\x00\xf8\x53\x5b\xff\x00\x8d\x00\x7e\xb6\x6e\x1e\xa2\x8d\xc3\
-\xd4\x57\xe4\x9f\xfc\x28\xdf\xf8\x28\x57\xfd\x0d\xda\xbf\xfe\x14\
-\xd6\xff\x00\xe3\x47\xfc\x28\xdf\xf8\x28\x57\xfd\x0d\xda\xbf\xfe\
-\x14\xd6\xff\x00\xe3\x40\x1f\xad\x9b\x87\xa8\xa3\x70\xf5\x15\xf9\
-\x27\xff\x00\x0a\x37\xfe\x0a\x15\xff\x00\x43\x76\xaf\xff\x00\x85\
-\x35\xbf\xf8\xd1\xff\x00\x0a\x37\xfe\x0a\x15\xff\x00\x43\x76\xaf\
-\xff\x00\x85\x35\xbf\xf8\xd0\x07\xeb\x66\xe1\xea\x28\xdc\x3d\x45\
-\x7e\x49\xff\x00\xc2\x8d\xff\x00\x82\x85\x7f\xd0\xdd\xab\xff\x00\
-\xe1\x4d\x6f\xfe\x34\x7f\xc2\x8d\xff\x00\x82\x85\x7f\xd0\xdd\xab\
-\xff\x00\xe1\x4d\x6f\xfe\x34\x01\xfa\xd9\xb8\x7a\x8a\x37\x0f\x51\
-\x5f\x92\x7f\xf0\xa3\x7f\xe0\xa1\x5f\xf4\x37\x6a\xff\x00\xf8\x53\
-\x5b\xff\x00\x8d\x1f\xf0\xa3\x7f\xe0\xa1\x5f\xf4\x37\x6a\xff\x00\
-\xf8\x53\x5b\xff\x00\x8d\x00\x7e\xb6\x6e\x1e\xa2\x8d\xc3\xd4\x57\
-\xe4\x9f\xfc\x28\xdf\xf8\x28\x57\xfd\x0d\xda\xbf\xfe\x14\xd6\xff\
-\x00\xe3\x47\xfc\x28\xdf\xf8\x28\x57\xfd\x0d\xda\xbf\xfe\x14\xd6\
-\xff\x00\xe3\x40\x1f\xad\x9b\x87\xa8\xa3\x70\xf5\x15\xf9\x27\xff\
-\x00\x0a\x37\xfe\x0a\x15\xff\x00\x43\x76\xaf\xff\x00\x85\x35\xbf\
-\xf8\xd1\xff\x00\x0a\x37\xfe\x0a\x15\xff\x00\x43\x76\xaf\xff\x00\
-\x85\x35\xbf\xf8\xd0\x07\xeb\x5b\x30\xc7\x5a\xfc\x8d\xfd\xa5\x98\
-\x37\xfc\x15\xeb\xc0\x3e\xbf\xda\xde\x1e\xe3\xf0\x5f\xf1\xa9\xff\
-\x00\xe1\x46\xff\x00\xc1\x42\x7b\xf8\xb7\x57\x3f\xf7\x33\x5b\xff\
-\x00\x8d\x54\xf8\x5f\xfb\x11\xfe\xd3\x73\x7e\xd3\xde\x01\xf8\x91\
-\xf1\x22\xcd\x75\x65\xd2\xf5\xbb\x1b\xad\x43\x52\xba\xd6\xad\xe6\
-\x95\x6d\xe1\x75\xec\x18\x67\x0a\x3a\x0e\x68\x03\xf5\xd5\x7b\x7d\
-\x3f\xc2\x9f\x51\xc6\xdb\xbb\x1f\xca\xa4\xa0\x06\xb2\xee\x5c\x74\
-\xa6\xac\x41\x58\xb7\x19\x3d\xf1\xfe\x7d\xff\x00\x3a\x28\xa0\x07\
-\xe2\x8c\x51\x45\x00\x18\xa3\x14\x51\x40\x06\x28\xc5\x14\x50\x01\
-\x8a\x31\x45\x14\x00\x62\x8c\x51\x45\x00\x18\xa3\x14\x51\x40\x06\
-\x28\xc5\x14\x50\x01\x8a\x31\x45\x14\x00\x62\x8c\x51\x45\x00\x18\
-\xa3\x14\x51\x40\x06\x29\x19\x03\x0c\x1e\x94\x51\x40\x08\xb1\x85\
-\x39\xea\x7a\x67\xbf\xf9\xe2\x9f\x45\x14\x01\xff\xd9\
-\x00\x00\x0f\xca\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x00\x8c\x00\x9d\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x53\
-\xa2\x8a\x6f\x98\xa3\xaf\x1f\x85\x00\x3a\x8a\x67\x98\xbe\xbf\xa5\
-\x1e\x62\xfa\xfe\x94\x00\xfa\x29\x9e\x62\xfa\xfe\x94\x79\x8b\xeb\
-\xfa\x50\x03\xe8\xa6\x79\x8b\xeb\xfa\x51\xe6\x2f\xaf\xe9\x40\x0f\
-\xa2\x99\xe6\x2f\xaf\xe9\x47\x98\xbe\xbf\xa5\x00\x3e\x8a\x67\x98\
-\xbe\xbf\xa5\x1e\x62\xfa\xfe\x94\x00\xfa\x29\x9e\x62\xfa\xfe\x94\
-\x79\x8b\xeb\xfa\x50\x03\xe8\xa6\x79\x8b\xeb\xfa\x51\xe6\x2f\xaf\
-\xe9\x40\x0f\xa2\x99\xe6\x2f\xaf\xe9\x47\x98\xbe\xbf\xa5\x00\x3e\
-\x8a\x61\x95\x46\x32\x71\x9e\x83\x1c\x9e\xfd\x29\xd4\x00\xb5\xf9\
-\xf7\xfb\x63\x7f\xc1\x3d\xfe\x23\xfe\xd0\xdf\x1b\xaf\x7c\x67\xe1\
-\xbf\x1c\x69\x7a\x0e\x9b\x3d\x9d\xbd\xb2\xda\x5d\x4d\x74\xae\xac\
-\x8b\xb5\x9b\xf7\x43\x6f\x3d\x6b\xf4\x12\x93\xeb\x40\x1f\x91\xbf\
-\xf0\xe8\x5f\x8c\xff\x00\xf4\x55\x34\x3f\xfc\x08\xbf\xff\x00\x0a\
-\x3f\xe1\xd0\xbf\x19\xff\x00\xe8\xaa\x68\x7f\xf8\x11\x7f\xfe\x15\
-\xfa\xe5\x45\x00\x7e\x46\xff\x00\xc3\xa1\x7e\x33\xff\x00\xd1\x54\
-\xd0\xff\x00\xf0\x22\xff\x00\xfc\x28\xff\x00\x87\x42\xfc\x67\xff\
-\x00\xa2\xa9\xa1\xff\x00\xe0\x45\xff\x00\xf8\x57\xeb\x95\x14\x01\
-\xf9\x1b\xff\x00\x0e\x85\xf8\xcf\xff\x00\x45\x53\x43\xff\x00\xc0\
-\x8b\xff\x00\xf0\xa3\xfe\x1d\x0b\xf1\x9f\xfe\x8a\xa6\x87\xff\x00\
-\x81\x17\xff\x00\xe1\x5f\xae\x54\x50\x07\xe4\x6f\xfc\x3a\x17\xe3\
-\x3f\xfd\x15\x4d\x0f\xff\x00\x02\x2f\xff\x00\xc2\x8f\xf8\x74\x2f\
-\xc6\x7f\xfa\x2a\x9a\x1f\xfe\x04\x5f\xff\x00\x85\x7e\xb9\x51\x40\
-\x1f\x91\xbf\xf0\xe8\x5f\x8c\xff\x00\xf4\x55\x34\x3f\xfc\x08\xbf\
-\xff\x00\x0a\x3f\xe1\xd0\xbf\x19\xff\x00\xe8\xaa\x68\x7f\xf8\x11\
-\x7f\xfe\x15\xfa\xe5\x45\x00\x7e\x46\xff\x00\xc3\xa1\x7e\x33\xff\
-\x00\xd1\x54\xd0\xff\x00\xf0\x22\xff\x00\xfc\x28\xff\x00\x87\x42\
-\xfc\x67\xff\x00\xa2\xa9\xa1\xff\x00\xe0\x45\xff\x00\xf8\x57\xeb\
-\x95\x14\x01\xf9\x1b\xff\x00\x0e\x85\xf8\xcf\xff\x00\x45\x53\x43\
-\xff\x00\xc0\x8b\xff\x00\xf0\xa3\xfe\x1d\x0b\xf1\x9f\xfe\x8a\xa6\
-\x87\xff\x00\x81\x17\xff\x00\xe1\x5f\xae\x54\x50\x07\xe4\x6f\xfc\
-\x3a\x17\xe3\x3f\xfd\x15\x4d\x0f\xff\x00\x02\x2f\xff\x00\xc2\x8f\
-\xf8\x74\x2f\xc6\x7f\xfa\x2a\x9a\x1f\xfe\x04\x5f\xff\x00\x85\x7e\
-\xb9\x51\x40\x1f\x9a\x3f\xb3\xd7\xfc\x13\x37\xe2\xa7\xc2\x3f\x8d\
-\x9e\x10\xf1\x7e\xb1\xf1\x0b\x49\xd5\x34\x7d\x1e\xf9\x6e\xae\x6c\
-\xe1\x9e\xf0\xbc\xca\x15\x86\xd5\x0e\xbb\x4f\xde\xef\xe9\x5f\xa5\
-\xcb\xd0\x51\x4b\x40\x05\x37\x78\x1d\xe9\xd5\xf9\xfb\xfb\x61\x78\
-\xbb\xf6\xc2\xd1\xbe\x36\x5f\x5b\x7c\x1a\xb3\xd4\xa5\xf0\x38\xb3\
-\xb7\x68\x8d\xae\x95\x61\x32\x19\xb6\xfe\xfb\xe7\x99\x77\xfd\xef\
-\x7f\xa5\x00\x7e\x80\xee\x14\x6e\x15\xf9\x23\xff\x00\x0b\x13\xfe\
-\x0a\x37\xff\x00\x40\xfd\x6f\xff\x00\x04\x3a\x4f\xff\x00\x11\x47\
-\xfc\x2c\x4f\xf8\x28\xdf\xfd\x03\xf5\xbf\xfc\x10\xe9\x3f\xfc\x45\
-\x02\xb9\xfa\xdd\xb8\x51\xb8\x57\xe4\x8f\xfc\x2c\x4f\xf8\x28\xdf\
-\xfd\x03\xf5\xbf\xfc\x10\xe9\x3f\xfc\x45\x1f\xf0\xb1\x3f\xe0\xa3\
-\x7f\xf4\x0f\xd6\xff\x00\xf0\x43\xa4\xff\x00\xf1\x14\x05\xcf\xd6\
-\xed\xc2\x8d\xc2\xbf\x24\x7f\xe1\x62\x7f\xc1\x46\xff\x00\xe8\x1f\
-\xad\xff\x00\xe0\x87\x49\xff\x00\xe2\x28\xff\x00\x85\x89\xff\x00\
-\x05\x1b\xff\x00\xa0\x7e\xb7\xff\x00\x82\x1d\x27\xff\x00\x88\xa0\
-\x2e\x7e\xb7\x6e\x14\x6e\x15\xf9\x23\xff\x00\x0b\x13\xfe\x0a\x37\
-\xff\x00\x40\xfd\x6f\xff\x00\x04\x3a\x4f\xff\x00\x11\x47\xfc\x2c\
-\x4f\xf8\x28\xdf\xfd\x03\xf5\xbf\xfc\x10\xe9\x3f\xfc\x45\x01\x73\
-\xf5\xbb\x70\xa3\x70\xaf\xc9\x1f\xf8\x58\x9f\xf0\x51\xbf\xfa\x07\
-\xeb\x7f\xf8\x21\xd2\x7f\xf8\x8a\x3f\xe1\x62\x7f\xc1\x46\xff\x00\
-\xe8\x1f\xad\xff\x00\xe0\x87\x49\xff\x00\xe2\x28\x0b\x9f\xad\xdb\
-\x85\x1b\x85\x7e\x48\xff\x00\xc2\xc4\xff\x00\x82\x8d\xff\x00\xd0\
-\x3f\x5b\xff\x00\xc1\x0e\x93\xff\x00\xc4\x51\xff\x00\x0b\x13\xfe\
-\x0a\x37\xff\x00\x40\xfd\x6f\xff\x00\x04\x3a\x4f\xff\x00\x11\x40\
-\x5c\xfd\x6e\xdc\x28\xdc\x2b\xf2\x47\xfe\x16\x27\xfc\x14\x6f\xfe\
-\x81\xfa\xdf\xfe\x08\x74\x9f\xfe\x22\x8f\xf8\x58\x9f\xf0\x51\xbf\
-\xfa\x07\xeb\x7f\xf8\x21\xd2\x7f\xf8\x8a\x02\xe7\xeb\x76\xe1\x46\
-\xe1\x5f\x92\x3f\xf0\xb1\x3f\xe0\xa3\x7f\xf4\x0f\xd6\xff\x00\xf0\
-\x43\xa4\xff\x00\xf1\x14\x7f\xc2\xc4\xff\x00\x82\x8d\xff\x00\xd0\
-\x3f\x5b\xff\x00\xc1\x0e\x93\xff\x00\xc4\x50\x17\x3f\x5b\x77\x0e\
-\x99\xa7\x57\xe6\x8f\xec\xfb\xe3\x6f\xdb\x93\x51\xf8\xd7\xe0\xf8\
-\x3e\x22\xda\xea\xd1\x78\x2a\x5b\xe5\x5d\x54\xdc\x68\xfa\x6c\x29\
-\xe4\xed\x6d\xd9\x78\xd0\x38\xe7\x6f\xdd\x22\xbf\x4b\x17\x38\xe6\
-\x81\x8e\xa8\xbc\xbc\x0c\x10\x18\x63\xf3\xfc\x2a\x5a\x6f\x98\xa4\
-\xe3\x3c\xfa\x77\xa0\x04\xf2\xc7\xa5\x1e\x58\xf4\xa7\x66\x8c\xd0\
-\x2b\x0d\xf2\xc7\xa5\x1e\x58\xf4\xa7\x66\x8c\xd0\x16\x1b\xe5\x8f\
-\x4a\x3c\xb1\xe9\x4e\xcd\x19\xa0\x2c\x37\xcb\x1e\x94\x79\x63\xd2\
-\x9d\x9a\x33\x40\x58\x6f\x96\x3d\x28\xf2\xc7\xa5\x3b\x34\x66\x80\
-\xb0\xdf\x2c\x7a\x51\xe5\x8f\x4a\x76\x68\xcd\x01\x61\xbe\x58\xf4\
-\xa3\xcb\x1e\x94\xec\xd1\x9a\x02\xc3\x7c\xb1\xe9\x47\x96\x3d\x29\
-\xd9\xa3\x34\x05\x88\xc4\x67\x69\x18\x0a\x3f\xd9\x1f\xce\xa5\xa6\
-\x2c\x8a\xcc\x54\x1c\xb0\xea\x3b\x8f\xf3\x9a\x7d\x03\x0a\xf8\x1f\
-\xf6\xba\xff\x00\x82\x99\x5f\x7e\xcb\xff\x00\x1a\x2f\xbc\x07\x17\
-\x80\x6d\x7c\x45\x0d\xb5\x9d\xbd\xdf\xdb\xa5\xd5\xcd\xa9\x7f\x31\
-\x32\x57\x67\x92\xe3\x8f\xad\x7d\xf1\x59\xd3\x68\xb6\x77\x33\x19\
-\x66\xb2\xb7\x92\x4f\xf9\xe8\xf1\x86\x6e\x06\x00\xe9\xe9\xef\x40\
-\x1f\x95\xff\x00\xf0\xfb\xcd\x57\xfe\x89\x2d\x87\xfe\x14\x4f\xff\
-\x00\xc8\xf4\x7f\xc3\xef\x35\x5f\xfa\x24\xb6\x1f\xf8\x51\x3f\xff\
-\x00\x23\xd7\xea\x77\xfc\x23\x5a\x57\xfd\x03\x6c\xff\x00\xf0\x1d\
-\x3f\xc2\x8f\xf8\x46\xb4\xaf\xfa\x06\xd9\xff\x00\xe0\x3a\x7f\x85\
-\x00\x7e\x58\xff\x00\xc3\xef\x35\x5f\xfa\x24\xb6\x1f\xf8\x51\x3f\
-\xff\x00\x23\xd1\xff\x00\x0f\xbc\xd5\x7f\xe8\x92\xd8\x7f\xe1\x44\
-\xff\x00\xfc\x8f\x5f\xa9\xdf\xf0\x8d\x69\x5f\xf4\x0d\xb3\xff\x00\
-\xc0\x74\xff\x00\x0a\x3f\xe1\x1a\xd2\xbf\xe8\x1b\x67\xff\x00\x80\
-\xe9\xfe\x14\x01\xf9\x63\xff\x00\x0f\xbc\xd5\x7f\xe8\x92\xd8\x7f\
-\xe1\x44\xff\x00\xfc\x8f\x47\xfc\x3e\xf3\x55\xff\x00\xa2\x4b\x61\
-\xff\x00\x85\x13\xff\x00\xf2\x3d\x7e\xa7\x7f\xc2\x35\xa5\x7f\xd0\
-\x36\xcf\xff\x00\x01\xd3\xfc\x28\xff\x00\x84\x6b\x4a\xff\x00\xa0\
-\x6d\x9f\xfe\x03\xa7\xf8\x50\x07\xe5\x8f\xfc\x3e\xf3\x55\xff\x00\
-\xa2\x4b\x61\xff\x00\x85\x13\xff\x00\xf2\x3d\x1f\xf0\xfb\xcd\x57\
-\xfe\x89\x2d\x87\xfe\x14\x4f\xff\x00\xc8\xf5\xfa\x9d\xff\x00\x08\
-\xd6\x95\xff\x00\x40\xdb\x3f\xfc\x07\x4f\xf0\xa3\xfe\x11\xad\x2b\
-\xfe\x81\xb6\x7f\xf8\x0e\x9f\xe1\x40\x1f\x96\x3f\xf0\xfb\xcd\x57\
-\xfe\x89\x2d\x87\xfe\x14\x4f\xff\x00\xc8\xf4\x7f\xc3\xef\x35\x5f\
-\xfa\x24\xb6\x1f\xf8\x51\x3f\xff\x00\x23\xd7\xea\x77\xfc\x23\x5a\
-\x57\xfd\x03\x6c\xff\x00\xf0\x1d\x3f\xc2\x8f\xf8\x46\xb4\xaf\xfa\
-\x06\xd9\xff\x00\xe0\x3a\x7f\x85\x00\x7e\x58\xff\x00\xc3\xef\x35\
-\x5f\xfa\x24\xb6\x1f\xf8\x51\x3f\xff\x00\x23\xd1\xff\x00\x0f\xbc\
-\xd5\x7f\xe8\x92\xd8\x7f\xe1\x44\xff\x00\xfc\x8f\x5f\xa9\xdf\xf0\
-\x8d\x69\x5f\xf4\x0d\xb3\xff\x00\xc0\x74\xff\x00\x0a\x3f\xe1\x1a\
-\xd2\xbf\xe8\x1b\x67\xff\x00\x80\xe9\xfe\x14\x01\xf9\x63\xff\x00\
-\x0f\xbc\xd5\x7f\xe8\x92\xd8\x7f\xe1\x44\xff\x00\xfc\x8f\x47\xfc\
-\x3e\xf3\x55\xff\x00\xa2\x4b\x61\xff\x00\x85\x13\xff\x00\xf2\x3d\
-\x7e\xa7\x7f\xc2\x35\xa5\x7f\xd0\x36\xcf\xff\x00\x01\xd3\xfc\x28\
-\xff\x00\x84\x6b\x4a\xff\x00\xa0\x6d\x9f\xfe\x03\xa7\xf8\x50\x07\
-\xe5\x8f\xfc\x3e\xf3\x55\xff\x00\xa2\x4b\x61\xff\x00\x85\x13\xff\
-\x00\xf2\x3d\x1f\xf0\xfb\xcd\x57\xfe\x89\x2d\x87\xfe\x14\x4f\xff\
-\x00\xc8\xf5\xfa\x9d\xff\x00\x08\xd6\x95\xff\x00\x40\xdb\x3f\xfc\
-\x07\x4f\xf0\xa3\xfe\x11\xad\x2b\xfe\x81\xb6\x7f\xf8\x0e\x9f\xe1\
-\x40\x1f\x9e\x3f\x01\x7f\xe0\xac\xda\x8f\xc6\x8f\x8c\x3e\x13\xf0\
-\x34\xdf\x0d\xac\xf4\x98\xf5\xdb\xdf\xb1\x9b\xe8\xf5\xa6\x94\xc1\
-\xc1\xf9\xf6\x18\x00\x23\x8e\xe6\xbf\x48\x6b\x2e\xdf\xc3\xf6\x16\
-\xf2\x87\x8b\x4f\xb5\x81\xd7\xee\xc9\x1c\x4a\xac\x38\xf6\x03\x07\
-\x93\xd0\xd6\xa5\x00\x14\xdd\xeb\xc8\xce\x48\xec\x3a\xd3\xab\xe6\
-\xdf\x8d\x5f\xb7\xcf\xc2\x6f\xd9\xff\x00\xc7\x53\xf8\x3f\xc5\xda\
-\x86\xa9\x6f\xad\x41\x04\x77\x0e\x96\xba\x6c\xb3\xa6\xd7\x19\x43\
-\xb8\x7a\x8f\x7a\x00\xfa\x47\x22\x8c\x8a\xf8\xcf\xfe\x1e\xcf\xfb\
-\x3e\xff\x00\xd0\x5b\x5e\xff\x00\xc1\x24\xb4\x7f\xc3\xd9\xff\x00\
-\x67\xdf\xfa\x0b\x6b\xdf\xf8\x24\x96\x81\x1f\x66\x64\x51\x91\x5f\
-\x19\xff\x00\xc3\xd9\xff\x00\x67\xdf\xfa\x0b\x6b\xdf\xf8\x24\x96\
-\x8f\xf8\x7b\x3f\xec\xfb\xff\x00\x41\x6d\x7b\xff\x00\x04\x92\xd0\
-\x07\xd9\x99\x14\x64\x57\xc6\x7f\xf0\xf6\x7f\xd9\xf7\xfe\x82\xda\
-\xf7\xfe\x09\x25\xa3\xfe\x1e\xcf\xfb\x3e\xff\x00\xd0\x5b\x5e\xff\
-\x00\xc1\x24\xb4\x01\xf6\x66\x45\x19\x15\xf1\x9f\xfc\x3d\x9f\xf6\
-\x7d\xff\x00\xa0\xb6\xbd\xff\x00\x82\x49\x68\xff\x00\x87\xb3\xfe\
-\xcf\xbf\xf4\x16\xd7\xbf\xf0\x49\x2d\x00\x7d\x99\x91\x46\x45\x7c\
-\x67\xff\x00\x0f\x67\xfd\x9f\x7f\xe8\x2d\xaf\x7f\xe0\x92\x5a\x3f\
-\xe1\xec\xff\x00\xb3\xef\xfd\x05\xb5\xef\xfc\x12\x4b\x40\x1f\x66\
-\x64\x51\x91\x5f\x19\xff\x00\xc3\xd9\xff\x00\x67\xdf\xfa\x0b\x6b\
-\xdf\xf8\x24\x96\x8f\xf8\x7b\x3f\xec\xfb\xff\x00\x41\x6d\x7b\xff\
-\x00\x04\x92\xd0\x07\xd9\x99\x14\x64\x57\xc6\x7f\xf0\xf6\x7f\xd9\
-\xf7\xfe\x82\xda\xf7\xfe\x09\x25\xa3\xfe\x1e\xcf\xfb\x3e\xff\x00\
-\xd0\x5b\x5e\xff\x00\xc1\x24\xb4\x01\xf6\x66\x45\x19\x15\xf1\x9f\
-\xfc\x3d\x9f\xf6\x7d\xff\x00\xa0\xb6\xbd\xff\x00\x82\x49\x68\xff\
-\x00\x87\xb3\xfe\xcf\xbf\xf4\x16\xd7\xbf\xf0\x49\x2d\x00\x7d\x99\
-\xb8\x7a\xd2\xd7\xca\xbf\x0d\xff\x00\xe0\xa4\x1f\x05\xfe\x2b\xf8\
-\xe3\x45\xf0\x8f\x87\xf5\x1d\x5e\x4d\x67\x58\xb8\x16\xd6\xa9\x3e\
-\x95\x2c\x28\xce\x41\x20\x16\x3e\xc0\xd7\xd5\x21\x83\x74\xa0\x62\
-\xd7\x84\xfc\x56\xfd\x89\x3e\x0c\xfc\x6f\xf1\x8c\xde\x29\xf1\xb7\
-\x82\xd3\x5b\xd7\xa6\x8a\x38\x1e\xf0\xea\x37\x70\x7c\x88\x30\x8b\
-\xb2\x39\x95\x78\x1e\xd5\xee\xd4\x50\x07\xcb\x3f\xf0\xec\x5f\xd9\
-\xa3\xfe\x89\x9a\x7f\xe0\xe7\x50\xff\x00\xe4\x8a\x3f\xe1\xd8\xbf\
-\xb3\x47\xfd\x13\x34\xff\x00\xc1\xce\xa1\xff\x00\xc9\x15\xf5\x35\
-\x14\x0a\xc7\xcb\x3f\xf0\xec\x5f\xd9\xa3\xfe\x89\x9a\x7f\xe0\xe7\
-\x50\xff\x00\xe4\x8a\x3f\xe1\xd8\xbf\xb3\x47\xfd\x13\x34\xff\x00\
-\xc1\xce\xa1\xff\x00\xc9\x15\xf5\x35\x14\x05\x8f\x96\x7f\xe1\xd8\
-\xbf\xb3\x47\xfd\x13\x34\xff\x00\xc1\xce\xa1\xff\x00\xc9\x14\x7f\
-\xc3\xb1\x7f\x66\x8f\xfa\x26\x69\xff\x00\x83\x9d\x43\xff\x00\x92\
-\x2b\xea\x6a\x28\x0b\x1f\x2c\xff\x00\xc3\xb1\x7f\x66\x8f\xfa\x26\
-\x69\xff\x00\x83\x9d\x43\xff\x00\x92\x28\xff\x00\x87\x62\xfe\xcd\
-\x1f\xf4\x4c\xd3\xff\x00\x07\x3a\x87\xff\x00\x24\x57\xd4\xd4\x50\
-\x16\x3e\x59\xff\x00\x87\x62\xfe\xcd\x1f\xf4\x4c\xd3\xff\x00\x07\
-\x3a\x87\xff\x00\x24\x51\xff\x00\x0e\xc5\xfd\x9a\x3f\xe8\x99\xa7\
-\xfe\x0e\x75\x0f\xfe\x48\xaf\xa9\xa8\xa0\x2c\x7c\xb3\xff\x00\x0e\
-\xc5\xfd\x9a\x3f\xe8\x99\xa7\xfe\x0e\x75\x0f\xfe\x48\xa3\xfe\x1d\
-\x8b\xfb\x34\x7f\xd1\x33\x4f\xfc\x1c\xea\x1f\xfc\x91\x5f\x53\x51\
-\x40\x58\xf9\x67\xfe\x1d\x8b\xfb\x34\x7f\xd1\x33\x4f\xfc\x1c\xea\
-\x1f\xfc\x91\x47\xfc\x3b\x17\xf6\x68\xff\x00\xa2\x66\x9f\xf8\x39\
-\xd4\x3f\xf9\x22\xbe\xa6\xa2\x80\xb1\xf2\xcf\xfc\x3b\x17\xf6\x68\
-\xff\x00\xa2\x66\x9f\xf8\x39\xd4\x3f\xf9\x22\x8f\xf8\x76\x2f\xec\
-\xd1\xff\x00\x44\xcd\x3f\xf0\x73\xa8\x7f\xf2\x45\x7d\x4d\x45\x01\
-\x63\xe7\x5f\x02\xff\x00\xc1\x3f\x3e\x02\xfc\x35\xf1\x96\x95\xe2\
-\x9f\x0d\xf8\x09\x74\xcd\x73\x4b\x9b\xed\x16\x77\x43\x55\xbd\x97\
-\xca\x70\x08\x07\x63\xcc\xca\xdc\x13\xf7\x81\xaf\xa2\x54\x6d\x14\
-\xb4\x50\x30\xae\x53\xc4\x1f\x15\xbc\x17\xe1\x3d\x41\xac\x35\xaf\
-\x16\xe8\x5a\x45\xea\x85\x63\x6f\x7f\xa9\x43\x04\x80\x1e\x87\x6b\
-\xb0\x3c\xd7\x57\x5f\x12\x7e\xd4\xdf\xf0\x4c\xdd\x3b\xf6\x9e\xf8\
-\xbb\x77\xe3\xab\xaf\x1e\x5d\x68\x12\xdc\x5a\x43\x6b\xf6\x18\xf4\
-\xa8\xee\x02\xf9\x4b\xb4\x37\x98\xd2\x03\xcf\x5e\x94\x01\xf4\xff\
-\x00\xfc\x2f\xaf\x86\xbf\xf4\x50\x7c\x2b\xff\x00\x83\xbb\x6f\xfe\
-\x39\x47\xfc\x2f\xaf\x86\xbf\xf4\x50\x7c\x2b\xff\x00\x83\xbb\x6f\
-\xfe\x39\x5f\x00\xff\x00\xc3\x91\x74\x4f\xfa\x2a\xb7\xdf\xf8\x21\
-\x87\xff\x00\x8e\xd1\xff\x00\x0e\x45\xd1\x3f\xe8\xaa\xdf\x7f\xe0\
-\x86\x1f\xfe\x3b\x40\x1f\x7f\x7f\xc2\xfa\xf8\x6b\xff\x00\x45\x07\
-\xc2\xbf\xf8\x3b\xb6\xff\x00\xe3\x94\x7f\xc2\xfa\xf8\x6b\xff\x00\
-\x45\x07\xc2\xbf\xf8\x3b\xb6\xff\x00\xe3\x95\xf0\x0f\xfc\x39\x17\
-\x44\xff\x00\xa2\xab\x7d\xff\x00\x82\x18\x7f\xf8\xed\x1f\xf0\xe4\
-\x5d\x13\xfe\x8a\xad\xf7\xfe\x08\x61\xff\x00\xe3\xb4\x01\xf7\xf7\
-\xfc\x2f\xaf\x86\xbf\xf4\x50\x7c\x2b\xff\x00\x83\xbb\x6f\xfe\x39\
-\x47\xfc\x2f\xaf\x86\xbf\xf4\x50\x7c\x2b\xff\x00\x83\xbb\x6f\xfe\
-\x39\x5f\x00\xff\x00\xc3\x91\x74\x4f\xfa\x2a\xb7\xdf\xf8\x21\x87\
-\xff\x00\x8e\xd1\xff\x00\x0e\x45\xd1\x3f\xe8\xaa\xdf\x7f\xe0\x86\
-\x1f\xfe\x3b\x40\x1f\x7f\x7f\xc2\xfa\xf8\x6b\xff\x00\x45\x07\xc2\
-\xbf\xf8\x3b\xb6\xff\x00\xe3\x94\x7f\xc2\xfa\xf8\x6b\xff\x00\x45\
-\x07\xc2\xbf\xf8\x3b\xb6\xff\x00\xe3\x95\xf0\x0f\xfc\x39\x17\x44\
-\xff\x00\xa2\xab\x7d\xff\x00\x82\x18\x7f\xf8\xed\x1f\xf0\xe4\x5d\
-\x13\xfe\x8a\xad\xf7\xfe\x08\x61\xff\x00\xe3\xb4\x01\xf7\xf7\xfc\
-\x2f\xaf\x86\xbf\xf4\x50\x7c\x2b\xff\x00\x83\xbb\x6f\xfe\x39\x47\
-\xfc\x2f\xaf\x86\xbf\xf4\x50\x7c\x2b\xff\x00\x83\xbb\x6f\xfe\x39\
-\x5f\x00\xff\x00\xc3\x91\x74\x4f\xfa\x2a\xb7\xdf\xf8\x21\x87\xff\
-\x00\x8e\xd1\xff\x00\x0e\x45\xd1\x3f\xe8\xaa\xdf\x7f\xe0\x86\x1f\
-\xfe\x3b\x40\x1f\x7f\x7f\xc2\xfa\xf8\x6b\xff\x00\x45\x07\xc2\xbf\
-\xf8\x3b\xb6\xff\x00\xe3\x94\x7f\xc2\xfa\xf8\x6b\xff\x00\x45\x07\
-\xc2\xbf\xf8\x3b\xb6\xff\x00\xe3\x95\xf0\x0f\xfc\x39\x17\x44\xff\
-\x00\xa2\xab\x7d\xff\x00\x82\x18\x7f\xf8\xed\x1f\xf0\xe4\x5d\x13\
-\xfe\x8a\xad\xf7\xfe\x08\x61\xff\x00\xe3\xb4\x01\xf7\xf7\xfc\x2f\
-\xaf\x86\xbf\xf4\x50\x7c\x2b\xff\x00\x83\xbb\x6f\xfe\x39\x47\xfc\
-\x2f\xaf\x86\xbf\xf4\x50\x7c\x2b\xff\x00\x83\xbb\x6f\xfe\x39\x5f\
-\x00\xff\x00\xc3\x91\x74\x4f\xfa\x2a\xb7\xdf\xf8\x21\x87\xff\x00\
-\x8e\xd1\xff\x00\x0e\x45\xd1\x3f\xe8\xaa\xdf\x7f\xe0\x86\x1f\xfe\
-\x3b\x40\x1f\x7f\x7f\xc2\xfa\xf8\x6b\xff\x00\x45\x07\xc2\xbf\xf8\
-\x3b\xb6\xff\x00\xe3\x94\x7f\xc2\xfa\xf8\x6b\xff\x00\x45\x07\xc2\
-\xbf\xf8\x3b\xb6\xff\x00\xe3\x95\xf0\x0f\xfc\x39\x17\x44\xff\x00\
-\xa2\xab\x7d\xff\x00\x82\x18\x7f\xf8\xed\x1f\xf0\xe4\x5d\x13\xfe\
-\x8a\xad\xf7\xfe\x08\x61\xff\x00\xe3\xb4\x01\xfa\x0f\xa5\xfc\x66\
-\xf0\x0e\xb9\xa9\xdb\xe9\xda\x77\x8d\xbc\x3b\x7f\xa8\x5c\x36\xc8\
-\x6d\x2d\x75\x6b\x79\x25\x95\xba\xe1\x51\x5c\x96\xfc\x05\x76\x55\
-\xf0\x07\xc0\xff\x00\xf8\x24\xce\x97\xf0\x4f\xe2\xc7\x85\xbc\x75\
-\x6f\xf1\x16\xf3\x55\x9f\x43\xbc\x5b\xc5\xb3\x93\x48\x8a\x11\x29\
-\x0a\xc3\x6e\xe1\x21\xc6\x77\x7e\x95\xf7\xfa\xf4\x14\x00\xb4\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\
-\x45\x00\x14\x51\x45\x00\x7f\xff\xd9\
-\x00\x00\x19\xba\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x00\x84\x00\xb6\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x53\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x6b\xb6\xda\x00\x75\x15\
-\xe3\x3f\x19\xff\x00\x6b\xef\x84\xdf\x00\xf7\xc5\xe3\x0f\x19\xd8\
-\xda\x6a\x2a\x3f\xe4\x15\x6b\x9b\x9b\xc2\x7b\x0f\x26\x3c\xb2\xe7\
-\x3d\x5b\x03\xf2\xaf\x88\x7e\x26\x7f\xc1\x68\x0c\xd7\xb2\xe9\xbf\
-\x0d\x3e\x1d\x4d\x79\x39\x63\x1c\x37\x7e\x20\x98\x86\x66\xed\x8b\
-\x68\x46\xe3\xf8\xc8\x3e\x94\x01\xfa\x84\xcc\x47\x4e\x6a\x26\xb8\
-\x54\x04\x96\x0a\x14\x73\xb8\xe3\x1f\xe7\xf0\xaf\xc8\xaf\xf8\x59\
-\xdf\xb7\xc7\xed\x18\xa1\xf4\x4d\x33\x59\xf0\xb6\x99\x3f\xdc\xfb\
-\x26\x9f\x0e\x8d\x10\x1e\xa2\x69\xcf\x9a\x7e\xa1\x8f\xeb\x53\x5b\
-\xff\x00\xc1\x33\xff\x00\x69\xff\x00\x8a\x1f\xe9\x1e\x3b\xf8\xa3\
-\x6d\x6c\xb3\x1f\xde\x43\xa9\x6b\xd7\x97\xf2\xf3\xd7\x2a\xa3\xcb\
-\x3f\x83\x50\x07\xea\x9e\xa5\xf1\x03\xc3\x5a\x2e\x3f\xb4\x3c\x47\
-\xa4\xd8\x9e\xff\x00\x69\xbe\x8a\x3f\xe6\x6b\x19\xbe\x3c\xfc\x35\
-\x49\x02\x1f\x88\x5e\x15\x0d\xe8\x75\xbb\x5c\xfe\x5e\x65\x7e\x72\
-\x69\x7f\xf0\x44\x7b\x96\xc9\xd5\x3e\x2c\x42\x24\x3f\x79\x2d\x34\
-\x32\x40\xfc\x5a\x6e\x7f\x21\x5d\x0c\x7f\xf0\x44\x7f\x0e\xec\x01\
-\xbe\x29\xea\x7b\xb0\x33\x8d\x12\x2c\x13\xf4\xf3\x28\x03\xf4\x3b\
-\x4f\xf8\x9d\xe1\x1d\x5e\x44\x4d\x3f\xc5\x3a\x2d\xf3\x3f\x41\x6d\
-\xa8\x42\xf9\xfa\x61\xff\x00\x95\x6f\xc7\x70\x26\x01\x92\x45\x74\
-\x3d\xd0\xee\xaf\xcb\x9d\x53\xfe\x08\x8e\xbb\x58\xe9\x9f\x16\x31\
-\xcf\xdd\xba\xd0\x83\x03\xe9\x90\xb3\x0a\xe6\xee\x7f\xe0\x95\x3f\
-\x1e\xfe\x1f\x07\x9f\xc0\xbf\x14\xf4\xe9\x0c\x3c\xc7\x1d\xbe\xa1\
-\x79\xa6\xbf\xb6\x00\xdc\xa0\xfd\x4d\x00\x7e\xb7\x2c\xbb\x99\x86\
-\x47\xcb\xd7\x1c\xd3\xd4\xd7\xe4\x1b\x37\xfc\x14\x07\xf6\x7d\x63\
-\x29\xfe\xde\xf1\x46\x9f\x00\x05\x97\xfd\x1f\x5d\x46\x51\xd7\xa6\
-\xe9\x80\xfa\x00\x7d\xf8\xae\x93\xc0\xff\x00\xf0\x58\xdf\x17\x78\
-\x47\x50\x5d\x33\xe2\xa7\xc3\x38\xfc\xf8\xfe\x59\xa5\xd2\xde\x4b\
-\x1b\x84\xe7\xa9\xb7\x9c\x10\x4f\xb6\xf5\xa0\x0f\xd5\xaa\x2b\xe7\
-\x3f\x83\x7f\xb7\xe7\xc1\x6f\x8d\x93\x5b\xd9\xe9\x3e\x2e\x87\x47\
-\xd6\x27\x00\x26\x95\xe2\x05\xfb\x0d\xc1\x63\xd1\x57\x77\xc8\xe7\
-\xd9\x58\xe7\xb6\x6b\xe8\x78\xe4\x2c\x09\x27\xf0\xf4\xa0\x09\x68\
-\xa6\xae\x7b\x9c\xd3\xa8\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x43\x40\x0b\x51\xc8\xe5\x08\xe3\x23\xbf\xe9\x59\xbe\x26\xf1\
-\x26\x9f\xe1\x1d\x16\xef\x59\xd6\x35\x0b\x5d\x2b\x49\xb2\x89\xa6\
-\xba\xbc\xbc\x95\x62\x8a\x18\xc7\x56\x66\x6e\x06\x3d\xeb\xf2\xf3\
-\xf6\x94\xff\x00\x82\x99\x78\xbf\xe3\x27\x89\x8f\xc3\x7f\xd9\xda\
-\xca\xf9\xfe\xd9\x29\xb7\x1a\xed\xad\xbb\x35\xf5\xe7\x63\xf6\x78\
-\xf1\x98\x10\xff\x00\xcf\x47\x01\xb1\xce\x50\x66\x81\x1f\x67\x7e\
-\xd2\x5f\xb7\x57\xc3\x1f\xd9\x96\xde\x5b\x4d\x77\x56\xfe\xd6\xf1\
-\x46\xcc\xc7\xe1\xfd\x27\x12\xdc\x9c\xf4\x2e\xc7\x09\x12\xfb\xb9\
-\x1d\xf0\x0e\x0d\x7e\x7e\x6b\xbf\xb5\x07\xed\x49\xfb\x7b\x6b\x57\
-\x7a\x1f\xc3\x1d\x22\xeb\xc2\xfe\x14\xde\x62\x97\xfb\x16\x5f\x22\
-\x38\xd4\xe3\x8b\x8b\xf6\xc1\x2d\x8c\xf1\x1e\xdc\xf3\xf2\x1e\xb5\
-\xeb\xdf\xb3\x0f\xfc\x12\x6e\xde\x0b\x88\xbc\x57\xf1\xda\xfd\xb5\
-\xfd\x6e\x76\xf3\xdb\xc3\x90\x5d\x33\xc2\xae\xd9\x24\xdc\xdc\x03\
-\xba\x67\x3c\x64\x29\xdb\xd7\x25\xf2\x31\xfa\x37\xe1\xbf\x0c\xe9\
-\x3e\x13\xd1\x6d\x74\x8d\x17\x4d\xb4\xd2\x74\xbb\x48\xc4\x36\xf6\
-\x36\x30\xac\x50\x42\x83\xf8\x51\x14\x00\x07\xd0\x50\x07\xe7\x27\
-\xc1\x7f\xf8\x23\x96\x85\x62\xf0\xea\x9f\x15\xfc\x57\x71\xaf\xde\
-\xb3\xf9\x93\xe9\x7a\x1b\x98\x20\xdc\x79\x2b\x25\xc3\x8f\x31\xf9\
-\xeb\x8d\xa7\xf3\xaf\xba\xbe\x15\xfe\xcf\x7f\x0d\xfe\x0c\xda\xa4\
-\x3e\x0c\xf0\x56\x8f\xe1\xf7\x8c\x6d\xfb\x45\xb5\xb0\xfb\x43\x7a\
-\xe6\x56\xcc\x84\x1f\x76\x35\xe8\x81\x00\x24\x81\xc9\xef\x42\xa8\
-\x5c\xe0\x63\xe9\x40\xc3\x68\xf4\xe2\x8d\x83\xd3\xda\x9d\x45\x00\
-\x26\x00\xa4\xda\x3b\x0c\x7d\x29\xd4\x50\x02\x6d\x1f\x5a\x36\x8a\
-\x5a\x28\x01\xbb\x41\xfc\xb1\x5c\x9f\x8f\xbe\x13\xf8\x33\xe2\x86\
-\x9a\x74\xff\x00\x17\x78\x5b\x49\xf1\x25\x9b\x29\x5d\x9a\x95\xa2\
-\x4e\x47\x4e\x41\x60\x48\x3e\xe0\x83\x5d\x75\x23\x28\x61\x82\x32\
-\x28\x03\xf3\xe7\xe3\x7f\xfc\x11\xff\x00\xe1\xbf\x8c\x3e\xd1\x7b\
-\xf0\xff\x00\x56\xbb\xf0\x26\xa4\xe7\x29\x63\x3f\xfa\x6d\x81\x6f\
-\x4d\xae\xde\x62\x03\x8e\xcc\x71\xd9\x6b\xe7\x08\xf5\xcf\xda\xe3\
-\xfe\x09\xdb\x75\x19\xd4\x84\xde\x29\xf0\x15\xbb\x6c\x1e\x7b\xb6\
-\xa5\xa5\x14\x1d\x96\x4c\x89\x6d\x78\xf5\xd8\xbe\xb9\xc5\x7e\xca\
-\x79\x6b\xd8\x60\x7a\x03\xc7\xe5\x55\xef\x2c\xe0\xba\x85\xa0\x9e\
-\x14\x9a\x09\x15\x92\x48\xe4\x5d\xca\xe8\x41\x05\x48\x3c\x10\x73\
-\xd0\xf1\x40\x1f\x24\xfe\xcc\x5f\xf0\x52\xcf\x86\x9f\xb4\x04\x96\
-\xba\x3e\xa9\x37\xfc\x20\x7e\x2e\x9b\x08\xba\x6e\xab\x32\x9b\x7b\
-\x86\xc7\x48\x2e\x0e\x15\x89\xc8\xc2\x90\xad\xc8\xc0\x6a\xfa\xf2\
-\x27\x2f\x92\x46\x3d\x38\xc7\xf9\x35\xf0\x57\xed\x45\xff\x00\x04\
-\xab\xf0\x47\xc5\x38\x6f\x75\xdf\x87\x0d\x6f\xe0\x4f\x14\x9c\xc8\
-\xd6\x71\x8f\xf8\x95\x5d\x30\x1f\xc5\x1a\x8c\xc2\x7a\x7c\xc9\xc0\
-\xcf\xdd\x3d\x47\xce\x7f\x06\x7f\x6d\x4f\x8c\x3f\xb0\xc7\x8c\xa2\
-\xf8\x6d\xf1\xb3\x47\xd4\x75\x7f\x0c\x40\x76\x45\xf6\x93\xe6\x5e\
-\x5b\x44\x0e\x04\xb6\xb3\x12\x16\x78\x73\xfc\x25\xba\x74\x2b\x82\
-\x08\x23\xf6\x16\x8a\xe2\xbe\x16\xfc\x5e\xf0\xaf\xc6\xaf\x06\xda\
-\x78\xa7\xc1\xba\xcd\xbe\xb3\xa2\xdd\x7c\xa2\xe2\x26\xc1\x8d\xc6\
-\x37\x46\xea\x46\x51\xd7\x3c\xab\x00\x79\x07\xa1\x06\xbb\x28\xd8\
-\xb6\x73\xd6\x81\x8f\xa2\x8a\x28\x01\x92\x31\x51\xc7\x27\xd3\xd6\
-\xb8\xef\x8a\xdf\x16\x7c\x35\xf0\x5b\xc1\x1a\x8f\x8b\x3c\x5d\xaa\
-\x45\xa5\xe8\xb6\x2a\x0b\xcd\x20\x25\xdd\x8f\x0a\x91\xa8\xe5\xdd\
-\x8f\x01\x54\x67\xf2\xae\xbe\x6c\xf0\x41\x03\x19\x23\x23\xbe\x2b\
-\xf2\x43\xfe\x0a\xf9\xe0\xaf\x8a\xab\xe3\x6d\x23\xc4\x57\xf7\x2f\
-\xa9\x7c\x2b\x8a\x34\x87\x4f\x8e\xd2\x32\xb1\x69\xf7\x04\x61\xc5\
-\xca\xe7\x0c\xce\x54\xe2\x43\xf2\xe0\xed\x01\x4e\x77\x00\x72\x3e\
-\x37\xf8\x97\xf1\x87\xfe\x0a\x95\xf1\x62\x3f\x0b\x78\x4e\xce\x4d\
-\x07\xe1\xe5\x85\xc7\x9e\x6d\xe4\x73\xf6\x5b\x48\xc1\x2a\x27\xbc\
-\x91\x3f\xd6\xca\x7f\x86\x35\x24\x0c\xf0\x00\xdc\xf5\xfa\x59\xfb\
-\x2d\xfe\xc7\xfe\x02\xfd\x96\xfc\x2e\xb6\x9e\x1d\xb2\xfb\x76\xbd\
-\x32\x05\xbf\xf1\x15\xea\xa9\xbb\xb9\x61\xd4\x02\x3f\xd5\xa6\x78\
-\x08\xbc\x60\x0c\xee\x23\x71\xf3\xdf\xf8\x27\x37\xc4\x9f\x85\x1e\
-\x30\xf8\x0b\x61\xa5\xfc\x38\xb1\x87\x41\xbe\xd3\x55\x46\xb9\xa3\
-\xcf\x30\x92\xed\x6e\x98\x6d\x69\xe5\x7c\x66\x55\x72\x3e\x57\xe9\
-\x85\x0b\xf2\xe3\x68\xfa\xce\xdf\xee\x93\xd7\x9e\xb8\x23\xda\x82\
-\x49\x36\x81\x9c\x71\x9a\x30\x29\x68\xa0\xa0\xa2\x8a\x64\x92\x08\
-\xc6\x58\x85\x5e\xec\xc7\x00\x50\x03\xe9\x09\xaa\xb7\xba\x84\x36\
-\x16\xed\x73\x3c\xd1\xc3\x6e\x83\x73\x4b\x21\xc2\x28\xf5\x26\xbc\
-\x23\xe2\x17\xed\xed\xf0\x1b\xe1\x9c\xd3\x5b\xea\xdf\x12\xb4\x7b\
-\x9b\xc8\x83\x66\xdb\x49\x76\xbf\x7d\xc3\xf8\x4f\x92\x18\x03\xec\
-\xc4\x7f\x3a\x00\xfa\x03\x75\x1b\xab\xe0\xff\x00\x11\x7f\xc1\x63\
-\x7e\x0c\xe9\x6a\x3f\xb3\x34\x8f\x15\xeb\x8c\x7b\xc5\x61\x14\x0a\
-\x3f\x19\x25\x07\xf4\xed\x5c\xf7\xfc\x3e\xa7\xe1\xae\x71\xff\x00\
-\x08\x27\x8b\x31\xee\xf6\x9f\xfc\x76\x81\x5c\xfd\x11\xdd\x4a\x0d\
-\x7c\x0d\xe1\xdf\xf8\x2c\x9f\xc2\x1d\x56\xe3\xcb\xd4\x7c\x3b\xe2\
-\xdd\x25\x3f\xbe\x6d\x21\x9c\x7f\xe3\x92\x13\xff\x00\xeb\xaf\x5f\
-\xf0\x3f\xfc\x14\x77\xf6\x7e\xf1\xe4\x90\xc1\x07\xc4\x2b\x2d\x1a\
-\xee\x4d\xc3\xc9\xd7\xa1\x96\xc7\x69\x1d\x03\x3c\x8a\x23\x1f\xf7\
-\xdf\xd2\x80\xb9\xf4\xdd\x15\x93\xa1\xf8\x9b\x4c\xf1\x2d\x8a\xdf\
-\x69\x1a\x9d\xa6\xab\x65\x26\x0a\x5c\xd8\xcc\xb3\x46\xc0\x80\x72\
-\x19\x49\x18\xfc\x6b\x4a\x37\x2d\x90\x7a\x8f\xf3\x9a\x06\x49\x48\
-\x54\x36\x32\x3a\x73\x4b\x45\x00\x37\xcb\x53\x80\x46\x7e\xa7\xdf\
-\x35\xe7\x1f\x1c\xfe\x01\xf8\x1f\xf6\x82\xf0\x5c\x9e\x19\xf1\xae\
-\x91\x1e\xa1\x64\xe4\xbc\x13\x8f\x92\xe2\xd6\x4c\x7f\xac\x86\x5e\
-\xa8\xff\x00\x98\x23\x82\x08\xe2\xbd\x26\xa3\x90\x13\xb7\x6f\x0d\
-\xdb\x34\x08\xfc\x5d\xf1\x87\xc3\xdf\x8c\x9f\xf0\x4b\x2f\x8a\x5f\
-\xf0\x93\x78\x66\xfe\x4d\x7f\xe1\xee\xa1\x38\x89\xa5\x68\xdb\xec\
-\xb7\xa9\xc9\xfb\x3d\xdc\x6a\x71\x14\xe1\x7e\xeb\xaf\x04\x64\xa9\
-\xea\x95\xfa\x85\xfb\x34\xfe\xd3\xbe\x10\xfd\xa7\xbe\x1f\xdb\xf8\
-\x8f\xc2\xd7\x2c\xb7\x68\x42\x6a\x3a\x3c\xe5\x7e\xd3\x65\x2e\x33\
-\xb1\xc7\x75\x3f\xc2\xe3\x86\x03\xa8\x6c\x81\x8f\xfb\x64\x7c\x60\
-\xf8\x77\xf0\x77\xe0\x8e\xb5\x3f\xc4\x3b\x4b\x3d\x67\x4f\xd4\xe1\
-\x7b\x3b\x6f\x0f\x5c\x28\x66\xd5\x65\x2a\x48\x88\x29\xe4\x28\x3f\
-\x31\x93\x8d\x98\x07\x39\xc6\x7f\x33\xff\x00\xe0\x97\xff\x00\x09\
-\xbe\x21\xf8\xc3\xe3\xc3\xf8\xe7\xc2\x97\x57\x3e\x14\xf0\x15\x8c\
-\xae\x35\x79\x9b\x33\x45\x7d\x09\x3b\x86\x9e\xa1\x81\xf3\x58\x80\
-\x32\xc7\x94\x1f\x37\xde\xc0\x20\x1f\xb5\x10\xb1\x70\x49\x20\x8e\
-\xd8\xa2\xa2\xb3\x90\xc9\xe6\x13\xc8\xe3\x0c\x18\x10\x78\x1d\xff\
-\x00\x5f\xc7\xf0\x05\x03\x27\x68\xd5\xf1\xb9\x41\xc7\x4a\xc7\xf1\
-\x57\x85\xb4\x8f\x17\x78\x6e\xff\x00\x41\xd6\xb4\xdb\x6d\x53\x47\
-\xd4\x22\x6b\x7b\xbb\x2b\xa4\x0f\x14\xc8\xdf\x78\x30\x3d\x7d\x73\
-\xd7\x8c\x8e\x6b\x6a\x9a\xc8\xaf\x8d\xc3\x38\xe4\x66\x80\x3f\x17\
-\x7f\x68\xcf\xd9\xdf\xc7\xff\x00\xf0\x4e\x7f\x8c\x56\x3f\x14\xfe\
-\x17\xdf\xde\x5c\x78\x26\x49\xc0\x82\xea\x42\x65\x16\xc1\xcf\xcd\
-\x63\x78\x07\x0d\x13\x0f\xba\xe7\xae\x07\x21\xd4\x13\xfa\x53\xfb\
-\x26\x7e\xd6\xbe\x15\xfd\xaa\xbe\x1f\xc7\xab\xe8\xb2\x26\x9d\xaf\
-\xd9\x85\x8b\x58\xd0\xde\x50\xd2\xda\x4a\x7e\x50\xc0\xe3\xe7\x8d\
-\xb1\x95\x70\x39\xe8\x70\x41\x15\xec\x1e\x2e\xf0\xce\x93\xe3\x0f\
-\x0f\x5f\x68\x5a\xde\x9d\x6d\xaa\xe8\xfa\x8c\x4d\x05\xd5\x8d\xd2\
-\x07\x8e\x64\x6e\xaa\xca\x7b\x77\xcf\x51\x8e\x39\xaf\xc7\x7f\xda\
-\x37\xf6\x75\xf1\xff\x00\xfc\x13\x9f\xe3\x05\x87\xc5\x4f\x85\xd7\
-\xb7\x97\x1e\x0a\x92\x60\x90\xdd\x36\x65\x5b\x65\x73\xcd\x8d\xe8\
-\x1f\x7e\x26\xe0\x2b\x9e\xbc\x74\x75\x04\x80\x7e\xcf\xc2\xe5\xd4\
-\x93\xd7\xe9\x8a\x73\x12\xbc\xf6\xef\x5f\x3f\xfe\xc8\xbf\xb5\xe7\
-\x85\x7f\x6a\xbf\x04\x9d\x47\x48\x61\xa7\x78\x8a\xc4\x2a\x6a\xda\
-\x04\xd2\x86\x9a\xd6\x42\x0f\xcc\xa7\x1f\xbc\x8d\xb0\x76\xb8\xec\
-\x39\xc1\xe2\xb9\xaf\xdb\x1b\xf6\xf2\xf0\x97\xec\xab\xa5\xff\x00\
-\x66\x6c\x5f\x11\xf8\xf2\xee\x1f\x32\xcf\x43\x85\xb6\x88\xc1\xe9\
-\x2d\xc3\x75\x44\xcf\x45\xfb\xed\x83\x80\x3e\xf0\x00\xf7\xcf\x88\
-\x9f\x13\xbc\x31\xf0\xa3\xc3\x17\x1e\x21\xf1\x7e\xbd\x65\xe1\xdd\
-\x1a\x01\xf3\xde\x5e\xca\x15\x49\xc1\x21\x53\xbb\x39\xc7\x0a\xa0\
-\x93\xd8\x57\xe7\x17\xc7\x9f\xf8\x2c\x25\xd5\xfd\xe3\x68\x1f\x05\
-\x7c\x34\xf7\x57\x32\xb0\x8a\x3d\x6b\x58\x81\x9d\xe5\x63\xc7\xfa\
-\x3d\xa2\xf2\x4f\xa1\x90\x83\xfe\xc5\x78\xbf\xc3\xcf\x80\xbf\x1e\
-\x3f\xe0\xa5\x5e\x32\x5f\x1a\x78\xe7\x59\x9b\x48\xf0\x68\x72\x13\
-\x52\xba\x8c\xad\xb4\x68\x4f\x29\x61\x6d\x90\x1b\x00\x00\x5c\x9c\
-\x7c\xa3\x74\x8c\x46\x2b\xf4\xf7\xf6\x76\xfd\x8e\x7e\x17\xfe\xcd\
-\x76\x2a\xbe\x16\xd0\x22\x9b\x5c\xd8\x16\x7f\x10\xea\x21\x66\xd4\
-\x26\xc8\xe7\xf7\x98\xfd\xda\x9c\x7d\xd4\x0a\xbc\x74\x38\xcd\x02\
-\x3f\x35\x74\xbf\xd8\xff\x00\xf6\xb4\xfd\xb1\xae\xa1\xd6\x3e\x24\
-\x6b\x17\xda\x36\x93\x3f\xce\x8d\xe2\xbb\xa6\x86\x35\x53\xce\x63\
-\xd3\xe2\x19\x43\xc0\xe0\xaa\x67\x03\x3e\xdf\x45\x7c\x38\xff\x00\
-\x82\x32\xfc\x3d\xd0\xe1\x86\x4f\x17\xf8\xcf\x5f\xf1\x2d\xc0\xc9\
-\x78\x74\xf4\x8f\x4e\xb7\xc9\xff\x00\x67\xe7\x7e\x3d\x77\x0c\xfa\
-\x57\xe8\x8f\x96\xbc\xfc\xa3\x9e\xbc\x75\xa5\xda\x3a\x76\xf4\xa0\
-\x67\xcc\x1e\x1d\xff\x00\x82\x6a\xfe\xce\xba\x05\xbc\x71\x1f\x87\
-\x36\xda\x94\x91\x9c\xf9\xfa\x8d\xed\xcc\xee\xe7\xd5\x81\x93\x69\
-\xfc\xab\xa9\xff\x00\x86\x14\xf8\x01\xc7\xfc\x5a\x6f\x0c\xff\x00\
-\xe0\x1f\xff\x00\x5e\xbd\xd8\x28\x5e\x83\x14\xb4\x01\xf3\x5e\xb9\
-\xff\x00\x04\xe9\xfd\x9d\xb5\xbd\xe2\x4f\x85\xfa\x6d\xbb\x48\xa5\
-\x77\xd9\xdc\x5c\x40\x57\xdc\x04\x70\x33\xf8\x57\x8b\x78\xfb\xfe\
-\x08\xe7\xf0\x97\x5e\x84\xff\x00\xc2\x33\xaf\x78\x93\xc2\x97\x40\
-\x10\x99\x9d\x2f\xa0\x19\xf5\x47\x01\xc8\xfa\x38\xaf\xbf\x31\x9a\
-\x36\x8f\x4a\x00\xfc\x70\xf1\x17\xfc\x13\x8f\xf6\x91\xfd\x9b\x75\
-\x56\xd7\xbe\x14\x78\xae\x5d\x6d\x20\x26\x45\x93\xc3\x77\x8f\x61\
-\x78\xca\x31\x90\xd6\xce\xc1\x1c\x1e\xea\x19\xb3\x8e\x41\xe3\x3d\
-\x17\xc2\x5f\xf8\x2a\xf7\xc4\x8f\x84\xba\xca\xf8\x5b\xe3\x87\x84\
-\xe6\xd4\x0d\xb1\xf2\xee\x2f\x23\xb1\x3a\x7e\xa7\x6f\x8c\x02\xd2\
-\x40\xc1\x52\x40\x0e\x78\x02\x32\x73\xd7\xa6\x7f\x5b\x19\x03\x29\
-\x04\x71\xd2\xbc\xd7\xe3\x57\xec\xf9\xf0\xfb\xe3\xd6\x86\x74\xaf\
-\x1c\x78\x6e\xcf\x57\x8f\x6b\x79\x17\x4c\x9b\x6e\xad\xdb\xd6\x19\
-\x97\x0e\x87\xaf\x00\xf3\x8e\x41\x03\x14\x00\xef\x83\x1f\xb4\x27\
-\x81\x3f\x68\x1f\x0c\xb6\xb7\xe0\x5f\x11\x5a\xeb\x30\xc7\x85\x9e\
-\xdc\x7c\x97\x16\xac\x7a\x2c\xb1\x31\x0c\x84\xe0\xe3\x3c\x1c\x1c\
-\x13\x8a\xf4\x78\xd9\x8e\x77\x0c\x73\xc6\x0d\x7e\x39\x7c\x78\xfd\
-\x81\xfe\x2b\x7e\xc7\x5e\x21\x93\xe2\x57\xc1\x7d\x7b\x55\xd5\xb4\
-\x5b\x1d\xd2\x19\xac\x38\xd5\x34\xf8\xbe\xf3\x09\x63\x51\xb6\xe2\
-\x2c\x0e\x58\x0c\x60\x1d\xc8\x31\x9a\xfa\x97\xf6\x24\xff\x00\x82\
-\x96\x68\xbf\x1e\xae\xac\xbc\x19\xe3\xd5\xb5\xf0\xcf\x8f\xa5\xd9\
-\x15\xb4\xca\xdb\x2c\xb5\x57\xc0\x00\x47\xb8\xfe\xee\x56\xe3\x11\
-\x92\x43\x13\xf2\x1e\xd4\x08\xfb\xa2\x42\x46\x30\x70\x4f\x1d\x33\
-\x5e\x45\xfb\x49\x7e\xd2\x9e\x13\xfd\x98\xfe\x1f\xdc\x78\xa3\xc5\
-\x57\x3b\x9c\xe6\x3d\x3b\x4b\x8d\x80\xb8\xbf\x9f\x1c\x45\x18\x3d\
-\x00\xfe\x29\x0f\xca\xa0\xfa\x91\x49\xfb\x49\x7e\xd3\x1e\x13\xfd\
-\x99\x3e\x1e\xdc\x78\xa7\xc5\x17\x21\x9d\x89\x4d\x3b\x4a\x88\x81\
-\x73\x7f\x36\x07\xee\xd0\x1f\xba\x01\x3f\x33\x9e\x14\x75\xe7\x19\
-\xfc\xb5\xf8\x53\xf0\xa3\xe2\x6f\xfc\x14\xf3\xe3\x95\xcf\x8d\x3c\
-\x71\x73\x36\x91\xe0\x4d\x3e\xe0\xc5\x71\x71\x6e\x85\x61\xb5\x88\
-\x73\xf6\x1b\x30\x78\x32\x15\xc6\xe7\x20\x95\xe1\x9b\x71\xd8\xa4\
-\x18\x7c\x29\xf8\x53\xf1\x33\xfe\x0a\x7f\xf1\xc2\xe7\xc6\xbe\x38\
-\xbb\x97\x49\xf0\x26\x9f\x70\x61\xb9\xb8\xb6\x8c\xa4\x16\xb1\x8f\
-\x98\x59\x59\xe7\xac\x85\x71\xb9\xce\x4a\x82\x0b\x6e\x3b\x54\xfe\
-\xc2\xfc\x3b\xf0\x0e\x83\xf0\xcf\xc2\x3a\x6f\x86\x3c\x37\xa6\xc3\
-\xa5\x68\xba\x5c\x62\x1b\x6b\x58\x13\x6a\xa0\x1d\x49\xfe\xf3\x12\
-\x49\x66\x24\x96\x66\x62\x4f\x26\x9b\xf0\xef\xe1\xef\x87\xfe\x19\
-\xf8\x47\x4d\xf0\xcf\x86\xf4\xa8\x34\x9d\x1b\x4b\x88\x41\x6d\x6b\
-\x02\x05\x54\x5e\xa7\xfd\xe6\x27\xe6\x66\x24\x96\x62\x49\x39\xe9\
-\xd3\x85\x0b\xd0\x62\x80\x11\x51\x57\x90\x00\x38\xc5\x14\xea\x28\
-\x00\xa2\x8a\x28\x01\xac\xa1\xba\x8c\xd6\x3f\x8b\x3c\x2f\xa4\x78\
-\xcb\xc3\xf7\xfa\x1e\xb9\xa7\x5b\x6a\x9a\x45\xfc\x2f\x05\xd5\x9d\
-\xd2\x86\x8e\x68\xdb\xef\x2b\x02\x3a\x77\xf5\x18\xc8\xe6\xb6\xa9\
-\xac\xa1\xb1\x91\x9c\x50\x07\xe2\x9f\xed\x31\xfb\x34\x78\xf7\xfe\
-\x09\xef\xf1\x56\xcf\xe2\x67\xc2\xcd\x56\xfe\x3f\x08\x4f\x29\x5b\
-\x3d\x49\x40\x98\xe9\xe6\x42\x33\x69\x76\x08\x2b\x24\x6c\x7e\xe3\
-\x38\xc3\x7c\xb9\xf9\x94\x67\x43\xfe\x09\xeb\xfb\x30\xe8\x3f\xb5\
-\xc7\xc4\x4f\x10\x78\xff\x00\xe2\x67\x89\xa3\xf1\x24\xda\x7d\xe0\
-\x9a\xeb\xc3\xb3\xca\x5a\xee\xfe\x66\x1b\x84\xd7\x47\x39\x36\xfb\
-\xb2\x00\x5e\x18\xa6\x3e\x50\x36\x9f\xd8\x4f\x16\x78\x5f\x4a\xf1\
-\x97\x87\xef\xb4\x2d\x6f\x4e\xb7\xd5\x74\x8d\x42\x26\x82\xea\xce\
-\xe9\x03\xc5\x34\x6c\x30\x55\x81\xea\x31\xf9\x63\x8e\x40\xaf\xc7\
-\x0f\xda\x4f\xf6\x69\xf1\xf7\xfc\x13\xc7\xe2\xc5\x97\xc5\x0f\x85\
-\xb7\xd7\x67\xc1\x6d\x71\x8b\x7b\xd9\x14\xca\x2d\x37\xb0\xdd\x65\
-\x7c\x01\xfd\xe4\x2f\xd0\x39\xe1\xb0\xa3\x21\xc0\x34\x01\xfb\x39\
-\xa5\xe9\xf6\xba\x6d\x8c\x16\x76\x90\x47\x6d\x69\x6e\x8b\x14\x30\
-\x42\x02\xa2\x22\x8c\x28\x0a\x30\x00\xc0\xe8\x06\x06\x31\xda\xae\
-\x05\x0b\xd2\xbe\x7d\xfd\x90\xff\x00\x6b\xff\x00\x0b\xfe\xd5\xde\
-\x01\x1a\x96\x98\xeb\xa6\x78\x9a\xc5\x55\x75\x8d\x0a\x49\x03\x4b\
-\x6c\xfd\x37\xab\x7f\x1c\x2d\x8f\x96\x40\x3d\x8e\x08\xaf\x7f\x85\
-\x99\xb7\x06\xea\x3d\xb1\x9f\xc3\xb7\xff\x00\x5a\x80\x24\xa2\x8a\
-\x28\x00\xa2\x90\xe6\xa3\x0c\xdb\xbb\x11\xdb\x9f\xfe\xb5\x00\x4b\
-\x45\x35\x5b\x75\x3a\x80\x0a\x42\xa0\xe0\x91\xc8\xa5\xa6\xb3\x15\
-\x23\x1c\xfb\x50\x03\x25\x5f\x94\x72\x40\xcf\x38\xaf\xca\x7f\xf8\
-\x2a\x67\xec\x9b\xf0\xe7\xc0\x3a\x28\xf8\xa3\xe1\xbd\x4e\xcf\xc2\
-\x1a\xfd\xe5\xe2\xc7\x71\xa0\xc6\x76\xc7\xab\xb3\x37\xcd\x2c\x08\
-\xbf\xea\xe5\x5e\x5d\xf8\x11\x91\xcf\x0c\x3e\x6f\xd0\x1f\xda\x5b\
-\xf6\x92\xf0\x97\xec\xcb\xf0\xe2\xe7\xc5\x3e\x29\x9d\xa4\x62\x7c\
-\xab\x0d\x2e\x0c\x7d\xa6\xfe\x6c\x64\x24\x79\x3c\x01\xd5\x9c\xf0\
-\xa3\x9e\xb8\x07\xf2\x93\xe1\x9f\xc3\x4f\x8a\x1f\xf0\x54\x3f\x8e\
-\x97\xbe\x2c\xf1\x6d\xfd\xc6\x95\xe0\xab\x09\x8c\x37\x77\x56\xea\
-\x45\xbd\x8c\x3b\x83\x2d\x8d\x9a\xb7\xca\x64\x61\x82\x59\x81\xc7\
-\x0e\xe5\x89\x54\x20\x8c\x2f\xd9\xf3\xe0\x7f\xc5\x4f\xf8\x28\xa7\
-\xc4\x8b\x2b\xff\x00\x1c\xf8\x97\x55\xbb\xf0\xaf\x87\xa0\x86\xca\
-\xff\x00\xc4\x17\x58\x2d\x14\x68\x06\x2d\x60\xe3\x69\xb8\x70\x37\
-\x33\xb6\x48\xdc\x1d\xf7\x12\xaa\xff\x00\xb5\x3f\x0d\x7e\x1c\xf8\
-\x6b\xe1\x77\x82\xb4\x9f\x0b\xf8\x57\x49\x83\x48\xd0\xf4\xb8\x44\
-\x36\xd6\xb0\xa1\x5d\xa0\xfc\xcc\x5b\x3f\x31\x66\x27\x73\x16\x24\
-\x96\x39\x3c\xd1\xf0\xcb\xe1\xc7\x86\xbe\x15\x78\x37\x4b\xf0\xcf\
-\x85\x34\xa8\x74\x7d\x13\x4e\x88\x45\x6f\x6b\x08\x20\x81\x81\x92\
-\xc4\x9d\xcc\xcd\xd4\x96\x24\x93\xd6\xba\x95\x50\xbd\x06\x28\x01\
-\x55\x42\xf4\x18\xa5\xa2\x8a\x06\x14\x51\x45\x00\x14\x51\x45\x00\
-\x14\x51\x45\x00\x35\xa3\x59\x3e\xf0\xdc\x3d\x0f\x4a\xc8\xf1\x57\
-\x85\x74\x8f\x18\x78\x7e\xff\x00\x46\xd6\xf4\xcb\x5d\x5b\x4a\xbe\
-\x85\xed\xee\xac\xee\xe2\x12\x47\x2c\x6c\x0e\x54\xaf\x71\xcf\x4a\
-\xd9\xa6\xb4\x6a\xf8\xdc\xa0\xe3\xa6\x68\x03\xf1\x9b\xf6\x9a\xfd\
-\x98\xbc\x75\xff\x00\x04\xfb\xf8\xad\x65\xf1\x5f\xe1\x35\xe5\xe8\
-\xf0\x70\xb8\x01\x2e\x36\xb4\xbf\x60\xdc\x41\x36\x97\x63\x3f\xbd\
-\xb7\x60\x00\x56\x3d\x78\x53\x87\x0a\x6b\xf4\x63\xf6\x45\xfd\xb0\
-\x3c\x2d\xfb\x56\xf8\x14\xea\x5a\x6b\x47\xa5\xf8\x9e\xc4\x2a\xeb\
-\x3a\x03\xc9\x99\x6d\x9c\xf1\xe6\x2f\xf7\xa1\x63\xd2\x4f\xc0\xe0\
-\x83\x5e\xd7\xe2\x8f\x0e\xe9\x9e\x28\xd0\x6f\x34\x6d\x5f\x4f\xb6\
-\xd4\xf4\xbb\xe8\xda\xde\xe6\xce\xee\x31\x24\x72\xc6\xc0\x86\x56\
-\x43\xf7\x81\xee\x3e\xa7\xad\x7e\x3d\xfe\xd3\x7f\xb3\x37\x8e\x7f\
-\xe0\x9f\x3f\x15\xac\x7e\x2c\x7c\x26\xbb\xbc\xff\x00\x84\x35\x67\
-\xdb\x1c\xb8\x69\x7e\xc0\x1b\x93\x69\x76\x3f\xe5\xac\x0d\xd1\x5d\
-\xbd\x81\x3b\x95\x4d\x00\x7e\xc8\xc9\x74\x63\x50\x59\x94\x63\x24\
-\xe4\x60\x60\x03\xce\x3a\xf6\x3d\x33\xf4\xaf\x90\xbf\x68\x6f\xf8\
-\x2a\x17\xc2\x9f\x82\x77\x97\x5a\x3e\x8d\x3c\xde\x3f\xf1\x24\x05\
-\x91\xed\x74\x66\x5f\xb3\x44\xe3\x8d\xb2\x5c\x9f\x97\x39\xce\x42\
-\x6f\x23\x1c\x81\x5f\x11\x7c\x64\xfd\xb7\x3e\x2f\x7e\xdd\x5a\xb6\
-\x8b\xf0\xc7\xe1\xb6\x81\x75\xa0\xc1\x7f\x02\x26\xa1\xa6\x69\x57\
-\x5b\xa6\xbd\x9b\x0b\xe6\x34\xb3\xf0\x12\xd9\x7d\xc8\xe3\x97\x27\
-\x21\x47\xd5\x9f\xb3\x0f\xfc\x12\x8f\xc0\x3f\x0c\xec\xad\x35\x8f\
-\x89\x42\x0f\x1e\x78\x9c\xe2\x43\x63\x28\x2b\xa5\xda\xf1\xf7\x56\
-\x33\xcc\xbc\xf5\x67\xe0\xe0\x61\x47\x24\x84\x9f\x38\x5f\x7f\xc1\
-\x4c\x7f\x69\xbf\x8d\x97\xd2\xc3\xf0\xcb\xc1\x90\x58\xdb\x2c\x9b\
-\x57\xfb\x0b\x45\x97\x54\x99\x37\x7d\xd5\x79\x5c\x32\x7f\x09\xc7\
-\xc8\x87\xaf\x5e\xcb\x2f\x8f\xff\x00\xe0\xa1\x33\x9f\x33\xfb\x3b\
-\xc5\x80\xbb\x6e\xda\x34\x3b\x35\x03\xdb\x1b\x7f\xa5\x7e\xbb\xe8\
-\xba\x1e\x9f\xa0\xe9\xf0\xd8\x69\xb6\x36\xfa\x75\x8d\xba\xec\x86\
-\xde\xd6\x15\x8a\x38\xc7\xa2\xaa\x80\x00\xf6\x00\x55\xdf\x25\x31\
-\x82\x80\x8f\x43\xcd\x03\x3f\x1d\x64\xfd\xbf\x3f\x6c\x1f\x81\xb7\
-\x2d\x2f\xc4\x0f\x0a\x3d\xe5\x84\x45\x52\x4f\xf8\x48\x3c\x32\xf6\
-\xd1\x8c\xfa\x4d\x08\x8d\x73\xee\x49\xfa\x57\xd2\x5f\x01\xbf\xe0\
-\xaf\x3f\x0e\x7e\x21\xdd\x43\xa6\x78\xf3\x4f\x9b\xe1\xee\xa5\x37\
-\xca\x97\xaf\x29\xb9\xd3\x99\xba\x7c\xd2\x85\x0d\x16\x4f\x76\x4d\
-\xa3\x3c\xb5\x7d\xeb\x35\xac\x37\x11\xb4\x72\xc6\xb2\xc4\xca\x51\
-\xa3\x71\x95\x20\xf6\x20\xf6\xaf\x91\x7f\x69\x2f\xf8\x26\x8f\xc2\
-\x8f\x8d\x96\x77\x37\xda\x26\x9b\x07\x80\x7c\x5a\xca\xcd\x0e\xa5\
-\xa3\x44\x23\x82\x57\xc6\x42\xcd\x6e\x3e\x47\x04\xf5\x2a\x03\x7b\
-\x9e\x94\x0b\x53\xea\xfd\x1f\x59\xb5\xd7\xb4\xf8\x2f\xf4\xfb\xc8\
-\x2f\xec\x2e\x50\x49\x05\xcd\xa4\x8b\x24\x52\x29\xe4\x15\x70\x4a\
-\xb0\xc7\x70\x6b\xcd\xff\x00\x68\xef\xda\x3b\xc2\xbf\xb3\x47\xc3\
-\xb9\xfc\x59\xe2\x7b\x9d\xeb\x93\x1d\x96\x99\x0b\x01\x73\x7f\x31\
-\x07\x11\xc6\x0f\xe6\xcc\x78\x51\x96\x27\x80\x0f\xe5\x47\x83\x7e\
-\x2c\x7c\x6e\xff\x00\x82\x5f\xfc\x4d\x1e\x11\xf1\x55\xa3\xeb\x7e\
-\x07\xbb\x7d\xeb\xa7\x99\x8b\x59\xde\x45\x93\xfb\xfb\x19\xd8\x62\
-\x39\x39\xe5\x48\x1c\xe0\x32\x7d\xd6\x0c\xf8\x7b\xf0\xef\xe2\x5f\
-\xfc\x15\x3b\xe3\xad\xd7\x8b\x3c\x55\x70\xfa\x47\x80\xb4\xc9\x44\
-\x57\x37\x16\xc3\xf7\x16\x10\xe0\x11\x65\x68\x1b\xe5\x69\x99\x76\
-\x96\x76\xfb\xb9\x0c\xd9\xf9\x10\x83\x17\xe1\xcf\xc3\xcf\x89\xff\
-\x00\xf0\x54\x8f\x8e\xf7\x3e\x2c\xf1\x55\xd4\xba\x37\x81\x34\xb9\
-\x84\x73\xdd\x5b\x2e\x20\xb1\x83\x82\x2c\xed\x03\x0c\x19\x98\x63\
-\x73\xb0\xf9\x70\x19\xb3\xf2\x21\xfd\x87\xf8\x65\xf0\xeb\xc3\x9f\
-\x0a\xfc\x15\xa4\xf8\x5b\xc2\xba\x64\x3a\x4e\x87\xa5\xc4\x21\xb7\
-\xb5\x85\x4a\xed\xcf\x2c\x5b\x3c\x96\x62\x4b\x31\x6c\x92\xcc\x49\
-\xe6\x8f\x86\x7f\x0e\x7c\x37\xf0\xb3\xc1\x7a\x5f\x85\xfc\x2d\xa5\
-\xc3\xa5\x68\x9a\x6c\x22\x18\x2d\xa2\x52\x31\x9e\x59\x9b\x3c\xb3\
-\xb1\x3b\x99\x98\x92\x49\xc9\xe6\xba\xa5\x50\xb9\xc0\xc5\x03\x11\
-\x51\x57\xee\x8c\x76\xa7\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\
-\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x21\x50\xc4\
-\x12\x39\x15\x95\xe2\x7f\x0d\xe9\x7e\x2c\xd0\x6f\xb4\x5d\x66\xc6\
-\xdf\x53\xd2\x75\x08\x5e\xda\xea\xca\xe9\x04\x91\x4f\x1b\x29\x0c\
-\xac\xa7\xef\x02\x33\xc5\x6b\x53\x5e\x35\x90\x61\x86\x45\x00\x7e\
-\x2e\xfe\xd4\x1f\xb2\xdf\x8e\x3f\x60\x3f\x89\xf6\x5f\x14\x7e\x13\
-\xea\x37\xcd\xe0\xf5\x9f\xf7\x37\x7f\xeb\x5f\x4f\xdd\xd6\xd6\xe8\
-\x1e\x24\x81\xfa\x06\x6e\x08\x04\x37\xcc\xa0\xd7\xe8\xa7\xec\x71\
-\xfb\x63\x78\x67\xf6\xae\xf0\x3f\xda\xad\xda\x2d\x23\xc5\xf6\x0a\
-\xa3\x57\xd0\xcc\x9c\xc6\xdb\x7f\xd7\x45\x93\x97\x85\x8e\x48\x6e\
-\xa3\xee\xb7\x4c\x9f\x79\xf1\x37\x87\x34\xcf\x14\x68\x37\xba\x46\
-\xad\x61\x6f\xa9\x69\x77\xb1\xb4\x37\x36\x77\x51\xf9\x91\xca\x8c\
-\x08\x60\x53\xb8\x3e\x9f\x8f\x5a\xfc\x73\xfd\xa9\xff\x00\x65\x8f\
-\x1a\xfe\xc0\xbf\x14\x6c\x7e\x2b\x7c\x29\xbc\xbc\x8f\xc2\x29\x70\
-\x1a\x2b\xb1\x99\x1f\x4d\x66\x20\x9b\x6b\x9c\xf1\x34\x2c\x48\xc3\
-\xb7\x07\x1b\x49\x0c\x01\xa0\x0f\xd9\xf8\xfb\xfa\xf1\xd8\x67\xf1\
-\xf7\xa9\x2b\xe7\x4f\xd8\xef\xf6\xc8\xf0\xcf\xed\x5d\xe0\x93\x73\
-\x6a\xf1\xe9\x5e\x2d\xb0\x55\x1a\xb6\x86\xf2\x65\xa2\x62\x3f\xd6\
-\xc5\x9e\x5e\x16\xe4\x86\xea\xbf\x74\x8e\x32\x7e\x85\x59\x1b\x24\
-\x75\xc7\x6c\x73\x9f\x4a\x00\x91\x98\xa9\x18\xe7\xda\xbc\x9f\xf6\
-\x92\xfd\xa3\x7c\x29\xfb\x33\xfc\x3b\xb8\xf1\x67\x8a\x6e\xca\xa2\
-\xee\x8a\xcb\x4f\x88\x8f\xb4\x6a\x13\xed\xca\xc5\x10\x3e\xbd\x4b\
-\x1e\x14\x0c\x93\xc6\x09\xfb\x48\xfe\xd1\xde\x15\xfd\x99\xbe\x1d\
-\xdc\x78\xb3\xc5\x17\x44\x22\x93\x1d\x96\x9f\x16\x3c\xfb\xf9\xf1\
-\xf2\xc5\x18\x27\xbf\x52\xc7\x85\x03\x24\xf1\x83\xf9\x3d\xe0\x5f\
-\x02\xfc\x51\xff\x00\x82\xa3\xfc\x7d\x9f\xc4\x3e\x24\x9e\x5d\x1f\
-\xc1\xba\x7c\xa2\x2b\x8b\xa8\x14\x8b\x7d\x36\x0f\xbc\x2d\x2d\x41\
-\xe1\xe6\x75\x03\x2c\x79\xe8\xed\xc2\xaa\xd0\x03\xbc\x03\xe0\x9f\
-\x8a\x3f\xf0\x54\x8f\x8f\x97\x1e\x21\xf1\x2d\xd4\xda\x37\x82\xec\
-\x25\x11\x5c\xdc\x40\xa4\x5b\x69\xd0\x1c\x30\xb4\xb6\x53\xc3\xcc\
-\xea\x01\x24\xf3\xd1\xdf\x21\x55\x2b\xf6\x33\xe1\x8f\xc3\x5f\x0e\
-\x7c\x25\xf0\x4e\x95\xe1\x3f\x0b\x69\x71\x69\x5a\x1e\x97\x08\x82\
-\xde\xda\x35\xe7\x07\xe6\x66\x72\x79\x77\x66\x25\x99\x89\x25\x98\
-\x92\x79\xa6\xfc\x2d\xf8\x5d\xe1\x9f\x83\xfe\x07\xd3\x3c\x23\xe1\
-\x4d\x2e\x0d\x2f\x42\xd3\xa3\xf2\xe1\xb7\x89\x71\xbb\x3c\xb3\xb9\
-\xfe\x37\x63\x92\xcc\x7a\x92\x6b\xae\x55\x0b\x9c\x7f\x3a\x00\x15\
-\x42\xe7\x03\x14\xb4\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x0d\x68\xd5\xf1\xb8\x67\x1d\x2b\x2b\xc4\x9e\x1f\xd3\
-\x3c\x4b\xa1\xde\xe8\xda\xb5\x95\xbe\xa1\xa6\x5f\x44\xf0\xdc\x5a\
-\x5d\x46\x24\x8a\x54\x61\x86\x0c\xa7\xa8\x39\xfd\x7d\x79\xad\x7a\
-\x6b\x28\x6e\xa3\x34\x01\xf8\xcf\xfb\x51\x7e\xc9\x1e\x36\xfd\x83\
-\x3e\x23\x5a\x7c\x5c\xf8\x47\xa8\xdd\xb7\x85\x60\xb8\x0f\xe7\x1c\
-\xcb\x26\x96\x58\xe4\xdb\xdc\x83\x9f\x3a\x07\x38\x02\x46\xc7\x5d\
-\xac\x01\x01\xcf\xd8\xbf\x0f\x7f\xe0\xa8\x5f\x0c\x7c\x41\xf0\x0a\
-\xf3\xc7\x7e\x23\xbc\x1a\x27\x88\xb4\xad\x90\x5f\x78\x59\x1c\x3d\
-\xd5\xcd\xcb\x2f\xca\x2d\x01\xff\x00\x59\x1c\x84\x12\x18\xe0\x20\
-\x07\x79\x50\x01\xaf\xb0\xf5\xed\x1e\xc7\x5c\xd2\x6e\x74\xed\x42\
-\xd6\x1b\xdb\x1b\xa8\x9e\x19\xad\xee\x10\x3c\x72\x23\x02\xac\xac\
-\xa7\xa8\x20\x91\x8e\xf9\xf7\xaf\xcb\x7f\x89\x7f\xf0\x48\x19\xf5\
-\x0f\x8f\xf6\x69\xe1\x3d\x5d\x6c\x3e\x15\xdf\xb3\x5c\x5e\xb4\xad\
-\xba\xef\x4c\x50\xd9\x6b\x68\x94\xff\x00\xac\xdc\x49\xd8\xe7\x85\
-\xf9\xb7\x67\x67\xcc\x01\xe3\xfe\x09\xf0\x2f\xc5\x0f\xf8\x2a\x57\
-\xc7\xeb\x8f\x12\x78\x86\x59\xb4\x4f\x04\xe9\xf3\x79\x13\xdc\x40\
-\x0f\xd9\xb4\xd8\x06\x1b\xec\x96\xb9\x1b\x5e\x76\x50\x32\x7a\x8e\
-\x1d\xf8\x0a\xa7\xf6\x2f\xe1\x6f\xc2\xff\x00\x0c\xfc\x20\xf0\x36\
-\x9b\xe1\x1f\x0a\x69\x70\x69\x7a\x16\x9f\x1f\x97\x0d\xbc\x4b\xf7\
-\xb3\xcb\x3b\x9f\xe2\x76\x39\x2c\xc7\xa9\x26\x9b\xf0\xaf\xe1\x8f\
-\x86\x3e\x10\xf8\x26\xc3\xc2\x3e\x13\xd2\xed\xf4\xbd\x0b\x4e\x8c\
-\x47\x15\xb4\x3f\x31\x24\x8c\xb3\xbb\x75\x77\x63\xf3\x33\x1c\x92\
-\x4e\x4f\x51\x5d\x82\xa8\x5e\x94\x00\x2a\x85\x18\x14\xb4\x51\x40\
-\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\
-\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\
-\x05\x14\x51\x40\x0d\x78\xd6\x41\x86\x50\xc3\x18\xc1\xf4\xf4\xa4\
-\x30\xa3\x75\x5c\xf3\x9a\x28\xa0\x05\x55\x0a\x49\x03\x19\xeb\x4e\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\xff\xd9\
-\x00\x00\x46\x2f\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x01\x03\x01\x02\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x53\
-\xa2\x8a\xe6\xfc\x65\xe3\x9d\x1b\xc0\x1e\x1a\xd4\xfc\x43\xe2\x2d\
-\x4e\x0d\x1b\x44\xd3\xa0\x6b\x9b\x9b\xcb\xb7\xd8\x89\x18\x20\x67\
-\xdc\x92\x40\x00\x72\x4b\x28\xea\x45\x00\x74\x44\xe3\x39\xe0\x57\
-\x03\xf1\x17\xe3\xb7\xc3\xef\x84\x7b\x4f\x8c\xbc\x6d\xa1\x78\x6e\
-\x42\x9b\xc5\xbe\xa3\x7f\x14\x53\xb8\xf5\x58\xcb\x6e\x61\xf4\x04\
-\xd7\xe4\xff\x00\xed\x65\xff\x00\x05\x5a\xf1\x9f\xc4\xcb\xeb\xdd\
-\x03\xe1\x65\xc5\xd7\x82\x7c\x24\xa4\xa0\xd5\xa3\xf9\x35\x3b\xd1\
-\xdd\xc3\xe7\xf7\x0b\xe8\xa9\x86\xe3\xef\xff\x00\x0d\x7e\x7f\xdf\
-\x6a\x57\x7a\xa5\xe4\xb7\x97\x97\x53\x5d\xdd\xcc\xfe\x64\x97\x13\
-\xc8\x5e\x47\x6f\xef\x16\x27\x24\xfb\x9a\x00\xfd\xfd\xbe\xff\x00\
-\x82\x9a\x7e\xcd\x36\x12\x18\xa4\xf8\x9d\x11\x6f\xfa\x63\xa4\x6a\
-\x12\x8f\xcd\x6d\xcd\x41\xff\x00\x0f\x46\xfd\x98\xff\x00\xe8\xa6\
-\x7f\xe5\x03\x54\xff\x00\xe4\x6a\xfc\x05\x5c\xfa\x1d\x9d\xf1\xff\
-\x00\xea\xa6\xed\x1e\xbf\xca\x80\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\
-\xfd\x14\xcf\xfc\xa0\x6a\x9f\xfc\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\
-\x00\xa2\x99\xff\x00\x94\x0d\x53\xff\x00\x91\xab\xf0\x0f\x68\xf5\
-\xfe\x54\x6d\x1e\xbf\xca\x80\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\
-\x14\xcf\xfc\xa0\x6a\x9f\xfc\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\x00\
-\xa2\x99\xff\x00\x94\x0d\x53\xff\x00\x91\xab\xf0\x0f\x68\xf5\xfe\
-\x54\x6d\x1e\xbf\xca\x80\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\
-\xcf\xfc\xa0\x6a\x9f\xfc\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\
-\x99\xff\x00\x94\x0d\x53\xff\x00\x91\xab\xf0\x0f\x68\xf5\xfe\x54\
-\x6d\x1e\xbf\xca\x80\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\xcf\
-\xfc\xa0\x6a\x9f\xfc\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\x99\
-\xff\x00\x94\x0d\x53\xff\x00\x91\xab\xf0\x0f\x68\xf5\xfe\x54\x6d\
-\x1e\xbf\xca\x80\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\xcf\xfc\
-\xa0\x6a\x9f\xfc\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\x99\xff\
-\x00\x94\x0d\x53\xff\x00\x91\xab\xf0\x0f\x68\xf5\xfe\x54\x6d\x1e\
-\xbf\xca\x80\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\xcf\xfc\xa0\
-\x6a\x9f\xfc\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\x99\xff\x00\
-\x94\x0d\x53\xff\x00\x91\xab\xf0\x0f\x68\xf5\xfe\x54\x6d\x1e\xbf\
-\xca\x80\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\xcf\xfc\xa0\x6a\
-\x9f\xfc\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\x99\xff\x00\x94\
-\x0d\x53\xff\x00\x91\xab\xf0\x0f\x68\xf5\xfe\x54\x6d\x1e\xbf\xca\
-\x80\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\xcf\xfc\xa0\x6a\x9f\
-\xfc\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\x99\xff\x00\x94\x0d\
-\x53\xff\x00\x91\xab\xf0\x0f\x68\xf5\xfe\x54\x6d\x1e\xbf\xca\x80\
-\x3f\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\xcf\xfc\xa0\x6a\x9f\xfc\
-\x8d\x47\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\x99\xff\x00\x94\x0d\x53\
-\xff\x00\x91\xab\xf0\x0f\x68\xf5\xfe\x54\x6d\x1e\xbf\xca\x80\x3f\
-\x7f\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\xcf\xfc\xa0\x6a\x9f\xfc\x8d\
-\x47\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\x99\xff\x00\x94\x0d\x53\xff\
-\x00\x91\xab\xf0\x0f\x68\xf5\xfe\x54\x6d\x1e\xbf\xca\x80\x3f\x7f\
-\x3f\xe1\xe8\xdf\xb3\x1f\xfd\x14\xcf\xfc\xa0\x6a\x9f\xfc\x8d\x47\
-\xfc\x3d\x1b\xf6\x63\xff\x00\xa2\x99\xff\x00\x94\x0d\x53\xff\x00\
-\x91\xab\xf0\x0f\x68\xf5\xfe\x54\x9b\x7d\xff\x00\x5a\x00\xfe\x89\
-\x7c\x23\xfb\x7d\xfe\xcf\x9e\x35\x99\x21\xd3\xbe\x2a\x68\x50\xca\
-\xc7\x00\x6a\x8f\x26\x9e\x3f\x3b\x95\x8e\xbd\xc6\xc3\x56\xb7\xd5\
-\xac\xe0\xbc\xb0\xba\x86\xf2\xd2\xe1\x43\x43\x3c\x12\x2b\xc7\x2a\
-\xff\x00\x79\x58\x12\x08\xfd\x6b\xf9\x6c\xe5\x0f\xa1\x07\x3c\x67\
-\x8f\xc2\xbd\x5f\xe0\x6f\xed\x31\xf1\x2b\xf6\x76\xd5\x85\xf7\x82\
-\x7c\x4f\x77\xa4\xc1\xbb\x7c\xda\x7c\x8d\xe6\x59\x5c\x74\xe2\x48\
-\x58\xed\x63\xee\x06\xe1\xd8\xd0\x07\xf4\x9b\x45\x7c\x8b\xfb\x14\
-\xff\x00\xc1\x41\xbc\x2f\xfb\x55\x59\x8d\x13\x52\x48\x7c\x31\xf1\
-\x0a\x08\xcb\x4d\xa4\x3c\xb9\x86\xf0\x0e\xb2\x5b\x39\xe5\x80\xee\
-\x87\xe6\x5f\xf6\x87\xcd\x5f\x5d\x50\x01\x45\x14\x50\x02\x12\x07\
-\x5a\xfc\x42\xff\x00\x82\x9c\x7e\xd7\xd7\x7f\x1c\xbe\x25\x5e\xf8\
-\x03\xc3\xba\x83\x0f\x02\x78\x62\xe5\xa3\x71\x0b\x7c\xba\x95\xea\
-\x7c\xb2\x4c\xf8\x38\x2a\x8d\xb9\x23\x1d\xf9\x6f\xe2\x15\xfa\x97\
-\xfb\x6a\x7c\x5c\x9f\xe0\x7f\xec\xc3\xe3\xdf\x16\x58\xdc\x35\xbe\
-\xa9\x0d\x88\xb5\xb0\x91\x58\xab\x25\xcd\xc3\xac\x11\xba\xe3\x9c\
-\xa9\x93\x7f\x1f\xdc\xcd\x7f\x39\x6d\x23\x33\x12\x58\x92\xc7\x24\
-\x93\xd4\xd0\x07\x77\xf0\x9f\xe1\x27\x89\xfe\x39\x78\xfb\x4c\xf0\
-\x87\x83\x34\x96\xd4\xb5\xbb\xe2\x42\x46\xa7\x11\xc2\x83\xef\x4b\
-\x23\xf4\x44\x5e\xa5\xcf\x1d\x87\x24\x29\xfd\x75\xfd\x9f\x7f\xe0\
-\x92\x3f\x0b\xfe\x1d\xe9\xf6\xb7\xbf\x10\x95\xbe\x20\x78\x8b\x6a\
-\xb4\x91\xc9\x23\xc3\xa7\x42\xfe\x89\x0a\x61\xa4\x1d\x79\x91\x88\
-\x3d\x91\x6b\xaa\xff\x00\x82\x61\xfe\xcd\x56\x7f\x04\x7e\x00\xe9\
-\xde\x25\xbd\xb5\x4f\xf8\x4b\xbc\x65\x6d\x16\xa7\x79\x3c\x8b\x87\
-\x86\xd5\x81\x6b\x78\x07\x70\x36\x15\x76\xff\x00\x6e\x42\x0f\x08\
-\x2b\xec\xcc\x03\x9c\x8c\xd0\x07\x99\x69\xbf\xb3\x47\xc2\x1d\x1e\
-\x15\x82\xcf\xe1\x6f\x82\xe0\x40\x31\xb5\x34\x0b\x40\x4f\xd4\xf9\
-\x75\xa1\xff\x00\x0c\xfd\xf0\xbb\xfe\x89\xb7\x84\x7f\xf0\x45\x6b\
-\xff\x00\xc6\xeb\xbd\xa6\x13\x8e\xe4\x71\x93\xed\xf8\xd0\x07\x0b\
-\xff\x00\x0c\xfd\xf0\xbb\xfe\x89\xb7\x84\x7f\xf0\x45\x6b\xff\x00\
-\xc6\xe8\xff\x00\x86\x7e\xf8\x5d\xff\x00\x44\xdb\xc2\x3f\xf8\x22\
-\xb5\xff\x00\xe3\x75\xdd\xe7\xd3\x3f\x95\x2f\x34\x01\xc1\xff\x00\
-\xc3\x3f\x7c\x2e\xff\x00\xa2\x6d\xe1\x1f\xfc\x11\x5a\xff\x00\xf1\
-\xba\x3f\xe1\x9f\xbe\x17\x7f\xd1\x36\xf0\x8f\xfe\x08\xad\x7f\xf8\
-\xdd\x77\x9c\xd1\xcd\x00\x70\x7f\xf0\xcf\xdf\x0b\xbf\xe8\x9b\x78\
-\x47\xff\x00\x04\x56\xbf\xfc\x6e\x8f\xf8\x67\xef\x85\xdf\xf4\x4d\
-\xbc\x23\xff\x00\x82\x2b\x5f\xfe\x37\x5d\xe7\x34\x73\x40\x1c\x1f\
-\xfc\x33\xf7\xc2\xef\xfa\x26\xde\x11\xff\x00\xc1\x15\xaf\xff\x00\
-\x1b\xa3\xfe\x19\xfb\xe1\x77\xfd\x13\x6f\x08\xff\x00\xe0\x8a\xd7\
-\xff\x00\x8d\xd7\x79\xcd\x35\x58\xf0\x73\xc1\xe9\xc7\xf5\xcd\x00\
-\x70\xbf\xf0\xcf\xdf\x0b\xbf\xe8\x9b\x78\x47\xff\x00\x04\x56\xbf\
-\xfc\x6e\x8f\xf8\x67\xef\x85\xdf\xf4\x4d\xbc\x23\xff\x00\x82\x2b\
-\x5f\xfe\x37\x5d\xf5\x14\x01\xc0\xff\x00\xc3\x3f\x7c\x2e\xff\x00\
-\xa2\x6d\xe1\x1f\xfc\x11\x5a\xff\x00\xf1\xba\x3f\xe1\x9f\xbe\x17\
-\x7f\xd1\x36\xf0\x8f\xfe\x08\xad\x7f\xf8\xdd\x77\xd4\x50\x07\x03\
-\xff\x00\x0c\xfd\xf0\xbb\xfe\x89\xb7\x84\x7f\xf0\x45\x6b\xff\x00\
-\xc6\xe8\xff\x00\x86\x7e\xf8\x5d\xff\x00\x44\xdb\xc2\x3f\xf8\x22\
-\xb5\xff\x00\xe3\x75\xdf\x54\x59\x38\xe4\xf3\xe8\x39\xc7\xf5\xa0\
-\x0e\x1b\xfe\x19\xfb\xe1\x77\xfd\x13\x6f\x08\xff\x00\xe0\x8a\xd7\
-\xff\x00\x8d\xd1\xff\x00\x0c\xfd\xf0\xbb\xfe\x89\xb7\x84\x7f\xf0\
-\x45\x6b\xff\x00\xc6\xeb\xbc\xe6\x8e\x68\x03\x83\xff\x00\x86\x7e\
-\xf8\x5d\xff\x00\x44\xdb\xc2\x3f\xf8\x22\xb5\xff\x00\xe3\x74\x7f\
-\xc3\x3f\x7c\x2e\xff\x00\xa2\x6d\xe1\x1f\xfc\x11\x5a\xff\x00\xf1\
-\xba\xef\x39\xa3\x9a\x00\xe0\xff\x00\xe1\x9f\xbe\x17\x7f\xd1\x36\
-\xf0\x8f\xfe\x08\xad\x7f\xf8\xdd\x1f\xf0\xcf\xdf\x0b\xbf\xe8\x9b\
-\x78\x47\xff\x00\x04\x56\xbf\xfc\x6e\xbb\xce\x68\xe6\x80\x38\x3f\
-\xf8\x67\xef\x85\xdf\xf4\x4d\xbc\x23\xff\x00\x82\x2b\x5f\xfe\x37\
-\x47\xfc\x33\xf7\xc2\xef\xfa\x26\xde\x11\xff\x00\xc1\x15\xaf\xff\
-\x00\x1b\xae\xe5\x99\x8f\x0a\x79\xef\xcf\x4f\xd2\xa5\xa0\x0f\x9f\
-\x3e\x21\x7e\xc2\x7f\x01\xfe\x26\x58\xc9\x6f\xa8\xfc\x32\xd0\x6c\
-\x24\x65\x20\x5d\x68\x76\xab\xa7\x4e\x87\xd7\x7c\x1b\x41\x3e\xcd\
-\x91\x5f\x98\x3f\xb6\x87\xfc\x13\x33\x5d\xfd\x9d\xf4\xcb\xdf\x19\
-\x78\x26\xf2\xef\xc5\xde\x03\x81\xb7\xdd\x24\xb1\x83\x7d\xa5\xa0\
-\xfe\x29\x82\x0d\xb2\x46\x3a\x99\x14\x2e\xdf\xe2\x50\x3e\x6a\xfd\
-\xc0\xc7\xb5\x43\x79\x63\x6d\xa8\x5a\xcd\x6d\x75\x6f\x15\xcd\xb4\
-\xc8\xd1\xc9\x0c\xc8\x1d\x1d\x5b\xef\x2b\x03\xc1\x07\xb8\x34\x01\
-\xfc\xbd\x78\x57\xc5\x1a\xaf\x82\xfc\x45\xa6\xeb\x9a\x1d\xec\xfa\
-\x5e\xaf\x61\x3a\x5c\x5a\x5e\x5a\xb1\x59\x61\x91\x7a\x32\x91\x5f\
-\xd0\x3f\xec\x51\xfb\x4f\x5b\x7e\xd4\xff\x00\x04\xec\x3c\x48\xf2\
-\x47\x0f\x88\xec\x48\xd3\xf5\xcb\x48\xf0\x04\x77\x6a\xab\xfb\xc5\
-\x1d\x92\x50\xc1\xd7\xb0\xcb\x2f\x54\x35\xf8\xdf\xfb\x7b\xfe\xce\
-\x70\x7e\xcd\x7f\xb4\x26\xaf\xe1\xfd\x2e\x32\x9e\x1a\xd5\x22\x5d\
-\x63\x48\x03\x9f\x2e\xde\x42\xc0\xc3\x9f\x48\xe4\x49\x10\x77\x2a\
-\x14\x9e\x4d\x7a\xbf\xfc\x12\x27\xe2\xe4\xde\x05\xfd\xa7\x3f\xe1\
-\x13\x9a\x5d\xba\x5f\x8c\x2c\x24\xb5\x68\x89\xc2\x8b\x98\x50\xcd\
-\x0c\x9f\x5d\xa2\x54\x1f\xf5\xd6\x80\x3f\x6f\xa8\xa2\x8a\x00\xf8\
-\x2f\xfe\x0b\x2f\xa9\x4d\xa7\xfe\xca\x3a\x3c\x31\x37\xcb\x7b\xe2\
-\xab\x4b\x79\x31\xfd\xdf\xb3\x5d\xc9\xff\x00\xa1\x46\xb5\xf8\xb3\
-\xa4\x58\xff\x00\x69\x6a\xd6\x56\x9d\x05\xc4\xc9\x0e\x7f\xde\x21\
-\x73\x5f\xb3\x7f\xf0\x5a\x92\x57\xf6\x59\xf0\xb6\x38\xff\x00\x8a\
-\xca\xd4\x7f\xe4\x8d\xf1\xaf\xc6\xef\x08\x93\xff\x00\x09\x66\x8b\
-\xff\x00\x5f\xd0\xff\x00\xe8\xc5\xa0\x0f\xea\x16\xc3\x4f\x83\x4b\
-\xb1\xb7\xb4\xb6\x8c\x45\x6f\x6e\x82\x28\x90\x74\x55\x03\x00\x01\
-\xe8\x00\xc5\x5b\xa4\xda\x3d\x29\xac\xc1\x46\x49\xe3\xa9\x24\xe0\
-\x01\x40\x1e\x0d\xfb\x56\xfe\xd7\x5e\x12\xfd\x94\x3c\x0a\xba\xce\
-\xb8\xd2\x6a\x5a\xcd\xee\xf5\xd2\x74\x38\x1c\x24\xd7\xcc\xa0\x6e\
-\x25\x8f\x09\x1a\x96\x52\xd2\x63\x18\x65\x0b\xb8\x90\xa7\xf1\xdf\
-\xe3\x37\xfc\x14\x67\xe3\x9f\xc6\x3d\x4a\x43\x27\x8b\xef\x3c\x25\
-\xa5\x31\xdd\x1e\x97\xe1\x99\x1a\xc9\x11\x79\xe0\xc8\xa4\x4a\xff\
-\x00\xf0\x27\x22\xb8\xcf\xdb\x1b\xe3\xd5\xdf\xed\x19\xf1\xf7\xc4\
-\xde\x2c\x96\xe1\xe6\xd3\x16\xe1\xec\xb4\x88\xcb\x12\xb1\x58\xc6\
-\xc4\x44\x14\x7f\x0e\xee\x64\x38\xea\x64\x26\xba\xdf\xd8\xdf\xf6\
-\x1e\xf1\x37\xed\x75\xad\x6a\x0f\x6b\x7e\x9e\x1c\xf0\x96\x96\xeb\
-\x1d\xfe\xb7\x34\x06\x6c\x4a\xc0\x11\x0c\x51\xee\x5d\xef\x83\x93\
-\x96\x01\x46\x09\xe5\x95\x58\x03\xc5\x4f\xc6\xcf\x88\x8c\xdb\x8f\
-\x8f\x7c\x4e\x5b\xd7\xfb\x62\xe3\x3f\xfa\x1d\x37\xfe\x17\x57\xc4\
-\x2f\xfa\x1f\x3c\x4d\xff\x00\x83\x8b\x8f\xfe\x2e\xbf\x55\xe1\xff\
-\x00\x82\x27\xfc\x36\x58\xd4\xcb\xf1\x03\xc5\x05\x87\x52\xb1\x5b\
-\x28\xfd\x63\xa7\xff\x00\xc3\x92\xbe\x1a\xff\x00\xd0\xff\x00\xe2\
-\xbf\xfb\xf7\x6d\xff\x00\xc6\xe8\x03\xf2\x97\xfe\x17\x57\xc4\x2f\
-\xfa\x1f\x3c\x4d\xff\x00\x83\x8b\x8f\xfe\x2e\x8f\xf8\x5d\x5f\x10\
-\xbf\xe8\x7c\xf1\x37\xfe\x0e\x2e\x3f\xf8\xba\xfd\x5a\xff\x00\x87\
-\x25\x7c\x35\xff\x00\xa1\xff\x00\xc5\x7f\xf7\xee\xdb\xff\x00\x8d\
-\xd1\xff\x00\x0e\x4a\xf8\x6b\xff\x00\x43\xff\x00\x8a\xff\x00\xef\
-\xdd\xb7\xff\x00\x1b\xa0\x0f\xca\x5f\xf8\x5d\x5f\x10\xbf\xe8\x7c\
-\xf1\x37\xfe\x0e\x2e\x3f\xf8\xba\x3f\xe1\x75\x7c\x42\xff\x00\xa1\
-\xf3\xc4\xdf\xf8\x38\xb8\xff\x00\xe2\xeb\xf5\x6b\xfe\x1c\x95\xf0\
-\xd7\xfe\x87\xff\x00\x15\xff\x00\xdf\xbb\x6f\xfe\x37\x47\xfc\x39\
-\x2b\xe1\xaf\xfd\x0f\xfe\x2b\xff\x00\xbf\x76\xdf\xfc\x6e\x80\x3f\
-\x29\x7f\xe1\x75\x7c\x42\xff\x00\xa1\xf3\xc4\xdf\xf8\x38\xb8\xff\
-\x00\xe2\xeb\xd1\xbe\x19\xfe\xdb\x5f\x1b\xfe\x14\xea\x09\x77\xa3\
-\x7c\x46\xd7\x27\x89\x79\x36\x5a\xbd\xe3\xdf\x5b\x3a\xff\x00\x77\
-\xca\x9d\x99\x47\xd5\x40\x6f\x7a\xfd\x14\xff\x00\x87\x25\x7c\x35\
-\xff\x00\xa1\xff\x00\xc5\x7f\xf7\xee\xdb\xff\x00\x8d\xd7\xcb\x7f\
-\xb6\x4f\xfc\x13\x13\x5b\xfd\x9b\xfc\x1f\x73\xe3\x6f\x0c\x6b\xcd\
-\xe3\x0f\x09\xda\xba\xad\xfa\xcd\x6b\xe4\xdd\xd9\x2b\x60\x2c\x87\
-\x6b\x32\xc8\x9b\x88\x05\x80\x52\x0b\x0f\x97\x19\x6a\x00\xfb\xcb\
-\xf6\x1f\xff\x00\x82\x88\x68\xdf\xb5\x2b\x27\x85\xb5\xeb\x58\x7c\
-\x39\xf1\x12\x18\xda\x4f\xb1\xc4\xe4\xdb\x6a\x28\xab\xb9\xa4\xb7\
-\xdc\x77\x02\xa3\x96\x8d\x89\x38\x1b\x95\x98\x06\xc7\xd9\xd5\xfc\
-\xbb\xf8\x37\xc5\xda\xaf\x80\xbc\x53\xa5\x78\x87\x43\xbc\x93\x4f\
-\xd5\xf4\xbb\x98\xee\xed\x2e\x22\x27\x72\x48\xad\xb9\x4e\x3b\x8c\
-\x80\x08\xaf\xe9\x27\xe0\x57\xc5\x08\x3e\x33\xfc\x1f\xf0\x8f\x8d\
-\xed\x93\xc9\x4d\x73\x4e\x8a\xed\xe1\x07\x3e\x4c\xa5\x40\x92\x3f\
-\x7d\xae\x1c\x7e\x14\x01\xdf\xd7\x2b\xe3\xcf\x1e\xe8\x9f\x0b\x7c\
-\x1f\xab\x78\xa3\xc4\xfa\x9c\x3a\x4f\x87\xf4\xa8\x0d\xc5\xdd\xed\
-\xcb\xe0\x28\xc8\xc2\x81\xd4\xb3\x31\x0a\x14\x72\xcc\xca\xaa\x09\
-\x20\x57\x55\x5f\x91\x5f\xf0\x59\x6f\x8f\x57\x9a\x97\x8d\x74\x0f\
-\x84\x9a\x7d\xc3\x45\xa5\xe9\x96\xe9\xac\x6a\x6a\xad\xfe\xba\xe6\
-\x40\xcb\x12\x10\x3b\x47\x18\x2d\xcf\xfc\xf6\xff\x00\x64\x50\x07\
-\x0d\xfb\x4c\x7f\xc1\x59\xbe\x23\xfc\x46\xd5\xef\x34\xef\x86\x97\
-\x12\xf8\x0b\xc2\x8a\xcc\x90\xdc\x46\x8a\xda\x95\xd2\xff\x00\x7d\
-\xe4\x3b\x84\x5d\x3e\xec\x78\x23\x3c\xb3\x57\xc8\x5a\x97\xc7\xef\
-\x89\xba\xbd\xdb\x5c\xde\xfc\x44\xf1\x65\xdc\xed\xd6\x49\xf5\xcb\
-\x97\x63\xf8\x97\xa7\x7c\x19\xf8\x3f\xe2\x2f\x8e\xdf\x11\x34\x6f\
-\x06\x78\x52\xd1\x6f\x35\x9d\x4e\x52\x8b\xe6\x3e\xd8\xa1\x45\x05\
-\xa4\x96\x56\xfe\x18\xd1\x72\x49\xeb\xc7\x01\x98\x85\xaf\xd3\x5f\
-\x0c\x7f\xc1\x12\xfc\x21\x16\x91\x00\xf1\x1f\xc4\x5d\x6a\xe7\x53\
-\x23\xf7\xad\xa5\xda\x43\x0c\x39\xf4\x55\x70\xec\x7f\x1a\x00\xfc\
-\xbd\xff\x00\x85\xd5\xf1\x0b\xfe\x87\xcf\x13\x7f\xe0\xe2\xe3\xff\
-\x00\x8b\xa3\xfe\x17\x57\xc4\x2f\xfa\x1f\x3c\x4d\xff\x00\x83\x8b\
-\x8f\xfe\x2e\xbf\x56\xbf\xe1\xc9\x5f\x0d\x7f\xe8\x7f\xf1\x5f\xfd\
-\xfb\xb6\xff\x00\xe3\x74\x7f\xc3\x92\xbe\x1a\xff\x00\xd0\xff\x00\
-\xe2\xbf\xfb\xf7\x6d\xff\x00\xc6\xe8\x03\xf2\x97\xfe\x17\x57\xc4\
-\x2f\xfa\x1f\x3c\x4d\xff\x00\x83\x8b\x8f\xfe\x2e\x8f\xf8\x5d\x5f\
-\x10\xbf\xe8\x7c\xf1\x37\xfe\x0e\x2e\x3f\xf8\xba\xfd\x5a\xff\x00\
-\x87\x25\x7c\x35\xff\x00\xa1\xff\x00\xc5\x7f\xf7\xee\xdb\xff\x00\
-\x8d\xd1\xff\x00\x0e\x4a\xf8\x6b\xff\x00\x43\xff\x00\x8a\xff\x00\
-\xef\xdd\xb7\xff\x00\x1b\xa0\x0f\xca\x5f\xf8\x5d\x5f\x10\xbf\xe8\
-\x7c\xf1\x37\xfe\x0e\x2e\x3f\xf8\xba\x3f\xe1\x75\x7c\x42\xff\x00\
-\xa1\xf3\xc4\xdf\xf8\x38\xb8\xff\x00\xe2\xeb\xf5\x6b\xfe\x1c\x95\
-\xf0\xd7\xfe\x87\xff\x00\x15\xff\x00\xdf\xbb\x6f\xfe\x37\x47\xfc\
-\x39\x2b\xe1\xaf\xfd\x0f\xfe\x2b\xff\x00\xbf\x76\xdf\xfc\x6e\x80\
-\x3f\x30\xfc\x31\xfb\x4b\xfc\x59\xf0\x85\xf2\x5d\xe9\x3f\x13\x3c\
-\x57\x63\x2a\x36\x40\x4d\x66\x72\xa4\xff\x00\xb4\x8c\xe5\x58\x7d\
-\x45\x7e\x81\x7e\xc7\xdf\xf0\x56\xad\x4a\xfb\x5b\xb1\xf0\x97\xc6\
-\xe9\x2d\xde\xde\xe5\xd6\x1b\x7f\x18\x5a\xc6\x90\x79\x2e\x78\xc5\
-\xdc\x6a\x36\x6d\x3f\xf3\xd1\x42\xed\xee\xa4\x65\x95\x9f\x17\xbf\
-\xe0\x8b\x91\x69\xfe\x17\xba\xbe\xf8\x6f\xe3\x6b\xad\x4f\x5a\x85\
-\x19\x93\x4a\xd6\xe0\x8e\x35\xb9\x38\xe1\x16\x54\xfb\x8d\xe9\xb9\
-\x70\x7b\xb2\x8f\x9a\xbf\x2f\xf5\x4d\x36\xef\x45\xd5\x2f\x34\xdb\
-\xf8\x24\xb2\xbd\xb4\x91\xe0\x9e\xde\x61\x86\x8d\xd0\x90\xc8\x47\
-\xa8\x61\x8a\x00\xfe\xa3\xe1\xb8\x5b\xa8\x92\x58\xa6\x59\x22\x90\
-\x2b\x23\xa3\x6e\x0c\xa4\x67\x20\x8e\x08\x23\x90\x45\x5a\xaf\x85\
-\x3f\xe0\x92\xbf\x1e\xaf\x3e\x2b\x7c\x01\xbb\xf0\xa6\xb1\x71\x25\
-\xde\xad\xe0\xab\x98\xec\xa3\x96\x46\x25\x9a\xca\x55\x66\xb7\xc9\
-\x3d\xd7\x64\xc9\xec\xb1\xa8\xaf\xba\xe8\x03\xf2\xbb\xfe\x0b\x85\
-\xa2\x41\xf6\x7f\x84\x5a\xba\xa2\x8b\x8d\xda\x9d\xab\xb8\x03\x2c\
-\xbf\xe8\xce\xa3\x3e\xc7\x71\xff\x00\x81\x1f\x5a\xf8\x3b\xf6\x39\
-\xd5\x65\xd2\x3f\x6a\xef\x84\x13\xc2\xe5\x5d\xfc\x55\xa7\x5b\xf1\
-\xe9\x2d\xc2\x44\xdf\xf8\xeb\x9f\xce\xbf\x40\xff\x00\xe0\xb8\x7c\
-\x78\x4f\xe1\x28\x1c\x0f\xb7\x6a\x3f\xfa\x2e\xde\xbf\x3b\x7f\x64\
-\xf6\x3f\xf0\xd4\xdf\x06\xf9\x3f\xf2\x39\x68\xdf\xfa\x5b\x0d\x00\
-\x7f\x4a\x34\x51\x45\x00\x7e\x7f\xff\x00\xc1\x6a\xbf\xe4\xd6\x7c\
-\x2d\xff\x00\x63\x9d\xaf\xfe\x90\xdf\x57\xe3\x7f\x84\x7f\xe4\x6c\
-\xd1\x7f\xeb\xfa\x1f\xfd\x18\xb5\xfb\x21\xff\x00\x05\xaa\xff\x00\
-\x93\x59\xf0\xb7\xfd\x8e\x76\xbf\xfa\x43\x7d\x5f\x8d\xfe\x11\xff\
-\x00\x91\xb3\x45\xff\x00\xaf\xe8\x7f\xf4\x62\xd0\x07\xf5\x21\x5c\
-\xe7\xc4\x09\x9e\xd7\xc0\x7e\x25\x9e\x26\x29\x2c\x3a\x6d\xcc\x88\
-\xca\x70\x41\x11\x31\x04\x1f\x63\x5d\x1d\x73\x5f\x12\x3f\xe4\x9d\
-\x78\xab\xfe\xc1\x57\x5f\xfa\x25\xa8\x03\xf9\x7d\xdc\x47\x42\x45\
-\x7e\xec\x7f\xc1\x24\xb4\xf8\x2c\xbf\x63\x3d\x12\x68\xa3\x55\x92\
-\xeb\x54\xbf\x9e\x52\x00\x1b\x9c\x4c\x63\x04\xfa\x9d\xb1\xa8\xfa\
-\x62\xbf\x09\xab\xf7\x87\xfe\x09\x33\xcf\xec\x5b\xe1\x9c\xff\x00\
-\xd0\x43\x50\xff\x00\xd2\x86\xa0\x0f\xb1\xa9\x68\xaf\x85\xbf\x6e\
-\x8f\xf8\x28\xfc\x9f\xb2\xff\x00\x8b\xa0\xf0\x5f\x84\xf4\x0b\x5f\
-\x10\xf8\xa4\x5b\x47\x79\x7d\x71\xa8\xc8\xeb\x69\x68\xaf\x9f\x2e\
-\x32\x88\x77\x3b\xb0\x1b\xb8\x65\xda\x0a\x7d\xec\x9d\xa0\x1f\x74\
-\xd1\x5f\x8d\x1f\xf0\xfb\x0f\x8a\xdf\xf4\x24\xf8\x37\xfe\xf8\xbb\
-\xff\x00\xe3\xd4\x7f\xc3\xec\x3e\x2b\x7f\xd0\x93\xe0\xdf\xfb\xe2\
-\xef\xff\x00\x8f\x50\x07\xec\xbd\x15\xf8\xd1\xff\x00\x0f\xb0\xf8\
-\xad\xff\x00\x42\x4f\x83\x7f\xef\x8b\xbf\xfe\x3d\x5e\xb5\xfb\x32\
-\xff\x00\xc1\x5e\x35\x5f\x88\x5f\x14\xb4\x4f\x09\xfc\x43\xf0\xb6\
-\x97\xa5\xd9\x6b\x77\x51\xd8\xdb\xea\x9a\x34\x92\xaf\xd9\xee\x24\
-\x21\x63\xf3\x23\x91\x9f\x28\x5c\xaa\x96\x0c\x36\xe7\x27\x34\x01\
-\xfa\x7b\x5e\x77\xfb\x43\x69\xf6\xfa\xa7\xc0\x3f\x89\x36\x97\x31\
-\x2c\xb0\x4d\xe1\xbd\x49\x24\x56\x19\xc8\xfb\x2c\x95\xe8\x95\xc2\
-\x7c\x74\x01\xbe\x08\xfc\x41\xc8\xcf\xfc\x53\xba\x87\xfe\x92\xc9\
-\x40\x1f\xcc\x9e\xe6\xf5\x3f\x9d\x7e\xfc\xff\x00\xc1\x2e\xae\x24\
-\x9f\xf6\x1b\xf8\x71\xe6\x31\x62\x87\x51\x45\x2c\x73\xc0\xd4\x6e\
-\x80\x1f\x85\x7e\x02\xd7\xef\xbf\xfc\x12\xcb\xe6\xfd\x86\xfe\x1e\
-\x67\x9c\x49\xa9\x63\xff\x00\x06\x17\x14\x01\xf5\x8d\x7f\x3f\xff\
-\x00\xf0\x53\xe9\x9e\x4f\xdb\x93\xe2\x50\x63\x95\x53\xa7\x2a\x82\
-\x7a\x01\xa6\xda\xf0\x3f\x33\xf9\xd7\xf4\x01\x5f\xcf\xe7\xfc\x14\
-\xe7\xfe\x4f\x9b\xe2\x77\xfd\x74\xd3\xff\x00\xf4\xdd\x6b\x40\x1e\
-\xdf\xff\x00\x04\x54\xd3\xe0\xb8\xf8\xf9\xe3\x7b\xb9\x23\x56\x9e\
-\xdf\xc3\x46\x38\xd9\x80\x24\x07\xba\x83\x24\x1e\xdf\x70\x57\xec\
-\x9e\x07\xa5\x7e\x3a\x7f\xc1\x12\xff\x00\xe4\xb7\x78\xfb\xfe\xc5\
-\xd5\xff\x00\xd2\xa8\xeb\xf6\x32\x80\x0a\x2b\xc1\xbf\x6b\xcf\xda\
-\xa3\x4b\xfd\x93\xfe\x14\x9f\x16\x5f\xd8\x49\xab\x6a\x37\x57\x2b\
-\x65\xa6\xe9\x69\x2a\xc4\x27\x9c\x86\x23\x7b\x1e\x55\x02\xab\x31\
-\x60\xa7\xa0\x1d\xeb\xf3\x8d\xff\x00\xe0\xb5\xdf\x15\x77\x1d\x9e\
-\x08\xf0\x78\x4c\xf1\xb9\x2e\xc9\xff\x00\xd1\xd4\x01\xfb\x2b\x45\
-\x7e\x34\x7f\xc3\xec\x3e\x2b\x7f\xd0\x93\xe0\xdf\xfb\xe2\xef\xff\
-\x00\x8f\x51\xff\x00\x0f\xb0\xf8\xad\xff\x00\x42\x4f\x83\x7f\xef\
-\x8b\xbf\xfe\x3d\x40\x1f\xb2\xf4\x57\xe3\xc6\x85\xff\x00\x05\xb0\
-\xf8\x89\x0e\xad\x6c\xda\xc7\x80\xfc\x33\x7b\xa6\x6f\xfd\xfc\x36\
-\x0f\x73\x0c\xce\xbf\xec\x3b\x48\xe1\x4f\xd5\x4d\x7e\xaa\x7c\x29\
-\xf8\x93\xa4\xfc\x5f\xf8\x77\xe1\xef\x19\x68\x33\xc9\x26\x95\xad\
-\x5a\x47\x75\x08\x97\x02\x44\xce\x77\x23\x81\xd1\xd4\xe5\x58\x74\
-\x04\x1c\x50\x07\x65\xb4\x63\x18\x18\xfa\x57\xf3\xc3\xff\x00\x05\
-\x05\xd3\x61\xd2\xff\x00\x6c\x8f\x8a\xd1\x5b\x46\xb0\xc6\xda\xb0\
-\x9c\xaa\x00\x01\x79\x61\x49\x1c\xfd\x4b\x33\x12\x7d\x49\xaf\xe8\
-\x7e\xbf\x9e\x6f\xf8\x28\x91\x23\xf6\xd2\xf8\xab\x83\x8f\xf8\x98\
-\xc7\xff\x00\xa4\xf1\x50\x07\xd4\xdf\xf0\x44\x39\xa4\x3e\x3c\xf8\
-\xa7\x0e\xe3\xe5\xbe\x9b\x65\x21\x5c\xf0\x48\x9a\x5c\x1c\x7a\x8c\
-\x9c\x7d\x4d\x7e\xb9\xd7\xe4\x4f\xfc\x11\x07\xfe\x4a\x17\xc4\xff\
-\x00\xfb\x05\x59\xff\x00\xe8\xe9\x2b\xf5\xda\x80\x3f\x30\x3f\xe0\
-\xb8\x9f\xf2\x2a\x7c\x26\xff\x00\xaf\xed\x47\xff\x00\x45\xdb\xd7\
-\xe7\x67\xec\x9f\xff\x00\x27\x4d\xf0\x73\xfe\xc7\x3d\x17\xff\x00\
-\x4b\xa1\xaf\xd1\x3f\xf8\x2e\x27\xfc\x8a\x9f\x09\xbf\xeb\xfb\x51\
-\xff\x00\xd1\x76\xf5\xf9\xd9\xfb\x27\xff\x00\xc9\xd3\x7c\x1c\xff\
-\x00\xb1\xcf\x45\xff\x00\xd2\xe8\x68\x03\xfa\x52\xa2\x8a\x28\x03\
-\xf3\xff\x00\xfe\x0b\x55\xff\x00\x26\xb3\xe1\x6f\xfb\x1c\xed\x7f\
-\xf4\x86\xfa\xbf\x1b\xfc\x23\xff\x00\x23\x66\x8b\xff\x00\x5f\xd0\
-\xff\x00\xe8\xc5\xaf\xd9\x0f\xf8\x2d\x57\xfc\x9a\xcf\x85\xbf\xec\
-\x73\xb5\xff\x00\xd2\x1b\xea\xfc\x6f\xf0\x8f\xfc\x8d\x9a\x2f\xfd\
-\x7f\x43\xff\x00\xa3\x16\x80\x3f\xa9\x0a\xe6\xbe\x24\x7f\xc9\x39\
-\xf1\x57\xfd\x82\xae\xbf\xf4\x4b\x57\x4b\x5c\xd7\xc4\x8f\xf9\x27\
-\x3e\x2a\xff\x00\xb0\x55\xd7\xfe\x89\x6a\x00\xfe\x5f\x2b\xf7\x87\
-\xfe\x09\x33\xff\x00\x26\x5b\xe1\x9f\xfb\x08\x6a\x1f\xfa\x50\xd5\
-\xf8\x3d\x5f\xbc\x3f\xf0\x49\x9f\xf9\x32\xdf\x0c\xff\x00\xd8\x43\
-\x50\xff\x00\xd2\x86\xa0\x0f\xb1\xeb\xf0\x43\xfe\x0a\xad\xf2\xfe\
-\xdb\xde\x3a\x23\x83\xf6\x7d\x37\xa7\xfd\x78\xc3\x5f\xbd\xf5\xf8\
-\x21\xff\x00\x05\x56\xff\x00\x93\xde\xf1\xcf\xfd\x7b\xe9\xbf\xfa\
-\x43\x0d\x00\x78\x7f\xc1\x5f\x80\x1e\x3a\xfd\xa1\x7c\x49\x79\xa0\
-\x78\x0b\x44\x5d\x73\x55\xb4\xb2\x37\xf3\x40\x6e\xa1\xb7\x0b\x0a\
-\xb2\x21\x6d\xf3\x3a\x2f\xde\x91\x46\x33\xde\xbd\x9f\xfe\x1d\x6b\
-\xfb\x4c\xff\x00\xd1\x3a\x8f\xff\x00\x07\xba\x7f\xff\x00\x24\x57\
-\xab\x7f\xc1\x15\x40\x6f\xda\x5b\xc5\xc4\x8c\x9f\xf8\x44\x6e\x3f\
-\xf4\xb2\xce\xbf\x68\xa8\x03\xf9\xc5\xf8\xd9\xfb\x1d\x7c\x59\xfd\
-\x9d\x7c\x3b\x63\xae\x7c\x41\xf0\xb2\xe8\x5a\x75\xf5\xcf\xd8\xed\
-\xe5\x1a\x8d\xa5\xc1\x79\x76\x96\xdb\xb6\x19\x5c\x8f\x95\x58\xe7\
-\xda\xbc\xff\x00\xe1\x33\x1f\xf8\x5a\x5e\x0e\xe7\xfe\x63\x36\x7f\
-\xfa\x39\x3f\xc0\x57\xeb\x3f\xfc\x16\xbd\x8a\xfc\x03\xf0\x36\x0e\
-\x3f\xe2\xa6\x1d\x3f\xeb\xd6\x71\xfd\x6b\xf2\x5f\xe1\x2f\xfc\x95\
-\x2f\x07\xff\x00\xd8\x66\xcf\xff\x00\x47\x2d\x00\x7f\x4f\x75\xc2\
-\x7c\x74\xff\x00\x92\x23\xf1\x0b\xfe\xc5\xdd\x43\xff\x00\x49\x64\
-\xae\xee\xb8\x4f\x8e\x9f\xf2\x44\x7e\x21\x7f\xd8\xbb\xa8\x7f\xe9\
-\x2c\x94\x01\xfc\xc9\x57\xef\xbf\xfc\x12\xc7\xfe\x4c\x6f\xe1\xef\
-\xfd\x74\xd4\xbf\xf4\xe1\x71\x5f\x81\x15\xfb\xef\xff\x00\x04\xb1\
-\xff\x00\x93\x1b\xf8\x7b\xff\x00\x5d\x35\x2f\xfd\x38\x5c\x50\x07\
-\xd6\x35\xfc\xfe\x7f\xc1\x4e\x7f\xe4\xf9\xbe\x27\x7f\xd7\x4d\x3f\
-\xff\x00\x4d\xf6\xb5\xfd\x01\xd7\xf3\xf9\xff\x00\x05\x39\xff\x00\
-\x93\xe6\xf8\x9d\xff\x00\x5d\x34\xff\x00\xfd\x37\xda\xd0\x07\xbb\
-\xff\x00\xc1\x12\xff\x00\xe4\xb7\x78\xff\x00\xfe\xc5\xd5\xff\x00\
-\xd2\xa8\xeb\xf6\x32\xbf\x1c\xff\x00\xe0\x89\x7f\xf2\x5b\xbc\x7f\
-\xff\x00\x62\xea\xff\x00\xe9\x54\x75\xfb\x19\x40\x1f\x9a\xdf\xf0\
-\x5b\x82\x7f\xe1\x55\x7c\x37\xe7\xae\xb5\x70\x0f\xfd\xf9\xaf\xc9\
-\x9f\x0d\xf8\x76\xf3\xc5\x9e\x24\xd3\x74\x4d\x32\x11\x71\xa8\x6a\
-\x77\x31\xd9\xda\xc4\xce\xa9\xbe\x59\x18\x2a\xae\xe6\xc0\x1f\x31\
-\x03\x35\xfa\xcb\xff\x00\x05\xb8\xff\x00\x92\x57\xf0\xdb\xfe\xc3\
-\x57\x1f\xfa\x26\xbf\x30\xff\x00\x67\x87\x61\xf1\xfb\xe1\xa6\x18\
-\xff\x00\xc8\xcb\xa6\x8e\xbf\xf4\xf5\x19\xa0\x0f\x6e\xff\x00\x87\
-\x5a\xfe\xd3\x3f\xf4\x4e\xa3\xff\x00\xc1\xee\x9f\xff\x00\xc9\x15\
-\x9b\xe2\x8f\xf8\x26\xf7\xed\x07\xe0\xdf\x0e\x6a\xba\xf6\xb1\xe0\
-\x25\xb4\xd2\x74\xab\x39\x6f\xef\x2e\x3f\xb6\x6c\x1c\xc7\x0c\x6a\
-\x59\xd8\x22\x4e\xcc\x70\xaa\x4f\x00\xd7\xf4\x15\x5e\x61\xfb\x50\
-\x28\xff\x00\x86\x69\xf8\xb6\x31\xff\x00\x32\x8e\xad\xff\x00\xa4\
-\x73\x50\x07\xf3\x4d\x93\xd3\x35\xfd\x05\xff\x00\xc1\x34\x54\x7f\
-\xc3\x0f\xfc\x2f\xe3\xfe\x5d\xef\x3f\xf4\xba\xe2\xbf\x9f\x4a\xfe\
-\x83\x3f\xe0\x9a\x3f\xf2\x63\xff\x00\x0b\xff\x00\xeb\xde\xf3\xff\
-\x00\x4b\xae\x28\x03\xe9\xca\xfe\x79\xbf\xe0\xa2\x9f\xf2\x7a\x5f\
-\x15\x7f\xec\x23\x1f\xfe\x93\xc3\x5f\xd0\xcd\x7f\x3c\xdf\xf0\x51\
-\x4f\xf9\x3d\x2f\x8a\xbf\xf6\x11\x8f\xff\x00\x49\xe1\xa0\x0f\xa8\
-\xff\x00\xe0\x88\x3f\xf2\x50\xbe\x27\xff\x00\xd8\x2a\xcf\xff\x00\
-\x47\x49\x5f\xae\xd5\xf9\x13\xff\x00\x04\x41\xff\x00\x92\x85\xf1\
-\x3f\xfe\xc1\x56\x7f\xfa\x3a\x4a\xfd\x76\xa0\x0f\xcc\x0f\xf8\x2e\
-\x27\xfc\x8a\x9f\x09\xbf\xeb\xfb\x51\xff\x00\xd1\x76\xf5\xf9\xd9\
-\xfb\x27\xff\x00\xc9\xd3\x7c\x1c\xff\x00\xb1\xcf\x45\xff\x00\xd2\
-\xe8\x6b\xf4\x4f\xfe\x0b\x89\xff\x00\x22\xa7\xc2\x6f\xfa\xfe\xd4\
-\x7f\xf4\x5d\xbd\x7e\x76\x7e\xc9\xff\x00\xf2\x74\xdf\x07\x3f\xec\
-\x73\xd1\x7f\xf4\xba\x1a\x00\xfe\x94\xa8\xa2\x8a\x00\xfc\xff\x00\
-\xff\x00\x82\xd5\x7f\xc9\xac\xf8\x5b\xfe\xc7\x3b\x5f\xfd\x21\xbe\
-\xaf\xc6\xff\x00\x08\xff\x00\xc8\xd9\xa2\xff\x00\xd7\xf4\x3f\xfa\
-\x31\x6b\xf6\x43\xfe\x0b\x55\xff\x00\x26\xb3\xe1\x6f\xfb\x1c\xed\
-\x7f\xf4\x86\xfa\xbf\x1b\xfc\x23\xff\x00\x23\x66\x8b\xff\x00\x5f\
-\xd0\xff\x00\xe8\xc5\xa0\x0f\xea\x42\xb9\xaf\x89\x1f\xf2\x4e\x7c\
-\x55\xff\x00\x60\xab\xaf\xfd\x12\xd5\xd2\xd7\x35\xf1\x23\xfe\x49\
-\xcf\x8a\xbf\xec\x15\x75\xff\x00\xa2\x5a\x80\x3f\x97\xca\xfd\xe1\
-\xff\x00\x82\x4c\xff\x00\xc9\x96\xf8\x67\xfe\xc2\x1a\x87\xfe\x94\
-\x35\x7e\x0f\x57\xef\x0f\xfc\x12\x67\xfe\x4c\xb7\xc3\x3f\xf6\x10\
-\xd4\x3f\xf4\xa1\xa8\x03\xec\x7a\xfc\x10\xff\x00\x82\xab\x7f\xc9\
-\xef\x78\xe7\xfe\xbd\xf4\xdf\xfd\x21\x86\xbf\x7b\xeb\xf1\x03\xfe\
-\x0a\xdd\xf0\xaf\xc4\x1e\x1b\xfd\xa7\x35\x0f\x19\xde\x58\x4c\x7c\
-\x3d\xe2\x2b\x4b\x56\xb4\xd4\x04\x6c\xd1\x79\xb1\x42\xb0\xc9\x09\
-\x6c\x00\x1c\x79\x7b\x82\x9e\x4a\xb0\x39\xa0\x0e\x5f\xfe\x09\xa1\
-\xfb\x40\x78\x2b\xf6\x6b\xf8\xd1\xe2\x2f\x12\xf8\xf7\x51\x9b\x4c\
-\xd2\x2f\x3c\x3f\x2e\x9f\x0c\xd6\xf6\xb2\x5c\x16\x99\xae\xad\xdc\
-\x2e\x10\x1e\x36\xc4\xe7\x3e\xd5\xfa\x4f\xff\x00\x0f\x60\xfd\x9b\
-\xff\x00\xe8\x6e\xd4\x3f\xf0\x49\x77\xff\x00\xc6\xeb\xf0\x6b\x70\
-\xf5\x3f\x9f\xff\x00\x5a\x93\xe5\xf7\xfc\xff\x00\xfa\xd4\x01\xfa\
-\x47\xff\x00\x05\x35\xfd\xb3\xbe\x15\xfe\xd2\x5f\x0a\x3c\x31\xa0\
-\xf8\x13\x5a\xba\xd5\x35\x1d\x3f\x5a\xfb\x75\xc4\x57\x1a\x7c\xd6\
-\xc1\x62\xf2\x25\x4c\x83\x22\x0c\x9c\xb8\xaf\x81\xfe\x12\xff\x00\
-\xc9\x52\xf0\x7f\xfd\x86\x6c\xff\x00\xf4\x72\xd7\x2b\xb8\x70\x32\
-\x7f\x3f\xfe\xb5\x7b\x07\xec\xb1\xf0\xb3\x5d\xf8\xb7\xf1\xeb\xc1\
-\x7a\x1f\x87\x74\xe9\x2f\x26\x1a\x9d\xb5\xd5\xcd\xc4\x6a\x4a\x5a\
-\x5b\xc7\x2a\x3c\xb3\x48\x79\x0a\x15\x01\xeb\xd4\x90\xa0\x16\x20\
-\x50\x07\xf4\x8b\x5c\x27\xc7\x4f\xf9\x22\x3f\x10\xbf\xec\x5d\xd4\
-\x3f\xf4\x96\x4a\xee\xeb\x84\xf8\xe9\xff\x00\x24\x47\xe2\x17\xfd\
-\x8b\xba\x87\xfe\x92\xc9\x40\x1f\xcc\x95\x7e\xfb\xff\x00\xc1\x2c\
-\x7f\xe4\xc6\xfe\x1e\xff\x00\xd7\x4d\x4b\xff\x00\x4e\x17\x15\xf8\
-\x11\x5f\xbe\xff\x00\xf0\x4b\x1f\xf9\x31\xbf\x87\xbf\xf5\xd3\x52\
-\xff\x00\xd3\x85\xc5\x00\x7d\x63\x5f\xcf\xe7\xfc\x14\xe7\xfe\x4f\
-\x9b\xe2\x77\xfd\x74\xd3\xff\x00\xf4\xdf\x6b\x5f\xd0\x1d\x7f\x3f\
-\x9f\xf0\x53\x9f\xf9\x3e\x6f\x89\xdf\xf5\xd3\x4f\xff\x00\xd3\x7d\
-\xad\x00\x7b\xbf\xfc\x11\x2f\xfe\x4b\x77\x8f\xff\x00\xec\x5d\x5f\
-\xfd\x2a\x8e\xbf\x63\x2b\xf1\xcf\xfe\x08\x97\xff\x00\x25\xbb\xc7\
-\xff\x00\xf6\x2e\xaf\xfe\x95\x47\x5f\xb1\x94\x01\xf9\xab\xff\x00\
-\x05\xb8\xff\x00\x92\x57\xf0\xdb\xfe\xc3\x57\x1f\xfa\x26\xbf\x2d\
-\x7e\x0f\xeb\xd6\x5e\x13\xf8\xb5\xe0\xbd\x77\x52\x90\xc1\xa7\x69\
-\x9a\xd5\x8d\xf5\xd4\xa8\xbb\xca\x45\x1c\xe8\xec\x40\x1d\x4e\x01\
-\xe2\xbf\x5d\x7f\xe0\xb0\x5f\x0c\x7c\x43\xe3\xef\x80\xda\x16\xb3\
-\xa2\x69\xf3\x6a\x71\x78\x6b\x55\x6b\x9d\x42\x1b\x64\x2e\xf1\xdb\
-\xbc\x6c\xa6\x7c\x0e\x4a\xab\x05\xdc\x07\x2a\x1b\x71\xf9\x41\x23\
-\xf1\x70\xee\xc9\x2c\x48\x6d\xdd\x73\x8c\x1f\x7e\x28\x03\xf7\x8b\
-\xfe\x1e\xc1\xfb\x37\xff\x00\xd0\xdd\xa8\x7f\xe0\x92\xef\xff\x00\
-\x8d\xd7\x0d\xf1\xc3\xfe\x0a\x65\xf0\x13\xc7\x5f\x05\x7e\x20\x78\
-\x6f\x48\xf1\x3d\xf4\xda\xbe\xb1\xe1\xed\x47\x4f\xb4\x8e\x4d\x26\
-\xe2\x35\x69\xa4\xb5\x91\x11\x4b\x32\x60\x65\x98\x0c\x9a\xfc\x52\
-\xf9\x7d\xff\x00\x3f\xfe\xb5\x2e\xe1\x8c\x64\xe3\xeb\xff\x00\xd6\
-\xa0\x06\x57\xf4\x19\xff\x00\x04\xd1\xff\x00\x93\x1f\xf8\x5f\xff\
-\x00\x5e\xf7\x9f\xfa\x5d\x71\x5f\x80\x16\xba\x7c\xd7\xf7\x30\xdb\
-\xdb\x5b\xc9\x3c\xd3\x1d\x91\xc7\x12\x17\x67\x6c\xf4\x00\x75\x3f\
-\x4e\x2b\xfa\x24\xfd\x88\x7e\x1d\xeb\x5f\x09\xff\x00\x65\x7f\x87\
-\x7e\x16\xd7\xed\xcd\x9e\xb1\x67\x60\xd2\xdc\xda\xb6\x37\x40\xd3\
-\x4c\xf3\xf9\x6f\xfe\xda\x89\x40\x3e\xe0\xd0\x07\xbb\xd7\xf3\xcd\
-\xff\x00\x05\x14\xff\x00\x93\xd2\xf8\xab\xff\x00\x61\x18\xff\x00\
-\xf4\x9e\x1a\xfe\x86\x6b\xf9\xe6\xff\x00\x82\x8a\x7f\xc9\xe9\x7c\
-\x55\xff\x00\xb0\x8c\x7f\xfa\x4f\x0d\x00\x7d\x47\xff\x00\x04\x41\
-\xff\x00\x92\x85\xf1\x3f\xfe\xc1\x56\x7f\xfa\x3a\x4a\xfd\x76\xaf\
-\xc8\x9f\xf8\x22\x0f\xfc\x94\x2f\x89\xff\x00\xf6\x0a\xb3\xff\x00\
-\xd1\xd2\x57\xeb\xb5\x00\x7e\x60\x7f\xc1\x71\x3f\xe4\x54\xf8\x4d\
-\xff\x00\x5f\xda\x8f\xfe\x8b\xb7\xaf\xce\xcf\xd9\x3f\xfe\x4e\x9b\
-\xe0\xe7\xfd\x8e\x7a\x2f\xfe\x97\x43\x5f\xa2\x7f\xf0\x5c\x4f\xf9\
-\x15\x3e\x13\x7f\xd7\xf6\xa3\xff\x00\xa2\xed\xeb\xf3\xb3\xf6\x4f\
-\xff\x00\x93\xa6\xf8\x39\xff\x00\x63\x9e\x8b\xff\x00\xa5\xd0\xd0\
-\x07\xf4\xa5\x45\x14\x50\x07\xe7\xff\x00\xfc\x16\xab\xfe\x4d\x67\
-\xc2\xdf\xf6\x39\xda\xff\x00\xe9\x0d\xf5\x7e\x37\xf8\x47\xfe\x46\
-\xcd\x17\xfe\xbf\xa1\xff\x00\xd1\x8b\x5f\xb2\x1f\xf0\x5a\xaf\xf9\
-\x35\x9f\x0b\x7f\xd8\xe7\x6b\xff\x00\xa4\x37\xd5\xf8\xdf\xe1\x1f\
-\xf9\x1b\x34\x5f\xfa\xfe\x87\xff\x00\x46\x2d\x00\x7f\x52\x15\xcd\
-\x7c\x48\xff\x00\x92\x73\xe2\xaf\xfb\x05\x5d\x7f\xe8\x96\xae\x96\
-\xb3\x75\xad\x2d\x35\xcd\x1a\xff\x00\x4e\x9c\x91\x15\xe5\xbb\xdb\
-\xb6\x3b\x07\x4d\xa6\x80\x3f\x96\x9a\xfd\xe1\xff\x00\x82\x4c\xff\
-\x00\xc9\x96\xf8\x67\xfe\xc2\x1a\x87\xfe\x94\x35\x7e\x1d\x78\xbf\
-\xc2\xf7\xfe\x0a\xf1\x3e\xb1\xe1\xfd\x56\x11\x6d\xa9\xe9\x37\x72\
-\x59\x5d\x43\x8f\xb9\x2c\x6c\x51\xd7\x3e\x81\x86\x33\xdf\xad\x7e\
-\xa7\xff\x00\xc1\x23\x3f\x6a\x8f\x0b\x69\xdf\x0f\xe7\xf8\x43\xe2\
-\x1d\x5a\xdb\x47\xd7\x60\xd4\x24\xbb\xd1\x7e\xd4\xfb\x23\xbe\x8a\
-\x6d\xa5\xa0\x46\x3c\x19\x56\x4d\xc7\x6f\x05\x83\x8d\xa0\xed\x6a\
-\x00\xfd\x3d\xaa\x9a\x96\x93\x63\xac\x59\xb5\xa5\xfd\x9d\xbd\xf5\
-\xa3\x63\x74\x17\x31\x2c\x88\x70\x72\x32\xa4\x11\xda\xac\x67\x3d\
-\x39\xcf\x3e\xdf\x9d\x1b\xbd\x8f\xeb\x40\x1c\xdf\xfc\x2a\xef\x06\
-\x7f\xd0\xa3\xa1\x7f\xe0\xb6\x1f\xfe\x26\x8f\xf8\x55\xde\x0c\xff\
-\x00\xa1\x47\x42\xff\x00\xc1\x6c\x3f\xfc\x4d\x74\x9b\xbd\x8f\xeb\
-\x46\xef\x63\xfa\xd0\x07\x37\xff\x00\x0a\xbb\xc1\x9f\xf4\x28\xe8\
-\x5f\xf8\x2d\x87\xff\x00\x89\xad\x5d\x1b\xc3\x3a\x3f\x87\x12\x54\
-\xd2\x74\xab\x1d\x2d\x25\x20\xc8\xb6\x76\xc9\x08\x72\x3a\x13\xb4\
-\x0c\xe2\xaf\xee\xf6\x3f\xad\x1b\xbd\x8f\xeb\x40\x0f\xae\x13\xe3\
-\xa7\xfc\x91\x1f\x88\x5f\xf6\x2e\xea\x1f\xfa\x4b\x25\x77\x1b\xbd\
-\x8f\xeb\x5f\x25\xff\x00\xc1\x41\x7f\x6a\x6f\x0c\xfc\x0d\xf8\x1b\
-\xe2\x8d\x03\xfb\x56\xde\xeb\xc6\x9e\x22\xd3\xa7\xd2\xf4\xfd\x22\
-\x19\x55\xae\x13\xcf\x42\x8d\x72\xea\x09\xd8\x88\xae\xc4\x16\x18\
-\x66\xda\xa0\x60\x9a\x00\xfc\x0e\xaf\xdf\x7f\xf8\x25\x8f\xfc\x98\
-\xdf\xc3\xdf\xfa\xe9\xa9\x7f\xe9\xc2\xe2\xbf\x02\x2b\xfa\x20\xfd\
-\x80\x3c\x0f\x77\xf0\xdf\xf6\x3d\xf8\x63\xa2\xdf\x46\xd1\x5e\x3e\
-\x9a\xfa\x8b\xc6\xc0\x86\x5f\xb4\xcc\xf7\x20\x30\x3d\x0a\xac\xc0\
-\x11\xed\x40\x1f\x44\x57\xf3\xf9\xff\x00\x05\x39\xff\x00\x93\xe6\
-\xf8\x9d\xff\x00\x5d\x34\xff\x00\xfd\x37\xda\xd7\xf4\x07\x5f\x85\
-\x5f\xf0\x56\x9f\x02\xdd\xf8\x57\xf6\xc4\xd6\x75\x99\xa2\x22\xd3\
-\xc4\xba\x65\x9e\xa3\x6f\x26\x0e\xd6\xf2\xe1\x5b\x66\x19\xf5\x0d\
-\x6f\x92\x3f\xda\x1e\xb4\x01\xe9\x3f\xf0\x44\xbf\xf9\x2d\xde\x3f\
-\xff\x00\xb1\x75\x7f\xf4\xaa\x3a\xfd\x8c\xaf\xc0\xcf\xf8\x26\xdf\
-\xed\x19\xa2\xfe\xce\x7f\xb4\x22\xdf\x78\x96\xe4\x59\x78\x67\x5e\
-\xb1\x7d\x22\xf6\xf4\xaf\xc9\x6a\xec\xe9\x24\x73\x36\x3f\x84\x34\
-\x7b\x08\x1f\xc2\xec\xdd\x54\x57\xee\xfe\x91\xad\xd8\xf8\x83\x4d\
-\xb5\xd4\xf4\xad\x46\xdb\x52\xd3\x6e\xa3\x12\xc1\x75\x67\x2a\xcd\
-\x14\xc9\xfd\xe4\x65\x24\x30\xf7\x04\x8a\x00\xd2\x64\x56\x04\x32\
-\x82\x0f\x5c\x8f\xc2\xb9\xb9\x3e\x18\xf8\x3a\x49\x1a\x47\xf0\x9e\
-\x86\xee\xc7\x2c\xcd\xa6\xc2\x49\xfa\x9d\xb5\xd1\xee\xf6\x3f\xad\
-\x1b\xbd\x8f\xeb\x40\x1c\xdf\xfc\x2a\xef\x06\x7f\xd0\xa3\xa1\x7f\
-\xe0\xb6\x1f\xfe\x26\x8f\xf8\x55\xde\x0c\xff\x00\xa1\x47\x42\xff\
-\x00\xc1\x6c\x3f\xfc\x4d\x74\x9b\xbd\x8f\xeb\x46\xef\x63\xfa\xd0\
-\x06\x1e\x9b\xe0\x0f\x0c\x68\xb7\x89\x79\xa7\xf8\x6f\x48\xb1\xbb\
-\x41\x85\xb8\xb6\xb1\x8a\x39\x07\xd1\x95\x41\xad\xed\xa3\xd0\x7e\
-\x54\xdd\xde\xc7\xf5\xa3\x77\xb1\xfd\x68\x01\xf5\xfc\xf3\x7f\xc1\
-\x45\x3f\xe4\xf4\xbe\x2a\xff\x00\xd8\x46\x3f\xfd\x27\x86\xbf\x79\
-\xbe\x26\xfc\x58\xf0\xaf\xc1\xcf\x0a\xdd\xf8\x8f\xc6\x3a\xed\xae\
-\x83\xa4\x5b\xa3\x31\x9a\xea\x40\x0c\x84\x7f\x04\x6b\xf7\x9d\xcf\
-\x65\x5c\x9f\x6a\xfe\x74\xbf\x68\x5f\x8a\x4d\xf1\xb3\xe3\x57\x8c\
-\xbc\x70\x6d\xda\xda\x3d\x6f\x52\x92\xe6\x18\x64\xc6\xe8\xe1\xce\
-\xd8\xd1\x8f\x72\x10\x26\x4f\xa8\x34\x01\xf7\x57\xfc\x11\x07\xfe\
-\x4a\x17\xc4\xff\x00\xfb\x05\x59\xff\x00\xe8\xe9\x2b\xf5\xda\xbf\
-\x2d\x3f\xe0\x89\x5e\x06\xbc\xb7\xd3\x7e\x27\x78\xc2\x48\x8a\xd9\
-\x5c\xc9\x65\xa5\x5a\xc8\x3a\x3b\xa0\x96\x59\x81\xcf\xa0\x92\x11\
-\x91\xdd\x8f\xa5\x7e\xa5\xd0\x07\xe6\x07\xfc\x17\x13\xfe\x45\x4f\
-\x84\xdf\xf5\xfd\xa8\xff\x00\xe8\xbb\x7a\xfc\xec\xfd\x93\xff\x00\
-\xe4\xe9\xbe\x0e\x7f\xd8\xe7\xa2\xff\x00\xe9\x74\x35\xfa\x27\xff\
-\x00\x05\xc4\xff\x00\x91\x53\xe1\x37\xfd\x7f\x6a\x3f\xfa\x2e\xde\
-\xbf\x3b\x3f\x64\xff\x00\xf9\x3a\x6f\x83\x9f\xf6\x39\xe8\xbf\xfa\
-\x5d\x0d\x00\x7f\x4a\x54\x51\x45\x00\x7e\x7f\xff\x00\xc1\x6a\xbf\
-\xe4\xd6\x7c\x2d\xff\x00\x63\x9d\xaf\xfe\x90\xdf\x57\xe3\x7f\x84\
-\x7f\xe4\x6c\xd1\x7f\xeb\xfa\x1f\xfd\x18\xb5\xfb\x21\xff\x00\x05\
-\xaa\xff\x00\x93\x59\xf0\xb7\xfd\x8e\x76\xbf\xfa\x43\x7d\x5f\x8d\
-\xfe\x11\xff\x00\x91\xb3\x45\xff\x00\xaf\xe8\x7f\xf4\x62\xd0\x07\
-\xf5\x21\x49\x81\xe9\x4b\x45\x00\x7e\x55\x7f\xc1\x51\xbf\x61\x5d\
-\x53\x54\xf1\x0d\xf7\xc6\x4f\x01\x69\x92\x6a\x31\xdc\x22\xbf\x88\
-\xf4\xab\x54\xdd\x22\xb2\x2e\xdf\xb6\x46\xa3\xef\x0d\xa0\x6f\x1d\
-\x41\x1b\xce\x43\x31\x5f\xcb\x42\x85\x49\x05\x4f\x52\xb8\x3d\x78\
-\xeb\xf8\xfd\x6b\xfa\x9f\xda\x33\x9c\x0c\xd7\xcc\x7f\x1a\x3f\xe0\
-\x9d\x5f\x03\xbe\x37\xea\x57\x1a\xa6\xab\xe1\x63\xa1\xeb\x33\x92\
-\x64\xd4\xbc\x3b\x37\xd8\x9e\x42\x7a\x96\x4e\x63\x66\x3f\xde\x28\
-\x4f\xbd\x00\x7e\x06\xc5\xe3\x4f\x10\xc1\x18\x8e\x3d\x77\x53\x8e\
-\x31\xd1\x56\xf2\x40\x07\xe1\xba\x9f\xff\x00\x09\xdf\x89\x7f\xe8\
-\x61\xd5\x7f\xf0\x36\x5f\xfe\x2a\xbf\x62\x1b\xfe\x08\xab\xf0\x5b\
-\x71\x23\xc5\x7e\x3c\x45\xf4\x37\xb6\x47\xff\x00\x6d\x28\xff\x00\
-\x87\x29\xfc\x16\xff\x00\xa1\xbb\xc7\x9f\xf8\x1b\x65\xff\x00\xc8\
-\x94\x01\xf8\xef\xff\x00\x09\xdf\x89\x7f\xe8\x61\xd5\x7f\xf0\x36\
-\x5f\xfe\x2a\x8f\xf8\x4e\xfc\x4b\xff\x00\x43\x0e\xab\xff\x00\x81\
-\xb2\xff\x00\xf1\x55\xfb\x11\xff\x00\x0e\x53\xf8\x2d\xff\x00\x43\
-\x77\x8f\x3f\xf0\x36\xcb\xff\x00\x91\x28\xff\x00\x87\x29\xfc\x16\
-\xff\x00\xa1\xbb\xc7\x9f\xf8\x1b\x65\xff\x00\xc8\x94\x01\xf8\xef\
-\xff\x00\x09\xdf\x89\x7f\xe8\x61\xd5\x7f\xf0\x36\x5f\xfe\x2a\x8f\
-\xf8\x4e\xfc\x4b\xff\x00\x43\x0e\xab\xff\x00\x81\xb2\xff\x00\xf1\
-\x55\xfb\x11\xff\x00\x0e\x53\xf8\x2d\xff\x00\x43\x77\x8f\x3f\xf0\
-\x36\xcb\xff\x00\x91\x28\xff\x00\x87\x29\xfc\x16\xff\x00\xa1\xbb\
-\xc7\x9f\xf8\x1b\x65\xff\x00\xc8\x94\x01\xf8\xef\xff\x00\x09\xdf\
-\x89\x7f\xe8\x61\xd5\x7f\xf0\x36\x5f\xfe\x2a\xb1\xa6\xb8\x96\xe6\
-\x67\x96\x69\x1e\x59\x5c\xe5\x9d\xd8\x96\x63\xea\x49\xeb\x5f\xb4\
-\x3f\xf0\xe5\x3f\x82\xdf\xf4\x37\x78\xf3\xff\x00\x03\x6c\xbf\xf9\
-\x12\xbb\xaf\x86\xff\x00\xf0\x4a\x7f\x80\x1f\x0e\xef\xe3\xbf\xb8\
-\xd1\xb5\x2f\x19\xdc\x40\xdb\xe3\x5f\x12\xde\x89\xa2\x56\xff\x00\
-\x6a\x28\x92\x28\xdf\xfd\xd7\x04\x50\x07\xe7\x77\xfc\x13\xff\x00\
-\xf6\x17\xd4\xff\x00\x68\xff\x00\x1b\x69\xfe\x27\xf1\x1e\x9b\x2d\
-\xaf\xc3\x2d\x2e\x65\x9e\xea\xe6\x74\x65\x1a\xa3\xa1\x38\xb5\x87\
-\xfb\xea\x48\xfd\xe3\x8e\x83\x20\x60\xd7\xee\xc4\x71\x24\x31\xac\
-\x68\x8a\x88\xa3\x01\x54\x60\x00\x3b\x01\x50\x69\xfa\x5d\x9e\x93\
-\x63\x6f\x65\x63\x69\x05\x95\x9d\xba\x08\xa1\xb7\xb7\x8d\x63\x8e\
-\x34\x03\x01\x55\x40\xc0\x00\x00\x30\x3b\x0a\xb5\x40\x05\x7c\xab\
-\xfb\x7f\x7e\xc8\x70\xfe\xd5\xdf\x0a\xe3\x4d\x2c\xc5\x07\x8e\x74\
-\x16\x92\xeb\x45\x9e\x53\xb5\x26\xdc\xa0\x4b\x6c\xe7\xfb\xb2\x04\
-\x52\x1b\xb3\xa2\x9f\xbb\xb8\x1f\xaa\xa9\xbb\x54\x74\x00\x7e\x14\
-\x01\xfc\xbb\x78\xb3\xc2\x3a\xcf\x81\x7c\x41\x7d\xa0\xf8\x83\x4c\
-\xb8\xd2\x35\x8b\x19\x1a\x1b\x9b\x1b\xb4\x29\x2c\x2d\xe8\x41\xff\
-\x00\xeb\x8a\xa7\xa7\xf8\x93\x57\xd2\x61\x68\xac\x75\x5b\xdb\x28\
-\x99\xb7\xb2\x5b\xdc\x3c\x6a\x5b\xd4\x80\x7a\xd7\xf4\x73\xf1\xb3\
-\xf6\x5d\xf8\x65\xfb\x44\x59\xc7\x17\x8e\xbc\x25\x67\xab\xdc\x42\
-\x9b\x61\xbf\x4d\xd0\x5e\x42\x3d\x16\x68\xd8\x3e\xdf\xf6\x09\xdb\
-\xed\x5f\x2e\xdf\xff\x00\xc1\x18\x7e\x08\x5d\xcf\xe6\x43\xe2\x1f\
-\x1c\x58\xab\xff\x00\xcb\x18\xf5\x0b\x46\x51\xf4\xdd\x6a\x5b\xf3\
-\x34\x01\xf8\xe7\xff\x00\x09\xdf\x89\x7f\xe8\x61\xd5\x7f\xf0\x36\
-\x5f\xfe\x2a\x8f\xf8\x4e\xfc\x4b\xff\x00\x43\x0e\xab\xff\x00\x81\
-\xb2\xff\x00\xf1\x55\xfb\x11\xff\x00\x0e\x53\xf8\x2d\xff\x00\x43\
-\x77\x8f\x3f\xf0\x36\xcb\xff\x00\x91\x28\xff\x00\x87\x29\xfc\x16\
-\xff\x00\xa1\xbb\xc7\x9f\xf8\x1b\x65\xff\x00\xc8\x94\x01\xf8\xef\
-\xff\x00\x09\xdf\x89\x7f\xe8\x61\xd5\x7f\xf0\x36\x5f\xfe\x2a\x8f\
-\xf8\x4e\xfc\x4b\xff\x00\x43\x0e\xab\xff\x00\x81\xb2\xff\x00\xf1\
-\x55\xfb\x11\xff\x00\x0e\x53\xf8\x2d\xff\x00\x43\x77\x8f\x3f\xf0\
-\x36\xcb\xff\x00\x91\x28\xff\x00\x87\x29\xfc\x16\xff\x00\xa1\xbb\
-\xc7\x9f\xf8\x1b\x65\xff\x00\xc8\x94\x01\xf8\xef\xff\x00\x09\xdf\
-\x89\x7f\xe8\x61\xd5\x7f\xf0\x36\x5f\xfe\x2a\x8f\xf8\x4e\xfc\x4b\
-\xff\x00\x43\x0e\xab\xff\x00\x81\xb2\xff\x00\xf1\x55\xfb\x11\xff\
-\x00\x0e\x53\xf8\x2d\xff\x00\x43\x77\x8f\x3f\xf0\x36\xcb\xff\x00\
-\x91\x28\xff\x00\x87\x29\xfc\x16\xff\x00\xa1\xbb\xc7\x9f\xf8\x1b\
-\x65\xff\x00\xc8\x94\x01\xf8\xcf\xa8\x6b\x3a\x86\xad\x30\x96\xfa\
-\xfa\xe6\xf6\x50\x02\x87\xb8\x99\xa4\x6c\x0e\x83\x24\xd7\xa1\xfc\
-\x0a\xf8\x03\xe3\x0f\xda\x33\xc7\x56\x7e\x17\xf0\x76\x9b\x25\xe5\
-\xcc\x85\x7e\xd3\x74\xdf\x2d\xb5\x8c\x24\xe1\xa6\x99\xf1\x85\x41\
-\xe9\xd5\x88\xc2\xe5\x8e\x2b\xf5\xab\xc3\x3f\xf0\x47\x1f\x81\x3a\
-\x1d\xfc\x77\x3a\x85\xe7\x8b\xbc\x41\x12\x9c\x9b\x3b\xed\x4a\x28\
-\xe2\x6f\xaf\x91\x02\x38\xff\x00\xbe\xeb\xeb\xaf\x86\x5f\x09\xbc\
-\x1d\xf0\x73\xc3\xa9\xa1\xf8\x2b\xc3\xba\x7f\x86\xb4\xdf\xbc\xd6\
-\xf6\x31\x6d\x32\xb6\x31\xbd\xd8\x8d\xd2\x3e\x3f\x89\x89\x34\x01\
-\x8d\xfb\x3c\xfc\x12\xd0\x7f\x67\xbf\x84\xba\x1f\x81\x34\x01\xe6\
-\xdb\x69\x71\xe2\x6b\xa7\x00\x49\x75\x70\xff\x00\x34\x93\x3f\xbb\
-\x16\xc8\x1d\x97\x6a\xf4\x51\x5e\x9d\x49\xb4\x7a\x0f\x4a\x5a\x00\
-\xfc\xc0\xff\x00\x82\xe2\x7f\xc8\xa9\xf0\x9b\xfe\xbf\xb5\x1f\xfd\
-\x17\x6f\x5f\x9d\x9f\xb2\x7f\xfc\x9d\x37\xc1\xcf\xfb\x1c\xf4\x5f\
-\xfd\x2e\x86\xbf\x44\xff\x00\xe0\xb8\x9f\xf2\x2a\x7c\x26\xff\x00\
-\xaf\xed\x47\xff\x00\x45\xdb\xd7\xe7\x67\xec\x9f\xff\x00\x27\x4d\
-\xf0\x73\xfe\xc7\x3d\x17\xff\x00\x4b\xa1\xa0\x0f\xe9\x4a\x8a\x28\
-\xa0\x0f\xcf\xff\x00\xf8\x2d\x57\xfc\x9a\xcf\x85\xbf\xec\x73\xb5\
-\xff\x00\xd2\x1b\xea\xfc\x6f\xf0\x8f\xfc\x8d\x9a\x2f\xfd\x7f\x43\
-\xff\x00\xa3\x16\xbf\x64\x3f\xe0\xb5\x5f\xf2\x6b\x3e\x16\xff\x00\
-\xb1\xce\xd7\xff\x00\x48\x6f\xab\xf1\xbf\xc2\x3f\xf2\x36\x68\xbf\
-\xf5\xfd\x0f\xfe\x8c\x5a\x00\xfe\xa4\x28\xa2\x8a\x00\x29\x30\x3a\
-\xe3\xda\xb9\xbf\x1a\x78\xe3\x44\xf8\x73\xe1\x7d\x47\xc4\x5e\x26\
-\xd5\xed\xf4\x5d\x07\x4e\x84\xcd\x75\x7f\x79\x26\xd4\x45\xc8\x1c\
-\xf1\xce\x49\x00\x05\xe4\xb3\x2a\xae\x49\x02\xbf\x38\xbe\x34\x7f\
-\xc1\x69\x2c\xb4\xdd\x4a\xe2\xc3\xe1\x77\x83\x57\x57\x82\x2f\x95\
-\x75\x9f\x11\x48\xf0\xa4\x87\xd5\x6d\xa3\x21\xf6\xfb\x97\x53\xfe\
-\xca\xd0\x07\xea\x15\x15\xf8\xa6\xdf\xf0\x5a\x2f\x8e\x45\xbf\xe4\
-\x5c\xf0\x22\x0f\xfb\x07\x5e\x7f\xf2\x5d\x37\xfe\x1f\x45\xf1\xcb\
-\xfe\x85\xdf\x02\x7f\xe0\xb6\xf3\xff\x00\x92\xe8\x03\xf6\xba\x8a\
-\xfc\x51\xff\x00\x87\xd1\x7c\x72\xff\x00\xa1\x77\xc0\x9f\xf8\x2d\
-\xbc\xff\x00\xe4\xba\x3f\xe1\xf4\x5f\x1c\xbf\xe8\x5d\xf0\x27\xfe\
-\x0b\x6f\x3f\xf9\x2e\x80\x3f\x6b\xa8\xaf\xc5\x1f\xf8\x7d\x17\xc7\
-\x2f\xfa\x17\x7c\x09\xff\x00\x82\xdb\xcf\xfe\x4b\xa3\xfe\x1f\x45\
-\xf1\xcb\xfe\x85\xdf\x02\x7f\xe0\xb6\xf3\xff\x00\x92\xe8\x03\xf6\
-\xba\x93\x68\xe0\xe3\x9a\xfc\x52\xff\x00\x87\xd1\x7c\x72\xff\x00\
-\xa1\x77\xc0\x9f\xf8\x2d\xbc\xff\x00\xe4\xba\xf4\x3f\x86\xdf\xf0\
-\x5a\xef\x13\x5b\xea\x10\xaf\xc4\x1f\x87\xda\x5d\xee\x9c\xc4\x79\
-\xb7\x1e\x1a\x9a\x4b\x69\xa2\x5f\xef\x2c\x53\x3b\x89\x3e\x9b\x94\
-\x7f\xb5\x40\x1f\xad\x74\x57\x98\x7c\x0b\xfd\xa0\xbc\x13\xfb\x46\
-\x78\x3a\x2f\x11\xf8\x1b\x5a\x1a\xa5\x9e\x55\x2e\x6d\xdc\x6c\xb9\
-\xb3\x90\x8c\xf9\x73\x47\x9c\xa3\x67\xea\x08\x19\x5c\xaf\x35\xe9\
-\xf4\x00\x51\x45\x7e\x7b\x7e\xdd\x5f\xf0\x53\x2d\x4f\xf6\x73\xf8\
-\x84\x7c\x01\xe0\x2d\x17\x4c\xd6\x35\xfb\x38\x22\xb8\xd4\xef\xb5\
-\x93\x23\xdb\xdb\x99\x14\x49\x1c\x4b\x1c\x6e\x8c\xcd\xe5\x94\x72\
-\xc5\xb1\xfb\xc5\x18\x6e\x68\x03\xf4\x23\x68\xf4\xa3\x68\xe7\x81\
-\xcf\x5a\xfc\x52\xff\x00\x87\xd1\x7c\x72\xff\x00\xa1\x77\xc0\x9f\
-\xf8\x2d\xbc\xff\x00\xe4\xba\x3f\xe1\xf4\x5f\x1c\xbf\xe8\x5d\xf0\
-\x27\xfe\x0b\x6f\x3f\xf9\x2e\x80\x3f\x6b\xa8\xaf\xc5\x1f\xf8\x7d\
-\x17\xc7\x2f\xfa\x17\x7c\x09\xff\x00\x82\xdb\xcf\xfe\x4b\xaf\x6a\
-\xfd\x94\xff\x00\xe0\xad\x7e\x25\xf8\x91\xf1\x5b\x45\xf0\x87\xc4\
-\x9f\x0f\x68\xd6\x76\x7a\xf5\xd2\x58\x59\xea\x7a\x02\x4d\x0f\x91\
-\x71\x21\x0b\x18\x91\x65\x91\xc1\x56\x76\x55\xc8\x65\xdb\xbb\x27\
-\x38\xa0\x0f\xd4\x4a\x28\xac\xaf\x11\xeb\xd6\x7e\x15\xf0\xfe\xa7\
-\xad\xea\x73\xfd\x97\x4d\xd3\x6d\xa5\xbc\xb9\x9b\xa8\x48\xa3\x52\
-\xee\xdf\xf7\xc8\x26\x80\x35\x68\xaf\xc7\x6f\x1e\x7f\xc1\x68\xbe\
-\x23\x5c\x78\x92\xfd\xfc\x1b\xe1\x4f\x0d\x58\x78\x7c\x33\x2d\xb4\
-\x7a\xc4\x33\xdc\xdd\x95\x1d\x19\xde\x39\xd1\x01\x3f\xdd\x09\x81\
-\xea\xd5\xcd\x7f\xc3\xe8\xbe\x39\x7f\xd0\xbb\xe0\x4f\xfc\x16\xde\
-\x7f\xf2\x5d\x00\x7e\xd6\xed\x18\x03\x03\x14\x6d\x18\xc6\x06\x3e\
-\x95\xf8\xa5\xff\x00\x0f\xa2\xf8\xe5\xff\x00\x42\xef\x81\x3f\xf0\
-\x5b\x79\xff\x00\xc9\x74\xbf\xf0\xfa\x3f\x8e\x5f\xf4\x2e\xf8\x0f\
-\xff\x00\x05\xb7\x9f\xfc\x97\x40\x1f\xb5\xb4\x57\xc9\xdf\xb0\x6f\
-\xed\xb4\x9f\xb6\x0f\x85\x35\xa4\xd4\x74\xb8\xb4\x1f\x17\xe8\x2f\
-\x10\xd4\x2d\x6d\x64\x66\xb6\x9e\x39\x41\xd9\x2c\x3b\xbe\x65\x04\
-\xc7\x20\x2a\x4b\x15\xc0\xf9\xbe\x61\x8f\xac\x68\x03\xf3\x03\xfe\
-\x0b\x89\xff\x00\x22\xa7\xc2\x6f\xfa\xfe\xd4\x7f\xf4\x5d\xbd\x7e\
-\x76\x7e\xc9\xff\x00\xf2\x74\xdf\x07\x3f\xec\x73\xd1\x7f\xf4\xba\
-\x1a\xfd\x13\xff\x00\x82\xe2\x7f\xc8\xa9\xf0\x9b\xfe\xbf\xb5\x1f\
-\xfd\x17\x6f\x5f\x9d\x9f\xb2\x7f\xfc\x9d\x37\xc1\xcf\xfb\x1c\xf4\
-\x5f\xfd\x2e\x86\x80\x3f\xa5\x2a\x28\xa2\x80\x3f\x3f\xff\x00\xe0\
-\xb5\x5f\xf2\x6b\x3e\x16\xff\x00\xb1\xce\xd7\xff\x00\x48\x6f\xab\
-\xf1\xbf\xc2\x3f\xf2\x36\x68\xbf\xf5\xfd\x0f\xfe\x8c\x5a\xfd\x90\
-\xff\x00\x82\xd5\x7f\xc9\xac\xf8\x5b\xfe\xc7\x3b\x5f\xfd\x21\xbe\
-\xaf\xc6\xff\x00\x08\xff\x00\xc8\xd9\xa2\xff\x00\xd7\xf4\x3f\xfa\
-\x31\x68\x03\xfa\x90\xa2\x8a\xc5\xf1\x66\xab\x2e\x87\xe1\x5d\x67\
-\x52\x88\x6e\x9a\xce\xca\x7b\x84\x07\xa6\x51\x19\x86\x7f\x2a\x00\
-\xfc\x48\xff\x00\x82\x9b\xfe\xd5\xda\x9f\xc7\x2f\x8c\xba\x8f\x83\
-\x74\xbb\xb7\x8f\xc0\xfe\x12\xbc\x92\xce\x08\x62\x63\xb2\xee\xf2\
-\x32\x52\x6b\x86\xc1\xc3\x10\xc1\x91\x33\xd1\x46\x47\x32\x1a\xf9\
-\x73\xe1\xaf\xc2\x8f\x15\xfc\x62\xf1\x25\xbf\x87\x7c\x17\xe1\xeb\
-\xef\x11\x6b\x53\x65\xd6\xda\xc9\x33\xb6\x31\x80\xce\xec\x7e\x54\
-\x40\x59\x72\xee\x42\x8c\x8e\x4e\x46\x39\x1b\x9b\xb9\x6e\xee\x24\
-\x9e\x57\x69\x24\x91\x8b\xbb\x3b\x12\x59\x89\xc9\x24\xf7\x24\xd7\
-\xed\x77\xfc\x11\xfb\xe1\xde\x95\xe1\xff\x00\xd9\x96\x6f\x15\x47\
-\x0c\x6f\xac\x78\x8b\x53\x94\xdc\xdd\x6d\xf9\xbc\xa8\x18\xc5\x14\
-\x59\xeb\x85\x22\x46\xc7\x40\x64\xcd\x00\x7c\x1f\x1f\xfc\x12\x7f\
-\xf6\x8c\x95\x03\x1f\x0b\x69\x91\x33\x7f\xcb\x37\xd6\xad\xb7\x7e\
-\x8d\x8a\x5f\xf8\x74\xdf\xed\x19\xff\x00\x42\xde\x93\xff\x00\x83\
-\xab\x6f\xfe\x2a\xbf\x78\xba\x74\xe2\x96\x80\x3f\x07\x3f\xe1\xd3\
-\x7f\xb4\x67\xfd\x0b\x7a\x4f\xfe\x0e\xad\xbf\xf8\xaa\x3f\xe1\xd3\
-\x7f\xb4\x67\xfd\x0b\x7a\x4f\xfe\x0e\xad\xbf\xf8\xaa\xfd\xe3\xa2\
-\x80\x3f\x07\x3f\xe1\xd3\x7f\xb4\x67\xfd\x0b\x7a\x4f\xfe\x0e\xad\
-\xbf\xf8\xaa\x3f\xe1\xd3\x7f\xb4\x67\xfd\x0b\x7a\x4f\xfe\x0e\xad\
-\xbf\xf8\xaa\xfd\xe3\xa2\x80\x3f\x07\x3f\xe1\xd3\x7f\xb4\x67\xfd\
-\x0b\x7a\x4f\xfe\x0e\xad\xbf\xf8\xaa\xf1\x3f\x8d\x7f\xb3\x2f\xc4\
-\xaf\xd9\xd6\xf2\x1b\x7f\x1f\xf8\x4e\xeb\x43\x4b\xa2\xdf\x66\xbc\
-\x0c\xb3\x5a\xca\x71\xc0\x49\xa3\x66\x52\xdd\xf6\xee\x0c\x3a\x91\
-\x8a\xfe\x93\xeb\xc5\x7f\x6c\x0f\x87\xba\x3f\xc4\xef\xd9\xa7\xe2\
-\x46\x8b\xab\xdb\xa4\xd1\x8d\x16\xea\xfa\xdd\xe4\x1c\xc3\x73\x04\
-\x4d\x2c\x52\x83\xd8\xab\x2a\xe7\x1d\x54\x95\xe8\x68\x03\xf0\x87\
-\xf6\x63\xfd\xa2\x3c\x43\xfb\x32\x7c\x59\xd3\x7c\x61\xa2\xcd\x24\
-\x96\xc8\xeb\x16\xa5\xa7\x06\xc2\x5f\xda\xb3\x02\xf1\x30\x3c\x64\
-\x8c\x90\x4f\xdd\x60\x0d\x7f\x45\x9e\x12\xf1\x46\x9f\xe3\x6f\x0c\
-\xe9\x1e\x20\xd2\x2e\x45\xde\x95\xaa\xda\x45\x7d\x69\x3a\x9f\xf5\
-\x90\xc8\x8a\xc8\xde\xdf\x29\xe9\xeb\x5f\xcb\xa7\x98\xdf\xde\x3f\
-\x9f\xad\x7f\x40\xbf\xf0\x4d\x3d\x6a\x7f\x11\x7e\xc4\xbf\x0c\xee\
-\x6e\xe4\x32\xcf\x0c\x17\x96\x7b\x89\x3f\x72\x2b\xd9\xe2\x41\xf4\
-\x08\x88\x3f\x01\x40\x1f\x51\x57\xf3\xfb\xff\x00\x05\x38\x25\x7f\
-\x6e\x6f\x89\xc0\x1c\x0f\x33\x4f\x3f\x8f\xf6\x7d\xad\x7f\x40\x55\
-\xfc\xfe\x7f\xc1\x4e\x7f\xe4\xf9\xbe\x27\x7f\xd7\x4d\x3f\xff\x00\
-\x4d\xf6\xb4\x01\xe5\xff\x00\x00\xff\x00\x66\x9f\x1c\xfe\xd2\xde\
-\x20\xd4\xf4\x5f\x02\x58\x5b\x5f\xdf\xe9\xb6\xbf\x6c\xb9\x4b\x9b\
-\xb8\xed\xc2\xc5\xbd\x53\x20\xb9\x19\x39\x6a\xf7\x0f\xf8\x74\xdf\
-\xed\x19\xff\x00\x42\xde\x93\xff\x00\x83\xab\x6f\xfe\x2a\xbd\x5f\
-\xfe\x08\x97\xf3\x7c\x6e\xf1\xf0\x3c\x81\xe1\xd5\xc0\xff\x00\xb7\
-\xa8\xeb\xf6\x32\x80\x3f\x9c\x8f\x8f\x9f\xb1\xbf\xc4\xcf\xd9\xa7\
-\x46\xd2\x75\x5f\x1d\xe9\x56\x76\x16\x7a\xa4\xef\x6d\x6a\xd6\x97\
-\xf1\x5c\x96\x91\x57\x71\xc8\x42\x70\x31\x5c\x7f\xec\xf2\xc7\xfe\
-\x17\xf7\xc3\x4e\x7f\xe6\x66\xd3\x3f\xf4\xaa\x3a\xfd\x43\xff\x00\
-\x82\xd9\xda\x4d\x37\xc2\x2f\x87\x93\xa4\x6c\xd0\x45\xad\xcc\xb2\
-\x38\x19\x00\xb4\x27\x68\x27\xb7\xdd\x6f\xca\xbf\x32\x3f\x66\xdb\
-\x19\x35\x0f\xda\x13\xe1\x95\xbc\x11\xf9\xb3\xbf\x8a\x34\xd5\x58\
-\x80\xe4\xff\x00\xa5\x45\x81\x91\xfc\xfb\x60\x9a\x00\xfe\x96\xeb\
-\xcc\x3f\x6a\x05\x1f\xf0\xcd\x3f\x16\xc6\x38\xff\x00\x84\x43\x56\
-\x1f\xf9\x27\x35\x7a\x7d\x79\x87\xed\x3f\xff\x00\x26\xd5\xf1\x6f\
-\xfe\xc5\x1d\x5b\xff\x00\x48\xe6\xa0\x0f\xe6\x9b\x71\xeb\x9e\x6b\
-\xe9\xef\x85\x1f\xf0\x4e\xdf\x8d\x5f\x19\xbe\x1f\xe9\x3e\x33\xf0\
-\xb6\x85\xa7\x5e\x68\x1a\xaa\x3b\xda\xcd\x36\xa5\x04\x4c\xc1\x24\
-\x74\x39\x52\xd9\x1f\x32\x11\x5f\x30\xd7\xf4\x19\xff\x00\x04\xd2\
-\x03\xfe\x18\x83\xe1\x81\xc7\x26\xde\xf3\x3f\xf8\x1d\x71\x40\x1f\
-\x97\x1f\xf0\xe9\xbf\xda\x33\xfe\x85\xbd\x27\xff\x00\x07\x56\xdf\
-\xfc\x55\x7c\xd1\xf1\x4b\xe1\xa6\xb9\xf0\x7f\xc7\xba\xc7\x83\xfc\
-\x49\x6f\x15\xb6\xb9\xa4\xc8\x22\xba\x8a\x29\x56\x55\x46\x28\xae\
-\x00\x65\xe0\xf0\xc2\xbf\xa7\xaa\xfe\x79\xbf\xe0\xa2\x4c\x47\xed\
-\xa5\xf1\x57\x07\xfe\x62\x31\x9f\xfc\x97\x86\x80\x3e\xa3\xff\x00\
-\x82\x20\xf3\xf1\x0b\xe2\x7f\xfd\x82\xac\xff\x00\xf4\x74\x95\xfa\
-\xed\x5f\x91\x3f\xf0\x44\x1f\xf9\x28\x5f\x13\xff\x00\xec\x15\x67\
-\xff\x00\xa3\xa4\xaf\xd7\x6a\x00\xfc\xc0\xff\x00\x82\xe2\x7f\xc8\
-\xa9\xf0\x9b\xfe\xbf\xb5\x1f\xfd\x17\x6f\x5f\x9d\x9f\xb2\x7f\xfc\
-\x9d\x37\xc1\xcf\xfb\x1c\xf4\x5f\xfd\x2e\x86\xbf\x44\xff\x00\xe0\
-\xb8\x9f\xf2\x2a\x7c\x26\xff\x00\xaf\xed\x47\xff\x00\x45\xdb\xd7\
-\xe7\x67\xec\x9f\xff\x00\x27\x4d\xf0\x73\xfe\xc7\x3d\x17\xff\x00\
-\x4b\xa1\xa0\x0f\xe9\x4a\x8a\x28\xa0\x0f\xcf\xff\x00\xf8\x2d\x57\
-\xfc\x9a\xcf\x85\xbf\xec\x73\xb5\xff\x00\xd2\x1b\xea\xfc\x6f\xf0\
-\x8f\xfc\x8d\x9a\x2f\xfd\x7f\x43\xff\x00\xa3\x16\xbf\x64\x3f\xe0\
-\xb5\x5f\xf2\x6b\x3e\x16\xff\x00\xb1\xce\xd7\xff\x00\x48\x6f\xab\
-\xf1\xbf\xc2\x3f\xf2\x36\x68\xbf\xf5\xfd\x0f\xfe\x8c\x5a\x00\xfe\
-\xa4\x2b\x9a\xf8\x90\x07\xfc\x2b\x9f\x15\x71\xff\x00\x30\xab\xaf\
-\xfd\x12\xd5\xd2\xd7\x35\xf1\x23\xfe\x49\xcf\x8a\xbf\xec\x15\x75\
-\xff\x00\xa2\x5a\x80\x3f\x97\xca\xfd\xe2\xff\x00\x82\x4d\x9d\xff\
-\x00\xb1\x6f\x86\x77\x7c\xdf\xf1\x30\xd4\x3a\xff\x00\xd7\xc3\x7f\
-\x8d\x7e\x0e\xd7\xef\x0f\xfc\x12\x67\xfe\x4c\xb7\xc3\x3f\xf6\x10\
-\xd4\x3f\xf4\xa1\xa8\x03\xec\x7a\xf1\x8f\x8f\x9f\xb5\x8f\xc3\x3f\
-\xd9\xa6\x0b\x16\xf1\xcf\x88\xff\x00\xb3\xee\xef\x83\xb5\xae\x9b\
-\x6f\x0b\xcf\x73\x3a\xa9\x00\xb7\x96\xa0\x95\x5e\xb8\x66\xda\xa4\
-\x83\xcd\x7b\x3d\x7e\x0d\x7f\xc1\x57\x75\x2b\x8b\xdf\xdb\x5b\xc5\
-\xb0\xcf\x33\xbc\x76\x76\x3a\x7c\x10\x2b\x31\x21\x10\xdb\x47\x26\
-\xd0\x3b\x0d\xd2\x33\x60\x77\x62\x7b\xd0\x07\xe8\x9f\xfc\x3d\xcf\
-\xf6\x79\xff\x00\xa0\xae\xbd\xff\x00\x82\x79\x3f\xc6\x8f\xf8\x7b\
-\x9f\xec\xf3\xff\x00\x41\x5d\x7b\xff\x00\x04\xf2\x7f\x8d\x7e\x18\
-\x79\x39\x53\x81\x9c\x7d\xec\x73\x8e\x47\xe5\xcf\x19\xfa\x54\x3c\
-\x7a\x50\x07\xee\xaf\xfc\x3d\xcf\xf6\x79\xff\x00\xa0\xae\xbd\xff\
-\x00\x82\x79\x3f\xc6\xbd\x03\xe0\x9f\xed\xf9\xf0\x73\xe3\xf7\x8a\
-\xe2\xf0\xcf\x85\xfc\x4f\x24\x5e\x20\x9c\x16\x83\x4f\xd5\x2d\x24\
-\xb6\x7b\x90\xa0\x96\xf2\x89\x1b\x59\xc0\xe4\xa0\x6d\xd8\x05\x80\
-\xe1\xab\xf9\xf0\xf2\x87\xb1\x39\xc7\x1c\xfb\xf5\x1c\x57\x63\xf0\
-\x4f\x54\xba\xd2\x7e\x31\x78\x16\xf2\xce\x77\x86\xea\xdf\x5d\xb1\
-\x96\x29\x14\x90\x55\x85\xc4\x78\xe7\xda\x80\x3f\xa7\x0a\xe0\xfe\
-\x39\x80\x3e\x09\x7c\x41\x20\x60\xff\x00\xc2\x3d\xa8\x1f\xca\xda\
-\x42\x3f\x5a\xef\x2b\x84\xf8\xe9\xff\x00\x24\x47\xe2\x17\xfd\x8b\
-\xba\x87\xfe\x92\xc9\x40\x1f\xcc\x95\x7e\xfb\x7f\xc1\x2c\xd4\x37\
-\xec\x37\xf0\xf7\x23\x3f\xbc\xd4\xba\xff\x00\xd8\x42\xe2\xbf\x02\
-\x6b\xf7\xdf\xfe\x09\x63\xff\x00\x26\x37\xf0\xf7\xfe\xba\x6a\x5f\
-\xfa\x70\xb8\xa0\x0f\xac\x6b\xf9\xfc\xff\x00\x82\x9c\xff\x00\xc9\
-\xf3\x7c\x4e\xff\x00\xae\x9a\x7f\xfe\x9b\xed\x6b\xfa\x03\xaf\xc3\
-\x5f\xf8\x2a\xe7\xc2\x1f\x12\x78\x4f\xf6\xa0\xd7\xbc\x6d\x79\xa6\
-\xce\xde\x19\xf1\x34\x56\x72\xd9\x6a\x5e\x53\x18\x7c\xc8\xed\x62\
-\x86\x48\x4b\xe0\x00\xe0\xc4\x5b\x07\x9d\xa4\x1c\xe6\x80\x32\x3f\
-\xe0\x9a\xbf\xb4\xc7\x82\x3f\x66\x1f\x89\x5e\x2a\xd7\x3c\x73\x3d\
-\xe5\xa5\x8e\xa3\xa3\xad\x95\xbb\x58\xda\xb4\xe5\xe4\xf3\xd1\xf9\
-\x00\xf0\x30\xa6\xbf\x46\xb4\x5f\xf8\x2b\x07\xec\xf3\xac\x6a\x30\
-\x5a\x3f\x89\x35\x3d\x3b\xcd\x6d\x9f\x68\xbd\xd2\x66\x58\x94\xfa\
-\x9d\xa1\xb0\x2b\xf0\x7f\x75\x68\x69\x7a\x5d\xde\xb1\x7d\x0d\x95\
-\x95\xa4\xf7\xb7\xb7\x0d\xe5\xc5\x6f\x6f\x13\x49\x24\x8d\xfd\xd5\
-\x50\x09\x27\xd8\x50\x07\xf4\xa5\xf1\x2b\xe1\x9f\x82\xff\x00\x68\
-\x8f\x86\xd3\x68\x1e\x26\xb1\xb5\xf1\x27\x86\x75\x34\x8e\xe2\x37\
-\x86\x4c\x80\x48\xdd\x1c\xf0\xca\x87\x21\xb6\xb0\x21\xc1\xc1\x0c\
-\x73\xf2\xb1\x07\xc6\xbe\x00\x7f\xc1\x39\xfe\x0f\x7e\xcf\x3e\x32\
-\x8f\xc5\xda\x0d\x9e\xa9\xac\x6b\xb6\xfb\xcd\x95\xd6\xb9\x74\x97\
-\x1f\x62\x2c\x30\xc6\x24\x48\xd1\x73\x8c\x80\xcc\x19\x86\x7a\xd7\
-\x6d\xfb\x15\xf8\x07\xc4\x3f\x0b\xff\x00\x65\xbf\x87\x9e\x18\xf1\
-\x5c\x6d\x1e\xbf\x61\x60\x4d\xd5\xbc\x8c\x19\xed\xf7\xca\xf2\xa4\
-\x2d\xcf\x05\x15\xd5\x30\x3a\x6d\xc5\x7b\x9e\xd1\xcf\x02\x80\x16\
-\xbc\xc3\xf6\x9f\xff\x00\x93\x6a\xf8\xb7\xff\x00\x62\x8e\xad\xff\
-\x00\xa4\x73\x57\xa7\xd7\x17\xf1\x93\xc2\x37\x5f\x10\x3e\x11\xf8\
-\xdb\xc2\xf6\x52\x2c\x57\x9a\xde\x89\x7b\xa6\xc3\x24\x9c\x00\xf3\
-\x40\xf1\xa9\x3e\xd9\x6a\x00\xfe\x62\xeb\xf5\xab\xf6\x31\xff\x00\
-\x82\x8d\x7c\x19\xf8\x23\xfb\x33\xf8\x27\xc1\x5e\x27\xd4\x75\x68\
-\x75\xcd\x26\x2b\x84\xb9\x8e\xdf\x4d\x79\x63\x52\xf7\x52\xc8\x30\
-\xc0\xe0\xf1\x20\xaf\xcb\x5f\x18\xf8\x27\x5b\xf8\x7b\xe2\x2b\xcd\
-\x07\xc4\x9a\x55\xc6\x8d\xac\x59\xc8\xd1\x4f\x65\x79\x19\x8e\x44\
-\x3f\x43\x8e\x3d\xf3\x58\x3b\xba\x73\x40\x1f\xba\x9f\xf0\xf7\x3f\
-\xd9\xe7\xfe\x82\xba\xf7\xfe\x09\xe4\xff\x00\x1a\xfc\x90\xfd\xaf\
-\xfe\x26\x68\x7f\x19\x3f\x68\xef\x1c\x78\xd7\xc3\x6f\x34\xba\x1e\
-\xb1\x78\x93\x5a\xc9\x71\x09\x89\xd9\x56\x28\xd0\xe5\x4f\x4e\x56\
-\xbc\x67\x8f\x4a\x5c\x9c\x91\x9e\x4f\x5f\x7a\x00\xfd\x30\xff\x00\
-\x82\x20\xff\x00\xc9\x42\xf8\x9f\xff\x00\x60\xab\x3f\xfd\x1d\x25\
-\x7e\xbb\x57\xe5\xf7\xfc\x11\x8f\xe1\x0f\x89\x7c\x37\x63\xe3\x9f\
-\x1f\x6a\x7a\x6c\xda\x6e\x87\xac\x43\x6b\x63\xa6\x3d\xc4\x6c\xa6\
-\xf0\x23\x33\xc9\x2a\x74\xca\x0d\xc8\x03\x63\x0c\x49\xc1\xf9\x5a\
-\xbf\x50\x68\x03\xf3\x03\xfe\x0b\x89\xff\x00\x22\xa7\xc2\x6f\xfa\
-\xfe\xd4\x7f\xf4\x5d\xbd\x7e\x76\x7e\xc9\xff\x00\xf2\x74\xdf\x07\
-\x3f\xec\x73\xd1\x7f\xf4\xba\x1a\xfd\x13\xff\x00\x82\xe2\x7f\xc8\
-\xa9\xf0\x9b\xfe\xbf\xb5\x1f\xfd\x17\x6f\x5f\x9d\x9f\xb2\x7f\xfc\
-\x9d\x37\xc1\xcf\xfb\x1c\xf4\x5f\xfd\x2e\x86\x80\x3f\xa5\x2a\x28\
-\xa2\x80\x3f\x3f\xff\x00\xe0\xb5\x5f\xf2\x6b\x3e\x16\xff\x00\xb1\
-\xce\xd7\xff\x00\x48\x6f\xab\xf1\xbf\xc2\x3f\xf2\x36\x68\xbf\xf5\
-\xfd\x0f\xfe\x8c\x5a\xfd\x90\xff\x00\x82\xd5\x7f\xc9\xac\xf8\x5b\
-\xfe\xc7\x3b\x5f\xfd\x21\xbe\xaf\xc6\xff\x00\x08\xff\x00\xc8\xd9\
-\xa2\xff\x00\xd7\xf4\x3f\xfa\x31\x68\x03\xfa\x90\xae\x6b\xe2\x47\
-\xfc\x93\x9f\x15\x7f\xd8\x2a\xeb\xff\x00\x44\xb5\x74\xb5\xcd\x7c\
-\x48\xff\x00\x92\x73\xe2\xaf\xfb\x05\x5d\x7f\xe8\x96\xa0\x0f\xe5\
-\xf2\xbf\x78\x7f\xe0\x93\x3f\xf2\x65\xbe\x19\xff\x00\xb0\x86\xa1\
-\xff\x00\xa5\x0d\x5f\x83\xd5\xfb\xc3\xff\x00\x04\x99\xff\x00\x93\
-\x2d\xf0\xcf\xfd\x84\x35\x0f\xfd\x28\x6a\x00\xfb\x1e\xbf\x04\x3f\
-\xe0\xaa\xdf\x2f\xed\xbd\xe3\xac\x71\xfe\x8f\xa6\xf4\xff\x00\xaf\
-\x18\x2b\xf7\xbe\xbf\x04\x3f\xe0\xaa\xdf\xf2\x7b\xde\x39\xff\x00\
-\xaf\x7d\x37\xff\x00\x48\x61\xa0\x0f\x46\xff\x00\x82\x31\xe9\xd6\
-\x9a\xa7\xed\x21\xe2\xd8\xef\x6d\x61\xbb\x8d\x7c\x27\x3b\x04\x9e\
-\x30\xe0\x11\x79\x67\x83\x82\x3a\x8a\xfd\x93\xff\x00\x84\x47\x42\
-\xff\x00\xa0\x2e\x9f\xff\x00\x80\xb1\xff\x00\x85\x7e\x39\xff\x00\
-\xc1\x17\x18\x47\xfb\x4a\x78\xb7\xae\x7f\xe1\x12\x98\x0d\xb8\xc7\
-\xfc\x7e\x5a\x7e\xbd\xfe\x80\xfa\x57\xed\x07\x3e\x9f\xe7\xf3\xa0\
-\x0f\xce\x0f\xf8\x2d\x16\x8b\xa7\xe9\x7f\x01\xfc\x0f\x25\x95\x85\
-\xad\xa4\x8d\xe2\x30\x85\xe0\x85\x50\x95\xfb\x34\xc7\x04\x81\xd3\
-\x20\x1c\x7b\x0a\xfc\xa6\xf8\x4a\xc7\xfe\x16\x97\x83\xf9\xff\x00\
-\x98\xcd\x9f\xfe\x8e\x5a\xfd\x67\xff\x00\x82\xd5\x0d\xff\x00\x01\
-\x7c\x0e\x0f\xcd\xff\x00\x15\x28\xe7\xa6\x3f\xd1\x67\x1c\x9c\xfa\
-\xe3\x92\x3b\xd7\xe4\xbf\xc2\x5f\xf9\x2a\x5e\x0f\xff\x00\xb0\xcd\
-\x9f\xfe\x8e\x5a\x00\xfe\x9e\xeb\x84\xf8\xe9\xff\x00\x24\x47\xe2\
-\x17\xfd\x8b\xba\x87\xfe\x92\xc9\x5d\xdd\x70\x9f\x1d\x3f\xe4\x88\
-\xfc\x42\xff\x00\xb1\x77\x50\xff\x00\xd2\x59\x28\x03\xf9\x92\xaf\
-\xdf\x7f\xf8\x25\x8f\xfc\x98\xdf\xc3\xdf\xfa\xe9\xa9\x7f\xe9\xc2\
-\xe2\xbf\x02\x2b\xf7\xdf\xfe\x09\x63\xff\x00\x26\x37\xf0\xf7\xfe\
-\xba\x6a\x5f\xfa\x70\xb8\xa0\x0f\xac\x6a\x1b\x8b\x3b\x7b\xa8\x5e\
-\x19\xe0\x8e\x68\x64\x18\x78\xe4\x40\xca\xc3\xdc\x1e\xbd\x07\xe5\
-\x53\x54\x3b\x8f\x5d\xd9\x18\xc7\x1e\xbf\xe7\xde\x80\x33\xff\x00\
-\xe1\x11\xd0\xbf\xe8\x0b\xa7\xff\x00\xe0\x2c\x7f\xe1\x53\x59\xf8\
-\x7f\x4b\xd3\xe7\x13\xda\x69\xb6\x76\xd3\x63\x6f\x99\x0c\x08\x8d\
-\x8f\x4c\x81\xd2\xaf\x73\xe9\xfe\x7f\x3a\x39\xf4\xff\x00\x3f\x9d\
-\x00\x2e\xd0\x3a\x00\x39\xcd\x2d\x37\x9f\x4f\xf3\xf9\xd3\x09\x3c\
-\x92\x48\xfa\xf4\xff\x00\x3f\x5a\x00\x96\x93\x03\xd2\x96\x8a\x00\
-\xa5\x7d\xa2\xe9\xfa\x9b\x2b\x5e\x58\x5a\xdd\xb2\xf0\xa6\x78\x55\
-\xc8\xfa\x64\x55\x6f\xf8\x44\x74\x2f\xfa\x02\xe9\xff\x00\xf8\x0b\
-\x1f\xf8\x56\xb5\x42\x64\xf2\xd4\x96\x6c\x28\xe4\x9c\xfa\x75\x3c\
-\xf6\xa0\x0c\xff\x00\xf8\x44\x74\x2f\xfa\x02\xe9\xff\x00\xf8\x0b\
-\x1f\xf8\x50\xbe\x11\xd0\xd4\xe5\x74\x5d\x3c\x1f\x6b\x58\xff\x00\
-\xc2\xb4\xb7\x67\xa1\xe7\xf9\x52\xee\xed\x82\x7f\x2a\x00\x3c\xb4\
-\x3d\x51\x4f\x43\xd3\xd0\xe4\x7e\xb4\xfa\x80\x31\x55\x04\xb7\x38\
-\xcf\x1c\xfe\x38\xcf\x4f\xa5\x4f\x40\x1f\x98\x1f\xf0\x5c\x4f\xf9\
-\x15\x3e\x13\x7f\xd7\xf6\xa3\xff\x00\xa2\xed\xeb\xf3\xb3\xf6\x4f\
-\xff\x00\x93\xa6\xf8\x39\xff\x00\x63\x9e\x8b\xff\x00\xa5\xd0\xd7\
-\xe8\x9f\xfc\x17\x13\xfe\x45\x4f\x84\xdf\xf5\xfd\xa8\xff\x00\xe8\
-\xbb\x7a\xfc\xec\xfd\x93\xff\x00\xe4\xe9\xbe\x0e\x7f\xd8\xe7\xa2\
-\xff\x00\xe9\x74\x34\x01\xfd\x29\x51\x45\x14\x01\xf9\xff\x00\xff\
-\x00\x05\xaa\xff\x00\x93\x59\xf0\xb7\xfd\x8e\x76\xbf\xfa\x43\x7d\
-\x5f\x8d\xfe\x11\xff\x00\x91\xb3\x45\xff\x00\xaf\xe8\x7f\xf4\x62\
-\xd7\xec\x87\xfc\x16\xab\xfe\x4d\x67\xc2\xdf\xf6\x39\xda\xff\x00\
-\xe9\x0d\xf5\x7e\x37\xf8\x47\xfe\x46\xcd\x17\xfe\xbf\xa1\xff\x00\
-\xd1\x8b\x40\x1f\xd4\x85\x73\x5f\x12\x3f\xe4\x9c\xf8\xab\xfe\xc1\
-\x57\x5f\xfa\x25\xab\xa5\xae\x6b\xe2\x47\xfc\x93\x9f\x15\x7f\xd8\
-\x2a\xeb\xff\x00\x44\xb5\x00\x7f\x2f\x95\xfb\xc3\xff\x00\x04\x99\
-\xff\x00\x93\x2d\xf0\xcf\xfd\x84\x35\x0f\xfd\x28\x6a\xfc\x1e\xaf\
-\xde\x1f\xf8\x24\xcf\xfc\x99\x6f\x86\x7f\xec\x21\xa8\x7f\xe9\x43\
-\x50\x07\xd8\xf5\xf8\x2f\xff\x00\x05\x5a\xb3\x9e\xdf\xf6\xd6\xf1\
-\x84\x92\xc0\xd1\xa5\xc5\xa6\x9f\x2c\x4e\xeb\x81\x22\x8b\x48\xd0\
-\xb2\x9e\xe0\x32\xb2\xfd\x54\xd7\xef\x45\x78\x1f\xed\x1d\xfb\x1b\
-\xfc\x33\xfd\xa9\xa3\xb3\x9b\xc6\x9a\x6c\xdf\xda\x9a\x7a\x34\x16\
-\xda\xc6\x9b\x71\xe4\xdd\xa4\x65\x8b\x18\xcb\xe1\x95\x97\x24\x90\
-\xae\xa4\x21\x66\x2b\x8c\x9a\x00\xfe\x75\x96\x79\x23\x39\x59\x19\
-\x4f\x23\x20\x91\xd7\xad\x3b\xed\x93\xff\x00\xcf\x79\x3f\xef\xb3\
-\x5f\xb6\x9f\xf0\xe6\x9f\x81\x1f\xf4\x11\xf1\x97\xfe\x0c\xe0\xff\
-\x00\xe3\x14\x7f\xc3\x9a\x7e\x04\x7f\xd0\x47\xc6\x5f\xf8\x33\x83\
-\xff\x00\x8c\x50\x07\xe2\x4b\xdc\x4b\x27\xdf\x91\xdb\xfd\xe6\x27\
-\xda\xbb\x5f\x83\x56\x33\xea\x5f\x17\xbc\x11\x69\x6b\x0f\x9d\x75\
-\x36\xb7\x64\x91\xc4\xa0\xe4\x93\x3a\x80\x38\xfc\xcd\x7e\xc0\xff\
-\x00\xc3\x9a\x7e\x04\x7f\xd0\x47\xc6\x5f\xf8\x33\x83\xff\x00\x8c\
-\x57\xa2\xfc\x09\xff\x00\x82\x71\xfc\x1b\xf8\x05\xe3\x1b\x7f\x14\
-\xe8\xba\x76\xa7\xac\x6b\xb6\xbf\x35\x9d\xde\xb9\x76\xb7\x1f\x65\
-\x6e\x3e\x74\x44\x8d\x50\x38\xec\xc4\x12\x3b\x50\x07\xd5\x55\xc2\
-\x7c\x74\xff\x00\x92\x23\xf1\x0b\xfe\xc5\xdd\x43\xff\x00\x49\x64\
-\xae\xee\xb8\x4f\x8e\x9f\xf2\x44\x7e\x21\x7f\xd8\xbb\xa8\x7f\xe9\
-\x2c\x94\x01\xfc\xc9\x57\xef\xbf\xfc\x12\xc7\xfe\x4c\x6f\xe1\xef\
-\xfd\x74\xd4\xbf\xf4\xe1\x71\x5f\x81\x15\xfb\xef\xff\x00\x04\xb1\
-\xff\x00\x93\x1b\xf8\x7b\xff\x00\x5d\x35\x2f\xfd\x38\x5c\x50\x07\
-\xd6\x35\xf8\x91\xff\x00\x05\x5b\xf8\xf9\xe2\xcf\x12\x7e\xd2\x9a\
-\xf7\xc3\xff\x00\xed\x6b\xab\x4f\x09\xf8\x6e\x0b\x68\x61\xd3\x60\
-\x95\x92\x19\xe5\x96\xda\x29\xde\x59\x54\x10\x1d\xc1\x97\x68\xce\
-\x70\x14\x7f\x78\xd7\xed\xbd\x7f\x3f\xbf\xf0\x53\x96\x3f\xf0\xdc\
-\xdf\x13\xb9\xe8\xfa\x7f\xfe\x9b\xed\x68\x03\xe5\xef\xb6\x4f\xff\
-\x00\x3d\xe4\xff\x00\xbe\xcd\x1f\x6c\x9f\xfe\x7b\xc9\xff\x00\x7d\
-\x9a\xfa\xd3\xfe\x09\xd3\xfb\x2c\xf8\x37\xf6\xac\xf8\x8f\xe2\x7d\
-\x07\xc6\x32\xea\xb0\x59\x69\xba\x50\xbd\x85\xb4\x9b\x98\xe2\x62\
-\xfe\x7a\x47\x83\xbd\x1b\x8c\x31\xaf\xd0\x0f\xf8\x73\x4f\xc0\x8f\
-\xfa\x08\xf8\xcb\xff\x00\x06\x70\x7f\xf1\x8a\x00\xfc\x4b\xfb\x64\
-\xff\x00\xf3\xde\x4f\xfb\xec\xd7\xd1\x7f\xb0\xf7\xc7\x9f\x17\xfc\
-\x1e\xfd\xa1\x7c\x17\x1e\x93\xab\xde\x7f\x63\xea\xba\xbd\xae\x9d\
-\xa9\xe9\x7e\x63\xb5\xbd\xcc\x33\xca\x91\xbe\xe4\x27\x6e\xf5\xdf\
-\x95\x62\x32\x18\x2f\x62\x6b\xda\xbf\xe0\xa3\x5f\xb0\xdf\xc3\xbf\
-\xd9\x3f\xc1\x3e\x11\xd5\x3c\x1b\x77\xae\x5d\x5d\x6a\xd7\xf2\xda\
-\xcf\xfd\xad\x77\x14\xaa\x11\x22\xde\x31\xb2\x24\xe7\x35\xf2\x3f\
-\xec\xf1\x23\x7f\xc2\xfc\xf8\x6a\x37\x1c\x7f\xc2\x4b\xa6\xf7\xff\
-\x00\xa7\xa8\xff\x00\xc4\xd0\x07\xf4\xcd\x45\x15\x03\x4a\x23\x56\
-\x2c\xd8\x51\x92\x4e\x7d\x3a\x9e\x7b\x50\x04\xf5\xf0\x9f\xfc\x15\
-\xab\xe3\x37\x8b\xfe\x13\xfc\x0a\xd0\xec\xfc\x29\x7b\x75\xa3\x8f\
-\x10\x6a\x66\xce\xf7\x54\xb2\x73\x1c\x89\x12\x21\x73\x0a\xb8\xe5\
-\x0c\x8c\x33\xb8\x1e\x55\x18\x74\x35\xdf\xf8\x83\xfe\x0a\x6f\xfb\
-\x3f\xf8\x77\xc7\x6f\xe1\x79\xfc\x65\x24\xd2\xc5\x2f\x93\x2e\xa9\
-\x6b\x65\x24\xd6\x11\xbe\x7a\x19\x40\xf9\x97\xfd\xb4\xdc\xbe\xf5\
-\xed\x5f\x12\x7e\x1a\x78\x27\xf6\x86\xf8\x6f\x26\x81\xe2\x6b\x2b\
-\x7f\x12\x78\x67\x56\x8e\x39\xa3\x64\x93\xd4\x06\x8e\x68\x65\x4e\
-\x54\xe0\xe5\x58\x1e\x43\x63\xa1\x22\x80\x3f\x9a\x29\xb5\x2b\xbb\
-\x89\x1a\x49\x6e\xa6\x95\xdb\xab\x3c\x84\x93\xf5\x39\xa6\xad\xf5\
-\xca\x9c\x8b\x89\x41\xf5\x0e\x6b\xf6\xd2\x4f\xf8\x23\x6f\xc0\x87\
-\x66\x6f\xb7\x78\xc9\x3d\x97\x53\x83\xff\x00\x8c\x57\xe5\x3f\xed\
-\x67\xf0\xa3\x46\xf8\x23\xfb\x43\x78\xd3\xc1\x1e\x1f\x6b\xa9\x34\
-\x7d\x1e\xed\x21\xb6\x6b\xe7\x0f\x33\x29\x89\x1f\xe6\x60\xaa\x0f\
-\x2e\x47\x4e\xd4\x01\xfa\x29\xff\x00\x04\x72\xf8\xef\xe2\xbf\x1c\
-\xe9\xbe\x33\xf0\x37\x88\xf5\x5b\xad\x67\x4f\xd1\x21\xb6\xbd\xd3\
-\x25\xbd\x95\xa4\x92\xdd\x64\x32\x2c\x91\x06\x62\x49\x4c\x84\xc2\
-\xf4\x18\x38\xeb\x5f\xa6\x55\xf9\x15\xff\x00\x04\x42\xf9\xbe\x22\
-\x7c\x4f\x27\x93\xfd\x95\x67\xff\x00\xa3\xa4\xaf\xd7\x5a\x00\xfc\
-\xc0\xff\x00\x82\xe2\x7f\xc8\xa9\xf0\x9b\xfe\xbf\xb5\x1f\xfd\x17\
-\x6f\x5f\x9d\x9f\xb2\x7f\xfc\x9d\x37\xc1\xcf\xfb\x1c\xf4\x5f\xfd\
-\x2e\x86\xbf\x44\xff\x00\xe0\xb8\x9f\xf2\x2a\x7c\x26\xff\x00\xaf\
-\xed\x47\xff\x00\x45\xdb\xd7\xe7\x67\xec\x9f\xff\x00\x27\x4d\xf0\
-\x73\xfe\xc7\x3d\x17\xff\x00\x4b\xa1\xa0\x0f\xe9\x4a\x8a\x28\xa0\
-\x0f\xcf\xff\x00\xf8\x2d\x57\xfc\x9a\xcf\x85\xbf\xec\x73\xb5\xff\
-\x00\xd2\x1b\xea\xfc\x6f\xf0\x8f\xfc\x8d\x9a\x2f\xfd\x7f\x43\xff\
-\x00\xa3\x16\xbf\x64\x7f\xe0\xb5\x3f\xf2\x6b\x3e\x16\xff\x00\xb1\
-\xca\xd7\xff\x00\x48\x6f\xab\xf1\xb7\xc2\x3f\xf2\x35\x68\xbf\xf5\
-\xfb\x0f\xfe\x8c\x5a\x00\xfe\xa4\x6b\x0f\xc6\x3a\x6c\x9a\xd7\x85\
-\x35\xab\x08\x8e\x25\xbb\xb1\x9e\x04\xf4\xcb\x46\xca\x3f\x98\xad\
-\xca\x4c\x7b\x50\x07\xf2\xc1\x35\xbb\xda\xc9\x24\x53\x21\x8e\x58\
-\xc9\x57\x56\x18\x2a\x41\xc1\x04\x7a\x8a\xfd\xb4\xff\x00\x82\x41\
-\xf8\xf3\x4d\xd7\xbf\x65\x93\xe1\xdb\x69\x94\x6a\x9e\x1f\xd5\xee\
-\x23\xbb\xb7\xcf\xce\xab\x33\x09\x63\x72\x33\x9d\xac\x59\xd4\x11\
-\xde\x36\xf4\xe7\xe0\xaf\xf8\x29\x47\xec\xaf\xa8\x7c\x07\xf8\xe1\
-\xa9\x78\x8b\x4f\xb2\x61\xe0\x9f\x16\x5c\xc9\x7d\x61\x70\x8a\x44\
-\x76\xf7\x2e\x77\xcb\x6a\x4f\x45\x2a\x72\xcb\x9e\x0a\x11\x8e\x55\
-\xb1\xf3\xb7\xc1\xef\x8d\x5e\x36\xf8\x0b\xe2\xc5\xf1\x1f\x81\x75\
-\xfb\x9f\x0f\xea\x9b\x3c\xa9\x24\x87\x6b\x47\x34\x79\x07\xcb\x95\
-\x1b\xe4\x91\x72\x01\xc3\x02\x32\x05\x00\x7f\x4d\x54\x9b\x41\xc6\
-\x40\x38\xe9\x5f\x87\x96\xff\x00\xf0\x58\x1f\x8f\xe8\xa1\x0b\x78\
-\x62\x66\xe9\xbd\xf4\x96\xdd\xf9\x2c\x80\x52\x7f\xc3\xe2\x7e\x3e\
-\xff\x00\x77\xc2\xbf\xf8\x2a\x7f\xfe\x3b\x40\x1f\xb8\xb4\x57\xe1\
-\xd7\xfc\x3e\x27\xe3\xef\xf7\x7c\x2b\xff\x00\x82\xa7\xff\x00\xe3\
-\xb4\x7f\xc3\xe2\x7e\x3e\xff\x00\x77\xc2\xbf\xf8\x2a\x7f\xfe\x3b\
-\x40\x1f\xb8\xb4\x9b\x47\xa0\xf5\xaf\xc3\xbf\xf8\x7c\x4f\xc7\xdf\
-\xee\xf8\x57\xff\x00\x05\x4f\xff\x00\xc7\x68\xff\x00\x87\xc4\xfc\
-\x7d\xfe\xef\x85\x7f\xf0\x54\xff\x00\xfc\x76\x80\x3f\x71\x6b\xc7\
-\x7f\x6b\x2f\x1d\x69\x7f\x0d\xff\x00\x66\xbf\x89\x1a\xce\xaf\x72\
-\x90\x5b\xae\x87\x79\x6d\x1a\xbb\xe3\xcd\x9a\x58\x9a\x28\xa3\x1d\
-\xf2\xce\xea\xbc\x74\xc9\xf4\xaf\xc9\xcf\xf8\x7c\x47\xc7\xef\xee\
-\xf8\x57\xff\x00\x05\x4f\xff\x00\xc7\x6b\xc1\xfe\x3f\x7e\xd7\x3f\
-\x14\x3f\x69\x29\x6d\x93\xc7\x1e\x24\x6b\xbd\x36\xd5\xf7\xc1\xa4\
-\xda\xc6\xb6\xf6\xb1\x38\xc8\x0f\xe5\xaf\xde\x7c\x12\x37\x3e\x4f\
-\x34\x01\xe2\x95\xfd\x02\xff\x00\xc1\x33\xf4\x5b\x9d\x0f\xf6\x22\
-\xf8\x69\x0d\xd2\x34\x53\x4d\x0d\xe5\xd0\x52\x31\xf2\x4b\x7b\x3b\
-\xc6\xdf\x42\x8c\x87\xf1\xaf\xc5\x0f\xd9\xcf\xf6\x7f\xd7\xbf\x69\
-\x3f\x8a\x9a\x37\x82\xfc\x3d\x11\x57\xb9\x93\xcd\xbe\xbc\x28\x4a\
-\x58\x5a\xab\x28\x92\x77\x3e\x80\x1c\x28\xee\xc5\x57\xab\x0a\xfe\
-\x8c\xbc\x1b\xe1\x3d\x3b\xc0\x7e\x11\xd1\xbc\x35\xa3\xc3\xf6\x6d\
-\x2b\x48\xb1\x86\xc6\xd2\x13\xfc\x11\x46\x81\x10\x1f\x5e\x17\x9a\
-\x00\xe8\x2b\xf9\xfc\xff\x00\x82\x9c\xff\x00\xc9\xf3\x7c\x4e\xff\
-\x00\xae\x9a\x7f\xfe\x9b\xed\x6b\xfa\x03\xaf\xe7\xef\xfe\x0a\x77\
-\xff\x00\x27\xcd\xf1\x37\xfe\xba\x69\xff\x00\xfa\x6e\xb5\xa0\x0f\
-\x78\xff\x00\x82\x26\x7c\xdf\x1b\xfc\x7f\x9e\x7f\xe2\x9d\x5f\xfd\
-\x2a\x8e\xbf\x63\x2b\xf9\xba\xfd\x9b\xff\x00\x6a\x0f\x19\xfe\xca\
-\xfe\x24\xd5\xb5\xcf\x04\x8d\x37\xed\xfa\x95\xa7\xd8\xa6\x3a\x95\
-\xb9\x99\x7c\xbd\xea\xfc\x0d\xcb\xce\x56\xbe\x80\xff\x00\x87\xc4\
-\xfc\x7d\xfe\xef\x85\x7f\xf0\x54\xff\x00\xfc\x76\x80\x3e\x9c\xff\
-\x00\x82\xdc\x1f\xf8\xb5\x7f\x0d\xbf\xec\x35\x71\xff\x00\xa2\x6b\
-\xf3\x03\xf6\x79\xff\x00\x92\xfd\xf0\xd3\xfe\xc6\x6d\x37\xff\x00\
-\x4a\xa3\xaf\x44\xfd\xa4\x3f\x6d\xaf\x88\xdf\xb5\x56\x87\xa3\xe9\
-\x3e\x37\x1a\x3f\xd9\xb4\xab\x87\xb9\xb7\xfe\xcd\xb4\x30\x92\xee\
-\xbb\x0e\x4e\xe6\xc8\xc7\x35\xe7\xbf\xb3\xda\xff\x00\xc5\xfd\xf8\
-\x67\x8e\xbf\xf0\x93\x69\x7f\xfa\x55\x1d\x00\x7f\x4c\xd5\xe6\xbf\
-\xb4\x95\xe4\xda\x67\xec\xef\xf1\x42\xf6\xd2\x56\x82\xee\xdb\xc2\
-\xda\xa4\xf0\xcb\x19\x2a\xc8\xeb\x69\x23\x2b\x02\x39\x04\x10\x0e\
-\x47\x70\x2b\xd2\xab\xcb\xff\x00\x69\xff\x00\xf9\x36\xaf\x8b\x58\
-\xff\x00\xa1\x47\x56\xff\x00\xd2\x39\xa8\x03\xf9\xa7\xc9\xf5\xaf\
-\xe8\x43\xfe\x09\xc5\x77\x36\xa9\xfb\x14\xfc\x2e\x9e\xe6\x56\x9e\
-\x45\xb2\x9e\x15\x69\x09\x24\x2a\x5e\x4e\xaa\xa3\x3d\x00\x55\x50\
-\x07\x60\xa0\x76\xaf\xe7\xbe\xbe\xb4\xf8\x35\xff\x00\x05\x28\xf8\
-\xc1\xf0\x3b\xe1\xbe\x89\xe0\x5f\x0d\x2f\x87\xce\x89\xa4\xa4\x89\
-\x6a\x6f\xac\x1a\x49\x3e\x79\x5e\x53\xb9\xc4\x8a\x0f\xcc\xe6\x80\
-\x3f\x7c\xeb\xf9\xe6\xff\x00\x82\x89\x7c\xbf\xb6\x97\xc5\x5c\x71\
-\xff\x00\x13\x18\xfa\x7f\xd7\xbc\x35\xea\xbf\xf0\xf8\x9f\x8f\xbf\
-\xdd\xf0\xaf\xfe\x0a\x9f\xff\x00\x8e\xd7\xca\x7f\x17\xbe\x27\x6b\
-\x5f\x19\xbe\x23\xeb\x9e\x33\xf1\x08\xb6\x3a\xe6\xb1\x30\x9a\xeb\
-\xec\x91\x18\xe3\xdd\xb1\x50\x6d\x43\xc8\xe1\x07\xe7\x40\x1f\x7d\
-\xff\x00\xc1\x10\x7f\xe4\xa1\x7c\x4f\xff\x00\xb0\x55\x9f\xfe\x8e\
-\x92\xbf\x5d\xab\xf2\x27\xfe\x08\x85\xff\x00\x25\x0f\xe2\x87\xfd\
-\x82\xec\xff\x00\xf4\x74\x95\xfa\xed\x40\x1f\x98\x1f\xf0\x5c\x4f\
-\xf9\x15\x3e\x13\x7f\xd7\xf6\xa3\xff\x00\xa2\xed\xeb\xf3\xb3\xf6\
-\x4f\xff\x00\x93\xa6\xf8\x39\xff\x00\x63\x9e\x8b\xff\x00\xa5\xd0\
-\xd7\xe8\x9f\xfc\x17\x13\xfe\x45\x5f\x84\x9f\xf5\xfb\xa9\x7f\xe8\
-\xbb\x7a\xfc\xed\xfd\x93\xbf\xe4\xe9\x3e\x0d\xff\x00\xd8\xe5\xa3\
-\xff\x00\xe9\x74\x34\x01\xfd\x28\xd1\x45\x14\x01\xf0\xef\xfc\x16\
-\x0f\xc3\x72\xeb\xdf\xb2\x1f\xdb\x23\x52\xcb\xa2\xf8\x82\xca\xfe\
-\x4c\x0c\xed\x56\x59\x6d\xf2\x7f\x1b\x81\x5f\x88\x36\x57\x92\x58\
-\x5e\x41\x71\x0e\x04\xb0\xb8\x91\x0f\xa1\x07\x22\xbf\xa5\x8f\x8f\
-\x9f\x0a\xed\x7e\x37\xfc\x1a\xf1\x8f\x81\xae\xdd\x23\x5d\x6f\x4f\
-\x96\xde\x29\xa4\xfb\xb0\xcc\x3e\x68\x25\x23\xb8\x49\x56\x36\xff\
-\x00\x80\xd7\xf3\x71\xe2\x8f\x0e\xdf\xf8\x4b\xc4\x1a\x8e\x87\xab\
-\x5a\x3d\x8e\xad\xa7\x5c\x49\x69\x79\x6b\x22\xe1\xa1\x99\x1b\x6b\
-\xa3\x7b\xab\x06\x07\x1c\x71\xc7\x5a\x00\xfe\x9b\x7c\x0b\xe3\x0b\
-\x3f\x1f\xf8\x37\x44\xf1\x36\x9a\xfb\xf4\xfd\x5e\xca\x1b\xeb\x76\
-\x0d\x9c\xc7\x2c\x6a\xeb\xf9\x06\xc1\x1e\xa0\xd7\x45\x5f\x99\x7f\
-\xf0\x4a\x1f\xdb\x23\x4f\xd5\x3c\x23\x6b\xf0\x5f\xc5\x97\xeb\x6d\
-\xac\xe9\xdb\xdb\xc3\xb7\x13\xb8\x02\xee\xdc\x92\xe6\xd8\x12\x7f\
-\xd6\x26\x58\xa8\xe9\xb0\xe0\x7d\xca\xfd\x34\xa0\x0e\x4f\xe2\x37\
-\xc3\x8f\x0d\x7c\x5a\xf0\x7e\xa3\xe1\x6f\x16\xe9\x36\xfa\xee\x85\
-\x7c\xbb\x27\xb3\xb8\x52\x41\xe7\x2a\xc0\x8e\x55\x94\xe0\x86\x1c\
-\x82\x38\xaf\xcc\xbf\x8c\xff\x00\xf0\x45\xdb\xd8\x75\x29\xaf\x7e\
-\x16\x78\xd6\xd0\xda\x36\x5d\x74\xbf\x14\x06\x47\x84\x0e\xcb\x71\
-\x12\xb6\xfe\xa3\xef\x46\xb8\xee\xd5\xfa\xbd\xb1\x71\x8d\xa3\x18\
-\xc7\x4a\x5d\xa3\xd3\xde\x80\x3f\x0e\x1b\xfe\x08\xfd\xf1\xfb\x77\
-\xfa\xbf\x0c\xb7\xd3\x56\x23\xff\x00\x69\xd4\x7f\xf0\xe8\x0f\xda\
-\x03\xfe\x79\x78\x67\xff\x00\x06\xdf\xfd\xae\xbf\x73\x28\xa0\x0f\
-\xc3\x3f\xf8\x74\x07\xed\x01\xff\x00\x3c\xbc\x33\xff\x00\x83\x6f\
-\xfe\xd7\x47\xfc\x3a\x03\xf6\x80\xff\x00\x9e\x5e\x19\xff\x00\xc1\
-\xb7\xff\x00\x6b\xaf\xdc\xca\x28\x03\xf0\xcf\xfe\x1d\x01\xfb\x40\
-\x7f\xcf\x2f\x0c\xff\x00\xe0\xdb\xff\x00\xb5\xd1\xff\x00\x0e\x80\
-\xfd\xa0\x3f\xe7\x97\x86\x7f\xf0\x6d\xff\x00\xda\xeb\xf7\x32\x8a\
-\x00\xfc\x33\xff\x00\x87\x40\x7e\xd0\x1f\xf3\xcb\xc3\x3f\xf8\x36\
-\xff\x00\xed\x75\xe8\x3f\x0c\xff\x00\xe0\x8b\xfe\x3e\xd5\x35\x08\
-\x9f\xc7\x5e\x31\xd0\xfc\x3d\xa6\x64\x12\xba\x4f\x9b\x7b\x74\xdf\
-\xec\x80\xe9\x1a\x2f\xfd\xf4\xc7\xfd\x9a\xfd\x8b\xa4\xc7\xb5\x00\
-\x79\x07\xec\xf7\xfb\x33\x78\x0b\xf6\x61\xf0\xa9\xd0\x7c\x13\xa5\
-\x3c\x06\x7d\xa6\xf3\x51\xb9\x6f\x36\xee\xf9\xc1\x3b\x5a\x69\x00\
-\x1d\x32\x70\x02\xaa\x8c\x9c\x0e\x6b\xd7\xb6\xaf\x1f\x28\xe3\x91\
-\xc5\x2e\xd1\xe8\x29\x68\x00\xaf\xce\x0f\xdb\xe3\xfe\x09\xab\xe2\
-\x0f\xda\x03\xe2\x64\xff\x00\x11\x7e\x1e\x6a\x9a\x6c\x7a\xce\xa1\
-\x0c\x51\xea\xda\x5e\xac\xed\x08\x95\xe2\x8c\x44\x92\xc5\x20\x56\
-\x00\x94\x54\x56\x53\xb4\x7c\x99\xdd\x93\xb6\xbf\x47\xe9\xbb\x57\
-\xd0\x75\xcf\x4a\x00\xfc\x36\xff\x00\x87\x41\x7e\xd0\x3c\x7e\xef\
-\xc3\x3c\x74\xff\x00\x89\xbf\xff\x00\x6b\xa4\xff\x00\x87\x40\x7e\
-\xd0\x1f\xf3\xcb\xc3\x3f\xf8\x36\xff\x00\xed\x75\xfb\x99\x45\x00\
-\x7e\x1a\x7f\xc3\xa0\xbf\x68\x1f\xf9\xe7\xe1\x9f\xfc\x1b\xff\x00\
-\xf6\xba\xf6\xbf\xd9\x3b\xfe\x09\x3b\xe3\x2f\x04\xfc\x5e\xd0\x3c\
-\x65\xf1\x2f\x54\xd1\x6d\xb4\x9d\x02\xf6\x3d\x46\x0d\x33\x4c\xb8\
-\x7b\x99\x6e\xa7\x88\xac\x91\x87\x62\xaa\x89\x1a\xb0\x0c\x79\x62\
-\xdb\x0a\xed\xc1\xdd\x5f\xac\x14\xdd\x8b\xfd\xd1\xf9\x50\x03\xab\
-\x13\xc5\x3e\x1e\xb1\xf1\x87\x86\x75\x6f\x0f\x6a\x71\x34\xfa\x76\
-\xab\x67\x3d\x8d\xd4\x7d\x0c\x90\xc8\x86\x39\x07\xb6\x55\x8f\xe7\
-\x5b\x74\x9b\x40\xce\x00\x19\xeb\xc5\x00\x7e\x2b\xf8\xff\x00\xfe\
-\x08\xdd\xf1\x6f\x48\xf1\x35\xe4\x1e\x13\xd5\x7c\x3f\xe2\x0d\x07\
-\x7b\x1b\x5b\xab\x9b\xb7\xb7\x9f\xcb\xed\xe6\xa1\x8f\x68\x6f\x65\
-\x66\x15\xce\x8f\xf8\x24\x1f\xed\x04\x0e\x44\x7e\x19\x07\xfe\xc2\
-\xff\x00\xfd\xae\xbf\x72\xb6\x8c\x83\x81\x91\xd3\x8a\x5a\x00\xfc\
-\x33\xff\x00\x87\x40\x7e\xd0\x1f\xf3\xcb\xc3\x3f\xf8\x36\xff\x00\
-\xed\x75\x27\xfc\x39\xfb\xf6\x80\x3c\x18\xfc\x32\x47\xfd\x85\xcf\
-\xff\x00\x1b\xaf\xdc\x8a\x28\x03\xe3\xdf\xf8\x27\xef\xec\x53\x37\
-\xec\x7f\xe1\x7d\x7a\xf7\xc4\x3a\xad\xa6\xa9\xe3\x0f\x10\x34\x2b\
-\x78\xd6\x1b\x9a\xda\xd2\x18\xb7\x94\x89\x19\x95\x59\x89\xde\x59\
-\x98\xaa\x8f\xba\x00\xf9\x77\x37\xd8\x54\xdd\x8a\x46\x0a\x8c\x67\
-\x3d\x3b\xe7\x39\xfc\xeb\x8b\xf8\xa9\xf1\x53\xc3\x9f\x06\x3c\x0b\
-\xab\x78\xbf\xc5\xda\xaa\x69\x7a\x26\x9c\x86\x49\x1d\x88\xdd\x29\
-\x23\xe4\x8a\x35\xea\xd2\x39\xe1\x54\x72\x4f\xa0\xa0\x0f\xcc\x9f\
-\xf8\x2d\xb7\x8d\xad\x6f\x3c\x4d\xf0\xc3\xc2\x51\x4c\x1a\xee\xc2\
-\xd6\xf7\x53\xb9\x4c\xe4\x85\x99\xe2\x8e\x23\xec\x7f\x73\x31\xc7\
-\xa1\x15\xf1\xcf\xec\x37\xe1\x99\x7c\x59\xfb\x5e\x7c\x25\xb2\x81\
-\x4b\x34\x3e\x20\xb6\xbf\x38\x5c\xe1\x6d\xdb\xed\x0c\x7f\x01\x11\
-\xae\x77\xf6\x92\xf8\xe1\xab\x7e\xd1\x5f\x19\x3c\x47\xe3\xbd\x5c\
-\x34\x2d\xa8\xcd\x8b\x4b\x52\x78\xb5\xb5\x4f\x92\x08\x87\xba\xa8\
-\x1b\xb1\xf7\x98\xb3\x75\x26\xbe\xd5\xff\x00\x82\x35\xfc\x0c\x9b\
-\x5a\xf8\x8d\xaf\xfc\x54\xbf\xb5\x1f\xd9\xba\x0d\xb3\x69\x7a\x6c\
-\xce\xa4\x07\xbc\x9c\x0f\x31\x94\xf7\x29\x0e\x54\xfb\x5c\x0e\xf9\
-\xa0\x0f\xd7\xfa\x28\xa2\x80\x1b\xb5\x7f\xba\x3f\x2f\x4a\xfc\xc1\
-\xff\x00\x82\xa6\xfe\xc2\xf7\x9e\x25\xba\xba\xf8\xcf\xe0\x2d\x3d\
-\xee\xaf\xe3\x88\x7f\xc2\x47\xa5\xdb\xae\x64\x95\x50\x05\x4b\xb8\
-\xd4\x75\x65\x50\x15\xc7\x70\x15\xba\x86\xaf\xd4\x0a\x4d\xa3\xd0\
-\x7e\x54\x01\xfc\xb3\x5b\x5c\xdc\xe9\x97\x91\x5c\xdb\x4b\x2d\xad\
-\xd4\x12\x09\x22\x9a\x16\x64\x78\xdd\x48\x3b\x95\xb8\x21\x81\x00\
-\x8e\xe3\x15\xf7\xff\x00\xec\xf7\xff\x00\x05\x7d\xf1\xdf\xc3\xdd\
-\x32\xd3\x46\xf8\x8d\xa4\x9f\x88\x1a\x7c\x60\x22\x6a\xd1\xcd\xf6\
-\x6d\x4a\x35\x1c\x1d\xec\x54\xc7\x36\x07\x42\x42\xb1\xfe\x27\x35\
-\xf4\xef\xed\x61\xff\x00\x04\xa9\xf0\xa7\xc6\x2b\x9b\xbf\x13\xfc\
-\x3e\xb9\xb5\xf0\x2f\x8a\xe6\x62\xf3\x58\x98\xc8\xd2\xef\x18\xf0\
-\x58\xa2\x65\xa1\x62\x7a\x94\x04\x1e\x9b\x72\x77\x57\xe6\x87\xc5\
-\x2f\xd8\x7b\xe3\x77\xc2\x0b\xa9\x17\x5c\xf8\x7f\xab\x5d\x59\xc6\
-\x37\x7f\x68\x68\xf1\x7f\x68\x5b\x32\x8f\xe3\x2f\x0e\x76\x8f\xf7\
-\x80\x34\x01\xfa\x73\xa6\x7f\xc1\x65\xbe\x07\xde\xc2\xa6\xe3\x49\
-\xf1\x9d\x94\xdd\xe3\x7d\x3a\xdd\xff\x00\x54\xb8\x35\x73\xfe\x1f\
-\x1f\xf0\x13\xfe\x7d\x7c\x5d\xff\x00\x82\xb8\xbf\xf8\xf5\x7e\x26\
-\x5d\x69\xf7\x3a\x6d\xc7\x93\x7d\x6b\x35\xb4\xab\xd6\x2b\x88\xd9\
-\x1b\xfe\xf9\x38\x35\x53\x1e\xc6\x80\x3f\x6f\xbf\xe1\xf1\xff\x00\
-\x01\x3f\xe7\xd7\xc5\xdf\xf8\x2b\x8b\xff\x00\x8f\x51\xff\x00\x0f\
-\x8f\xf8\x09\xff\x00\x3e\xbe\x2e\xff\x00\xc1\x5c\x5f\xfc\x7a\xbf\
-\x10\x71\xec\x68\xc7\xb1\xa0\x0f\xdb\xef\xf8\x7c\x7f\xc0\x4f\xf9\
-\xf5\xf1\x77\xfe\x0a\xe2\xff\x00\xe3\xd4\x7f\xc3\xe3\xfe\x02\x7f\
-\xcf\xaf\x8b\xbf\xf0\x57\x17\xff\x00\x1e\xaf\xc4\x1c\x7b\x1a\x31\
-\xec\x68\x03\xf6\xfb\xfe\x1f\x1f\xf0\x13\xfe\x7d\x7c\x5d\xff\x00\
-\x82\xb8\xbf\xf8\xf5\x1f\xf0\xf8\xff\x00\x80\x9f\xf3\xeb\xe2\xef\
-\xfc\x15\xc5\xff\x00\xc7\xab\xf1\x07\x1e\xc6\x8c\x7b\x1a\x00\xfd\
-\xbe\xff\x00\x87\xc7\xfc\x04\xff\x00\x9f\x5f\x17\x7f\xe0\xae\x2f\
-\xfe\x3d\x47\xfc\x3e\x3f\xe0\x27\xfc\xfa\xf8\xbb\xff\x00\x05\x71\
-\x7f\xf1\xea\xfc\x41\xc7\xb1\xa3\x1e\xc6\x80\x3f\x6f\xbf\xe1\xf1\
-\xff\x00\x01\x3f\xe7\xd7\xc5\xdf\xf8\x2b\x8b\xff\x00\x8f\x51\xff\
-\x00\x0f\x8f\xf8\x09\xff\x00\x3e\xbe\x2e\xff\x00\xc1\x5c\x5f\xfc\
-\x7a\xbf\x10\x71\xec\x68\xc7\xb1\xa0\x0f\xdb\xef\xf8\x7c\x7f\xc0\
-\x4f\xf9\xf5\xf1\x77\xfe\x0a\xe2\xff\x00\xe3\xd4\x7f\xc3\xe3\xfe\
-\x02\x7f\xcf\xaf\x8b\xbf\xf0\x57\x17\xff\x00\x1e\xaf\xc4\x1c\x7b\
-\x1a\x31\xec\x68\x03\xf6\xfb\xfe\x1f\x1f\xf0\x13\xfe\x7d\x7c\x5d\
-\xff\x00\x82\xb8\xbf\xf8\xf5\x1f\xf0\xf8\xff\x00\x80\x9f\xf3\xeb\
-\xe2\xef\xfc\x15\xc5\xff\x00\xc7\xab\xf1\x07\x1e\xc6\x8c\x7b\x1a\
-\x00\xfd\xbe\xff\x00\x87\xc7\xfc\x04\xff\x00\x9f\x5f\x17\x7f\xe0\
-\xae\x2f\xfe\x3d\x47\xfc\x3e\x3f\xe0\x27\xfc\xfa\xf8\xbb\xff\x00\
-\x05\x71\x7f\xf1\xea\xfc\x41\xc7\xb1\xa3\x1e\xc6\x80\x3f\x6f\xbf\
-\xe1\xf1\xff\x00\x01\x3f\xe7\xd7\xc5\xdf\xf8\x2b\x8b\xff\x00\x8f\
-\x51\xff\x00\x0f\x8f\xf8\x09\xff\x00\x3e\xbe\x2e\xff\x00\xc1\x5c\
-\x5f\xfc\x7a\xbf\x10\x71\xec\x68\xc7\xb1\xa0\x0f\xdb\xef\xf8\x7c\
-\x7f\xc0\x4f\xf9\xf5\xf1\x77\xfe\x0a\xe2\xff\x00\xe3\xd4\x7f\xc3\
-\xe3\xfe\x02\x7f\xcf\xaf\x8b\xbf\xf0\x57\x17\xff\x00\x1e\xaf\xc4\
-\x1c\x7b\x1a\x31\xec\x68\x03\xf6\xfb\xfe\x1f\x1f\xf0\x13\xfe\x7d\
-\x7c\x5d\xff\x00\x82\xb8\xbf\xf8\xf5\x1f\xf0\xf8\xff\x00\x80\x9f\
-\xf3\xeb\xe2\xef\xfc\x15\xc5\xff\x00\xc7\xab\xf1\x07\x1e\xc6\x8c\
-\x7b\x1a\x00\xfd\x7c\xf8\x85\xff\x00\x05\xac\xf0\x5d\x8d\xac\x8b\
-\xe0\x8f\x03\x6b\xda\xc5\xee\x36\x87\xd7\x65\x86\xce\x05\x3f\xde\
-\xc4\x4d\x2b\x30\xf6\xf9\x6b\xf3\xaf\xf6\x8a\xfd\xab\x3e\x23\xfe\
-\xd4\x1a\xe4\x7a\x97\x8d\x35\x80\xf6\x36\xec\xed\x65\xa3\xd9\x83\
-\x15\x8d\xa6\x46\x0f\x97\x19\x3c\xb1\x1c\x6e\x62\xcf\x8e\xf5\xc2\
-\x78\x47\xe1\x37\x8d\xbc\x7d\x70\xb0\xf8\x67\xc2\x1a\xef\x88\x24\
-\x2d\xc2\xe9\x9a\x6c\xd7\x3f\xfa\x02\x35\x7d\x93\xf0\x13\xfe\x09\
-\x1b\xf1\x2f\xe2\x15\xdd\xbe\xa1\xf1\x02\x68\xbe\x1d\x78\x7f\x0b\
-\x24\xb1\x49\x22\x5c\x6a\x32\x21\xec\xb1\xa9\xdb\x1e\x70\x79\x91\
-\x83\x2f\x74\x6a\x00\xf9\x7b\xf6\x77\xfd\x9d\xfc\x57\xfb\x4b\x7c\
-\x45\xb1\xf0\x8f\x85\x6c\xc9\x79\xb1\x25\xe6\xa1\x20\x22\xde\xc6\
-\xdf\x38\x69\xa4\x6e\x98\x07\x80\xbd\x58\xfc\xa2\xbf\xa0\xef\x81\
-\xbf\x07\xf4\x1f\x80\x9f\x0b\x34\x1f\x03\xf8\x6e\x2c\x69\xba\x5c\
-\x45\x3c\xd3\xf7\xee\x25\x24\xb4\x93\x48\x7f\xbc\xef\x96\x23\xb6\
-\x42\x8e\x14\x55\x0f\x80\xff\x00\xb3\xf7\x81\xff\x00\x67\x7f\x04\
-\xc7\xe1\xdf\x03\x69\x4b\xa5\xda\x39\x57\xb8\xba\x66\xdf\x73\x7b\
-\x20\x18\xf3\x26\x97\x19\x62\x47\xfc\x04\x7f\x00\x15\xea\x3b\x47\
-\x5c\x73\x40\x0b\x45\x14\x50\x01\x45\x14\x50\x02\x05\x0b\xd0\x01\
-\xda\x8d\xa3\xd0\x75\xcd\x14\x50\x01\x81\xe9\x4b\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x98\xf6\xa2\x8a\x28\
-\x00\xda\x39\xe2\x96\x8a\x28\x00\xa2\x8a\x28\x03\xff\xd9\
-\x00\x00\x11\x04\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x00\x93\x00\xd9\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x53\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x6b\x1e\
-\x54\x7a\x9a\x00\x18\xf4\xc0\xea\x7d\x6b\xc3\xff\x00\x69\x1f\xda\
-\xf3\xe1\xf7\xec\xbf\x6f\xa2\x37\x8b\xf5\x39\x7e\xd7\xa9\xdd\x24\
-\x29\x61\x63\x1f\x9f\x72\xb0\xe4\x79\x97\x0c\x80\xfc\xb1\xa0\x20\
-\x93\xc9\x39\x01\x41\x27\x8c\x5f\xdb\x1b\xf6\xc8\xf0\xd7\xec\xa3\
-\xe0\x91\x73\x72\xd1\xea\xde\x2e\xd4\x03\x47\xa4\xe8\x41\xbe\x69\
-\x64\x03\xfd\x64\xd8\xe5\x21\x5c\x82\x48\xe4\xe4\x01\xdc\x8f\x80\
-\xbf\x64\xff\x00\xd9\x4b\xc6\x1f\xb7\x47\xc4\x99\xfe\x33\x7c\x67\
-\xbc\xbc\xbc\xf0\x93\xdc\x79\x91\xc7\x31\xf2\xdb\x57\x28\xdf\x2c\
-\x10\xa8\xff\x00\x57\x6c\x84\xe1\x8a\xf5\xc9\x44\xc1\xdc\xca\x08\
-\xfd\x74\xf0\xcf\x88\xb4\xff\x00\x16\xe8\x76\x5a\xce\x93\x7b\x0e\
-\xa3\xa5\xdf\xc2\x97\x36\xb7\x56\xec\x1a\x39\x63\x61\x95\x65\x23\
-\xa8\x3d\x6b\x56\xb3\xf4\x3d\x2a\xd3\x42\xd2\xad\xb4\xdd\x3e\xd2\
-\x1b\x0b\x1b\x48\xd6\x08\x2d\x2d\xd0\x24\x50\xc6\xbc\x2a\x20\x50\
-\x00\x50\x00\xc0\x03\x8a\xd0\xa0\x61\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\xd6\x3f\x74\x77\x26\x80\x06\x3c\xa8\xf5\x35\xf3\xaf\
-\xed\x8d\xfb\x64\x78\x6f\xf6\x4f\xf0\x4a\xdd\x5c\x18\xf5\x7f\x16\
-\xea\x01\xa3\xd2\xb4\x20\xdf\x34\xae\x06\x4c\x93\x63\x94\x85\x72\
-\x32\x47\x24\x90\x07\x72\x0f\xdb\x1b\xf6\xc9\xf0\xd7\xec\x9f\xe0\
-\x95\xba\xb8\x31\xea\xfe\x2e\xbf\x0d\x1e\x95\xa1\x06\xf9\xa5\x70\
-\x32\x64\x9b\x1c\xa4\x2b\x90\x49\x1c\x92\x40\x1d\xc8\xf8\x0b\xf6\
-\x4d\xfd\x94\x7c\x63\xfb\x73\x7c\x49\x9f\xe3\x3f\xc6\x7b\xdb\xab\
-\xcf\x0a\x3d\xc1\x74\x49\x98\xc6\xda\xc6\xc2\x7f\x71\x0a\x8f\xf5\
-\x76\xc8\x4e\xd6\x2b\xd7\x3b\x10\x83\xb9\x94\x10\x7e\xc9\xbf\xb2\
-\x97\x8c\x7f\x6e\x4f\x89\x53\xfc\x67\xf8\xcf\x7b\x77\x77\xe1\x37\
-\xb8\x2f\x1a\x4a\xde\x5b\xeb\x1b\x1b\x88\x21\x51\xfe\xae\xd9\x09\
-\x2a\xc5\x7a\xe7\x62\x60\xee\x65\xfd\x7a\xd1\x74\xcb\x5d\x1b\x4c\
-\xb6\xd3\xec\xad\x61\xb2\xb3\xb5\x8d\x60\x82\xd6\x04\x0b\x1c\x31\
-\xa8\xda\xa8\x80\x00\x02\x80\x00\x00\x0e\x05\x26\x8b\xa5\xda\x68\
-\xba\x6d\xb6\x9f\x63\x6b\x1d\x9d\x8d\xac\x29\x05\xbd\xb4\x28\x16\
-\x38\xa3\x55\xda\xa8\x80\x00\x02\xa8\x00\x00\x00\xc6\x2a\xfd\x00\
-\x18\x03\xa0\xc5\x2d\x14\x50\x30\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x6b\x67\
-\x8a\x00\x1b\xf8\x70\x33\xcf\xad\x7c\xe9\xfb\x63\xfe\xd9\x1e\x19\
-\xfd\x94\x3c\x12\x2e\xae\x9a\x3d\x5b\xc5\xb7\xea\xe9\xa5\x68\x2a\
-\xf8\x69\x58\x01\x99\x66\xc7\x29\x0a\xe4\x12\x47\xcc\x72\x00\xee\
-\x41\xfb\x63\xfe\xd8\xde\x19\xfd\x94\x7c\x13\xf6\xab\x96\x8f\x56\
-\xf1\x6e\xa0\xae\x9a\x56\x82\x24\xf9\xa5\x60\x06\x64\x9b\x1c\xa4\
-\x4b\x90\x49\x1f\x31\xc8\x03\xb9\x1f\x02\x7e\xc9\xff\x00\xb2\x8f\
-\x8c\x7f\x6e\x6f\x89\x17\x1f\x19\xfe\x33\xde\xde\x5e\x78\x51\xae\
-\x4b\x2c\x73\x31\x8d\xb5\x82\x87\xfd\x4c\x0a\x3f\xd5\xda\xa1\x3b\
-\x49\x5e\xb9\x28\x98\x3b\x99\x41\x07\xec\x9b\xfb\x28\x78\xc7\xf6\
-\xe5\xf8\x93\x73\xf1\x9b\xe3\x45\xed\xd5\xdf\x85\x5a\xe5\x99\x52\
-\x62\x51\xb5\x8d\x84\xfe\xe6\x05\x5f\xf5\x76\xa8\x4e\x09\x5e\x0f\
-\x28\xb8\x25\x99\x7f\x5e\x74\x5d\x2e\xd3\x46\xd3\x6d\xb4\xfb\x1b\
-\x48\x6c\xac\xac\xe2\x4b\x7b\x7b\x58\x10\x24\x70\xc6\x8a\x15\x11\
-\x00\xe0\x28\x50\x00\x03\xa7\x4a\x34\x5d\x26\xd3\x44\xd2\xed\x74\
-\xfb\x1b\x48\x6c\x6c\xad\x22\x4b\x78\x2d\x60\x40\xb1\xc3\x1a\x0d\
-\xa8\x88\x07\x01\x40\x00\x00\x3a\x0a\xbd\x80\x3a\x0c\x50\x01\xd3\
-\xa7\x14\xb4\x51\x40\xc2\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x29\xac\x71\xb7\x8c\
-\xf3\xeb\x40\x03\x1e\x54\x7b\xd7\xce\x9f\xb6\x3f\xed\x8f\xe1\x9f\
-\xd9\x43\xc1\x22\xea\xe4\xa6\xad\xe2\xeb\xf5\x74\xd2\xb4\x15\x7f\
-\x9a\x56\x00\x66\x49\xb1\xca\x44\xb9\x52\x48\xf9\x8e\x40\x1d\xc8\
-\x5f\xdb\x1f\xf6\xc8\xf0\xdf\xec\x9f\xe0\x95\xba\xb8\x68\xf5\x6f\
-\x17\xdf\x86\x4d\x2b\x42\x0d\xcc\xae\x06\x4c\x93\x63\x94\x89\x72\
-\x09\x23\x92\x48\x03\xb9\x1f\x00\xfe\xc9\xbf\xb2\x97\x8c\x3f\x6e\
-\x8f\x89\x53\xfc\x67\xf8\xcd\x7b\x77\x75\xe1\x39\x2e\x19\xd2\x39\
-\x9b\x63\x6a\xfb\x09\xfd\xc4\x2a\x3f\xd5\xdb\x21\x38\x25\x78\x39\
-\x28\xb8\x25\x99\x41\x0b\xfb\x27\xfe\xca\x3e\x30\xfd\xb9\xbe\x25\
-\x4f\xf1\x97\xe3\x3d\xf5\xdd\xdf\x85\x5e\xe5\x9d\x63\x99\xbc\xb6\
-\xd6\x0a\x1f\xf5\x30\x28\xff\x00\x57\x6a\x84\xe0\x95\xe0\xf2\x8b\
-\x82\x59\x97\xf5\xe7\x43\xd3\x2c\xf4\x6d\x2e\xd6\xc3\x4f\xb5\x86\
-\xca\xca\xd2\x24\xb7\xb7\xb6\xb7\x40\xb1\xc5\x12\x28\x54\x44\x00\
-\x00\x14\x2e\x30\x07\x00\x51\xa1\xe9\x76\x7a\x36\x97\x6b\x61\x61\
-\x69\x0d\x95\x95\x9c\x49\x6f\x6f\x6d\x02\x05\x8e\x28\xd1\x42\xa2\
-\x20\x00\x00\xa0\x63\x00\x70\x05\x5f\xc6\x3a\x0c\x50\x00\x00\x1d\
-\x06\x29\x68\xa2\x81\x85\x14\x51\x40\x05\x14\x51\x40\x05\x26\x41\
-\xe9\x55\xb5\x0f\x3c\x5b\xc8\x6d\xca\x89\x42\x36\xdf\x33\xee\x6e\
-\xc7\x19\xef\x8c\xfe\x99\xf6\xaf\xca\x6f\x09\xfe\xde\x1f\x17\xff\
-\x00\x65\xef\xda\x87\xc4\x7e\x1c\xfd\xa0\xbc\xeb\xcd\x07\x55\xbc\
-\x0f\x70\x96\xa8\x5a\x1d\x35\x1b\xe5\x8a\xe2\xc0\x75\x7b\x7d\xa1\
-\x72\x9f\x7b\xef\x1e\x64\x04\x30\x07\xeb\x1d\x15\x97\xe1\xbf\x10\
-\x69\xbe\x2b\xd1\x6c\xf5\x9d\x1f\x50\x83\x54\xd2\xaf\xa1\x4b\x8b\
-\x6b\xcb\x59\x44\x90\xcd\x1b\x0c\x86\x46\x1d\x41\x15\xa9\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x53\x58\xfd\xd1\xdc\x9a\x00\x18\x91\x8c\x0c\
-\xe4\xd7\xce\xbf\xb6\x37\xed\x91\xe1\xaf\xd9\x4b\xc1\x22\xe2\xe1\
-\xa3\xd5\xbc\x5f\xa8\x06\x8f\x49\xd0\x83\x73\x2b\x81\xcc\xb3\x63\
-\x94\x85\x72\x09\x23\x93\x90\x07\x72\x0f\xdb\x1b\xf6\xc8\xf0\xd7\
-\xec\xa3\xe0\x91\x73\x70\xd1\xea\xde\x2e\xd4\x15\xa3\xd2\x74\x20\
-\xdf\x34\xae\x07\xfa\xc9\xb1\xca\x42\xb9\x04\x91\xc9\xc8\x03\xb9\
-\x1f\x01\x7e\xc9\xbf\xb2\x9f\x8c\x3f\x6e\x7f\x89\x53\xfc\x67\xf8\
-\xcd\x7b\x79\x77\xe1\x37\x9c\xbc\x69\x31\xf2\xdf\x57\xda\xdc\x5b\
-\xc2\xa3\xfd\x5d\xb2\x13\xb5\x8a\xf5\xc9\x45\xc1\xdc\xca\x08\x3f\
-\x64\xdf\xd9\x4f\xc6\x1f\xb7\x47\xc4\xa9\xfe\x33\x7c\x66\xbe\xbc\
-\xba\xf0\xa3\xce\x5e\x38\xe7\x6d\x8f\xab\xec\x6f\xf5\x10\xa8\xff\
-\x00\x57\x6c\x84\xe1\x8a\xf0\x72\x51\x70\x4b\x32\xfe\xbd\x68\xda\
-\x6d\xa6\x93\xa6\xda\xd8\x59\x5a\x43\x65\x65\x69\x12\x41\x05\xb4\
-\x08\x16\x38\xa3\x41\xb5\x15\x00\x00\x05\x0a\x00\x00\x70\x05\x1a\
-\x36\x97\x6b\xa3\xe9\xb6\xda\x7d\x9d\xac\x36\x76\x76\xb1\xac\x10\
-\x5a\xc0\x81\x63\x86\x34\x18\x44\x40\x00\x01\x40\x03\x03\x1c\x55\
-\xe5\x50\xbd\x00\x1f\x4a\x00\x31\x8e\x83\x14\xb4\x51\x40\xc2\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x04\xaf\x0a\xfd\xad\xbf\
-\x64\xff\x00\x09\xfe\xd5\x5e\x01\xfe\xc6\xd6\x51\x74\xfd\x7a\xd1\
-\x64\x7d\x23\x5d\x8a\x3c\xcd\x65\x21\x1d\x0f\xf7\xa3\x6c\x0d\xc9\
-\xdc\x0c\x8c\x10\x08\xf7\x6a\x42\xa0\xf5\x19\xa0\x0f\xc6\x9f\xd9\
-\xc7\xf6\x94\xf1\xf7\xfc\x13\xab\xe2\xe5\xe7\xc2\x7f\x8b\x36\x97\
-\x4d\xe0\x86\xb8\x06\x45\x4d\xd2\x8b\x2d\xfd\x2f\x2c\xcf\x59\x21\
-\x6e\x0b\x22\xe3\xa1\xc0\xde\x0a\xb7\xec\x1f\x86\xfc\x41\xa6\xf8\
-\xaf\x45\xb2\xd6\x74\x7b\xf8\x35\x4d\x2a\xfa\x14\xb8\xb6\xbc\xb5\
-\x94\x49\x0c\xd1\xb0\xc8\x64\x61\xd4\x11\x5e\x39\xfb\x5b\x7e\xc9\
-\xde\x13\xfd\xab\x3c\x03\xfd\x8b\xac\xa2\xe9\xda\xf5\xa2\xc8\xfa\
-\x46\xbb\x0c\x79\x9a\xca\x52\x3a\x67\xf8\xa3\x6c\x0d\xd1\xf7\x03\
-\x23\x04\x02\x3f\x37\xff\x00\x66\xff\x00\xda\x53\xc7\xbf\xf0\x4e\
-\xbf\x8b\x77\xbf\x09\xfe\x2d\x59\xdd\xb7\x82\x1a\xe3\x32\xa4\x7b\
-\xa5\x16\x41\xfa\x5e\xd9\x9e\xb2\x40\xdc\x16\x45\xc7\x43\x81\xbc\
-\x15\x60\x47\xec\xbd\x15\x97\xe1\xbf\x11\x69\xde\x2c\xd1\x6c\xb5\
-\x9d\x1e\xfe\xdf\x53\xd2\xef\xe1\x4b\x8b\x5b\xbb\x59\x56\x48\xa6\
-\x8d\x86\x55\xd1\x87\x55\x22\xb5\x28\x18\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x35\x8f\x40\x07\x53\xeb\x40\x03\
-\x36\x36\x80\x33\x93\xeb\x5f\x3a\xfe\xd8\xff\x00\xb6\x47\x86\xbf\
-\x65\x0f\x04\xad\xcd\xcb\x47\xab\x78\xbb\x50\x0d\x1e\x93\xa1\x06\
-\xf9\xa5\x70\x3f\xd6\xcd\x8e\x52\x15\xc8\x24\x8e\x4e\x40\x1d\xc8\
-\x4f\xdb\x23\xf6\xc7\xf0\xcf\xec\x9f\xe0\x91\x75\x74\xd1\xea\xfe\
-\x2d\xbf\x57\x4d\x2b\x41\x57\xc3\x4a\xc0\x0c\xcb\x36\x39\x48\x57\
-\x20\x92\x3e\x63\x90\x07\x72\x3e\x04\xfd\x93\xbf\x65\x0f\x19\x7e\
-\xdc\xbf\x12\xae\x7e\x33\x7c\x67\xbd\xba\xbc\xf0\xab\x5c\xb3\x2a\
-\xcc\x4a\x36\xb0\x54\x9f\xdc\x40\x07\xfa\xbb\x54\x27\x04\xaf\x5e\
-\x51\x30\x77\x32\x82\x13\xf6\x4d\xfd\x94\xfc\x61\xfb\x73\x7c\x4a\
-\x9f\xe3\x37\xc6\x6b\xdb\xcb\xbf\x09\xbc\xe6\x48\xd2\x66\xf2\xdf\
-\x58\xda\xdc\x5b\xc2\xa3\xfd\x5d\xb2\x13\xb5\x8a\xf5\xc9\x44\xc1\
-\xdc\xcb\xfa\xf5\xa2\xe9\x96\xba\x36\x99\x6d\xa7\xd9\x5a\xc3\x65\
-\x67\x6b\x1a\xc1\x05\xac\x08\x16\x38\x63\x51\xb5\x51\x00\x00\x05\
-\x00\x00\x00\x1c\x0a\x34\x5d\x36\xd3\x47\xd3\x6d\xec\x2c\x6d\x62\
-\xb2\xb2\xb4\x89\x2d\xe0\xb5\x81\x36\x47\x14\x68\xa0\x2a\x28\x1c\
-\x05\x03\x18\x03\xa5\x5e\xa0\x03\x00\x74\x18\xa5\xa2\x8a\x06\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x21\x50\xdd\x46\x6b\xc2\xff\x00\x6b\x5f\xd9\x3f\xc2\
-\x7f\xb5\x67\x80\x7f\xb1\x75\x94\x5d\x3b\x5d\xb3\x57\x93\x48\xd7\
-\xa1\x8f\x33\x59\x4b\x8e\x87\xfb\xd1\xb6\x00\x64\x3d\x47\x23\x04\
-\x02\x3d\xd6\x90\xa8\x6e\xa0\x1f\xc2\x80\x3f\x1a\x7f\x66\xff\x00\
-\xda\x4f\xc7\xdf\xf0\x4e\x9f\x8b\x57\xbf\x0a\x3e\x2d\x59\xdd\x37\
-\x82\x24\xb8\x0d\x22\x46\x1a\x51\x65\xbd\xb0\x2f\x2c\xcf\x59\x21\
-\x6e\x0b\x22\xe3\xa1\xc0\xde\x0a\xb7\xec\x1f\x86\xbc\x41\xa6\xf8\
-\xb3\x45\xb2\xd6\x74\x7d\x42\xdf\x54\xd2\xaf\xa1\x5b\x8b\x6b\xcb\
-\x59\x44\x91\x4d\x1b\x72\x19\x18\x75\x04\x62\xbc\x73\xf6\xb6\xfd\
-\x93\x7c\x23\xfb\x55\xf8\x04\xe8\xda\xd4\x6b\xa7\x6b\xd6\x8a\xef\
-\xa4\x6b\xd0\xc6\x3c\xeb\x29\x31\x9c\x1f\xef\x44\xc4\x0d\xd1\xf7\
-\x1c\x8c\x10\x08\xfc\xdf\xfd\x9b\xbf\x69\x4f\x1f\x7f\xc1\x3a\xbe\
-\x2d\x5e\x7c\x27\xf8\xb5\x69\x74\xfe\x08\x6b\x80\x64\x8e\x3c\xca\
-\x2c\xb7\xb7\x17\x96\x64\x0c\xc9\x0b\x75\x64\x18\xe8\x70\x37\x82\
-\xac\x01\xfb\x2f\x45\x65\xf8\x6f\xc4\x1a\x6f\x8b\x34\x5b\x2d\x67\
-\x47\xd4\x20\xd5\x34\xab\xe8\x56\xe2\xda\xf2\xd6\x51\x24\x33\x46\
-\xdc\x86\x46\x1d\x41\x18\xad\x4a\x00\x28\xa2\x8a\x00\x28\xa2\x9a\
-\xd9\xe2\x80\x06\x6c\x6d\x00\x67\x27\xd6\xbe\x74\xfd\xb1\xff\x00\
-\x6c\x8f\x0c\xfe\xca\x3e\x09\x17\x57\x4d\x1e\xad\xe2\xeb\xf5\x74\
-\xd2\xb4\x15\x7c\x34\xac\x00\xcc\x93\x63\x94\x89\x72\x09\x23\xe6\
-\x39\x00\x77\x20\xfd\xb1\xff\x00\x6c\x6f\x0c\xfe\xca\x3e\x09\xfb\
-\x55\xcb\x47\xab\x78\xba\xfd\x5d\x34\xad\x05\x64\xf9\xa5\x60\x06\
-\x64\x9b\x1c\xa4\x4b\x95\x24\x8f\x98\xe4\x01\xdc\x8f\x81\x3f\x64\
-\xff\x00\xd9\x47\xc6\x3f\xb7\x37\xc4\x8b\x8f\x8c\xff\x00\x1a\x2f\
-\x6e\xee\xfc\x28\xd7\x25\x96\x39\x98\xa3\x6b\x05\x0f\x10\xc0\xa3\
-\xfd\x5d\xaa\x13\xb4\x95\xeb\x92\x89\x83\xb9\x94\x10\x7e\xc9\xbf\
-\xb2\x8f\x8c\x7f\x6e\x6f\x89\x17\x1f\x19\xfe\x34\x5e\xdd\x5d\xf8\
-\x51\xae\x59\x96\x39\xc9\x46\xd5\xca\x13\xfb\x98\x15\x4f\xee\xed\
-\x50\x9c\x12\xbc\x1e\x51\x30\x4b\x32\xfe\xbc\xe8\x9a\x5d\xa6\x89\
-\xa6\xdb\x69\xf6\x16\x90\xd8\x58\xd9\xc4\x96\xf6\xf6\xb6\xf1\x84\
-\x8e\x18\xd1\x42\xa2\x20\x1c\x05\x00\x0c\x01\xd3\xa5\x1a\x2e\x93\
-\x69\xa2\xe9\x96\xba\x7d\x8d\xa4\x36\x36\x76\x91\x25\xbc\x16\xd0\
-\x20\x58\xe2\x8d\x06\xd4\x44\x03\x80\xa0\x00\x00\x1d\x05\x5e\xc0\
-\x1d\x06\x28\x00\x00\x0e\x83\x14\xb4\x51\x40\xc2\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x04\x2a\x1b\xa8\xcd\x78\x57\xed\x69\
-\xfb\x26\xf8\x4f\xf6\xac\xf0\x19\xd1\xb5\x94\x5d\x3b\x5e\xb4\x57\
-\x7d\x23\x5e\x86\x30\x66\xb2\x93\x1d\x0f\xf7\xa2\x6c\x0d\xd1\x9e\
-\xa3\x91\x82\x01\x1e\xed\x48\xca\x1b\x19\x00\xfd\x45\x00\x7e\x34\
-\xfe\xcd\xff\x00\xb4\xaf\x8f\xbf\xe0\x9d\x5f\x17\x2f\x3e\x13\xfc\
-\x59\xb3\xba\x7f\x04\xbd\xc6\x64\x8d\x03\x4a\xb6\x41\xdb\x02\xf2\
-\xcc\xf5\x92\x16\xea\xc8\xb8\xe8\x70\x37\x82\xad\xfb\x07\xe1\xaf\
-\x10\x69\xde\x2c\xd1\x2c\xb5\x9d\x1e\xfe\x0d\x53\x4a\xbe\x85\x6e\
-\x2d\xaf\x2d\x65\x12\x43\x34\x6d\xca\xb2\x30\xea\x08\xc5\x78\xef\
-\xed\x69\xfb\x26\xf8\x4f\xf6\xab\xf0\x09\xd1\x75\x84\x5d\x37\x5e\
-\xb5\x47\x7d\x23\x5e\x86\x30\x66\xb2\x93\xae\x0f\xf7\xa2\x6c\x0d\
-\xd1\x9e\xa3\x91\x82\x01\x1f\x9b\xdf\xb3\x7f\xed\x25\xe3\xff\x00\
-\xf8\x27\x5f\xc5\xbb\xbf\x84\xff\x00\x16\x2c\xee\xdb\xc1\x0f\x71\
-\xfb\xc5\x40\xd3\x2d\x96\xf2\x71\x79\x66\x7a\xc9\x0b\x70\x59\x06\
-\x3a\x1c\x0d\xe0\xab\x02\x3f\x65\xe8\xac\xcf\x0d\xeb\xfa\x77\x8a\
-\xb4\x4b\x2d\x67\x47\xbf\x83\x54\xd2\xaf\xe1\x5b\x8b\x6b\xcb\x59\
-\x04\x90\xcd\x1b\x0c\x86\x46\x07\x90\x46\x2b\x45\x8f\xdd\x1d\xc9\
-\xa0\x60\xc7\x95\x1e\xf5\xf3\xa7\xed\x8f\xfb\x64\x78\x6f\xf6\x50\
-\xf0\x42\xdd\x5c\x18\xf5\x6f\x17\x6a\x01\x93\x4a\xd0\xb7\x73\x2b\
-\x81\x93\x24\xd8\xe5\x22\x5c\x82\x48\xe4\x92\x00\xee\x42\xfe\xd8\
-\xdf\xb6\x47\x86\x7f\x65\x0f\x04\x8b\xab\x96\x8f\x56\xf1\x7d\xf2\
-\xb2\x69\x5a\x0a\xbf\xcd\x2b\x00\x33\x24\xd8\xe5\x22\x5c\xa9\x24\
-\x7c\xc7\x20\x0e\xe4\x7c\x05\xfb\x27\x7e\xca\x3e\x30\xfd\xb9\xbe\
-\x25\x5c\x7c\x66\xf8\xcf\x7b\x77\x75\xe1\x56\xb8\x67\x54\x98\xec\
-\x6d\x60\xa1\xff\x00\x51\x02\x8f\xf5\x76\xa8\x4e\x09\x5e\x0f\x28\
-\xb8\x25\x99\x41\x07\xec\x9b\xfb\x28\xf8\xc3\xf6\xe8\xf8\x91\x3f\
-\xc6\x7f\x8c\xd7\x97\x77\x7e\x13\x92\xe0\xb2\x47\x33\x79\x6f\xab\
-\x94\x63\x88\x21\x51\xfe\xae\xd9\x09\x21\x8a\xf0\x72\x51\x30\x77\
-\x32\xfe\xbd\x68\xba\x55\x9e\x89\xa6\x5a\xe9\xf6\x16\x90\xd8\xd9\
-\xd9\xc2\x96\xf0\x5a\xc0\x81\x23\x86\x34\x5d\xa8\x88\x07\x01\x40\
-\x00\x00\x3a\x0a\x34\x5d\x36\xd3\x47\xd3\x6d\xac\x2c\x6d\xa2\xb2\
-\xb2\xb4\x89\x20\x82\xda\x04\x0b\x1c\x51\xa2\x85\x44\x40\x00\x01\
-\x40\x03\x00\x0c\x01\x57\x80\x0b\xd0\x62\x80\x00\x00\xe8\x31\x4b\
-\x45\x14\x0c\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x46\x50\xd8\xc8\x07\xea\x2b\xc2\xbf\
-\x6b\x5f\xd9\x37\xc2\x7f\xb5\x67\x80\x4e\x8b\xac\xc6\xba\x76\xbd\
-\x68\xae\xfa\x46\xbd\x0c\x40\xcd\x65\x21\x1d\x0f\xf7\xa3\x6c\x0d\
-\xc8\x7a\x8e\x46\x08\x04\x7b\xb5\x21\x50\xd8\xc8\x07\xf0\xa0\x0f\
-\xc6\x9f\xd9\xbf\xf6\x92\xf1\xf7\xfc\x13\xb7\xe2\xdd\xef\xc2\x7f\
-\x8b\x16\x77\x6f\xe0\x96\x9f\x32\x24\x79\x90\x59\x6e\x3c\x5e\xd9\
-\x9c\x7e\xf2\x06\xe3\x72\x0c\x77\x20\x6f\x56\x56\xfb\xe7\xf6\xa2\
-\xfd\xb9\xfc\x15\xfb\x3d\xfc\x2c\xd3\xfc\x43\x63\xa8\x5a\xf8\xa7\
-\x5b\xd7\xe0\xf3\x7c\x3f\xa6\xda\xcc\x1e\x3b\xb5\x61\x91\x70\xec\
-\xa7\x2b\x00\xc8\xc9\xfb\xc7\x80\x3f\x88\x8e\x9b\xf6\xb7\xfd\x93\
-\xfc\x27\xfb\x54\xf8\x04\x68\xda\xc2\x26\x99\xae\xd9\xee\x93\x48\
-\xd7\xa2\x8c\x19\x6c\x65\xc6\x70\x47\xf1\xc6\xd8\xf9\x93\xbf\x51\
-\x82\x01\x1f\x9e\x9f\xb2\xcf\xfc\x12\xd3\xc5\x9a\xdf\xc5\x4b\xc9\
-\x3e\x31\x5a\x3e\x9d\xe1\x1f\x0c\x5c\x9b\x78\xec\xe3\x98\xb1\xd6\
-\xb6\x9d\xc1\x61\x6e\xa2\xd8\xee\x05\x98\x60\xb6\xf2\x83\x6b\x17\
-\x65\x04\x45\xfb\x26\xfe\xca\x3e\x30\xfd\xb9\xfe\x25\x4f\xf1\x9b\
-\xe3\x35\xf5\xdd\xd7\x84\xde\x76\x92\x38\xe6\x6d\x8d\xab\xec\x3c\
-\x41\x0a\x8f\xf5\x76\xc8\x4e\x18\xaf\x07\x25\x17\x04\xb3\x2f\xeb\
-\xce\x8b\xa5\xd9\xe8\xfa\x5d\xad\x85\x8d\xa4\x36\x36\x56\x91\x25\
-\xbd\xbd\xb5\xba\x05\x8e\x28\xd1\x42\xa2\x20\x00\x00\xa0\x01\x80\
-\x06\x00\xa3\x45\xd2\xed\x34\x7d\x36\xdb\x4f\xb2\xb4\x86\xca\xce\
-\xd2\x35\x82\x0b\x58\x10\x2c\x70\xc6\x83\x6a\x22\x00\x00\x0a\x00\
-\x00\x00\x38\x15\x78\x28\x5e\x83\x1d\xe8\x00\x00\x0e\x83\x14\xb4\
-\x51\x40\xc2\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x9a\
-\x11\x57\xa2\x81\xc6\x3a\x51\x45\x00\x2e\x00\xe8\x31\x4b\x45\x14\
-\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\
-\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\
-\x01\xff\xd9\
-\x00\x00\x71\x86\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x01\x4b\x01\x51\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x53\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x90\xb6\x29\x68\x00\xa2\xa1\
-\xf3\x8e\x40\xe9\x9c\xfb\xe3\x1f\x4e\xd4\xaa\xec\x78\x61\x8f\x97\
-\x3e\xff\x00\xe7\xf1\xa0\x09\x68\xa2\xaa\x5f\x5f\x47\xa7\xd9\x4f\
-\x75\x2b\x11\x0c\x51\x99\x18\x81\xce\xd0\x33\x9a\x00\xb3\x93\xf5\
-\x3d\xf1\x4d\x12\x1e\xf8\x07\xd0\xf5\xaf\xc5\x6f\x8b\xbf\xf0\x57\
-\x6f\x8b\x9e\x20\xf1\x2e\xaa\xbe\x0b\x6d\x2f\xc2\xde\x1d\x69\x08\
-\xb1\x56\xb1\x4b\x8b\xaf\x27\x3f\x2b\xc8\xee\x58\x6e\x23\x07\x01\
-\x31\xcd\x78\xc6\xa1\xff\x00\x05\x1c\xfd\xa3\xb5\x28\xfc\xb9\x3e\
-\x28\xea\x51\x8f\xfa\x77\xb4\xb5\x84\xfe\x69\x10\x34\x01\xfd\x08\
-\xee\xfa\xfe\x47\xfc\x29\xab\x23\x73\x9c\x0c\x77\xff\x00\x1e\x05\
-\x7f\x3a\x32\x7e\xdc\x9f\x1f\x64\x76\x66\xf8\xb1\xe2\x6d\xcd\xd7\
-\x17\xa4\x7f\x2a\xb9\xa4\x7e\xde\x7f\xb4\x06\x8f\xa9\xc1\x77\x17\
-\xc5\x5f\x11\x4f\x24\x2d\xc4\x77\x77\x02\x78\xc8\xf7\x47\x05\x4f\
-\xe2\x28\x03\xfa\x27\xa2\xbc\x83\xf6\x53\xf8\xc9\x7d\xf1\xfb\xf6\
-\x7f\xf0\x6f\x8e\xaf\xed\x56\xc6\xff\x00\x55\xb5\x73\x73\x14\x6b\
-\xf2\x79\xb1\x4a\xd0\xbb\x20\xfe\xe1\x68\xd8\x8f\x62\x2b\xd7\xe8\
-\x00\xa2\xbc\xd3\xe3\x87\xc7\xcf\x09\xfe\xcf\x3e\x04\xb9\xf1\x6f\
-\x8c\xf5\x21\x61\xa5\xc5\x27\x91\x1c\x71\xa1\x96\x7b\x99\x8e\x76\
-\xc5\x0a\x0c\x6f\x73\x82\x71\xc0\x1b\x5b\x71\x00\x12\x3e\x77\xf0\
-\x4f\xfc\x15\xbb\xe0\x0f\x8b\x6e\x1e\x0b\xfd\x4b\x5c\xf0\xa7\x38\
-\x59\xb5\x9d\x2c\x98\xdb\xfe\x05\x6e\x65\xc7\xfc\x08\x0a\x00\xfb\
-\x4e\x8a\xe2\x7e\x1f\x7c\x64\xf0\x57\xc5\x4b\x3f\xb5\x78\x43\xc5\
-\xba\x37\x89\x22\xee\x34\xcb\xd8\xe7\x65\xfa\xa8\x3b\x97\xf1\x02\
-\xbb\x25\x93\x72\x83\xc8\x1e\xe0\x83\xf9\x1a\x00\x92\x8a\x40\xd9\
-\xa5\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\x90\xd2\xd3\x5b\xa1\xa0\x0c\x3f\x13\xf8\xc3\x46\xf0\
-\x7e\x8d\x73\xac\x6b\xba\xb5\x96\x8d\xa4\xda\x8c\xcf\x7b\x7f\x3a\
-\xc3\x0c\x79\x20\x0d\xce\xc7\x00\x9c\x8c\x03\xc9\xc8\xc5\x7c\x37\
-\xf1\xcb\xfe\x0b\x01\xf0\xe3\xc0\xaf\x71\x61\xe0\x1d\x2a\xef\xc7\
-\xfa\x92\x8c\x0b\xad\xc6\xd3\x4f\x53\xeb\xe6\x32\xef\x7e\xbd\x94\
-\x0e\x3a\xd7\xc7\x9f\xf0\x56\x1f\x17\xf8\xbb\x59\xfd\xa8\xaf\x74\
-\x4d\x6e\x49\xa3\xf0\xf6\x99\x67\x6e\x74\x6b\x55\x90\x9b\x76\x8d\
-\xe3\x06\x49\x82\xe7\x1b\xcc\x9b\xc3\x1e\x48\xf2\xc6\x7a\x73\xf2\
-\x97\xc3\xdf\x84\x9e\x34\xf8\xbf\xae\x2e\x97\xe0\xdf\x0e\x6a\x5e\
-\x23\xd4\x19\xb0\xd1\xd8\xc0\x5c\xaf\x5e\x64\x6f\xba\x9f\x56\x61\
-\x40\x1e\xe7\xf1\x87\xfe\x0a\x45\xf1\xd7\xe3\x01\x9a\x09\x3c\x54\
-\xde\x15\xd2\xe4\xcf\xfc\x4b\x7c\x32\x9f\x65\x4e\x7a\xe6\x50\xcd\
-\x2b\x7e\x2e\x6b\xdf\x7f\xe0\x94\x3f\xb4\x87\xc4\x5d\x53\xe3\x5b\
-\xfc\x3f\xd5\x75\xbd\x43\xc4\x5e\x18\xbe\xd3\xae\x2e\xbc\x9d\x46\
-\x57\x9c\xd9\x49\x1e\xd2\x25\x8d\xd8\x92\xaa\x49\xda\x41\xe3\xe6\
-\x18\x14\x9f\x05\x3f\xe0\x8c\xde\x2f\xf1\x0a\xc3\x7d\xf1\x3b\xc5\
-\x36\xbe\x17\xb7\x60\x1c\xe9\x7a\x42\x8b\xdb\xbc\x7f\x75\xa6\x3f\
-\xba\x46\xff\x00\x77\xcc\xaf\xd0\xff\x00\xd9\xbf\xf6\x3c\xf8\x6f\
-\xfb\x2f\xda\xdd\x37\x83\xb4\xb9\x5b\x56\xbc\x41\x1d\xd6\xaf\xa8\
-\x4d\xe7\x5d\x4a\x80\xe7\x68\x3d\x15\x7a\x64\x28\x00\xe0\x67\xa5\
-\x00\x7b\xa5\x43\x73\x6e\x97\x10\xbc\x4e\xa1\xe3\x75\x28\xca\x7a\
-\x10\x78\x22\xa6\xa2\x80\x3f\x2d\xfe\x23\x7f\xc1\x16\xe2\xd5\xbc\
-\x6f\x77\x79\xe1\x4f\x88\x11\x68\xfe\x1a\xba\x99\xe5\x5b\x2b\xed\
-\x3d\xa5\x9a\xd3\x73\x92\x23\x52\xb2\x01\x22\x80\x47\x27\x69\xe2\
-\xac\x69\xbf\xf0\x44\x1d\x0d\x58\x1b\xef\x8b\x5a\x85\xc2\x7f\x76\
-\xdf\x43\x8e\x23\xf9\x99\xde\xbf\x4f\xbc\xb5\xf4\xfa\x7b\x52\x95\
-\x07\xad\x00\x7e\x73\x5b\xff\x00\xc1\x14\x7e\x18\xc2\xb9\xba\xf1\
-\xdf\x8b\x66\x3f\xf4\xcb\xec\xb1\xff\x00\x38\xcd\x5c\xd3\xff\x00\
-\xe0\x8b\xbf\x09\x6d\xf5\x3b\x79\xee\x7c\x59\xe2\xeb\xbb\x38\xfe\
-\x69\x2d\xda\x5b\x75\xf3\x3d\xbc\xc1\x17\x0b\xf4\x19\xf7\xaf\xd0\
-\xda\x36\x8f\x4f\x7a\x00\xc4\xf0\x77\x83\x74\x7f\x01\xf8\x5f\x4a\
-\xf0\xee\x83\x61\x16\x99\xa2\xe9\x76\xc9\x69\x67\x67\x0e\x76\x45\
-\x1a\x0c\x01\xc9\x24\x9f\x56\x39\x24\xe4\x92\x49\xad\xca\x28\xa0\
-\x0f\x89\xff\x00\xe0\xa8\x1f\xb3\x5f\x8b\xff\x00\x68\x4f\x84\x5a\
-\x24\xde\x0c\xb5\x6d\x53\x58\xd0\x75\x06\xb9\x7d\x29\x30\x24\xba\
-\x86\x44\x08\x76\x12\x7a\xa1\xda\x71\xd0\xe5\xab\xf1\x5b\xc6\x1f\
-\x0e\xfc\x51\xf0\xfa\xf1\x6d\x7c\x53\xe1\xcd\x5b\xc3\x97\x6f\xf3\
-\x24\x5a\xb5\x94\x96\xcc\xfe\xe3\xcc\x03\x23\xe9\x9a\xfe\x9f\x5a\
-\x15\x62\x0b\x2a\x92\x0e\x46\x47\x4f\xa7\xa5\x53\xd6\xb4\x3d\x3f\
-\xc4\x5a\x74\xd6\x1a\xa5\x85\xae\xa7\x61\x30\xdb\x2d\xad\xe4\x2b\
-\x34\x4e\x3d\x19\x18\x10\x7f\x11\x40\x1f\xcb\xde\x93\xa9\x5f\xe8\
-\xf7\x89\x79\xa6\xdd\xdc\x58\xdd\x44\x71\x1d\xc5\xac\x8d\x1c\x8b\
-\xf4\x75\xe4\x7e\x15\xf5\x87\xc0\x9f\xf8\x29\x9f\xc6\x5f\x84\x3a\
-\x85\x94\x3a\xb6\xb8\xde\x3a\xf0\xdc\x6e\xbf\x68\xd3\xb5\xc5\x59\
-\x26\x31\xff\x00\x1f\x97\x70\x3e\x75\x6f\xee\x96\x24\x1f\x4a\xfd\
-\x34\xf8\xb9\xff\x00\x04\xd1\xf8\x11\xf1\x51\x6e\x27\x5f\x09\xaf\
-\x85\xb5\x39\x83\x1f\xb6\x78\x6d\xfe\xca\x43\x1f\xba\x7c\xa3\x98\
-\xb8\xff\x00\x72\xbe\x72\xd0\xbf\xe0\x8a\xba\x1d\x87\x8e\xe1\xba\
-\xd4\xfe\x23\x5d\x6a\x1e\x14\x8a\x6f\x34\xe9\xf1\xe9\xc2\x1b\xd9\
-\x10\x7f\x01\x9f\xcc\xda\x3f\xdf\x09\xf8\x50\x07\xe9\x27\x85\x3c\
-\x43\x6b\xe2\xdf\x0e\x69\x5a\xe6\x9f\x23\x49\xa7\xea\x56\x91\x5e\
-\xdb\xb3\x0c\x16\x8a\x44\x0e\x84\x8e\xc4\xab\x0f\xca\xb6\x6a\xa6\
-\x9d\xa6\x5b\xe9\x36\x16\xd6\x56\xb1\x2c\x16\x96\xd1\xa4\x30\xc3\
-\x18\xc2\xa2\x28\x01\x54\x7b\x00\x00\xab\x25\xb0\xd4\x00\xea\x2b\
-\xcc\x3c\x7b\xfb\x49\x7c\x34\xf8\x5b\xad\x43\xa3\xf8\xbb\xc7\x5a\
-\x07\x86\xf5\x59\x91\x64\x4b\x3d\x46\xf5\x62\x93\x69\x3c\x12\x0f\
-\x40\x7b\x13\x8e\x39\xe9\x5d\xf5\xae\xb1\x6f\xa9\x58\xc1\x77\x65\
-\x71\x1d\xe5\xb4\xe8\xaf\x14\xd6\xee\xae\x8e\xad\xf7\x59\x58\x64\
-\x10\x7b\x1c\xe0\xd0\x06\x8d\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x54\x2d\x21\x0b\
-\x90\xdc\xfd\x33\xd3\xad\x00\x39\xa4\xc7\x4c\x93\x8c\x8c\x57\x93\
-\x7c\x5b\xfd\xab\x3e\x16\x7c\x0b\xd4\x2c\xf4\xff\x00\x1c\xf8\xd3\
-\x4e\xd0\x35\x1b\xa5\xdd\x1d\x9c\xa1\xe4\x9b\x1e\xa5\x23\x56\x2a\
-\xbf\xed\x36\x07\xa1\x35\xf2\x4f\xed\xcf\xff\x00\x05\x38\xb0\xf8\
-\x61\xfd\xa1\xe0\x5f\x85\x57\x10\x6a\xfe\x30\x46\xfb\x3d\xfe\xb8\
-\x10\x4b\x6b\xa6\x9e\xe9\x1f\x55\x96\x6f\x6c\x15\x5e\x73\xb8\xe5\
-\x57\xf2\x27\xc4\x5e\x22\xd5\x3c\x61\xae\x5f\x6b\x3a\xd6\xa3\x73\
-\xaa\x6a\xd7\xee\x66\xb9\xbd\xbd\x98\xbc\xd3\xb1\xfb\xcc\xce\x73\
-\xbb\xdf\x3d\x7b\x0a\x00\xfe\x9a\xbc\x2f\xe3\x0d\x2f\xc6\xda\x15\
-\x8e\xbb\xa0\x6a\x56\xda\xbe\x8b\x7b\x18\x92\xda\xf2\xd2\x45\x78\
-\xa5\x04\xf5\x0c\x3d\xfe\x5c\x60\x10\x41\xcd\x6f\x57\xc4\x3f\xf0\
-\x49\xff\x00\x87\xde\x2e\xf0\x07\xec\xd7\x70\x7c\x4d\x6f\x35\x8d\
-\xb6\xab\xaa\xc9\xa8\x69\x76\x37\x31\xec\x92\x2b\x62\x91\xa9\x72\
-\x0f\x2a\x1d\x91\x98\x29\xec\x09\xfe\x2a\xfb\x7e\x80\x3c\xff\x00\
-\xe2\x97\xc0\x3f\x87\xbf\x1b\x20\xb3\x8b\xc7\x5e\x12\xd3\x7c\x4c\
-\x2c\xc9\xfb\x3b\xdf\x45\xba\x48\xb2\x41\x21\x5c\x10\xc0\x12\xa3\
-\x20\x1c\x1c\x73\x5b\xde\x0d\xf8\x7b\xe1\xaf\x87\x7a\x2c\x3a\x3f\
-\x86\x34\x3b\x0d\x03\x4b\x88\x6d\x4b\x5d\x3a\xdd\x61\x8f\x1e\xe1\
-\x40\xcf\xe3\x5d\x15\x14\x00\xdf\x2d\x4f\x51\x9f\xad\x2e\xd0\x7a\
-\x8c\xd2\xd1\x40\x05\x14\x51\x40\x05\x14\x52\x50\x02\xd1\x45\x14\
-\x00\x51\x49\x4b\x40\x05\x14\x51\x40\x09\xb4\x63\x18\xe2\x93\x68\
-\x1d\x29\xd4\x50\x02\x6d\x15\x1c\x9f\x79\x4f\xe9\x52\xd3\x4a\x82\
-\x41\x23\x9a\x00\xfe\x73\x7f\x6c\x2f\x0f\xf8\xab\xc3\x7f\xb4\xaf\
-\xc4\x58\xfc\x5d\x15\xd4\x3a\x95\xde\xb5\x75\x77\x1c\xd7\x4c\xdf\
-\xe9\x16\xce\xec\x60\x74\x63\xf7\xa3\x31\x6d\x55\xea\x00\x18\xe2\
-\xba\x1f\xd9\x73\xf6\xe6\xf8\x91\xfb\x2d\xea\x30\xdb\x69\x37\xab\
-\xae\x78\x49\xe5\xdf\x71\xe1\xbd\x42\x53\xf6\x7f\x77\x89\xbf\xe5\
-\x8b\x1e\xec\xbc\x1f\xe2\x06\xbf\x70\xfe\x36\x7c\x01\xf0\x27\xed\
-\x01\xe1\xb6\xd0\xfc\x6b\xe1\xfb\x6d\x4e\x11\x96\x82\xe4\x62\x2b\
-\xab\x57\x6f\xe3\x86\x51\xf3\x23\x7a\xf3\x83\xdf\x35\xf8\xf3\xfb\
-\x60\x7f\xc1\x36\xfc\x69\xfb\x3a\xb5\xff\x00\x88\x3c\x39\x25\xc7\
-\x8c\xfc\x09\x19\x32\x1b\xe8\xa2\xdd\x79\x60\xa4\xff\x00\xcb\xcc\
-\x6a\x3a\x63\xfe\x5a\xaf\xca\x7b\x85\xa0\x0f\xd6\x4f\xd9\xa7\xf6\
-\xbc\xf0\x1f\xed\x4b\xe1\xf3\x77\xe1\x5d\x47\xec\xda\xc4\x11\xa9\
-\xbf\xd0\x2f\xf0\x97\xb6\x6c\x47\x24\xaf\xf1\xa7\xa3\xae\x54\xf7\
-\xc1\xe2\xbd\xba\x37\xdf\x5f\xcc\x07\x83\xbc\x71\xaf\xfc\x3b\xf1\
-\x35\x86\xbd\xe1\x9d\x5e\xf3\x44\xd5\xec\x64\xf3\x6d\xaf\x6c\x5f\
-\xcb\x95\x0e\x30\x71\x8f\x51\xc1\x07\x83\xdf\x35\xfd\x03\x7e\xc4\
-\x7f\x1c\xb5\x8f\xda\x1b\xf6\x72\xf0\xbf\x8c\xb5\xfb\x75\x83\x5a\
-\x94\xcd\x67\x7a\xf1\x45\xe5\xc7\x3c\xb0\xc8\xd1\x99\x50\x74\xc3\
-\x00\x09\xc0\x00\x3e\xe0\x30\x00\x14\x01\xef\xb4\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x15\xf9\x95\xff\x00\
-\x05\x4d\xfd\xb5\xfc\x49\xf0\xfb\x55\x6f\x84\x3e\x0b\x9d\xf4\x8b\
-\x8b\xab\x14\xb8\xd6\x75\x88\xc1\x59\xc2\x4a\x4e\xd8\x20\x39\xf9\
-\x7e\x51\x96\x61\x86\xf9\x97\x69\x18\x35\xfa\x66\xd9\xda\x71\xd6\
-\xbe\x39\xfd\xb4\x3f\xe0\x9d\xfa\x17\xed\x61\xad\xe9\xfe\x24\xb5\
-\xd7\xdb\xc2\x3e\x2d\xb5\xb6\x16\x92\xdd\x9b\x5f\xb4\xc1\x75\x02\
-\xb1\x28\x1e\x3d\xe8\x43\x26\xe3\x87\x07\x9c\xf2\x0f\x14\x01\xf8\
-\x7b\xe1\xff\x00\x0e\xea\x1e\x2c\xd7\xac\x74\x4d\x22\xca\xe7\x52\
-\xd5\xaf\xa5\x4b\x5b\x6b\x4b\x58\xcc\x92\x4b\x23\x70\x11\x40\xe4\
-\x9e\xc0\x7e\x24\x81\x5f\xaf\x3f\xb1\x2f\xfc\x13\x17\x4a\xf8\x5b\
-\x0d\x8f\x8c\x3e\x2a\x43\x06\xb5\xe2\xf6\x2b\x3d\xa6\x86\xf8\x96\
-\xcb\x4e\x23\xf8\x9c\x63\x13\x4e\x3d\x4f\xca\xb9\xe0\x35\x7a\xf7\
-\xec\x7d\xfb\x02\xf8\x3f\xf6\x53\xdd\xaa\x8b\xaf\xf8\x4a\xfc\x6d\
-\x72\xbb\x1f\x5c\x9e\xd7\xca\x5b\x68\x8f\xde\x8e\xd9\x32\xde\x50\
-\x23\x82\xc4\x96\x71\xc0\x20\x57\xd5\xd1\xc6\x15\x71\xfd\x7f\xcf\
-\x14\x00\x47\x6f\x1c\x4a\x02\x2e\xd1\xe9\x9f\xf3\xff\x00\xd6\xa9\
-\x68\xa2\x80\x0a\x29\x0d\x47\xe6\x1e\xdd\x39\x1c\x8e\x73\x40\x12\
-\x16\xc5\x1f\x8d\x79\x67\xc6\x8f\xda\x4b\xe1\xef\xc0\x0d\x2c\xdf\
-\x78\xe7\xc5\x36\x5a\x29\x65\x2d\x05\x9b\x1f\x32\xee\xe3\xfe\xb9\
-\xc2\xbf\x3b\x7e\x58\xf7\xaf\xce\xef\x8e\x9f\xf0\x59\x7d\x5e\xf3\
-\xed\x1a\x6f\xc2\x8f\x0b\x47\xa6\xc4\x37\x2f\xf6\xe6\xbc\x3c\xe9\
-\xb8\xfe\x28\xed\xd4\xec\x5e\xdc\xbb\x37\x5e\x50\x50\x07\xea\xdc\
-\xfa\x84\x16\xd6\xed\x3c\xb3\x24\x51\x0e\x4c\x8e\xc1\x54\x73\x8e\
-\xa7\x8e\xbe\xf5\xe1\x3f\x11\xbf\x6f\x0f\x81\x7f\x0b\x5e\x58\x35\
-\xaf\x89\x5a\x2c\xf7\xb1\xee\x0d\x67\xa4\xc8\x6f\xe5\xdc\x3f\x85\
-\x84\x01\x82\x1f\xf7\x88\xaf\xc2\x7f\x8a\x9f\xb4\xa7\xc4\xdf\x8d\
-\x57\x13\x49\xe3\x1f\x1a\xea\xda\xd4\x52\x1c\x7d\x8e\x4b\x86\x4b\
-\x65\x19\xcf\x10\xa6\x23\xeb\xfe\xcd\x79\xb2\xb3\x33\x6e\xce\x4f\
-\xfb\x3c\x1f\xae\x71\xd7\xde\x80\x3f\x65\xbc\x5d\xff\x00\x05\xa0\
-\xf8\x5b\xa5\x48\x91\x68\x1e\x15\xf1\x36\xbf\x27\x77\x9a\x38\xac\
-\xa3\xfd\x59\xdb\xff\x00\x1d\xaf\x26\xd7\x3f\xe0\xb7\x3a\xb3\x5c\
-\x11\xa3\x7c\x2d\xb2\x8a\x1f\xe1\x6b\xfd\x5d\xe4\x63\xff\x00\x7c\
-\x46\x2b\xe0\xff\x00\x04\xfe\xcb\xff\x00\x16\xbe\x22\xb0\x3e\x1c\
-\xf8\x73\xe2\x4d\x4a\x26\x1b\x96\x74\xd3\x64\x48\x8a\xfa\xf9\x8c\
-\x02\xfe\xb5\xc6\xf8\xeb\xc0\xba\xdf\xc3\x6f\x15\x6a\x1e\x1c\xf1\
-\x1e\x9d\x2e\x95\xae\x58\x49\xe5\xdd\x59\xce\x06\xe8\x9b\x00\xe3\
-\x20\x90\x78\x22\x80\x3e\xfb\xbe\xff\x00\x82\xd8\x7c\x49\x97\x22\
-\xd3\xc0\xbe\x17\xb7\x3d\xbc\xc7\xb8\x93\xf9\x38\xa7\x58\xff\x00\
-\xc1\x6c\x3e\x23\xc5\xff\x00\x1f\x5e\x03\xf0\xbd\xcf\xfd\x73\x9a\
-\xe2\x3f\xe6\xc6\xbe\x6a\xfd\x99\xff\x00\x62\x1f\x1e\xfe\xd5\xba\
-\x26\xb3\xa9\xf8\x3a\xe7\x46\xb7\xb5\xd2\x6e\x23\xb5\xb8\xfe\xd4\
-\xb9\x64\x6d\xec\xbb\xbe\x50\xaa\xd9\x5a\xf5\xbd\x4b\xfe\x08\xfb\
-\xf1\xeb\x4f\x5c\xdb\xc9\xe1\x9b\xcf\xfa\xe5\xaa\xb2\x7f\xe8\x48\
-\x28\x03\xd9\x34\x0f\xf8\x2d\xce\xa1\xf6\xa0\x35\x9f\x85\x76\xd2\
-\x5b\xf7\x6d\x3b\x57\x70\xdf\x93\x44\x6b\xd7\x7c\x19\xff\x00\x05\
-\x9a\xf8\x4b\xac\x7c\xbe\x20\xf0\xe7\x89\xbc\x38\xfb\xb6\xef\x58\
-\x62\xbb\x8b\xeb\x94\x60\xdf\xf8\xed\x7c\x19\xe2\x3f\xf8\x25\xdf\
-\xed\x13\xe1\xfb\x6f\x3d\x7c\x15\x16\xaa\xa3\xfe\x81\xba\x9d\xbc\
-\xe7\xf2\xdc\x0d\x78\xef\x8d\x3f\x66\x8f\x8a\x7f\x0f\xa4\x94\x78\
-\x8b\xe1\xf7\x88\xb4\xb8\xe2\x19\x79\xe5\xd3\x65\x68\x90\x7a\xb3\
-\xa8\x20\x63\xaf\x53\x40\x1f\xbc\x7f\x0d\xff\x00\x6d\xbf\x82\x3f\
-\x16\x25\x8e\x0f\x0e\xfc\x4b\xd0\xda\xee\x46\x0a\x96\x7a\x84\xc6\
-\xc6\xe1\x9b\xd1\x63\x9c\x21\x7f\xf8\x0e\x6b\xdb\x23\xba\x49\x91\
-\x1e\x39\x15\xd5\xc6\x55\x94\x82\x0e\x7a\x62\xbf\x96\x6d\xcd\x1b\
-\x72\x70\xca\xdd\xf2\x1a\xbd\x5b\xe1\x3f\xed\x55\xf1\x53\xe0\x8b\
-\x40\x7c\x1f\xe3\x7d\x5b\x4b\xb6\x8c\xaf\xfc\x4b\xde\x7f\x3e\xc8\
-\xaa\xf4\x1e\x43\xee\x41\xf9\x50\x07\xf4\x94\x0f\xbd\x19\xaf\xca\
-\xaf\x80\xff\x00\xf0\x59\x89\x95\xad\xf4\xdf\x8b\x5e\x16\x59\x13\
-\x01\x5b\x5e\xf0\xd8\x39\x51\xd3\x74\x96\xcc\x7f\x54\x61\xfe\xe5\
-\x7e\x88\x7c\x1f\xf8\xf5\xe0\x6f\x8e\xfa\x00\xd6\x3c\x11\xe2\x5b\
-\x0d\x7a\xd9\x54\x79\xd1\xdb\x49\xfb\xe8\x18\x80\x42\xcb\x11\xf9\
-\xe3\x6f\x62\x3e\x84\xd0\x07\xa3\x51\x4c\xf3\x3f\x0e\x32\x73\x4e\
-\xeb\x40\x09\xe5\xaf\x61\x8e\xfc\x71\x51\xcf\x6b\x15\xc4\x2f\x1c\
-\xb1\xac\xb1\xba\x95\x64\x71\x90\x41\xea\x08\x3d\xaa\x6a\x4a\x00\
-\xf8\x9b\xe2\x8f\xfc\x12\x93\xe0\xc7\xc4\xaf\x1c\x3f\x88\xed\xd7\
-\x57\xf0\xa4\x57\x32\x34\xd7\x9a\x5e\x89\x24\x71\x5a\xca\x4f\xde\
-\x2a\xae\x87\xc9\x63\xe8\xbf\x2f\xb5\x7d\x65\xf0\xf7\xe1\xe6\x83\
-\xf0\xb7\xc1\x9a\x4f\x85\x3c\x35\xa7\xae\x93\xa1\x69\x50\x0b\x7b\
-\x4b\x68\xc9\x3b\x54\x7a\x9c\x92\xc4\x92\x49\x24\x92\x49\x24\x92\
-\x4e\x6b\xa6\xf2\xd7\x39\xc6\x0f\x4e\x29\x76\x8f\x4a\x00\x33\x4b\
-\x5c\x77\xc5\x0f\x89\xfe\x1e\xf8\x3f\xe0\xbd\x57\xc5\x9e\x2a\xd4\
-\xd7\x4a\xd0\xb4\xd8\xbc\xc9\xe7\x74\xdc\x4f\x20\x05\x50\x39\x66\
-\x62\x42\xa8\x1d\x49\xaf\x9c\x3e\x07\xff\x00\xc1\x4d\xbe\x13\x7c\
-\x6f\xf8\x85\x17\x83\xad\x53\x5a\xf0\xee\xab\x77\x2b\x45\x60\xda\
-\xdc\x11\xc7\x0d\xdb\xf3\x88\xd5\xd1\xdb\x63\x9c\x7c\xaa\xf8\xce\
-\x71\x9d\xdc\x50\x07\xd8\x14\x55\x74\xb8\xce\x06\xe1\x9c\xed\x39\
-\xe0\xe7\xe9\xdb\x35\x62\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x18\xd2\x6d\xed\x9a\
-\xce\x9b\x5e\xb3\x82\xe8\x5a\xbd\xe4\x0b\x74\xc0\x11\x03\x48\xa1\
-\xce\xef\xba\x00\x24\x64\x9e\x82\xbc\x53\xf6\xc8\xfd\xa8\x6c\x3f\
-\x65\x9f\x83\x97\xfe\x23\x97\xcb\xb9\xf1\x05\xd9\x36\x7a\x25\x8c\
-\x9f\xf2\xde\xe4\xaf\xde\x61\xfd\xc8\xd7\x2e\xe4\x7a\x05\xea\x45\
-\x7e\x03\x78\x8b\xe2\x57\x8a\xbc\x51\xe3\x29\xfc\x5d\xa9\x6b\xfa\
-\x85\xd7\x89\xa6\xb8\x37\x4f\xab\x35\xc3\x2c\xe2\x4d\xc5\x89\x57\
-\x1c\xa0\x04\x8c\x01\x80\x3b\x62\x80\x3f\xa7\x25\x9b\x77\x20\x1c\
-\x74\x39\x18\xc7\xe1\x52\x79\x6b\xd8\x63\x9c\xd7\x97\x7e\xcc\xfe\
-\x22\xf1\x0f\x8b\x3e\x00\x7c\x3c\xd6\xbc\x58\x24\x1e\x24\xbf\xd1\
-\x2d\x67\xbf\x69\x93\x64\x8d\x2b\xc6\xa4\xb1\x5c\x0d\xa4\xe4\x36\
-\x31\xc6\xee\xd5\xea\x74\x00\xdf\x2d\x73\x92\x32\x7d\xf9\xeb\x4e\
-\xa2\x8a\x00\x29\x0d\x2d\x78\x9f\xed\x31\xfb\x57\x78\x33\xf6\x5a\
-\xf0\x4b\xeb\x5e\x2a\xbb\xf3\xf5\x29\xf2\xba\x76\x87\x6a\x47\xda\
-\xef\x9f\xfd\x95\x3f\x75\x07\xf1\x39\xe1\x7a\x72\xd8\x04\x03\xd2\
-\xfc\x61\xe3\x7d\x1b\xc0\x7e\x1d\xbc\xd7\x7c\x43\xaa\x5a\xe8\xfa\
-\x4d\x9a\x19\x27\xbc\xbc\x94\x47\x1c\x63\xb6\x49\xfe\x43\x27\xd0\
-\x1a\xfc\xb8\xfd\xa9\xbf\xe0\xae\xda\x86\xa5\x25\xdf\x87\xfe\x0c\
-\x5b\x7d\x86\xc7\x2d\x14\x9e\x2a\xd4\x2d\xff\x00\x7d\x30\xf5\xb7\
-\x81\xf8\x41\xfe\xd4\x81\x8f\xaa\xad\x7c\x75\xfb\x4f\x7e\xd7\x1e\
-\x3c\xfd\xa8\xbc\x41\xf6\xbf\x11\xde\x9b\x4d\x0e\xdd\xd9\xac\x3c\
-\x3f\x65\x23\x7d\x8e\xdd\x7d\x70\x7f\xd6\xc9\xfd\xe9\x5b\x93\xdb\
-\x02\xbc\x4a\xc2\xd7\xed\xf7\xd6\xf6\xe6\x75\x83\xcf\x95\x63\x32\
-\x49\xc2\xae\xe3\x8c\xb7\xb0\xa0\x0b\xde\x20\xf1\x3e\xb1\xe3\x3d\
-\x66\xeb\x57\xd7\x35\x5b\xcd\x63\x53\xba\x6d\xf3\xde\xdf\xce\xd2\
-\xc9\x23\x7f\xb6\xec\x72\x6b\xd6\xbe\x04\xfe\xc6\x1f\x16\x7f\x68\
-\xa9\xa3\x9b\xc2\x7e\x16\x9e\x3d\x15\xdc\x06\xd7\x35\x43\xf6\x5b\
-\x05\x07\xb8\x76\x19\x90\xf4\xe2\x20\xe7\x9e\x95\xfa\x85\xfb\x2e\
-\xff\x00\xc1\x2b\xbe\x1e\xfc\x20\x8e\xd7\x5d\xf1\xcb\xdb\xfc\x43\
-\xf1\x5a\x85\x91\x56\x64\xff\x00\x89\x65\xb3\x1c\x91\xe5\xc4\x4f\
-\xef\x79\x20\x6e\x93\x83\x8e\x11\x6b\xee\x6b\x6d\x36\xde\xce\xde\
-\x3b\x7b\x78\x63\x82\x08\xd7\x62\x45\x1a\x05\x45\x5f\x40\x00\xc0\
-\x14\x01\xf9\xc3\xf0\x77\xfe\x08\xcd\xe1\x1d\x0d\x61\xba\xf8\x91\
-\xe2\x8b\xcf\x12\x5c\xa8\xf9\xec\x74\x7c\xd9\xda\x83\xf2\xf1\xe6\
-\x1c\xc8\xdd\xfb\x27\x5a\xfb\x5b\xe1\x9f\xec\xc5\xf0\xa7\xe0\xdc\
-\x51\xff\x00\xc2\x1f\xe0\x1d\x0f\x45\x9e\x3f\xbb\x79\x1d\xaa\xc9\
-\x75\xff\x00\x7f\xdf\x74\x87\xf1\x6a\xef\x75\x2d\x4e\x1d\x2e\xca\
-\xea\xea\xe6\xe2\x0b\x2b\x5b\x78\xcc\x92\xcf\x3b\xf9\x71\xc4\x8a\
-\x32\xcc\xcc\x78\x51\x8f\x5e\x83\x9e\x7a\x57\xe7\xa7\xed\x3b\xff\
-\x00\x05\x7c\xf0\xff\x00\x83\xe4\xbc\xd0\xfe\x11\xe9\xd0\xf8\xb3\
-\x52\x8f\xe4\x6d\x7e\xfb\x70\xd3\xe3\x6f\x58\xd0\x61\xe6\xfa\x9d\
-\x8b\xe8\x5a\x80\x3f\x42\xf5\x2d\x62\xcb\x42\xb1\x9a\xf3\x50\xb9\
-\xb7\xd3\xec\x60\x8f\x74\xb7\x17\x4e\x22\x8a\x35\xf7\x76\xc2\x8f\
-\xc7\x15\xfc\xea\x7e\xd8\x7e\x36\xd2\xfe\x24\x7e\xd3\xdf\x12\x3c\
-\x47\xa2\x4c\x97\x3a\x4d\xee\xaf\x29\xb5\xb8\x88\x10\x25\x44\x01\
-\x37\xaf\xb1\xd9\x9f\xc6\xb2\xfe\x2e\x7e\xd2\xdf\x12\xfe\x3b\x6a\
-\x12\xdc\x78\xd7\xc5\xda\x86\xb3\x1b\x36\xe4\xb2\x32\xf9\x56\x91\
-\x8f\x44\x85\x31\x1a\xff\x00\xdf\x35\x8d\xf0\xb7\xe1\x1f\x8a\x3e\
-\x35\x78\xda\xc7\xc2\xde\x0e\xd2\x2e\x75\xad\x5a\xe9\x8a\xac\x30\
-\x0f\x92\x25\xee\xf2\x37\x48\xd3\x9e\x59\x8e\x07\xa9\xe9\x40\x1f\
-\xa9\xdf\xf0\x45\x4d\x16\x68\xfe\x09\xf8\xfb\x54\x64\x53\x05\xd6\
-\xbe\x96\xf1\xbe\x3f\x8a\x2b\x68\xd9\x87\xd3\x12\xa7\xe6\x6b\xf4\
-\x78\x28\x1d\x06\x2b\xc7\x3f\x65\x2f\x80\xb6\x7f\xb3\x57\xc0\xff\
-\x00\x0e\xf8\x16\xda\x75\xbc\xb9\xb5\x46\xb9\xbf\xbc\x54\xda\xb7\
-\x37\x52\x1d\xd2\x38\x1d\x76\x83\xf2\xae\x79\xda\x82\xbd\x92\x80\
-\x19\xe5\xaf\x5c\x73\xeb\xdf\xf3\xaf\x9a\x3f\xe0\xa0\x9f\x1c\xe6\
-\xfd\x9f\x7f\x66\x9d\x77\x58\xd3\x2e\x3e\xcd\xe2\x1d\x4a\x45\xd1\
-\xf4\xa9\x09\x39\x8e\x69\x41\xdc\xeb\x8f\xee\x44\xb2\x3f\xd5\x45\
-\x7d\x35\x5f\x9d\x1f\xf0\x5a\xbb\x4b\xa9\x3e\x05\x78\x16\xee\x32\
-\xdf\x62\x87\xc4\x5e\x5c\xa0\x7f\x79\xed\x65\x28\x7f\x25\x71\xf8\
-\xd0\x07\xe3\xfd\xbd\x9d\xd6\xb5\xa9\xc3\x6d\x6f\x0c\x97\x77\x77\
-\x32\x2c\x71\x44\x83\x73\xc8\xec\x40\x0a\xa0\x75\x62\x48\xe2\xbf\
-\x47\x74\x5f\xf8\x22\xff\x00\x89\x75\x4f\x85\x76\x3a\x85\xc7\x8c\
-\xed\x74\xaf\x1e\xca\x9e\x7c\xda\x55\xcd\xb9\x7b\x38\xf7\x2f\xcb\
-\x09\x95\x4e\xf5\x70\x7e\xf3\x80\xcb\xe8\x0d\x7c\x6d\xfb\x21\x6a\
-\xfa\x76\x8b\xfb\x52\x7c\x29\xbc\xd5\x84\x67\x4f\x8f\xc4\x56\x22\
-\x43\x21\xc2\xa1\x32\x2a\x87\x3f\x46\x2a\x7f\x0e\x6b\xfa\x3e\x8e\
-\x14\x55\xc0\x18\x07\xa8\xcf\x5a\x00\xfe\x71\xbe\x39\x7e\xc8\xbf\
-\x14\xff\x00\x67\x5b\xa7\xff\x00\x84\xcb\xc3\x17\x16\xba\x70\x70\
-\xb1\xeb\x56\x7f\xe9\x16\x32\x9f\xf6\x67\x51\x85\x3c\x1f\x95\xf6\
-\xb7\x1d\x2b\xcf\x3c\x1b\xe3\xcf\x10\xfc\x3b\xf1\x05\xbe\xb7\xe1\
-\x7d\x6a\xff\x00\x42\xd6\x2d\x48\x31\x5e\xd8\x4e\x62\x91\x47\xa6\
-\x41\xf9\x87\xfb\x39\xc7\xb5\x7f\x4e\x77\xfa\x3d\x9e\xab\x6b\x35\
-\xb5\xed\xbc\x37\x96\xd3\x27\x97\x2c\x37\x11\xab\xa4\x8b\xfd\xd6\
-\x53\xc1\x1e\xc6\xbe\x07\xfd\xa8\xbf\xe0\x93\x7e\x07\xf8\x95\x6f\
-\x71\xad\xfc\x32\x96\x1f\x02\x78\x85\xbf\x78\x74\xf6\xcb\x69\x97\
-\x2d\xfe\xee\x49\x84\xfb\xa6\x57\xfd\x9a\x00\xf3\x7f\xd9\x57\xfe\
-\x0a\xf4\x97\x13\x58\xf8\x6f\xe3\x45\xa2\xc5\xf7\x60\x8f\xc5\x9a\
-\x74\x1f\x29\x3e\xb7\x16\xe9\x9f\xfb\xea\x2f\xfb\xe2\xbf\x4d\x7c\
-\x3f\xe2\x6d\x3b\xc4\xfa\x35\x9e\xab\xa4\x6a\x36\xda\xae\x99\x7b\
-\x1a\xcd\x6d\x79\x64\xe2\x58\xa6\x43\xfc\x48\xc0\xe1\x81\xf5\x19\
-\xc7\x7a\xfe\x6c\xbe\x2e\x7c\x13\xf1\x8f\xc0\xbf\x16\x5c\x78\x6f\
-\xc6\xfa\x15\xd6\x87\xaa\x46\x49\x4f\x38\x66\x2b\x94\x07\x02\x48\
-\xa4\xfb\xae\x87\xd4\x7e\x27\x3c\x57\xa8\x7e\xc9\xff\x00\xb6\xaf\
-\x8e\x7f\x65\x7d\x71\x06\x8f\x71\xfd\xad\xe1\x19\xa5\xcd\xf7\x87\
-\x2e\xdc\xfd\x9e\x4c\xfd\xe7\x8d\xbf\xe5\x94\x9e\x84\x70\x7f\x8b\
-\x34\x01\xfd\x0a\xaf\x41\x4b\x5e\x47\xfb\x3a\xfe\xd2\x9e\x10\xfd\
-\xa5\xbc\x07\x07\x89\x3c\x25\xa8\x2c\xc1\x76\xc7\x7b\xa7\xcd\x84\
-\xba\xb0\x94\xff\x00\xcb\x39\x93\xb3\x67\x80\x47\xca\xe0\x65\x4f\
-\x50\x3d\x72\x80\x0a\x28\xa2\x80\x3e\x6b\xfd\xbe\xbe\x08\xeb\xdf\
-\x1f\xff\x00\x66\xfd\x73\xc3\x7e\x19\xc3\x6b\xb0\x4d\x0e\xa7\x6d\
-\x6a\x18\xa9\xba\x68\x49\x26\x15\x3d\x03\x10\x4e\xdc\xf1\xb8\x2d\
-\x7e\x00\x4f\x1d\xd6\x8f\xaa\x34\x6e\xb3\x59\x5f\x59\xc9\xb0\xab\
-\xa9\x8a\x58\x64\x46\xc1\x04\x75\x47\x52\xbc\x8e\xa1\x8d\x7f\x51\
-\xb2\x5b\xac\x9e\xa3\xf1\x3e\x98\xff\x00\x3f\x9d\x7e\x61\xff\x00\
-\xc1\x54\x3f\x62\x84\xd4\xec\xaf\xbe\x34\xf8\x27\x4e\x51\xa8\x40\
-\x37\x78\x96\xc2\x05\xe2\x68\xc0\xda\x2f\x15\x47\xf1\x8c\x7e\xf3\
-\x1d\xbe\x6f\xbc\xac\x48\x07\xac\x7f\xc1\x36\xff\x00\x6d\xc5\xfd\
-\xa0\x3c\x22\x9e\x09\xf1\x85\xf4\x69\xf1\x17\x46\x84\x14\x92\x41\
-\xb1\xb5\x6b\x35\x1b\x7c\xe0\x7b\xca\x9d\x1c\x77\x04\x30\xfe\x2d\
-\xbf\x74\x07\x04\xd7\xf3\x0b\xf0\xf7\xe2\x06\xbb\xf0\xb7\xc6\xda\
-\x47\x8a\xbc\x37\x7d\x2e\x9b\xae\x69\x77\x0b\x75\x6b\x3c\x63\xf8\
-\x87\x66\x5f\xe2\x46\x04\xa9\x5e\x84\x12\x3b\xd7\xf4\x37\xfb\x2c\
-\xfe\xd0\x5a\x57\xed\x31\xf0\x77\x44\xf1\xb6\x9a\x82\xd6\x7b\x80\
-\x6d\xf5\x0b\x10\x73\xf6\x4b\xb4\xc7\x99\x1f\xfb\xbd\xd4\xf7\x56\
-\x5a\x00\xf6\x1a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\
-\x28\xa2\x80\x0a\xce\xd5\x35\x48\xb4\x9b\x1b\x8b\xdb\xcb\x85\xb4\
-\xb3\xb6\x89\xa6\x9e\x79\x48\x54\x8d\x14\x16\x62\xc4\xf4\x00\x02\
-\x49\xe9\x80\x6b\x46\xbe\x36\xff\x00\x82\xab\x78\x9b\xc4\x7e\x1e\
-\xfd\x90\xf5\xaf\xf8\x47\x8c\x90\x5b\x6a\x17\xf6\xd6\x3a\xbc\xf0\
-\x8c\xb4\x76\x2e\x5c\x1e\x47\xdd\x57\x90\x42\x99\xee\x24\x2a\x71\
-\xb8\x90\x01\xf9\x59\xfb\x70\x7e\xd3\xd7\x9f\xb5\x07\xc6\xeb\xfd\
-\x6a\x09\xe5\x3e\x16\xd3\x4b\x59\x68\x56\xae\x08\x0b\x6e\x0f\x32\
-\x95\xcf\x0f\x21\x5d\xe7\xf0\x1d\x00\x15\xea\x9f\xf0\x4c\xdf\xd9\
-\x01\x3e\x3f\x7c\x4c\xff\x00\x84\xbf\xc4\xd6\x7e\x77\x80\xfc\x33\
-\x3a\x3c\x91\xbf\x4b\xfb\xce\x1e\x28\x0f\xf7\x95\x72\x24\x93\xfe\
-\x00\xbf\xc6\x71\xf2\x8f\xc3\x3f\x87\x7a\xcf\xc5\x8f\x1b\x68\x5e\
-\x11\xf0\xf5\x9f\xda\xf5\xbd\x5a\xe9\x6d\x60\x8c\xe4\xf5\xc1\x2e\
-\xd8\x04\x84\x51\x96\x2d\xe8\xa7\xd0\xe7\xfa\x2c\xf8\x05\xf0\x67\
-\x45\xfd\x9f\xfe\x13\xf8\x7f\xc0\xda\x18\x06\xd3\x4d\x83\x6c\xb7\
-\x1b\x70\xd7\x33\x36\x5a\x59\x9b\xdd\x98\xe7\xf2\xf4\xa0\x0f\x46\
-\x8e\xde\x38\x97\x08\x81\x47\x4e\x3f\x95\x49\x45\x14\x00\x52\x51\
-\x5e\x2f\xfb\x51\xfe\xd2\xda\x07\xec\xc3\xf0\xbe\xfb\xc5\x5a\xd9\
-\x17\x57\x9b\xbe\xcd\xa6\x69\x6a\xe1\x64\xbe\xb9\x2b\x95\x8c\x7f\
-\x74\x01\xf3\xb3\x74\x55\x07\xb9\x02\x80\x39\xbf\xdb\x1b\xf6\xcd\
-\xf0\xd7\xec\x99\xe0\x73\x77\x74\x63\xd5\x7c\x61\xa8\x23\x0d\x23\
-\x40\x0d\x86\x90\x83\xb4\xcb\x2f\x75\x85\x4f\x24\xf5\x6c\x61\x7b\
-\x91\xf8\x3f\xf1\x63\xe2\xe7\x8a\xfe\x36\x78\xdf\x50\xf1\x57\x8b\
-\xf5\x49\x75\x5d\x62\xf1\xb2\xed\x20\xc2\xc2\x83\x91\x1c\x49\xd2\
-\x38\xd7\x9f\x94\x60\x77\xeb\x4e\xf8\xbb\xf1\x67\xc4\x5f\x1c\x3c\
-\x75\xab\x78\xbb\xc5\x37\xcd\xa8\x6a\xfa\x84\xdb\xdb\x9f\x92\x15\
-\x1f\x76\x28\x93\xf8\x63\x45\xf9\x40\xf6\xaf\xaf\xff\x00\xe0\x9e\
-\x5f\xf0\x4f\x69\x7e\x39\xdc\x5b\xfc\x41\xf8\x81\x69\x35\xb7\xc3\
-\xeb\x59\x73\x65\xa7\xb0\x2b\x26\xb3\x22\xf2\x7d\x08\xb7\x53\xd5\
-\x87\x2f\xca\x8e\xe4\x00\x78\xd7\xc0\x9f\xd8\x6f\xc7\x9f\x1b\xbe\
-\x19\x78\xb7\xc7\xe2\x26\xd1\x3c\x27\xa2\xe9\x97\x57\xb6\xb7\x37\
-\x68\x43\x6a\x73\xc2\x8c\x7c\xb8\x57\xba\x82\x30\xd2\x74\x04\x6d\
-\x19\x39\x03\xe6\xde\x53\x18\xee\x33\x5f\xd4\x0d\xff\x00\x85\x6c\
-\x26\xf0\x7d\xc7\x87\x6c\xed\x61\xb2\xd3\x9e\xc5\xac\x21\xb6\xb7\
-\x8c\x24\x51\x46\x63\xd8\xaa\xaa\x38\x0a\x17\x8c\x0e\xd5\xfc\xc5\
-\xeb\x9a\x73\x68\xfa\xbd\xed\x83\x9d\xcd\x69\x3c\x90\x6e\x3d\xf6\
-\x33\x2f\xf4\xa0\x0f\xe9\x07\xf6\x60\xf1\x52\xf8\xf3\xf6\x76\xf8\
-\x6d\xae\xb4\x8d\x73\x2d\xe7\x87\xac\x5a\x59\x64\x39\x67\x90\x42\
-\xa9\x26\x4f\xfb\xca\xd5\xea\x86\xbe\x54\xff\x00\x82\x61\xf8\x89\
-\xfc\x41\xfb\x17\x78\x0b\x7a\x95\x36\x3f\x6b\xb1\xeb\xff\x00\x3c\
-\xee\x65\x19\xfc\x88\xaf\xaa\xe8\x03\xf1\x83\xfe\x0a\x85\xfb\x62\
-\x6b\x5f\x10\xbe\x23\x6a\xff\x00\x0a\x7c\x3d\x7f\x2d\x97\x83\xf4\
-\x09\x5a\xdb\x51\x5b\x77\x0b\xfd\xa5\x76\xb8\x67\x0e\x47\x58\xe3\
-\x39\x0a\xbd\xca\xb1\x39\x38\xc7\xc5\xbf\x0d\xfe\x15\xf8\xa3\xe3\
-\x07\x8b\xad\xfc\x33\xe0\xfd\x0a\xf3\x5f\xd7\x6e\x9b\x11\xdb\x5b\
-\x0c\xec\xe7\x0c\xf2\x13\xc2\x2f\x72\xce\x42\x8e\xe6\xbe\x9b\xfd\
-\xb4\xbf\x62\xdf\x89\xde\x11\xfd\xa0\x7c\x5b\x7f\xa0\x78\x3b\x5d\
-\xf1\x4f\x87\x35\xcd\x42\x6d\x56\xc2\xfb\x47\xb3\x92\xf5\x71\x2b\
-\x99\x19\x24\x11\x2b\x14\x65\x76\x2b\xf3\x63\x3b\x7e\x5c\xd7\xe8\
-\x8f\xfc\x13\x3f\xf6\x6e\xd6\x3f\x67\xff\x00\x82\x77\x52\x78\xb3\
-\x49\x8b\x4b\xf1\x56\xbb\x7a\xf7\xb3\x44\xca\xad\x71\x6f\x6e\x02\
-\xac\x50\xc8\xc0\x7b\x33\x60\x74\xdd\x40\x1e\x09\xfb\x3c\xff\x00\
-\xc1\x1d\x34\x8b\x2b\x78\x35\x4f\x8b\x9a\xf4\xba\xad\xe3\x00\xe7\
-\x41\xd0\x65\x29\x02\xe7\xfe\x7a\xce\x46\xe7\xef\xf7\x02\x8e\x38\
-\x26\xbf\x43\x3e\x19\x7c\x18\xf0\x37\xc1\xcd\x0f\xfb\x27\xc1\x5e\
-\x16\xd3\x7c\x37\x62\x70\x1d\x6c\x60\x0a\xf2\xe3\xa1\x91\xce\x5a\
-\x42\x3d\x58\x93\x5d\x97\x92\x9f\xdd\x1d\x73\xf8\xfa\xd3\xa8\x02\
-\x25\x8d\x55\x81\xea\x4f\x73\xc9\x3e\xf5\xe7\xbf\x14\xbf\x68\x6f\
-\x87\x5f\x05\xed\xd6\x5f\x1a\xf8\xcf\x48\xf0\xf3\x38\x26\x38\x2e\
-\x67\xcd\xc3\x91\xd9\x61\x5c\xbb\x7e\x0b\x5e\x0d\xff\x00\x05\x18\
-\xfd\xae\x2f\xbf\x66\x3f\x85\xb6\xb6\x9e\x1b\x9d\x21\xf1\x9f\x89\
-\x1e\x5b\x7d\x3a\xe2\x48\xc3\x2d\xa4\x51\x8f\xde\xcf\xb4\xe4\x16\
-\x52\xc8\xaa\x18\x10\x59\xf9\x04\x0c\x57\xe1\x8e\xbd\xe2\x5d\x5b\
-\xc5\x9a\xd5\xde\xad\xac\xea\x37\x5a\xa6\xa7\x76\xe5\xe7\xbb\xbb\
-\x95\xa5\x96\x56\x3d\x77\x39\x39\x3e\xb4\x01\xfb\x6b\xe2\x0f\xf8\
-\x2b\xc7\xc0\x2d\x16\x7d\x96\xb7\x7e\x22\xd7\x57\xfe\x7a\xe9\xfa\
-\x43\x2a\xfe\x53\x32\x1a\xf9\xaf\xf6\xdc\xff\x00\x82\x8c\xfc\x25\
-\xfd\xa4\x7f\x67\xdd\x6b\xc1\x5e\x1f\xd2\x7c\x49\x0e\xb5\x3d\xcd\
-\xa5\xcd\xa4\xba\xa5\x94\x11\xc3\x1b\x47\x32\xbb\x90\xeb\x33\x30\
-\x25\x37\x2f\xdd\xe8\x4d\x7e\x7a\x78\x63\xe1\x2f\x8d\xbc\x6d\x1e\
-\xff\x00\x0e\xf8\x37\x5f\xd7\xa3\xfe\xfe\x99\xa6\x4f\x70\x0f\xe2\
-\x88\x6b\xa2\xff\x00\x86\x62\xf8\xcb\xce\x3e\x13\xf8\xe4\x67\xd3\
-\xc3\x77\x9f\xfc\x6a\x80\x38\xbf\x07\xc7\x3c\xbe\x2c\xd1\x63\xb4\
-\x56\x6b\xb6\xbd\x84\x44\xab\xf7\x8b\x99\x54\x28\x1e\xf9\xc5\x7f\
-\x51\x4b\xd2\xbf\x22\xff\x00\x60\x6f\xf8\x26\xdf\x8b\x6d\xfe\x24\
-\x68\x7f\x11\x7e\x29\xe8\xed\xe1\xcd\x2b\x45\x9d\x2f\xac\x34\x4b\
-\xb7\x1f\x6a\xbb\xb9\x4c\x3c\x4f\x2a\x0e\x62\x8d\x4f\xcd\xb5\xc8\
-\x62\xc9\x82\xa4\x12\x2b\xf5\xcd\x4e\x57\xd2\x80\x16\x9b\xe5\xa8\
-\xce\x06\x3b\x9c\x7f\x3a\x7d\x14\x01\xe6\xdf\x1a\xbe\x05\x78\x2f\
-\xe3\xe7\x83\x66\xf0\xd7\x8d\x34\x48\x75\x4d\x3d\xf2\xd0\xc8\xcb\
-\xb2\xe2\xd5\xc8\xe1\xe1\x93\xaa\x3e\x7d\x38\x3d\x0f\x15\xf8\xa3\
-\xfb\x66\x7e\xc1\xbe\x2c\xfd\x95\x75\x67\xd4\x6d\x8c\xde\x24\xf8\
-\x7d\x70\xfe\x5d\xa6\xbb\x1c\x67\x7d\xb1\x27\x88\xae\x40\xe2\x37\
-\xfe\x10\xf8\x08\xfd\xb0\x72\x07\xef\xaf\x96\xa1\x89\x0b\x82\x7a\
-\xe2\xb2\x3c\x49\xe1\x6d\x23\xc5\x5a\x1d\xfe\x8d\xac\x69\x96\xda\
-\x9e\x93\x7f\x09\x82\xea\xce\xe6\x30\xf1\x4d\x19\x18\x2a\xca\x78\
-\x23\x1f\x97\x6a\x00\xfe\x6f\x7e\x06\x7c\x75\xf1\x77\xec\xef\xe3\
-\xab\x2f\x15\xf8\x47\x51\x93\x4f\xbc\x87\x02\x78\x18\x1f\x22\xf2\
-\x12\xdb\x8c\x33\x20\xfb\xe8\xc0\x7e\x07\x04\x60\xf3\x5f\xbc\xdf\
-\xb2\xaf\xed\x65\xe1\x8f\xda\xaf\xc0\x31\x6b\x9a\x1c\x91\xd9\x6b\
-\x16\xbb\x21\xd6\x34\x39\x65\x0d\x3d\x8c\xcc\x0e\x3a\x7d\xf8\xd8\
-\x82\x51\xc6\x03\x00\x7a\x32\x95\x1f\x94\x3f\xb7\xe7\xec\x11\x7f\
-\xfb\x34\xeb\x93\xf8\xab\xc2\x91\x4f\xa8\xfc\x35\xbd\x9b\x11\xc9\
-\x93\x24\x9a\x3b\xbb\x7c\xb0\x4c\xdd\x7c\xbc\xfc\xb1\xc8\x73\x9f\
-\xba\xc7\x70\x1b\xfe\x7c\xf8\x07\xf1\xef\xc5\x3f\xb3\x9f\xc4\x7d\
-\x3b\xc6\x5e\x13\xbc\xf2\x6e\xad\x4e\xcb\x9b\x59\x09\xf2\x2f\xa0\
-\x38\xdd\x04\xaa\x3a\xab\x00\x08\xfe\xe9\x01\x97\x04\x03\x40\x1f\
-\xd2\xb5\x15\xe5\xdf\xb3\xef\xc7\xdf\x0f\x7e\xd1\x9f\x0c\xf4\xbf\
-\x19\xf8\x6e\x73\xf6\x6b\xa0\x63\xb9\xb3\x93\x06\x5b\x2b\x81\x8d\
-\xf6\xf2\x63\xa3\x2e\x47\x3d\x18\x15\x23\x86\x19\xf5\x0c\xd0\x02\
-\xd5\x7b\x8d\x3e\xda\xf2\x09\x61\xb8\x81\x27\x86\x55\x64\x92\x39\
-\x46\xe5\x75\x23\x0c\xa4\x1e\xa0\x8e\xa3\xbd\x58\xa2\x80\x3f\x1c\
-\x3f\x69\xaf\xf8\x25\x07\x8f\xed\xfe\x27\xdf\xdf\xfc\x27\xd3\xac\
-\xb5\x9f\x07\xea\xb3\x99\xa1\xb1\x92\xfe\x1b\x69\xb4\xd2\xc7\x73\
-\x44\x44\xa5\x03\x44\x0e\x4a\xb2\x12\xdb\x41\x05\x49\x1c\xfd\xff\
-\x00\xfb\x0b\xfe\xcd\x17\x5f\xb2\xdf\xc1\x1b\x7f\x0d\xea\x57\xd6\
-\xf7\xda\xe5\xf5\xd3\x6a\x5a\x94\x96\xa5\x9a\x01\x23\x2a\xae\xc8\
-\xd8\xe3\x72\xaa\xaa\x8d\xd8\x1f\x4a\xfa\x37\xcb\x5d\xc1\xb1\xf3\
-\x0e\x01\xef\xcf\xf9\xfd\x05\x02\x24\x19\xc2\xe3\x9c\x9f\xf1\xa0\
-\x07\xd1\x45\x25\x00\x2d\x14\x51\x40\x05\x14\x51\x40\x05\x14\x52\
-\x13\x85\xa0\x05\xac\xfd\x67\x43\xb1\xf1\x06\x97\x77\xa6\xea\x36\
-\x50\x6a\x1a\x7d\xdc\x6d\x0d\xc5\xad\xd4\x62\x48\xa5\x46\x18\x65\
-\x65\x3c\x10\x47\x51\x57\x3c\xe0\x06\x7a\xf3\x8c\x01\x93\x4f\x52\
-\x3b\x50\x07\x94\x7c\x30\xfd\x96\xbe\x15\xfc\x19\xd6\xae\x35\x7f\
-\x05\xf8\x1b\x49\xd0\x35\x49\xd7\x63\x5e\x40\xae\xd2\x85\xe7\xe5\
-\x56\x76\x25\x01\xce\x08\x5c\x02\x30\x0f\x00\x57\xab\x6d\x1e\x94\
-\xea\x28\x00\xa2\x8a\x6b\x36\xd5\xa0\x0c\x3f\x17\x78\xab\x4f\xf0\
-\x6f\x86\xb5\x2d\x7b\x5a\xbe\x87\x4c\xd2\x74\xd8\x1e\xea\xee\xf2\
-\x7f\xb9\x0c\x68\xbb\x98\xb7\xd0\x03\xf5\xe0\x0e\x48\xaf\xe7\xd3\
-\xf6\xc4\xfd\xa7\xb5\x3f\xda\x9f\xe2\xdd\xd7\x88\x25\x12\x5b\x78\
-\x76\xcc\xbd\xb6\x89\xa6\xb3\x7c\xb6\xf6\xfb\xb3\xb9\x87\xf7\xdc\
-\xae\xf7\x23\xd4\x76\x02\xbe\xd5\xff\x00\x82\xbe\xfe\xd4\x6d\x1f\
-\xd9\x3e\x0b\x68\x17\x85\x53\xf7\x77\xfe\x22\x68\x5f\xd7\xe6\x82\
-\xd9\xbd\xba\x48\xc3\xfe\xb9\x7a\xf1\xf9\xe5\xf0\x3b\xe1\x0e\xbd\
-\xf1\xf3\xe2\x86\x85\xe0\xaf\x0e\xc4\x3e\xdd\xa9\xcd\xb1\xae\x18\
-\x16\x8e\xd6\x21\xcc\x93\xbe\x3a\x22\xa8\x24\xfa\xf0\x3a\x91\x40\
-\x1e\xf3\xff\x00\x04\xfd\xfd\x8b\x6e\x3f\x6a\x1f\x88\x0b\xaa\xeb\
-\xb1\x4d\x07\xc3\xad\x0e\x55\x7d\x46\x55\x24\x1b\xf9\xb2\x19\x6d\
-\x11\xbf\x15\xf3\x08\xe4\x2f\x4c\x33\x02\x3f\x75\x34\x9d\x22\xd3\
-\x42\xd3\x6d\x34\xeb\x1b\x68\x6c\xec\x6d\x22\x48\x20\xb7\x82\x30\
-\xb1\xc4\x88\x30\xa8\x8a\x3a\x28\x1c\x0f\x61\x5e\x2f\x16\xa5\xf0\
-\xaf\xf6\x15\xf8\x13\xa4\xe9\x77\xfa\xa5\xaf\x87\x3c\x33\xa4\x41\
-\xe4\xc2\x6e\x08\x37\x5a\x84\xf8\x26\x47\x44\x1c\xcd\x33\xb0\x2c\
-\xc1\x71\xb4\x12\x48\x55\x51\x8f\xcf\x3f\xda\x33\xfe\x0a\xff\x00\
-\xe2\xcf\x15\xb5\xd6\x97\xf0\xa7\x4b\x5f\x09\x69\x4c\x0c\x5f\xdb\
-\x1a\x8a\xa4\xda\x8c\x80\x31\xe5\x14\xe6\x28\xb2\x07\x7d\xe7\x9a\
-\x00\xfd\x05\xfd\xaf\xbf\x6a\xff\x00\x0c\x7e\xcb\xbf\x0d\x75\x1b\
-\xfd\x52\xfa\x19\xbc\x4f\x77\x6d\x22\x68\xba\x2c\x6e\x3c\xfb\xa9\
-\x88\xda\xaf\x8e\xab\x12\x1e\x5d\xc8\x20\x74\x04\xb6\x01\xfe\x7a\
-\xef\x2e\xa4\xbf\xbc\x96\xe6\x67\xf3\xa6\x9d\xda\x47\x73\x80\x49\
-\x2e\x49\x27\xb0\xc9\x35\x7f\xc4\xde\x2e\xd7\x3c\x6d\xac\x5d\x6b\
-\x3a\xf6\xaf\x7b\xad\xea\xb7\x2c\x1e\x6b\xfd\x42\xe1\xa6\x96\x46\
-\xff\x00\x69\xdc\xe4\xff\x00\x4a\xfb\x37\xfe\x09\xff\x00\xff\x00\
-\x04\xfe\xd6\x3e\x38\x78\x9b\x4e\xf1\xaf\x8d\x34\xe9\xf4\xff\x00\
-\x86\xf6\x32\x0b\x84\x4b\x80\x63\x6d\x69\xd0\xe5\x23\x8c\x30\xc9\
-\x87\x23\xe6\x93\x8e\x85\x57\x9c\x95\x00\xfd\x2b\xff\x00\x82\x7c\
-\xfc\x3f\xb8\xf8\x6b\xfb\x23\x7c\x3c\xd2\xef\x22\x6b\x6b\xeb\x9b\
-\x26\xd4\xe6\x8d\xce\x48\x37\x12\x34\xcb\xc6\x06\x3e\x47\x4e\x0f\
-\x35\xf4\x85\x43\x0c\x09\x1a\x00\x17\x0a\x38\x0b\xd8\x7e\x1f\xe7\
-\x15\x35\x00\x37\xcb\x5f\x4e\xf9\xa4\xf2\xd7\xd3\xbe\x69\xf4\x50\
-\x01\x50\x34\xa4\x11\x92\x06\xee\x83\xa1\xfc\x07\x39\x22\xa6\x35\
-\xf9\xaf\xff\x00\x05\x21\xff\x00\x82\x84\x6b\x9f\x09\xf5\xd9\xfe\
-\x18\x7c\x34\xba\x8b\x4f\xd7\xe3\x89\x5b\x59\xd7\x54\x2b\xc9\x65\
-\xbf\x0c\x20\x84\x10\x40\x72\xa4\x33\x39\x1f\x28\x65\x03\x0c\x72\
-\x00\x3c\x53\xfe\x0b\x39\xe3\x5b\x5d\x73\xe3\xaf\x84\xbc\x39\x04\
-\x8b\x2c\xba\x2e\x88\x66\xb8\xdb\x82\x62\x92\xe2\x52\xc1\x5b\xb8\
-\x3b\x22\x43\xcf\x67\x1c\x57\x9c\x7f\xc1\x2a\xfe\x18\xe9\x3f\x14\
-\xbf\x6a\x45\x8f\xc4\x1a\x4d\xae\xb3\xa6\xe8\xfa\x2d\xce\xa2\x6d\
-\xef\x60\x59\x62\xdc\xad\x14\x28\x59\x48\xda\x48\xf3\x78\x04\x10\
-\x70\x6b\xe4\xed\x73\xc4\x1a\xa7\x8a\x35\x8b\xcd\x4f\x58\xd4\x2e\
-\x75\x1d\x4a\xe5\x8c\xb7\x17\x77\xb2\x19\x24\x91\xb8\x1b\xd9\x98\
-\x92\x5b\x91\xea\x40\x18\xaf\xd8\xbf\xf8\x24\xbf\xec\xd3\xa9\x7c\
-\x27\xf8\x6b\xab\x78\xeb\xc4\x76\x33\x69\xba\xdf\x8b\x04\x3f\x64\
-\xb5\xb9\x4d\xb2\x45\x60\x99\x78\xdc\x8e\xab\xe6\xb3\x93\xcf\x50\
-\xa9\xc0\xa0\x0f\xbe\xad\xed\x63\xb7\x8d\x52\x38\xd6\x24\x5e\x8b\
-\x18\xda\x3f\x21\x53\x52\xd1\x40\x0d\xd8\xbc\x9c\x60\xd2\xd2\xd1\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x18\xfe\x28\xf0\xae\x95\xe3\
-\x2d\x03\x51\xd1\x35\xbd\x3a\xdf\x55\xd2\x75\x08\x1e\xda\xea\xce\
-\xe9\x37\xc7\x34\x6c\x30\xca\xc0\xfa\x8a\xfc\x10\xfd\xb9\xbf\x63\
-\xed\x4b\xf6\x4f\xf8\x90\xc9\x65\xe6\xde\xf8\x23\x58\x67\x97\x45\
-\xd4\x9c\xfc\xc8\x33\xf3\x5b\xca\x7f\xe7\xac\x79\xc7\xfb\x4b\x86\
-\x1c\xee\x0b\xfd\x03\x57\x96\xfe\xd0\x9f\x01\x7c\x3d\xfb\x43\xfc\
-\x29\xd6\xbc\x17\xaf\xc2\xa2\x0b\xd5\x32\x5a\x5e\x2a\x66\x4b\x3b\
-\x80\xbf\xbb\x9d\x09\xe4\x30\x39\x1e\xea\x4a\x9c\xa9\x22\x80\x3f\
-\x13\x7f\x60\xff\x00\xda\xd2\xf3\xf6\x5d\xf8\xb5\x0c\xba\x84\xf3\
-\x49\xe0\x5d\x61\xd2\xdb\x5b\xb2\x4f\x98\x22\x8c\x85\xb9\x55\xff\
-\x00\x9e\x91\xe4\x9e\x3e\xf2\x6e\x5e\x49\x15\xfb\xe9\xa5\xea\x90\
-\xea\xf6\x76\xd7\xf6\x77\x11\xdd\xd8\xdc\xc4\xb3\x43\x3c\x24\x32\
-\x48\x8c\x03\x2b\x03\xdc\x10\x41\x04\x76\xaf\xe6\x77\xe2\x9f\xc3\
-\x7d\x77\xe0\xef\xc4\x0d\x73\xc1\xde\x22\xb4\x36\x5a\xc6\x8f\x70\
-\xd6\xd3\xa8\x39\x0d\x8f\xb9\x22\x9e\xea\xc3\x6b\x29\xf4\x22\xbf\
-\x52\xbf\xe0\x91\x7f\xb5\x61\xf1\x57\x85\xee\x7e\x0e\xf8\x86\xec\
-\xbe\xa7\xa1\xc2\x6e\xb4\x29\x26\x3f\x34\xb6\x79\xfd\xec\x00\xf7\
-\xf2\x98\xe5\x73\x93\xb5\x88\xe8\xb8\x00\x1f\xa5\x34\x52\x75\xa5\
-\xa0\x02\xaa\xde\x5e\xc7\x63\x69\x2d\xd5\xc4\xcb\x6f\x6f\x0a\x99\
-\x24\x92\x42\x02\xaa\x01\x92\x49\xf6\x19\xab\x55\xc6\xfc\x5a\xf0\
-\x64\xdf\x11\x3e\x17\xf8\xb3\xc2\xf0\x5d\x35\xa4\xfa\xc6\x99\x73\
-\x61\x1d\xc2\x1c\x18\x9a\x48\xd9\x54\x8f\xa1\x22\x80\x3e\x5b\x4f\
-\xf8\x2b\x47\xc0\xb9\x3e\x22\x2f\x86\x7e\xd5\xad\xad\x87\x9f\xe4\
-\x7f\xc2\x4c\xd6\x23\xfb\x33\x3f\xde\xce\xff\x00\x37\x66\x7e\x5d\
-\xfe\x5e\x3b\xe3\x6f\x35\xf6\x5d\xa5\xca\x5d\x42\x93\x42\xeb\x2c\
-\x52\x28\x78\xdd\x4e\x55\x94\x8c\x86\x07\xd0\x82\x2b\xf9\x7b\xf1\
-\x16\x85\x7b\xe1\x7d\x72\xff\x00\x48\xd4\xa1\x36\xda\x8e\x9f\x71\
-\x25\x9d\xcc\x2f\xd6\x29\x11\x8a\x32\x37\xb8\x2a\x45\x7e\xe7\x7f\
-\xc1\x30\xfe\x38\x3f\xc6\x2f\xd9\x8f\x4a\xb1\xbd\xb9\xf3\xb5\x9f\
-\x0a\xc9\xfd\x89\x75\xbc\xe5\xdd\x11\x43\x41\x21\xfa\xc6\xc0\x67\
-\xb9\x46\xee\x0d\x00\x7d\x83\x45\x20\xa5\xa0\x02\x8a\x28\xa0\x02\
-\x9b\x27\xdd\xa7\x57\x31\xf1\x23\xc6\x96\xbf\x0e\xfc\x03\xe2\x4f\
-\x14\x5f\x3e\xcb\x1d\x17\x4e\xb8\xd4\x26\x62\x3f\x86\x28\xcb\x91\
-\xf5\xc0\xa0\x0f\xcb\xcf\xdb\x9f\xfe\x0a\x4d\xf1\x17\xc1\xff\x00\
-\x1a\xf5\xaf\x03\xfc\x36\xd4\x6d\xf4\x2d\x23\xc3\xf3\x7d\x92\xe6\
-\xf8\x5a\xc7\x3c\xb7\x77\x21\x41\x97\x97\x56\x0a\x88\xc7\x60\xc6\
-\x09\xc1\xce\x72\x31\xf5\xb7\xfc\x13\xb7\xf6\xaf\xd7\x7f\x6a\x3f\
-\x84\xba\x8d\xdf\x8a\x61\x81\x7c\x4d\xa1\xde\x0b\x2b\xbb\xab\x58\
-\xbc\xa8\xee\x55\x90\x3a\x4a\x17\xa2\xb7\x2c\x08\x00\x03\x8c\x8a\
-\xfc\x25\xf1\x27\x88\xae\xfc\x55\xae\x6a\x5a\xcd\xf4\xbb\xef\x35\
-\x2b\xa9\xaf\x2e\x18\x70\x0c\x8e\xc5\xd8\xfe\x2c\xcc\x7f\x13\x5f\
-\xb9\x7f\xf0\x4b\x9f\x84\xeb\xf0\xe3\xf6\x4d\xf0\xfe\xa5\x34\x0b\
-\x1e\xa5\xe2\x89\xe4\xd6\xa7\x62\x80\x1d\x8c\x76\x5b\x8c\xf7\x5f\
-\x2d\x15\x87\xa6\xfa\x00\xfb\x0e\x8a\x28\xa0\x02\xbc\xfb\xe3\xaf\
-\xc5\x8d\x3f\xe0\x8f\xc2\x6f\x13\x78\xdf\x54\x39\xb5\xd1\xec\xde\
-\xe0\x45\x9c\x79\xb2\x70\x23\x8f\xea\xce\xc8\xbc\x7f\x78\xd7\xa0\
-\x1e\x86\xbf\x2c\xff\x00\xe0\xb3\x5f\x1d\x64\x8a\xd7\xc2\x7f\x09\
-\xf4\xd9\xb0\x26\x27\x5c\xd5\x76\x9e\x48\x56\x68\xed\xe3\x23\xbf\
-\x22\x47\x20\xf5\xc2\x50\x07\xe6\x5f\x8d\xfc\x65\xaa\xfc\x44\xf1\
-\x9e\xb5\xe2\x7d\x72\xe8\xde\x6b\x1a\xc5\xdc\x97\xb7\x53\xb7\xf1\
-\x4b\x2b\x6e\xc7\xa0\x51\xd0\x01\x80\x07\x03\x8e\x2b\xf4\xaf\xf6\
-\x27\xd2\x7c\x29\xfb\x0d\x7e\xcb\xda\xaf\xc7\xbf\x88\x31\xe7\xc4\
-\x5e\x2a\x8f\xc9\xd1\x34\xee\x05\xcc\xf6\xa0\x93\x1c\x31\xe7\xa1\
-\x95\x87\x98\xcd\xc8\x11\xac\x6c\x7a\x10\x7f\x2f\xb4\xc9\xad\xed\
-\xaf\xad\xe5\xbb\x83\xed\x70\x47\x22\xb4\x90\x79\x9b\x7c\xc5\x0d\
-\xf3\x26\x7a\x8c\x8e\xe2\xbb\xff\x00\x8e\xdf\x1f\xbc\x59\xf1\xfb\
-\xc4\xf6\xfa\xaf\x89\x67\x48\xad\x6c\x60\x5b\x5d\x33\x47\xb4\x4f\
-\x2a\xcf\x4c\xb7\x00\x05\x86\x08\xfa\x28\xc2\xa8\x2d\xf7\x8e\xd1\
-\x92\x70\x30\x01\x27\xed\x07\xfb\x44\x78\xc3\xf6\x90\xf8\x89\x79\
-\xe2\xbf\x16\x5f\x99\x67\x73\xb2\xce\xca\x16\x22\xde\xc6\x1c\xe5\
-\x62\x85\x4f\xdd\x1d\x49\x27\x96\x24\x92\x49\x35\xd5\xfe\xcd\xbf\
-\xb1\x97\xc4\xcf\xda\x7b\x50\xdf\xe1\x6d\x33\xec\x9a\x2c\x32\x79\
-\x77\x3a\xf6\xa3\x98\x6d\x21\x61\x8c\x80\x7e\xf3\xb8\xf4\x8c\x31\
-\xf5\xc5\x76\xff\x00\xb0\xaf\xec\x41\xab\x7e\xd5\x1e\x30\x1a\xae\
-\xaf\x1c\xfa\x77\xc3\x8d\x2e\x61\xfd\xa5\xa8\x72\xaf\x78\xe3\x9f\
-\xb3\x42\xdf\xde\x6f\xe2\x7e\x42\x0e\x79\x38\x07\xf7\x6f\xc3\x3e\
-\x11\xd1\xbc\x17\xa0\x58\x68\x7a\x16\x9b\x6f\xa4\xe8\xf6\x11\x24\
-\x16\xb6\x36\x89\xb2\x28\x51\x7e\xe8\x55\x1c\x0f\xeb\xde\x80\x3e\
-\x37\xfd\x9d\x7f\xe0\x95\x7f\x0a\xfe\x0e\xcf\x6b\xab\x78\x94\xbf\
-\xc4\x5f\x12\xc4\x43\xf9\x9a\x9c\x41\x6c\x61\x6f\x55\xb6\x19\x07\
-\xfe\xda\x33\xd7\xdb\x10\xd9\xc5\x6f\x14\x71\x44\x8b\x14\x71\x8d\
-\xa8\x88\x30\x14\x7a\x00\x3a\x0f\x6a\x97\xcb\x5e\x38\xe9\xd3\xda\
-\x9d\x40\x09\x4b\x45\x14\x00\x51\x45\x14\x00\xc6\x3c\xad\x7f\x31\
-\xdf\x16\xfc\x41\xaa\x78\xaf\xe2\x7f\x8b\xf5\xad\x69\x64\x4d\x5e\
-\xfb\x56\xba\xba\xbb\x47\x27\x2b\x2b\x4c\xdb\xc1\xcf\x60\x72\x00\
-\xea\x00\xaf\xe9\xcf\x68\xe2\xbf\x34\x3f\x6c\xef\xf8\x25\x6d\xef\
-\xc5\x4f\x1c\x6a\x9e\x3a\xf8\x5d\xa9\xd8\xd9\xea\x5a\xb4\xad\x77\
-\xa8\x68\x7a\x9b\x3c\x50\xbc\xee\x72\xf2\xc1\x22\xab\x05\xde\x7a\
-\xa3\x00\x33\xce\xe0\x28\x03\xe1\x7f\xd9\x5f\xe3\xe7\xc2\xcf\x81\
-\x17\x8b\xaa\xf8\xbb\xe1\x43\x7c\x40\xf1\x1c\x53\xf9\x96\x97\xb7\
-\x5a\xa0\x4b\x7b\x45\xc2\x70\xb6\xcd\x09\x52\xf9\x07\xe7\x62\x7a\
-\xd7\xd9\xb7\x5f\xf0\x5b\xbd\x36\x1c\x1b\x3f\x83\x97\x12\x91\x8c\
-\x79\xbe\x22\x54\xe8\x31\x9e\x2d\x9b\x9c\x71\x5f\x24\xea\x1f\xf0\
-\x4c\xdf\xda\x4b\x4d\x94\xc6\xdf\x0d\x67\xb8\x41\xc6\xeb\x6d\x4e\
-\xca\x45\x3e\xfc\x4d\x50\xda\xff\x00\xc1\x33\xbf\x69\x4b\xa1\x95\
-\xf8\x63\x70\xab\xff\x00\x4d\x35\x5b\x04\xff\x00\xd0\xae\x05\x00\
-\x7d\x65\xff\x00\x0f\xca\x7f\xfa\x22\xeb\xff\x00\x85\x4f\xff\x00\
-\x71\xd6\xbf\x87\xff\x00\xe0\xb8\x1a\x35\xcd\xc2\x8d\x6f\xe1\x3d\
-\xfd\x85\xbf\x79\x34\xfd\x6d\x2e\x9f\xfe\xf9\x78\x62\x1f\xf8\xf5\
-\x7c\x8a\xbf\xf0\x4b\x7f\xda\x59\x94\x9f\xf8\x57\x88\x3d\x9b\x5b\
-\xb0\xff\x00\xe3\xf5\x87\xe2\x3f\xf8\x27\x3f\xed\x17\xe1\x6b\x76\
-\xb9\xbc\xf8\x5f\xa8\xcf\x12\xff\x00\xd0\x3a\xe6\xda\xf1\x8f\xfc\
-\x06\x29\x19\xbf\xf1\xda\x00\xfd\x5a\xf8\x4d\xff\x00\x05\x42\xf8\
-\x1b\xf1\x52\xf6\xde\xc1\xf5\xcb\x9f\x08\xea\x33\xb6\xc4\x83\xc4\
-\x90\x0b\x64\x66\xdc\xab\x8f\x39\x59\xe2\x1f\x7b\x3c\xbf\x6a\xfa\
-\xae\x1d\x52\x2b\x9b\x58\xae\x22\x9a\x39\x21\x99\x55\xe3\x91\x18\
-\x32\xb0\x61\x90\x41\x19\x07\x8e\x72\x09\x18\x19\xe9\x5f\xcc\x37\
-\x88\xbc\x2f\xab\x78\x3b\x56\xb9\xd2\xb5\xcd\x2e\xfb\x45\xd4\xa0\
-\x62\xb2\xd8\x5f\xc0\xd0\x4d\x1b\x0c\x8f\x9a\x36\xe5\x4e\x46\x39\
-\x1f\x8d\x7d\xa9\xff\x00\x04\xe2\xfd\xb8\xb5\x9f\x84\x7e\x3c\xd2\
-\xbe\x1d\x78\xab\x53\x92\xff\x00\xe1\xfe\xb1\x3a\x59\xdb\x2d\xeb\
-\x92\x74\x8b\x86\x6c\x23\xc4\x7f\x86\x26\x62\x03\x47\xd0\x1c\x30\
-\xc6\x1b\x70\x07\xed\xa5\x15\x1e\xe3\xb7\x39\xf4\xa9\x28\x00\xa2\
-\x8a\x28\x00\xa6\xed\x14\xea\x28\x03\xf3\x5b\xfe\x0a\xf5\xfb\x2f\
-\xc7\xe2\x8f\x08\xd9\xfc\x5f\xd0\xed\x31\xa9\xe8\x6a\xb6\x7a\xd2\
-\xc4\xb8\x33\x59\x93\x88\xa5\x38\xea\x62\x76\x0a\x4f\xf7\x1c\x7f\
-\x72\xbf\x2e\xbe\x0e\xfc\x4e\xd5\xfe\x0c\x7c\x4e\xf0\xdf\x8d\x34\
-\x59\x4a\xea\x3a\x25\xe4\x77\x2b\x19\x27\x12\xa8\xff\x00\x59\x1b\
-\x7b\x32\x96\x53\xf5\x35\xfd\x2a\x78\xaf\xc2\xfa\x6f\x8c\x7c\x35\
-\xaa\x68\x5a\xb5\xba\xdd\x69\x9a\x9d\xb4\x96\x97\x50\xb0\xca\xbc\
-\x6e\xa5\x5d\x7f\x10\xc7\x91\xcf\x35\xfc\xdc\x7c\x7c\xf8\x4f\xa8\
-\x7c\x0b\xf8\xc5\xe2\xbf\x03\x6a\x25\x8c\xba\x35\xeb\xc1\x14\xa4\
-\x63\xcf\x84\xfc\xd0\xca\x7f\xdf\x46\x56\xf6\xdc\x47\x6a\x00\xfe\
-\x8e\x3e\x1b\xf8\xf7\x4c\xf8\x99\xe0\x5d\x0b\xc5\x9a\x35\xc7\x9f\
-\xa5\x6b\x16\x69\x7b\x6e\xc3\x1f\x71\xd4\x36\x0f\xba\xe4\xaf\xe1\
-\x5d\x4d\x7e\x6f\x7f\xc1\x1a\x7e\x3a\x49\xe2\x8f\x86\xbe\x23\xf8\
-\x65\xa8\xdc\xf9\x97\xbe\x1d\x9b\xed\xfa\x72\xb1\xe4\xda\x4c\xd8\
-\x74\xfa\x24\xa3\xf2\x98\x0e\x80\x63\xf4\x80\x50\x02\xd3\x59\x46\
-\xd3\x4e\xa4\xa0\x0f\xc3\x9f\xf8\x2b\x2f\xc1\x75\xf8\x6f\xfb\x4a\
-\x4b\xe2\x6b\x28\x36\x69\x5e\x32\xb5\x1a\x8f\x03\xe5\x5b\xb4\xfd\
-\xdd\xc0\x1e\xb9\xf9\x24\xcf\xfd\x34\x35\x7b\xfe\x09\x15\xf1\x85\
-\xfc\x03\xfb\x48\x5c\x78\x46\xea\xe0\xc7\xa6\xf8\xbe\xc5\xad\x42\
-\x48\x76\x8f\xb5\xc0\x1a\x58\x4f\x7e\x76\xf9\xc8\x3f\xeb\xa7\xd2\
-\xbe\xd8\xff\x00\x82\xb0\x7c\x17\xbb\xf8\x9d\xfb\x3a\xa6\xb9\xa5\
-\xd8\xc9\x79\xaa\x78\x4e\xf5\x75\x0f\x2e\xdd\x73\x29\xb4\x65\xf2\
-\xa7\x01\x70\x49\x03\x28\xe4\x8e\x81\x0f\x06\xbf\x27\x3f\x65\x3d\
-\x0f\xc4\x7a\xe7\xed\x15\xf0\xee\xdf\xc2\x71\x4d\x2e\xb5\x1e\xb5\
-\x67\x3c\x5f\x66\x00\x94\x54\x95\x5a\x49\x18\xe7\x01\x42\x6f\x2d\
-\x9e\xc3\x1d\x68\x03\xfa\x42\x5e\x82\x9d\x4c\x8f\xee\xd3\xe8\x00\
-\xa2\x8a\x28\x00\xaf\x8f\x7f\xe0\xaa\x7e\x3e\x6f\x04\xfe\xc7\x7e\
-\x25\xb5\x8c\x91\x3e\xbf\x75\x6b\xa3\xa3\x2b\xe0\x80\xd2\x79\xb2\
-\x71\xdc\x14\x85\x94\xfb\x35\x7d\x85\x5f\x28\xff\x00\xc1\x43\xbf\
-\x66\x5d\x7b\xf6\xa0\xf8\x27\x06\x93\xe1\x83\x1f\xfc\x24\xda\x35\
-\xf8\xd4\xac\xac\xee\x2e\x04\x51\x5d\x00\xac\x8d\x19\x38\xc0\x62\
-\xae\x0a\x96\xc2\x82\x30\xcc\x07\x34\x01\xf8\x41\xe1\x4f\x0d\xdd\
-\x78\xc3\xc4\x9a\x46\x87\x62\x54\xde\xea\x77\x90\xd9\xc0\x1f\x3b\
-\x4c\x92\x3a\xa2\x0f\xc5\x9b\xf4\xaf\xe9\xc3\xc1\xbe\x1a\xb4\xf0\
-\x6f\x84\xf4\x5d\x02\xc1\x04\x76\x5a\x4d\x94\x36\x10\x46\x3a\x04\
-\x89\x02\x01\xf9\x28\xfc\xab\xf2\x3f\xf6\x23\xff\x00\x82\x72\xfc\
-\x51\xd2\xbe\x3b\xf8\x7b\xc5\x9e\x3c\xf0\xe2\xf8\x63\xc3\x7e\x1d\
-\xbd\xfb\x5b\xad\xf5\xc4\x52\x4d\x75\x3c\x7c\x46\x91\xa4\x65\xbe\
-\x52\xe5\x5b\x79\xe3\x03\x86\x35\xfb\x11\x1a\x7c\xbf\x37\x5c\xe7\
-\xf5\xcd\x00\x4b\x45\x14\x50\x04\x4c\x58\x64\x93\xc6\x2b\xf9\xcb\
-\xfd\xb0\xbe\x2d\xc9\xf1\xa3\xf6\x94\xf1\xd7\x8a\x52\x6f\x36\xce\
-\x4d\x41\xed\xac\x18\x3e\x57\xec\xb0\xe2\x28\x71\xec\x55\x43\xff\
-\x00\xc0\xab\xf7\x6b\xf6\xad\xf8\x90\x7e\x13\x7e\xce\x7f\x11\x7c\
-\x54\x92\x34\x37\x56\x3a\x35\xc0\xb4\x75\x19\x2b\x71\x20\x11\x44\
-\x4f\xb0\x95\xd2\xbf\x9b\xa0\xc7\x70\xcf\x6e\xb4\x01\xf4\x4f\xc0\
-\x7f\xd8\x4f\xe2\xb7\xed\x1d\xe0\x59\x3c\x5b\xe0\xad\x37\x4f\xba\
-\xd2\x12\xfa\x4d\x3c\xbd\xd5\xfa\x5b\xb9\x91\x11\x18\x90\x1b\xaa\
-\xfc\xe3\x9f\x50\x6b\xeb\x0f\xd9\xf7\xfe\x08\xe5\xac\x5c\x6b\x36\
-\xfa\x8f\xc5\xcd\x6a\xd6\xcf\x4d\x84\x89\x0e\x87\xa1\x4a\x64\xb8\
-\xb8\xc1\xe8\xf3\xf0\xb1\xa9\xe7\xee\x65\x8f\xaa\xd7\xde\x5f\xb1\
-\x27\xc3\x95\xf8\x53\xfb\x2c\x7c\x39\xf0\xf8\x55\x17\x5f\xd9\x89\
-\x7b\x74\xc3\x0d\xfe\x91\x70\x5a\x79\x54\x91\xd4\xab\x3e\xce\xbd\
-\x14\x0a\xf7\x0e\x36\xfc\xdc\xe7\xf8\x79\x3f\xfe\xaa\x00\xcc\xf0\
-\x9f\x82\x74\x1f\x02\xf8\x6b\x4e\xf0\xf7\x87\xb4\xab\x7d\x1f\x45\
-\xd3\xe3\x10\xda\xd8\xda\x26\xc8\xe2\x51\xd8\x01\xef\xce\x7a\x92\
-\x72\x79\xe6\xb7\x29\x05\x2d\x00\x14\x51\x45\x00\x14\x51\x51\x79\
-\xbb\x57\x24\x9f\x5c\xe2\x80\x11\x99\xb1\xcb\x10\x7d\x55\x7a\xfe\
-\x1e\xd5\xe5\xbf\x19\x3f\x69\xff\x00\x86\xdf\x00\xed\x77\xf8\xe3\
-\xc5\xfa\x7e\x8b\x74\xc8\x5e\x2b\x06\x6f\x32\xee\x51\xea\xb0\x2e\
-\x5c\x8f\xf6\xb0\x07\xbd\x7c\x2f\xfb\x75\xff\x00\xc1\x4f\x1f\xc3\
-\x1a\x9e\xa3\xf0\xfb\xe0\xfd\xf4\x2d\x7d\x6a\xcd\x6f\xa9\xf8\xad\
-\x00\x91\x21\x7d\xd8\x68\xad\xb8\x2a\xc4\x74\x69\x31\x80\x78\x50\
-\xdd\x6b\xf2\xb3\x58\xd6\x35\x1f\x10\xea\x97\x7a\x8e\xab\x7f\x73\
-\x7d\xa8\x5c\xbe\xfb\x8b\xbb\xc9\x5a\x49\x65\x7f\xef\x3b\x31\x24\
-\x9f\xcc\xf1\x40\x1f\xb1\x1e\x2a\xff\x00\x82\xd0\x7c\x2b\xd2\x6e\
-\x65\x8b\x45\xf0\xc7\x89\xb5\xe1\x1f\x49\x9a\x38\x6d\x23\x73\xf4\
-\x77\x2f\xfa\x57\x2d\x65\xff\x00\x05\xb2\xf0\x93\x5c\x11\x79\xf0\
-\xbb\x57\x8a\x1d\xc7\xe6\x87\x53\x86\x47\xe7\xfd\x96\x55\xfa\x75\
-\xe9\xc5\x7e\x70\xf8\x17\xf6\x5c\xf8\xb3\xf1\x32\xd9\x2e\x7c\x2f\
-\xf0\xef\xc4\x5a\xbd\xa4\x85\x55\x2e\xa2\xb0\x91\x61\x62\x46\x73\
-\xe6\x30\x0b\x8f\x7c\xe2\xbb\x9d\x4b\xfe\x09\xed\xfb\x44\xe9\x76\
-\x7f\x68\x93\xe1\x66\xb3\x2c\x39\xce\xcb\x67\x8a\x67\xff\x00\xbe\
-\x11\xc9\xff\x00\xc7\x68\x03\xf4\xbb\xc1\xbf\xf0\x58\x0f\x82\x1e\
-\x21\x93\x66\xb1\x6b\xe2\x2f\x0b\xb6\xe0\x9e\x65\xe5\x8a\xcf\x17\
-\xd7\x74\x0e\xff\x00\xca\xbe\x99\xf8\x67\xfb\x4c\x7c\x2d\xf8\xc4\
-\xc9\x1f\x83\x7c\x7b\xa1\xeb\xb7\x4f\xc2\xd9\xc3\x76\xa9\x70\x7f\
-\xed\x83\xed\x93\xf4\xaf\xe7\x8f\xc6\xdf\x05\x7c\x7d\xf0\xe6\x46\
-\x5f\x14\xf8\x33\x5e\xf0\xf3\xaa\xef\x3f\xda\x5a\x74\xb0\xe1\x7f\
-\xbd\x96\x50\x00\xfa\x9a\xe3\x63\x63\x1c\x8a\xfb\x99\x48\x39\xdc\
-\x0f\x43\xf9\xff\x00\x51\x40\x1f\xd4\xc2\xc8\x64\x8f\x76\x31\x91\
-\xe9\xff\x00\xeb\x1f\x8e\x4d\x3c\xec\x8f\xfb\xa3\xe8\x40\xaf\xe6\
-\xe7\xc2\xbf\xb5\xb7\xc6\x8f\x04\xc7\x14\x3a\x47\xc5\x0f\x15\x5a\
-\x41\x12\xed\x8e\x07\xd4\xe5\x9a\x38\xd7\xd1\x51\xcb\x28\x1e\xc0\
-\x57\x77\x6b\xff\x00\x05\x1e\xfd\xa3\x6c\x70\x23\xf8\xa1\xa8\x38\
-\xfe\xec\xd6\x76\x8f\xfa\x98\xa8\x03\xf5\x93\xfe\x0a\x17\xf0\x1f\
-\xc3\xdf\x18\x3f\x66\xbf\x1a\x6a\x37\xfa\x7c\x07\x5e\xf0\xde\x97\
-\x3e\xb1\xa6\x6a\x61\x01\x9a\x2f\x21\x4c\xad\x1a\xb0\x39\x28\xc8\
-\x1d\x0a\x9e\x01\x7d\xc0\x0c\x0a\xfc\x09\xfb\x4c\xb1\xc9\xb9\x64\
-\x65\x65\x39\x52\x0f\x23\xe9\xe9\xd0\x7e\x55\xf4\x27\xc4\x4f\xdb\
-\xe3\xe3\xaf\xc5\x0f\x0c\xdf\xf8\x77\xc4\x3e\x3c\xba\x6d\x1a\xfa\
-\x03\x6f\x77\x69\x6d\x69\x0d\xb7\xda\x63\x3c\x32\xbb\x22\x06\x20\
-\x8e\x0f\x3c\x8e\x0f\x15\xe4\x3f\x0f\xfe\x1d\xeb\x1f\x13\xbc\x6b\
-\xa3\x78\x53\xc3\xd6\x12\x6a\x3a\xe6\xad\x3a\xdb\x5b\xc1\x1f\xcd\
-\x92\xdd\x5d\xb1\xf7\x55\x7e\xf1\x6e\x81\x41\x63\xc0\x34\x01\xfd\
-\x1f\xfc\x0d\xf1\x45\xc7\x8c\xbe\x0a\xfc\x3f\xf1\x05\xe7\xfc\x7e\
-\x6b\x1a\x05\x85\xfc\xa3\xb7\x99\x35\xb2\x48\xdf\xa9\x3f\x9d\x77\
-\x9f\x5a\xe5\xbe\x1b\x78\x3a\x1f\x87\xbf\x0e\xfc\x2d\xe1\x5b\x79\
-\x1a\xe2\x0d\x07\x4c\xb5\xd3\x12\x66\xfe\x35\x86\x25\x8b\x3f\x92\
-\xd7\x51\x21\xc0\xa0\x0c\x1f\x17\x78\xd3\x48\xf0\x17\x87\x75\x0f\
-\x10\x78\x8b\x55\xb5\xd1\x74\x4d\x3e\x2f\x3a\xe6\xf2\xf2\x40\x91\
-\xc6\x80\x81\x92\x4f\xae\x40\x00\x64\x92\xc0\x01\x93\xcf\xc6\x7e\
-\x2c\xff\x00\x82\xc1\x7c\x15\xf0\xfe\xaa\xf6\x7a\x6d\xb7\x89\x3c\
-\x45\x0a\xb3\x2b\x6a\x16\x56\x29\x14\x1f\x2f\x75\xf3\x1c\x39\x07\
-\xfd\xda\xf8\xe7\xfe\x0a\xcd\xfb\x44\x6a\x7f\x10\x3e\x39\x5c\xfc\
-\x38\xb5\xba\x99\x3c\x2d\xe1\x2d\x88\xd6\x8a\xe7\xcb\x9e\xf9\xe3\
-\x0e\xf2\xb2\xf7\x64\x12\x79\x60\x9e\x83\x7e\x31\x93\x5f\x26\xfc\
-\x27\xf8\x1d\xe3\x9f\x8e\x1a\xf7\xf6\x3f\x81\x7c\x33\x7d\xe2\x2b\
-\xd4\xc1\x94\xdb\x2e\xd8\xe0\x1b\xb1\x99\x25\x7c\x47\x1a\xfb\xb3\
-\x01\xef\x40\x1f\xb7\xbf\x0a\x7f\xe0\xa4\xff\x00\x03\x3e\x2c\xea\
-\x10\xe9\xd6\xde\x2b\xff\x00\x84\x7b\x52\x9b\x02\x3b\x7f\x10\x5b\
-\x9b\x45\x66\x3d\x84\x84\x94\x3f\x98\xaf\xa7\x61\xba\xf3\xe1\x8e\
-\x54\x75\x74\x75\x0c\x19\x48\x20\xfa\xf4\x27\xf3\xc9\x15\xf9\x69\
-\xf0\x3b\xfe\x08\xd1\x13\x43\x0d\xf7\xc5\x5f\x16\xe5\xd9\x56\x47\
-\xd0\xfc\x39\x8c\x2e\x73\xf2\xbd\xcc\x80\xfa\x75\x54\x03\xd1\x8d\
-\x7e\x8d\xfc\x25\xf8\x4f\xe1\xff\x00\x83\x1e\x09\xd3\xfc\x29\xe1\
-\x98\xae\xa2\xd1\xec\x01\x10\x25\xe5\xec\xb7\x6e\x33\xd4\xee\x91\
-\x89\x03\xfd\x95\xc0\xf6\xa0\x0e\xe1\x94\x6d\xe9\x5f\x95\xff\x00\
-\xf0\x57\x8f\xd9\xaf\x5c\xf1\x4f\x8d\xbc\x21\xe3\xef\x09\x78\x6b\
-\x52\xd7\xae\x6e\xed\x5f\x4b\xd4\xe2\xd2\x6c\x66\xb8\x7c\xc5\xf3\
-\xc3\x23\x84\x53\xc1\x56\x65\xcf\xfb\x02\xbf\x53\x5a\x55\x55\xcb\
-\x30\x51\xd7\x9e\x3f\x9d\x26\xdd\xd8\xea\x0e\x31\xc6\x45\x00\x7e\
-\x0d\xfe\xc3\x37\x5e\x32\xfd\x9c\x7f\x6a\x7f\x05\x6a\xbe\x21\xf0\
-\xe6\xb7\xe1\xfd\x23\x53\xb8\xfe\xc5\xbe\x9b\x51\xd3\x2e\x21\x8f\
-\xcb\xb8\x22\x34\x27\x72\xae\x3f\x7b\xe5\x9c\x9e\x38\xaf\xde\x85\
-\xce\xde\x6a\xb3\x2a\x48\xd8\x2b\x9c\x60\x80\x72\x3e\x9f\xe7\x35\
-\x6b\x8a\x00\x5a\x29\x03\x66\x96\x80\x23\xfb\x3c\x79\x27\x6e\x73\
-\x90\x7d\xf3\x5c\xfe\x83\xf0\xdf\xc2\x9e\x16\xbe\x9e\xf7\x45\xf0\
-\xce\x8f\xa4\x5e\x5c\x02\x26\xb8\xb1\xb1\x8a\x09\x24\x04\xe4\x86\
-\x65\x50\x48\x27\x93\x9e\xb5\xd2\x52\x6e\xe7\x14\x00\x00\x17\xa5\
-\x2d\x37\x70\xe3\x9a\x75\x00\x14\x51\x45\x00\x14\xcf\x25\x36\xed\
-\xdb\xf2\xe7\x38\x1e\xb4\xfa\x83\xce\x3b\x4f\xaa\xf5\xe3\x8f\xa7\
-\x19\xc5\x00\x49\xe5\x20\xfe\x1f\x5f\xd6\x9d\x51\x2c\x8c\xcb\xd3\
-\x1c\x7f\x91\xcf\x4f\xca\xa6\xa0\x02\x8a\x28\xa0\x0f\x86\x7f\xe0\
-\xaf\x9e\x2e\xff\x00\x84\x77\xf6\x4f\x3a\x52\xdc\x34\x53\x6b\x9a\
-\xd5\xa5\xaf\x96\xa7\x1b\xe3\x8f\x74\xcc\x0f\xb6\x63\x53\x5f\x88\
-\x2b\xce\x78\xeb\xc1\xe7\x15\xfa\xd9\xff\x00\x05\xb7\xd7\x52\xdf\
-\xc1\x7f\x0c\x74\x6c\xfe\xf2\x6b\xfb\xcb\xb2\xbe\xa1\x21\x48\xf3\
-\xff\x00\x91\x3f\x5a\xf8\x0f\xf6\x25\xf8\x6b\xa6\x7c\x5c\xfd\xa8\
-\xbc\x03\xe1\x6d\x6e\xc5\x75\x3d\x1a\xf2\xf1\x9a\xf2\xd1\xd9\x95\
-\x64\x89\x23\x67\x71\x95\x20\x8e\x17\xa8\x22\x80\x3c\xeb\xc2\x7f\
-\x14\xfc\x65\xe0\x7b\xf8\x2e\xfc\x3b\xe2\x8d\x63\x44\xb8\x84\xe6\
-\x39\x74\xfb\xf9\x22\x2a\x7e\xa1\xb1\x5f\x65\x7e\xcf\x7f\xf0\x56\
-\x4f\x89\xbf\x0d\xef\xec\xf4\xef\x88\x5b\x7e\x20\x78\x60\x00\x92\
-\x4d\x32\x2c\x3a\x94\x29\xd8\xa4\xaa\x02\xc9\xc7\x38\x90\x31\x6e\
-\xce\xb5\xf6\x3f\xc4\x2f\xf8\x24\x6f\xc1\x2f\x15\x59\x4e\x74\x11\
-\xac\xf8\x46\xfa\x4f\x9e\x3b\x8b\x1b\xd3\x71\x02\x9c\x74\x31\xcc\
-\x1b\x2b\xf4\x6c\xfb\xd7\xe5\x97\xed\x4f\xfb\x2c\x78\x8b\xf6\x54\
-\xf8\x8b\xff\x00\x08\xc6\xbd\x73\x6f\xa9\x5b\xcf\x07\xda\xf4\xdd\
-\x56\xcf\x2a\x97\x90\xef\x65\xc9\x43\xf3\x23\x06\x5d\xac\x84\x92\
-\xbd\x41\x65\xc1\xa0\x0f\xdf\xdf\x84\xdf\x17\x3c\x39\xf1\xa3\xc0\
-\xfa\x67\x8b\x7c\x29\xa9\xc7\xaa\x68\xba\x82\x06\x8e\x48\xc6\x1d\
-\x1b\xf8\xa3\x90\x7f\x03\xa9\xca\x95\x3e\xc7\xa1\x15\xdc\x57\xe3\
-\xa7\xfc\x11\xa7\xe2\xde\xa5\xa4\xfc\x5e\xf1\x1f\xc3\xb9\xae\x59\
-\xf4\x7d\x6b\x4f\x7d\x4a\x38\x59\xb8\x4b\xa8\x4a\x02\xea\x3d\x5e\
-\x26\x6c\xff\x00\xd7\x35\xaf\xd8\xba\x00\x28\xa2\x8a\x00\x2b\xe0\
-\xbf\xf8\x2a\x77\xed\x69\x71\xf0\x57\xe1\xdd\xbf\x80\xbc\x31\x78\
-\xd6\xfe\x2e\xf1\x54\x4f\xe6\xdd\x44\xdb\x65\xb2\xb1\x07\x0c\xea\
-\x47\x46\x90\xe5\x14\xfa\x2b\x91\xc8\x06\xbe\xf2\xdc\x46\x38\xc9\
-\xf6\xaf\xe7\x3f\xf6\xd0\xf8\xc1\x2f\xc6\xdf\xda\x63\xc7\x7e\x25\
-\x13\xb5\xc6\x9f\xf6\xe7\xb0\xd3\x97\x27\x6a\xda\x40\xc6\x28\xb0\
-\xbd\x89\x0b\xbf\x1e\xae\xde\xa6\x80\x3c\xa3\xc3\xfa\x1e\xa7\xe3\
-\x0d\x6b\x4f\xd1\xb4\x7b\x19\xb5\x0d\x52\xfe\x65\xb7\xb5\xb3\xb7\
-\x5f\xde\x4d\x23\x1d\xa0\x28\xf5\xe9\xf4\xe7\xb0\x35\xfb\x37\xfb\
-\x1b\x7f\xc1\x34\x7c\x25\xf0\x4f\x4d\xd3\xbc\x47\xf1\x0e\xce\xcf\
-\xc5\x5e\x3c\x91\x04\x82\x0b\x80\xb2\xd8\xe9\xc7\x8f\x96\x24\x23\
-\x12\x48\x30\x37\x4a\xc3\x1f\xdd\x03\xad\x78\x6f\xfc\x11\xc7\xf6\
-\x77\xb3\xd4\xa7\xd7\x7e\x2f\xeb\x36\xde\x7c\x96\x73\x1d\x2b\x44\
-\x59\x07\xcb\x1c\x85\x41\x9e\x71\x91\xd7\x91\x1a\x91\xd3\x32\xf7\
-\xc5\x7e\xae\x24\x21\x7a\xf3\xd3\xf4\xe9\x40\x11\xc3\x6b\x1c\x31\
-\x2c\x4b\x1a\xa4\x4a\x36\x84\x51\x85\x03\x18\xc0\x1e\x9e\xd5\x31\
-\x8d\x5b\xaa\x82\x7d\xc5\x3a\x8a\x00\xa7\x75\xa7\xdb\xdf\x5a\xcb\
-\x6d\x3c\x11\xcd\x6c\xeb\xb1\xa1\x91\x03\x23\x2f\xa1\x53\xc1\x1f\
-\x5a\xf0\x6f\x8a\x9f\xb0\x87\xc0\xdf\x8b\xd2\x4d\x36\xb7\xe0\x1d\
-\x3a\xdf\x50\x90\xef\x3a\x86\x90\x4d\x8d\xc1\x7f\x52\x62\x2a\x1b\
-\xfe\x05\x91\x5f\x42\x51\xb4\x50\x07\xe7\x96\xbd\xff\x00\x04\x57\
-\xf8\x51\x76\xac\xfa\x4f\x8c\x3c\x5d\xa6\x31\xed\x71\x2d\xbd\xca\
-\xaf\xfe\x41\x43\xfa\xd7\x17\x75\xff\x00\x04\x41\xd1\xd9\x7f\xd1\
-\xbe\x2d\xdf\xc5\xff\x00\x5d\x34\x14\x7f\xfd\x06\x71\x5f\xa8\x3b\
-\x47\x5c\x73\x46\x28\x03\xf2\xdf\x4d\xff\x00\x82\x23\x69\x91\xcc\
-\xad\xa9\xfc\x57\xba\x78\x01\xcb\x25\x9e\x88\xa8\xc4\x7f\xbe\xd2\
-\x90\xbf\x88\x35\xf6\x6f\xec\xdb\xfb\x19\xfc\x33\xfd\x97\xec\xdd\
-\xfc\x23\xa4\xcd\x36\xb3\x34\x7e\x55\xc6\xbb\xaa\xc8\xb3\xdd\xca\
-\x9d\xd4\x30\xf9\x63\x53\xc6\x42\x2a\x83\x81\x9c\xe0\x57\xbd\x6d\
-\x5c\xe7\x03\x3d\x33\x5c\xbf\xc4\x6f\x14\x1f\x03\xf8\x0b\xc4\xde\
-\x23\x8e\x15\x9a\x4d\x27\x4c\xb9\xbf\x54\x6e\x03\x98\xa1\x79\x36\
-\xb1\xeb\xfc\x18\xfc\x68\x03\xca\x3e\x3e\x7e\xdb\x9f\x09\x3f\x67\
-\x3d\x4a\x3d\x2f\xc5\xde\x23\xce\xb8\x42\xc8\x74\x7d\x36\xdd\xae\
-\x6e\x63\x43\xc6\xe7\x03\xe5\x40\x72\x7e\xfb\x0f\x60\x6a\x4f\x81\
-\xff\x00\xb6\xe7\xc2\x3f\xda\x22\xfb\xfb\x2f\xc2\x5e\x29\x45\xd7\
-\x76\x97\x1a\x46\xa5\x13\x5a\xdc\xba\x8e\xa5\x15\xc6\x1f\x03\xfb\
-\x85\x88\x1c\x91\x8a\xfe\x7c\xbc\x59\xe2\xcd\x57\xc7\x1e\x24\xd4\
-\xb5\xed\x6e\xf2\x4b\xfd\x5b\x51\xb8\x7b\xbb\x9b\xa9\x5b\x2c\xf2\
-\x37\x3b\x89\xaf\xd1\xaf\xf8\x26\x97\xec\x0a\xde\x28\x9f\x48\xf8\
-\xc1\xf1\x0a\x19\x63\xd2\x2d\x65\x8e\xef\xc3\x9a\x43\xb3\x29\xba\
-\x75\x6c\xad\xdb\xe0\x82\xb1\x87\xf9\xa3\x1f\xc6\x79\x3c\x01\xbc\
-\x03\xd2\x3c\x69\xff\x00\x04\xbf\xbd\xf8\xe1\xfb\x5d\x78\xf3\xc6\
-\xbe\x2f\xd5\x1b\x4b\xf0\x05\xe5\xfc\x77\x96\xf1\x59\x38\x37\x9a\
-\x88\x31\x21\x91\x06\x7f\xd4\xaa\xb0\x65\x2c\x7e\x63\xd0\x2f\x3b\
-\xeb\xef\x3f\x87\x3f\x0a\xfc\x27\xf0\x7f\xc2\xf6\xda\x07\x83\x74\
-\x1b\x1d\x03\x49\x83\x68\x5b\x7b\x48\xf6\x97\x23\xab\x3b\x72\xd2\
-\x3f\xfb\x4d\x93\xef\x5a\xfe\x24\xf1\x16\x9b\xe0\xed\x17\x50\xd7\
-\x35\x7b\xdb\x7d\x3b\x49\xb3\x8c\xcf\x73\x79\x74\xc1\x23\x89\x17\
-\xab\x3b\x1f\xe1\x1d\xbb\xfb\x1a\xfc\x93\xfd\xb2\x7f\xe0\xaa\xba\
-\xf7\x8e\xae\x2f\xbc\x2b\xf0\x7a\x7b\x9f\x0f\xf8\x64\xe6\xde\x6f\
-\x12\x85\x31\xdf\x5f\x0f\xfa\x62\x7a\xc0\x84\x7f\x17\xfa\xc3\xd7\
-\xe4\xfb\xb4\x01\xfa\x11\xf1\xff\x00\xf6\xd8\xf8\x4d\xfb\x38\x07\
-\xb4\xf1\x3f\x88\xe3\xbb\xd7\x82\x12\x9a\x16\x98\x45\xcd\xe1\x3d\
-\xb7\x20\xf9\x63\x1e\xee\x41\x3d\xb7\x57\xc0\x7f\x15\xff\x00\xe0\
-\xb4\x5e\x30\xd5\x9a\x7b\x5f\x87\xfe\x0c\xd3\x74\x1b\x56\x3b\x52\
-\xf3\x5d\x76\xbb\xb8\x2b\x8f\xbd\xe5\xa9\x48\xd4\xfb\x65\x85\x7e\
-\x73\xdc\x5d\x5c\xea\x13\x4d\x3d\xcc\xf2\xdc\xcd\x33\xef\x76\x91\
-\xcb\x34\x8e\x7a\xb3\x13\x9d\xcd\xf5\x39\xaf\xa5\xfe\x0a\xff\x00\
-\xc1\x38\x7e\x36\xfc\x6c\x86\xde\xf2\xcf\xc3\xcb\xe1\x7d\x1a\x71\
-\x95\xd4\xbc\x49\x23\x59\xab\x2f\xaa\xc7\xb4\xca\xdf\x51\x19\x1e\
-\xf4\x01\x87\xe2\xef\xf8\x28\x67\xed\x0d\xe3\x0b\x8f\x36\xe7\xe2\
-\x7e\xad\x62\x3a\x2a\x69\x2b\x15\x8a\x81\xff\x00\x6c\x51\x33\x5c\
-\x64\xdf\xb5\x97\xc6\x89\xe4\x67\x93\xe2\xa7\x8c\x19\x98\xe4\xff\
-\x00\xc4\xe2\x7f\xfe\x2a\xbf\x42\xfc\x0d\xff\x00\x04\x4d\xd2\x22\
-\xb5\x69\x3c\x5f\xf1\x36\xfa\xee\x76\x5c\x79\x1a\x26\x9e\x90\xaa\
-\x37\xa6\xf9\x99\xf7\x7f\xdf\x2b\x5e\x8d\x6b\xff\x00\x04\x65\xf8\
-\x2f\x0d\xae\xc9\x75\xff\x00\x16\xdc\x4d\xff\x00\x3d\x5a\xf2\x05\
-\xfd\x04\x58\xa0\x0f\xcc\xdf\x0f\xfe\xdd\x9f\x1f\x7c\x37\x75\x1c\
-\xd6\x9f\x15\xbc\x49\x33\x27\xdd\x8e\xf6\xef\xed\x51\xff\x00\xdf\
-\x12\x86\x53\xf9\x57\xd0\xdf\x0c\x7f\xe0\xb2\x3f\x17\xbc\x31\x24\
-\x51\x78\xbf\x49\xd0\xfc\x6f\x64\xbf\xeb\x25\xf2\x7e\xc1\x74\xdf\
-\xf0\x38\xbf\x77\xff\x00\x90\xab\xdf\xfc\x51\xff\x00\x04\x4f\xf0\
-\x4d\xd5\xac\x89\xe1\xef\x88\xda\xf6\x97\x75\xd5\x4e\xa5\x69\x05\
-\xda\x01\xfe\xea\x79\x67\xf5\xaf\x97\x7e\x30\x7f\xc1\x25\xfe\x33\
-\xfc\x39\x49\x6e\xfc\x3f\x16\x9d\xe3\xfd\x39\x72\x57\xfb\x1a\x5d\
-\x97\x7b\x7d\x4c\x12\x6d\x24\xfb\x21\x7a\x00\xfd\x0d\xf8\x0f\xff\
-\x00\x05\x3b\xf8\x39\xf1\xa2\x78\x74\xeb\xcd\x4e\x4f\x03\xeb\xb2\
-\x60\x2d\x8e\xbc\x55\x22\x95\xbd\x12\xe0\x1f\x2c\xff\x00\xc0\x8a\
-\xd7\xd6\xdf\x69\x2e\xc3\x61\x56\x53\x8c\x60\x8f\xe7\xcf\xf2\x1f\
-\x5a\xfe\x5e\x35\x6d\x13\x50\xf0\xce\xab\x3e\x9f\xab\x59\x5c\x69\
-\x97\xd6\xed\x89\x6d\x6e\xe2\x68\xa5\x8d\x87\x66\x43\x86\x1f\xa7\
-\xd6\xbe\xa1\xfd\x92\xff\x00\xe0\xa2\x1f\x10\x7f\x66\xdb\x8b\x5d\
-\x1a\xf6\xe2\x6f\x16\xf8\x0d\x4f\x96\xda\x3d\xec\xa5\xa4\xb4\x4f\
-\x5b\x59\x5b\xfd\x5f\x1f\xc2\x72\x9e\xc2\x80\x3f\x7b\x77\x6e\xe9\
-\x5f\x15\x7e\xdf\xdf\xb7\xfd\xdf\xec\x9f\x77\xa2\x78\x73\xc2\xfa\
-\x25\xae\xb1\xe2\xfd\x52\xd7\xed\xe5\xf5\x30\xe6\xd2\xd6\xdf\x7b\
-\x22\x12\xa8\x54\xbb\x33\x23\x8c\x07\x18\xd9\xcf\x51\x5f\x48\x7c\
-\x17\xf8\xe9\xe1\x1f\x8f\x5e\x07\xb6\xf1\x57\x83\x75\x44\xd4\x34\
-\xc9\x0e\xc9\x11\xbe\x49\xed\xa4\x18\x26\x29\x90\xe4\xab\x8e\xfd\
-\xbd\x09\x1c\xd7\xcd\x1f\xf0\x51\x8f\xd8\x85\xbf\x69\x6f\x0f\xc3\
-\xe2\xcf\x0b\x17\x5f\x1e\xe8\x96\xbe\x44\x16\x8e\xe0\x45\xa9\x5b\
-\x87\x66\x30\x73\xc2\xcb\xb9\xc9\x56\xe8\x4f\x0d\x9c\xa9\x50\x0b\
-\x7f\xb0\x4f\xed\xe9\x71\xfb\x57\x36\xaf\xe1\xdf\x12\x69\x36\x5a\
-\x27\x8c\x74\xab\x74\xbc\xff\x00\x89\x7b\x38\xb7\xbd\x80\xb0\x56\
-\x28\x8e\x4b\x23\x2b\x10\x18\x65\xba\xf1\x5f\x69\xd7\xe2\x6f\xfc\
-\x12\x1d\x27\xd0\xff\x00\x6b\xcd\x5b\x4d\xba\x8a\x6b\x5b\x9f\xf8\
-\x47\x6f\xed\xe6\xb7\x98\x15\x65\x75\x9a\x02\x51\xd4\xf2\x08\x2a\
-\x72\x0f\x20\x8a\xfd\xb1\x5e\x82\x80\x16\x8a\x28\xa0\x04\x35\xf8\
-\xd7\xff\x00\x05\x36\xfd\xaf\x3e\x26\x68\xff\x00\xb4\x86\xb1\xe0\
-\x2f\x0d\xf8\xa7\x54\xf0\xae\x83\xe1\xb8\xed\x51\x63\xd1\xee\x9e\
-\xdd\xee\xa5\x96\xde\x39\xcc\x92\x3a\x10\xc7\xfd\x68\x4c\x67\x1f\
-\x26\x71\x92\x6b\xf6\x52\xbf\x00\x3f\xe0\xa7\x3b\x93\xf6\xe2\xf8\
-\x99\xc1\x55\x69\x34\xfe\xbd\xff\x00\xe2\x5d\x6c\x33\xf9\xe6\x80\
-\x3f\x45\xbf\xe0\x95\x3f\xb4\x87\x8b\xbe\x3b\x7c\x2d\xf1\x2e\x93\
-\xe3\x3d\x42\x7d\x73\x55\xf0\xbd\xdc\x10\xc5\xac\x5c\xfc\xd3\xcb\
-\x04\xea\xe5\x63\x91\xbf\x8d\xd0\xc4\xdf\x31\xea\xac\xb9\xce\x0d\
-\x7d\xd5\x5f\x96\x3f\xf0\x43\xd9\x3c\xdb\x2f\x8c\x91\x37\xcc\xa9\
-\x26\x8e\xc3\x3f\xed\x0b\xc1\xc7\xe0\x3f\x5a\xfd\x4e\xa0\x02\x8a\
-\x28\xa0\x0f\xc9\x8f\xf8\x2e\x14\xe7\xfe\x12\x2f\x84\xb1\x76\xfb\
-\x26\xa4\x7f\xf2\x25\xb7\xf8\x0a\xf9\xe7\xfe\x09\x57\x18\x7f\xdb\
-\x63\xc1\x84\x8c\xf9\x76\xba\x93\x7e\x3f\x62\x98\x57\xd1\x7f\xf0\
-\x5c\x0b\x67\xfe\xd8\xf8\x49\x3e\xcc\xaf\xd9\xf5\x38\xcc\x9e\xe5\
-\xed\x88\x1f\x90\x35\xf3\x87\xfc\x12\xc6\xe5\x6d\x7f\x6d\xaf\x03\
-\xef\x38\x12\xdb\xea\x08\x3e\xa6\xce\x6c\x0a\x00\xfd\xee\x31\x23\
-\x63\x2a\x0e\x0e\x46\x7b\x57\xe3\xb7\xfc\x16\xc2\xe5\xcf\xc6\xbf\
-\x00\xdb\x67\xf7\x49\xe1\xe7\x91\x57\xb0\x26\xe6\x50\x71\xf8\x2a\
-\xfe\x55\xfb\x16\x2b\xf1\xfb\xfe\x0b\x69\xa5\xcb\x0f\xc5\xaf\x87\
-\x1a\x91\x1f\xbb\xba\xd1\x27\xb5\x53\xdb\x31\xdc\x6e\x3f\xfa\x34\
-\x50\x07\x9f\x7f\xc1\x1e\xed\xd2\xe3\xf6\xb8\x2e\xe0\x33\x43\xe1\
-\xfb\xe9\x11\x88\xe4\x1d\xd0\x2e\x7f\x22\x47\xe3\x5f\xb8\x75\xf8\
-\x65\xff\x00\x04\x8b\xd5\xa1\xd3\x7f\x6b\xfb\x08\x19\xd1\x1f\x50\
-\xd1\x6f\xad\x63\x56\x3c\xbb\x05\x49\x48\x1e\xfb\x62\x27\xe8\xa6\
-\xbf\x73\x28\x01\x68\xa2\x8a\x00\xc2\xf1\x96\xa1\x26\x93\xe1\x1d\
-\x6a\xfe\x26\x2b\x25\xbd\x9c\xd3\xae\x3a\xe5\x63\x66\x1f\xa8\x15\
-\xfc\xbf\xdd\xde\xc9\x7f\x7f\x2d\xcc\x8d\x99\x26\x90\xbb\x31\xeb\
-\xb8\x9c\x93\xf9\x9a\xfe\xa2\xb5\xcd\x35\x75\x7d\x26\xf2\xc2\x56\
-\x3e\x55\xd4\x32\x40\xdc\x7f\x7d\x76\xfe\x80\xd7\xf3\x0d\xe2\xef\
-\x0f\xcb\xe1\x5f\x15\x6a\xda\x45\xc4\x6c\x93\xe9\xf7\x93\x5a\xc8\
-\x92\x0c\x32\xb4\x6e\xc8\x43\x7a\x1f\x97\xf5\xa0\x0f\xde\xcf\xf8\
-\x26\xde\x81\x6f\xa0\xfe\xc6\x7f\x0d\xc4\x23\xe6\xba\xb6\xb8\xbd\
-\x91\xb9\x24\xbc\x97\x32\x12\x79\xaf\xa8\x2b\xe3\x7f\xf8\x25\x7f\
-\xc4\xcb\x5f\x1c\x7e\xc9\x3a\x06\x96\x93\x46\xd7\xde\x19\xb8\x9f\
-\x4a\xba\x85\x7e\xf4\x7f\x39\x96\x32\x47\xa1\x59\x06\x0f\x72\x0e\
-\x3a\x1a\xfb\x22\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\
-\x80\x0a\xe4\xbe\x28\x78\x6e\x6f\x18\x7c\x39\xf1\x5e\x81\x6d\x85\
-\x9f\x55\xd2\x6e\xec\x63\xdd\xd3\x74\xb0\x3a\x0c\xfe\x2c\x2b\xad\
-\xa6\xf9\x6b\xe9\xdf\x3f\xae\x68\x03\xf0\x67\xfe\x09\xf7\xfb\x1d\
-\xcb\xfb\x46\x7c\x64\x69\x7c\x45\x69\x22\x78\x2f\xc2\xf3\x2b\xeb\
-\x01\x83\x2f\xda\x65\x0d\x88\xec\xc1\x18\x2a\xcc\x43\x33\xe0\x82\
-\xa8\xa7\x18\x62\x0d\x7e\xe7\xce\xfa\x6f\x85\xf4\x96\x77\xfb\x3e\
-\x9b\xa5\xd8\xc3\xb9\xb3\xb6\x28\x2d\xa2\x44\x3d\x4f\x44\x40\xaa\
-\x73\xd8\x62\xb1\x7c\x03\xf0\xbf\xc3\x7f\x0b\xe1\xd6\x62\xf0\xde\
-\x9b\x1e\x9c\xba\xc6\xa9\x71\xac\x5e\x79\x7f\xf2\xd6\xea\x66\xdd\
-\x23\x1c\x9e\xe7\xa0\x1c\x0e\x80\x01\x5f\x9f\x1f\xf0\x57\x2f\xda\
-\xba\x4d\x0f\x4d\xb6\xf8\x2f\xe1\x9b\xa2\x97\x7a\x84\x4b\x7d\xe2\
-\x19\xa2\x6e\x52\xdc\x9c\xc3\x6d\xff\x00\x03\x3f\x3b\x2f\xf7\x76\
-\x03\xc3\x9a\x00\xf9\x77\xfe\x0a\x01\xfb\x71\x6a\x1f\xb4\xb7\x8b\
-\x2e\x3c\x33\xe1\xab\x99\x6c\xfe\x19\xe9\x92\x96\x82\x15\x25\x5b\
-\x53\x95\x5b\x02\xe6\x61\xdd\x73\xc4\x68\x7e\xea\xf3\x8c\x9a\xf0\
-\x3f\x81\xdf\x00\xfc\x67\xfb\x44\x78\xda\xdf\xc3\x1e\x0d\xd3\x9a\
-\xfe\xed\x97\xcc\xb8\xba\x90\x14\xb5\xb5\x84\x1e\x65\x9a\x4f\xe1\
-\x4c\xf4\xee\xc7\x8c\x66\xb1\xfe\x14\xfc\x30\xd7\xfe\x32\xfc\x41\
-\xd1\xbc\x1d\xe1\x9b\x67\xbe\xd6\xf5\x69\x84\x50\xc6\xc7\xe5\x45\
-\xea\xf2\x39\x1f\x75\x15\x77\x33\x1f\xee\xa9\x3e\xc7\xfa\x05\xfd\
-\x96\x7f\x66\xdf\x0d\xfe\xcc\x7f\x0c\xad\x3c\x2f\xa1\xc2\x24\xbe\
-\x21\x65\xd4\xf5\x62\xb8\x9a\xfe\xe3\xa1\x91\x8f\xf7\x01\xca\xa2\
-\xf4\x0a\x07\xbd\x00\x79\xa7\xec\xa7\xff\x00\x04\xf1\xf8\x73\xfb\
-\x36\xd9\xdb\x6a\x77\x96\x90\xf8\xb7\xc6\xe8\xaa\xef\xae\x6a\x50\
-\x82\xb0\x37\xa5\xb4\x27\x22\x21\xfe\xd1\xcb\xfb\xd7\xd6\x8b\x1a\
-\xaf\x41\x8f\x5f\x7a\x4f\x25\x00\xc0\x5d\xa3\x39\xf9\x78\xaa\x57\
-\x1a\xa4\x56\x76\x33\x5d\xdc\xcd\x1c\x16\xf0\xa3\x49\x24\xd2\xb8\
-\x8d\x15\x54\x1c\xb3\x16\xe1\x40\xc7\x39\x3c\x77\xa0\x0b\xde\x5a\
-\x8e\x83\x1d\xb1\xda\x97\x15\xf1\xbf\xc6\x0f\xf8\x2a\xb7\xc1\x2f\
-\x85\x77\xf2\xe9\xd6\x1a\x85\xf7\x8e\xb5\x18\x9b\x63\xc7\xe1\xd8\
-\x16\x48\x51\xbf\xeb\xbb\xb2\xa3\x7f\xc0\x09\xaf\x02\xba\xff\x00\
-\x82\xe1\x59\x47\x74\xc9\x17\xc1\xfb\x96\x84\x1c\x6e\x97\xc4\x2a\
-\x8f\xff\x00\x7c\xfd\x98\xff\x00\x3a\x00\xfd\x44\xf2\xd4\xf1\x8e\
-\x31\x8c\x76\xa4\xf2\x50\x82\x36\x8c\x37\x51\xeb\xf5\xf5\xaf\x83\
-\x3e\x19\xff\x00\xc1\x62\x3e\x12\x78\xbe\xe6\x1b\x5f\x13\xe9\x5a\
-\xe7\x82\x67\x7c\x06\x9e\x78\x96\xee\xd5\x0e\xec\x63\x7c\x59\x7f\
-\xce\x31\x5f\x67\xf8\x33\xc7\xfa\x27\xc4\x2f\x0e\xda\x6b\xbe\x1b\
-\xd6\x2c\x75\xcd\x1e\xe7\x3e\x55\xf5\x84\xeb\x2c\x4d\x8e\xa3\x70\
-\xfe\x21\xdc\x10\x31\xce\x7a\x50\x07\x9f\x7e\xd0\xdf\xb2\x7f\xc3\
-\x7f\xda\x5b\x41\x7b\x3f\x19\x68\x91\x36\xa0\x88\x45\xb6\xb7\x6a\
-\x44\x57\xf6\xc7\xb1\x49\x7b\xaf\xfb\x0f\x95\xf6\xaf\xc5\x6f\xda\
-\xeb\xf6\x20\xf1\xa7\xec\xa3\xaf\xa4\x9a\x82\xb6\xb9\xe0\xeb\xb9\
-\x0c\x7a\x7f\x88\xe0\x8c\x88\xdd\xb0\x4a\xc1\x32\x75\x8a\x5d\xa0\
-\x9d\xa4\xe1\x80\x3b\x49\x2a\x40\xfe\x83\x84\x63\x93\x8c\x36\x72\
-\x48\xef\x5c\xff\x00\x8f\x3c\x03\xe1\xff\x00\x89\x5e\x10\xd5\x7c\
-\x33\xe2\x5d\x32\xdf\x56\xd0\xf5\x38\x4c\x17\x76\x77\x2b\x94\x91\
-\x4e\x08\xf7\x04\x10\x0a\xb0\xc1\x52\x01\x52\x08\x06\x80\x3f\x9e\
-\x6f\xd9\x8f\xf6\x96\xf1\x57\xec\xc3\xf1\x26\xcb\xc4\xbe\x1d\xb8\
-\x2d\x67\x26\xc4\xd5\x34\x99\x9c\x88\x6f\xed\x87\xfc\xb3\x6f\x46\
-\xc7\x28\xe3\x1b\x58\x83\xf7\x72\x2b\xf7\xe7\xe0\xcf\xc5\xcf\x0e\
-\xfc\x7a\xf8\x6b\xa3\x78\xcf\xc3\x53\xc7\x75\xa5\x6a\x51\x6f\xda\
-\x48\x2f\x6f\x20\x00\x49\x0c\xa3\xf8\x5d\x4e\x54\x8f\x60\x7a\x11\
-\x5f\x84\xdf\xb6\x97\xec\xa3\xac\x7e\xca\x3f\x14\x66\xd1\x64\x79\
-\x2f\x3c\x2f\xa9\x79\x97\x7a\x26\xa4\xe3\x99\xe2\xcf\x31\xbf\xfd\
-\x34\x8c\xb0\x53\xeb\xb8\x11\xc3\x71\xe9\xbf\xf0\x4c\x7f\xda\xa6\
-\x6f\x81\x3f\x17\xa1\xf0\x9e\xb1\x7b\xb7\xc1\x7e\x2c\x99\x2d\xe7\
-\x59\x8e\x12\xce\xf0\x92\xb0\x4e\x0f\x60\x49\x08\xfd\x88\x65\x27\
-\xee\x70\x01\xfa\x77\x77\xfb\x29\xe9\xfa\x2f\xed\x79\xa1\x7c\x6a\
-\xf0\xda\x43\x63\x35\xd5\x9d\xdd\x8f\x88\xad\x15\x82\x09\xd9\xe2\
-\x02\x2b\xa5\x00\x60\xbe\x40\x0f\xea\x4a\x9e\xbb\x89\xfa\x4e\xab\
-\xa8\x56\x62\x18\x7c\xde\x9e\x9d\xc0\xfa\xd5\x9a\x00\x28\xa2\x8a\
-\x00\x2b\xf0\x93\xfe\x0a\xcd\xa1\xff\x00\x64\xfe\xd9\x5a\xf5\xdb\
-\x0f\x97\x53\xd2\xec\x2f\x07\xbf\xee\xbc\xaf\xfd\xa4\x6b\xf7\x6e\
-\xbf\x3b\xff\x00\xe0\xa4\x9f\xb0\x77\x8b\xbf\x68\x9f\x14\xe8\xbe\
-\x3a\xf0\x18\xb6\xbe\xd6\x6d\xac\x46\x9f\x7f\xa5\xdd\x5c\x08\x1a\
-\x48\x91\x9d\xe3\x92\x36\x3f\x26\x54\xc8\xea\xca\x4f\x39\x5c\x50\
-\x07\x8d\xff\x00\xc1\x11\x7c\x41\xf6\x7f\x1f\x7c\x4e\xd0\xb7\x81\
-\xf6\xcd\x32\xce\xf8\x2f\xb4\x52\xba\x1f\xfd\x1d\xfa\xd7\xeb\xa5\
-\x7c\x07\xff\x00\x04\xd4\xfd\x86\xfc\x4f\xfb\x35\xea\xde\x26\xf1\
-\x87\x8d\xa6\xb7\xb6\xd7\xb5\x4b\x45\xd3\x6d\xb4\xcb\x49\xc4\xab\
-\x0d\xb9\x91\x64\x77\x95\x80\xc1\x66\x64\x40\xa1\x7a\x05\x6c\xfd\
-\xe1\x8f\xbf\x28\x00\xa2\x8a\x28\x03\xf3\x4f\xfe\x0b\x63\xa3\xfd\
-\xa3\xe1\x8f\xc3\x9d\x5c\x46\x4f\xd9\x75\x8b\x8b\x52\xfe\x9e\x64\
-\x01\xc7\xeb\x1d\x7c\x03\xfb\x07\xf8\x80\x78\x6f\xf6\xbe\xf8\x59\
-\x7a\x64\xf2\x12\x4d\x6a\x3b\x57\x6c\xe0\x05\x98\x34\x47\xff\x00\
-\x43\xc5\x7e\xae\xff\x00\xc1\x57\xbc\x1f\x27\x8a\xff\x00\x63\xbd\
-\x7a\xf2\x24\x56\x7d\x0b\x51\xb3\xd4\x4e\xec\x67\x67\x9b\xe4\xb6\
-\x3e\x9e\x77\xe4\x2b\xf1\x13\xc1\x3e\x24\x97\xc1\xfe\x34\xd0\x75\
-\xe8\x97\x7c\x9a\x55\xf4\x17\xca\x14\xe3\x26\x39\x04\x9f\xd2\x80\
-\x3f\xa8\x58\xcf\x15\xf9\xfd\xff\x00\x05\x86\xf8\x2d\x75\xe3\xcf\
-\x82\x7a\x17\x8d\xf4\xe8\x64\x9e\xe3\xc1\xf7\x72\x7d\xad\x50\x1e\
-\x2c\xee\x76\x23\xbf\x4f\xe0\x91\x22\x24\xf4\x0a\x58\x9e\x2b\xef\
-\x3d\x0f\x54\x8b\x5b\xd1\xec\x75\x1b\x67\xdf\x05\xe4\x11\xdc\x46\
-\xc3\xa1\x47\x50\xc0\x83\xf4\x22\x9b\xae\x78\x7e\xc3\xc4\x9a\x5d\
-\xee\x9b\xa9\x59\xc5\x7d\x61\x79\x0b\xdb\xdc\x5b\xce\xbb\x92\x58\
-\xdd\x76\xba\x10\x7a\x82\x0e\x08\xef\x40\x1f\xcd\x0f\xc2\x5f\x89\
-\x5a\xbf\xc1\xaf\x89\x1e\x1d\xf1\xae\x82\xcb\x1e\xab\xa2\x5d\xa5\
-\xd4\x26\x4f\xb9\x26\x32\x0a\x37\x7d\xae\x84\xa9\xf6\x26\xbf\xa0\
-\xef\xd9\xab\xf6\x9a\xf0\x97\xed\x37\xf0\xf6\xd7\xc4\xde\x18\xbb\
-\x09\x3a\xaa\xc7\xa9\x69\x32\xb0\xfb\x46\x9f\x39\x5c\x94\x75\xfe\
-\xe9\xea\xaf\xd1\x87\xa1\xc8\x1f\x90\x7f\xb7\x77\xec\x1b\xac\xfe\
-\xcc\x7e\x24\xba\xf1\x0e\x81\x0d\xc6\xab\xf0\xd2\xfa\xe3\x16\xf7\
-\xbc\xb3\xe9\x8c\xc7\x2b\x6f\x70\x7d\x3b\x24\x87\x82\x38\x3f\x37\
-\x15\xe0\x1f\x04\xfe\x36\xf8\xc3\xe0\x1f\x8e\xed\x7c\x57\xe0\xdd\
-\x4a\x4b\x1d\x4a\x10\x16\x58\xd8\x6f\x82\xea\x33\xc9\x8a\x68\xff\
-\x00\x8d\x1b\x8f\x70\x46\x46\x0f\x34\x01\xfd\x2e\xd2\xd7\xcf\x3f\
-\xb1\xff\x00\xed\x7d\xe1\xcf\xda\xc3\xc0\x23\x54\xd3\xb1\xa5\xf8\
-\x92\xc4\x08\xb5\x7d\x10\x9d\xcd\x6f\x21\xe8\xe9\x9e\x5e\x26\xc1\
-\xda\xdd\x88\x20\xf3\xd7\xe8\x55\x6d\xc3\x8a\x00\x36\x83\x5f\x88\
-\xbf\xf0\x55\x6f\xd9\xa6\xf7\xe1\x77\xc6\xeb\xcf\x1f\xe9\xb6\xe7\
-\xfe\x11\x2f\x17\xca\xd7\x26\x45\x1c\x5b\x6a\x1b\x7f\x7f\x13\x13\
-\xdd\xf6\x99\x57\xd7\x73\xa8\xfb\xb5\xfb\x77\x5c\x77\xc4\xef\x85\
-\xde\x1b\xf8\xbd\xe0\x9d\x4f\xc2\x7e\x2b\xd2\xe2\xd5\xf4\x2d\x42\
-\x3f\x2e\x6b\x69\x7a\xa9\xce\x43\xa9\x04\x14\x60\x7a\x32\x90\x47\
-\x62\x28\x03\xf0\x03\xf6\x57\xfd\xaa\xbc\x55\xfb\x29\xf8\xf1\xb5\
-\xdf\x0e\xac\x77\xd6\x17\x91\xac\x3a\xa6\x91\x74\x58\x43\x77\x08\
-\x39\x19\xe7\x28\xea\x49\xd9\x20\xe9\x9c\x1e\x09\x07\xf6\x1f\xf6\
-\x77\xff\x00\x82\x8b\xfc\x23\xf8\xfc\xb6\xd6\x4b\xac\x8f\x09\xf8\
-\x92\x50\x03\x68\xda\xf3\xac\x2c\xcf\xc7\x11\x4d\xfe\xae\x5e\xbd\
-\x01\x0f\xc7\xdc\xaf\xcf\x0f\xda\x73\xfe\x09\x5b\xf1\x03\xe1\x4d\
-\xc5\xee\xad\xf0\xfd\x65\xf1\xff\x00\x84\x63\xdd\x22\xc5\x0a\x81\
-\xa9\xda\xa8\x19\x22\x48\x80\x1e\x6f\xa6\xe8\xb9\xf5\x51\x5f\x10\
-\xdf\x69\xb7\x7a\x6d\xe4\xb6\x97\x96\xf2\x5b\x5d\xc2\x7c\xa9\x20\
-\x99\x0a\xbc\x6c\x3f\x84\xa9\xe5\x5b\x83\xc1\x02\x80\x3f\xa8\xe8\
-\xae\xd6\x65\x57\x8d\x84\xa8\xc3\x21\xe3\x1b\x94\xfd\x08\xe3\xf5\
-\xa7\xb4\x85\x73\xeb\xf4\xcf\xe9\x5f\xcc\x65\x8f\xc5\xcf\x1c\xe9\
-\x3a\x72\xd8\xd8\xf8\xc7\xc4\x16\x76\x4a\x30\x2d\xa0\xd5\x2e\x12\
-\x20\x3d\x94\x3e\x2a\x35\xf8\xa9\xe3\x68\xe4\xf3\x17\xc5\xba\xea\
-\xc9\xfd\xe1\xa9\xdc\x03\xf9\xef\xa0\x0f\xe9\xd4\xdc\x6d\x24\x12\
-\x32\x00\x24\x71\xfe\x7f\x9d\x4d\x91\xeb\x5f\xcf\xc7\xc1\x5f\xf8\
-\x28\x97\xc6\xff\x00\x83\x77\xd6\xa2\x2f\x16\xdd\x78\xa3\x47\x88\
-\xfc\xfa\x5f\x88\x9d\xae\xe2\x65\xf4\x57\x3f\xbc\x4f\xf8\x0b\x0a\
-\xfd\x93\xfd\x95\xff\x00\x6a\xbf\x0b\xfe\xd5\x7f\x0f\xd7\xc4\x3a\
-\x02\x9b\x0d\x4e\xd9\xd6\x0d\x53\x43\x9e\x50\xd3\x58\xca\x41\x23\
-\xe6\x1c\x3a\x30\x19\x49\x06\x03\x60\x82\x15\x83\x28\x00\xf7\x5a\
-\x28\xa2\x80\x0a\x28\xa2\x80\x39\xdf\x1c\x78\xb2\xc3\xc0\x7e\x0f\
-\xd7\x7c\x49\xaa\xca\x2d\xb4\xbd\x1e\xca\x7b\xfb\x97\xc7\x48\xa3\
-\x8c\xbb\x1f\xae\x01\xfc\x6b\xf9\xb0\xf8\xb5\xf1\x2b\x55\xf8\xb9\
-\xf1\x23\xc4\x7e\x32\xd6\x1c\xbe\xa3\xad\xdf\x49\x77\x26\xe2\x08\
-\x40\xc7\x2a\x83\xd0\x2a\x95\x51\x8e\x81\x6b\xf6\x97\xfe\x0a\xbd\
-\xf1\x0a\x5f\x03\xfe\xc8\x3a\xdd\x85\xac\x86\x2b\x9f\x11\xea\x16\
-\xba\x46\xe5\x6c\x30\x8c\xb1\x9e\x5f\xc0\xac\x25\x4f\xfb\xf5\xf8\
-\x87\xe0\xdf\x0b\x5d\xf8\xeb\xc5\xda\x17\x87\x6c\x48\xfb\x6e\xaf\
-\x7d\x05\x84\x1b\x87\x1e\x64\xd2\x2a\x27\xfe\x3c\xdf\xa5\x00\x7e\
-\xb8\xff\x00\xc1\x21\x7f\x66\xc8\x3c\x1f\xf0\xde\xef\xe2\xbe\xaf\
-\x6c\x0e\xb7\xe2\x5d\xd6\xba\x6f\x98\xbf\x34\x36\x08\xd8\x66\x1e\
-\x9e\x63\xae\x7f\xdd\x8d\x3d\x6b\xf4\x4d\x62\x4d\xa7\xe5\xea\x72\
-\x7d\xfe\xbe\xb5\x81\xe0\x7f\x07\xd8\x78\x03\xc1\xfa\x2f\x86\xb4\
-\xa8\xfc\x9d\x37\x48\xb1\x82\xc6\xd5\x0f\x68\xe2\x40\x80\x9f\x7c\
-\x01\xcf\x53\xdf\x35\xd1\x50\x06\x17\x8a\xfc\x51\xa7\xf8\x2f\xc3\
-\xba\x96\xbb\xad\xea\x30\x69\x5a\x46\x9f\x0b\xdc\xdc\xde\x5c\x7d\
-\xc8\x62\x55\xcb\x33\x7d\x39\xfa\xf0\x07\x24\x57\xe1\xaf\xed\xb9\
-\xfb\x7b\x78\xa3\xf6\x9a\xd7\x6e\xb4\x3d\x16\x6b\xad\x03\xe1\xc5\
-\xb4\x8c\xb6\xda\x6c\x6e\x52\x4b\xe0\x3f\xe5\xad\xd6\x3e\xf1\xc7\
-\x22\x3f\xba\x83\x8c\x13\xcd\x7d\x51\xff\x00\x05\x92\xfd\xa0\xae\
-\x74\x6d\x23\xc3\x9f\x08\xb4\x9b\x96\x8d\x75\x44\x3a\xbe\xb3\xe5\
-\xb7\x2f\x0a\xb9\x4b\x78\x4f\xb1\x75\x79\x08\x3f\xf3\xcd\x3b\x57\
-\xe7\x1f\xc0\x7f\x83\x3a\xf7\xed\x09\xf1\x47\x41\xf0\x2f\x87\x55\
-\x16\xfb\x52\x90\x09\x2e\x64\xc9\x4b\x48\x17\x2d\x2c\xaf\xfe\xca\
-\xa8\x2d\xef\x90\x3a\x91\x40\x1c\x9f\x85\xfc\x1b\xae\xf8\xdf\x58\
-\x83\x48\xf0\xfe\x8d\xa8\xeb\x5a\x9c\xe4\x08\xac\xf4\xfb\x67\xb8\
-\x95\xf3\xd3\x6a\x22\x92\x7e\xa0\x57\xbe\xd8\xff\x00\xc1\x37\x7f\
-\x69\x0d\x4b\x4f\x17\xb0\xfc\x30\xbd\x5b\x77\xf9\x82\x5c\x6a\x16\
-\x50\x39\xff\x00\xb6\x4d\x30\x7f\xd2\xbf\x6b\x3f\x67\x7f\xd9\x8f\
-\xc1\x1f\xb3\x4f\x82\xed\xbc\x3f\xe1\x5d\x36\x34\x98\xa0\xfb\x6e\
-\xab\x32\x03\x77\x7f\x27\xf1\x3c\xaf\xe8\x7b\x27\xdd\x1d\x80\xaf\
-\x5a\x58\xf6\x8c\x28\x0a\x3d\x00\xc5\x00\x7f\x33\x5f\x12\x3e\x0b\
-\xf8\xe3\xe0\xfe\xa0\x96\x5e\x35\xf0\x9e\xad\xe1\x79\xa4\xff\x00\
-\x55\xfd\xa5\x6e\xd1\xac\x83\x9e\x63\x93\x1b\x5b\x18\x3c\x82\x73\
-\xda\xba\x5f\xd9\xc7\xf6\xa0\xf1\xc7\xec\xbf\xe3\x28\xf5\xcf\x09\
-\xea\x8e\xb6\x92\x32\x1b\xfd\x16\xe1\xc9\xb3\xbf\x51\xfc\x32\x27\
-\x66\x1c\xe1\xc6\x18\x64\xe0\x8c\xd7\xf4\x3f\xe3\xcf\x87\x3e\x1b\
-\xf8\x9d\xe1\xbb\xbf\x0f\xf8\xa7\x45\xb3\xd7\xb4\x6b\xa1\x89\x6c\
-\xef\xa3\xf3\x10\x91\x9c\x30\xfe\xeb\x0c\x9f\x98\x60\x8f\x5a\xfc\
-\x23\xfd\xbc\xbf\x63\xd9\xbf\x64\xff\x00\x89\xd0\x47\xa6\xc9\x3d\
-\xc7\x82\xb5\xc5\x7b\x8d\x26\xee\x73\xba\x48\x8a\xff\x00\xac\xb6\
-\x91\x87\x56\x52\x46\x0f\x75\x2a\x7b\x1a\x00\xfd\xa9\xfd\x9c\x3f\
-\x68\x4f\x0d\xfe\xd2\xff\x00\x0c\x74\xff\x00\x19\x78\x6e\x56\x8d\
-\x25\x3e\x45\xed\x8c\x9c\xcb\x63\x72\xa0\x19\x21\x93\x1d\xc6\xe0\
-\x54\xf4\x65\x2a\xdd\xf0\x3d\x63\x15\xf8\x59\xff\x00\x04\xb5\xf8\
-\xfd\x37\xc2\x3f\xda\x3b\x4e\xf0\xcd\xdd\xc6\xdf\x0d\xf8\xcd\xe3\
-\xd3\x27\x89\x9b\x08\xb7\x7c\xfd\x9a\x40\x3d\x77\x93\x1f\xfd\xb4\
-\xc9\xe4\x0c\x7e\xe9\x8a\x00\xf9\xeb\xf6\xde\xfd\x9c\xad\xff\x00\
-\x69\x4f\x80\x7a\xe7\x87\xa3\xb7\x59\x3c\x45\x62\xa7\x51\xd0\xe6\
-\x2a\x03\x25\xdc\x6a\xc5\x53\x77\x65\x75\x26\x33\xfe\xf6\x7a\x80\
-\x6b\xf9\xea\x95\x66\xb6\x99\xa3\x70\xf0\x4b\x09\xd8\x63\x61\xb5\
-\x94\xae\x73\xc7\x62\x08\x3f\x8f\xbd\x7f\x52\xed\x1a\x95\xc1\x19\
-\xe9\xfa\x74\xaf\xe7\xcf\xfe\x0a\x21\xf0\xbe\x0f\x85\x5f\xb5\xa7\
-\x8d\xac\x2c\xe2\x58\x74\xed\x4a\x54\xd6\x6d\x91\x15\x95\x42\xdc\
-\x2f\x98\xc1\x73\xd8\x39\x71\xed\xd2\x80\x3f\x61\x3f\x60\xff\x00\
-\x8e\x0d\xfb\x40\x7e\xcc\xbe\x13\xd7\xae\xe7\xf3\xb5\xbb\x14\x3a\
-\x46\xa8\xdd\xda\xe6\x05\xda\x5f\xfe\x06\x85\x24\xff\x00\x81\x11\
-\x5f\x46\x57\xe5\x1f\xfc\x11\x3f\xe2\x04\x8b\xa8\x7c\x45\xf0\x44\
-\xd2\xa8\x8a\x58\xed\xf5\x8b\x68\xd9\xf2\x41\x0c\xd0\xc8\x00\xfa\
-\x18\xf3\xf8\x57\xea\xe5\x00\x14\x51\x45\x00\x15\x1f\xd9\xe3\xfe\
-\xee\x79\x07\xf1\x1d\xfe\xb5\x25\x35\x9b\x6a\x92\x7a\x50\x03\x7c\
-\x95\xe0\x6d\x18\x07\x20\x76\x1c\x63\x8f\x4e\x2a\x4a\xaa\xd7\x41\
-\x41\xdc\xea\x87\x1c\x6e\x23\x9c\xf4\xef\xfe\x14\xff\x00\x38\x9f\
-\xe2\x55\xe7\x18\xea\x79\xe9\x91\xd8\xd0\x04\xf4\x51\x45\x00\x70\
-\x3f\x1d\x3e\x1d\xc7\xf1\x5b\xe0\xe7\x8d\x7c\x20\xc9\x1b\x49\xad\
-\x69\x37\x56\x51\x19\x06\x42\x4a\xf1\xb0\x89\xbf\x07\xda\xdf\x85\
-\x7f\x34\x37\x56\xf2\xd9\x4f\x2d\xac\xf1\xb4\x13\xc4\xc5\x1e\x39\
-\x06\x0a\xba\x92\x08\x3f\x43\x91\x5f\xd4\xd3\x28\xc1\x3d\xeb\xf9\
-\xf5\xff\x00\x82\x87\x7c\x21\x7f\x83\xbf\xb5\x5f\x8c\xad\x22\x83\
-\xca\xd3\x75\x89\xff\x00\xb7\x2c\x78\x38\x31\x5c\x12\xec\x06\x47\
-\xf0\xca\x25\x1f\x80\xa0\x0f\xd7\x0f\xf8\x27\x67\xc5\x11\xf1\x4f\
-\xf6\x45\xf0\x1d\xd4\x92\xf9\xda\x86\x8f\x01\xd0\xaf\x36\x9c\x95\
-\x7b\x73\xe5\xa6\x73\xdc\xc3\xe4\xb9\xff\x00\x78\xd7\xd3\x6b\xd2\
-\xbf\x22\xff\x00\xe0\x8c\xff\x00\x19\x9b\x4b\xf1\x97\x8b\x3e\x19\
-\xdd\xcb\x84\xd5\xa2\x5d\x62\xc1\x59\x8f\xfa\xe8\x86\xd9\xd4\x02\
-\x7e\xf3\x21\x53\xef\xe5\xfa\x03\x5f\xae\x51\x9e\x28\x03\x3b\x5d\
-\xf0\xd6\x99\xe2\x6d\x1e\xf7\x4a\xd5\xac\x6d\xf5\x2d\x32\xf6\x36\
-\x86\xe6\xce\xea\x31\x24\x52\xa3\x0c\x32\xb2\x9e\x08\x3e\x9f\x8f\
-\x5a\xfc\x55\xff\x00\x82\x87\xfe\xc0\x6f\xfb\x39\xdd\x27\x8d\xbc\
-\x17\x1c\xd7\x9f\x0f\x2f\xe6\x31\x4b\x6a\xc4\xbc\x9a\x3c\xec\x72\
-\xa8\x58\xe4\x98\x98\xf0\xac\x49\x20\xfc\x84\xe4\xa9\x3f\xb7\xbb\
-\x45\x78\x67\xed\xa1\x0e\x8f\xff\x00\x0c\xa7\xf1\x5b\xfb\x69\x77\
-\x69\xff\x00\xd8\x17\x24\x83\xd3\xcc\xc6\x61\x23\xe9\x21\x4f\xc6\
-\x80\x3f\x0b\xff\x00\x65\xdf\x8f\x5a\xb7\xec\xdf\xf1\xb7\x41\xf1\
-\x8e\x9d\x34\x89\x69\x14\x82\x1d\x52\xd5\x49\xc5\xdd\x8b\x11\xe7\
-\x44\xc3\xa3\x70\x37\x0f\x47\x45\xc7\x4a\xfe\x8d\x74\x9d\x46\x1d\
-\x5b\x4f\xb6\xbd\xb6\x93\xcc\xb6\xb9\x8d\x66\x8a\x40\x38\x64\x65\
-\x0c\xa7\xf5\x15\xfc\xb6\xb4\x8c\xd9\xf9\x89\x24\x63\xf5\xcd\x7f\
-\x4a\x7f\xb3\x4a\x5f\x47\xfb\x3d\xfc\x36\x1a\x96\xff\x00\xb7\x8f\
-\x0e\xd8\x09\xbc\xc3\xf3\x6e\xf2\x13\x39\xfd\x28\x03\xd3\xa9\x36\
-\x8f\x4a\x5a\x28\x02\x3f\x28\x7a\x9f\xcf\xdf\x35\xe5\xff\x00\x17\
-\xbf\x66\x1f\x85\xbf\x1d\x54\x1f\x1b\xf8\x2f\x4b\xd7\x2e\x54\x00\
-\x97\xcd\x11\x8a\xe9\x00\xcf\xcb\xe7\x46\x56\x4d\xbc\x9f\x97\x76\
-\x3d\xab\xd5\x29\x36\x8f\xeb\x40\x1f\x0f\x5c\x7f\xc1\x1f\xfe\x02\
-\x4f\x3e\xf5\x1e\x28\xb7\x5c\xff\x00\xa9\x8f\x56\x05\x7f\x36\x8c\
-\x9f\xd6\xad\x5c\x7f\xc1\x22\xff\x00\x67\xe9\xad\x44\x31\xd8\x78\
-\x82\x19\x3f\xe7\xbc\x7a\xcb\x99\x3f\x26\x05\x7f\x4a\xfb\x5b\x62\
-\xe3\x1b\x41\x1f\x4a\x5d\xa2\x80\x3f\x05\x3f\x6f\x0f\xd8\x69\xff\
-\x00\x64\x9d\x5f\x47\xd4\x74\x8d\x52\x7d\x7b\xc1\xfa\xc9\x92\x3b\
-\x5b\xab\xa4\x55\xb8\xb6\x9d\x00\x3e\x54\xbb\x70\x1f\x2b\x96\x56\
-\x50\x01\xda\xdc\x7c\xbc\x9f\xf0\x4c\x1f\x8b\x37\x9f\x0c\xff\x00\
-\x6b\x2f\x0c\xe9\xe9\x71\x24\x7a\x57\x8a\x03\xe8\xb7\xb6\xea\xdf\
-\x2c\xac\xe0\x98\x58\xaf\x4c\xac\xaa\x98\x3d\x46\xe6\xec\x4e\x7e\
-\xd5\xff\x00\x82\xd2\x5b\xcc\xdf\x02\xfc\x13\x2a\x42\x44\x2b\xe2\
-\x5f\x9e\x65\xfe\x16\x36\xb2\x05\xcf\xe2\x08\xff\x00\x80\x8a\xfc\
-\xd0\xfd\x92\x7c\x41\xa7\xf8\x67\xf6\x9c\xf8\x5d\xaa\x6a\x97\x09\
-\x67\xa7\xda\x78\x86\xca\x59\xee\x24\xe1\x63\x5f\x35\x41\x66\x3d\
-\xb1\xd6\x80\x3f\xa4\x45\x6d\xc0\x11\xd2\x9d\x55\xa3\x66\x54\x50\
-\x4e\x30\x31\x8f\x7e\xff\x00\xe3\x56\x68\x00\xa2\x8a\x28\x03\xf3\
-\x23\xfe\x0b\x71\xa9\x49\x17\x81\x7e\x18\x58\x79\x87\x64\xfa\x8d\
-\xec\xcc\x9d\x89\x48\xa2\x00\x9f\xa6\xe3\xf9\xd7\xc2\xff\x00\xf0\
-\x4f\xcd\x22\x1d\x77\xf6\xc8\xf8\x59\x6d\x34\x42\x68\xd3\x54\x33\
-\x95\x61\x91\x98\xe2\x92\x45\x3f\x81\x55\x3f\x85\x7d\xc5\xff\x00\
-\x05\xbc\xb3\x3f\xf0\x8a\x7c\x2b\xba\x55\x25\x23\xbe\xd4\x22\x76\
-\xec\x0b\x47\x0b\x01\xf8\xe0\xfe\x55\xf1\x3f\xfc\x13\x9e\xf9\x34\
-\xef\xdb\x3b\xe1\x7c\x8e\xc2\x35\x92\xfe\x58\x32\xc7\x1f\x33\xdb\
-\x4c\xaa\x3f\x12\x40\xfc\x68\x03\xfa\x10\x8d\x06\x3a\x77\xcd\x48\
-\x7a\x1a\x6c\x7f\x77\xde\x9d\x40\x1f\x80\x9f\xf0\x53\x3f\x15\x5c\
-\x78\x93\xf6\xcb\xf1\xea\x4c\x30\x9a\x73\x5b\x69\xd0\x8e\xbf\x2c\
-\x70\x46\x7f\x22\x5d\x8f\xbe\x6b\xe9\xef\xf8\x22\x6f\x81\xad\x2e\
-\x35\x2f\x89\x3e\x2e\x9d\x15\xaf\xad\x63\xb3\xd2\xe0\x62\xbc\xa4\
-\x72\x19\x24\x72\x0f\x6c\xec\x4f\xfb\xe4\x57\xce\xdf\xf0\x54\xbf\
-\x03\xbf\x84\x7f\x6c\x4f\x15\xdd\x3c\x52\xac\x3a\xe5\xb5\xa6\xab\
-\x13\x30\xe1\x81\x89\x63\x72\xbe\xa0\x3c\x64\x7e\x06\xbd\x9f\xfe\
-\x08\xc7\xf1\x5a\xd3\x41\xf8\x8d\xe3\x3f\x00\xde\x5c\xa4\x12\xeb\
-\xd6\x90\xea\x16\x4a\xc3\x99\x65\xb7\x2d\xe6\x46\xbe\xe6\x37\x2c\
-\x3d\x94\xd0\x07\xeb\xf6\xd0\x06\x00\xc0\xf6\xa7\x51\x45\x00\x15\
-\xf1\x8f\xfc\x15\x8b\xc1\xb6\x3e\x23\xfd\x8e\x75\xed\x4a\x78\xd7\
-\xed\x7e\x1f\xbf\xb2\xbf\xb4\x6d\xa3\x70\x66\x99\x6d\xdd\x73\xd8\
-\x14\x9d\x89\x1e\xc2\xbe\xce\xaf\x83\xff\x00\xe0\xaf\x3f\x15\x2c\
-\xfc\x21\xfb\x34\x0f\x07\x49\x22\x36\xa9\xe2\xdd\x46\x08\x62\x84\
-\x1f\x98\x5b\xc0\xeb\x34\xb2\x63\xd9\xd2\x25\xff\x00\xb6\x9e\xc6\
-\x80\x3f\x18\xbc\x2d\xaf\x5d\x78\x57\xc4\xda\x4e\xb1\x64\xde\x5d\
-\xde\x9d\x77\x0d\xdc\x0c\x3a\x87\x8e\x40\xca\x47\xbe\x54\x1f\xc2\
-\xbf\xa8\x6b\x7b\x81\x71\x0a\x4a\x87\x29\x20\x0c\xbf\x8d\x7f\x31\
-\x1f\x0c\xbc\x23\x71\xf1\x03\xe2\x27\x85\xbc\x31\x66\xa5\xae\xf5\
-\x8d\x4e\xda\xc2\x2d\xa3\x24\x34\x92\x2a\x03\xf4\xcb\x73\xec\x0d\
-\x7f\x4f\x51\x46\xb1\xa2\xaa\x8d\xaa\xa3\x68\x1e\xd4\x00\xfa\xfc\
-\x78\xff\x00\x82\xd9\x68\x1f\x65\xf8\xc5\xf0\xfb\x58\x0a\x00\xbc\
-\xd0\x64\xb5\x38\xea\x4c\x37\x0c\xd9\x3e\xbc\x4e\x3f\x2a\xfd\x87\
-\x35\xf8\xff\x00\xff\x00\x05\xb0\xd6\xe3\xb8\xf8\xad\xf0\xe3\x48\
-\xc6\x25\xb4\xd1\x6e\x2e\x89\x3d\xc4\xb7\x05\x00\x1f\xf7\xe3\xf5\
-\xa0\x0f\x37\xff\x00\x82\x41\xeb\x0b\xa7\x7e\xd7\xb0\x5a\x9e\x3f\
-\xb4\x34\x3b\xeb\x6e\x3b\xe3\xcb\x90\x7f\xe8\xa3\xf9\xd7\xee\x4d\
-\x7e\x18\xff\x00\xc1\x23\xb4\x96\xd4\xbf\x6c\x3d\x3e\xe2\x35\xf9\
-\x74\xfd\x16\xfa\xe8\x8c\xf3\x82\xab\x18\xff\x00\xd1\x8b\x5f\xb9\
-\xd4\x00\x51\x45\x14\x00\x54\x72\xa8\x29\x83\xd2\xa4\xa6\xb0\xf9\
-\x68\x03\xf9\xe1\xfd\xb7\x3e\x29\x78\xd7\xc7\x5f\xb4\xa7\x8d\xff\
-\x00\xe1\x27\xbe\xbd\x85\xf4\x7d\x66\xe2\xc6\xc3\x4f\x69\xc9\x8e\
-\xca\x28\xa4\x2b\x18\x8d\x47\x00\x91\x86\xcf\x53\x9a\xfd\x49\xff\
-\x00\x82\x59\xfc\x7f\xd5\xfe\x34\x7c\x03\x9b\x4a\xf1\x16\xab\x36\
-\xad\xe2\x1f\x0b\xde\x7d\x8e\x4b\xab\xa9\x3c\xc9\xe6\xb5\x75\x12\
-\x40\xf2\x31\xe4\x9c\x6f\x4d\xc7\x27\xe4\x19\x39\xcd\x7c\x45\xff\
-\x00\x05\x7e\xf8\x39\x27\x81\x7f\x68\x7b\x1f\x1a\xda\xc1\xb3\x4c\
-\xf1\x85\x82\xca\xee\x8b\x85\x17\x90\x62\x39\x47\xe2\x9e\x53\x67\
-\xfd\xa3\x5c\xf7\xfc\x12\xa7\xe3\x68\xf8\x57\xfb\x4d\x59\xe8\x37\
-\x93\xf9\x1a\x47\x8c\x61\xfe\xc8\x98\x31\xc2\xad\xc8\x21\xed\x5b\
-\xea\x64\x0d\x1e\x3a\x62\x63\x40\x1f\xba\x8b\xd0\x52\xd3\x23\x3b\
-\x96\x9f\x40\x08\xdf\x74\xd7\xe7\x6f\xfc\x16\x1b\xe0\x28\xf1\xa7\
-\xc2\x7d\x17\xe2\x4e\x9d\x6f\xbf\x51\xf0\xac\xff\x00\x66\xd4\x0a\
-\x8e\x4d\x94\xec\x00\x76\xf6\x49\x82\x7e\x12\xbf\xa5\x7e\x89\x57\
-\x3f\xe3\x5f\x08\x69\xde\x3e\xf0\x9e\xaf\xe1\xdd\x62\xdc\x5d\xe9\
-\x5a\xad\xa4\xb6\x57\x50\xb0\xce\xf8\xe4\x5d\xa7\xaf\x70\x3b\xf5\
-\x07\x91\xcd\x00\x7f\x36\x7f\x07\x7e\x27\x6a\x9f\x06\x3e\x27\x78\
-\x67\xc6\xba\x33\xe2\xff\x00\x44\xbf\x8e\xf1\x63\x62\x40\x95\x17\
-\x21\xe2\x6f\x69\x11\x9d\x4f\xb3\x1f\x5a\xfe\x91\xbe\x1e\x78\xf3\
-\x4b\xf8\x95\xe0\xad\x13\xc5\x5a\x25\xc8\xb8\xd1\xf5\x8b\x48\xef\
-\x2d\x65\x1d\xd1\xc6\x40\x3e\x84\x67\x04\x7a\x82\x2b\xf9\xc9\xf8\
-\xfd\xf0\x6f\x56\xf8\x07\xf1\x83\xc4\x5e\x05\xd6\xc1\x37\x1a\x4d\
-\xd3\x24\x77\x0c\x30\x97\x30\x37\xcd\x0c\xc3\xd9\x91\x83\x7b\x64\
-\x8e\xaa\x6b\xf4\x2b\xfe\x09\x07\xfb\x52\x03\x1d\xef\xc1\x6f\x10\
-\xde\x6d\x75\x32\x6a\x1e\x1c\x69\x4e\x77\x8e\x5a\x6b\x50\x7d\x46\
-\x3c\xc4\x1e\x86\x4f\xf6\x70\x01\xfa\xa7\x5f\x9e\x1f\xf0\x58\xcf\
-\x8b\xe7\xc1\xff\x00\x05\x34\x1f\x01\xda\x4c\x62\xba\xf1\x55\xf3\
-\x4f\x3f\x5e\x6d\x6d\x8a\xbb\x28\x23\xa6\x65\x92\x21\x83\xc6\xd0\
-\x6b\xf4\x37\x77\x02\xbf\x13\xbf\xe0\xb1\x9e\x30\x93\x5a\xfd\xa8\
-\x34\xdd\x19\x1d\xc5\xb6\x8b\xe1\xeb\x68\xbc\x9c\xfc\x9e\x64\x8f\
-\x2c\xac\xd8\xf5\x2a\xc8\x3f\xe0\x22\x80\x3e\x4d\xf8\x11\xf0\xc2\
-\xe7\xe3\x27\xc6\x0f\x08\x78\x2e\xd1\x19\xe5\xd6\xb5\x28\x6d\x5d\
-\x97\x3f\xbb\x88\xb6\x66\x73\x8e\xca\x81\x9b\xe8\xa6\xbf\xa5\x8d\
-\x2f\x4f\xb7\xd3\x34\xfb\x7b\x3b\x54\xf2\xed\xed\xe3\x58\xa2\x8c\
-\x13\x85\x55\x01\x40\xfc\x00\x15\xf8\xc9\xff\x00\x04\x6d\xf0\x2a\
-\xf8\x83\xf6\x92\xd6\xfc\x45\x3c\x41\xe2\xf0\xf6\x85\x23\x44\x58\
-\x7d\xd9\xe7\x74\x88\x11\xff\x00\x6c\xc4\xcb\xf8\x9a\xfd\xa7\x5a\
-\x00\x5a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x3c\x3b\xf6\
-\xc4\xf8\x0e\x9f\xb4\x6f\xc0\x2f\x13\xf8\x35\x06\x35\x49\x22\xfb\
-\x56\x97\x23\xf0\x12\xf2\x2c\xb4\x79\xf6\x6f\xb9\xff\x00\x03\xaf\
-\xe7\x52\x48\x65\xb4\x9a\x54\x74\x68\xa4\x8d\xb6\x3a\xb7\x0c\xac\
-\x3a\x8f\xa8\x2b\x8a\xfe\xa6\xbc\xb5\xee\x33\xf5\xaf\xe6\x8f\xf6\
-\x92\xb3\x8f\x4d\xfd\xa1\xbe\x26\xda\x43\x10\x82\x18\x7c\x4f\xa9\
-\xa2\x46\xbd\x15\x45\xd4\xbb\x40\xfa\x0c\x50\x07\xee\xcf\xec\x1b\
-\xf1\x5a\xe3\xe3\x47\xec\xa7\xe0\x1f\x10\xea\x53\x9b\x8d\x5a\x3b\
-\x56\xd3\xaf\x9d\x9b\x2c\xf2\xdb\x3b\x41\xbd\xbd\xdd\x55\x5f\xfe\
-\xda\x57\xd0\xb5\xf0\x67\xfc\x11\xb6\x77\xb8\xfd\x94\xf5\x64\x76\
-\xcf\x91\xe2\xab\xc4\x55\xfe\xea\x9b\x7b\x56\xc7\xe6\x49\xaf\xbc\
-\xe8\x00\xa2\x8a\x81\x9a\x4c\x64\x1c\x9c\x8e\x83\x8f\x7f\xeb\x40\
-\x1f\x10\x7f\xc1\x5f\x3c\x06\xfe\x2b\xfd\x94\x4e\xb5\x0c\x5b\xe6\
-\xf0\xd6\xb1\x6b\x7f\x23\xf3\x91\x0c\x9b\xed\xdb\xff\x00\x1e\x96\
-\x22\x7d\x96\xbf\x1b\x3e\x14\xf8\xd9\xfe\x1a\xfc\x4c\xf0\xa7\x8a\
-\xa3\x56\x2f\xa2\xea\x76\xba\x86\xd5\x3c\xb0\x8a\x64\x72\x3f\x15\
-\x04\x57\xf4\x89\xf1\x73\xe1\xdd\x97\xc5\xaf\x86\x3e\x2a\xf0\x6e\
-\xa1\xff\x00\x1e\x9a\xe6\x9f\x3d\x8c\x8d\xdd\x37\xa1\xda\xe3\x3d\
-\xc3\x60\x8f\x71\x5f\xcd\x57\x8c\x3c\x33\x7f\xe0\x9f\x14\x6a\xda\
-\x06\xab\x01\xb7\xd4\xf4\xab\xc9\x2c\xae\xa3\x23\x05\x24\x8d\x8a\
-\xb0\xfa\x12\x0e\x3d\xa8\x03\xfa\x77\xd1\x75\x8b\x5d\x7b\x4b\xb4\
-\xd4\xb4\xfb\x84\xba\xb1\xbc\x81\x2e\x2d\xe7\x8f\xa4\xb1\xb8\xdc\
-\xae\xbe\xcc\xa4\x11\xf5\xad\x3a\xf8\x8b\xfe\x09\x55\xf1\xfa\x3f\
-\x8b\x1f\xb3\xec\x5e\x13\xbc\xb8\x57\xf1\x07\x83\x76\x58\x38\x66\
-\xcb\xbd\x9b\x6e\x36\xef\x83\xe8\x37\x47\x91\xc0\x31\xfd\x33\xf6\
-\xe7\x5a\x00\xf8\x0b\xfe\x0a\xcf\xfb\x33\xdc\xfc\x56\xf8\x4f\x61\
-\xf1\x03\x41\xb5\x6b\x9f\x10\x78\x44\x37\xda\xa2\x88\x6e\x69\xb4\
-\xf7\xfb\xfc\x01\x92\x63\x70\xac\x00\xec\xf2\x7a\x0a\xfc\x79\xf0\
-\x4f\x8c\xb5\xbf\x87\x3e\x2e\xd1\xfc\x4d\xe1\xfb\xf9\x74\xdd\x6f\
-\x4a\xb9\x4b\xbb\x3b\x98\x86\x59\x1d\x79\x53\x8e\x8c\xa7\xee\x90\
-\x78\x20\x90\x46\x0e\x2b\xfa\x7d\xb8\xb6\x4b\x84\x64\x91\x04\x88\
-\xc3\x0c\xad\xc8\x20\xf5\x04\x7a\x7f\x89\xf5\xaf\xc9\x7f\xdb\x83\
-\xfe\x09\x77\xab\x69\xfa\xa6\xad\xe3\xbf\x83\xba\x77\xf6\x9e\x93\
-\x33\xbc\xf7\xbe\x13\xb7\xc1\x9e\xd5\x89\xdc\xcd\x6a\x9f\xf2\xd1\
-\x3b\xf9\x40\x86\x5e\x80\x30\xe2\x80\x3e\xa7\xfd\x93\x7f\xe0\xa4\
-\xde\x02\xf8\xf9\xa3\xd9\x69\xbe\x26\xbe\xb5\xf0\x67\x8e\x55\x04\
-\x73\x69\xf7\xd2\x08\xed\xae\xd9\x57\x2d\x25\xbc\xa7\x83\x9e\xbe\
-\x5b\x1d\xe3\xd0\x8f\x9a\xbe\xbe\x86\xf1\x6e\x23\x49\x22\x71\x2c\
-\x6c\xbb\x96\x48\xf0\xca\xc3\xd4\x10\x71\x5f\xcb\xa5\xf6\x9f\x75\
-\xa5\xdd\x4d\x6b\x77\x6d\x35\xb5\xd4\x4d\xb2\x48\x2e\x10\xab\xa1\
-\xe9\x86\x53\xca\x9f\x62\x3f\x1a\xb1\x69\xe3\x0d\x7a\xd6\xdd\x20\
-\xb7\xd6\x35\x08\x20\x8c\x6d\x58\xe2\xba\x91\x55\x47\xa0\x01\xb1\
-\x40\x1f\xd0\xaf\xed\x05\xfb\x67\x7c\x30\xfd\x9c\x74\x89\xee\x3c\
-\x49\xe2\x3b\x7b\x9d\x57\x61\xfb\x3e\x83\xa6\xc8\x93\x5f\x4e\xde\
-\xd1\xe7\x08\x3f\xdb\x72\x16\xbf\x0e\x7f\x6a\x1f\xda\x4f\xc4\x3f\
-\xb5\x17\xc4\xdb\xbf\x16\xeb\xa5\x6d\xa2\x0b\xf6\x7d\x3f\x4d\x81\
-\x89\x8e\xca\xd8\x13\xb6\x31\x9e\xac\x7e\xf3\x3f\xf1\x31\xc0\xc0\
-\xe2\xbc\x86\x56\x96\x69\x8c\x9b\xa4\x67\x2d\xf7\xfa\x92\xdf\x5f\
-\x5f\xc4\x9a\xfa\xff\x00\xf6\x41\xff\x00\x82\x72\xf8\xe7\xf6\x82\
-\xbe\xb2\xd6\xbc\x47\x6b\x79\xe0\xff\x00\x00\x82\xb2\x36\xa3\x77\
-\x17\x97\x73\x78\xad\xd1\x6d\x51\xba\xe7\xfe\x7a\x30\xda\x3b\x13\
-\x40\x1e\x95\xff\x00\x04\x8d\xfd\x99\xee\xbc\x61\xf1\x32\x6f\x8a\
-\xda\xad\x9b\x26\x85\xe1\xbd\xd0\x69\x8f\x22\xfc\xb7\x17\xce\xb8\
-\x62\xa7\xa3\x08\x91\xc9\x3e\x8c\xe8\x3a\xf4\xfd\x92\xae\x5b\xe1\
-\xef\xc3\xfd\x0b\xe1\x7f\x83\xf4\x9f\x0b\xf8\x73\x4f\x8f\x4b\xd0\
-\xf4\xc8\x85\xbd\xad\xb4\x20\x80\xa3\x24\xe7\x93\xc9\x25\x89\x2c\
-\x79\x24\x92\x49\x35\xd4\x96\xdb\x40\x08\x7e\xed\x7e\x02\xff\x00\
-\xc1\x4c\x3e\x28\x47\xf1\x3b\xf6\xba\xf1\x73\xda\xca\xd3\x58\xe8\
-\x7e\x5e\x89\x01\x2d\x90\x0c\x00\x89\xb6\xfb\x79\xa6\x4a\xfd\x97\
-\xfd\xab\xbe\x3b\xda\xfe\xce\x7f\x03\x3c\x51\xe3\x5b\xa7\x8c\xde\
-\x5b\x40\x60\xd2\xed\xe4\xe9\x3d\xec\x99\x58\x50\xe3\xa8\xce\x18\
-\x8f\xee\xa3\xd7\xf3\x99\xa8\x5f\x5c\xea\xda\x85\xcd\xf5\xd4\xaf\
-\x71\x75\x70\xed\x2c\xd2\xc8\xd9\x66\x76\x6c\x96\x24\xf7\x2c\x49\
-\xa0\x0f\xd2\xbf\xf8\x22\x9f\xc3\xd6\xbd\xf1\x5f\xc4\x2f\x1b\xc9\
-\x02\x88\xac\xec\xa1\xd2\x61\x94\x75\xdf\x24\x9e\x6c\x80\x7f\xc0\
-\x51\x07\xe2\x2b\xf5\xb6\xbe\x5b\xff\x00\x82\x74\x7c\x13\x9f\xe0\
-\x87\xec\xb5\xe1\x8b\x4b\xfb\x71\x6f\xad\xeb\x80\xeb\xb7\xf1\xb2\
-\xe1\x91\xe7\x0a\x62\x43\xe8\x56\x25\x8c\x30\x3d\x1b\x75\x7d\x49\
-\x40\x05\x14\x51\x40\x05\x23\x7d\xd3\x4b\x49\x40\x1f\x29\x7f\xc1\
-\x49\x3e\x05\xff\x00\xc2\xeb\xfd\x98\x75\xd1\x65\x68\x2e\x75\xdf\
-\x0e\x37\xf6\xd6\x9e\xaa\x09\x76\xf2\x94\x99\xa3\x5f\xf7\xa3\x2f\
-\xc7\x4c\x81\xe8\x31\xf8\x33\xa4\x6a\x17\x5a\x2e\xa9\x6d\x7f\x65\
-\x3b\x5b\x5e\x5a\xcc\x93\xc1\x34\x6d\x86\x8e\x45\x60\xc8\xe0\xfd\
-\x40\x39\x15\xfd\x47\x4d\x6e\x97\x11\xb4\x6e\xa1\xe3\x61\x82\xac\
-\x32\x08\xf4\x35\xf9\xfb\xe2\xff\x00\xf8\x23\xcf\xc3\x4f\x11\x7c\
-\x43\xb9\xd7\x2c\x7c\x4f\xad\x68\x3a\x0d\xcd\xd7\xda\x24\xd0\x6d\
-\xa2\x89\xbc\xb5\x6f\xf5\x89\x14\xad\x96\x45\x3d\xb7\x03\xb3\xde\
-\x80\x3e\xbe\xfd\x9d\xfe\x28\x49\xf1\x9b\xe0\x7f\x82\xbc\x6b\x2c\
-\x5f\x67\xb8\xd6\xb4\xb8\x6e\x66\x89\x71\x85\x97\x04\x49\x8f\x6d\
-\xc1\xab\xd2\xab\x0b\xc1\xbe\x10\xd2\xbc\x05\xe1\x5d\x2b\xc3\x9a\
-\x25\xa2\x58\xe9\x3a\x5d\xb2\x5a\x5a\xc1\x1e\x40\x48\xd0\x00\xab\
-\x92\x72\x78\x1d\x49\x24\xf7\xcd\x6e\xd0\x01\x4d\xda\x29\xd4\x50\
-\x07\xc0\x3f\xf0\x55\x6f\xd9\x42\x5f\x8b\x3f\x0e\xe3\xf8\x93\xe1\
-\xcb\x23\x3f\x89\xfc\x2b\x6e\xc2\xee\x18\x53\x74\xb7\x96\x19\x2c\
-\xc0\x7a\xb4\x44\xb4\x9e\xa5\x4b\x0e\xb5\xf8\xed\xe1\x5f\x15\x6a\
-\xfe\x06\xf1\x2e\x93\xe2\x0d\x1a\xee\x4d\x37\x57\xd3\x2e\x12\xee\
-\xd2\xea\x2e\xa9\x22\xb6\x50\xf1\xc1\x19\xe0\xf1\xd3\x83\xc7\x15\
-\xfd\x40\xcd\x6b\x1c\xe8\xc8\xca\xac\x8c\xa5\x59\x58\x64\x10\x7b\
-\x11\xe9\x5f\x86\x7f\xf0\x52\x4f\xd8\xca\xe3\xf6\x76\xf8\x85\x27\
-\x8a\xbc\x39\x65\xb7\xe1\xe7\x88\x6e\x19\xad\xc4\x6b\xf2\xe9\xb7\
-\x4c\x77\x35\xb1\xfe\xea\x10\x0b\x21\xf4\x0c\xbf\xc3\xc8\x07\xea\
-\xdf\xec\x83\xfb\x4f\x69\x5f\xb5\x4f\xc2\x3d\x3b\xc4\xd6\x66\x3b\
-\x4d\x6a\xdf\x6d\xb6\xb5\xa6\xa7\x3f\x65\xb9\x0a\x33\xb7\x3c\xec\
-\x7f\xbc\x84\xff\x00\x09\x23\xa8\x35\xf9\x75\xff\x00\x05\x8a\xf0\
-\xfa\xe8\xff\x00\xb5\x75\x9d\xf2\xbe\x4e\xad\xe1\xcb\x4b\xa6\x53\
-\xfc\x25\x24\x9a\x11\xfa\x47\x5e\x07\xfb\x2b\xfe\xd3\x9e\x23\xfd\
-\x96\x3e\x26\x41\xe2\x8d\x0c\xfd\xa2\xca\x44\x36\xfa\xae\x93\x33\
-\x91\x15\xf4\x1d\xd5\xbf\xba\xea\x46\xe4\x61\xc8\x39\x1d\x09\x05\
-\x3f\x6b\x2f\xda\x47\x52\xfd\xaa\xfe\x2f\x5c\x78\xd7\x51\xd3\xa3\
-\xd2\x63\x5b\x58\xb4\xfb\x3d\x3e\x29\x3c\xd1\x04\x31\x96\x21\x4c\
-\x98\x1b\x99\x9d\xd9\xb3\x8c\x7c\xd8\xe8\x28\x03\xea\x5f\xf8\x22\
-\xb7\x88\x27\xb5\xf8\xf7\xe3\x5d\x20\x63\xc8\xbc\xf0\xe1\xb9\x7f\
-\x50\x62\xb9\x88\x0f\xfd\x1c\xd5\xfb\x27\x5f\x92\xdf\xf0\x45\x3f\
-\x86\x37\x2f\xe2\xdf\x88\x1e\x3d\x9a\x29\x12\xce\x0b\x28\xf4\x4b\
-\x69\x72\x0a\xbc\x92\x38\x9a\x51\x9e\xe5\x56\x38\xbf\xef\xaa\xfd\
-\x6a\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x04\x35\
-\xfc\xe8\xfe\xdc\x5e\x1b\x7f\x0b\xfe\xd6\xff\x00\x15\x6c\x5b\x9d\
-\xda\xe4\xd7\x4a\xdf\xec\xcd\x89\x86\x3f\x07\x1f\x95\x7f\x45\xd5\
-\xf8\xc3\xff\x00\x05\x8e\xf8\x4b\x3f\x85\x7e\x39\xe8\x9e\x39\x86\
-\x0c\x69\xde\x26\xd3\x96\x09\x24\x55\x01\x7e\xd5\x6f\x85\x61\xf5\
-\x31\x98\xcf\xe7\x40\x1e\xf5\xff\x00\x04\x51\xf1\x72\x5c\xfc\x28\
-\xf8\x81\xe1\x8d\xeb\xe7\x58\x6b\x51\xdf\x84\x2c\x37\x15\x9a\x00\
-\x84\xe3\xd3\x30\x01\xf8\xd7\xe9\x26\xea\xfc\x14\xff\x00\x82\x6a\
-\x7e\xd0\xd6\x7f\x01\xff\x00\x68\x8d\x3a\x3d\x5a\xe5\x2c\xfc\x3d\
-\xe2\x58\x3f\xb2\x2f\x67\x90\x0d\xb0\xbb\x36\xe8\x25\x63\xd8\x09\
-\x70\x09\xcf\x0a\xf9\xec\x6b\xf7\x87\xcd\x6d\xa0\xa9\xfc\x54\x64\
-\x74\xcf\x1e\xa0\xff\x00\x93\x40\x13\xef\xed\x9e\x47\x27\x02\xbf\
-\x3d\x3f\xe0\xa6\x9f\xb6\xf8\xf8\x53\xa7\xdb\xfc\x37\xf0\x36\xa2\
-\xad\xe3\x69\xe5\x82\xf3\x52\xba\xb6\x6c\xff\x00\x67\x42\x92\x2c\
-\xa9\x19\x23\xa4\x92\x32\xaf\xca\x7a\x27\x5e\x5d\x41\xbd\xfb\x72\
-\x7f\xc1\x4c\xb4\x6f\x84\x36\xfa\x87\x82\xfe\x19\x5e\x5b\xeb\xfe\
-\x38\xf9\xe0\xb9\xd5\x22\xc4\xb6\x7a\x4b\x0f\xbc\x33\xc8\x96\x61\
-\xfd\xd0\x0a\xaf\xf1\x73\xf2\xd7\xe3\xb6\xa7\xac\x6a\x3e\x2c\xd5\
-\xee\xb5\x1d\x46\xf6\xe7\x51\xd5\x6f\x65\x6b\x8b\x9b\xcb\xa9\x0c\
-\x92\xce\xec\x77\x3b\xb3\x1e\xac\x58\x9c\x1c\xe4\x92\x30\x32\x68\
-\x03\xfa\x3e\xf8\x05\xf1\x8b\x4a\xf8\xf9\xf0\x87\xc3\x1e\x39\xd2\
-\x99\x7c\x9d\x5a\xd5\x64\x9a\x21\xcf\xd9\xee\x17\x89\xa2\x3f\xee\
-\xba\xb0\xfa\x00\x7b\x8a\xfc\xc8\xff\x00\x82\xbb\xfe\xcb\xb2\xf8\
-\x6f\xc6\xf6\xbf\x18\x34\x2b\x5c\xe8\xfa\xf6\xcb\x5d\x68\x44\x09\
-\x58\x2f\x42\xed\x8e\x53\xe8\xb2\xa8\x0b\x9e\x9b\x90\x9e\xad\x5f\
-\x52\x7f\xc1\x2d\xfe\x03\xf8\xe3\xe0\xaf\xc0\xcb\xbb\xbf\x18\x5d\
-\x4d\x62\x9e\x20\xb9\x8f\x52\xd3\xf4\x09\x93\xe6\xb1\x88\xa0\x1e\
-\x64\x9d\xd6\x49\x7e\x52\x62\xfe\x10\xab\x9f\x9c\x90\xbf\x55\x7c\
-\x54\xf8\x65\xa2\x7c\x5d\xf8\x7b\xaf\x78\x3b\xc4\x36\xdf\x69\xd1\
-\xf5\x7b\x67\xb5\x99\x57\xef\xa0\x20\x15\x75\xf4\x65\x60\x18\x7a\
-\x63\x8a\x00\xfe\x7e\x7f\x64\xbf\xda\x27\x54\xfd\x99\x7e\x35\x68\
-\xbe\x31\xb3\x67\x97\x4c\xdd\xf6\x5d\x5a\xc9\x48\x1f\x6a\xb2\x66\
-\x1e\x62\x63\xd4\x60\x3a\xff\x00\xb4\x8b\xdb\x35\xfd\x0d\xf8\x4b\
-\xc5\xda\x77\x8e\x3c\x37\xa6\x6b\xba\x1d\xf4\x57\xfa\x4e\xa5\x6f\
-\x1d\xe5\xa5\xd4\x5f\x76\x48\x99\x72\x0f\xea\x3f\x51\xd4\x1a\xfe\
-\x70\xfe\x3c\x7c\x18\xd6\xff\x00\x67\xef\x8a\x9a\xff\x00\x81\xf5\
-\xc8\xff\x00\xd3\x34\xd9\x58\x45\x73\xb3\xe5\xb9\xb7\x3c\xc7\x32\
-\x8f\x46\x5c\x1f\x63\x91\xd4\x1a\xfd\x02\xff\x00\x82\x45\xfe\xd6\
-\x02\x19\x26\xf8\x2b\xe2\x3b\xb2\x56\x42\xf7\x5e\x1c\x9a\x76\x24\
-\x29\xe5\xe6\xb4\xfd\x0c\x88\x3d\xdc\x77\x14\x01\xfa\xb5\x4c\x58\
-\xd5\x54\x28\x18\x1e\x99\xfd\x3e\x94\xe5\xe8\x29\x68\x03\xcc\x7e\
-\x29\x7e\xcd\x1f\x0c\x3e\x35\x32\xcb\xe3\x3f\x03\xe8\xda\xed\xd2\
-\xf0\x2f\x27\xb6\x0b\x72\x07\xa7\x9c\x98\x7c\x7b\x6e\xaf\x08\x93\
-\xfe\x09\x43\xfb\x3c\x49\x33\x48\x3c\x31\xa9\xc2\x4f\xf0\x47\xad\
-\xdc\x85\xff\x00\xd0\xb3\x5f\x62\xd2\x62\x80\x3c\x1f\xe1\xa7\xec\
-\x3f\xf0\x47\xe1\x3d\xcc\x17\x5e\x1f\xf8\x7b\xa4\xff\x00\x68\x40\
-\x3e\x4b\xdd\x46\x33\x7b\x3a\x7b\xab\x4c\x5b\x69\xf7\x1c\xd7\xbb\
-\x79\x6b\xc7\x1d\x06\x07\xa8\xa5\x2a\x1b\x82\x32\x3d\x29\xd4\x00\
-\x9b\x45\x40\xcc\x7e\x61\x92\xdf\xa7\xe5\xfa\x9a\x9d\xba\x1a\xf8\
-\xb7\xfe\x0a\x67\xfb\x57\x2f\xc0\x1f\x84\x2f\xe1\x8d\x0e\xef\xca\
-\xf1\xb7\x8a\xa3\x7b\x6b\x4d\x8d\xf3\x5a\xda\xe3\x6c\xd7\x07\xd3\
-\x83\xb1\x7d\x58\x93\xd1\x0e\x40\x3e\x0a\xff\x00\x82\x9e\x7e\xd5\
-\xcb\xf1\xe7\xe2\xc2\xf8\x47\xc3\xd7\x62\x5f\x05\xf8\x52\x57\x86\
-\x39\x22\x63\xb2\xfa\xf4\xfc\xb3\x4f\x9e\x85\x57\x6f\x94\x84\xfa\
-\x3b\x7f\x1f\x1c\x27\xfc\x13\xe7\xf6\x6b\x7f\xda\x33\xe3\xe6\x9b\
-\x69\x75\x6c\xd7\x1e\x16\xd0\x0a\x6a\x9a\xcc\x84\x62\x33\x1a\x3f\
-\xc9\x01\xcf\xf1\x48\xfc\x01\xfd\xd0\xe7\xb7\xcb\xf3\x9e\x8f\xa6\
-\xdd\xf8\x83\x55\xb1\xd3\x34\xfb\x69\x6f\x6f\xef\xa7\x58\x2d\xad\
-\xa1\x1b\x9e\x59\x1d\x80\x58\xd4\x7b\x93\x81\xee\x4d\x7f\x41\x3f\
-\xb1\x5f\xec\xc7\x67\xfb\x30\xfc\x13\xd3\xfc\x3e\xc9\x0c\xde\x24\
-\xbc\xc5\xee\xb7\x74\x80\xe6\x6b\xa6\x03\x09\x9e\xe9\x18\x3b\x07\
-\x6e\x09\xea\x49\xa0\x0f\xa0\x63\x81\x23\x8f\x6a\xae\x17\xfb\xa3\
-\xa7\x4c\x63\x1e\x95\x2d\x20\x18\xe9\x4b\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x37\x62\x8e\x00\xe2\x9d\x45\x00\x25\x19\xaf\x34\
-\xfd\xa1\xbe\x34\x5a\xfc\x01\xf8\x3b\xe2\x7f\x1d\xde\xc0\x6f\x23\
-\xd2\x2d\xf7\xc5\x68\xa7\x06\x69\x59\x82\x46\x99\xec\x0b\x90\x2b\
-\xf3\x1f\xe1\x9f\xfc\x16\x37\xc7\xf6\xff\x00\x12\x20\x7f\x1d\x69\
-\x1a\x2d\xcf\x83\x2e\x6e\x36\x4d\x6f\xa6\xdb\x3c\x77\x36\xb0\xb3\
-\x7f\xac\x8d\xcb\x9f\x33\x62\xf6\x2b\x97\xed\x8a\x00\xfd\x84\xa2\
-\xb1\x34\x1f\x14\x58\xf8\xa7\x45\xd3\xf5\x8d\x1e\xf6\x1d\x47\x49\
-\xd4\x22\x4b\x8b\x5b\xc8\x18\x79\x73\x46\xc3\x70\x65\x3f\x4f\xd3\
-\x3d\xc1\x15\xb5\x9a\x00\x5a\xe2\xfe\x2a\x7c\x35\xd0\x3e\x2f\x78\
-\x27\x57\xf0\x87\x89\xec\x57\x50\xd1\xf5\x4b\x76\x86\x78\x58\x61\
-\x86\x78\x57\x8d\xbf\x85\xd5\xb0\x41\xea\x2b\xb4\xa6\xb4\x6a\xdc\
-\x11\x91\xe8\x68\x03\xf9\xd7\xfd\xae\x7f\x64\xef\x12\xfe\xca\x7f\
-\x11\xe5\xd1\x75\x40\xf7\xfe\x1e\xba\x2d\x2e\x8b\xae\x2a\x62\x2b\
-\xd8\x07\x25\x4f\x61\x2a\x65\x43\x27\xa9\x04\x65\x58\x13\xe2\xba\
-\x4c\x76\x4d\xab\xd9\x2e\xa6\xf7\x0b\xa7\x79\xb1\xfd\xa9\xad\x80\
-\xf3\xbc\x9c\x8d\xe6\x3d\xdc\x6e\xd8\x09\x50\x78\xe9\x5f\xd2\x67\
-\xc6\xdf\x82\x9e\x17\xf8\xfd\xf0\xff\x00\x52\xf0\x87\x8b\x6c\x16\
-\xf7\x4d\xbb\x3b\xa2\x92\x32\x16\x7b\x59\x40\xc2\xcb\x0b\x7f\x0b\
-\xa3\x64\xfa\x10\x48\x39\x04\x8a\xfc\x22\xfd\xad\x3f\x64\x2f\x17\
-\xfe\xca\x1e\x34\x16\x1a\xc4\x32\x6a\x1e\x18\xbc\x62\x74\xaf\x11\
-\x41\x11\x58\x6e\x90\x7f\x0b\xaf\xfc\xb3\x95\x7b\xc6\x4f\x1d\x89\
-\x1c\xd0\x07\xed\x7f\xec\x77\x17\xc3\x0b\x5f\x80\xbe\x1a\x83\xe1\
-\x0d\xdc\x17\x1e\x12\x8e\x3d\xa6\x46\x60\x6e\x7c\xf2\x01\x97\xed\
-\x23\xf8\x67\xdc\x4e\x54\xf0\x32\x31\xf2\xed\x15\xee\xd5\xfc\xdd\
-\xfe\xcd\x7f\xb5\x17\x8e\xbf\x66\x0f\x1a\xa6\xb9\xe1\x4d\x4b\xfd\
-\x16\x5d\xab\x7d\xa3\xde\x31\x6b\x4b\xe4\x5c\x7c\xb2\x27\x62\x31\
-\x80\xe3\x0c\x06\x40\x23\x26\xbf\x6e\x3f\x65\x7f\xdb\x7b\xc0\x7f\
-\xb5\x46\x92\x8b\xa4\x5e\x0d\x1f\xc5\x51\x46\x1e\xf3\xc3\x57\xcc\
-\x05\xcc\x7e\xad\x11\xe9\x2c\x63\xfb\xeb\xc8\xfe\x20\x94\x01\xf4\
-\x65\x15\x00\x91\x9b\x9d\xdc\xfa\x63\x81\xce\x7e\xb9\xc5\x38\xc8\
-\x42\xe4\xff\x00\xdf\x38\x3f\x97\x4e\x68\x02\x5a\x2b\x8e\xf1\xc7\
-\xc5\xaf\x07\xfc\x33\xd3\x85\xf7\x8b\xbc\x55\xa3\xf8\x66\xd9\x8e\
-\x11\xf5\x4b\xd8\xad\xc3\x7d\x37\x37\xcd\xf8\x66\xbe\x70\xf1\x87\
-\xfc\x15\x63\xf6\x79\xf0\xa4\x8f\x0d\xbf\x89\xef\xfc\x45\x3a\x33\
-\x2b\xae\x91\xa5\xcc\xc0\x63\xbe\xf9\x44\x68\x73\xfe\xc9\x34\x01\
-\xf6\x05\x15\xf0\x5a\xff\x00\xc1\x66\xbe\x06\x96\xc7\xf6\x37\x8d\
-\xbf\xf0\x59\x6d\xff\x00\xc9\x35\xe8\xfe\x01\xff\x00\x82\x9d\x7e\
-\xcf\x9e\x3d\x9a\x1b\x75\xf1\xbf\xf6\x05\xe4\x9d\x21\xd7\xec\xe5\
-\xb3\x51\xfe\xf4\xa4\x34\x63\xfe\xfb\xa0\x0f\xab\x6b\xc0\x7f\x6d\
-\x0f\xd9\xb6\xdb\xf6\xa2\xf8\x1b\xab\xf8\x55\x44\x71\x6b\x90\x11\
-\x7d\xa3\x5d\x48\x71\xe5\x5d\xc6\x18\x05\x3f\xec\xba\x96\x46\xff\
-\x00\x78\x1e\xaa\x08\xf6\x9d\x0b\xc4\xda\x5f\x8a\x34\xb8\x35\x2d\
-\x1b\x53\xb3\xd5\xb4\xe9\xc6\x62\xbc\xb2\x9d\x66\x86\x4f\xf7\x5d\
-\x72\x0f\xe7\x5a\x2d\x0a\x1e\xd4\x01\xfc\xbc\xf8\x93\xc3\x3a\x97\
-\x83\xb5\xeb\xed\x13\x59\xb3\xb8\xd3\x75\x7b\x09\x9e\xde\xea\xd6\
-\x75\xdb\x24\x4e\xb9\xca\x91\xd8\xe4\x1c\xf6\xc7\x23\x20\xd7\xb0\
-\x6a\xbf\xb7\x3f\xc7\x0d\x63\xe1\xc5\xa7\x81\xee\x3c\x7b\xa9\x2e\
-\x87\x6d\x02\xda\x83\x0a\xa4\x57\x32\x42\x06\xd1\x1c\x97\x0a\x04\
-\xac\x31\xea\xc6\xbf\x61\xff\x00\x6a\x9f\xd8\x13\xe1\xcf\xed\x4b\
-\x72\xba\xc6\xa5\x1c\xfe\x1e\xf1\x6a\xc6\x23\x1a\xe6\x94\xaa\x24\
-\x99\x40\xc0\x13\xc6\xdc\x4a\x00\xc0\x0d\xf7\xc0\x00\x03\x80\x05\
-\x7c\x9d\xa4\xff\x00\xc1\x11\xd2\x3d\x59\x5b\x54\xf8\xa9\xe6\x69\
-\xaa\x73\xb6\xcf\x45\xdb\x29\x1f\xef\x3c\xc5\x7f\x4a\x00\xfc\xc3\
-\xd1\x74\x4b\xff\x00\x10\xea\xd6\xba\x5e\x95\x6b\x71\xa9\xea\x17\
-\x72\x2c\x36\xd6\xb6\xb0\xb4\xb2\x4a\xe7\xa2\xa8\x1c\x92\x7b\x0c\
-\x64\xfb\x57\xeb\x8f\xec\x21\xff\x00\x04\xcb\x87\xe1\x9d\xcd\x97\
-\xc4\x2f\x8b\x16\xb0\xea\x1e\x2a\x4d\xb3\x69\xbe\x1d\x3b\x64\x83\
-\x4c\x60\x32\x25\x9c\xf4\x92\x71\xc6\x00\xca\xa1\x19\xdc\xc4\x82\
-\x9f\x4f\xfe\xcd\xff\x00\xb1\x4f\xc2\xef\xd9\x9a\x15\x9f\xc2\xfa\
-\x27\xda\x7c\x40\xd1\x98\xe4\xd7\xb5\x37\x13\xde\xed\x3d\x55\x1b\
-\xa4\x4a\x7b\x84\x0a\x0f\x7c\xd7\xbe\x2d\xbc\x6a\x41\x0b\x8c\x0c\
-\x0f\x61\x9c\xf1\xe9\x40\x07\x92\xa4\xe4\x80\x4f\x3f\xad\x3b\xcb\
-\x53\xda\x9d\x50\xb4\x8e\xa3\xfc\xfe\x5d\x0e\x68\x03\xe1\x8f\xf8\
-\x2a\x27\xec\x92\xbf\x1a\x3e\x15\x8f\x1d\xf8\x76\xcd\x5b\xc6\x1e\
-\x15\x85\xe5\x91\x22\x00\xbd\xf5\x80\xcb\x49\x1f\x03\x2c\xea\x73\
-\x22\x83\xd7\xe7\x1d\x58\x57\xe3\x07\x86\xfc\x45\xa9\xf8\x3f\xc4\
-\x1a\x6e\xb7\xa3\xde\xc9\x63\xaa\x69\xd7\x29\x77\x69\x73\x11\x3b\
-\xa2\x91\x58\x32\x32\xfb\x64\x0c\xe6\xbf\xa8\x06\x64\x99\x76\x9f\
-\x99\x73\xd3\xae\x71\x9c\x8f\xd2\xbf\x0a\xbf\xe0\xa4\x1f\xb2\xa1\
-\xfd\x9d\xfe\x32\x4f\xac\x68\x96\x86\x2f\x03\xf8\xa2\x59\x2e\xf4\
-\xf2\xb9\xdb\x69\x3e\x41\x9a\xd7\x27\xa7\xcc\x44\x89\x9f\xe0\x71\
-\xfd\xd6\xa0\x0f\xd6\xef\xd9\x17\xf6\x94\xb1\xfd\xa7\xbe\x0b\xe8\
-\xfe\x2c\xb6\x78\x60\xd5\x90\x0b\x4d\x62\xc2\x33\x93\x6d\x76\xa8\
-\x0b\x81\xe8\xaf\x90\xeb\x9f\xe1\x60\x3a\x83\x5e\xe7\x5f\x80\x9f\
-\xf0\x4f\x9f\xda\xa5\xbf\x66\x6f\x8d\x56\xed\xaa\xdc\x94\xf0\x5f\
-\x88\x0a\x58\x6b\x28\xc7\x22\x11\x92\x62\xba\xc7\xf7\x91\x8f\x3f\
-\xec\x17\xef\x82\x3f\x7b\xad\xef\x05\xe4\x31\x4b\x04\xab\x2c\x52\
-\x2a\xba\xc8\x84\x32\xb2\x9e\x77\x03\xe9\x8e\x87\xbd\x00\x5d\xa2\
-\x8a\x28\x00\xa2\x8a\x6e\x4f\xe5\x40\x1c\xcf\xc4\x2f\x1f\x69\x3f\
-\x0c\xfc\x17\xac\xf8\xa7\x5f\xbd\x5b\x1d\x17\x49\xb7\x6b\xab\xa9\
-\xd8\x02\x55\x07\x3c\x0e\xe4\x9c\x28\x1d\xc9\x15\xfc\xed\xfe\xd2\
-\xdf\x1c\xb5\x9f\xda\x33\xe3\x0e\xbd\xe3\x6d\x59\x9a\x05\xbd\x90\
-\xad\x9d\x9e\xec\xad\xa5\xaa\x0d\xb1\xc2\x3d\xd5\x7e\xf1\xe8\x5b\
-\x76\x2b\xed\x8f\xf8\x2b\x87\xed\x60\x3c\x41\xae\xa7\xc1\x8f\x0d\
-\xdd\x86\xb0\xd2\x64\x17\x3e\x20\x9e\x06\xf9\x65\xb9\xc0\x31\xdb\
-\x64\x75\xd8\x3e\x76\x03\x8d\xcc\x07\x58\xce\x7e\x26\xfd\x9b\x3e\
-\x05\x6a\xff\x00\xb4\x87\xc6\x0d\x0b\xc0\xfa\x46\xe8\xfe\xd2\xfe\
-\x65\xdd\xe8\x19\x5b\x3b\x44\x21\xa4\x9b\x1d\xb0\x32\x00\xee\xce\
-\xa3\xb9\xa0\x0f\xb6\x7f\xe0\x91\x7f\xb2\x79\xd7\xbc\x41\x37\xc6\
-\x5f\x12\x59\xe7\x4e\xd3\x59\xed\x3c\x3f\x1c\x80\x15\x96\xe3\x05\
-\x65\xb9\xc1\xea\x23\x07\x6a\x91\xfc\x4c\x4f\x55\xc8\xfd\x71\x58\
-\xc6\x17\xfd\x9e\x9c\xd7\x37\xe0\x1f\x02\xe9\x1f\x0d\xfc\x1b\xa2\
-\xf8\x5b\x41\xb2\x4b\x2d\x1f\x48\xb5\x8a\xce\xd2\x05\x1f\x75\x14\
-\x63\x39\x3c\x92\x79\x24\x93\x92\x49\x24\x92\x49\xae\x9a\x80\x16\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x0e\
-\x0b\xe3\x57\xc2\x8d\x27\xe3\x87\xc2\xff\x00\x11\x78\x1f\x5c\x0e\
-\x34\xcd\x6a\xd8\xc0\xf2\xc7\xd6\x17\x18\x64\x91\x7d\xd5\xc2\x9f\
-\xc2\xbf\x9d\xcf\x8e\x1f\x06\xfc\x41\xf0\x0b\xe2\x76\xbb\xe0\x8f\
-\x12\xc2\xd1\xdf\x69\xf2\x9c\x4c\xa1\x96\x2b\xa8\x8f\xfa\xb9\xa3\
-\xe7\xe6\x57\x52\x08\x3d\x8e\x41\xe4\x1a\xfe\x97\xb6\x2e\xe0\x71\
-\xcf\x4a\xf9\x5b\xf6\xf6\xfd\x8d\x6c\xbf\x6a\xcf\x86\xea\xfa\x62\
-\x5b\xda\x78\xf3\x46\x56\x7d\x22\xfa\x40\x14\x4d\x93\x96\xb6\x95\
-\xbf\xb8\xe7\x38\x27\xee\x39\x04\x60\x17\xc8\x07\xc4\x5f\xf0\x4c\
-\x2f\xdb\x89\x7e\x1d\x6a\x56\xbf\x08\xbc\x71\x7e\x23\xf0\xc6\xa1\
-\x3e\xdd\x13\x51\xba\x93\xe5\xb0\xb9\x73\xfe\xa1\xd8\xfd\xd8\x9d\
-\xce\x41\xe8\xae\xc4\xf0\x1b\x8f\xd8\x05\x66\x6c\x9d\xd8\x03\xdb\
-\xdf\xfc\x2b\xf9\x7c\xf1\x17\x87\x75\x3f\x06\xeb\xd7\x7a\x36\xad\
-\x65\x35\x86\xab\x61\x23\x43\x73\x67\x72\xb8\x78\x9d\x73\xb9\x19\
-\x7b\x60\xe7\xea\x39\x1c\x1a\xfd\x9f\xff\x00\x82\x52\xfe\xd2\xbe\
-\x23\xf8\xdd\xf0\x9f\x5a\xf0\xdf\x8a\x64\x97\x50\xd4\xfc\x22\xf6\
-\xf0\x41\xaa\x48\xa4\xbd\xc5\xbc\xa1\xf6\x2c\x8d\xfc\x4e\x9b\x08\
-\x27\xa9\x52\xa4\xe4\x9c\xd0\x07\xdd\x94\x51\x45\x00\x37\xcb\x5d\
-\xb8\xc7\x1f\xce\xb9\xaf\x88\x5f\x0e\x7c\x37\xf1\x4b\xc2\x37\xde\
-\x19\xf1\x56\x8d\x6b\xae\x68\x97\xab\xb6\x7b\x3b\xa5\xca\xb7\xa1\
-\x04\x72\xac\x3b\x32\x90\x47\x62\x2b\xa7\xa2\x80\x3f\x11\x3f\x6c\
-\x8f\xf8\x26\x5f\x8a\x3e\x05\xfd\xbf\xc5\x7e\x01\x4b\xbf\x16\x78\
-\x15\x59\xa4\x78\xd5\x3c\xcb\xfd\x39\x3f\xe9\xaa\xaf\xfa\xc8\xff\
-\x00\xe9\xaa\x8c\x8f\xe2\x00\x7c\xd5\xf1\x76\x8b\xac\x6a\x3e\x19\
-\xd5\x2d\x75\x4d\x2a\xf2\xe7\x4d\xd4\xad\x5f\xcf\xb7\xbc\xb2\x91\
-\xa2\x92\x17\x1d\x1d\x19\x48\x20\xaf\xa8\xc6\x3d\x2b\xfa\x88\xf2\
-\x51\x7a\x2e\x3e\x9e\xfd\x4d\x7c\x4d\xfb\x54\x7f\xc1\x30\xfc\x03\
-\xf1\xea\x4b\xcd\x7f\xc2\x72\x43\xe0\x3f\x18\xca\x4c\x8d\x35\xa4\
-\x20\xd8\x5d\x3f\xf1\x79\xb0\x0c\x6d\x62\x7e\xf4\x89\x83\xea\xad\
-\x40\x1f\x31\xfe\xcc\x7f\xf0\x57\x6d\x77\xc2\xb6\xb6\x7a\x17\xc5\
-\xfd\x2e\x4f\x11\x69\xcb\x88\xe1\xf1\x16\x99\x1a\xad\xe2\xaa\x80\
-\x3f\x7b\x17\x09\x36\x32\x32\x54\xab\x0e\xe1\xab\x8b\xfd\xa3\x7f\
-\xe0\xad\x9f\x10\xfe\x26\x35\xce\x95\xf0\xe9\x4f\xc3\xed\x01\x86\
-\xcf\xb4\xc6\x44\xba\x94\xcb\xfe\xd4\xb8\xdb\x17\xd2\x30\x4f\xfb\
-\x75\xf3\x77\xc7\xaf\xd9\x27\xe2\x8f\xec\xe7\xa8\x4b\x1f\x8d\x3c\
-\x3b\x3c\x1a\x7e\xff\x00\x2e\x3d\x66\xcb\x33\xd8\xcf\xd3\x01\x65\
-\x51\xf2\xf6\xf9\x5c\x29\xe3\xa5\x78\xe8\x8f\x74\x83\x71\xdb\xdf\
-\x24\x8c\xe3\xd7\x9c\x64\xfe\x34\x01\xa3\xaf\xf8\x8b\x54\xf1\x76\
-\xa9\x3e\xa3\xac\x6a\x57\x5a\xae\xa3\x31\xdd\x25\xdd\xf4\xed\x2c\
-\xaf\xee\xce\xe7\x35\x27\x86\xbc\x1f\xaf\x78\xd2\xf8\x69\xfe\x1f\
-\xd1\x75\x2d\x6e\xf4\x8c\xfd\x97\x4d\xb4\x92\xe2\x4f\xfb\xe1\x14\
-\x9f\xd0\xd7\xa4\xfe\xce\xff\x00\x17\xfc\x23\xf0\x8b\xc4\xc3\x56\
-\xf1\x4f\xc2\xfd\x27\xe2\x5d\xba\xcb\x1c\x8b\x16\xa9\x71\x2a\x35\
-\xbe\xcc\xe4\xa0\x19\x8c\xe7\x23\x89\x11\xc5\x7e\xa9\xfc\x13\xff\
-\x00\x82\xa5\x7e\xcf\x3a\x96\x8f\x67\xa3\xc9\x6b\x73\xf0\xc1\x22\
-\x0a\xab\x61\x71\xa6\x28\xb1\x8d\x8f\x68\xde\xd8\x32\x85\x1e\xae\
-\xb1\xd0\x07\xe4\x91\xfd\x99\x7e\x2f\x2a\xee\x6f\x85\x7e\x34\x09\
-\xff\x00\x62\xfd\xd7\xff\x00\x1b\xae\x23\x58\xd0\x35\x1f\x0e\xdf\
-\xc9\x63\xaa\xe9\xf7\x5a\x5d\xdc\x47\x6c\x96\xf7\x70\xbc\x52\x03\
-\xdf\x2a\xc0\x11\xc7\x63\x8a\xfe\x93\xfc\x21\xfb\x40\x7c\x36\xf8\
-\x81\x07\x9b\xe1\xdf\x1e\x78\x7b\x59\x42\x70\x05\xae\xa7\x13\x36\
-\x7f\xdd\xdd\x9a\xd2\xf1\xf7\xc3\x1f\x07\xfc\x56\xd1\x5f\x4a\xf1\
-\x67\x87\x34\xaf\x12\x69\xcc\x18\x08\x75\x1b\x54\x9b\x69\x61\x82\
-\x50\x9e\x51\xbd\xd4\x83\xef\x40\x1f\xce\xaf\xc1\xdf\xda\x03\xc7\
-\xff\x00\x01\x35\xe8\xf5\x7f\x03\xf8\x92\xf3\x44\x9b\x23\xce\x82\
-\x37\xdd\x6f\x70\x07\x51\x2c\x4d\x94\x71\xee\x41\x35\xfb\x11\xfb\
-\x16\xff\x00\xc1\x48\x3c\x37\xfb\x4b\x7d\x97\xc3\x1e\x27\x8a\xdb\
-\xc2\xdf\x10\x88\xc0\xb5\x8d\x88\xb4\xd4\x31\xd4\xdb\x97\x39\x0d\
-\xeb\x1b\x1c\xff\x00\x74\xb5\x7c\xdb\xfb\x63\x7f\xc1\x27\xdb\x45\
-\xb0\xba\xf1\x67\xc1\x58\xee\xaf\x6d\xe1\x0f\x35\xcf\x84\xe6\x90\
-\xcb\x2a\xa8\x1f\x31\xb4\x90\xf2\xf8\xff\x00\x9e\x4c\x72\x7f\x84\
-\x93\xf2\xd7\xe6\x95\xbc\xd7\xba\x25\xfc\x77\x10\xcd\x3d\x8d\xe5\
-\xb4\xaa\xe9\x2a\xb3\x24\xb1\xc8\xbd\x30\x41\xf9\x58\x76\xe4\x11\
-\x40\x1f\xd4\x5e\xd4\x60\x57\x03\xaf\x39\x18\xc9\xf7\x15\x36\xd1\
-\xd7\x1c\xe3\x15\xf1\x47\xfc\x13\x9f\xf6\xd8\x5f\xda\x33\xc0\xf2\
-\xf8\x6f\xc5\x57\x08\x9e\x3d\xd0\x21\x1f\x68\x99\xb0\x8b\xa8\xda\
-\x83\x84\xb9\x51\xd0\x32\x93\xb5\xc7\x41\xf2\x9e\x84\xed\xfa\x3f\
-\xc6\x9f\xb4\x87\xc2\xdf\x87\x71\xef\xf1\x1f\xc4\x1f\x0e\x69\x07\
-\xfe\x79\xdc\x6a\x51\x09\x3f\xef\x80\x77\x7e\x94\x01\xe9\x24\x03\
-\xd7\x9a\x89\xa4\x38\xf9\x7a\x91\x91\xe8\x7e\x87\xff\x00\xad\x5f\
-\x0e\x7c\x50\xff\x00\x82\xbe\x7c\x15\xf0\x5c\x72\xc5\xe1\xa4\xd6\
-\x7c\x73\x7c\x14\xec\xfb\x0d\xaf\xd9\xad\x83\x7f\x75\xa5\x9b\x04\
-\x7d\x55\x18\x57\xc5\x1f\x18\xff\x00\xe0\xad\x9f\x17\xbe\x22\x34\
-\xf6\x7e\x17\x4b\x1f\x87\xba\x64\x87\x1b\xb4\xdf\xf4\x8b\xc2\xb9\
-\xcf\x33\xb8\x38\xe3\xfb\xa8\x28\x03\xf5\xcb\xe3\x37\xed\x0d\xe0\
-\x2f\x80\x7a\x1b\xea\x5e\x36\xf1\x35\x8e\x88\x0a\x33\xc1\x6b\x24\
-\x81\xee\xa7\xc7\xfc\xf3\x81\x4e\xf7\xfc\x38\xf5\x22\xbf\x30\x7f\
-\x69\xef\xf8\x2b\x77\x8a\x7c\x77\x1d\xe6\x81\xf0\xa2\xd2\x6f\x07\
-\xe8\x8d\x98\xdf\x5b\xb9\xc1\xd4\x67\x40\x79\x31\x8f\xbb\x00\x23\
-\xb8\x0c\xde\xeb\x5f\x9f\x7a\xff\x00\x88\xb5\x6f\x16\x6a\xd3\xea\
-\x9a\xd6\xa7\x79\xac\x6a\x73\x9c\xcd\x7d\xa8\x5c\xb4\xf2\xb9\xf5\
-\x32\x3b\x12\xdf\x89\xaf\x63\xfd\x9e\xff\x00\x62\xff\x00\x8a\x9f\
-\xb4\x95\xe4\x0d\xe1\x5d\x02\x4b\x6d\x18\xba\x89\x35\xed\x4f\x75\
-\xbd\x8c\x7d\x39\x12\x60\x97\x3c\xfd\xd8\xc1\x3e\xd4\x01\xf7\x87\
-\xfc\x12\x7b\xf6\xc0\x9b\xc4\x66\xeb\xe1\x07\x8b\xf5\x39\x6e\x35\
-\x35\x32\x5f\xe8\x57\x97\x93\x99\x64\x9c\x1c\xb4\xf6\xc5\x98\xe4\
-\xb0\x25\xa4\x5c\x92\x4a\xef\x1f\xc2\x2b\xed\x9f\xda\x8b\xe0\x0e\
-\x95\xfb\x4a\x7c\x1b\xd7\x3c\x15\xa9\x84\xb7\xb8\xb8\x5f\x3a\xc2\
-\xf9\xd4\xb7\xd8\xee\xd4\x9f\x2a\x5c\x81\xd3\x3f\x2b\x01\xfc\x2e\
-\xe3\xa5\x79\x2f\xec\xa3\xff\x00\x04\xe4\xf0\x07\xec\xd9\x35\xa7\
-\x88\x2f\x4b\x78\xb7\xc7\x50\x80\xe9\xab\x5e\x26\xd8\xad\x5c\x82\
-\x09\xb7\x8b\x9d\x9f\xef\x36\xe6\xf7\xaf\xae\x92\x14\x5e\x8a\x07\
-\x39\xa0\x0f\xe6\x03\xc6\xde\x0b\xd6\x7e\x1d\x78\xaf\x59\xf0\xd6\
-\xbd\x67\x26\x9f\xac\x69\x77\x4f\x67\x77\x6b\x20\xc1\x59\x11\xb0\
-\xdf\x55\x3c\x10\x7f\x88\x10\xde\x95\xfa\xf3\xff\x00\x04\xa4\xfd\
-\xac\x3f\xe1\x67\x78\x01\xbe\x18\xf8\x8a\xf0\x4b\xe2\x7f\x0d\x41\
-\x9d\x3a\x59\x5b\x12\x5e\x69\xc0\x81\xb4\xff\x00\x79\xe2\xdc\x01\
-\x1d\x76\x95\x3d\x41\xae\x33\xfe\x0a\xe7\xfb\x29\x1d\x67\x47\x8b\
-\xe3\x47\x87\x2c\xb7\x5e\xd8\x22\x59\xf8\x86\x18\x94\xee\x92\x01\
-\x85\x8a\xeb\x1f\xf4\xcf\x88\xc9\xfe\xe9\x43\xd1\x6b\xf3\x43\xe1\
-\x0f\xc5\x2d\x77\xe0\xaf\xc4\x6f\x0e\xf8\xd3\xc3\xb3\xf9\x3a\xa6\
-\x91\x72\xb3\xc6\xad\xf7\x25\x5e\x8d\x1b\x7f\xb2\xea\x59\x0f\xd7\
-\x3d\x79\xa0\x0f\xe9\xae\x96\xbc\xf3\xe0\x8f\xc6\x4d\x13\xe3\xbf\
-\xc3\x1d\x0f\xc6\xde\x1c\x97\x76\x9d\xaa\x5b\x89\x3c\xa6\x70\x5e\
-\xde\x41\xf2\xc9\x13\xf1\x80\xe8\xe1\x94\x8f\x60\x7a\x11\x5e\x87\
-\x40\x08\x5b\x15\xf3\xe7\xed\xb5\xfb\x4d\x59\xfe\xcb\xbf\x04\x75\
-\x5f\x10\x07\x8e\x4f\x11\xdf\x1f\xb0\xe8\x96\x4d\xd6\x4b\x96\x5f\
-\xbe\x47\x74\x8d\x72\xe7\xb7\xca\x17\xab\x0a\xf7\x5d\x47\x50\x87\
-\x4d\xb7\x9e\xea\xf2\x74\xb6\xb4\x81\x0c\x92\xcb\x2b\x05\x44\x45\
-\x05\x99\x99\x8f\x40\x00\x24\x93\xc6\x05\x7e\x00\x7e\xdd\xff\x00\
-\xb5\x14\xbf\xb4\xf7\xc6\xab\xed\x5a\xca\x59\x3f\xe1\x12\xd2\x77\
-\xd8\x68\x90\xb7\x1f\xb9\x52\x37\x4c\x47\x66\x91\x80\x7f\xf7\x76\
-\x0e\x08\x34\x01\xf3\xce\xa9\xab\x5e\x6b\xda\xa5\xd6\xa1\x7d\x71\
-\x25\xd6\xa1\x75\x33\x4d\x3c\xf2\x31\x66\x92\x47\x62\xce\xcd\x9e\
-\xad\xb9\xbf\x3a\xfd\xc3\xff\x00\x82\x68\xfe\xca\x3f\xf0\xcf\xbf\
-\x09\x13\xc4\x5a\xe5\x8f\x91\xe3\x7f\x15\x2a\x5d\x5e\x09\x57\xf7\
-\x96\x76\xb8\xdd\x15\xb1\x3f\xc2\x70\x44\x8e\x06\x3e\x76\x50\x78\
-\x41\x8f\x81\xff\x00\xe0\x98\x1f\xb2\x90\xf8\xed\xf1\x6c\x78\xc3\
-\x5e\xb1\xf3\xfc\x1b\xe1\x39\x92\x69\x56\x55\x06\x3b\xcb\xd1\x86\
-\x86\x0f\xf6\xb6\xff\x00\xac\x6e\xd8\x0a\x0f\x0d\x5f\xb8\x8b\x1f\
-\xf7\xa8\x02\x4d\xa2\x96\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa8\xda\x14\x91\x58\x32\xee\
-\x0d\xd4\x1e\x47\xbd\x49\x45\x00\x7c\x9f\xfb\x54\x7f\xc1\x3c\x7e\
-\x1c\x7e\xd4\x5a\xfc\x5e\x22\xd4\x27\xbd\xf0\xbf\x8a\x76\x08\xe6\
-\xd4\xb4\x8f\x2f\x37\x88\xbc\x01\x2c\x6c\x08\x76\x51\x81\xb8\x61\
-\xb0\x14\x67\x00\x01\xea\x7f\xb3\x8f\xec\xd3\xe0\xcf\xd9\x87\xc0\
-\x67\xc3\x5e\x0e\x86\x76\x86\x69\x8d\xc5\xe5\xf5\xec\x82\x4b\x8b\
-\xb9\x8a\x85\xdf\x23\x00\x07\x40\x06\x00\x00\x7a\x57\xad\xf9\x6b\
-\xc8\xc7\x07\xa8\xa0\x20\x5e\x83\x9c\x63\x3d\xe8\x01\xd4\x55\x6b\
-\x8b\xb4\xb5\x86\x59\xe6\x95\x62\xb7\x89\x4b\xbc\x8e\x70\x14\x00\
-\x73\x9f\x61\x8c\xd7\xc4\x1a\x87\xfc\x16\x07\xe0\xae\x9d\xe3\xb7\
-\xd0\xbe\xc9\xe2\x2b\x9d\x26\x39\xbc\x87\xf1\x1c\x36\x51\x9b\x53\
-\xff\x00\x4d\x16\x3f\x33\xcd\x31\xfb\xec\xdd\xe8\xa6\x80\x3e\xe8\
-\xa2\xb9\xff\x00\x0a\xf8\xdb\x48\xf1\xc7\x87\x2c\x35\xef\x0f\xea\
-\x56\xda\xc6\x8f\x7d\x1a\xcb\x6f\x7b\x67\x20\x92\x29\x10\xf7\x04\
-\x77\xf6\x38\x3e\xd9\xe2\xba\x0a\x00\x4a\x6f\x92\x9c\x7c\xbf\xe7\
-\xb5\x3e\x8a\x00\xa5\xa9\x68\xf6\x5a\xc5\x8c\xd6\x77\xf6\x70\x5f\
-\x59\xcc\xbb\x25\xb7\xb9\x8c\x49\x1c\x8b\xfd\xd6\x56\x04\x11\xec\
-\x6b\xe2\xff\x00\x8e\x5f\xf0\x4a\x1f\x83\xff\x00\x14\xe4\x9a\xff\
-\x00\xc3\x11\xdc\x7c\x38\xd5\xe4\x3b\xc7\xf6\x42\x87\xb2\x76\xf7\
-\xb5\x72\x15\x7e\x91\xb2\x0a\xfb\x76\x9b\xe5\xa8\xcf\x1d\x7a\xfb\
-\xd0\x07\xe1\x87\xc5\xaf\xf8\x25\x07\xc6\xef\x87\xed\x34\xda\x15\
-\x9e\x9f\xe3\xdd\x3d\x0f\x12\x68\xf3\x6c\xb8\x03\x6e\xef\x9a\x09\
-\x76\x91\xd3\x1f\x2b\x35\x7c\xa3\xe2\xff\x00\x87\xbe\x29\xf8\x7b\
-\xa9\x0b\x2f\x13\xf8\x7b\x56\xf0\xe5\xef\x51\x16\xab\x65\x2d\xab\
-\x9f\xa7\x98\x06\x45\x7f\x4f\x66\x25\x38\xc8\x07\x1d\x3d\xaa\x9e\
-\xb1\xe1\xfd\x3b\xc4\x1a\x7c\xb6\x3a\xad\x8d\xb6\xa7\x65\x28\xc4\
-\x96\xd7\x90\xac\xd1\xb8\xf4\x2a\xc0\x83\x40\x1f\xcb\x68\x69\x1a\
-\x4c\xa9\x66\x7c\xe4\x15\xe5\xb3\xf5\xae\x97\x45\xf8\xa9\xe3\x4f\
-\x0e\x48\x8d\xa4\x78\xb7\x5c\xd2\xca\xf4\xfb\x1e\xa3\x34\x7f\xc9\
-\xab\xfa\x01\xf1\x77\xec\x29\xf0\x1b\xc7\x13\x4b\x3e\xa5\xf0\xc3\
-\x41\x59\xa5\xff\x00\x96\xb6\x10\x35\xa1\x1f\x84\x4c\xa3\xf4\xaf\
-\x25\xd6\xbf\xe0\x91\xbf\xb3\xee\xa2\x8d\xf6\x6d\x3f\x5f\xd2\x99\
-\xba\x35\xae\xae\xe7\x1f\xf7\xf0\x35\x00\x7e\x45\xdb\xfe\xd7\x5f\
-\x1b\xad\x63\xd9\x0f\xc5\x9f\x1a\x46\xbc\x70\x35\xbb\x8e\xc3\x1f\
-\xdf\xf4\xaf\x37\xf1\x07\x8a\x35\x5f\x16\x6b\x57\xba\xbe\xb7\xa8\
-\x5c\x6a\x9a\xa5\xf4\x86\x6b\xab\xcb\xa9\x0c\x92\xce\xe7\xab\x3b\
-\x1e\x58\xfb\x9a\xfd\x89\xba\xff\x00\x82\x2c\x7c\x20\x9a\x4c\xc5\
-\xe2\xdf\x1a\x5b\xaf\xf7\x16\xe6\xd5\xbf\x9c\x14\xeb\x5f\xf8\x22\
-\xd7\xc1\xf8\x64\x56\x9f\xc5\x7e\x33\xb9\x5e\xf1\xb5\xcd\xaa\xfe\
-\xa2\x0a\x00\xfc\x6b\xb5\xd4\x2e\x6c\x37\xb5\xac\xd2\x5b\x96\x52\
-\x8c\xd1\xb1\x52\xca\x46\x0a\x9c\x75\x04\x70\x47\x7e\xf5\x19\x66\
-\x8d\xf8\x5f\x2c\xe7\x8c\x7c\xbf\x8f\xad\x7e\xe6\xe8\xff\x00\xf0\
-\x49\x3f\xd9\xeb\x4d\x11\xb4\xfa\x4e\xb9\xaa\x32\x74\x37\x5a\xbc\
-\x83\x77\xfd\xfb\xdb\x5e\xbd\xe0\xff\x00\xd8\x87\xe0\x4f\x81\x65\
-\x13\x69\x5f\x0c\x3c\x3e\x26\x0b\xb4\x4b\x79\x6d\xf6\xb3\x8f\xfb\
-\x6c\x5e\x80\x3f\x9f\x7f\x05\x7c\x34\xf1\x87\xc4\xed\x40\x59\x78\
-\x53\xc3\x5a\xcf\x89\xee\xc0\x0a\x61\xd2\xec\xa4\xba\x64\x1e\xfb\
-\x01\xda\x3d\xce\x05\x7d\x77\xf0\x97\xfe\x09\x25\xf1\x97\xc7\x52\
-\x43\x37\x8a\xbf\xb3\xfc\x03\xa7\xff\x00\x17\xf6\x84\xdf\x68\xba\
-\x3c\xa8\xf9\x62\x8b\x20\x70\xdf\xc4\xe3\xa5\x7e\xdb\x69\xfa\x4d\
-\x8e\x91\xa7\xc3\x63\x61\x67\x6f\x63\x63\x0a\xec\x8e\xda\xda\x35\
-\x8e\x24\x5f\xee\xaa\xa8\x00\x0f\x61\x56\x04\x28\xa0\x00\xa0\x01\
-\xd0\x7a\x77\xa0\x0f\x8d\xfe\x04\xff\x00\xc1\x2d\x7e\x0d\xfc\x1d\
-\x92\xdf\x52\xd5\x6c\xe6\xf1\xfe\xbb\x19\x0c\x2e\xb5\xd0\xad\x6c\
-\x87\xfd\x8b\x75\xc2\x7f\xdf\xcd\xf5\xf6\x0d\x9e\x9d\x6f\x63\x6f\
-\x1c\x16\xf0\x47\x04\x11\xae\xc4\x8a\x24\x0a\xa8\xbf\xdd\x00\x70\
-\x07\xb0\xab\x1b\x46\x73\x8e\x7d\x69\xd4\x00\xd0\xa0\x00\x00\xc0\
-\x1d\x00\xe2\x96\x96\x8a\x00\xce\xd6\xf4\x1b\x1f\x11\x69\x37\xda\
-\x5e\xa3\x6d\x1d\xe6\x9f\x7d\x0b\xdb\xdd\x5b\xcc\x32\x93\x46\xea\
-\x55\x95\x87\x70\x41\x22\xbf\x9e\x9f\xdb\x33\xf6\x6b\xbc\xfd\x97\
-\x7e\x36\x6b\x1e\x19\x65\x92\x6f\x0f\x5d\x03\x7b\xa2\x5e\x37\xdd\
-\x9a\xd5\x98\xe1\x09\xee\xf1\x9d\xd1\x9f\x70\x0f\x46\x15\xfd\x13\
-\x6d\x15\xf3\x27\xed\xe7\xfb\x2d\x41\xfb\x50\x7c\x13\xbc\xd3\xec\
-\x61\x8d\x7c\x63\xa3\xee\xbe\xd1\x26\x6e\x09\x94\x0f\x9a\x02\x4f\
-\x41\x2a\x80\xbe\xcf\xb0\xf6\x34\x01\xf9\xd9\xff\x00\x04\xab\xfd\
-\xac\x1b\xe1\x1f\xc4\xe7\xf8\x73\xe2\x1b\xd1\x1f\x84\x7c\x57\x3a\
-\x8b\x69\x26\x7c\x25\x96\xa1\x80\xaa\xc4\x9e\x02\xc8\x31\x19\xff\
-\x00\x6b\xcb\x3d\x01\xaf\xda\x8f\x38\x95\x18\x3c\xfa\x63\x9e\x99\
-\xc6\x3b\x1c\x57\xf2\xe5\x79\x67\x73\xa3\x6a\x13\x5b\xcf\x13\xd9\
-\xde\xda\xc8\x51\xa3\x70\x52\x48\x9d\x58\x86\x04\x76\x65\x20\x83\
-\xdc\x10\x31\x5f\xb2\xff\x00\xb3\x47\xfc\x14\x43\x43\xba\xfd\x90\
-\x35\xcf\x16\xf8\xd2\xeb\x77\x8b\xfc\x0d\x6f\x1d\x9e\xa1\x6a\x58\
-\x79\xda\xa4\x8e\x0a\x5a\x3a\x8c\xe7\x32\x1f\x91\xba\xed\x64\x73\
-\xd2\x80\x39\xcf\xf8\x2b\x57\xed\x60\x3c\x1b\xe0\xb1\xf0\x8b\xc3\
-\x97\x5b\x75\xad\x76\x21\x36\xb5\x24\x64\x6e\x82\xc4\xb0\xdb\x09\
-\x3d\x9a\x62\xa4\xe3\x8f\xdd\xa9\xfe\xf5\x7e\x52\x7c\x37\xf8\x7b\
-\xac\xfc\x56\xf1\xe6\x87\xe1\x2d\x02\xd9\xaf\x35\x6d\x62\xe5\x6d\
-\x6d\xa1\xcf\x72\x7e\xf3\x7a\x2a\x8c\xb3\x1e\xc1\x4d\x4d\xf1\x3b\
-\xe2\x36\xb5\xf1\x6b\xc7\x9a\xdf\x8b\xbc\x41\x72\x6e\xb5\x8d\x62\
-\xea\x4b\xa9\xe4\xc9\xd8\x09\x38\x0a\x83\xb2\x22\xe0\x0f\x40\x31\
-\x5f\xaa\x1f\xf0\x49\x1f\xd9\x4f\xfe\x10\xdf\x0a\x4b\xf1\x83\xc4\
-\x56\x98\xd5\xf5\xb8\x8c\x1a\x12\x4a\xbc\xc1\x65\xb8\xee\x9c\x67\
-\xa3\x4a\x73\x8e\xfb\x07\xfb\x7c\x80\x7d\xad\xfb\x3c\x7c\x0d\xd1\
-\x3f\x67\x7f\x84\xba\x0f\x82\x74\x48\xd3\xc9\xb0\x80\x1b\x9b\x9d\
-\xb8\x7b\xab\x86\x19\x9a\x76\xff\x00\x69\x9b\x1f\x40\x14\x0c\x05\
-\x00\x7a\x7d\x37\x68\xf4\xa7\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x07\x37\xe3\xef\x0c\xaf\x8d\xbc\x15\xaf\xf8\x79\
-\xe7\x6b\x58\xf5\x7d\x3e\xe2\xc1\xae\x23\x3f\x3c\x62\x58\xda\x30\
-\xeb\xee\x37\x66\xbf\x9d\x5f\x8f\x9f\xb3\xaf\x8d\x7f\x67\x1f\x19\
-\x4b\xe1\xbf\x19\xe9\x72\x59\x93\xba\x4b\x3b\xe8\x8e\xfb\x4b\xd8\
-\xbb\x49\x0b\x8c\x06\x07\xba\xf0\xcb\xfc\x42\xbf\xa4\xc1\x1a\x8c\
-\xf1\xd7\x9f\xf3\xf9\x57\x17\xf1\x4b\xe1\x0f\x84\x3e\x33\xf8\x4e\
-\xf3\xc3\x7e\x32\xd0\xed\x75\xdd\x1e\xe8\x61\xa1\xb8\x4e\x62\x7f\
-\xf9\xe9\x1b\x8c\x32\x3f\xfb\x6a\x41\x1e\xb4\x01\xf8\x09\xfb\x34\
-\x7e\xd7\x5f\x10\xff\x00\x66\x0d\x70\x5c\x78\x53\x54\xfb\x4e\x89\
-\x2c\x81\xef\x34\x0b\xd2\xd2\x59\xdc\x9e\x79\xdb\xd5\x1f\x8e\x1d\
-\x30\x47\x73\x5f\xb1\xdf\xb2\xef\xfc\x14\x13\xe1\xc7\xed\x39\x6f\
-\x0e\x9d\x69\x78\xbe\x19\xf1\xa1\x03\xcc\xf0\xee\xa9\x22\x87\x7f\
-\x53\x04\x9c\x2c\xe3\xe9\x86\xf5\x55\x1c\xd7\xe7\xdf\xed\x61\xff\
-\x00\x04\xad\xf1\x7f\xc2\x77\xbd\xf1\x17\xc3\x43\x71\xe3\x5f\x09\
-\x2a\xb4\xef\x64\x00\x6d\x4e\xcd\x70\x78\x2b\xd2\x65\xeb\xca\xe1\
-\x8f\xf7\x6b\xe1\x3b\x45\xbe\xb2\xd5\x22\x16\xe2\xe2\x1d\x42\x39\
-\x57\xcb\xf2\x89\x13\x24\xa0\xf6\xc6\x08\x6c\xfa\x73\x9e\x3a\xd0\
-\x07\xf5\x16\xb3\x33\x01\xfc\xf1\x8f\xd3\xb5\x58\xaf\x3f\xf8\x1a\
-\xfa\xfc\x9f\x07\xbc\x09\x27\x8a\xd6\x51\xe2\x79\x34\x3b\x13\xaa\
-\x19\x97\x12\x7d\xa7\xc8\x53\x26\xfc\x7f\x16\xed\xdb\x87\x40\x4e\
-\x07\x15\xdf\xd0\x02\xd1\x49\x90\x7a\x1a\x37\x0f\x5a\x00\x5a\x4a\
-\x33\x4b\x40\x09\x81\xf5\xa0\x28\x1d\x06\x3e\x94\xb4\x50\x02\x63\
-\xb5\x14\xb4\x50\x02\x6d\x07\xa8\xcd\x2d\x14\x50\x01\x45\x14\x50\
-\x01\x45\x26\x40\xea\x6a\x15\x99\xb3\xb5\xb6\x86\x3d\x39\xc7\xe9\
-\xff\x00\xeb\xfa\xd0\x04\xf4\x57\xcf\x7f\x15\x3f\x6e\xcf\x82\x7f\
-\x06\xf5\x88\xf4\x9f\x11\x78\xea\xcc\xea\x66\x4d\x92\x5a\x69\xa8\
-\xf7\x92\x41\xef\x2f\x94\x18\x27\xe2\x45\x7b\x07\x82\xbc\x77\xa3\
-\x7c\x44\xf0\xcd\x87\x88\xfc\x35\xab\x5a\x6b\x7a\x16\xa0\x81\xed\
-\xaf\xac\xdf\x7c\x6e\x33\xb7\x83\xeb\x9c\x82\x08\xc8\x20\xe7\xd2\
-\x80\x3a\x4a\x89\xa1\x4d\xbc\xae\x7e\xbc\xd4\xb4\x94\x01\xf8\xe7\
-\xff\x00\x05\x66\xfd\x94\x5b\xc0\xfe\x35\x5f\x8b\xbe\x1d\xb5\x11\
-\xe8\x5a\xf4\xc2\x2d\x66\x28\xd7\x8b\x5b\xe2\xbf\x2c\xd8\xec\xb3\
-\x2a\x9e\x47\x1e\x62\x9f\xef\x8a\xfc\xea\x37\x32\xf9\x7b\x37\x36\
-\xce\x32\xbd\xb8\xce\x0e\x3d\x79\x3f\x99\xf5\x35\xfd\x37\xfc\x51\
-\xf8\x6f\xa2\x7c\x59\xf8\x7f\xae\xf8\x47\xc4\x16\x9f\x6a\xd2\x75\
-\x7b\x67\xb6\x99\x40\xcb\xae\x71\xb5\xd4\xf6\x64\x60\x18\x7a\x15\
-\x18\xe9\x5f\x85\xff\x00\x10\x3f\xe0\x9c\xff\x00\x1b\xfc\x17\xf1\
-\x06\xe7\xc3\x56\x5e\x0a\xd4\x3c\x47\x6e\xf7\x2d\x1d\x9e\xad\xa7\
-\x22\xb5\xad\xcc\x5d\x52\x4d\xf9\x1b\x38\xfb\xc1\x80\x2b\xef\x40\
-\x19\x1f\xb0\xdf\xec\xc3\x71\xfb\x51\x7c\x6a\xb4\xd1\xee\x52\x51\
-\xe1\x5d\x30\x2d\xfe\xb9\x73\x19\x23\x16\xe0\xf1\x08\x61\xce\xe9\
-\x48\xd8\x30\x73\x82\xc7\xf8\x6b\xfa\x0d\xd3\x74\x9b\x3d\x2f\x4f\
-\xb6\xb2\xb3\xb6\x8e\xd6\xd2\xda\x35\x86\x18\x22\x5d\xa9\x1a\x2a\
-\x85\x55\x00\x70\x00\x00\x00\x3d\x85\x78\x1f\xec\x4b\xfb\x30\xd9\
-\xfe\xcb\x5f\x05\xec\xb4\x09\x12\x09\x7c\x4f\x7c\xc2\xf7\x5b\xbc\
-\x8b\x9d\xf7\x04\x7c\xb1\xab\x1e\xa9\x18\x3b\x46\x3d\x58\xf5\x62\
-\x4f\xd1\x0b\xd2\x80\x16\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x93\x68\xa5\xa2\x80\x1a\xd1\xab\x75\x19\
-\x3d\x8f\x71\xf4\xf4\xae\x2a\x6f\x82\x7f\x0f\xee\x3c\x62\x3c\x5b\
-\x2f\x81\xbc\x39\x27\x8a\x43\xf9\x9f\xdb\x4f\xa5\x40\x6f\x37\x63\
-\x1b\xbc\xed\x9b\xb7\x63\x8c\xe7\x38\xe2\xbb\x7a\x28\x02\x35\x85\
-\x57\x00\x0e\x31\x8a\x59\x05\x3e\x98\xe0\x9e\x94\x01\xf9\x9f\xfb\
-\x62\x7f\xc1\x53\x7c\x49\xf0\x73\xe2\xfe\xaf\xe0\x4f\x01\x78\x7f\
-\x4b\xb9\x5d\x06\x64\x86\xff\x00\x52\xd5\x37\xc8\x67\x94\x00\xd2\
-\xc7\x1c\x68\xc3\x62\x80\xc0\x6e\x6c\x9c\x86\xe2\xa5\xf8\x57\xff\
-\x00\x05\xa2\xf0\xa6\xa5\xe5\x5b\x7c\x44\xf0\x5d\xfe\x85\x3f\xdd\
-\x7b\xed\x0a\x51\x77\x06\x73\xd7\xcb\x7d\xae\x07\xd0\xb5\x43\xfb\
-\x6b\x7f\xc1\x2f\x7c\x41\xf1\x7f\xe2\x2e\xb7\xf1\x0b\xe1\xd6\xad\
-\x60\x97\xfa\xc4\x82\xea\xf7\x43\xd5\x19\xe1\xcc\xf8\x55\x2f\x14\
-\x9b\x4a\x82\xdc\x31\x57\x00\xe4\x9e\x6b\xf3\xbf\xe2\x87\xec\x8f\
-\xf1\x77\xe0\xd9\x99\xfc\x59\xe0\x1d\x6f\x4e\xb3\x88\x33\x35\xfc\
-\x76\xa6\xe2\xd0\x2a\x9e\xbe\x74\x5b\xd0\x67\xdc\x8a\x00\xfd\xd0\
-\xf8\x6d\xfb\x6c\x7c\x13\xf8\xaf\xe5\x2f\x87\xbe\x23\xe8\x72\x5c\
-\xc9\xc2\x59\xea\x17\x1f\x61\xb9\x2d\xe8\x22\x9c\x23\x1f\xc3\x35\
-\xec\xd6\x7a\x94\x57\xd0\x25\xcd\xbc\xd1\xdc\x5b\x3a\xee\x59\x21\
-\x70\xe8\xdc\xf5\x04\x75\x1d\x7b\xfe\x15\xfc\xb6\xae\x46\x30\x78\
-\x27\x8e\x7b\xff\x00\x9f\xa5\x7e\x82\x7f\xc1\x20\xfe\x22\xf8\xc2\
-\x3f\x8f\x17\x3e\x0f\xb5\xbb\xb8\xbc\xf0\x8d\xd6\x95\x35\xd5\xed\
-\x8c\xb2\x96\x86\xd9\xa3\x2b\xe5\x4e\x80\xe7\x6b\x86\x62\xa7\x6e\
-\xdd\xc1\xf3\xda\x80\x3f\x67\x28\xa6\xa9\x26\x86\x6d\xb4\x00\x6e\
-\x19\xeb\x4e\xaf\xca\x0f\x8e\x7f\xf0\x58\xdf\x15\x68\x5f\x12\x35\
-\x9d\x23\xe1\xe7\x85\xb4\x16\xf0\xf6\x9b\x71\x25\xaa\x5f\x6b\xf0\
-\xcf\x34\xd7\x85\x18\x83\x2a\x88\xe5\x8c\x46\xa7\x07\x68\x3b\x8e\
-\x39\x3c\xfc\xb5\xe6\xcd\xff\x00\x05\xa8\xf8\xd8\xcb\x81\xe1\x7f\
-\x02\x23\x7a\xfd\x82\xf3\xff\x00\x92\xa8\x03\xf6\x9b\x70\x51\xc9\
-\xa1\x5b\x3d\x39\xaf\xc3\x4d\x77\xfe\x0a\xed\xfb\x41\x6a\xdb\x96\
-\xde\xf3\xc3\xba\x30\x3f\xc5\x63\xa3\x86\xdb\xff\x00\x7f\x99\xeb\
-\xeb\xff\x00\xf8\x27\x07\xed\xf3\xe3\x2f\xda\x1b\xc5\x1a\xaf\x80\
-\xfe\x20\x2d\xb5\xf6\xb3\x6b\x64\xda\x8d\x96\xb5\x6b\x6e\xb6\xe6\
-\x74\x57\x55\x78\xa4\x8d\x40\x5d\xd8\x70\xca\x54\x28\xc2\x90\x79\
-\xc6\x40\x3f\x43\x41\xca\xd4\x17\x37\x91\xd9\xdb\xc9\x3c\xf2\x2c\
-\x30\xc6\xac\xcf\x23\x90\x15\x54\x02\x49\x27\xd8\x02\x6a\x65\xe1\
-\x45\x60\x78\xcb\xc3\x71\x78\xcf\xc2\x3a\xde\x81\x3c\xd2\x5b\xc5\
-\xaa\xd9\x4f\x65\x24\xd1\x7d\xf8\xc4\x91\x34\x4c\xcb\xee\x37\x50\
-\x07\xe7\xa7\xc7\x0f\xf8\x2c\xa7\x87\x3c\x3d\xaa\x6a\x3a\x57\xc3\
-\x6f\x0a\xc9\xe2\x6f\xb3\xc8\xc8\xba\xd6\xa9\x37\xd9\xed\x64\xc1\
-\xc1\x68\xe2\x1f\x3b\x29\xea\x18\x95\x3f\xec\xd7\xc1\xbf\x18\xff\
-\x00\x6f\x0f\x8d\x5f\x1e\x22\x9e\xc3\x5b\xf1\x7d\xc6\x9d\xa3\xce\
-\xbb\x1b\x45\xd0\x41\xb2\xb5\x75\xfe\xe3\xaa\x65\xa4\x5f\xf6\x5d\
-\x98\x7b\x57\x5d\xe2\x0f\xf8\x26\x47\xc7\xfd\x27\xc7\x97\x3a\x05\
-\xa7\x84\x1b\x55\xb4\x8a\x73\x1c\x3a\xdc\x37\x71\x25\x9c\xb1\x83\
-\x85\x90\x33\xb0\x65\xc8\xfe\x1d\xbb\x87\xa5\x7d\x11\xf0\x87\xfe\
-\x08\xbb\xaa\x6a\x06\xde\xeb\xe2\x67\x8d\xa3\xd3\xe1\xe0\xbe\x95\
-\xe1\xc8\xfc\xe9\x80\xee\xa6\x69\x40\x55\x3e\xe1\x18\x50\x07\xe6\
-\x7d\xbd\x94\xd7\x93\xac\x76\xf1\xcd\x34\xce\xdb\x55\x62\x05\xcb\
-\x37\xb6\xdc\xf3\xed\xfa\xd7\xee\x57\xfc\x12\xd7\xe1\x47\x8b\xbe\
-\x15\xfe\xcd\x72\xc3\xe3\x2b\x6b\x8d\x36\xe7\x56\xd5\xe6\xd4\xec\
-\xf4\xfb\xcf\x96\x58\x2d\x9a\x28\xd0\x33\x03\x9d\xa5\xda\x37\x62\
-\xbe\x84\x13\xcb\x1c\xfb\x0f\xc1\x5f\xd9\x17\xe1\x3f\xc0\x24\x46\
-\xf0\x6f\x84\x2c\x6d\xf5\x35\x0a\x1b\x55\xba\xff\x00\x4a\xbe\x6f\
-\x52\x65\x7c\xb2\xfd\x10\x81\xed\x5e\xd1\x1c\x21\x73\xc6\x32\x72\
-\x79\xef\x40\x12\xd1\x45\x14\x00\xdd\x83\xd2\x93\xcb\x43\xd5\x41\
-\xe7\x3d\x3b\xd3\xe8\xa0\x06\xf9\x63\xdf\xf3\x34\xb4\xb4\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x04\x7e\x4a\xf5\xc7\
-\x3e\xb4\x79\x2b\xc8\xc0\xc1\xe3\x18\xa9\x28\xa0\x0f\x2a\xf8\x85\
-\xfb\x2b\xfc\x22\xf8\xa9\x24\xd3\x78\xa7\xe1\xdf\x87\xf5\x4b\xb9\
-\x8e\xe9\x6f\x3e\xc2\x91\x5c\xb9\xff\x00\x6a\x68\xf6\xb9\xfc\x5a\
-\xaf\xfc\x23\xfd\x9e\x3e\x1d\x7c\x07\xb5\xbc\xb7\xf0\x17\x84\xec\
-\x7c\x38\xb7\x8c\x1a\xe1\xed\xf7\xbc\x93\x60\x60\x06\x91\xd9\x98\
-\x81\x93\xc1\x38\xc9\xce\x33\x5e\x8d\x45\x00\x26\xd0\x29\xac\x9b\
-\xba\xd3\xe8\xa0\x0f\xc9\x4f\x8e\xdf\xf0\x47\xbf\x18\x6b\x7f\x11\
-\xf5\x7d\x4b\xe1\xcf\x8a\x7c\x3d\xfd\x83\xa8\x4f\x25\xe2\x5a\x6b\
-\xb3\x4f\x05\xc5\xb9\x77\x2c\x53\x31\x45\x20\x75\x52\x4e\x1c\xed\
-\x3d\xb1\x5c\x0c\x3f\xf0\x45\x9f\x8d\x4c\xe0\x4b\xe2\x7f\x02\xa2\
-\x7f\x79\x6f\xef\x0f\xfe\xda\xd7\xed\x31\x8d\x5b\xaa\xe7\x9c\xf3\
-\xeb\xeb\x4e\xda\x3d\x28\x03\xf1\xf7\x47\xff\x00\x82\x26\x78\xea\
-\x5c\x36\xab\xf1\x13\xc3\xb6\x6b\xdf\xec\x96\x93\xdc\x1f\xd7\x65\
-\x7d\x9b\xfb\x16\xfe\xc0\xbe\x1f\xfd\x91\x6e\xb5\x5d\x6b\xfb\x72\
-\x5f\x14\xf8\xa7\x53\xb6\x16\x92\x6a\x4d\x6c\x2d\xa3\x86\xdf\xcc\
-\x12\x18\xe3\x4d\xcf\x9d\xcc\xb1\x12\x59\x89\xf9\x06\x08\xaf\xad\
-\x76\x8f\x4a\x4d\x83\xfc\x9a\x00\x5a\x4f\x2d\x79\x38\xe4\xfb\xfd\
-\x3f\xc2\x9d\x45\x00\x43\xf6\x58\xc2\x6c\xdb\xf2\x73\xf2\xf6\xe4\
-\xe7\xa5\x3b\xc9\x4c\x01\x8c\x0f\xa9\xfc\xbe\x9e\xd5\x25\x14\x00\
-\xdd\x83\xd2\x9d\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x01\xff\xd9\
-\x00\x00\x61\x49\
-\xff\
-\xd8\xff\xe0\x00\x10\x4a\x46\x49\x46\x00\x01\x01\x01\x00\x60\x00\
-\x60\x00\x00\xff\xdb\x00\x43\x00\x03\x02\x02\x03\x02\x02\x03\x03\
-\x03\x03\x04\x03\x03\x04\x05\x08\x05\x05\x04\x04\x05\x0a\x07\x07\
-\x06\x08\x0c\x0a\x0c\x0c\x0b\x0a\x0b\x0b\x0d\x0e\x12\x10\x0d\x0e\
-\x11\x0e\x0b\x0b\x10\x16\x10\x11\x13\x14\x15\x15\x15\x0c\x0f\x17\
-\x18\x16\x14\x18\x12\x14\x15\x14\xff\xdb\x00\x43\x01\x03\x04\x04\
-\x05\x04\x05\x09\x05\x05\x09\x14\x0d\x0b\x0d\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\
-\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\x14\xff\xc0\x00\
-\x11\x08\x01\xa1\x02\x00\x03\x01\x22\x00\x02\x11\x01\x03\x11\x01\
-\xff\xc4\x00\x1f\x00\x00\x01\x05\x01\x01\x01\x01\x01\x01\x00\x00\
-\x00\x00\x00\x00\x00\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\
-\x0b\xff\xc4\x00\xb5\x10\x00\x02\x01\x03\x03\x02\x04\x03\x05\x05\
-\x04\x04\x00\x00\x01\x7d\x01\x02\x03\x00\x04\x11\x05\x12\x21\x31\
-\x41\x06\x13\x51\x61\x07\x22\x71\x14\x32\x81\x91\xa1\x08\x23\x42\
-\xb1\xc1\x15\x52\xd1\xf0\x24\x33\x62\x72\x82\x09\x0a\x16\x17\x18\
-\x19\x1a\x25\x26\x27\x28\x29\x2a\x34\x35\x36\x37\x38\x39\x3a\x43\
-\x44\x45\x46\x47\x48\x49\x4a\x53\x54\x55\x56\x57\x58\x59\x5a\x63\
-\x64\x65\x66\x67\x68\x69\x6a\x73\x74\x75\x76\x77\x78\x79\x7a\x83\
-\x84\x85\x86\x87\x88\x89\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\
-\xa2\xa3\xa4\xa5\xa6\xa7\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\
-\xb9\xba\xc2\xc3\xc4\xc5\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\
-\xd7\xd8\xd9\xda\xe1\xe2\xe3\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf1\xf2\
-\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\xff\xc4\x00\x1f\x01\x00\x03\x01\
-\x01\x01\x01\x01\x01\x01\x01\x01\x00\x00\x00\x00\x00\x00\x01\x02\
-\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\xff\xc4\x00\xb5\x11\x00\x02\
-\x01\x02\x04\x04\x03\x04\x07\x05\x04\x04\x00\x01\x02\x77\x00\x01\
-\x02\x03\x11\x04\x05\x21\x31\x06\x12\x41\x51\x07\x61\x71\x13\x22\
-\x32\x81\x08\x14\x42\x91\xa1\xb1\xc1\x09\x23\x33\x52\xf0\x15\x62\
-\x72\xd1\x0a\x16\x24\x34\xe1\x25\xf1\x17\x18\x19\x1a\x26\x27\x28\
-\x29\x2a\x35\x36\x37\x38\x39\x3a\x43\x44\x45\x46\x47\x48\x49\x4a\
-\x53\x54\x55\x56\x57\x58\x59\x5a\x63\x64\x65\x66\x67\x68\x69\x6a\
-\x73\x74\x75\x76\x77\x78\x79\x7a\x82\x83\x84\x85\x86\x87\x88\x89\
-\x8a\x92\x93\x94\x95\x96\x97\x98\x99\x9a\xa2\xa3\xa4\xa5\xa6\xa7\
-\xa8\xa9\xaa\xb2\xb3\xb4\xb5\xb6\xb7\xb8\xb9\xba\xc2\xc3\xc4\xc5\
-\xc6\xc7\xc8\xc9\xca\xd2\xd3\xd4\xd5\xd6\xd7\xd8\xd9\xda\xe2\xe3\
-\xe4\xe5\xe6\xe7\xe8\xe9\xea\xf2\xf3\xf4\xf5\xf6\xf7\xf8\xf9\xfa\
-\xff\xda\x00\x0c\x03\x01\x00\x02\x11\x03\x11\x00\x3f\x00\xfd\x53\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x85\xa4\
-\x0a\xa4\x92\x47\x7e\xbd\x87\x7e\x68\x02\x6a\x2b\xe2\x8f\xda\x53\
-\xfe\x0a\x95\xf0\xd7\xe0\x46\xaf\x7b\xe1\xdd\x0e\xde\xe3\xe2\x0f\
-\x8a\x2c\xcb\x45\x73\x6f\xa7\x5c\x24\x56\x76\xd2\x29\xc1\x49\x2e\
-\x3e\x6f\x98\x1e\x30\x8a\xc4\x72\x18\x86\xe2\xbe\x5b\xb9\xff\x00\
-\x82\xdc\x78\xda\x49\x8b\x5b\xfc\x35\xd0\x62\x85\xbe\xea\x4d\x7d\
-\x33\x91\xff\x00\x02\x01\x45\x00\x7e\xbd\xd1\x5f\x8f\xdf\xf0\xfb\
-\x9f\x1e\x7f\xd1\x38\xf0\xe7\xfe\x05\xcf\xfe\x34\x7f\xc3\xee\x7c\
-\x79\xff\x00\x44\xe3\xc3\x9f\xf8\x17\x3f\xf8\xd0\x07\xec\x0d\x15\
-\xf8\xfd\xff\x00\x0f\xb9\xf1\xe7\xfd\x13\x8f\x0e\x7f\xe0\x5c\xff\
-\x00\xe3\x47\xfc\x3e\xe7\xc7\x9f\xf4\x4e\x3c\x39\xff\x00\x81\x73\
-\xff\x00\x8d\x00\x7e\xc0\xd1\x5f\x8f\xdf\xf0\xfb\x9f\x1e\x7f\xd1\
-\x38\xf0\xe7\xfe\x05\xcf\xfe\x34\x7f\xc3\xee\x7c\x79\xff\x00\x44\
-\xe3\xc3\x9f\xf8\x17\x3f\xf8\xd0\x07\xec\x0d\x15\xf8\xfd\xff\x00\
-\x0f\xb9\xf1\xe7\xfd\x13\x8f\x0e\x7f\xe0\x5c\xff\x00\xe3\x47\xfc\
-\x3e\xe7\xc7\x9f\xf4\x4e\x3c\x39\xff\x00\x81\x73\xff\x00\x8d\x00\
-\x7e\xc0\xd1\x5f\x8f\xdf\xf0\xfb\x9f\x1e\x7f\xd1\x38\xf0\xe7\xfe\
-\x05\xcf\xfe\x34\x7f\xc3\xee\x7c\x79\xff\x00\x44\xe3\xc3\x9f\xf8\
-\x17\x3f\xf8\xd0\x07\xec\x0d\x15\xf8\xfd\xff\x00\x0f\xb9\xf1\xe7\
-\xfd\x13\x8f\x0e\x7f\xe0\x5c\xff\x00\xe3\x47\xfc\x3e\xe7\xc7\x9f\
-\xf4\x4e\x3c\x39\xff\x00\x81\x73\xff\x00\x8d\x00\x7e\xc0\xd1\x5f\
-\x90\x96\xdf\xf0\x5b\x8f\x1a\xa4\xdb\xae\x3e\x1a\xe8\x33\x42\xbf\
-\x79\x21\xbe\x99\x09\xff\x00\x81\x10\xc2\xbe\xa4\xfd\x9a\xff\x00\
-\xe0\xa9\x5f\x0d\xbe\x3c\x6a\xd6\x7e\x1d\xd7\x2d\xae\x3e\x1e\xf8\
-\xa2\xec\xac\x76\xf0\x6a\x37\x09\x25\x9d\xcc\x84\xe0\x24\x77\x1f\
-\x2f\xcc\x4f\x18\x75\x52\x7a\x29\x2d\xc5\x00\x7d\xaf\x45\x42\xb2\
-\x06\x50\x41\x27\xbf\x5e\xc7\xbf\x15\x35\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x15\xf0\xc7\xfc\x15\x4b\xf6\xa0\xd4\x7e\x06\xfc\x23\
-\xd3\xfc\x2b\xe1\xcb\xc9\x2c\x7c\x51\xe2\xf6\x96\x11\x77\x0b\x95\
-\x92\xd2\xca\x30\xbe\x6c\x8a\xc3\x95\x72\xce\x88\xa4\x76\x2e\x7a\
-\xa8\xaf\xb9\xeb\xf1\x93\xfe\x0b\x55\x79\x2c\x9f\xb4\x77\x83\xad\
-\x19\xd8\x43\x17\x84\xe3\x95\x46\x78\xdc\xf7\x97\x60\xff\x00\xe8\
-\xb5\xfd\x28\x03\xf3\xcf\x7b\x1c\x65\x89\xed\xd6\x93\x26\x8a\xfd\
-\xe6\xfd\x97\xbf\x62\x7f\x82\x32\xfe\xcf\x3f\x0e\x6f\xb5\x2f\x86\
-\xda\x06\xb3\xaa\xea\x5a\x05\x8e\xa3\x79\x7d\xa9\xda\x2d\xc4\xd2\
-\xcf\x3d\xbc\x72\xb9\x25\xc9\xc0\xdc\xe7\x0a\x38\x00\x50\x07\xe0\
-\xcd\x15\xfd\x1d\x7f\xc3\x13\xfc\x06\xff\x00\xa2\x43\xe1\x0f\xfc\
-\x14\xc5\xfe\x14\x7f\xc3\x13\xfc\x06\xff\x00\xa2\x43\xe1\x0f\xfc\
-\x14\xc5\xfe\x14\x01\xfc\xe2\xd1\x5f\xd1\xd7\xfc\x31\x3f\xc0\x6f\
-\xfa\x24\x3e\x10\xff\x00\xc1\x4c\x5f\xe1\x47\xfc\x31\x3f\xc0\x6f\
-\xfa\x24\x3e\x10\xff\x00\xc1\x4c\x5f\xe1\x40\x1f\xce\x2d\x15\xfd\
-\x1d\x7f\xc3\x13\xfc\x06\xff\x00\xa2\x43\xe1\x0f\xfc\x14\xc5\xfe\
-\x14\x7f\xc3\x13\xfc\x06\xff\x00\xa2\x43\xe1\x0f\xfc\x14\xc5\xfe\
-\x14\x01\xfc\xe2\xd1\x5f\xd1\xd7\xfc\x31\x3f\xc0\x6f\xfa\x24\x3e\
-\x10\xff\x00\xc1\x4c\x5f\xe1\x47\xfc\x31\x3f\xc0\x6f\xfa\x24\x3e\
-\x10\xff\x00\xc1\x4c\x5f\xe1\x40\x1f\xce\x2d\x15\xfd\x1d\x7f\xc3\
-\x13\xfc\x06\xff\x00\xa2\x43\xe1\x0f\xfc\x14\xc5\xfe\x14\x7f\xc3\
-\x13\xfc\x06\xff\x00\xa2\x43\xe1\x0f\xfc\x14\xc5\xfe\x14\x01\xfc\
-\xe2\xd1\x5f\xd1\xd7\xfc\x31\x3f\xc0\x6f\xfa\x24\x3e\x10\xff\x00\
-\xc1\x4c\x5f\xe1\x47\xfc\x31\x3f\xc0\x6f\xfa\x24\x3e\x10\xff\x00\
-\xc1\x4c\x5f\xe1\x40\x1f\xce\x2e\x4d\x2e\xe3\xea\x7d\x2b\xf7\x93\
-\xf6\xa2\xfd\x8a\x7e\x08\xc7\xfb\x3d\xfc\x44\xbe\xd3\x7e\x1b\xe8\
-\x1a\x26\xab\xa6\xe8\x17\xba\x8d\x9d\xf6\x99\x66\xb6\xf3\x45\x34\
-\x30\xbc\x88\xc0\xa1\x19\x5d\xc8\x32\x0f\x04\x1c\x57\xe0\xd5\x00\
-\x7e\xe1\xff\x00\xc1\x2b\xbf\x6a\x0d\x47\xe3\x9f\xc2\x3d\x43\xc2\
-\xbe\x23\xbc\x92\xfb\xc4\xfe\x11\x68\x61\x37\x73\x3e\xe9\x2e\xac\
-\xe4\x0d\xe5\x48\xcc\x79\x67\x0c\x8e\x8c\x4f\x60\x84\xf2\xc6\xbe\
-\xe5\xaf\xc6\x4f\xf8\x22\xb5\xec\xb1\x7e\xd1\xde\x31\xb3\x57\x63\
-\x04\xbe\x13\x92\x56\x19\xe3\x72\x5e\x5a\x01\xff\x00\xa3\x1b\xf5\
-\xaf\xd9\xba\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x2b\xf1\x6f\xfe\
-\x0b\x55\xc7\xed\x39\xe1\x2c\x71\xff\x00\x14\x85\xbf\xfe\x96\x5e\
-\x57\xed\x25\x7e\x2d\xff\x00\xc1\x6a\xbf\xe4\xe7\x3c\x25\xff\x00\
-\x62\x7d\xbf\xfe\x96\x5e\x50\x07\xe7\xdd\x7f\x4b\x1f\xb3\x0a\x2f\
-\xfc\x33\x5f\xc2\x31\xb4\x60\x78\x43\x49\xc0\xc7\xfd\x39\x42\x2b\
-\xf9\xa7\xaf\xe9\x6b\xf6\x61\xff\x00\x93\x6b\xf8\x49\xff\x00\x62\
-\x8e\x93\xff\x00\xa4\x70\xd0\x07\xa6\xd1\x4b\x45\x00\x25\x14\xb4\
-\x50\x02\x51\x4b\x45\x00\x25\x14\xb4\x50\x02\x51\x4b\x45\x00\x25\
-\x14\xb4\x50\x07\x98\x7e\xd3\xca\x0f\xec\xd7\xf1\x70\x10\x08\x3e\
-\x11\xd5\xb3\xff\x00\x80\x73\x57\xf3\x4d\x5f\xd2\xd7\xed\x3d\xff\
-\x00\x26\xd7\xf1\x6f\xfe\xc5\x1d\x5b\xff\x00\x48\xe6\xaf\xe6\x96\
-\x80\x3f\x41\x3f\xe0\x8a\xa4\x9f\xda\x73\xc5\xbf\xf6\x28\x5c\x7f\
-\xe9\x65\x9d\x7e\xd2\x57\xe2\xdf\xfc\x11\x57\xfe\x4e\x73\xc5\xbf\
-\xf6\x27\xdc\x7f\xe9\x65\x9d\x7e\xd2\x50\x01\x45\x14\x50\x01\x45\
-\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\
-\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\
-\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\
-\x72\xfe\x36\xf8\x8d\xe1\x9f\x86\xda\x2b\xea\xfe\x2a\xf1\x0e\x9d\
-\xe1\xdd\x31\x78\x37\x9a\x9d\xda\x5b\xa6\xef\xee\x82\xf8\x05\xbd\
-\xba\xd7\xca\x3e\x3c\xff\x00\x82\xb7\x7c\x03\xf0\x7d\xc3\x45\xa6\
-\xea\x1a\xef\x8c\x19\x4e\xd2\xda\x2e\x9a\x44\x79\xf4\xdf\x70\xf1\
-\x03\xf5\x1b\xa8\x03\xed\x6a\x2b\xf3\x9a\x4f\xf8\x2d\x97\xc3\x3d\
-\xc7\x67\x81\x3c\x5a\xcb\xfe\xd1\xb5\x07\xff\x00\x46\xd2\x7f\xc3\
-\xed\x3e\x1b\xff\x00\xd1\x3f\xf1\x57\xfd\xf7\x6d\xff\x00\xc5\xd0\
-\x07\xe8\xd5\x15\xf9\xcb\xff\x00\x0f\xb4\xf8\x6f\xff\x00\x44\xff\
-\x00\xc5\x5f\xf7\xdd\xb7\xff\x00\x17\x47\xfc\x3e\xd3\xe1\xbf\xfd\
-\x13\xff\x00\x15\x7f\xdf\x76\xdf\xfc\x5d\x00\x7e\x8d\x51\x5f\x9c\
-\xbf\xf0\xfb\x4f\x86\xff\x00\xf4\x4f\xfc\x55\xff\x00\x7d\xdb\x7f\
-\xf1\x74\x7f\xc3\xed\x3e\x1b\xff\x00\xd1\x3f\xf1\x57\xfd\xf7\x6d\
-\xff\x00\xc5\xd0\x07\xe8\xd5\x15\xf9\xcb\xff\x00\x0f\xb4\xf8\x6f\
-\xff\x00\x44\xff\x00\xc5\x5f\xf7\xdd\xb7\xff\x00\x17\x47\xfc\x3e\
-\xd3\xe1\xbf\xfd\x13\xff\x00\x15\x7f\xdf\x76\xdf\xfc\x5d\x00\x7e\
-\x8d\x51\x5f\x9c\xbf\xf0\xfb\x4f\x86\xff\x00\xf4\x4f\xfc\x55\xff\
-\x00\x7d\xdb\x7f\xf1\x74\x7f\xc3\xed\x3e\x1b\xff\x00\xd1\x3f\xf1\
-\x57\xfd\xf7\x6d\xff\x00\xc5\xd0\x07\xe8\xd5\x15\xf9\xcb\xff\x00\
-\x0f\xb4\xf8\x6f\xff\x00\x44\xff\x00\xc5\x5f\xf7\xdd\xb7\xff\x00\
-\x17\x47\xfc\x3e\xd3\xe1\xbf\xfd\x13\xff\x00\x15\x7f\xdf\x76\xdf\
-\xfc\x5d\x00\x7e\x8d\x51\x5f\x9c\xbf\xf0\xfb\x4f\x86\xff\x00\xf4\
-\x4f\xfc\x55\xff\x00\x7d\xdb\x7f\xf1\x74\x7f\xc3\xed\x3e\x1b\xff\
-\x00\xd1\x3f\xf1\x57\xfd\xf7\x6d\xff\x00\xc5\xd0\x07\xe8\xd5\x15\
-\xf9\xcb\xff\x00\x0f\xb4\xf8\x6f\xff\x00\x44\xff\x00\xc5\x5f\xf7\
-\xdd\xb7\xff\x00\x17\x47\xfc\x3e\xd3\xe1\xbf\xfd\x13\xff\x00\x15\
-\x7f\xdf\x76\xdf\xfc\x5d\x00\x7e\x8d\x57\xe2\xdf\xfc\x16\xab\xfe\
-\x4e\x73\xc2\x5f\xf6\x27\xdb\xff\x00\xe9\x65\xe5\x7d\x15\xff\x00\
-\x0f\xb4\xf8\x6f\xff\x00\x44\xff\x00\xc5\x5f\xf7\xdd\xb7\xff\x00\
-\x17\x5f\x06\xfe\xde\xdf\xb5\x16\x87\xfb\x5a\x7c\x5a\xd1\x7c\x59\
-\xa0\xe9\x17\xda\x35\xa5\x8e\x89\x1e\x94\xf6\xfa\x93\x46\xd2\x19\
-\x16\x79\xe4\xdf\xf2\x13\xc6\xd9\x97\xf1\x06\x80\x3e\x63\xaf\xe9\
-\x6b\xf6\x61\xff\x00\x93\x6b\xf8\x49\xff\x00\x62\x8e\x93\xff\x00\
-\xa4\x70\xd7\xf3\x4b\x5f\xd2\xcf\xec\xc1\xff\x00\x26\xd7\xf0\x93\
-\xfe\xc5\x1d\x27\xff\x00\x48\xe1\xa0\x0f\x4f\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\
-\x8a\x28\x03\xcc\x7f\x69\xef\xf9\x36\xbf\x8b\x7f\xf6\x28\xea\xdf\
-\xfa\x47\x35\x7f\x34\xb5\xfd\x2c\xfe\xd3\xff\x00\xf2\x6d\x7f\x16\
-\xff\x00\xec\x51\xd5\xbf\xf4\x8e\x6a\xfe\x69\xa8\x03\xf4\x13\xfe\
-\x08\xab\xff\x00\x27\x39\xe2\xdf\xfb\x13\xee\x3f\xf4\xb2\xce\xbf\
-\x69\x2b\xf9\xf3\xfd\x82\x7f\x6a\x2d\x0f\xf6\x4b\xf8\xb5\xad\x78\
-\xb3\x5e\xd2\x2f\xb5\x9b\x4b\xed\x12\x4d\x29\x2d\xf4\xd6\x8d\x64\
-\x12\x34\xf0\x49\xbf\xe7\x23\x8d\xb0\xb7\xe2\x45\x7d\xe5\xff\x00\
-\x0f\xb4\xf8\x6f\xff\x00\x44\xff\x00\xc5\x5f\xf7\xdd\xb7\xff\x00\
-\x17\x40\x1f\xa3\x54\x57\xe7\x2f\xfc\x3e\xd3\xe1\xbf\xfd\x13\xff\
-\x00\x15\x7f\xdf\x76\xdf\xfc\x5d\x1f\xf0\xfb\x4f\x86\xff\x00\xf4\
-\x4f\xfc\x55\xff\x00\x7d\xdb\x7f\xf1\x74\x01\xfa\x35\x45\x7e\x72\
-\xff\x00\xc3\xed\x3e\x1b\xff\x00\xd1\x3f\xf1\x57\xfd\xf7\x6d\xff\
-\x00\xc5\xd1\xff\x00\x0f\xb4\xf8\x6f\xff\x00\x44\xff\x00\xc5\x5f\
-\xf7\xdd\xb7\xff\x00\x17\x40\x1f\xa3\x54\x57\xe7\x2f\xfc\x3e\xd3\
-\xe1\xbf\xfd\x13\xff\x00\x15\x7f\xdf\x76\xdf\xfc\x5d\x1f\xf0\xfb\
-\x4f\x86\xff\x00\xf4\x4f\xfc\x55\xff\x00\x7d\xdb\x7f\xf1\x74\x01\
-\xfa\x35\x45\x7e\x72\xff\x00\xc3\xed\x3e\x1b\xff\x00\xd1\x3f\xf1\
-\x57\xfd\xf7\x6d\xff\x00\xc5\xd1\xff\x00\x0f\xb4\xf8\x6f\xff\x00\
-\x44\xff\x00\xc5\x5f\xf7\xdd\xb7\xff\x00\x17\x40\x1f\xa3\x54\x57\
-\xe7\x2f\xfc\x3e\xd3\xe1\xbf\xfd\x13\xff\x00\x15\x7f\xdf\x76\xdf\
-\xfc\x5d\x1f\xf0\xfb\x4f\x86\xff\x00\xf4\x4f\xfc\x55\xff\x00\x7d\
-\xdb\x7f\xf1\x74\x01\xfa\x35\x45\x7e\x72\xff\x00\xc3\xed\x3e\x1b\
-\xff\x00\xd1\x3f\xf1\x57\xfd\xf7\x6d\xff\x00\xc5\xd1\xff\x00\x0f\
-\xb4\xf8\x6f\xff\x00\x44\xff\x00\xc5\x5f\xf7\xdd\xb7\xff\x00\x17\
-\x40\x1f\xa3\x54\x57\xe7\x2f\xfc\x3e\xd3\xe1\xbf\xfd\x13\xff\x00\
-\x15\x7f\xdf\x76\xdf\xfc\x5d\x1f\xf0\xfb\x4f\x86\xff\x00\xf4\x4f\
-\xfc\x55\xff\x00\x7d\xdb\x7f\xf1\x74\x01\xfa\x35\x45\x7e\x72\xff\
-\x00\xc3\xed\x3e\x1b\xff\x00\xd1\x3f\xf1\x57\xfd\xf7\x6d\xff\x00\
-\xc5\xd2\xc7\xff\x00\x05\xb2\xf8\x67\xb8\x6f\xf0\x27\x8b\x55\x7f\
-\xd9\x36\xa4\xff\x00\xe8\xda\x00\xfd\x19\xa2\xbe\x29\xf0\x1f\xfc\
-\x15\xbb\xe0\x1f\x8c\x6e\x12\x2d\x47\x50\xd7\x7c\x1e\xce\x76\x86\
-\xd6\xb4\xdd\xd1\xee\xf7\x78\x1a\x50\x07\xb9\xdb\x5f\x57\xf8\x2b\
-\xe2\x2f\x86\x7e\x24\x68\xa9\xab\xf8\x53\xc4\x3a\x77\x88\xf4\xb7\
-\xe0\x5d\xe9\x97\x29\x3c\x5b\xbf\xba\x59\x32\x03\x7b\x75\xa0\x0e\
-\x9e\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\xbe\x08\xfd\
-\xb8\x3f\xe0\xa6\xda\x5f\xc0\x7b\xcb\xef\x04\xfc\x3d\x5b\x7f\x10\
-\xf8\xf2\x32\xd0\xde\x5d\xca\x37\xd9\xe9\x2f\xd0\xab\x00\x7f\x79\
-\x30\xfe\xe8\xf9\x47\x7c\x9c\xad\x69\xff\x00\xc1\x4c\x3f\x6d\x1b\
-\x8f\xd9\xe3\xc0\xf0\x78\x37\xc2\x17\xcf\x07\x8f\xbc\x47\x1b\x6d\
-\xba\x85\xbe\x7d\x36\xd3\x3b\x5a\x65\xf4\x77\x3b\x91\x0f\x55\xda\
-\xec\x31\xb5\x73\xf8\x7b\x24\xd2\x4d\x23\x3c\x8e\xd2\x3b\x1c\x96\
-\x63\x92\x4f\xad\x00\x76\x5f\x13\x7e\x2c\x78\xc3\xe3\x27\x89\xa7\
-\xf1\x07\x8c\xfc\x43\x7d\xe2\x2d\x52\x4c\xfe\xfe\xf2\x62\xeb\x12\
-\xb7\xf0\xc6\x83\xe5\x8d\x07\xf7\x14\x01\xed\x5c\x61\x62\x7a\x92\
-\x7b\x57\x75\xf0\xa7\xe0\xff\x00\x8b\x3e\x36\xf8\xc6\xd7\xc3\x3e\
-\x09\xd0\xee\x35\xdd\x62\xe3\xe6\x10\xc0\x7e\x58\x97\xbc\x92\x39\
-\x01\x51\x57\xbb\x31\x03\xd3\xb5\x7e\x92\x7c\x22\xff\x00\x82\x29\
-\x69\xe2\xce\x2b\xaf\x89\xfe\x39\xb9\x92\xe9\x97\x73\xe9\xbe\x17\
-\x89\x63\x44\x3e\x9f\x68\x99\x5b\x77\xe1\x1a\xd0\x07\xe5\x05\x15\
-\xfb\x9d\x6b\xff\x00\x04\x89\xfd\x9e\xe1\x89\x52\x4b\x0f\x10\x5c\
-\x38\xea\xd2\x6a\xec\x1b\xf2\x55\x02\xa6\xff\x00\x87\x44\xfe\xcf\
-\x1f\xf4\x0a\xd7\xbf\xf0\x71\x27\xf8\x50\x07\xe1\x5d\x15\xfb\xa9\
-\xff\x00\x0e\x89\xfd\x9e\x3f\xe8\x15\xaf\x7f\xe0\xe2\x4f\xf0\xa3\
-\xfe\x1d\x13\xfb\x3c\x7f\xd0\x2b\x5e\xff\x00\xc1\xc4\x9f\xe1\x40\
-\x1f\x85\x74\x57\xee\xa7\xfc\x3a\x27\xf6\x78\xff\x00\xa0\x56\xbd\
-\xff\x00\x83\x89\x3f\xc2\x8f\xf8\x74\x4f\xec\xf1\xff\x00\x40\xad\
-\x7b\xff\x00\x07\x12\x7f\x85\x00\x7e\x15\xd1\x5f\xba\x9f\xf0\xe8\
-\x9f\xd9\xe3\xfe\x81\x5a\xf7\xfe\x0e\x24\xff\x00\x0a\x3f\xe1\xd1\
-\x3f\xb3\xc7\xfd\x02\xb5\xef\xfc\x1c\x49\xfe\x14\x01\xf8\x57\x45\
-\x7e\xea\x7f\xc3\xa2\x7f\x67\x8f\xfa\x05\x6b\xdf\xf8\x38\x93\xfc\
-\x28\xff\x00\x87\x44\xfe\xcf\x1f\xf4\x0a\xd7\xbf\xf0\x71\x27\xf8\
-\x50\x07\xe1\x5d\x15\xfb\xa9\xff\x00\x0e\x89\xfd\x9e\x3f\xe8\x15\
-\xaf\x7f\xe0\xe2\x4f\xf0\xa3\xfe\x1d\x13\xfb\x3c\x7f\xd0\x2b\x5e\
-\xff\x00\xc1\xc4\x9f\xe1\x40\x1f\x85\x74\x57\xee\xa7\xfc\x3a\x27\
-\xf6\x78\xff\x00\xa0\x56\xbd\xff\x00\x83\x89\x3f\xc2\x8f\xf8\x74\
-\x4f\xec\xf1\xff\x00\x40\xad\x7b\xff\x00\x07\x12\x7f\x85\x00\x7e\
-\x15\xd1\x5f\xba\x9f\xf0\xe8\x9f\xd9\xe3\xfe\x81\x5a\xf7\xfe\x0e\
-\x24\xff\x00\x0a\x3f\xe1\xd1\x3f\xb3\xc7\xfd\x02\xb5\xef\xfc\x1c\
-\x49\xfe\x14\x01\xf8\x57\x4b\xb8\xf4\xc9\xf4\xaf\xdd\x3f\xf8\x74\
-\x4f\xec\xf1\xff\x00\x40\xad\x7b\xff\x00\x07\x12\x7f\x85\x7e\x6f\
-\xff\x00\xc1\x48\x3f\x67\x3f\x06\x7e\xcc\xbf\x1a\xb4\x1f\x0c\xf8\
-\x22\xd6\xea\xdb\x4a\xbc\xf0\xfc\x3a\x94\xab\x79\x70\xd3\xbf\x9c\
-\xd7\x17\x08\x4e\x5b\xb6\xd8\x93\x8f\x5c\xd0\x07\xc9\x75\xfd\x2a\
-\xfe\xca\xd9\xff\x00\x86\x61\xf8\x42\x18\xe5\xc7\x83\xf4\x70\x49\
-\xeb\x9f\xb0\xc3\x5f\xcd\x55\x7f\x4b\x3f\xb3\x0f\x1f\xb3\x5f\xc2\
-\x4c\x71\xff\x00\x14\x8e\x93\xff\x00\xa4\x70\xd0\x07\xa7\xd1\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x01\xe5\x9f\xb5\x4e\x7f\xe1\x98\x7e\x2f\x05\
-\x38\x73\xe0\xfd\x60\x02\x3a\xe7\xec\x33\x57\xf3\x55\x5f\xd2\xcf\
-\xed\x3d\xcf\xec\xd7\xf1\x6f\x3c\xff\x00\xc5\x23\xab\x7f\xe9\x1c\
-\xd5\xfc\xd3\x50\x02\xee\x3d\x32\x7d\x29\x2b\xeb\x4f\xf8\x26\xff\
-\x00\xec\xe7\xe0\xcf\xda\x6b\xe3\x56\xbd\xe1\x9f\x1b\xda\xdd\x5c\
-\xe9\x56\x7e\x1f\x9b\x52\x89\x6c\xee\x1a\x07\xf3\x96\xe2\xdd\x01\
-\xca\xf6\xdb\x2b\xf1\xeb\x8a\xfd\x20\xff\x00\x87\x44\xfe\xcf\x1f\
-\xf4\x0a\xd7\xbf\xf0\x71\x27\xf8\x50\x07\xe1\x5d\x15\xfb\xa9\xff\
-\x00\x0e\x89\xfd\x9e\x3f\xe8\x15\xaf\x7f\xe0\xe2\x4f\xf0\xa3\xfe\
-\x1d\x13\xfb\x3c\x7f\xd0\x2b\x5e\xff\x00\xc1\xc4\x9f\xe1\x40\x1f\
-\x85\x74\x57\xee\xa7\xfc\x3a\x27\xf6\x78\xff\x00\xa0\x56\xbd\xff\
-\x00\x83\x89\x3f\xc2\x8f\xf8\x74\x4f\xec\xf1\xff\x00\x40\xad\x7b\
-\xff\x00\x07\x12\x7f\x85\x00\x7e\x15\xd1\x5f\xba\x9f\xf0\xe8\x9f\
-\xd9\xe3\xfe\x81\x5a\xf7\xfe\x0e\x24\xff\x00\x0a\x3f\xe1\xd1\x3f\
-\xb3\xc7\xfd\x02\xb5\xef\xfc\x1c\x49\xfe\x14\x01\xf8\x57\x45\x7e\
-\xea\x7f\xc3\xa2\x7f\x67\x8f\xfa\x05\x6b\xdf\xf8\x38\x93\xfc\x28\
-\xff\x00\x87\x44\xfe\xcf\x1f\xf4\x0a\xd7\xbf\xf0\x71\x27\xf8\x50\
-\x07\xe1\x5d\x15\xfb\xa9\xff\x00\x0e\x89\xfd\x9e\x3f\xe8\x15\xaf\
-\x7f\xe0\xe2\x4f\xf0\xa3\xfe\x1d\x13\xfb\x3c\x7f\xd0\x2b\x5e\xff\
-\x00\xc1\xc4\x9f\xe1\x40\x1f\x85\x74\x57\xee\xa7\xfc\x3a\x27\xf6\
-\x78\xff\x00\xa0\x56\xbd\xff\x00\x83\x89\x3f\xc2\x8f\xf8\x74\x4f\
-\xec\xf1\xff\x00\x40\xad\x7b\xff\x00\x07\x12\x7f\x85\x00\x7e\x15\
-\xd1\x5f\xba\x9f\xf0\xe8\x9f\xd9\xe3\xfe\x81\x5a\xf7\xfe\x0e\x24\
-\xff\x00\x0a\x3f\xe1\xd1\x3f\xb3\xc7\xfd\x02\xb5\xef\xfc\x1c\x49\
-\xfe\x14\x01\xf8\x57\x45\x7e\xea\x7f\xc3\xa2\x7f\x67\x8f\xfa\x05\
-\x6b\xdf\xf8\x38\x93\xfc\x2a\x1b\xaf\xf8\x24\x4f\xec\xf7\x34\x45\
-\x23\xb0\xf1\x05\xb3\x37\x47\x4d\x5d\x8b\x7e\x4c\xa4\x50\x07\xe1\
-\x96\xf6\xfe\xf1\xe9\x8e\xbd\xab\xb3\xf8\x67\xf1\x5f\xc5\xff\x00\
-\x06\xfc\x4f\x07\x88\x3c\x19\xe2\x1b\xef\x0e\xea\x91\xe3\xfd\x22\
-\xce\x62\xa2\x55\x5f\xe1\x91\x4f\xcb\x22\x1f\xee\x30\x23\xda\xbf\
-\x4a\xbe\x2f\x7f\xc1\x14\xf4\xff\x00\xb1\xcd\x75\xf0\xc3\xc7\x17\
-\x49\x74\x8b\xb9\x34\xdf\x14\x44\xb2\x24\x87\xd0\x5c\x42\xab\xb7\
-\xf1\x8d\xab\xf3\x77\xe2\xb7\xc1\xff\x00\x16\xfc\x14\xf1\x85\xe7\
-\x86\x7c\x6b\xa1\x5c\xe8\x5a\xc4\x03\x7f\x93\x70\x3e\x59\x50\x67\
-\xf7\x91\xb8\xca\xc8\xa7\x1c\x32\x12\x3a\xe4\xf0\x68\x03\xf5\xd7\
-\xf6\x1f\xff\x00\x82\x9b\x69\x7f\x1e\x2f\x2c\x7c\x13\xf1\x09\x6d\
-\xfc\x3d\xe3\xc9\x0a\xc3\x67\x77\x10\xd9\x67\xab\x3f\x40\xaa\x09\
-\xfd\xdc\xc7\xfb\xa7\xe5\x3d\xb0\x70\xb5\xf7\xbd\x7f\x2b\x31\xcd\
-\x24\x32\x2b\xc6\xed\x1b\xa9\xc8\x65\x38\x20\xfa\xd7\xee\x27\xfc\
-\x13\x43\xf6\xcf\xb8\xfd\xa2\x3c\x15\x3f\x83\x7c\x5d\x7e\xd7\x1e\
-\x3f\xf0\xe4\x4a\x5a\xe6\x63\x89\x35\x3b\x4c\xed\x59\x88\xee\xe8\
-\x76\xa4\x87\xa9\x2c\x8d\xfc\x4d\x40\x1f\x71\x51\x45\x14\x00\x55\
-\x1d\x43\x51\x83\x49\xb1\xbb\xbd\xbb\x99\x6d\xac\xed\x62\x69\xa5\
-\x9a\x43\xf2\xa2\x28\x25\x98\xfb\x00\x33\x57\xab\xe7\xbf\xdb\xf3\
-\xc6\x12\x78\x0f\xf6\x3b\xf8\xa9\xaa\xc2\xec\x93\x49\xa5\x7f\x67\
-\xab\x29\xc1\x1f\x69\x95\x2d\xb2\x0f\xb7\x9d\x9f\xc2\x80\x3f\x0b\
-\x7f\x69\x2f\x8c\xd7\xff\x00\xb4\x07\xc6\xef\x16\x78\xe6\xfc\xb9\
-\x1a\xa5\xdb\x7d\x92\x17\xff\x00\x97\x7b\x54\xf9\x20\x8f\x1f\xec\
-\xc6\xaa\x0f\xab\x6e\x6e\xf5\xcb\x7c\x37\xf0\x0e\xaf\xf1\x53\xc7\
-\x7a\x17\x84\xb4\x0b\x6f\xb5\x6b\x3a\xc5\xd4\x76\x96\xd1\xe3\x03\
-\x73\x10\x32\xde\x8a\xa3\x2c\x4f\xa0\x35\xcb\x89\x18\x1c\x86\x20\
-\xe3\x1d\x7b\x63\x18\xfc\xab\xf4\x63\xfe\x08\xbb\xf0\xc6\xdb\xc4\
-\x7f\x17\xbc\x63\xe3\x7b\x98\x44\xaf\xe1\x9d\x3a\x2b\x6b\x62\xc0\
-\x7e\xee\x6b\xa6\x91\x4b\x8f\x71\x14\x32\x2f\xfc\x0c\xfa\xd0\x07\
-\xe9\x17\xec\xbb\xfb\x32\x78\x4f\xf6\x59\xf8\x69\x69\xe1\x9d\x06\
-\x15\x9a\xfe\x45\x59\xf5\x5d\x62\x54\x02\x7b\xfb\x81\xf7\x9d\xb8\
-\xe1\x17\xa2\x2f\xf0\x8c\x67\x2c\x59\x9b\xdb\x29\x36\xaf\xa0\xeb\
-\x9e\x94\xea\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x2b\xf1\x7f\xfe\x0b\x4d\x66\xf1\xfe\xd2\x5e\x10\
-\xb9\x2a\xcb\x13\xf8\x4a\x18\xc3\xf6\x2c\x2f\x6f\x0b\x01\xf8\x30\
-\xfc\xc5\x7e\xd0\x57\xe7\xff\x00\xfc\x15\xb7\xf6\x6d\xbf\xf8\xb1\
-\xf0\xab\x49\xf1\xef\x87\xad\x1a\xf7\x59\xf0\x79\x93\xed\xb6\xf1\
-\x2e\x64\x96\xc2\x50\x85\xdb\x03\x92\x62\x64\x56\x0a\x3f\x85\xe5\
-\x3d\x45\x00\x7e\x2b\xd7\xf4\x1b\xfb\x2c\x7e\xd1\x9f\x0c\xee\x7f\
-\x67\x3f\x86\x70\x37\xc4\x0f\x0e\x59\x5d\xd8\xf8\x6e\xc6\xca\xe6\
-\xd2\xfb\x55\x82\x09\xe2\x9e\x18\x12\x29\x63\x68\xdd\xd5\x94\xab\
-\x29\x1c\x8e\x46\x0d\x7f\x3e\xac\xbb\x49\xc8\xc7\x38\xe4\x62\x91\
-\xa5\x76\xea\xec\x7e\xa7\xdb\x1f\xca\x80\x3f\xa6\x5f\xf8\x68\x2f\
-\x85\xff\x00\xf4\x52\x7c\x23\xff\x00\x83\xdb\x5f\xfe\x39\x47\xfc\
-\x34\x17\xc2\xff\x00\xfa\x29\x3e\x11\xff\x00\xc1\xed\xaf\xff\x00\
-\x1c\xaf\xe6\x63\x34\x66\x80\x3f\xa6\x7f\xf8\x68\x2f\x85\xff\x00\
-\xf4\x52\x7c\x23\xff\x00\x83\xdb\x5f\xfe\x39\x47\xfc\x34\x17\xc2\
-\xff\x00\xfa\x29\x3e\x11\xff\x00\xc1\xed\xaf\xff\x00\x1c\xaf\xe6\
-\x63\x34\x66\x80\x3f\xa6\x7f\xf8\x68\x2f\x85\xff\x00\xf4\x52\x7c\
-\x23\xff\x00\x83\xdb\x5f\xfe\x39\x47\xfc\x34\x17\xc2\xff\x00\xfa\
-\x29\x3e\x11\xff\x00\xc1\xed\xaf\xff\x00\x1c\xaf\xe6\x63\x34\x66\
-\x80\x3f\xa6\x7f\xf8\x68\x2f\x85\xff\x00\xf4\x52\x7c\x23\xff\x00\
-\x83\xdb\x5f\xfe\x39\x47\xfc\x34\x17\xc2\xff\x00\xfa\x29\x3e\x11\
-\xff\x00\xc1\xed\xaf\xff\x00\x1c\xaf\xe6\x63\x34\x66\x80\x3f\xa6\
-\x7f\xf8\x68\x2f\x85\xff\x00\xf4\x52\x7c\x23\xff\x00\x83\xdb\x5f\
-\xfe\x39\x47\xfc\x34\x17\xc2\xff\x00\xfa\x29\x3e\x11\xff\x00\xc1\
-\xed\xaf\xff\x00\x1c\xaf\xe6\x63\x34\x66\x80\x3f\xa6\x7f\xf8\x68\
-\x2f\x85\xff\x00\xf4\x52\x7c\x23\xff\x00\x83\xdb\x5f\xfe\x39\x47\
-\xfc\x34\x17\xc2\xff\x00\xfa\x29\x3e\x11\xff\x00\xc1\xed\xaf\xff\
-\x00\x1c\xaf\xe6\x63\x34\x66\x80\x3f\xa0\xdf\xda\x9f\xf6\x8c\xf8\
-\x67\x6d\xfb\x39\xfc\x4c\x81\x7e\x20\x78\x72\xf6\xee\xfb\xc3\x77\
-\xd6\x56\xd6\x96\x3a\xac\x13\xcf\x2c\xf3\x40\xf1\x45\x1a\xc6\x8e\
-\xcc\xc5\x99\x80\xe0\x70\x32\x6b\xf9\xf2\xa7\x2c\xae\xbd\x1d\x87\
-\xd0\xfb\x63\xf9\x52\xaa\xee\x23\x03\x3c\xe3\x81\x9a\x00\xfd\x05\
-\xff\x00\x82\x2c\x59\xbc\x9f\xb4\x97\x8b\xee\x76\xb3\x44\x9e\x12\
-\x9a\x32\xfd\x83\x1b\xdb\x32\xa0\xfe\x0a\x7f\x23\x5f\xb4\x15\xf9\
-\xff\x00\xff\x00\x04\x91\xfd\x9b\x6f\xfe\x14\xfc\x29\xd5\xbc\x7d\
-\xe2\x0b\x46\xb2\xd6\x7c\x60\x63\xfb\x1d\xbc\xcb\x87\x8b\x4f\x8b\
-\x71\x47\xe7\x90\x65\x77\x66\x2a\x7f\x85\x22\x3d\x4d\x7e\x80\x50\
-\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x02\x60\x7a\x57\x89\xfe\xd4\x9f\xb3\x2f\x85\x3f\x6a\x6f\x86\xb7\
-\x7e\x19\xd7\xa1\x48\xaf\xe3\x56\x9f\x4a\xd5\xe3\x50\x67\xb0\xb8\
-\x3f\x75\xd7\x8e\x51\xba\x32\x7f\x10\xce\x3e\x60\xac\xbe\xdb\x4d\
-\xda\xbd\x36\x8c\x67\x3d\x3d\xf3\x40\x1f\xcc\x17\xc4\x8f\x00\xea\
-\xff\x00\x0a\xfc\x75\xae\xf8\x4b\x5f\xb5\xfb\x26\xb3\xa3\xdd\x3d\
-\xa5\xcc\x5d\x46\xe5\x24\x65\x7d\x55\x86\x18\x1f\x42\x2b\xab\xfd\
-\x9a\xbe\x34\x5f\xfe\xcf\xff\x00\x1b\xbc\x29\xe3\x9b\x03\x21\x4d\
-\x2e\xed\x7e\xd9\x0a\x7f\xcb\x7b\x47\x06\x39\xe2\xc7\x72\xd1\xb3\
-\x05\xcf\x46\xda\xdd\x45\x7d\x87\xff\x00\x05\xa0\xf8\x61\x6f\xe1\
-\xbf\x8c\x1e\x0d\xf1\xc5\xb4\x4b\x11\xf1\x36\x9d\x2d\xad\xce\xd1\
-\xf7\xe6\xb4\x31\xa8\x73\xf5\x8a\x68\x97\xfe\xd9\xfb\x57\xe7\x49\
-\x62\x7a\x92\x7b\x50\x07\xf5\x33\xa7\xea\x50\x6a\x96\x16\xd7\xb6\
-\x73\x2d\xcd\xad\xd4\x6b\x34\x33\x21\xca\xba\x30\x05\x58\x7b\x60\
-\x83\x57\xab\xe7\xcf\xd8\x1b\xc6\x12\x78\xf7\xf6\x3d\xf8\x57\xab\
-\x4c\xe6\x49\x63\xd2\x7f\xb3\xd9\x98\xe4\x9f\xb3\x4a\xd6\xd9\x27\
-\xdf\xc9\xcf\xe3\x5f\x41\xd0\x01\x5f\x24\x7f\xc1\x55\x19\x97\xf6\
-\x21\xf1\xd8\x04\x80\xd3\xe9\xa0\xe0\xf5\x1f\x6e\x80\xff\x00\x41\
-\x5f\x5b\xd7\xc8\xbf\xf0\x55\x6f\xf9\x32\x1f\x1c\xff\x00\xd7\xc6\
-\x9b\xff\x00\xa5\xd0\xd0\x07\xe0\x8d\x7e\xb6\xff\x00\xc1\x0f\xd5\
-\x5b\xc1\x7f\x15\x98\xa8\x2d\xf6\xfd\x3c\x67\x1c\xf0\x93\x91\xfa\
-\x93\xf9\xd7\xe4\x95\x7e\xb7\xff\x00\xc1\x0f\xff\x00\xe4\x49\xf8\
-\xad\xff\x00\x61\x0b\x1f\xfd\x17\x35\x00\x7e\x9c\xd1\x45\x14\x00\
-\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\
-\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\
-\x53\x5a\x34\x91\x4a\xb2\xab\x29\xc8\x2a\x46\x41\xcf\x5a\x75\x14\
-\x01\xf9\xed\xfb\x4b\x7f\xc1\x23\xbc\x19\xf1\x4b\x5a\xbc\xf1\x0f\
-\xc3\xbd\x4c\x78\x03\x55\xb8\x3e\x64\xba\x63\x5a\xf9\xda\x6c\x8d\
-\xeb\x1a\x2b\x06\x83\xdc\x0d\xcb\xfd\xd4\x15\xf2\xcd\xc7\xfc\x11\
-\x87\xe3\x7c\x33\x32\xc5\xaf\x78\x22\x78\xc7\x49\x3f\xb4\x2e\xc6\
-\x7f\x0f\xb3\x57\xed\x75\x18\x1e\x94\x01\xf8\x9b\xff\x00\x0e\x61\
-\xf8\xe7\xff\x00\x41\xbf\x03\xff\x00\xe0\xce\xeb\xff\x00\x91\x68\
-\xff\x00\x87\x30\xfc\x73\xff\x00\xa0\xdf\x81\xff\x00\xf0\x67\x75\
-\xff\x00\xc8\xb5\xfb\x67\x45\x00\x7e\x26\x7f\xc3\x98\x7e\x39\xff\
-\x00\xd0\x6f\xc0\xff\x00\xf8\x33\xba\xff\x00\xe4\x5a\x3f\xe1\xcc\
-\x3f\x1c\xff\x00\xe8\x37\xe0\x7f\xfc\x19\xdd\x7f\xf2\x2d\x7e\xd9\
-\xd1\x40\x1f\x89\x9f\xf0\xe6\x1f\x8e\x7f\xf4\x1b\xf0\x3f\xfe\x0c\
-\xee\xbf\xf9\x16\x8f\xf8\x73\x0f\xc7\x3f\xfa\x0d\xf8\x1f\xff\x00\
-\x06\x77\x5f\xfc\x8b\x5f\xb6\x74\x50\x07\xe2\x67\xfc\x39\x87\xe3\
-\x9f\xfd\x06\xfc\x0f\xff\x00\x83\x3b\xaf\xfe\x45\xa3\xfe\x1c\xc3\
-\xf1\xcf\xfe\x83\x7e\x07\xff\x00\xc1\x9d\xd7\xff\x00\x22\xd7\xed\
-\x9d\x14\x01\xf8\x99\xff\x00\x0e\x61\xf8\xe7\xff\x00\x41\xbf\x03\
-\xff\x00\xe0\xce\xeb\xff\x00\x91\x68\xff\x00\x87\x30\xfc\x73\xff\
-\x00\xa0\xdf\x81\xff\x00\xf0\x67\x75\xff\x00\xc8\xb5\xfb\x67\x45\
-\x00\x7e\x26\x7f\xc3\x98\x7e\x39\xff\x00\xd0\x6f\xc0\xff\x00\xf8\
-\x33\xba\xff\x00\xe4\x5a\x3f\xe1\xcc\x3f\x1c\xff\x00\xe8\x37\xe0\
-\x7f\xfc\x19\xdd\x7f\xf2\x2d\x7e\xd9\xd1\x40\x1f\x8a\x16\xff\x00\
-\xf0\x46\x0f\x8d\xd3\x4c\xab\x2e\xbd\xe0\x78\x23\x3d\x64\xfe\xd0\
-\xbb\x38\xfc\x3e\xcd\x5f\x53\x7e\xcd\x1f\xf0\x48\xff\x00\x05\x7c\
-\x2c\xd6\x6c\xfc\x43\xf1\x17\x53\x5f\x1f\xea\xd0\x1d\xf0\xe9\x82\
-\xdc\x43\xa6\x46\xfd\x8b\xab\x31\x69\xfd\x83\x6d\x5f\xef\x21\xaf\
-\xd0\x8d\xa3\x39\xc7\x34\x6d\x1c\xf1\x40\x0d\x8e\x24\x8d\x42\xa2\
-\x2a\x28\x18\x0a\xa3\x03\xd2\x9f\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\
-\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x01\xf9\
-\x87\xff\x00\x05\xc0\x85\x57\xc1\x9f\x0a\x5c\x28\x07\xfb\x43\x50\
-\xed\xeb\x1c\x24\xd7\xe4\x9d\x7e\xb7\xff\x00\xc1\x70\x3f\xe4\x49\
-\xf8\x53\xff\x00\x61\x0b\xef\xfd\x17\x0d\x7e\x48\x50\x07\xef\x8f\
-\xfc\x12\xb2\x42\xff\x00\xb1\x0f\x81\x01\x24\x85\x9f\x52\x00\x1e\
-\xc3\xed\xf3\x9c\x7e\xa7\xf3\xaf\xad\xeb\xe4\x5f\xf8\x25\x47\xfc\
-\x99\x0f\x81\xbf\xeb\xe3\x52\xff\x00\xd2\xe9\xab\xeb\xaa\x00\x2b\
-\xe4\x5f\xf8\x2a\xbf\xfc\x99\x0f\x8e\x7f\xeb\xe3\x4d\xff\x00\xd2\
-\xe8\x6b\xeb\xaa\xf9\x17\xfe\x0a\xaf\xff\x00\x26\x43\xe3\x9f\xfa\
-\xf8\xd3\x7f\xf4\xba\x1a\x00\xfc\x11\xaf\xd6\xff\x00\xf8\x22\x07\
-\xfc\x89\x3f\x15\xbf\xeb\xfe\xc7\xff\x00\x45\xcd\x5f\x92\x15\xfa\
-\xdf\xff\x00\x04\x40\xff\x00\x91\x27\xe2\xb7\xfd\x7f\xd8\xff\x00\
-\xe8\xb9\xa8\x03\xf4\xe6\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\
-\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\xcc\
-\xd5\xb5\xcd\x3f\xc3\xfa\x6c\xda\x86\xa9\xa8\xdb\x69\xb6\x10\x8c\
-\xc9\x75\x7b\x3a\x45\x14\x63\xd4\xb3\x1c\x7e\x66\xbc\x4b\xc4\x9f\
-\xb7\xa7\xec\xff\x00\xe1\x09\x5a\x2d\x47\xe2\xbf\x87\xe5\x91\x7a\
-\x8d\x36\x66\xbf\x1f\x9d\xba\x3d\x00\x7d\x01\x45\x7c\xc9\x61\xff\
-\x00\x05\x24\xfd\x9c\x35\x39\x0c\x30\xfc\x52\xb1\x8e\x4e\x9f\xe9\
-\x36\x17\x90\x0f\xfb\xea\x48\x00\xaf\x5f\xf0\x1f\xc7\x0f\x87\xff\
-\x00\x14\x94\x0f\x07\xf8\xdf\xc3\xfe\x26\x93\x68\x66\x83\x4c\xd4\
-\xa2\x96\x64\x1e\xac\x81\xb7\x2f\xd1\x80\xa0\x0e\xf2\x8a\x8f\x70\
-\x6e\xe7\x18\xeb\x9e\xbf\x95\x49\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\
-\x40\x05\x14\x51\x40\x1f\x98\xdf\xf0\x5b\xff\x00\xf9\x12\x7e\x14\
-\xff\x00\xd7\xfd\xf7\xfe\x8b\x86\xbf\x24\x2b\xf5\xbf\xfe\x0b\x7f\
-\xff\x00\x22\x4f\xc2\x9f\xfa\xff\x00\xbe\xff\x00\xd1\x70\xd7\xe4\
-\x85\x00\x7e\xf7\x7f\xc1\x2a\x3f\xe4\xc8\x7c\x0d\xff\x00\x5f\x1a\
-\x97\xfe\x97\x4d\x5f\x5d\x57\xc8\xbf\xf0\x4a\x8f\xf9\x32\x1f\x03\
-\x7f\xd7\xc6\xa5\xff\x00\xa5\xd3\x57\xd7\x54\x00\x57\xc8\xbf\xf0\
-\x55\x7f\xf9\x32\x1f\x1c\xff\x00\xd7\xc6\x9b\xff\x00\xa5\xd0\xd7\
-\xd7\x55\xf2\x2f\xfc\x15\x5f\xfe\x4c\x87\xc7\x3f\xf5\xf1\xa6\xff\
-\x00\xe9\x74\x34\x01\xf8\x23\x5f\xad\xff\x00\xf0\x44\x0f\xf9\x12\
-\x7e\x2b\x7f\xd7\xfd\x8f\xfe\x8b\x9a\xbf\x24\x2b\xf5\xbf\xfe\x08\
-\x81\xff\x00\x22\x4f\xc5\x6f\xfa\xff\x00\xb1\xff\x00\xd1\x73\x50\
-\x07\xe9\xcd\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x14\x55\x3b\xdd\x42\x0d\x36\xce\x6b\xbb\xb9\xd2\xde\
-\xd6\x14\x32\x4b\x34\x8c\x15\x11\x00\xc9\x66\x27\xa0\x14\x01\x57\
-\x58\xd6\xad\xb4\x4d\x36\xe6\xfe\xfa\xf6\x0b\x1b\x2b\x58\x9a\x7b\
-\x8b\xab\x89\x02\x47\x1c\x6a\x32\xee\xc4\xfd\xd0\xa0\x64\x93\xc0\
-\xcf\x7a\xfc\xcf\xfd\xaa\x3f\xe0\xaf\xab\xa6\xdc\x5d\x78\x6f\xe0\
-\x9d\xa4\x57\xb3\xa6\xe8\xe4\xf1\x56\xa5\x09\x68\xb3\x8e\xb6\xd6\
-\xe7\xef\x7b\x3c\x9f\x2f\xa2\x30\xf9\xab\xe7\x7f\xf8\x28\x47\xed\
-\xe7\xa8\xfe\xd2\x1e\x26\xba\xf0\x87\x84\xae\x66\xb1\xf8\x61\xa7\
-\x4b\x85\xf2\xc9\x0d\xab\xc8\x87\x89\xe5\xff\x00\xa6\x61\xbe\xe4\
-\x67\x81\xf7\x9b\x2c\x40\x4f\x89\xb7\x1f\x53\xe9\x40\x1d\xbf\xc4\
-\xaf\x8c\x1e\x37\xf8\xc5\xad\x3e\xa7\xe3\x5f\x14\xea\x9e\x26\xbc\
-\x0d\x94\x7b\xeb\x93\x22\x45\xec\x8b\x9d\x91\xaf\xb2\x80\x2b\x87\
-\xdc\x7d\x6b\xd3\x3e\x0f\xfe\xcf\x9f\x10\xbe\x3d\xeb\x3f\xd9\x9e\
-\x04\xf0\xbd\xe7\x88\xa6\x84\x85\x9e\x78\x95\x52\xda\xdf\x23\x3f\
-\xbd\x9d\xca\xa4\x7d\xf1\xb9\x86\x71\xf2\xe6\xbe\xd5\xf0\x1f\xfc\
-\x11\x4b\xc7\x7a\xb5\xaa\x49\xe2\xef\x1e\xe8\x7e\x1c\x76\xe7\xca\
-\xd3\x6d\x25\xd4\x5d\x07\xa3\x6e\x30\x8c\xfd\x19\xa8\x03\xf3\x7b\
-\x71\xf5\xa9\xac\xef\xae\x74\xfb\x88\xae\x2d\x6e\x25\xb6\x9e\x26\
-\xdf\x1c\xb0\xb9\x46\x46\xf5\x04\x72\x0d\x7e\xa2\x6a\xdf\xf0\x43\
-\xbb\xb8\xad\x9d\xb4\xbf\x8b\xf6\xf7\x17\x1f\xc3\x1d\xe7\x87\x5a\
-\x25\xff\x00\xbe\xd6\xe5\xbf\xf4\x1a\xf9\x93\xe3\x77\xfc\x13\x4f\
-\xe3\x67\xc1\x3b\x19\xf5\x19\x34\x08\x3c\x61\xa3\x42\xa5\xa4\xbf\
-\xf0\xc4\x8d\x75\xb1\x47\xf1\x34\x2c\xab\x30\xc7\xf1\x30\x4d\xab\
-\xdc\x9a\x00\xdc\xfd\x9e\x3f\xe0\xa7\xdf\x18\x3e\x0a\xdc\x5a\xd9\
-\xeb\x7a\x93\xfc\x45\xf0\xc2\xb6\x24\xb0\xd6\xa6\x2f\x76\xab\xfc\
-\x5e\x5d\xd1\x06\x40\x7d\x37\x87\x5f\x6a\xfd\x74\xfd\x9b\x7f\x6a\
-\xaf\x02\xfe\xd4\x5e\x15\x3a\xaf\x83\xf5\x5d\xd7\xf6\xe1\x3f\xb4\
-\x34\x5b\xb2\x23\xbd\xb2\x63\xd4\x49\x1f\x39\x53\xd9\xd7\xe5\x6e\
-\x80\xe4\x10\xbf\xce\x43\x46\x62\x91\x81\x5d\xa7\x90\x41\xea\x31\
-\xd7\x8e\x3f\x23\x5d\x57\xc2\xbf\x8a\x9e\x27\xf8\x2f\xe3\x8d\x3b\
-\xc5\x9e\x11\xd5\x66\xd2\x75\xcb\x06\xcc\x72\xc2\x49\x0e\xbf\xc5\
-\x1c\x8b\xd1\xd1\xbb\xa9\xc8\x34\x01\xfd\x3b\x51\x5f\x3f\x7e\xc6\
-\xff\x00\xb5\xa6\x8b\xfb\x5a\x7c\x2f\x8b\x5c\xb5\x44\xd3\xbc\x47\
-\x63\xb6\x0d\x6b\x48\x0f\x93\x6f\x36\x08\x0e\xbd\xcc\x4f\x82\xca\
-\xde\xcc\xa7\x95\x39\xfa\x06\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\
-\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\x28\xa2\x80\x0a\xa1\x7f\xaa\
-\x5b\x69\x36\xf2\x5c\xde\x5d\x47\x6b\x6f\x1e\x4b\xcb\x3c\x8a\x8a\
-\x83\x1d\x49\x24\x60\x7d\x79\xab\xf5\xf8\x43\xff\x00\x05\x3c\xf8\
-\xf9\xe2\x7f\x89\x9f\xb4\x97\x89\xfc\x27\x73\x7f\x75\x07\x85\xbc\
-\x2d\x72\x2c\x2c\xb4\xa0\xcc\xb0\xef\x55\x1e\x6c\xcc\xb9\xc3\x39\
-\x90\xbe\x18\x8c\xed\xda\x3a\x50\x07\xed\x7f\xfc\x2d\xef\x03\x7f\
-\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\x00\xc5\x51\xff\x00\x0b\x7b\xc0\
-\xdf\xf4\x3a\x78\x77\xff\x00\x06\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\
-\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\
-\x00\xc5\x51\xff\x00\x0b\x7b\xc0\xdf\xf4\x3a\x78\x77\xff\x00\x06\
-\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\
-\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\x00\xc5\x51\xff\x00\x0b\x7b\xc0\
-\xdf\xf4\x3a\x78\x77\xff\x00\x06\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\
-\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\
-\x00\xc5\x51\xff\x00\x0b\x7b\xc0\xdf\xf4\x3a\x78\x77\xff\x00\x06\
-\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\
-\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\x00\xc5\x51\xff\x00\x0b\x7b\xc0\
-\xdf\xf4\x3a\x78\x77\xff\x00\x06\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\
-\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\
-\x00\xc5\x51\xff\x00\x0b\x7b\xc0\xdf\xf4\x3a\x78\x77\xff\x00\x06\
-\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\
-\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\x00\xc5\x51\xff\x00\x0b\x7b\xc0\
-\xdf\xf4\x3a\x78\x77\xff\x00\x06\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\
-\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\
-\x00\xc5\x51\xff\x00\x0b\x7b\xc0\xdf\xf4\x3a\x78\x77\xff\x00\x06\
-\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\
-\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\x00\xc5\x51\xff\x00\x0b\x7b\xc0\
-\xdf\xf4\x3a\x78\x77\xff\x00\x06\xd0\x7f\xf1\x55\xfc\xc3\x51\x40\
-\x1f\xd3\xcf\xfc\x2d\xef\x03\x7f\xd0\xe9\xe1\xdf\xfc\x1b\x41\xff\
-\x00\xc5\x56\xce\x93\xe2\x2d\x3b\x5e\xb3\x6b\xbd\x2b\x52\xb5\xd5\
-\x2d\x87\xca\x26\xb3\x99\x25\x4c\xfa\x65\x4e\x3f\x33\x5f\xcb\x6d\
-\x7b\x2f\xec\xb7\xf1\xeb\xc4\xbf\xb3\xdf\xc6\x1f\x0f\xf8\x87\xc3\
-\xf7\xd7\x09\x6e\xd7\x91\x43\xa8\xe9\xb1\x92\x62\xbf\xb6\x66\x55\
-\x92\x27\x4e\x87\x2a\xcd\xb4\xe3\x2a\xc0\x11\x40\x1f\xd2\x1d\x14\
-\x51\x40\x05\x14\x51\x40\x1f\x98\xdf\xf0\x5b\xff\x00\xf9\x12\x7e\
-\x14\xff\x00\xd7\xfd\xf7\xfe\x8b\x86\xbf\x24\x2b\xf5\xbf\xfe\x0b\
-\x7f\xff\x00\x22\x4f\xc2\x9f\xfa\xff\x00\xbe\xff\x00\xd1\x70\xd7\
-\xe4\x85\x00\x7e\xf7\x7f\xc1\x2a\x3f\xe4\xc8\x7c\x0d\xff\x00\x5f\
-\x1a\x97\xfe\x97\x4d\x5f\x5d\x57\xc8\xbf\xf0\x4a\x8f\xf9\x32\x1f\
-\x03\x7f\xd7\xc6\xa5\xff\x00\xa5\xd3\x57\xd7\x54\x00\x57\xc8\xbf\
-\xf0\x55\x7f\xf9\x32\x1f\x1c\xff\x00\xd7\xc6\x9b\xff\x00\xa5\xd0\
-\xd7\xd7\x55\xf2\x2f\xfc\x15\x5f\xfe\x4c\x87\xc7\x3f\xf5\xf1\xa6\
-\xff\x00\xe9\x74\x34\x01\xf8\x23\x5f\xad\xff\x00\xf0\x44\x0f\xf9\
-\x12\x7e\x2b\x7f\xd7\xfd\x8f\xfe\x8b\x9a\xbf\x24\x2b\xf5\xbf\xfe\
-\x08\x81\xff\x00\x22\x4f\xc5\x6f\xfa\xff\x00\xb1\xff\x00\xd1\x73\
-\x50\x07\xe9\xcd\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x7e\x71\xff\x00\xc1\x5e\xbf\x6a\x09\xbc\x0f\xe0\
-\x6d\x3b\xe1\x37\x87\xef\x7c\x9d\x57\xc4\xf0\xb5\xce\xb1\x24\x67\
-\x0f\x1e\x9f\xbb\x0b\x1e\x47\x41\x2b\xab\x03\xfe\xcc\x6c\x0f\x0d\
-\x5f\xa3\x95\xfc\xe4\xfe\xda\x1f\x15\xa4\xf8\xcb\xfb\x4e\xfc\x40\
-\xf1\x19\x97\xce\xb2\x6d\x4a\x4b\x2b\x0c\x9c\xa8\xb5\x80\xf9\x51\
-\x95\xf4\xdc\x23\xdd\xc7\x77\x27\xbd\x00\x78\x76\xe6\xce\x72\x73\
-\x9c\xe7\x35\xf6\x27\xec\x0b\xfb\x08\x5e\xfe\xd5\x1e\x24\x97\x5d\
-\xf1\x08\x9f\x4c\xf8\x71\xa5\x4c\x23\xba\xb9\x8c\x6d\x93\x50\x9b\
-\x01\xbe\xcf\x09\xed\xf2\x95\x2c\xe3\xa0\x23\x1c\x9e\x3e\x61\xf8\
-\x6f\xe0\x4d\x47\xe2\x77\x8f\xbc\x3b\xe1\x2d\x22\x31\x26\xa9\xad\
-\xdf\x43\x61\x6f\x91\xc2\xb4\x8e\x17\x71\xf6\x5c\xe4\xfb\x03\x5f\
-\xd2\x57\xc2\x4f\x85\x7a\x27\xc1\x8f\x87\x1a\x07\x83\x3c\x3f\x07\
-\x93\xa5\x68\xf6\xab\x6d\x11\x0a\x03\x3b\x0c\x97\x91\xb1\xd5\x99\
-\xc9\x63\xea\x49\x34\x01\x7f\xc0\x9e\x03\xf0\xf7\xc3\x0f\x0b\xd9\
-\x78\x7b\xc2\xfa\x45\xae\x87\xa2\x59\xaf\x97\x0d\x9d\xa4\x7b\x14\
-\x7f\x56\x62\x7a\xb1\xe4\xd7\x4f\x81\xe9\x46\xd0\x3b\x0f\x4e\x94\
-\xb4\x00\x94\x9b\x14\x7f\x08\xfc\xa9\xd4\x50\x07\xc1\xff\x00\xb7\
-\x6f\xfc\x13\x8f\x40\xf8\xe1\xa4\xea\x5e\x35\xf0\x0e\x9f\x06\x8b\
-\xf1\x16\x15\x69\xa5\xb5\xb7\x55\x86\xdb\x5a\xc0\xe5\x19\x71\x84\
-\x9d\x8f\xdd\x97\xa1\x3c\x3e\x41\x0c\x9f\x8a\x9a\x86\x9f\x73\xa5\
-\x5f\x5c\x59\x5e\x41\x25\xad\xdd\xbb\xb4\x73\x5b\xca\xa4\x3c\x4c\
-\x0e\xd2\xa4\x1e\xe2\xbf\xa9\xad\xa0\xf5\x03\xf2\xaf\xc6\xaf\xf8\
-\x2c\x17\xec\xed\x6b\xe0\x1f\x89\xda\x3f\xc4\xdd\x1a\xd5\x61\xd3\
-\x7c\x5a\x1e\x0d\x49\x23\x5d\xa8\xb7\xf1\xa8\x3e\x67\x1c\x03\x22\
-\x1d\xc7\xd5\xa3\x73\xdc\xd0\x07\xcd\x3f\xb1\x9f\xed\x21\x7d\xfb\
-\x30\xfc\x72\xd1\xbc\x54\xb2\x48\xda\x14\xc7\xec\x5a\xe5\xaa\xf4\
-\x96\xcd\xc8\x0e\xc1\x47\x05\xd0\xed\x75\xf5\x65\x03\xa3\x1a\xfe\
-\x87\xec\x6f\xe0\xd5\x2d\x6d\xae\xed\x67\x59\xed\xae\xa2\x13\x43\
-\x2c\x6d\x94\x92\x36\x00\x86\x04\x76\x20\x82\x3e\xb5\xfc\xb2\xee\
-\x3c\x72\x6b\xf7\xbf\xfe\x09\x7f\xf1\x62\x4f\x8a\x5f\xb2\x3f\x86\
-\xe2\xba\x9b\xed\x1a\x8f\x86\x65\x93\x40\x9d\x89\xe7\x6c\x41\x5e\
-\xdc\x7e\x10\x49\x0a\xe7\xd5\x0d\x00\x7d\x71\x45\x14\x50\x01\x45\
-\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x5f\
-\x9e\x3f\xb7\x47\xfc\x13\x2e\xf3\xe3\xf7\x8f\x6e\x7e\x20\x7c\x3e\
-\xd5\xf4\xfd\x27\xc4\xb7\xc8\x83\x53\xd3\xb5\x66\x64\xb7\xbb\x65\
-\x4d\x8b\x2a\x48\xaa\xc6\x39\x08\x01\x4a\x95\xc3\x10\xa4\x32\xfc\
-\xd9\xfd\x0e\xa4\xda\x0f\x51\x40\x1f\x87\x9f\xf0\xe7\x7f\x8f\x9f\
-\xde\xf0\xa7\xfe\x0d\x5f\xff\x00\x8d\xd1\xff\x00\x0e\x77\xf8\xfb\
-\xeb\xe1\x5f\xfc\x1a\xbf\xff\x00\x1b\xaf\xdc\x4a\x28\x03\xf0\xef\
-\xfe\x1c\xef\xf1\xf7\xd7\xc2\xbf\xf8\x35\x7f\xfe\x37\x47\xfc\x39\
-\xdf\xe3\xef\xaf\x85\x7f\xf0\x6a\xff\x00\xfc\x6e\xbf\x71\x28\xa0\
-\x0f\xc3\xbf\xf8\x73\xbf\xc7\xdf\x5f\x0a\xff\x00\xe0\xd5\xff\x00\
-\xf8\xdd\x1f\xf0\xe7\x7f\x8f\xbe\xbe\x15\xff\x00\xc1\xab\xff\x00\
-\xf1\xba\xfd\xc4\xa2\x80\x3f\x0e\xff\x00\xe1\xce\xff\x00\x1f\x7d\
-\x7c\x2b\xff\x00\x83\x57\xff\x00\xe3\x74\x7f\xc3\x9d\xfe\x3e\xfa\
-\xf8\x57\xff\x00\x06\xaf\xff\x00\xc6\xeb\xf7\x12\x8a\x00\xfc\x3b\
-\xff\x00\x87\x3b\xfc\x7d\xf5\xf0\xaf\xfe\x0d\x5f\xff\x00\x8d\xd1\
-\xff\x00\x0e\x77\xf8\xfb\xeb\xe1\x5f\xfc\x1a\xbf\xff\x00\x1b\xaf\
-\xdc\x4a\x28\x03\xf0\xef\xfe\x1c\xef\xf1\xf7\xd7\xc2\xbf\xf8\x35\
-\x7f\xfe\x37\x47\xfc\x39\xdf\xe3\xef\xaf\x85\x7f\xf0\x6a\xff\x00\
-\xfc\x6e\xbf\x71\x28\xa0\x0f\xc3\xbf\xf8\x73\xbf\xc7\xdf\x5f\x0a\
-\xff\x00\xe0\xd5\xff\x00\xf8\xdd\x1f\xf0\xe7\x7f\x8f\xbe\xbe\x15\
-\xff\x00\xc1\xab\xff\x00\xf1\xba\xfd\xc4\xa2\x80\x3f\x0e\xff\x00\
-\xe1\xce\xff\x00\x1f\x7d\x7c\x2b\xff\x00\x83\x57\xff\x00\xe3\x74\
-\x7f\xc3\x9d\xfe\x3e\xfa\xf8\x57\xff\x00\x06\xaf\xff\x00\xc6\xeb\
-\xf7\x12\x8a\x00\xfc\x3b\xff\x00\x87\x3b\xfc\x7d\xf5\xf0\xaf\xfe\
-\x0d\x5f\xff\x00\x8d\xd1\xff\x00\x0e\x77\xf8\xfb\xeb\xe1\x5f\xfc\
-\x1a\xbf\xff\x00\x1b\xaf\xdc\x4a\x28\x03\xf0\xef\xfe\x1c\xef\xf1\
-\xf7\xd7\xc2\xbf\xf8\x35\x7f\xfe\x37\x5e\xef\xfb\x26\xff\x00\xc1\
-\x24\x75\xbf\x07\x7c\x45\xd2\x7c\x57\xf1\x57\x58\xd1\xee\x2c\xb4\
-\x6b\xa4\xbb\xb5\xd0\xf4\x97\x79\xcd\xc4\xe8\x77\x21\x9a\x46\x55\
-\x50\x81\x82\xb6\xd0\x1b\x78\xe1\xb1\x5f\xa9\xb4\x9b\x47\x5c\x73\
-\x40\x0b\x45\x14\x50\x01\x45\x14\x50\x07\xe6\x37\xfc\x16\xff\x00\
-\xfe\x44\x9f\x85\x3f\xf5\xff\x00\x7d\xff\x00\xa2\xe1\xaf\xc9\x0a\
-\xfd\x6f\xff\x00\x82\xdf\xff\x00\xc8\x93\xf0\xa7\xfe\xbf\xef\xbf\
-\xf4\x5c\x35\xf9\x21\x40\x1f\xbd\xdf\xf0\x4a\x8f\xf9\x32\x1f\x03\
-\x7f\xd7\xc6\xa5\xff\x00\xa5\xd3\x57\xd7\x55\xf2\x2f\xfc\x12\xa3\
-\xfe\x4c\x87\xc0\xdf\xf5\xf1\xa9\x7f\xe9\x74\xd5\xf5\xd5\x00\x15\
-\xf2\x2f\xfc\x15\x5f\xfe\x4c\x87\xc7\x3f\xf5\xf1\xa6\xff\x00\xe9\
-\x74\x35\xf5\xd5\x7c\x8b\xff\x00\x05\x57\xff\x00\x93\x21\xf1\xcf\
-\xfd\x7c\x69\xbf\xfa\x5d\x0d\x00\x7e\x08\xd7\xeb\x7f\xfc\x11\x03\
-\xfe\x44\x9f\x8a\xdf\xf5\xff\x00\x63\xff\x00\xa2\xe6\xaf\xc9\x0a\
-\xfd\x6f\xff\x00\x82\x20\x7f\xc8\x93\xf1\x5b\xfe\xbf\xec\x7f\xf4\
-\x5c\xd4\x01\xfa\x73\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\
-\x01\x45\x14\x50\x07\x37\xf1\x0b\x5e\x93\xc2\xfe\x03\xf1\x2e\xb3\
-\x13\x62\x4d\x3b\x4c\xba\xbc\x5f\xac\x71\x33\xff\x00\xec\xb5\xfc\
-\xbe\x33\xb3\x31\x62\xc4\xb1\x39\x24\x9e\x4d\x7f\x4f\xbf\x13\xb4\
-\x59\x3c\x45\xf0\xd3\xc5\x9a\x44\x23\x33\xdf\xe9\x37\x76\xa8\x07\
-\x76\x92\x17\x50\x3f\xf1\xea\xfe\x60\xca\x95\xcf\x1c\x8e\x08\x22\
-\x80\x3e\xca\xff\x00\x82\x4c\xf8\x46\x1f\x14\x7e\xd9\x1a\x25\xdc\
-\xe8\xb2\x2e\x87\xa6\x5e\xea\x48\xac\x01\x1b\xbc\xbf\x21\x4e\x0f\
-\x70\x67\x0c\x0f\x62\xa0\xd7\xee\xde\x07\x5c\x57\xe1\x57\xfc\x12\
-\x3f\xc4\xf0\xf8\x7f\xf6\xc2\xd3\x6c\xe4\x60\x8f\xad\x69\x37\xba\
-\x7c\x6c\xc7\x03\x70\x55\x9f\x1f\x52\x20\xc0\xf7\x35\xfb\xad\x40\
-\x05\x14\x51\x40\x05\x14\x51\x40\x05\x7c\x7f\xff\x00\x05\x5a\xf0\
-\x9c\x1e\x24\xfd\x8b\xbc\x57\x77\x24\x7b\xee\x34\x5b\xdb\x0d\x4a\
-\xdc\xe3\x38\x6f\xb4\xc7\x03\x1f\x6f\xdd\xcf\x27\xe1\x9a\xfb\x02\
-\xbe\x4a\xff\x00\x82\xa4\x78\x9a\xdf\xc3\xbf\xb1\x3f\x8e\x61\x91\
-\xd5\x2e\x35\x49\x6c\x6c\x2d\xd4\x9f\xbc\xe6\xea\x27\x60\x3f\xed\
-\x9c\x52\x1f\xc2\x80\x3f\x03\x2b\xf5\xa7\xfe\x08\x7f\xe2\x09\x6e\
-\xbc\x2f\xf1\x67\x45\x66\x26\x1b\x3b\xcd\x3a\xf1\x17\x3c\x6e\x99\
-\x2e\x15\xbf\xf4\x4a\xfe\x95\xf9\x2d\x5f\xac\x3f\xf0\x43\xcd\x16\
-\x68\xb4\x3f\x8b\xda\xb9\x4c\x41\x73\x73\xa5\xda\xa3\xe3\x8d\xd1\
-\xa5\xd3\x30\xff\x00\xc8\xc9\xfa\x50\x07\xea\x3d\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\
-\x14\x51\x40\x1f\x98\xdf\xf0\x5b\xff\x00\xf9\x12\x7e\x14\xff\x00\
-\xd7\xfd\xf7\xfe\x8b\x86\xbf\x24\x2b\xf5\xbf\xfe\x0b\x7f\xff\x00\
-\x22\x4f\xc2\x9f\xfa\xff\x00\xbe\xff\x00\xd1\x70\xd7\xe4\x85\x00\
-\x7e\xf7\x7f\xc1\x2a\x3f\xe4\xc8\x7c\x0d\xff\x00\x5f\x1a\x97\xfe\
-\x97\x4d\x5f\x5d\x57\xc8\xbf\xf0\x4a\x8f\xf9\x32\x1f\x03\x7f\xd7\
-\xc6\xa5\xff\x00\xa5\xd3\x57\xd7\x54\x00\x57\xc8\xbf\xf0\x55\x7f\
-\xf9\x32\x1f\x1c\xff\x00\xd7\xc6\x9b\xff\x00\xa5\xd0\xd7\xd7\x55\
-\xf2\x2f\xfc\x15\x5f\xfe\x4c\x87\xc7\x3f\xf5\xf1\xa6\xff\x00\xe9\
-\x74\x34\x01\xf8\x23\x5f\xad\xff\x00\xf0\x44\x0f\xf9\x12\x7e\x2b\
-\x7f\xd7\xfd\x8f\xfe\x8b\x9a\xbf\x24\x2b\xf5\xbf\xfe\x08\x81\xff\
-\x00\x22\x4f\xc5\x6f\xfa\xff\x00\xb1\xff\x00\xd1\x73\x50\x07\xe9\
-\xcd\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\x05\x14\x51\x40\
-\x09\xb4\x7a\x57\xf3\x6b\xfb\x55\x7c\x2d\x97\xe0\xbf\xed\x11\xe3\
-\xbf\x07\xc9\x6c\x6d\xed\xac\x35\x59\x8d\x9a\x91\x80\x6d\x64\x3e\
-\x6d\xbb\x7b\x8f\x29\xd0\xfe\x9d\xab\xfa\x4b\xaf\xcb\xef\xf8\x2c\
-\x67\xec\xd3\x2e\xad\xa6\xe8\xff\x00\x19\x34\x2b\x3f\x32\x5d\x3e\
-\x31\xa5\xeb\xe9\x1a\xf3\xe4\x16\xff\x00\x47\xb8\x38\xea\x11\xdc\
-\xc6\xcc\x79\xf9\xe2\x1d\x16\x80\x3f\x34\x7e\x0c\x7c\x48\xbb\xf8\
-\x3b\xf1\x53\xc2\x9e\x35\xd3\xc7\x9b\x77\xa1\xea\x30\xdf\x2c\x5d\
-\x3c\xd0\xac\x37\xc5\x9f\x47\x4c\xaf\xe2\x6b\xfa\x4b\xf0\x2f\x8d\
-\xb4\xbf\x88\xde\x0f\xd1\x3c\x51\xa0\x5d\xfd\xbb\x45\xd5\xad\x62\
-\xbd\xb6\x9c\x63\xe6\x8d\xd4\x15\x07\x1d\x1b\x9e\x47\x62\x08\xaf\
-\xe5\xf3\x73\x73\xc9\xe7\xaf\x35\xf7\xe7\xfc\x13\x83\xf6\xf8\x87\
-\xf6\x7f\xbd\x4f\x87\x9e\x3c\xbc\x91\xbc\x01\x7d\x3e\xfb\x1d\x41\
-\xbe\x6f\xec\x89\xdc\xfc\xe0\xe3\xfe\x58\xbb\x1c\xb0\x1f\x75\x81\
-\x71\xf7\x9b\x20\x1f\xb5\x74\x56\x5e\x8f\xac\xda\x6b\x1a\x5d\xad\
-\xfd\x95\xf4\x17\xf6\x57\x51\xa4\xd0\xdd\x5b\xca\xb2\x47\x2c\x6d\
-\xf7\x59\x58\x1c\x10\xdd\x88\xe0\xf6\xc5\x6a\x50\x01\x45\x14\x50\
-\x01\x5f\x91\xdf\xf0\x59\x4f\x8f\xd6\xda\xf7\x88\xbc\x37\xf0\x97\
-\x49\xba\xf3\xa2\xd1\x9b\xfb\x57\x59\xd8\x72\x05\xcb\xa1\x5b\x78\
-\x8e\x3b\xa4\x6f\x23\xb7\xb4\xe9\xdc\x1a\xfb\x13\xf6\xd8\xfd\xba\
-\xbc\x3b\xfb\x2c\xf8\x4e\xe7\x4f\xb1\x9a\x0d\x63\xe2\x3d\xec\x44\
-\x69\xda\x3a\xb6\xf1\x06\x47\x17\x17\x1b\x4f\xcb\x1a\xfd\xe0\xbd\
-\x5f\x80\x30\x0b\x32\xfe\x10\x78\xb3\xc5\x1a\xa7\x8d\xbc\x49\xaa\
-\x6b\xda\xd5\xe4\xda\x8e\xb1\xa9\x5c\x3d\xcd\xdd\xdc\xec\x4c\x92\
-\xc8\xe7\x73\x31\xcf\xd6\x80\x30\xeb\xf7\x6f\xfe\x09\x45\xf0\xbe\
-\x4f\x87\x5f\xb2\x56\x95\x7f\x79\x0f\x93\x7b\xe2\x9b\xe9\xb5\xa7\
-\x56\x04\x30\x88\xed\x86\x1f\xc0\xac\x21\xc7\xfd\x74\xf7\xaf\xc8\
-\x2f\xd9\x8f\xe0\x1e\xa3\xfb\x48\x7c\x6a\xf0\xef\x81\xf4\xe8\xdd\
-\x22\xba\x98\x4b\xa8\xdd\x46\x32\x2d\x6c\xd0\x83\x3c\xa4\xf4\x04\
-\x29\xc0\x1d\xdd\x94\x7f\x10\xaf\xe8\xd3\xc3\xba\x1d\x8f\x85\x74\
-\x3d\x3b\x47\xd3\x2d\x96\xd3\x4d\xd3\xed\x92\xd6\xd6\xde\x3f\xb9\
-\x14\x51\xa8\x54\x51\xe8\x00\x00\x00\x3b\x0a\x00\xd6\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x03\xf3\x1b\xfe\x0b\x7f\xff\x00\x22\x4f\xc2\x9f\
-\xfa\xff\x00\xbe\xff\x00\xd1\x70\xd7\xe4\x85\x7e\xb7\xff\x00\xc1\
-\x6f\xff\x00\xe4\x49\xf8\x53\xff\x00\x5f\xf7\xdf\xfa\x2e\x1a\xfc\
-\x90\xa0\x0f\xde\xef\xf8\x25\x47\xfc\x99\x0f\x81\xbf\xeb\xe3\x52\
-\xff\x00\xd2\xe9\xab\xeb\xaa\xf9\x17\xfe\x09\x51\xff\x00\x26\x43\
-\xe0\x6f\xfa\xf8\xd4\xbf\xf4\xba\x6a\xfa\xea\x80\x0a\xf9\x17\xfe\
-\x0a\xaf\xff\x00\x26\x43\xe3\x9f\xfa\xf8\xd3\x7f\xf4\xba\x1a\xfa\
-\xea\xbe\x45\xff\x00\x82\xab\xff\x00\xc9\x90\xf8\xe7\xfe\xbe\x34\
-\xdf\xfd\x2e\x86\x80\x3f\x04\x6b\xf5\xbf\xfe\x08\x81\xff\x00\x22\
-\x4f\xc5\x6f\xfa\xff\x00\xb1\xff\x00\xd1\x73\x57\xe4\x85\x7e\xb7\
-\xff\x00\xc1\x10\x3f\xe4\x49\xf8\xad\xff\x00\x5f\xf6\x3f\xfa\x2e\
-\x6a\x00\xfd\x39\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\
-\xa2\x8a\x28\x00\xac\x5f\x13\x78\x6f\x4d\xf1\x7f\x87\xf5\x2d\x17\
-\x59\xb4\x8b\x51\xd2\x75\x0b\x77\xb5\xbb\xb5\xb8\x00\xc5\x34\x4e\
-\x08\x64\x60\x7d\x8d\x6b\x16\xdb\xd7\xa6\x3d\x7a\x7e\x35\xf3\x77\
-\xed\x1d\xfb\x7b\x7c\x2a\xfd\x9a\x5a\x7b\x0d\x6b\x58\x3a\xe7\x8a\
-\x63\x1c\x78\x7f\x46\xc4\xd7\x08\x4e\x38\x95\xb2\x12\x21\xfe\xfb\
-\x03\xcf\x0a\xd8\xa0\x0f\xc8\xff\x00\xdb\x83\xf6\x2b\xd6\xbf\x64\
-\xff\x00\x1c\xcb\x2d\xb4\x13\x6a\x5e\x00\xd5\x25\x73\xa3\xea\xe5\
-\x77\x79\x7c\xe4\xdb\x4e\x47\xdd\x95\x07\x73\xc4\x8a\x37\x2f\x46\
-\x51\xf2\xee\xe3\xea\x6b\xec\xdf\xda\x73\xfe\x0a\x75\xf1\x13\xf6\
-\x86\xd0\x75\x3f\x0a\xdb\x69\x1a\x37\x85\xfc\x1b\x7d\xf2\x4b\xa7\
-\xad\xaa\xdf\x5c\x4d\x18\x20\xa8\x92\x69\x94\xa8\x20\x80\x43\x46\
-\x88\x41\x15\xf1\x8d\x00\x7d\x01\xfb\x3d\x7e\xdb\x3f\x15\xbf\x66\
-\x56\x16\x9e\x14\xd7\x05\xd7\x87\xc3\xef\x7d\x03\x57\x8c\xdc\xd8\
-\x96\x3f\x78\x84\x24\x34\x64\xf7\xf2\xd9\x33\xde\xbe\xec\xf0\x2f\
-\xfc\x16\xdb\x41\xb9\xb4\x8d\x3c\x65\xf0\xdf\x53\xb1\xb9\x51\x87\
-\x9b\x41\xbc\x4b\x94\x73\xea\x12\x5f\x2c\xa8\xf6\xdc\xd5\xf9\x26\
-\x09\x1c\x83\x83\x46\xe3\xeb\x40\x1f\xb3\x1a\xc7\xfc\x16\xbb\xe1\
-\x4c\x36\x65\xf4\xaf\x04\xf8\xc6\xf6\xe7\xb4\x77\x89\x69\x6e\x9f\
-\x9a\xcf\x21\xff\x00\xc7\x6b\xe6\x3f\x8e\x1f\xf0\x57\xef\x8a\x7f\
-\x10\xad\xae\x74\xdf\x04\xe9\xb6\x7f\x0e\xac\x65\xf9\x5a\xe6\x09\
-\x0d\xe6\xa0\x17\xba\x89\x5d\x55\x13\x3d\xc8\x8b\x70\xc7\x0f\x5f\
-\x01\xd2\xee\x3e\xa6\x80\x2d\xea\xda\xce\xa1\xaf\x6a\x77\x7a\x96\
-\xa7\x7d\x73\xa8\xea\x37\x72\x19\xae\x2e\xee\xe6\x69\x65\x9a\x42\
-\x72\x5d\xdd\x89\x2c\xc4\xf3\x92\x73\x5a\x5e\x17\xf0\x9e\xaf\xe3\
-\x8f\x10\xe9\xda\x0e\x81\xa6\xdc\x6a\xda\xc5\xfc\xab\x0d\xb5\x8d\
-\xaa\xee\x92\x57\x6e\x80\x7f\x8f\x41\x58\x35\xe9\xff\x00\x02\xbf\
-\x68\x1f\x18\xfe\xce\x3e\x34\x5f\x13\xf8\x2e\xea\xc6\xd7\x54\x31\
-\xf9\x32\x7d\xb2\xc6\x2b\x90\xf1\x1f\xbc\x99\x65\x2c\x80\xf7\xd8\
-\xca\xc7\xd6\x80\x3f\x6b\xff\x00\x60\xcf\xd8\xde\xcf\xf6\x50\xf8\
-\x77\x20\xd4\x96\x0b\xdf\x1e\xeb\x41\x64\xd5\xaf\x62\x01\x96\x05\
-\x03\x2b\x6b\x11\xff\x00\x9e\x6a\x4e\x49\xfe\x27\x62\x7e\xe8\x50\
-\x3e\xa9\xda\x3d\x2b\xf3\x83\xf6\x7a\xff\x00\x82\xc5\xf8\x4f\xc5\
-\xf2\xdb\x69\x3f\x15\x34\x33\xe0\xdd\x45\xc2\xa1\xd6\x34\xc0\xd7\
-\x1a\x7b\x37\xab\xa1\xfd\xec\x23\xf1\x90\x7a\xb2\xd7\xe8\x37\x86\
-\x7c\x55\xa5\xf8\xcb\x44\xb5\xd6\x34\x0d\x52\xcf\x5a\xd2\x6e\xd0\
-\x49\x6f\x7d\x61\x3a\xcf\x0c\xab\x8e\xaa\xca\x70\x47\xe3\x9a\x00\
-\xda\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\x00\xa2\x8a\x28\
-\x00\xa2\x8a\x28\x00\xac\xed\x4f\x56\xb5\xd1\x6c\xa4\xbc\xbf\xbc\
-\x86\xca\xce\x31\x97\x9e\xe2\x45\x44\x41\x8e\xa5\x98\x81\x8f\xaf\
-\x35\xa3\x5f\x83\xff\x00\xf0\x53\xbf\x8f\x3e\x25\xf8\x95\xfb\x4b\
-\xf8\x9f\xc3\x17\x37\xf7\x30\xf8\x6b\xc2\xb7\x23\x4f\xb1\xd3\x03\
-\x32\xc4\x1d\x50\x19\x27\x65\xce\x0b\xb3\xb3\x61\xb1\x9d\xbb\x47\
-\x41\x40\x1f\xb5\x7f\xf0\xba\xfe\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\
-\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\x7d\xff\x00\x43\xdf\x86\x7f\xf0\
-\x71\x6d\xff\x00\xc5\xd7\xf3\x19\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\
-\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\
-\x7d\xff\x00\x43\xdf\x86\x7f\xf0\x71\x6d\xff\x00\xc5\xd7\xf3\x19\
-\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\
-\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\x7d\xff\x00\x43\xdf\x86\x7f\xf0\
-\x71\x6d\xff\x00\xc5\xd7\xf3\x19\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\
-\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\
-\x7d\xff\x00\x43\xdf\x86\x7f\xf0\x71\x6d\xff\x00\xc5\xd7\xf3\x19\
-\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\
-\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\x7d\xff\x00\x43\xdf\x86\x7f\xf0\
-\x71\x6d\xff\x00\xc5\xd7\xf3\x19\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\
-\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\
-\x7d\xff\x00\x43\xdf\x86\x7f\xf0\x71\x6d\xff\x00\xc5\xd7\xf3\x19\
-\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\
-\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\x7d\xff\x00\x43\xdf\x86\x7f\xf0\
-\x71\x6d\xff\x00\xc5\xd7\xf3\x19\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\
-\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\
-\x7d\xff\x00\x43\xdf\x86\x7f\xf0\x71\x6d\xff\x00\xc5\xd7\xf3\x19\
-\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\
-\x5b\x7f\xf1\x74\x7f\xc2\xeb\xf8\x7d\xff\x00\x43\xdf\x86\x7f\xf0\
-\x71\x6d\xff\x00\xc5\xd7\xf3\x19\x45\x00\x7f\x4e\x7f\xf0\xba\xfe\
-\x1f\x7f\xd0\xf7\xe1\x9f\xfc\x1c\x5b\x7f\xf1\x75\xbd\xa3\xf8\x97\
-\x4b\xf1\x2d\x99\xba\xd1\xb5\x3b\x4d\x56\xd4\x1d\xbe\x75\x94\xeb\
-\x32\xe7\xd3\x2a\x71\xfa\xd7\xf2\xdd\x5e\xc9\xfb\x2e\xfc\x76\xf1\
-\x27\xec\xfb\xf1\x8b\xc3\xde\x22\xf0\xfd\xed\xc2\x40\x6f\x21\x87\
-\x50\xd3\xa3\x27\xcb\xbe\xb6\x66\x55\x92\x27\x41\xc1\xca\xb3\x6d\
-\x38\xca\x90\x08\xa0\x0f\xe9\x12\x8a\x28\xa0\x02\x8a\x28\xa0\x0f\
-\xcc\x6f\xf8\x2d\xff\x00\xfc\x89\x3f\x0a\x7f\xeb\xfe\xfb\xff\x00\
-\x45\xc3\x5f\x92\x15\xfa\xdf\xff\x00\x05\xbf\xff\x00\x91\x27\xe1\
-\x4f\xfd\x7f\xdf\x7f\xe8\xb8\x6b\xf2\x42\x80\x3f\x7b\xbf\xe0\x95\
-\x1f\xf2\x64\x3e\x06\xff\x00\xaf\x8d\x4b\xff\x00\x4b\xa6\xaf\xae\
-\xab\xe4\x5f\xf8\x25\x47\xfc\x99\x0f\x81\xbf\xeb\xe3\x52\xff\x00\
-\xd2\xe9\xab\xeb\xaa\x00\x2b\xe4\x5f\xf8\x2a\xbf\xfc\x99\x0f\x8e\
-\x7f\xeb\xe3\x4d\xff\x00\xd2\xe8\x6b\xeb\xaa\xf9\x17\xfe\x0a\xaf\
-\xff\x00\x26\x43\xe3\x9f\xfa\xf8\xd3\x7f\xf4\xba\x1a\x00\xfc\x11\
-\xaf\xd6\xff\x00\xf8\x22\x07\xfc\x89\x3f\x15\xbf\xeb\xfe\xc7\xff\
-\x00\x45\xcd\x5f\x92\x15\xfa\xdf\xff\x00\x04\x40\xff\x00\x91\x27\
-\xe2\xb7\xfd\x7f\xd8\xff\x00\xe8\xb9\xa8\x03\xf4\xe6\x8a\x28\xa0\
-\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\xb9\x8f\x19\x78\xf3\x42\xf8\
-\x6f\xe1\x7d\x4b\xc4\x3e\x27\xd6\x6d\xf4\x6d\x13\x4d\x8f\xce\xba\
-\xbe\xbb\x90\x2a\x46\xa0\x91\xc9\xea\x58\x9e\x02\xaf\x24\xfc\xaa\
-\x09\xe0\xe7\x7c\x59\xf8\xb3\xe1\xcf\x82\x7e\x01\xd5\xbc\x5f\xe2\
-\xcd\x4d\x74\xcd\x23\x4e\x8f\x74\x92\x39\x0c\xf2\x37\x01\x63\x8d\
-\x3f\x89\xd8\x90\xa0\x7a\x9e\x78\x15\xf8\x43\xfb\x60\x7e\xda\x3e\
-\x2b\xfd\xad\x3c\x60\xd2\xdd\xbc\xda\x47\x83\x6d\x25\x27\x4c\xf0\
-\xfa\x48\x3c\xb8\xc6\x30\x25\x94\xf4\x79\x48\xe0\xb1\xe1\x7a\x0a\
-\x00\xf7\xaf\xdb\x03\xfe\x0a\xa9\xe2\xaf\x89\xf3\x5f\x78\x63\xe1\
-\x3c\xd7\x7e\x11\xf0\x98\x2d\x1c\xba\xc7\x11\xea\x57\xc3\xd5\x4f\
-\x58\x13\xd3\x69\x12\x1e\x32\x57\x25\x6b\xf3\xda\x49\xa4\x9a\x46\
-\x92\x47\x69\x24\x63\xb9\x99\x89\x24\x9f\x52\x69\xa1\x99\x7a\x12\
-\x3b\x75\xaf\xa5\xff\x00\x65\x5f\xd8\x37\xe2\x27\xed\x4d\x79\x15\
-\xe6\x9f\x67\xff\x00\x08\xef\x83\x95\xc2\xcf\xe2\x4d\x4a\x32\x21\
-\x20\x7d\xf1\x02\x60\x19\x9f\xd8\x7c\xa3\xa3\x30\x34\x01\xf3\x72\
-\x8d\xd2\x01\x81\xc9\xc6\x46\x73\xf4\xe9\xd7\xe8\x2b\xdf\xbe\x10\
-\x7e\xc1\xbf\x1b\xfe\x36\x2c\x13\xe8\x5e\x05\xbd\xb0\xd2\xa5\x01\
-\x97\x56\xd7\x07\xd8\x6d\x8a\x7f\x7d\x0c\x98\x69\x57\xfe\xb9\xab\
-\x9a\xfd\x87\xfd\x9d\x7f\xe0\x9f\xbf\x09\x7f\x67\x5b\x6b\x4b\x9b\
-\x0d\x0e\x1f\x12\xf8\x9a\x32\x1d\xfc\x41\xae\x44\x97\x13\x86\xf5\
-\x89\x08\x29\x08\xf4\xd8\x03\x7f\x79\x9a\xbe\x9b\xa0\x0f\xc9\x2f\
-\x01\xff\x00\xc1\x12\x35\xeb\xcb\x74\x97\xc6\x3f\x12\xf4\xdd\x36\
-\x4f\xe2\xb7\xd1\x34\xe7\xbb\x1f\xf7\xf2\x47\x8f\xff\x00\x41\xaf\
-\x60\xd2\xff\x00\xe0\x8a\x7f\x08\xa0\xb5\x0b\xa8\xf8\xc3\xc6\xb7\
-\xb7\x2b\xd6\x4b\x5b\x8b\x48\x10\xff\x00\xc0\x5a\xdd\xcf\xfe\x3d\
-\x5f\xa1\xd4\x94\x01\xf0\x03\xff\x00\xc1\x15\xfe\x08\x32\xfc\xbe\
-\x27\xf1\xf2\x9f\xfb\x08\x59\x1f\xfd\xb3\xae\x17\xc5\x3f\xf0\x44\
-\x5f\x0d\x5c\x97\x6f\x0d\xfc\x4f\xd5\x34\xf0\x79\x48\xf5\x5d\x2e\
-\x3b\x9f\xc3\x29\x24\x47\xf4\xaf\xd3\x9a\x28\x03\xf0\xd7\xe2\x77\
-\xfc\x12\x37\xe3\x7f\x81\x60\x9a\xeb\x44\x87\x47\xf1\xd5\xa4\x7c\
-\x85\xd2\x2e\xcc\x57\x01\x7d\x4c\x73\x2a\x67\xfe\x00\xcd\x5f\x23\
-\x78\xcb\xc0\xbe\x22\xf8\x7f\xad\x4b\xa3\xf8\xa3\x42\xd4\xbc\x3b\
-\xaa\x46\xbb\x9a\xcf\x53\xb4\x7b\x79\x71\xeb\xb5\xc0\x3b\x7d\xc0\
-\xc5\x7f\x50\x78\x1e\x95\xc6\xfc\x48\xf8\x53\xe0\xff\x00\x8b\xde\
-\x1f\x93\x44\xf1\x9f\x87\x34\xef\x13\x69\xa7\x91\x0d\xfc\x02\x4f\
-\x2d\xbf\xbc\x8d\xf7\xa3\x7f\xf6\x97\x06\x80\x3f\x98\xb0\xc4\x10\
-\x41\x20\xd7\xb4\xfe\xcf\x3f\xb5\x6f\xc4\x6f\xd9\x93\x5e\x1a\x97\
-\x83\x35\x87\x4d\x3e\x49\x03\x5e\x68\xb7\x84\xcb\x61\x77\xc7\xdd\
-\x78\xf3\xc1\xff\x00\x69\x4a\xbf\xbd\x7d\xaf\xfb\x53\xff\x00\xc1\
-\x20\x67\xd2\x61\xbc\xf1\x17\xc1\x4b\xb9\x75\x18\x14\x34\xb2\x78\
-\x57\x53\x98\x19\x80\x1d\xad\xa7\x3c\x3f\xb2\x49\x83\xe8\xec\x7e\
-\x5a\xfc\xd5\xd5\xb4\x2b\xff\x00\x0f\xea\xd7\x5a\x66\xab\x65\x3e\
-\x9d\xa8\xd9\xc8\xd0\xcf\x67\x77\x1b\x47\x34\x4e\xbf\x79\x59\x08\
-\xca\x91\x8e\x87\x1e\xd4\x01\xfb\xef\xfb\x24\x7e\xdd\x5e\x07\xfd\
-\xab\x74\x74\xb5\xd3\xe6\x1a\x1f\x8d\xad\xe1\xf3\x6f\x7c\x37\x77\
-\x26\xe9\x70\x3a\xc9\x03\xe0\x09\xa3\x1e\xdf\x38\xfe\x25\x1c\x6e\
-\xfa\x6a\xbf\x96\xff\x00\x0c\x78\x97\x54\xf0\x6e\xbd\x63\xad\xe8\
-\x77\xf7\x3a\x5e\xad\x61\x2a\xcf\x6d\x7b\x67\x21\x49\x21\x90\x74\
-\x2a\xc0\x82\x0f\xb8\xaf\xdb\x6f\xd8\x0b\xfe\x0a\x05\x67\xfb\x4d\
-\x69\x91\x78\x43\xc5\xd2\x43\xa6\x7c\x4c\xb1\x83\x71\x0a\x44\x71\
-\x6b\x11\xa8\xc9\x9a\x25\x18\x0b\x20\xfe\x38\xc7\xd5\x7e\x5c\x84\
-\x00\xfb\x6a\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\xbf\x3d\xff\x00\x6e\x6f\xf8\x26\x6c\xdf\xb4\x27\x8d\
-\xe7\xf8\x85\xe0\x1d\x66\xc3\x45\xf1\x45\xea\x46\x9a\x95\x8e\xad\
-\xbd\x2d\xae\xdd\x00\x44\x95\x5d\x15\x8a\x49\xb0\x2a\x90\x57\x0c\
-\x42\x9c\xaf\xcd\xbb\xf4\x22\x9a\x55\x48\xc1\x00\x8e\x9d\x28\x03\
-\xf1\x03\xfe\x1c\xe3\xf1\xeb\xfe\x7e\xbc\x21\xff\x00\x83\x59\x7f\
-\xf8\xcd\x1f\xf0\xe7\x1f\x8f\x5f\xf3\xf5\xe1\x0f\xfc\x1a\xcb\xff\
-\x00\xc6\x6b\xf7\x06\x8a\x00\xfc\x3e\xff\x00\x87\x38\xfc\x7a\xff\
-\x00\x9f\xaf\x08\x7f\xe0\xd6\x5f\xfe\x33\x47\xfc\x39\xc7\xe3\xd7\
-\xfc\xfd\x78\x43\xff\x00\x06\xb2\xff\x00\xf1\x9a\xfd\xc1\xa2\x80\
-\x3f\x0f\xbf\xe1\xce\x3f\x1e\xbf\xe7\xeb\xc2\x1f\xf8\x35\x97\xff\
-\x00\x8c\xd1\xff\x00\x0e\x71\xf8\xf5\xff\x00\x3f\x5e\x10\xff\x00\
-\xc1\xac\xbf\xfc\x66\xbf\x70\x68\xa0\x0f\xc3\xef\xf8\x73\x8f\xc7\
-\xaf\xf9\xfa\xf0\x87\xfe\x0d\x65\xff\x00\xe3\x34\x7f\xc3\x9c\x7e\
-\x3d\x7f\xcf\xd7\x84\x3f\xf0\x6b\x2f\xff\x00\x19\xaf\xdc\x1a\x28\
-\x03\xf0\xfb\xfe\x1c\xe3\xf1\xeb\xfe\x7e\xbc\x21\xff\x00\x83\x59\
-\x7f\xf8\xcd\x1f\xf0\xe7\x1f\x8f\x5f\xf3\xf5\xe1\x0f\xfc\x1a\xcb\
-\xff\x00\xc6\x6b\xf7\x06\x8a\x00\xfc\x3e\xff\x00\x87\x38\xfc\x7a\
-\xff\x00\x9f\xaf\x08\x7f\xe0\xd6\x5f\xfe\x33\x47\xfc\x39\xc7\xe3\
-\xd7\xfc\xfd\x78\x43\xff\x00\x06\xb2\xff\x00\xf1\x9a\xfd\xc1\xa2\
-\x80\x3f\x0f\xbf\xe1\xce\x3f\x1e\xbf\xe7\xeb\xc2\x1f\xf8\x35\x97\
-\xff\x00\x8c\xd1\xff\x00\x0e\x71\xf8\xf5\xff\x00\x3f\x5e\x10\xff\
-\x00\xc1\xac\xbf\xfc\x66\xbf\x70\x68\xa0\x0f\xc3\xef\xf8\x73\x8f\
-\xc7\xaf\xf9\xfa\xf0\x87\xfe\x0d\x65\xff\x00\xe3\x34\x7f\xc3\x9c\
-\x7e\x3d\x7f\xcf\xd7\x84\x3f\xf0\x6b\x2f\xff\x00\x19\xaf\xdc\x1a\
-\x28\x03\xf0\xfb\xfe\x1c\xe3\xf1\xeb\xfe\x7e\xbc\x21\xff\x00\x83\
-\x59\x7f\xf8\xcd\x1f\xf0\xe7\x1f\x8f\x5f\xf3\xf5\xe1\x0f\xfc\x1a\
-\xcb\xff\x00\xc6\x6b\xf7\x06\x8a\x00\xfc\x3e\xff\x00\x87\x38\xfc\
-\x7a\xff\x00\x9f\xaf\x08\x7f\xe0\xd6\x5f\xfe\x33\x5e\xf1\xfb\x2a\
-\xff\x00\xc1\x24\x75\xaf\x03\xfc\x46\xd2\x3c\x5b\xf1\x53\x59\xd1\
-\xee\xac\xb4\x7b\x98\xef\x6d\x74\x3d\x1d\xe4\x9d\x67\x99\x18\x32\
-\x19\xa4\x78\xd0\x04\x0c\x03\x6d\x50\xdb\x80\x00\xb0\xc1\xaf\xd4\
-\x9a\x4d\xa3\x39\xc0\xcf\xad\x00\x2d\x14\x51\x40\x05\x14\x51\x40\
-\x1f\x98\xdf\xf0\x5b\xff\x00\xf9\x12\x7e\x14\xff\x00\xd7\xfd\xf7\
-\xfe\x8b\x86\xbf\x24\x2b\xf5\xbf\xfe\x0b\x7f\xff\x00\x22\x4f\xc2\
-\x9f\xfa\xff\x00\xbe\xff\x00\xd1\x70\xd7\xe4\x85\x00\x7e\xf7\x7f\
-\xc1\x2a\x3f\xe4\xc8\x7c\x0d\xff\x00\x5f\x1a\x97\xfe\x97\x4d\x5f\
-\x5d\x57\xc8\xbf\xf0\x4a\x8f\xf9\x32\x1f\x03\x7f\xd7\xc6\xa5\xff\
-\x00\xa5\xd3\x57\xd7\x54\x00\x57\xc8\xbf\xf0\x55\x7f\xf9\x32\x1f\
-\x1c\xff\x00\xd7\xc6\x9b\xff\x00\xa5\xd0\xd7\xd7\x55\xf2\x2f\xfc\
-\x15\x5f\xfe\x4c\x87\xc7\x3f\xf5\xf1\xa6\xff\x00\xe9\x74\x34\x01\
-\xf8\x23\x5f\xad\xff\x00\xf0\x44\x0f\xf9\x12\x7e\x2b\x7f\xd7\xfd\
-\x8f\xfe\x8b\x9a\xbf\x24\x2b\xf5\xbf\xfe\x08\x81\xff\x00\x22\x4f\
-\xc5\x6f\xfa\xff\x00\xb1\xff\x00\xd1\x73\x50\x07\xe9\xcd\x14\x51\
-\x40\x05\x14\x51\x40\x05\x64\xeb\x7a\xe5\x9f\x87\xb4\x9b\xed\x4b\
-\x50\xbb\x4b\x2b\x1b\x28\x5e\xe2\xe2\xe2\x66\x01\x22\x8d\x06\xe6\
-\x76\x24\xf0\xaa\xbc\x9f\x6e\x9c\xd6\xb5\x7e\x5d\x7f\xc1\x5d\xff\
-\x00\x6a\xaf\xec\xbb\x3b\x7f\x82\x7e\x1d\xbc\x55\x9a\xed\x12\xf7\
-\xc4\xb2\x42\xdb\x4a\x45\xf7\xe0\xb5\xc8\xee\xe4\x89\x18\x1e\xc2\
-\x3e\xcc\xc2\x80\x3e\x47\xfd\xbc\xbf\x6c\x8d\x43\xf6\xac\xf8\x8a\
-\xd1\x69\xb3\xcd\x6d\xe0\x0d\x1a\x47\x8f\x47\xd3\xdb\x2a\x67\x39\
-\x2a\xd7\x52\x2f\x79\x1b\x38\x00\xfd\xd4\xc0\xfb\xdb\x89\xf9\x58\
-\x33\x13\x8e\x49\xed\x8a\x6e\xe3\xeb\x5f\x7b\xff\x00\xc1\x33\x7f\
-\x61\xc8\x7e\x3c\x78\x81\xbe\x22\x78\xd3\x4f\x69\x3c\x07\xa3\xdc\
-\x79\x76\x96\x53\xa7\xc9\xaa\xdd\x2e\x09\x53\x9f\xbd\x0c\x79\x5d\
-\xd9\xc8\x76\x3b\x79\x01\xf0\x01\xd1\x7e\xc0\x3f\xf0\x4d\x17\xf8\
-\xa1\x0d\x87\xc4\x3f\x8a\xd6\x33\xd9\xf8\x49\x8a\xcd\xa5\xe8\x12\
-\x66\x29\xb5\x41\xf7\x96\x59\x7f\x89\x61\x23\xa0\x18\x67\x1c\xf0\
-\xb8\x2d\xfb\x09\xa5\xe9\x36\x3a\x1e\x9d\x6d\xa7\xe9\xd6\x56\xfa\
-\x7d\x85\xb2\x2c\x50\x5a\xda\xc4\xb1\x45\x12\x0e\x8a\xaa\xa0\x05\
-\x03\xb0\x15\x62\x38\x63\x86\x30\x89\x1a\xa2\x28\xc0\x55\x00\x00\
-\x3d\x29\xf4\x00\x98\x1e\x94\xb4\x51\x40\x05\x14\x51\x40\x05\x14\
-\x51\x40\x05\x21\x00\xf5\x19\xa5\xa2\x80\x13\x68\xf4\xaf\x96\xbf\
-\x6c\xcf\xd8\x47\xc2\x1f\xb5\x76\x87\x2d\xf0\x8e\x1f\x0f\xfc\x42\
-\x82\x2d\x96\x3a\xfc\x4a\x47\x9b\xb7\xee\xc3\x72\xa3\xfd\x64\x7e\
-\xff\x00\x7d\x3a\xa9\x20\x14\x6f\xa9\xa9\xbb\x14\x74\x50\x3f\x0a\
-\x00\xfe\x63\xfe\x28\xfc\x2b\xf1\x2f\xc1\x7f\x1d\x6a\x9e\x11\xf1\
-\x76\x95\x26\x93\xae\xe9\xef\xb5\xe1\x90\x65\x64\x5f\xe1\x95\x1b\
-\xa3\x46\x47\x21\xba\x30\xf7\xac\x2f\x0d\xf8\x9b\x54\xf0\x87\x88\
-\x34\xed\x6f\x47\xbe\x97\x4e\xd5\xb4\xf9\xd2\xe6\xd6\xea\xdd\xca\
-\xc9\x0c\x91\xfd\xd6\x52\x39\x07\xdc\x57\xef\x5f\xed\xcd\xfb\x1b\
-\x69\x5f\xb5\x87\xc3\x99\x7e\xc6\x90\xd9\xf8\xff\x00\x48\x89\xa5\
-\xd1\xb5\x26\x00\x09\x0e\x32\x6d\x66\x3d\x4c\x72\x70\x33\xfc\x0d\
-\x87\x1f\xc4\xaf\xf8\x25\xe2\x2d\x06\xfb\xc3\x1a\xdd\xf6\x8f\xa9\
-\xda\xbd\x96\xa5\x63\x2b\xdb\x5c\xda\xca\xa4\x3c\x32\x21\x2a\xe8\
-\xd9\xfe\x20\xc1\x81\xf7\x1c\x71\x40\x1f\xbe\x7f\xb0\x9f\xed\x7f\
-\x63\xfb\x57\x7c\x2f\x8e\xe2\xf2\x48\x6d\x7c\x75\xa3\xaa\xdb\xeb\
-\x7a\x7c\x6d\x80\xcc\x73\xb6\xe6\x35\xfe\xe4\x81\x73\x8f\xe1\x60\
-\xcb\xd3\x6b\x37\xd3\xd5\xfc\xdc\x7e\xcb\x5f\xb4\x16\xb1\xfb\x33\
-\xfc\x64\xd1\x3c\x69\xa6\x34\x92\x5a\x44\xe2\xdf\x53\xb1\x8d\xb0\
-\x2f\x2c\xd8\x8f\x36\x2e\x78\xce\x06\x46\x7a\x32\xa9\xea\x2b\xfa\
-\x28\xf0\x57\x8b\xb4\xbf\x1e\x78\x4f\x48\xf1\x1e\x89\x78\xb7\xfa\
-\x46\xad\x6b\x1d\xe5\xad\xca\x36\x43\xc5\x22\x86\x53\xec\x70\xc3\
-\x8e\xc7\x23\xb5\x00\x6f\xd1\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x01\xf9\x8d\xff\x00\x05\xbf\xff\x00\x91\x27\
-\xe1\x4f\xfd\x7f\xdf\x7f\xe8\xb8\x6b\xf2\x42\xbf\x5b\xff\x00\xe0\
-\xb7\xff\x00\xf2\x24\xfc\x29\xff\x00\xaf\xfb\xef\xfd\x17\x0d\x7e\
-\x48\x50\x07\xef\x77\xfc\x12\xa3\xfe\x4c\x87\xc0\xdf\xf5\xf1\xa9\
-\x7f\xe9\x74\xd5\xf5\xd5\x7c\x8b\xff\x00\x04\xa8\xff\x00\x93\x21\
-\xf0\x37\xfd\x7c\x6a\x5f\xfa\x5d\x35\x7d\x75\x40\x05\x7c\x8b\xff\
-\x00\x05\x57\xff\x00\x93\x21\xf1\xcf\xfd\x7c\x69\xbf\xfa\x5d\x0d\
-\x7d\x75\x5f\x22\xff\x00\xc1\x55\xff\x00\xe4\xc8\x7c\x73\xff\x00\
-\x5f\x1a\x6f\xfe\x97\x43\x40\x1f\x82\x35\xfa\xdf\xff\x00\x04\x40\
-\xff\x00\x91\x27\xe2\xb7\xfd\x7f\xd8\xff\x00\xe8\xb9\xab\xf2\x42\
-\xbf\x5b\xff\x00\xe0\x88\x1f\xf2\x24\xfc\x56\xff\x00\xaf\xfb\x1f\
-\xfd\x17\x35\x00\x7e\x9c\xd1\x45\x14\x00\x51\x45\x14\x01\xc6\xfc\
-\x5d\xf8\x95\xa6\xfc\x1d\xf8\x67\xe2\x6f\x1a\x6b\x0c\x7f\xb3\xf4\
-\x4b\x09\x6f\x5d\x01\xc1\x94\xaa\x92\xb1\xa9\xfe\xf3\x1c\x28\xf7\
-\x61\x5f\xcd\x87\xc4\x6f\x1e\x6a\xff\x00\x14\x7c\x79\xaf\x78\xbb\
-\x5d\xb8\x37\x5a\xbe\xb1\x77\x25\xed\xcc\x99\xc8\x0c\xe4\x90\x83\
-\xfd\x90\x30\xa0\x76\x00\x0a\xfd\x5f\xff\x00\x82\xcf\x7c\x62\x3e\
-\x1f\xf8\x57\xe1\x4f\x86\xf6\x73\x05\x9f\xc4\x37\x6f\x7f\x7c\x15\
-\xb9\x16\xd6\xc5\x76\x21\x1d\xc3\x4a\xea\xc3\xfe\xb8\x1a\xfc\x79\
-\xdc\x78\xe7\xa5\x00\x7a\x67\xec\xeb\xf0\x47\x56\xfd\xa1\xbe\x30\
-\x78\x77\xc0\xba\x38\xf2\xe5\xd4\xa7\x22\xe2\xeb\x6e\x56\xd6\xdd\
-\x06\xe9\xa6\x6f\x65\x40\x48\xf5\x6d\xa3\xbd\x7f\x46\xbf\x0f\x7c\
-\x0b\xa2\xfc\x2f\xf0\x5e\x8b\xe1\x3f\x0f\x59\xad\x86\x8b\xa3\xda\
-\xc7\x69\x6b\x6e\xbc\x95\x45\x18\x05\x8f\x76\x27\x2c\xcd\xd4\x92\
-\x49\xeb\x5f\x9f\xdf\xf0\x46\xdf\x80\xb1\xf8\x73\xe1\xe6\xbb\xf1\
-\x5b\x51\xb6\x1f\xda\x3e\x20\x98\xe9\x9a\x5c\x8e\x39\x16\x70\xb0\
-\xf3\x59\x7d\x9a\x75\xda\x7f\xeb\xd8\x1a\xfd\x27\x2a\x18\x60\x80\
-\x47\xd2\x80\x16\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x02\
-\x8a\x28\xa0\x02\x8a\x28\xa0\x02\x8a\x28\xa0\x04\xda\x3a\xe0\x66\
-\xbf\x28\x3f\xe0\xaf\xbf\xb2\xba\x5b\x5c\x5b\x7c\x6e\xf0\xed\xa2\
-\xac\x73\x34\x76\x1e\x23\x8a\x25\x18\x57\xfb\x96\xf7\x47\x1d\x77\
-\x0d\xb1\xb1\xf5\xf2\xbd\x4d\x7e\xb0\x57\x27\xf1\x33\xe1\xde\x91\
-\xf1\x5b\xe1\xef\x88\x7c\x1d\xae\xc1\xe7\x69\x3a\xdd\x9c\x96\x57\
-\x0a\xa0\x12\xa1\xc1\x01\xd7\xd1\x94\x90\xc0\xf5\x04\x03\xda\x80\
-\x3f\x98\x4d\xc7\xa6\x4e\x2b\xf5\xeb\xfe\x08\xdf\xfb\x44\x3f\x89\
-\x7c\x17\xae\x7c\x23\xd5\xee\x59\xef\x74\x10\x75\x5d\x23\x79\xe4\
-\xd9\xbb\x01\x2c\x63\xda\x39\x59\x5b\xdf\xcf\x23\xa0\xaf\xca\xbf\
-\x88\xde\x05\xd4\x3e\x19\xf8\xf3\xc4\x3e\x12\xd5\xe3\x09\xaa\x68\
-\xb7\xd3\x58\x4e\x14\x10\x19\xa3\x72\xbb\x86\x7b\x36\x37\x03\xe8\
-\x45\x7a\x2f\xec\x77\xf1\x8a\x4f\x81\x7f\xb4\x9f\x81\x7c\x58\xd7\
-\x1e\x4e\x9f\x0d\xfa\x5a\x6a\x39\x27\x69\xb4\x98\x79\x33\x13\xeb\
-\xb5\x1c\xb0\xf4\x2a\x0f\x6a\x00\xfe\x8f\x28\xa8\xc3\x6e\x1c\x1c\
-\x82\x3d\x7a\xfe\x35\x25\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x7e\x63\x7f\xc1\x6f\xff\x00\xe4\x49\xf8\x53\xff\x00\
-\x5f\xf7\xdf\xfa\x2e\x1a\xfc\x90\xaf\xd6\xff\x00\xf8\x2d\xff\x00\
-\xfc\x89\x3f\x0a\x7f\xeb\xfe\xfb\xff\x00\x45\xc3\x5f\x92\x14\x01\
-\xfb\xdd\xff\x00\x04\xa8\xff\x00\x93\x21\xf0\x37\xfd\x7c\x6a\x5f\
-\xfa\x5d\x35\x7d\x75\x5f\x22\xff\x00\xc1\x2a\x3f\xe4\xc8\x7c\x0d\
-\xff\x00\x5f\x1a\x97\xfe\x97\x4d\x5f\x5d\x50\x01\x5f\x22\xff\x00\
-\xc1\x55\xff\x00\xe4\xc8\x7c\x73\xff\x00\x5f\x1a\x6f\xfe\x97\x43\
-\x5f\x5d\x57\xc8\xbf\xf0\x55\x7f\xf9\x32\x1f\x1c\xff\x00\xd7\xc6\
-\x9b\xff\x00\xa5\xd0\xd0\x07\xe0\x8d\x7e\xb7\xff\x00\xc1\x10\x3f\
-\xe4\x49\xf8\xad\xff\x00\x5f\xf6\x3f\xfa\x2e\x6a\xfc\x90\xaf\xd6\
-\xff\x00\xf8\x22\x07\xfc\x89\x3f\x15\xbf\xeb\xfe\xc7\xff\x00\x45\
-\xcd\x40\x1f\xa7\x34\x51\x45\x00\x14\x51\x45\x00\x7e\x0d\xff\x00\
-\xc1\x56\x3e\x21\x1f\x1b\x7e\xd8\x9e\x21\xb0\x8e\x4d\xf6\x7e\x1a\
-\xb3\xb5\xd2\x21\xda\x78\xc8\x8f\xce\x93\xf1\x12\x4e\xeb\xff\x00\
-\x01\xaf\x91\x6d\x6d\x66\xbc\xb8\x86\xde\x08\xbc\xf9\xe6\x75\x48\
-\xd1\x46\x4b\x31\x38\x0a\x3d\xc9\xaf\x41\xfd\xa4\x3c\x4c\xde\x31\
-\xfd\xa1\x3e\x25\xeb\x7b\xf7\xad\xef\x88\xf5\x09\xd1\xba\x8d\x9f\
-\x68\x93\x67\xe9\x81\x54\xfe\x05\xeb\x5a\x17\x87\x7e\x33\x78\x1b\
-\x58\xf1\x44\xcf\x07\x87\x74\xed\x6e\xd2\xf7\x50\x65\x8d\xa5\x6f\
-\x22\x29\x95\xe4\x01\x07\x27\x2a\x08\xfc\x68\x03\xfa\x2a\xf8\x17\
-\xf0\xe2\x0f\x84\x3f\x07\x7c\x17\xe0\xb8\x11\x53\xfb\x13\x4a\x82\
-\xce\x46\x8c\x00\xaf\x32\xa8\xf3\x5f\x8e\xa5\x9f\x73\x67\xbe\xe2\
-\x6b\xbf\xaf\x8e\x3f\xe1\xec\x5f\xb3\x88\xc6\x3c\x47\xaa\x8f\xfb\
-\x82\x5c\xff\x00\xf1\x34\xef\xf8\x7b\x27\xec\xe7\xff\x00\x43\x26\
-\xad\xff\x00\x82\x5b\x9f\xfe\x26\x80\x3e\xc5\xa2\xbe\x3a\xff\x00\
-\x87\xb2\x7e\xce\x7f\xf4\x32\x6a\xdf\xf8\x25\xb9\xff\x00\xe2\x68\
-\xff\x00\x87\xb2\x7e\xce\x7f\xf4\x32\x6a\xdf\xf8\x25\xb9\xff\x00\
-\xe2\x68\x03\xec\x5a\x2b\xe3\xaf\xf8\x7b\x27\xec\xe7\xff\x00\x43\
-\x26\xad\xff\x00\x82\x5b\x9f\xfe\x26\x8f\xf8\x7b\x27\xec\xe7\xff\
-\x00\x43\x26\xad\xff\x00\x82\x5b\x9f\xfe\x26\x80\x3e\xc5\xa2\xbe\
-\x3a\xff\x00\x87\xb2\x7e\xce\x7f\xf4\x32\x6a\xdf\xf8\x25\xb9\xff\
-\x00\xe2\x68\xff\x00\x87\xb2\x7e\xce\x7f\xf4\x32\x6a\xdf\xf8\x25\
-\xb9\xff\x00\xe2\x68\x03\xec\x5a\x2b\xe3\xaf\xf8\x7b\x27\xec\xe7\
-\xff\x00\x43\x26\xad\xff\x00\x82\x5b\x9f\xfe\x26\x8f\xf8\x7b\x27\
-\xec\xe7\xff\x00\x43\x26\xad\xff\x00\x82\x5b\x9f\xfe\x26\x80\x3e\
-\xc5\xa2\xbe\x3a\xff\x00\x87\xb2\x7e\xce\x7f\xf4\x32\x6a\xdf\xf8\
-\x25\xb9\xff\x00\xe2\x68\xff\x00\x87\xb2\x7e\xce\x7f\xf4\x32\x6a\
-\xdf\xf8\x25\xb9\xff\x00\xe2\x68\x03\xec\x5a\x2b\xe3\xaf\xf8\x7b\
-\x27\xec\xe7\xff\x00\x43\x26\xad\xff\x00\x82\x5b\x9f\xfe\x26\x8f\
-\xf8\x7b\x27\xec\xe7\xff\x00\x43\x26\xad\xff\x00\x82\x5b\x9f\xfe\
-\x26\x80\x3e\xc5\xa4\xda\x3d\x2b\xe3\xbf\xf8\x7b\x27\xec\xe7\xff\
-\x00\x43\x26\xad\xff\x00\x82\x5b\x9f\xfe\x26\x8f\xf8\x7b\x27\xec\
-\xe7\xff\x00\x43\x26\xad\xff\x00\x82\x5b\x9f\xfe\x26\x80\x3e\x08\
-\xff\x00\x82\xc1\x7c\x31\x1e\x0c\xfd\xa7\x2d\xbc\x4d\x6d\x0f\x97\
-\x67\xe2\xcd\x26\x2b\xa7\x65\x4c\x29\xb9\x84\x98\x64\x03\xdf\x6a\
-\xc2\xc7\xfd\xfa\xf8\x53\x73\x0e\x84\xd7\xe8\x47\xfc\x14\xe3\xf6\
-\xab\xf8\x4d\xfb\x4e\xf8\x5f\xc0\xcf\xe0\x7d\x5a\xf3\x50\xd6\xb4\
-\x3b\xdb\x91\x34\x77\x36\x12\xdb\x85\xb7\x9a\x34\xcb\x02\xe0\x67\
-\x0d\x0a\x71\xee\x6b\xf3\xda\x80\x3f\xa4\x6f\xd9\x23\xe2\x13\x7c\
-\x52\xfd\x9a\x7e\x1b\xf8\x9e\x69\x7c\xeb\xbb\xed\x1a\x01\x73\x36\
-\xec\xef\xb9\x8d\x7c\xa9\x8f\xfd\xfc\x8d\xf3\xef\x9a\xf6\x2a\xf8\
-\x93\xfe\x09\x11\xe2\x66\xf1\x07\xec\x7b\x65\x62\xcd\xbc\x68\xba\
-\xe5\xf6\x9e\x01\x39\xc0\x66\x4b\x9f\xfd\xb8\x35\xf6\xdd\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x15\x99\xab\x6b\x56\x7a\x0d\x8c\x97\
-\xba\x95\xed\xbd\x85\x9c\x43\xf7\x97\x17\x32\xac\x48\x9c\x67\x25\
-\x98\xe0\x7d\x2b\x4e\xbf\x06\xff\x00\xe0\xa6\xff\x00\x1d\xbc\x49\
-\xf1\x33\xf6\x9a\xf1\x47\x86\xae\xef\x6e\x61\xf0\xdf\x85\x6e\x7f\
-\xb3\xf4\xed\x37\x25\x22\x0c\x8a\x3c\xc9\x8a\xf4\x2e\xcc\xce\x43\
-\xe3\x3b\x76\x8e\x82\x80\x3f\x6a\xbf\xe1\x7b\xfc\x35\xff\x00\xa2\
-\x85\xe1\x5f\xfc\x1d\x5b\x7f\xf1\x74\x7f\xc2\xf7\xf8\x6b\xff\x00\
-\x45\x0b\xc2\xbf\xf8\x3a\xb6\xff\x00\xe2\xeb\xf9\x91\xa2\x80\x3f\
-\xa6\xef\xf8\x5e\xff\x00\x0d\x7f\xe8\xa1\x78\x57\xff\x00\x07\x56\
-\xdf\xfc\x5d\x1f\xf0\xbd\xfe\x1a\xff\x00\xd1\x42\xf0\xaf\xfe\x0e\
-\xad\xbf\xf8\xba\xfe\x64\x68\xa0\x0f\xe9\xbb\xfe\x17\xbf\xc3\x5f\
-\xfa\x28\x5e\x15\xff\x00\xc1\xd5\xb7\xff\x00\x17\x47\xfc\x2f\x7f\
-\x86\xbf\xf4\x50\xbc\x2b\xff\x00\x83\xab\x6f\xfe\x2e\xbf\x99\x1a\
-\x28\x03\xfa\x6e\xff\x00\x85\xef\xf0\xd7\xfe\x8a\x17\x85\x7f\xf0\
-\x75\x6d\xff\x00\xc5\xd1\xff\x00\x0b\xdf\xe1\xaf\xfd\x14\x2f\x0a\
-\xff\x00\xe0\xea\xdb\xff\x00\x8b\xaf\xe6\x46\x8a\x00\xfe\x9b\xbf\
-\xe1\x7b\xfc\x35\xff\x00\xa2\x85\xe1\x5f\xfc\x1d\x5b\x7f\xf1\x74\
-\x7f\xc2\xf7\xf8\x6b\xff\x00\x45\x0b\xc2\xbf\xf8\x3a\xb6\xff\x00\
-\xe2\xeb\xf9\x91\xa2\x80\x3f\xa6\xef\xf8\x5e\xff\x00\x0d\x7f\xe8\
-\xa1\x78\x57\xff\x00\x07\x56\xdf\xfc\x5d\x1f\xf0\xbd\xfe\x1a\xff\
-\x00\xd1\x42\xf0\xaf\xfe\x0e\xad\xbf\xf8\xba\xfe\x64\x68\xa0\x0f\
-\xe9\xbb\xfe\x17\xbf\xc3\x5f\xfa\x28\x5e\x15\xff\x00\xc1\xd5\xb7\
-\xff\x00\x17\x47\xfc\x2f\x7f\x86\xbf\xf4\x50\xbc\x2b\xff\x00\x83\
-\xab\x6f\xfe\x2e\xbf\x99\x1a\x28\x03\xfa\x6e\xff\x00\x85\xef\xf0\
-\xd7\xfe\x8a\x17\x85\x7f\xf0\x75\x6d\xff\x00\xc5\xd1\xff\x00\x0b\
-\xdf\xe1\xaf\xfd\x14\x2f\x0a\xff\x00\xe0\xea\xdb\xff\x00\x8b\xaf\
-\xe6\x46\x8a\x00\xfe\x9b\xbf\xe1\x7b\xfc\x35\xff\x00\xa2\x85\xe1\
-\x5f\xfc\x1d\x5b\x7f\xf1\x74\x7f\xc2\xf7\xf8\x6b\xff\x00\x45\x0b\
-\xc2\xbf\xf8\x3a\xb6\xff\x00\xe2\xeb\xf9\x91\xa2\x80\x3f\xa6\xef\
-\xf8\x5e\xff\x00\x0d\x7f\xe8\xa1\x78\x57\xff\x00\x07\x56\xdf\xfc\
-\x5d\x6f\xf8\x7f\xc5\x9a\x47\x8a\xad\x7e\xd7\xa2\xeb\x16\x5a\xcd\
-\xb0\x21\x5a\x4d\x3e\xe6\x3b\x84\x0d\xe8\x4a\x12\x01\xfc\x6b\xf9\
-\x72\xaf\x62\xfd\x97\xfe\x39\xf8\x8f\xe0\x0f\xc6\x3f\x0f\x78\x8f\
-\xc3\xf7\x97\x08\x9f\x6c\x86\x2b\xed\x3d\x09\xf2\xef\xed\xd9\x82\
-\xc9\x0c\x88\x38\x3b\x95\x9b\x69\xe4\xa9\x00\x8a\x00\xfe\x91\xa8\
-\xa2\x8a\x00\x28\xa2\x8a\x00\xfc\xc6\xff\x00\x82\xdf\xff\x00\xc8\
-\x93\xf0\xa7\xfe\xbf\xef\xbf\xf4\x5c\x35\xf9\x21\x5f\xad\xff\x00\
-\xf0\x5b\xff\x00\xf9\x12\x7e\x14\xff\x00\xd7\xfd\xf7\xfe\x8b\x86\
-\xbf\x24\x28\x03\xf7\xbb\xfe\x09\x51\xff\x00\x26\x43\xe0\x6f\xfa\
-\xf8\xd4\xbf\xf4\xba\x6a\xfa\xea\xbe\x45\xff\x00\x82\x54\x7f\xc9\
-\x90\xf8\x1b\xfe\xbe\x35\x2f\xfd\x2e\x9a\xbe\xba\xa0\x02\xbe\x45\
-\xff\x00\x82\xab\xff\x00\xc9\x90\xf8\xe7\xfe\xbe\x34\xdf\xfd\x2e\
-\x86\xbe\xba\xaf\x91\x7f\xe0\xaa\xff\x00\xf2\x64\x3e\x39\xff\x00\
-\xaf\x8d\x37\xff\x00\x4b\xa1\xa0\x0f\xc1\x1a\xfd\x6f\xff\x00\x82\
-\x20\x7f\xc8\x93\xf1\x5b\xfe\xbf\xec\x7f\xf4\x5c\xd5\xf9\x21\x5f\
-\xad\xff\x00\xf0\x44\x0f\xf9\x12\x7e\x2b\x7f\xd7\xfd\x8f\xfe\x8b\
-\x9a\x80\x3f\x4e\x68\xa2\x8a\x00\x28\xa2\x8a\x00\xfe\x5e\x3c\x7b\
-\x61\x7d\xa6\x78\xdf\xc4\x16\x7a\x94\x4f\x6f\xa8\x43\x7f\x3a\xdc\
-\xc2\xe0\x86\x59\x04\x8d\xb8\x57\x3d\xb8\xfa\xd7\xef\x17\xed\x21\
-\xff\x00\x04\xce\xf8\x5b\xfb\x43\x78\xba\xeb\xc5\x26\xe3\x52\xf0\
-\x9f\x89\x2e\x8f\x99\x79\x71\xa4\x18\xfc\xab\xa6\x24\x96\x92\x58\
-\x5d\x31\xbd\xb9\xf9\x83\x2e\x7b\xe6\xbc\x7b\xfe\x1c\x8d\xe0\x4f\
-\xfa\x28\xfe\x22\xff\x00\xc0\x48\x3f\xc2\x80\x3f\x1f\xa8\xaf\xd8\
-\x1f\xf8\x72\x37\x81\x3f\xe8\xa3\xf8\x8b\xff\x00\x01\x20\xff\x00\
-\x0a\x3f\xe1\xc8\xde\x04\xff\x00\xa2\x8f\xe2\x2f\xfc\x04\x83\xfc\
-\x28\x03\xf1\xfa\x8a\xfd\x81\xff\x00\x87\x23\x78\x13\xfe\x8a\x3f\
-\x88\xbf\xf0\x12\x0f\xf0\xa3\xfe\x1c\x8d\xe0\x4f\xfa\x28\xfe\x22\
-\xff\x00\xc0\x48\x3f\xc2\x80\x3f\x1f\xa8\xaf\xd8\x1f\xf8\x72\x37\
-\x81\x3f\xe8\xa3\xf8\x8b\xff\x00\x01\x20\xff\x00\x0a\x3f\xe1\xc8\
-\xde\x04\xff\x00\xa2\x8f\xe2\x2f\xfc\x04\x83\xfc\x28\x03\xf1\xfa\
-\x8a\xfd\x81\xff\x00\x87\x23\x78\x13\xfe\x8a\x3f\x88\xbf\xf0\x12\
-\x0f\xf0\xa3\xfe\x1c\x8d\xe0\x4f\xfa\x28\xfe\x22\xff\x00\xc0\x48\
-\x3f\xc2\x80\x3f\x1f\xa8\xaf\xd8\x1f\xf8\x72\x37\x81\x3f\xe8\xa3\
-\xf8\x8b\xff\x00\x01\x20\xff\x00\x0a\x3f\xe1\xc8\xde\x04\xff\x00\
-\xa2\x8f\xe2\x2f\xfc\x04\x83\xfc\x28\x03\xf1\xfa\x8a\xfd\x81\xff\
-\x00\x87\x23\x78\x13\xfe\x8a\x3f\x88\xbf\xf0\x12\x0f\xf0\xa3\xfe\
-\x1c\x8d\xe0\x4f\xfa\x28\xfe\x22\xff\x00\xc0\x48\x3f\xc2\x80\x3f\
-\x1f\xa8\xaf\xd8\x1f\xf8\x72\x37\x81\x3f\xe8\xa3\xf8\x8b\xff\x00\
-\x01\x20\xff\x00\x0a\x3f\xe1\xc8\xde\x04\xff\x00\xa2\x8f\xe2\x2f\
-\xfc\x04\x83\xfc\x28\x03\xf1\xfa\x8a\xfd\x81\xff\x00\x87\x23\x78\
-\x13\xfe\x8a\x3f\x88\xbf\xf0\x12\x0f\xf0\xa3\xfe\x1c\x8d\xe0\x4f\
-\xfa\x28\xfe\x22\xff\x00\xc0\x48\x3f\xc2\x80\x3f\x1f\xf7\x1e\x39\
-\x3c\x74\xf6\xa4\xaf\xd8\x1f\xf8\x72\x37\x81\x3f\xe8\xa3\xf8\x8b\
-\xff\x00\x01\x20\xff\x00\x0a\xbb\xa2\xff\x00\xc1\x14\xbe\x1a\xd9\
-\xea\x10\x4b\xa9\xf8\xdf\xc4\xba\x8d\xa2\xb6\x5e\x08\x52\x08\x0b\
-\x8f\x4d\xdb\x18\x8a\x00\xd4\xff\x00\x82\x2f\xd9\xde\xd9\xfe\xcd\
-\x3e\x27\x9a\x78\x1a\x2b\x2b\x9f\x15\x4c\xf6\xf2\x38\x23\x7f\xfa\
-\x2d\xb2\x31\x5f\x51\xb9\x42\xe7\xd4\x37\xa5\x7e\x83\x57\x2b\xf0\
-\xeb\xe1\xff\x00\x87\xbe\x13\xf8\x33\x4a\xf0\xa7\x85\x74\xc8\xb4\
-\x7d\x03\x4c\x8b\xc9\xb5\xb3\x88\x1c\x2f\xcc\x59\x89\x2d\xcb\x33\
-\x33\x33\x16\x3c\x92\x49\x3d\x6b\xaa\xa0\x02\x8a\x28\xa0\x02\x8a\
-\x28\xa0\x02\xbf\x3e\xff\x00\x6e\x6f\xf8\x26\x5c\xbf\xb4\x47\x8d\
-\xe6\xf1\xf7\x81\x75\xbb\x0d\x0f\xc5\x37\x91\xa4\x7a\x8d\x8e\xaa\
-\x1d\x2d\x2e\xd9\x14\x46\x93\x07\x45\x66\x8d\xc2\x05\x53\xf2\xb0\
-\x7c\x29\xf9\x70\x77\x7e\x82\x52\x6d\x1e\x83\xf2\xa0\x0f\xc4\x6f\
-\xf8\x73\x4f\xc7\x7f\xfa\x08\xf8\x33\xff\x00\x06\x77\x1f\xfc\x8f\
-\x47\xfc\x39\xa7\xe3\xbf\xfd\x04\x7c\x19\xff\x00\x83\x3b\x8f\xfe\
-\x47\xaf\xdb\xaa\x28\x03\xf1\x17\xfe\x1c\xd3\xf1\xdf\xfe\x82\x3e\
-\x0c\xff\x00\xc1\x9d\xc7\xff\x00\x23\xd1\xff\x00\x0e\x69\xf8\xef\
-\xff\x00\x41\x1f\x06\x7f\xe0\xce\xe3\xff\x00\x91\xeb\xf6\xea\x8a\
-\x00\xfc\x45\xff\x00\x87\x34\xfc\x77\xff\x00\xa0\x8f\x83\x3f\xf0\
-\x67\x71\xff\x00\xc8\xf4\x7f\xc3\x9a\x7e\x3b\xff\x00\xd0\x47\xc1\
-\x9f\xf8\x33\xb8\xff\x00\xe4\x7a\xfd\xba\xa2\x80\x3f\x11\x7f\xe1\
-\xcd\x3f\x1d\xff\x00\xe8\x23\xe0\xcf\xfc\x19\xdc\x7f\xf2\x3d\x1f\
-\xf0\xe6\x9f\x8e\xff\x00\xf4\x11\xf0\x67\xfe\x0c\xee\x3f\xf9\x1e\
-\xbf\x6e\xa8\xa0\x0f\xc4\x5f\xf8\x73\x4f\xc7\x7f\xfa\x08\xf8\x33\
-\xff\x00\x06\x77\x1f\xfc\x8f\x47\xfc\x39\xa7\xe3\xbf\xfd\x04\x7c\
-\x19\xff\x00\x83\x3b\x8f\xfe\x47\xaf\xdb\xaa\x28\x03\xf1\x17\xfe\
-\x1c\xd3\xf1\xdf\xfe\x82\x3e\x0c\xff\x00\xc1\x9d\xc7\xff\x00\x23\
-\xd1\xff\x00\x0e\x69\xf8\xef\xff\x00\x41\x1f\x06\x7f\xe0\xce\xe3\
-\xff\x00\x91\xeb\xf6\xea\x8a\x00\xfc\x45\xff\x00\x87\x34\xfc\x77\
-\xff\x00\xa0\x8f\x83\x3f\xf0\x67\x71\xff\x00\xc8\xf4\x7f\xc3\x9a\
-\x7e\x3b\xff\x00\xd0\x47\xc1\x9f\xf8\x33\xb8\xff\x00\xe4\x7a\xfd\
-\xba\xa2\x80\x3f\x11\x7f\xe1\xcd\x3f\x1d\xff\x00\xe8\x23\xe0\xcf\
-\xfc\x19\xdc\x7f\xf2\x3d\x1f\xf0\xe6\x9f\x8e\xff\x00\xf4\x11\xf0\
-\x67\xfe\x0c\xee\x3f\xf9\x1e\xbf\x6e\xa8\xa0\x0f\xc4\x5f\xf8\x73\
-\x4f\xc7\x7f\xfa\x08\xf8\x33\xff\x00\x06\x77\x1f\xfc\x8f\x47\xfc\
-\x39\xa7\xe3\xbf\xfd\x04\x7c\x19\xff\x00\x83\x3b\x8f\xfe\x47\xaf\
-\xdb\xaa\x28\x03\xf1\x17\xfe\x1c\xd3\xf1\xdf\xfe\x82\x3e\x0c\xff\
-\x00\xc1\x9d\xc7\xff\x00\x23\xd7\xbb\x7e\xca\xff\x00\xf0\x49\x2d\
-\x53\xc0\x7f\x13\x74\x8f\x15\xfc\x51\xd7\x74\x8b\xcb\x6d\x16\xe6\
-\x3b\xdb\x4d\x0b\x46\x69\x26\x4b\x89\xd0\x82\x86\x69\x25\x8d\x00\
-\x45\x65\xdd\xb0\x2b\x6e\x1c\x16\xe0\xe7\xf5\x12\x93\x68\xf4\x1d\
-\x31\x40\x0b\x45\x14\x50\x01\x45\x14\x50\x07\xe6\x37\xfc\x16\xff\
-\x00\xfe\x44\x9f\x85\x3f\xf5\xff\x00\x7d\xff\x00\xa2\xe1\xaf\xc9\
-\x0a\xfd\x6f\xff\x00\x82\xdf\xff\x00\xc8\x93\xf0\xa7\xfe\xbf\xef\
-\xbf\xf4\x5c\x35\xf9\x21\x40\x1f\xbd\xdf\xf0\x4a\x8f\xf9\x32\x1f\
-\x03\x7f\xd7\xc6\xa5\xff\x00\xa5\xd3\x57\xd7\x55\xf2\x2f\xfc\x12\
-\xa3\xfe\x4c\x87\xc0\xdf\xf5\xf1\xa9\x7f\xe9\x74\xd5\xf5\xd5\x00\
-\x15\xf2\x2f\xfc\x15\x5f\xfe\x4c\x87\xc7\x3f\xf5\xf1\xa6\xff\x00\
-\xe9\x74\x35\xf5\xd5\x7c\x8b\xff\x00\x05\x57\xff\x00\x93\x21\xf1\
-\xcf\xfd\x7c\x69\xbf\xfa\x5d\x0d\x00\x7e\x08\xd7\xeb\x7f\xfc\x11\
-\x03\xfe\x44\x9f\x8a\xdf\xf5\xff\x00\x63\xff\x00\xa2\xe6\xaf\xc9\
-\x0a\xfd\x6f\xff\x00\x82\x20\x7f\xc8\x93\xf1\x5b\xfe\xbf\xec\x7f\
-\xf4\x5c\xd4\x01\xfa\x73\x45\x14\x50\x01\x45\x14\x50\x02\x6d\x1e\
-\x83\xae\x7a\x52\xd1\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\x51\x45\x00\x14\
-\x51\x45\x00\x14\x51\x45\x00\x14\x98\x1e\x94\xb4\x50\x03\x76\x2f\
-\xf7\x47\xe5\x4e\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\xfc\xc6\xff\x00\x82\xdf\xff\x00\xc8\x93\xf0\xa7\xfe\
-\xbf\xef\xbf\xf4\x5c\x35\xf9\x21\x5f\xad\xff\x00\xf0\x5b\xff\x00\
-\xf9\x12\x7e\x14\xff\x00\xd7\xfd\xf7\xfe\x8b\x86\xbf\x24\x28\x03\
-\xf7\xbb\xfe\x09\x51\xff\x00\x26\x43\xe0\x6f\xfa\xf8\xd4\xbf\xf4\
-\xba\x6a\xfa\xea\xbe\x45\xff\x00\x82\x54\x7f\xc9\x90\xf8\x1b\xfe\
-\xbe\x35\x2f\xfd\x2e\x9a\xbe\xba\xa0\x02\xbe\x45\xff\x00\x82\xab\
-\xff\x00\xc9\x90\xf8\xe7\xfe\xbe\x34\xdf\xfd\x2e\x86\xbe\xba\xaf\
-\x91\x7f\xe0\xaa\xff\x00\xf2\x64\x3e\x39\xff\x00\xaf\x8d\x37\xff\
-\x00\x4b\xa1\xa0\x0f\xc1\x1a\xfd\x6f\xff\x00\x82\x20\x7f\xc8\x93\
-\xf1\x5b\xfe\xbf\xec\x7f\xf4\x5c\xd5\xf9\x21\x5f\xad\xff\x00\xf0\
-\x44\x0f\xf9\x12\x7e\x2b\x7f\xd7\xfd\x8f\xfe\x8b\x9a\x80\x3f\x4e\
-\x68\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\
-\xfc\xc6\xff\x00\x82\xdf\xff\x00\xc8\x93\xf0\xa7\xfe\xbf\xef\xbf\
-\xf4\x5c\x35\xf9\x21\x5f\xad\xff\x00\xf0\x5b\xff\x00\xf9\x12\x7e\
-\x14\xff\x00\xd7\xfd\xf7\xfe\x8b\x86\xbf\x24\x28\x03\xf7\xbb\xfe\
-\x09\x51\xff\x00\x26\x43\xe0\x6f\xfa\xf8\xd4\xbf\xf4\xba\x6a\xfa\
-\xea\xbe\x45\xff\x00\x82\x54\x7f\xc9\x90\xf8\x1b\xfe\xbe\x35\x2f\
-\xfd\x2e\x9a\xbe\xba\xa0\x02\xbe\x45\xff\x00\x82\xab\xff\x00\xc9\
-\x90\xf8\xe7\xfe\xbe\x34\xdf\xfd\x2e\x86\xbe\xba\xaf\x91\x7f\xe0\
-\xaa\xff\x00\xf2\x64\x3e\x39\xff\x00\xaf\x8d\x37\xff\x00\x4b\xa1\
-\xa0\x0f\xc1\x1a\xfd\x6f\xff\x00\x82\x20\x7f\xc8\x93\xf1\x5b\xfe\
-\xbf\xec\x7f\xf4\x5c\xd5\xf9\x21\x5f\xad\xff\x00\xf0\x44\x0f\xf9\
-\x12\x7e\x2b\x7f\xd7\xfd\x8f\xfe\x8b\x9a\x80\x3f\x4e\x68\xa2\x8a\
-\x00\x28\xa2\x8a\x00\xc4\xf1\x17\x8b\xb4\x6f\x08\xd9\x8b\xad\x73\
-\x58\xd3\xf4\x6b\x66\x6d\xab\x36\xa3\x74\x96\xea\x5b\xd0\x17\x2a\
-\x09\xfc\x6b\x03\xfe\x17\xbf\xc3\x5f\xfa\x28\x5e\x15\xff\x00\xc1\
-\xd5\xb7\xff\x00\x17\x5f\xcf\x87\xed\x3b\xf1\xc3\xc4\xbf\x1e\xfe\
-\x31\x78\x87\xc4\x7e\x21\xba\x9d\xc7\xdb\x25\x8a\xc6\xc2\x46\x26\
-\x3b\x1b\x65\x62\xb1\xc3\x1a\xf4\x01\x54\x0c\x9c\x02\xc4\x92\x72\
-\x4d\x79\x05\x00\x7f\x4d\xdf\xf0\xbd\xfe\x1a\xff\x00\xd1\x42\xf0\
-\xaf\xfe\x0e\xad\xbf\xf8\xba\x3f\xe1\x7b\xfc\x35\xff\x00\xa2\x85\
-\xe1\x5f\xfc\x1d\x5b\x7f\xf1\x75\xfc\xc8\xd1\x40\x1f\xd3\x77\xfc\
-\x2f\x7f\x86\xbf\xf4\x50\xbc\x2b\xff\x00\x83\xab\x6f\xfe\x2e\x8f\
-\xf8\x5e\xff\x00\x0d\x7f\xe8\xa1\x78\x57\xff\x00\x07\x56\xdf\xfc\
-\x5d\x7f\x32\x34\x50\x07\xf4\xdd\xff\x00\x0b\xdf\xe1\xaf\xfd\x14\
-\x2f\x0a\xff\x00\xe0\xea\xdb\xff\x00\x8b\xa3\xfe\x17\xbf\xc3\x5f\
-\xfa\x28\x5e\x15\xff\x00\xc1\xd5\xb7\xff\x00\x17\x5f\xcc\x8d\x14\
-\x01\xfd\x37\x7f\xc2\xf7\xf8\x6b\xff\x00\x45\x0b\xc2\xbf\xf8\x3a\
-\xb6\xff\x00\xe2\xe8\xff\x00\x85\xef\xf0\xd7\xfe\x8a\x17\x85\x7f\
-\xf0\x75\x6d\xff\x00\xc5\xd7\xf3\x23\x45\x00\x7f\x4d\xdf\xf0\xbd\
-\xfe\x1a\xff\x00\xd1\x42\xf0\xaf\xfe\x0e\xad\xbf\xf8\xba\x3f\xe1\
-\x7b\xfc\x35\xff\x00\xa2\x85\xe1\x5f\xfc\x1d\x5b\x7f\xf1\x75\xfc\
-\xc8\xd1\x40\x1f\xd3\x77\xfc\x2f\x7f\x86\xbf\xf4\x50\xbc\x2b\xff\
-\x00\x83\xab\x6f\xfe\x2e\x8f\xf8\x5e\xff\x00\x0d\x7f\xe8\xa1\x78\
-\x57\xff\x00\x07\x56\xdf\xfc\x5d\x7f\x32\x34\x50\x07\xf4\xdd\xff\
-\x00\x0b\xdf\xe1\xaf\xfd\x14\x2f\x0a\xff\x00\xe0\xea\xdb\xff\x00\
-\x8b\xa3\xfe\x17\xbf\xc3\x5f\xfa\x28\x5e\x15\xff\x00\xc1\xd5\xb7\
-\xff\x00\x17\x5f\xcc\x8d\x14\x01\xfd\x37\x7f\xc2\xf7\xf8\x6b\xff\
-\x00\x45\x0b\xc2\xbf\xf8\x3a\xb6\xff\x00\xe2\xe8\xff\x00\x85\xef\
-\xf0\xd7\xfe\x8a\x17\x85\x7f\xf0\x75\x6d\xff\x00\xc5\xd7\xf3\x23\
-\x45\x00\x7f\x4d\xdf\xf0\xbd\xfe\x1a\xff\x00\xd1\x42\xf0\xaf\xfe\
-\x0e\xad\xbf\xf8\xba\x3f\xe1\x7b\xfc\x35\xff\x00\xa2\x85\xe1\x5f\
-\xfc\x1d\x5b\x7f\xf1\x75\xfc\xc8\xd1\x40\x1f\xd3\x77\xfc\x2f\x7f\
-\x86\xbf\xf4\x50\xbc\x2b\xff\x00\x83\xab\x6f\xfe\x2e\x8f\xf8\x5e\
-\xff\x00\x0d\x7f\xe8\xa1\x78\x57\xff\x00\x07\x56\xdf\xfc\x5d\x7f\
-\x32\x34\x50\x07\xf4\xdd\xff\x00\x0b\xdf\xe1\xaf\xfd\x14\x2f\x0a\
-\xff\x00\xe0\xea\xdb\xff\x00\x8b\xa3\xfe\x17\xbf\xc3\x5f\xfa\x28\
-\x5e\x15\xff\x00\xc1\xd5\xb7\xff\x00\x17\x5f\xcc\x8d\x14\x01\xfd\
-\x37\x7f\xc2\xf7\xf8\x6b\xff\x00\x45\x0b\xc2\xbf\xf8\x3a\xb6\xff\
-\x00\xe2\xe8\xff\x00\x85\xef\xf0\xd7\xfe\x8a\x17\x85\x7f\xf0\x75\
-\x6d\xff\x00\xc5\xd7\xf3\x23\x45\x00\x7f\x4d\xdf\xf0\xbd\xfe\x1a\
-\xff\x00\xd1\x42\xf0\xaf\xfe\x0e\xad\xbf\xf8\xba\x3f\xe1\x7b\xfc\
-\x35\xff\x00\xa2\x85\xe1\x5f\xfc\x1d\x5b\x7f\xf1\x75\xfc\xc8\xd1\
-\x40\x1f\xd3\x77\xfc\x2f\x7f\x86\xbf\xf4\x50\xbc\x2b\xff\x00\x83\
-\xab\x6f\xfe\x2e\x8f\xf8\x5e\xff\x00\x0d\x7f\xe8\xa1\x78\x57\xff\
-\x00\x07\x56\xdf\xfc\x5d\x7f\x32\x34\x50\x07\xf4\xdd\xff\x00\x0b\
-\xdf\xe1\xaf\xfd\x14\x2f\x0a\xff\x00\xe0\xea\xdb\xff\x00\x8b\xa3\
-\xfe\x17\xbf\xc3\x5f\xfa\x28\x5e\x15\xff\x00\xc1\xd5\xb7\xff\x00\
-\x17\x5f\xcc\x8d\x14\x01\xfd\x37\x7f\xc2\xf7\xf8\x6b\xff\x00\x45\
-\x0b\xc2\xbf\xf8\x3a\xb6\xff\x00\xe2\xe8\xff\x00\x85\xef\xf0\xd7\
-\xfe\x8a\x17\x85\x7f\xf0\x75\x6d\xff\x00\xc5\xd7\xf3\x23\x45\x00\
-\x7f\x4d\xdf\xf0\xbd\xfe\x1a\xff\x00\xd1\x42\xf0\xaf\xfe\x0e\xad\
-\xbf\xf8\xba\x3f\xe1\x7b\xfc\x35\xff\x00\xa2\x85\xe1\x5f\xfc\x1d\
-\x5b\x7f\xf1\x75\xfc\xc8\xd1\x40\x1f\xd3\x77\xfc\x2f\x7f\x86\xbf\
-\xf4\x50\xbc\x2b\xff\x00\x83\xab\x6f\xfe\x2e\x8f\xf8\x5e\xff\x00\
-\x0d\x7f\xe8\xa1\x78\x57\xff\x00\x07\x56\xdf\xfc\x5d\x7f\x32\x34\
-\x50\x07\xf4\xdd\xff\x00\x0b\xdf\xe1\xaf\xfd\x14\x2f\x0a\xff\x00\
-\xe0\xea\xdb\xff\x00\x8b\xa3\xfe\x17\xbf\xc3\x5f\xfa\x28\x5e\x15\
-\xff\x00\xc1\xd5\xb7\xff\x00\x17\x5f\xcc\x8d\x14\x01\xfd\x37\x7f\
-\xc2\xf7\xf8\x6b\xff\x00\x45\x0b\xc2\xbf\xf8\x3a\xb6\xff\x00\xe2\
-\xe8\xff\x00\x85\xef\xf0\xd7\xfe\x8a\x17\x85\x7f\xf0\x75\x6d\xff\
-\x00\xc5\xd7\xf3\x23\x45\x00\x7f\x4d\xdf\xf0\xbd\xfe\x1a\xff\x00\
-\xd1\x42\xf0\xaf\xfe\x0e\xad\xbf\xf8\xba\x3f\xe1\x7b\xfc\x35\xff\
-\x00\xa2\x85\xe1\x5f\xfc\x1d\x5b\x7f\xf1\x75\xfc\xc8\xd1\x40\x1f\
-\xd3\x77\xfc\x2f\x7f\x86\xbf\xf4\x50\xbc\x2b\xff\x00\x83\xab\x6f\
-\xfe\x2e\x8f\xf8\x5e\xff\x00\x0d\x7f\xe8\xa1\x78\x57\xff\x00\x07\
-\x56\xdf\xfc\x5d\x7f\x32\x34\x50\x07\xf4\xdd\xff\x00\x0b\xdf\xe1\
-\xaf\xfd\x14\x2f\x0a\xff\x00\xe0\xea\xdb\xff\x00\x8b\xad\xff\x00\
-\x0e\xf8\xbb\x47\xf1\x75\x99\xba\xd0\xf5\x8d\x3f\x59\xb7\x8d\xb6\
-\x3c\xda\x6d\xd2\x5c\x20\x6f\x42\x50\xb0\x07\xdb\x35\xfc\xb9\x57\
-\xb0\xfe\xcc\x3f\x1c\x3c\x49\xf0\x13\xe3\x1f\x87\x7c\x45\xe1\xfb\
-\xb9\xe2\x06\xf2\x18\xaf\xac\x23\x27\xcb\xbe\xb6\x67\x0b\x24\x32\
-\x27\x43\xb9\x58\xe0\xe0\x95\x20\x11\x82\x28\x03\xfa\x47\xa2\x8a\
-\x28\x00\xa2\x8a\x28\x03\xf3\x1b\xfe\x0b\x7f\xff\x00\x22\x4f\xc2\
-\x9f\xfa\xff\x00\xbe\xff\x00\xd1\x70\xd7\xe4\x85\x7e\xb7\xff\x00\
-\xc1\x6f\xff\x00\xe4\x49\xf8\x53\xff\x00\x5f\xf7\xdf\xfa\x2e\x1a\
-\xfc\x90\xa0\x0f\xde\xef\xf8\x25\x47\xfc\x99\x0f\x81\xbf\xeb\xe3\
-\x52\xff\x00\xd2\xe9\xab\xeb\xaa\xf9\x17\xfe\x09\x51\xff\x00\x26\
-\x43\xe0\x6f\xfa\xf8\xd4\xbf\xf4\xba\x6a\xfa\xea\x80\x0a\xf9\x17\
-\xfe\x0a\xaf\xff\x00\x26\x43\xe3\x9f\xfa\xf8\xd3\x7f\xf4\xba\x1a\
-\xfa\xea\xbe\x45\xff\x00\x82\xab\xff\x00\xc9\x90\xf8\xe7\xfe\xbe\
-\x34\xdf\xfd\x2e\x86\x80\x3f\x04\x6b\xf5\xbf\xfe\x08\x81\xff\x00\
-\x22\x4f\xc5\x6f\xfa\xff\x00\xb1\xff\x00\xd1\x73\x57\xe4\x85\x7e\
-\xb7\xff\x00\xc1\x10\x3f\xe4\x49\xf8\xad\xff\x00\x5f\xf6\x3f\xfa\
-\x2e\x6a\x00\xfd\x39\xa2\x8a\x28\x00\xa2\x8a\x28\x03\xf2\xfb\xf6\
-\xa8\xff\x00\x82\x49\xea\x7e\x3c\xf8\x9b\xab\x78\xaf\xe1\x6e\xbb\
-\xa3\xd8\x5b\xeb\x17\x32\x5e\x5e\x68\x5a\xd1\x96\x14\xb7\x9e\x42\
-\x4b\x98\x64\x8a\x37\xca\x33\x36\xed\x85\x57\x68\xe0\x37\x23\x1e\
-\x1b\xff\x00\x0e\x61\xf8\xe7\xff\x00\x41\xbf\x03\xff\x00\xe0\xce\
-\xeb\xff\x00\x91\x6b\xf6\xc7\x6a\xff\x00\x74\x74\xc7\x4a\x75\x00\
-\x7e\x26\x7f\xc3\x98\x7e\x39\xff\x00\xd0\x6f\xc0\xff\x00\xf8\x33\
-\xba\xff\x00\xe4\x5a\x3f\xe1\xcc\x3f\x1c\xff\x00\xe8\x37\xe0\x7f\
-\xfc\x19\xdd\x7f\xf2\x2d\x7e\xd9\xd1\x40\x1f\x89\x9f\xf0\xe6\x1f\
-\x8e\x7f\xf4\x1b\xf0\x3f\xfe\x0c\xee\xbf\xf9\x16\x8f\xf8\x73\x0f\
-\xc7\x3f\xfa\x0d\xf8\x1f\xff\x00\x06\x77\x5f\xfc\x8b\x5f\xb6\x74\
-\x50\x07\xe2\x67\xfc\x39\x87\xe3\x9f\xfd\x06\xfc\x0f\xff\x00\x83\
-\x3b\xaf\xfe\x45\xa3\xfe\x1c\xc3\xf1\xcf\xfe\x83\x7e\x07\xff\x00\
-\xc1\x9d\xd7\xff\x00\x22\xd7\xed\x9d\x14\x01\xf8\x99\xff\x00\x0e\
-\x61\xf8\xe7\xff\x00\x41\xbf\x03\xff\x00\xe0\xce\xeb\xff\x00\x91\
-\x68\xff\x00\x87\x30\xfc\x73\xff\x00\xa0\xdf\x81\xff\x00\xf0\x67\
-\x75\xff\x00\xc8\xb5\xfb\x67\x45\x00\x7e\x26\x7f\xc3\x98\x7e\x39\
-\xff\x00\xd0\x6f\xc0\xff\x00\xf8\x33\xba\xff\x00\xe4\x5a\x3f\xe1\
-\xcc\x3f\x1c\xff\x00\xe8\x37\xe0\x7f\xfc\x19\xdd\x7f\xf2\x2d\x7e\
-\xd9\xd1\x40\x1f\x89\x9f\xf0\xe6\x1f\x8e\x7f\xf4\x1b\xf0\x3f\xfe\
-\x0c\xee\xbf\xf9\x16\x8f\xf8\x73\x0f\xc7\x3f\xfa\x0d\xf8\x1f\xff\
-\x00\x06\x77\x5f\xfc\x8b\x5f\xb6\x74\x50\x07\xe2\x67\xfc\x39\x87\
-\xe3\x9f\xfd\x06\xfc\x0f\xff\x00\x83\x3b\xaf\xfe\x45\xa3\xfe\x1c\
-\xc3\xf1\xcf\xfe\x83\x7e\x07\xff\x00\xc1\x9d\xd7\xff\x00\x22\xd7\
-\xed\x9d\x14\x01\xf8\x99\xff\x00\x0e\x61\xf8\xe7\xff\x00\x41\xbf\
-\x03\xff\x00\xe0\xce\xeb\xff\x00\x91\x68\xff\x00\x87\x30\xfc\x73\
-\xff\x00\xa0\xdf\x81\xff\x00\xf0\x67\x75\xff\x00\xc8\xb5\xfb\x67\
-\x45\x00\x7e\x26\x7f\xc3\x98\x7e\x39\xff\x00\xd0\x6f\xc0\xff\x00\
-\xf8\x33\xba\xff\x00\xe4\x5a\x3f\xe1\xcc\x3f\x1c\xff\x00\xe8\x37\
-\xe0\x7f\xfc\x19\xdd\x7f\xf2\x2d\x7e\xd9\xd1\x40\x1f\x89\x9f\xf0\
-\xe6\x1f\x8e\x7f\xf4\x1b\xf0\x3f\xfe\x0c\xee\xbf\xf9\x16\x8f\xf8\
-\x73\x0f\xc7\x3f\xfa\x0d\xf8\x1f\xff\x00\x06\x77\x5f\xfc\x8b\x5f\
-\xb6\x74\x50\x07\xe2\x67\xfc\x39\x87\xe3\x9f\xfd\x06\xfc\x0f\xff\
-\x00\x83\x3b\xaf\xfe\x45\xa3\xfe\x1c\xc3\xf1\xcf\xfe\x83\x7e\x07\
-\xff\x00\xc1\x9d\xd7\xff\x00\x22\xd7\xed\x9d\x14\x01\xf8\x99\xff\
-\x00\x0e\x61\xf8\xe7\xff\x00\x41\xbf\x03\xff\x00\xe0\xce\xeb\xff\
-\x00\x91\x68\xff\x00\x87\x30\xfc\x73\xff\x00\xa0\xdf\x81\xff\x00\
-\xf0\x67\x75\xff\x00\xc8\xb5\xfb\x67\x45\x00\x7e\x26\x7f\xc3\x98\
-\x7e\x39\xff\x00\xd0\x6f\xc0\xff\x00\xf8\x33\xba\xff\x00\xe4\x5a\
-\x3f\xe1\xcc\x3f\x1c\xff\x00\xe8\x37\xe0\x7f\xfc\x19\xdd\x7f\xf2\
-\x2d\x7e\xd9\xd1\x40\x1f\x89\x9f\xf0\xe6\x1f\x8e\x7f\xf4\x1b\xf0\
-\x3f\xfe\x0c\xee\xbf\xf9\x16\x8f\xf8\x73\x0f\xc7\x3f\xfa\x0d\xf8\
-\x1f\xff\x00\x06\x77\x5f\xfc\x8b\x5f\xb6\x74\x50\x07\xe2\x67\xfc\
-\x39\x87\xe3\x9f\xfd\x06\xfc\x0f\xff\x00\x83\x3b\xaf\xfe\x45\xa3\
-\xfe\x1c\xc3\xf1\xcf\xfe\x83\x7e\x07\xff\x00\xc1\x9d\xd7\xff\x00\
-\x22\xd7\xed\x9d\x14\x01\xf8\x99\xff\x00\x0e\x61\xf8\xe7\xff\x00\
-\x41\xbf\x03\xff\x00\xe0\xce\xeb\xff\x00\x91\x68\xff\x00\x87\x30\
-\xfc\x73\xff\x00\xa0\xdf\x81\xff\x00\xf0\x67\x75\xff\x00\xc8\xb5\
-\xfb\x67\x45\x00\x7e\x26\x7f\xc3\x98\x7e\x39\xff\x00\xd0\x6f\xc0\
-\xff\x00\xf8\x33\xba\xff\x00\xe4\x5a\x3f\xe1\xcc\x3f\x1c\xff\x00\
-\xe8\x37\xe0\x7f\xfc\x19\xdd\x7f\xf2\x2d\x7e\xd9\xd1\x40\x1f\x89\
-\x9f\xf0\xe6\x1f\x8e\x7f\xf4\x1b\xf0\x3f\xfe\x0c\xee\xbf\xf9\x16\
-\x8f\xf8\x73\x0f\xc7\x3f\xfa\x0d\xf8\x1f\xff\x00\x06\x77\x5f\xfc\
-\x8b\x5f\xb6\x74\x50\x07\xe2\x67\xfc\x39\x87\xe3\x9f\xfd\x06\xfc\
-\x0f\xff\x00\x83\x3b\xaf\xfe\x45\xa3\xfe\x1c\xc3\xf1\xcf\xfe\x83\
-\x7e\x07\xff\x00\xc1\x9d\xd7\xff\x00\x22\xd7\xed\x9d\x14\x01\xf8\
-\x99\xff\x00\x0e\x61\xf8\xe7\xff\x00\x41\xbf\x03\xff\x00\xe0\xce\
-\xeb\xff\x00\x91\x68\xff\x00\x87\x30\xfc\x73\xff\x00\xa0\xdf\x81\
-\xff\x00\xf0\x67\x75\xff\x00\xc8\xb5\xfb\x67\x45\x00\x7e\x26\x7f\
-\xc3\x98\x7e\x39\xff\x00\xd0\x6f\xc0\xff\x00\xf8\x33\xba\xff\x00\
-\xe4\x5a\x3f\xe1\xcc\x3f\x1c\xff\x00\xe8\x37\xe0\x7f\xfc\x19\xdd\
-\x7f\xf2\x2d\x7e\xd9\xd1\x40\x1f\x89\x9f\xf0\xe6\x1f\x8e\x7f\xf4\
-\x1b\xf0\x3f\xfe\x0c\xee\xbf\xf9\x16\x8f\xf8\x73\x0f\xc7\x3f\xfa\
-\x0d\xf8\x1f\xff\x00\x06\x77\x5f\xfc\x8b\x5f\xb6\x74\x50\x07\xe2\
-\x67\xfc\x39\x87\xe3\x9f\xfd\x06\xfc\x0f\xff\x00\x83\x3b\xaf\xfe\
-\x45\xaf\x73\xfd\x96\x7f\xe0\x92\x3a\x9f\x80\xbe\x26\x69\x3e\x2c\
-\xf8\xa3\xaf\x69\x17\xd6\xfa\x3d\xcc\x77\x96\x9a\x16\x8a\x65\x9a\
-\x3b\x89\xe3\xe5\x0c\xd2\xcb\x1a\x61\x15\x80\x3b\x02\xb6\xe1\xc1\
-\x6e\x0e\x7f\x50\x29\x36\x8c\x83\x81\x90\x30\x0e\x28\x01\x68\xa2\
-\x8a\x00\x28\xa2\x8a\x00\xfc\xc6\xff\x00\x82\xdf\xff\x00\xc8\x93\
-\xf0\xa7\xfe\xbf\xef\xbf\xf4\x5c\x35\xf9\x21\x5f\xad\xff\x00\xf0\
-\x5b\xff\x00\xf9\x12\x7e\x14\xff\x00\xd7\xfd\xf7\xfe\x8b\x86\xbf\
-\x24\x28\x03\xf7\xbb\xfe\x09\x51\xff\x00\x26\x43\xe0\x6f\xfa\xf8\
-\xd4\xbf\xf4\xba\x6a\xfa\xea\xbe\x45\xff\x00\x82\x54\x7f\xc9\x90\
-\xf8\x1b\xfe\xbe\x35\x2f\xfd\x2e\x9a\xbe\xba\xa0\x02\xbe\x45\xff\
-\x00\x82\xab\xff\x00\xc9\x90\xf8\xe7\xfe\xbe\x34\xdf\xfd\x2e\x86\
-\xbe\xba\xaf\x91\x7f\xe0\xaa\xff\x00\xf2\x64\x3e\x39\xff\x00\xaf\
-\x8d\x37\xff\x00\x4b\xa1\xa0\x0f\xc1\x1a\xfd\x6f\xff\x00\x82\x20\
-\x7f\xc8\x93\xf1\x5b\xfe\xbf\xec\x7f\xf4\x5c\xd5\xf9\x21\x5f\xad\
-\xff\x00\xf0\x44\x0f\xf9\x12\x7e\x2b\x7f\xd7\xfd\x8f\xfe\x8b\x9a\
-\x80\x3f\x4e\x68\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\xa2\x8a\x00\x28\
-\xa2\x8a\x00\xfc\xc6\xff\x00\x82\xdf\xff\x00\xc8\x93\xf0\xa7\xfe\
-\xbf\xef\xbf\xf4\x5c\x35\xf9\x21\x5f\xad\xff\x00\xf0\x5b\xff\x00\
-\xf9\x12\x7e\x14\xff\x00\xd7\xfd\xf7\xfe\x8b\x86\xbf\x24\x28\x03\
-\xf7\xbb\xfe\x09\x51\xff\x00\x26\x43\xe0\x6f\xfa\xf8\xd4\xbf\xf4\
-\xba\x6a\xfa\xea\xbe\x45\xff\x00\x82\x54\x7f\xc9\x90\xf8\x1b\xfe\
-\xbe\x35\x2f\xfd\x2e\x9a\xbe\xba\xa0\x02\xbe\x59\xff\x00\x82\x9c\
-\x68\xb2\xeb\x9f\xb1\x17\xc4\x84\x85\x77\xcb\x02\x59\x5d\x6d\xff\
-\x00\x66\x3b\xe8\x19\xcf\xfd\xf2\x18\xfe\x15\xf5\x35\x71\xdf\x17\
-\xbc\x03\x6f\xf1\x4b\xe1\x6f\x8b\x3c\x1d\x75\xb4\x43\xae\xe9\x97\
-\x3a\x79\x67\x19\xd8\x64\x8d\x95\x5f\xea\xac\x41\x07\xb1\x02\x80\
-\x3f\x98\x8a\xfd\x51\xff\x00\x82\x20\x78\xaa\x04\x93\xe2\xbf\x87\
-\x24\x75\x5b\xa9\x06\x9f\x7f\x04\x79\xf9\x9d\x07\x9d\x1c\xa7\xe8\
-\x0b\x45\xff\x00\x7d\x57\xe6\x16\xbd\xa0\x5e\xf8\x63\x5a\xd4\x34\
-\x8d\x4e\xd9\xad\x35\x1d\x3e\xe2\x4b\x5b\x98\x1c\x61\xa3\x91\x0b\
-\x2b\x29\xfa\x15\xaf\x6c\xfd\x87\xff\x00\x68\x63\xfb\x34\xfe\xd0\
-\xda\x07\x8a\x6e\x9d\xc6\x81\x71\x9d\x37\x58\x45\xcb\x1f\xb1\xca\
-\x40\x77\x00\x77\x8d\x95\x24\xc7\x7d\x98\xef\x40\x1f\xd1\x45\x15\
-\x9b\xa5\xea\x76\xda\xdd\x85\xb6\xa3\x61\x76\x97\x96\x17\x28\xb3\
-\x43\x3c\x2e\x19\x24\x8d\xb9\x04\x11\xdb\xb8\x3f\x85\x69\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\x45\x14\x50\x01\
-\x45\x14\x50\x01\x45\x14\x50\x01\x45\x15\x99\xaa\x6a\x96\xda\x26\
-\x9f\x75\xa8\xea\x17\x89\x67\x63\x6c\x8d\x34\xd3\xcd\x20\x54\x8e\
-\x35\xe4\x92\x4f\x6e\xe4\xd0\x07\xe5\xdf\xfc\x16\xfb\xc5\x56\xef\
-\x27\xc2\x7f\x0d\xc6\xea\xd7\x31\xae\xa3\xa8\x4f\x1e\x7e\x64\x43\
-\xe4\xc7\x11\xfa\x12\xb2\xff\x00\xdf\x35\xf9\x5d\x5e\xff\x00\xfb\
-\x70\x7e\xd0\xc7\xf6\x97\xfd\xa1\x75\xff\x00\x15\x5b\x3b\x7f\x60\
-\x5b\xe3\x4d\xd1\xe3\x60\x54\x8b\x38\x89\x08\xe4\x1e\x86\x46\x67\
-\x93\x1d\xb7\xe3\xb5\x78\xa6\x81\xa0\x5f\x78\xa3\x5c\xd3\xb4\x8d\
-\x32\xd9\xae\xf5\x1d\x42\xe2\x3b\x5b\x58\x11\x72\xd2\x48\xec\x15\
-\x57\xf1\x2c\x28\x03\xf7\xbf\xfe\x09\x95\xa2\xcb\xa1\xfe\xc4\x7f\
-\x0d\x22\x9d\x3c\xb9\xa6\x8a\xf6\xe8\x8c\x63\x2b\x25\xf4\xee\x87\
-\xfe\xf8\x65\xaf\xa9\x6b\x8e\xf8\x49\xe0\x3b\x6f\x85\xbf\x0b\xfc\
-\x29\xe0\xfb\x5d\xa6\x1d\x0f\x4b\xb6\xd3\x83\xa0\xc6\xf3\x14\x4a\
-\x8c\xc7\xdd\x98\x12\x4f\x72\x6b\xb1\xa0\x02\x93\x68\xf4\xa5\xa2\
-\x80\x3f\x1b\x7f\xe0\xad\x3f\xb2\xbc\xde\x05\xf8\x89\xff\x00\x0b\
-\x7b\xc3\xf6\x59\xf0\xef\x89\x1c\x47\xab\x24\x51\xfc\xb6\x97\xe0\
-\x6d\x2e\xd8\xe8\xb3\x0e\x77\x7f\x7c\x48\x4f\x2e\x2b\xf3\xab\x7b\
-\x7f\x78\xf5\xcf\x5a\xfe\xa0\x3c\x75\xe0\x7d\x13\xe2\x67\x84\x35\
-\x6f\x0c\x78\x93\x4e\x87\x56\xd0\xf5\x48\x4d\xbd\xdd\xa5\xc0\xf9\
-\x1d\x78\xee\x3e\xeb\x02\x03\x2b\x0e\x41\x00\x8e\x6b\xf0\xc3\xf6\
-\xce\xfd\x81\xfc\x53\xfb\x2c\xeb\x77\x5a\xad\x94\x53\xf8\x83\xe1\
-\xc4\xd2\x66\xcf\x5c\x08\x0b\x5b\x6e\x38\x58\x6e\x76\x8f\x96\x40\
-\x7e\x50\xd8\xd8\xdc\x11\x82\x4a\xa8\x07\x79\xfb\x0c\xff\x00\xc1\
-\x49\x35\x6f\xd9\xda\xc6\xdb\xc1\x5e\x39\x8e\xe7\xc4\x1e\x00\x0d\
-\xb2\xd6\x68\x4e\xeb\xcd\x27\x3d\xa3\x0d\xc3\xc3\xdc\xa1\xe5\x7a\
-\xaf\x65\x6f\xd7\x7f\x85\x3f\x1e\x7c\x01\xf1\xc3\x4a\x5d\x47\xc0\
-\xbe\x2e\xd3\x3c\x45\x03\x28\x63\x15\xac\xff\x00\xbf\x88\x7f\xd3\
-\x58\x58\x09\x23\x3e\xcc\x05\x7f\x33\x7b\x8f\xa9\xa9\x6d\x2f\x6e\
-\x34\xfb\x98\xee\x2d\x67\x96\xda\xe2\x33\xb9\x25\x85\xca\xba\x9f\
-\x50\x47\x20\xd0\x07\xf5\x3d\xbb\xe5\x1c\xe7\x3d\x39\xe3\xf3\xa5\
-\xdc\x7d\x3f\x9d\x7f\x32\x76\xff\x00\x1e\x3e\x26\x5a\x46\x23\x83\
-\xe2\x27\x8a\xe1\x8c\x74\x48\xf5\xbb\x95\x03\xf0\x0f\x52\xff\x00\
-\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\
-\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\
-\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\
-\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\
-\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\
-\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\
-\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\
-\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\
-\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\
-\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\
-\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\
-\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\
-\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\
-\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\
-\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\
-\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\
-\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\
-\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\
-\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\
-\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\
-\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\
-\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\
-\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\
-\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\
-\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\
-\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\
-\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\
-\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\
-\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\
-\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\
-\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\
-\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\
-\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\
-\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\
-\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\
-\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\
-\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\
-\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\
-\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\
-\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\
-\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\
-\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\
-\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\
-\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\
-\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\
-\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\
-\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\
-\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\
-\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\
-\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\
-\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\
-\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\
-\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\
-\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\
-\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\
-\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\
-\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\
-\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\
-\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\
-\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\
-\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\
-\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\
-\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\
-\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\
-\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\
-\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\
-\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\
-\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\
-\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\
-\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\
-\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\x00\
-\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\xff\x00\xa2\x93\
-\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\
-\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\
-\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\xc3\x41\x7c\x51\
-\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\xca\x00\xfe\x99\
-\xf7\x1f\x4f\xe7\x46\xe3\xe9\xfc\xeb\xf9\x98\xff\x00\x86\x82\xf8\
-\xa3\xff\x00\x45\x27\xc5\xff\x00\xf8\x3d\xba\xff\x00\xe3\x94\x7f\
-\xc3\x41\x7c\x51\xff\x00\xa2\x93\xe2\xff\x00\xfc\x1e\xdd\x7f\xf1\
-\xca\x00\xfe\x99\xf7\x1f\x4f\xe7\x48\x5b\x6a\x9e\xd8\xeb\x93\xc7\
-\xe6\x6b\xf9\x99\xff\x00\x86\x82\xf8\xa3\xff\x00\x45\x27\xc5\xff\
-\x00\xf8\x3d\xba\xff\x00\xe3\x95\x15\xc7\xc7\x8f\x89\x97\x91\x98\
-\xe7\xf8\x89\xe2\xb9\xa3\x3d\x52\x4d\x6e\xe5\x81\xfc\x0b\xd0\x07\
-\xf4\x59\xf1\x5b\xe3\xd7\x80\x3e\x07\x69\x4d\xa8\xf8\xe7\xc5\xda\
-\x67\x87\x60\x54\x2c\x22\xba\x9f\xf7\xf2\x8f\xfa\x65\x0a\x83\x24\
-\x87\xd9\x41\xaf\xc8\x8f\xdb\x9b\xfe\x0a\x4d\xab\xfe\xd1\x36\x57\
-\x5e\x0b\xf0\x2c\x77\x3e\x1e\xf8\x7e\x5f\x65\xd4\xd3\x7c\xb7\xba\
-\xb6\x3b\x48\x14\xfe\xee\x1f\xf6\x3a\xb7\x56\xee\xab\xf0\xbd\xdd\
-\xe5\xc5\xfd\xcc\x97\x17\x33\xc9\x71\x71\x21\xdc\xf2\xcc\xe5\x9d\
-\x8f\xa9\x27\x92\x6a\x2d\xc7\xd4\xd0\x01\xb9\x8f\x52\x4f\x7e\xb5\
-\xfa\x2d\xff\x00\x04\x95\xfd\x95\xe6\xf1\xd7\xc4\x3f\xf8\x5b\xde\
-\x20\xb2\x2b\xe1\xef\x0d\xbf\x95\xa4\x24\xb1\xfc\xb7\x77\xe4\x60\
-\x48\xa0\xf5\x58\x47\x3b\xbf\xbe\x63\x23\x94\x6a\xf1\x8f\xd8\xc3\
-\xf6\x09\xf1\x4f\xed\x49\xaf\xdb\xea\x57\xb1\x5c\x68\x1f\x0e\x6d\
-\xe4\xdd\x7b\xad\xbc\x60\x35\xc0\x53\x86\x82\xdb\x70\xc3\x49\x9e\
-\x0b\x11\xb1\x79\x27\x24\x05\x6f\xdd\x1f\x02\xf8\x1b\x44\xf8\x67\
-\xe0\xed\x27\xc2\xde\x1c\xd3\xe1\xd2\x74\x2d\x2e\x11\x6d\x6b\x69\
-\x00\x3b\x51\x79\xee\x7e\xf3\x16\x25\x99\x8f\x24\x92\x4f\x34\x01\
-\xd3\x6d\x1e\x94\xb4\x51\x40\x05\x14\x51\x40\x09\xb4\x0e\x80\x0e\
-\xdd\x2a\xb6\xa3\xa5\xd9\x6b\x16\x17\x36\x37\xf6\x70\x5e\xd9\x5c\
-\xc6\xd1\x4f\x6d\x71\x12\xc9\x1c\xa8\xc3\x0c\xac\xa4\x61\x81\x1d\
-\x41\xe0\xd5\xaa\x28\x03\xf3\xe3\xf6\x80\xff\x00\x82\x42\xfc\x3a\
-\xf8\x8d\x75\x3e\xad\xf0\xf3\x51\x7f\x87\x7a\xb4\xa1\x99\xb4\xff\
-\x00\x28\xdc\xe9\xb2\x49\xe8\xb1\xee\xdd\x16\x4e\x73\xb1\x8a\xae\
-\x38\x4a\xf8\x9f\xc7\x3f\xf0\x49\xdf\xda\x0f\xc1\xf3\xba\xd8\x78\
-\x7b\x4d\xf1\x75\xb2\x8f\xf8\xf9\xd1\x35\x48\xb1\xff\x00\x7c\x4e\
-\x62\x7f\xfc\x74\xd7\xee\xf6\xd1\xe9\x46\x07\xa5\x00\x7f\x3b\x73\
-\x7e\xc0\xbf\xb4\x1c\x32\x6d\x6f\x84\xfa\xf1\xf6\x58\xe3\x7f\xe4\
-\xd5\x0f\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\
-\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\
-\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\
-\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\
-\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\
-\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\
-\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\
-\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\
-\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\
-\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\
-\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\
-\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\
-\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\
-\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\
-\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\
-\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\
-\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\
-\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\
-\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\
-\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\
-\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\
-\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\
-\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\
-\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\
-\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\
-\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\
-\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\
-\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\
-\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\
-\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\
-\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\
-\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\
-\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\
-\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\
-\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\
-\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\
-\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\
-\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\
-\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\
-\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\
-\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\
-\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\
-\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\
-\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\
-\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\
-\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\
-\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\
-\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\
-\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\
-\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\
-\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\
-\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\
-\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\
-\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\
-\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\xe3\x47\xfc\x30\x4f\xed\
-\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\x8d\x7f\x45\x74\x50\x07\
-\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\x26\xf1\x1f\xfd\xf8\x1f\
-\xe3\x47\xfc\x30\x4f\xed\x05\xff\x00\x44\x9b\xc4\x7f\xf7\xe0\x7f\
-\x8d\x7f\x45\x74\x50\x07\xf3\xa9\xff\x00\x0c\x13\xfb\x41\x7f\xd1\
-\x26\xf1\x1f\xfd\xf8\x1f\xe3\x53\x43\xfb\x02\xfe\xd0\x73\x49\xb5\
-\x7e\x13\xeb\xc3\xd9\xa3\x8d\x3f\x9b\x57\xf4\x4b\x45\x00\x7e\x10\
-\x78\x1b\xfe\x09\x3b\xfb\x41\xf8\xc2\x74\x5b\xff\x00\x0f\x69\xbe\
-\x11\xb6\x61\xff\x00\x1f\x3a\xde\xa9\x16\x3f\xef\x88\x0c\xaf\xff\
-\x00\x8e\x8a\xfb\x5b\xe0\x0f\xfc\x12\x0b\xe1\xe7\xc3\xab\x8b\x5d\
-\x5f\xe2\x1e\xa9\x27\xc4\x1d\x52\x32\xae\xba\x71\x8b\xec\xba\x72\
-\xbf\xf7\x59\x37\x17\x9b\x07\xa6\x59\x55\x87\x54\xaf\xd0\x8c\x0f\
-\x4a\x02\x81\xd0\x01\x40\x15\xb4\xfd\x2e\xcb\x48\xd3\xed\xac\x6c\
-\x2c\xe0\xb2\xb2\xb6\x8d\x62\x82\xda\xde\x25\x8e\x38\x91\x46\x15\
-\x55\x40\xc2\x80\x3a\x01\xd2\xac\x6c\x5e\x7e\x51\xcf\x07\x8a\x75\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\x14\x00\x51\x45\
-\x14\x00\x51\x45\x14\x01\xff\xd9\
-"
-
-qt_resource_name = b"\
-\x00\x05\
-\x00\x6f\xa6\x53\
-\x00\x69\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0a\
-\x01\xe4\x67\x04\
-\x00\x62\
-\x00\x61\x00\x63\x00\x6b\x00\x67\x00\x72\x00\x6f\x00\x75\x00\x6e\x00\x64\
-\x00\x12\
-\x0a\x06\xc4\x67\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x36\x00\x34\x00\x34\x00\x30\x00\x30\x00\x36\x00\x32\x00\x39\x00\x31\x00\x2e\x00\x6a\x00\x70\
-\x00\x67\
-\x00\x11\
-\x0b\x95\xf1\x47\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x34\x00\x30\x00\x36\x00\x34\x00\x35\x00\x38\x00\x37\x00\x35\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-\x00\x08\
-\x00\x28\x5c\xc7\
-\x00\x66\
-\x00\x69\x00\x6c\x00\x65\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\x00\x11\
-\x02\x5e\xe9\x47\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x35\x00\x31\x00\x36\x00\x38\x00\x35\x00\x30\x00\x35\x00\x32\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-\x00\x11\
-\x02\x9c\xe9\x47\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x35\x00\x31\x00\x36\x00\x38\x00\x35\x00\x30\x00\x31\x00\x34\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-\x00\x11\
-\x04\x63\xe9\x47\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x35\x00\x31\x00\x36\x00\x38\x00\x35\x00\x32\x00\x38\x00\x39\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-\x00\x11\
-\x04\x8e\xe9\x47\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x35\x00\x31\x00\x36\x00\x38\x00\x35\x00\x32\x00\x32\x00\x32\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-\x00\x11\
-\x05\x98\xe9\x47\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x35\x00\x31\x00\x36\x00\x38\x00\x35\x00\x31\x00\x31\x00\x30\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-\x00\x11\
-\x07\x78\xe9\x47\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x35\x00\x31\x00\x36\x00\x38\x00\x35\x00\x33\x00\x37\x00\x30\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-\x00\x11\
-\x09\xc6\xe6\xa7\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x37\x00\x33\x00\x36\x00\x39\x00\x34\x00\x35\x00\x32\x00\x36\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-\x00\x11\
-\x0d\x1f\xe8\xa7\
-\x00\x31\
-\x00\x37\x00\x30\x00\x39\x00\x35\x00\x35\x00\x31\x00\x36\x00\x38\x00\x34\x00\x39\x00\x39\x00\x35\x00\x2e\x00\x6a\x00\x70\x00\x67\
-\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x05\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
-\x00\x00\x00\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x54\x00\x00\x00\x00\x00\x01\x00\x00\x04\x27\
-\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xe0\xdb\
-\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x01\x28\x24\
-\x00\x00\x00\xba\x00\x00\x00\x00\x00\x01\x00\x01\x64\x72\
-\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x01\x78\x44\
-\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x01\x88\x12\
-\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x01\xa1\xd0\
-\x00\x00\x01\x5a\x00\x00\x00\x00\x00\x01\x00\x01\xe8\x03\
-\x00\x00\x01\x82\x00\x00\x00\x00\x00\x01\x00\x01\xf9\x0b\
-\x00\x00\x01\xaa\x00\x00\x00\x00\x00\x01\x00\x02\x6a\x95\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x09\x00\x00\x00\x05\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x10\x00\x02\x00\x00\x00\x02\x00\x00\x00\x03\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x2a\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x8e\x09\xfd\x61\xdd\
-\x00\x00\x00\x54\x00\x00\x00\x00\x00\x01\x00\x00\x04\x27\
-\x00\x00\x01\x8e\x09\x06\x4e\x2f\
-\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\xe0\xdb\
-\x00\x00\x01\x8c\x4f\x6e\x5a\xb5\
-\x00\x00\x00\x92\x00\x00\x00\x00\x00\x01\x00\x01\x28\x24\
-\x00\x00\x01\x8e\x09\x40\xd7\xe5\
-\x00\x00\x00\xba\x00\x00\x00\x00\x00\x01\x00\x01\x64\x72\
-\x00\x00\x01\x8e\x09\x40\x79\xa1\
-\x00\x00\x00\xe2\x00\x00\x00\x00\x00\x01\x00\x01\x78\x44\
-\x00\x00\x01\x8e\x09\x45\x1d\x27\
-\x00\x00\x01\x0a\x00\x00\x00\x00\x00\x01\x00\x01\x88\x12\
-\x00\x00\x01\x8e\x09\x44\x65\xea\
-\x00\x00\x01\x32\x00\x00\x00\x00\x00\x01\x00\x01\xa1\xd0\
-\x00\x00\x01\x8e\x09\xf6\x4f\xe5\
-\x00\x00\x01\x5a\x00\x00\x00\x00\x00\x01\x00\x01\xe8\x03\
-\x00\x00\x01\x8e\x09\x46\x39\x53\
-\x00\x00\x01\x82\x00\x00\x00\x00\x00\x01\x00\x01\xf9\x0b\
-\x00\x00\x01\x8e\x0a\x8b\x01\xaa\
-\x00\x00\x01\xaa\x00\x00\x00\x00\x00\x01\x00\x02\x6a\x95\
-\x00\x00\x01\x8e\x09\x40\x27\x19\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
+RESOURCE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "icons.rcc")
 
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
+registered = False
 
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
 
-qInitResources()
+def register() -> bool:
+    """
+    Function that registers icons.rcc with Qt the first time it is called and returns whether that worked.
+    """
+    global registered
+    if not registered:
+        registered = QtCore.QResource.registerResource(RESOURCE_FILE)
+    return registered
@@ -1,7 +1,67 @@
-import streamlit as st
-import barcode
-import segno
 import io
+import itertools
+import os
+import sys
+import tempfile
+
+import streamlit as st
+
+# Make the shared generation engine (../qrengine) importable
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import qrengine  # noqa: E402
+
+PNG_SIZE = 1024  # Target width in pixels of the PNG used for both display and download
+PNG_MAX_PIXELS = 4_000_000  # Hard pixel budget of that PNG
+POSTER_MAX_SIZE = 20_000  # Largest download width in pixels, streamed row by row
+RENDER_CACHE_BYTES = 128 * 1024 * 1024  # Byte budget of the shared render cache
+METRICS_PORT = os.environ.get("QRCODE_METRICS_PORT")  # Serve Prometheus metrics on this port if set
+METRICS_HOST = os.environ.get("QRCODE_METRICS_HOST", "127.0.0.1")  # Interface of the metrics port, "" for all
+LINK_DB = os.environ.get("QRCODE_LINK_DB", "links.sqlite3")  # SQLite store of the short links
+SHORT_LINK_BASE = os.environ.get("QRCODE_SHORT_LINK_BASE", "http://127.0.0.1:8000/R/")  # Redirect route of the codes
+CONTACT_FORMATS = {"Auto (shorter)": "auto", "vCard 3.0": "vcard", "MeCard": "mecard"}  # Labels of the vCard formats
+
+
+@st.cache_resource
+def render_cache() -> qrengine.RenderCache:
+    """
+    Returns the render cache shared by all sessions of this server process.
+    """
+    return qrengine.RenderCache(max_bytes=RENDER_CACHE_BYTES)
+
+
+@st.cache_resource
+def timing_log() -> qrengine.TimingLog:
+    """
+    Returns the ring buffer of per-stage timings shared by all sessions of this server process.
+    """
+    return qrengine.TimingLog()
+
+
+@st.cache_resource
+def link_store():
+    """
+    Returns the short-link store shared by all sessions of this server process.
+    The redirects are answered by `python -m qrengine serve --links` on the same file.
+    """
+    import qrengine.shortlinks
+
+    return qrengine.shortlinks.LinkStore(LINK_DB, SHORT_LINK_BASE)
+
+
+@st.cache_resource
+def metrics():
+    """
+    Returns the Prometheus metrics of this server process. Streamlit cannot add routes,
+    so if QRCODE_METRICS_PORT is set they are served on that port under /metrics, on the
+    interface given by QRCODE_METRICS_HOST (local only by default).
+    """
+    import qrengine.metrics
+
+    generation_metrics = qrengine.metrics.GenerationMetrics(render_cache())
+    if METRICS_PORT:
+        qrengine.metrics.serve_metrics(generation_metrics, host=METRICS_HOST, port=int(METRICS_PORT))
+    return generation_metrics
+
 
 class QRCodeGenerator:
     """
@@ -15,9 +75,9 @@ class QRCodeGenerator:
         st.title("QR Code Generator")
 
         # Button labels and functions
-        button_labels = ["Text", "Link", "VCard", "Wifi", "Email", "Geo", "Micro", "Barcode"]
+        button_labels = ["Text", "Link", "VCard", "Wifi", "Email", "Geo", "Micro", "Barcode", "Batch"]
         button_job = [self.text_exp, self.link_exp, self.vcard_exp, self.wifi_exp,
-                      self.email_exp, self.geo_exp, self.micro_exp, self.barcode_exp]
+                      self.email_exp, self.geo_exp, self.micro_exp, self.barcode_exp, self.batch_exp]
 
         # Check state variables
         if 'active_expander' not in st.session_state:
@@ -34,75 +94,193 @@ class QRCodeGenerator:
                         if lbl != label:
                             st.session_state[f'show_{lbl.lower()}'] = False
 
+        st.sidebar.number_input("Download width (px)", min_value=100, max_value=POSTER_MAX_SIZE,
+                                value=PNG_SIZE, step=100, key='download_size')
+        with st.sidebar.expander("Encoding"):
+            st.selectbox("Error correction", ["Auto", *qrengine.core.ERRORS], key='encode_error')
+            st.number_input("Version (0 = auto, 1-4 for Micro)", min_value=0, max_value=40, value=0,
+                            key='encode_version')
+            st.selectbox("Mask", ["Auto", *range(8)], key='encode_mask')
+            st.checkbox("Fast mode (skip mask evaluation)", key='encode_fast')
+            st.checkbox("Force UTF-8", key='encode_utf8',
+                        help="Non-Latin text is encoded in the smallest character set (e.g. ISO-8859-9 for "
+                             "Turkish), announced by an ECI header. Force UTF-8 for scanners that ignore ECI.")
+
         # Show expanders
         for label in button_labels:
             if st.session_state.active_expander == label:
                 button_job[button_labels.index(label)]()
 
+        self.cache_stats()
+        self.diagnostics()
+
     def generate(self, qr_type: str, input_data: dict):
         """
         Generates a QR code or barcode of the given type.
+        The result is kept in the session, so Show and Download of the same input share one encode.
 
         Args:
             qr_type (str): The type of code to generate (Text, Link, vCard, Wifi, Email, Geo, Micro, Barcode).
             input_data (dict): The content of the code.
 
         Returns:
-            QRCode or barcode object.
+            qrengine.GeneratedCode object or None if generation failed.
         """
+        timing = qrengine.Timing("generate", qr_type)
+        size = None
+        encode_opts = self.encode_options()
         try:
-            if qr_type == "Text":
-                data = self.text_link_qr(input_data)
-            elif qr_type == "Link":
-                data = self.text_link_qr(input_data)
-            elif qr_type == "VCard":
-                data = self.vcard_qr(input_data)
-            elif qr_type == "Wifi":
-                data = self.wifi_qr(input_data)
-            elif qr_type == "Email":
-                data = self.email_qr(input_data)
-            elif qr_type == "Geo":
-                data = self.geo_qr(input_data)
-            elif qr_type == "Micro":
-                data = self.micro_qr(input_data)
-            elif qr_type == "Barcode":
-                data = self.barcode_(input_data)
-            return data
-        except Exception as e:
-            st.write("An error occurred while generating the QR code:", e)
-        
+            result = st.session_state.get('result')
+            if result is not None and result.matches(qr_type, input_data, encode_opts):
+                timing.info["reused"] = True
+                return result
+            try:
+                estimate = qrengine.estimate(qr_type, input_data, encode_opts)
+                if estimate is not None and not estimate.fits:
+                    raise qrengine.CapacityError(estimate.message())  # Rejected before any encoding
+                result = qrengine.GeneratedCode(qr_type, input_data, cache=render_cache(), encode_opts=encode_opts)
+                size = len(self.png(result, timing))  # Render now so that errors are reported here
+            except Exception as e:
+                timing.error = type(e).__name__
+                st.write("An error occurred while generating the QR code:", e)
+                return None
+            st.session_state.result = result
+            return result
+        finally:
+            timing_log().record(timing)
+            metrics().observe(qr_type, timing.seconds, "error" if timing.error else "ok", size=size,
+                              error=timing.error)
+
+    def capacity_hint(self, qr_type: str, input_data: dict):
+        """
+        Shows below the inputs which QR version the content will need, or that it won't fit.
+        The estimate only measures the content, so it is updated on every edit at no noticeable cost.
+        """
+        try:
+            estimate = qrengine.estimate(qr_type, input_data, self.encode_options())
+        except Exception:
+            return  # Incomplete input, generate() reports the error
+        if estimate is None:
+            return
+        if estimate.fits:
+            st.caption(estimate.message())
+        else:
+            st.error(estimate.message())
+
+    def encode_options(self) -> qrengine.EncodeOptions | None:
+        """
+        Returns the encoding options chosen in the sidebar, None if segno should choose everything.
+        """
+        error = st.session_state.get('encode_error', "Auto")
+        mask = st.session_state.get('encode_mask', "Auto")
+        opts = qrengine.EncodeOptions(error=None if error == "Auto" else error,
+                                      version=st.session_state.get('encode_version') or None,
+                                      mask=None if mask == "Auto" else mask,
+                                      fast=st.session_state.get('encode_fast', False),
+                                      utf8=st.session_state.get('encode_utf8', False))
+        return None if opts == qrengine.EncodeOptions() else opts
+
+    def cache_stats(self):
+        """
+        Shows the hit/miss counters of the render cache in the sidebar.
+        """
+        stats = render_cache().stats()
+        st.sidebar.subheader("Render cache")
+        st.sidebar.write(f"Hits: {stats['hits']} / Misses: {stats['misses']} ({stats['hit_ratio']:.0%})")
+        st.sidebar.write(f"Entries: {stats['entries']}, {stats['bytes'] / 1024:.0f} KiB of {stats['max_bytes'] / 1024 / 1024:.0f} MiB")
+
+    def diagnostics(self):
+        """
+        Shows the per-stage timings of the latest operations in the sidebar and offers them as JSON.
+        """
+        log = timing_log()
+        with st.sidebar.expander("Diagnostics"):
+            if not len(log):
+                st.write("No operations recorded yet.")
+                return
+            st.dataframe(log.summary(), hide_index=True)
+            recent = [{"time": entry["time"][11:], "operation": entry["operation"], "kind": entry["kind"],
+                       "total_ms": entry["total_ms"],
+                       "note": entry["error"] or ("reused" if entry.get("reused") else ""),
+                       "stages": ", ".join(f"{s['stage']} {s['ms']} ms" for s in entry["stages"])}
+                      for entry in reversed(log.entries()[-20:])]
+            st.dataframe(recent, hide_index=True)
+            st.download_button("Download timings (JSON)", log.to_json(), file_name="timings.json",
+                               mime="application/json")
+
+    def png(self, result: qrengine.GeneratedCode, timing: qrengine.Timing | None = None) -> bytes:
+        """
+        Returns the PNG bytes shared by display and download.
+
+        Args:
+            result (qrengine.GeneratedCode): The generated code.
+            timing (qrengine.Timing | None): Receives the stages needed to produce the PNG.
+
+        Returns:
+            bytes: PNG image.
+        """
+        return result.render(qrengine.RenderOptions(size=PNG_SIZE, max_pixels=PNG_MAX_PIXELS), timing)
+
+    def poster(self, result: qrengine.GeneratedCode, size: int) -> bytes:
+        """
+        Returns a large PNG for download. QR codes are streamed row by row into the
+        buffer, so only the compressed image is ever held in memory.
+
+        Args:
+            result (qrengine.GeneratedCode): The generated code.
+            size (int): Target width in pixels.
+
+        Returns:
+            bytes: PNG image.
+        """
+        if result.kind == "Barcode":
+            return self.png(result)
+        buffer = io.BytesIO()
+        opts = qrengine.RenderOptions(size=size, max_pixels=POSTER_MAX_SIZE * POSTER_MAX_SIZE)
+        qrengine.write(result.code, buffer, opts)
+        return buffer.getvalue()
+
     def display(self, qr_code):
         """
         Displays the generated QR code or barcode.
 
         Args:
-            qr_code: QR code or barcode object.
+            qr_code (qrengine.GeneratedCode | None): The generated code.
         """
-        buffer = io.BytesIO()
-        if type(qr_code) == segno.QRCode:
-            qr_code.save(buffer, kind="png", scale=50)  # Save QR code in PNG format
-        else:
-            qr_code.write(buffer)  # Save barcode
-        buffer.seek(0)
-        st.image(buffer, caption="Generated Code", use_container_width=True)  # Show the image
-    
+        if qr_code is None:
+            return
+        timing = qrengine.Timing("display", qr_code.kind)
+        png = self.png(qr_code, timing)
+        with timing.stage("st.image") as stage:
+            st.image(png, caption="Generated Code", use_container_width=True)  # Show the image
+            stage.size = len(png)
+        timing_log().record(timing)
+
     def download(self, data):
         """
         Makes the generated QR code or barcode available for download.
 
         Args:
-            data: QR code or barcode object to download.
+            data (qrengine.GeneratedCode | None): The generated code to download.
         """
+        if data is None:
+            return
+        timing = qrengine.Timing("download", data.kind)
         try:
-            buffer = io.BytesIO()
-            if type(data) == segno.QRCode:
-                data.save(buffer, kind="png", scale=40)  # Save QR code as PNG
+            size = st.session_state.get('download_size', PNG_SIZE)
+            if size == PNG_SIZE:
+                png = self.png(data, timing)
             else:
-                data.write(buffer)  # Save barcode
-            buffer.seek(0)
-            st.download_button("Download", buffer, file_name="code.png", mime="image/png")  # Download button
+                with timing.stage("poster") as stage:
+                    png = self.poster(data, size)
+                    stage.size = len(png)
+            with timing.stage("st.download_button") as stage:
+                st.download_button("Download", png, file_name="code.png", mime="image/png")  # Download button
+                stage.size = len(png)
         except Exception as e:
+            timing.error = type(e).__name__
             st.write("An error occurred while downloading the QR code:", e)
+        timing_log().record(timing)
 
     def text_exp(self):
         """
@@ -110,16 +288,14 @@ class QRCodeGenerator:
         """
         with st.expander("Text", expanded=True):
             content = st.text_area("Enter your text here", placeholder="Enter text here", key='text_area')
+            input_data = {"Content": content}
+            self.capacity_hint("Text", input_data)
             col1, col2 = st.columns(2)
             if col1.button("Show"):
                 st.session_state.show_text = True
-                input_data = {"Content": content}
-                qr_code = self.generate("Text", input_data)
-                self.display(qr_code)
+                self.display(self.generate("Text", input_data))
             if col2.button("Download"):
-                input_data = {"Content": content}
-                data = self.generate("Text", input_data)
-                self.download(data)
+                self.download(self.generate("Text", input_data))
 
     def link_exp(self):
         """
@@ -127,16 +303,30 @@ class QRCodeGenerator:
         """
         with st.expander("Link", expanded=True):
             content = st.text_input("Enter your link here", placeholder="Enter link here")
+            shorten = st.checkbox("Short link", key='link_short',
+                                  help=f"Stores the link and encodes a short redirect URL ({SHORT_LINK_BASE}...) "
+                                       "instead, so long tracking links still give a small code.")
+            if shorten:
+                input_data = {"Content": self.short_link(content, store=False)}
+            else:
+                if st.checkbox("Canonical form (smaller code)", key='link_canonical',
+                               help="Uppercases the scheme and host, which browsers ignore, so the link fits "
+                                    "the compact alphanumeric mode of QR codes."):
+                    upper_path = st.checkbox("Uppercase the path too", key='link_upper_path',
+                                             help="Only for servers that ignore the case of paths.")
+                    content = self.canonical_url(content, upper_path)
+                input_data = {"Content": content}
+            self.capacity_hint("Link", input_data)
             col1, col2 = st.columns(2)
             if col1.button("Show"):
                 st.session_state.show_link = True  # Update state
-                input_data = {"Content": content}
-                qr_code = self.generate("Text", input_data)
-                self.display(qr_code)
+                if shorten:
+                    input_data = {"Content": self.short_link(content)}
+                self.display(self.generate("Link", input_data))
             if col2.button("Download"):
-                input_data = {"Content": content}
-                data = self.generate("Link", input_data)
-                self.download(data)
+                if shorten:
+                    input_data = {"Content": self.short_link(content)}
+                self.download(self.generate("Link", input_data))
 
     def vcard_exp(self):
         """
@@ -159,28 +349,64 @@ class QRCodeGenerator:
             org = st.text_input("Organization (optional)", placeholder="Enter organization here")
             title = st.text_input("Title (optional)", placeholder="Enter title here")
             photo_uri = st.text_input("Photo URI (optional)", placeholder="Enter photo URI here")
+            contact_format = st.selectbox("Format", list(CONTACT_FORMATS), key='vcard_format',
+                                          help="MeCard is about half the size of a vCard but has no organization, "
+                                               "title, photo or phone types. Auto uses it only when nothing is lost.")
+            input_data = {
+                "Name": name, "Displayname": displayname, "Email": email,
+                "Phone": phone, "Memo": memo, "Birthday": birthday,
+                "URL": url, "Pobox": pobox, "Street": street, "City": city,
+                "Region": region, "Zipcode": zipcode, "Country": country, 
+                "Org": org, "Title": title, "Photo_Uri": photo_uri,
+                "Format": CONTACT_FORMATS[contact_format]
+            }
+            self.contact_report(input_data)
+            self.capacity_hint("VCard", input_data)
             col1, col2 = st.columns(2)
             if col1.button("Show"):
                 st.session_state.show_vcard = True  # Update state
-                input_data = {
-                    "Name": name, "Displayname": displayname, "Email": email,
-                    "Phone": phone, "Memo": memo, "Birthday": birthday,
-                    "URL": url, "Pobox": pobox, "Street": street, "City": city,
-                    "Region": region, "Zipcode": zipcode, "Country": country, 
-                    "Org": org, "Title": title, "Photo_Uri": photo_uri
-                }
-                qr_code = self.generate("VCard", input_data)
-                self.display(qr_code)
+                self.display(self.generate("VCard", input_data))
             if col2.button("Download"):
-                input_data = {
-                    "Name": name, "Displayname": displayname, "Email": email,
-                    "Phone": phone, "Memo": memo, "Birthday": birthday,
-                    "URL": url, "Pobox": pobox, "Street": street, "City": city,
-                    "Region": region, "Zipcode": zipcode, "Country": country, 
-                    "Org": org, "Title": title, "Photo_Uri": photo_uri
-                }
-                data = self.generate("VCard", input_data)
-                self.download(data)
+                self.download(self.generate("VCard", input_data))
+
+    def contact_report(self, input_data: dict):
+        """
+        Shows which contact format is encoded and how many bytes it saves over the full vCard.
+        """
+        import qrengine.contacts
+        try:
+            st.caption(qrengine.contacts.minimize(input_data)[1].message())
+        except Exception:
+            pass  # Incomplete input, generate() reports the error
+
+    def canonical_url(self, url: str, upper_path: bool) -> str:
+        """
+        Returns the canonical form of a URL and shows how many bits and versions it saves.
+        qrengine.urls is only imported once the option is turned on.
+        """
+        import qrengine.urls
+        if not url:
+            return url
+        report = qrengine.urls.report(url, upper_path, self.encode_options())
+        st.caption(f"Encodes {report.message()}")
+        return report.after
+
+    def short_link(self, url: str, store: bool = True) -> str:
+        """
+        Returns the short link of a URL and shows it. The URL is only stored when the code is generated;
+        before that the preview shows a placeholder code of the same length, as the stored code is random.
+        Anything but an http or https URL is returned unchanged.
+        """
+        import qrengine.shortlinks
+        if not qrengine.shortlinks.shortenable(url):
+            if url:
+                st.caption("Only http and https links can be shortened")
+            return url
+        code = link_store().shorten(url) if store else link_store().peek(url)
+        short_url = link_store().short_url(code)
+        if not store:
+            st.caption(f"Encodes a short URL like {short_url}, which redirects to the link")
+        return short_url
 
     def wifi_exp(self):
         """
@@ -189,16 +415,14 @@ class QRCodeGenerator:
         with st.expander("Wifi", expanded=True):
             ssid = st.text_input("SSID", placeholder="Enter SSID here")
             password = st.text_input("Password", placeholder="Enter password here")
+            input_data = {"SSID": ssid, "Password": password}
+            self.capacity_hint("Wifi", input_data)
             col1, col2 = st.columns(2)
             if col1.button("Show"):
                 st.session_state.show_wifi = True  # Update state
-                input_data = {"SSID": ssid, "Password": password}
-                qr_code = self.generate("Wifi", input_data)
-                self.display(qr_code)
+                self.display(self.generate("Wifi", input_data))
             if col2.button("Download"):
-                input_data = {"SSID": ssid, "Password": password}
-                data = self.generate("Wifi", input_data)
-                self.download(data)
+                self.download(self.generate("Wifi", input_data))
 
     def email_exp(self):
         """
@@ -208,16 +432,14 @@ class QRCodeGenerator:
             subject = st.text_input("Subject", placeholder="Enter subject here")
             body = st.text_area("Body", placeholder="Enter body here")
             to = st.text_input("To", placeholder="Enter to here")
+            input_data = {"Subject": subject, "Body": body, "To": to}
+            self.capacity_hint("Email", input_data)
             col1, col2 = st.columns(2)
             if col1.button("Show"):
                 st.session_state.show_email = True  # Update state
-                input_data = {"Subject": subject, "Body": body, "To": to}
-                qr_code = self.generate("Email", input_data)
-                self.display(qr_code)
+                self.display(self.generate("Email", input_data))
             if col2.button("Download"):
-                input_data = {"Subject": subject, "Body": body, "To": to}
-                data = self.generate("Email", input_data)
-                self.download(data)
+                self.download(self.generate("Email", input_data))
 
     def geo_exp(self):
         """
@@ -226,16 +448,14 @@ class QRCodeGenerator:
         with st.expander("Geo", expanded=True):
             lat = st.number_input("Latitude", min_value=-90.0, max_value=90.0, format="%.4f", placeholder="Enter latitude here")
             lng = st.number_input("Longitude", min_value=-180.0, max_value=180.0, format="%.4f", placeholder="Enter longitude here")
+            input_data = {"Latitude": lat, "Longitude": lng}
+            self.capacity_hint("Geo", input_data)
             col1, col2 = st.columns(2)
             if col1.button("Show"):
                 st.session_state.show_geo = True  # Update state
-                input_data = {"Latitude": lat, "Longitude": lng}
-                qr_code = self.generate("Geo", input_data)
-                self.display(qr_code)
+                self.display(self.generate("Geo", input_data))
             if col2.button("Download"):
-                input_data = {"Latitude": lat, "Longitude": lng}
-                data = self.generate("Geo", input_data)
-                self.download(data)       
+                self.download(self.generate("Geo", input_data))       
 
     def micro_exp(self):
         """
@@ -243,16 +463,14 @@ class QRCodeGenerator:
         """
         with st.expander("Micro", expanded=True):
             text = st.text_area("Enter your text here", placeholder="Enter text here")
+            input_data = {"Text": text}
+            self.capacity_hint("Micro", input_data)
             col1, col2 = st.columns(2)
             if col1.button("Show"):
                 st.session_state.show_micro = True  # Update state
-                input_data = {"Text": text}
-                qr_code = self.generate("Micro", input_data)
-                self.display(qr_code)
+                self.display(self.generate("Micro", input_data))
             if col2.button("Download"):
-                input_data = {"Text": text}
-                data = self.generate("Micro", input_data)
-                self.download(data)
+                self.download(self.generate("Micro", input_data))
 
     def barcode_exp(self):
         """
@@ -261,124 +479,75 @@ class QRCodeGenerator:
         with st.expander("Barcode", expanded=True):
             type = st.selectbox("Select a type", ["code128", "ean13", "ean8", "upc", "isbn10", "isbn13", "pzn", "itf", "codabar", "qr"])
             number = st.text_input("Enter a number", placeholder="Enter a number here")
+            input_data = {"Type": type, "Number": number}
             col1, col2 = st.columns(2)
             if col1.button("Show"):
                 st.session_state.show_barcode = True  # Update state
-                input_data = {"Type": type, "Number": number}
-                brcd = self.generate("Barcode", input_data)
-                self.display(brcd)
+                self.display(self.generate("Barcode", input_data))
             if col2.button("Download"):
-                input_data = {"Type": type, "Number": number}
-                data = self.generate("Barcode", input_data)
-                self.download(data)
-    
-    def text_link_qr(self, content: dict):
-        """
-        Creates a QR code for text or link.
-
-        Args:
-            content (dict): QR code content.
-
-        Returns:
-            segno.QRCode: The created QR code object.
-        """
-        qr = segno.make_qr(content["Content"])
-        return qr
-
-    def vcard_qr(self, vcard: dict):
-        """
-        Creates a QR code for VCard information.
-
-        Args:
-            vcard (dict): VCard information.
-
-        Returns:
-            segno.QRCode: The created QR code object.
-        """
-        qr = segno.helpers.make_vcard(
-            name=vcard["Name"],
-            displayname=vcard["Displayname"],
-            email=vcard["Email"],
-            phone=vcard["Phone"],
-            memo=vcard["Memo"],
-            birthday=vcard["Birthday"],
-            url=vcard["URL"],
-            pobox=vcard["Pobox"],
-            street=vcard["Street"],
-            city=vcard["City"],
-            region=vcard["Region"],
-            zipcode=vcard["Zipcode"],
-            country=vcard["Country"],
-            org=vcard["Org"],
-            title=vcard["Title"],
-            photo_uri=vcard["Photo_Uri"]
-        )
-        return qr
-
-    def wifi_qr(self, wifi: dict):
-        """
-        Creates a QR code for Wifi network.
-
-        Args:
-            wifi (dict): Wifi information.
-
-        Returns:
-            segno.QRCode: The created QR code object.
-        """
-        qr = segno.helpers.make_wifi(ssid=wifi["SSID"], password=wifi["Password"])
-        return qr
-        
-    def email_qr(self, email: dict):
-        """
-        Creates a QR code for Email information.
-
-        Args:
-            email (dict): Email information.
-
-        Returns:
-            segno.QRCode: The created QR code object.
-        """
-        qr = segno.helpers.make_email(email["Subject"], email["Body"], email["To"])
-        return qr
-        
-    def geo_qr(self, geo: dict):
-        """
-        Creates a QR code for geographical location.
+                self.download(self.generate("Barcode", input_data))
 
-        Args:
-            geo (dict): Geographical location information.
-
-        Returns:
-            segno.QRCode: The created QR code object.
+    def batch_exp(self):
         """
-        qr = segno.helpers.make_geo(geo["Latitude"], geo["Longitude"])
-        return qr
-
-    def micro_qr(self, content: dict):
+        Interface for generating many codes from a CSV or JSONL file.
         """
-        Creates a Micro QR code.
+        with st.expander("Batch", expanded=True):
+            st.write("One row per code: the `type` column names the code type (Text, Link, VCard, Wifi, "
+                     "Email, Geo, Micro, Barcode) and the other columns are its fields, "
+                     "e.g. `type,Content` or `type,SSID,Password`.")
+            upload = st.file_uploader("Upload a CSV or JSONL file", type=["csv", "jsonl", "json"])
+            if upload is not None and st.button("Generate"):
+                st.session_state.show_batch = True  # Update state
+                self.batch(upload)
 
-        Args:
-            content (dict): Micro QR code content.
-
-        Returns:
-            segno.QRCode: The created micro QR code object.
+    def batch(self, upload):
         """
-        qr = segno.make_micro(content["Text"])
-        return qr
-
-    def barcode_(self, brcode: dict):
-        """
-        Creates a barcode.
+        Renders every row of the uploaded file in a worker pool and offers the codes as a ZIP.
+        Rows are parsed as the pool takes them and codes are streamed into a temporary archive
+        on disk as they finish, so memory stays flat while the batch renders. Streamlit has no
+        streaming downloads, though: st.download_button reads the finished archive into memory
+        and keeps it there for the session, so the largest batch is bounded by the ZIP size.
+        For larger batches use `python -m qrengine batch` or POST /batch of the generation server.
+        The progress bar follows the position in the upload, as the number of rows is not known
+        in advance. The batch modules are imported only when a batch is run.
 
         Args:
-            brcode (dict): Barcode information.
-
-        Returns:
-            barcode.barcode.Barcode: The created barcode object.
-        """
-        brcd = barcode.get_barcode(name=brcode["Type"], code=brcode["Number"], writer=barcode.writer.ImageWriter())
-        return brcd
+            upload: The uploaded CSV or JSONL file.
+        """
+        import qrengine.archive
+        import qrengine.batch
+
+        fmt = qrengine.batch.detect_format(upload.name)
+        stream = io.TextIOWrapper(upload, encoding="utf-8-sig", newline="")  # Kept referenced, closes the upload when collected
+        rows = qrengine.batch.read_rows(stream, fmt)
+        first = next(rows, None)
+        if first is None:
+            st.write("The uploaded file contains no rows.")
+            return
+        rows = itertools.chain([first], rows)
+        opts = qrengine.RenderOptions(size=PNG_SIZE, max_pixels=PNG_MAX_PIXELS)
+        progress = st.progress(0.0, text="0 rows")
+        errors = []
+        done = 0
+        # Closed before it is reopened by name, which Windows does not allow for an open temporary file
+        spool = tempfile.NamedTemporaryFile(suffix=".zip", delete=False)
+        try:
+            with spool, qrengine.archive.ZipStream(spool) as archive:
+                results = qrengine.batch.run_batch(rows, opts, encode_opts=self.encode_options())
+                for done, result in enumerate(results, start=1):
+                    if result.error is None:
+                        archive.add(result.name, result.data)
+                    else:
+                        errors.append((result.index, result.error))
+                    progress.progress(min(upload.tell() / max(upload.size, 1), 1.0), text=f"{done} rows")
+            progress.progress(1.0, text=f"{done} rows")
+            if errors:
+                st.write(f"{len(errors)} of {done} rows could not be generated:")
+                st.text("\n".join(f"Row {index + 1}: {error}" for index, error in sorted(errors)))
+            with open(spool.name, "rb") as zip_file:
+                st.download_button("Download ZIP", zip_file, file_name="codes.zip", mime="application/zip")
+        finally:
+            os.remove(spool.name)
 
 # Start QRCodeGenerator class
 QRCodeGenerator()
@@ -0,0 +1,14 @@
+"""
+Headless QR code and barcode generation engine.
+
+Shared by the WEB (Streamlit) and Desktop (PyQt5) front ends. Imports neither
+Streamlit nor PyQt5, so batch workers and API processes can use it directly.
+"""
+from .cache import RenderCache
+from .capacity import CapacityError, Estimate, estimate
+from .core import KINDS, EncodeOptions, RenderOptions, generate, make_code, render, write
+from .result import GeneratedCode
+from .timing import Timing, TimingLog
+
+__all__ = ["KINDS", "CapacityError", "EncodeOptions", "Estimate", "GeneratedCode", "RenderCache", "RenderOptions",
+           "Timing", "TimingLog", "estimate", "generate", "make_code", "render", "write"]
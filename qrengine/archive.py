@@ -0,0 +1,103 @@
+"""
+Streaming ZIP writer for batch output.
+
+Each rendered code is appended to the archive as soon as it is available and
+never kept afterwards, so memory stays flat regardless of the batch size. The
+target may be a file, a socket or any other object with a write() method; it does
+not need to be seekable. PNG files are already deflate-compressed and are stored
+as-is (ZIP_STORED) instead of being compressed a second time.
+"""
+import zipfile
+
+STORED_EXTENSIONS = (".png",)
+
+
+class ZipStream:
+    """
+    Appends files to a ZIP archive written to a file or a (possibly unseekable) stream.
+    Usable as a context manager; the central directory is written on close().
+    """
+
+    def __init__(self, out):
+        """
+        Args:
+            out: File path or binary file object with a write() method.
+        """
+        self.archive = zipfile.ZipFile(out, "w")
+        self.count = 0
+
+    def add(self, name: str, data: bytes):
+        """
+        Writes one file into the archive.
+
+        Args:
+            name (str): File name inside the archive.
+            data (bytes): File content.
+        """
+        stored = name.lower().endswith(STORED_EXTENSIONS)
+        self.archive.writestr(name, data, compress_type=zipfile.ZIP_STORED if stored else zipfile.ZIP_DEFLATED)
+        self.count += 1
+
+    def close(self):
+        """
+        Writes the central directory.
+        """
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ChunkSink:
+    """
+    Write-only stream that collects written bytes until they are taken.
+    """
+
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        """
+        Returns and forgets everything written since the last call.
+        """
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def iter_zip(results, errors: list | None = None, errors_name: str | None = None):
+    """
+    Yields a ZIP archive of batch results piece by piece, e.g. for a chunked HTTP response.
+
+    Args:
+        results: Iterable of qrengine.batch.BatchResult.
+        errors (list | None): If given, (index, error) tuples of failed rows are appended to it.
+        errors_name (str | None): If given and rows failed, a text file of that name listing
+            the failures is added at the end of the archive.
+
+    Yields:
+        bytes: Consecutive pieces of the archive.
+    """
+    failed = [] if errors is None else errors
+    sink = ChunkSink()
+    with ZipStream(sink) as archive:
+        for result in results:
+            if result.error is None:
+                archive.add(result.name, result.data)
+                yield sink.take()
+            else:
+                failed.append((result.index, result.error))
+        if failed and errors_name:
+            report = "".join(f"Row {index + 1}: {error}\n" for index, error in sorted(failed))
+            archive.add(errors_name, report.encode("utf-8"))
+    yield sink.take()
@@ -0,0 +1,261 @@
+"""
+Batch generation: rows of a CSV or JSONL file in, rendered codes out.
+
+Every row carries a `type` column naming the code type (Text, Link, VCard, Wifi,
+Email, Geo, Micro, Barcode); all other columns are the payload keys used by the
+front ends, e.g. Content, SSID/Password or Type/Number for barcodes. Rows that
+cannot fit into a QR code are rejected by the capacity pre-check before they
+reach the worker pool. Lines that are not rows at all (invalid JSON, undecodable
+bytes) fail as rows too, so one bad line does not end the batch.
+"""
+import csv
+import datetime
+import itertools
+import json
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+
+from .capacity import check
+from .core import KINDS, EncodeOptions, RenderOptions, generate
+
+FLOAT_FIELDS = ("Latitude", "Longitude")
+DATE_FIELDS = ("Birthday",)
+
+
+@dataclass
+class BatchResult:
+    """
+    Outcome of a single batch row.
+
+    Attributes:
+        index (int): Zero-based row number in the input.
+        name (str): File name for the rendered code.
+        data (bytes | None): Rendered output, None if the row failed.
+        error (str | None): Error message if the row failed.
+    """
+    index: int
+    name: str
+    data: bytes | None = None
+    error: str | None = None
+
+
+class InvalidRow(dict):
+    """
+    Stand-in yielded by read_rows for a line that cannot be read; parse_row raises its error.
+
+    Attributes:
+        error (Exception): Why the line could not be read.
+    """
+
+    def __init__(self, error: Exception):
+        super().__init__()
+        self.error = error
+
+
+def detect_format(filename: str) -> str:
+    """
+    Returns "jsonl" for .jsonl/.json files and "csv" otherwise.
+    """
+    return "jsonl" if filename.lower().endswith((".jsonl", ".json")) else "csv"
+
+
+def read_rows(stream, fmt: str = "csv"):
+    """
+    Lazily reads rows from a text stream.
+
+    Args:
+        stream: Text file object.
+        fmt (str): "csv" (with a header line) or "jsonl" (one JSON object per line).
+
+    Yields:
+        dict: One row, or an InvalidRow for a line that is not valid JSON or not an object.
+            A stream that cannot be decoded any further ends with an InvalidRow.
+    """
+    try:
+        if fmt == "jsonl":
+            for line in stream:
+                if not line.strip():
+                    continue
+                try:
+                    row = json.loads(line.strip())
+                except json.JSONDecodeError as e:
+                    yield InvalidRow(e)
+                    continue
+                if not isinstance(row, dict):
+                    row = InvalidRow(ValueError(f"Expected a JSON object, got {line.strip()[:40]!r}"))
+                yield row
+        else:
+            yield from csv.DictReader(stream)
+    except (UnicodeDecodeError, csv.Error) as e:
+        yield InvalidRow(e)
+
+
+def parse_row(row: dict) -> tuple[str, dict]:
+    """
+    Splits a row into the code type and the payload dictionary.
+
+    Args:
+        row (dict): Row with a `type` column.
+
+    Returns:
+        tuple[str, dict]: Code type and payload.
+    """
+    if isinstance(row, InvalidRow):
+        raise row.error
+    payload = dict(row)
+    kind = str(payload.pop("type", "")).strip()
+    matches = [k for k in KINDS if k.lower() == kind.lower()]
+    if not matches:
+        raise ValueError(f"Unknown code type: {kind!r}")
+    for field in FLOAT_FIELDS + DATE_FIELDS:
+        # Mixed-type CSV files leave the columns of other types empty
+        if payload.get(field) == "":
+            del payload[field]
+    for field in FLOAT_FIELDS:
+        if isinstance(payload.get(field), str):
+            payload[field] = float(payload[field])
+    for field in DATE_FIELDS:
+        if isinstance(payload.get(field), str):
+            payload[field] = datetime.date.fromisoformat(payload[field])
+    return matches[0], payload
+
+
+def canonical_links(rows, upper_path: bool = False):
+    """
+    Lazily rewrites the Content of Link rows into canonical URL form (see qrengine.urls).
+
+    Args:
+        rows: Iterable of row dictionaries.
+        upper_path (bool): Also uppercase the paths.
+
+    Yields:
+        dict: One row.
+    """
+    from .urls import canonicalize
+    for row in rows:
+        if str(row.get("type", "")).strip().lower() == "link" and row.get("Content"):
+            row = {**row, "Content": canonicalize(str(row["Content"]), upper_path)}
+        yield row
+
+
+def short_links(rows, store, chunk_size: int = 10_000):
+    """
+    Lazily stores the http and https URLs of Link rows in a LinkStore and rewrites them into short links.
+    Rows are read in chunks, so every chunk is stored in one transaction.
+
+    Args:
+        rows: Iterable of row dictionaries.
+        store (LinkStore): Store of the short links.
+        chunk_size (int): Rows per transaction.
+
+    Yields:
+        dict: One row.
+    """
+    from .shortlinks import shortenable
+    rows = iter(rows)
+    while chunk := list(itertools.islice(rows, chunk_size)):
+        links = [i for i, row in enumerate(chunk)
+                 if str(row.get("type", "")).strip().lower() == "link" and shortenable(str(row.get("Content") or ""))]
+        codes = store.add_many([str(chunk[i]["Content"]) for i in links], chunk_size)
+        for i, code in zip(links, codes):
+            chunk[i] = {**chunk[i], "Content": store.short_url(code)}
+        yield from chunk
+
+
+def row_name(index: int, kind: str | None, render_opts: RenderOptions) -> str:
+    """
+    Returns the file name of a row's output, e.g. 000001_text.png.
+    """
+    if kind is None:
+        return f"{index + 1:06d}.{render_opts.output}"
+    return f"{index + 1:06d}_{kind.lower()}.{render_opts.output}"
+
+
+def reject_row(index: int, row: dict, render_opts: RenderOptions,
+               encode_opts: EncodeOptions | None = None) -> BatchResult | None:
+    """
+    Checks a row without encoding it: the type must be known and the payload must fit.
+
+    Args:
+        index (int): Zero-based row number.
+        row (dict): Row with a `type` column.
+        render_opts (RenderOptions): Output options.
+        encode_opts (EncodeOptions | None): Encoding options shared by all rows.
+
+    Returns:
+        BatchResult | None: The error result, or None if the row should be generated.
+    """
+    kind = None
+    try:
+        kind, payload = parse_row(row)
+        check(kind, payload, encode_opts)
+    except Exception as e:
+        return BatchResult(index, row_name(index, kind, render_opts), error=f"{type(e).__name__}: {e}")
+    return None
+
+
+def render_row(index: int, row: dict, render_opts: RenderOptions,
+               encode_opts: EncodeOptions | None = None) -> BatchResult:
+    """
+    Generates one row; errors are returned in the result instead of raised.
+
+    Args:
+        index (int): Zero-based row number.
+        row (dict): Row with a `type` column.
+        render_opts (RenderOptions): Output options.
+        encode_opts (EncodeOptions | None): Encoding options shared by all rows.
+
+    Returns:
+        BatchResult: The rendered code or the error.
+    """
+    name = row_name(index, None, render_opts)
+    try:
+        kind, payload = parse_row(row)
+        name = row_name(index, kind, render_opts)
+        return BatchResult(index, name, data=generate(kind, payload, render_opts, encode_opts))
+    except Exception as e:
+        return BatchResult(index, name, error=f"{type(e).__name__}: {e}")
+
+
+def run_batch(rows, render_opts: RenderOptions | None = None, workers: int | None = None, executor=None,
+              encode_opts: EncodeOptions | None = None):
+    """
+    Renders rows in a worker pool.
+
+    At most a few jobs per worker are in flight at any time, so the input is
+    consumed lazily and results are yielded as soon as they are finished. Rows
+    that fail the capacity pre-check are answered without a round trip to the pool.
+
+    Args:
+        rows: Iterable of row dictionaries.
+        render_opts (RenderOptions | None): Output options, defaults to PNG.
+        workers (int | None): Pool size, defaults to the number of CPU cores.
+        executor: Existing concurrent.futures executor to use instead of a new process pool.
+        encode_opts (EncodeOptions | None): Pinned version, error level or mask for all rows.
+
+    Yields:
+        BatchResult: Results in completion order.
+    """
+    opts = render_opts or RenderOptions()
+    workers = workers or os.cpu_count() or 1
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        pending = set()
+        for index, row in enumerate(rows):
+            rejected = reject_row(index, row, opts, encode_opts)
+            if rejected is not None:
+                yield rejected
+                continue
+            pending.add(executor.submit(render_row, index, row, opts, encode_opts))
+            if len(pending) >= workers * 4:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in wait(pending).done:
+            yield future.result()
+    finally:
+        if own_executor:
+            executor.shutdown(cancel_futures=True)
@@ -0,0 +1,349 @@
+"""
+Benchmark harness of the generation pipeline.
+
+Every code type of the front ends, including each barcode symbology offered on
+the Barcode page, is timed over several payload sizes, scales and outputs. Each
+case is split into three stages:
+
+    encode     payload -> symbol (qrengine.make_code, including segno's mask selection)
+    rasterize  symbol -> pixel rows (packed PNG scanlines for QR codes, build() for barcodes)
+    serialize  pixel rows -> output (PNG compression, SVG text, matrix tuple)
+
+Results are written as JSON. A results file doubles as a baseline: a later run
+compared against it reports every case whose median stage time grew by more
+than the threshold. With --encode-modes the encode stage of every QR code
+payload is also timed with pinned EncodeOptions, showing the time saved per code.
+
+Usage:
+    python -m qrengine bench -o baseline.json
+    python -m qrengine bench --baseline baseline.json --threshold 0.25
+    python -m qrengine bench --kinds Text Link --encode-modes
+"""
+import datetime
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+
+from . import payloads
+from .core import OUTPUTS, EncodeOptions, RenderOptions, make_code, pixel_scale, render
+from .pngstream import iter_png, packed_lines
+
+SCALES = (1, 10, 40)
+STAGES = ("encode", "rasterize", "serialize")
+THRESHOLD = 0.2  # Allowed relative slowdown of a stage before it counts as a regression
+NOISE_MS = 0.05  # Absolute differences below this are timer noise, never a regression
+
+# Symbologies of the Barcode page; its "qr" entry is not a python-barcode symbology
+BARCODES = {
+    "code128": "ABC-12345",
+    "ean13": "590123412345",
+    "ean8": "9638507",
+    "upc": "04210000526",
+    "isbn10": "3-12-517154",
+    "isbn13": "978-3-16-148410",
+    "pzn": "123456",
+    "itf": "12345678",
+    "codabar": "A12345B",
+}
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    A single benchmark case.
+
+    Attributes:
+        kind (str): Code type, one of qrengine.KINDS.
+        size (str): Label of the payload size.
+        payload (dict): The content of the code.
+        output (str): One of qrengine.core.OUTPUTS.
+        scale (int | None): Module size in pixels, None where it does not apply.
+    """
+    kind: str
+    size: str
+    payload: dict
+    output: str
+    scale: int | None = None
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the key of the case in the results, e.g. "Text/large/png@10".
+        """
+        name = f"{self.kind}/{self.size}/{self.output}"
+        return name if self.scale is None else f"{name}@{self.scale}"
+
+
+def qr_payloads() -> list[tuple[str, str, dict]]:
+    """
+    Returns (kind, size, payload) for every QR code type and payload size.
+    """
+    vcard = {"Name": "Doe;John", "Displayname": "John Doe"}
+    full_vcard = dict(vcard, Email="john.doe@example.com", Phone="+1 555 0100", Cellphone="+1 555 0101",
+                      URL="https://example.com/john", Street="1 Main Street", City="Springfield",
+                      Zipcode="12345", Country="USA", Org="Example Inc.", Title="Engineer",
+                      Birthday=datetime.date(1990, 1, 2))
+    return [
+        ("Text", "small", {"Content": "Hello, world!"}),
+        ("Text", "medium", {"Content": "Lorem ipsum dolor sit amet. " * 10}),
+        ("Text", "large", {"Content": "Lorem ipsum dolor sit amet. " * 80}),
+        ("Link", "small", {"Content": "https://example.com"}),
+        ("Link", "medium", {"Content": "https://example.com/articles/2024/benchmark?utm_source=qr&id=" + "7" * 60}),
+        ("Link", "large", {"Content": "https://example.com/?q=" + "a1b2c3d4" * 120}),
+        ("VCard", "small", vcard),
+        ("VCard", "large", full_vcard),
+        ("Wifi", "small", {"SSID": "Office", "Password": "secret", "Security": "WPA"}),
+        ("Wifi", "large", {"SSID": "Guest network 5 GHz", "Password": "x7!Kp2#qLm9$Zt4&" * 4, "Security": "WPA"}),
+        ("Email", "small", {"To": "jane@example.com", "Subject": "Hi", "Body": "See you"}),
+        ("Email", "large", {"To": "jane@example.com", "Subject": "Quarterly report",
+                            "Body": "Please find the numbers below. " * 30}),
+        ("Geo", "small", {"Latitude": 52.520008, "Longitude": 13.404954}),
+        ("Micro", "small", {"Text": "12345"}),
+        ("Micro", "large", {"Text": "HELLO WORLD 123"}),
+    ]
+
+
+def build_cases(kinds=None) -> list[Case]:
+    """
+    Returns all benchmark cases, optionally restricted to some code types.
+
+    Args:
+        kinds: Iterable of code types to keep, None for all.
+
+    Returns:
+        list[Case]: QR code cases for every scale of PNG and SVG plus the matrix,
+        and one case per output for every barcode symbology.
+    """
+    cases = []
+    for kind, size, payload in qr_payloads():
+        for output in ("png", "svg"):
+            cases.extend(Case(kind, size, payload, output, scale) for scale in SCALES)
+        cases.append(Case(kind, size, payload, "matrix"))
+    for symbology, number in BARCODES.items():
+        cases.extend(Case("Barcode", symbology, {"Type": symbology, "Number": number}, output) for output in OUTPUTS)
+    if kinds is not None:
+        kinds = set(kinds)
+        cases = [case for case in cases if case.kind in kinds]
+    return cases
+
+
+def run_stages(case: Case) -> tuple[dict, int]:
+    """
+    Runs a case once.
+
+    Returns:
+        tuple[dict, int]: Seconds spent per stage and the size of the output (bytes,
+        or modules for the matrix). Stages that do not apply to a case are missing.
+    """
+    timings = {}
+    start = time.perf_counter()
+    code = make_code(case.kind, case.payload)
+    timings["encode"] = time.perf_counter() - start
+    opts = RenderOptions(output=case.output, scale=case.scale or 1)
+    if payloads.is_qrcode(code) and case.output == "png":
+        scale = pixel_scale(code, opts)
+        start = time.perf_counter()
+        lines = list(packed_lines(code, scale))
+        timings["rasterize"] = time.perf_counter() - start
+        width, height = code.symbol_size(scale=scale)
+        start = time.perf_counter()
+        output = b"".join(iter_png(lines, width, height, scale))
+        timings["serialize"] = time.perf_counter() - start
+    elif not payloads.is_qrcode(code):
+        start = time.perf_counter()
+        rows = code.build()
+        timings["rasterize"] = time.perf_counter() - start
+        start = time.perf_counter()
+        if case.output == "matrix":
+            output = tuple(tuple(int(module) for module in line) for line in rows)
+        else:
+            # python-barcode's writers build the symbol again, so this includes a second build()
+            output = render(code, opts)
+        timings["serialize"] = time.perf_counter() - start
+    else:
+        # segno writes SVG and the matrix straight from its module matrix
+        start = time.perf_counter()
+        output = render(code, opts)
+        timings["serialize"] = time.perf_counter() - start
+    size = len(output) if isinstance(output, bytes) else sum(len(row) for row in output)
+    return timings, size
+
+
+def measure(case: Case, repeat: int = 5) -> dict:
+    """
+    Runs a case repeat times after one warm-up run.
+
+    Returns:
+        dict: Median milliseconds per stage (and in total) and the output size.
+    """
+    run_stages(case)
+    runs = [run_stages(case) for _ in range(repeat)]
+    result = {"kind": case.kind, "size": case.size, "output": case.output, "scale": case.scale,
+              "bytes": runs[0][1]}
+    for stage in STAGES:
+        if stage in runs[0][0]:
+            result[f"{stage}_ms"] = round(statistics.median(r[0][stage] for r in runs) * 1000, 4)
+    result["total_ms"] = round(statistics.median(sum(r[0].values()) for r in runs) * 1000, 4)
+    return result
+
+
+def median_ms(func, repeat: int) -> float:
+    """
+    Returns the median milliseconds of repeat calls of func after one warm-up call.
+    """
+    func()
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        durations.append(time.perf_counter() - start)
+    return round(statistics.median(durations) * 1000, 4)
+
+
+def encode_modes(kinds=None, repeat: int = 5) -> dict:
+    """
+    Times the encode stage of every QR code payload with and without pinned EncodeOptions.
+
+    Modes:
+        auto    segno searches the version, error level and mask (the default)
+        fast    EncodeOptions(fast=True): fixed mask, version still searched
+        pinned  version, error level and mask pinned to what auto picked, i.e. the same symbol
+
+    Returns:
+        dict: {"Kind/size": {"designator", "auto_ms", "fast_ms", "pinned_ms", "fast_saved_ms", "pinned_saved_ms"}}
+    """
+    results = {}
+    for kind, size, payload in qr_payloads():
+        if kinds is not None and kind not in kinds:
+            continue
+        code = make_code(kind, payload)
+        modes = {"auto": None, "fast": EncodeOptions(fast=True),
+                 "pinned": EncodeOptions(error=code.error, version=code.version, mask=code.mask)}
+        result = {"designator": code.designator}
+        for mode, opts in modes.items():
+            result[f"{mode}_ms"] = median_ms(lambda: make_code(kind, payload, opts), repeat)
+        for mode in ("fast", "pinned"):
+            result[f"{mode}_saved_ms"] = round(result["auto_ms"] - result[f"{mode}_ms"], 4)
+        results[f"{kind}/{size}"] = result
+    return results
+
+
+def environment() -> dict:
+    """
+    Returns the facts needed to tell whether two result files are comparable.
+    """
+    from importlib.metadata import PackageNotFoundError, version
+
+    versions = {}
+    for package in ("segno", "python-barcode", "Pillow", "numpy"):
+        try:
+            versions[package] = version(package)
+        except PackageNotFoundError:
+            versions[package] = None
+    return {"created": datetime.datetime.now().isoformat(timespec="seconds"), "python": platform.python_version(),
+            "platform": platform.platform(), "machine": platform.machine(), "packages": versions}
+
+
+def run(cases, repeat: int = 5, progress=None) -> dict:
+    """
+    Measures all cases.
+
+    Args:
+        cases: Iterable of Case.
+        repeat (int): Timed runs per case.
+        progress: Optional callable receiving each case name before it runs.
+
+    Returns:
+        dict: {"environment": ..., "repeat": repeat, "results": {case name: measurement}}
+    """
+    results = {}
+    for case in cases:
+        if progress is not None:
+            progress(case.name)
+        results[case.name] = measure(case, repeat)
+    return {"environment": environment(), "repeat": repeat, "results": results}
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD, noise_ms: float = NOISE_MS) -> list[dict]:
+    """
+    Compares two results files stage by stage.
+
+    A stage regresses when it became more than threshold slower relative to the
+    baseline and the difference is larger than noise_ms. Cases missing from
+    either file are skipped.
+
+    Args:
+        current (dict): Output of run().
+        baseline (dict): Output of an earlier run().
+        threshold (float): Allowed relative slowdown, 0.2 = 20 %.
+        noise_ms (float): Smallest difference in milliseconds that can count as a regression.
+
+    Returns:
+        list[dict]: One entry per compared case and stage with the baseline and
+        current median, their ratio and whether it is a regression.
+    """
+    rows = []
+    for name, result in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        for key in [f"{stage}_ms" for stage in STAGES] + ["total_ms"]:
+            if key not in result or key not in before:
+                continue
+            old, new = before[key], result[key]
+            ratio = new / old if old else float("inf")
+            rows.append({"case": name, "stage": key[:-3], "baseline_ms": old, "current_ms": new,
+                         "ratio": round(ratio, 3), "regression": ratio > 1 + threshold and new - old > noise_ms})
+    return rows
+
+
+def print_summary(results: dict, out=sys.stdout) -> None:
+    """
+    Prints one line per case with the median stage times.
+    """
+    print(f"{'case':<34}{'encode':>10}{'raster':>10}{'serial':>10}{'total':>10}{'bytes':>10}", file=out)
+    for name, result in results["results"].items():
+        stages = "".join(f"{result.get(f'{stage}_ms', 0):>10.3f}" for stage in STAGES)
+        print(f"{name:<34}{stages}{result['total_ms']:>10.3f}{result['bytes']:>10}", file=out)
+    if "encode_modes" in results:
+        print(f"\n{'encode':<24}{'symbol':>8}{'auto':>10}{'fast':>10}{'pinned':>10}{'saved':>10}", file=out)
+        for name, result in results["encode_modes"].items():
+            print(f"{name:<24}{result['designator']:>8}{result['auto_ms']:>10.3f}{result['fast_ms']:>10.3f}"
+                  f"{result['pinned_ms']:>10.3f}{result['pinned_saved_ms'] / result['auto_ms']:>10.0%}", file=out)
+
+
+def main(args) -> int:
+    """
+    Runs the bench subcommand: measures, writes the JSON results and compares them against a baseline.
+
+    Returns:
+        int: 1 if any stage regressed against the baseline, 0 otherwise.
+    """
+    progress = None
+    if sys.stderr.isatty():
+        def progress(name):
+            print(f"\r{name:<40}", end="", file=sys.stderr, flush=True)
+    results = run(build_cases(args.kinds), repeat=args.repeat, progress=progress)
+    if progress is not None:
+        print("\r" + " " * 40 + "\r", end="", file=sys.stderr)
+    if args.encode_modes:
+        results["encode_modes"] = encode_modes(args.kinds, repeat=args.repeat)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=1)
+    print_summary(results)
+    if not args.baseline:
+        return 0
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    rows = compare(results, baseline, threshold=args.threshold)
+    regressions = [row for row in rows if row["regression"]]
+    for row in regressions:
+        print(f"REGRESSION {row['case']} {row['stage']}: {row['baseline_ms']:.3f} ms -> "
+              f"{row['current_ms']:.3f} ms (x{row['ratio']})")
+    print(f"{len(rows)} stages compared against {args.baseline}, {len(regressions)} regressions "
+          f"(threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
@@ -0,0 +1,106 @@
+"""
+Content-addressed render cache with LRU eviction bounded by total bytes.
+"""
+import dataclasses
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from .core import EncodeOptions, RenderOptions
+
+
+def cache_key(kind: str, payload: dict, render_opts: RenderOptions, encode_opts: EncodeOptions | None = None) -> str:
+    """
+    Returns a normalized hash of the code type, payload, render and encoding options.
+
+    Payload keys are sorted and non-JSON values (e.g. dates) are converted with str(),
+    so equal inputs map to the same key regardless of dictionary order.
+
+    Args:
+        kind (str): One of qrengine.KINDS.
+        payload (dict): The content of the code.
+        render_opts (RenderOptions): Output options.
+        encode_opts (EncodeOptions | None): Encoding options, None for segno's choice.
+
+    Returns:
+        str: Hex digest.
+    """
+    key = [kind, payload, dataclasses.asdict(render_opts)]
+    if encode_opts is not None and encode_opts != EncodeOptions():
+        key.append(dataclasses.asdict(encode_opts))
+    normalized = json.dumps(key, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def output_size(output: bytes | tuple) -> int:
+    """
+    Returns the approximate number of bytes held by a rendered output.
+    """
+    if isinstance(output, bytes):
+        return len(output)
+    return sum(len(row) for row in output)
+
+
+class RenderCache:
+    """
+    Thread-safe LRU cache of rendered outputs, bounded by the total size of the stored values.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            max_bytes (int): Upper bound for the sum of all cached output sizes.
+        """
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str):
+        """
+        Returns the cached output for key or None, marking it as recently used.
+        """
+        with self._lock:
+            output = self._entries.get(key)
+            if output is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return output
+
+    def put(self, key: str, output: bytes | tuple):
+        """
+        Stores an output and evicts least recently used entries until the byte budget holds.
+        Outputs larger than the whole budget are not stored.
+        """
+        size = output_size(output)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.size -= output_size(previous)
+            self._entries[key] = output
+            self.size += size
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= output_size(evicted)
+
+    def stats(self) -> dict:
+        """
+        Returns hit/miss counters and the current fill level.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "entries": len(self._entries),
+                "bytes": self.size,
+                "max_bytes": self.max_bytes,
+            }
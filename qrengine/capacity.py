@@ -0,0 +1,263 @@
+"""
+Capacity pre-check: estimates the symbol a payload needs without encoding it.
+
+The tables below hold the data capacity in bits of every version and error
+level (ISO/IEC 18004, as used by segno) and the length of the character count
+indicator per mode. estimate() determines the mode and the encoded length of the
+content in a single pass and looks the smallest fitting version up in the
+tables. This follows segno's rules (one segment, ISO-8859-1 before Shift_JIS
+before UTF-8 unless a charset is given, error level boosted within the chosen
+version), so a payload that
+"won't fit" can be rejected, and the version it will get shown, before any work
+is done.
+"""
+from dataclasses import dataclass
+
+from .charsets import DEFAULT, ECI_BITS, UTF8, Charset, choose, is_kanji
+from .core import ERRORS, EncodeOptions
+from .payloads import CHARSET_KINDS, qr_content
+
+# Data bits per version for error levels L, M, Q, H
+DATA_BITS = {
+    1: (152, 128, 104, 72), 2: (272, 224, 176, 128), 3: (440, 352, 272, 208),
+    4: (640, 512, 384, 288), 5: (864, 688, 496, 368), 6: (1088, 864, 608, 480),
+    7: (1248, 992, 704, 528), 8: (1552, 1232, 880, 688), 9: (1856, 1456, 1056, 800),
+    10: (2192, 1728, 1232, 976), 11: (2592, 2032, 1440, 1120), 12: (2960, 2320, 1648, 1264),
+    13: (3424, 2672, 1952, 1440), 14: (3688, 2920, 2088, 1576), 15: (4184, 3320, 2360, 1784),
+    16: (4712, 3624, 2600, 2024), 17: (5176, 4056, 2936, 2264), 18: (5768, 4504, 3176, 2504),
+    19: (6360, 5016, 3560, 2728), 20: (6888, 5352, 3880, 3080), 21: (7456, 5712, 4096, 3248),
+    22: (8048, 6256, 4544, 3536), 23: (8752, 6880, 4912, 3712), 24: (9392, 7312, 5312, 4112),
+    25: (10208, 8000, 5744, 4304), 26: (10960, 8496, 6032, 4768), 27: (11744, 9024, 6464, 5024),
+    28: (12248, 9544, 6968, 5288), 29: (13048, 10136, 7288, 5608), 30: (13880, 10984, 7880, 5960),
+    31: (14744, 11640, 8264, 6344), 32: (15640, 12328, 8920, 6760), 33: (16568, 13048, 9368, 7208),
+    34: (17528, 13800, 9848, 7688), 35: (18448, 14496, 10288, 7888), 36: (19472, 15312, 10832, 8432),
+    37: (20528, 15936, 11408, 8768), 38: (21616, 16816, 12016, 9136), 39: (22496, 17728, 12656, 9776),
+    40: (23648, 18672, 13328, 10208),
+}
+
+# Data bits of the Micro QR versions; M1 only detects errors
+MICRO_DATA_BITS = {
+    "M1": {None: 20},
+    "M2": {"L": 40, "M": 32},
+    "M3": {"L": 84, "M": 68},
+    "M4": {"L": 128, "M": 112, "Q": 80},
+}
+
+# Modes every Micro QR version can encode
+MICRO_MODES = {
+    "M1": ("numeric",),
+    "M2": ("numeric", "alphanumeric"),
+    "M3": ("numeric", "alphanumeric", "byte", "kanji"),
+    "M4": ("numeric", "alphanumeric", "byte", "kanji"),
+}
+
+# Character count indicator bits per mode for versions 1-9, 10-26, 27-40 and M1-M4
+COUNT_BITS = {
+    "numeric": ((10, 12, 14), {"M1": 3, "M2": 4, "M3": 5, "M4": 6}),
+    "alphanumeric": ((9, 11, 13), {"M2": 3, "M3": 4, "M4": 5}),
+    "byte": ((8, 16, 16), {"M3": 4, "M4": 5}),
+    "kanji": ((8, 10, 12), {"M3": 3, "M4": 4}),
+}
+
+ALPHANUMERIC = frozenset("0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:")
+ALPHANUMERIC_BYTES = frozenset(b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ $%*+-./:")
+
+
+class CapacityError(ValueError):
+    """
+    Raised by check() for a payload that does not fit into any allowed symbol.
+    """
+
+
+@dataclass(frozen=True)
+class Estimate:
+    """
+    The symbol a payload is expected to need.
+
+    Attributes:
+        designator (str | None): Version and error level as segno names it, e.g. "3-L",
+            "M2-M" or "M1"; None if the payload does not fit.
+        mode (str): numeric, alphanumeric, byte or kanji.
+        bits (int): Payload bits including mode and count indicators at that version
+            (at the largest version if it does not fit).
+        capacity (int): Data bits of that version and error level.
+        segments (int): Number of segments; more than one for mixed content split by qrengine.segments.
+        single (str | None): Designator of the same content as a single segment, set if it was split.
+    """
+    designator: str | None
+    mode: str
+    bits: int
+    capacity: int
+    segments: int = 1
+    single: str | None = None
+
+    @property
+    def fits(self) -> bool:
+        return self.designator is not None
+
+    def message(self) -> str:
+        """
+        Returns a short human readable verdict.
+        """
+        if self.fits and self.segments > 1:
+            single = f"version {self.single}" if self.single else "won't fit"
+            return (f"Will be version {self.designator} ({self.bits:,} of {self.capacity:,} bits, "
+                    f"{self.segments} segments; as one segment: {single})")
+        if self.fits:
+            return f"Will be version {self.designator} ({self.bits:,} of {self.capacity:,} bits, {self.mode} mode)"
+        return (f"Won't fit: needs {self.bits:,} bits in {self.mode} mode, "
+                f"the largest allowed symbol holds {self.capacity:,}")
+
+
+def analyze(content: str, encoding: str | None = None) -> tuple[str, int]:
+    """
+    Returns the mode segno picks for content and the number of characters it counts.
+
+    Args:
+        content (str): The encoded text.
+        encoding (str | None): Encoding passed to segno, None for ISO-8859-1, Shift_JIS or UTF-8.
+
+    Returns:
+        tuple[str, int]: Mode and character count (bytes in byte mode, characters in kanji mode).
+    """
+    if encoding is not None:
+        data = content.encode(encoding)
+    else:
+        try:
+            data = content.encode("iso-8859-1")
+        except UnicodeError:
+            try:
+                data = content.encode("shift_jis")
+            except UnicodeError:
+                data = content.encode("utf-8")
+    if data.isdigit():
+        return "numeric", len(data)
+    if ALPHANUMERIC_BYTES.issuperset(data):
+        return "alphanumeric", len(data)
+    if is_kanji(data):  # segno checks every encoding, so e.g. Latin-1 "àA" is kanji 0xE041 too
+        return "kanji", len(data) // 2
+    return "byte", len(data)
+
+
+def data_bits(mode: str, count: int) -> int:
+    """
+    Returns the number of bits the characters take in the given mode.
+    """
+    if mode == "numeric":
+        return count // 3 * 10 + (0, 4, 7)[count % 3]
+    if mode == "alphanumeric":
+        return count // 2 * 11 + count % 2 * 6
+    if mode == "kanji":
+        return count * 13
+    return count * 8
+
+
+def segment_bits(mode: str, count: int, version) -> int:
+    """
+    Returns the bits of a single segment including mode and count indicators.
+
+    Args:
+        mode (str): The segment mode.
+        count (int): Characters in the segment.
+        version (int | str): 1-40 or M1-M4.
+    """
+    regular, micro = COUNT_BITS[mode]
+    if isinstance(version, int):
+        return 4 + regular[0 if version < 10 else 1 if version < 27 else 2] + data_bits(mode, count)
+    indicator = int(version[1]) - 1  # M1 has no mode indicator, M2-M4 one to three bits
+    return indicator + micro[version] + data_bits(mode, count)
+
+
+def boost(capacities: dict, error: str, bits: int) -> str:
+    """
+    Returns the highest error level from error on that still holds bits, as segno's boost_error does.
+    """
+    levels = [level for level in ERRORS if level in capacities]
+    for level in levels[levels.index(error) + 1:]:
+        if capacities[level] < bits:
+            break
+        error = level
+    return error
+
+
+def estimate_content(content: str, micro: bool = False, encode_opts: EncodeOptions | None = None,
+                     charset: Charset = DEFAULT) -> Estimate:
+    """
+    Estimates the smallest symbol for content, as segno.make_qr / make_micro would choose it.
+
+    Args:
+        content (str): The encoded text.
+        micro (bool): Estimate a Micro QR code.
+        encode_opts (EncodeOptions | None): A pinned version or error level restricts the search.
+        charset (Charset): Encoding of the byte data.
+
+    Returns:
+        Estimate: The expected symbol.
+    """
+    opts = encode_opts or EncodeOptions()
+    mode, count = analyze(content, charset.encoding)
+    eci = ECI_BITS if charset.eci and mode == "byte" else 0
+    pinned = opts.error.upper() if opts.error else None
+    if micro:
+        versions = [v for v in MICRO_DATA_BITS if mode in MICRO_MODES[v]]
+        if pinned is not None:
+            versions = [v for v in versions if v != "M1"]
+        if opts.version is not None:
+            version = opts.version if isinstance(opts.version, str) else f"M{opts.version}"
+            versions = [v for v in versions if v == version.upper()]
+        table = MICRO_DATA_BITS
+    else:
+        versions = list(DATA_BITS) if opts.version is None else [int(opts.version)]
+        table = {v: dict(zip(ERRORS, DATA_BITS[v])) for v in versions}
+    bits = capacity = 0
+    for version in versions:
+        capacities = table[version]
+        error = pinned or ("L" if version != "M1" else None)
+        bits = segment_bits(mode, count, version) + eci
+        capacity = capacities.get(error, 0)
+        if capacity >= bits:
+            if pinned is None and error is not None:
+                error = boost(capacities, error, bits)
+                capacity = capacities[error]
+            designator = str(version) if error is None else f"{version}-{error}"
+            return Estimate(designator, mode, bits, capacity)
+    return Estimate(None, mode, bits, capacity)
+
+
+def estimate(kind: str, payload: dict, encode_opts: EncodeOptions | None = None) -> Estimate | None:
+    """
+    Estimates the symbol of a payload without encoding it.
+
+    Args:
+        kind (str): One of qrengine.KINDS.
+        payload (dict): The content of the code.
+        encode_opts (EncodeOptions | None): Pinned version or error level.
+
+    Returns:
+        Estimate | None: None for barcodes, whose length is fixed by the symbology.
+    """
+    content = qr_content(kind, payload)
+    if content is None:
+        return None
+    opts = encode_opts or EncodeOptions()
+    if kind in CHARSET_KINDS:
+        charset = choose(content, force_utf8=opts.utf8)
+    else:
+        charset = UTF8 if opts.utf8 else DEFAULT
+    if kind in ("Text", "Link"):
+        from .segments import optimize  # segments builds on this module
+        return optimize(content, opts.error, opts.version, charset).estimate
+    return estimate_content(content, micro=kind == "Micro", encode_opts=opts, charset=charset)
+
+
+def check(kind: str, payload: dict, encode_opts: EncodeOptions | None = None) -> Estimate | None:
+    """
+    Estimates the symbol of a payload and rejects it if it cannot fit.
+
+    Raises:
+        CapacityError: If the payload does not fit into any allowed symbol.
+    """
+    result = estimate(kind, payload, encode_opts)
+    if result is not None and not result.fits:
+        raise CapacityError(result.message())
+    return result
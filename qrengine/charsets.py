@@ -0,0 +1,92 @@
+"""
+Smallest character set for non-Latin-1 content, signalled by an ECI header.
+
+Without help, segno encodes text that ISO-8859-1 cannot represent as
+Shift_JIS or UTF-8 bytes. For Turkish, Greek, Cyrillic, Arabic or Hebrew text,
+UTF-8 takes two bytes per letter, while the matching ISO-8859 part takes one.
+choose() picks the encoding with the fewest bits that represents the text
+losslessly. A non-default charset is announced by a 12-bit ECI header, so it
+is only chosen when it saves more than that. UTF-8 can be forced instead,
+because some scanners ignore ECI headers and guess UTF-8.
+"""
+from dataclasses import dataclass
+
+ECI_BITS = 12  # ECI mode indicator and an 8-bit assignment number
+
+# Encodings with an ECI assignment number, in order of preference on a tie. ISO-8859-3 comes
+# after ISO-8859-9, which replaced it for Turkish, so it is only used for Maltese and Esperanto.
+CANDIDATES = ("iso-8859-2", "iso-8859-4", "iso-8859-5", "iso-8859-6", "iso-8859-7", "iso-8859-8", "iso-8859-9",
+              "iso-8859-3", "iso-8859-10", "iso-8859-11", "iso-8859-13", "iso-8859-14", "iso-8859-15",
+              "iso-8859-16", "cp1250", "cp1251", "cp1252", "cp1256", "shift_jis", "big5", "euc_kr", "gb18030")
+
+
+@dataclass(frozen=True)
+class Charset:
+    """
+    How the byte data of a QR code is encoded.
+
+    Attributes:
+        encoding (str | None): Codec name, None for segno's choice (ISO-8859-1, then Shift_JIS, then UTF-8).
+        eci (bool): Whether an ECI header announces the encoding.
+    """
+    encoding: str | None = None
+    eci: bool = False
+
+    def segno_args(self) -> dict:
+        """
+        Returns the encoding and eci keyword arguments of segno.make_qr.
+        """
+        if self.encoding is None:
+            return {}
+        return {"encoding": self.encoding, "eci": True} if self.eci else {"encoding": self.encoding}
+
+
+DEFAULT = Charset()
+UTF8 = Charset("utf-8")
+
+
+def is_kanji(data: bytes) -> bool:
+    """
+    Returns whether bytes consist of Shift_JIS double-byte characters only, as segno checks it.
+    """
+    if not data or len(data) % 2:
+        return False
+    for i in range(0, len(data), 2):
+        code = data[i] << 8 | data[i + 1]
+        if not (0x8140 <= code <= 0x9FFC or 0xE040 <= code <= 0xEBBF):
+            return False
+    return True
+
+
+def choose(text: str, force_utf8: bool = False) -> Charset:
+    """
+    Returns the charset that encodes text in the fewest bits.
+
+    Args:
+        text (str): The content of the QR code.
+        force_utf8 (bool): Always use UTF-8 without an ECI header, for scanners that ignore ECI.
+
+    Returns:
+        Charset: DEFAULT for Latin-1 text and for text that segno encodes in kanji mode.
+    """
+    if force_utf8:
+        return UTF8
+    try:
+        text.encode("iso-8859-1")
+        return DEFAULT
+    except UnicodeError:
+        pass
+    try:
+        if is_kanji(text.encode("shift_jis")):
+            return DEFAULT  # Kanji mode takes 13 bits per character
+    except UnicodeError:
+        pass
+    best, bits = UTF8, len(text.encode("utf-8")) * 8  # UTF-8 is what scanners assume without ECI
+    for encoding in CANDIDATES:
+        try:
+            size = len(text.encode(encoding)) * 8 + ECI_BITS
+        except UnicodeError:
+            continue
+        if size < bits:
+            best, bits = Charset(encoding, eci=True), size
+    return best
@@ -0,0 +1,229 @@
+"""
+Command-line interface of the engine.
+
+Usage:
+    python -m qrengine batch rows.csv -o out/
+    python -m qrengine batch rows.jsonl -o codes.zip --format svg --workers 8
+    python -m qrengine batch links.csv -o codes.zip --error M --version 4 --fast
+    python -m qrengine batch links.csv -o codes.zip --canonical-urls
+    python -m qrengine batch links.csv -o codes.zip --short-links links.sqlite3 --short-base https://qr.example.com/r/
+    python -m qrengine shorten urls.txt -o short.csv --db links.sqlite3 --short-base https://qr.example.com/r/
+    python -m qrengine serve --port 8000 --processes --links links.sqlite3
+    python -m qrengine bench -o results.json --baseline baseline.json
+"""
+import argparse
+import csv
+import itertools
+import os
+import sys
+import time
+
+from .core import ERRORS, KINDS, OUTPUTS, EncodeOptions, RenderOptions
+
+
+def add_encode_arguments(parser: argparse.ArgumentParser) -> None:
+    """
+    Adds the --error, --version, --mask, --fast and --utf8 options of EncodeOptions to a parser.
+    """
+    parser.add_argument("--error", choices=ERRORS, type=str.upper, help="Pin the error correction level.")
+    parser.add_argument("--version", type=lambda v: int(v) if v.isdigit() else v.upper(),
+                        help="Pin the symbol version (1-40, M1-M4 for Micro QR).")
+    parser.add_argument("--mask", type=int, help="Pin the mask pattern (0-7, 0-3 for Micro QR).")
+    parser.add_argument("--fast", action="store_true", help="Skip the mask evaluation.")
+    parser.add_argument("--utf8", action="store_true",
+                        help="Encode non-Latin-1 text as UTF-8 instead of the smallest ECI charset.")
+
+
+def encode_options(args) -> EncodeOptions | None:
+    """
+    Returns the EncodeOptions given on the command line, None if segno should choose everything.
+    """
+    opts = EncodeOptions(error=args.error, version=args.version, mask=args.mask, fast=args.fast, utf8=args.utf8)
+    return None if opts == EncodeOptions() else opts
+
+
+def write_outputs(results, output: str) -> tuple[int, int]:
+    """
+    Writes batch results to a directory or, if output ends with .zip, into a ZIP archive.
+    Failed rows are reported on stderr.
+
+    Args:
+        results: Iterable of batch.BatchResult.
+        output (str): Target directory or .zip path.
+
+    Returns:
+        tuple[int, int]: Number of written codes and number of failed rows.
+    """
+    from .archive import ZipStream
+    written = failed = 0
+    if output.lower().endswith(".zip"):
+        archive = ZipStream(output)
+        save = archive.add
+    else:
+        archive = None
+        os.makedirs(output, exist_ok=True)
+
+        def save(name, data):
+            with open(os.path.join(output, name), "wb") as f:
+                f.write(data)
+    try:
+        for result in results:
+            if result.error is None:
+                save(result.name, result.data)
+                written += 1
+            else:
+                print(f"Row {result.index + 1}: {result.error}", file=sys.stderr)
+                failed += 1
+    finally:
+        if archive is not None:
+            archive.close()
+    return written, failed
+
+
+def batch_command(args) -> int:
+    """
+    Runs the batch subcommand and reports the throughput.
+    """
+    from . import batch
+    from .shortlinks import LinkStore
+    opts = RenderOptions(output=args.format, scale=args.scale, border=args.border, size=args.size)
+    fmt = args.input_format or batch.detect_format(args.input)
+    start = time.perf_counter()
+    store = LinkStore(args.short_links, args.short_base) if args.short_links else None
+    try:
+        with open(args.input, encoding="utf-8-sig", newline="") as stream:
+            rows = batch.read_rows(stream, fmt)
+            if store is not None:
+                rows = batch.short_links(rows, store)
+            elif args.canonical_urls or args.upper_paths:
+                rows = batch.canonical_links(rows, upper_path=args.upper_paths)
+            results = batch.run_batch(rows, opts, workers=args.workers, encode_opts=encode_options(args))
+            written, failed = write_outputs(results, args.output)
+    finally:
+        if store is not None:
+            store.close()
+    elapsed = time.perf_counter() - start
+    total = written + failed
+    print(f"{total} rows in {elapsed:.2f} s ({total / elapsed if elapsed else 0:.1f} rows/s), "
+          f"{written} written, {failed} failed")
+    return 1 if failed else 0
+
+
+def shorten_command(args) -> int:
+    """
+    Runs the shorten subcommand: bulk import of URLs into a link store, with a CSV of their short links.
+    """
+    from .shortlinks import LinkStore
+    store = LinkStore(args.db, args.short_base)
+    out = open(args.output, "w", encoding="utf-8", newline="") if args.output else sys.stdout
+    start = time.perf_counter()
+    count = 0
+    try:
+        with open(args.input, encoding="utf-8-sig") as stream:
+            urls = (line.strip() for line in stream)
+            urls = (url for url in urls if url)
+            writer = csv.writer(out)
+            writer.writerow(["code", "short_url", "url"])
+            while chunk := list(itertools.islice(urls, args.chunk_size)):
+                codes = store.add_many(chunk, len(chunk))  # One transaction per chunk
+                writer.writerows([code, store.short_url(code), url] for url, code in zip(chunk, codes))
+                count += len(chunk)
+    except ValueError as e:
+        print(f"{e} (stored the first {count} URLs)", file=sys.stderr)
+        return 1
+    finally:
+        store.close()
+        if out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+    print(f"{count} URLs in {elapsed:.2f} s ({count / elapsed if elapsed else 0:.0f} URLs/s), stored in {args.db}",
+          file=sys.stderr)
+    return 0
+
+
+def serve_command(args) -> int:
+    """
+    Runs the serve subcommand.
+    """
+    from . import server
+    server.serve(args.host, args.port, workers=args.workers, processes=args.processes, max_pending=args.max_pending,
+                 links=args.links, max_body=args.max_body)
+    return 0
+
+
+def bench_command(args) -> int:
+    """
+    Runs the bench subcommand.
+    """
+    from . import bench
+    return bench.main(args)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Returns the argument parser of the command-line interface.
+    """
+    from .shortlinks import DEFAULT_BASE_URL, DEFAULT_PATH
+    parser = argparse.ArgumentParser(prog="python -m qrengine", description="QR code and barcode generation engine.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch_parser = commands.add_parser("batch", help="Generate one code per row of a CSV or JSONL file.")
+    batch_parser.add_argument("input", help="CSV (with header) or JSONL file; the type column names the code type.")
+    batch_parser.add_argument("-o", "--output", required=True, help="Output directory, or a .zip file.")
+    batch_parser.add_argument("--input-format", choices=["csv", "jsonl"], help="Defaults to the file extension.")
+    batch_parser.add_argument("--format", choices=[o for o in OUTPUTS if o != "matrix"], default="png")
+    batch_parser.add_argument("--scale", type=int, default=10, help="Module size in pixels.")
+    batch_parser.add_argument("--size", type=int, help="Target image width in pixels, overrides --scale.")
+    batch_parser.add_argument("--border", type=int, help="Quiet zone in modules.")
+    batch_parser.add_argument("--workers", type=int, help="Worker processes, defaults to the number of cores.")
+    links = batch_parser.add_mutually_exclusive_group()  # Short links are canonical already
+    links.add_argument("--canonical-urls", action="store_true",
+                       help="Uppercase scheme and host of Link rows for smaller codes.")
+    links.add_argument("--upper-paths", action="store_true",
+                       help="Like --canonical-urls, and uppercase the paths too (case-insensitive servers only).")
+    links.add_argument("--short-links", metavar="DB",
+                       help="Store the URLs of Link rows in this SQLite link store and encode short links.")
+    batch_parser.add_argument("--short-base", default=DEFAULT_BASE_URL,
+                              help=f"Redirect route the short-link codes are appended to (default {DEFAULT_BASE_URL}).")
+    add_encode_arguments(batch_parser)
+    batch_parser.set_defaults(func=batch_command)
+
+    shorten_parser = commands.add_parser("shorten", help="Bulk import URLs into a short-link store.")
+    shorten_parser.add_argument("input", help="Text file with one URL per line.")
+    shorten_parser.add_argument("-o", "--output", help="CSV of code, short_url and url; defaults to stdout.")
+    shorten_parser.add_argument("--db", default=DEFAULT_PATH, help=f"SQLite link store (default {DEFAULT_PATH}).")
+    shorten_parser.add_argument("--short-base", default=DEFAULT_BASE_URL,
+                                help=f"Redirect route the codes are appended to (default {DEFAULT_BASE_URL}).")
+    shorten_parser.add_argument("--chunk-size", type=int, default=10_000, help="URLs stored per transaction.")
+    shorten_parser.set_defaults(func=shorten_command)
+
+    serve_parser = commands.add_parser("serve", help="Run the HTTP generation API.")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--workers", type=int, help="Pool size, defaults to the number of cores.")
+    serve_parser.add_argument("--processes", action="store_true", help="Use a process pool instead of threads.")
+    serve_parser.add_argument("--max-pending", type=int, help="Queued plus running requests before answering 503.")
+    serve_parser.add_argument("--max-body", type=int, default=1024 * 1024,
+                              help="Largest /generate request body in bytes before answering 413 (default 1 MiB).")
+    serve_parser.add_argument("--links", metavar="DB", help="Redirect the short links of this SQLite store under /r/.")
+    serve_parser.set_defaults(func=serve_command)
+
+    bench_parser = commands.add_parser("bench", help="Benchmark encode, rasterize and serialize of every code type.")
+    bench_parser.add_argument("-o", "--output", help="Write the results as JSON; the file can serve as a baseline.")
+    bench_parser.add_argument("--baseline", help="Results JSON of an earlier run to compare against.")
+    bench_parser.add_argument("--threshold", type=float, default=0.2,
+                              help="Relative slowdown of a stage that counts as a regression (default 0.2 = 20%%).")
+    bench_parser.add_argument("--repeat", type=int, default=5, help="Timed runs per case, the median is reported.")
+    bench_parser.add_argument("--kinds", nargs="+", choices=KINDS, help="Only benchmark these code types.")
+    bench_parser.add_argument("--encode-modes", action="store_true",
+                              help="Also time encoding with segno's search against fast mode and pinned options.")
+    bench_parser.set_defaults(func=bench_command)
+    return parser
+
+
+def main(argv=None) -> int:
+    """
+    Entry point of `python -m qrengine`.
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
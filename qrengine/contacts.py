@@ -0,0 +1,162 @@
+"""
+Smallest serialization of contact cards.
+
+A vCard 3.0 spends about 60 bytes on BEGIN/VERSION/END lines, CRLF line
+breaks and property names. MeCard (MECARD:N:Doe,John;TEL:...;;) holds the
+same name, phone, email, URL, address, birthday and note fields in a fraction
+of that, and phone cameras read both. minimize() drops blank fields and
+serializes the card in the requested format. With "auto" it uses whichever
+format is shorter, but MeCard only if it keeps everything the vCard holds: it
+has no organization, title or photo, and its TEL has no types, so cell, home
+and work numbers would become untyped.
+"""
+from dataclasses import dataclass
+
+FORMATS = ("auto", "vcard", "mecard")
+VCARD_ONLY = ("Org", "Title", "Photo_Uri")  # Fields MeCard has no property for
+PHONES = ("Phone", "Cellphone", "Homephone", "Workphone")
+TYPED_PHONES = ("Cellphone", "Homephone", "Workphone")  # TEL;TYPE=... in vCard, a plain TEL in MeCard
+
+
+@dataclass(frozen=True)
+class ContactReport:
+    """
+    Size of a contact card in the chosen format compared with the plain vCard.
+
+    Attributes:
+        format (str): "vcard" or "mecard".
+        size (int): Bytes (UTF-8) of the chosen serialization.
+        original (int): Bytes of the vCard 3.0 of the fields as entered.
+        dropped (tuple): Fields, or phone types, the chosen format could not hold, only if MeCard was forced.
+    """
+    format: str
+    size: int
+    original: int
+    dropped: tuple = ()
+
+    @property
+    def saved(self) -> int:
+        return self.original - self.size
+
+    def message(self) -> str:
+        """
+        Returns a one-line summary, e.g. "MeCard: 71 bytes instead of 124 as vCard 3.0 (53 saved)".
+        """
+        name = "MeCard" if self.format == "mecard" else "vCard 3.0"
+        text = f"{name}: {self.size:,} bytes"
+        if self.saved:
+            text += f" instead of {self.original:,} as vCard 3.0 ({self.saved:,} saved)"
+        if self.dropped:
+            text += f", without {', '.join(self.dropped)}"
+        return text
+
+
+def clean(vcard: dict) -> dict:
+    """
+    Returns the fields of a vCard payload without empty or whitespace-only values, strings stripped.
+    """
+    fields = {}
+    for key, value in vcard.items():
+        if isinstance(value, str):
+            value = value.strip()
+        if value is not None and value != "":
+            fields[key] = value
+    return fields
+
+
+def vcard_text(fields: dict) -> str:
+    """
+    Returns the vCard 3.0 of the fields.
+
+    Args:
+        fields (dict): VCard information. Keys: Name, Displayname and the optional
+            Email, Phone, Memo, Birthday, URL, Pobox, Street, City, Region, Zipcode,
+            Country, Org, Title, Photo_Uri, Cellphone, Homephone, Workphone.
+    """
+    from segno import helpers
+    return helpers.make_vcard_data(
+        name=fields["Name"],
+        displayname=fields["Displayname"],
+        email=fields.get("Email"),
+        phone=fields.get("Phone"),
+        memo=fields.get("Memo"),
+        birthday=fields.get("Birthday"),
+        url=fields.get("URL"),
+        pobox=fields.get("Pobox"),
+        street=fields.get("Street"),
+        city=fields.get("City"),
+        region=fields.get("Region"),
+        zipcode=fields.get("Zipcode"),
+        country=fields.get("Country"),
+        org=fields.get("Org"),
+        title=fields.get("Title"),
+        photo_uri=fields.get("Photo_Uri"),
+        cellphone=fields.get("Cellphone"),
+        homephone=fields.get("Homephone"),
+        workphone=fields.get("Workphone"),
+    )
+
+
+def mecard_text(fields: dict) -> tuple[str, tuple]:
+    """
+    Returns the MeCard of the fields and what it cannot hold: fields, and the types of typed phones.
+
+    The vCard name "Last;First" becomes "Last,First". The display name is left out
+    if it is just the name in either order, otherwise it is kept as NICKNAME.
+
+    Args:
+        fields (dict): VCard information, see vcard_text.
+
+    Returns:
+        tuple[str, tuple]: The MeCard and the names of the dropped fields, e.g. ("Org", "Workphone type").
+    """
+    from segno import helpers
+    parts = [part.strip() for part in str(fields["Name"]).split(";")]
+    given = " ".join(part for part in parts[1:] if part)
+    name = f"{parts[0]},{given}" if given else parts[0]
+    derived = {" ".join(filter(None, (given, parts[0]))), " ".join(filter(None, (parts[0], given)))}
+    displayname = fields.get("Displayname")
+    data = helpers.make_mecard_data(
+        name=name,
+        nickname=displayname if displayname and displayname not in derived else None,
+        email=fields.get("Email"),
+        phone=[fields[key] for key in PHONES if key in fields] or None,
+        memo=fields.get("Memo"),
+        birthday=fields.get("Birthday"),
+        url=fields.get("URL"),
+        pobox=fields.get("Pobox"),
+        houseno=fields.get("Street"),
+        city=fields.get("City"),
+        prefecture=fields.get("Region"),
+        zipcode=fields.get("Zipcode"),
+        country=fields.get("Country"),
+    )
+    dropped = [key for key in VCARD_ONLY if key in fields]
+    dropped += [f"{key} type" for key in TYPED_PHONES if key in fields]
+    return data, tuple(dropped)
+
+
+def minimize(vcard: dict) -> tuple[str, ContactReport]:
+    """
+    Serializes a vCard payload as compactly as its Format field allows.
+
+    Args:
+        vcard (dict): VCard information (see vcard_text) and the optional Format:
+            "auto" (default, the shorter of vCard 3.0 and a lossless MeCard), "vcard" or "mecard".
+
+    Returns:
+        tuple[str, ContactReport]: The encoded text and its size report.
+    """
+    fmt = str(vcard.get("Format") or "auto").lower()
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown contact format: {fmt!r}, expected one of {', '.join(FORMATS)}")
+    fields = clean({key: value for key, value in vcard.items() if key != "Format"})
+    for key in ("Name", "Displayname"):  # Required, kept even if blank
+        fields.setdefault(key, str(vcard[key] or "").strip())
+    original = len(vcard_text(vcard).encode("utf-8"))
+    text = vcard_text(fields) if fmt != "mecard" else None
+    if fmt != "vcard":
+        mecard, dropped = mecard_text(fields)
+        if fmt == "mecard" or (not dropped and len(mecard.encode("utf-8")) < len(text.encode("utf-8"))):
+            return mecard, ContactReport("mecard", len(mecard.encode("utf-8")), original, dropped)
+    return text, ContactReport("vcard", len(text.encode("utf-8")), original)
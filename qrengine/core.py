@@ -0,0 +1,215 @@
+"""
+Single entry point of the engine: payload dictionary in, encoded bytes or module matrix out.
+"""
+import io
+import math
+from dataclasses import dataclass
+
+from . import payloads
+from .pngstream import write_png
+
+KINDS = ("Text", "Link", "VCard", "Wifi", "Email", "Geo", "Micro", "Barcode")
+
+BUILDERS = {
+    "Text": payloads.text_link_qr,
+    "Link": payloads.text_link_qr,
+    "VCard": payloads.vcard_qr,
+    "Wifi": payloads.wifi_qr,
+    "Email": payloads.email_qr,
+    "Geo": payloads.geo_qr,
+    "Micro": payloads.micro_qr,
+    "Barcode": payloads.barcode_,
+}
+
+OUTPUTS = ("png", "svg", "matrix")
+
+MAX_PIXELS = 16_000_000  # Default pixel budget of a single raster image (4000 x 4000)
+ERRORS = ("L", "M", "Q", "H")
+FAST_MASK = 0  # Mask used in fast mode; every mask yields a valid symbol, evaluation only picks the most robust
+
+
+@dataclass(frozen=True)
+class EncodeOptions:
+    """
+    How a payload is encoded into a QR code. None lets segno choose, which costs time:
+    segno evaluates all eight mask patterns (four for Micro QR) and searches the
+    smallest version and the highest error level that fits that version.
+    Barcodes ignore these options.
+
+    Attributes:
+        error (str | None): Error correction level L, M, Q or H (Micro QR: L, M, Q).
+            A pinned level is used as is instead of being raised to fill the version.
+        version (int | str | None): Version 1-40, or 1-4 / M1-M4 for Micro QR codes.
+        mask (int | None): Mask pattern 0-7 (Micro QR: 0-3).
+        fast (bool): Use FAST_MASK if no mask is pinned, skipping the mask evaluation.
+        utf8 (bool): Encode non-Latin-1 text as UTF-8 without an ECI header instead of the
+            smallest ECI charset (see qrengine.charsets), for scanners that ignore ECI.
+    """
+    error: str | None = None
+    version: int | str | None = None
+    mask: int | None = None
+    fast: bool = False
+    utf8: bool = False
+
+    def segno_args(self) -> dict:
+        """
+        Returns the keyword arguments for segno.make_qr / segno.make_micro.
+        """
+        args = {"error": self.error, "version": self.version, "mask": self.mask}
+        if self.mask is None and self.fast:
+            args["mask"] = FAST_MASK
+        if self.error is not None:
+            args["boost_error"] = False
+        if self.utf8:
+            args["encoding"] = "utf-8"
+        return args
+
+
+@dataclass(frozen=True)
+class RenderOptions:
+    """
+    How an encoded symbol is turned into output.
+
+    Attributes:
+        output (str): One of "png", "svg" or "matrix".
+        scale (int): Size of a single module in pixels (QR codes only).
+        border (int | None): Quiet zone in modules, None means the symbol's default.
+        size (int | None): Target image width in pixels of PNG and SVG output (QR codes only).
+            If set, the scale is derived from it (largest whole module size that fits) and the
+            scale field is ignored.
+        max_pixels (int): Hard budget for width x height of PNG output; the scale is
+            reduced until the image fits.
+    """
+    output: str = "png"
+    scale: int = 10
+    border: int | None = None
+    size: int | None = None
+    max_pixels: int = MAX_PIXELS
+
+
+def make_code(kind: str, payload: dict, encode_opts: EncodeOptions | None = None):
+    """
+    Encodes the payload into a symbol without rendering it.
+
+    Args:
+        kind (str): One of KINDS.
+        payload (dict): The content of the code, see qrengine.payloads.
+        encode_opts (EncodeOptions | None): Pinned version, error level or mask, defaults to segno's choice.
+
+    Returns:
+        segno.QRCode or barcode.barcode.Barcode object.
+    """
+    try:
+        builder = BUILDERS[kind]
+    except KeyError:
+        raise ValueError(f"Unknown code type: {kind!r}") from None
+    if encode_opts is None:
+        return builder(payload)
+    return builder(payload, **encode_opts.segno_args())
+
+
+def size_scale(code, render_opts: RenderOptions) -> int:
+    """
+    Returns the module size of a QR code with the given options before the pixel budget:
+    the largest whole module size that fits into the target width, or the scale field.
+    """
+    if render_opts.size is None:
+        return render_opts.scale
+    width, _ = code.symbol_size(scale=1, border=render_opts.border)
+    return max(1, render_opts.size // width)
+
+
+def pixel_scale(code, render_opts: RenderOptions) -> int:
+    """
+    Returns the module size used to render a QR code as PNG with the given options.
+
+    Args:
+        code (segno.QRCode): The encoded symbol.
+        render_opts (RenderOptions): Output options.
+
+    Returns:
+        int: Module size in pixels.
+
+    Raises:
+        ValueError: If the symbol does not fit into the pixel budget even at scale 1.
+    """
+    width, height = code.symbol_size(scale=1, border=render_opts.border)
+    scale = size_scale(code, render_opts)
+    if width * height * scale * scale > render_opts.max_pixels:
+        scale = math.isqrt(render_opts.max_pixels // (width * height))
+        if scale < 1:
+            raise ValueError(f"A {width}x{height} symbol exceeds the pixel budget of {render_opts.max_pixels}")
+    return scale
+
+
+def render(code, render_opts: RenderOptions | None = None) -> bytes | tuple:
+    """
+    Renders an encoded symbol.
+
+    Args:
+        code: segno.QRCode or barcode.barcode.Barcode object.
+        render_opts (RenderOptions | None): Output options, defaults to PNG.
+
+    Returns:
+        bytes for "png"/"svg", a tuple of rows (0 = light, 1 = dark) for "matrix".
+    """
+    opts = render_opts or RenderOptions()
+    if opts.output not in OUTPUTS:
+        raise ValueError(f"Unknown output format: {opts.output!r}")
+    if payloads.is_qrcode(code):
+        if opts.output == "matrix":
+            return tuple(tuple(row) for row in code.matrix)
+        buffer = io.BytesIO()
+        if opts.output == "png":
+            write_png(code, buffer, scale=pixel_scale(code, opts), border=opts.border)
+        else:
+            # Whole modules as in PNG output: a fractional scale leaves rounding errors in width and height
+            code.save(buffer, kind="svg", scale=size_scale(code, opts), border=opts.border)
+        return buffer.getvalue()
+    if opts.output == "matrix":
+        return tuple(tuple(int(module) for module in line) for line in code.build())
+    if opts.output == "png":
+        from barcode.writer import ImageWriter
+        code.writer = ImageWriter()
+    else:
+        from barcode.writer import SVGWriter
+        code.writer = SVGWriter()
+    buffer = io.BytesIO()
+    code.write(buffer)
+    return buffer.getvalue()
+
+
+def write(code, out, render_opts: RenderOptions | None = None) -> None:
+    """
+    Writes a rendered symbol into a binary file object.
+
+    PNG output of QR codes is streamed row by row, so memory stays proportional
+    to the image width; other outputs are rendered in memory first.
+
+    Args:
+        code: segno.QRCode or barcode.barcode.Barcode object.
+        out: Object with a write(bytes) method, e.g. an open file.
+        render_opts (RenderOptions | None): Output options, defaults to PNG.
+    """
+    opts = render_opts or RenderOptions()
+    if payloads.is_qrcode(code) and opts.output == "png":
+        write_png(code, out, scale=pixel_scale(code, opts), border=opts.border)
+    else:
+        out.write(render(code, opts))
+
+
+def generate(kind: str, payload: dict, render_opts: RenderOptions | None = None,
+             encode_opts: EncodeOptions | None = None) -> bytes | tuple:
+    """
+    Generates a code of the given type and renders it.
+
+    Args:
+        kind (str): One of KINDS.
+        payload (dict): The content of the code.
+        render_opts (RenderOptions | None): Output options, defaults to PNG.
+        encode_opts (EncodeOptions | None): Encoding options, defaults to segno's choice.
+
+    Returns:
+        bytes for "png"/"svg", a tuple of rows for "matrix".
+    """
+    return render(make_code(kind, payload, encode_opts), render_opts)
@@ -0,0 +1,230 @@
+"""
+Prometheus metrics of the generation pipeline, without third-party dependencies.
+
+GenerationMetrics holds the counters and histograms the front ends and the
+HTTP API update on every generate call. It renders them in the Prometheus text
+exposition format (version 0.0.4). Updating a metric takes a lock and a dict
+lookup, so the cost per request is a few microseconds.
+
+    qrengine_requests_total{kind,status}               Generate calls by outcome (ok, error, rejected)
+    qrengine_request_duration_seconds{kind}            Latency histogram
+    qrengine_render_bytes{kind,format}                 Histogram of the rendered output size
+    qrengine_errors_total{kind,error}                  Failures by exception class, e.g. DataOverflowError
+    qrengine_render_cache_{hits,misses}_total          Render cache counters
+    qrengine_render_cache_hit_ratio, _bytes, _entries  Render cache gauges
+"""
+import bisect
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .core import KINDS
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216)
+STATUSES = ("ok", "error", "rejected")
+
+
+def format_value(value: float) -> str:
+    """
+    Returns a sample value as Prometheus expects it (integers without a decimal point, +Inf for infinity).
+    """
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def escape(value) -> str:
+    """
+    Returns a label value with backslashes, double quotes and newlines escaped.
+    """
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    """
+    Returns the {name="value",...} part of a sample.
+    """
+    pairs = [f'{name}="{escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """
+    Monotonic counter with labels.
+    """
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues, amount: float = 1) -> None:
+        """
+        Adds amount to the series of the given label values (in labelnames order).
+        """
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def samples(self):
+        """
+        Yields the exposition lines of all series.
+        """
+        with self._lock:
+            values = sorted(self._values.items())
+        for labelvalues, value in values:
+            yield f"{self.name}{format_labels(self.labelnames, labelvalues)} {format_value(value)}"
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets and labels.
+    """
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple = (), buckets: tuple = DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(buckets)
+        self._series = {}  # label values -> [per-bucket counts (last one is +Inf), sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues) -> None:
+        """
+        Records one observation in the series of the given label values.
+        """
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def samples(self):
+        """
+        Yields the cumulative bucket, sum and count lines of all series.
+        """
+        with self._lock:
+            series = sorted((labelvalues, (list(counts), total))
+                            for labelvalues, (counts, total) in self._series.items())
+        for labelvalues, (counts, total) in series:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{format_value(bound)}"'
+                yield f"{self.name}_bucket{format_labels(self.labelnames, labelvalues, le)} {cumulative}"
+            labels = format_labels(self.labelnames, labelvalues)
+            yield f"{self.name}_sum{labels} {format_value(total)}"
+            yield f"{self.name}_count{labels} {cumulative}"
+
+
+class GenerationMetrics:
+    """
+    The metrics of one process that generates codes, rendered on demand in the text format.
+    """
+
+    def __init__(self, cache=None):
+        """
+        Args:
+            cache (RenderCache | None): Render cache whose statistics are exported.
+        """
+        self.cache = cache
+        self.requests = Counter("qrengine_requests_total", "Generate requests by code type and outcome.",
+                                ("kind", "status"))
+        self.duration = Histogram("qrengine_request_duration_seconds", "Generate latency in seconds.", ("kind",))
+        self.render_bytes = Histogram("qrengine_render_bytes", "Size of the rendered output in bytes.",
+                                      ("kind", "format"), SIZE_BUCKETS)
+        self.errors = Counter("qrengine_errors_total", "Failed generate requests by exception class.",
+                              ("kind", "error"))
+        for kind in KINDS:
+            self.requests.inc(kind, "ok", amount=0)  # Export every code type from the first scrape on
+
+    def observe(self, kind: str, seconds: float, status: str = "ok", output: str = "png",
+                size: int | None = None, error: str | None = None) -> None:
+        """
+        Records one generate request.
+
+        Args:
+            kind (str): Code type, one of KINDS (or "unknown").
+            seconds (float): Time the request took.
+            status (str): One of STATUSES.
+            output (str): Output format.
+            size (int | None): Size of the rendered output, if any.
+            error (str | None): Exception class name of a failed request.
+        """
+        self.requests.inc(kind, status)
+        self.duration.observe(seconds, kind)
+        if size is not None:
+            self.render_bytes.observe(size, kind, output)
+        if error is not None:
+            self.errors.inc(kind, error)
+
+    def render(self) -> bytes:
+        """
+        Returns all metrics in the Prometheus text exposition format.
+        """
+        lines = []
+        for metric in (self.requests, self.duration, self.render_bytes, self.errors):
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        if self.cache is not None:
+            stats = self.cache.stats()
+            for name, kind, documentation, value in (
+                    ("hits_total", "counter", "Render cache hits.", stats["hits"]),
+                    ("misses_total", "counter", "Render cache misses.", stats["misses"]),
+                    ("hit_ratio", "gauge", "Share of render cache lookups that were hits.", stats["hit_ratio"]),
+                    ("bytes", "gauge", "Bytes held by the render cache.", stats["bytes"]),
+                    ("entries", "gauge", "Outputs held by the render cache.", stats["entries"])):
+                lines.append(f"# HELP qrengine_render_cache_{name} {documentation}")
+                lines.append(f"# TYPE qrengine_render_cache_{name} {kind}")
+                lines.append(f"qrengine_render_cache_{name} {format_value(value)}")
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class MetricsHandler(BaseHTTPRequestHandler):
+    """
+    Answers GET /metrics with the metrics of the server.
+    """
+
+    def do_GET(self):
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+        body = self.server.metrics.render()
+        self.send_response(200)
+        self.send_header("Content-Type", CONTENT_TYPE)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_metrics(metrics: GenerationMetrics, host: str = "127.0.0.1", port: int = 9100) -> ThreadingHTTPServer:
+    """
+    Serves GET /metrics on a daemon thread next to an application that has no HTTP endpoint of its own.
+
+    Args:
+        metrics (GenerationMetrics): The metrics to expose.
+        host (str): Interface to listen on, local only by default; "" for all.
+        port (int): Port to listen on.
+
+    Returns:
+        ThreadingHTTPServer: The running server; call shutdown() to stop it.
+    """
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    server.daemon_threads = True
+    server.metrics = metrics
+    threading.Thread(target=server.serve_forever, name="metrics", daemon=True).start()
+    return server
@@ -0,0 +1,242 @@
+"""
+Per-type payload builders.
+
+Every builder takes the input dictionary used by the front ends and returns
+the encoded symbol (a segno.QRCode or a python-barcode object). QR code builders
+pass their keyword arguments (error, version, mask, boost_error, encoding, see
+qrengine.core.EncodeOptions) on to segno. Text, link, vCard and email builders
+encode non-Latin-1 content in the smallest ECI charset (see qrengine.charsets).
+
+segno and python-barcode (which pulls in Pillow) are imported on first use by
+the builder that needs them, so importing the engine stays cheap and barcode
+support costs nothing until a barcode is generated.
+"""
+import sys
+
+from .charsets import choose
+from .contacts import minimize
+
+# Input fields of every code type, required ones first
+FIELDS = {
+    "Text": ("Content",),
+    "Link": ("Content",),
+    "VCard": ("Name", "Displayname", "Email", "Phone", "Memo", "Birthday", "URL", "Pobox", "Street", "City",
+              "Region", "Zipcode", "Country", "Org", "Title", "Photo_Uri", "Cellphone", "Homephone", "Workphone",
+              "Format"),
+    "Wifi": ("SSID", "Password", "Security"),
+    "Email": ("To", "Subject", "Body"),
+    "Geo": ("Latitude", "Longitude"),
+    "Micro": ("Text",),
+    "Barcode": ("Type", "Number"),
+}
+
+CHARSET_KINDS = ("Text", "Link", "VCard", "Email")  # Types whose builders pick the smallest ECI charset
+
+
+def is_qrcode(code) -> bool:
+    """
+    Returns whether code is a segno.QRCode, without importing segno if it is not loaded yet.
+    """
+    segno = sys.modules.get("segno")
+    return segno is not None and isinstance(code, segno.QRCode)
+
+
+def with_charset(data: str, encode_args: dict) -> dict:
+    """
+    Returns encode_args with the smallest charset for data, unless they force one (EncodeOptions.utf8).
+    """
+    if "encoding" in encode_args:
+        return encode_args
+    return {**choose(data).segno_args(), **encode_args}
+
+
+def text_link_qr(content: dict, **encode_args):
+    """
+    Creates a QR code for text or link.
+    Mixed content is split into numeric, alphanumeric and byte segments if that
+    leads to a smaller version (see qrengine.segments), and non-Latin-1 content
+    is encoded in the smallest ECI charset.
+
+    Args:
+        content (dict): QR code content. Keys: Content.
+        **encode_args: Passed on to segno.make_qr.
+
+    Returns:
+        segno.QRCode: The created QR code object.
+    """
+    import segno
+
+    from .segments import optimize
+    charset = choose(content["Content"], force_utf8="encoding" in encode_args)
+    plan = optimize(content["Content"], encode_args.get("error"), encode_args.get("version"), charset)
+    encode_args = {**charset.segno_args(), **encode_args}
+    if plan.split:
+        encode_args = {**encode_args, "error": encode_args.get("error") or plan.error}
+    return segno.make_qr(plan.content(), **encode_args)
+
+
+def vcard_data(vcard: dict) -> str:
+    """
+    Returns the contact card text encoded by vcard_qr: blank fields dropped, and
+    MeCard instead of vCard 3.0 where that is shorter (see qrengine.contacts).
+
+    Args:
+        vcard (dict): VCard information. Keys: Name, Displayname and the optional
+            Email, Phone, Memo, Birthday, URL, Pobox, Street, City, Region, Zipcode,
+            Country, Org, Title, Photo_Uri, Cellphone, Homephone, Workphone and
+            Format (auto, vcard or mecard).
+
+    Returns:
+        str: The vCard or MeCard.
+    """
+    return minimize(vcard)[0]
+
+
+def vcard_qr(vcard: dict, **encode_args):
+    """
+    Creates a QR code which encodes a contact card (vCard 3.0 or MeCard).
+
+    Args:
+        vcard (dict): VCard information, see vcard_data.
+        **encode_args: Passed on to segno.make_qr.
+
+    Returns:
+        segno.QRCode: The created QR code object.
+    """
+    import segno
+    data = vcard_data(vcard)
+    return segno.make_qr(data, **with_charset(data, encode_args))
+
+
+def wifi_data(wifi: dict) -> str:
+    """
+    Returns the WIFI: configuration string encoded by wifi_qr.
+
+    Args:
+        wifi (dict): Wifi information. Keys: SSID, Password and the optional Security.
+    """
+    from segno import helpers
+    return helpers.make_wifi_data(ssid=wifi["SSID"], password=wifi["Password"], security=wifi.get("Security"))
+
+
+def wifi_qr(wifi: dict, **encode_args):
+    """
+    Creates a QR code for Wifi network.
+
+    Args:
+        wifi (dict): Wifi information, see wifi_data.
+        **encode_args: Passed on to segno.make_qr.
+
+    Returns:
+        segno.QRCode: The created QR code object.
+    """
+    import segno
+    return segno.make_qr(wifi_data(wifi), **encode_args)
+
+
+def email_data(email: dict) -> str:
+    """
+    Returns the mailto: URI encoded by email_qr.
+
+    Args:
+        email (dict): Email information. Keys: Subject, Body, To.
+    """
+    from segno import helpers
+    return helpers.make_make_email_data(to=email["To"], subject=email["Subject"], body=email["Body"])
+
+
+def email_qr(email: dict, **encode_args):
+    """
+    Creates a QR code for Email information.
+
+    Args:
+        email (dict): Email information, see email_data.
+        **encode_args: Passed on to segno.make_qr.
+
+    Returns:
+        segno.QRCode: The created QR code object.
+    """
+    import segno
+    data = email_data(email)
+    return segno.make_qr(data, **with_charset(data, encode_args))
+
+
+def geo_data(geo: dict) -> str:
+    """
+    Returns the geo: URI encoded by geo_qr.
+
+    Args:
+        geo (dict): Geographical location information. Keys: Latitude, Longitude.
+    """
+    from segno import helpers
+    return helpers.make_geo_data(lat=geo["Latitude"], lng=geo["Longitude"])
+
+
+def geo_qr(geo: dict, **encode_args):
+    """
+    Creates a QR code for geographical location.
+
+    Args:
+        geo (dict): Geographical location information, see geo_data.
+        **encode_args: Passed on to segno.make_qr.
+
+    Returns:
+        segno.QRCode: The created QR code object.
+    """
+    import segno
+    return segno.make_qr(geo_data(geo), **encode_args)
+
+
+def micro_qr(content: dict, **encode_args):
+    """
+    Creates a Micro QR code.
+
+    Args:
+        content (dict): Micro QR code content. Keys: Text.
+        **encode_args: Passed on to segno.make_micro; a numeric version 1-4 means M1-M4.
+
+    Returns:
+        segno.QRCode: The created micro QR code object.
+    """
+    import segno
+    if isinstance(encode_args.get("version"), int):
+        encode_args["version"] = f"M{encode_args['version']}"
+    return segno.make_micro(content["Text"], **encode_args)
+
+
+def barcode_(brcode: dict, **encode_args):
+    """
+    Creates a barcode.
+
+    Args:
+        brcode (dict): Barcode information. Keys: Type, Number.
+        **encode_args: Ignored, barcodes have no QR code encoding options.
+
+    Returns:
+        barcode.barcode.Barcode: The created barcode object.
+    """
+    import barcode
+    return barcode.get_barcode(name=brcode["Type"], code=brcode["Number"])
+
+
+CONTENT = {
+    "Text": lambda content: content["Content"],
+    "Link": lambda content: content["Content"],
+    "VCard": vcard_data,
+    "Wifi": wifi_data,
+    "Email": email_data,
+    "Geo": geo_data,
+    "Micro": lambda content: content["Text"],
+}
+
+
+def qr_content(kind: str, payload: dict) -> str | None:
+    """
+    Returns the string a QR code of the given type encodes, None for barcodes.
+
+    Args:
+        kind (str): Code type, one of qrengine.KINDS.
+        payload (dict): The content of the code.
+    """
+    data = CONTENT.get(kind)
+    return None if data is None else data(payload)
@@ -0,0 +1,132 @@
+"""
+Streaming PNG writer for QR code module matrices.
+
+The image is produced row by row: each module row is expanded once into a packed
+1-bit scanline, fed to a zlib compressor and flushed out in IDAT chunks as soon
+as compressed data is available. Memory use is O(image width) regardless of the
+scale, so poster-sized images can be written straight to a file or an HTTP response.
+The repeated rows of a module row are fed to the compressor in blocks of at most
+UP_BLOCK_SIZE bytes, so a large scale does not multiply the buffer size.
+
+The first pixel row of every module row uses PNG filter type 0 (None); the
+remaining scale - 1 identical rows use filter type 2 (Up), which turns them into
+zeros that cost the compressor next to nothing. For large scales the run-length
+strategy of zlib is used, which trades some file size for several times faster
+compression on these images.
+"""
+import struct
+import zlib
+
+from . import raster
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+IDAT_SIZE = 64 * 1024  # Compressed bytes collected before an IDAT chunk is emitted
+UP_BLOCK_SIZE = 64 * 1024  # Upper bound of the Up-filtered rows passed to the compressor at once
+RLE_MIN_SCALE = 32  # From this scale on run-length matching beats the default strategy on speed
+
+
+def png_chunk(chunk_type: bytes, data: bytes) -> bytes:
+    """
+    Returns a complete PNG chunk (length, type, data, CRC).
+    """
+    return struct.pack(">I", len(data)) + chunk_type + data + struct.pack(">I", zlib.crc32(chunk_type + data))
+
+
+def pack_row(row, scale: int) -> bytes:
+    """
+    Returns the packed 1-bit pixels of a module row.
+
+    Args:
+        row: Iterable of modules (truthy = dark).
+        scale (int): Size of a single module in pixels.
+
+    Returns:
+        bytes: Packed pixels (dark = 0, light = 1), without the PNG filter byte.
+    """
+    light, dark = "1" * scale, "0" * scale
+    bits = "".join(dark if module else light for module in row)
+    padding = -len(bits) % 8
+    bits += "0" * padding
+    return int(bits, 2).to_bytes(len(bits) // 8, "big")
+
+
+def iter_png(lines, width: int, height: int, scale: int = 1, compresslevel: int = 6):
+    """
+    Yields a 1-bit greyscale PNG image chunk by chunk.
+
+    Args:
+        lines: Iterable of packed module rows (see pack_row), quiet zone included.
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        scale (int): Number of pixel rows per module row.
+        compresslevel (int): zlib compression level.
+
+    Yields:
+        bytes: Consecutive pieces of the PNG file.
+    """
+    yield PNG_SIGNATURE
+    # Width, height, bit depth 1, colour type 0 (greyscale), deflate, adaptive filtering, no interlace
+    yield png_chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 1, 0, 0, 0, 0))
+    strategy = zlib.Z_RLE if scale >= RLE_MIN_SCALE else zlib.Z_DEFAULT_STRATEGY
+    compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 15, 9, strategy)
+    up_row = b"\x02" + bytes((width + 7) // 8)
+    block_rows = max(1, min(scale - 1, UP_BLOCK_SIZE // len(up_row)))
+    full_blocks, rest = divmod(scale - 1, block_rows)
+    block, rest_block = up_row * block_rows, up_row * rest
+    pending = []
+    pending_size = 0
+    for line in lines:
+        pieces = [compressor.compress(b"\x00" + line)]
+        pieces.extend(compressor.compress(block) for _ in range(full_blocks))
+        pieces.append(compressor.compress(rest_block))
+        for data in pieces:
+            if data:
+                pending.append(data)
+                pending_size += len(data)
+        if pending_size >= IDAT_SIZE:
+            yield png_chunk(b"IDAT", b"".join(pending))
+            pending, pending_size = [], 0
+    pending.append(compressor.flush())
+    yield png_chunk(b"IDAT", b"".join(pending))
+    yield png_chunk(b"IEND", b"")
+
+
+def packed_lines(code, scale: int = 1, border: int | None = None):
+    """
+    Yields the packed 1-bit scanline of every module row, quiet zone included.
+    Uses the NumPy rasterizer when raster.use_numpy allows it.
+
+    Args:
+        code (segno.QRCode): The encoded symbol.
+        scale (int): Size of a single module in pixels.
+        border (int | None): Quiet zone in modules, None means the symbol's default.
+
+    Yields:
+        bytes: Packed pixels (dark = 0, light = 1) of one module row.
+    """
+    if raster.use_numpy():
+        yield from raster.packed_rows(code, scale, border)
+    else:
+        for row in code.matrix_iter(scale=1, border=border):
+            yield pack_row(row, scale)
+
+
+def write_png(code, out, scale: int = 1, border: int | None = None) -> int:
+    """
+    Streams a QR code as PNG into a writable binary file object.
+
+    Args:
+        code (segno.QRCode): The encoded symbol.
+        out: Object with a write(bytes) method, e.g. an open file or a socket file.
+        scale (int): Size of a single module in pixels.
+        border (int | None): Quiet zone in modules, None means the symbol's default.
+
+    Returns:
+        int: Number of bytes written.
+    """
+    width, height = code.symbol_size(scale=scale, border=border)
+    written = 0
+    for piece in iter_png(packed_lines(code, scale, border), width, height, scale):
+        out.write(piece)
+        written += len(piece)
+    return written
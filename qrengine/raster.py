@@ -0,0 +1,87 @@
+"""
+NumPy fast path for rasterizing QR code module matrices.
+
+NumPy is optional: HAS_NUMPY tells whether it is installed and qrengine.pngstream
+falls back to its pure Python packing otherwise. Importing NumPy costs more than
+packing a single image in pure Python, so it is only imported once a process
+rasterizes its second image (see use_numpy).
+"""
+import importlib.util
+import sys
+
+HAS_NUMPY = importlib.util.find_spec("numpy") is not None
+
+_first_image = True
+
+
+def use_numpy() -> bool:
+    """
+    Returns whether the next image should be rasterized with NumPy.
+    One-shot processes that only write one image never pay for the NumPy import.
+
+    Returns:
+        bool: True if NumPy is installed and either already imported or this is not the first image.
+    """
+    global _first_image
+    if not HAS_NUMPY:
+        return False
+    if "numpy" in sys.modules or not _first_image:
+        return True
+    _first_image = False
+    return False
+
+
+def module_array(code, border: int | None = None):
+    """
+    Returns the module matrix including the quiet zone.
+
+    Args:
+        code (segno.QRCode): The encoded symbol.
+        border (int | None): Quiet zone in modules, None means the symbol's default.
+
+    Returns:
+        numpy.ndarray: 2D uint8 array, 1 = dark, 0 = light.
+    """
+    import numpy as np
+    matrix = np.array(code.matrix, dtype=np.uint8)
+    width = code.symbol_size(scale=1, border=border)[0]
+    quiet_zone = (width - matrix.shape[1]) // 2
+    return np.pad(matrix, quiet_zone)
+
+
+def rasterize(code, scale: int = 1, border: int | None = None):
+    """
+    Returns the full bitmap of a symbol.
+
+    Args:
+        code (segno.QRCode): The encoded symbol.
+        scale (int): Size of a single module in pixels.
+        border (int | None): Quiet zone in modules, None means the symbol's default.
+
+    Returns:
+        numpy.ndarray: 2D bool array, True = dark.
+    """
+    import numpy as np
+    modules = module_array(code, border).astype(bool)
+    return np.repeat(np.repeat(modules, scale, axis=0), scale, axis=1)
+
+
+def packed_rows(code, scale: int = 1, border: int | None = None):
+    """
+    Yields every module row as one packed 1-bit scanline (dark = 0, light = 1).
+
+    Only the horizontal expansion is done here; repeating the line `scale` times is
+    left to the PNG writer, so memory stays proportional to the image width.
+
+    Args:
+        code (segno.QRCode): The encoded symbol.
+        scale (int): Size of a single module in pixels.
+        border (int | None): Quiet zone in modules, None means the symbol's default.
+
+    Yields:
+        bytes: Packed pixels of one module row, without the PNG filter byte.
+    """
+    import numpy as np
+    light = module_array(code, border) == 0
+    for row in light:
+        yield np.packbits(np.repeat(row, scale)).tobytes()
@@ -0,0 +1,81 @@
+"""
+Result object that keeps an encoded symbol together with its rendered outputs.
+"""
+from .cache import RenderCache, cache_key, output_size
+from .core import EncodeOptions, RenderOptions, make_code, render
+from .timing import Timing
+
+
+class GeneratedCode:
+    """
+    An encoded symbol plus every output rendered from it so far.
+
+    The symbol is encoded lazily on first use; each distinct RenderOptions is
+    rendered at most once, so showing and downloading the same code reuse the bytes.
+    With a RenderCache, outputs already rendered for an identical payload are
+    returned without encoding the symbol at all.
+    """
+
+    def __init__(self, kind: str, payload: dict, cache: RenderCache | None = None,
+                 encode_opts: EncodeOptions | None = None):
+        """
+        Args:
+            kind (str): One of qrengine.KINDS.
+            payload (dict): The content of the code.
+            cache (RenderCache | None): Shared render cache.
+            encode_opts (EncodeOptions | None): Pinned version, error level or mask.
+        """
+        self.kind = kind
+        self.payload = dict(payload)
+        self.cache = cache
+        self.encode_opts = encode_opts
+        self._code = None
+        self._outputs = {}
+
+    @property
+    def code(self):
+        """
+        The encoded segno.QRCode or barcode object.
+        """
+        if self._code is None:
+            self._code = make_code(self.kind, self.payload, self.encode_opts)
+        return self._code
+
+    def matches(self, kind: str, payload: dict, encode_opts: EncodeOptions | None = None) -> bool:
+        """
+        Returns whether this result was generated from the given type, payload and encoding options.
+        """
+        return self.kind == kind and self.payload == payload and self.encode_opts == encode_opts
+
+    def render(self, render_opts: RenderOptions | None = None, timing: Timing | None = None) -> bytes | tuple:
+        """
+        Returns the rendered output, rendering it on first request only.
+
+        Args:
+            render_opts (RenderOptions | None): Output options, defaults to PNG.
+            timing (Timing | None): Receives the cache, encode and render stages that actually ran.
+
+        Returns:
+            bytes for "png"/"svg", a tuple of rows for "matrix".
+        """
+        opts = render_opts or RenderOptions()
+        if opts in self._outputs:
+            return self._outputs[opts]
+        timing = timing or Timing("render", self.kind)
+        output = None
+        if self.cache is not None:
+            key = cache_key(self.kind, self.payload, opts, self.encode_opts)
+            with timing.stage("cache") as stage:
+                output = self.cache.get(key)
+                stage.size = None if output is None else output_size(output)
+        if output is None:
+            if self._code is None:
+                with timing.stage("encode"):
+                    self._code = make_code(self.kind, self.payload, self.encode_opts)
+            with timing.stage("render") as stage:
+                output = render(self._code, opts)
+                stage.size = output_size(output)
+            if self.cache is not None:
+                self.cache.put(key, output)
+        self._outputs[opts] = output
+        return output
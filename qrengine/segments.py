@@ -0,0 +1,170 @@
+"""
+Optimal segmentation of text and links into numeric, alphanumeric and byte segments.
+
+Encoded as one segment, content that is mostly lower case or punctuation is
+byte mode throughout, so digit runs cost 8 bits per digit instead of 3.33 and
+upper case runs 8 bits per character instead of 5.5. split() finds the cheapest
+segmentation by dynamic programming over the characters: for every mode it
+keeps the cheapest encoding of the prefix that ends in that mode, so the
+search is linear in the content length. Costs are counted in sixths of a bit,
+which makes the 10-bits-per-3-digits and 11-bits-per-2-characters groups exact.
+
+The mode and count indicators of every extra segment cost 12-24 bits, and the
+count indicator lengths depend on the version range, so optimize() splits once
+per range and keeps the segmentation only if it leads to a smaller version
+than the single segment segno would otherwise use.
+"""
+from dataclasses import dataclass
+
+from .capacity import ALPHANUMERIC, DATA_BITS, ERRORS, Estimate, boost, estimate_content, segment_bits
+from .charsets import DEFAULT, ECI_BITS, Charset
+from .core import EncodeOptions
+
+MODES = ("numeric", "alphanumeric", "byte")
+MODE_INDICATORS = {"numeric": 1, "alphanumeric": 2, "byte": 4}  # Mode values segno expects in segment tuples
+DIGITS = frozenset("0123456789")
+VERSION_RANGES = (range(1, 10), range(10, 27), range(27, 41))  # Versions sharing the count indicator lengths
+
+
+@dataclass(frozen=True)
+class Segmentation:
+    """
+    The chosen encoding of a text or link.
+
+    Attributes:
+        text (str): The content.
+        segments (tuple): (text, mode) pairs; empty if the content is encoded as a single segment.
+        encoding (str): Encoding of the byte segments.
+        estimate (Estimate): The symbol the content will get.
+    """
+    text: str
+    segments: tuple
+    encoding: str
+    estimate: Estimate
+
+    @property
+    def split(self) -> bool:
+        return bool(self.segments)
+
+    @property
+    def error(self) -> str | None:
+        """
+        Error level of the symbol; segno only boosts it for single segments, so it is passed explicitly.
+        """
+        return self.estimate.designator.split("-")[1] if self.estimate.fits else None
+
+    def content(self):
+        """
+        Returns the content argument of segno.make_qr: the text, or a list of (text, mode, encoding) tuples.
+        """
+        if not self.segments:
+            return self.text
+        return [(text, MODE_INDICATORS[mode], self.encoding if mode == "byte" else None)
+                for text, mode in self.segments]
+
+
+def char_costs(char: str, encoding: str) -> tuple:
+    """
+    Returns the cost of a character in sixths of a bit per mode (None where the mode cannot hold it).
+    """
+    return (20 if char in DIGITS else None,
+            33 if char in ALPHANUMERIC else None,
+            48 * len(char.encode(encoding)))
+
+
+def split(text: str, version: int, encoding: str = "iso-8859-1", eci: bool = False) -> list[tuple[str, str]]:
+    """
+    Returns the segmentation of text with the fewest bits at the given version.
+
+    Args:
+        text (str): The content, not empty.
+        version (int): Any version of the range whose count indicator lengths are used.
+        encoding (str): Encoding of the byte segments.
+        eci (bool): Every byte segment starts with an ECI header.
+
+    Returns:
+        list[tuple[str, str]]: (text, mode) pairs in order.
+    """
+    inf = 1 << 62  # An int, as float("inf") // 6 is nan
+    heads = [(segment_bits(mode, 0, version) + (ECI_BITS if eci and mode == "byte" else 0)) * 6 for mode in MODES]
+    costs = [head + (cost if cost is not None else inf)
+             for head, cost in zip(heads, char_costs(text[0], encoding))]
+    parents = [(0, 1, 2)]  # parents[i][m]: mode of character i - 1 on the cheapest path that has character i in mode m
+    for char in text[1:]:
+        closed = [-(-cost // 6) * 6 for cost in costs]  # A segment ends on a whole bit
+        previous = min(range(len(MODES)), key=closed.__getitem__)
+        new, parent = [], []
+        for mode, cost in enumerate(char_costs(char, encoding)):
+            if cost is None:
+                new.append(inf)
+                parent.append(mode)
+                continue
+            keep = costs[mode] + cost
+            switch = closed[previous] + heads[mode] + cost
+            if keep <= switch:
+                new.append(keep)
+                parent.append(mode)
+            else:
+                new.append(switch)
+                parent.append(previous)
+        costs = new
+        parents.append(tuple(parent))
+    mode = min(range(len(MODES)), key=lambda m: -(-costs[m] // 6))
+    modes = []
+    for parent in reversed(parents):
+        modes.append(mode)
+        mode = parent[mode]
+    modes.reverse()
+    segments, start = [], 0
+    for i in range(1, len(text) + 1):
+        if i == len(text) or modes[i] != modes[start]:
+            segments.append((text[start:i], MODES[modes[start]]))
+            start = i
+    return segments
+
+
+def optimize(text: str, error: str | None = None, version: int | None = None,
+             charset: Charset = DEFAULT) -> Segmentation:
+    """
+    Splits text into segments if that leads to a smaller QR code than a single segment.
+
+    Args:
+        text (str): The content of a text or link QR code.
+        error (str | None): Pinned error level, otherwise the level is boosted within the version.
+        version (int | None): Pinned version.
+        charset (Charset): Encoding of the byte data (see qrengine.charsets).
+
+    Returns:
+        Segmentation: The segments (if any) and the resulting symbol.
+    """
+    single = estimate_content(text, encode_opts=EncodeOptions(error=error, version=version), charset=charset)
+    if not text or single.mode in ("numeric", "kanji"):  # Nothing is cheaper than numeric
+        return Segmentation(text, (), "", single)
+    encoding = charset.encoding
+    if encoding is None:
+        try:
+            text.encode("iso-8859-1")
+            encoding = "iso-8859-1"
+        except UnicodeError:
+            encoding = "utf-8"
+    pinned = error.upper() if error else None
+    for versions in VERSION_RANGES:
+        if version is not None:
+            if int(version) not in versions:
+                continue
+            versions = [int(version)]
+        segments = split(text, versions[0], encoding, charset.eci)
+        bits = sum(segment_bits(mode, len(part.encode(encoding)), versions[0]) + ECI_BITS * charset.eci
+                   if mode == "byte" else segment_bits(mode, len(part), versions[0])
+                   for part, mode in segments)
+        for candidate in versions:
+            capacities = dict(zip(ERRORS, DATA_BITS[candidate]))
+            if capacities[pinned or "L"] < bits:
+                continue
+            if len(segments) < 2 or (single.fits and int(single.designator.split("-")[0]) <= candidate):
+                return Segmentation(text, (), "", single)
+            level = pinned or boost(capacities, "L", bits)
+            return Segmentation(text, tuple(segments), encoding,
+                                Estimate(f"{candidate}-{level}", "mixed", bits, capacities[level],
+                                         segments=len(segments), single=single.designator))
+    return Segmentation(text, (), "", single)
@@ -0,0 +1,427 @@
+"""
+Small HTTP generation API built on the standard library.
+
+Endpoints:
+    POST /generate/{kind}  JSON object with the same fields as the front end input
+                           dictionaries; returns PNG, SVG or a JSON module matrix.
+    POST /batch            CSV or JSONL body (see qrengine.batch), parsed while it is
+                           received; returns a ZIP streamed with chunked transfer
+                           encoding, failed rows listed in errors.txt.
+    GET /metrics           Prometheus metrics (see qrengine.metrics).
+    GET /r/{code}          Redirect of a short link (see qrengine.shortlinks), if the
+                           server was started with a link store.
+
+Query parameters select the output: format (png, svg, matrix), scale, size, border,
+and the encoding: error (L, M, Q, H), version, mask, fast (skip the mask evaluation)
+and utf8 (UTF-8 instead of the smallest ECI charset).
+Payloads that cannot fit into a QR code are answered with 400 before any encoding,
+and /generate bodies larger than the server's max_body with 413 before they are read.
+Generation runs in a bounded thread or process pool; every job of a batch takes a
+pending slot like a single request does. Connections are kept alive
+(HTTP/1.1) and every response carries latency headers; for a streamed batch they
+measure the time until the archive starts. Generated outputs are kept in a
+RenderCache, so repeated requests skip the worker pool.
+"""
+import io
+import itertools
+import json
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, urlsplit
+
+from . import batch
+from .archive import iter_zip
+from .cache import RenderCache, cache_key
+from .capacity import CapacityError, check
+from .core import ERRORS, KINDS, OUTPUTS, EncodeOptions, RenderOptions, generate
+from .metrics import CONTENT_TYPE as METRICS_CONTENT_TYPE
+from .metrics import GenerationMetrics
+from .shortlinks import LinkStore
+
+CONTENT_TYPES = {"png": "image/png", "svg": "image/svg+xml", "matrix": "application/json"}
+BATCH_FORMATS = ("csv", "jsonl")
+BODY_CHUNK_SIZE = 64 * 1024  # Bytes read at a time when an unused request body is skipped
+MAX_BODY_SIZE = 1024 * 1024  # Default limit of a /generate body; the largest QR payload is below 8 KB
+
+
+def timed_generate(kind: str, payload: dict, render_opts: RenderOptions,
+                   encode_opts: EncodeOptions | None = None) -> tuple[bytes | tuple, float]:
+    """
+    Generates a code and returns it together with the time it took in seconds.
+    Runs inside the worker pool, so the time excludes queueing.
+    """
+    start = time.perf_counter()
+    output = generate(kind, payload, render_opts, encode_opts)
+    return output, time.perf_counter() - start
+
+
+def render_options(query: dict) -> RenderOptions:
+    """
+    Builds RenderOptions from parsed query parameters.
+    """
+    def number(name):
+        return int(query[name][0]) if name in query else None
+
+    output = query.get("format", ["png"])[0]
+    if output not in OUTPUTS:
+        raise ValueError(f"Unknown output format: {output!r}")
+    return RenderOptions(output=output, scale=number("scale") or 10, border=number("border"), size=number("size"))
+
+
+def encode_options(query: dict) -> EncodeOptions | None:
+    """
+    Builds EncodeOptions from parsed query parameters, None if none of them is given.
+    """
+    if not any(name in query for name in ("error", "version", "mask", "fast", "utf8")):
+        return None
+    error = query.get("error", [None])[0]
+    if error is not None and error.upper() not in ERRORS:
+        raise ValueError(f"Unknown error correction level: {error!r}")
+    version = query.get("version", [None])[0]
+    if version is not None and version.isdigit():
+        version = int(version)
+    mask = int(query["mask"][0]) if "mask" in query else None
+    fast = query.get("fast", ["0"])[0].lower() in ("1", "true", "yes", "")
+    utf8 = query.get("utf8", ["0"])[0].lower() in ("1", "true", "yes", "")
+    return EncodeOptions(error=error and error.upper(), version=version, mask=mask, fast=fast, utf8=utf8)
+
+
+class RequestBody(io.RawIOBase):
+    """
+    Readable stream of a request body of known length, so large bodies are parsed while they are received.
+    """
+
+    def __init__(self, rfile, length: int):
+        """
+        Args:
+            rfile: The connection's input file object.
+            length (int): Content-Length of the request.
+        """
+        super().__init__()
+        self.rfile = rfile
+        self.remaining = length
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        size = min(len(buffer), self.remaining)
+        if size <= 0:
+            return 0
+        data = self.rfile.read(size)
+        buffer[:len(data)] = data
+        self.remaining -= len(data)
+        if not data:
+            self.remaining = 0  # Connection closed early
+        return len(data)
+
+    def discard(self) -> None:
+        """
+        Reads and drops the rest of the body, so the connection can be kept alive after an early response.
+        """
+        while self.remaining > 0 and self.read(min(self.remaining, BODY_CHUNK_SIZE)):
+            pass
+
+
+class SlotExecutor:
+    """
+    Executor wrapper whose jobs each hold one of the server's pending slots until they finish.
+
+    Used for batches: submit() waits for a free slot, so the jobs a batch keeps in flight
+    count against max_pending like single requests and never queue up beyond it.
+    """
+
+    def __init__(self, executor, slots: threading.Semaphore):
+        """
+        Args:
+            executor: The server's concurrent.futures executor.
+            slots (threading.Semaphore): The server's pending slots.
+        """
+        self.executor = executor
+        self.slots = slots
+
+    def submit(self, fn, *args, **kwargs):
+        self.slots.acquire()
+        try:
+            future = self.executor.submit(fn, *args, **kwargs)
+        except BaseException:
+            self.slots.release()
+            raise
+        future.add_done_callback(lambda _: self.slots.release())
+        return future
+
+
+class GenerationServer(ThreadingHTTPServer):
+    """
+    Threading HTTP server that hands generation to a bounded worker pool.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], executor, workers: int, max_pending: int,
+                 cache: RenderCache | None = None, links: LinkStore | None = None, max_body: int = MAX_BODY_SIZE):
+        """
+        Args:
+            address (tuple[str, int]): Host and port to listen on.
+            executor: concurrent.futures executor that runs the generation.
+            workers (int): Size of the executor.
+            max_pending (int): Requests allowed to wait for or occupy a worker;
+                further requests are answered with 503.
+            cache (RenderCache | None): Cache of generated responses, None to disable.
+            links (LinkStore | None): Store of short links answered under /r/, None to disable.
+            max_body (int): Largest /generate body in bytes; larger ones are answered with 413.
+        """
+        super().__init__(address, GenerationHandler)
+        self.executor = executor
+        self.workers = workers
+        self.slots = threading.BoundedSemaphore(max_pending)
+        self.cache = cache
+        self.metrics = GenerationMetrics(cache)
+        self.links = links
+        self.max_body = max_body
+
+
+class GenerationHandler(BaseHTTPRequestHandler):
+    """
+    Request handler of GenerationServer.
+    """
+    protocol_version = "HTTP/1.1"  # Keep-alive
+    server_version = "qrengine"
+    status = None  # Status of the last response sent on this connection
+
+    def do_GET(self):
+        start = time.perf_counter()
+        path = urlsplit(self.path).path
+        parts = path.strip("/").split("/")
+        if path == "/metrics":
+            self.send_body(200, METRICS_CONTENT_TYPE, self.server.metrics.render(), start)
+        elif len(parts) == 2 and parts[0].lower() == "r" and self.server.links is not None:
+            self.redirect(parts[1], start)
+        else:
+            self.send_text(404, "Not found", start)
+
+    def do_POST(self):
+        start = time.perf_counter()
+        url = urlsplit(self.path)
+        try:
+            length = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            self.close_connection = True  # The end of the body is unknown
+            self.send_text(400, "Invalid Content-Length", start)
+            return
+        body = RequestBody(self.rfile, length)
+        try:
+            query = parse_qs(url.query, keep_blank_values=True)
+            opts = render_options(query)
+            encode_opts = encode_options(query)
+        except ValueError as e:
+            body.discard()
+            self.send_text(400, str(e), start)
+            return
+        parts = url.path.strip("/").split("/")
+        if len(parts) == 2 and parts[0] == "generate":
+            self.generate(parts[1], body, opts, encode_opts, start)
+        elif parts == ["batch"]:
+            self.batch(body, query, opts, encode_opts, start)
+        else:
+            body.discard()
+            self.send_text(404, "Not found", start)
+
+    def generate(self, kind: str, body: RequestBody, opts: RenderOptions, encode_opts: EncodeOptions | None,
+                 start: float):
+        """
+        Answers POST /generate/{kind} and records the request in the server metrics.
+        A body above the server's max_body is answered with 413 without reading it.
+        """
+        name = next((k for k in KINDS if k.lower() == kind.lower()), None)
+        error = output = self.status = None
+        try:
+            if body.remaining > self.server.max_body:
+                error = "BodyTooLarge"
+                self.close_connection = True  # The body is left unread
+                self.send_text(413, f"Body of {body.remaining} bytes exceeds the limit of {self.server.max_body}",
+                               start)
+                return
+            data = body.read()
+            if name is None:
+                self.send_text(404, f"Unknown code type: {kind!r}", start)
+                return
+            try:
+                kind, payload = batch.parse_row({**json.loads(data or b"{}"), "type": name})
+            except (ValueError, TypeError) as e:
+                error = type(e).__name__
+                self.send_text(400, f"Invalid payload: {e}", start)
+                return
+            try:
+                check(kind, payload, encode_opts)
+            except CapacityError as e:
+                error = type(e).__name__
+                self.send_text(400, str(e), start)
+                return
+            except Exception as e:  # E.g. KeyError of a missing field, answered like a failed encode
+                error = type(e).__name__
+                self.send_text(400, f"{error}: {e}", start)
+                return
+            key = cache_key(kind, payload, opts, encode_opts)
+            output = self.server.cache.get(key) if self.server.cache is not None else None
+            if output is not None:
+                self.send_body(200, CONTENT_TYPES[opts.output], output, start, timings={"cache": 0.0})
+                return
+            if not self.server.slots.acquire(blocking=False):
+                self.send_text(503, "Too many pending requests", start)
+                return
+            try:
+                queued = time.perf_counter()
+                future = self.server.executor.submit(timed_generate, kind, payload, opts, encode_opts)
+                output, render_time = future.result()
+            except Exception as e:
+                error = type(e).__name__
+                self.send_text(400, f"{error}: {e}", start)
+                return
+            finally:
+                self.server.slots.release()
+            if opts.output == "matrix":
+                output = json.dumps(output, separators=(",", ":")).encode("utf-8")
+            if self.server.cache is not None:
+                self.server.cache.put(key, output)
+            queue_time = time.perf_counter() - queued - render_time
+            self.send_body(200, CONTENT_TYPES[opts.output], output, start,
+                           timings={"queue": queue_time, "render": render_time})
+        finally:
+            status = "ok" if self.status == 200 else "rejected" if self.status == 503 else "error"
+            self.server.metrics.observe(name or "unknown", time.perf_counter() - start, status, opts.output,
+                                        size=len(output) if status == "ok" else None, error=error)
+
+    def batch(self, body: RequestBody, query: dict, opts: RenderOptions, encode_opts: EncodeOptions | None,
+              start: float):
+        """
+        Answers POST /batch with a chunked ZIP; failed rows are listed in errors.txt inside it.
+        The input format is checked on the first row before the response starts, so a body that is not
+        CSV or JSONL at all is answered with 400. A batch is only started while a pending slot is
+        free; each of its jobs then waits for a slot of its own (see SlotExecutor).
+        """
+        fmt = query.get("input", [None])[0]
+        if fmt is None:
+            fmt = "jsonl" if "json" in self.headers.get("Content-Type", "") else "csv"
+        error = self.status = None
+        size = 0
+        try:
+            if fmt not in BATCH_FORMATS:
+                error = "ValueError"
+                body.discard()
+                self.send_text(400, f"Unknown input format: {fmt!r}, expected one of {', '.join(BATCH_FORMATS)}", start)
+                return
+            if not self.server.slots.acquire(blocking=False):
+                body.discard()
+                self.send_text(503, "Too many pending requests", start)
+                return
+            self.server.slots.release()  # Its jobs take slots one by one
+            try:
+                stream = io.TextIOWrapper(io.BufferedReader(body), encoding="utf-8-sig", newline="")
+                rows = batch.read_rows(stream, fmt)
+                first = next(rows, None)
+                if isinstance(first, batch.InvalidRow):
+                    error = type(first.error).__name__
+                    body.discard()
+                    self.send_text(400, f"Invalid {fmt} body: {first.error}", start)
+                    return
+                rows = itertools.chain([first] if first is not None else [], rows)
+                self.status = 200
+                self.send_response(200)
+                self.send_header("Content-Type", "application/zip")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.send_timing_headers(start)
+                self.end_headers()
+                executor = SlotExecutor(self.server.executor, self.server.slots)
+                results = batch.run_batch(rows, opts, workers=self.server.workers, executor=executor,
+                                          encode_opts=encode_opts)
+                for piece in iter_zip(results, errors_name="errors.txt"):
+                    if piece:
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(piece), piece))
+                        size += len(piece)
+                self.wfile.write(b"0\r\n\r\n")
+            except Exception as e:
+                error = type(e).__name__
+                raise
+        finally:
+            status = "rejected" if self.status == 503 else "error" if error else "ok"
+            self.server.metrics.observe("Batch", time.perf_counter() - start, status, "zip",
+                                        size=size if status == "ok" else None, error=error)
+
+    def redirect(self, code: str, start: float):
+        """
+        Answers GET /r/{code} with a redirect to the stored URL; codes are matched case-insensitively.
+        """
+        url = self.server.links.resolve(code)
+        if url is None:
+            self.send_text(404, f"Unknown short link: {code!r}", start)
+            return
+        self.status = 302
+        self.send_response(302)
+        self.send_header("Location", quote(url, safe=":/?#[]@!$&'()*+,;=%~"))  # Headers are ASCII
+        self.send_header("Content-Length", "0")
+        self.send_timing_headers(start)
+        self.end_headers()
+
+    def send_text(self, status: int, text: str, start: float):
+        """
+        Sends a plain text response.
+        """
+        self.send_body(status, "text/plain; charset=utf-8", text.encode("utf-8"), start)
+
+    def send_body(self, status: int, content_type: str, body: bytes, start: float, timings: dict | None = None):
+        """
+        Sends a complete response with Content-Length and latency headers.
+        """
+        self.status = status
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_timing_headers(start, timings)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_timing_headers(self, start: float, timings: dict | None = None):
+        """
+        Sends the Server-Timing and X-Response-Time-Ms headers; total is the time since start.
+        """
+        timings = {**(timings or {}), "total": time.perf_counter() - start}
+        self.send_header("Server-Timing", ", ".join(f"{name};dur={seconds * 1000:.2f}" for name, seconds in timings.items()))
+        self.send_header("X-Response-Time-Ms", f"{timings['total'] * 1000:.2f}")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host: str = "127.0.0.1", port: int = 8000, workers: int | None = None,
+          processes: bool = False, max_pending: int | None = None, links: str | None = None,
+          max_body: int = MAX_BODY_SIZE):
+    """
+    Runs the generation API until interrupted.
+
+    Args:
+        host (str): Interface to listen on.
+        port (int): Port to listen on.
+        workers (int | None): Pool size, defaults to the number of CPU cores.
+        processes (bool): Use a process pool instead of a thread pool.
+        max_pending (int | None): Bound of queued plus running requests, defaults to 4 per worker.
+        links (str | None): SQLite file of a LinkStore whose short links are redirected under /r/.
+        max_body (int): Largest /generate body in bytes; larger ones are answered with 413.
+    """
+    workers = workers or os.cpu_count() or 1
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    with executor_class(max_workers=workers) as executor:
+        store = LinkStore(links) if links else None
+        server = GenerationServer((host, port), executor, workers, max_pending or workers * 4, RenderCache(), store,
+                                  max_body)
+        print(f"Serving on http://{host}:{port} with {workers} {'process' if processes else 'thread'} workers")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if store is not None:
+                store.close()
@@ -0,0 +1,236 @@
+"""
+Short-link mode: long URLs are stored locally and encoded as a short redirect URL.
+
+A tracking URL of a few hundred characters needs a QR code of version 10 or
+more. LinkStore keeps such URLs in a SQLite table and hands out a code per URL:
+a random row id of CODE_LENGTH base 36 digits, drawn with the secrets module so
+that the stored links cannot be enumerated by counting up. The short URL, e.g.
+HTTP://127.0.0.1:8000/R/7Q2LKCB, consists of upper case letters, digits and :/.
+only, so it is encoded in alphanumeric mode and stays at version 1 or 2
+whatever the length of the original. The /r/{code} route of qrengine.server
+answers it with a redirect; it matches the route and the code
+case-insensitively. The scheme, host and code of a short URL are uppercased;
+the path of the configured base URL is kept as given, since another redirect
+server may not ignore its case.
+
+Both lookups stay fast with millions of rows. A code is the INTEGER PRIMARY KEY,
+i.e. the key of the table's own B-tree, so resolving it needs no extra index.
+Every URL gets a single code; the URL-to-code lookup goes through an index on a
+64-bit hash of the URL instead of the URL text, so the index takes a few bytes
+per row whatever the length of the URLs. add_many() imports URLs in chunks of
+one transaction each, looking the known ones up a few hundred at a time and
+inserting the new ones with a single executemany().
+"""
+import hashlib
+import itertools
+import secrets
+import sqlite3
+import threading
+import time
+from urllib.parse import urlsplit
+
+from .urls import canonicalize
+
+ALPHABET = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"  # Digits of the codes, all in the QR alphanumeric set
+CODE_LENGTH = 7  # Digits of a new code: 36 ** 7 is about 78 billion, so random codes rarely collide
+FIRST_ID = len(ALPHABET) ** (CODE_LENGTH - 1)  # Smallest row id with CODE_LENGTH digits
+SCHEMES = ("http", "https")  # Only web links are redirected to
+LOOKUP_SIZE = 500  # Digests per SELECT ... IN query, below SQLite's limit of bound parameters
+DEFAULT_PATH = "links.sqlite3"
+DEFAULT_BASE_URL = "http://127.0.0.1:8000/R/"  # The redirect route of `python -m qrengine serve`, any case
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    id INTEGER PRIMARY KEY,  -- The code, in base 36; random
+    digest INTEGER NOT NULL,  -- First 8 bytes of the SHA-256 of the URL
+    url TEXT NOT NULL,
+    created INTEGER NOT NULL  -- Unix time
+);
+CREATE INDEX IF NOT EXISTS links_digest ON links (digest);
+"""
+
+
+def encode_code(number: int) -> str:
+    """
+    Returns the base 36 code of a row id, e.g. 1000 -> "RS".
+    """
+    digits = []
+    while True:
+        number, digit = divmod(number, len(ALPHABET))
+        digits.append(ALPHABET[digit])
+        if not number:
+            return "".join(reversed(digits))
+
+
+def random_id() -> int:
+    """
+    Returns a random row id whose code has CODE_LENGTH digits.
+    """
+    return FIRST_ID + secrets.randbelow(len(ALPHABET) ** CODE_LENGTH - FIRST_ID)
+
+
+def decode_code(code: str) -> int | None:
+    """
+    Returns the row id of a code in either case, None if it is not a code.
+    """
+    if not code or len(code) > 12 or not code.isalnum() or not code.isascii():
+        return None
+    return int(code, 36)
+
+
+def url_digest(url: str) -> int:
+    """
+    Returns the 64-bit hash of a URL as a signed integer, which SQLite stores in 8 bytes.
+    """
+    return int.from_bytes(hashlib.sha256(url.encode("utf-8")).digest()[:8], "big", signed=True)
+
+
+def shortenable(url: str) -> bool:
+    """
+    Returns whether a URL can be shortened: an absolute http or https URL.
+    """
+    parts = urlsplit(url.strip())
+    return parts.scheme.lower() in SCHEMES and bool(parts.netloc)
+
+
+class LinkStore:
+    """
+    Thread-safe SQLite table of shortened URLs.
+    """
+
+    def __init__(self, path: str = DEFAULT_PATH, base_url: str = DEFAULT_BASE_URL):
+        """
+        Args:
+            path (str): SQLite database file, created if missing; ":memory:" for a temporary store.
+            base_url (str): URL of the redirect route the codes are appended to.
+        """
+        self.path = path
+        self.base_url = base_url
+        self._lock = threading.Lock()
+        # Autocommit, transactions are opened explicitly
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            if path != ":memory:":
+                self._connection.execute("PRAGMA journal_mode=WAL")  # Redirects read while imports write
+                self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+
+    def short_url(self, code: str) -> str:
+        """
+        Returns the short URL of a code, e.g. HTTP://127.0.0.1:8000/R/7Q2LKCB.
+        The scheme, host and code are uppercased; the path of the base URL keeps its case.
+        """
+        return f"{canonicalize(self.base_url).rstrip('/')}/{code.upper()}"
+
+    def _find(self, url: str) -> int | None:
+        row = self._connection.execute("SELECT id FROM links WHERE digest = ? AND url = ?",
+                                       (url_digest(url), url)).fetchone()
+        return row[0] if row else None
+
+    def _add(self, urls: list) -> list[str]:
+        """
+        Stores a chunk of URLs inside an open write transaction and returns their codes.
+        """
+        for url in urls:
+            if not shortenable(url):
+                raise ValueError(f"Only absolute http and https URLs can be shortened: {url!r}")
+        urls = [url.strip() for url in urls]
+        digests = [url_digest(url) for url in urls]
+        known = {}
+        for start in range(0, len(digests), LOOKUP_SIZE):
+            part = digests[start:start + LOOKUP_SIZE]
+            rows = self._connection.execute(
+                f"SELECT digest, url, id FROM links WHERE digest IN ({','.join('?' * len(part))})", part)
+            known.update(((digest, url), number) for digest, url, number in rows)
+        new = list(dict.fromkeys(key for key in zip(digests, urls) if key not in known))
+        # The write lock of BEGIN IMMEDIATE is held, so no other writer can take the free ids
+        known.update(zip(new, self._free_ids(len(new))))
+        now = int(time.time())
+        self._connection.executemany("INSERT INTO links (id, digest, url, created) VALUES (?, ?, ?, ?)",
+                                     [(known[key], *key, now) for key in new])
+        return [encode_code(known[key]) for key in zip(digests, urls)]
+
+    def _free_ids(self, count: int) -> list[int]:
+        """
+        Draws distinct random row ids that are not stored yet, drawing again for the ones that are.
+        """
+        numbers, taken = [], set()
+        while len(numbers) < count:
+            drawn = list({random_id() for _ in range(count - len(numbers))} - taken)
+            for start in range(0, len(drawn), LOOKUP_SIZE):
+                part = drawn[start:start + LOOKUP_SIZE]
+                rows = self._connection.execute(
+                    f"SELECT id FROM links WHERE id IN ({','.join('?' * len(part))})", part)
+                taken.update(number for number, in rows)
+            free = [number for number in drawn if number not in taken]
+            taken.update(free)
+            numbers += free
+        return numbers
+
+    def shorten(self, url: str) -> str:
+        """
+        Stores a URL and returns its code; a URL that is already stored keeps its code.
+
+        Raises:
+            ValueError: If the URL is not an absolute http or https URL.
+        """
+        return next(self.add_many([url]))
+
+    def add_many(self, urls, chunk_size: int = 10_000):
+        """
+        Lazily stores URLs, committing one transaction per chunk.
+
+        Args:
+            urls: Iterable of URLs.
+            chunk_size (int): URLs per transaction.
+
+        Yields:
+            str: The code of every URL, in order.
+
+        Raises:
+            ValueError: If a URL cannot be shortened; the URLs of its chunk are not stored.
+        """
+        urls = iter(urls)
+        while chunk := list(itertools.islice(urls, chunk_size)):
+            with self._lock:
+                self._connection.execute("BEGIN IMMEDIATE")
+                try:
+                    codes = self._add(chunk)
+                except BaseException:
+                    self._connection.execute("ROLLBACK")
+                    raise
+                self._connection.execute("COMMIT")
+            yield from codes
+
+    def peek(self, url: str) -> str:
+        """
+        Returns the code of a URL without storing it: its code if it is stored, otherwise a placeholder.
+        Used for previews. The placeholder has the length of a new code, so the short URL takes as
+        much space as the stored one, but storing the URL draws a different, random code.
+
+        Raises:
+            ValueError: If the URL is not an absolute http or https URL.
+        """
+        if not shortenable(url):
+            raise ValueError(f"Only absolute http and https URLs can be shortened: {url!r}")
+        with self._lock:
+            number = self._find(url.strip())
+        return encode_code(FIRST_ID if number is None else number)
+
+    def resolve(self, code: str) -> str | None:
+        """
+        Returns the URL of a code, None if it is unknown.
+        """
+        number = decode_code(code)
+        if number is None:
+            return None
+        with self._lock:
+            row = self._connection.execute("SELECT url FROM links WHERE id = ?", (number,)).fetchone()
+        return row[0] if row else None
+
+    def close(self):
+        """
+        Closes the database connection.
+        """
+        with self._lock:
+            self._connection.close()
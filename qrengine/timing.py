@@ -0,0 +1,168 @@
+"""
+Per-stage timing of the generation pipeline.
+
+A Timing collects the duration, and optionally the byte size, of the stages
+of one operation. For example, a generate call has an encode stage and a
+render stage, and a display call has a render stage and an image transfer
+stage. Finished timings go into a TimingLog. The log is a fixed-size ring
+buffer that can be dumped as JSON. Recording a stage costs two perf_counter
+calls and a list append, so instrumentation can stay on in production.
+"""
+import datetime
+import json
+import threading
+import time
+from collections import deque
+
+LOG_SIZE = 500  # Operations kept by a TimingLog before the oldest are dropped
+
+
+class Stage:
+    """
+    Context manager that measures one stage of a Timing.
+
+    Set size inside the with block to record the number of bytes the stage produced.
+    """
+    __slots__ = ("name", "seconds", "size", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.seconds = 0.0
+        self.size = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds = time.perf_counter() - self._start
+        return False
+
+    def as_dict(self) -> dict:
+        """
+        Returns the stage as a JSON-serializable dictionary.
+        """
+        return {"stage": self.name, "ms": round(self.seconds * 1000, 3), "bytes": self.size}
+
+
+class Timing:
+    """
+    Stage durations of one operation, e.g. generating, displaying or saving a code.
+    """
+
+    def __init__(self, operation: str, kind: str | None = None, **info):
+        """
+        Args:
+            operation (str): Name of the instrumented operation, e.g. "generate".
+            kind (str | None): Code type the operation worked on.
+            **info: Additional JSON-serializable details, e.g. reused=True.
+        """
+        self.operation = operation
+        self.kind = kind
+        self.info = info
+        self.started = time.time()
+        self.stages = []
+        self.error = None
+
+    def stage(self, name: str) -> Stage:
+        """
+        Returns a context manager that records a stage of the given name when it exits.
+        """
+        stage = Stage(name)
+        self.stages.append(stage)
+        return stage
+
+    def add(self, name: str, seconds: float, size: int | None = None) -> None:
+        """
+        Records a stage that was measured elsewhere, e.g. the time a job waited in a queue.
+        """
+        stage = Stage(name)
+        stage.seconds = seconds
+        stage.size = size
+        self.stages.append(stage)
+
+    @property
+    def seconds(self) -> float:
+        """
+        The time spent in all stages.
+        """
+        return sum(stage.seconds for stage in self.stages)
+
+    def as_dict(self) -> dict:
+        """
+        Returns the operation as a JSON-serializable dictionary.
+        """
+        return {
+            "time": datetime.datetime.fromtimestamp(self.started).isoformat(timespec="milliseconds"),
+            "operation": self.operation,
+            "kind": self.kind,
+            "total_ms": round(self.seconds * 1000, 3),
+            "stages": [stage.as_dict() for stage in self.stages],
+            "error": self.error,
+            **self.info,
+        }
+
+
+class TimingLog:
+    """
+    Thread-safe ring buffer of the most recent Timing records.
+    """
+
+    def __init__(self, maxlen: int = LOG_SIZE):
+        """
+        Args:
+            maxlen (int): Number of operations kept.
+        """
+        self._entries = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, timing: Timing) -> None:
+        """
+        Appends a finished operation, dropping the oldest one if the buffer is full.
+        """
+        with self._lock:
+            self._entries.append(timing)
+
+    def entries(self) -> list[dict]:
+        """
+        Returns the recorded operations, oldest first.
+        """
+        with self._lock:
+            timings = list(self._entries)
+        return [timing.as_dict() for timing in timings]
+
+    def summary(self) -> list[dict]:
+        """
+        Returns count, median and maximum milliseconds of every operation and stage.
+
+        Returns:
+            list[dict]: One row per (operation, stage). Stage "total" covers the whole operation.
+        """
+        import statistics  # Only needed for summaries, and slow to import
+        durations = {}
+        with self._lock:
+            timings = list(self._entries)
+        for timing in timings:
+            durations.setdefault((timing.operation, "total"), []).append(timing.seconds)
+            for stage in timing.stages:
+                durations.setdefault((timing.operation, stage.name), []).append(stage.seconds)
+        return [{"operation": operation, "stage": stage, "count": len(values),
+                 "median_ms": round(statistics.median(values) * 1000, 3),
+                 "max_ms": round(max(values) * 1000, 3)}
+                for (operation, stage), values in durations.items()]
+
+    def to_json(self) -> str:
+        """
+        Returns the summary and all recorded operations as a JSON document.
+        """
+        return json.dumps({"summary": self.summary(), "entries": self.entries()}, indent=1, default=str)
+
+    def clear(self) -> None:
+        """
+        Drops all recorded operations.
+        """
+        with self._lock:
+            self._entries.clear()
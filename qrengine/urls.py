@@ -0,0 +1,113 @@
+"""
+Canonical form of URLs for smaller QR codes.
+
+QR alphanumeric mode holds the digits, upper case letters, space and $%*+-./:
+at 5.5 bits per character instead of 8 in byte mode. The scheme and host of a
+URL are case-insensitive (RFC 3986, section 6.2.2.1), so HTTPS://EXAMPLE.COM/
+opens the same page as https://example.com/ but splits into far cheaper
+segments. canonicalize() uppercases only what is safe to change: the scheme,
+an ASCII host and the hex digits of percent-escapes in the path, query and
+fragment (%2f and %2F are the same octet). It also drops the default port. The
+path is uppercased only on request, for servers that ignore its case. Apart
+from their escapes, the query and the fragment are left as they are, and the
+user information is never touched.
+"""
+import re
+from dataclasses import dataclass
+from urllib.parse import urlsplit, urlunsplit
+
+from .capacity import estimate
+from .core import EncodeOptions
+
+DEFAULT_PORTS = {"http": 80, "https": 443, "ftp": 21, "ws": 80, "wss": 443}
+PERCENT_ESCAPE = re.compile(r"%[0-9a-fA-F]{2}")
+
+
+@dataclass(frozen=True)
+class UrlReport:
+    """
+    Size of a link QR code before and after canonicalization.
+
+    Attributes:
+        before (str): The URL as entered.
+        after (str): The canonical URL.
+        bits_before (int): Payload bits of the URL as entered.
+        bits_after (int): Payload bits of the canonical URL.
+        version_before (str | None): Symbol of the URL as entered, None if it does not fit.
+        version_after (str | None): Symbol of the canonical URL, None if it does not fit.
+    """
+    before: str
+    after: str
+    bits_before: int
+    bits_after: int
+    version_before: str | None
+    version_after: str | None
+
+    @property
+    def saved_bits(self) -> int:
+        return self.bits_before - self.bits_after
+
+    def message(self) -> str:
+        """
+        Returns a one-line summary, e.g. "HTTPS://EXAMPLE.COM/ID/1: 236 -> 179 bits, version 2-L -> 1-Q".
+        """
+        return (f"{self.after}: {self.bits_before:,} -> {self.bits_after:,} bits, "
+                f"version {self.version_before or 'too large'} -> {self.version_after or 'too large'}")
+
+
+def upper_escapes(text: str) -> str:
+    """
+    Returns text with the hex digits of all percent-escapes in upper case (%2f -> %2F).
+    """
+    return PERCENT_ESCAPE.sub(lambda match: match.group(0).upper(), text)
+
+
+def canonicalize(url: str, upper_path: bool = False) -> str:
+    """
+    Returns the URL with its case-insensitive parts in upper case.
+
+    Args:
+        url (str): An absolute URL; anything else is returned unchanged.
+        upper_path (bool): Also uppercase the path, for servers that match paths case-insensitively.
+
+    Returns:
+        str: The canonical URL.
+    """
+    parts = urlsplit(url.strip())
+    if not parts.scheme or not parts.netloc:
+        return url
+    try:
+        port = parts.port
+    except ValueError:
+        return url  # Invalid port, leave the URL to the user
+    host = parts.hostname or ""
+    if host.isascii():
+        host = host.upper()
+    if ":" in host:
+        host = f"[{host}]"  # IPv6 literal
+    userinfo, _, _ = parts.netloc.rpartition("@")
+    netloc = (userinfo + "@" if userinfo else "") + host
+    if port is not None and port != DEFAULT_PORTS.get(parts.scheme):
+        netloc += f":{port}"
+    path = upper_escapes(parts.path)
+    if upper_path:
+        path = path.upper()
+    return urlunsplit((parts.scheme.upper(), netloc, path, upper_escapes(parts.query), upper_escapes(parts.fragment)))
+
+
+def report(url: str, upper_path: bool = False, encode_opts: EncodeOptions | None = None) -> UrlReport:
+    """
+    Canonicalizes a URL and compares the link QR codes of both forms.
+
+    Args:
+        url (str): The URL as entered.
+        upper_path (bool): Also uppercase the path.
+        encode_opts (EncodeOptions | None): Pinned version or error level.
+
+    Returns:
+        UrlReport: Both forms with their payload bits and versions.
+    """
+    canonical = canonicalize(url, upper_path)
+    before = estimate("Link", {"Content": url}, encode_opts)
+    after = estimate("Link", {"Content": canonical}, encode_opts)
+    return UrlReport(url, canonical, before.bits, after.bits, before.designator, after.designator)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the shared generation engine (../qrengine) importable, as the front ends do
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,31 @@
+import io
+
+from qrengine import batch
+from qrengine.core import RenderOptions
+
+
+def run(text: str, fmt: str) -> list:
+    rows = batch.read_rows(io.StringIO(text), fmt)
+    return sorted(batch.run_batch(rows, RenderOptions(), workers=1), key=lambda result: result.index)
+
+
+def test_invalid_jsonl_lines_fail_as_rows():
+    results = run('{"type": "Text", "Content": "a"}\n{"type": "Text",\n[1, 2]\n\n{"type": "Text", "Content": "b"}\n',
+                  "jsonl")
+    assert [result.error is None for result in results] == [True, False, False, True]
+    assert results[1].error.startswith("JSONDecodeError")
+    assert results[2].error.startswith("ValueError: Expected a JSON object")
+
+
+def test_undecodable_csv_ends_with_a_failed_row():
+    stream = io.TextIOWrapper(io.BytesIO(b"type,Content\nText,a\xff\n"), encoding="utf-8")
+    rows = list(batch.read_rows(stream, "csv"))
+    assert isinstance(rows[-1], batch.InvalidRow)
+    assert isinstance(rows[-1].error, UnicodeDecodeError)
+
+
+def test_rows_that_do_not_fit_are_rejected():
+    results = run("type,Content\nText,hello\nText," + "x" * 3000 + "\nBogus,x\n", "csv")
+    assert results[0].error is None and results[0].data.startswith(b"\x89PNG")
+    assert results[1].error.startswith("CapacityError")
+    assert results[2].error.startswith("ValueError: Unknown code type")
@@ -0,0 +1,51 @@
+import datetime
+
+from qrengine.cache import RenderCache, cache_key
+from qrengine.core import EncodeOptions, RenderOptions
+
+
+def test_key_is_stable():
+    first = cache_key("VCard", {"Name": "Doe;John", "Birthday": datetime.date(1990, 1, 2)}, RenderOptions())
+    second = cache_key("VCard", {"Birthday": datetime.date(1990, 1, 2), "Name": "Doe;John"}, RenderOptions())
+    assert first == second  # Key order and non-JSON values do not matter
+    assert len(first) == 64 and int(first, 16) >= 0
+    # Default encoding options hash like none at all
+    assert cache_key("Text", {"Content": "a"}, RenderOptions(), EncodeOptions()) == \
+        cache_key("Text", {"Content": "a"}, RenderOptions())
+
+
+def test_key_depends_on_every_input():
+    base = cache_key("Text", {"Content": "a"}, RenderOptions())
+    assert len({
+        base,
+        cache_key("Link", {"Content": "a"}, RenderOptions()),
+        cache_key("Text", {"Content": "b"}, RenderOptions()),
+        cache_key("Text", {"Content": "a"}, RenderOptions(output="svg")),
+        cache_key("Text", {"Content": "a"}, RenderOptions(scale=3)),
+        cache_key("Text", {"Content": "a"}, RenderOptions(), EncodeOptions(error="H")),
+    }) == 6
+
+
+def test_least_recently_used_is_evicted_first():
+    cache = RenderCache(max_bytes=30)
+    for key in "abc":
+        cache.put(key, b"x" * 10)
+    assert cache.get("a") == b"x" * 10  # a is now the most recently used
+    cache.put("d", b"y" * 10)
+    assert cache.get("b") is None
+    assert [cache.get(key) is not None for key in "acd"] == [True, True, True]
+
+
+def test_byte_budget():
+    cache = RenderCache(max_bytes=100)
+    cache.put("a", b"x" * 60)
+    cache.put("b", b"x" * 50)  # Evicts a
+    assert cache.get("a") is None and cache.size == 50
+    cache.put("b", b"x" * 20)  # Replacing an entry frees its old size
+    assert cache.size == 20
+    cache.put("c", b"x" * 101)  # Larger than the whole budget, not stored
+    assert cache.get("c") is None and cache.size == 20
+    cache.put("m", ((0, 1), (1, 0)))  # Matrices count one byte per module
+    assert cache.size == 24
+    stats = cache.stats()
+    assert stats["entries"] == 2 and stats["bytes"] == 24 and stats["misses"] == 2 and stats["hits"] == 0
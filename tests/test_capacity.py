@@ -0,0 +1,77 @@
+import random
+
+import pytest
+import segno
+
+from qrengine.capacity import estimate, estimate_content
+from qrengine.core import ERRORS, EncodeOptions
+
+MODES = {"numeric": "0123456789", "alphanumeric": "AZ09 $%*+-./:", "byte": "az!é", "kanji": "漢字点"}
+VERSIONS = [1, 2, 3, 4, 5, 6, 9, 10, 11, 16, 26, 27, 33, 40]  # Every change of the count indicator length
+
+
+def content(mode: str, count: int) -> str:
+    return (MODES[mode] * (count // len(MODES[mode]) + 1))[:count]
+
+
+def segno_designator(text: str, micro: bool = False, error: str | None = None) -> str | None:
+    make = segno.make_micro if micro else segno.make_qr
+    try:
+        # A fixed mask skips the mask evaluation, it does not change the version
+        return make(text, error=error, boost_error=error is None, mask=0).designator
+    except segno.DataOverflowError:
+        return None
+
+
+def largest_count(mode: str, version, error: str | None, micro: bool = False) -> int:
+    """
+    Returns the most characters the estimate puts into the version, by bisection.
+    """
+    opts = EncodeOptions(error=error, version=version)
+    low, high = 0, 8000
+    while low < high:
+        middle = (low + high + 1) // 2
+        if estimate_content(content(mode, middle), micro, opts).fits:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+@pytest.mark.parametrize("mode", MODES)
+@pytest.mark.parametrize("error", ERRORS)
+def test_boundaries_of_every_version_agree_with_segno(mode, error):
+    for version in VERSIONS:
+        count = largest_count(mode, version, error)
+        for size in (count, count + 1):
+            text = content(mode, size)
+            assert estimate_content(text, encode_opts=EncodeOptions(error=error)).designator == \
+                segno_designator(text, error=error), (version, size)
+
+
+@pytest.mark.parametrize("mode", MODES)
+def test_micro_boundaries_agree_with_segno(mode):
+    for version in ("M1", "M2", "M3", "M4"):
+        count = largest_count(mode, version, None, micro=True)
+        if count == 0:
+            continue  # The mode is not available in this version
+        for size in (count, count + 1):
+            text = content(mode, size)
+            assert estimate_content(text, micro=True).designator == segno_designator(text, micro=True), \
+                (version, size)
+
+
+def test_fuzzed_payloads_agree_with_segno():
+    generator = random.Random(18004)
+    alphabet = "".join(MODES.values()) + "abcXYZ-_?&=" + "ßü€Ж"
+    for _ in range(300):
+        text = "".join(generator.choice(alphabet) for _ in range(generator.randint(1, 400)))
+        if generator.random() < 0.5:  # Single-mode content as well
+            text = content(generator.choice(list(MODES)), len(text))
+        assert estimate_content(text).designator == segno_designator(text), text
+
+
+def test_payload_that_cannot_fit():
+    result = estimate("Text", {"Content": "x" * 3000})
+    assert not result.fits and result.bits > result.capacity
+    assert segno_designator("x" * 3000) is None
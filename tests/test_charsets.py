@@ -0,0 +1,39 @@
+import pytest
+
+import qrengine
+from qrengine.charsets import DEFAULT, UTF8, Charset, choose
+
+TURKISH = "Çağrı Şükrü ığdır, İstanbul"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Grüße aus Köln", DEFAULT),  # Latin-1 needs no ECI header
+    ("hello", DEFAULT),
+    (TURKISH, Charset("iso-8859-9", eci=True)),
+    ("Привет, как дела?", Charset("iso-8859-5", eci=True)),
+    ("Ħadd ġewwa", Charset("iso-8859-3", eci=True)),  # Maltese
+    ("漢字", DEFAULT),  # segno's kanji mode beats any byte encoding
+    ("😀 hi ş", UTF8),  # No candidate holds the emoji
+    ("ş", UTF8),  # One byte saved is less than the 12-bit ECI header
+])
+def test_choose(text, expected):
+    assert choose(text) == expected
+
+
+def test_forced_utf8():
+    assert choose(TURKISH, force_utf8=True) == UTF8
+    assert choose("hello", force_utf8=True) == UTF8
+
+
+def test_chosen_charset_is_lossless():
+    for text in (TURKISH, "Привет, как дела?", "Ελληνικά κείμενο", "中文字符串测试"):
+        charset = choose(text)
+        assert text.encode(charset.encoding).decode(charset.encoding) == text
+
+
+def test_readme_turkish_example():
+    code = qrengine.make_code("Text", {"Content": TURKISH})
+    assert code.designator == qrengine.estimate("Text", {"Content": TURKISH}).designator == "2-L"
+    options = qrengine.EncodeOptions(utf8=True)
+    code = qrengine.make_code("Text", {"Content": TURKISH}, options)
+    assert code.designator == qrengine.estimate("Text", {"Content": TURKISH}, options).designator == "3-M"
@@ -0,0 +1,52 @@
+import zipfile
+
+import pytest
+
+from qrengine.cli import main
+
+ROWS = "type,Content,Type,Number\nText,hello,,\nLink,https://example.com,,\nBarcode,,EAN13,5901234123457\n"
+
+
+@pytest.fixture
+def rows(tmp_path):
+    path = tmp_path / "rows.csv"
+    path.write_text(ROWS, encoding="utf-8")
+    return path
+
+
+def test_batch_writes_png_files(rows, tmp_path, capsys):
+    out = tmp_path / "out"
+    assert main(["batch", str(rows), "-o", str(out), "--workers", "1"]) == 0
+    names = sorted(path.name for path in out.iterdir())
+    assert names == ["000001_text.png", "000002_link.png", "000003_barcode.png"]
+    assert all((out / name).read_bytes().startswith(b"\x89PNG") for name in names)
+    assert "3 rows" in capsys.readouterr().out
+
+
+def test_batch_writes_svg_zip(rows, tmp_path):
+    out = tmp_path / "codes.zip"
+    assert main(["batch", str(rows), "-o", str(out), "--format", "svg", "--size", "300", "--workers", "1"]) == 0
+    with zipfile.ZipFile(out) as archive:
+        assert sorted(archive.namelist()) == ["000001_text.svg", "000002_link.svg", "000003_barcode.svg"]
+        assert all(b"<svg" in archive.read(name) for name in archive.namelist())
+
+
+def test_batch_fails_with_bad_rows(tmp_path, capsys):
+    path = tmp_path / "rows.jsonl"
+    path.write_text('{"type": "Text", "Content": "a"}\n{"type": "Bogus"}\n', encoding="utf-8")
+    assert main(["batch", str(path), "-o", str(tmp_path / "out"), "--workers", "1", "--error", "h"]) == 1
+    assert "Row 2: ValueError: Unknown code type: 'Bogus'" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("argv", [
+    [],
+    ["batch", "rows.csv"],  # No output
+    ["batch", "rows.csv", "-o", "out", "--format", "gif"],
+    ["batch", "rows.csv", "-o", "out", "--error", "X"],
+    ["render"],
+])
+def test_bad_arguments_exit_with_2(argv, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(argv)
+    assert exit_info.value.code == 2
+    assert "usage:" in capsys.readouterr().err
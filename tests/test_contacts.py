@@ -0,0 +1,20 @@
+from qrengine.contacts import minimize
+
+CARD = {"Name": "Doe;John", "Displayname": "John Doe", "Email": "john@example.com"}
+
+
+def test_auto_uses_mecard_when_nothing_is_lost():
+    text, report = minimize({**CARD, "Phone": "+1 555 0100"})
+    assert text.startswith("MECARD:") and report.format == "mecard" and report.saved > 0
+
+
+def test_auto_keeps_vcard_for_typed_phones():
+    for key in ("Cellphone", "Homephone", "Workphone"):
+        text, report = minimize({**CARD, key: "+1 555 0100"})
+        assert text.startswith("BEGIN:VCARD") and report.format == "vcard", key
+
+
+def test_forced_mecard_reports_the_lost_phone_types():
+    text, report = minimize({**CARD, "Workphone": "+1 555 0100", "Org": "ACME", "Format": "mecard"})
+    assert "TEL:+1 555 0100;" in text
+    assert report.dropped == ("Org", "Workphone type")
@@ -0,0 +1,69 @@
+import os
+import sys
+
+import pytest
+
+import qrengine
+
+DESKTOP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Desktop")
+sys.path.insert(0, DESKTOP)
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from Payload import parse_birthday  # noqa: E402
+
+
+@pytest.mark.parametrize("birthday", ["02", "02.", "02.01", "02.01.", "2.1.19x", "02011990"])
+def test_partial_birthdays_are_value_errors(birthday):
+    with pytest.raises(ValueError):
+        parse_birthday(birthday)
+
+
+def test_birthday_separators():
+    assert parse_birthday("02/01/1990") == parse_birthday("2-1-1990") == parse_birthday("02.01.1990")
+    assert parse_birthday(" ") is None
+
+
+@pytest.fixture
+def window(monkeypatch):
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    errors = []
+    # PyQt5 aborts on an exception in a slot unless sys.excepthook was replaced
+    monkeypatch.setattr(sys, "excepthook", lambda *exc_info: errors.append(exc_info))
+    application = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    from App import App
+    window = App()
+    yield window, errors
+    window.close()
+    application.processEvents()
+
+
+def test_capacity_hint_survives_a_birthday_being_typed(window):
+    window, errors = window
+    window.ui.vcard_button.click()
+    window.ui.name_content.setText("Doe;John")
+    window.ui.display_name_content.setText("John Doe")
+    typed = ""
+    for key in "02.01.1990":
+        typed += key
+        window.ui.birthday_content.setText(typed)
+        if typed in ("02.", "02.01"):
+            assert window.statusBar().currentMessage() == ""
+    assert errors == []
+    assert "version" in window.statusBar().currentMessage()
+
+
+def test_encoding_controls(window):
+    window, errors = window
+    assert window.encode_options() is None
+    window.error_box.setCurrentText("H")
+    window.fast_box.setChecked(True)
+    assert window.encode_options() == qrengine.EncodeOptions(error="H", fast=True)
+    window.ui.text_button.click()
+    window.ui.text_content.setPlainText("hello")
+    assert "-H " in window.statusBar().currentMessage()
+    assert errors == []
+
+
+def test_icons_are_registered_when_the_window_is_built(window):
+    from PyQt5 import QtCore
+    assert QtCore.QFile.exists(":/icons/file.jpg")
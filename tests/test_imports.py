@@ -0,0 +1,40 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ("segno", "numpy", "barcode", "PIL", "sqlite3", "PyQt5")
+
+# Prints the heavy modules an import statement loaded, in a fresh interpreter
+PROBE = """
+import sys
+{statement}
+print(" ".join(name for name in {modules!r} if name in sys.modules))
+"""
+
+
+def loaded_modules(statement: str) -> list:
+    code = PROBE.format(statement=statement, modules=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True, capture_output=True, text=True,
+                            env={**os.environ, "PYTHONPATH": os.pathsep.join([ROOT, os.path.join(ROOT, "Desktop")])})
+    return output.stdout.split()
+
+
+def test_engine_import_is_light():
+    assert loaded_modules("import qrengine") == []
+
+
+def test_desktop_command_line_import_is_light():
+    assert loaded_modules("import Cli") == []
+
+
+def test_desktop_window_import_loads_no_link_store():
+    assert loaded_modules("import os; os.environ['QT_QPA_PLATFORM'] = 'offscreen'; import App") == ["PyQt5"]
+
+
+def test_desktop_window_import_registers_no_resources():
+    assert loaded_modules("import App, icon_rc; icon_rc.registered and print('icons')") == ["PyQt5"]
+
+
+def test_batch_import_loads_no_link_store():
+    assert "sqlite3" not in loaded_modules("import qrengine.batch")
@@ -0,0 +1,76 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from qrengine.cache import RenderCache
+from qrengine.metrics import CONTENT_TYPE, GenerationMetrics, serve_metrics
+
+
+def samples(text: str) -> dict:
+    """
+    Returns the sample lines of an exposition as {name{labels}: value}.
+    """
+    values = {}
+    for line in text.splitlines():
+        if line and not line.startswith("#"):
+            name, value = line.rsplit(" ", 1)
+            values[name] = float(value)
+    return values
+
+
+def scrape(server, path: str = "/metrics") -> str:
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.server_address[1]}{path}", timeout=5) as response:
+        assert response.headers["Content-Type"] == CONTENT_TYPE
+        return response.read().decode("utf-8")
+
+
+@pytest.fixture
+def server():
+    server = serve_metrics(GenerationMetrics(RenderCache(max_bytes=1000)), port=0)
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_scrape_counts_requests(server):
+    metrics, cache = server.metrics, server.metrics.cache
+    metrics.observe("Text", 0.002, "ok", "png", size=300)
+    metrics.observe("Text", 0.2, "ok", "svg", size=5000)
+    metrics.observe("Wifi", 0.03, "error", error="KeyError")
+    metrics.observe("Link", 0.0001, "rejected")
+    cache.put("a", b"x" * 10)
+    cache.get("a")
+    cache.get("b")
+    text = scrape(server)
+    values = samples(text)
+    assert values['qrengine_requests_total{kind="Text",status="ok"}'] == 2
+    assert values['qrengine_requests_total{kind="Wifi",status="error"}'] == 1
+    assert values['qrengine_requests_total{kind="Link",status="rejected"}'] == 1
+    assert values['qrengine_requests_total{kind="Geo",status="ok"}'] == 0  # Every type from the first scrape on
+    assert values['qrengine_errors_total{kind="Wifi",error="KeyError"}'] == 1
+    # Histogram buckets are cumulative and end in count
+    assert values['qrengine_request_duration_seconds_bucket{kind="Text",le="0.0025"}'] == 1
+    assert values['qrengine_request_duration_seconds_bucket{kind="Text",le="0.25"}'] == 2
+    assert values['qrengine_request_duration_seconds_bucket{kind="Text",le="+Inf"}'] == 2
+    assert values['qrengine_request_duration_seconds_count{kind="Text"}'] == 2
+    assert values['qrengine_request_duration_seconds_sum{kind="Text"}'] == pytest.approx(0.202)
+    assert values['qrengine_render_bytes_count{kind="Text",format="svg"}'] == 1
+    assert values["qrengine_render_cache_hits_total"] == 1
+    assert values["qrengine_render_cache_misses_total"] == 1
+    assert values["qrengine_render_cache_hit_ratio"] == 0.5
+    assert values["qrengine_render_cache_bytes"] == 10
+    assert "# TYPE qrengine_request_duration_seconds histogram" in text
+    assert "# TYPE qrengine_requests_total counter" in text
+
+
+def test_label_values_are_escaped(server):
+    server.metrics.observe('odd"kind\\', 0.001, "error", error="Bad\nError")
+    assert 'qrengine_errors_total{kind="odd\\"kind\\\\",error="Bad\\nError"} 1' in scrape(server)
+
+
+def test_listens_locally_and_only_on_metrics(server):
+    assert server.server_address[0] == "127.0.0.1"
+    with pytest.raises(urllib.error.HTTPError) as error:
+        scrape(server, "/other")
+    assert error.value.code == 404
@@ -0,0 +1,69 @@
+import datetime
+import io
+import tracemalloc
+
+import pytest
+from PIL import Image
+
+import qrengine
+from qrengine import pngstream, raster
+
+# Every QR code type of the web app
+CASES = [
+    ("Text", {"Content": "hello world"}),
+    ("Text", {"Content": "x" * 2900}),
+    ("Link", {"Content": "https://example.com/" + "a" * 500}),
+    ("VCard", {"Name": "Doe;John", "Displayname": "John Doe", "Email": "j@d.com",
+               "Birthday": datetime.date(2000, 1, 2)}),
+    ("Wifi", {"SSID": "x", "Password": "y"}),
+    ("Email", {"Subject": "s", "Body": "b", "To": "a@b.c"}),
+    ("Geo", {"Latitude": 1.5, "Longitude": 2.25}),
+    ("Micro", {"Text": "12345"}),
+]
+
+
+def pixels(png: bytes) -> tuple:
+    image = Image.open(io.BytesIO(png))
+    return image.size, image.convert("L").tobytes()
+
+
+@pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "python"])
+@pytest.mark.parametrize("kind, payload", CASES, ids=[f"{kind}-{i}" for i, (kind, _) in enumerate(CASES)])
+def test_png_matches_segno(monkeypatch, use_numpy, kind, payload):
+    monkeypatch.setattr(raster, "HAS_NUMPY", use_numpy and raster.HAS_NUMPY)
+    monkeypatch.setattr(raster, "_first_image", False)
+    code = qrengine.make_code(kind, payload)
+    for scale in (1, 2, 3, 7, 8, 13):
+        for border in (None, 0, 1):
+            expected, actual = io.BytesIO(), io.BytesIO()
+            code.save(expected, kind="png", scale=scale, border=border)
+            pngstream.write_png(code, actual, scale=scale, border=border)
+            assert pixels(actual.getvalue()) == pixels(expected.getvalue()), (scale, border)
+
+
+def test_large_scale_matches_segno():
+    code = qrengine.make_code("Text", {"Content": "hello world"})
+    expected, actual = io.BytesIO(), io.BytesIO()
+    code.save(expected, kind="png", scale=300)
+    pngstream.write_png(code, actual, scale=300)
+    assert pixels(actual.getvalue()) == pixels(expected.getvalue())
+
+
+class Discard:
+    def write(self, data: bytes) -> None:
+        pass
+
+
+def test_memory_does_not_grow_with_scale():
+    code = qrengine.make_code("Text", {"Content": "x" * 2900})
+    pngstream.write_png(code, Discard(), scale=2)  # Load NumPy outside the measurement
+    peaks = []
+    for scale in (50, 400):
+        tracemalloc.start()
+        try:
+            pngstream.write_png(code, Discard(), scale=scale)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+        finally:
+            tracemalloc.stop()
+    assert peaks[1] < peaks[0] * 2
+    assert peaks[1] < 4 * 1024 * 1024
@@ -0,0 +1,17 @@
+import re
+
+import qrengine
+from qrengine.core import RenderOptions
+
+
+def svg_width(data: bytes) -> int:
+    return int(re.search(rb'<svg[^>]* width="(\d+)"', data).group(1))
+
+
+def test_svg_follows_the_target_size_like_png():
+    code = qrengine.make_code("Text", {"Content": "hello"})
+    width, _ = code.symbol_size(scale=1)
+    for size in (width, 150, 512, 1000):
+        svg = qrengine.render(code, RenderOptions(output="svg", size=size))
+        assert svg_width(svg) == size // width * width <= size
+    assert svg_width(qrengine.render(code, RenderOptions(output="svg", scale=3))) == 3 * width
@@ -0,0 +1,39 @@
+import qrengine
+from qrengine.core import EncodeOptions, RenderOptions
+
+
+def stages(timing: qrengine.Timing) -> list[str]:
+    return [stage.name for stage in timing.stages]
+
+
+def test_each_output_is_rendered_once():
+    result = qrengine.GeneratedCode("Text", {"Content": "hello"})
+    first, second = qrengine.Timing("render"), qrengine.Timing("render")
+    png = result.render(timing=first)
+    assert png.startswith(b"\x89PNG")
+    assert result.render(RenderOptions(), timing=second) is png
+    assert stages(first) == ["encode", "render"]
+    assert stages(second) == []
+    svg_timing = qrengine.Timing("render")
+    assert b"<svg" in result.render(RenderOptions(output="svg"), timing=svg_timing)
+    assert stages(svg_timing) == ["render"]
+
+
+def test_cache_hit_skips_encoding():
+    cache = qrengine.RenderCache()
+    png = qrengine.GeneratedCode("Text", {"Content": "hello"}, cache=cache).render()
+    result = qrengine.GeneratedCode("Text", {"Content": "hello"}, cache=cache)
+    timing = qrengine.Timing("render")
+    assert result.render(timing=timing) == png
+    assert stages(timing) == ["cache"]
+    assert result._code is None
+
+
+def test_matches_and_payload_copy():
+    payload = {"Content": "hello"}
+    result = qrengine.GeneratedCode("Text", payload, encode_opts=EncodeOptions(error="h"))
+    payload["Content"] = "changed"
+    assert result.matches("Text", {"Content": "hello"}, EncodeOptions(error="h"))
+    assert not result.matches("Text", {"Content": "hello"})
+    assert not result.matches("Link", {"Content": "hello"}, EncodeOptions(error="h"))
+    assert result.code.error == "H"
@@ -0,0 +1,45 @@
+import random
+
+import segno
+
+from qrengine.capacity import estimate_content
+from qrengine.segments import optimize, split
+
+ALPHABET = "0123456789" * 3 + "ABCXYZ:/.-" * 2 + "abcxyz?&=_é"
+
+
+def version(designator: str | None) -> int:
+    return int(designator.split("-")[0]) if designator else 41
+
+
+def random_texts(count: int):
+    generator = random.Random(21)
+    for _ in range(count):
+        yield "".join(generator.choice(ALPHABET) * generator.randint(1, 12) for _ in range(generator.randint(1, 40)))
+
+
+def test_split_round_trips():
+    for text in random_texts(200):
+        for start in (1, 10, 27):
+            segments = split(text, start)
+            assert "".join(part for part, _ in segments) == text
+            assert all(a[1] != b[1] for a, b in zip(segments, segments[1:]))  # Neighbours differ in mode
+
+
+def test_optimize_never_picks_a_larger_version():
+    for text in random_texts(200):
+        plan = optimize(text)
+        single = estimate_content(text)
+        assert version(plan.estimate.designator) <= version(single.designator)
+        if plan.split:
+            assert "".join(part for part, _, _ in plan.content()) == text
+            code = segno.make_qr(plan.content(), error=plan.error, boost_error=False, mask=0)
+            assert code.designator == plan.estimate.designator
+
+
+def test_readme_link_example():
+    plan = optimize("https://EXAMPLE.COM/ID/1234567890")
+    assert plan.segments == (("https", "byte"), ("://EXAMPLE.COM/ID/", "alphanumeric"), ("1234567890", "numeric"))
+    assert plan.estimate.designator == "2-M" and plan.estimate.single == "3-M"
+    assert plan.estimate.message() == \
+        "Will be version 2-M (212 of 224 bits, 3 segments; as one segment: version 3-M)"
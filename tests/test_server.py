@@ -0,0 +1,161 @@
+import http.client
+import io
+import json
+import threading
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from qrengine.server import GenerationServer
+
+
+@pytest.fixture
+def server():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        httpd = GenerationServer(("127.0.0.1", 0), executor, workers=2, max_pending=8)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        yield httpd
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def request(server, method: str, path: str, body: bytes = b"", headers: dict | None = None):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    try:
+        connection.request(method, path, body=body, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def wait_for_metric(server, text: str) -> bool:
+    """
+    Returns whether the metrics contain text; a request is observed only after its response is sent.
+    """
+    deadline = time.monotonic() + 5
+    while text not in server.metrics.render().decode():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_generate_returns_png(server):
+    status, headers, body = request(server, "POST", "/generate/text", json.dumps({"Content": "hi"}).encode())
+    assert status == 200
+    assert headers["Content-Type"] == "image/png"
+    assert body.startswith(b"\x89PNG")
+
+
+@pytest.mark.parametrize("kind, payload", [
+    ("text", {}),
+    ("wifi", {"SSID": "x"}),
+    ("vcard", {"Name": "x"}),
+])
+def test_generate_rejects_missing_fields(server, kind, payload):
+    status, _, body = request(server, "POST", f"/generate/{kind}", json.dumps(payload).encode())
+    assert status == 400
+    assert body.startswith(b"KeyError")
+    assert wait_for_metric(server, 'error="KeyError"')
+
+
+def test_generate_rejects_oversized_payload(server):
+    status, _, body = request(server, "POST", "/generate/text", json.dumps({"Content": "x" * 3000}).encode())
+    assert status == 400
+    assert body.startswith(b"Won't fit")
+
+
+def test_batch_streams_zip_with_errors(server):
+    body = b'{"type": "Text", "Content": "a"}\n{"type": "Text",\n{"type": "Link", "Content": "https://example.com"}\n'
+    status, headers, data = request(server, "POST", "/batch?input=jsonl", body)
+    assert status == 200
+    assert headers["Transfer-Encoding"] == "chunked"
+    assert "X-Response-Time-Ms" in headers and "Server-Timing" in headers
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert sorted(archive.namelist()) == ["000001_text.png", "000003_link.png", "errors.txt"]
+        assert archive.read("errors.txt").startswith(b"Row 2: JSONDecodeError")
+    assert wait_for_metric(server, 'qrengine_requests_total{kind="Batch",status="ok"} 1')
+
+
+def test_batch_rejects_unreadable_body(server):
+    status, _, body = request(server, "POST", "/batch?input=jsonl", b"type,Content\nText,a\n")
+    assert status == 400
+    assert body.startswith(b"Invalid jsonl body")
+    status, _, _ = request(server, "POST", "/batch?input=xml", b"<rows/>")
+    assert status == 400
+
+
+def test_batch_is_rejected_without_free_slot(server):
+    slots = 0
+    while server.slots.acquire(blocking=False):
+        slots += 1
+    try:
+        status, _, _ = request(server, "POST", "/batch", b"type,Content\nText,a\n")
+    finally:
+        for _ in range(slots):
+            server.slots.release()
+    assert status == 503
+
+
+def test_batch_jobs_take_pending_slots(server, monkeypatch):
+    in_flight = peak = 0
+    lock = threading.Lock()
+    submit = server.executor.submit
+
+    def counting_submit(fn, *args, **kwargs):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        future = submit(fn, *args, **kwargs)
+
+        def finished(_):
+            nonlocal in_flight
+            with lock:
+                in_flight -= 1
+        future.add_done_callback(finished)
+        return future
+
+    monkeypatch.setattr(server.executor, "submit", counting_submit)
+    monkeypatch.setattr(server, "slots", threading.BoundedSemaphore(3))
+    body = b"type,Content\n" + b"".join(b"Text,row %d\n" % i for i in range(40))
+    status, _, data = request(server, "POST", "/batch", body)
+    assert status == 200
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert len(archive.namelist()) == 40
+    assert peak <= 3
+    assert server.slots.acquire(blocking=False)  # Every slot was given back
+
+
+def test_generate_rejects_large_body_unread(server):
+    server.max_body = 100
+    connection = http.client.HTTPConnection(*server.server_address, timeout=10)
+    try:
+        connection.putrequest("POST", "/generate/text")
+        connection.putheader("Content-Length", str(10 * 1024 * 1024))
+        connection.endheaders()  # The body is never sent
+        response = connection.getresponse()
+        assert response.status == 413
+        assert response.read().startswith(b"Body of 10485760 bytes")
+    finally:
+        connection.close()
+    assert wait_for_metric(server, 'error="BodyTooLarge"')
+    status, _, _ = request(server, "POST", "/generate/text", json.dumps({"Content": "hi"}).encode())
+    assert status == 200
+
+
+def test_metrics_count_requests(server):
+    for content in ("a", "b", "a"):
+        request(server, "POST", "/generate/text", json.dumps({"Content": content}).encode())
+    request(server, "POST", "/generate/wifi", b"{}")
+    assert wait_for_metric(server, 'qrengine_requests_total{kind="Wifi",status="error"} 1')
+    status, headers, body = request(server, "GET", "/metrics")
+    assert status == 200 and headers["Content-Type"].startswith("text/plain; version=0.0.4")
+    text = body.decode()
+    assert 'qrengine_requests_total{kind="Text",status="ok"} 3' in text
+    assert 'qrengine_request_duration_seconds_count{kind="Text"} 3' in text
+    assert 'qrengine_render_bytes_count{kind="Text",format="png"} 3' in text
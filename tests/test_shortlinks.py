@@ -0,0 +1,34 @@
+import pytest
+
+from qrengine import shortlinks
+from qrengine.shortlinks import LinkStore
+
+
+@pytest.fixture
+def store():
+    store = LinkStore(":memory:", "https://qr.Example.com/Go/")
+    yield store
+    store.close()
+
+
+def test_codes_are_random_and_stable(store):
+    codes = list(store.add_many(["https://example.com/a", "https://example.com/b", "https://example.com/a"]))
+    assert all(len(code) == shortlinks.CODE_LENGTH for code in codes)
+    assert codes[0] == codes[2] != codes[1]
+    assert store.shorten("https://example.com/a") == codes[0]
+    assert store.peek("https://example.com/a") == codes[0]
+    assert store.resolve(codes[1].lower()) == "https://example.com/b"
+
+
+def test_colliding_codes_are_drawn_again(store, monkeypatch):
+    first = store.shorten("https://example.com/a")
+    drawn = iter([shortlinks.decode_code(first), shortlinks.FIRST_ID, shortlinks.FIRST_ID, shortlinks.FIRST_ID + 1])
+    monkeypatch.setattr(shortlinks, "random_id", lambda: next(drawn))
+    codes = list(store.add_many(["https://example.com/b", "https://example.com/c"]))
+    assert sorted(shortlinks.decode_code(code) for code in codes) == [shortlinks.FIRST_ID, shortlinks.FIRST_ID + 1]
+    assert store.resolve(first) == "https://example.com/a"
+
+
+def test_short_url_keeps_the_case_of_the_base_path(store):
+    assert store.short_url("7q2lkcb") == "HTTPS://QR.EXAMPLE.COM/Go/7Q2LKCB"
+    assert LinkStore(":memory:").short_url("7q2lkcb") == "HTTP://127.0.0.1:8000/R/7Q2LKCB"
@@ -0,0 +1,47 @@
+import json
+import time
+
+from qrengine.timing import Timing, TimingLog
+
+
+def test_stages_are_measured():
+    timing = Timing("generate", "Text", reused=False)
+    with timing.stage("encode") as stage:
+        time.sleep(0.01)
+        stage.size = 42
+    timing.add("queue", 0.5)
+    assert [stage.name for stage in timing.stages] == ["encode", "queue"]
+    assert 0.01 <= timing.stages[0].seconds < 0.5
+    assert timing.seconds == timing.stages[0].seconds + 0.5
+    entry = timing.as_dict()
+    assert entry["operation"] == "generate" and entry["kind"] == "Text" and entry["reused"] is False
+    assert entry["stages"][0]["bytes"] == 42 and entry["stages"][1] == {"stage": "queue", "ms": 500.0, "bytes": None}
+
+
+def test_stage_records_time_on_error():
+    timing = Timing("save")
+    try:
+        with timing.stage("write"):
+            raise OSError("disk full")
+    except OSError:
+        timing.error = "OSError"
+    assert timing.stages[0].seconds > 0
+    assert timing.as_dict()["error"] == "OSError"
+
+
+def test_log_is_a_ring_buffer_with_summary():
+    log = TimingLog(maxlen=3)
+    for seconds in (1.0, 2.0, 3.0, 4.0):
+        timing = Timing("generate")
+        timing.add("encode", seconds)
+        log.record(timing)
+    assert len(log) == 3
+    assert [entry["total_ms"] for entry in log.entries()] == [2000.0, 3000.0, 4000.0]  # Oldest dropped
+    summary = {row["stage"]: row for row in log.summary()}
+    assert summary["encode"] == {"operation": "generate", "stage": "encode", "count": 3,
+                                 "median_ms": 3000.0, "max_ms": 4000.0}
+    assert summary["total"]["count"] == 3
+    dump = json.loads(log.to_json())
+    assert dump["summary"] == log.summary() and len(dump["entries"]) == 3
+    log.clear()
+    assert len(log) == 0 and log.summary() == []
@@ -0,0 +1,43 @@
+import pytest
+
+from qrengine.cli import main
+from qrengine.urls import canonicalize, report
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("https://example.com/id/1234", "HTTPS://EXAMPLE.COM/id/1234"),
+    ("http://Example.com:80/a", "HTTP://EXAMPLE.COM/a"),
+    ("https://example.com:8443/a", "HTTPS://EXAMPLE.COM:8443/a"),
+    # Only the hex digits of escapes change in path, query and fragment
+    ("https://example.com/a%2fb?q=x%c3%a9&Next=/Up#Frag%3a", "HTTPS://EXAMPLE.COM/a%2Fb?q=x%C3%A9&Next=/Up#Frag%3A"),
+    ("https://example.com/%41%2F?%7E", "HTTPS://EXAMPLE.COM/%41%2F?%7E"),  # Already encoded escapes stay
+    ("https://User:Pw@example.com/", "HTTPS://User:Pw@EXAMPLE.COM/"),
+    ("https://[::1]:8000/", "HTTPS://[::1]:8000/"),
+    ("https://bücher.de/", "HTTPS://bücher.de/"),  # Non-ASCII hosts keep their case
+    ("mailto:someone@example.com", "mailto:someone@example.com"),
+    ("example.com/path", "example.com/path"),
+])
+def test_canonicalize(url, expected):
+    assert canonicalize(url) == expected
+
+
+def test_upper_path_leaves_query_and_fragment():
+    assert canonicalize("https://example.com/id/x?utm=a#b", upper_path=True) == "HTTPS://EXAMPLE.COM/ID/X?utm=a#b"
+
+
+def test_report_counts_the_saving():
+    result = report("https://example.com/id/1234567890")
+    assert result.after == "HTTPS://EXAMPLE.COM/id/1234567890"
+    assert result.saved_bits > 0
+
+
+@pytest.mark.parametrize("options", [
+    ["--canonical-urls", "--short-links", "links.sqlite3"],
+    ["--upper-paths", "--short-links", "links.sqlite3"],
+    ["--canonical-urls", "--upper-paths"],
+])
+def test_conflicting_link_options_are_rejected(options, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(["batch", "rows.csv", "-o", "out.zip", *options])
+    assert exit_info.value.code == 2
+    assert "not allowed with argument" in capsys.readouterr().err